@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 7 seed ranges; each file calls window._loadSpotSeedBundle()
+window._registerSpotSeedIndex({"ranges":[{"file":"spot-history-bundles/spot-history-1960s.js","start":1968,"end":1969,"years":2,"entries":1003,"bytes":15436},{"file":"spot-history-bundles/spot-history-1970s.js","start":1970,"end":1979,"years":10,"entries":5056,"bytes":78793},{"file":"spot-history-bundles/spot-history-1980s.js","start":1980,"end":1989,"years":10,"entries":5051,"bytes":80011},{"file":"spot-history-bundles/spot-history-1990s.js","start":1990,"end":1999,"years":10,"entries":9988,"bytes":160043},{"file":"spot-history-bundles/spot-history-2000s.js","start":2000,"end":2009,"years":10,"entries":10112,"bytes":162760},{"file":"spot-history-bundles/spot-history-2010s.js","start":2010,"end":2019,"years":10,"entries":10104,"bytes":167549},{"file":"spot-history-bundles/spot-history-2020s.js","start":2020,"end":2026,"years":7,"entries":6238,"bytes":104459}],"lod":{"v":1,"tiers":[{"name":"weekly","kind":"ohlc","file":"spot-history-lod/weekly.js","points":3034,"bytes":448711},{"name":"monthly","kind":"ohlc","file":"spot-history-lod/monthly.js","points":699,"bytes":106415},{"name":"yearly","kind":"ohlc","file":"spot-history-lod/yearly.js","points":59,"bytes":9607},{"name":"lttb-500","kind":"line","file":"spot-history-lod/lttb-500.js","points":500,"bytes":38584},{"name":"lttb-2000","kind":"line","file":"spot-history-lod/lttb-2000.js","points":2000,"bytes":153400}]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 1003 entries across 2 years (1968–1969)
+window._loadSpotSeedBundle({"1968":{"Gold":[["01-02",35.18],["01-03",35.16],["01-04",35.14],["01-05",35.14],["01-08",35.14],["01-09",35.14],["01-10",35.15],["01-11",35.17],["01-12",35.18],["01-15",35.18],["01-16",35.19],["01-17",35.2],["01-18",35.2],["01-19",35.19],["01-22",35.19],["01-23",35.19],["01-24",35.2],["01-25",35.2],["01-26",35.2],["01-29",35.19],["01-30",35.19],["01-31",35.2],["02-01",35.2],["02-02",35.2],["02-05",35.19],["02-06",35.19],["02-07",35.2],["02-08",35.19],["02-09",35.2],["02-12",35.19],["02-13",35.19],["02-14",35.2],["02-15",35.2],["02-16",35.2],["02-19",35.2],["02-20",35.2],["02-21",35.2],["02-22",35.2],["02-23",35.2],["02-26",35.2],["02-27",35.2],["02-28",35.2],["02-29",35.2],["03-01",35.2],["03-04",35.2],["03-05",35.2],["03-06",35.2],["03-07",35.2],["03-08",35.2],["03-11",35.2],["03-12",35.2],["03-13",35.2],["03-14",35.2],["04-01",38.0],["04-02",37.6],["04-03",37.7],["04-04",36.7],["04-05",37.2],["04-08",37.0],["04-09",37.25],["04-10",37.6],["04-11",38.05],["04-16",38.1],["04-17",38.0],["04-18",37.6],["04-19",37.65],["04-22",38.3],["04-23",38.05],["04-24",38.35],["04-25",38.25],["04-26",38.5],["04-29",38.55],["04-30",39.1],["05-01",39.1],["05-02",39.25],["05-03",39.6],["05-06",39.7],["05-07",39.3],["05-08",39.5],["05-09",39.7],["05-10",39.8],["05-13",39.4],["05-14",39.6],["05-15",40.1],["05-16",40.85],["05-17",41.6],["05-20",42.0],["05-21",42.6],["05-22",42.2],["05-23",41.5],["05-24",41.75],["05-27",41.5],["05-28",41.6],["05-29",41.5],["05-30",41.75],["05-31",42.0],["06-04",41.2],["06-05",41.4],["06-06",41.25],["06-07",41.2],["06-10",41.35],["06-11",41.3],["06-12",42.1],["06-13",41.4],["06-14",40.2],["06-17",40.9],["06-18",40.7],["06-19",41.4],["06-20",41.05],["06-21",41.05],["06-24",41.05],["06-25",40.85],["06-26",40.95],["06-27",40.8],["06-28",40.95],["07-01",40.9],["07-02",40.85],["07-03",40.9],["07-04",41.05],["07-05",41.1],["07-08",40.95],["07-09",40.6],["07-10",40.15],["07-11",39.4],["07-12",39.1],["07-15",39.15],["07-16",38.9],["07-17",37.8],["07-18",38.0],["07-19",39.1],["07-22",38.65],["07-23",38.65],["07-24",39.2],["07-25",39.1],["07-26",38.75],["07-29",38.9],["07-30",39.1],["07-31",38.9],["08-01",38.8],["08-02",38.8],["08-05",38.85],["08-06",38.85],["08-07",38.8],["08-08",38.55],["08-09",38.45],["08-12",38.6],["08-13",38.75],["08-14",38.95],["08-15",39.0],["08-16",39.1],["08-19",39.15],["08-20",39.35],["08-21",40.3],["08-22",39.65],["08-23",39.65],["08-26",39.4],["08-27",39.55],["08-28",39.55],["08-29",39.8],["08-30",39.85],["09-03",39.98],["09-04",39.9],["09-05",39.95],["09-06",40.0],["09-09",40.0],["09-10",40.0],["09-11",40.0],["09-12",40.05],["09-13",40.18],["09-16",40.2],["09-17",40.55],["09-18",40.45],["09-19",40.53],["09-20",40.5],["09-23",40.43],["09-24",40.48],["09-25",40.43],["09-26",40.45],["09-27",40.3],["09-30",39.7],["10-01",39.6],["10-02",38.3],["10-03",39.0],["10-04",38.9],["10-07",39.8],["10-08",39.75],["10-09",39.2],["10-10",38.83],["10-11",39.2],["10-14",39.3],["10-15",39.2],["10-16",38.95],["10-17",39.2],["10-18",39.4],["10-21",39.1],["10-22",38.95],["10-23",39.18],["10-24",39.2],["10-25",39.3],["10-28",39.38],["10-29",39.6],["10-30",39.3],["10-31",39.2],["11-01",38.9],["11-04",39.25],["11-05",39.33],["11-06",39.5],["11-07",39.53],["11-08",39.4],["11-11",39.5],["11-12",39.73],["11-13",39.75],["11-14",39.75],["11-15",40.0],["11-18",40.0],["11-19",40.05],["11-20",40.75],["11-21",40.25],["11-22",40.2],["11-25",40.3],["11-26",40.08],["11-27",39.75],["11-28",39.85],["11-29",39.85],["12-02",39.9],["12-03",40.15],["12-04",40.78],["12-05",40.45],["12-06",40.35],["12-09",40.63],["12-10",40.68],["12-11",40.75],["12-12",41.3],["12-13",40.9],["12-16",40.98],["12-17",41.2],["12-18",41.83],["12-19",41.68],["12-20",41.65],["12-23",41.7],["12-24",41.7],["12-27",41.7],["12-30",42.0],["12-31",41.95]],"Silver":[["01-02",2.17],["01-03",2.23],["01-04",2.17],["01-05",2.16],["01-08",2.16],["01-09",2.11],["01-10",2.08],["01-11",2.09],["01-12",2.13],["01-15",2.11],["01-16",2.07],["01-17",2.07],["01-18",2.06],["01-19",2.08],["01-22",2.09],["01-23",2.08],["01-24",2.06],["01-25",2.02],["01-26",2.07],["01-29",2.04],["01-30",2.02],["01-31",1.96],["02-01",2.0],["02-02",2.02],["02-05",2.0],["02-06",1.95],["02-07",1.97],["02-08",1.98],["02-09",1.94],["02-12",1.93],["02-13",1.92],["02-14",1.92],["02-15",1.94],["02-16",2.0],["02-19",1.97],["02-20",1.98],["02-21",2.03],["02-22",2.03],["02-23",2.02],["02-26",2.06],["02-27",2.1],["02-28",2.1],["02-29",2.08],["03-01",2.2],["03-04",2.19],["03-05",2.19],["03-06",2.13],["03-07",2.19],["03-08",2.23],["03-11",2.2],["03-12",2.22],["03-13",2.37],["03-14",2.49],["03-18",2.12],["03-19",2.4],["03-20",2.24],["03-21",2.3],["03-22",2.22],["03-25",2.24],["03-26",2.24],["03-27",2.3],["03-28",2.25],["03-29",2.28],["04-01",2.26],["04-02",2.2],["04-03",2.19],["04-04",2.12],["04-05",2.1],["04-08",2.13],["04-09",2.21],["04-10",2.2],["04-11",2.16],["04-16",2.25],["04-17",2.3],["04-18",2.23],["04-19",2.28],["04-22",2.36],["04-23",2.36],["04-24",2.3],["04-25",2.31],["04-26",2.33],["04-29",2.4],["04-30",2.4],["05-01",2.36],["05-02",2.3],["05-03",2.31],["05-06",2.33],["05-07",2.25],["05-08",2.32],["05-09",2.32],["05-10",2.36],["05-13",2.36],["05-14",2.38],["05-15",2.4],["05-16",2.46],["05-17",2.5],["05-20",2.51],["05-21",2.55],["05-22",2.47],["05-23",2.48],["05-24",2.5],["05-27",2.52],["05-28",2.49],["05-29",2.42],["05-30",2.48],["05-31",2.48],["06-04",2.43],["06-05",2.42],["06-06",2.45],["06-07",2.48],["06-10",2.45],["06-11",2.51],["06-12",2.58],["06-13",2.52],["06-14",2.46],["06-17",2.43],["06-18",2.43],["06-19",2.53],["06-20",2.47],["06-21",2.45],["06-24",2.48],["06-25",2.51],["06-26",2.49],["06-27",2.49],["06-28",2.5],["07-01",2.51],["07-02",2.46],["07-03",2.49],["07-04",2.49],["07-05",2.47],["07-08",2.44],["07-09",2.32],["07-10",2.42],["07-11",2.37],["07-12",2.35],["07-15",2.39],["07-16",2.35],["07-17",2.3],["07-18",2.24],["07-19",2.33],["07-22",2.29],["07-23",2.29],["07-24",2.33],["07-25",2.28],["07-26",2.28],["07-29",2.28],["07-30",2.23],["07-31",2.29],["08-01",2.23],["08-02",2.25],["08-05",2.19],["08-06",2.19],["08-07",2.21],["08-08",2.17],["08-09",2.15],["08-12",2.12],["08-13",2.06],["08-14",2.19],["08-15",2.21],["08-16",2.2],["08-19",2.18],["08-20",2.24],["08-21",2.33],["08-22",2.24],["08-23",2.27],["08-26",2.24],["08-27",2.24],["08-28",2.22],["08-29",2.24],["08-30",2.24],["09-03",2.24],["09-04",2.25],["09-05",2.27],["09-06",2.26],["09-09",2.24],["09-10",2.17],["09-11",2.25],["09-12",2.2],["09-13",2.23],["09-16",2.21],["09-17",2.23],["09-18",2.25],["09-19",2.23],["09-20",2.24],["09-23",2.23],["09-24",2.22],["09-25",2.22],["09-26",2.19],["09-27",2.2],["09-30",2.17],["10-01",2.14],["10-02",2.09],["10-03",2.1],["10-04",2.08],["10-07",2.1],["10-08",2.09],["10-09",2.05],["10-10",2.01],["10-11",2.05],["10-14",2.03],["10-15",1.99],["10-16",1.92],["10-17",1.84],["10-18",1.87],["10-21",1.97],["10-22",1.88],["10-23",1.92],["10-24",1.9],["10-25",1.91],["10-28",1.91],["10-29",1.97],["10-30",1.96],["10-31",1.93],["11-01",1.9],["11-04",1.96],["11-05",1.98],["11-06",1.99],["11-07",1.96],["11-08",1.97],["11-11",2.0],["11-12",2.01],["11-13",2.06],["11-14",2.07],["11-15",2.09],["11-18",2.1],["11-19",2.08],["11-25",2.1],["11-26",1.99],["11-27",1.92],["11-28",1.98],["11-29",1.97],["12-02",1.94],["12-03",1.95],["12-04",1.99],["12-05",2.0],["12-06",2.04],["12-09",2.04],["12-10",1.98],["12-11",2.02],["12-12",1.98],["12-13",1.99],["12-16",1.96],["12-17",1.96],["12-18",2.0],["12-19",2.0],["12-20",1.97],["12-23",1.97],["12-24",1.96],["12-27",1.94],["12-30",1.97],["12-31",1.95]]},"1969":{"Gold":[["01-02",41.8],["01-03",41.9],["01-06",42.03],["01-07",42.1],["01-08",42.45],["01-09",42.48],["01-10",42.3],["01-13",42.0],["01-14",42.4],["01-15",42.75],["01-16",42.7],["01-17",41.9],["01-20",42.2],["01-21",42.4],["01-22",42.6],["01-23",42.2],["01-24",42.0],["01-27",42.2],["01-28",42.45],["01-29",42.45],["01-30",42.55],["01-31",42.55],["02-03",42.5],["02-04",42.48],["02-05",42.7],["02-06",42.63],["02-07",42.55],["02-10",42.55],["02-11",42.53],["02-12",42.6],["02-13",42.55],["02-14",42.5],["02-17",42.65],["02-18",42.63],["02-19",42.65],["02-20",42.6],["02-21",42.63],["02-24",42.7],["02-25",42.68],["02-26",42.7],["02-27",42.75],["02-28",42.78],["03-03",42.75],["03-04",42.75],["03-05",42.9],["03-06",43.25],["03-07",43.6],["03-10",43.75],["03-11",43.3],["03-12",43.03],["03-13",43.15],["03-14",43.0],["03-17",43.03],["03-18",42.85],["03-19",43.08],["03-20",43.13],["03-21",43.18],["03-24",43.25],["03-25",43.4],["03-26",43.35],["03-27",43.48],["03-28",43.3],["03-31",43.1],["04-01",43.1],["04-02",43.3],["04-03",43.35],["04-08",43.35],["04-09",43.38],["04-10",43.4],["04-11",43.35],["04-14",43.28],["04-15",42.9],["04-16",43.08],["04-17",43.23],["04-18",43.2],["04-21",43.2],["04-22",43.18],["04-23",43.4],["04-24",43.28],["04-25",43.25],["04-28",43.55],["04-29",43.55],["04-30",43.6],["05-01",43.6],["05-02",43.6],["05-05",43.48],["05-06",43.4],["05-07",43.48],["05-08",43.65],["05-09",43.6],["05-12",43.45],["05-13",43.5],["05-14",43.5],["05-15",43.5],["05-16",43.5],["05-19",43.48],["05-20",43.45],["05-21",43.43],["05-22",43.45],["05-23",43.5],["05-27",43.5],["05-28",43.4],["05-29",43.08],["05-30",43.15],["06-02",42.95],["06-03",42.15],["06-04",42.08],["06-05",41.1],["06-06",40.75],["06-09",40.7],["06-10",41.98],["06-11",41.8],["06-12",41.55],["06-13",41.55],["06-16",41.25],["06-17",41.5],["06-18",41.4],["06-19",41.45],["06-20",41.45],["06-23",41.23],["06-24",41.2],["06-25",40.9],["06-26",40.98],["06-27",41.1],["06-30",41.23],["07-01",41.1],["07-02",41.25],["07-03",41.51],["07-04",41.5],["07-07",41.76],["07-08",42.1],["07-09",41.9],["07-10",41.9],["07-11",41.9],["07-14",41.95],["07-15",42.0],["07-16",41.9],["07-17",41.98],["07-18",41.9],["07-21",42.0],["07-22",41.95],["07-23",41.88],["07-24",41.9],["07-25",41.85],["07-28",41.72],["07-29",41.49],["07-30",41.49],["07-31",41.45],["08-01",41.39],["08-04",41.4],["08-05",41.15],["08-06",41.1],["08-07",41.03],["08-08",41.15],["08-11",41.45],["08-12",41.2],["08-13",41.1],["08-14",41.38],["08-15",41.1],["08-18",41.2],["08-19",41.13],["08-20",41.1],["08-21",41.08],["08-22",41.05],["08-25",41.0],["08-26",40.9],["08-27",40.9],["08-28",40.95],["08-29",40.95],["09-02",40.79],["09-03",40.78],["09-04",40.89],["09-05",40.9],["09-08",40.9],["09-09",40.9],["09-10",40.98],["09-11",40.93],["09-12",40.95],["09-15",41.0],["09-16",41.0],["09-17",41.0],["09-18",40.88],["09-19",40.85],["09-22",40.88],["09-23",40.8],["09-24",40.85],["09-25",40.85],["09-26",40.75],["09-29",40.65],["09-30",40.65],["10-01",40.75],["10-02",40.78],["10-03",40.99],["10-06",40.9],["10-07",40.78],["10-08",40.76],["10-09",40.78],["10-10",40.75],["10-13",40.63],["10-14",40.68],["10-15",40.73],["10-16",40.65],["10-17",40.58],["10-20",40.48],["10-21",40.35],["10-22",40.25],["10-23",39.95],["10-24",40.05],["10-27",40.15],["10-28",40.13],["10-29",40.05],["10-30",39.98],["10-31",39.85],["11-03",39.58],["11-04",39.53],["11-05",39.5],["11-06",39.05],["11-07",38.85],["11-10",37.9],["11-11",38.2],["11-12",38.08],["11-13",37.8],["11-14",37.8],["11-17",37.9],["11-18",37.78],["11-19",37.05],["11-20",36.0],["11-21",36.1],["11-24",35.83],["11-25",35.35],["11-26",35.58],["11-27",35.63],["11-28",35.55],["12-01",35.53],["12-02",35.45],["12-03",35.35],["12-04",35.33],["12-05",35.23],["12-08",35.2],["12-09",35.0],["12-10",35.0],["12-11",35.18],["12-12",35.33],["12-15",35.2],["12-16",35.03],["12-17",35.1],["12-18",35.08],["12-19",35.0],["12-22",35.04],["12-23",35.13],["12-24",35.18],["12-29",35.23],["12-30",35.23],["12-31",35.21]],"Silver":[["01-02",1.96],["01-03",1.97],["01-06",1.97],["01-07",1.98],["01-08",2.02],["01-09",2.01],["01-10",2.04],["01-13",2.02],["01-14",2.03],["01-15",2.04],["01-16",2.02],["01-17",1.99],["01-20",1.99],["01-21",2.02],["01-22",2.0],["01-23",1.98],["01-24",1.99],["01-27",2.0],["01-28",1.99],["01-29",1.98],["01-30",2.0],["01-31",2.0],["02-03",1.99],["02-04",1.99],["02-05",1.98],["02-06",1.92],["02-07",1.89],["02-10",1.88],["02-11",1.88],["02-12",1.87],["02-13",1.83],["02-14",1.77],["02-17",1.85],["02-18",1.8],["02-19",1.83],["02-20",1.84],["02-21",1.83],["02-24",1.83],["02-25",1.8],["02-26",1.8],["02-27",1.83],["02-28",1.82],["03-03",1.81],["03-04",1.8],["03-05",1.86],["03-06",1.89],["03-07",1.93],["03-10",1.9],["03-11",1.88],["03-12",1.83],["03-13",1.87],["03-14",1.84],["03-17",1.83],["03-18",1.81],["03-19",1.82],["03-20",1.81],["03-21",1.83],["03-24",1.85],["03-25",1.83],["03-26",1.82],["03-27",1.81],["03-28",1.83],["03-31",1.82],["04-01",1.81],["04-02",1.8],["04-03",1.83],["04-08",1.83],["04-09",1.8],["04-10",1.81],["04-11",1.8],["04-14",1.8],["04-15",1.8],["04-16",1.8],["04-17",1.81],["04-18",1.8],["04-21",1.8],["04-22",1.77],["04-23",1.78],["04-24",1.79],["04-25",1.78],["04-28",1.81],["04-29",1.79],["04-30",1.78],["05-01",1.78],["05-02",1.78],["05-05",1.77],["05-06",1.76],["05-07",1.81],["05-08",1.85],["05-09",1.82],["05-12",1.79],["05-13",1.75],["05-14",1.78],["05-15",1.76],["05-16",1.78],["05-19",1.76],["05-20",1.75],["05-21",1.76],["05-22",1.75],["05-23",1.76],["05-27",1.78],["05-28",1.77],["05-29",1.77],["05-30",1.77],["06-02",1.77],["06-03",1.77],["06-04",1.76],["06-05",1.77],["06-06",1.75],["06-09",1.72],["06-10",1.69],["06-11",1.68],["06-12",1.69],["06-13",1.69],["06-16",1.68],["06-17",1.59],["06-18",1.58],["06-19",1.6],["06-20",1.63],["06-23",1.57],["06-24",1.58],["06-25",1.59],["06-26",1.58],["06-27",1.56],["06-30",1.56],["07-01",1.59],["07-02",1.57],["07-03",1.57],["07-04",1.59],["07-07",1.59],["07-08",1.61],["07-09",1.62],["07-10",1.66],["07-11",1.63],["07-14",1.65],["07-15",1.68],["07-16",1.67],["07-17",1.64],["07-18",1.65],["07-21",1.67],["07-22",1.68],["07-23",1.66],["07-24",1.64],["07-25",1.65],["07-28",1.65],["07-29",1.62],["07-30",1.62],["07-31",1.63],["08-01",1.61],["08-04",1.62],["08-05",1.6],["08-06",1.61],["08-07",1.61],["08-08",1.62],["08-11",1.69],["08-12",1.65],["08-13",1.68],["08-14",1.71],["08-15",1.7],["08-18",1.68],["08-19",1.66],["08-20",1.69],["08-21",1.67],["08-22",1.68],["08-25",1.67],["08-26",1.66],["08-27",1.67],["08-28",1.66],["08-29",1.67],["09-02",1.69],["09-03",1.71],["09-04",1.71],["09-05",1.7],["09-08",1.73],["09-09",1.76],["09-10",1.75],["09-11",1.77],["09-12",1.8],["09-15",1.78],["09-16",1.77],["09-17",1.81],["09-18",1.79],["09-19",1.8],["09-22",1.82],["09-23",1.87],["09-24",1.89],["09-25",1.84],["09-26",1.83],["09-29",1.84],["09-30",1.88],["10-01",1.86],["10-02",1.89],["10-03",1.87],["10-06",1.82],["10-07",1.86],["10-08",1.82],["10-09",1.84],["10-10",1.84],["10-13",1.83],["10-14",1.82],["10-15",1.81],["10-16",1.84],["10-17",1.81],["10-20",1.85],["10-21",1.87],["10-22",1.85],["10-23",1.86],["10-24",1.85],["10-27",1.91],["10-28",1.89],["10-29",1.9],["10-30",1.93],["10-31",1.95],["11-03",2.0],["11-04",1.97],["11-05",1.99],["11-06",1.99],["11-07",1.96],["11-10",1.94],["11-11",1.96],["11-12",1.96],["11-13",1.93],["11-14",1.92],["11-17",1.92],["11-18",1.9],["11-19",1.88],["11-20",1.9],["11-21",1.9],["11-24",1.9],["11-25",1.87],["11-26",1.87],["11-27",1.88],["11-28",1.89],["12-01",1.91],["12-02",1.92],["12-03",1.91],["12-04",1.88],["12-05",1.85],["12-08",1.86],["12-09",1.81],["12-10",1.76],["12-11",1.77],["12-12",1.75],["12-15",1.76],["12-16",1.76],["12-17",1.73],["12-18",1.72],["12-19",1.74],["12-22",1.76],["12-23",1.77],["12-24",1.8],["12-29",1.82],["12-30",1.8],["12-31",1.79]]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 5056 entries across 10 years (1970–1979)
+window._loadSpotSeedBundle({"1970":{"Gold":[["01-02",35.13],["01-05",35.1],["01-06",35.13],["01-07",35.0],["01-08",34.98],["01-09",34.85],["01-12",34.98],["01-13",34.92],["01-14",34.89],["01-15",34.86],["01-16",34.78],["01-19",34.78],["01-20",34.8],["01-21",34.83],["01-22",34.93],["01-23",34.99],["01-26",34.98],["01-27",35.0],["01-28",35.0],["01-29",35.0],["01-30",34.98],["02-02",34.95],["02-03",35.0],["02-04",35.0],["02-05",34.99],["02-06",35.0],["02-09",35.01],["02-10",35.01],["02-11",35.03],["02-12",34.99],["02-13",34.98],["02-16",35.0],["02-17",35.0],["02-18",34.98],["02-19",34.98],["02-20",34.99],["02-23",35.0],["02-24",34.98],["02-25",35.0],["02-26",35.0],["02-27",35.0],["03-02",35.0],["03-03",35.01],["03-04",35.0],["03-05",35.0],["03-06",34.95],["03-09",34.97],["03-10",34.98],["03-11",34.99],["03-12",35.0],["03-13",35.0],["03-16",35.05],["03-17",35.07],["03-18",35.08],["03-19",35.3],["03-20",35.18],["03-23",35.15],["03-24",35.17],["03-25",35.28],["03-26",35.3],["03-31",35.3],["04-01",35.33],["04-02",35.4],["04-03",35.35],["04-06",35.33],["04-07",35.28],["04-08",35.36],["04-09",35.43],["04-10",35.38],["04-13",35.43],["04-14",35.53],["04-15",35.84],["04-16",35.75],["04-17",35.75],["04-20",35.76],["04-21",35.84],["04-22",35.93],["04-23",35.98],["04-24",35.81],["04-27",35.74],["04-28",35.8],["04-29",35.88],["04-30",35.85],["05-01",35.85],["05-04",35.9],["05-05",36.19],["05-06",36.24],["05-07",36.23],["05-08",36.23],["05-11",36.15],["05-12",36.0],["05-13",35.94],["05-14",35.95],["05-15",35.95],["05-18",35.98],["05-19",35.96],["05-20",35.96],["05-21",35.95],["05-22",35.88],["05-26",35.85],["05-27",35.8],["05-28",35.67],["05-29",35.5],["06-01",35.45],["06-02",35.3],["06-03",35.2],["06-04",35.18],["06-05",35.19],["06-08",35.25],["06-09",35.7],["06-10",35.53],["06-11",35.59],["06-12",35.64],["06-15",35.64],["06-16",35.48],["06-17",35.34],["06-18",35.46],["06-19",35.37],["06-22",35.4],["06-23",35.4],["06-24",35.45],["06-25",35.63],["06-26",35.45],["06-29",35.48],["06-30",35.51],["07-01",35.5],["07-02",35.48],["07-03",35.39],["07-06",35.35],["07-07",35.33],["07-08",35.3],["07-09",35.31],["07-10",35.31],["07-13",35.33],["07-14",35.33],["07-15",35.31],["07-16",35.3],["07-17",35.31],["07-20",35.33],["07-21",35.31],["07-22",35.32],["07-23",35.3],["07-24",35.28],["07-27",35.3],["07-28",35.31],["07-29",35.31],["07-30",35.3],["07-31",35.29],["08-03",35.3],["08-04",35.31],["08-05",35.33],["08-06",35.3],["08-07",35.3],["08-10",35.3],["08-11",35.25],["08-12",35.25],["08-13",35.28],["08-14",35.25],["08-17",35.25],["08-18",35.25],["08-19",35.25],["08-20",35.28],["08-21",35.33],["08-24",35.5],["08-25",35.59],["08-26",35.6],["08-27",35.87],["08-28",35.78],["09-01",35.85],["09-02",36.07],["09-03",36.35],["09-04",36.3],["09-07",36.23],["09-08",35.95],["09-09",36.23],["09-10",36.23],["09-11",36.3],["09-14",36.35],["09-15",36.28],["09-16",36.08],["09-17",36.23],["09-18",36.2],["09-21",36.23],["09-22",36.3],["09-23",36.25],["09-24",36.15],["09-25",36.15],["09-28",36.18],["09-29",36.2],["09-30",36.24],["10-01",36.43],["10-02",36.28],["10-05",36.53],["10-06",36.93],["10-07",36.83],["10-08",36.73],["10-09",36.79],["10-12",37.25],["10-13",37.36],["10-14",37.45],["10-15",37.63],["10-16",37.56],["10-19",37.66],["10-20",37.87],["10-21",38.0],["10-22",37.85],["10-23",38.2],["10-26",39.15],["10-27",39.19],["10-28",38.7],["10-29",38.4],["10-30",37.4],["11-02",37.7],["11-03",37.45],["11-04",36.8],["11-05",37.1],["11-06",37.0],["11-09",37.23],["11-10",37.55],["11-11",37.11],["11-12",37.33],["11-13",37.6],["11-16",37.9],["11-17",37.35],["11-18",37.6],["11-19",37.6],["11-20",37.6],["11-23",37.55],["11-24",37.43],["11-25",37.65],["11-26",37.79],["11-27",37.63],["11-30",37.6],["12-01",37.35],["12-02",37.58],["12-03",37.58],["12-04",37.55],["12-07",37.5],["12-08",37.4],["12-09",37.23],["12-10",36.98],["12-11",37.19],["12-14",37.2],["12-15",37.36],["12-16",37.71],["12-17",37.64],["12-18",37.65],["12-21",37.63],["12-22",37.65],["12-23",37.55],["12-24",37.4],["12-28",37.34],["12-29",37.33],["12-30",37.38],["12-31",37.38]],"Silver":[["01-02",1.8],["01-05",1.83],["01-06",1.85],["01-07",1.82],["01-08",1.84],["01-09",1.84],["01-12",1.81],["01-13",1.83],["01-14",1.84],["01-15",1.88],["01-16",1.86],["01-19",1.87],["01-20",1.89],["01-21",1.87],["01-22",1.87],["01-23",1.88],["01-26",1.9],["01-27",1.88],["01-28",1.87],["01-29",1.92],["01-30",1.91],["02-02",1.89],["02-03",1.9],["02-04",1.92],["02-05",1.9],["02-06",1.9],["02-09",1.91],["02-10",1.91],["02-11",1.89],["02-12",1.89],["02-13",1.9],["02-16",1.9],["02-17",1.89],["02-18",1.87],["02-19",1.89],["02-20",1.88],["02-23",1.88],["02-24",1.88],["02-25",1.87],["02-26",1.88],["02-27",1.9],["03-02",1.89],["03-03",1.9],["03-04",1.9],["03-05",1.93],["03-06",1.9],["03-09",1.89],["03-10",1.89],["03-11",1.89],["03-12",1.88],["03-13",1.87],["03-16",1.87],["03-17",1.86],["03-18",1.86],["03-19",1.88],["03-20",1.87],["03-23",1.86],["03-24",1.86],["03-25",1.86],["03-26",1.88],["03-31",1.88],["04-01",1.88],["04-02",1.89],["04-03",1.88],["04-06",1.87],["04-07",1.86],["04-08",1.86],["04-09",1.86],["04-10",1.84],["04-13",1.85],["04-14",1.86],["04-15",1.85],["04-16",1.85],["04-17",1.86],["04-20",1.86],["04-21",1.86],["04-22",1.86],["04-23",1.85],["04-24",1.85],["04-27",1.84],["04-28",1.8],["04-29",1.75],["04-30",1.72],["05-01",1.73],["05-04",1.73],["05-05",1.65],["05-06",1.73],["05-07",1.7],["05-08",1.73],["05-11",1.75],["05-12",1.75],["05-13",1.72],["05-14",1.68],["05-15",1.68],["05-18",1.7],["05-19",1.69],["05-20",1.68],["05-21",1.64],["05-22",1.62],["05-26",1.57],["05-27",1.6],["05-28",1.63],["05-29",1.63],["06-01",1.65],["06-02",1.61],["06-03",1.62],["06-04",1.64],["06-05",1.64],["06-08",1.65],["06-09",1.67],["06-10",1.69],["06-11",1.65],["06-12",1.63],["06-15",1.63],["06-16",1.64],["06-17",1.66],["06-18",1.63],["06-19",1.65],["06-22",1.64],["06-23",1.65],["06-24",1.64],["06-25",1.63],["06-26",1.63],["06-29",1.62],["06-30",1.61],["07-01",1.62],["07-02",1.64],["07-03",1.62],["07-06",1.62],["07-07",1.6],["07-08",1.62],["07-09",1.62],["07-10",1.62],["07-13",1.62],["07-14",1.64],["07-15",1.66],["07-16",1.69],["07-17",1.66],["07-20",1.69],["07-21",1.72],["07-22",1.74],["07-23",1.73],["07-24",1.72],["07-27",1.73],["07-28",1.78],["07-29",1.78],["07-30",1.77],["07-31",1.77],["08-03",1.78],["08-04",1.76],["08-05",1.78],["08-06",1.75],["08-07",1.74],["08-10",1.76],["08-11",1.73],["08-12",1.74],["08-13",1.76],["08-14",1.76],["08-17",1.79],["08-18",1.81],["08-19",1.84],["08-20",1.82],["08-21",1.81],["08-24",1.84],["08-25",1.85],["08-26",1.86],["08-27",1.84],["08-28",1.84],["09-01",1.85],["09-02",1.84],["09-03",1.84],["09-04",1.85],["09-07",1.85],["09-08",1.85],["09-09",1.87],["09-10",1.85],["09-11",1.84],["09-14",1.84],["09-15",1.81],["09-16",1.79],["09-17",1.81],["09-18",1.78],["09-21",1.77],["09-22",1.78],["09-23",1.78],["09-24",1.77],["09-25",1.73],["09-28",1.76],["09-29",1.75],["09-30",1.7],["10-01",1.72],["10-02",1.73],["10-05",1.73],["10-06",1.71],["10-07",1.75],["10-08",1.76],["10-09",1.75],["10-12",1.75],["10-13",1.75],["10-14",1.72],["10-15",1.74],["10-16",1.75],["10-19",1.74],["10-20",1.72],["10-21",1.73],["10-22",1.73],["10-23",1.73],["10-26",1.79],["10-27",1.8],["10-28",1.79],["10-29",1.77],["10-30",1.78],["11-02",1.79],["11-03",1.78],["11-04",1.79],["11-05",1.81],["11-06",1.79],["11-09",1.79],["11-10",1.82],["11-11",1.79],["11-12",1.81],["11-13",1.78],["11-16",1.78],["11-17",1.79],["11-18",1.77],["11-19",1.76],["11-20",1.74],["11-23",1.75],["11-24",1.72],["11-25",1.66],["11-26",1.68],["11-27",1.66],["11-30",1.65],["12-01",1.61],["12-02",1.65],["12-03",1.64],["12-04",1.65],["12-07",1.64],["12-08",1.63],["12-09",1.6],["12-10",1.58],["12-11",1.6],["12-14",1.63],["12-15",1.64],["12-16",1.61],["12-17",1.59],["12-18",1.65],["12-21",1.65],["12-22",1.67],["12-23",1.63],["12-24",1.64],["12-28",1.64],["12-29",1.65],["12-30",1.64],["12-31",1.63]]},"1971":{"Gold":[["01-04",37.33],["01-05",37.5],["01-06",37.5],["01-07",37.39],["01-08",37.51],["01-11",37.5],["01-12",37.85],["01-13",38.28],["01-14",38.1],["01-15",38.15],["01-18",38.1],["01-19",37.93],["01-20",38.03],["01-21",38.18],["01-22",37.95],["01-25",37.9],["01-26",38.1],["01-27",38.03],["01-28",38.05],["01-29",38.0],["02-01",38.1],["02-02",38.35],["02-03",38.7],["02-04",38.48],["02-05",38.45],["02-08",38.5],["02-09",38.73],["02-10",38.85],["02-11",38.88],["02-12",39.05],["02-15",38.9],["02-16",38.95],["02-17",38.9],["02-18",38.85],["02-19",38.78],["02-22",38.75],["02-23",38.8],["02-24",38.78],["02-25",38.75],["02-26",38.79],["03-01",38.75],["03-02",38.7],["03-03",38.78],["03-04",38.78],["03-05",38.76],["03-08",38.75],["03-09",38.81],["03-10",38.84],["03-11",38.96],["03-12",39.03],["03-15",39.08],["03-16",38.98],["03-17",38.93],["03-18",38.95],["03-19",39.03],["03-22",38.95],["03-23",38.93],["03-24",38.92],["03-25",38.91],["03-26",38.9],["03-29",38.83],["03-30",38.75],["03-31",38.8],["04-01",38.95],["04-02",38.83],["04-05",38.9],["04-06",38.9],["04-07",38.93],["04-08",38.95],["04-13",38.9],["04-14",38.9],["04-15",38.89],["04-16",38.93],["04-19",38.95],["04-20",38.95],["04-21",38.91],["04-22",38.98],["04-23",39.09],["04-26",39.0],["04-27",38.91],["04-28",39.15],["04-29",39.43],["04-30",39.6],["05-03",39.42],["05-04",39.86],["05-05",39.66],["05-06",40.2],["05-07",39.88],["05-10",39.65],["05-11",40.0],["05-12",40.7],["05-13",40.85],["05-14",40.8],["05-17",41.1],["05-18",41.2],["05-19",40.5],["05-20",40.8],["05-21",41.05],["05-24",40.75],["05-25",40.98],["05-26",40.96],["05-27",40.7],["05-28",40.8],["06-01",40.85],["06-02",40.65],["06-03",40.53],["06-04",40.6],["06-07",40.5],["06-08",40.3],["06-09",39.95],["06-10",39.6],["06-11",39.65],["06-14",39.6],["06-15",39.49],["06-16",39.78],["06-17",39.95],["06-18",39.9],["06-21",39.95],["06-22",40.1],["06-23",40.25],["06-24",40.4],["06-25",40.11],["06-28",40.08],["06-29",39.88],["06-30",40.2],["07-01",40.1],["07-02",40.41],["07-05",40.23],["07-06",40.3],["07-07",40.2],["07-08",40.28],["07-09",40.24],["07-12",40.35],["07-13",40.35],["07-14",40.4],["07-15",40.44],["07-16",40.6],["07-19",41.01],["07-20",40.98],["07-21",41.2],["07-22",41.59],["07-23",41.58],["07-26",41.45],["07-27",41.98],["07-28",42.09],["07-29",42.21],["07-30",42.48],["08-02",42.48],["08-03",42.15],["08-04",42.19],["08-05",42.8],["08-06",42.65],["08-09",42.9],["08-10",43.3],["08-11",42.75],["08-12",43.23],["08-13",43.28],["08-18",43.0],["08-19",43.4],["08-20",43.3],["08-23",43.25],["08-24",43.1],["08-25",43.1],["08-26",42.75],["08-27",41.1],["08-31",41.0],["09-01",40.7],["09-02",41.6],["09-03",41.73],["09-06",41.8],["09-07",41.7],["09-08",41.33],["09-09",41.7],["09-10",41.58],["09-13",41.59],["09-14",41.85],["09-15",41.89],["09-16",42.23],["09-17",42.1],["09-20",42.05],["09-21",42.3],["09-22",42.2],["09-23",42.25],["09-24",42.65],["09-27",42.35],["09-28",42.73],["09-29",42.7],["09-30",42.48],["10-01",42.18],["10-04",42.5],["10-05",42.35],["10-06",42.44],["10-07",42.45],["10-08",42.5],["10-11",42.45],["10-12",42.53],["10-13",42.6],["10-14",42.54],["10-15",42.58],["10-18",42.51],["10-19",42.55],["10-20",42.5],["10-21",42.53],["10-22",42.48],["10-25",42.48],["10-26",42.5],["10-27",42.51],["10-28",42.45],["10-29",42.4],["11-01",42.13],["11-02",42.4],["11-03",42.2],["11-04",42.15],["11-05",42.25],["11-08",42.35],["11-09",42.48],["11-10",42.63],["11-11",42.55],["11-12",42.6],["11-15",42.85],["11-16",43.0],["11-17",42.81],["11-18",43.0],["11-19",43.15],["11-22",43.25],["11-23",43.2],["11-24",43.38],["11-25",43.64],["11-26",43.33],["11-29",43.65],["11-30",43.55],["12-01",43.5],["12-02",43.6],["12-03",43.73],["12-06",43.9],["12-07",43.88],["12-08",43.6],["12-09",43.5],["12-10",43.68],["12-13",43.65],["12-14",43.65],["12-15",43.61],["12-16",43.4],["12-17",43.05],["12-20",42.4],["12-21",42.95],["12-22",43.15],["12-23",43.53],["12-24",43.29],["12-28",43.3],["12-29",43.53],["12-30",43.5],["12-31",43.62]],"Silver":[["01-04",1.65],["01-05",1.65],["01-06",1.65],["01-07",1.69],["01-08",1.69],["01-11",1.71],["01-12",1.7],["01-13",1.7],["01-14",1.68],["01-15",1.68],["01-18",1.63],["01-19",1.59],["01-20",1.58],["01-21",1.58],["01-22",1.56],["01-25",1.59],["01-26",1.61],["01-27",1.56],["01-28",1.59],["01-29",1.59],["02-01",1.59],["02-02",1.61],["02-03",1.62],["02-04",1.62],["02-05",1.6],["02-08",1.61],["02-09",1.58],["02-10",1.58],["02-11",1.59],["02-12",1.59],["02-15",1.58],["02-16",1.58],["02-17",1.59],["02-18",1.6],["02-19",1.6],["02-22",1.6],["02-23",1.6],["02-24",1.59],["02-25",1.57],["02-26",1.59],["03-01",1.6],["03-02",1.63],["03-03",1.61],["03-04",1.61],["03-05",1.64],["03-08",1.66],["03-09",1.66],["03-10",1.67],["03-11",1.66],["03-12",1.66],["03-15",1.66],["03-16",1.68],["03-17",1.68],["03-18",1.67],["03-19",1.67],["03-22",1.67],["03-23",1.68],["03-24",1.66],["03-25",1.66],["03-26",1.69],["03-29",1.69],["03-30",1.69],["03-31",1.69],["04-01",1.71],["04-02",1.71],["04-05",1.74],["04-06",1.73],["04-07",1.74],["04-08",1.75],["04-13",1.75],["04-14",1.73],["04-15",1.73],["04-16",1.71],["04-19",1.71],["04-20",1.73],["04-21",1.74],["04-22",1.74],["04-23",1.72],["04-26",1.72],["04-27",1.67],["04-28",1.69],["04-29",1.7],["04-30",1.69],["05-03",1.68],["05-04",1.66],["05-05",1.69],["05-06",1.69],["05-07",1.69],["05-10",1.67],["05-11",1.68],["05-12",1.67],["05-13",1.68],["05-14",1.7],["05-17",1.68],["05-18",1.68],["05-19",1.68],["05-20",1.67],["05-21",1.66],["05-24",1.61],["05-25",1.64],["05-26",1.61],["05-27",1.6],["05-28",1.6],["06-01",1.61],["06-02",1.59],["06-03",1.59],["06-04",1.59],["06-07",1.58],["06-08",1.58],["06-09",1.63],["06-10",1.61],["06-11",1.61],["06-14",1.62],["06-15",1.61],["06-16",1.63],["06-17",1.64],["06-18",1.63],["06-21",1.61],["06-22",1.58],["06-23",1.6],["06-24",1.59],["06-25",1.6],["06-28",1.6],["06-29",1.58],["06-30",1.57],["07-01",1.6],["07-02",1.6],["07-05",1.58],["07-06",1.59],["07-07",1.58],["07-08",1.59],["07-09",1.59],["07-12",1.59],["07-13",1.56],["07-14",1.58],["07-15",1.56],["07-16",1.55],["07-19",1.56],["07-20",1.54],["07-21",1.54],["07-22",1.56],["07-23",1.56],["07-26",1.56],["07-27",1.55],["07-28",1.56],["07-29",1.6],["07-30",1.59],["08-02",1.58],["08-03",1.61],["08-04",1.63],["08-05",1.62],["08-06",1.6],["08-09",1.61],["08-10",1.61],["08-11",1.57],["08-12",1.59],["08-13",1.59],["08-23",1.59],["08-24",1.57],["08-25",1.58],["08-26",1.57],["08-27",1.56],["08-31",1.5],["09-01",1.48],["09-02",1.5],["09-03",1.49],["09-06",1.47],["09-07",1.44],["09-08",1.37],["09-09",1.42],["09-10",1.39],["09-13",1.37],["09-14",1.39],["09-15",1.41],["09-16",1.4],["09-17",1.42],["09-20",1.42],["09-21",1.42],["09-22",1.4],["09-23",1.4],["09-24",1.41],["09-27",1.4],["09-28",1.39],["09-29",1.39],["09-30",1.38],["10-01",1.38],["10-04",1.38],["10-05",1.33],["10-06",1.34],["10-07",1.35],["10-08",1.34],["10-11",1.3],["10-12",1.31],["10-13",1.3],["10-14",1.32],["10-15",1.32],["10-18",1.34],["10-19",1.34],["10-20",1.31],["10-21",1.29],["10-22",1.31],["10-25",1.31],["10-26",1.32],["10-27",1.33],["10-28",1.29],["10-29",1.31],["11-01",1.29],["11-02",1.27],["11-03",1.27],["11-04",1.29],["11-05",1.28],["11-08",1.3],["11-09",1.32],["11-10",1.31],["11-11",1.31],["11-12",1.33],["11-15",1.32],["11-16",1.34],["11-17",1.32],["11-18",1.33],["11-19",1.32],["11-22",1.31],["11-23",1.33],["11-24",1.31],["11-25",1.32],["11-26",1.31],["11-29",1.33],["11-30",1.33],["12-01",1.32],["12-02",1.35],["12-03",1.35],["12-06",1.4],["12-07",1.37],["12-08",1.38],["12-09",1.4],["12-10",1.42],["12-13",1.4],["12-14",1.39],["12-15",1.39],["12-16",1.41],["12-17",1.43],["12-21",1.39],["12-22",1.39],["12-23",1.39],["12-24",1.39],["12-28",1.36],["12-29",1.36],["12-30",1.38],["12-31",1.37]]},"1972":{"Gold":[["01-03",43.73],["01-04",44.35],["01-05",44.43],["01-06",44.88],["01-07",45.75],["01-10",45.7],["01-11",45.34],["01-12",45.25],["01-13",45.45],["01-14",45.73],["01-17",45.98],["01-18",46.09],["01-19",45.9],["01-20",45.75],["01-21",45.89],["01-24",45.93],["01-25",46.1],["01-26",46.08],["01-27",46.2],["01-28",47.0],["01-31",46.95],["02-01",47.49],["02-02",48.6],["02-03",48.4],["02-04",47.55],["02-07",47.45],["02-08",48.2],["02-09",47.93],["02-10",48.4],["02-11",48.25],["02-14",48.2],["02-15",47.9],["02-16",48.05],["02-17",48.5],["02-18",48.24],["02-21",48.4],["02-22",48.6],["02-23",48.63],["02-24",48.7],["02-25",48.6],["02-28",48.49],["02-29",48.4],["03-01",47.8],["03-02",48.2],["03-03",48.05],["03-06",48.0],["03-07",48.28],["03-08",48.25],["03-09",48.3],["03-10",48.23],["03-13",48.35],["03-14",48.4],["03-15",48.3],["03-16",48.47],["03-17",48.4],["03-20",48.35],["03-21",48.4],["03-22",48.4],["03-23",48.4],["03-24",48.4],["03-27",48.35],["03-28",48.23],["03-29",48.43],["03-30",48.38],["04-04",48.4],["04-05",48.4],["04-06",48.3],["04-07",48.35],["04-10",48.4],["04-11",48.45],["04-12",48.81],["04-13",49.43],["04-14",49.35],["04-17",49.35],["04-18",49.48],["04-19",49.25],["04-20",49.43],["04-21",49.38],["04-24",49.35],["04-25",49.21],["04-26",49.3],["04-27",49.38],["04-28",49.5],["05-01",50.2],["05-02",50.7],["05-03",50.3],["05-04",50.35],["05-05",50.53],["05-08",51.6],["05-09",54.0],["05-10",53.3],["05-11",53.0],["05-12",52.8],["05-15",52.8],["05-16",54.5],["05-17",57.5],["05-18",57.15],["05-19",56.5],["05-22",57.2],["05-23",57.5],["05-24",56.65],["05-25",56.93],["05-26",57.5],["05-30",58.7],["05-31",59.3],["06-01",58.8],["06-02",59.2],["06-05",59.4],["06-06",59.75],["06-07",64.75],["06-08",66.75],["06-09",65.6],["06-12",59.0],["06-13",63.3],["06-14",60.7],["06-15",61.6],["06-16",61.8],["06-19",60.6],["06-20",61.6],["06-21",61.13],["06-22",61.48],["06-23",64.0],["06-26",63.5],["06-27",62.3],["06-28",63.3],["06-29",65.1],["06-30",64.1],["07-03",64.25],["07-04",65.5],["07-05",65.3],["07-06",65.9],["07-07",65.8],["07-10",65.05],["07-11",65.7],["07-12",64.85],["07-13",65.1],["07-14",65.2],["07-17",65.2],["07-18",65.6],["07-19",65.1],["07-20",64.75],["07-21",65.3],["07-24",65.1],["07-25",65.45],["07-26",65.58],["07-27",65.65],["07-28",67.45],["07-31",68.9],["08-01",68.8],["08-02",70.0],["08-03",68.7],["08-04",67.75],["08-07",68.4],["08-08",66.25],["08-09",65.7],["08-10",66.15],["08-11",66.1],["08-14",64.75],["08-15",65.75],["08-16",65.8],["08-17",66.25],["08-18",66.25],["08-21",66.6],["08-22",66.98],["08-23",67.4],["08-24",67.3],["08-25",67.05],["08-29",66.6],["08-30",66.8],["08-31",66.8],["09-01",66.8],["09-04",66.85],["09-05",66.85],["09-06",67.0],["09-07",66.98],["09-08",67.1],["09-11",67.2],["09-12",67.0],["09-13",66.95],["09-14",66.85],["09-15",66.1],["09-18",64.5],["09-19",64.35],["09-20",64.55],["09-21",64.5],["09-22",64.65],["09-25",63.8],["09-26",63.4],["09-27",63.7],["09-28",64.15],["09-29",64.1],["10-02",64.1],["10-03",64.1],["10-04",64.8],["10-05",65.63],["10-06",65.3],["10-09",65.7],["10-10",65.5],["10-11",65.19],["10-12",64.43],["10-13",64.5],["10-16",64.85],["10-17",65.05],["10-18",64.8],["10-19",64.91],["10-20",64.9],["10-23",64.93],["10-24",64.62],["10-25",64.8],["10-26",64.55],["10-27",64.55],["10-30",64.5],["10-31",64.43],["11-01",63.8],["11-02",64.05],["11-03",64.13],["11-06",64.05],["11-07",63.75],["11-08",63.85],["11-09",62.75],["11-10",62.6],["11-13",62.54],["11-14",62.45],["11-15",61.9],["11-16",61.6],["11-17",60.1],["11-20",60.38],["11-21",61.5],["11-22",62.1],["11-23",62.0],["11-24",62.55],["11-27",63.05],["11-28",63.63],["11-29",63.6],["11-30",63.6],["12-01",63.9],["12-04",63.4],["12-05",63.0],["12-06",63.1],["12-07",62.85],["12-08",63.0],["12-11",63.0],["12-12",62.75],["12-13",62.85],["12-14",63.28],["12-15",63.4],["12-18",64.4],["12-19",65.4],["12-20",64.7],["12-21",64.2],["12-22",64.15],["12-27",64.9],["12-28",64.83],["12-29",64.7]],"Silver":[["01-03",1.37],["01-04",1.39],["01-05",1.42],["01-06",1.41],["01-07",1.44],["01-10",1.44],["01-11",1.48],["01-12",1.46],["01-13",1.47],["01-14",1.45],["01-17",1.5],["01-18",1.5],["01-19",1.51],["01-20",1.49],["01-21",1.49],["01-24",1.49],["01-25",1.46],["01-26",1.46],["01-27",1.47],["01-28",1.52],["01-31",1.5],["02-01",1.53],["02-02",1.55],["02-03",1.51],["02-04",1.52],["02-07",1.54],["02-08",1.53],["02-09",1.51],["02-10",1.53],["02-11",1.53],["02-14",1.49],["02-15",1.49],["02-16",1.49],["02-17",1.5],["02-18",1.5],["02-21",1.49],["02-22",1.5],["02-23",1.48],["02-24",1.48],["02-25",1.49],["02-28",1.47],["02-29",1.47],["03-01",1.48],["03-02",1.5],["03-03",1.5],["03-06",1.52],["03-07",1.54],["03-08",1.52],["03-09",1.54],["03-10",1.54],["03-13",1.54],["03-14",1.54],["03-15",1.52],["03-16",1.52],["03-17",1.51],["03-20",1.52],["03-21",1.54],["03-22",1.55],["03-23",1.53],["03-24",1.53],["03-27",1.52],["03-28",1.54],["03-29",1.56],["03-30",1.56],["04-04",1.6],["04-05",1.59],["04-06",1.57],["04-07",1.58],["04-10",1.59],["04-11",1.58],["04-12",1.58],["04-13",1.58],["04-14",1.55],["04-17",1.56],["04-18",1.56],["04-19",1.55],["04-20",1.54],["04-21",1.55],["04-24",1.55],["04-25",1.55],["04-26",1.55],["04-27",1.57],["04-28",1.57],["05-01",1.6],["05-02",1.59],["05-03",1.58],["05-04",1.58],["05-05",1.59],["05-08",1.59],["05-09",1.6],["05-10",1.59],["05-11",1.58],["05-12",1.58],["05-15",1.58],["05-16",1.59],["05-17",1.6],["05-18",1.59],["05-19",1.58],["05-22",1.59],["05-23",1.58],["05-24",1.56],["05-25",1.56],["05-26",1.57],["05-30",1.57],["05-31",1.55],["06-01",1.54],["06-02",1.56],["06-05",1.55],["06-06",1.56],["06-07",1.58],["06-08",1.57],["06-09",1.57],["06-12",1.57],["06-13",1.58],["06-14",1.58],["06-15",1.59],["06-16",1.59],["06-19",1.58],["06-20",1.57],["06-21",1.56],["06-22",1.56],["06-27",1.57],["06-28",1.57],["06-29",1.55],["06-30",1.56],["07-03",1.56],["07-04",1.55],["07-05",1.56],["07-06",1.61],["07-07",1.68],["07-10",1.7],["07-11",1.68],["07-12",1.7],["07-13",1.75],["07-14",1.76],["07-17",1.77],["07-18",1.78],["07-19",1.75],["07-20",1.78],["07-21",1.74],["07-24",1.76],["07-25",1.78],["07-26",1.76],["07-27",1.75],["07-28",1.84],["07-31",1.83],["08-01",1.79],["08-02",1.83],["08-03",1.81],["08-04",1.81],["08-07",1.82],["08-08",1.81],["08-09",1.79],["08-10",1.82],["08-11",1.82],["08-14",1.79],["08-15",1.81],["08-16",1.82],["08-17",1.82],["08-18",1.84],["08-21",1.84],["08-22",1.84],["08-23",1.88],["08-24",1.9],["08-25",1.88],["08-29",1.88],["08-30",1.9],["08-31",1.91],["09-01",1.9],["09-04",1.9],["09-05",1.91],["09-06",1.9],["09-07",1.86],["09-08",1.86],["09-11",1.83],["09-12",1.79],["09-13",1.78],["09-14",1.8],["09-15",1.78],["09-18",1.7],["09-19",1.69],["09-20",1.7],["09-21",1.71],["09-22",1.72],["09-25",1.69],["09-26",1.69],["09-27",1.69],["09-28",1.75],["09-29",1.74],["10-02",1.74],["10-03",1.76],["10-04",1.78],["10-05",1.77],["10-06",1.76],["10-09",1.8],["10-10",1.8],["10-11",1.79],["10-12",1.78],["10-13",1.78],["10-16",1.8],["10-17",1.78],["10-18",1.81],["10-19",1.84],["10-20",1.83],["10-23",1.85],["10-24",1.85],["10-25",1.83],["10-26",1.81],["10-27",1.81],["10-30",1.82],["10-31",1.8],["11-01",1.83],["11-02",1.84],["11-03",1.83],["11-06",1.86],["11-07",1.83],["11-08",1.86],["11-09",1.82],["11-10",1.8],["11-13",1.82],["11-14",1.81],["11-15",1.81],["11-16",1.81],["11-17",1.8],["11-20",1.79],["11-21",1.8],["11-22",1.81],["11-23",1.81],["11-24",1.82],["11-27",1.81],["11-28",1.81],["11-29",1.85],["11-30",1.85],["12-01",1.87],["12-04",1.89],["12-05",1.87],["12-06",1.93],["12-07",1.91],["12-08",1.92],["12-11",1.95],["12-12",1.97],["12-13",1.95],["12-14",1.95],["12-15",1.98],["12-18",1.97],["12-19",1.95],["12-20",1.94],["12-21",1.99],["12-22",2.0],["12-27",1.99],["12-28",2.0],["12-29",2.03]]},"1973":{"Gold":[["01-02",64.99],["01-03",65.25],["01-04",65.2],["01-05",65.23],["01-08",65.15],["01-09",65.15],["01-10",65.05],["01-11",65.1],["01-12",65.1],["01-15",65.1],["01-16",65.05],["01-17",64.8],["01-18",64.63],["01-19",64.1],["01-22",64.6],["01-23",65.2],["01-24",64.75],["01-25",65.25],["01-26",65.6],["01-29",65.3],["01-30",66.2],["01-31",66.0],["02-01",66.4],["02-02",67.1],["02-05",66.9],["02-06",68.9],["02-07",68.7],["02-08",68.9],["02-09",69.2],["02-12",68.53],["02-13",69.1],["02-14",70.1],["02-15",72.8],["02-16",73.0],["02-19",73.7],["02-20",76.1],["02-21",78.5],["02-22",83.0],["02-23",89.0],["02-26",83.0],["02-27",81.2],["02-28",85.3],["03-01",86.0],["03-02",87.0],["03-05",83.0],["03-06",83.0],["03-07",81.5],["03-08",83.0],["03-09",83.0],["03-12",81.75],["03-13",81.5],["03-14",80.25],["03-15",82.0],["03-16",82.6],["03-19",82.25],["03-20",82.5],["03-21",81.8],["03-22",81.4],["03-23",82.5],["03-26",86.0],["03-27",91.5],["03-28",88.25],["03-29",89.25],["03-30",90.25],["04-02",89.25],["04-03",89.5],["04-04",89.9],["04-05",90.85],["04-06",91.1],["04-09",90.75],["04-10",91.0],["04-11",91.25],["04-12",91.1],["04-13",90.4],["04-16",89.6],["04-17",89.4],["04-18",90.75],["04-19",90.78],["04-24",90.9],["04-25",90.6],["04-26",90.1],["04-27",90.45],["04-30",90.7],["05-01",90.7],["05-02",90.4],["05-03",90.4],["05-04",90.3],["05-07",90.3],["05-08",90.8],["05-09",92.15],["05-10",94.6],["05-11",96.3],["05-14",99.75],["05-15",107.0],["05-16",111.0],["05-17",103.5],["05-18",105.75],["05-21",112.5],["05-22",110.5],["05-23",111.0],["05-24",109.75],["05-25",104.75],["05-29",108.25],["05-30",111.5],["05-31",114.5],["06-01",117.0],["06-04",120.75],["06-05",127.0],["06-06",121.0],["06-07",119.75],["06-08",118.5],["06-11",115.5],["06-12",116.2],["06-13",117.5],["06-14",116.0],["06-15",120.0],["06-18",122.0],["06-19",122.5],["06-20",118.5],["06-21",120.25],["06-22",120.25],["06-25",118.0],["06-26",119.0],["06-27",122.5],["06-28",120.1],["06-29",123.5],["07-02",123.0],["07-03",121.0],["07-04",123.5],["07-05",122.75],["07-06",127.0],["07-09",126.0],["07-10",124.75],["07-11",119.0],["07-12",120.5],["07-13",120.5],["07-16",119.75],["07-17",120.75],["07-18",119.75],["07-19",119.0],["07-20",116.0],["07-23",118.5],["07-24",119.75],["07-25",119.0],["07-26",119.5],["07-27",118.8],["07-30",114.0],["07-31",115.2],["08-01",117.0],["08-02",115.75],["08-03",115.7],["08-06",115.5],["08-07",114.75],["08-08",114.75],["08-09",109.0],["08-10",107.5],["08-13",103.75],["08-14",98.25],["08-15",92.5],["08-16",96.0],["08-17",102.5],["08-20",107.25],["08-21",103.0],["08-22",103.5],["08-23",102.5],["08-24",100.5],["08-28",102.0],["08-29",105.5],["08-30",105.75],["08-31",104.0],["09-03",105.5],["09-04",104.5],["09-05",106.0],["09-06",106.98],["09-07",105.5],["09-10",105.25],["09-11",102.5],["09-12",102.5],["09-13",101.6],["09-14",100.0],["09-17",102.5],["09-18",103.75],["09-19",100.5],["09-20",102.4],["09-21",103.25],["09-24",102.5],["09-25",101.85],["09-26",102.1],["09-27",101.25],["09-28",100.25],["10-01",98.5],["10-02",97.9],["10-03",97.75],["10-04",98.58],["10-05",97.6],["10-08",102.25],["10-09",98.75],["10-10",101.75],["10-11",103.75],["10-12",102.0],["10-15",101.75],["10-16",101.5],["10-17",102.75],["10-18",102.0],["10-19",101.0],["10-22",100.0],["10-23",99.75],["10-24",99.4],["10-25",100.0],["10-26",98.5],["10-29",98.5],["10-30",97.0],["10-31",97.25],["11-01",97.25],["11-02",98.0],["11-05",98.0],["11-06",97.7],["11-07",97.35],["11-08",97.6],["11-09",98.5],["11-12",97.25],["11-13",96.75],["11-14",90.85],["11-15",91.25],["11-16",91.25],["11-19",90.5],["11-20",90.0],["11-21",90.4],["11-22",90.0],["11-23",89.75],["11-26",90.0],["11-27",90.8],["11-28",97.25],["11-29",101.5],["11-30",100.25],["12-03",100.0],["12-04",100.25],["12-05",104.25],["12-06",104.5],["12-07",106.75],["12-10",105.5],["12-11",104.75],["12-12",104.5],["12-13",104.4],["12-14",104.35],["12-17",106.75],["12-18",108.5],["12-19",107.75],["12-20",109.05],["12-21",107.2],["12-27",108.75],["12-28",112.75],["12-31",112.25]],"Silver":[["01-02",2.04],["01-03",2.01],["01-04",2.05],["01-05",2.03],["01-08",1.98],["01-09",2.01],["01-10",1.98],["01-11",2.01],["01-12",2.01],["01-15",2.04],["01-16",2.0],["01-17",2.02],["01-18",2.01],["01-19",2.0],["01-22",1.99],["01-23",1.96],["01-24",1.98],["01-25",1.97],["01-26",1.98],["01-29",1.96],["01-30",1.98],["01-31",2.01],["02-01",2.03],["02-02",2.03],["02-05",2.04],["02-06",2.11],["02-07",2.09],["02-08",2.13],["02-09",2.14],["02-14",2.25],["02-15",2.22],["02-16",2.19],["02-19",2.19],["02-20",2.2],["02-21",2.25],["02-22",2.43],["02-23",2.46],["02-26",2.35],["02-27",2.38],["02-28",2.43],["03-01",2.49],["03-12",2.32],["03-13",2.24],["03-14",2.23],["03-15",2.2],["03-16",2.15],["03-19",2.17],["03-20",2.15],["03-21",2.22],["03-22",2.22],["03-23",2.21],["03-26",2.29],["03-27",2.27],["03-28",2.2],["03-29",2.17],["03-30",2.2],["04-02",2.17],["04-03",2.23],["04-04",2.2],["04-05",2.24],["04-06",2.21],["04-09",2.21],["04-10",2.25],["04-11",2.25],["04-12",2.23],["04-13",2.21],["04-16",2.21],["04-17",2.16],["04-18",2.11],["04-19",2.12],["04-24",2.1],["04-25",2.14],["04-26",2.13],["04-27",2.13],["04-30",2.15],["05-01",2.15],["05-02",2.12],["05-03",2.12],["05-04",2.19],["05-07",2.19],["05-08",2.22],["05-09",2.28],["05-10",2.34],["05-11",2.36],["05-14",2.37],["05-15",2.47],["05-16",2.38],["05-17",2.34],["05-18",2.38],["05-21",2.49],["05-22",2.45],["05-23",2.42],["05-24",2.39],["05-25",2.39],["05-29",2.45],["05-30",2.54],["05-31",2.55],["06-01",2.61],["06-04",2.65],["06-05",2.73],["06-06",2.55],["06-07",2.54],["06-08",2.5],["06-11",2.5],["06-12",2.46],["06-13",2.51],["06-14",2.51],["06-15",2.53],["06-18",2.6],["06-19",2.59],["06-20",2.56],["06-21",2.6],["06-22",2.6],["06-25",2.58],["06-26",2.63],["06-27",2.68],["06-28",2.66],["06-29",2.67],["07-02",2.7],["07-03",2.68],["07-04",2.73],["07-05",2.7],["07-06",2.8],["07-09",2.8],["07-10",2.75],["07-11",2.67],["07-12",2.78],["07-13",2.8],["07-16",2.81],["07-17",2.91],["07-18",2.88],["07-19",2.88],["07-20",2.84],["07-23",2.9],["07-24",2.96],["07-25",2.92],["07-26",2.9],["07-27",2.91],["07-30",2.77],["07-31",2.76],["08-01",2.92],["08-02",2.9],["08-03",2.86],["08-06",2.84],["08-07",2.79],["08-08",2.72],["08-09",2.63],["08-10",2.67],["08-13",2.65],["08-14",2.57],["08-15",2.56],["08-16",2.61],["08-17",2.65],["08-20",2.67],["08-21",2.69],["08-22",2.59],["08-23",2.56],["08-24",2.59],["08-28",2.57],["08-29",2.58],["08-30",2.63],["08-31",2.6],["09-03",2.61],["09-04",2.62],["09-05",2.57],["09-06",2.6],["09-07",2.59],["09-10",2.6],["09-11",2.54],["09-12",2.55],["09-13",2.52],["09-14",2.54],["09-17",2.57],["09-18",2.64],["09-19",2.59],["09-20",2.7],["09-21",2.73],["09-24",2.73],["09-25",2.74],["09-26",2.78],["09-27",2.75],["09-28",2.7],["10-01",2.71],["10-02",2.72],["10-03",2.77],["10-04",2.75],["10-05",2.7],["10-08",2.81],["10-09",2.79],["10-10",2.87],["10-11",2.84],["10-12",2.87],["10-15",2.95],["10-16",2.9],["10-17",3.0],["10-18",2.92],["10-19",2.92],["10-22",2.89],["10-23",2.91],["10-24",2.88],["10-25",2.95],["10-26",2.87],["10-29",2.82],["10-30",2.83],["10-31",2.83],["11-01",2.83],["11-02",2.87],["11-05",2.87],["11-06",2.87],["11-07",2.86],["11-08",2.84],["11-09",2.86],["11-12",2.82],["11-13",2.79],["11-14",2.77],["11-15",2.78],["11-16",2.78],["11-19",2.8],["11-20",2.83],["11-21",2.8],["11-22",2.81],["11-23",2.8],["11-26",2.79],["11-27",2.76],["11-28",2.88],["11-29",2.96],["11-30",2.92],["12-03",2.92],["12-04",3.04],["12-05",3.02],["12-06",2.98],["12-07",3.07],["12-10",3.04],["12-11",3.09],["12-12",3.05],["12-13",3.04],["12-14",2.97],["12-17",3.04],["12-18",3.18],["12-19",3.11],["12-20",3.2],["12-21",3.17],["12-27",3.24],["12-28",3.22],["12-31",3.26]]},"1974":{"Gold":[["01-02",114.75],["01-03",121.25],["01-04",118.75],["01-07",119.8],["01-08",127.0],["01-09",123.75],["01-10",120.5],["01-11",121.75],["01-14",123.75],["01-15",125.75],["01-16",125.25],["01-17",128.5],["01-18",127.95],["01-21",141.75],["01-22",139.75],["01-23",137.0],["01-24",135.25],["01-25",138.4],["01-28",139.75],["01-29",139.0],["01-30",135.7],["01-31",133.25],["02-01",132.0],["02-04",132.25],["02-05",138.5],["02-06",138.25],["02-07",136.0],["02-08",141.5],["02-11",144.5],["02-12",147.75],["02-13",145.75],["02-14",146.0],["02-15",149.0],["02-18",150.0],["02-19",148.0],["02-20",149.25],["02-21",151.5],["02-22",158.5],["02-25",166.5],["02-26",177.25],["02-27",178.0],["02-28",169.5],["03-01",172.4],["03-04",168.25],["03-05",160.0],["03-06",158.25],["03-07",162.0],["03-08",170.0],["03-11",163.5],["03-12",163.0],["03-13",163.0],["03-14",163.0],["03-15",163.5],["03-18",162.5],["03-19",167.5],["03-20",173.75],["03-21",177.0],["03-22",174.5],["03-25",176.75],["03-26",174.25],["03-27",175.6],["03-28",172.5],["03-29",173.0],["04-01",173.0],["04-02",175.0],["04-03",179.5],["04-04",177.6],["04-05",175.25],["04-08",168.5],["04-09",166.75],["04-10",177.0],["04-11",170.5],["04-16",174.0],["04-17",170.5],["04-18",169.0],["04-19",173.0],["04-22",173.6],["04-23",174.4],["04-24",171.0],["04-25",172.0],["04-26",168.5],["04-29",166.75],["04-30",168.5],["05-01",169.9],["05-02",170.5],["05-03",169.75],["05-06",167.4],["05-07",163.0],["05-08",161.5],["05-09",162.5],["05-10",168.0],["05-13",167.5],["05-14",166.5],["05-15",164.5],["05-16",164.25],["05-17",165.9],["05-20",164.25],["05-21",160.25],["05-22",162.2],["05-23",161.25],["05-24",160.6],["05-28",157.0],["05-29",154.25],["05-30",161.0],["05-31",156.5],["06-03",156.5],["06-04",153.0],["06-05",156.5],["06-06",160.75],["06-07",157.5],["06-10",156.5],["06-11",157.0],["06-12",153.5],["06-13",156.75],["06-14",158.0],["06-17",157.5],["06-18",155.6],["06-19",157.0],["06-20",153.5],["06-21",153.0],["06-24",152.0],["06-25",147.0],["06-26",148.25],["06-27",143.65],["06-28",146.75],["07-01",144.5],["07-02",138.0],["07-03",138.5],["07-04",132.5],["07-05",131.5],["07-08",137.0],["07-09",142.0],["07-10",141.5],["07-11",133.5],["07-12",139.75],["07-15",139.5],["07-16",139.0],["07-17",138.5],["07-18",142.0],["07-19",146.0],["07-22",144.0],["07-23",141.5],["07-24",142.75],["07-25",144.5],["07-26",149.0],["07-29",152.5],["07-30",160.5],["07-31",154.0],["08-01",157.5],["08-02",156.75],["08-05",153.1],["08-06",155.5],["08-07",154.0],["08-08",152.5],["08-09",152.25],["08-12",153.0],["08-13",152.25],["08-14",155.5],["08-15",155.5],["08-16",152.75],["08-19",153.0],["08-20",155.5],["08-21",155.6],["08-22",156.0],["08-23",154.0],["08-27",153.25],["08-28",154.0],["08-29",154.4],["08-30",155.25],["09-02",158.0],["09-03",158.5],["09-04",156.75],["09-05",157.5],["09-06",157.5],["09-09",156.0],["09-10",153.5],["09-11",152.75],["09-12",154.0],["09-13",153.4],["09-16",152.75],["09-17",150.1],["09-18",144.0],["09-19",149.4],["09-20",148.0],["09-23",147.75],["09-24",147.75],["09-25",147.5],["09-26",146.2],["09-27",146.0],["09-30",147.5],["10-01",153.5],["10-02",155.0],["10-03",154.45],["10-04",158.25],["10-07",160.0],["10-08",155.75],["10-09",154.95],["10-10",158.4],["10-11",156.25],["10-14",154.5],["10-15",154.2],["10-16",155.25],["10-17",154.5],["10-18",155.0],["10-21",157.5],["10-22",158.2],["10-23",157.75],["10-24",158.5],["10-25",165.5],["10-28",165.0],["10-29",169.5],["10-30",167.9],["10-31",166.4],["11-01",168.75],["11-04",168.6],["11-05",173.5],["11-06",177.0],["11-07",179.0],["11-08",177.5],["11-11",182.5],["11-12",179.0],["11-13",183.0],["11-14",186.5],["11-15",188.0],["11-18",190.0],["11-19",189.0],["11-20",185.05],["11-21",184.75],["11-22",181.75],["11-25",182.25],["11-26",185.75],["11-27",185.0],["11-28",182.25],["11-29",182.0],["12-02",185.5],["12-03",182.0],["12-04",170.5],["12-05",175.25],["12-06",178.25],["12-09",179.25],["12-10",178.5],["12-11",177.5],["12-12",174.0],["12-13",178.4],["12-16",184.0],["12-17",186.75],["12-18",188.75],["12-19",185.5],["12-20",185.5],["12-23",192.25],["12-24",192.25],["12-27",194.5],["12-30",197.5],["12-31",187.5]],"Silver":[["01-02",3.28],["01-03",3.33],["01-04",3.27],["01-07",3.27],["01-08",3.34],["01-09",3.33],["01-10",3.3],["01-11",3.34],["01-14",3.34],["01-15",3.51],["01-16",3.45],["01-17",3.64],["01-18",3.63],["01-21",3.93],["01-22",3.9],["01-23",3.72],["01-24",3.8],["01-25",3.91],["01-28",4.01],["01-29",3.97],["01-30",3.91],["01-31",3.87],["02-01",4.04],["02-04",4.21],["02-05",4.35],["02-06",4.39],["02-07",4.57],["02-08",4.75],["02-11",5.15],["02-12",5.54],["02-13",5.19],["02-14",5.28],["02-15",5.59],["02-18",5.4],["02-19",5.13],["02-20",5.28],["02-21",5.75],["02-22",5.82],["02-25",5.96],["02-26",6.76],["02-27",6.46],["02-28",5.68],["03-01",5.73],["03-04",5.63],["03-05",5.21],["03-06",5.01],["03-07",5.29],["03-08",5.42],["03-11",5.02],["03-12",5.22],["03-13",5.3],["03-14",5.4],["03-15",5.28],["03-18",5.17],["03-19",5.62],["03-20",5.6],["03-21",5.55],["03-22",5.43],["03-25",5.6],["03-26",5.19],["03-27",5.17],["03-28",5.19],["03-29",5.35],["04-01",5.32],["04-02",5.15],["04-03",5.16],["04-04",5.17],["04-05",5.02],["04-08",4.41],["04-09",4.74],["04-10",4.72],["04-11",4.34],["04-16",4.58],["04-17",4.39],["04-18",4.67],["04-19",4.78],["04-22",5.12],["04-23",5.46],["04-24",5.28],["04-25",5.58],["04-26",5.43],["04-29",5.34],["04-30",5.62],["05-01",5.4],["05-02",5.43],["05-03",5.5],["05-06",5.45],["05-07",5.21],["05-08",5.24],["05-09",5.45],["05-10",5.46],["05-13",5.58],["05-14",6.02],["05-15",5.66],["05-16",5.77],["05-17",5.77],["05-20",5.61],["05-21",5.42],["05-22",5.43],["05-23",4.98],["05-24",5.21],["05-28",4.87],["05-29",4.62],["05-30",5.08],["05-31",4.92],["06-03",4.74],["06-04",4.7],["06-05",5.02],["06-06",4.95],["06-07",5.01],["06-10",5.2],["06-11",5.1],["06-12",4.79],["06-13",5.05],["06-14",5.02],["06-17",4.89],["06-18",4.87],["06-19",4.78],["06-20",4.68],["06-21",4.83],["06-24",4.73],["06-25",4.52],["06-26",4.57],["06-27",4.48],["06-28",4.61],["07-01",4.69],["07-02",4.32],["07-03",4.19],["07-04",4.12],["07-05",4.1],["07-08",4.33],["07-09",4.36],["07-10",4.22],["07-11",3.92],["07-12",3.79],["07-15",4.05],["07-16",4.15],["07-17",3.99],["07-18",4.16],["07-19",4.37],["07-22",4.18],["07-23",4.38],["07-24",4.46],["07-25",4.72],["07-26",4.7],["07-29",4.98],["07-30",5.03],["07-31",4.79],["08-01",4.95],["08-02",4.66],["08-05",4.49],["08-06",4.62],["08-07",4.59],["08-08",4.56],["08-09",4.47],["08-12",4.33],["08-13",4.37],["08-14",4.61],["08-15",4.35],["08-16",4.41],["08-19",4.39],["08-20",4.41],["08-21",4.31],["08-22",4.44],["08-23",4.4],["08-27",4.38],["08-28",4.17],["08-29",4.27],["08-30",4.12],["09-02",4.23],["09-03",4.23],["09-04",4.0],["09-05",4.06],["09-06",4.14],["09-09",4.07],["09-10",4.11],["09-11",3.94],["09-12",4.12],["09-13",3.94],["09-16",3.96],["09-17",3.83],["09-18",3.83],["09-19",3.97],["09-20",3.87],["09-23",3.98],["09-24",4.04],["09-25",4.18],["09-26",4.06],["09-27",4.18],["09-30",4.25],["10-01",4.43],["10-02",4.43],["10-03",4.68],["10-04",4.83],["10-07",4.84],["10-08",4.65],["10-09",4.63],["10-10",4.97],["10-11",4.75],["10-14",4.62],["10-15",4.63],["10-16",4.65],["10-17",4.48],["10-18",4.62],["10-21",4.79],["10-22",4.95],["10-23",4.84],["10-24",4.96],["10-25",5.09],["10-28",5.15],["10-29",5.14],["10-30",5.07],["10-31",4.86],["11-01",4.89],["11-04",4.71],["11-05",4.91],["11-06",4.95],["11-07",4.99],["11-08",4.89],["11-11",5.06],["11-12",4.9],["11-13",4.92],["11-14",4.94],["11-15",4.75],["11-18",4.69],["11-19",4.38],["11-20",4.36],["11-21",4.51],["11-22",4.21],["11-25",4.38],["11-26",4.39],["11-27",4.57],["11-28",4.44],["11-29",4.46],["12-02",4.61],["12-03",4.33],["12-04",4.19],["12-05",4.29],["12-06",4.27],["12-09",4.25],["12-10",4.17],["12-11",4.18],["12-12",4.17],["12-13",4.21],["12-16",4.4],["12-17",4.5],["12-18",4.46],["12-19",4.6],["12-20",4.48],["12-23",4.55],["12-24",4.65],["12-27",4.78],["12-30",4.75],["12-31",4.47]]},"1975":{"Gold":[["01-02",185.0],["01-03",177.0],["01-06",173.0],["01-07",171.25],["01-08",177.0],["01-09",180.25],["01-10",178.75],["01-13",180.0],["01-14",176.5],["01-15",178.9],["01-16",177.5],["01-17",174.5],["01-20",172.75],["01-21",177.0],["01-22",174.5],["01-23",174.0],["01-24",176.75],["01-27",179.5],["01-28",176.0],["01-29",176.6],["01-30",178.0],["01-31",176.25],["02-03",177.25],["02-04",175.0],["02-05",174.85],["02-06",173.5],["02-07",174.5],["02-10",173.5],["02-11",174.0],["02-12",174.5],["02-13",177.25],["02-14",184.0],["02-17",182.5],["02-18",180.4],["02-19",182.5],["02-20",182.8],["02-21",185.1],["02-24",184.4],["02-25",186.25],["02-26",184.25],["02-27",182.75],["02-28",181.75],["03-03",181.6],["03-04",181.0],["03-05",177.75],["03-06",179.25],["03-07",179.25],["03-10",176.75],["03-11",178.5],["03-12",178.0],["03-13",177.25],["03-14",178.25],["03-17",177.75],["03-18",178.0],["03-19",178.25],["03-20",178.25],["03-21",177.5],["03-24",177.25],["03-25",176.5],["03-26",177.0],["03-27",177.75],["04-01",177.25],["04-02",177.65],["04-03",176.25],["04-04",174.6],["04-07",173.25],["04-08",173.5],["04-09",173.0],["04-10",173.0],["04-11",172.5],["04-14",171.0],["04-15",164.25],["04-16",165.0],["04-17",167.0],["04-18",169.4],["04-21",168.0],["04-22",164.9],["04-23",166.75],["04-24",168.75],["04-25",166.0],["04-28",165.5],["04-29",166.5],["04-30",167.4],["05-01",166.25],["05-02",165.75],["05-05",163.5],["05-06",164.5],["05-07",164.75],["05-08",165.75],["05-09",166.0],["05-12",165.15],["05-13",165.5],["05-14",165.9],["05-15",166.25],["05-16",165.75],["05-19",166.75],["05-20",166.75],["05-21",167.0],["05-22",172.75],["05-23",172.6],["05-27",172.75],["05-28",171.75],["05-29",170.0],["05-30",167.75],["06-02",163.25],["06-03",164.5],["06-04",165.9],["06-05",164.5],["06-06",165.25],["06-09",165.0],["06-10",166.0],["06-11",165.25],["06-12",165.4],["06-13",164.75],["06-16",164.0],["06-17",163.25],["06-18",164.1],["06-19",163.5],["06-20",162.5],["06-23",162.5],["06-24",162.25],["06-25",163.0],["06-26",164.1],["06-27",164.25],["06-30",166.0],["07-01",167.0],["07-02",165.0],["07-03",164.0],["07-04",164.5],["07-07",163.0],["07-08",162.75],["07-09",164.9],["07-10",164.5],["07-11",163.75],["07-14",166.0],["07-15",164.9],["07-16",164.3],["07-17",164.5],["07-18",163.4],["07-21",163.6],["07-22",164.9],["07-23",164.35],["07-24",164.5],["07-25",165.0],["07-28",166.75],["07-29",167.75],["07-30",166.2],["07-31",166.4],["08-01",166.5],["08-04",166.35],["08-05",166.25],["08-06",165.35],["08-07",165.25],["08-08",165.0],["08-11",162.5],["08-12",163.15],["08-13",163.25],["08-14",162.15],["08-15",161.6],["08-18",162.25],["08-19",161.6],["08-20",162.1],["08-21",161.65],["08-22",161.8],["08-26",162.0],["08-27",161.4],["08-28",161.7],["08-29",161.5],["09-01",154.25],["09-02",153.75],["09-03",149.75],["09-04",152.0],["09-05",152.25],["09-08",152.75],["09-09",150.55],["09-10",150.25],["09-11",148.75],["09-12",147.9],["09-15",148.25],["09-16",148.0],["09-17",144.85],["09-18",142.9],["09-19",137.0],["09-22",138.0],["09-23",128.75],["09-24",133.75],["09-25",133.4],["09-26",133.5],["09-29",136.0],["09-30",138.25],["10-01",143.75],["10-02",144.5],["10-03",141.0],["10-06",137.5],["10-07",142.0],["10-08",141.6],["10-09",139.3],["10-10",141.0],["10-13",142.5],["10-14",141.25],["10-15",142.0],["10-16",143.0],["10-17",143.75],["10-20",143.75],["10-21",146.0],["10-22",145.25],["10-23",145.0],["10-24",143.5],["10-27",143.6],["10-28",141.75],["10-29",142.5],["10-30",144.0],["10-31",143.4],["11-03",143.0],["11-04",144.0],["11-05",144.5],["11-06",146.5],["11-07",145.0],["11-10",144.0],["11-11",143.65],["11-12",143.4],["11-13",143.7],["11-14",143.25],["11-17",142.1],["11-18",140.4],["11-19",140.95],["11-20",142.25],["11-21",141.85],["11-24",141.35],["11-25",141.9],["11-26",141.25],["11-27",140.0],["11-28",138.25],["12-01",138.15],["12-02",137.85],["12-03",139.1],["12-04",138.5],["12-05",138.25],["12-08",137.9],["12-09",137.0],["12-10",139.0],["12-11",139.4],["12-12",139.35],["12-15",138.65],["12-16",138.65],["12-17",138.75],["12-18",139.15],["12-19",138.9],["12-22",142.0],["12-23",141.25],["12-24",140.5],["12-29",141.25],["12-30",141.0],["12-31",140.25]],"Silver":[["01-02",4.44],["01-03",4.35],["01-06",4.22],["01-07",4.27],["01-08",4.24],["01-09",4.22],["01-10",4.19],["01-13",4.42],["01-14",4.29],["01-15",4.45],["01-16",4.3],["01-17",4.15],["01-20",3.99],["01-21",4.07],["01-22",4.02],["01-23",3.99],["01-24",4.27],["01-27",4.31],["01-28",4.18],["01-29",4.22],["01-30",4.32],["01-31",4.15],["02-03",4.13],["02-04",4.11],["02-05",4.13],["02-06",4.12],["02-07",4.25],["02-10",4.3],["02-11",4.22],["02-12",4.37],["02-13",4.43],["02-14",4.55],["02-17",4.48],["02-18",4.38],["02-19",4.61],["02-20",4.53],["02-21",4.68],["02-24",4.58],["02-25",4.62],["02-26",4.49],["02-27",4.48],["02-28",4.42],["03-03",4.5],["03-04",4.48],["03-05",4.34],["03-06",4.36],["03-07",4.33],["03-10",4.3],["03-11",4.44],["03-12",4.45],["03-13",4.48],["03-14",4.5],["03-17",4.42],["03-18",4.48],["03-19",4.37],["03-20",4.41],["03-21",4.32],["03-24",4.31],["03-25",4.24],["03-26",4.29],["03-27",4.28],["04-01",4.28],["04-02",4.33],["04-03",4.24],["04-04",4.14],["04-07",4.11],["04-08",4.15],["04-09",4.11],["04-10",4.12],["04-11",4.18],["04-14",4.1],["04-15",4.08],["04-16",4.18],["04-17",4.24],["04-18",4.33],["04-21",4.29],["04-22",4.26],["04-23",4.25],["04-24",4.32],["04-25",4.31],["04-28",4.32],["04-29",4.38],["04-30",4.43],["05-01",4.3],["05-02",4.37],["05-05",4.3],["05-06",4.36],["05-07",4.44],["05-08",4.51],["05-09",4.5],["05-12",4.57],["05-13",4.55],["05-14",4.64],["05-15",4.54],["05-16",4.45],["05-19",4.62],["05-20",4.6],["05-21",4.56],["05-22",4.74],["05-23",4.72],["05-27",4.71],["05-28",4.61],["05-29",4.57],["05-30",4.53],["06-02",4.43],["06-03",4.46],["06-04",4.46],["06-05",4.43],["06-06",4.41],["06-09",4.46],["06-10",4.58],["06-11",4.54],["06-12",4.55],["06-13",4.48],["06-16",4.49],["06-17",4.47],["06-18",4.49],["06-19",4.46],["06-20",4.45],["06-23",4.48],["06-24",4.46],["06-25",4.53],["06-26",4.53],["06-27",4.52],["06-30",4.57],["07-01",4.58],["07-02",4.54],["07-03",4.51],["07-04",4.56],["07-07",4.52],["07-08",4.51],["07-09",4.64],["07-10",4.64],["07-11",4.57],["07-14",4.69],["07-15",4.63],["07-16",4.64],["07-17",4.63],["07-18",4.6],["07-21",4.63],["07-22",4.74],["07-23",4.66],["07-24",4.7],["07-25",4.82],["07-28",4.86],["07-29",5.13],["07-30",5.14],["07-31",5.0],["08-01",5.0],["08-04",5.14],["08-05",5.12],["08-06",5.05],["08-07",5.16],["08-08",5.21],["08-11",4.97],["08-12",4.97],["08-13",5.06],["08-14",4.94],["08-15",4.81],["08-18",4.9],["08-19",4.77],["08-20",4.85],["08-21",4.85],["08-22",4.85],["08-26",4.84],["08-27",4.67],["08-28",4.74],["08-29",4.63],["09-01",4.53],["09-02",4.42],["09-03",4.5],["09-04",4.55],["09-05",4.48],["09-08",4.51],["09-09",4.39],["09-10",4.57],["09-11",4.53],["09-12",4.51],["09-15",4.58],["09-16",4.56],["09-17",4.49],["09-18",4.56],["09-19",4.48],["09-22",4.45],["09-23",4.4],["09-24",4.46],["09-25",4.48],["09-26",4.47],["09-29",4.47],["09-30",4.44],["10-01",4.5],["10-02",4.54],["10-03",4.46],["10-06",4.46],["10-07",4.43],["10-08",4.42],["10-09",4.3],["10-10",4.33],["10-13",4.31],["10-14",4.27],["10-15",4.32],["10-16",4.29],["10-17",4.35],["10-20",4.35],["10-21",4.4],["10-22",4.32],["10-23",4.33],["10-24",4.27],["10-27",4.21],["10-28",4.18],["10-29",4.2],["10-30",4.24],["10-31",4.19],["11-03",4.2],["11-04",4.26],["11-05",4.3],["11-06",4.44],["11-07",4.39],["11-10",4.42],["11-11",4.45],["11-12",4.39],["11-13",4.38],["11-14",4.36],["11-17",4.33],["11-18",4.31],["11-19",4.33],["11-20",4.32],["11-21",4.28],["11-24",4.25],["11-25",4.31],["11-26",4.24],["11-27",4.22],["11-28",4.23],["12-01",4.12],["12-02",4.12],["12-03",4.15],["12-04",4.1],["12-05",4.03],["12-08",4.03],["12-09",3.93],["12-10",4.01],["12-11",4.0],["12-12",4.02],["12-15",3.96],["12-16",4.0],["12-17",4.03],["12-18",4.06],["12-19",4.05],["12-22",4.2],["12-23",4.24],["12-24",4.23],["12-29",4.25],["12-30",4.17],["12-31",4.18]]},"1976":{"Gold":[["01-02",140.35],["01-05",140.15],["01-06",138.85],["01-07",139.0],["01-08",137.65],["01-09",136.2],["01-12",136.5],["01-13",135.6],["01-14",131.0],["01-15",131.65],["01-16",129.6],["01-19",129.35],["01-20",126.0],["01-21",124.5],["01-22",124.0],["01-23",128.15],["01-26",126.65],["01-27",126.4],["01-28",127.0],["01-29",129.0],["01-30",128.0],["02-02",128.4],["02-03",131.65],["02-04",130.4],["02-05",128.75],["02-06",131.15],["02-09",130.75],["02-10",128.85],["02-11",130.4],["02-12",130.0],["02-13",131.3],["02-16",131.6],["02-17",130.5],["02-18",131.2],["02-19",131.0],["02-20",131.0],["02-23",131.5],["02-24",132.15],["02-25",133.65],["02-26",132.25],["02-27",132.3],["03-01",132.45],["03-02",131.55],["03-03",132.5],["03-04",132.0],["03-05",133.2],["03-08",133.15],["03-09",132.9],["03-10",133.3],["03-11",134.0],["03-12",133.3],["03-15",133.9],["03-16",133.35],["03-17",133.25],["03-18",134.3],["03-19",133.45],["03-22",134.0],["03-23",133.2],["03-24",133.25],["03-25",133.1],["03-26",132.2],["03-29",131.1],["03-30",128.6],["03-31",129.5],["04-01",129.15],["04-02",129.25],["04-05",127.7],["04-06",128.1],["04-07",127.4],["04-08",127.45],["04-09",128.3],["04-12",127.1],["04-13",128.0],["04-14",127.9],["04-15",127.6],["04-20",128.0],["04-21",127.45],["04-22",127.4],["04-23",127.4],["04-26",127.5],["04-27",127.75],["04-28",128.6],["04-29",128.0],["04-30",128.15],["05-03",128.25],["05-04",128.25],["05-05",127.4],["05-06",126.9],["05-07",128.15],["05-10",128.25],["05-11",128.0],["05-12",127.85],["05-13",127.5],["05-14",127.7],["05-17",127.7],["05-18",127.6],["05-19",127.15],["05-20",125.6],["05-21",125.8],["05-24",125.6],["05-25",124.5],["05-26",124.4],["05-27",126.4],["05-28",125.25],["06-01",126.05],["06-02",126.65],["06-03",126.9],["06-04",126.5],["06-07",127.0],["06-08",126.9],["06-09",126.9],["06-10",126.75],["06-11",126.3],["06-14",125.8],["06-15",125.75],["06-16",125.1],["06-17",125.45],["06-18",125.6],["06-21",125.6],["06-22",125.5],["06-23",125.0],["06-24",124.5],["06-25",124.8],["06-28",124.3],["06-29",123.9],["06-30",123.8],["07-01",123.25],["07-02",123.1],["07-05",123.1],["07-06",123.05],["07-07",123.2],["07-08",123.1],["07-09",122.6],["07-12",122.2],["07-13",122.0],["07-14",122.25],["07-15",121.8],["07-16",119.1],["07-19",117.75],["07-20",110.0],["07-21",110.0],["07-22",111.25],["07-23",110.3],["07-26",111.1],["07-27",112.9],["07-28",115.35],["07-29",113.25],["07-30",112.4],["08-02",111.5],["08-03",111.8],["08-04",112.8],["08-05",112.75],["08-06",112.8],["08-09",112.8],["08-10",113.4],["08-11",113.65],["08-12",113.4],["08-13",113.0],["08-16",113.35],["08-17",112.85],["08-18",110.25],["08-19",109.15],["08-20",109.0],["08-23",107.3],["08-24",105.1],["08-25",103.5],["08-26",105.5],["08-27",104.2],["08-31",103.05],["09-01",104.0],["09-02",107.35],["09-03",105.55],["09-06",112.0],["09-07",113.0],["09-08",113.0],["09-09",111.75],["09-10",114.0],["09-13",113.95],["09-14",112.9],["09-15",109.5],["09-16",115.3],["09-17",116.85],["09-20",115.1],["09-21",118.6],["09-22",120.75],["09-23",119.0],["09-24",118.45],["09-27",118.75],["09-28",117.75],["09-29",116.5],["09-30",116.1],["10-01",116.25],["10-04",114.9],["10-05",114.3],["10-06",114.75],["10-07",116.25],["10-08",114.55],["10-11",113.65],["10-12",114.75],["10-13",114.25],["10-14",114.9],["10-15",115.0],["10-18",116.2],["10-19",115.6],["10-20",114.85],["10-21",115.4],["10-22",116.15],["10-25",115.65],["10-26",117.15],["10-27",117.65],["10-28",123.5],["10-29",122.3],["11-01",122.0],["11-02",122.2],["11-03",124.0],["11-04",124.5],["11-05",125.6],["11-08",130.0],["11-09",130.25],["11-10",135.9],["11-11",135.0],["11-12",135.0],["11-15",138.2],["11-16",134.75],["11-17",131.7],["11-18",129.1],["11-19",131.15],["11-22",132.75],["11-23",134.15],["11-24",131.1],["11-25",131.3],["11-26",130.0],["11-29",128.75],["11-30",130.1],["12-01",130.5],["12-02",131.15],["12-03",131.0],["12-06",133.0],["12-07",134.2],["12-08",134.65],["12-09",136.0],["12-10",137.0],["12-13",136.0],["12-14",134.1],["12-15",134.9],["12-16",133.0],["12-17",133.15],["12-20",131.5],["12-21",133.75],["12-22",133.9],["12-23",132.9],["12-24",133.05],["12-29",134.2],["12-30",134.65],["12-31",134.55]],"Silver":[["01-02",4.16],["01-05",4.2],["01-06",4.25],["01-07",4.27],["01-08",4.27],["01-09",4.23],["01-12",4.23],["01-13",4.24],["01-14",4.1],["01-15",4.14],["01-16",3.98],["01-19",4.03],["01-20",3.85],["01-21",3.83],["01-22",3.9],["01-23",3.98],["01-26",3.9],["01-27",3.9],["01-28",3.94],["01-29",4.0],["01-30",4.01],["02-02",3.99],["02-03",4.03],["02-04",3.95],["02-05",3.94],["02-06",3.99],["02-09",4.0],["02-10",3.95],["02-11",4.08],["02-12",4.09],["02-13",4.1],["02-16",4.11],["02-17",4.06],["02-18",4.12],["02-19",4.12],["02-20",4.23],["02-23",4.17],["02-24",4.24],["02-25",4.26],["02-26",4.16],["02-27",4.16],["03-01",4.19],["03-02",4.14],["03-03",4.16],["03-04",4.16],["03-05",4.23],["03-08",4.26],["03-09",4.23],["03-10",4.3],["03-11",4.28],["03-12",4.26],["03-15",4.28],["03-16",4.22],["03-17",4.2],["03-18",4.26],["03-19",4.22],["03-22",4.23],["03-23",4.2],["03-24",4.2],["03-25",4.17],["03-26",4.13],["03-29",4.07],["03-30",4.03],["03-31",4.11],["04-01",4.12],["04-02",4.15],["04-05",4.09],["04-06",4.14],["04-07",4.17],["04-08",4.27],["04-09",4.28],["04-12",4.27],["04-13",4.45],["04-14",4.38],["04-15",4.4],["04-20",4.55],["04-21",4.46],["04-22",4.44],["04-23",4.41],["04-26",4.4],["04-27",4.57],["04-28",4.51],["04-29",4.43],["04-30",4.43],["05-03",4.41],["05-04",4.38],["05-05",4.36],["05-06",4.38],["05-07",4.47],["05-10",4.56],["05-11",4.47],["05-12",4.53],["05-13",4.55],["05-14",4.47],["05-17",4.51],["05-18",4.42],["05-19",4.44],["05-20",4.38],["05-21",4.46],["05-24",4.38],["05-25",4.5],["05-26",4.51],["05-27",4.67],["05-28",4.62],["06-01",4.68],["06-02",4.65],["06-03",4.64],["06-04",4.66],["06-07",4.63],["06-08",4.81],["06-09",4.76],["06-10",4.85],["06-11",4.92],["06-14",4.94],["06-15",4.91],["06-16",4.81],["06-17",4.83],["06-18",4.85],["06-21",4.79],["06-22",4.86],["06-23",4.89],["06-24",4.78],["06-25",4.77],["06-28",4.71],["06-29",4.7],["06-30",4.83],["07-01",4.82],["07-02",4.96],["07-05",4.99],["07-06",5.04],["07-07",5.08],["07-08",5.0],["07-09",5.03],["07-12",4.97],["07-13",4.82],["07-14",4.88],["07-15",4.96],["07-16",4.82],["07-19",4.71],["07-20",4.44],["07-21",4.54],["07-22",4.51],["07-23",4.5],["07-26",4.54],["07-27",4.54],["07-28",4.6],["07-29",4.56],["07-30",4.54],["08-02",4.47],["08-03",4.25],["08-04",4.39],["08-05",4.34],["08-06",4.23],["08-09",4.16],["08-10",4.2],["08-11",4.29],["08-12",4.27],["08-13",4.32],["08-16",4.33],["08-17",4.3],["08-18",4.19],["08-19",4.27],["08-20",4.35],["08-23",4.27],["08-24",4.23],["08-25",4.11],["08-26",4.19],["08-27",4.21],["08-31",4.11],["09-01",4.09],["09-02",4.29],["09-03",4.29],["09-06",4.35],["09-07",4.36],["09-08",4.45],["09-09",4.27],["09-10",4.29],["09-13",4.18],["09-14",4.15],["09-15",4.17],["09-16",4.28],["09-17",4.26],["09-20",4.23],["09-21",4.34],["09-22",4.34],["09-23",4.38],["09-24",4.38],["09-27",4.43],["09-28",4.37],["09-29",4.37],["09-30",4.39],["10-01",4.36],["10-04",4.31],["10-05",4.34],["10-06",4.31],["10-07",4.29],["10-08",4.24],["10-11",4.13],["10-12",4.18],["10-13",4.21],["10-14",4.21],["10-15",4.16],["10-18",4.2],["10-19",4.2],["10-20",4.18],["10-21",4.2],["10-22",4.21],["10-25",4.15],["10-26",4.16],["10-27",4.15],["10-28",4.28],["10-29",4.27],["11-01",4.3],["11-02",4.29],["11-03",4.36],["11-04",4.29],["11-05",4.36],["11-08",4.39],["11-09",4.33],["11-10",4.44],["11-11",4.46],["11-12",4.45],["11-15",4.57],["11-16",4.37],["11-17",4.34],["11-18",4.31],["11-19",4.34],["11-22",4.38],["11-23",4.39],["11-24",4.35],["11-25",4.34],["11-26",4.32],["11-29",4.25],["11-30",4.28],["12-01",4.24],["12-02",4.33],["12-03",4.31],["12-06",4.37],["12-07",4.36],["12-08",4.34],["12-09",4.39],["12-10",4.37],["12-13",4.34],["12-14",4.33],["12-15",4.38],["12-16",4.34],["12-17",4.33],["12-20",4.32],["12-21",4.33],["12-22",4.35],["12-23",4.31],["12-24",4.32],["12-29",4.35],["12-30",4.37],["12-31",4.36]]},"1977":{"Gold":[["01-04",136.1],["01-05",134.0],["01-06",132.83],["01-07",133.45],["01-10",131.45],["01-11",129.4],["01-12",130.45],["01-13",131.65],["01-14",131.25],["01-17",131.0],["01-18",132.65],["01-19",132.4],["01-20",132.75],["01-21",133.0],["01-24",132.3],["01-25",132.9],["01-26",132.95],["01-27",132.2],["01-28",131.3],["01-31",132.1],["02-01",132.85],["02-02",131.8],["02-03",132.6],["02-04",132.4],["02-07",133.3],["02-08",135.0],["02-09",136.25],["02-10",136.2],["02-11",135.15],["02-14",136.3],["02-15",135.9],["02-16",135.95],["02-17",136.45],["02-18",136.6],["02-21",137.25],["02-22",137.5],["02-23",138.15],["02-24",140.5],["02-25",140.85],["02-28",142.25],["03-01",142.1],["03-02",144.9],["03-03",145.35],["03-04",145.0],["03-07",147.75],["03-08",147.7],["03-09",146.25],["03-10",147.4],["03-11",145.75],["03-14",145.65],["03-15",146.1],["03-16",147.5],["03-17",148.4],["03-18",150.25],["03-21",151.4],["03-22",151.35],["03-23",152.2],["03-24",153.25],["03-25",153.6],["03-28",151.2],["03-29",150.0],["03-30",148.9],["03-31",149.8],["04-01",148.25],["04-04",149.75],["04-05",148.85],["04-06",147.2],["04-07",148.9],["04-12",149.5],["04-13",152.3],["04-14",152.2],["04-15",151.4],["04-18",151.0],["04-19",150.7],["04-20",149.6],["04-21",148.1],["04-22",149.6],["04-25",149.3],["04-26",147.25],["04-27",147.5],["04-28",146.6],["04-29",146.5],["05-02",147.5],["05-03",148.15],["05-04",147.6],["05-05",147.0],["05-06",147.75],["05-09",147.8],["05-10",147.85],["05-11",147.6],["05-12",147.1],["05-13",147.6],["05-16",147.6],["05-17",147.75],["05-18",146.85],["05-19",146.8],["05-20",147.05],["05-23",146.55],["05-24",144.8],["05-25",145.0],["05-26",144.35],["05-27",143.9],["05-30",144.0],["05-31",143.2],["06-01",143.75],["06-02",142.45],["06-03",142.6],["06-08",142.4],["06-09",141.4],["06-10",140.0],["06-13",139.5],["06-14",137.6],["06-15",137.2],["06-16",139.8],["06-17",139.2],["06-20",139.5],["06-21",141.0],["06-22",139.5],["06-23",140.2],["06-24",140.9],["06-27",141.6],["06-28",142.7],["06-29",142.3],["06-30",142.95],["07-01",143.05],["07-04",140.55],["07-05",141.4],["07-06",141.05],["07-07",141.25],["07-08",142.2],["07-11",141.05],["07-12",142.0],["07-13",142.75],["07-14",144.2],["07-15",144.15],["07-18",143.75],["07-19",145.0],["07-20",144.1],["07-21",144.2],["07-22",144.3],["07-25",145.75],["07-26",145.55],["07-27",145.8],["07-28",144.75],["07-29",144.5],["08-01",144.8],["08-02",145.2],["08-03",145.85],["08-04",146.5],["08-05",146.0],["08-08",146.15],["08-09",146.5],["08-10",145.85],["08-11",145.75],["08-12",145.5],["08-15",144.3],["08-16",143.35],["08-17",144.1],["08-18",143.75],["08-19",144.4],["08-22",144.2],["08-23",143.75],["08-24",144.0],["08-25",144.4],["08-26",144.2],["08-30",145.65],["08-31",146.0],["09-01",145.6],["09-02",146.2],["09-05",147.8],["09-06",147.85],["09-07",146.85],["09-08",147.5],["09-09",147.15],["09-12",148.0],["09-13",147.8],["09-14",147.75],["09-15",147.85],["09-16",147.95],["09-19",149.2],["09-20",149.3],["09-21",150.65],["09-22",151.5],["09-23",151.4],["09-26",152.35],["09-27",152.75],["09-28",153.0],["09-29",153.0],["09-30",153.9],["10-03",155.1],["10-04",155.1],["10-05",155.2],["10-06",154.25],["10-07",153.6],["10-10",156.8],["10-11",156.5],["10-12",157.7],["10-13",157.2],["10-14",157.4],["10-17",160.8],["10-18",160.6],["10-19",161.55],["10-20",159.65],["10-21",160.95],["10-24",162.7],["10-25",163.5],["10-26",163.65],["10-27",161.55],["10-28",161.2],["10-31",160.8],["11-01",162.55],["11-02",161.75],["11-03",163.2],["11-04",164.7],["11-07",166.5],["11-08",164.7],["11-09",167.2],["11-10",167.0],["11-11",168.15],["11-14",166.5],["11-15",162.25],["11-16",161.75],["11-17",159.75],["11-18",160.2],["11-21",158.5],["11-22",156.65],["11-23",158.5],["11-24",159.0],["11-25",157.9],["11-28",160.5],["11-29",159.85],["11-30",159.8],["12-01",160.1],["12-02",158.6],["12-05",158.6],["12-06",161.25],["12-07",160.6],["12-08",160.4],["12-09",158.8],["12-12",158.0],["12-13",157.35],["12-14",160.4],["12-15",159.65],["12-16",159.25],["12-19",159.75],["12-20",159.8],["12-21",159.9],["12-22",159.9],["12-23",162.05],["12-28",164.1],["12-29",165.5],["12-30",165.6]],"Silver":[["01-04",4.43],["01-05",4.39],["01-06",4.39],["01-07",4.4],["01-10",4.38],["01-11",4.31],["01-12",4.33],["01-13",4.34],["01-14",4.33],["01-17",4.35],["01-18",4.38],["01-19",4.36],["01-20",4.42],["01-21",4.4],["01-24",4.43],["01-25",4.48],["01-26",4.48],["01-27",4.53],["01-28",4.46],["01-31",4.45],["02-01",4.47],["02-02",4.45],["02-03",4.5],["02-04",4.48],["02-07",4.53],["02-08",4.5],["02-09",4.54],["02-10",4.51],["02-11",4.47],["02-14",4.5],["02-15",4.5],["02-16",4.5],["02-17",4.52],["02-18",4.53],["02-21",4.55],["02-22",4.56],["02-23",4.55],["02-24",4.65],["02-25",4.59],["02-28",4.73],["03-01",4.72],["03-02",4.8],["03-03",4.8],["03-04",4.77],["03-07",4.88],["03-08",4.87],["03-09",4.81],["03-10",4.83],["03-11",4.81],["03-14",4.82],["03-15",4.82],["03-16",4.89],["03-17",4.88],["03-18",4.92],["03-21",4.95],["03-22",4.96],["03-23",4.97],["03-24",4.95],["03-25",4.97],["03-28",4.87],["03-29",4.76],["03-30",4.83],["03-31",4.83],["04-01",4.84],["04-04",4.89],["04-05",4.82],["04-06",4.7],["04-07",4.75],["04-12",4.77],["04-13",4.8],["04-14",4.8],["04-15",4.79],["04-18",4.83],["04-19",4.85],["04-20",4.8],["04-21",4.8],["04-22",4.86],["04-25",4.82],["04-26",4.73],["04-27",4.78],["04-28",4.73],["04-29",4.71],["05-02",4.77],["05-03",4.78],["05-04",4.78],["05-05",4.72],["05-06",4.74],["05-09",4.74],["05-10",4.74],["05-11",4.77],["05-12",4.74],["05-13",4.79],["05-16",4.77],["05-17",4.77],["05-18",4.73],["05-19",4.69],["05-20",4.72],["05-23",4.65],["05-24",4.61],["05-25",4.62],["05-26",4.54],["05-27",4.61],["05-30",4.57],["05-31",4.56],["06-01",4.58],["06-02",4.58],["06-03",4.55],["06-08",4.54],["06-09",4.43],["06-10",4.39],["06-13",4.42],["06-14",4.33],["06-15",4.37],["06-16",4.44],["06-17",4.39],["06-20",4.47],["06-21",4.5],["06-22",4.42],["06-23",4.45],["06-24",4.46],["06-27",4.5],["06-28",4.51],["06-29",4.51],["06-30",4.51],["07-01",4.52],["07-04",4.43],["07-05",4.45],["07-06",4.44],["07-07",4.46],["07-08",4.45],["07-11",4.47],["07-12",4.48],["07-13",4.5],["07-14",4.53],["07-15",4.56],["07-18",4.54],["07-19",4.58],["07-20",4.58],["07-21",4.57],["07-22",4.57],["07-25",4.62],["07-26",4.63],["07-27",4.6],["07-28",4.58],["07-29",4.52],["08-01",4.51],["08-02",4.53],["08-03",4.55],["08-04",4.58],["08-05",4.55],["08-08",4.57],["08-09",4.57],["08-10",4.55],["08-11",4.56],["08-12",4.51],["08-15",4.42],["08-16",4.37],["08-17",4.41],["08-18",4.38],["08-19",4.43],["08-22",4.4],["08-23",4.36],["08-24",4.41],["08-25",4.4],["08-26",4.4],["08-30",4.42],["08-31",4.45],["09-01",4.47],["09-02",4.47],["09-05",4.52],["09-06",4.51],["09-07",4.48],["09-08",4.51],["09-09",4.45],["09-12",4.5],["09-13",4.46],["09-14",4.45],["09-15",4.47],["09-16",4.49],["09-19",4.56],["09-20",4.55],["09-21",4.61],["09-22",4.62],["09-23",4.59],["09-26",4.59],["09-27",4.61],["09-28",4.62],["09-29",4.62],["09-30",4.64],["10-03",4.66],["10-04",4.64],["10-05",4.67],["10-06",4.63],["10-07",4.64],["10-10",4.66],["10-11",4.71],["10-12",4.75],["10-13",4.76],["10-14",4.75],["10-17",4.82],["10-18",4.81],["10-19",4.84],["10-20",4.77],["10-21",4.81],["10-24",4.83],["10-25",4.86],["10-26",4.88],["10-27",4.8],["10-28",4.81],["10-31",4.85],["11-01",4.88],["11-02",4.84],["11-03",4.84],["11-04",4.89],["11-07",4.93],["11-08",4.87],["11-09",4.96],["11-10",4.94],["11-11",4.97],["11-14",4.91],["11-15",4.8],["11-16",4.81],["11-17",4.82],["11-18",4.84],["11-21",4.79],["11-22",4.7],["11-23",4.74],["11-24",4.73],["11-25",4.71],["11-28",4.79],["11-29",4.73],["11-30",4.74],["12-01",4.78],["12-02",4.7],["12-05",4.71],["12-06",4.78],["12-07",4.74],["12-08",4.77],["12-09",4.76],["12-12",4.74],["12-13",4.66],["12-14",4.72],["12-15",4.68],["12-16",4.67],["12-19",4.68],["12-20",4.67],["12-21",4.72],["12-22",4.66],["12-23",4.7],["12-28",4.76],["12-29",4.8],["12-30",4.76]]},"1978":{"Gold":[["01-03",168.6],["01-04",172.5],["01-05",166.3],["01-06",168.9],["01-09",168.6],["01-10",173.5],["01-11",172.9],["01-12",174.2],["01-13",172.4],["01-16",174.45],["01-17",174.25],["01-18",172.3],["01-19",172.85],["01-20",173.3],["01-23",174.95],["01-24",177.1],["01-25",177.0],["01-26",176.0],["01-27",176.15],["01-30",175.9],["01-31",175.2],["02-01",176.6],["02-02",175.0],["02-03",175.2],["02-06",175.5],["02-07",175.7],["02-08",175.0],["02-09",174.0],["02-10",174.0],["02-13",176.5],["02-14",177.5],["02-15",178.55],["02-16",179.25],["02-17",179.6],["02-20",181.6],["02-21",181.4],["02-22",181.35],["02-23",182.6],["02-24",183.75],["02-27",182.1],["02-28",182.0],["03-01",183.8],["03-02",183.5],["03-03",183.8],["03-06",184.1],["03-07",185.4],["03-08",188.8],["03-09",187.95],["03-10",186.9],["03-13",185.2],["03-14",187.65],["03-15",186.75],["03-16",185.55],["03-17",184.5],["03-20",181.35],["03-21",177.25],["03-22",178.55],["03-23",182.1],["03-28",183.2],["03-29",182.7],["03-30",179.4],["03-31",180.75],["04-03",182.75],["04-04",179.8],["04-05",178.65],["04-06",182.0],["04-07",179.25],["04-10",178.7],["04-11",179.65],["04-12",180.7],["04-13",179.4],["04-14",178.2],["04-17",175.1],["04-18",173.3],["04-19",173.8],["04-20",169.7],["04-21",171.0],["04-24",169.0],["04-25",168.0],["04-26",168.1],["04-27",169.35],["04-28",170.0],["05-02",169.15],["05-03",170.3],["05-04",172.85],["05-05",172.55],["05-08",171.95],["05-09",172.15],["05-10",173.1],["05-11",174.85],["05-12",175.1],["05-15",175.0],["05-16",177.1],["05-17",176.4],["05-18",176.75],["05-19",178.65],["05-22",179.35],["05-23",180.25],["05-24",179.6],["05-25",179.35],["05-26",178.95],["05-30",181.7],["05-31",184.9],["06-01",183.25],["06-02",184.5],["06-05",182.5],["06-06",181.95],["06-07",182.35],["06-08",183.4],["06-09",181.0],["06-12",181.4],["06-13",181.6],["06-14",183.65],["06-15",182.55],["06-16",184.0],["06-19",184.15],["06-20",186.35],["06-21",186.1],["06-22",185.55],["06-23",185.2],["06-26",185.1],["06-27",185.1],["06-28",185.25],["06-29",184.6],["06-30",183.2],["07-03",183.0],["07-04",185.0],["07-05",184.4],["07-06",183.45],["07-07",183.85],["07-10",185.5],["07-11",185.35],["07-12",185.7],["07-13",186.7],["07-14",186.0],["07-17",185.05],["07-18",185.4],["07-19",185.75],["07-20",187.4],["07-21",190.75],["07-24",195.5],["07-25",194.05],["07-26",194.7],["07-27",194.7],["07-28",198.8],["07-31",198.9],["08-01",207.5],["08-02",203.25],["08-03",201.75],["08-04",201.35],["08-07",205.0],["08-08",206.75],["08-09",208.0],["08-10",205.85],["08-11",209.85],["08-14",212.25],["08-15",215.9],["08-16",215.7],["08-17",210.45],["08-18",212.75],["08-21",205.15],["08-22",207.3],["08-23",198.35],["08-24",202.7],["08-25",198.85],["08-29",199.4],["08-30",206.6],["08-31",207.3],["09-01",208.1],["09-04",212.5],["09-05",211.2],["09-06",211.75],["09-07",210.85],["09-08",208.6],["09-11",205.7],["09-12",207.15],["09-13",206.8],["09-14",211.2],["09-15",210.65],["09-18",209.3],["09-19",211.1],["09-20",213.5],["09-21",215.9],["09-22",214.35],["09-25",216.65],["09-26",219.1],["09-27",217.15],["09-28",217.45],["09-29",217.45],["10-02",217.0],["10-03",218.8],["10-04",223.0],["10-05",223.4],["10-06",223.2],["10-09",222.45],["10-10",223.6],["10-11",226.0],["10-12",227.2],["10-13",225.05],["10-16",224.3],["10-17",228.0],["10-18",229.25],["10-19",227.0],["10-20",227.45],["10-23",229.0],["10-24",226.3],["10-25",230.1],["10-26",233.3],["10-27",234.15],["10-30",241.3],["10-31",243.65],["11-01",238.65],["11-02",220.4],["11-03",219.55],["11-06",208.25],["11-07",214.4],["11-08",221.75],["11-09",216.6],["11-10",209.6],["11-13",209.1],["11-14",210.6],["11-15",207.0],["11-16",197.1],["11-17",198.3],["11-20",199.15],["11-21",199.1],["11-22",197.9],["11-23",201.35],["11-24",202.75],["11-27",199.7],["11-28",197.2],["11-29",193.65],["11-30",193.7],["12-01",194.05],["12-04",197.7],["12-05",196.65],["12-06",195.5],["12-07",198.1],["12-08",200.35],["12-11",205.4],["12-12",204.05],["12-13",203.0],["12-14",202.8],["12-15",205.6],["12-18",212.2],["12-19",220.35],["12-20",216.75],["12-21",213.25],["12-22",216.0],["12-27",220.75],["12-28",223.0],["12-29",224.5]],"Silver":[["01-03",4.87],["01-04",4.97],["01-05",4.82],["01-06",4.86],["01-09",4.87],["01-10",4.96],["01-11",4.94],["01-12",4.98],["01-13",4.92],["01-16",4.99],["01-17",4.97],["01-18",4.93],["01-19",4.92],["01-20",4.92],["01-23",4.94],["01-24",5.05],["01-25",5.02],["01-26",5.0],["01-27",4.99],["01-30",4.96],["01-31",4.95],["02-01",5.0],["02-02",4.94],["02-03",4.9],["02-06",4.92],["02-07",4.91],["02-08",4.88],["02-09",4.85],["02-10",4.9],["02-13",4.93],["02-14",4.95],["02-15",4.95],["02-16",5.0],["02-17",5.02],["02-20",5.05],["02-21",5.04],["02-22",5.03],["02-23",5.04],["02-24",5.03],["02-27",4.95],["02-28",4.97],["03-01",5.01],["03-02",4.99],["03-03",5.0],["03-06",5.0],["03-07",5.08],["03-08",5.32],["03-09",5.29],["03-10",5.24],["03-13",5.31],["03-14",5.48],["03-15",5.43],["03-16",5.42],["03-17",5.45],["03-20",5.29],["03-21",5.17],["03-22",5.25],["03-23",5.28],["03-28",5.41],["03-29",5.37],["03-30",5.29],["03-31",5.34],["04-03",5.42],["04-04",5.35],["04-05",5.27],["04-06",5.33],["04-07",5.25],["04-10",5.25],["04-11",5.28],["04-12",5.31],["04-13",5.26],["04-14",5.22],["04-17",5.14],["04-18",5.07],["04-19",5.11],["04-20",4.99],["04-21",5.04],["04-24",4.98],["04-25",4.92],["04-26",4.97],["04-27",5.0],["04-28",5.0],["05-02",4.98],["05-03",5.05],["05-04",5.08],["05-05",5.09],["05-08",5.05],["05-09",5.05],["05-10",5.06],["05-11",5.12],["05-12",5.09],["05-15",5.07],["05-16",5.1],["05-17",5.12],["05-18",5.14],["05-19",5.2],["05-22",5.21],["05-23",5.19],["05-24",5.18],["05-25",5.17],["05-26",5.21],["05-30",5.36],["05-31",5.47],["06-01",5.4],["06-02",5.45],["06-05",5.34],["06-06",5.3],["06-07",5.35],["06-08",5.3],["06-09",5.26],["06-12",5.25],["06-13",5.26],["06-14",5.33],["06-15",5.26],["06-16",5.33],["06-19",5.32],["06-20",5.41],["06-21",5.37],["06-22",5.32],["06-23",5.33],["06-26",5.33],["06-27",5.34],["06-28",5.37],["06-29",5.34],["06-30",5.28],["07-03",5.27],["07-04",5.3],["07-05",5.3],["07-06",5.27],["07-07",5.24],["07-10",5.28],["07-11",5.29],["07-12",5.29],["07-13",5.32],["07-14",5.29],["07-17",5.25],["07-18",5.24],["07-19",5.24],["07-20",5.3],["07-21",5.41],["07-24",5.54],["07-25",5.46],["07-26",5.5],["07-27",5.45],["07-28",5.6],["07-31",5.57],["08-01",5.72],["08-02",5.6],["08-03",5.55],["08-04",5.52],["08-07",5.58],["08-08",5.58],["08-09",5.58],["08-10",5.49],["08-11",5.63],["08-14",5.67],["08-15",5.74],["08-16",5.66],["08-17",5.53],["08-18",5.54],["08-21",5.41],["08-22",5.46],["08-23",5.35],["08-24",5.45],["08-25",5.4],["08-29",5.43],["08-30",5.53],["08-31",5.53],["09-01",5.52],["09-04",5.59],["09-05",5.56],["09-06",5.56],["09-07",5.52],["09-08",5.5],["09-11",5.47],["09-12",5.5],["09-13",5.52],["09-14",5.6],["09-15",5.57],["09-18",5.55],["09-19",5.6],["09-20",5.65],["09-21",5.68],["09-22",5.62],["09-25",5.69],["09-26",5.73],["09-27",5.66],["09-28",5.68],["09-29",5.67],["10-02",5.67],["10-03",5.77],["10-04",5.85],["10-05",5.84],["10-06",5.84],["10-09",5.8],["10-10",5.99],["10-11",5.97],["10-12",6.01],["10-13",5.93],["10-16",5.89],["10-17",5.97],["10-18",5.99],["10-19",5.92],["10-20",5.92],["10-23",5.91],["10-24",5.83],["10-25",5.94],["10-26",6.11],["10-27",6.12],["10-30",6.25],["10-31",6.26],["11-01",6.13],["11-02",5.85],["11-03",5.81],["11-06",5.78],["11-07",5.86],["11-08",5.89],["11-09",5.82],["11-10",5.73],["11-13",5.72],["11-14",5.86],["11-15",5.77],["11-16",5.67],["11-17",5.78],["11-20",5.92],["11-21",5.93],["11-22",5.95],["11-23",5.98],["11-24",6.04],["11-27",6.02],["11-28",5.97],["11-29",5.9],["11-30",5.91],["12-01",5.95],["12-04",5.94],["12-05",5.87],["12-06",5.84],["12-07",5.86],["12-08",5.86],["12-11",5.9],["12-12",5.84],["12-13",5.85],["12-14",5.87],["12-15",5.88],["12-18",5.98],["12-19",6.03],["12-20",5.98],["12-21",5.94],["12-22",5.95],["12-27",5.99],["12-28",6.03],["12-29",6.02]]},"1979":{"Gold":[["01-02",227.15],["01-03",222.1],["01-04",222.5],["01-05",226.7],["01-08",224.1],["01-09",224.0],["01-10",220.4],["01-11",221.2],["01-12",216.6],["01-15",216.55],["01-16",219.0],["01-17",225.0],["01-18",227.8],["01-19",230.7],["01-22",234.4],["01-23",230.8],["01-24",234.5],["01-25",235.1],["01-26",234.35],["01-29",234.05],["01-30",233.65],["01-31",233.05],["02-01",232.4],["02-02",229.9],["02-05",238.8],["02-06",242.55],["02-07",249.0],["02-08",254.0],["02-09",243.9],["02-12",249.6],["02-13",244.0],["02-14",237.6],["02-15",245.0],["02-16",245.95],["02-19",249.6],["02-20",248.0],["02-21",249.25],["02-22",251.15],["02-23",252.1],["02-26",250.3],["02-27",247.8],["02-28",250.9],["03-01",249.3],["03-02",248.7],["03-05",242.8],["03-06",239.3],["03-07",242.0],["03-08",238.75],["03-09",240.5],["03-12",241.1],["03-13",239.4],["03-14",239.9],["03-15",239.8],["03-16",243.35],["03-19",243.85],["03-20",242.0],["03-21",240.25],["03-22",242.9],["03-23",242.15],["03-26",244.3],["03-27",246.3],["03-28",243.75],["03-29",241.6],["03-30",239.65],["04-02",240.05],["04-03",239.9],["04-04",239.8],["04-05",240.5],["04-06",239.85],["04-09",240.0],["04-10",239.6],["04-11",239.1],["04-12",233.75],["04-17",231.75],["04-18",234.5],["04-19",241.0],["04-20",237.8],["04-23",236.75],["04-24",240.0],["04-25",241.5],["04-26",242.25],["04-27",242.75],["04-30",243.45],["05-01",247.7],["05-02",246.6],["05-03",245.9],["05-04",247.65],["05-08",250.2],["05-09",247.0],["05-10",251.7],["05-11",251.1],["05-14",250.65],["05-15",253.4],["05-16",256.1],["05-17",257.55],["05-18",257.5],["05-21",261.05],["05-22",265.15],["05-23",264.4],["05-24",263.0],["05-25",270.0],["05-29",276.1],["05-30",272.6],["05-31",277.15],["06-01",276.7],["06-04",273.6],["06-05",275.75],["06-06",280.75],["06-07",279.3],["06-08",277.4],["06-11",282.4],["06-12",278.9],["06-13",276.1],["06-14",278.8],["06-15",279.3],["06-18",279.9],["06-19",279.25],["06-20",280.7],["06-21",280.6],["06-22",281.95],["06-25",284.5],["06-26",281.9],["06-27",281.0],["06-28",281.3],["06-29",276.45],["07-02",282.2],["07-03",281.8],["07-04",283.3],["07-05",286.75],["07-06",290.2],["07-09",290.25],["07-10",289.9],["07-11",290.6],["07-12",290.75],["07-13",288.6],["07-16",291.4],["07-17",296.5],["07-18",303.85],["07-19",300.1],["07-20",298.5],["07-23",303.6],["07-24",306.5],["07-25",303.0],["07-26",307.0],["07-27",305.4],["07-30",304.65],["07-31",295.35],["08-01",290.95],["08-02",292.85],["08-03",288.5],["08-06",287.0],["08-07",282.5],["08-08",287.1],["08-09",292.75],["08-10",302.8],["08-13",304.1],["08-14",293.0],["08-15",300.25],["08-16",296.5],["08-17",298.7],["08-20",299.1],["08-21",298.9],["08-22",311.5],["08-23",309.6],["08-24",314.7],["08-28",316.2],["08-29",314.05],["08-30",318.65],["08-31",317.75],["09-03",319.3],["09-04",323.9],["09-05",329.25],["09-06",340.85],["09-07",331.15],["09-10",336.4],["09-11",338.65],["09-12",336.95],["09-13",334.35],["09-14",345.75],["09-17",350.75],["09-18",371.35],["09-19",376.0],["09-20",375.35],["09-21",373.0],["09-24",377.0],["09-25",375.9],["09-26",370.8],["09-27",386.25],["09-28",397.0],["10-01",399.5],["10-02",437.0],["10-03",418.5],["10-04",394.5],["10-05",367.5],["10-08",376.75],["10-09",377.0],["10-10",409.25],["10-11",400.0],["10-12",387.75],["10-15",400.2],["10-16",398.6],["10-17",386.4],["10-18",382.0],["10-19",388.75],["10-22",395.5],["10-23",387.6],["10-24",389.0],["10-25",391.2],["10-26",374.8],["10-29",374.5],["10-30",376.0],["10-31",379.75],["11-01",379.7],["11-02",373.0],["11-05",378.0],["11-06",382.8],["11-07",392.5],["11-08",392.5],["11-09",389.75],["11-12",393.0],["11-13",388.0],["11-14",389.25],["11-15",387.5],["11-16",386.75],["11-19",390.0],["11-20",389.0],["11-21",396.8],["11-22",394.85],["11-23",390.15],["11-26",393.0],["11-27",393.4],["11-28",405.35],["11-29",410.9],["11-30",417.2],["12-03",428.0],["12-04",435.0],["12-05",427.25],["12-06",434.5],["12-07",428.9],["12-10",431.35],["12-11",442.75],["12-12",449.75],["12-13",458.75],["12-14",459.5],["12-17",460.6],["12-18",473.5],["12-19",494.0],["12-20",477.25],["12-21",474.9],["12-24",485.9],["12-27",508.75],["12-28",515.0],["12-31",524.0]],"Silver":[["01-02",6.08],["01-03",5.99],["01-04",5.98],["01-05",5.98],["01-08",6.01],["01-09",6.02],["01-10",5.98],["01-11",5.99],["01-12",5.93],["01-15",5.94],["01-16",6.04],["01-17",6.2],["01-18",6.21],["01-19",6.24],["01-22",6.33],["01-23",6.28],["01-24",6.41],["01-25",6.53],["01-26",6.55],["01-29",6.61],["01-30",6.59],["01-31",6.71],["02-01",6.64],["02-02",6.62],["02-05",7.08],["02-06",7.06],["02-07",7.31],["02-08",7.51],["02-09",7.0],["02-12",7.37],["02-13",7.12],["02-14",6.95],["02-15",7.26],["02-16",7.35],["02-19",7.69],["02-20",7.69],["02-21",7.85],["02-22",7.8],["02-23",7.72],["02-26",7.75],["02-27",7.5],["02-28",7.69],["03-01",7.62],["03-02",7.69],["03-05",7.37],["03-06",7.39],["03-07",7.38],["03-08",7.23],["03-09",7.25],["03-12",7.26],["03-13",7.13],["03-14",7.16],["03-15",7.14],["03-16",7.34],["03-19",7.35],["03-20",7.32],["03-21",7.38],["03-22",7.58],["03-23",7.55],["03-26",7.67],["03-27",7.73],["03-28",7.64],["03-29",7.5],["03-30",7.45],["04-02",7.46],["04-03",7.43],["04-04",7.33],["04-05",7.39],["04-06",7.39],["04-09",7.49],["04-10",7.58],["04-11",7.52],["04-12",7.39],["04-17",7.34],["04-18",7.39],["04-19",7.52],["04-20",7.37],["04-23",7.36],["04-24",7.45],["04-25",7.44],["04-26",7.51],["04-27",7.57],["04-30",7.65],["05-01",8.02],["05-02",7.89],["05-03",7.93],["05-04",8.01],["05-08",8.28],["05-09",8.12],["05-10",8.38],["05-11",8.35],["05-14",8.27],["05-15",8.47],["05-16",8.43],["05-17",8.39],["05-18",8.33],["05-21",8.43],["05-22",8.54],["05-23",8.6],["05-24",8.59],["05-25",8.74],["05-29",8.95],["05-30",8.67],["05-31",8.77],["06-01",8.63],["06-04",8.43],["06-05",8.49],["06-06",8.64],["06-07",8.45],["06-08",8.49],["06-11",8.62],["06-12",8.45],["06-13",8.29],["06-14",8.42],["06-15",8.48],["06-18",8.48],["06-19",8.45],["06-20",8.65],["06-21",8.67],["06-22",8.76],["06-25",8.82],["06-26",8.64],["06-27",8.63],["06-28",8.53],["06-29",8.54],["07-02",8.7],["07-03",8.6],["07-04",8.74],["07-05",8.84],["07-06",8.93],["07-09",8.89],["07-10",9.04],["07-11",9.12],["07-12",9.19],["07-13",8.92],["07-16",9.07],["07-17",9.4],["07-18",9.56],["07-19",9.35],["07-20",9.3],["07-23",9.56],["07-24",9.58],["07-25",9.37],["07-26",9.48],["07-27",9.5],["07-30",9.33],["07-31",9.08],["08-01",9.1],["08-02",9.12],["08-03",9.0],["08-06",8.86],["08-07",8.78],["08-08",8.79],["08-09",9.01],["08-10",9.13],["08-13",9.09],["08-14",8.84],["08-15",9.09],["08-16",9.06],["08-17",9.25],["08-20",9.15],["08-21",9.16],["08-22",9.51],["08-23",9.5],["08-24",9.76],["08-28",9.95],["08-29",10.08],["08-30",10.39],["08-31",10.32],["09-03",10.9],["09-04",10.95],["09-05",11.48],["09-06",12.55],["09-07",11.72],["09-10",12.2],["09-11",12.21],["09-12",12.29],["09-13",11.94],["09-14",13.0],["09-17",13.4],["09-18",18.3],["09-19",15.48],["09-20",16.5],["09-21",14.04],["09-24",16.0],["09-25",14.75],["09-26",14.72],["09-27",16.31],["09-28",16.25],["10-01",17.09],["10-02",18.1],["10-03",17.0],["10-04",14.9],["10-05",15.3],["10-08",15.3],["10-09",16.2],["10-10",16.9],["10-11",16.75],["10-12",16.98],["10-15",17.74],["10-16",17.46],["10-17",16.8],["10-18",16.21],["10-19",17.31],["10-22",17.45],["10-23",17.02],["10-24",17.21],["10-25",17.12],["10-26",16.49],["10-29",15.79],["10-30",16.01],["10-31",16.6],["11-01",16.32],["11-02",16.02],["11-05",16.2],["11-06",16.53],["11-07",16.74],["11-08",16.4],["11-09",16.41],["11-12",16.45],["11-13",16.21],["11-14",16.06],["11-15",16.1],["11-16",16.2],["11-19",16.38],["11-20",16.23],["11-21",16.45],["11-22",16.19],["11-23",16.08],["11-26",16.28],["11-27",16.71],["11-28",17.97],["11-29",18.66],["11-30",19.0],["12-03",19.88],["12-04",19.52],["12-05",19.1],["12-06",19.58],["12-07",19.11],["12-10",19.01],["12-11",19.85],["12-12",20.14],["12-13",20.52],["12-14",20.9],["12-17",21.6],["12-18",23.21],["12-19",23.87],["12-20",23.5],["12-21",23.44],["12-24",24.6],["12-27",27.51],["12-28",27.85],["12-31",32.2]]}});
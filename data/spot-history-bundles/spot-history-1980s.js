@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 5051 entries across 10 years (1980–1989)
+window._loadSpotSeedBundle({"1980":{"Gold":[["01-02",559.0],["01-03",632.0],["01-04",596.0],["01-07",634.0],["01-08",615.75],["01-09",599.25],["01-10",608.25],["01-11",610.0],["01-14",647.75],["01-15",682.0],["01-16",765.0],["01-17",728.25],["01-18",825.5],["01-21",843.0],["01-22",763.0],["01-23",650.0],["01-24",712.0],["01-25",691.5],["01-28",629.0],["01-29",678.0],["01-30",703.5],["01-31",668.0],["02-01",675.0],["02-04",672.0],["02-05",661.25],["02-06",696.0],["02-07",704.0],["02-08",688.5],["02-11",714.5],["02-12",703.75],["02-13",695.5],["02-14",688.0],["02-15",674.5],["02-18",665.25],["02-19",661.75],["02-20",625.0],["02-21",646.5],["02-22",643.5],["02-25",625.0],["02-26",636.75],["02-27",629.0],["02-28",638.0],["02-29",640.0],["03-03",637.0],["03-04",633.25],["03-05",641.75],["03-06",634.25],["03-07",602.25],["03-10",602.0],["03-11",569.0],["03-12",582.5],["03-13",574.3],["03-14",502.75],["03-17",480.0],["03-18",474.0],["03-19",514.0],["03-20",561.0],["03-21",535.0],["03-24",544.0],["03-25",548.5],["03-26",525.0],["03-27",486.0],["03-28",490.0],["03-31",503.25],["04-01",501.5],["04-02",498.0],["04-03",491.25],["04-08",518.4],["04-09",547.0],["04-10",539.5],["04-11",532.0],["04-14",532.8],["04-15",495.5],["04-16",513.5],["04-17",511.5],["04-18",511.75],["04-21",506.5],["04-22",494.5],["04-23",506.75],["04-24",514.25],["04-25",552.0],["04-28",535.25],["04-29",513.0],["04-30",519.25],["05-01",507.75],["05-02",510.0],["05-06",517.5],["05-07",509.25],["05-08",513.75],["05-09",510.5],["05-12",510.5],["05-13",510.0],["05-14",518.5],["05-15",516.25],["05-16",516.1],["05-19",515.1],["05-20",509.8],["05-21",511.75],["05-22",507.5],["05-23",510.5],["05-27",514.2],["05-28",524.0],["05-29",521.0],["05-30",531.4],["06-02",563.0],["06-03",554.5],["06-04",568.0],["06-05",581.5],["06-06",598.0],["06-09",627.5],["06-10",606.5],["06-11",595.0],["06-12",588.75],["06-13",609.25],["06-16",599.0],["06-17",590.75],["06-18",602.5],["06-19",598.0],["06-20",603.75],["06-23",596.0],["06-24",599.75],["06-25",617.5],["06-26",623.25],["06-27",631.5],["06-30",662.5],["07-01",656.0],["07-02",672.0],["07-03",664.5],["07-04",668.5],["07-07",665.75],["07-08",688.75],["07-09",678.0],["07-10",665.0],["07-11",663.5],["07-14",649.0],["07-15",621.0],["07-16",624.5],["07-17",630.25],["07-18",610.0],["07-21",620.75],["07-22",611.5],["07-23",632.0],["07-24",635.5],["07-25",652.5],["07-28",643.25],["07-29",645.5],["07-30",636.5],["07-31",618.0],["08-01",622.0],["08-04",622.25],["08-05",635.5],["08-06",628.5],["08-07",632.5],["08-08",631.25],["08-11",614.5],["08-12",613.25],["08-13",615.95],["08-14",623.0],["08-15",626.0],["08-18",609.75],["08-19",620.75],["08-20",622.75],["08-21",640.5],["08-22",639.5],["08-26",629.0],["08-27",632.75],["08-28",633.75],["08-29",633.75],["09-01",626.25],["09-02",632.25],["09-03",636.7],["09-04",637.25],["09-05",647.5],["09-08",660.0],["09-09",674.0],["09-10",686.0],["09-11",676.5],["09-12",693.5],["09-15",672.5],["09-16",668.0],["09-17",678.25],["09-18",674.0],["09-19",674.5],["09-22",698.75],["09-23",720.5],["09-24",711.0],["09-25",705.0],["09-26",697.0],["09-29",687.25],["09-30",670.0],["10-01",679.25],["10-02",675.75],["10-03",670.25],["10-06",671.5],["10-07",679.5],["10-08",674.5],["10-09",681.75],["10-10",683.5],["10-13",683.5],["10-14",674.0],["10-15",676.25],["10-16",673.5],["10-17",667.75],["10-20",664.2],["10-21",652.75],["10-22",659.5],["10-23",649.25],["10-24",628.0],["10-27",633.5],["10-28",631.0],["10-29",643.5],["10-30",643.5],["10-31",636.0],["11-03",634.3],["11-04",648.0],["11-05",655.0],["11-06",633.75],["11-07",603.0],["11-10",617.0],["11-11",598.75],["11-12",614.5],["11-13",616.0],["11-14",615.7],["11-17",609.25],["11-18",616.25],["11-19",628.25],["11-20",634.5],["11-21",637.75],["11-24",635.0],["11-25",613.5],["11-26",625.5],["11-27",620.0],["11-28",621.5],["12-01",635.5],["12-02",629.25],["12-03",627.5],["12-04",632.7],["12-05",620.25],["12-08",615.25],["12-09",612.5],["12-10",594.5],["12-11",573.5],["12-12",553.5],["12-15",581.0],["12-16",559.75],["12-17",572.0],["12-18",577.0],["12-19",573.5],["12-22",594.0],["12-23",596.5],["12-24",604.0],["12-29",602.25],["12-30",587.0],["12-31",589.5]],"Silver":[["01-02",39.95],["01-03",37.0],["01-04",32.75],["01-07",39.0],["01-08",33.52],["01-09",33.15],["01-10",33.95],["01-11",36.61],["01-14",39.75],["01-15",44.0],["01-16",48.01],["01-17",43.35],["01-18",49.45],["01-21",49.0],["01-22",41.55],["01-23",38.48],["01-24",41.5],["01-25",38.3],["01-28",35.3],["01-29",37.0],["01-30",37.35],["01-31",35.28],["02-01",35.31],["02-04",34.5],["02-05",33.76],["02-06",39.12],["02-07",38.3],["02-08",36.8],["02-11",40.25],["02-12",39.49],["02-13",38.86],["02-14",37.43],["02-15",36.11],["02-18",35.75],["02-19",35.35],["02-20",30.0],["02-21",33.5],["02-22",33.2],["02-25",32.8],["02-26",33.5],["02-27",33.0],["02-28",35.01],["02-29",35.52],["03-03",34.75],["03-04",34.64],["03-05",36.31],["03-06",35.54],["03-07",32.45],["03-10",30.62],["03-11",28.15],["03-12",29.65],["03-13",27.0],["03-14",23.01],["03-17",19.01],["03-18",16.6],["03-19",20.65],["03-20",22.6],["03-21",21.03],["03-24",23.05],["03-25",21.25],["03-26",19.65],["03-27",16.0],["03-28",13.99],["03-31",13.49],["04-01",16.99],["04-02",14.99],["04-03",14.75],["04-08",16.62],["04-09",17.6],["04-10",15.54],["04-11",15.62],["04-14",15.84],["04-15",14.55],["04-16",14.75],["04-17",14.75],["04-18",14.58],["04-21",14.2],["04-22",13.56],["04-23",14.0],["04-24",14.25],["04-25",15.52],["04-28",13.75],["04-29",13.87],["04-30",13.83],["05-01",12.0],["05-02",13.1],["05-06",13.4],["05-07",12.7],["05-08",13.23],["05-09",13.01],["05-12",12.74],["05-13",12.76],["05-14",13.06],["05-15",12.77],["05-16",12.79],["05-19",12.4],["05-20",12.0],["05-21",12.0],["05-22",10.89],["05-23",11.37],["05-27",12.3],["05-28",13.98],["05-29",13.07],["05-30",13.7],["06-02",14.65],["06-03",14.17],["06-04",15.15],["06-05",16.0],["06-06",17.02],["06-09",17.85],["06-10",15.6],["06-11",15.46],["06-12",15.3],["06-13",16.15],["06-16",16.0],["06-17",15.5],["06-18",15.79],["06-19",15.5],["06-20",15.71],["06-23",15.46],["06-24",15.47],["06-25",16.07],["06-26",16.1],["06-27",16.26],["06-30",16.75],["07-01",17.1],["07-02",17.29],["07-03",16.77],["07-04",16.9],["07-07",16.8],["07-08",17.46],["07-09",17.0],["07-10",16.49],["07-11",16.2],["07-14",15.9],["07-15",15.5],["07-16",15.95],["07-17",15.99],["07-18",15.36],["07-21",15.56],["07-22",15.45],["07-23",15.96],["07-24",16.17],["07-25",16.65],["07-28",16.37],["07-29",16.37],["07-30",16.28],["07-31",15.78],["08-01",15.61],["08-04",15.68],["08-05",16.07],["08-06",15.9],["08-07",16.15],["08-08",16.16],["08-11",15.66],["08-12",15.65],["08-13",15.8],["08-14",15.83],["08-15",15.86],["08-18",15.48],["08-19",15.81],["08-20",15.93],["08-21",16.23],["08-22",16.19],["08-26",16.1],["08-27",16.07],["08-28",16.16],["08-29",16.06],["09-01",15.99],["09-02",16.19],["09-03",16.2],["09-04",16.28],["09-05",17.03],["09-08",18.1],["09-09",18.75],["09-10",19.72],["09-11",19.42],["09-12",21.65],["09-15",19.73],["09-16",19.78],["09-17",21.75],["09-18",20.93],["09-19",20.95],["09-22",22.92],["09-23",23.25],["09-24",23.54],["09-25",21.4],["09-26",22.24],["09-29",21.31],["09-30",20.5],["10-01",21.75],["10-02",21.2],["10-03",19.91],["10-06",20.5],["10-07",20.85],["10-08",20.7],["10-09",21.37],["10-10",21.47],["10-13",21.26],["10-14",20.67],["10-15",21.03],["10-16",21.0],["10-17",20.6],["10-20",20.15],["10-21",19.69],["10-22",19.9],["10-23",19.0],["10-24",18.93],["10-27",18.9],["10-28",18.64],["10-29",19.12],["10-30",19.45],["10-31",18.88],["11-03",18.83],["11-04",19.75],["11-05",20.1],["11-06",18.85],["11-07",17.5],["11-10",18.55],["11-11",17.6],["11-12",18.13],["11-13",18.32],["11-14",18.54],["11-17",18.15],["11-18",18.41],["11-19",18.9],["11-20",19.29],["11-21",19.26],["11-24",19.0],["11-25",17.94],["11-26",18.57],["11-27",18.45],["11-28",18.42],["12-01",18.9],["12-02",18.62],["12-03",18.47],["12-04",18.62],["12-05",18.05],["12-08",17.43],["12-09",17.2],["12-10",16.11],["12-11",14.88],["12-12",14.3],["12-15",16.0],["12-16",14.45],["12-17",15.11],["12-18",15.6],["12-19",15.3],["12-22",15.91],["12-23",16.15],["12-24",16.5],["12-29",16.21],["12-30",15.59],["12-31",15.5]]},"1981":{"Gold":[["01-05",592.0],["01-06",599.25],["01-07",588.75],["01-08",573.75],["01-09",579.75],["01-12",564.25],["01-13",566.0],["01-14",561.5],["01-15",566.75],["01-16",562.75],["01-19",558.75],["01-20",563.5],["01-21",576.0],["01-22",567.0],["01-23",552.0],["01-26",530.25],["01-27",517.0],["01-28",524.5],["01-29",505.0],["01-30",507.5],["02-02",493.25],["02-03",482.0],["02-04",504.25],["02-05",497.0],["02-06",506.5],["02-09",515.0],["02-10",517.75],["02-11",505.0],["02-12",493.5],["02-13",492.5],["02-16",487.0],["02-17",498.5],["02-18",502.0],["02-19",505.5],["02-20",514.75],["02-23",506.5],["02-24",503.75],["02-25",505.75],["02-26",495.25],["02-27",490.25],["03-02",474.5],["03-03",466.25],["03-04",475.75],["03-05",457.0],["03-06",462.0],["03-09",473.25],["03-10",484.5],["03-11",475.5],["03-12",477.5],["03-13",492.0],["03-16",499.25],["03-17",498.25],["03-18",510.25],["03-19",512.75],["03-20",509.5],["03-23",535.75],["03-24",531.0],["03-25",533.25],["03-26",534.0],["03-27",547.25],["03-30",529.5],["03-31",514.25],["04-01",516.75],["04-02",517.0],["04-03",523.5],["04-06",534.25],["04-07",517.0],["04-08",508.0],["04-09",512.0],["04-10",491.0],["04-13",475.5],["04-14",483.0],["04-15",480.25],["04-16",481.5],["04-21",481.0],["04-22",497.0],["04-23",490.5],["04-24",491.75],["04-27",488.75],["04-28",484.25],["04-29",478.5],["04-30",481.0],["05-01",484.75],["05-05",476.75],["05-06",482.75],["05-07",479.25],["05-08",481.75],["05-11",501.0],["05-12",487.0],["05-13",486.5],["05-14",480.75],["05-15",482.5],["05-18",481.75],["05-19",483.25],["05-20",478.25],["05-21",480.0],["05-22",472.75],["05-26",468.5],["05-27",467.75],["05-28",472.0],["05-29",478.75],["06-01",481.25],["06-02",473.5],["06-03",474.0],["06-04",463.75],["06-05",460.25],["06-08",460.0],["06-09",463.0],["06-10",463.25],["06-11",464.25],["06-12",467.0],["06-15",472.25],["06-16",466.75],["06-17",463.25],["06-18",460.25],["06-19",457.75],["06-22",462.0],["06-23",465.0],["06-24",462.25],["06-25",454.5],["06-26",443.75],["06-29",431.5],["06-30",421.5],["07-01",421.25],["07-02",410.0],["07-03",413.75],["07-06",403.5],["07-07",403.5],["07-08",400.0],["07-09",406.0],["07-10",415.25],["07-13",417.75],["07-14",403.25],["07-15",408.0],["07-16",417.25],["07-17",414.5],["07-20",414.75],["07-21",408.0],["07-22",409.25],["07-23",410.5],["07-24",407.5],["07-27",409.75],["07-28",403.0],["07-30",402.25],["07-31",405.25],["08-03",392.5],["08-04",391.75],["08-05",392.6],["08-06",395.0],["08-07",399.0],["08-10",393.2],["08-11",396.5],["08-12",408.5],["08-13",407.5],["08-14",411.5],["08-17",409.5],["08-18",422.5],["08-19",433.5],["08-20",430.5],["08-21",428.5],["08-24",428.5],["08-25",410.5],["08-26",413.0],["08-27",414.75],["08-28",425.5],["09-01",422.5],["09-02",431.5],["09-03",435.25],["09-04",440.25],["09-07",437.25],["09-08",434.25],["09-09",436.25],["09-10",448.0],["09-11",447.75],["09-14",456.0],["09-15",455.25],["09-16",449.75],["09-17",456.0],["09-18",446.75],["09-21",459.25],["09-22",460.25],["09-23",458.0],["09-24",450.5],["09-25",451.75],["09-28",427.5],["09-29",432.5],["09-30",426.5],["10-01",435.25],["10-02",433.25],["10-05",440.75],["10-06",434.95],["10-07",445.0],["10-08",441.75],["10-09",452.25],["10-12",451.6],["10-13",443.9],["10-14",445.25],["10-15",446.85],["10-16",441.25],["10-19",440.75],["10-20",437.2],["10-21",433.3],["10-22",434.6],["10-23",433.5],["10-26",428.0],["10-27",426.8],["10-28",431.5],["10-29",422.25],["10-30",429.0],["11-02",431.0],["11-03",427.75],["11-04",431.0],["11-05",428.9],["11-06",427.75],["11-09",430.1],["11-10",422.75],["11-11",412.75],["11-12",412.25],["11-13",414.0],["11-16",408.25],["11-17",395.75],["11-18",400.75],["11-19",401.0],["11-20",401.0],["11-23",396.0],["11-24",398.0],["11-25",406.0],["11-26",409.75],["11-27",411.25],["11-30",415.5],["12-01",405.0],["12-02",405.25],["12-03",419.0],["12-04",423.5],["12-07",417.25],["12-08",417.25],["12-09",408.25],["12-10",407.0],["12-11",409.0],["12-14",419.25],["12-15",413.25],["12-16",418.0],["12-17",418.0],["12-18",415.25],["12-21",413.75],["12-22",403.75],["12-23",402.25],["12-24",404.0],["12-29",396.25],["12-30",397.25],["12-31",400.0]],"Silver":[["01-05",15.8],["01-06",16.3],["01-07",15.8],["01-08",15.4],["01-09",15.63],["01-12",14.82],["01-13",14.96],["01-14",15.0],["01-15",15.15],["01-16",14.9],["01-19",14.86],["01-20",14.97],["01-21",15.35],["01-22",14.96],["01-23",14.21],["01-26",13.4],["01-27",13.53],["01-28",13.47],["01-29",13.05],["01-30",13.15],["02-02",12.86],["02-03",12.47],["02-04",13.33],["02-05",13.2],["02-06",13.35],["02-09",13.9],["02-10",13.87],["02-11",13.35],["02-12",13.01],["02-13",12.69],["02-16",12.73],["02-17",13.3],["02-18",13.17],["02-19",12.99],["02-20",13.25],["02-23",13.0],["02-24",13.02],["02-25",13.0],["02-26",12.61],["02-27",12.53],["03-02",11.6],["03-03",11.57],["03-04",11.97],["03-05",11.26],["03-06",11.55],["03-09",11.8],["03-10",12.13],["03-11",11.75],["03-12",11.74],["03-13",12.14],["03-16",12.47],["03-17",12.42],["03-18",12.86],["03-19",12.98],["03-20",12.9],["03-23",13.31],["03-24",12.7],["03-25",13.08],["03-26",12.88],["03-27",13.15],["03-30",12.53],["03-31",12.33],["04-01",12.03],["04-02",12.2],["04-03",12.18],["04-06",12.33],["04-07",11.96],["04-08",11.96],["04-09",11.62],["04-10",11.4],["04-13",10.95],["04-14",11.28],["04-15",11.22],["04-16",11.11],["04-21",11.13],["04-22",11.55],["04-23",11.35],["04-24",11.39],["04-27",11.23],["04-28",11.18],["04-29",11.03],["04-30",11.06],["05-01",11.13],["05-05",10.88],["05-06",10.99],["05-07",10.91],["05-08",11.11],["05-11",11.42],["05-12",11.1],["05-13",11.02],["05-14",10.87],["05-15",10.9],["05-18",10.95],["05-19",10.94],["05-20",10.95],["05-21",10.83],["05-22",10.65],["05-26",10.34],["05-27",10.24],["05-28",10.56],["05-29",10.59],["06-01",10.67],["06-02",10.48],["06-03",10.5],["06-04",10.03],["06-05",9.99],["06-08",10.1],["06-09",10.25],["06-10",10.2],["06-11",10.15],["06-12",10.47],["06-15",10.54],["06-16",10.15],["06-17",10.06],["06-18",9.97],["06-19",9.91],["06-22",10.07],["06-23",10.24],["06-24",10.11],["06-25",9.9],["06-26",9.2],["06-29",8.59],["06-30",8.3],["07-01",8.45],["07-02",8.31],["07-03",8.44],["07-06",8.2],["07-07",8.47],["07-08",8.33],["07-09",8.71],["07-10",8.92],["07-13",9.02],["07-14",8.68],["07-15",8.68],["07-16",8.98],["07-17",8.88],["07-20",8.88],["07-21",8.54],["07-22",8.7],["07-23",8.62],["07-24",8.46],["07-27",8.51],["07-28",8.35],["07-30",8.41],["07-31",8.51],["08-03",8.24],["08-04",8.26],["08-05",8.28],["08-06",8.42],["08-07",8.51],["08-10",8.35],["08-11",8.55],["08-12",8.98],["08-13",8.91],["08-14",9.31],["08-17",8.97],["08-18",9.43],["08-19",9.72],["08-20",9.48],["08-21",9.48],["08-24",9.49],["08-25",8.7],["08-26",8.82],["08-27",8.88],["08-28",9.15],["09-01",9.15],["09-02",9.4],["09-03",9.59],["09-04",9.95],["09-07",9.85],["09-08",10.03],["09-09",10.19],["09-10",10.92],["09-11",10.78],["09-14",11.24],["09-15",11.03],["09-16",10.9],["09-17",11.05],["09-18",10.06],["09-21",10.26],["09-22",10.32],["09-23",10.17],["09-24",9.79],["09-25",9.54],["09-28",8.77],["09-29",9.02],["09-30",8.95],["10-01",9.32],["10-02",9.33],["10-05",9.45],["10-06",9.04],["10-07",9.28],["10-08",9.23],["10-09",9.49],["10-12",9.48],["10-13",9.3],["10-14",9.32],["10-15",9.69],["10-16",9.5],["10-19",9.36],["10-20",9.23],["10-21",9.1],["10-22",9.09],["10-23",9.08],["10-26",8.95],["10-27",8.93],["10-28",9.15],["10-29",8.93],["10-30",9.12],["11-02",9.17],["11-03",9.01],["11-04",9.15],["11-05",9.07],["11-06",9.05],["11-09",9.11],["11-10",8.89],["11-11",8.62],["11-12",8.58],["11-13",8.67],["11-16",8.29],["11-17",8.04],["11-18",8.17],["11-19",8.2],["11-20",8.19],["11-23",8.03],["11-24",8.11],["11-25",8.17],["11-26",8.2],["11-27",8.23],["11-30",8.27],["12-01",8.07],["12-02",8.09],["12-03",8.49],["12-04",8.75],["12-07",8.68],["12-08",8.78],["12-09",8.63],["12-10",8.48],["12-11",8.5],["12-14",8.7],["12-15",8.52],["12-16",8.7],["12-17",8.82],["12-18",8.77],["12-21",8.64],["12-22",8.34],["12-23",8.3],["12-24",8.29],["12-29",8.05],["12-30",8.05],["12-31",8.15]]},"1982":{"Gold":[["01-04",399.0],["01-05",400.75],["01-06",402.0],["01-07",396.25],["01-08",397.75],["01-11",392.0],["01-12",389.25],["01-13",387.0],["01-14",371.0],["01-15",377.25],["01-18",369.75],["01-19",377.25],["01-20",371.75],["01-21",375.25],["01-22",377.75],["01-25",373.5],["01-26",373.5],["01-27",382.5],["01-28",381.5],["01-29",388.25],["02-01",381.25],["02-02",376.25],["02-03",378.75],["02-04",383.75],["02-05",384.5],["02-08",381.5],["02-09",378.0],["02-10",382.6],["02-11",381.5],["02-12",379.0],["02-15",375.55],["02-16",376.25],["02-17",375.5],["02-18",367.5],["02-19",368.75],["02-22",364.0],["02-23",360.5],["02-24",362.75],["02-25",368.0],["02-26",363.25],["03-01",358.75],["03-02",363.0],["03-03",357.1],["03-04",347.0],["03-05",340.0],["03-08",335.5],["03-09",325.5],["03-10",332.75],["03-11",334.0],["03-12",322.5],["03-15",314.25],["03-16",321.0],["03-17",314.5],["03-18",322.4],["03-19",316.25],["03-22",318.5],["03-23",327.0],["03-24",333.0],["03-25",328.0],["03-26",322.75],["03-29",319.5],["03-30",325.75],["03-31",320.5],["04-01",325.5],["04-02",326.6],["04-05",336.0],["04-06",346.25],["04-07",356.75],["04-08",352.5],["04-13",352.5],["04-14",364.75],["04-15",362.5],["04-16",363.75],["04-19",356.75],["04-20",345.75],["04-21",346.6],["04-22",344.75],["04-23",346.75],["04-26",361.0],["04-27",350.75],["04-28",358.5],["04-29",352.0],["04-30",356.75],["05-04",343.5],["05-05",341.75],["05-06",335.25],["05-07",336.25],["05-10",329.5],["05-11",330.0],["05-12",333.5],["05-13",331.75],["05-14",331.75],["05-17",337.25],["05-18",337.5],["05-19",342.75],["05-20",341.5],["05-21",343.25],["05-24",331.85],["05-25",326.0],["05-26",332.0],["05-27",324.75],["05-28",325.5],["06-01",319.0],["06-02",316.8],["06-03",322.0],["06-04",318.5],["06-07",322.9],["06-08",330.9],["06-09",326.75],["06-10",329.0],["06-11",327.0],["06-14",322.25],["06-15",315.0],["06-16",316.65],["06-17",313.5],["06-18",307.5],["06-21",297.0],["06-22",301.75],["06-23",300.75],["06-24",309.75],["06-25",304.0],["06-28",303.4],["06-29",310.75],["06-30",314.0],["07-01",311.75],["07-02",313.0],["07-05",315.5],["07-06",313.1],["07-07",307.4],["07-08",310.85],["07-09",322.35],["07-12",338.5],["07-13",339.0],["07-14",353.75],["07-15",347.75],["07-16",345.75],["07-19",350.0],["07-20",344.25],["07-21",361.5],["07-22",358.25],["07-23",363.75],["07-26",357.0],["07-27",351.5],["07-28",345.75],["07-29",340.5],["07-30",342.5],["08-02",352.13],["08-03",355.5],["08-04",347.6],["08-05",348.25],["08-06",346.13],["08-09",337.75],["08-10",337.75],["08-11",332.88],["08-12",333.25],["08-13",337.75],["08-16",337.25],["08-17",338.0],["08-18",352.1],["08-19",356.25],["08-20",379.0],["08-23",381.75],["08-24",411.5],["08-25",394.5],["08-26",417.5],["08-27",425.25],["08-31",409.6],["09-01",404.25],["09-02",408.25],["09-03",454.75],["09-06",458.0],["09-07",488.5],["09-08",469.0],["09-09",477.0],["09-10",448.25],["09-13",440.0],["09-14",452.0],["09-15",444.75],["09-16",447.25],["09-17",445.5],["09-20",426.25],["09-21",426.5],["09-22",441.5],["09-23",437.25],["09-24",438.5],["09-27",414.25],["09-28",409.65],["09-29",413.15],["09-30",394.75],["10-01",397.75],["10-04",392.75],["10-05",387.25],["10-06",402.5],["10-07",417.25],["10-08",438.0],["10-11",432.75],["10-12",442.25],["10-13",429.5],["10-14",448.0],["10-15",437.25],["10-18",426.5],["10-19",439.0],["10-20",429.75],["10-21",432.25],["10-22",426.25],["10-25",420.5],["10-26",416.5],["10-27",422.25],["10-28",418.25],["10-29",422.0],["11-01",426.75],["11-02",431.5],["11-03",433.5],["11-04",426.0],["11-05",423.0],["11-08",411.0],["11-09",410.0],["11-10",412.0],["11-11",408.0],["11-12",400.0],["11-15",404.5],["11-16",404.0],["11-17",412.6],["11-18",409.25],["11-19",417.0],["11-22",413.4],["11-23",404.75],["11-24",404.5],["11-25",410.25],["11-26",413.75],["11-29",428.5],["11-30",428.25],["12-01",440.0],["12-02",435.75],["12-03",440.75],["12-06",443.0],["12-07",458.15],["12-08",449.25],["12-09",442.5],["12-10",439.0],["12-13",438.75],["12-14",449.25],["12-15",435.25],["12-16",441.5],["12-17",440.5],["12-20",440.75],["12-21",441.75],["12-22",448.15],["12-23",445.5],["12-24",448.5],["12-29",456.75],["12-30",457.25],["12-31",448.0]],"Silver":[["01-04",8.06],["01-05",8.15],["01-06",8.26],["01-07",8.11],["01-08",8.22],["01-11",8.01],["01-12",8.09],["01-13",7.92],["01-14",7.72],["01-15",7.92],["01-18",7.79],["01-19",7.9],["01-20",7.82],["01-21",7.86],["01-22",7.92],["01-25",7.73],["01-26",7.79],["01-27",8.04],["01-28",8.02],["01-29",8.28],["02-01",8.12],["02-02",8.05],["02-03",8.16],["02-04",8.41],["02-05",8.52],["02-08",8.48],["02-09",8.38],["02-10",8.66],["02-11",8.56],["02-12",8.52],["02-15",8.51],["02-16",8.57],["02-17",8.44],["02-18",8.25],["02-19",8.29],["02-22",8.08],["02-23",7.84],["02-24",7.96],["02-25",8.03],["02-26",7.84],["03-01",7.74],["03-02",7.93],["03-03",7.78],["03-04",7.53],["03-08",7.34],["03-09",7.0],["03-10",7.21],["03-11",7.2],["03-12",7.04],["03-15",6.96],["03-16",7.15],["03-17",7.08],["03-18",7.13],["03-19",7.0],["03-22",7.07],["03-23",7.21],["03-24",7.29],["03-25",7.06],["03-26",7.06],["03-29",7.01],["03-30",7.08],["03-31",7.06],["04-01",7.11],["04-02",7.11],["04-05",7.28],["04-06",7.38],["04-07",7.47],["04-08",7.41],["04-13",7.39],["04-14",7.61],["04-15",7.49],["04-16",7.51],["04-19",7.47],["04-20",7.19],["04-21",7.2],["04-22",7.18],["04-23",7.21],["04-26",7.39],["04-27",7.17],["04-28",7.21],["04-29",7.01],["04-30",7.06],["05-04",6.9],["05-05",6.82],["05-06",6.8],["05-07",6.86],["05-10",6.7],["05-11",6.68],["05-12",6.69],["05-13",6.65],["05-14",6.65],["05-17",6.76],["05-18",6.69],["05-19",6.76],["05-20",6.71],["05-21",6.7],["05-24",6.57],["05-25",6.49],["05-26",6.6],["05-27",6.39],["05-28",6.36],["06-01",6.1],["06-02",5.97],["06-03",6.07],["06-04",5.92],["06-07",5.92],["06-08",6.08],["06-09",5.92],["06-10",5.88],["06-11",5.95],["06-14",5.82],["06-15",5.51],["06-16",5.45],["06-17",5.32],["06-18",5.14],["06-21",4.9],["06-22",5.01],["06-23",5.04],["06-24",5.22],["06-25",5.12],["06-28",5.1],["06-29",5.36],["06-30",5.73],["07-01",5.71],["07-02",5.88],["07-05",5.96],["07-06",5.86],["07-07",5.53],["07-08",5.74],["07-09",6.24],["07-12",6.31],["07-13",6.24],["07-14",6.62],["07-15",6.48],["07-16",6.38],["07-19",6.55],["07-20",6.42],["07-21",7.05],["07-22",6.96],["07-23",7.14],["07-26",7.12],["07-27",7.21],["07-28",6.99],["07-29",6.7],["07-30",6.63],["08-02",6.89],["08-03",7.08],["08-04",6.81],["08-05",6.93],["08-06",6.82],["08-09",6.58],["08-10",6.49],["08-11",6.24],["08-12",6.25],["08-13",6.38],["08-16",6.28],["08-17",6.34],["08-18",6.96],["08-19",6.96],["08-20",7.45],["08-23",7.85],["08-24",8.15],["08-25",7.86],["08-26",8.07],["08-27",8.25],["08-31",7.73],["09-01",7.69],["09-02",7.74],["09-03",8.8],["09-06",9.15],["09-07",9.45],["09-08",8.88],["09-09",9.33],["09-10",8.75],["09-13",8.78],["09-14",8.95],["09-15",8.88],["09-16",9.16],["09-17",8.98],["09-20",8.68],["09-21",8.71],["09-22",9.1],["09-23",8.89],["09-24",8.91],["09-27",8.48],["09-28",8.26],["09-29",8.44],["09-30",8.19],["10-01",8.23],["10-04",8.13],["10-05",7.97],["10-06",8.22],["10-07",8.47],["10-08",8.9],["10-11",9.1],["10-12",9.44],["10-13",9.37],["10-14",9.8],["10-15",9.73],["10-18",9.58],["10-19",10.24],["10-20",9.91],["10-21",10.46],["10-22",10.26],["10-25",10.07],["10-26",9.95],["10-27",9.9],["10-28",9.76],["10-29",9.87],["11-01",10.18],["11-02",10.35],["11-03",10.45],["11-04",10.58],["11-05",10.58],["11-08",10.22],["11-09",10.14],["11-10",10.18],["11-11",9.76],["11-12",9.37],["11-15",9.35],["11-16",9.48],["11-17",9.73],["11-18",9.59],["11-19",9.83],["11-22",9.63],["11-23",9.3],["11-24",9.01],["11-25",9.23],["11-26",9.22],["11-29",9.53],["11-30",9.54],["12-01",10.14],["12-02",10.13],["12-03",10.43],["12-06",10.37],["12-07",11.06],["12-08",10.78],["12-09",10.45],["12-10",10.44],["12-13",10.3],["12-14",10.82],["12-15",10.32],["12-16",10.5],["12-17",10.3],["12-20",10.38],["12-21",10.49],["12-22",10.71],["12-23",10.63],["12-24",10.75],["12-29",11.11],["12-30",11.05],["12-31",10.87]]},"1983":{"Gold":[["01-04",452.75],["01-05",454.75],["01-06",458.0],["01-07",454.0],["01-10",474.0],["01-11",490.5],["01-12",483.0],["01-13",491.0],["01-14",483.75],["01-17",494.5],["01-18",487.0],["01-19",497.75],["01-20",487.5],["01-21",490.25],["01-24",475.75],["01-25",485.0],["01-26",488.25],["01-27",493.5],["01-28",492.5],["01-31",503.0],["02-01",508.5],["02-02",498.25],["02-03",506.0],["02-04",501.0],["02-07",489.0],["02-08",496.5],["02-09",492.25],["02-10",494.75],["02-11",506.0],["02-14",500.5],["02-15",511.5],["02-16",506.75],["02-17",506.0],["02-18",502.25],["02-21",503.75],["02-22",503.25],["02-23",479.25],["02-24",473.75],["02-25",470.75],["02-28",419.75],["03-01",414.5],["03-02",431.0],["03-03",431.75],["03-04",415.5],["03-07",421.25],["03-08",422.25],["03-09",424.25],["03-10",433.0],["03-11",424.0],["03-14",431.75],["03-15",436.5],["03-16",424.0],["03-17",416.75],["03-18",419.75],["03-21",414.5],["03-22",420.75],["03-23",413.0],["03-24",415.0],["03-25",411.25],["03-28",412.0],["03-29",412.0],["03-30",417.25],["03-31",414.25],["04-05",425.75],["04-06",428.5],["04-07",426.5],["04-08",423.0],["04-11",427.75],["04-12",433.25],["04-13",428.75],["04-14",436.25],["04-15",435.75],["04-18",443.0],["04-19",441.5],["04-20",434.0],["04-21",440.5],["04-22",436.25],["04-25",442.25],["04-26",435.25],["04-27",436.5],["04-28",427.0],["04-29",428.5],["05-03",431.0],["05-04",434.5],["05-05",435.0],["05-06",431.5],["05-09",435.0],["05-10",439.25],["05-11",443.25],["05-12",438.25],["05-13",438.0],["05-16",438.5],["05-17",437.5],["05-18",442.15],["05-19",440.0],["05-20",439.0],["05-23",433.0],["05-24",437.25],["05-25",437.6],["05-26",441.25],["05-27",436.85],["05-31",439.0],["06-01",416.25],["06-02",411.5],["06-03",413.25],["06-06",408.75],["06-07",403.15],["06-08",402.25],["06-09",405.75],["06-10",413.25],["06-13",412.0],["06-14",412.35],["06-15",407.5],["06-16",410.75],["06-17",416.5],["06-20",411.25],["06-21",415.25],["06-22",421.25],["06-23",418.5],["06-24",420.75],["06-27",423.25],["06-28",413.75],["06-29",415.25],["06-30",416.75],["07-01",416.75],["07-04",416.0],["07-05",413.75],["07-06",412.25],["07-07",414.25],["07-08",422.75],["07-11",426.15],["07-12",430.5],["07-13",426.5],["07-14",424.4],["07-15",421.75],["07-18",423.25],["07-19",424.25],["07-20",426.0],["07-21",429.25],["07-22",424.25],["07-25",423.25],["07-26",426.25],["07-27",425.75],["07-28",426.0],["07-29",422.25],["08-01",413.25],["08-02",413.75],["08-03",412.75],["08-04",413.25],["08-05",409.0],["08-08",410.5],["08-09",412.0],["08-10",408.0],["08-11",411.15],["08-12",411.6],["08-15",415.3],["08-16",419.75],["08-17",420.25],["08-18",421.0],["08-19",419.1],["08-22",421.25],["08-23",425.75],["08-24",423.75],["08-25",422.5],["08-26",419.25],["08-30",418.85],["08-31",414.5],["09-01",415.8],["09-02",418.3],["09-05",420.0],["09-06",418.25],["09-07",413.0],["09-08",414.5],["09-09",414.5],["09-12",416.9],["09-13",406.75],["09-14",406.15],["09-15",403.75],["09-16",405.25],["09-19",410.25],["09-20",413.0],["09-21",412.0],["09-22",410.5],["09-23",413.25],["09-26",416.25],["09-27",413.5],["09-28",414.0],["09-29",409.5],["09-30",404.0],["10-03",393.5],["10-04",392.75],["10-05",388.75],["10-06",397.25],["10-07",395.7],["10-10",399.25],["10-11",400.5],["10-12",395.75],["10-13",397.5],["10-14",400.75],["10-17",400.5],["10-18",396.75],["10-19",393.6],["10-20",390.0],["10-21",393.6],["10-24",396.25],["10-25",396.25],["10-26",395.25],["10-27",384.5],["10-28",387.25],["10-31",383.5],["11-01",376.0],["11-02",381.5],["11-03",381.75],["11-04",382.5],["11-07",377.0],["11-08",382.15],["11-09",380.5],["11-10",382.0],["11-11",381.15],["11-14",382.6],["11-15",383.25],["11-16",383.0],["11-17",376.5],["11-18",376.25],["11-21",374.75],["11-22",375.8],["11-23",375.75],["11-24",375.75],["11-25",375.9],["11-28",381.25],["11-29",391.25],["11-30",405.75],["12-01",398.5],["12-02",403.5],["12-05",402.4],["12-06",398.0],["12-07",399.75],["12-08",402.0],["12-09",388.5],["12-12",390.9],["12-13",389.75],["12-14",390.0],["12-15",388.6],["12-16",381.0],["12-19",376.65],["12-20",375.4],["12-21",378.25],["12-22",378.9],["12-23",379.5],["12-28",379.1],["12-29",379.0],["12-30",381.5]],"Silver":[["01-04",11.06],["01-05",11.1],["01-06",11.29],["01-07",11.23],["01-10",12.02],["01-11",12.22],["01-12",12.1],["01-13",12.44],["01-14",12.3],["01-17",12.97],["01-18",12.69],["01-19",13.11],["01-20",12.8],["01-21",12.83],["01-24",12.2],["01-25",12.77],["01-26",12.99],["01-27",13.17],["01-28",13.35],["01-31",13.82],["02-01",14.3],["02-02",13.71],["02-03",14.36],["02-04",14.15],["02-05",7.54],["02-07",13.69],["02-08",14.1],["02-09",13.83],["02-10",13.9],["02-11",14.26],["02-14",14.17],["02-15",14.67],["02-16",14.6],["02-17",14.66],["02-18",14.45],["02-21",14.46],["02-22",14.41],["02-23",13.3],["02-24",13.54],["02-25",13.26],["02-28",11.7],["03-01",10.68],["03-02",11.0],["03-03",10.94],["03-04",10.6],["03-07",10.48],["03-08",10.6],["03-09",10.6],["03-10",10.98],["03-11",10.87],["03-14",10.94],["03-15",11.25],["03-16",10.83],["03-17",10.64],["03-18",10.62],["03-21",10.24],["03-22",10.6],["03-23",10.23],["03-24",10.57],["03-25",10.39],["03-28",10.31],["03-29",10.38],["03-30",10.65],["03-31",10.5],["04-05",10.97],["04-06",11.18],["04-07",11.14],["04-08",11.02],["04-11",11.11],["04-12",11.35],["04-13",11.22],["04-14",11.64],["04-15",11.75],["04-18",12.29],["04-19",12.26],["04-20",11.91],["04-21",12.42],["04-22",12.02],["04-25",12.27],["04-26",12.2],["04-27",12.31],["04-28",11.8],["04-29",11.96],["05-03",12.12],["05-04",12.35],["05-05",12.44],["05-06",12.4],["05-09",12.61],["05-10",12.88],["05-11",13.16],["05-12",12.9],["05-13",12.9],["05-16",12.97],["05-17",12.96],["05-18",13.36],["05-19",13.41],["05-20",13.29],["05-23",12.73],["05-24",13.24],["05-25",13.28],["05-26",13.35],["05-27",13.22],["05-31",13.54],["06-01",12.74],["06-02",12.25],["06-03",12.2],["06-06",11.72],["06-07",11.09],["06-08",11.1],["06-09",11.25],["06-10",11.73],["06-13",11.73],["06-14",11.71],["06-15",11.4],["06-16",11.55],["06-17",11.72],["06-20",11.56],["06-21",11.74],["06-22",12.16],["06-23",12.1],["06-24",12.3],["06-27",12.26],["06-28",11.59],["06-29",11.63],["06-30",11.6],["07-01",11.56],["07-04",11.64],["07-05",11.48],["07-06",11.42],["07-07",11.61],["07-08",12.03],["07-11",12.08],["07-12",12.38],["07-13",12.15],["07-14",12.19],["07-15",11.97],["07-18",11.95],["07-19",12.13],["07-20",12.26],["07-21",12.55],["07-22",12.28],["07-25",12.11],["07-26",12.43],["07-27",12.36],["07-28",12.35],["07-29",12.14],["08-01",11.8],["08-02",11.87],["08-03",11.85],["08-04",11.93],["08-05",11.59],["08-08",11.57],["08-09",11.62],["08-10",11.48],["08-11",11.63],["08-12",11.72],["08-15",12.01],["08-16",12.42],["08-17",12.48],["08-18",12.45],["08-19",12.22],["08-22",12.38],["08-23",12.77],["08-24",12.53],["08-25",12.51],["08-26",12.21],["08-30",12.27],["08-31",11.99],["09-01",12.16],["09-02",12.19],["09-05",12.34],["09-06",12.38],["09-07",12.15],["09-08",12.18],["09-09",12.24],["09-12",12.27],["09-13",11.85],["09-14",11.74],["09-15",11.63],["09-16",11.68],["09-19",11.94],["09-20",11.88],["09-21",11.88],["09-22",11.79],["09-23",11.94],["09-26",12.07],["09-27",11.88],["09-28",11.9],["09-29",11.71],["09-30",11.24],["10-03",10.4],["10-04",10.42],["10-05",9.74],["10-06",10.35],["10-07",10.32],["10-10",10.43],["10-11",10.56],["10-12",10.2],["10-13",10.25],["10-14",10.43],["10-17",10.4],["10-18",10.12],["10-19",9.9],["10-20",9.51],["10-21",9.53],["10-24",9.62],["10-25",9.58],["10-26",9.48],["10-27",8.59],["10-28",9.0],["10-31",8.74],["11-01",8.37],["11-02",8.76],["11-03",8.7],["11-04",8.9],["11-07",8.82],["11-08",9.03],["11-09",8.95],["11-10",9.01],["11-11",8.91],["11-14",8.96],["11-15",9.06],["11-16",9.04],["11-17",8.59],["11-18",8.61],["11-21",8.39],["11-22",8.61],["11-23",8.55],["11-24",8.47],["11-25",8.55],["11-28",8.71],["11-29",9.02],["11-30",9.81],["12-01",9.58],["12-02",9.73],["12-05",9.67],["12-06",9.5],["12-07",9.57],["12-08",9.81],["12-09",9.25],["12-12",9.47],["12-13",9.38],["12-14",9.33],["12-15",9.28],["12-16",8.85],["12-19",8.64],["12-20",8.64],["12-21",8.79],["12-22",8.74],["12-23",8.84],["12-28",8.79],["12-29",8.8],["12-30",8.91]]},"1984":{"Gold":[["01-03",384.0],["01-04",376.5],["01-05",376.5],["01-06",374.4],["01-09",364.25],["01-10",367.5],["01-11",369.0],["01-12",371.25],["01-13",370.0],["01-16",370.25],["01-17",368.75],["01-18",368.25],["01-19",373.0],["01-20",372.75],["01-23",371.25],["01-24",365.2],["01-25",366.38],["01-26",368.4],["01-27",366.65],["01-30",369.25],["01-31",371.9],["02-01",377.25],["02-02",382.75],["02-03",386.25],["02-06",380.4],["02-07",379.25],["02-08",384.95],["02-09",383.8],["02-10",380.9],["02-13",377.5],["02-14",374.95],["02-15",382.5],["02-16",383.1],["02-17",382.0],["02-20",384.5],["02-21",388.25],["02-22",392.0],["02-23",399.75],["02-24",396.1],["02-27",394.0],["02-28",400.0],["02-29",396.6],["03-01",395.25],["03-02",396.8],["03-05",406.85],["03-06",403.5],["03-07",402.0],["03-08",396.35],["03-09",402.0],["03-12",397.5],["03-13",397.5],["03-14",400.0],["03-15",394.15],["03-16",392.8],["03-19",392.15],["03-20",393.7],["03-21",392.0],["03-22",391.6],["03-23",388.0],["03-26",388.5],["03-27",389.1],["03-28",385.75],["03-29",390.35],["03-30",388.5],["04-02",387.25],["04-03",381.15],["04-04",380.5],["04-05",381.6],["04-06",378.75],["04-09",381.5],["04-10",381.9],["04-11",382.8],["04-12",382.1],["04-13",380.2],["04-16",380.0],["04-17",380.3],["04-18",380.85],["04-19",385.0],["04-24",384.6],["04-25",382.25],["04-26",381.6],["04-27",377.5],["04-30",376.2],["05-01",376.4],["05-02",377.35],["05-03",378.3],["05-04",378.3],["05-08",371.5],["05-09",372.65],["05-10",370.1],["05-11",373.0],["05-14",371.2],["05-15",373.35],["05-16",374.8],["05-17",376.65],["05-18",375.0],["05-21",380.35],["05-22",379.15],["05-23",378.5],["05-24",375.3],["05-25",380.5],["05-29",385.5],["05-30",384.75],["05-31",383.45],["06-01",389.4],["06-04",394.5],["06-05",394.0],["06-06",393.4],["06-07",392.0],["06-08",387.1],["06-11",383.6],["06-12",375.25],["06-13",374.5],["06-14",376.0],["06-15",373.9],["06-18",369.4],["06-19",370.2],["06-20",371.85],["06-21",370.0],["06-22",373.0],["06-25",370.45],["06-26",369.0],["06-27",370.3],["06-28",371.5],["06-29",375.25],["07-02",370.45],["07-03",369.75],["07-04",370.55],["07-05",366.0],["07-06",358.0],["07-09",332.5],["07-10",346.0],["07-11",335.75],["07-12",339.5],["07-13",341.6],["07-16",352.25],["07-17",347.5],["07-18",346.25],["07-19",352.35],["07-20",346.5],["07-23",335.25],["07-24",337.75],["07-25",337.5],["07-26",345.0],["07-27",336.15],["07-30",339.15],["07-31",341.6],["08-01",337.35],["08-02",343.15],["08-03",347.5],["08-06",352.4],["08-07",346.25],["08-08",343.9],["08-09",344.25],["08-10",350.5],["08-13",343.0],["08-14",348.8],["08-15",353.9],["08-16",350.65],["08-17",351.25],["08-20",349.7],["08-21",345.4],["08-22",345.4],["08-23",351.75],["08-24",350.35],["08-28",348.15],["08-29",348.8],["08-30",348.75],["08-31",347.7],["09-03",346.2],["09-04",341.75],["09-05",338.5],["09-06",340.3],["09-07",339.5],["09-10",337.2],["09-11",338.65],["09-12",339.5],["09-13",337.5],["09-14",339.4],["09-17",338.0],["09-18",336.5],["09-19",339.9],["09-20",340.0],["09-21",339.75],["09-24",347.25],["09-25",345.1],["09-26",345.75],["09-27",344.0],["09-28",344.15],["10-01",344.75],["10-02",344.85],["10-03",347.6],["10-04",346.0],["10-05",346.55],["10-08",342.75],["10-09",341.25],["10-10",337.75],["10-11",338.1],["10-12",337.9],["10-15",338.25],["10-16",339.75],["10-17",340.0],["10-18",338.25],["10-19",339.6],["10-22",338.0],["10-23",339.4],["10-24",340.25],["10-25",339.9],["10-26",338.15],["10-29",335.8],["10-30",335.65],["10-31",334.5],["11-01",333.85],["11-02",339.0],["11-05",342.3],["11-06",345.95],["11-07",345.8],["11-08",348.1],["11-09",345.85],["11-12",345.8],["11-13",350.0],["11-14",346.0],["11-15",345.35],["11-16",345.05],["11-19",343.0],["11-20",342.65],["11-21",342.75],["11-22",342.55],["11-23",342.0],["11-26",339.5],["11-27",333.35],["11-28",329.1],["11-29",331.75],["11-30",328.6],["12-03",327.7],["12-04",330.9],["12-05",330.55],["12-06",330.7],["12-07",330.0],["12-10",326.25],["12-11",326.65],["12-12",327.6],["12-13",326.4],["12-14",321.75],["12-17",316.85],["12-18",308.25],["12-19",308.75],["12-20",303.25],["12-21",308.85],["12-27",310.25],["12-28",309.5],["12-31",309.0]],"Silver":[["01-03",8.96],["01-04",8.48],["01-05",8.44],["01-06",8.41],["01-09",7.9],["01-10",8.11],["01-11",8.02],["01-12",7.97],["01-13",8.09],["01-16",8.06],["01-17",8.02],["01-18",8.01],["01-19",8.24],["01-20",8.29],["01-23",8.26],["01-24",7.98],["01-25",8.08],["01-26",8.13],["01-27",8.12],["01-30",8.29],["01-31",8.43],["02-01",8.7],["02-02",8.83],["02-03",8.87],["02-06",8.73],["02-07",8.63],["02-08",9.03],["02-09",9.05],["02-10",8.73],["02-13",8.7],["02-14",8.64],["02-15",9.01],["02-16",9.15],["02-17",9.04],["02-20",9.13],["02-21",9.26],["02-22",9.42],["02-23",9.75],["02-24",9.62],["02-27",9.53],["02-28",9.87],["02-29",9.64],["03-01",9.62],["03-02",9.67],["03-05",10.11],["03-06",10.04],["03-07",9.93],["03-08",9.66],["03-09",9.87],["03-12",9.69],["03-13",9.75],["03-14",9.87],["03-15",9.42],["03-16",9.43],["03-19",9.46],["03-20",9.53],["03-21",9.55],["03-22",9.53],["03-23",9.39],["03-26",9.39],["03-27",9.5],["03-28",9.42],["03-29",9.8],["03-30",9.65],["04-02",9.74],["04-03",9.36],["04-04",9.36],["04-05",9.37],["04-06",9.11],["04-09",9.19],["04-10",9.16],["04-11",9.29],["04-12",9.24],["04-13",9.13],["04-16",9.14],["04-17",9.18],["04-18",9.21],["04-19",9.32],["04-24",9.35],["04-25",9.24],["04-26",9.22],["04-27",9.09],["04-30",8.96],["05-01",8.93],["05-02",8.96],["05-03",9.05],["05-04",9.05],["05-08",8.59],["05-09",8.65],["05-10",8.61],["05-11",8.75],["05-14",8.83],["05-15",8.84],["05-16",8.94],["05-17",9.06],["05-18",8.89],["05-21",9.15],["05-22",9.09],["05-23",9.11],["05-24",8.92],["05-25",9.16],["05-29",9.2],["05-30",9.16],["05-31",9.12],["06-01",9.36],["06-04",9.38],["06-05",9.35],["06-06",9.3],["06-07",9.22],["06-08",9.12],["06-11",9.01],["06-12",8.67],["06-13",8.71],["06-14",8.7],["06-15",8.65],["06-18",8.44],["06-19",8.56],["06-20",8.57],["06-21",8.48],["06-22",8.65],["06-25",8.52],["06-26",8.37],["06-27",8.36],["06-28",8.36],["06-29",8.39],["07-02",8.29],["07-03",8.21],["07-04",8.16],["07-05",7.81],["07-06",7.6],["07-09",7.24],["07-10",7.54],["07-11",7.2],["07-12",7.26],["07-13",7.38],["07-16",7.59],["07-17",7.46],["07-18",7.43],["07-19",7.57],["07-20",7.39],["07-23",7.2],["07-24",7.15],["07-25",7.2],["07-26",7.24],["07-27",6.99],["07-30",6.92],["07-31",7.11],["08-01",7.01],["08-02",7.34],["08-03",7.54],["08-06",7.7],["08-07",7.36],["08-08",7.54],["08-09",7.48],["08-10",7.88],["08-13",7.59],["08-14",7.87],["08-15",7.92],["08-16",7.89],["08-17",7.85],["08-20",7.79],["08-21",7.48],["08-22",7.5],["08-23",7.65],["08-24",7.59],["08-28",7.61],["08-29",7.61],["08-30",7.57],["08-31",7.45],["09-03",7.32],["09-04",7.21],["09-05",7.11],["09-06",7.18],["09-07",7.16],["09-10",7.16],["09-11",7.19],["09-12",7.19],["09-13",7.08],["09-14",7.18],["09-17",7.1],["09-18",6.98],["09-19",7.12],["09-20",7.12],["09-21",7.14],["09-24",7.65],["09-25",7.53],["09-26",7.58],["09-27",7.44],["09-28",7.43],["10-01",7.45],["10-02",7.51],["10-03",7.61],["10-04",7.58],["10-05",7.57],["10-08",7.28],["10-09",7.24],["10-10",7.11],["10-11",7.12],["10-12",7.13],["10-15",7.21],["10-16",7.27],["10-17",7.28],["10-18",7.16],["10-19",7.21],["10-22",7.18],["10-23",7.25],["10-24",7.33],["10-25",7.3],["10-26",7.26],["10-29",7.21],["10-30",7.2],["10-31",7.2],["11-01",7.18],["11-02",7.42],["11-05",7.5],["11-06",7.57],["11-07",7.85],["11-08",7.69],["11-09",7.62],["11-12",7.67],["11-13",7.83],["11-14",7.66],["11-15",7.59],["11-16",7.61],["11-19",7.53],["11-20",7.48],["11-21",7.51],["11-22",7.58],["11-23",7.52],["11-26",7.45],["11-27",7.38],["11-28",7.13],["11-29",7.12],["11-30",7.05],["12-03",7.0],["12-04",7.07],["12-05",7.1],["12-06",7.08],["12-07",6.99],["12-10",6.85],["12-11",6.83],["12-12",6.79],["12-13",6.82],["12-14",6.67],["12-17",6.57],["12-18",6.32],["12-19",6.39],["12-20",6.22],["12-21",6.41],["12-27",6.28],["12-28",6.38],["12-31",6.29]]},"1985":{"Gold":[["01-02",306.25],["01-03",299.5],["01-04",303.45],["01-07",296.75],["01-08",304.4],["01-09",298.35],["01-10",304.0],["01-11",304.0],["01-14",301.25],["01-15",302.5],["01-16",302.45],["01-17",305.8],["01-18",306.9],["01-21",307.0],["01-22",306.85],["01-23",302.15],["01-24",301.9],["01-25",299.25],["01-28",298.6],["01-29",303.5],["01-30",303.0],["01-31",304.9],["02-01",304.8],["02-04",301.25],["02-05",301.75],["02-06",303.45],["02-07",302.5],["02-08",300.6],["02-11",300.0],["02-12",303.45],["02-13",302.8],["02-14",303.4],["02-15",304.9],["02-18",314.95],["02-19",302.9],["02-20",302.85],["02-21",302.0],["02-22",298.8],["02-25",290.0],["02-26",285.0],["02-27",290.75],["02-28",290.5],["03-01",288.1],["03-04",288.3],["03-05",288.85],["03-06",286.7],["03-07",289.3],["03-08",289.0],["03-11",290.25],["03-12",288.75],["03-13",290.1],["03-14",290.25],["03-15",289.9],["03-18",293.7],["03-19",307.25],["03-20",333.25],["03-21",312.5],["03-22",320.75],["03-25",315.9],["03-26",316.0],["03-27",329.9],["03-28",328.75],["03-29",329.8],["04-01",324.65],["04-02",317.0],["04-03",321.1],["04-04",317.0],["04-09",323.1],["04-10",323.3],["04-11",329.0],["04-12",331.25],["04-15",330.3],["04-16",331.5],["04-17",327.0],["04-18",325.5],["04-19",327.7],["04-22",328.1],["04-23",326.0],["04-24",322.6],["04-25",322.4],["04-26",322.5],["04-29",323.0],["04-30",324.65],["05-01",315.6],["05-02",314.25],["05-03",313.7],["05-07",311.25],["05-08",313.35],["05-09",314.5],["05-10",313.55],["05-13",316.75],["05-14",324.75],["05-15",322.85],["05-16",320.4],["05-17",319.8],["05-20",323.65],["05-21",316.5],["05-22",317.4],["05-23",316.4],["05-24",316.35],["05-28",313.9],["05-29",311.2],["05-30",315.0],["05-31",313.15],["06-03",316.85],["06-04",316.25],["06-05",314.75],["06-06",314.9],["06-07",315.0],["06-10",310.75],["06-11",313.25],["06-12",313.75],["06-13",314.1],["06-14",315.75],["06-17",317.25],["06-18",321.65],["06-19",325.2],["06-20",322.0],["06-21",315.25],["06-24",314.1],["06-25",315.9],["06-26",316.5],["06-27",316.25],["06-28",316.5],["07-01",315.35],["07-02",310.85],["07-03",310.4],["07-04",310.7],["07-05",310.9],["07-08",312.2],["07-09",314.8],["07-10",314.7],["07-11",313.8],["07-12",315.05],["07-15",317.15],["07-16",316.8],["07-17",321.7],["07-18",322.25],["07-19",319.0],["07-22",317.4],["07-23",322.75],["07-24",318.5],["07-25",319.4],["07-26",317.6],["07-29",323.0],["07-30",323.25],["07-31",328.1],["08-01",326.75],["08-02",319.65],["08-05",323.0],["08-06",321.4],["08-07",320.65],["08-08",322.9],["08-09",322.4],["08-12",326.6],["08-13",328.5],["08-14",326.2],["08-15",328.9],["08-16",335.4],["08-19",339.25],["08-20",335.5],["08-21",335.75],["08-22",337.6],["08-23",333.6],["08-27",335.25],["08-28",339.3],["08-29",338.4],["08-30",335.75],["09-02",335.45],["09-03",332.7],["09-04",325.0],["09-05",326.0],["09-06",318.75],["09-09",320.2],["09-10",320.0],["09-11",322.0],["09-12",318.0],["09-13",321.75],["09-16",318.85],["09-17",318.7],["09-18",315.5],["09-19",315.9],["09-20",319.2],["09-23",328.1],["09-24",328.4],["09-25",328.7],["09-26",330.4],["09-27",328.95],["09-30",326.5],["10-01",323.15],["10-02",324.75],["10-03",324.35],["10-04",330.55],["10-07",326.25],["10-08",326.1],["10-09",326.95],["10-10",325.55],["10-11",325.8],["10-14",326.6],["10-15",326.85],["10-16",325.9],["10-17",324.6],["10-18",326.25],["10-21",326.5],["10-22",325.9],["10-23",326.9],["10-24",325.95],["10-25",325.65],["10-28",326.5],["10-29",326.55],["10-30",326.8],["10-31",325.75],["11-01",324.65],["11-04",325.6],["11-05",324.55],["11-06",324.75],["11-07",323.6],["11-08",322.1],["11-11",323.25],["11-12",322.7],["11-13",324.5],["11-14",325.0],["11-15",324.55],["11-18",323.75],["11-19",324.1],["11-20",325.05],["11-21",325.75],["11-22",326.0],["11-25",330.5],["11-26",331.5],["11-27",330.45],["11-28",326.75],["11-29",327.4],["12-02",323.95],["12-03",322.5],["12-04",324.5],["12-05",322.5],["12-06",322.5],["12-09",320.15],["12-10",316.1],["12-11",316.8],["12-12",316.05],["12-13",317.9],["12-16",318.25],["12-17",321.9],["12-18",321.1],["12-19",323.4],["12-20",323.55],["12-23",325.75],["12-24",324.85],["12-27",324.8],["12-30",326.15],["12-31",327.0]],"Silver":[["01-02",6.25],["01-03",6.02],["01-04",6.09],["01-07",5.83],["01-08",6.08],["01-09",5.88],["01-10",6.09],["01-11",6.11],["01-14",6.0],["01-15",5.99],["01-16",6.01],["01-17",6.18],["01-18",6.26],["01-21",6.21],["01-22",6.25],["01-23",6.04],["01-24",5.99],["01-25",5.95],["01-28",5.95],["01-29",6.24],["01-30",6.17],["01-31",6.33],["02-01",6.29],["02-04",6.14],["02-05",6.14],["02-06",6.2],["02-07",6.15],["02-08",6.13],["02-11",6.08],["02-12",6.22],["02-13",6.21],["02-14",6.3],["02-15",6.32],["02-18",6.27],["02-19",6.22],["02-20",6.23],["02-21",6.17],["02-22",6.0],["02-25",5.45],["02-26",5.58],["02-27",5.77],["02-28",5.71],["03-01",5.61],["03-04",5.64],["03-05",5.66],["03-06",5.62],["03-07",5.68],["03-08",5.67],["03-11",5.64],["03-12",5.52],["03-13",5.57],["03-14",5.66],["03-15",5.63],["03-18",5.71],["03-19",6.04],["03-20",6.46],["03-21",6.11],["03-22",6.39],["03-25",6.3],["03-26",6.26],["03-27",6.59],["03-28",6.57],["03-29",6.66],["04-01",6.52],["04-02",6.42],["04-03",6.5],["04-04",6.39],["04-09",6.63],["04-10",6.63],["04-11",6.68],["04-12",6.67],["04-15",6.75],["04-16",6.63],["04-17",6.45],["04-18",6.44],["04-19",6.4],["04-22",6.44],["04-23",6.36],["04-24",6.12],["04-25",6.18],["04-26",6.24],["04-29",6.24],["04-30",6.32],["05-01",6.15],["05-02",6.15],["05-03",6.16],["05-07",6.14],["05-08",6.25],["05-09",6.35],["05-10",6.29],["05-13",6.36],["05-14",6.54],["05-15",6.49],["05-16",6.49],["05-17",6.45],["05-20",6.56],["05-21",6.21],["05-22",6.2],["05-23",6.16],["05-24",6.15],["05-28",6.1],["05-29",6.0],["05-30",6.16],["05-31",6.08],["06-03",6.21],["06-04",6.11],["06-05",6.06],["06-06",6.12],["06-07",6.1],["06-10",6.08],["06-11",6.14],["06-12",6.14],["06-13",6.16],["06-14",6.24],["06-17",6.21],["06-18",6.3],["06-19",6.42],["06-20",6.29],["06-21",6.11],["06-24",6.11],["06-25",6.15],["06-26",6.12],["06-27",6.13],["06-28",6.11],["07-01",6.09],["07-02",5.94],["07-03",5.89],["07-04",5.92],["07-05",5.91],["07-08",5.93],["07-09",6.05],["07-10",6.04],["07-11",5.99],["07-12",6.04],["07-15",6.08],["07-16",6.1],["07-17",6.25],["07-18",6.21],["07-19",6.12],["07-22",6.12],["07-23",6.16],["07-24",6.09],["07-25",6.1],["07-26",6.08],["07-29",6.23],["07-30",6.25],["07-31",6.33],["08-01",6.25],["08-02",6.13],["08-05",6.18],["08-06",6.14],["08-07",6.11],["08-08",6.15],["08-09",6.12],["08-12",6.27],["08-13",6.33],["08-14",6.26],["08-15",6.3],["08-16",6.35],["08-19",6.39],["08-20",6.26],["08-21",6.25],["08-22",6.3],["08-23",6.21],["08-27",6.3],["08-28",6.4],["08-29",6.3],["08-30",6.25],["09-02",6.22],["09-03",6.19],["09-04",6.1],["09-05",6.08],["09-06",6.0],["09-09",6.06],["09-10",6.03],["09-11",6.04],["09-12",5.97],["09-13",6.05],["09-16",6.0],["09-17",6.01],["09-18",5.89],["09-19",5.93],["09-20",6.0],["09-23",6.17],["09-24",6.17],["09-25",6.14],["09-26",6.16],["09-27",6.06],["09-30",6.05],["10-01",6.0],["10-02",6.04],["10-03",6.09],["10-04",6.36],["10-07",6.25],["10-08",6.26],["10-09",6.28],["10-10",6.23],["10-11",6.22],["10-14",6.22],["10-15",6.26],["10-16",6.22],["10-17",6.13],["10-18",6.16],["10-21",6.16],["10-22",6.13],["10-23",6.21],["10-24",6.17],["10-25",6.16],["10-28",6.16],["10-29",6.17],["10-30",6.13],["10-31",6.14],["11-01",6.07],["11-04",6.08],["11-05",6.07],["11-06",6.08],["11-07",6.06],["11-08",6.04],["11-11",6.08],["11-12",6.08],["11-13",6.12],["11-14",6.15],["11-15",6.12],["11-18",6.09],["11-19",6.09],["11-20",6.17],["11-21",6.17],["11-22",6.15],["11-25",6.25],["11-26",6.25],["11-27",6.21],["11-28",6.13],["11-29",6.15],["12-02",6.1],["12-03",6.08],["12-04",6.08],["12-05",6.06],["12-06",6.06],["12-09",5.99],["12-10",5.81],["12-11",5.79],["12-12",5.78],["12-13",5.87],["12-16",5.84],["12-17",5.9],["12-18",5.76],["12-19",5.82],["12-20",5.83],["12-23",5.86],["12-24",5.78],["12-27",5.78],["12-30",5.87],["12-31",5.8]]},"1986":{"Gold":[["01-02",327.1],["01-03",326.0],["01-06",327.8],["01-07",328.9],["01-08",330.9],["01-09",333.9],["01-10",339.45],["01-13",340.75],["01-14",338.8],["01-15",345.3],["01-16",359.6],["01-17",357.25],["01-20",353.25],["01-21",356.5],["01-22",352.75],["01-23",349.5],["01-24",355.25],["01-27",361.75],["01-28",353.8],["01-29",354.4],["01-30",355.4],["01-31",354.0],["02-03",347.35],["02-04",338.5],["02-05",335.95],["02-06",337.1],["02-07",337.9],["02-10",340.5],["02-11",337.2],["02-12",338.35],["02-13",335.4],["02-14",329.5],["02-17",333.0],["02-18",332.4],["02-19",343.7],["02-20",339.25],["02-21",339.0],["02-24",343.35],["02-25",351.4],["02-26",345.1],["02-27",337.85],["02-28",338.25],["03-03",339.45],["03-04",337.9],["03-05",342.2],["03-06",343.0],["03-07",342.0],["03-10",341.8],["03-11",341.65],["03-12",344.5],["03-13",349.8],["03-14",347.6],["03-17",348.2],["03-18",350.8],["03-19",349.25],["03-20",350.6],["03-21",351.35],["03-24",352.4],["03-25",352.9],["03-26",344.9],["03-27",345.5],["04-01",333.7],["04-02",335.5],["04-03",336.6],["04-04",335.6],["04-07",336.5],["04-08",340.65],["04-09",338.65],["04-10",338.15],["04-11",340.25],["04-14",343.2],["04-15",340.25],["04-16",340.75],["04-17",339.3],["04-18",341.0],["04-21",342.45],["04-22",344.15],["04-23",347.25],["04-24",346.0],["04-25",344.3],["04-28",344.4],["04-29",342.35],["04-30",344.75],["05-01",345.6],["05-02",341.6],["05-06",341.55],["05-07",342.15],["05-08",344.6],["05-09",344.25],["05-12",344.9],["05-13",343.8],["05-14",342.75],["05-15",342.5],["05-16",342.75],["05-19",342.05],["05-20",340.3],["05-21",338.6],["05-22",339.4],["05-23",340.85],["05-27",341.15],["05-28",341.6],["05-29",342.75],["05-30",343.35],["06-02",343.0],["06-03",341.85],["06-04",341.4],["06-05",341.5],["06-06",341.5],["06-09",341.85],["06-10",347.55],["06-11",347.5],["06-12",347.95],["06-13",347.4],["06-16",346.5],["06-17",337.3],["06-18",338.5],["06-19",338.7],["06-20",338.9],["06-23",340.5],["06-24",340.75],["06-25",343.25],["06-26",343.8],["06-27",343.55],["06-30",345.5],["07-01",345.65],["07-02",344.0],["07-03",343.5],["07-04",343.8],["07-07",344.45],["07-08",346.5],["07-09",350.35],["07-10",347.5],["07-11",347.65],["07-14",346.2],["07-15",345.85],["07-16",348.35],["07-17",346.9],["07-18",347.1],["07-21",353.0],["07-22",353.5],["07-23",351.75],["07-24",348.5],["07-25",349.0],["07-28",350.8],["07-29",353.3],["07-30",351.35],["07-31",357.75],["08-01",360.5],["08-04",358.75],["08-05",358.5],["08-06",360.85],["08-07",360.85],["08-08",361.85],["08-11",394.5],["08-12",386.1],["08-13",391.25],["08-14",384.0],["08-15",386.4],["08-18",377.25],["08-19",372.5],["08-20",379.0],["08-21",381.75],["08-22",384.65],["08-26",379.3],["08-27",377.8],["08-28",384.0],["08-29",386.0],["09-01",392.0],["09-02",395.5],["09-03",407.2],["09-04",404.0],["09-05",418.25],["09-08",419.0],["09-09",412.5],["09-10",414.5],["09-11",407.0],["09-12",418.75],["09-15",416.0],["09-16",413.55],["09-17",413.6],["09-18",415.7],["09-19",423.0],["09-22",442.75],["09-23",435.15],["09-24",434.0],["09-25",432.25],["09-26",434.0],["09-29",429.45],["09-30",421.2],["10-01",425.5],["10-02",425.5],["10-03",436.9],["10-06",436.5],["10-07",442.0],["10-08",439.4],["10-09",435.8],["10-10",428.15],["10-13",431.4],["10-14",431.25],["10-15",426.25],["10-16",426.0],["10-17",420.0],["10-20",420.0],["10-21",426.8],["10-22",426.6],["10-23",425.4],["10-24",413.0],["10-27",409.6],["10-28",409.55],["10-29",407.75],["10-30",404.0],["10-31",401.5],["11-03",400.3],["11-04",408.5],["11-05",410.25],["11-06",405.0],["11-07",408.3],["11-10",409.9],["11-11",407.4],["11-12",407.45],["11-13",406.85],["11-14",409.0],["11-17",393.25],["11-18",388.0],["11-19",391.5],["11-20",387.0],["11-21",389.5],["11-24",380.4],["11-25",380.75],["11-26",384.0],["11-27",382.3],["11-28",390.0],["12-01",399.6],["12-02",394.3],["12-03",385.25],["12-04",391.2],["12-05",388.6],["12-08",390.5],["12-09",389.2],["12-10",387.25],["12-11",388.75],["12-12",389.7],["12-15",394.6],["12-16",393.7],["12-17",393.4],["12-18",392.5],["12-19",394.15],["12-22",395.35],["12-23",392.75],["12-24",391.0],["12-29",391.4],["12-30",389.4],["12-31",390.9]],"Silver":[["01-02",5.81],["01-03",5.75],["01-06",5.79],["01-07",5.84],["01-08",5.89],["01-09",5.91],["01-10",6.11],["01-13",6.06],["01-14",6.01],["01-15",6.1],["01-16",6.31],["01-17",6.19],["01-20",6.09],["01-21",6.19],["01-22",6.14],["01-23",6.11],["01-24",6.2],["01-27",6.25],["01-28",6.14],["01-29",6.15],["01-30",6.17],["01-31",6.1],["02-03",6.04],["02-04",5.86],["02-05",5.88],["02-06",5.9],["02-07",5.88],["02-10",5.93],["02-11",5.85],["02-12",5.9],["02-13",5.86],["02-14",5.79],["02-17",5.86],["02-18",5.87],["02-19",5.99],["02-20",5.9],["02-21",5.88],["02-24",5.91],["02-25",6.05],["02-26",5.89],["02-27",5.69],["02-28",5.67],["03-03",5.65],["03-04",5.57],["03-05",5.7],["03-06",5.58],["03-07",5.61],["03-10",5.55],["03-11",5.61],["03-12",5.67],["03-13",5.79],["03-14",5.71],["03-17",5.66],["03-18",5.75],["03-19",5.69],["03-20",5.71],["03-21",5.74],["03-24",5.7],["03-25",5.73],["03-26",5.57],["03-27",5.62],["04-01",5.18],["04-02",5.1],["04-03",5.17],["04-04",5.11],["04-07",5.24],["04-08",5.33],["04-09",5.33],["04-10",5.32],["04-11",5.41],["04-14",5.48],["04-15",5.37],["04-16",5.38],["04-17",5.4],["04-18",5.21],["04-21",5.16],["04-22",5.12],["04-23",5.12],["04-24",5.11],["04-25",5.07],["04-28",5.1],["04-29",5.03],["04-30",5.11],["05-01",5.11],["05-02",5.12],["05-06",5.14],["05-07",5.16],["05-08",5.23],["05-09",5.21],["05-12",5.22],["05-13",5.16],["05-14",5.08],["05-15",5.06],["05-16",5.06],["05-19",5.05],["05-20",4.85],["05-21",4.92],["05-22",4.93],["05-23",5.0],["05-27",5.09],["05-28",5.12],["05-29",5.09],["05-30",5.21],["06-02",5.21],["06-03",5.12],["06-04",5.1],["06-05",5.15],["06-06",5.14],["06-09",5.15],["06-10",5.29],["06-11",5.33],["06-12",5.42],["06-13",5.3],["06-16",5.26],["06-17",5.08],["06-18",5.09],["06-19",5.07],["06-20",5.1],["06-23",5.11],["06-24",5.06],["06-25",5.11],["06-26",5.08],["06-27",5.04],["06-30",5.04],["07-01",5.09],["07-02",5.11],["07-03",5.07],["07-04",5.05],["07-07",5.06],["07-08",5.1],["07-09",5.11],["07-10",5.06],["07-11",5.06],["07-14",5.04],["07-15",5.03],["07-16",5.08],["07-17",5.03],["07-18",5.03],["07-21",5.03],["07-22",5.03],["07-23",4.97],["07-24",5.0],["07-25",5.01],["07-28",5.02],["07-29",5.01],["07-30",4.98],["07-31",5.04],["08-01",5.05],["08-04",5.14],["08-05",5.14],["08-06",5.18],["08-07",5.17],["08-08",5.2],["08-11",5.49],["08-12",5.42],["08-13",5.43],["08-14",5.28],["08-15",5.34],["08-18",5.21],["08-19",5.08],["08-20",5.15],["08-21",5.15],["08-22",5.26],["08-26",5.12],["08-27",5.1],["08-28",5.14],["08-29",5.17],["09-01",5.21],["09-02",5.21],["09-03",5.41],["09-04",5.3],["09-05",5.46],["09-08",5.54],["09-09",5.67],["09-10",5.78],["09-11",5.65],["09-12",5.78],["09-15",5.8],["09-16",5.83],["09-17",5.8],["09-18",5.76],["09-19",5.89],["09-22",6.03],["09-23",5.95],["09-24",5.95],["09-25",5.9],["09-26",5.76],["09-29",5.64],["09-30",5.52],["10-01",5.57],["10-02",5.56],["10-03",5.76],["10-06",5.74],["10-07",5.73],["10-08",5.68],["10-09",5.72],["10-10",5.6],["10-13",5.65],["10-14",5.64],["10-15",5.58],["10-16",5.57],["10-17",5.5],["10-20",5.55],["10-21",5.79],["10-22",5.82],["10-23",5.79],["10-24",5.62],["10-27",5.63],["10-28",5.66],["10-29",5.59],["10-30",5.6],["10-31",5.61],["11-03",5.62],["11-04",5.73],["11-05",5.74],["11-06",5.61],["11-07",5.71],["11-10",5.79],["11-11",5.74],["11-12",5.75],["11-13",5.78],["11-14",5.84],["11-17",5.66],["11-18",5.57],["11-19",5.55],["11-20",5.46],["11-21",5.45],["11-24",5.26],["11-25",5.25],["11-26",5.28],["11-27",5.26],["11-28",5.38],["12-01",5.5],["12-02",5.43],["12-03",5.31],["12-04",5.38],["12-05",5.35],["12-08",5.37],["12-09",5.35],["12-10",5.32],["12-11",5.35],["12-12",5.37],["12-15",5.45],["12-16",5.43],["12-17",5.37],["12-18",5.36],["12-19",5.38],["12-22",5.41],["12-23",5.37],["12-24",5.3],["12-29",5.32],["12-30",5.28],["12-31",5.28]]},"1987":{"Gold":[["01-02",402.4],["01-05",399.0],["01-06",401.7],["01-07",399.5],["01-08",401.6],["01-09",402.25],["01-12",409.9],["01-13",408.6],["01-14",414.4],["01-15",415.0],["01-16",414.5],["01-19",421.25],["01-20",417.4],["01-21",408.5],["01-22",410.6],["01-23",403.55],["01-26",405.35],["01-27",408.7],["01-28",416.5],["01-29",411.0],["01-30",407.3],["02-02",406.45],["02-03",402.0],["02-04",401.75],["02-05",402.6],["02-06",402.7],["02-09",402.95],["02-10",404.4],["02-11",402.9],["02-12",402.0],["02-13",395.55],["02-16",397.2],["02-17",396.85],["02-18",392.95],["02-19",392.6],["02-20",397.5],["02-23",403.0],["02-24",401.95],["02-25",406.7],["02-26",403.1],["02-27",405.75],["03-02",404.4],["03-03",403.7],["03-04",407.65],["03-05",411.45],["03-06",406.5],["03-09",404.85],["03-10",405.0],["03-11",406.85],["03-12",408.0],["03-13",409.25],["03-16",404.65],["03-17",406.0],["03-18",406.4],["03-19",405.05],["03-20",405.0],["03-23",406.6],["03-24",410.3],["03-25",415.0],["03-26",411.3],["03-27",415.9],["03-30",421.8],["03-31",419.0],["04-01",418.5],["04-02",420.25],["04-03",418.65],["04-06",420.55],["04-07",419.8],["04-08",423.2],["04-09",421.5],["04-10",432.3],["04-13",436.5],["04-14",440.25],["04-15",445.5],["04-16",441.0],["04-21",454.3],["04-22",446.8],["04-23",453.0],["04-24",462.6],["04-27",476.6],["04-28",455.75],["04-29",451.75],["04-30",454.5],["05-01",452.15],["05-05",464.5],["05-06",456.75],["05-07",457.4],["05-08",456.7],["05-11",454.75],["05-12",460.25],["05-13",459.5],["05-14",460.0],["05-15",466.7],["05-18",476.5],["05-19",471.35],["05-20",479.95],["05-21",468.6],["05-22",473.6],["05-26",459.65],["05-27",447.9],["05-28",453.35],["05-29",451.75],["06-01",443.4],["06-02",449.3],["06-03",453.25],["06-04",450.25],["06-05",454.7],["06-08",454.4],["06-09",452.05],["06-10",456.65],["06-11",456.4],["06-12",460.8],["06-15",450.35],["06-16",452.75],["06-17",448.25],["06-18",451.1],["06-19",452.25],["06-22",443.6],["06-23",438.1],["06-24",443.0],["06-25",439.0],["06-26",441.4],["06-29",446.0],["06-30",447.1],["07-01",449.5],["07-02",447.4],["07-03",443.0],["07-06",443.1],["07-07",444.8],["07-08",442.15],["07-09",445.3],["07-10",444.25],["07-13",443.7],["07-14",447.15],["07-15",448.25],["07-16",452.9],["07-17",452.5],["07-20",449.65],["07-21",452.5],["07-22",454.45],["07-23",454.75],["07-24",454.0],["07-27",453.1],["07-28",454.2],["07-29",459.5],["07-30",457.2],["07-31",464.25],["08-03",473.25],["08-04",476.0],["08-05",469.85],["08-06",468.85],["08-07",464.0],["08-10",459.5],["08-11",463.2],["08-12",461.0],["08-13",462.0],["08-14",457.4],["08-17",454.8],["08-18",454.9],["08-19",457.65],["08-20",457.4],["08-21",454.1],["08-24",455.8],["08-25",458.5],["08-26",457.4],["08-27",458.25],["08-28",455.9],["09-01",453.1],["09-02",456.55],["09-03",462.15],["09-04",464.4],["09-07",463.35],["09-08",462.75],["09-09",458.0],["09-10",461.0],["09-11",460.9],["09-14",456.6],["09-15",458.35],["09-16",458.5],["09-17",458.8],["09-18",461.35],["09-21",458.85],["09-22",463.15],["09-23",461.05],["09-24",463.85],["09-25",461.0],["09-28",460.9],["09-29",458.9],["09-30",459.15],["10-01",454.1],["10-02",455.0],["10-05",455.15],["10-06",456.85],["10-07",458.55],["10-08",458.25],["10-09",461.75],["10-12",461.85],["10-13",459.65],["10-14",459.45],["10-15",461.75],["10-16",464.25],["10-19",479.5],["10-20",481.6],["10-21",466.65],["10-22",469.8],["10-23",472.65],["10-26",474.85],["10-27",473.45],["10-28",479.65],["10-29",474.05],["10-30",468.0],["11-02",469.95],["11-03",470.1],["11-04",467.0],["11-05",459.7],["11-06",458.6],["11-09",463.5],["11-10",458.75],["11-11",461.3],["11-12",463.0],["11-13",464.2],["11-16",461.75],["11-17",463.55],["11-18",464.2],["11-19",465.8],["11-20",466.25],["11-23",468.25],["11-24",476.95],["11-25",478.75],["11-26",477.65],["11-27",477.8],["11-30",493.9],["12-01",486.9],["12-02",490.0],["12-03",488.95],["12-04",485.75],["12-07",480.9],["12-08",483.0],["12-09",485.3],["12-10",484.5],["12-11",495.0],["12-14",502.75],["12-15",493.7],["12-16",487.05],["12-17",487.75],["12-18",484.55],["12-21",481.0],["12-22",481.6],["12-23",483.25],["12-24",483.75],["12-29",489.55],["12-30",486.9],["12-31",486.5]],"Silver":[["01-02",5.36],["01-05",5.37],["01-06",5.4],["01-07",5.36],["01-08",5.42],["01-09",5.39],["01-12",5.51],["01-13",5.54],["01-14",5.58],["01-15",5.57],["01-16",5.56],["01-19",5.65],["01-20",5.6],["01-21",5.47],["01-22",5.54],["01-23",5.51],["01-26",5.55],["01-27",5.62],["01-28",5.73],["01-29",5.61],["01-30",5.55],["02-02",5.53],["02-03",5.49],["02-04",5.5],["02-05",5.5],["02-06",5.56],["02-09",5.53],["02-10",5.54],["02-11",5.54],["02-12",5.51],["02-13",5.43],["02-16",5.45],["02-17",5.45],["02-18",5.39],["02-19",5.4],["02-20",5.44],["02-23",5.48],["02-24",5.45],["02-25",5.5],["02-26",5.47],["02-27",5.47],["03-02",5.43],["03-03",5.44],["03-04",5.47],["03-05",5.51],["03-06",5.53],["03-09",5.55],["03-10",5.53],["03-11",5.55],["03-12",5.57],["03-13",5.66],["03-16",5.56],["03-17",5.59],["03-18",5.58],["03-19",5.57],["03-20",5.55],["03-23",5.56],["03-24",5.71],["03-25",5.91],["03-26",5.84],["03-27",5.96],["03-30",6.23],["03-31",6.3],["04-01",6.26],["04-02",6.3],["04-03",6.35],["04-06",6.5],["04-07",6.75],["04-08",6.69],["04-09",6.65],["04-10",6.9],["04-13",6.89],["04-14",6.87],["04-15",7.24],["04-16",7.19],["04-21",7.84],["04-22",7.84],["04-23",8.3],["04-24",9.14],["04-27",10.93],["04-28",8.45],["04-29",8.25],["04-30",8.12],["05-01",7.93],["05-05",8.95],["05-06",8.19],["05-07",8.1],["05-08",8.19],["05-11",8.29],["05-12",8.69],["05-13",8.7],["05-14",8.65],["05-15",8.86],["05-18",9.44],["05-19",9.08],["05-20",9.38],["05-21",8.97],["05-22",8.99],["05-26",8.03],["05-27",7.3],["05-28",7.49],["05-29",7.68],["06-01",7.34],["06-02",7.58],["06-03",7.67],["06-04",7.63],["06-05",7.88],["06-08",7.86],["06-09",7.71],["06-10",7.93],["06-11",7.79],["06-12",7.91],["06-15",7.5],["06-16",7.67],["06-17",7.47],["06-18",7.49],["06-19",7.5],["06-22",7.0],["06-23",6.76],["06-24",6.95],["06-25",6.83],["06-26",6.81],["06-29",6.95],["06-30",7.14],["07-01",7.3],["07-02",7.38],["07-03",7.24],["07-06",7.2],["07-07",7.47],["07-08",7.36],["07-09",7.63],["07-10",7.66],["07-13",7.55],["07-14",7.7],["07-15",7.64],["07-16",7.79],["07-17",7.71],["07-20",7.53],["07-21",7.67],["07-22",7.72],["07-23",7.75],["07-24",7.68],["07-27",7.68],["07-28",7.74],["07-29",8.03],["07-30",8.01],["07-31",8.32],["08-03",8.6],["08-04",8.73],["08-05",8.43],["08-06",8.29],["08-07",7.99],["08-10",7.73],["08-11",7.82],["08-12",7.76],["08-13",7.86],["08-14",7.63],["08-17",7.53],["08-18",7.62],["08-19",7.66],["08-20",7.76],["08-21",7.62],["08-24",7.62],["08-25",7.75],["08-26",7.7],["08-27",7.73],["08-28",7.55],["09-01",7.45],["09-02",7.6],["09-03",7.66],["09-04",7.68],["09-07",7.69],["09-08",7.64],["09-09",7.52],["09-10",7.59],["09-11",7.82],["09-14",7.55],["09-15",7.71],["09-16",7.62],["09-17",7.51],["09-18",7.63],["09-21",7.36],["09-22",7.66],["09-23",7.54],["09-24",7.64],["09-25",7.57],["09-28",7.63],["09-29",7.55],["09-30",7.64],["10-01",7.55],["10-02",7.53],["10-05",7.57],["10-06",7.62],["10-07",7.65],["10-08",7.65],["10-09",7.82],["10-12",7.83],["10-13",7.73],["10-14",7.7],["10-15",7.82],["10-19",8.31],["10-20",7.83],["10-21",7.5],["10-22",7.5],["10-23",7.53],["10-26",7.57],["10-27",7.35],["10-28",7.46],["10-29",7.14],["10-30",6.88],["11-02",7.0],["11-03",6.96],["11-04",6.74],["11-05",6.29],["11-06",6.37],["11-09",6.66],["11-10",6.41],["11-11",6.49],["11-12",6.64],["11-13",6.71],["11-16",6.56],["11-17",6.73],["11-18",6.66],["11-19",6.64],["11-20",6.6],["11-23",6.63],["11-24",6.92],["11-25",6.88],["11-26",6.95],["11-27",7.0],["11-30",7.25],["12-01",6.99],["12-02",6.93],["12-03",6.96],["12-04",6.84],["12-07",6.63],["12-08",6.71],["12-09",6.76],["12-10",6.72],["12-11",7.01],["12-14",7.04],["12-15",6.91],["12-16",6.71],["12-17",6.77],["12-18",6.79],["12-21",6.77],["12-22",6.78],["12-23",6.76],["12-24",6.73],["12-29",6.81],["12-30",6.7],["12-31",6.7]]},"1988":{"Gold":[["01-04",484.1],["01-05",477.3],["01-06",481.6],["01-07",483.95],["01-08",479.5],["01-11",485.3],["01-12",482.05],["01-13",481.4],["01-14",480.9],["01-15",484.8],["01-18",475.85],["01-19",476.75],["01-20",477.75],["01-21",476.5],["01-22",477.85],["01-25",476.5],["01-26",471.4],["01-27",469.4],["01-28",467.0],["01-29",465.25],["02-01",454.65],["02-02",455.15],["02-03",447.1],["02-04",437.6],["02-05",444.15],["02-08",443.05],["02-09",439.25],["02-10",443.8],["02-11",440.2],["02-12",440.3],["02-15",443.6],["02-16",444.25],["02-17",444.4],["02-18",446.25],["02-19",443.45],["02-22",445.1],["02-23",443.95],["02-24",438.0],["02-25",433.95],["02-26",432.65],["02-29",423.75],["03-01",429.15],["03-02",431.55],["03-03",429.15],["03-04",430.75],["03-07",436.0],["03-08",435.7],["03-09",436.1],["03-10",437.25],["03-11",444.1],["03-14",441.9],["03-15",442.25],["03-16",447.15],["03-17",445.35],["03-18",442.8],["03-21",446.5],["03-22",449.4],["03-23",450.0],["03-24",453.9],["03-25",451.5],["03-28",453.1],["03-29",454.7],["03-30",454.0],["03-31",458.0],["04-05",456.0],["04-06",450.8],["04-07",446.25],["04-08",448.6],["04-11",450.15],["04-12",450.2],["04-13",448.5],["04-14",447.0],["04-15",453.85],["04-18",457.55],["04-19",456.55],["04-20",458.0],["04-21",454.0],["04-22",453.15],["04-25",449.75],["04-26",448.25],["04-27",449.1],["04-28",452.15],["04-29",449.75],["05-03",444.3],["05-04",441.95],["05-05",445.35],["05-06",445.95],["05-09",443.6],["05-10",447.1],["05-11",449.35],["05-12",448.65],["05-13",451.05],["05-16",453.4],["05-17",453.15],["05-18",452.7],["05-19",456.65],["05-20",456.5],["05-23",460.25],["05-24",458.6],["05-25",458.35],["05-26",453.0],["05-27",452.5],["05-31",454.0],["06-01",457.0],["06-02",454.6],["06-03",464.85],["06-06",464.1],["06-07",463.4],["06-08",458.75],["06-09",455.0],["06-10",457.1],["06-13",450.5],["06-14",450.8],["06-15",450.3],["06-16",452.65],["06-17",449.8],["06-20",453.9],["06-21",451.7],["06-22",449.8],["06-23",447.6],["06-24",447.0],["06-27",442.0],["06-28",443.85],["06-29",434.9],["06-30",436.85],["07-01",436.5],["07-04",437.15],["07-05",437.4],["07-06",438.1],["07-07",439.15],["07-08",438.9],["07-11",439.65],["07-12",434.5],["07-13",436.2],["07-14",439.05],["07-15",438.1],["07-18",437.65],["07-19",437.25],["07-20",445.0],["07-21",443.2],["07-22",443.2],["07-25",442.2],["07-26",430.15],["07-27",431.7],["07-28",428.75],["07-29",432.7],["08-01",436.4],["08-02",432.9],["08-03",431.25],["08-04",433.4],["08-05",431.45],["08-08",431.85],["08-09",428.25],["08-10",426.95],["08-11",429.0],["08-12",428.4],["08-15",431.15],["08-16",432.0],["08-17",429.0],["08-18",430.2],["08-19",432.4],["08-22",429.7],["08-23",432.7],["08-24",432.1],["08-25",434.8],["08-26",433.75],["08-30",429.4],["08-31",426.35],["09-01",430.3],["09-02",428.95],["09-05",427.0],["09-06",427.65],["09-07",427.0],["09-08",428.0],["09-09",428.9],["09-12",418.0],["09-13",420.8],["09-14",421.9],["09-15",421.5],["09-16",417.3],["09-19",409.0],["09-20",410.4],["09-21",401.6],["09-22",399.6],["09-23",399.3],["09-26",389.05],["09-27",397.0],["09-28",397.65],["09-29",398.6],["09-30",396.15],["10-03",394.2],["10-04",397.35],["10-05",397.25],["10-06",403.0],["10-07",404.25],["10-10",406.25],["10-11",408.0],["10-12",404.7],["10-13",408.6],["10-14",406.5],["10-17",411.15],["10-18",413.05],["10-19",410.8],["10-20",411.4],["10-21",410.55],["10-24",406.3],["10-25",406.6],["10-26",407.5],["10-27",407.15],["10-28",407.3],["10-31",412.3],["11-01",411.0],["11-02",412.5],["11-03",422.9],["11-04",419.5],["11-07",422.0],["11-08",421.85],["11-09",419.5],["11-10",422.25],["11-11",420.75],["11-14",420.65],["11-15",422.8],["11-16",422.6],["11-17",423.3],["11-18",419.75],["11-21",416.6],["11-22",416.1],["11-23",417.95],["11-24",419.85],["11-25",422.6],["11-28",421.4],["11-29",422.1],["11-30",421.3],["12-01",425.5],["12-02",423.8],["12-05",430.4],["12-06",429.0],["12-07",425.35],["12-08",423.3],["12-09",422.2],["12-12",421.0],["12-13",420.05],["12-14",419.6],["12-15",421.4],["12-16",412.6],["12-19",413.65],["12-20",413.2],["12-21",413.85],["12-22",415.6],["12-23",417.55],["12-28",413.65],["12-29",413.1],["12-30",410.15]],"Silver":[["01-04",6.63],["01-05",6.5],["01-06",6.75],["01-07",7.0],["01-08",6.85],["01-11",6.99],["01-12",6.86],["01-13",6.76],["01-14",6.79],["01-15",6.82],["01-18",6.7],["01-19",6.7],["01-20",6.73],["01-21",6.67],["01-22",6.71],["01-25",6.75],["01-26",6.62],["01-27",6.61],["01-28",6.63],["01-29",6.55],["02-01",6.54],["02-02",6.62],["02-03",6.41],["02-04",6.34],["02-05",6.39],["02-08",6.33],["02-09",6.29],["02-10",6.32],["02-11",6.27],["02-12",6.28],["02-15",6.35],["02-16",6.35],["02-17",6.36],["02-18",6.43],["02-19",6.35],["02-22",6.38],["02-23",6.38],["02-24",6.24],["02-25",6.2],["02-26",6.21],["02-29",6.14],["03-01",6.21],["03-02",6.24],["03-03",6.2],["03-04",6.27],["03-07",6.36],["03-08",6.38],["03-09",6.29],["03-10",6.39],["03-11",6.33],["03-14",6.23],["03-15",6.27],["03-16",6.37],["03-17",6.31],["03-18",6.32],["03-21",6.36],["03-22",6.43],["03-23",6.48],["03-24",6.67],["03-25",6.62],["03-28",6.65],["03-29",6.64],["03-30",6.69],["03-31",6.75],["04-05",6.73],["04-06",6.6],["04-07",6.46],["04-08",6.42],["04-11",6.41],["04-12",6.44],["04-13",6.37],["04-14",6.36],["04-15",6.46],["04-18",6.5],["04-19",6.42],["04-20",6.47],["04-21",6.43],["04-22",6.41],["04-25",6.41],["04-26",6.38],["04-27",6.37],["04-28",6.5],["04-29",6.46],["05-03",6.36],["05-04",6.32],["05-05",6.35],["05-06",6.37],["05-09",6.38],["05-10",6.45],["05-11",6.54],["05-12",6.53],["05-13",6.55],["05-16",6.67],["05-17",6.58],["05-18",6.56],["05-19",6.72],["05-20",6.62],["05-23",6.76],["05-24",6.69],["05-25",6.64],["05-26",6.57],["05-27",6.58],["05-31",6.6],["06-01",6.71],["06-02",6.76],["06-03",7.22],["06-06",7.23],["06-07",7.28],["06-08",7.19],["06-09",6.98],["06-10",7.13],["06-13",6.98],["06-14",6.98],["06-15",7.03],["06-16",7.16],["06-17",7.11],["06-20",7.22],["06-21",7.18],["06-22",7.1],["06-23",6.99],["06-24",6.91],["06-27",6.84],["06-28",6.96],["06-29",6.71],["06-30",6.65],["07-01",6.69],["07-04",6.71],["07-05",6.72],["07-06",6.78],["07-07",6.95],["07-08",6.95],["07-11",7.09],["07-12",6.89],["07-13",6.97],["07-14",7.24],["07-15",7.32],["07-18",7.24],["07-19",7.15],["07-20",7.82],["07-21",7.76],["07-22",7.71],["07-25",7.58],["07-26",6.99],["07-27",6.93],["07-28",6.78],["07-29",6.8],["08-01",6.86],["08-02",6.82],["08-03",6.76],["08-04",6.85],["08-05",6.83],["08-08",6.8],["08-09",6.7],["08-10",6.6],["08-11",6.7],["08-12",6.72],["08-15",6.7],["08-16",6.75],["08-17",6.62],["08-18",6.65],["08-19",6.67],["08-22",6.62],["08-23",6.74],["08-24",6.73],["08-25",6.78],["08-26",6.71],["08-30",6.51],["08-31",6.46],["09-01",6.55],["09-02",6.57],["09-05",6.49],["09-06",6.54],["09-07",6.51],["09-08",6.57],["09-09",6.63],["09-12",6.42],["09-13",6.44],["09-14",6.51],["09-15",6.49],["09-16",6.43],["09-19",6.29],["09-20",6.35],["09-21",6.19],["09-22",6.17],["09-23",6.24],["09-26",6.1],["09-27",6.14],["09-28",6.17],["09-29",6.21],["09-30",6.17],["10-03",6.12],["10-04",6.21],["10-05",6.22],["10-06",6.32],["10-07",6.31],["10-10",6.35],["10-11",6.33],["10-12",6.25],["10-13",6.33],["10-14",6.28],["10-17",6.34],["10-18",6.41],["10-19",6.32],["10-20",6.34],["10-21",6.34],["10-24",6.22],["10-25",6.24],["10-26",6.25],["10-27",6.23],["10-28",6.21],["10-31",6.31],["11-01",6.28],["11-02",6.35],["11-03",6.5],["11-04",6.4],["11-07",6.42],["11-08",6.48],["11-09",6.41],["11-10",6.52],["11-11",6.44],["11-14",6.38],["11-15",6.43],["11-16",6.38],["11-17",6.33],["11-18",6.21],["11-21",6.14],["11-22",6.07],["11-23",6.11],["11-24",6.14],["11-25",6.14],["11-28",6.17],["11-29",6.14],["11-30",6.07],["12-01",6.16],["12-02",6.11],["12-05",6.19],["12-06",6.15],["12-07",6.11],["12-08",6.17],["12-09",6.12],["12-12",6.14],["12-13",6.14],["12-14",6.13],["12-15",6.19],["12-16",6.08],["12-19",6.09],["12-20",6.08],["12-21",6.12],["12-22",6.11],["12-23",6.12],["12-28",6.09],["12-29",6.07],["12-30",6.05]]},"1989":{"Gold":[["01-03",413.6],["01-04",410.5],["01-05",408.0],["01-06",408.45],["01-09",404.45],["01-10",405.5],["01-11",403.5],["01-12",404.85],["01-13",403.5],["01-16",401.75],["01-17",402.1],["01-18",402.85],["01-19",402.3],["01-20",404.5],["01-23",407.75],["01-24",407.8],["01-25",404.75],["01-26",406.0],["01-27",402.05],["01-30",394.3],["01-31",394.85],["02-01",392.0],["02-02",392.7],["02-03",390.85],["02-06",390.25],["02-07",391.45],["02-08",390.4],["02-09",394.1],["02-10",393.8],["02-13",386.7],["02-14",385.65],["02-15",381.7],["02-16",384.25],["02-17",378.95],["02-20",382.15],["02-21",382.75],["02-22",386.0],["02-23",389.0],["02-24",389.25],["02-27",390.75],["02-28",386.75],["03-01",386.1],["03-02",384.1],["03-03",386.5],["03-06",388.4],["03-07",386.3],["03-08",393.1],["03-09",392.5],["03-10",397.0],["03-13",393.1],["03-14",394.3],["03-15",394.45],["03-16",391.0],["03-17",389.25],["03-20",395.3],["03-21",394.1],["03-22",393.4],["03-23",396.0],["03-28",391.25],["03-29",383.3],["03-30",384.0],["03-31",382.3],["04-03",385.3],["04-04",386.6],["04-05",384.4],["04-06",384.2],["04-07",384.4],["04-10",381.6],["04-11",384.75],["04-12",384.15],["04-13",387.8],["04-14",388.55],["04-17",385.15],["04-18",385.25],["04-19",382.9],["04-20",383.9],["04-21",385.25],["04-24",383.9],["04-25",385.85],["04-26",384.4],["04-27",384.75],["04-28",381.3],["05-02",376.9],["05-03",376.5],["05-04",378.2],["05-05",377.3],["05-08",377.15],["05-09",376.0],["05-10",378.1],["05-11",377.7],["05-12",379.65],["05-15",374.25],["05-16",374.4],["05-17",373.7],["05-18",371.0],["05-19",366.25],["05-22",359.25],["05-23",363.4],["05-24",362.5],["05-25",363.3],["05-26",367.2],["05-30",362.1],["05-31",363.5],["06-01",360.8],["06-02",362.7],["06-05",367.7],["06-06",365.0],["06-07",375.5],["06-08",374.6],["06-09",371.25],["06-12",358.5],["06-13",360.5],["06-14",361.6],["06-15",360.35],["06-16",365.75],["06-19",363.6],["06-20",366.5],["06-21",365.7],["06-22",370.4],["06-23",369.5],["06-26",375.3],["06-27",373.55],["06-28",373.75],["06-29",376.3],["06-30",371.15],["07-03",375.4],["07-04",377.5],["07-05",378.4],["07-06",384.3],["07-07",383.6],["07-10",382.45],["07-11",381.35],["07-12",379.5],["07-13",377.1],["07-14",375.0],["07-17",370.9],["07-18",369.7],["07-19",371.5],["07-20",368.8],["07-21",372.25],["07-24",372.0],["07-25",372.8],["07-26",371.5],["07-27",374.3],["07-28",371.95],["07-31",369.1],["08-01",369.95],["08-02",369.9],["08-03",369.8],["08-04",371.55],["08-07",367.25],["08-08",366.2],["08-09",365.15],["08-10",366.4],["08-11",364.4],["08-14",363.0],["08-15",364.7],["08-16",367.6],["08-17",366.0],["08-18",366.3],["08-21",365.5],["08-22",366.0],["08-23",366.8],["08-24",363.6],["08-25",361.15],["08-29",360.0],["08-30",361.2],["08-31",359.6],["09-01",358.25],["09-04",358.75],["09-05",358.1],["09-06",360.0],["09-07",359.2],["09-08",359.85],["09-11",358.1],["09-12",358.95],["09-13",358.8],["09-14",359.8],["09-15",359.65],["09-18",360.1],["09-19",360.65],["09-20",360.75],["09-21",362.95],["09-22",364.1],["09-25",368.75],["09-26",366.6],["09-27",369.3],["09-28",366.1],["09-29",369.0],["10-02",366.45],["10-03",365.0],["10-04",366.05],["10-05",366.9],["10-06",363.6],["10-09",362.95],["10-10",362.3],["10-11",360.4],["10-12",362.55],["10-13",362.9],["10-16",366.45],["10-17",365.65],["10-18",368.1],["10-19",368.5],["10-20",366.7],["10-23",365.8],["10-24",366.4],["10-25",368.35],["10-26",368.45],["10-27",371.55],["10-30",378.5],["10-31",376.05],["11-01",373.6],["11-02",373.85],["11-03",378.85],["11-06",378.15],["11-07",385.5],["11-08",386.95],["11-09",387.4],["11-10",386.45],["11-13",389.05],["11-14",390.75],["11-15",390.5],["11-16",389.1],["11-17",393.85],["11-20",396.05],["11-21",400.3],["11-22",406.6],["11-23",408.1],["11-24",415.8],["11-27",417.15],["11-28",410.4],["11-29",410.75],["11-30",406.8],["12-01",414.15],["12-04",409.9],["12-05",402.6],["12-06",402.05],["12-07",405.75],["12-08",408.85],["12-11",414.0],["12-12",416.1],["12-13",417.1],["12-14",409.45],["12-15",410.35],["12-18",411.65],["12-19",411.3],["12-20",413.15],["12-21",413.0],["12-22",413.2],["12-27",409.45],["12-28",400.4],["12-29",401.0]],"Silver":[["01-03",6.07],["01-04",6.03],["01-05",5.96],["01-06",5.97],["01-09",5.93],["01-10",5.96],["01-11",5.91],["01-12",5.96],["01-13",5.91],["01-16",5.87],["01-17",5.91],["01-18",5.93],["01-19",5.92],["01-20",5.99],["01-23",6.16],["01-24",6.21],["01-25",6.12],["01-26",6.19],["01-27",6.08],["01-30",5.87],["01-31",5.85],["02-01",5.82],["02-02",5.82],["02-03",5.81],["02-06",5.82],["02-07",5.9],["02-08",5.88],["02-09",5.93],["02-10",5.9],["02-13",5.79],["02-14",5.83],["02-15",5.8],["02-16",5.88],["02-17",5.83],["02-20",5.93],["02-21",5.93],["02-22",5.95],["02-23",5.97],["02-24",5.94],["02-27",5.95],["02-28",5.86],["03-01",5.84],["03-02",5.76],["03-03",5.81],["03-06",5.83],["03-07",5.8],["03-08",5.89],["03-09",5.87],["03-10",6.04],["03-13",6.04],["03-14",6.06],["03-15",6.13],["03-16",6.06],["03-17",6.05],["03-20",6.15],["03-21",6.08],["03-22",6.06],["03-23",6.09],["03-28",5.97],["03-29",5.83],["03-30",5.82],["03-31",5.77],["04-03",5.79],["04-04",5.83],["04-05",5.8],["04-06",5.81],["04-07",5.81],["04-10",5.76],["04-11",5.82],["04-12",5.82],["04-13",5.88],["04-14",5.86],["04-17",5.8],["04-18",5.82],["04-19",5.76],["04-20",5.78],["04-21",5.78],["04-24",5.76],["04-25",5.81],["04-26",5.78],["04-27",5.76],["04-28",5.64],["05-02",5.65],["05-03",5.64],["05-04",5.63],["05-05",5.62],["05-08",5.6],["05-09",5.59],["05-10",5.67],["05-11",5.64],["05-12",5.66],["05-15",5.5],["05-16",5.51],["05-17",5.5],["05-18",5.43],["05-19",5.37],["05-22",5.09],["05-23",5.1],["05-24",5.17],["05-25",5.21],["05-26",5.33],["05-30",5.22],["05-31",5.22],["06-01",5.16],["06-02",5.22],["06-05",5.31],["06-06",5.24],["06-07",5.4],["06-08",5.42],["06-09",5.39],["06-12",5.19],["06-13",5.22],["06-14",5.23],["06-15",5.21],["06-16",5.31],["06-19",5.32],["06-20",5.34],["06-21",5.24],["06-22",5.33],["06-23",5.31],["06-26",5.31],["06-27",5.29],["06-28",5.3],["06-29",5.28],["06-30",5.17],["07-03",5.19],["07-04",5.23],["07-05",5.26],["07-06",5.36],["07-07",5.34],["07-10",5.26],["07-11",5.22],["07-12",5.25],["07-13",5.2],["07-14",5.18],["07-17",5.23],["07-18",5.25],["07-19",5.22],["07-20",5.18],["07-21",5.23],["07-24",5.21],["07-25",5.21],["07-26",5.21],["07-27",5.23],["07-28",5.21],["07-31",5.15],["08-01",5.25],["08-02",5.24],["08-03",5.22],["08-04",5.29],["08-07",5.16],["08-08",5.16],["08-09",5.16],["08-10",5.17],["08-11",5.13],["08-14",5.17],["08-15",5.19],["08-16",5.24],["08-17",5.18],["08-18",5.24],["08-21",5.21],["08-22",5.22],["08-23",5.23],["08-24",5.17],["08-25",5.12],["08-29",5.12],["08-30",5.13],["08-31",5.07],["09-01",5.05],["09-04",5.07],["09-05",5.06],["09-06",5.09],["09-07",5.1],["09-08",5.12],["09-11",5.07],["09-12",5.08],["09-13",5.08],["09-14",5.09],["09-15",5.06],["09-18",5.07],["09-19",5.07],["09-20",5.07],["09-21",5.11],["09-22",5.21],["09-25",5.32],["09-26",5.26],["09-27",5.29],["09-28",5.26],["09-29",5.28],["10-02",5.23],["10-03",5.22],["10-04",5.23],["10-05",5.25],["10-06",5.15],["10-09",5.13],["10-10",5.07],["10-11",5.04],["10-12",5.09],["10-13",5.08],["10-16",5.17],["10-17",5.09],["10-18",5.13],["10-19",5.13],["10-20",5.09],["10-23",5.08],["10-24",5.1],["10-25",5.13],["10-26",5.12],["10-27",5.17],["10-30",5.25],["10-31",5.23],["11-01",5.17],["11-02",5.16],["11-03",5.24],["11-06",5.23],["11-07",5.29],["11-08",5.26],["11-09",5.28],["11-10",5.28],["11-13",5.3],["11-14",5.34],["11-15",5.37],["11-16",5.5],["11-17",5.66],["11-20",5.69],["11-21",5.76],["11-22",5.8],["11-23",5.8],["11-24",5.88],["11-27",5.84],["11-28",5.6],["11-29",5.61],["11-30",5.57],["12-01",5.71],["12-04",5.65],["12-05",5.53],["12-06",5.54],["12-07",5.59],["12-08",5.61],["12-11",5.66],["12-12",5.7],["12-13",5.67],["12-14",5.55],["12-15",5.6],["12-18",5.59],["12-19",5.56],["12-20",5.58],["12-21",5.6],["12-22",5.6],["12-27",5.53],["12-28",5.29],["12-29",5.22]]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 9988 entries across 10 years (1990–1999)
+window._loadSpotSeedBundle({"1990":{"Gold":[["01-02",401.65],["01-03",396.3],["01-04",394.95],["01-05",401.2],["01-08",403.75],["01-09",402.7],["01-10",405.85],["01-11",413.55],["01-12",413.9],["01-15",415.3],["01-16",415.25],["01-17",410.6],["01-18",413.6],["01-19",410.6],["01-22",408.7],["01-23",408.6],["01-24",413.75],["01-25",417.15],["01-26",419.1],["01-29",420.75],["01-30",417.8],["01-31",417.55],["02-01",413.25],["02-02",417.35],["02-05",418.75],["02-06",421.4],["02-07",419.9],["02-08",418.5],["02-09",418.5],["02-12",415.25],["02-13",419.75],["02-14",416.0],["02-15",417.05],["02-16",414.9],["02-19",416.95],["02-20",419.05],["02-21",420.6],["02-22",418.0],["02-23",415.0],["02-26",412.75],["02-27",408.8],["02-28",409.1],["03-01",406.25],["03-02",406.4],["03-05",403.0],["03-06",404.8],["03-07",402.6],["03-08",401.4],["03-09",399.7],["03-12",400.4],["03-13",397.35],["03-14",398.8],["03-15",397.6],["03-16",399.2],["03-19",401.25],["03-20",400.8],["03-21",389.9],["03-22",392.25],["03-23",393.6],["03-26",379.25],["03-27",369.75],["03-28",373.3],["03-29",370.75],["03-30",372.2],["04-02",368.0],["04-03",374.8],["04-04",374.25],["04-05",378.1],["04-06",380.35],["04-09",378.85],["04-10",375.3],["04-11",374.1],["04-12",375.25],["04-17",373.85],["04-18",374.7],["04-19",376.6],["04-20",376.8],["04-23",375.65],["04-24",377.95],["04-25",374.8],["04-26",371.35],["04-27",371.4],["04-30",371.55],["05-01",368.95],["05-02",370.5],["05-03",369.15],["05-04",371.4],["05-08",372.1],["05-09",369.7],["05-10",371.0],["05-11",368.25],["05-14",368.3],["05-15",367.4],["05-16",369.6],["05-17",369.1],["05-18",369.7],["05-21",373.4],["05-22",372.4],["05-23",363.25],["05-24",367.65],["05-25",366.35],["05-29",368.35],["05-30",365.7],["05-31",363.7],["06-01",363.1],["06-04",358.75],["06-05",357.85],["06-06",359.8],["06-07",353.25],["06-08",353.6],["06-11",354.7],["06-12",356.0],["06-13",353.0],["06-14",346.75],["06-15",347.05],["06-18",349.0],["06-19",348.45],["06-20",347.05],["06-21",350.0],["06-22",349.35],["06-25",351.4],["06-26",353.1],["06-27",350.3],["06-28",350.9],["06-29",352.4],["07-02",357.1],["07-03",357.4],["07-04",361.25],["07-05",358.85],["07-06",360.35],["07-09",359.9],["07-10",357.55],["07-11",353.7],["07-12",353.2],["07-13",359.1],["07-16",362.5],["07-17",361.3],["07-18",360.1],["07-19",361.55],["07-20",360.75],["07-23",361.8],["07-24",368.25],["07-25",367.4],["07-26",370.6],["07-27",368.5],["07-30",367.8],["07-31",371.1],["08-01",371.1],["08-02",382.6],["08-03",375.8],["08-06",380.0],["08-07",383.95],["08-08",384.75],["08-09",385.85],["08-10",388.75],["08-13",399.9],["08-14",411.0],["08-15",401.5],["08-16",399.25],["08-17",410.5],["08-20",410.9],["08-21",407.85],["08-22",410.0],["08-23",415.7],["08-24",412.0],["08-28",392.55],["08-29",389.1],["08-30",385.8],["08-31",388.1],["09-03",387.5],["09-04",386.75],["09-05",384.6],["09-06",388.25],["09-07",388.85],["09-10",382.5],["09-11",378.4],["09-12",380.65],["09-13",382.15],["09-14",384.3],["09-17",387.9],["09-18",390.55],["09-19",386.45],["09-20",386.0],["09-21",390.1],["09-24",390.15],["09-25",406.35],["09-26",401.75],["09-27",401.9],["09-28",406.1],["10-01",400.0],["10-02",389.25],["10-03",389.85],["10-04",392.75],["10-05",393.0],["10-08",391.25],["10-09",394.8],["10-10",392.2],["10-11",389.6],["10-12",388.3],["10-15",381.85],["10-16",375.15],["10-17",365.75],["10-18",370.0],["10-19",371.75],["10-22",368.5],["10-23",370.75],["10-24",371.1],["10-25",373.9],["10-26",377.3],["10-29",371.0],["10-30",373.35],["10-31",379.25],["11-01",380.1],["11-02",379.75],["11-05",377.05],["11-06",381.4],["11-07",383.5],["11-08",386.3],["11-09",384.85],["11-12",381.9],["11-13",383.2],["11-14",383.45],["11-15",378.5],["11-16",380.3],["11-19",377.6],["11-20",379.5],["11-21",377.35],["11-22",380.2],["11-23",380.0],["11-26",387.05],["11-27",384.25],["11-28",384.75],["11-29",385.25],["11-30",384.8],["12-03",381.75],["12-04",377.0],["12-05",377.3],["12-06",373.8],["12-07",371.1],["12-10",372.25],["12-11",374.3],["12-12",371.9],["12-13",373.0],["12-14",373.15],["12-17",376.85],["12-18",376.0],["12-19",376.8],["12-20",384.45],["12-21",383.25],["12-24",382.0],["12-27",383.75],["12-28",385.4],["12-31",391.0]],"Silver":[["01-02",5.21],["01-03",5.16],["01-04",5.2],["01-05",5.28],["01-08",5.28],["01-09",5.25],["01-10",5.26],["01-11",5.31],["01-12",5.33],["01-15",5.33],["01-16",5.22],["01-17",5.23],["01-18",5.27],["01-19",5.21],["01-22",5.2],["01-23",5.26],["01-24",5.28],["01-25",5.23],["01-26",5.28],["01-29",5.26],["01-30",5.2],["01-31",5.21],["02-01",5.21],["02-02",5.32],["02-05",5.33],["02-06",5.32],["02-07",5.3],["02-08",5.33],["02-09",5.32],["02-12",5.3],["02-13",5.33],["02-14",5.29],["02-15",5.34],["02-16",5.33],["02-19",5.33],["02-20",5.36],["02-21",5.34],["02-22",5.29],["02-23",5.25],["02-26",5.24],["02-27",5.17],["02-28",5.12],["03-01",5.14],["03-02",5.14],["03-05",5.12],["03-06",5.13],["03-07",5.14],["03-08",5.14],["03-09",5.11],["03-12",5.12],["03-13",5.06],["03-14",5.08],["03-15",5.09],["03-16",5.11],["03-19",5.12],["03-20",5.12],["03-21",5.05],["03-22",5.06],["03-23",5.09],["03-26",4.96],["03-27",4.96],["03-28",5.0],["03-29",4.97],["03-30",4.97],["04-02",4.94],["04-03",5.0],["04-04",5.01],["04-05",5.15],["04-06",5.18],["04-09",5.14],["04-10",5.12],["04-11",5.08],["04-12",5.13],["04-17",5.05],["04-18",5.09],["04-19",5.09],["04-20",5.08],["04-23",5.08],["04-24",5.1],["04-25",5.02],["04-26",4.96],["04-27",4.96],["04-30",4.94],["05-01",4.95],["05-02",5.0],["05-03",5.01],["05-04",5.06],["05-08",5.03],["05-09",5.0],["05-10",5.03],["05-11",5.05],["05-14",5.05],["05-15",5.03],["05-16",5.02],["05-17",5.03],["05-18",5.04],["05-21",5.13],["05-22",5.12],["05-23",5.09],["05-24",5.22],["05-25",5.22],["05-29",5.24],["05-30",5.13],["05-31",5.07],["06-01",5.07],["06-04",5.05],["06-05",5.05],["06-06",5.09],["06-07",4.99],["06-08",5.01],["06-11",5.0],["06-12",5.01],["06-13",4.99],["06-14",4.91],["06-15",4.84],["06-18",4.83],["06-19",4.84],["06-20",4.82],["06-21",4.84],["06-22",4.82],["06-25",4.84],["06-26",4.8],["06-27",4.81],["06-28",4.83],["06-29",4.84],["07-02",4.91],["07-03",4.96],["07-04",4.93],["07-05",4.9],["07-06",4.88],["07-09",4.88],["07-10",4.8],["07-11",4.81],["07-12",4.83],["07-13",4.9],["07-16",4.92],["07-17",4.85],["07-18",4.83],["07-19",4.88],["07-20",4.87],["07-23",4.88],["07-24",4.9],["07-25",4.87],["07-26",4.85],["07-27",4.84],["07-30",4.83],["07-31",4.86],["08-01",4.81],["08-02",4.93],["08-03",4.83],["08-06",4.88],["08-07",4.93],["08-08",4.87],["08-09",4.88],["08-10",4.94],["08-13",5.08],["08-14",5.2],["08-15",5.13],["08-16",5.07],["08-17",5.21],["08-20",5.2],["08-21",5.16],["08-22",5.12],["08-23",5.22],["08-24",5.13],["08-28",4.92],["08-29",4.86],["08-30",4.84],["08-31",4.83],["09-03",4.85],["09-04",4.82],["09-05",4.76],["09-06",4.8],["09-07",4.78],["09-10",4.77],["09-11",4.75],["09-12",4.79],["09-13",4.82],["09-14",4.81],["09-17",4.79],["09-18",4.79],["09-19",4.8],["09-20",4.79],["09-21",4.81],["09-24",4.83],["09-25",4.93],["09-26",4.83],["09-27",4.78],["09-28",4.79],["10-01",4.79],["10-02",4.69],["10-03",4.69],["10-04",4.71],["10-05",4.71],["10-08",4.67],["10-09",4.69],["10-10",4.63],["10-11",4.38],["10-12",4.25],["10-15",4.26],["10-16",4.2],["10-17",4.22],["10-18",4.25],["10-19",4.24],["10-22",4.23],["10-23",4.23],["10-24",4.23],["10-25",4.23],["10-26",4.22],["10-29",4.07],["10-30",4.14],["10-31",4.22],["11-01",4.18],["11-02",4.23],["11-05",4.17],["11-06",4.22],["11-07",4.23],["11-08",4.26],["11-09",4.24],["11-12",4.21],["11-13",4.21],["11-14",4.2],["11-15",4.17],["11-16",4.14],["11-19",4.13],["11-20",4.14],["11-21",4.11],["11-22",4.15],["11-23",4.14],["11-26",4.19],["11-27",4.12],["11-28",4.11],["11-29",4.13],["11-30",4.09],["12-03",4.13],["12-04",4.16],["12-05",4.15],["12-06",4.12],["12-07",4.15],["12-10",4.1],["12-11",4.08],["12-12",4.06],["12-13",4.01],["12-14",3.96],["12-17",3.95],["12-18",3.96],["12-19",3.97],["12-20",4.1],["12-21",4.15],["12-24",4.04],["12-27",4.1],["12-28",4.09],["12-31",4.19]],"Palladium":[["04-02",128.0],["04-03",128.35],["04-04",128.35],["04-05",128.4],["04-06",128.75],["04-09",128.5],["04-10",128.25],["04-11",128.25],["04-12",128.6],["04-17",128.65],["04-18",128.75],["04-19",128.5],["04-20",128.75],["04-23",128.0],["04-24",127.7],["04-25",126.0],["04-26",123.25],["04-27",123.0],["04-30",122.25],["05-01",118.35],["05-02",118.6],["05-03",118.75],["05-04",120.15],["05-08",119.85],["05-09",117.65],["05-10",118.25],["05-11",118.1],["05-14",118.5],["05-15",119.25],["05-16",119.25],["05-17",118.2],["05-18",118.75],["05-21",122.75],["05-22",120.5],["05-23",121.75],["05-24",120.65],["05-25",120.75],["05-29",121.25],["05-30",120.25],["05-31",119.75],["06-01",118.75],["06-04",118.75],["06-05",117.5],["06-06",119.0],["06-07",117.25],["06-08",117.25],["06-11",117.35],["06-12",117.5],["06-13",117.25],["06-14",115.75],["06-15",115.25],["06-18",114.75],["06-19",114.75],["06-20",113.75],["06-21",114.35],["06-22",114.1],["06-25",114.0],["06-26",112.85],["06-27",112.75],["06-28",113.0],["06-29",113.35],["07-02",116.75],["07-03",116.25],["07-04",117.25],["07-05",116.3],["07-06",117.5],["07-09",117.5],["07-10",116.75],["07-11",116.75],["07-12",116.5],["07-13",116.75],["07-16",117.75],["07-17",117.25],["07-18",116.25],["07-19",116.75],["07-20",117.5],["07-23",117.75],["07-24",118.55],["07-25",117.25],["07-26",117.5],["07-27",117.0],["07-30",116.75],["07-31",116.5],["08-01",116.6],["08-02",116.75],["08-03",115.5],["08-06",114.5],["08-07",114.5],["08-08",114.75],["08-09",114.75],["08-10",114.75],["08-13",117.0],["08-14",118.5],["08-15",117.75],["08-16",117.25],["08-17",118.75],["08-20",118.25],["08-21",118.0],["08-22",117.75],["08-23",117.75],["08-24",116.5],["08-28",111.25],["08-29",112.75],["08-30",112.25],["08-31",111.75],["09-03",112.25],["09-04",112.0],["09-05",111.25],["09-06",111.4],["09-07",108.35],["09-10",106.25],["09-11",106.0],["09-12",105.0],["09-13",105.25],["09-14",105.4],["09-17",105.25],["09-18",106.25],["09-19",105.75],["09-20",105.5],["09-21",103.25],["09-24",101.25],["09-25",102.5],["09-26",102.0],["09-27",98.75],["09-28",97.75],["10-01",97.0],["10-02",98.35],["10-03",99.25],["10-04",98.25],["10-05",99.0],["10-08",100.25],["10-09",100.5],["10-10",100.0],["10-11",98.65],["10-12",93.5],["10-15",93.75],["10-16",90.25],["10-17",88.5],["10-18",89.5],["10-19",92.25],["10-22",93.25],["10-23",93.75],["10-24",95.4],["10-25",94.6],["10-26",94.35],["10-29",94.6],["10-30",95.25],["10-31",96.5],["11-01",95.5],["11-02",95.75],["11-05",94.0],["11-06",94.75],["11-07",94.5],["11-08",94.5],["11-09",93.25],["11-12",93.0],["11-13",94.25],["11-14",94.15],["11-15",93.2],["11-16",93.65],["11-19",93.25],["11-20",92.75],["11-21",93.0],["11-22",93.0],["11-23",94.0],["11-26",94.0],["11-27",94.3],["11-28",94.25],["11-29",94.1],["11-30",93.5],["12-03",92.25],["12-04",93.0],["12-05",93.0],["12-06",93.35],["12-07",92.95],["12-10",92.75],["12-11",93.0],["12-12",92.5],["12-13",90.5],["12-14",87.85],["12-17",87.6],["12-18",88.0],["12-19",88.75],["12-20",89.5],["12-21",89.0],["12-24",87.75],["12-27",86.5],["12-28",82.95],["12-31",81.75]],"Platinum":[["04-02",471.0],["04-03",475.8],["04-04",475.7],["04-05",481.75],["04-06",481.0],["04-09",481.25],["04-10",476.75],["04-11",476.0],["04-12",480.9],["04-17",478.4],["04-18",478.0],["04-19",480.75],["04-20",481.75],["04-23",483.25],["04-24",485.25],["04-25",480.75],["04-26",474.4],["04-27",473.6],["04-30",472.25],["05-01",473.25],["05-02",476.75],["05-03",478.15],["05-04",482.95],["05-08",482.25],["05-09",476.25],["05-10",481.75],["05-11",478.5],["05-14",483.25],["05-15",484.6],["05-16",486.6],["05-17",488.9],["05-18",488.6],["05-21",497.75],["05-22",496.85],["05-23",503.25],["05-24",497.25],["05-25",498.25],["05-29",499.75],["05-30",496.5],["05-31",492.5],["06-01",490.0],["06-04",484.65],["06-05",485.9],["06-06",491.75],["06-07",482.25],["06-08",485.0],["06-11",484.25],["06-12",487.25],["06-13",484.4],["06-14",476.0],["06-15",474.75],["06-18",476.25],["06-19",478.25],["06-20",473.0],["06-21",479.1],["06-22",477.1],["06-25",479.0],["06-26",480.35],["06-27",478.75],["06-28",479.7],["06-29",482.5],["07-02",487.0],["07-03",487.1],["07-04",488.75],["07-05",486.0],["07-06",484.75],["07-09",484.75],["07-10",482.1],["07-11",477.65],["07-12",469.0],["07-13",474.35],["07-16",477.4],["07-17",472.5],["07-18",470.9],["07-19",474.75],["07-20",475.5],["07-23",475.5],["07-24",482.1],["07-25",477.75],["07-26",478.75],["07-27",476.4],["07-30",475.85],["07-31",478.25],["08-01",485.15],["08-02",490.5],["08-03",484.0],["08-06",483.5],["08-07",485.25],["08-08",479.65],["08-09",480.5],["08-10",484.5],["08-13",490.0],["08-14",502.75],["08-15",496.25],["08-16",496.25],["08-17",504.25],["08-20",504.25],["08-21",501.0],["08-22",500.25],["08-23",504.5],["08-24",501.9],["08-28",488.5],["08-29",488.25],["08-30",484.5],["08-31",486.25],["09-03",487.0],["09-04",487.0],["09-05",484.5],["09-06",486.0],["09-07",477.7],["09-10",471.25],["09-11",459.25],["09-12",455.65],["09-13",457.0],["09-14",457.5],["09-17",458.3],["09-18",462.0],["09-19",458.75],["09-20",456.35],["09-21",454.5],["09-24",451.25],["09-25",462.5],["09-26",451.85],["09-27",443.0],["09-28",431.25],["10-01",430.0],["10-02",444.0],["10-03",444.0],["10-04",441.25],["10-05",445.6],["10-08",444.35],["10-09",448.0],["10-10",443.75],["10-11",432.2],["10-12",413.25],["10-15",403.25],["10-16",389.75],["10-17",395.55],["10-18",397.6],["10-19",407.25],["10-22",412.35],["10-23",422.25],["10-24",426.15],["10-25",424.75],["10-26",420.0],["10-29",413.75],["10-30",418.25],["10-31",435.55],["11-01",435.75],["11-02",423.25],["11-05",419.0],["11-06",426.25],["11-07",422.25],["11-08",421.0],["11-09",413.75],["11-12",407.3],["11-13",417.0],["11-14",416.6],["11-15",413.35],["11-16",423.0],["11-19",417.25],["11-20",416.75],["11-21",413.85],["11-22",420.5],["11-23",421.25],["11-26",432.75],["11-27",424.75],["11-28",426.75],["11-29",428.75],["11-30",425.1],["12-03",429.25],["12-04",431.9],["12-05",429.75],["12-06",431.25],["12-07",427.9],["12-10",420.25],["12-11",422.75],["12-12",423.6],["12-13",419.5],["12-14",415.75],["12-17",417.1],["12-18",414.0],["12-19",416.0],["12-20",424.0],["12-21",419.75],["12-24",415.25],["12-27",414.65],["12-28",411.25],["12-31",415.0]]},"1991":{"Gold":[["01-02",392.5],["01-03",386.75],["01-04",388.1],["01-07",391.0],["01-08",392.8],["01-09",390.7],["01-10",388.5],["01-11",390.4],["01-14",395.35],["01-15",398.0],["01-16",403.7],["01-17",383.5],["01-18",380.0],["01-21",378.25],["01-22",381.25],["01-23",377.9],["01-24",377.05],["01-25",373.8],["01-28",374.5],["01-29",377.6],["01-30",369.75],["01-31",369.6],["02-01",367.95],["02-04",367.0],["02-05",367.15],["02-06",360.9],["02-07",363.5],["02-08",368.3],["02-11",368.0],["02-12",362.05],["02-13",367.05],["02-14",366.85],["02-15",366.25],["02-18",364.6],["02-19",361.6],["02-20",363.75],["02-21",361.5],["02-22",358.9],["02-25",357.5],["02-26",359.1],["02-27",360.0],["02-28",363.0],["03-01",367.45],["03-04",365.5],["03-05",364.3],["03-06",363.6],["03-07",366.25],["03-08",367.5],["03-11",369.25],["03-12",363.95],["03-13",365.2],["03-14",365.7],["03-15",363.6],["03-18",363.4],["03-19",362.0],["03-20",364.2],["03-21",362.1],["03-22",362.95],["03-25",361.75],["03-26",358.0],["03-27",357.1],["03-28",354.0],["04-02",357.9],["04-03",357.85],["04-04",358.1],["04-05",358.3],["04-08",358.8],["04-09",361.2],["04-10",363.65],["04-11",360.75],["04-12",361.45],["04-15",360.6],["04-16",360.3],["04-17",361.0],["04-18",361.2],["04-19",357.1],["04-22",356.25],["04-23",356.9],["04-24",355.9],["04-25",353.0],["04-26",354.15],["04-29",351.3],["04-30",353.45],["05-01",356.25],["05-02",355.35],["05-03",356.45],["05-07",356.25],["05-08",356.4],["05-09",356.85],["05-10",356.3],["05-13",356.75],["05-14",358.0],["05-15",360.25],["05-16",358.35],["05-17",354.95],["05-20",353.9],["05-21",356.75],["05-22",356.75],["05-23",355.0],["05-24",355.5],["05-28",356.3],["05-29",360.75],["05-30",360.8],["05-31",361.55],["06-03",361.5],["06-04",362.0],["06-05",361.6],["06-06",363.4],["06-07",365.8],["06-10",367.6],["06-11",372.75],["06-12",370.7],["06-13",368.4],["06-14",369.0],["06-17",367.3],["06-18",368.0],["06-19",367.3],["06-20",367.8],["06-21",367.4],["06-24",365.2],["06-25",363.25],["06-26",366.0],["06-27",365.3],["06-28",366.9],["07-01",368.65],["07-02",366.65],["07-03",367.75],["07-04",369.4],["07-05",370.25],["07-08",371.35],["07-09",369.0],["07-10",370.2],["07-11",368.85],["07-12",367.9],["07-15",369.1],["07-16",368.5],["07-17",369.2],["07-18",370.35],["07-19",370.3],["07-22",370.1],["07-23",368.05],["07-24",367.0],["07-25",365.1],["07-26",364.7],["07-29",366.0],["07-30",362.3],["07-31",363.6],["08-01",364.3],["08-02",360.35],["08-05",355.6],["08-06",357.2],["08-07",355.85],["08-08",357.0],["08-09",357.85],["08-12",357.75],["08-13",357.25],["08-14",356.5],["08-15",358.0],["08-16",357.25],["08-19",360.75],["08-20",358.5],["08-21",356.2],["08-22",356.5],["08-23",354.4],["08-27",354.1],["08-28",355.3],["08-29",353.5],["08-30",347.0],["09-02",347.6],["09-03",349.15],["09-04",348.6],["09-05",347.3],["09-06",347.0],["09-09",350.1],["09-10",351.2],["09-11",347.5],["09-12",345.45],["09-13",343.5],["09-16",344.9],["09-17",346.35],["09-18",348.0],["09-19",349.55],["09-20",347.55],["09-23",349.05],["09-24",351.25],["09-25",352.4],["09-26",352.3],["09-27",348.4],["09-30",350.5],["10-01",353.0],["10-02",354.4],["10-03",357.2],["10-04",357.0],["10-07",359.2],["10-08",358.5],["10-09",357.6],["10-10",359.55],["10-11",357.25],["10-14",360.3],["10-15",358.6],["10-16",356.4],["10-17",357.75],["10-18",360.25],["10-21",363.1],["10-22",362.9],["10-23",362.9],["10-24",359.8],["10-25",362.0],["10-28",359.5],["10-29",358.6],["10-30",359.8],["10-31",357.4],["11-01",357.5],["11-04",356.65],["11-05",356.45],["11-06",354.4],["11-07",355.3],["11-08",353.35],["11-11",354.9],["11-12",355.1],["11-13",356.45],["11-14",356.15],["11-15",355.3],["11-18",360.05],["11-19",359.85],["11-20",362.55],["11-21",363.75],["11-22",367.2],["11-25",368.4],["11-26",367.0],["11-27",366.5],["11-28",365.45],["11-29",366.85],["12-02",368.25],["12-03",366.0],["12-04",365.7],["12-05",365.75],["12-06",367.9],["12-09",370.2],["12-10",370.75],["12-11",367.7],["12-12",366.1],["12-13",358.9],["12-16",360.05],["12-17",357.1],["12-18",357.5],["12-19",357.95],["12-20",356.25],["12-23",359.2],["12-24",359.4],["12-27",356.1],["12-30",353.3],["12-31",353.4]],"Palladium":[["01-02",81.75],["01-03",82.25],["01-04",83.5],["01-07",83.75],["01-08",86.25],["01-09",86.0],["01-10",86.5],["01-11",87.75],["01-14",93.0],["01-15",89.75],["01-16",90.75],["01-17",89.25],["01-18",90.5],["01-21",91.25],["01-22",90.75],["01-23",88.25],["01-24",86.25],["01-25",87.85],["01-28",87.0],["01-29",87.75],["01-30",82.25],["01-31",83.35],["02-01",84.75],["02-04",85.75],["02-05",83.5],["02-06",83.5],["02-07",83.75],["02-08",85.25],["02-11",88.4],["02-12",86.75],["02-13",86.25],["02-14",87.25],["02-15",86.75],["02-18",86.0],["02-19",86.0],["02-20",85.0],["02-21",80.85],["02-22",79.25],["02-25",79.25],["02-26",80.5],["02-27",82.5],["02-28",83.25],["03-01",86.35],["03-04",86.5],["03-05",83.6],["03-06",83.35],["03-07",84.0],["03-08",86.75],["03-11",89.5],["03-12",85.75],["03-13",85.85],["03-14",86.5],["03-15",86.1],["03-18",85.5],["03-19",85.2],["03-20",87.25],["03-21",86.75],["03-22",88.0],["03-25",86.0],["03-26",84.25],["03-27",85.4],["03-28",88.0],["04-02",90.75],["04-03",92.75],["04-04",92.5],["04-05",93.35],["04-08",92.25],["04-09",93.5],["04-10",94.5],["04-11",94.75],["04-12",96.1],["04-15",96.75],["04-16",95.5],["04-17",96.25],["04-18",99.5],["04-19",96.55],["04-22",96.5],["04-23",101.25],["04-24",101.15],["04-25",100.75],["04-26",102.65],["04-29",100.25],["04-30",100.5],["05-01",100.5],["05-02",97.25],["05-03",96.55],["05-07",95.5],["05-08",95.75],["05-09",94.75],["05-10",94.75],["05-13",95.0],["05-14",94.8],["05-15",95.45],["05-16",95.0],["05-17",94.5],["05-20",94.0],["05-21",94.25],["05-22",94.5],["05-23",94.0],["05-24",93.65],["05-28",94.25],["05-29",94.25],["05-30",99.1],["05-31",100.5],["06-03",97.55],["06-04",96.25],["06-05",96.4],["06-06",96.0],["06-07",96.35],["06-10",96.75],["06-11",97.5],["06-12",98.15],["06-13",96.25],["06-14",96.25],["06-17",96.1],["06-18",96.0],["06-19",98.0],["06-20",98.6],["06-21",99.0],["06-24",98.5],["06-25",97.5],["06-26",96.65],["06-27",95.25],["06-28",96.85],["07-01",97.65],["07-02",97.0],["07-03",96.75],["07-04",96.5],["07-05",96.75],["07-08",97.35],["07-09",96.5],["07-10",96.0],["07-11",95.0],["07-12",94.5],["07-15",95.0],["07-16",94.75],["07-17",94.85],["07-18",94.9],["07-19",95.15],["07-22",95.5],["07-23",95.75],["07-24",94.5],["07-25",93.75],["07-26",93.15],["07-29",91.75],["07-30",88.5],["07-31",87.25],["08-01",88.5],["08-02",86.35],["08-05",84.5],["08-06",85.75],["08-07",86.0],["08-08",86.25],["08-09",84.75],["08-12",84.5],["08-13",84.5],["08-14",82.0],["08-15",80.75],["08-16",78.75],["08-19",85.25],["08-20",81.0],["08-21",80.75],["08-22",81.5],["08-23",80.5],["08-27",80.65],["08-28",81.75],["08-29",82.25],["08-30",81.0],["09-02",81.5],["09-03",80.75],["09-04",81.65],["09-05",81.5],["09-06",81.0],["09-09",82.0],["09-10",82.0],["09-11",81.5],["09-12",81.75],["09-13",81.5],["09-16",81.5],["09-17",81.0],["09-18",81.75],["09-19",82.25],["09-20",82.0],["09-23",82.25],["09-24",82.75],["09-25",83.5],["09-26",83.75],["09-27",81.25],["09-30",82.25],["10-01",82.4],["10-02",82.5],["10-03",84.0],["10-04",84.0],["10-07",84.5],["10-08",83.75],["10-09",83.75],["10-10",86.0],["10-11",86.25],["10-14",88.0],["10-15",87.0],["10-16",85.5],["10-17",85.25],["10-18",85.5],["10-21",86.4],["10-22",86.0],["10-23",86.1],["10-24",85.65],["10-25",86.0],["10-28",85.9],["10-29",85.25],["10-30",85.9],["10-31",86.0],["11-01",86.25],["11-04",87.0],["11-05",87.0],["11-06",86.85],["11-07",87.1],["11-08",85.0],["11-11",85.5],["11-12",86.0],["11-13",86.0],["11-14",85.0],["11-15",84.25],["11-18",84.6],["11-19",84.4],["11-20",85.0],["11-21",85.25],["11-22",85.25],["11-25",84.75],["11-26",85.0],["11-27",84.0],["11-28",85.1],["11-29",84.75],["12-02",84.25],["12-03",83.25],["12-04",83.5],["12-05",83.6],["12-06",84.6],["12-09",85.75],["12-10",85.5],["12-11",85.25],["12-12",84.75],["12-13",83.75],["12-16",83.75],["12-17",81.75],["12-18",82.65],["12-19",82.1],["12-20",80.2],["12-23",79.75],["12-24",80.25],["12-27",80.5],["12-30",79.75],["12-31",79.75]],"Platinum":[["01-02",416.25],["01-03",412.0],["01-04",415.75],["01-07",416.75],["01-08",417.0],["01-09",414.25],["01-10",413.5],["01-11",419.25],["01-14",424.3],["01-15",420.35],["01-16",424.0],["01-17",415.25],["01-18",413.0],["01-21",415.5],["01-22",408.65],["01-23",403.5],["01-24",392.25],["01-25",391.75],["01-28",386.25],["01-29",393.0],["01-30",386.5],["01-31",392.75],["02-01",394.75],["02-04",392.0],["02-05",383.75],["02-06",379.75],["02-07",383.0],["02-08",384.75],["02-11",385.0],["02-12",380.0],["02-13",383.25],["02-14",387.1],["02-15",386.15],["02-18",388.5],["02-19",389.25],["02-20",388.0],["02-21",382.5],["02-22",379.35],["02-25",382.35],["02-26",385.5],["02-27",393.5],["02-28",397.0],["03-01",401.75],["03-04",406.1],["03-05",397.0],["03-06",398.5],["03-07",401.55],["03-08",407.0],["03-11",416.1],["03-12",404.0],["03-13",406.5],["03-14",405.35],["03-15",401.75],["03-18",401.0],["03-19",398.1],["03-20",401.45],["03-21",394.25],["03-22",397.7],["03-25",396.75],["03-26",392.0],["03-27",390.0],["03-28",391.6],["04-02",394.5],["04-03",398.5],["04-04",398.95],["04-05",403.25],["04-08",402.0],["04-09",403.25],["04-10",406.0],["04-11",401.0],["04-12",403.0],["04-15",401.25],["04-16",398.0],["04-17",400.75],["04-18",404.5],["04-19",394.75],["04-22",392.75],["04-23",392.75],["04-24",393.45],["04-25",392.1],["04-26",392.0],["04-29",387.5],["04-30",391.0],["05-01",394.25],["05-02",392.35],["05-03",393.5],["05-07",392.2],["05-08",393.5],["05-09",393.75],["05-10",390.0],["05-13",389.5],["05-14",390.5],["05-15",392.9],["05-16",392.25],["05-17",389.1],["05-20",388.5],["05-21",391.1],["05-22",392.75],["05-23",389.85],["05-24",390.25],["05-28",391.0],["05-29",392.65],["05-30",369.5],["05-31",378.25],["06-03",376.3],["06-04",378.4],["06-05",378.5],["06-06",380.75],["06-07",382.5],["06-10",381.25],["06-11",381.75],["06-12",379.75],["06-13",375.25],["06-14",373.75],["06-17",369.75],["06-18",369.25],["06-19",368.25],["06-20",373.0],["06-21",375.35],["06-24",374.0],["06-25",372.55],["06-26",374.9],["06-27",374.75],["06-28",376.75],["07-01",379.85],["07-02",379.65],["07-03",380.25],["07-04",378.9],["07-05",381.65],["07-08",384.05],["07-09",382.75],["07-10",382.9],["07-11",378.5],["07-12",375.25],["07-15",377.9],["07-16",377.75],["07-17",380.0],["07-18",381.0],["07-19",379.8],["07-22",379.1],["07-23",378.4],["07-24",374.25],["07-25",368.35],["07-26",363.85],["07-29",366.5],["07-30",358.5],["07-31",362.0],["08-01",363.5],["08-02",352.85],["08-05",348.75],["08-06",354.6],["08-07",354.5],["08-08",352.75],["08-09",352.75],["08-12",353.5],["08-13",351.75],["08-14",348.25],["08-15",340.5],["08-16",341.75],["08-19",351.5],["08-20",349.35],["08-21",345.5],["08-22",341.75],["08-23",336.35],["08-27",335.25],["08-28",339.9],["08-29",341.5],["08-30",335.25],["09-02",338.5],["09-03",342.75],["09-04",344.0],["09-05",338.5],["09-06",341.0],["09-09",348.25],["09-10",349.6],["09-11",346.5],["09-12",346.0],["09-13",345.8],["09-16",347.85],["09-17",350.9],["09-18",354.75],["09-19",354.5],["09-20",352.55],["09-23",353.75],["09-24",358.3],["09-25",357.5],["09-26",356.25],["09-27",348.8],["09-30",350.9],["10-01",354.0],["10-02",351.25],["10-03",357.25],["10-04",360.25],["10-07",359.25],["10-08",356.25],["10-09",356.75],["10-10",365.25],["10-11",361.65],["10-14",369.0],["10-15",367.75],["10-16",365.75],["10-17",367.25],["10-18",369.35],["10-21",371.25],["10-22",368.25],["10-23",367.1],["10-24",363.0],["10-25",362.75],["10-28",362.5],["10-29",357.25],["10-30",363.0],["10-31",362.0],["11-01",362.0],["11-04",362.25],["11-05",364.35],["11-06",362.25],["11-07",364.5],["11-08",358.75],["11-11",359.75],["11-12",361.75],["11-13",363.65],["11-14",360.5],["11-15",358.75],["11-18",362.5],["11-19",362.65],["11-20",366.15],["11-21",369.9],["11-22",371.6],["11-25",371.5],["11-26",369.9],["11-27",367.25],["11-28",371.85],["11-29",369.35],["12-02",369.5],["12-03",364.5],["12-04",365.5],["12-05",367.35],["12-06",370.25],["12-09",372.25],["12-10",371.5],["12-11",368.1],["12-12",367.25],["12-13",361.65],["12-16",359.5],["12-17",347.5],["12-18",348.75],["12-19",344.4],["12-20",334.75],["12-23",341.5],["12-24",339.85],["12-27",336.0],["12-30",330.0],["12-31",334.2]],"Silver":[["01-02",4.16],["01-03",4.1],["01-04",4.21],["01-07",4.2],["01-08",4.25],["01-09",4.08],["01-10",4.14],["01-11",4.15],["01-14",4.2],["01-15",4.21],["01-16",4.22],["01-17",4.1],["01-18",4.04],["01-21",4.04],["01-22",4.03],["01-23",3.98],["01-24",3.87],["01-25",3.83],["01-28",3.81],["01-29",3.86],["01-30",3.81],["01-31",3.83],["02-01",3.88],["02-04",3.86],["02-05",3.82],["02-06",3.81],["02-07",3.8],["02-08",3.83],["02-11",3.82],["02-12",3.66],["02-13",3.72],["02-14",3.77],["02-15",3.82],["02-18",3.78],["02-19",3.74],["02-20",3.7],["02-21",3.66],["02-22",3.62],["02-25",3.55],["02-26",3.63],["02-27",3.61],["02-28",3.68],["03-01",3.75],["03-04",3.75],["03-05",3.82],["03-06",3.83],["03-07",3.91],["03-08",4.0],["03-11",4.17],["03-12",3.98],["03-13",4.06],["03-14",4.03],["03-15",4.03],["03-18",4.05],["03-19",3.94],["03-20",4.04],["03-21",3.98],["03-22",4.01],["03-25",3.95],["03-26",3.92],["03-27",3.9],["03-28",3.84],["04-02",3.94],["04-03",4.07],["04-04",4.06],["04-05",4.04],["04-08",3.96],["04-09",4.0],["04-10",4.02],["04-11",3.99],["04-12",4.02],["04-15",3.98],["04-16",4.02],["04-17",4.07],["04-18",4.12],["04-19",3.95],["04-22",3.92],["04-23",3.94],["04-24",3.94],["04-25",3.87],["04-26",3.9],["04-29",3.89],["04-30",3.93],["05-01",3.97],["05-02",3.93],["05-03",4.02],["05-07",4.03],["05-08",4.03],["05-09",4.06],["05-10",4.03],["05-13",4.04],["05-14",4.0],["05-15",4.12],["05-16",4.1],["05-17",4.02],["05-20",4.0],["05-21",4.04],["05-22",4.09],["05-23",4.04],["05-24",4.05],["05-28",4.06],["05-29",4.14],["05-30",4.12],["05-31",4.13],["06-03",4.16],["06-04",4.15],["06-05",4.17],["06-06",4.24],["06-07",4.49],["06-10",4.57],["06-11",4.48],["06-12",4.51],["06-13",4.46],["06-14",4.51],["06-17",4.39],["06-18",4.48],["06-19",4.43],["06-20",4.44],["06-21",4.44],["06-24",4.34],["06-25",4.36],["06-26",4.42],["06-27",4.36],["06-28",4.45],["07-01",4.45],["07-02",4.42],["07-03",4.43],["07-04",4.5],["07-05",4.53],["07-08",4.5],["07-09",4.46],["07-10",4.48],["07-11",4.42],["07-12",4.38],["07-15",4.39],["07-16",4.37],["07-17",4.4],["07-18",4.45],["07-19",4.39],["07-22",4.4],["07-23",4.33],["07-24",4.23],["07-25",4.13],["07-26",4.1],["07-29",4.11],["07-30",4.05],["07-31",4.07],["08-01",4.05],["08-02",3.97],["08-05",3.94],["08-06",3.96],["08-07",3.96],["08-08",3.97],["08-09",3.97],["08-12",3.99],["08-13",3.95],["08-14",3.95],["08-15",3.97],["08-16",3.96],["08-19",4.05],["08-20",4.0],["08-21",3.93],["08-22",3.94],["08-23",3.88],["08-27",3.95],["08-28",3.95],["08-29",3.94],["08-30",3.81],["09-02",3.83],["09-03",3.87],["09-04",3.93],["09-05",3.86],["09-06",3.87],["09-09",4.0],["09-10",4.06],["09-11",3.97],["09-12",3.97],["09-13",3.96],["09-16",4.06],["09-17",4.08],["09-18",4.09],["09-19",4.09],["09-20",4.07],["09-23",4.12],["09-24",4.25],["09-25",4.24],["09-26",4.22],["09-27",4.09],["09-30",4.13],["10-01",4.15],["10-02",4.22],["10-03",4.17],["10-04",4.17],["10-07",4.13],["10-08",4.07],["10-09",4.08],["10-10",4.12],["10-11",4.05],["10-14",4.1],["10-15",4.08],["10-16",4.05],["10-17",4.12],["10-18",4.12],["10-21",4.17],["10-22",4.16],["10-23",4.14],["10-24",4.09],["10-25",4.12],["10-28",4.08],["10-29",4.05],["10-30",4.11],["10-31",4.09],["11-01",4.1],["11-04",4.08],["11-05",4.11],["11-06",4.07],["11-07",4.07],["11-08",4.03],["11-11",4.04],["11-12",4.04],["11-13",4.05],["11-14",4.04],["11-15",4.01],["11-18",4.05],["11-19",4.04],["11-20",4.08],["11-21",4.1],["11-22",4.13],["11-25",4.14],["11-26",4.09],["11-27",4.1],["11-28",4.1],["11-29",4.07],["12-02",4.09],["12-03",4.07],["12-04",4.05],["12-05",4.05],["12-06",4.07],["12-09",4.07],["12-10",4.04],["12-11",4.0],["12-12",3.95],["12-13",3.85],["12-16",3.87],["12-17",3.85],["12-18",3.88],["12-19",3.85],["12-20",3.82],["12-23",3.89],["12-24",3.9],["12-27",3.9],["12-30",3.86],["12-31",3.86]]},"1992":{"Gold":[["01-02",351.2],["01-03",352.4],["01-06",351.15],["01-07",349.3],["01-08",350.3],["01-09",351.75],["01-10",356.65],["01-13",354.9],["01-14",353.4],["01-15",355.6],["01-16",354.6],["01-17",357.3],["01-20",356.6],["01-21",357.35],["01-22",356.85],["01-23",356.55],["01-24",354.5],["01-27",354.85],["01-28",356.3],["01-29",355.4],["01-30",356.5],["01-31",354.15],["02-03",357.1],["02-04",356.35],["02-05",354.95],["02-06",356.25],["02-07",355.4],["02-10",354.7],["02-11",355.25],["02-12",356.35],["02-13",356.65],["02-14",355.35],["02-17",354.2],["02-18",353.5],["02-19",352.35],["02-20",353.05],["02-21",353.25],["02-24",349.0],["02-25",350.65],["02-26",348.8],["02-27",350.85],["02-28",353.05],["03-02",350.55],["03-03",351.0],["03-04",350.2],["03-05",349.6],["03-06",350.55],["03-09",349.0],["03-10",348.9],["03-11",349.0],["03-12",348.65],["03-13",347.25],["03-16",346.75],["03-17",343.35],["03-18",340.0],["03-19",338.5],["03-20",337.6],["03-23",338.0],["03-24",337.75],["03-25",340.1],["03-26",340.75],["03-27",340.35],["03-30",342.75],["03-31",341.5],["04-01",343.75],["04-02",341.25],["04-03",340.25],["04-06",340.5],["04-07",338.5],["04-08",337.7],["04-09",338.4],["04-10",341.0],["04-13",342.0],["04-14",338.8],["04-15",339.6],["04-16",336.8],["04-21",338.2],["04-22",338.3],["04-23",338.6],["04-24",336.55],["04-27",336.5],["04-28",336.85],["04-29",334.75],["04-30",336.25],["05-01",337.1],["05-05",336.5],["05-06",336.75],["05-07",336.25],["05-08",334.85],["05-11",336.5],["05-12",334.9],["05-13",334.75],["05-14",336.5],["05-15",338.15],["05-18",339.2],["05-19",340.0],["05-20",337.45],["05-21",337.45],["05-22",337.2],["05-26",337.0],["05-27",338.45],["05-28",337.2],["05-29",337.55],["06-01",336.8],["06-02",337.75],["06-03",339.85],["06-04",338.65],["06-05",338.85],["06-08",338.5],["06-09",337.7],["06-10",337.85],["06-11",338.0],["06-12",340.25],["06-15",342.25],["06-16",342.15],["06-17",342.1],["06-18",340.9],["06-19",343.5],["06-22",341.6],["06-23",344.1],["06-24",344.0],["06-25",343.15],["06-26",343.35],["06-29",342.55],["06-30",343.4],["07-01",343.6],["07-02",344.65],["07-03",345.8],["07-06",346.2],["07-07",345.8],["07-08",347.7],["07-09",347.2],["07-10",348.75],["07-13",348.9],["07-14",350.4],["07-15",350.95],["07-16",353.15],["07-17",352.65],["07-20",358.8],["07-21",357.4],["07-22",357.1],["07-23",359.3],["07-24",357.9],["07-27",358.0],["07-28",359.25],["07-29",358.2],["07-30",356.75],["07-31",357.95],["08-03",357.3],["08-04",352.75],["08-05",352.9],["08-06",349.25],["08-07",349.85],["08-10",350.75],["08-11",348.5],["08-12",346.5],["08-13",339.25],["08-14",336.0],["08-17",337.5],["08-18",336.55],["08-19",338.6],["08-20",336.7],["08-21",337.35],["08-24",341.85],["08-25",340.85],["08-26",340.35],["08-27",338.75],["08-28",340.5],["09-01",342.65],["09-02",340.4],["09-03",339.05],["09-04",341.3],["09-07",343.25],["09-08",341.9],["09-09",343.1],["09-10",341.75],["09-11",341.05],["09-14",342.75],["09-15",346.2],["09-16",346.2],["09-17",350.75],["09-18",348.65],["09-21",348.25],["09-22",347.5],["09-23",348.9],["09-24",348.9],["09-25",348.35],["09-28",349.0],["09-29",347.7],["09-30",349.0],["10-01",347.6],["10-02",348.0],["10-05",348.75],["10-06",350.5],["10-07",349.5],["10-08",350.0],["10-09",349.8],["10-12",348.1],["10-13",343.45],["10-14",343.3],["10-15",341.75],["10-16",341.75],["10-19",342.25],["10-20",342.55],["10-21",343.5],["10-22",342.8],["10-23",343.6],["10-26",341.3],["10-27",339.1],["10-28",338.2],["10-29",339.5],["10-30",338.8],["11-02",339.3],["11-03",338.75],["11-04",336.9],["11-05",337.45],["11-06",336.7],["11-09",335.0],["11-10",330.2],["11-11",331.95],["11-12",333.2],["11-13",334.25],["11-16",336.0],["11-17",333.85],["11-18",335.4],["11-19",333.6],["11-20",335.55],["11-23",334.25],["11-24",333.95],["11-25",334.75],["11-26",334.65],["11-27",334.0],["11-30",333.7],["12-01",334.6],["12-02",335.1],["12-03",335.9],["12-04",335.9],["12-07",335.5],["12-08",335.25],["12-09",333.4],["12-10",333.9],["12-11",334.2],["12-14",335.3],["12-15",334.7],["12-16",334.9],["12-17",337.75],["12-18",337.15],["12-21",336.35],["12-22",334.35],["12-23",332.55],["12-24",332.9],["12-29",332.9],["12-30",332.3],["12-31",332.9]],"Palladium":[["01-02",80.0],["01-03",80.0],["01-06",79.25],["01-07",79.35],["01-08",79.25],["01-09",80.5],["01-10",81.5],["01-13",80.75],["01-14",81.25],["01-15",81.5],["01-16",82.75],["01-17",84.5],["01-20",84.25],["01-21",83.75],["01-22",84.0],["01-23",84.65],["01-24",84.25],["01-27",85.6],["01-28",86.85],["01-29",86.25],["01-30",87.25],["01-31",86.5],["02-03",86.75],["02-04",87.1],["02-05",86.65],["02-06",85.8],["02-07",86.15],["02-10",85.75],["02-11",85.5],["02-12",86.0],["02-13",86.2],["02-14",86.0],["02-17",86.0],["02-18",85.9],["02-19",86.0],["02-20",85.5],["02-21",86.0],["02-24",84.55],["02-25",84.35],["02-26",83.5],["02-27",83.75],["02-28",83.65],["03-02",83.6],["03-03",84.25],["03-04",83.65],["03-05",83.75],["03-06",83.75],["03-09",84.25],["03-10",84.35],["03-11",84.75],["03-12",84.9],["03-13",84.5],["03-16",84.5],["03-17",84.5],["03-18",84.5],["03-19",84.0],["03-20",84.25],["03-23",84.25],["03-24",84.0],["03-25",84.4],["03-26",85.0],["03-27",84.85],["03-30",85.0],["03-31",85.2],["04-01",85.5],["04-02",85.0],["04-03",84.85],["04-06",85.0],["04-07",84.25],["04-08",84.0],["04-09",83.85],["04-10",84.0],["04-13",84.4],["04-14",83.75],["04-15",84.0],["04-16",83.0],["04-21",82.25],["04-22",82.5],["04-23",82.5],["04-24",82.25],["04-27",82.5],["04-28",82.75],["04-29",81.75],["04-30",82.25],["05-01",82.5],["05-05",83.25],["05-06",83.0],["05-07",82.95],["05-08",82.75],["05-11",82.75],["05-12",82.75],["05-13",82.75],["05-14",82.75],["05-15",82.75],["05-18",83.1],["05-19",83.55],["05-20",83.15],["05-21",83.0],["05-22",82.95],["05-26",82.65],["05-27",82.75],["05-28",82.5],["05-29",81.5],["06-01",79.15],["06-02",80.0],["06-03",80.6],["06-04",79.1],["06-05",80.25],["06-08",80.0],["06-09",80.25],["06-10",80.25],["06-11",80.65],["06-12",81.25],["06-15",81.5],["06-16",81.3],["06-17",81.25],["06-18",80.75],["06-19",80.85],["06-22",80.75],["06-23",81.25],["06-24",80.75],["06-25",80.85],["06-26",81.0],["06-29",81.1],["06-30",82.25],["07-01",82.25],["07-02",82.75],["07-03",83.0],["07-06",83.25],["07-07",83.25],["07-08",83.35],["07-09",83.7],["07-10",84.75],["07-13",86.15],["07-14",89.4],["07-15",89.1],["07-16",88.45],["07-17",88.5],["07-20",89.75],["07-21",89.5],["07-22",88.0],["07-23",90.0],["07-24",89.35],["07-27",89.75],["07-28",89.5],["07-29",88.65],["07-30",88.5],["07-31",91.0],["08-03",88.45],["08-04",86.5],["08-05",86.85],["08-06",86.15],["08-07",87.85],["08-10",87.75],["08-11",87.25],["08-12",87.25],["08-13",84.75],["08-14",82.25],["08-17",83.5],["08-18",82.65],["08-19",83.55],["08-20",83.5],["08-21",84.4],["08-24",85.15],["08-25",85.15],["08-26",85.5],["08-27",85.9],["08-28",86.5],["09-01",87.1],["09-02",87.25],["09-03",88.75],["09-04",89.25],["09-07",90.25],["09-08",90.35],["09-09",91.5],["09-10",91.1],["09-11",88.75],["09-14",89.25],["09-15",90.25],["09-16",91.35],["09-17",92.5],["09-18",91.0],["09-21",90.5],["09-22",91.25],["09-23",91.25],["09-24",92.5],["09-25",92.65],["09-28",92.5],["09-29",93.0],["09-30",95.25],["10-01",96.75],["10-02",96.5],["10-05",95.75],["10-06",95.85],["10-07",95.0],["10-08",95.9],["10-09",94.6],["10-12",96.0],["10-13",95.5],["10-14",93.25],["10-15",93.5],["10-16",94.25],["10-19",95.15],["10-20",94.4],["10-21",94.35],["10-22",94.0],["10-23",94.4],["10-26",94.25],["10-27",94.0],["10-28",93.75],["10-29",93.5],["10-30",93.9],["11-02",94.0],["11-03",94.4],["11-04",94.5],["11-05",96.25],["11-06",96.0],["11-09",95.5],["11-10",93.25],["11-11",93.0],["11-12",93.5],["11-13",94.1],["11-16",94.25],["11-17",94.75],["11-18",95.0],["11-19",95.1],["11-20",94.9],["11-23",94.85],["11-24",94.85],["11-25",93.9],["11-26",94.25],["11-27",94.15],["11-30",94.5],["12-01",96.25],["12-02",97.0],["12-03",101.9],["12-04",101.75],["12-07",105.0],["12-08",110.0],["12-09",107.0],["12-10",106.9],["12-11",110.0],["12-14",113.5],["12-15",112.3],["12-16",109.5],["12-17",111.0],["12-18",111.25],["12-21",108.0],["12-22",107.75],["12-23",106.25],["12-24",107.0],["12-29",106.5],["12-30",106.25],["12-31",106.25]],"Platinum":[["01-02",336.5],["01-03",337.0],["01-06",334.25],["01-07",332.75],["01-08",335.5],["01-09",337.25],["01-10",341.0],["01-13",335.5],["01-14",333.7],["01-15",337.4],["01-16",338.25],["01-17",343.0],["01-20",343.75],["01-21",343.2],["01-22",339.75],["01-23",345.85],["01-24",345.75],["01-27",348.25],["01-28",353.4],["01-29",346.5],["01-30",353.0],["01-31",349.4],["02-03",357.0],["02-04",360.9],["02-05",358.25],["02-06",362.25],["02-07",367.5],["02-10",366.5],["02-11",364.1],["02-12",367.5],["02-13",367.5],["02-14",366.0],["02-17",362.5],["02-18",361.75],["02-19",358.5],["02-20",361.25],["02-21",363.0],["02-24",357.9],["02-25",359.85],["02-26",353.8],["02-27",357.75],["02-28",359.65],["03-02",358.5],["03-03",361.85],["03-04",360.75],["03-05",363.25],["03-06",363.75],["03-09",362.1],["03-10",363.0],["03-11",363.25],["03-12",361.5],["03-13",359.25],["03-16",361.0],["03-17",358.25],["03-18",353.9],["03-19",348.0],["03-20",351.25],["03-23",349.0],["03-24",348.85],["03-25",353.35],["03-26",352.25],["03-27",351.0],["03-30",353.25],["03-31",353.4],["04-01",360.25],["04-02",357.25],["04-03",356.5],["04-06",355.5],["04-07",349.35],["04-08",348.0],["04-09",345.85],["04-10",349.25],["04-13",348.5],["04-14",346.25],["04-15",348.5],["04-16",345.6],["04-21",341.25],["04-22",341.6],["04-23",342.85],["04-24",343.25],["04-27",344.85],["04-28",344.0],["04-29",340.75],["04-30",344.75],["05-01",347.75],["05-05",352.75],["05-06",352.65],["05-07",351.1],["05-08",351.0],["05-11",353.0],["05-12",353.1],["05-13",352.8],["05-14",357.25],["05-15",358.6],["05-18",357.0],["05-19",363.0],["05-20",359.75],["05-21",361.25],["05-22",361.0],["05-26",365.15],["05-27",365.5],["05-28",366.85],["05-29",370.05],["06-01",367.25],["06-02",371.6],["06-03",376.75],["06-04",373.9],["06-05",373.2],["06-08",369.45],["06-09",368.2],["06-10",367.25],["06-11",367.9],["06-12",372.4],["06-15",371.65],["06-16",369.0],["06-17",369.25],["06-18",365.25],["06-19",366.35],["06-22",363.8],["06-23",366.5],["06-24",366.6],["06-25",365.1],["06-26",366.85],["06-29",366.75],["06-30",378.5],["07-01",380.0],["07-02",385.5],["07-03",386.1],["07-06",385.5],["07-07",384.6],["07-08",384.75],["07-09",382.35],["07-10",385.0],["07-13",386.25],["07-14",392.1],["07-15",389.5],["07-16",385.75],["07-17",382.7],["07-20",392.0],["07-21",383.9],["07-22",377.9],["07-23",383.0],["07-24",380.5],["07-27",378.35],["07-28",377.4],["07-29",374.0],["07-30",374.6],["07-31",385.5],["08-03",380.0],["08-04",376.85],["08-05",377.35],["08-06",374.25],["08-07",377.5],["08-10",375.75],["08-11",367.9],["08-12",368.75],["08-13",352.5],["08-14",345.65],["08-17",348.25],["08-18",342.75],["08-19",347.75],["08-20",348.25],["08-21",351.5],["08-24",353.5],["08-25",349.0],["08-26",349.5],["08-27",353.25],["08-28",356.15],["09-01",361.75],["09-02",355.5],["09-03",354.65],["09-04",357.6],["09-07",359.1],["09-08",360.5],["09-09",362.4],["09-10",361.1],["09-11",357.2],["09-14",358.0],["09-15",361.0],["09-16",363.0],["09-17",367.25],["09-18",364.5],["09-21",362.6],["09-22",361.15],["09-23",364.25],["09-24",367.45],["09-25",368.1],["09-28",366.9],["09-29",365.25],["09-30",367.5],["10-01",366.5],["10-02",364.5],["10-05",365.85],["10-06",364.85],["10-07",359.0],["10-08",357.75],["10-09",355.45],["10-12",357.0],["10-13",356.0],["10-14",355.0],["10-15",355.05],["10-16",357.25],["10-19",357.9],["10-20",358.75],["10-21",357.25],["10-22",358.2],["10-23",358.1],["10-26",356.0],["10-27",354.9],["10-28",356.5],["10-29",353.5],["10-30",353.5],["11-02",354.5],["11-03",356.5],["11-04",355.25],["11-05",359.5],["11-06",362.25],["11-09",362.0],["11-10",354.6],["11-11",350.65],["11-12",351.25],["11-13",353.15],["11-16",353.05],["11-17",353.35],["11-18",353.5],["11-19",354.5],["11-20",355.5],["11-23",358.65],["11-24",356.2],["11-25",356.25],["11-26",356.5],["11-27",355.25],["11-30",357.55],["12-01",362.75],["12-02",361.5],["12-03",363.75],["12-04",363.0],["12-07",365.1],["12-08",368.75],["12-09",363.5],["12-10",362.25],["12-11",363.75],["12-14",365.2],["12-15",363.75],["12-16",362.75],["12-17",365.5],["12-18",363.75],["12-21",358.5],["12-22",358.75],["12-23",359.5],["12-24",360.6],["12-29",359.5],["12-30",356.5],["12-31",355.25]],"Silver":[["01-02",3.87],["01-03",3.98],["01-06",3.94],["01-07",3.95],["01-08",3.94],["01-09",3.98],["01-10",4.14],["01-13",4.07],["01-14",4.05],["01-15",4.14],["01-16",4.14],["01-17",4.33],["01-20",4.23],["01-21",4.26],["01-22",4.25],["01-23",4.29],["01-24",4.2],["01-27",4.17],["01-28",4.2],["01-29",4.16],["01-30",4.24],["01-31",4.13],["02-03",4.18],["02-04",4.17],["02-05",4.17],["02-06",4.22],["02-07",4.2],["02-10",4.19],["02-11",4.18],["02-12",4.2],["02-13",4.21],["02-14",4.19],["02-17",4.15],["02-18",4.13],["02-19",4.06],["02-20",4.1],["02-21",4.1],["02-24",4.08],["02-25",4.12],["02-26",4.07],["02-27",4.1],["02-28",4.12],["03-02",4.09],["03-03",4.12],["03-04",4.11],["03-05",4.11],["03-06",4.15],["03-09",4.16],["03-10",4.17],["03-11",4.15],["03-12",4.14],["03-13",4.11],["03-16",4.11],["03-17",4.04],["03-18",4.07],["03-19",4.02],["03-20",4.1],["03-23",4.11],["03-24",4.11],["03-25",4.11],["03-26",4.09],["03-27",4.09],["03-30",4.15],["03-31",4.12],["04-01",4.15],["04-02",4.09],["04-03",4.09],["04-06",4.09],["04-07",4.09],["04-08",4.09],["04-09",4.1],["04-10",4.13],["04-13",4.12],["04-14",4.08],["04-15",4.1],["04-16",4.03],["04-21",3.98],["04-22",3.99],["04-23",4.02],["04-24",3.99],["04-27",3.99],["04-28",3.98],["04-29",3.94],["04-30",3.98],["05-01",4.01],["05-05",4.01],["05-06",4.07],["05-07",4.04],["05-08",4.04],["05-11",4.11],["05-12",4.08],["05-13",4.08],["05-14",4.1],["05-15",4.12],["05-18",4.1],["05-19",4.12],["05-20",4.08],["05-21",4.08],["05-22",4.07],["05-26",4.09],["05-27",4.1],["05-28",4.08],["05-29",4.06],["06-01",4.03],["06-02",4.07],["06-03",4.09],["06-04",4.06],["06-05",4.08],["06-08",4.05],["06-09",4.05],["06-10",4.06],["06-11",4.06],["06-12",4.11],["06-15",4.12],["06-16",4.1],["06-17",4.11],["06-18",4.09],["06-19",4.11],["06-22",4.05],["06-23",4.06],["06-24",4.04],["06-25",4.04],["06-26",4.02],["06-29",3.99],["06-30",4.03],["07-01",4.05],["07-02",4.07],["07-03",4.04],["07-06",4.05],["07-07",3.92],["07-08",3.91],["07-09",3.91],["07-10",3.96],["07-13",3.94],["07-14",3.95],["07-15",3.95],["07-16",3.94],["07-17",3.92],["07-20",4.0],["07-21",3.95],["07-22",3.96],["07-23",4.01],["07-24",3.98],["07-27",3.97],["07-28",3.97],["07-29",3.94],["07-30",3.92],["07-31",3.95],["08-03",3.94],["08-04",3.88],["08-05",3.88],["08-06",3.9],["08-07",3.93],["08-10",3.98],["08-11",3.94],["08-12",3.89],["08-13",3.81],["08-14",3.81],["08-17",3.82],["08-18",3.79],["08-19",3.8],["08-20",3.73],["08-21",3.73],["08-24",3.76],["08-25",3.71],["08-26",3.65],["08-27",3.69],["08-28",3.72],["09-01",3.75],["09-02",3.72],["09-03",3.72],["09-04",3.74],["09-07",3.73],["09-08",3.73],["09-09",3.75],["09-10",3.73],["09-11",3.69],["09-14",3.75],["09-15",3.79],["09-16",3.84],["09-17",3.83],["09-18",3.81],["09-21",3.82],["09-22",3.79],["09-23",3.83],["09-24",3.82],["09-25",3.82],["09-28",3.81],["09-29",3.73],["09-30",3.77],["10-01",3.75],["10-02",3.73],["10-05",3.75],["10-06",3.76],["10-07",3.75],["10-08",3.73],["10-09",3.75],["10-12",3.74],["10-13",3.72],["10-14",3.71],["10-15",3.73],["10-16",3.71],["10-19",3.72],["10-20",3.74],["10-21",3.81],["10-22",3.8],["10-23",3.8],["10-26",3.75],["10-27",3.75],["10-28",3.77],["10-29",3.77],["10-30",3.76],["11-02",3.76],["11-03",3.79],["11-04",3.79],["11-05",3.87],["11-06",3.91],["11-09",3.86],["11-10",3.71],["11-11",3.69],["11-12",3.69],["11-13",3.8],["11-16",3.76],["11-17",3.76],["11-18",3.77],["11-19",3.75],["11-20",3.77],["11-23",3.75],["11-24",3.76],["11-25",3.76],["11-26",3.76],["11-27",3.75],["11-30",3.73],["12-01",3.76],["12-02",3.76],["12-03",3.76],["12-04",3.76],["12-07",3.76],["12-08",3.76],["12-09",3.71],["12-10",3.71],["12-11",3.72],["12-14",3.73],["12-15",3.72],["12-16",3.71],["12-17",3.75],["12-18",3.77],["12-21",3.75],["12-22",3.73],["12-23",3.7],["12-24",3.69],["12-29",3.67],["12-30",3.66],["12-31",3.67]]},"1993":{"Gold":[["01-04",329.4],["01-05",328.8],["01-06",328.85],["01-07",329.7],["01-08",329.1],["01-11",328.4],["01-12",328.5],["01-13",327.85],["01-14",328.2],["01-15",327.45],["01-18",327.9],["01-19",329.05],["01-20",328.65],["01-21",329.85],["01-22",329.4],["01-25",328.6],["01-26",329.1],["01-27",330.6],["01-28",329.7],["01-29",330.75],["02-01",329.5],["02-02",329.35],["02-03",329.6],["02-04",328.15],["02-05",327.8],["02-08",327.6],["02-09",327.75],["02-10",328.7],["02-11",331.65],["02-12",330.0],["02-15",328.35],["02-16",329.2],["02-17",331.5],["02-18",329.0],["02-19",331.1],["02-22",328.9],["02-23",329.2],["02-24",330.35],["02-25",329.75],["02-26",328.75],["03-01",328.4],["03-02",328.9],["03-03",329.55],["03-04",328.5],["03-05",329.7],["03-08",328.7],["03-09",327.2],["03-10",326.5],["03-11",326.65],["03-12",326.5],["03-15",327.9],["03-16",329.0],["03-17",328.65],["03-18",329.5],["03-19",331.3],["03-22",332.2],["03-23",331.9],["03-24",331.3],["03-25",332.65],["03-26",332.7],["03-29",331.6],["03-30",333.2],["03-31",336.9],["04-01",337.0],["04-02",339.4],["04-05",339.35],["04-06",338.45],["04-07",337.15],["04-08",337.85],["04-13",336.95],["04-14",337.55],["04-15",339.2],["04-16",337.0],["04-19",340.4],["04-20",341.55],["04-21",339.15],["04-22",337.7],["04-23",340.95],["04-26",348.55],["04-27",352.8],["04-28",349.7],["04-29",354.8],["04-30",353.45],["05-04",353.4],["05-05",352.75],["05-06",356.1],["05-07",357.5],["05-10",356.25],["05-11",355.35],["05-12",356.0],["05-13",367.0],["05-14",366.6],["05-17",367.85],["05-18",366.6],["05-19",378.75],["05-20",376.05],["05-21",374.05],["05-24",380.0],["05-25",374.35],["05-26",377.25],["05-27",377.0],["05-28",381.0],["06-01",378.25],["06-02",368.25],["06-03",370.4],["06-04",377.5],["06-07",375.45],["06-08",373.75],["06-09",370.65],["06-10",369.6],["06-11",370.2],["06-14",366.3],["06-15",365.0],["06-16",370.0],["06-17",369.4],["06-18",370.65],["06-21",369.55],["06-22",369.1],["06-23",367.0],["06-24",374.1],["06-25",374.6],["06-28",378.1],["06-29",375.25],["06-30",379.0],["07-01",377.85],["07-02",390.0],["07-05",387.25],["07-06",388.0],["07-07",397.25],["07-08",398.4],["07-09",389.4],["07-12",394.4],["07-13",390.4],["07-14",395.7],["07-15",391.8],["07-16",393.65],["07-19",392.8],["07-20",391.5],["07-21",391.6],["07-22",389.0],["07-23",392.6],["07-26",389.75],["07-27",393.6],["07-28",391.8],["07-29",394.3],["07-30",403.7],["08-02",406.7],["08-03",404.95],["08-04",400.65],["08-05",396.45],["08-06",381.9],["08-09",382.5],["08-10",382.2],["08-11",381.35],["08-12",375.35],["08-13",370.45],["08-16",373.5],["08-17",372.5],["08-18",372.85],["08-19",373.65],["08-20",370.35],["08-23",373.6],["08-24",372.75],["08-25",371.75],["08-26",371.6],["08-27",370.05],["08-31",370.6],["09-01",371.8],["09-02",369.2],["09-03",363.7],["09-06",364.2],["09-07",362.95],["09-08",352.25],["09-09",351.35],["09-10",356.0],["09-13",348.25],["09-14",342.05],["09-15",345.25],["09-16",350.4],["09-17",352.3],["09-20",353.5],["09-21",354.3],["09-22",355.0],["09-23",353.75],["09-24",357.4],["09-27",357.25],["09-28",354.25],["09-29",354.55],["09-30",352.65],["10-01",353.9],["10-04",355.5],["10-05",353.95],["10-06",353.5],["10-07",356.9],["10-08",357.85],["10-11",360.55],["10-12",359.6],["10-13",366.6],["10-14",365.9],["10-15",365.35],["10-18",365.0],["10-19",368.85],["10-20",371.6],["10-21",371.55],["10-22",370.65],["10-25",371.5],["10-26",368.5],["10-27",368.65],["10-28",369.1],["10-29",369.1],["11-01",367.95],["11-02",362.5],["11-03",363.0],["11-04",369.1],["11-05",374.4],["11-08",377.9],["11-09",376.35],["11-10",375.5],["11-11",377.15],["11-12",376.75],["11-15",373.9],["11-16",375.25],["11-17",373.7],["11-18",374.25],["11-19",375.75],["11-22",378.15],["11-23",378.05],["11-24",376.1],["11-25",377.1],["11-26",376.3],["11-29",376.7],["11-30",370.8],["12-01",370.1],["12-02",374.5],["12-03",372.75],["12-06",376.15],["12-07",374.35],["12-08",377.15],["12-09",382.5],["12-10",382.3],["12-13",387.55],["12-14",387.6],["12-15",385.9],["12-16",386.5],["12-17",385.8],["12-20",389.75],["12-21",388.65],["12-22",386.4],["12-23",385.75],["12-24",386.6],["12-29",385.65],["12-30",391.5],["12-31",390.65]],"Palladium":[["01-04",106.25],["01-05",107.75],["01-06",109.1],["01-07",113.4],["01-08",112.75],["01-11",110.75],["01-12",111.0],["01-13",110.6],["01-14",110.5],["01-15",106.65],["01-18",107.25],["01-19",109.75],["01-20",109.75],["01-21",110.65],["01-22",109.5],["01-25",108.25],["01-26",110.5],["01-27",110.5],["01-28",110.25],["01-29",111.35],["02-01",109.75],["02-02",110.85],["02-03",112.0],["02-04",112.25],["02-05",113.75],["02-08",113.25],["02-09",114.75],["02-10",117.5],["02-11",117.75],["02-12",117.0],["02-15",113.0],["02-16",115.5],["02-17",115.15],["02-18",112.5],["02-19",109.3],["02-22",100.75],["02-23",102.6],["02-24",101.25],["02-25",99.6],["02-26",100.25],["03-01",102.25],["03-02",102.25],["03-03",105.25],["03-04",103.5],["03-05",104.75],["03-08",104.25],["03-09",104.0],["03-10",103.75],["03-11",104.85],["03-12",106.75],["03-15",106.75],["03-16",105.9],["03-17",104.4],["03-18",104.75],["03-19",105.25],["03-22",106.6],["03-23",105.5],["03-24",107.75],["03-25",109.0],["03-26",109.25],["03-29",109.65],["03-30",110.25],["03-31",111.9],["04-01",111.35],["04-02",113.75],["04-05",114.5],["04-06",114.75],["04-07",112.75],["04-08",111.75],["04-13",112.5],["04-14",113.0],["04-15",114.0],["04-16",112.0],["04-19",114.5],["04-20",114.4],["04-21",115.0],["04-22",115.85],["04-23",118.25],["04-26",117.25],["04-27",116.75],["04-28",116.5],["04-29",118.35],["04-30",119.5],["05-04",116.25],["05-05",115.5],["05-06",119.0],["05-07",120.75],["05-10",120.0],["05-11",119.0],["05-12",119.0],["05-13",122.75],["05-14",119.75],["05-17",120.25],["05-18",119.85],["05-19",121.0],["05-20",118.75],["05-21",118.5],["05-24",119.75],["05-25",119.25],["05-26",119.85],["05-27",120.5],["05-28",122.75],["06-01",123.25],["06-02",122.75],["06-03",122.25],["06-04",123.0],["06-07",123.5],["06-08",124.5],["06-09",124.5],["06-10",125.25],["06-11",126.25],["06-14",125.75],["06-15",125.75],["06-16",126.4],["06-17",126.85],["06-18",129.0],["06-21",128.0],["06-22",127.35],["06-23",126.25],["06-24",127.75],["06-25",128.75],["06-28",131.0],["06-29",133.5],["06-30",139.0],["07-01",139.0],["07-02",145.0],["07-05",137.25],["07-06",137.25],["07-07",142.0],["07-08",139.75],["07-09",135.0],["07-12",139.0],["07-13",137.35],["07-14",137.75],["07-15",139.75],["07-16",139.5],["07-19",139.25],["07-20",139.0],["07-21",138.5],["07-22",138.25],["07-23",139.5],["07-26",139.25],["07-27",139.5],["07-28",140.5],["07-29",141.75],["07-30",143.1],["08-02",143.5],["08-03",143.9],["08-04",144.0],["08-05",143.0],["08-06",138.25],["08-09",140.0],["08-10",140.0],["08-11",140.25],["08-12",140.25],["08-13",138.75],["08-16",139.25],["08-17",138.75],["08-18",138.5],["08-19",138.25],["08-20",136.9],["08-23",137.35],["08-24",135.75],["08-25",131.85],["08-26",123.25],["08-27",122.75],["08-31",126.0],["09-01",124.0],["09-02",122.75],["09-03",121.5],["09-06",122.5],["09-07",120.75],["09-08",116.5],["09-09",116.35],["09-10",119.35],["09-13",117.75],["09-14",116.5],["09-15",116.5],["09-16",119.5],["09-17",121.0],["09-20",120.5],["09-21",124.25],["09-22",124.75],["09-23",122.85],["09-24",124.1],["09-27",125.25],["09-28",124.0],["09-29",124.9],["09-30",124.5],["10-01",125.5],["10-04",126.0],["10-05",124.75],["10-06",124.25],["10-07",125.0],["10-08",127.0],["10-11",127.6],["10-12",130.5],["10-13",133.5],["10-14",134.25],["10-15",133.6],["10-18",131.25],["10-19",132.25],["10-20",134.25],["10-21",132.75],["10-22",130.85],["10-25",131.0],["10-26",130.25],["10-27",130.0],["10-28",129.5],["10-29",130.1],["11-01",129.25],["11-02",128.65],["11-03",128.6],["11-04",129.75],["11-05",130.75],["11-08",129.75],["11-09",129.35],["11-10",129.1],["11-11",129.25],["11-12",129.9],["11-15",129.6],["11-16",130.0],["11-17",129.75],["11-18",129.5],["11-19",129.0],["11-22",128.5],["11-23",128.0],["11-24",126.25],["11-25",125.85],["11-26",125.75],["11-29",125.85],["11-30",123.5],["12-01",122.0],["12-02",123.25],["12-03",123.25],["12-06",124.25],["12-07",124.5],["12-08",126.25],["12-09",126.5],["12-10",126.0],["12-13",127.1],["12-14",127.25],["12-15",125.0],["12-16",125.0],["12-17",125.25],["12-20",125.25],["12-21",125.0],["12-22",124.25],["12-23",124.0],["12-24",123.85],["12-29",124.0],["12-30",123.65],["12-31",123.25]],"Platinum":[["01-04",352.7],["01-05",355.75],["01-06",357.7],["01-07",361.5],["01-08",358.9],["01-11",358.4],["01-12",357.5],["01-13",356.6],["01-14",358.25],["01-15",356.25],["01-18",356.5],["01-19",358.1],["01-20",358.5],["01-21",363.0],["01-22",361.4],["01-25",361.5],["01-26",362.5],["01-27",363.5],["01-28",362.5],["01-29",364.5],["02-01",361.0],["02-02",361.1],["02-03",359.6],["02-04",359.1],["02-05",360.75],["02-08",359.25],["02-09",361.45],["02-10",367.75],["02-11",368.5],["02-12",367.5],["02-15",365.35],["02-16",367.25],["02-17",368.25],["02-18",363.5],["02-19",362.0],["02-22",347.75],["02-23",347.1],["02-24",346.75],["02-25",344.1],["02-26",344.5],["03-01",346.4],["03-02",344.5],["03-03",342.5],["03-04",339.75],["03-05",343.85],["03-08",342.0],["03-09",345.35],["03-10",345.0],["03-11",348.95],["03-12",350.9],["03-15",350.6],["03-16",350.25],["03-17",348.45],["03-18",348.75],["03-19",349.0],["03-22",354.35],["03-23",353.6],["03-24",356.9],["03-25",357.0],["03-26",356.25],["03-29",356.25],["03-30",358.25],["03-31",361.75],["04-01",362.25],["04-02",365.8],["04-05",364.75],["04-06",362.25],["04-07",360.6],["04-08",360.0],["04-13",362.25],["04-14",362.5],["04-15",368.25],["04-16",365.75],["04-19",373.5],["04-20",371.75],["04-21",369.75],["04-22",365.75],["04-23",370.75],["04-26",375.5],["04-27",377.15],["04-28",374.75],["04-29",383.0],["04-30",386.5],["05-04",379.0],["05-05",374.15],["05-06",383.25],["05-07",384.75],["05-10",380.65],["05-11",378.75],["05-12",379.0],["05-13",389.25],["05-14",382.75],["05-17",386.9],["05-18",382.6],["05-19",392.0],["05-20",386.75],["05-21",386.5],["05-24",390.5],["05-25",385.25],["05-26",390.1],["05-27",391.25],["05-28",396.55],["06-01",398.0],["06-02",389.25],["06-03",386.25],["06-04",388.75],["06-07",389.85],["06-08",385.75],["06-09",383.4],["06-10",385.25],["06-11",387.65],["06-14",383.0],["06-15",378.0],["06-16",380.75],["06-17",381.0],["06-18",380.25],["06-21",377.25],["06-22",375.5],["06-23",372.65],["06-24",379.75],["06-25",381.5],["06-28",385.5],["06-29",384.5],["06-30",385.7],["07-01",385.5],["07-02",395.75],["07-05",391.5],["07-06",393.5],["07-07",408.75],["07-08",408.5],["07-09",401.25],["07-12",406.25],["07-13",401.25],["07-14",407.35],["07-15",405.75],["07-16",405.0],["07-19",405.0],["07-20",403.6],["07-21",403.75],["07-22",399.5],["07-23",404.9],["07-26",402.35],["07-27",404.9],["07-28",405.6],["07-29",409.25],["07-30",414.5],["08-02",418.65],["08-03",415.5],["08-04",417.75],["08-05",411.4],["08-06",392.35],["08-09",393.5],["08-10",393.5],["08-11",393.25],["08-12",389.5],["08-13",387.25],["08-16",388.5],["08-17",388.0],["08-18",388.0],["08-19",388.5],["08-20",385.25],["08-23",388.1],["08-24",387.5],["08-25",386.9],["08-26",385.1],["08-27",379.25],["08-31",383.25],["09-01",381.5],["09-02",379.75],["09-03",373.5],["09-06",372.65],["09-07",368.0],["09-08",356.5],["09-09",356.25],["09-10",359.75],["09-13",355.6],["09-14",351.5],["09-15",353.0],["09-16",359.25],["09-17",358.0],["09-20",361.0],["09-21",360.35],["09-22",362.75],["09-23",359.75],["09-24",362.75],["09-27",363.25],["09-28",361.0],["09-29",361.0],["09-30",357.75],["10-01",358.75],["10-04",360.25],["10-05",356.65],["10-06",359.25],["10-07",362.5],["10-08",362.75],["10-11",364.5],["10-12",363.35],["10-13",370.1],["10-14",369.35],["10-15",367.75],["10-18",367.1],["10-19",372.85],["10-20",375.25],["10-21",375.35],["10-22",374.1],["10-25",376.35],["10-26",372.15],["10-27",372.75],["10-28",372.75],["10-29",373.0],["11-01",369.5],["11-02",365.85],["11-03",368.0],["11-04",372.25],["11-05",378.25],["11-08",379.25],["11-09",378.75],["11-10",376.75],["11-11",378.25],["11-12",378.8],["11-15",376.9],["11-16",377.75],["11-17",375.75],["11-18",374.25],["11-19",375.25],["11-22",376.75],["11-23",378.0],["11-24",372.65],["11-25",373.75],["11-26",374.5],["11-29",373.0],["11-30",367.35],["12-01",366.75],["12-02",373.0],["12-03",372.5],["12-06",374.4],["12-07",374.75],["12-08",376.75],["12-09",379.5],["12-10",378.5],["12-13",384.4],["12-14",387.6],["12-15",385.25],["12-16",388.75],["12-17",386.6],["12-20",389.5],["12-21",389.4],["12-22",385.5],["12-23",385.25],["12-24",385.35],["12-29",388.5],["12-30",392.0],["12-31",393.5]],"Silver":[["01-04",3.66],["01-05",3.65],["01-06",3.7],["01-07",3.7],["01-08",3.66],["01-11",3.67],["01-12",3.68],["01-13",3.67],["01-14",3.69],["01-15",3.67],["01-18",3.67],["01-19",3.69],["01-20",3.69],["01-21",3.72],["01-22",3.71],["01-25",3.69],["01-26",3.7],["01-27",3.67],["01-28",3.69],["01-29",3.71],["02-01",3.66],["02-02",3.67],["02-03",3.67],["02-04",3.67],["02-05",3.67],["02-08",3.66],["02-09",3.68],["02-10",3.71],["02-11",3.77],["02-12",3.74],["02-15",3.69],["02-16",3.69],["02-17",3.71],["02-18",3.66],["02-19",3.64],["02-22",3.58],["02-23",3.58],["02-24",3.6],["02-25",3.59],["02-26",3.57],["03-01",3.58],["03-02",3.58],["03-03",3.58],["03-04",3.57],["03-05",3.59],["03-08",3.58],["03-09",3.56],["03-10",3.57],["03-11",3.6],["03-12",3.64],["03-15",3.62],["03-16",3.65],["03-17",3.66],["03-18",3.64],["03-19",3.68],["03-22",3.68],["03-23",3.67],["03-24",3.65],["03-25",3.68],["03-26",3.72],["03-29",3.7],["03-30",3.78],["03-31",3.89],["04-01",3.86],["04-02",3.97],["04-05",3.86],["04-06",3.88],["04-07",3.79],["04-08",3.88],["04-13",3.87],["04-14",3.9],["04-15",3.93],["04-16",3.87],["04-19",3.98],["04-20",3.95],["04-21",3.91],["04-22",3.88],["04-23",3.93],["04-26",4.02],["04-27",4.1],["04-28",4.04],["04-29",4.36],["04-30",4.3],["05-04",4.27],["05-05",4.25],["05-06",4.3],["05-07",4.36],["05-10",4.28],["05-11",4.24],["05-12",4.23],["05-13",4.52],["05-14",4.43],["05-17",4.46],["05-18",4.4],["05-19",4.74],["05-20",4.51],["05-21",4.52],["05-24",4.72],["05-25",4.52],["05-26",4.55],["05-27",4.59],["05-28",4.71],["06-01",4.62],["06-02",4.37],["06-03",4.38],["06-04",4.5],["06-07",4.36],["06-08",4.39],["06-09",4.37],["06-10",4.3],["06-11",4.31],["06-14",4.22],["06-15",4.22],["06-16",4.32],["06-17",4.33],["06-18",4.34],["06-21",4.29],["06-22",4.3],["06-23",4.27],["06-24",4.43],["06-25",4.4],["06-28",4.5],["06-29",4.46],["06-30",4.58],["07-01",4.55],["07-02",4.83],["07-05",4.88],["07-06",5.07],["07-07",5.17],["07-08",5.12],["07-09",4.99],["07-12",5.07],["07-13",4.98],["07-14",5.09],["07-15",4.92],["07-16",5.04],["07-19",5.07],["07-20",5.04],["07-21",5.05],["07-22",4.94],["07-23",5.03],["07-26",4.97],["07-27",5.11],["07-28",5.07],["07-29",5.14],["07-30",5.3],["08-02",5.42],["08-03",5.38],["08-04",5.29],["08-05",5.17],["08-06",4.82],["08-09",4.67],["08-10",4.8],["08-11",4.79],["08-12",4.69],["08-13",4.59],["08-16",4.77],["08-17",4.74],["08-18",4.69],["08-19",4.72],["08-20",4.66],["08-23",4.78],["08-24",4.76],["08-25",4.75],["08-26",4.72],["08-27",4.69],["08-31",4.84],["09-01",4.83],["09-02",4.72],["09-03",4.55],["09-06",4.53],["09-07",4.5],["09-08",4.25],["09-09",4.24],["09-10",4.28],["09-13",4.06],["09-14",3.92],["09-15",4.04],["09-16",4.06],["09-17",4.1],["09-20",4.11],["09-21",4.11],["09-22",4.07],["09-23",4.04],["09-24",4.14],["09-27",4.11],["09-28",4.04],["09-29",4.06],["09-30",4.03],["10-01",4.06],["10-04",4.09],["10-05",4.05],["10-06",4.15],["10-07",4.33],["10-08",4.37],["10-11",4.38],["10-12",4.29],["10-13",4.45],["10-14",4.43],["10-15",4.33],["10-18",4.36],["10-19",4.45],["10-20",4.49],["10-21",4.51],["10-22",4.44],["10-25",4.43],["10-26",4.39],["10-27",4.39],["10-28",4.42],["10-29",4.4],["11-01",4.29],["11-02",4.21],["11-03",4.21],["11-04",4.38],["11-05",4.48],["11-08",4.52],["11-09",4.54],["11-10",4.53],["11-11",4.57],["11-12",4.58],["11-15",4.52],["11-16",4.58],["11-17",4.55],["11-18",4.61],["11-19",4.69],["11-22",4.73],["11-23",4.68],["11-24",4.64],["11-25",4.64],["11-26",4.67],["11-29",4.63],["11-30",4.47],["12-01",4.43],["12-02",4.66],["12-03",4.61],["12-06",4.84],["12-07",4.83],["12-08",4.96],["12-09",4.98],["12-10",4.99],["12-13",5.1],["12-14",5.14],["12-15",5.09],["12-16",5.09],["12-17",5.02],["12-20",5.12],["12-21",5.11],["12-22",5.0],["12-23",5.04],["12-24",5.03],["12-29",5.09],["12-30",5.11],["12-31",5.12]]},"1994":{"Gold":[["01-04",395.0],["01-05",394.0],["01-06",390.6],["01-07",390.7],["01-10",382.2],["01-11",384.35],["01-12",386.8],["01-13",384.75],["01-14",389.5],["01-17",392.6],["01-18",392.5],["01-19",392.7],["01-20",392.4],["01-21",387.85],["01-24",381.5],["01-25",382.9],["01-26",381.0],["01-27",384.5],["01-28",378.15],["01-31",378.2],["02-01",382.1],["02-02",384.95],["02-03",384.0],["02-04",387.65],["02-07",383.95],["02-08",380.45],["02-09",380.25],["02-10",382.2],["02-11",381.1],["02-14",381.9],["02-15",384.5],["02-16",383.6],["02-17",384.75],["02-18",382.05],["02-21",379.75],["02-22",378.1],["02-23",377.5],["02-24",376.0],["02-25",377.6],["02-28",380.75],["03-01",381.1],["03-02",376.45],["03-03",377.7],["03-04",375.65],["03-07",377.0],["03-08",375.45],["03-09",376.25],["03-10",379.05],["03-11",387.1],["03-14",386.3],["03-15",386.25],["03-16",385.3],["03-17",383.0],["03-18",385.9],["03-21",386.8],["03-22",386.95],["03-23",388.4],["03-24",390.3],["03-25",391.8],["03-28",390.9],["03-29",387.9],["03-30",386.75],["03-31",389.7],["04-05",387.4],["04-06",385.1],["04-07",384.95],["04-08",384.85],["04-11",384.9],["04-12",378.4],["04-13",379.2],["04-14",378.55],["04-15",376.2],["04-18",377.35],["04-19",375.95],["04-20",372.4],["04-21",373.75],["04-22",372.85],["04-25",370.25],["04-26",374.15],["04-27",374.35],["04-28",373.2],["04-29",376.45],["05-03",375.7],["05-04",374.5],["05-05",374.5],["05-06",372.8],["05-09",381.4],["05-10",381.65],["05-11",378.5],["05-12",382.15],["05-13",381.45],["05-16",380.65],["05-17",382.55],["05-18",379.65],["05-19",383.0],["05-20",381.55],["05-23",386.75],["05-24",388.1],["05-25",386.4],["05-26",385.9],["05-27",383.4],["05-31",386.25],["06-01",387.25],["06-02",383.6],["06-03",382.75],["06-06",380.25],["06-07",380.5],["06-08",381.9],["06-09",382.2],["06-10",383.3],["06-13",382.5],["06-14",383.5],["06-15",383.5],["06-16",387.1],["06-17",385.75],["06-20",391.0],["06-21",389.95],["06-22",393.1],["06-23",389.5],["06-24",390.7],["06-27",390.25],["06-28",385.9],["06-29",385.8],["06-30",385.4],["07-01",386.8],["07-04",387.3],["07-05",387.8],["07-06",385.75],["07-07",383.9],["07-08",383.4],["07-11",384.4],["07-12",385.75],["07-13",384.85],["07-14",384.0],["07-15",384.85],["07-18",386.4],["07-19",384.25],["07-20",386.4],["07-21",385.4],["07-22",384.1],["07-25",384.85],["07-26",385.85],["07-27",387.0],["07-28",387.35],["07-29",384.05],["08-01",384.0],["08-02",383.75],["08-03",378.6],["08-04",377.5],["08-05",378.6],["08-08",377.7],["08-09",377.4],["08-10",378.3],["08-11",376.7],["08-12",377.7],["08-15",376.45],["08-16",376.6],["08-17",377.8],["08-18",377.85],["08-19",381.05],["08-22",381.6],["08-23",381.25],["08-24",382.6],["08-25",383.4],["08-26",383.3],["08-30",386.15],["08-31",386.25],["09-01",386.0],["09-02",387.1],["09-05",386.9],["09-06",387.8],["09-07",388.4],["09-08",391.0],["09-09",389.5],["09-12",391.5],["09-13",390.45],["09-14",390.4],["09-15",387.8],["09-16",388.25],["09-19",390.15],["09-20",392.25],["09-21",394.8],["09-22",393.95],["09-23",396.5],["09-26",395.4],["09-27",394.15],["09-28",397.5],["09-29",394.5],["09-30",395.35],["10-03",393.45],["10-04",394.1],["10-05",392.15],["10-06",391.9],["10-07",392.85],["10-10",391.95],["10-11",389.45],["10-12",388.2],["10-13",388.85],["10-14",387.1],["10-17",388.95],["10-18",390.0],["10-19",389.0],["10-20",390.55],["10-21",391.65],["10-24",389.2],["10-25",389.6],["10-26",388.8],["10-27",389.9],["10-28",388.4],["10-31",387.4],["11-01",383.45],["11-02",383.85],["11-03",383.9],["11-04",383.9],["11-07",383.2],["11-08",383.1],["11-09",384.35],["11-10",384.3],["11-11",385.25],["11-14",384.9],["11-15",386.45],["11-16",385.5],["11-17",386.4],["11-18",385.25],["11-21",383.6],["11-22",383.7],["11-23",384.5],["11-24",384.4],["11-25",384.55],["11-28",384.7],["11-29",383.7],["11-30",383.35],["12-01",381.2],["12-02",378.95],["12-05",377.3],["12-06",376.55],["12-07",377.0],["12-08",376.45],["12-09",376.1],["12-12",376.85],["12-13",378.7],["12-14",378.35],["12-15",380.1],["12-16",379.7],["12-19",379.0],["12-20",380.6],["12-21",382.5],["12-22",381.5],["12-23",381.3],["12-28",381.8],["12-29",383.15],["12-30",382.5]],"Palladium":[["01-04",124.25],["01-05",126.25],["01-06",125.1],["01-07",125.0],["01-10",124.0],["01-11",123.25],["01-12",123.75],["01-13",123.5],["01-14",123.75],["01-17",124.25],["01-18",125.25],["01-19",125.0],["01-20",124.5],["01-21",124.0],["01-24",123.75],["01-25",123.75],["01-26",124.1],["01-27",125.0],["01-28",123.65],["01-31",124.35],["02-01",125.0],["02-02",126.5],["02-03",126.85],["02-04",127.0],["02-07",128.0],["02-08",130.75],["02-09",130.5],["02-10",133.25],["02-11",133.0],["02-14",133.25],["02-15",134.75],["02-16",136.0],["02-17",135.15],["02-18",134.0],["02-21",133.5],["02-22",133.0],["02-23",132.25],["02-24",132.25],["02-25",134.25],["02-28",135.6],["03-01",135.5],["03-02",135.15],["03-03",133.0],["03-04",128.0],["03-07",130.1],["03-08",130.0],["03-09",130.85],["03-10",131.5],["03-11",133.0],["03-14",133.5],["03-15",133.25],["03-16",133.0],["03-17",132.75],["03-18",133.25],["03-21",133.25],["03-22",134.25],["03-23",134.25],["03-24",134.35],["03-25",135.25],["03-28",134.5],["03-29",134.5],["03-30",133.75],["03-31",133.75],["04-05",134.75],["04-06",134.0],["04-07",133.25],["04-08",133.25],["04-11",133.5],["04-12",133.0],["04-13",132.5],["04-14",132.75],["04-15",132.5],["04-18",132.5],["04-19",132.55],["04-20",132.0],["04-21",134.0],["04-22",133.4],["04-25",134.25],["04-26",135.0],["04-27",135.6],["04-28",135.15],["04-29",135.6],["05-03",139.75],["05-04",139.4],["05-05",139.0],["05-06",136.0],["05-09",137.25],["05-10",136.65],["05-11",134.0],["05-12",135.25],["05-13",135.6],["05-16",136.25],["05-17",135.5],["05-18",135.25],["05-19",135.5],["05-20",135.5],["05-23",135.75],["05-24",137.0],["05-25",136.85],["05-26",134.5],["05-27",133.75],["05-31",135.0],["06-01",135.25],["06-02",135.15],["06-03",134.5],["06-06",134.0],["06-07",134.25],["06-08",134.85],["06-09",135.75],["06-10",136.0],["06-13",136.5],["06-14",137.75],["06-15",137.75],["06-16",139.0],["06-17",137.9],["06-20",138.6],["06-21",139.25],["06-22",138.5],["06-23",138.5],["06-24",138.65],["06-27",138.5],["06-28",138.5],["06-29",139.25],["06-30",140.0],["07-01",142.75],["07-04",144.25],["07-05",143.5],["07-06",143.75],["07-07",142.75],["07-08",144.35],["07-11",144.5],["07-12",145.25],["07-13",145.65],["07-14",145.25],["07-15",146.35],["07-18",146.15],["07-19",146.25],["07-20",145.75],["07-21",145.75],["07-22",145.5],["07-25",146.5],["07-26",149.25],["07-27",152.25],["07-28",150.75],["07-29",149.35],["08-01",151.75],["08-02",154.75],["08-03",153.25],["08-04",151.75],["08-05",151.15],["08-08",149.75],["08-09",150.0],["08-10",151.5],["08-11",151.0],["08-12",152.25],["08-15",151.75],["08-16",152.25],["08-17",152.25],["08-18",152.75],["08-19",153.75],["08-22",154.5],["08-23",153.25],["08-24",152.75],["08-25",151.9],["08-26",151.5],["08-30",152.0],["08-31",152.0],["09-01",152.6],["09-02",153.25],["09-05",154.25],["09-06",154.4],["09-07",154.25],["09-08",154.75],["09-09",151.6],["09-12",152.25],["09-13",149.25],["09-14",149.6],["09-15",148.25],["09-16",150.0],["09-19",151.5],["09-20",153.0],["09-21",156.0],["09-22",155.5],["09-23",156.25],["09-26",156.0],["09-27",154.5],["09-28",154.0],["09-29",151.75],["09-30",152.75],["10-03",152.0],["10-04",152.5],["10-05",152.75],["10-06",153.0],["10-07",153.4],["10-10",153.5],["10-11",152.0],["10-12",152.5],["10-13",151.75],["10-14",152.25],["10-17",153.75],["10-18",154.5],["10-19",154.5],["10-20",155.25],["10-21",156.5],["10-24",155.6],["10-25",156.5],["10-26",157.25],["10-27",158.25],["10-28",160.1],["10-31",159.35],["11-01",158.5],["11-02",160.35],["11-03",161.0],["11-04",160.0],["11-07",157.75],["11-08",156.2],["11-09",158.0],["11-10",156.8],["11-11",156.5],["11-14",156.15],["11-15",158.0],["11-16",156.75],["11-17",156.25],["11-18",156.5],["11-21",154.25],["11-22",154.75],["11-23",154.75],["11-24",154.25],["11-25",154.25],["11-28",154.0],["11-29",153.75],["11-30",154.4],["12-01",152.6],["12-02",153.25],["12-05",153.0],["12-06",152.5],["12-07",153.5],["12-08",153.2],["12-09",152.25],["12-12",153.25],["12-13",154.0],["12-14",152.75],["12-15",152.5],["12-16",152.75],["12-19",153.0],["12-20",153.5],["12-21",154.0],["12-22",153.75],["12-23",153.75],["12-28",155.5],["12-29",156.5],["12-30",156.75]],"Platinum":[["01-04",399.5],["01-05",397.0],["01-06",392.85],["01-07",389.75],["01-10",382.0],["01-11",384.75],["01-12",387.25],["01-13",385.35],["01-14",389.35],["01-17",393.5],["01-18",393.0],["01-19",393.5],["01-20",392.75],["01-21",386.85],["01-24",380.5],["01-25",383.25],["01-26",380.6],["01-27",386.75],["01-28",379.25],["01-31",381.6],["02-01",388.0],["02-02",392.0],["02-03",391.5],["02-04",395.5],["02-07",391.5],["02-08",389.75],["02-09",389.5],["02-10",391.75],["02-11",391.75],["02-14",392.0],["02-15",397.35],["02-16",400.0],["02-17",403.0],["02-18",397.75],["02-21",398.25],["02-22",395.25],["02-23",393.5],["02-24",389.5],["02-25",391.15],["02-28",394.5],["03-01",394.4],["03-02",390.25],["03-03",391.5],["03-04",389.25],["03-07",391.25],["03-08",390.5],["03-09",392.0],["03-10",395.0],["03-11",405.5],["03-14",403.45],["03-15",403.5],["03-16",401.75],["03-17",398.5],["03-18",401.5],["03-21",398.1],["03-22",401.65],["03-23",403.75],["03-24",403.75],["03-25",408.25],["03-28",411.25],["03-29",408.25],["03-30",408.0],["03-31",415.25],["04-05",412.65],["04-06",407.75],["04-07",408.0],["04-08",406.25],["04-11",405.35],["04-12",397.25],["04-13",398.75],["04-14",399.25],["04-15",396.9],["04-18",395.15],["04-19",392.0],["04-20",385.75],["04-21",391.0],["04-22",388.0],["04-25",388.5],["04-26",393.75],["04-27",392.8],["04-28",388.35],["04-29",392.5],["05-03",401.0],["05-04",396.75],["05-05",393.75],["05-06",387.75],["05-09",395.75],["05-10",396.9],["05-11",391.75],["05-12",398.25],["05-13",397.5],["05-16",398.5],["05-17",401.75],["05-18",397.25],["05-19",399.0],["05-20",398.75],["05-23",404.8],["05-24",407.0],["05-25",404.5],["05-26",401.4],["05-27",395.25],["05-31",398.75],["06-01",402.25],["06-02",397.0],["06-03",397.75],["06-06",395.25],["06-07",395.25],["06-08",397.35],["06-09",399.1],["06-10",399.65],["06-13",399.0],["06-14",401.25],["06-15",401.5],["06-16",406.0],["06-17",404.75],["06-20",408.5],["06-21",405.85],["06-22",408.75],["06-23",405.5],["06-24",405.35],["06-27",401.6],["06-28",398.6],["06-29",399.75],["06-30",400.25],["07-01",405.0],["07-04",410.15],["07-05",410.0],["07-06",407.5],["07-07",403.5],["07-08",403.0],["07-11",402.5],["07-12",404.75],["07-13",407.75],["07-14",407.0],["07-15",410.0],["07-18",412.75],["07-19",413.9],["07-20",413.85],["07-21",413.5],["07-22",411.75],["07-25",415.0],["07-26",418.4],["07-27",423.0],["07-28",422.25],["07-29",419.0],["08-01",422.5],["08-02",423.0],["08-03",414.5],["08-04",409.75],["08-05",409.5],["08-08",408.25],["08-09",406.25],["08-10",412.5],["08-11",409.75],["08-12",411.75],["08-15",409.25],["08-16",411.0],["08-17",412.35],["08-18",410.25],["08-19",413.5],["08-22",413.5],["08-23",411.75],["08-24",411.75],["08-25",411.5],["08-26",412.5],["08-30",413.5],["08-31",412.0],["09-01",413.0],["09-02",415.75],["09-05",417.1],["09-06",417.75],["09-07",419.75],["09-08",421.15],["09-09",417.75],["09-12",420.5],["09-13",415.5],["09-14",416.75],["09-15",409.5],["09-16",412.4],["09-19",413.5],["09-20",416.75],["09-21",420.0],["09-22",418.0],["09-23",420.5],["09-26",419.4],["09-27",418.5],["09-28",419.4],["09-29",416.0],["09-30",419.25],["10-03",416.0],["10-04",418.25],["10-05",417.5],["10-06",419.75],["10-07",420.75],["10-10",419.0],["10-11",415.75],["10-12",416.75],["10-13",416.25],["10-14",414.25],["10-17",416.75],["10-18",418.25],["10-19",417.15],["10-20",421.0],["10-21",425.25],["10-24",420.5],["10-25",422.1],["10-26",420.7],["10-27",423.25],["10-28",424.0],["10-31",421.4],["11-01",414.0],["11-02",418.0],["11-03",417.6],["11-04",416.5],["11-07",415.15],["11-08",410.1],["11-09",411.0],["11-10",409.25],["11-11",410.6],["11-14",411.0],["11-15",415.75],["11-16",414.4],["11-17",415.15],["11-18",414.5],["11-21",411.25],["11-22",411.0],["11-23",410.5],["11-24",411.5],["11-25",410.25],["11-28",410.25],["11-29",408.9],["11-30",409.6],["12-01",403.75],["12-02",402.5],["12-05",401.0],["12-06",401.25],["12-07",403.9],["12-08",404.0],["12-09",403.25],["12-12",407.0],["12-13",411.0],["12-14",408.75],["12-15",408.15],["12-16",411.0],["12-19",413.75],["12-20",415.75],["12-21",417.75],["12-22",416.75],["12-23",414.25],["12-28",416.0],["12-29",417.75],["12-30",416.5]],"Silver":[["01-04",5.28],["01-05",5.23],["01-06",5.02],["01-07",5.11],["01-10",4.91],["01-11",5.04],["01-12",5.11],["01-13",5.06],["01-14",5.21],["01-17",5.34],["01-18",5.33],["01-19",5.32],["01-20",5.32],["01-21",5.18],["01-24",5.04],["01-25",5.13],["01-26",5.08],["01-27",5.12],["01-28",4.97],["01-31",5.06],["02-01",5.12],["02-02",5.28],["02-03",5.28],["02-04",5.46],["02-07",5.31],["02-08",5.22],["02-09",5.25],["02-10",5.29],["02-11",5.21],["02-14",5.26],["02-15",5.33],["02-16",5.25],["02-17",5.3],["02-18",5.23],["02-21",5.18],["02-22",5.16],["02-23",5.18],["02-24",5.21],["02-25",5.18],["02-28",5.24],["03-01",5.33],["03-02",5.24],["03-03",5.26],["03-04",5.19],["03-07",5.23],["03-08",5.18],["03-09",5.21],["03-10",5.3],["03-11",5.45],["03-14",5.37],["03-15",5.45],["03-16",5.42],["03-17",5.36],["03-18",5.43],["03-21",5.41],["03-22",5.45],["03-23",5.59],["03-24",5.75],["03-25",5.73],["03-28",5.7],["03-29",5.62],["03-30",5.61],["03-31",5.74],["04-05",5.64],["04-06",5.53],["04-07",5.5],["04-08",5.46],["04-11",5.46],["04-12",5.28],["04-13",5.34],["04-14",5.34],["04-15",5.29],["04-18",5.25],["04-19",5.24],["04-20",5.24],["04-21",5.26],["04-22",5.2],["04-25",5.09],["04-26",5.12],["04-27",5.17],["04-28",5.17],["04-29",5.28],["05-03",5.29],["05-04",5.21],["05-05",5.12],["05-06",5.07],["05-09",5.39],["05-10",5.39],["05-11",5.26],["05-12",5.4],["05-13",5.42],["05-16",5.39],["05-17",5.53],["05-18",5.44],["05-19",5.57],["05-20",5.53],["05-23",5.71],["05-24",5.73],["05-25",5.57],["05-26",5.51],["05-27",5.45],["05-31",5.5],["06-01",5.54],["06-02",5.35],["06-03",5.34],["06-06",5.27],["06-07",5.28],["06-08",5.33],["06-09",5.36],["06-10",5.39],["06-13",5.33],["06-14",5.42],["06-15",5.36],["06-16",5.53],["06-17",5.47],["06-20",5.61],["06-21",5.48],["06-22",5.54],["06-23",5.37],["06-24",5.41],["06-27",5.39],["06-28",5.26],["06-29",5.27],["06-30",5.25],["07-01",5.36],["07-04",5.39],["07-05",5.41],["07-06",5.32],["07-07",5.24],["07-08",5.24],["07-11",5.25],["07-12",5.32],["07-13",5.21],["07-14",5.16],["07-15",5.22],["07-18",5.25],["07-19",5.21],["07-20",5.32],["07-21",5.26],["07-22",5.25],["07-25",5.26],["07-26",5.32],["07-27",5.32],["07-28",5.33],["07-29",5.29],["08-01",5.33],["08-02",5.29],["08-03",5.21],["08-04",5.16],["08-05",5.17],["08-08",5.11],["08-09",5.11],["08-10",5.16],["08-11",5.12],["08-12",5.19],["08-15",5.05],["08-16",5.07],["08-17",5.13],["08-18",5.11],["08-19",5.17],["08-22",5.23],["08-23",5.21],["08-24",5.21],["08-25",5.25],["08-26",5.25],["08-30",5.38],["08-31",5.36],["09-01",5.4],["09-02",5.44],["09-05",5.41],["09-06",5.44],["09-07",5.51],["09-08",5.51],["09-09",5.45],["09-12",5.51],["09-13",5.46],["09-14",5.46],["09-15",5.39],["09-16",5.38],["09-19",5.43],["09-20",5.48],["09-21",5.67],["09-22",5.6],["09-23",5.71],["09-26",5.66],["09-27",5.67],["09-28",5.7],["09-29",5.62],["09-30",5.62],["10-03",5.53],["10-04",5.61],["10-05",5.6],["10-06",5.6],["10-07",5.66],["10-10",5.61],["10-11",5.56],["10-12",5.51],["10-13",5.51],["10-14",5.37],["10-17",5.39],["10-18",5.41],["10-19",5.36],["10-20",5.41],["10-21",5.4],["10-24",5.32],["10-25",5.33],["10-26",5.31],["10-27",5.39],["10-28",5.37],["10-31",5.34],["11-01",5.22],["11-02",5.28],["11-03",5.32],["11-04",5.26],["11-07",5.23],["11-08",5.21],["11-09",5.2],["11-10",5.13],["11-11",5.18],["11-14",5.16],["11-15",5.21],["11-16",5.19],["11-17",5.24],["11-18",5.23],["11-21",5.15],["11-22",5.15],["11-23",5.17],["11-24",5.15],["11-25",5.17],["11-28",5.17],["11-29",5.14],["11-30",5.08],["12-01",4.92],["12-02",4.93],["12-05",4.74],["12-06",4.65],["12-07",4.69],["12-08",4.64],["12-09",4.67],["12-12",4.73],["12-13",4.81],["12-14",4.76],["12-15",4.76],["12-16",4.82],["12-19",4.77],["12-20",4.81],["12-21",4.83],["12-22",4.79],["12-23",4.75],["12-28",4.81],["12-29",4.9],["12-30",4.85]]},"1995":{"Gold":[["01-03",381.4],["01-04",378.25],["01-05",375.0],["01-06",375.9],["01-09",372.45],["01-10",374.1],["01-11",375.0],["01-12",377.6],["01-13",379.8],["01-16",377.45],["01-17",377.9],["01-18",382.0],["01-19",383.1],["01-20",383.0],["01-23",385.1],["01-24",381.5],["01-25",381.7],["01-26",380.5],["01-27",380.0],["01-30",375.9],["01-31",375.85],["02-01",376.25],["02-02",375.25],["02-03",376.35],["02-06",375.25],["02-07",375.2],["02-08",374.8],["02-09",375.85],["02-10",376.4],["02-13",375.6],["02-14",376.0],["02-15",376.9],["02-16",376.1],["02-17",376.55],["02-20",379.3],["02-21",379.0],["02-22",379.0],["02-23",379.0],["02-24",379.6],["02-27",376.8],["02-28",375.7],["03-01",376.3],["03-02",374.45],["03-03",376.35],["03-06",376.6],["03-07",379.0],["03-08",383.1],["03-09",381.0],["03-10",383.5],["03-13",382.75],["03-14",385.2],["03-15",386.6],["03-16",385.15],["03-17",382.75],["03-20",382.45],["03-21",382.6],["03-22",381.4],["03-23",383.1],["03-24",383.25],["03-27",382.3],["03-28",382.35],["03-29",383.0],["03-30",382.1],["03-31",386.55],["04-03",392.25],["04-04",391.95],["04-05",392.5],["04-06",393.75],["04-07",392.0],["04-10",390.9],["04-11",389.1],["04-12",389.8],["04-13",389.9],["04-18",394.1],["04-19",396.95],["04-20",393.35],["04-21",390.35],["04-24",391.05],["04-25",390.2],["04-26",389.85],["04-27",386.6],["04-28",389.5],["05-01",386.5],["05-02",388.35],["05-03",388.8],["05-04",390.3],["05-05",391.35],["05-09",389.9],["05-10",383.4],["05-11",383.1],["05-12",384.1],["05-15",383.9],["05-16",384.1],["05-17",383.4],["05-18",383.05],["05-19",382.6],["05-22",382.35],["05-23",381.85],["05-24",382.9],["05-25",383.75],["05-26",385.8],["05-30",386.1],["05-31",384.25],["06-01",383.2],["06-02",384.6],["06-05",383.4],["06-06",384.2],["06-07",384.65],["06-08",385.95],["06-09",386.4],["06-12",387.6],["06-13",387.5],["06-14",386.8],["06-15",388.0],["06-16",391.3],["06-19",390.5],["06-20",390.6],["06-21",390.7],["06-22",389.8],["06-23",389.4],["06-26",389.3],["06-27",389.35],["06-28",389.3],["06-29",387.45],["06-30",387.6],["07-03",384.35],["07-04",384.65],["07-05",384.6],["07-06",384.45],["07-07",384.8],["07-10",385.75],["07-11",384.95],["07-12",385.85],["07-13",389.3],["07-14",388.2],["07-17",388.2],["07-18",389.3],["07-19",389.25],["07-20",387.85],["07-21",385.85],["07-24",386.45],["07-25",386.65],["07-26",385.8],["07-27",386.1],["07-28",383.2],["07-31",383.35],["08-01",381.75],["08-02",382.65],["08-03",382.75],["08-04",384.35],["08-07",383.75],["08-08",384.35],["08-09",384.5],["08-10",384.05],["08-11",383.9],["08-14",383.5],["08-15",384.5],["08-16",384.1],["08-17",383.0],["08-18",384.85],["08-21",385.55],["08-22",383.55],["08-23",383.45],["08-24",383.1],["08-25",382.6],["08-29",383.25],["08-30",381.9],["08-31",381.65],["09-01",381.8],["09-04",379.85],["09-05",379.4],["09-06",379.0],["09-07",380.55],["09-08",383.05],["09-11",381.9],["09-12",382.9],["09-13",385.4],["09-14",384.7],["09-15",385.25],["09-18",384.95],["09-19",385.65],["09-20",385.0],["09-21",382.95],["09-22",383.25],["09-25",382.2],["09-26",383.25],["09-27",383.2],["09-28",383.55],["09-29",383.75],["10-02",383.1],["10-03",382.25],["10-04",382.6],["10-05",383.35],["10-06",382.5],["10-09",384.65],["10-10",384.7],["10-11",384.7],["10-12",384.6],["10-13",384.0],["10-16",384.0],["10-17",383.8],["10-18",383.75],["10-19",383.4],["10-20",381.85],["10-23",382.55],["10-24",382.55],["10-25",382.4],["10-26",382.7],["10-27",382.55],["10-30",382.05],["10-31",382.4],["11-01",382.5],["11-02",382.2],["11-03",382.8],["11-06",382.5],["11-07",382.3],["11-08",384.7],["11-09",384.4],["11-10",386.65],["11-13",389.6],["11-14",386.1],["11-15",385.6],["11-16",384.65],["11-17",386.6],["11-20",386.55],["11-21",386.8],["11-22",385.3],["11-23",382.55],["11-24",383.5],["11-27",385.2],["11-28",387.3],["11-29",388.95],["11-30",387.85],["12-01",387.15],["12-04",386.25],["12-05",386.3],["12-06",387.6],["12-07",388.4],["12-08",389.35],["12-11",389.7],["12-12",388.45],["12-13",388.1],["12-14",385.7],["12-15",385.85],["12-18",387.0],["12-19",388.0],["12-20",387.1],["12-21",388.4],["12-22",387.2],["12-27",387.35],["12-28",386.85],["12-29",386.7]],"Palladium":[["01-03",156.6],["01-04",156.35],["01-05",154.0],["01-06",154.75],["01-09",153.85],["01-10",154.9],["01-11",155.5],["01-12",155.75],["01-13",157.25],["01-16",153.5],["01-17",154.5],["01-18",156.15],["01-19",156.35],["01-20",156.25],["01-23",157.6],["01-24",156.65],["01-25",157.25],["01-26",157.5],["01-27",158.0],["01-30",156.5],["01-31",157.0],["02-01",157.5],["02-02",157.35],["02-03",157.5],["02-06",157.25],["02-07",157.25],["02-08",157.0],["02-09",157.0],["02-10",157.0],["02-13",157.0],["02-14",157.25],["02-15",157.5],["02-16",157.35],["02-17",157.75],["02-20",157.45],["02-21",157.5],["02-22",157.5],["02-23",157.0],["02-24",156.5],["02-27",155.75],["02-28",154.25],["03-01",153.25],["03-02",152.0],["03-03",152.6],["03-06",153.75],["03-07",154.0],["03-08",156.5],["03-09",155.5],["03-10",157.25],["03-13",157.5],["03-14",159.25],["03-15",159.75],["03-16",161.75],["03-17",163.6],["03-20",165.85],["03-21",166.75],["03-22",164.5],["03-23",167.85],["03-24",175.85],["03-27",170.35],["03-28",169.75],["03-29",174.5],["03-30",173.25],["03-31",174.25],["04-03",175.4],["04-04",176.0],["04-05",176.25],["04-06",173.25],["04-07",174.85],["04-10",172.25],["04-11",171.65],["04-12",171.85],["04-13",171.1],["04-18",174.25],["04-19",174.8],["04-20",171.75],["04-21",167.75],["04-24",166.0],["04-25",161.5],["04-26",162.0],["04-27",160.25],["04-28",162.75],["05-01",163.25],["05-02",163.5],["05-03",162.75],["05-04",163.5],["05-05",164.25],["05-09",160.5],["05-10",158.5],["05-11",160.25],["05-12",159.0],["05-15",161.75],["05-16",162.1],["05-17",158.25],["05-18",157.75],["05-19",158.25],["05-22",157.25],["05-23",157.4],["05-24",158.5],["05-25",160.75],["05-26",162.0],["05-30",162.75],["05-31",162.0],["06-01",158.25],["06-02",158.75],["06-05",157.5],["06-06",156.25],["06-07",156.0],["06-08",157.0],["06-09",156.75],["06-12",158.25],["06-13",161.25],["06-14",159.75],["06-15",160.5],["06-16",161.0],["06-19",159.75],["06-20",160.0],["06-21",159.5],["06-22",158.75],["06-23",157.25],["06-26",157.5],["06-27",158.35],["06-28",160.85],["06-29",159.0],["06-30",158.75],["07-03",158.1],["07-04",157.75],["07-05",156.5],["07-06",157.5],["07-07",157.25],["07-10",157.25],["07-11",157.25],["07-12",156.5],["07-13",155.75],["07-14",154.35],["07-17",154.65],["07-18",155.0],["07-19",154.5],["07-20",153.5],["07-21",152.5],["07-24",153.75],["07-25",154.25],["07-26",153.5],["07-27",155.25],["07-28",153.25],["07-31",153.0],["08-01",151.75],["08-02",152.0],["08-03",151.0],["08-04",152.0],["08-07",151.75],["08-08",151.5],["08-09",151.75],["08-10",151.25],["08-11",148.75],["08-14",146.75],["08-15",147.75],["08-16",148.5],["08-17",148.0],["08-18",150.1],["08-21",150.25],["08-22",150.25],["08-23",149.5],["08-24",148.75],["08-25",148.5],["08-29",148.35],["08-30",146.5],["08-31",145.5],["09-01",146.0],["09-04",146.0],["09-05",146.25],["09-06",144.5],["09-07",144.65],["09-08",145.8],["09-11",145.5],["09-12",145.6],["09-13",147.25],["09-14",146.75],["09-15",147.25],["09-18",146.75],["09-19",146.35],["09-20",145.75],["09-21",139.75],["09-22",138.75],["09-25",135.35],["09-26",138.0],["09-27",137.85],["09-28",139.25],["09-29",142.25],["10-02",142.35],["10-03",140.0],["10-04",141.0],["10-05",135.5],["10-06",134.0],["10-09",137.85],["10-10",138.5],["10-11",138.5],["10-12",138.5],["10-13",138.0],["10-16",137.25],["10-17",137.5],["10-18",137.75],["10-19",136.6],["10-20",135.5],["10-23",135.0],["10-24",134.5],["10-25",135.75],["10-26",136.0],["10-27",135.0],["10-30",135.25],["10-31",135.85],["11-01",137.5],["11-02",135.75],["11-03",135.0],["11-06",134.0],["11-07",133.0],["11-08",134.5],["11-09",134.5],["11-10",136.25],["11-13",135.75],["11-14",134.6],["11-15",135.0],["11-16",134.65],["11-17",134.75],["11-20",134.25],["11-21",134.75],["11-22",133.35],["11-23",133.25],["11-24",133.5],["11-27",133.25],["11-28",134.1],["11-29",134.25],["11-30",132.4],["12-01",131.75],["12-04",130.0],["12-05",130.0],["12-06",133.0],["12-07",132.75],["12-08",132.4],["12-11",133.75],["12-12",136.0],["12-13",134.5],["12-14",133.25],["12-15",133.25],["12-18",132.0],["12-19",132.75],["12-20",129.0],["12-21",131.25],["12-22",130.5],["12-27",131.0],["12-28",129.0],["12-29",127.5]],"Platinum":[["01-03",416.0],["01-04",410.5],["01-05",403.25],["01-06",407.75],["01-09",404.85],["01-10",407.5],["01-11",409.5],["01-12",412.5],["01-13",418.0],["01-16",413.25],["01-17",414.0],["01-18",418.25],["01-19",417.25],["01-20",416.75],["01-23",419.25],["01-24",415.6],["01-25",417.9],["01-26",417.5],["01-27",417.5],["01-30",413.6],["01-31",415.75],["02-01",415.5],["02-02",414.75],["02-03",414.65],["02-06",413.15],["02-07",412.0],["02-08",408.75],["02-09",412.75],["02-10",414.35],["02-13",413.0],["02-14",413.75],["02-15",414.0],["02-16",413.0],["02-17",415.75],["02-20",417.0],["02-21",417.0],["02-22",416.4],["02-23",416.75],["02-24",417.25],["02-27",412.65],["02-28",409.75],["03-01",409.0],["03-02",404.0],["03-03",404.75],["03-06",405.5],["03-07",409.75],["03-08",419.5],["03-09",417.75],["03-10",421.0],["03-13",418.25],["03-14",421.75],["03-15",422.75],["03-16",419.75],["03-17",420.5],["03-20",419.0],["03-21",419.0],["03-22",412.25],["03-23",415.5],["03-24",417.1],["03-27",415.0],["03-28",416.5],["03-29",420.9],["03-30",418.35],["03-31",431.6],["04-03",440.0],["04-04",452.5],["04-05",457.5],["04-06",452.5],["04-07",450.75],["04-10",452.25],["04-11",449.0],["04-12",449.5],["04-13",447.5],["04-18",456.75],["04-19",461.25],["04-20",454.75],["04-21",447.75],["04-24",443.5],["04-25",438.75],["04-26",441.0],["04-27",441.1],["04-28",446.5],["05-01",442.75],["05-02",446.75],["05-03",452.75],["05-04",457.5],["05-05",459.0],["05-09",445.5],["05-10",435.5],["05-11",434.5],["05-12",433.5],["05-15",431.25],["05-16",432.1],["05-17",428.65],["05-18",427.5],["05-19",429.75],["05-22",427.75],["05-23",427.35],["05-24",431.75],["05-25",432.5],["05-26",437.75],["05-30",437.0],["05-31",434.1],["06-01",431.5],["06-02",432.9],["06-05",431.5],["06-06",432.25],["06-07",432.15],["06-08",435.75],["06-09",435.75],["06-12",439.0],["06-13",441.0],["06-14",436.6],["06-15",439.25],["06-16",442.5],["06-19",441.75],["06-20",441.5],["06-21",442.75],["06-22",442.0],["06-23",441.25],["06-26",440.85],["06-27",442.25],["06-28",442.0],["06-29",439.85],["06-30",439.75],["07-03",434.0],["07-04",433.5],["07-05",434.0],["07-06",433.75],["07-07",433.75],["07-10",434.5],["07-11",433.75],["07-12",434.0],["07-13",436.5],["07-14",434.75],["07-17",437.25],["07-18",440.25],["07-19",440.25],["07-20",437.0],["07-21",428.25],["07-24",429.75],["07-25",432.5],["07-26",430.5],["07-27",430.75],["07-28",427.75],["07-31",425.75],["08-01",418.75],["08-02",422.0],["08-03",421.75],["08-04",423.75],["08-07",421.4],["08-08",421.85],["08-09",422.75],["08-10",421.5],["08-11",420.25],["08-14",415.5],["08-15",418.6],["08-16",420.75],["08-17",423.5],["08-18",430.0],["08-21",432.25],["08-22",430.0],["08-23",428.0],["08-24",426.75],["08-25",430.25],["08-29",434.5],["08-30",428.75],["08-31",427.85],["09-01",429.25],["09-04",428.65],["09-05",427.25],["09-06",425.15],["09-07",427.25],["09-08",433.25],["09-11",432.0],["09-12",433.5],["09-13",438.75],["09-14",436.1],["09-15",440.85],["09-18",437.75],["09-19",439.0],["09-20",436.85],["09-21",428.5],["09-22",424.5],["09-25",421.1],["09-26",424.6],["09-27",420.25],["09-28",421.75],["09-29",423.9],["10-02",420.25],["10-03",412.75],["10-04",416.25],["10-05",416.1],["10-06",412.75],["10-09",415.0],["10-10",416.85],["10-11",415.25],["10-12",415.0],["10-13",412.5],["10-16",412.5],["10-17",413.0],["10-18",413.35],["10-19",412.7],["10-20",410.5],["10-23",410.25],["10-24",409.75],["10-25",411.5],["10-26",412.25],["10-27",410.25],["10-30",406.5],["10-31",409.5],["11-01",409.0],["11-02",407.75],["11-03",408.4],["11-06",404.85],["11-07",406.75],["11-08",414.25],["11-09",413.25],["11-10",422.25],["11-13",419.25],["11-14",414.75],["11-15",416.0],["11-16",415.0],["11-17",416.1],["11-20",414.8],["11-21",416.5],["11-22",413.75],["11-23",412.0],["11-24",413.25],["11-27",412.75],["11-28",415.3],["11-29",415.0],["11-30",413.25],["12-01",413.5],["12-04",410.0],["12-05",413.6],["12-06",414.0],["12-07",413.5],["12-08",413.5],["12-11",417.0],["12-12",415.9],["12-13",413.25],["12-14",409.0],["12-15",407.25],["12-18",408.4],["12-19",410.0],["12-20",405.65],["12-21",408.0],["12-22",405.0],["12-27",407.0],["12-28",403.5],["12-29",398.25]],"Silver":[["01-03",4.84],["01-04",4.71],["01-05",4.62],["01-06",4.7],["01-09",4.64],["01-10",4.68],["01-11",4.68],["01-12",4.74],["01-13",4.84],["01-16",4.77],["01-17",4.8],["01-18",4.9],["01-19",4.92],["01-20",4.84],["01-23",4.92],["01-24",4.82],["01-25",4.81],["01-26",4.78],["01-27",4.76],["01-30",4.67],["01-31",4.7],["02-01",4.68],["02-02",4.67],["02-03",4.74],["02-06",4.7],["02-07",4.7],["02-08",4.67],["02-09",4.73],["02-10",4.76],["02-13",4.74],["02-14",4.75],["02-15",4.76],["02-16",4.74],["02-17",4.73],["02-20",4.78],["02-21",4.78],["02-22",4.75],["02-23",4.82],["02-24",4.81],["02-27",4.65],["02-28",4.49],["03-01",4.47],["03-02",4.42],["03-03",4.43],["03-06",4.42],["03-07",4.53],["03-08",4.68],["03-09",4.63],["03-10",4.61],["03-13",4.62],["03-14",4.72],["03-15",4.73],["03-16",4.7],["03-17",4.67],["03-20",4.68],["03-21",4.69],["03-22",4.58],["03-23",4.69],["03-24",4.7],["03-27",4.63],["03-28",4.66],["03-29",4.73],["03-30",4.76],["03-31",5.16],["04-03",5.3],["04-04",5.21],["04-05",5.36],["04-06",5.37],["04-07",5.41],["04-10",5.33],["04-11",5.21],["04-12",5.34],["04-13",5.25],["04-18",5.66],["04-19",5.92],["04-20",5.65],["04-21",5.64],["04-24",5.7],["04-25",5.63],["04-26",5.68],["04-27",5.58],["04-28",5.83],["05-01",5.7],["05-02",5.87],["05-03",5.88],["05-04",5.97],["05-05",6.04],["05-09",5.92],["05-10",5.47],["05-11",5.42],["05-12",5.39],["05-15",5.33],["05-16",5.4],["05-17",5.38],["05-18",5.36],["05-19",5.45],["05-22",5.37],["05-23",5.28],["05-24",5.4],["05-25",5.49],["05-26",5.49],["05-30",5.46],["05-31",5.29],["06-01",5.26],["06-02",5.35],["06-05",5.23],["06-06",5.34],["06-07",5.33],["06-08",5.37],["06-09",5.34],["06-12",5.43],["06-13",5.39],["06-14",5.37],["06-15",5.33],["06-16",5.46],["06-19",5.43],["06-20",5.51],["06-21",5.49],["06-22",5.43],["06-23",5.35],["06-26",5.33],["06-27",5.33],["06-28",5.33],["06-29",5.26],["06-30",5.33],["07-03",5.08],["07-04",5.07],["07-05",5.07],["07-06",5.07],["07-07",5.12],["07-10",5.17],["07-11",5.12],["07-12",5.16],["07-13",5.26],["07-14",5.19],["07-17",5.23],["07-18",5.36],["07-19",5.34],["07-20",5.16],["07-21",5.16],["07-24",5.22],["07-25",5.17],["07-26",5.15],["07-27",5.18],["07-28",5.08],["07-31",5.1],["08-01",5.03],["08-02",5.15],["08-03",5.14],["08-04",5.2],["08-07",5.17],["08-08",5.22],["08-09",5.29],["08-10",5.25],["08-11",5.31],["08-14",5.23],["08-15",5.38],["08-16",5.36],["08-17",5.5],["08-18",5.66],["08-21",5.8],["08-22",5.71],["08-23",5.56],["08-24",5.67],["08-25",5.58],["08-29",5.58],["08-30",5.46],["08-31",5.32],["09-01",5.34],["09-04",5.31],["09-05",5.29],["09-06",5.21],["09-07",5.38],["09-08",5.5],["09-11",5.4],["09-12",5.52],["09-13",5.54],["09-14",5.45],["09-15",5.49],["09-18",5.49],["09-19",5.56],["09-20",5.48],["09-21",5.36],["09-22",5.46],["09-25",5.41],["09-26",5.49],["09-27",5.46],["09-28",5.48],["09-29",5.53],["10-02",5.42],["10-03",5.34],["10-04",5.33],["10-05",5.35],["10-06",5.32],["10-09",5.44],["10-10",5.43],["10-11",5.42],["10-12",5.42],["10-13",5.38],["10-16",5.38],["10-17",5.35],["10-18",5.35],["10-19",5.35],["10-20",5.33],["10-23",5.37],["10-24",5.35],["10-25",5.34],["10-26",5.44],["10-27",5.4],["10-30",5.33],["10-31",5.36],["11-01",5.33],["11-02",5.31],["11-03",5.36],["11-06",5.29],["11-07",5.28],["11-08",5.38],["11-09",5.36],["11-10",5.43],["11-13",5.42],["11-14",5.32],["11-15",5.34],["11-16",5.33],["11-17",5.36],["11-20",5.35],["11-21",5.38],["11-22",5.3],["11-23",5.21],["11-24",5.24],["11-27",5.28],["11-28",5.28],["11-29",5.22],["11-30",5.18],["12-01",5.22],["12-04",5.18],["12-05",5.22],["12-06",5.26],["12-07",5.25],["12-08",5.25],["12-11",5.25],["12-12",5.23],["12-13",5.16],["12-14",5.11],["12-15",5.14],["12-18",5.15],["12-19",5.17],["12-20",5.12],["12-21",5.16],["12-22",5.12],["12-27",5.16],["12-28",5.13],["12-29",5.14]]},"1996":{"Gold":[["01-02",387.1],["01-03",390.5],["01-04",393.6],["01-05",396.4],["01-08",396.0],["01-09",395.65],["01-10",396.75],["01-11",399.4],["01-12",396.35],["01-15",395.0],["01-16",397.8],["01-17",398.9],["01-18",397.5],["01-19",396.8],["01-22",401.8],["01-23",402.65],["01-24",403.0],["01-25",403.35],["01-26",407.4],["01-29",405.45],["01-30",406.7],["01-31",403.2],["02-01",406.6],["02-02",416.25],["02-05",415.25],["02-06",412.2],["02-07",414.75],["02-08",406.95],["02-09",408.3],["02-12",405.25],["02-13",403.0],["02-14",403.9],["02-15",404.55],["02-16",403.05],["02-19",405.9],["02-20",405.4],["02-21",398.5],["02-22",399.35],["02-23",397.75],["02-26",399.55],["02-27",398.75],["02-28",397.7],["02-29",400.35],["03-01",400.3],["03-04",398.65],["03-05",392.9],["03-06",393.6],["03-07",394.2],["03-08",394.85],["03-11",396.6],["03-12",396.0],["03-13",397.4],["03-14",396.1],["03-15",395.6],["03-18",395.45],["03-19",395.05],["03-20",394.7],["03-21",395.3],["03-22",397.3],["03-25",398.0],["03-26",399.45],["03-27",400.0],["03-28",398.6],["03-29",396.7],["04-01",395.0],["04-02",394.35],["04-03",393.8],["04-04",394.3],["04-09",397.6],["04-10",394.55],["04-11",395.15],["04-12",395.2],["04-15",393.75],["04-16",393.5],["04-17",391.4],["04-18",391.3],["04-19",389.9],["04-22",390.7],["04-23",391.45],["04-24",391.1],["04-25",390.35],["04-26",393.1],["04-29",390.75],["04-30",390.15],["05-01",391.0],["05-02",392.8],["05-03",394.0],["05-07",393.75],["05-08",393.65],["05-09",393.2],["05-10",392.8],["05-13",391.25],["05-14",391.25],["05-15",391.85],["05-16",392.0],["05-17",392.5],["05-20",391.65],["05-21",391.2],["05-22",391.0],["05-23",391.35],["05-24",390.65],["05-28",392.15],["05-29",391.65],["05-30",391.55],["05-31",390.55],["06-03",390.8],["06-04",390.35],["06-05",387.95],["06-06",385.7],["06-07",385.85],["06-10",385.55],["06-11",385.4],["06-12",384.5],["06-13",384.8],["06-14",383.2],["06-17",384.55],["06-18",384.9],["06-19",386.0],["06-20",384.3],["06-21",384.2],["06-24",383.7],["06-25",384.85],["06-26",384.0],["06-27",383.0],["06-28",381.3],["07-01",380.6],["07-02",381.75],["07-03",382.5],["07-04",380.9],["07-05",381.0],["07-08",382.3],["07-09",381.0],["07-10",383.4],["07-11",382.5],["07-12",384.0],["07-15",383.55],["07-16",384.65],["07-17",383.65],["07-18",383.85],["07-19",384.35],["07-22",384.5],["07-23",385.2],["07-24",384.4],["07-25",385.05],["07-26",384.9],["07-29",385.05],["07-30",384.9],["07-31",385.5],["08-01",386.65],["08-02",387.15],["08-05",387.95],["08-06",388.85],["08-07",388.25],["08-08",387.75],["08-09",388.4],["08-12",387.2],["08-13",387.7],["08-14",387.15],["08-15",386.3],["08-16",386.2],["08-19",386.25],["08-20",387.1],["08-21",387.45],["08-22",386.9],["08-23",387.5],["08-27",389.0],["08-28",388.65],["08-29",388.05],["08-30",387.25],["09-02",386.9],["09-03",387.2],["09-04",385.95],["09-05",386.0],["09-06",385.6],["09-09",385.0],["09-10",382.45],["09-11",383.15],["09-12",382.2],["09-13",382.5],["09-16",382.65],["09-17",383.3],["09-18",382.9],["09-19",383.1],["09-20",382.5],["09-23",381.2],["09-24",381.6],["09-25",383.25],["09-26",382.05],["09-27",380.3],["09-30",379.3],["10-01",377.05],["10-02",379.2],["10-03",379.5],["10-04",380.2],["10-07",379.6],["10-08",381.0],["10-09",380.9],["10-10",381.6],["10-11",381.85],["10-14",381.05],["10-15",381.0],["10-16",380.8],["10-17",380.55],["10-18",379.6],["10-21",380.0],["10-22",382.4],["10-23",383.95],["10-24",383.7],["10-25",382.2],["10-28",382.8],["10-29",382.35],["10-30",380.3],["10-31",379.3],["11-01",377.2],["11-04",378.65],["11-05",379.25],["11-06",377.9],["11-07",377.9],["11-08",378.35],["11-11",379.75],["11-12",381.6],["11-13",382.5],["11-14",382.65],["11-15",379.85],["11-18",379.7],["11-19",378.3],["11-20",378.6],["11-21",378.5],["11-22",376.9],["11-25",375.1],["11-26",374.5],["11-27",373.95],["11-28",372.2],["11-29",371.9],["12-02",370.5],["12-03",369.0],["12-04",370.4],["12-05",368.3],["12-06",373.0],["12-09",368.5],["12-10",368.8],["12-11",369.6],["12-12",368.6],["12-13",369.05],["12-16",368.6],["12-17",368.3],["12-18",369.0],["12-19",369.6],["12-20",369.2],["12-23",368.7],["12-24",368.9],["12-27",369.55],["12-30",369.6],["12-31",369.55]],"Palladium":[["01-02",128.75],["01-03",133.0],["01-04",131.5],["01-05",131.75],["01-08",130.75],["01-09",129.75],["01-10",129.65],["01-11",129.0],["01-12",127.6],["01-15",129.5],["01-16",130.0],["01-17",130.15],["01-18",129.5],["01-19",129.5],["01-22",130.5],["01-23",130.5],["01-24",130.0],["01-25",128.25],["01-26",129.25],["01-29",127.25],["01-30",128.25],["01-31",128.0],["02-01",128.5],["02-02",136.0],["02-05",139.5],["02-06",139.25],["02-07",141.0],["02-08",138.35],["02-09",140.0],["02-12",138.25],["02-13",138.75],["02-14",140.25],["02-15",142.25],["02-16",141.5],["02-19",141.5],["02-20",141.25],["02-21",140.75],["02-22",141.25],["02-23",140.0],["02-26",140.25],["02-27",139.5],["02-28",138.75],["02-29",137.5],["03-01",137.25],["03-04",134.75],["03-05",132.25],["03-06",133.25],["03-07",135.15],["03-08",135.25],["03-11",139.5],["03-12",142.0],["03-13",141.5],["03-14",139.5],["03-15",138.75],["03-18",138.25],["03-19",137.75],["03-20",138.5],["03-21",138.75],["03-22",139.25],["03-25",140.25],["03-26",140.5],["03-27",141.25],["03-28",139.75],["03-29",138.25],["04-01",139.75],["04-02",141.0],["04-03",140.5],["04-04",140.0],["04-09",140.5],["04-10",139.25],["04-11",138.75],["04-12",137.5],["04-15",136.75],["04-16",137.0],["04-17",135.5],["04-18",135.75],["04-19",135.75],["04-22",132.25],["04-23",135.25],["04-24",135.0],["04-25",133.75],["04-26",135.5],["04-29",131.4],["04-30",130.25],["05-01",130.75],["05-02",133.25],["05-03",134.55],["05-07",134.85],["05-08",135.75],["05-09",134.5],["05-10",133.0],["05-13",133.0],["05-14",133.25],["05-15",133.25],["05-16",133.75],["05-17",132.75],["05-20",131.5],["05-21",128.25],["05-22",128.5],["05-23",129.75],["05-24",130.5],["05-28",128.75],["05-29",130.75],["05-30",131.5],["05-31",131.5],["06-03",131.5],["06-04",129.75],["06-05",129.25],["06-06",127.25],["06-07",128.75],["06-10",128.5],["06-11",128.5],["06-12",127.75],["06-13",128.75],["06-14",128.5],["06-17",129.25],["06-18",129.75],["06-19",129.35],["06-20",129.25],["06-21",129.25],["06-24",129.25],["06-25",130.25],["06-26",130.75],["06-27",132.25],["06-28",132.0],["07-01",132.5],["07-02",133.5],["07-03",133.75],["07-04",132.5],["07-05",132.5],["07-08",131.5],["07-09",129.75],["07-10",130.75],["07-11",130.5],["07-12",131.0],["07-15",131.25],["07-16",133.5],["07-17",132.5],["07-18",132.5],["07-19",133.0],["07-22",133.25],["07-23",134.25],["07-24",133.5],["07-25",133.25],["07-26",130.75],["07-29",131.35],["07-30",130.0],["07-31",130.0],["08-01",131.75],["08-02",130.5],["08-05",129.5],["08-06",129.75],["08-07",128.5],["08-08",128.75],["08-09",129.25],["08-12",128.25],["08-13",129.25],["08-14",128.75],["08-15",127.0],["08-16",125.25],["08-19",123.5],["08-20",125.25],["08-21",126.0],["08-22",125.0],["08-23",124.75],["08-27",125.0],["08-28",125.25],["08-29",126.0],["08-30",125.5],["09-02",125.25],["09-03",125.25],["09-04",125.0],["09-05",125.5],["09-06",124.75],["09-09",124.5],["09-10",123.75],["09-11",123.0],["09-12",122.0],["09-13",122.0],["09-16",122.25],["09-17",121.5],["09-18",120.5],["09-19",121.5],["09-20",120.5],["09-23",118.75],["09-24",116.5],["09-25",118.5],["09-26",119.25],["09-27",118.0],["09-30",118.5],["10-01",118.5],["10-02",120.25],["10-03",120.75],["10-04",120.75],["10-07",119.75],["10-08",118.25],["10-09",118.0],["10-10",117.75],["10-11",118.25],["10-14",117.25],["10-15",116.25],["10-16",116.25],["10-17",116.25],["10-18",115.25],["10-21",115.75],["10-22",117.5],["10-23",118.5],["10-24",118.25],["10-25",117.0],["10-28",116.25],["10-29",116.0],["10-30",115.5],["10-31",116.0],["11-01",115.75],["11-04",116.0],["11-05",116.5],["11-06",116.25],["11-07",116.0],["11-08",116.75],["11-11",117.0],["11-12",117.75],["11-13",118.0],["11-14",120.5],["11-15",118.0],["11-18",119.0],["11-19",118.5],["11-20",118.25],["11-21",118.0],["11-22",118.0],["11-25",117.5],["11-26",115.75],["11-27",114.75],["11-28",114.25],["11-29",114.25],["12-02",114.5],["12-03",115.25],["12-04",115.5],["12-05",116.25],["12-06",116.0],["12-09",115.5],["12-10",117.0],["12-11",118.25],["12-12",119.25],["12-13",118.0],["12-16",117.75],["12-17",117.25],["12-18",118.0],["12-19",117.75],["12-20",118.25],["12-23",118.25],["12-24",117.25],["12-27",117.0],["12-30",116.75],["12-31",116.5]],"Platinum":[["01-02",400.75],["01-03",406.0],["01-04",410.25],["01-05",413.75],["01-08",417.25],["01-09",416.0],["01-10",415.85],["01-11",417.35],["01-12",414.75],["01-15",412.85],["01-16",415.75],["01-17",419.75],["01-18",415.5],["01-19",415.75],["01-22",419.0],["01-23",422.35],["01-24",421.5],["01-25",418.0],["01-26",423.5],["01-29",419.25],["01-30",421.0],["01-31",418.15],["02-01",422.5],["02-02",433.0],["02-05",430.25],["02-06",427.25],["02-07",431.0],["02-08",423.25],["02-09",423.75],["02-12",419.5],["02-13",422.5],["02-14",421.5],["02-15",422.75],["02-16",421.75],["02-19",424.25],["02-20",423.75],["02-21",417.5],["02-22",415.1],["02-23",410.6],["02-26",411.85],["02-27",409.0],["02-28",408.0],["02-29",412.85],["03-01",412.75],["03-04",410.75],["03-05",406.35],["03-06",406.35],["03-07",408.5],["03-08",410.5],["03-11",411.0],["03-12",411.25],["03-13",413.75],["03-14",413.0],["03-15",411.35],["03-18",411.25],["03-19",411.25],["03-20",410.5],["03-21",411.5],["03-22",412.5],["03-25",412.25],["03-26",413.25],["03-27",414.5],["03-28",412.5],["03-29",410.0],["04-01",406.5],["04-02",405.35],["04-03",405.25],["04-04",406.75],["04-09",410.5],["04-10",406.0],["04-11",407.5],["04-12",408.0],["04-15",405.4],["04-16",404.0],["04-17",401.75],["04-18",400.0],["04-19",399.25],["04-22",401.25],["04-23",404.75],["04-24",403.25],["04-25",401.5],["04-26",406.0],["04-29",401.6],["04-30",400.5],["05-01",400.5],["05-02",403.2],["05-03",404.5],["05-07",405.25],["05-08",406.25],["05-09",404.5],["05-10",404.25],["05-13",402.5],["05-14",402.75],["05-15",402.25],["05-16",402.5],["05-17",402.0],["05-20",398.25],["05-21",397.25],["05-22",397.25],["05-23",398.6],["05-24",398.0],["05-28",398.0],["05-29",400.25],["05-30",399.75],["05-31",399.0],["06-03",401.0],["06-04",399.25],["06-05",394.25],["06-06",390.75],["06-07",393.25],["06-10",392.75],["06-11",391.75],["06-12",391.0],["06-13",392.25],["06-14",390.75],["06-17",392.15],["06-18",392.5],["06-19",393.4],["06-20",392.25],["06-21",391.75],["06-24",391.75],["06-25",391.75],["06-26",390.15],["06-27",389.5],["06-28",388.65],["07-01",390.5],["07-02",391.65],["07-03",391.75],["07-04",387.25],["07-05",389.25],["07-08",390.75],["07-09",388.25],["07-10",390.25],["07-11",390.0],["07-12",391.25],["07-15",391.75],["07-16",395.0],["07-17",392.0],["07-18",392.75],["07-19",393.75],["07-22",394.0],["07-23",396.25],["07-24",396.65],["07-25",396.25],["07-26",398.75],["07-29",399.0],["07-30",398.5],["07-31",399.5],["08-01",403.5],["08-02",403.5],["08-05",403.75],["08-06",402.75],["08-07",400.0],["08-08",400.75],["08-09",401.75],["08-12",399.25],["08-13",399.75],["08-14",400.0],["08-15",400.5],["08-16",399.0],["08-19",397.25],["08-20",399.25],["08-21",399.5],["08-22",398.85],["08-23",399.5],["08-27",401.0],["08-28",400.0],["08-29",399.5],["08-30",397.0],["09-02",395.5],["09-03",396.0],["09-04",395.0],["09-05",394.0],["09-06",393.0],["09-09",393.75],["09-10",392.75],["09-11",392.75],["09-12",390.0],["09-13",389.5],["09-16",388.0],["09-17",388.5],["09-18",387.75],["09-19",390.0],["09-20",388.25],["09-23",386.5],["09-24",387.5],["09-25",388.25],["09-26",387.25],["09-27",383.75],["09-30",383.5],["10-01",381.5],["10-02",383.75],["10-03",384.0],["10-04",384.25],["10-07",383.5],["10-08",384.25],["10-09",384.0],["10-10",387.25],["10-11",387.0],["10-14",384.75],["10-15",384.5],["10-16",383.75],["10-17",383.75],["10-18",383.5],["10-21",383.0],["10-22",385.0],["10-23",387.5],["10-24",387.5],["10-25",384.0],["10-28",383.0],["10-29",382.75],["10-30",380.5],["10-31",380.5],["11-01",379.75],["11-04",381.0],["11-05",381.75],["11-06",379.25],["11-07",380.25],["11-08",382.25],["11-11",383.25],["11-12",388.25],["11-13",387.5],["11-14",386.25],["11-15",384.5],["11-18",385.0],["11-19",384.0],["11-20",383.5],["11-21",384.25],["11-22",382.9],["11-25",381.75],["11-26",379.0],["11-27",377.75],["11-28",374.25],["11-29",374.5],["12-02",373.75],["12-03",372.5],["12-04",372.5],["12-05",372.75],["12-06",372.0],["12-09",368.0],["12-10",368.5],["12-11",369.25],["12-12",368.5],["12-13",369.0],["12-16",367.75],["12-17",367.25],["12-18",371.0],["12-19",371.0],["12-20",371.5],["12-23",372.5],["12-24",372.0],["12-27",371.0],["12-30",370.25],["12-31",370.25]],"Silver":[["01-02",5.17],["01-03",5.35],["01-04",5.35],["01-05",5.5],["01-08",5.53],["01-09",5.51],["01-10",5.54],["01-11",5.56],["01-12",5.46],["01-15",5.4],["01-16",5.46],["01-17",5.49],["01-18",5.46],["01-19",5.41],["01-22",5.5],["01-23",5.59],["01-24",5.54],["01-25",5.52],["01-26",5.62],["01-29",5.51],["01-30",5.58],["01-31",5.52],["02-01",5.59],["02-02",5.83],["02-05",5.8],["02-06",5.75],["02-07",5.82],["02-08",5.66],["02-09",5.72],["02-12",5.64],["02-13",5.71],["02-14",5.69],["02-15",5.75],["02-16",5.68],["02-19",5.71],["02-20",5.69],["02-21",5.55],["02-22",5.59],["02-23",5.51],["02-26",5.49],["02-27",5.49],["02-28",5.46],["02-29",5.52],["03-01",5.53],["03-04",5.49],["03-05",5.35],["03-06",5.36],["03-07",5.37],["03-08",5.43],["03-11",5.49],["03-12",5.5],["03-13",5.58],["03-14",5.59],["03-15",5.57],["03-18",5.55],["03-19",5.55],["03-20",5.5],["03-21",5.57],["03-22",5.6],["03-25",5.63],["03-26",5.64],["03-27",5.69],["03-28",5.64],["03-29",5.52],["04-01",5.52],["04-02",5.53],["04-03",5.51],["04-04",5.53],["04-09",5.54],["04-10",5.46],["04-11",5.53],["04-12",5.54],["04-15",5.5],["04-16",5.47],["04-17",5.31],["04-18",5.33],["04-19",5.25],["04-22",5.29],["04-23",5.33],["04-24",5.32],["04-25",5.32],["04-26",5.37],["04-29",5.29],["04-30",5.28],["05-01",5.33],["05-02",5.38],["05-03",5.41],["05-07",5.46],["05-08",5.48],["05-09",5.43],["05-10",5.42],["05-13",5.38],["05-14",5.36],["05-15",5.4],["05-16",5.38],["05-17",5.36],["05-20",5.29],["05-21",5.29],["05-22",5.29],["05-23",5.34],["05-24",5.31],["05-28",5.34],["05-29",5.37],["05-30",5.34],["05-31",5.33],["06-03",5.38],["06-04",5.36],["06-05",5.21],["06-06",5.16],["06-07",5.2],["06-10",5.2],["06-11",5.17],["06-12",5.12],["06-13",5.11],["06-14",4.98],["06-17",5.17],["06-18",5.18],["06-19",5.21],["06-20",5.11],["06-21",5.11],["06-24",5.11],["06-25",5.18],["06-26",5.15],["06-27",5.11],["06-28",5.03],["07-01",5.05],["07-02",5.07],["07-03",5.14],["07-04",5.08],["07-05",5.07],["07-08",5.12],["07-09",5.08],["07-10",5.12],["07-11",5.1],["07-12",5.13],["07-15",5.13],["07-16",5.15],["07-17",5.0],["07-18",5.0],["07-19",5.01],["07-22",4.97],["07-23",5.03],["07-24",4.98],["07-25",4.99],["07-26",4.99],["07-29",5.09],["07-30",5.07],["07-31",5.11],["08-01",5.15],["08-02",5.12],["08-05",5.1],["08-06",5.07],["08-07",5.05],["08-08",5.04],["08-09",5.12],["08-12",5.04],["08-13",5.08],["08-14",5.09],["08-15",5.04],["08-16",5.08],["08-19",5.08],["08-20",5.2],["08-21",5.21],["08-22",5.19],["08-23",5.21],["08-27",5.25],["08-28",5.21],["08-29",5.18],["08-30",5.2],["09-02",5.18],["09-03",5.2],["09-04",5.15],["09-05",5.2],["09-06",5.14],["09-09",5.12],["09-10",5.08],["09-11",5.09],["09-12",5.08],["09-13",5.05],["09-16",5.04],["09-17",5.06],["09-18",5.05],["09-19",5.06],["09-20",4.95],["09-23",4.88],["09-24",4.91],["09-25",4.93],["09-26",4.87],["09-27",4.85],["09-30",4.88],["10-01",4.85],["10-02",4.91],["10-03",4.91],["10-04",4.9],["10-07",4.86],["10-08",4.89],["10-09",4.88],["10-10",4.97],["10-11",5.03],["10-14",5.04],["10-15",5.02],["10-16",5.02],["10-17",4.97],["10-18",4.89],["10-21",4.9],["10-22",4.95],["10-23",4.98],["10-24",4.98],["10-25",4.9],["10-28",4.92],["10-29",4.89],["10-30",4.83],["10-31",4.83],["11-01",4.8],["11-04",4.81],["11-05",4.83],["11-06",4.79],["11-07",4.74],["11-08",4.83],["11-11",4.83],["11-12",4.91],["11-13",4.9],["11-14",4.89],["11-15",4.84],["11-18",4.91],["11-19",4.87],["11-20",4.9],["11-21",4.93],["11-22",4.86],["11-25",4.83],["11-26",4.76],["11-27",4.74],["11-28",4.73],["11-29",4.74],["12-02",4.73],["12-03",4.71],["12-04",4.83],["12-05",4.75],["12-06",4.89],["12-09",4.76],["12-10",4.81],["12-11",4.87],["12-12",4.83],["12-13",4.83],["12-16",4.81],["12-17",4.8],["12-18",4.85],["12-19",4.86],["12-20",4.88],["12-23",4.83],["12-24",4.84],["12-27",4.88],["12-30",4.88],["12-31",4.8]]},"1997":{"Gold":[["01-02",367.8],["01-03",364.3],["01-06",359.25],["01-07",357.65],["01-08",355.8],["01-09",354.5],["01-10",358.55],["01-13",359.6],["01-14",357.3],["01-15",352.45],["01-16",354.0],["01-17",354.1],["01-20",354.2],["01-21",353.4],["01-22",350.1],["01-23",349.8],["01-24",352.95],["01-27",353.1],["01-28",357.25],["01-29",350.15],["01-30",349.3],["01-31",345.0],["02-03",343.75],["02-04",346.3],["02-05",343.15],["02-06",343.4],["02-07",340.9],["02-10",341.0],["02-11",338.85],["02-12",336.9],["02-13",343.0],["02-14",342.5],["02-17",343.6],["02-18",346.0],["02-19",346.1],["02-20",344.85],["02-21",350.75],["02-24",352.45],["02-25",353.45],["02-26",353.85],["02-27",356.6],["02-28",360.6],["03-03",361.8],["03-04",361.75],["03-05",355.75],["03-06",352.15],["03-07",351.7],["03-10",349.9],["03-11",352.6],["03-12",353.15],["03-13",351.45],["03-14",353.0],["03-17",352.05],["03-18",347.4],["03-19",348.95],["03-20",352.7],["03-21",351.7],["03-24",350.65],["03-25",350.9],["03-26",346.8],["03-27",349.5],["04-01",349.85],["04-02",350.7],["04-03",349.1],["04-04",347.35],["04-07",347.85],["04-08",349.1],["04-09",348.0],["04-10",348.05],["04-11",348.65],["04-14",346.65],["04-15",345.6],["04-16",341.45],["04-17",341.2],["04-18",342.0],["04-21",342.15],["04-22",342.0],["04-23",340.7],["04-24",341.15],["04-25",341.35],["04-28",341.25],["04-29",338.95],["04-30",340.45],["05-01",339.55],["05-02",339.8],["05-06",342.8],["05-07",340.65],["05-08",342.4],["05-09",344.8],["05-12",348.2],["05-13",347.3],["05-14",349.0],["05-15",348.1],["05-16",347.0],["05-19",343.35],["05-20",342.5],["05-21",342.25],["05-22",342.95],["05-23",341.65],["05-27",343.55],["05-28",344.7],["05-29",345.7],["05-30",345.75],["06-02",344.0],["06-03",343.8],["06-04",342.4],["06-05",340.7],["06-06",343.8],["06-09",343.85],["06-10",344.0],["06-11",343.7],["06-12",341.8],["06-13",341.2],["06-16",340.95],["06-17",341.4],["06-18",342.05],["06-19",340.15],["06-20",339.55],["06-23",336.95],["06-24",338.65],["06-25",338.7],["06-26",337.9],["06-27",337.3],["06-30",334.05],["07-01",333.6],["07-02",331.45],["07-03",332.3],["07-04",325.2],["07-07",318.75],["07-08",317.6],["07-09",315.75],["07-10",319.65],["07-11",320.6],["07-14",321.35],["07-15",319.0],["07-16",319.5],["07-17",318.75],["07-18",323.45],["07-21",328.05],["07-22",326.0],["07-23",324.35],["07-24",321.8],["07-25",324.5],["07-28",325.4],["07-29",327.5],["07-30",326.4],["07-31",326.0],["08-01",325.3],["08-04",324.05],["08-05",323.35],["08-06",318.85],["08-07",318.95],["08-08",321.6],["08-11",326.2],["08-12",327.6],["08-13",328.6],["08-14",327.3],["08-15",323.5],["08-18",326.05],["08-19",322.1],["08-20",322.0],["08-21",321.9],["08-22",321.8],["08-26",325.4],["08-27",325.3],["08-28",324.7],["08-29",325.4],["09-01",324.4],["09-02",324.5],["09-03",322.0],["09-04",321.8],["09-05",321.6],["09-08",322.05],["09-09",321.0],["09-10",321.0],["09-11",321.05],["09-12",323.25],["09-15",323.15],["09-16",321.8],["09-17",319.95],["09-18",320.65],["09-19",321.15],["09-22",321.1],["09-23",320.7],["09-24",322.0],["09-25",323.15],["09-26",325.45],["09-29",327.05],["09-30",328.75],["10-01",336.8],["10-02",331.75],["10-03",331.1],["10-06",334.15],["10-07",331.5],["10-08",331.9],["10-09",333.75],["10-10",327.9],["10-13",328.8],["10-14",328.1],["10-15",325.6],["10-16",327.3],["10-17",324.2],["10-20",324.25],["10-21",323.0],["10-22",322.7],["10-23",323.3],["10-24",321.9],["10-27",311.8],["10-28",313.75],["10-29",313.7],["10-30",314.0],["10-31",310.4],["11-03",313.5],["11-04",313.3],["11-05",314.6],["11-06",312.25],["11-07",313.25],["11-10",309.7],["11-11",310.6],["11-12",310.1],["11-13",308.35],["11-14",304.5],["11-17",303.0],["11-18",303.65],["11-19",306.4],["11-20",303.05],["11-21",303.4],["11-24",305.5],["11-25",301.7],["11-26",297.0],["11-27",296.15],["11-28",296.9],["12-01",293.35],["12-02",293.5],["12-03",291.1],["12-04",289.85],["12-05",287.05],["12-08",288.1],["12-09",285.5],["12-10",285.05],["12-11",286.15],["12-12",283.05],["12-15",283.2],["12-16",283.25],["12-17",286.1],["12-18",287.05],["12-19",289.25],["12-22",290.45],["12-23",292.2],["12-24",296.1],["12-29",293.9],["12-30",290.9],["12-31",289.2]],"Palladium":[["01-02",120.75],["01-03",120.25],["01-06",117.75],["01-07",118.25],["01-08",119.5],["01-09",121.85],["01-10",122.25],["01-13",122.5],["01-14",121.25],["01-15",120.0],["01-16",121.25],["01-17",122.0],["01-20",122.0],["01-21",121.25],["01-22",121.0],["01-23",121.25],["01-24",121.75],["01-27",122.75],["01-28",123.25],["01-29",121.75],["01-30",121.25],["01-31",121.25],["02-03",124.3],["02-04",125.75],["02-05",126.25],["02-06",127.5],["02-07",130.5],["02-10",133.75],["02-11",135.0],["02-12",135.5],["02-13",141.25],["02-14",137.0],["02-17",130.5],["02-18",136.0],["02-19",134.5],["02-20",133.0],["02-21",134.25],["02-24",138.25],["02-25",139.5],["02-26",141.25],["02-27",157.0],["02-28",155.0],["03-03",150.5],["03-04",150.75],["03-05",148.25],["03-06",144.75],["03-07",148.25],["03-10",148.5],["03-11",155.0],["03-12",154.75],["03-13",150.5],["03-14",151.5],["03-17",152.0],["03-18",149.0],["03-19",145.75],["03-20",151.75],["03-21",148.5],["03-24",147.5],["03-25",148.5],["03-26",144.5],["03-27",145.25],["04-01",146.0],["04-02",148.75],["04-03",146.5],["04-04",145.5],["04-07",146.75],["04-08",154.5],["04-09",157.75],["04-10",160.25],["04-11",157.5],["04-14",155.25],["04-15",152.25],["04-16",149.5],["04-17",152.0],["04-18",152.75],["04-21",157.0],["04-22",156.5],["04-23",155.5],["04-24",155.75],["04-25",159.0],["04-28",156.9],["04-29",158.0],["04-30",156.75],["05-01",155.5],["05-02",156.0],["05-06",159.0],["05-07",157.25],["05-08",156.75],["05-09",162.5],["05-12",171.75],["05-13",170.0],["05-14",172.25],["05-15",173.75],["05-16",173.5],["05-19",171.0],["05-20",177.5],["05-21",180.5],["05-22",175.0],["05-23",168.5],["05-27",172.75],["05-28",188.0],["05-29",196.5],["05-30",188.5],["06-02",181.0],["06-03",180.0],["06-04",210.0],["06-05",235.0],["06-06",240.0],["06-09",237.0],["06-10",210.0],["06-11",218.0],["06-12",208.0],["06-13",203.0],["06-16",205.0],["06-17",197.0],["06-18",192.0],["06-19",199.0],["06-20",200.0],["06-23",204.0],["06-24",197.0],["06-25",193.0],["06-26",195.5],["06-27",195.0],["06-30",190.0],["07-01",194.0],["07-02",193.0],["07-03",191.0],["07-04",190.0],["07-07",185.0],["07-08",176.5],["07-09",172.5],["07-10",168.0],["07-11",170.0],["07-14",173.5],["07-15",172.0],["07-16",178.0],["07-17",175.5],["07-18",179.0],["07-21",189.5],["07-22",193.0],["07-23",200.0],["07-24",198.5],["07-25",201.0],["07-28",202.0],["07-29",198.0],["07-30",208.0],["07-31",211.0],["08-01",227.0],["08-04",233.0],["08-05",245.5],["08-06",227.5],["08-07",221.0],["08-08",230.0],["08-11",233.0],["08-12",228.0],["08-13",227.5],["08-14",219.0],["08-15",217.0],["08-18",211.0],["08-19",203.0],["08-20",196.0],["08-21",204.0],["08-22",198.0],["08-26",200.0],["08-27",194.0],["08-28",188.0],["08-29",191.0],["09-01",193.0],["09-02",188.5],["09-03",188.0],["09-04",189.0],["09-05",187.0],["09-08",190.0],["09-09",186.0],["09-10",187.5],["09-11",189.5],["09-12",193.5],["09-15",194.0],["09-16",192.5],["09-17",191.0],["09-18",190.0],["09-19",195.0],["09-22",196.0],["09-23",188.5],["09-24",194.0],["09-25",190.0],["09-26",193.0],["09-29",194.0],["09-30",196.0],["10-01",193.5],["10-02",191.0],["10-03",193.0],["10-06",195.5],["10-07",194.5],["10-08",201.0],["10-09",205.5],["10-10",201.5],["10-13",204.0],["10-14",206.5],["10-15",216.0],["10-16",220.0],["10-17",223.5],["10-20",212.5],["10-21",206.0],["10-22",203.0],["10-23",205.0],["10-24",203.0],["10-27",204.0],["10-28",203.0],["10-29",215.0],["10-30",212.0],["10-31",209.0],["11-03",206.0],["11-04",208.0],["11-05",209.5],["11-06",203.5],["11-07",207.5],["11-10",205.0],["11-11",208.5],["11-12",212.5],["11-13",212.0],["11-14",210.0],["11-17",207.0],["11-18",207.0],["11-19",212.0],["11-20",214.0],["11-21",210.0],["11-24",207.0],["11-25",206.0],["11-26",207.0],["11-27",208.0],["11-28",208.0],["12-01",204.0],["12-02",208.5],["12-03",208.0],["12-04",207.0],["12-05",207.0],["12-08",207.0],["12-09",206.0],["12-10",207.75],["12-11",206.0],["12-12",202.0],["12-15",197.0],["12-16",190.0],["12-17",188.0],["12-18",190.5],["12-19",187.0],["12-22",185.0],["12-23",183.5],["12-24",191.0],["12-29",195.0],["12-30",202.0],["12-31",204.0]],"Platinum":[["01-02",369.5],["01-03",366.5],["01-06",362.75],["01-07",361.5],["01-08",359.0],["01-09",359.25],["01-10",363.0],["01-13",363.25],["01-14",361.0],["01-15",359.0],["01-16",359.75],["01-17",360.5],["01-20",359.5],["01-21",356.25],["01-22",356.5],["01-23",356.25],["01-24",358.25],["01-27",357.75],["01-28",360.5],["01-29",354.5],["01-30",353.0],["01-31",350.25],["02-03",350.25],["02-04",351.75],["02-05",349.75],["02-06",351.25],["02-07",349.75],["02-10",351.5],["02-11",354.0],["02-12",352.25],["02-13",368.5],["02-14",366.5],["02-17",363.75],["02-18",368.75],["02-19",368.25],["02-20",363.85],["02-21",369.25],["02-24",371.0],["02-25",374.0],["02-26",377.0],["02-27",393.5],["02-28",398.75],["03-03",390.5],["03-04",387.25],["03-05",384.0],["03-06",377.25],["03-07",380.5],["03-10",378.0],["03-11",382.75],["03-12",382.5],["03-13",380.0],["03-14",381.25],["03-17",380.5],["03-18",378.0],["03-19",377.25],["03-20",379.0],["03-21",377.5],["03-24",375.75],["03-25",376.5],["03-26",372.0],["03-27",373.5],["04-01",369.5],["04-02",368.75],["04-03",367.0],["04-04",363.75],["04-07",362.25],["04-08",366.75],["04-09",366.0],["04-10",369.75],["04-11",370.0],["04-14",368.25],["04-15",365.5],["04-16",365.0],["04-17",370.0],["04-18",378.75],["04-21",380.5],["04-22",380.5],["04-23",375.0],["04-24",374.5],["04-25",377.0],["04-28",376.5],["04-29",373.25],["04-30",374.25],["05-01",372.25],["05-02",372.5],["05-06",374.0],["05-07",373.0],["05-08",375.5],["05-09",382.25],["05-12",395.25],["05-13",389.75],["05-14",392.25],["05-15",395.5],["05-16",394.5],["05-19",388.75],["05-20",389.5],["05-21",396.0],["05-22",389.0],["05-23",387.0],["05-27",392.75],["05-28",404.5],["05-29",417.5],["05-30",410.0],["06-02",405.5],["06-03",404.0],["06-04",425.0],["06-05",440.0],["06-06",495.0],["06-09",480.0],["06-10",461.0],["06-11",455.0],["06-12",448.5],["06-13",437.0],["06-16",435.0],["06-17",416.0],["06-18",411.0],["06-19",416.0],["06-20",417.5],["06-23",422.0],["06-24",417.0],["06-25",414.0],["06-26",420.15],["06-27",416.0],["06-30",423.0],["07-01",434.0],["07-02",429.0],["07-03",425.0],["07-04",419.5],["07-07",419.0],["07-08",407.0],["07-09",399.0],["07-10",397.0],["07-11",404.5],["07-14",409.0],["07-15",403.5],["07-16",407.25],["07-17",406.0],["07-18",408.0],["07-21",413.5],["07-22",414.0],["07-23",415.5],["07-24",415.5],["07-25",422.0],["07-28",426.5],["07-29",427.0],["07-30",426.0],["07-31",429.0],["08-01",436.5],["08-04",442.0],["08-05",460.0],["08-06",432.0],["08-07",426.5],["08-08",439.0],["08-11",442.0],["08-12",437.5],["08-13",440.0],["08-14",431.0],["08-15",423.0],["08-18",426.0],["08-19",415.5],["08-20",406.5],["08-21",414.5],["08-22",408.0],["08-26",408.0],["08-27",405.0],["08-28",406.5],["08-29",410.0],["09-01",410.0],["09-02",411.0],["09-03",407.5],["09-04",418.0],["09-05",418.75],["09-08",422.0],["09-09",418.0],["09-10",423.25],["09-11",426.0],["09-12",427.0],["09-15",428.5],["09-16",426.0],["09-17",421.0],["09-18",422.0],["09-19",426.5],["09-22",436.0],["09-23",435.0],["09-24",443.0],["09-25",437.0],["09-26",431.0],["09-29",429.0],["09-30",432.75],["10-01",435.0],["10-02",429.5],["10-03",431.0],["10-06",426.0],["10-07",423.0],["10-08",432.0],["10-09",434.0],["10-10",430.0],["10-13",434.0],["10-14",439.0],["10-15",435.5],["10-16",434.0],["10-17",425.5],["10-20",422.5],["10-21",424.0],["10-22",419.0],["10-23",423.0],["10-24",420.5],["10-27",413.0],["10-28",398.5],["10-29",408.0],["10-30",400.5],["10-31",409.0],["11-03",407.0],["11-04",408.0],["11-05",408.0],["11-06",399.5],["11-07",400.0],["11-10",392.0],["11-11",391.0],["11-12",394.0],["11-13",391.0],["11-14",389.0],["11-17",387.0],["11-18",386.0],["11-19",396.0],["11-20",396.0],["11-21",392.0],["11-24",390.25],["11-25",385.5],["11-26",380.0],["11-27",384.0],["11-28",382.0],["12-01",384.0],["12-02",388.0],["12-03",387.0],["12-04",384.5],["12-05",384.0],["12-08",380.5],["12-09",377.0],["12-10",377.0],["12-11",366.6],["12-12",362.0],["12-15",357.5],["12-16",345.5],["12-17",350.0],["12-18",353.0],["12-19",355.0],["12-22",354.0],["12-23",353.5],["12-24",359.0],["12-29",364.0],["12-30",363.0],["12-31",362.0]],"Silver":[["01-02",4.77],["01-03",4.7],["01-06",4.67],["01-07",4.68],["01-08",4.66],["01-09",4.66],["01-10",4.75],["01-13",4.76],["01-14",4.69],["01-15",4.65],["01-16",4.68],["01-17",4.75],["01-20",4.75],["01-21",4.73],["01-22",4.7],["01-23",4.73],["01-24",4.97],["01-27",4.94],["01-28",5.03],["01-29",4.92],["01-30",4.88],["01-31",4.96],["02-03",4.88],["02-04",4.91],["02-05",4.86],["02-06",4.88],["02-07",4.8],["02-10",4.92],["02-11",4.93],["02-12",4.82],["02-13",5.12],["02-14",5.14],["02-17",5.22],["02-18",5.23],["02-19",5.2],["02-20",5.17],["02-21",5.24],["02-24",5.21],["02-25",5.19],["02-26",5.23],["02-27",5.25],["02-28",5.25],["03-03",5.31],["03-04",5.28],["03-05",5.21],["03-06",5.18],["03-07",5.17],["03-10",5.14],["03-11",5.25],["03-12",5.23],["03-13",5.23],["03-14",5.27],["03-17",5.25],["03-18",5.21],["03-19",5.17],["03-20",5.24],["03-21",5.19],["03-24",5.13],["03-25",5.17],["03-26",5.09],["03-27",5.13],["04-01",5.04],["04-02",4.98],["04-03",4.86],["04-04",4.74],["04-07",4.76],["04-08",4.83],["04-09",4.77],["04-10",4.77],["04-11",4.79],["04-14",4.72],["04-15",4.72],["04-16",4.73],["04-17",4.83],["04-18",4.72],["04-21",4.75],["04-22",4.76],["04-23",4.72],["04-24",4.71],["04-25",4.74],["04-28",4.72],["04-29",4.64],["04-30",4.66],["05-01",4.67],["05-02",4.74],["05-06",4.75],["05-07",4.72],["05-08",4.75],["05-09",4.83],["05-12",4.86],["05-13",4.83],["05-14",4.87],["05-15",4.83],["05-16",4.84],["05-19",4.68],["05-20",4.72],["05-21",4.67],["05-22",4.67],["05-23",4.66],["05-27",4.75],["05-28",4.76],["05-29",4.72],["05-30",4.86],["06-02",4.73],["06-03",4.75],["06-04",4.72],["06-05",4.73],["06-06",4.9],["06-09",4.81],["06-10",4.76],["06-11",4.77],["06-12",4.75],["06-13",4.71],["06-16",4.71],["06-17",4.72],["06-18",4.8],["06-19",4.72],["06-20",4.75],["06-23",4.72],["06-24",4.8],["06-25",4.77],["06-26",4.77],["06-27",4.75],["06-30",4.71],["07-01",4.64],["07-02",4.64],["07-03",4.65],["07-04",4.55],["07-07",4.47],["07-08",4.25],["07-09",4.28],["07-10",4.34],["07-11",4.36],["07-14",4.34],["07-15",4.28],["07-16",4.32],["07-17",4.22],["07-18",4.26],["07-21",4.32],["07-22",4.28],["07-23",4.29],["07-24",4.28],["07-25",4.31],["07-28",4.34],["07-29",4.36],["07-30",4.36],["07-31",4.38],["08-01",4.47],["08-04",4.46],["08-05",4.51],["08-06",4.34],["08-07",4.33],["08-08",4.38],["08-11",4.39],["08-12",4.43],["08-13",4.46],["08-14",4.48],["08-15",4.41],["08-18",4.53],["08-19",4.51],["08-20",4.51],["08-21",4.52],["08-22",4.5],["08-26",4.66],["08-27",4.66],["08-28",4.66],["08-29",4.72],["09-01",4.66],["09-02",4.7],["09-03",4.63],["09-04",4.67],["09-05",4.71],["09-08",4.71],["09-09",4.67],["09-10",4.74],["09-11",4.74],["09-12",4.78],["09-15",4.76],["09-16",4.71],["09-17",4.59],["09-18",4.63],["09-19",4.72],["09-22",4.71],["09-23",4.68],["09-24",4.72],["09-25",4.75],["09-26",4.76],["09-29",4.87],["09-30",5.17],["10-01",5.18],["10-02",5.14],["10-03",5.15],["10-06",5.28],["10-07",5.18],["10-08",5.25],["10-09",5.24],["10-10",5.14],["10-13",5.18],["10-14",5.12],["10-15",4.99],["10-16",5.1],["10-17",4.92],["10-20",4.94],["10-21",4.96],["10-22",4.97],["10-23",5.08],["10-24",4.9],["10-27",4.83],["10-28",4.83],["10-29",4.79],["10-30",4.81],["10-31",4.82],["11-03",4.78],["11-04",4.84],["11-05",4.85],["11-06",4.85],["11-07",4.95],["11-10",4.87],["11-11",4.94],["11-12",4.95],["11-13",5.02],["11-14",5.06],["11-17",5.13],["11-18",5.11],["11-19",5.12],["11-20",5.23],["11-21",5.25],["11-24",5.47],["11-25",5.33],["11-26",5.24],["11-27",5.27],["11-28",5.3],["12-01",5.24],["12-02",5.32],["12-03",5.32],["12-04",5.29],["12-05",5.31],["12-08",5.43],["12-09",5.38],["12-10",5.83],["12-11",6.05],["12-12",5.79],["12-15",5.96],["12-16",5.84],["12-17",6.05],["12-18",6.01],["12-19",6.08],["12-22",6.05],["12-23",6.03],["12-24",6.27],["12-29",6.24],["12-30",6.2],["12-31",6.0]]},"1998":{"Gold":[["01-02",287.7],["01-05",287.35],["01-06",281.8],["01-07",282.1],["01-08",282.9],["01-09",281.9],["01-12",278.5],["01-13",279.05],["01-14",285.9],["01-15",281.1],["01-16",287.35],["01-19",285.75],["01-20",287.2],["01-21",291.9],["01-22",293.8],["01-23",291.45],["01-26",304.5],["01-27",300.0],["01-28",298.25],["01-29",304.25],["01-30",301.8],["02-02",302.0],["02-03",299.7],["02-04",295.2],["02-05",298.9],["02-06",301.6],["02-09",300.0],["02-10",300.75],["02-11",298.95],["02-12",299.0],["02-13",298.0],["02-16",297.7],["02-17",299.2],["02-18",297.8],["02-19",298.3],["02-20",298.35],["02-23",295.2],["02-24",292.35],["02-25",292.3],["02-26",293.0],["02-27",296.55],["03-02",299.75],["03-03",297.65],["03-04",296.0],["03-05",294.7],["03-06",294.25],["03-09",294.45],["03-10",294.3],["03-11",295.25],["03-12",294.0],["03-13",295.15],["03-16",294.15],["03-17",293.8],["03-18",289.1],["03-19",291.3],["03-20",291.1],["03-23",292.8],["03-24",298.85],["03-25",298.5],["03-26",299.2],["03-27",302.75],["03-30",302.2],["03-31",299.9],["04-01",301.6],["04-02",299.3],["04-03",305.95],["04-06",313.5],["04-07",309.15],["04-08",309.75],["04-09",308.35],["04-14",309.5],["04-15",308.35],["04-16",306.3],["04-17",308.2],["04-20",307.3],["04-21",307.2],["04-22",311.2],["04-23",314.6],["04-24",312.65],["04-27",311.4],["04-28",308.6],["04-29",307.55],["04-30",310.7],["05-01",306.1],["05-05",304.2],["05-06",303.5],["05-07",299.0],["05-08",299.15],["05-11",299.0],["05-12",299.9],["05-13",295.6],["05-14",296.9],["05-15",302.3],["05-18",299.7],["05-19",299.0],["05-20",298.1],["05-21",300.05],["05-22",300.7],["05-26",298.85],["05-27",292.6],["05-28",293.4],["05-29",292.4],["06-01",292.35],["06-02",289.2],["06-03",293.35],["06-04",292.05],["06-05",292.2],["06-08",290.3],["06-09",296.25],["06-10",294.15],["06-11",292.9],["06-12",288.1],["06-15",286.1],["06-16",286.4],["06-17",288.4],["06-18",293.05],["06-19",293.4],["06-22",294.75],["06-23",295.55],["06-24",293.9],["06-25",293.25],["06-26",294.5],["06-29",293.0],["06-30",295.75],["07-01",297.1],["07-02",295.75],["07-03",293.9],["07-06",293.15],["07-07",293.1],["07-08",294.35],["07-09",292.2],["07-10",291.35],["07-13",290.7],["07-14",292.2],["07-15",292.8],["07-16",294.35],["07-17",293.6],["07-20",294.65],["07-21",295.2],["07-22",294.4],["07-23",292.9],["07-24",293.75],["07-27",290.75],["07-28",290.35],["07-29",291.0],["07-30",289.15],["07-31",289.4],["08-03",286.65],["08-04",285.7],["08-05",288.85],["08-06",286.85],["08-07",286.2],["08-10",286.2],["08-11",284.5],["08-12",285.5],["08-13",282.7],["08-14",284.8],["08-17",283.3],["08-18",284.4],["08-19",285.75],["08-20",283.7],["08-21",284.45],["08-24",284.3],["08-25",283.9],["08-26",282.5],["08-27",280.9],["08-28",273.4],["09-01",277.7],["09-02",280.0],["09-03",279.65],["09-04",285.4],["09-07",288.35],["09-08",287.3],["09-09",284.15],["09-10",285.65],["09-11",293.75],["09-14",290.3],["09-15",290.35],["09-16",289.15],["09-17",287.65],["09-18",290.85],["09-21",292.1],["09-22",288.5],["09-23",288.0],["09-24",290.6],["09-25",296.35],["09-28",293.8],["09-29",296.85],["09-30",294.1],["10-01",299.0],["10-02",301.4],["10-05",298.75],["10-06",296.35],["10-07",298.85],["10-08",302.35],["10-09",299.65],["10-12",296.65],["10-13",296.8],["10-14",296.6],["10-15",296.0],["10-16",300.45],["10-19",298.35],["10-20",295.85],["10-21",296.9],["10-22",293.75],["10-23",292.85],["10-26",291.2],["10-27",293.0],["10-28",293.75],["10-29",293.5],["10-30",293.1],["11-02",292.75],["11-03",290.1],["11-04",290.1],["11-05",290.9],["11-06",293.6],["11-09",292.4],["11-10",291.75],["11-11",293.6],["11-12",293.0],["11-13",297.2],["11-16",295.35],["11-17",294.6],["11-18",294.4],["11-19",297.85],["11-20",296.05],["11-23",295.6],["11-24",295.95],["11-25",296.2],["11-26",296.25],["11-27",295.7],["11-30",295.75],["12-01",293.35],["12-02",293.9],["12-03",292.95],["12-04",292.4],["12-07",292.35],["12-08",294.5],["12-09",293.5],["12-10",294.9],["12-11",294.3],["12-14",291.25],["12-15",292.5],["12-16",292.55],["12-17",293.75],["12-18",292.35],["12-21",289.95],["12-22",288.7],["12-23",287.7],["12-24",286.65],["12-29",286.7],["12-30",286.8],["12-31",287.45]],"Palladium":[["01-02",204.0],["01-05",204.0],["01-06",201.0],["01-07",202.0],["01-08",205.0],["01-09",219.0],["01-12",220.0],["01-13",229.0],["01-14",248.5],["01-15",239.0],["01-16",236.0],["01-19",232.0],["01-20",230.5],["01-21",235.0],["01-22",238.0],["01-23",235.0],["01-26",238.5],["01-27",233.0],["01-28",232.0],["01-29",232.0],["01-30",237.0],["02-02",239.0],["02-03",237.0],["02-04",237.0],["02-05",239.0],["02-06",239.0],["02-09",236.0],["02-10",233.0],["02-11",234.0],["02-12",239.0],["02-13",238.0],["02-16",238.0],["02-17",237.0],["02-18",231.0],["02-19",230.0],["02-20",234.0],["02-23",234.0],["02-24",236.0],["02-25",243.0],["02-26",241.0],["02-27",237.0],["03-02",234.0],["03-03",234.0],["03-04",239.0],["03-05",238.0],["03-06",236.0],["03-09",238.0],["03-10",243.0],["03-11",256.0],["03-12",259.0],["03-13",275.0],["03-16",282.0],["03-17",277.0],["03-18",262.0],["03-19",277.0],["03-20",267.0],["03-23",281.0],["03-24",295.0],["03-25",290.0],["03-26",281.0],["03-27",279.0],["03-30",268.0],["03-31",262.0],["04-01",270.0],["04-02",270.0],["04-03",281.5],["04-06",284.0],["04-07",272.0],["04-08",285.0],["04-09",292.0],["04-14",302.0],["04-15",328.5],["04-16",313.0],["04-17",301.5],["04-20",324.0],["04-21",334.0],["04-22",338.0],["04-23",390.0],["04-24",385.0],["04-27",375.0],["04-28",348.0],["04-29",362.0],["04-30",360.0],["05-01",363.0],["05-05",353.0],["05-06",354.0],["05-07",332.0],["05-08",318.5],["05-11",315.5],["05-12",331.0],["05-13",340.0],["05-14",384.0],["05-15",388.0],["05-18",407.0],["05-19",398.0],["05-20",390.0],["05-21",373.0],["05-22",363.0],["05-26",362.0],["05-27",352.0],["05-28",318.0],["05-29",293.0],["06-01",286.0],["06-02",272.0],["06-03",261.0],["06-04",282.0],["06-05",292.0],["06-08",290.0],["06-09",302.0],["06-10",282.0],["06-11",275.0],["06-12",269.0],["06-15",280.0],["06-16",274.0],["06-17",277.0],["06-18",295.0],["06-19",290.0],["06-22",295.0],["06-23",300.0],["06-24",310.0],["06-25",302.0],["06-26",295.0],["06-29",295.0],["06-30",297.0],["07-01",294.0],["07-02",296.0],["07-03",293.0],["07-06",287.0],["07-07",296.0],["07-08",296.0],["07-09",297.5],["07-10",295.0],["07-13",293.0],["07-14",293.0],["07-15",297.0],["07-16",325.0],["07-17",340.0],["07-20",343.0],["07-21",337.0],["07-22",320.0],["07-23",312.5],["07-24",314.5],["07-27",303.0],["07-28",309.0],["07-29",307.0],["07-30",301.0],["07-31",305.0],["08-03",307.0],["08-04",301.5],["08-05",294.0],["08-06",294.0],["08-07",294.0],["08-10",291.0],["08-11",289.0],["08-12",288.0],["08-13",285.0],["08-14",284.0],["08-17",280.0],["08-18",284.0],["08-19",279.0],["08-20",280.0],["08-21",286.0],["08-24",291.0],["08-25",290.0],["08-26",288.0],["08-27",279.0],["08-28",273.0],["09-01",278.0],["09-02",280.0],["09-03",280.0],["09-04",284.0],["09-07",285.0],["09-08",277.0],["09-09",278.0],["09-10",287.0],["09-11",290.0],["09-14",291.0],["09-15",290.0],["09-16",290.0],["09-17",288.0],["09-18",287.5],["09-21",284.0],["09-22",275.5],["09-23",276.0],["09-24",282.0],["09-25",286.0],["09-28",285.0],["09-29",280.0],["09-30",275.0],["10-01",280.0],["10-02",280.0],["10-05",279.5],["10-06",280.0],["10-07",281.0],["10-08",280.0],["10-09",279.75],["10-12",280.0],["10-13",278.0],["10-14",276.0],["10-15",274.0],["10-16",277.0],["10-19",275.0],["10-20",273.0],["10-21",274.0],["10-22",274.0],["10-23",274.5],["10-26",275.0],["10-27",278.0],["10-28",280.0],["10-29",277.0],["10-30",274.0],["11-02",272.0],["11-03",273.0],["11-04",273.5],["11-05",275.0],["11-06",274.0],["11-09",272.0],["11-10",272.0],["11-11",272.0],["11-12",274.5],["11-13",277.0],["11-16",275.0],["11-17",278.0],["11-18",282.5],["11-19",292.0],["11-20",300.0],["11-23",284.0],["11-24",275.0],["11-25",275.0],["11-26",278.0],["11-27",273.5],["11-30",273.5],["12-01",272.0],["12-02",271.75],["12-03",270.25],["12-04",272.0],["12-07",272.5],["12-08",270.75],["12-09",282.0],["12-10",295.0],["12-11",298.0],["12-14",292.0],["12-15",293.0],["12-16",305.0],["12-17",323.0],["12-18",307.0],["12-21",308.0],["12-22",315.0],["12-23",304.0],["12-24",306.0],["12-29",322.0],["12-30",330.0],["12-31",329.0]],"Platinum":[["01-02",366.0],["01-05",364.0],["01-06",358.0],["01-07",358.0],["01-08",364.0],["01-09",363.0],["01-12",364.0],["01-13",361.5],["01-14",378.5],["01-15",385.75],["01-16",384.0],["01-19",380.0],["01-20",373.0],["01-21",378.0],["01-22",386.0],["01-23",382.0],["01-26",387.0],["01-27",385.0],["01-28",386.5],["01-29",388.5],["01-30",388.0],["02-02",389.0],["02-03",387.0],["02-04",387.0],["02-05",397.0],["02-06",397.0],["02-09",394.0],["02-10",387.0],["02-11",389.5],["02-12",393.0],["02-13",388.0],["02-16",388.0],["02-17",388.0],["02-18",382.0],["02-19",379.0],["02-20",385.0],["02-23",378.0],["02-24",376.0],["02-25",380.0],["02-26",380.0],["02-27",385.25],["03-02",387.0],["03-03",385.0],["03-04",386.5],["03-05",382.75],["03-06",383.0],["03-09",381.5],["03-10",385.5],["03-11",393.0],["03-12",389.0],["03-13",393.5],["03-16",401.0],["03-17",395.0],["03-18",395.0],["03-19",414.0],["03-20",410.0],["03-23",417.75],["03-24",423.0],["03-25",412.0],["03-26",413.0],["03-27",414.0],["03-30",407.0],["03-31",405.0],["04-01",409.0],["04-02",405.0],["04-03",415.0],["04-06",420.0],["04-07",414.0],["04-08",419.5],["04-09",420.5],["04-14",422.0],["04-15",428.0],["04-16",414.0],["04-17",408.0],["04-20",414.0],["04-21",413.5],["04-22",417.0],["04-23",422.0],["04-24",412.0],["04-27",407.0],["04-28",407.0],["04-29",404.0],["04-30",404.0],["05-01",397.5],["05-05",396.0],["05-06",399.0],["05-07",394.0],["05-08",393.0],["05-11",394.0],["05-12",389.0],["05-13",385.0],["05-14",403.0],["05-15",403.0],["05-18",403.0],["05-19",392.0],["05-20",391.0],["05-21",385.0],["05-22",382.0],["05-26",381.0],["05-27",375.0],["05-28",372.0],["05-29",364.0],["06-01",368.0],["06-02",363.0],["06-03",355.25],["06-04",363.0],["06-05",361.0],["06-08",358.0],["06-09",362.5],["06-10",356.25],["06-11",355.0],["06-12",349.5],["06-15",347.0],["06-16",347.0],["06-17",355.0],["06-18",363.0],["06-19",359.0],["06-22",357.0],["06-23",356.0],["06-24",353.0],["06-25",351.0],["06-26",351.5],["06-29",349.5],["06-30",352.0],["07-01",360.0],["07-02",370.0],["07-03",366.0],["07-06",364.0],["07-07",369.75],["07-08",375.0],["07-09",379.0],["07-10",372.0],["07-13",373.5],["07-14",376.0],["07-15",382.5],["07-16",392.0],["07-17",392.0],["07-20",395.5],["07-21",386.0],["07-22",384.0],["07-23",380.0],["07-24",382.0],["07-27",377.0],["07-28",378.0],["07-29",378.0],["07-30",378.0],["07-31",378.0],["08-03",374.0],["08-04",376.0],["08-05",374.0],["08-06",379.0],["08-07",379.5],["08-10",378.0],["08-11",375.0],["08-12",375.0],["08-13",370.25],["08-14",373.0],["08-17",366.0],["08-18",365.0],["08-19",369.0],["08-20",369.0],["08-21",372.0],["08-24",368.0],["08-25",368.0],["08-26",361.0],["08-27",358.0],["08-28",349.0],["09-01",362.0],["09-02",368.0],["09-03",362.0],["09-04",368.5],["09-07",369.0],["09-08",363.0],["09-09",360.0],["09-10",363.0],["09-11",366.0],["09-14",364.0],["09-15",364.0],["09-16",365.0],["09-17",359.0],["09-18",356.0],["09-21",356.0],["09-22",353.5],["09-23",353.0],["09-24",356.0],["09-25",359.0],["09-28",353.0],["09-29",348.0],["09-30",349.0],["10-01",353.0],["10-02",354.0],["10-05",345.5],["10-06",340.0],["10-07",346.0],["10-08",352.0],["10-09",350.5],["10-12",343.0],["10-13",344.5],["10-14",340.5],["10-15",341.0],["10-16",347.0],["10-19",340.5],["10-20",335.0],["10-21",339.0],["10-22",337.0],["10-23",337.5],["10-26",337.0],["10-27",341.0],["10-28",341.0],["10-29",337.0],["10-30",336.0],["11-02",336.0],["11-03",337.0],["11-04",342.0],["11-05",344.0],["11-06",343.0],["11-09",339.0],["11-10",338.0],["11-11",338.0],["11-12",341.75],["11-13",351.0],["11-16",346.0],["11-17",349.5],["11-18",349.0],["11-19",356.0],["11-20",358.0],["11-23",353.0],["11-24",351.0],["11-25",354.5],["11-26",351.0],["11-27",351.0],["11-30",353.0],["12-01",351.5],["12-02",349.0],["12-03",345.0],["12-04",347.0],["12-07",346.5],["12-08",346.0],["12-09",350.0],["12-10",353.0],["12-11",353.0],["12-14",348.5],["12-15",350.0],["12-16",354.0],["12-17",356.0],["12-18",348.5],["12-21",349.0],["12-22",347.0],["12-23",346.0],["12-24",347.0],["12-29",351.0],["12-30",360.0],["12-31",361.5]],"Silver":[["01-02",5.94],["01-05",5.88],["01-06",6.02],["01-07",6.09],["01-08",6.06],["01-09",5.74],["01-12",5.53],["01-13",5.59],["01-14",5.7],["01-15",5.79],["01-16",5.89],["01-19",5.76],["01-20",5.8],["01-21",5.79],["01-22",5.88],["01-23",5.83],["01-26",5.94],["01-27",6.05],["01-28",6.02],["01-29",6.16],["01-30",6.05],["02-02",6.25],["02-03",6.38],["02-04",7.05],["02-05",7.55],["02-06",7.81],["02-09",7.19],["02-10",7.13],["02-11",7.09],["02-12",7.0],["02-13",7.08],["02-16",7.09],["02-17",7.21],["02-18",6.71],["02-19",6.69],["02-20",6.76],["02-23",6.47],["02-24",6.39],["02-25",6.34],["02-26",6.05],["02-27",6.37],["03-02",6.61],["03-03",6.5],["03-04",6.39],["03-05",6.32],["03-06",6.31],["03-09",6.06],["03-10",6.12],["03-11",6.31],["03-12",6.17],["03-13",6.24],["03-16",6.12],["03-17",6.07],["03-18",5.8],["03-19",5.84],["03-20",5.93],["03-23",6.32],["03-24",6.46],["03-25",6.34],["03-26",6.36],["03-27",6.38],["03-30",6.35],["03-31",6.34],["04-01",6.46],["04-02",6.45],["04-03",6.73],["04-06",6.63],["04-07",6.38],["04-08",6.46],["04-09",6.41],["04-14",6.41],["04-15",6.24],["04-16",6.07],["04-17",6.28],["04-20",6.27],["04-21",6.23],["04-22",6.31],["04-23",6.32],["04-24",6.32],["04-27",6.21],["04-28",6.13],["04-29",6.11],["04-30",6.21],["05-01",6.17],["05-05",6.24],["05-06",6.08],["05-07",5.88],["05-08",6.01],["05-11",5.79],["05-12",5.79],["05-13",5.46],["05-14",5.56],["05-15",5.66],["05-18",5.42],["05-19",5.25],["05-20",5.21],["05-21",5.34],["05-22",5.31],["05-26",5.28],["05-27",5.08],["05-28",5.17],["05-29",4.96],["06-01",5.14],["06-02",5.12],["06-03",5.19],["06-04",5.17],["06-05",5.23],["06-08",5.25],["06-09",5.46],["06-10",5.36],["06-11",5.31],["06-12",5.17],["06-15",5.09],["06-16",5.13],["06-17",5.28],["06-18",5.32],["06-19",5.29],["06-22",5.31],["06-23",5.36],["06-24",5.33],["06-25",5.29],["06-26",5.39],["06-29",5.3],["06-30",5.36],["07-01",5.53],["07-02",5.45],["07-03",5.34],["07-06",5.32],["07-07",5.34],["07-08",5.33],["07-09",5.33],["07-10",5.29],["07-13",5.27],["07-14",5.33],["07-15",5.32],["07-16",5.36],["07-17",5.29],["07-20",5.39],["07-21",5.42],["07-22",5.65],["07-23",5.67],["07-24",5.83],["07-27",5.62],["07-28",5.64],["07-29",5.67],["07-30",5.54],["07-31",5.53],["08-03",5.41],["08-04",5.38],["08-05",5.47],["08-06",5.42],["08-07",5.41],["08-10",5.29],["08-11",5.2],["08-12",5.25],["08-13",5.11],["08-14",5.14],["08-17",5.13],["08-18",5.12],["08-19",5.1],["08-20",5.1],["08-21",5.16],["08-24",5.16],["08-25",5.07],["08-26",4.96],["08-27",4.97],["08-28",4.79],["09-01",4.73],["09-02",4.85],["09-03",4.81],["09-04",4.98],["09-07",5.04],["09-08",5.01],["09-09",4.85],["09-10",4.98],["09-11",5.05],["09-14",4.96],["09-15",4.93],["09-16",4.95],["09-17",4.94],["09-18",5.0],["09-21",5.0],["09-22",4.89],["09-23",4.88],["09-24",5.06],["09-25",5.18],["09-28",5.14],["09-29",5.36],["09-30",5.38],["10-01",5.36],["10-02",5.3],["10-05",5.16],["10-06",5.09],["10-07",5.13],["10-08",5.22],["10-09",5.01],["10-12",4.84],["10-13",4.87],["10-14",4.8],["10-15",4.82],["10-16",4.96],["10-19",4.9],["10-20",4.86],["10-21",4.89],["10-22",4.88],["10-23",4.87],["10-26",4.86],["10-27",5.0],["10-28",5.06],["10-29",5.04],["10-30",5.05],["11-02",5.04],["11-03",4.96],["11-04",4.92],["11-05",4.95],["11-06",5.04],["11-09",5.0],["11-10",5.0],["11-11",4.99],["11-12",4.99],["11-13",5.13],["11-16",5.04],["11-17",4.95],["11-18",4.96],["11-19",5.01],["11-20",4.96],["11-23",4.92],["11-24",4.92],["11-25",4.92],["11-26",4.92],["11-27",4.93],["11-30",4.92],["12-01",4.88],["12-02",4.88],["12-03",4.69],["12-04",4.78],["12-07",4.76],["12-08",4.78],["12-09",4.82],["12-10",4.83],["12-11",4.83],["12-14",4.79],["12-15",4.87],["12-16",4.94],["12-17",5.02],["12-18",4.93],["12-21",4.95],["12-22",4.89],["12-23",4.89],["12-24",4.91],["12-29",4.92],["12-30",5.03],["12-31",5.0]]},"1999":{"Gold":[["01-04",288.25],["01-05",287.0],["01-06",287.15],["01-07",288.6],["01-08",290.9],["01-11",291.25],["01-12",291.4],["01-13",288.2],["01-14",285.7],["01-15",285.85],["01-18",286.95],["01-19",287.3],["01-20",285.9],["01-21",287.1],["01-22",287.75],["01-25",286.3],["01-26",287.3],["01-27",285.8],["01-28",282.3],["01-29",285.65],["02-01",287.1],["02-02",289.75],["02-03",287.55],["02-04",287.25],["02-05",289.75],["02-08",288.85],["02-09",287.65],["02-10",287.1],["02-11",287.5],["02-12",287.4],["02-15",290.05],["02-16",288.05],["02-17",285.35],["02-18",285.65],["02-19",287.05],["02-22",287.2],["02-23",286.65],["02-24",286.1],["02-25",287.1],["02-26",286.8],["03-01",287.05],["03-02",286.4],["03-03",286.65],["03-04",286.7],["03-05",287.9],["03-08",288.5],["03-09",291.9],["03-10",291.5],["03-11",293.8],["03-12",293.65],["03-15",291.25],["03-16",286.8],["03-17",283.9],["03-18",284.35],["03-19",283.45],["03-22",284.5],["03-23",285.1],["03-24",284.25],["03-25",283.75],["03-26",282.0],["03-29",280.35],["03-30",280.05],["03-31",279.8],["04-01",280.5],["04-06",278.35],["04-07",280.25],["04-08",280.4],["04-09",281.6],["04-12",282.7],["04-13",282.5],["04-14",283.85],["04-15",281.25],["04-16",283.9],["04-19",284.65],["04-20",284.55],["04-21",283.9],["04-22",283.35],["04-23",283.7],["04-26",283.1],["04-27",281.5],["04-28",282.8],["04-29",283.7],["04-30",285.85],["05-04",285.6],["05-05",285.5],["05-06",288.1],["05-07",283.4],["05-10",280.65],["05-11",278.3],["05-12",278.0],["05-13",278.4],["05-14",277.2],["05-17",276.1],["05-18",274.7],["05-19",272.85],["05-20",274.4],["05-21",274.85],["05-24",272.2],["05-25",272.65],["05-26",269.5],["05-27",268.25],["05-28",271.05],["06-01",265.5],["06-02",267.05],["06-03",263.85],["06-04",266.5],["06-07",266.35],["06-08",263.85],["06-09",262.0],["06-10",258.35],["06-11",259.2],["06-14",259.3],["06-15",259.65],["06-16",258.9],["06-17",259.0],["06-18",260.5],["06-21",259.15],["06-22",259.15],["06-23",258.7],["06-24",260.7],["06-25",261.15],["06-28",260.0],["06-29",260.8],["06-30",261.2],["07-01",263.0],["07-02",262.9],["07-05",262.85],["07-06",261.3],["07-07",256.2],["07-08",256.4],["07-09",257.0],["07-12",256.05],["07-13",254.25],["07-14",255.6],["07-15",253.75],["07-16",254.8],["07-19",253.15],["07-20",253.0],["07-21",252.9],["07-22",255.35],["07-23",254.9],["07-26",253.5],["07-27",254.2],["07-28",254.0],["07-29",254.5],["07-30",256.75],["08-02",255.35],["08-03",255.7],["08-04",257.5],["08-05",256.25],["08-06",255.3],["08-09",256.45],["08-10",257.0],["08-11",256.9],["08-12",260.2],["08-13",260.7],["08-16",259.25],["08-17",259.0],["08-18",261.5],["08-19",258.6],["08-20",258.6],["08-23",257.5],["08-24",254.2],["08-25",253.2],["08-26",253.15],["08-27",254.7],["08-31",254.6],["09-01",255.45],["09-02",254.05],["09-03",255.4],["09-06",254.9],["09-07",254.9],["09-08",256.0],["09-09",256.8],["09-10",256.2],["09-13",256.6],["09-14",256.7],["09-15",257.4],["09-16",255.7],["09-17",255.2],["09-20",255.3],["09-21",255.2],["09-22",262.6],["09-23",263.4],["09-24",265.6],["09-27",281.7],["09-28",288.25],["09-29",317.25],["09-30",303.75],["10-01",303.0],["10-04",311.75],["10-05",326.25],["10-06",325.0],["10-07",318.0],["10-08",322.75],["10-11",317.75],["10-12",323.5],["10-13",320.5],["10-14",322.65],["10-15",316.0],["10-18",317.65],["10-19",309.0],["10-20",309.75],["10-21",305.5],["10-22",303.25],["10-25",302.4],["10-26",297.95],["10-27",290.4],["10-28",300.9],["10-29",298.85],["11-01",293.85],["11-02",292.05],["11-03",291.75],["11-04",292.25],["11-05",292.0],["11-08",289.0],["11-09",291.25],["11-10",291.85],["11-11",296.25],["11-12",292.8],["11-15",292.7],["11-16",292.0],["11-17",295.45],["11-18",293.65],["11-19",293.7],["11-22",294.4],["11-23",296.7],["11-24",297.85],["11-25",298.5],["11-26",297.2],["11-29",293.1],["11-30",292.0],["12-01",291.4],["12-02",289.25],["12-03",280.85],["12-06",277.25],["12-07",280.0],["12-08",283.3],["12-09",279.6],["12-10",278.45],["12-13",279.75],["12-14",280.3],["12-15",279.85],["12-16",280.25],["12-17",283.05],["12-20",284.25],["12-21",284.6],["12-22",287.0],["12-23",286.4],["12-24",287.8],["12-29",290.65],["12-30",290.85]],"Palladium":[["01-04",334.0],["01-05",334.0],["01-06",332.0],["01-07",315.0],["01-08",314.0],["01-11",316.0],["01-12",317.0],["01-13",313.0],["01-14",310.0],["01-15",312.0],["01-18",316.0],["01-19",320.0],["01-20",320.0],["01-21",321.0],["01-22",320.0],["01-25",321.0],["01-26",325.0],["01-27",328.0],["01-28",330.0],["01-29",335.0],["02-01",340.0],["02-02",340.0],["02-03",343.0],["02-04",354.0],["02-05",357.0],["02-08",341.0],["02-09",345.0],["02-10",362.0],["02-11",359.0],["02-12",359.0],["02-15",358.0],["02-16",357.0],["02-17",350.0],["02-18",348.0],["02-19",359.0],["02-22",355.0],["02-23",347.0],["02-24",348.0],["02-25",355.0],["02-26",357.0],["03-01",354.0],["03-02",352.0],["03-03",350.0],["03-04",348.0],["03-05",346.0],["03-08",348.0],["03-09",345.5],["03-10",345.0],["03-11",346.5],["03-12",351.0],["03-15",350.0],["03-16",349.0],["03-17",350.0],["03-18",348.0],["03-19",350.0],["03-22",357.5],["03-23",357.0],["03-24",355.0],["03-25",356.0],["03-26",372.25],["03-29",368.0],["03-30",363.0],["03-31",362.0],["04-01",361.0],["04-06",355.0],["04-07",361.0],["04-08",362.0],["04-09",360.0],["04-12",363.0],["04-13",367.0],["04-14",367.0],["04-15",366.0],["04-16",369.0],["04-19",381.0],["04-20",384.0],["04-21",380.5],["04-22",373.5],["04-23",365.0],["04-26",358.0],["04-27",353.0],["04-28",346.5],["04-29",333.0],["04-30",333.0],["05-04",297.0],["05-05",284.0],["05-06",313.0],["05-07",328.0],["05-10",329.0],["05-11",330.0],["05-12",335.5],["05-13",338.0],["05-14",344.0],["05-17",339.0],["05-18",344.0],["05-19",340.0],["05-20",331.0],["05-21",331.0],["05-24",332.0],["05-25",331.5],["05-26",338.0],["05-27",340.0],["05-28",340.0],["06-01",337.0],["06-02",342.1],["06-03",342.0],["06-04",344.25],["06-07",344.0],["06-08",346.0],["06-09",349.0],["06-10",349.0],["06-11",346.0],["06-14",338.0],["06-15",342.0],["06-16",338.0],["06-17",338.0],["06-18",338.0],["06-21",338.0],["06-22",334.0],["06-23",330.0],["06-24",328.0],["06-25",330.0],["06-28",326.0],["06-29",322.5],["06-30",320.0],["07-01",320.0],["07-02",317.0],["07-05",315.0],["07-06",315.0],["07-07",315.0],["07-08",325.0],["07-09",330.0],["07-12",331.0],["07-13",333.0],["07-14",336.0],["07-15",339.0],["07-16",337.5],["07-19",335.0],["07-20",334.0],["07-21",335.0],["07-22",341.0],["07-23",341.0],["07-26",342.0],["07-27",341.5],["07-28",338.0],["07-29",340.0],["07-30",338.0],["08-02",334.0],["08-03",333.0],["08-04",340.0],["08-05",340.0],["08-06",337.5],["08-09",345.0],["08-10",341.0],["08-11",341.0],["08-12",340.0],["08-13",341.0],["08-16",337.0],["08-17",338.0],["08-18",340.0],["08-19",342.0],["08-20",344.0],["08-23",345.0],["08-24",343.5],["08-25",341.0],["08-26",340.5],["08-27",340.0],["08-31",339.0],["09-01",341.5],["09-02",342.0],["09-03",348.0],["09-06",353.0],["09-07",355.0],["09-08",353.0],["09-09",353.0],["09-10",359.0],["09-13",362.0],["09-14",369.5],["09-15",365.0],["09-16",367.5],["09-17",364.5],["09-20",362.0],["09-21",361.0],["09-22",366.0],["09-23",364.0],["09-24",360.0],["09-27",363.0],["09-28",368.0],["09-29",396.0],["09-30",380.0],["10-01",380.0],["10-04",385.0],["10-05",390.0],["10-06",382.0],["10-07",384.0],["10-08",392.0],["10-11",394.0],["10-12",398.0],["10-13",388.0],["10-14",386.0],["10-15",376.0],["10-18",378.0],["10-19",377.0],["10-20",382.0],["10-21",388.0],["10-22",386.0],["10-25",392.0],["10-26",394.0],["10-27",392.0],["10-28",392.0],["10-29",394.0],["11-01",394.0],["11-02",393.0],["11-03",392.0],["11-04",394.0],["11-05",396.0],["11-08",396.0],["11-09",399.0],["11-10",405.0],["11-11",419.0],["11-12",414.0],["11-15",415.0],["11-16",413.0],["11-17",415.0],["11-18",405.0],["11-19",392.0],["11-22",397.5],["11-23",406.0],["11-24",399.5],["11-25",401.0],["11-26",397.5],["11-29",395.0],["11-30",394.0],["12-01",398.0],["12-02",398.0],["12-03",400.0],["12-06",405.0],["12-07",408.0],["12-08",406.0],["12-09",411.0],["12-10",410.0],["12-13",420.0],["12-14",428.0],["12-15",427.0],["12-16",432.0],["12-17",440.0],["12-20",442.0],["12-21",440.0],["12-22",438.0],["12-23",442.0],["12-24",444.0],["12-29",449.0],["12-30",454.0]],"Platinum":[["01-04",362.5],["01-05",362.5],["01-06",360.0],["01-07",357.0],["01-08",360.0],["01-11",359.5],["01-12",361.5],["01-13",354.25],["01-14",353.5],["01-15",351.0],["01-18",354.25],["01-19",353.0],["01-20",354.0],["01-21",354.0],["01-22",352.5],["01-25",350.5],["01-26",352.0],["01-27",350.0],["01-28",346.9],["01-29",345.0],["02-01",347.0],["02-02",349.0],["02-03",352.5],["02-04",352.0],["02-05",359.0],["02-08",352.5],["02-09",354.5],["02-10",360.25],["02-11",359.0],["02-12",362.0],["02-15",370.0],["02-16",366.5],["02-17",363.0],["02-18",370.0],["02-19",380.0],["02-22",374.5],["02-23",380.0],["02-24",384.0],["02-25",381.0],["02-26",379.5],["03-01",378.0],["03-02",375.5],["03-03",373.0],["03-04",372.0],["03-05",373.5],["03-08",376.0],["03-09",377.0],["03-10",370.5],["03-11",369.0],["03-12",369.0],["03-15",366.0],["03-16",364.0],["03-17",367.0],["03-18",367.0],["03-19",369.5],["03-22",372.0],["03-23",374.0],["03-24",374.0],["03-25",370.5],["03-26",371.0],["03-29",368.5],["03-30",363.0],["03-31",361.0],["04-01",361.5],["04-06",358.0],["04-07",356.0],["04-08",357.5],["04-09",357.25],["04-12",360.5],["04-13",359.0],["04-14",358.0],["04-15",358.0],["04-16",361.0],["04-19",365.0],["04-20",365.0],["04-21",362.0],["04-22",359.0],["04-23",357.0],["04-26",356.0],["04-27",355.0],["04-28",355.0],["04-29",349.0],["04-30",350.0],["05-04",349.0],["05-05",349.0],["05-06",354.0],["05-07",356.0],["05-10",354.0],["05-11",353.0],["05-12",356.0],["05-13",356.0],["05-14",357.0],["05-17",354.0],["05-18",354.0],["05-19",354.5],["05-20",354.0],["05-21",357.5],["05-24",356.0],["05-25",357.0],["05-26",358.0],["05-27",363.75],["05-28",365.0],["06-01",360.0],["06-02",361.5],["06-03",363.0],["06-04",367.5],["06-07",365.0],["06-08",362.5],["06-09",364.0],["06-10",366.0],["06-11",366.0],["06-14",362.0],["06-15",362.0],["06-16",356.0],["06-17",354.0],["06-18",352.5],["06-21",351.0],["06-22",347.0],["06-23",347.5],["06-24",348.5],["06-25",349.75],["06-28",346.0],["06-29",347.5],["06-30",348.0],["07-01",352.5],["07-02",349.25],["07-05",347.0],["07-06",347.0],["07-07",345.5],["07-08",349.0],["07-09",353.0],["07-12",351.0],["07-13",349.0],["07-14",348.5],["07-15",348.0],["07-16",350.0],["07-19",348.0],["07-20",351.0],["07-21",351.5],["07-22",353.75],["07-23",353.0],["07-26",353.5],["07-27",352.0],["07-28",344.0],["07-29",346.0],["07-30",346.0],["08-02",344.0],["08-03",348.0],["08-04",352.0],["08-05",352.0],["08-06",349.0],["08-09",352.0],["08-10",350.0],["08-11",349.0],["08-12",351.5],["08-13",351.0],["08-16",347.0],["08-17",347.0],["08-18",351.0],["08-19",353.0],["08-20",355.0],["08-23",351.0],["08-24",349.5],["08-25",347.25],["08-26",348.0],["08-27",349.5],["08-31",349.0],["09-01",349.0],["09-02",348.5],["09-03",350.5],["09-06",351.5],["09-07",355.0],["09-08",354.25],["09-09",355.5],["09-10",359.0],["09-13",366.0],["09-14",376.5],["09-15",374.0],["09-16",375.0],["09-17",373.75],["09-20",375.0],["09-21",377.5],["09-22",382.5],["09-23",377.5],["09-24",374.5],["09-27",386.5],["09-28",396.0],["09-29",429.0],["09-30",401.0],["10-01",410.0],["10-04",415.0],["10-05",418.0],["10-06",411.0],["10-07",419.0],["10-08",429.0],["10-11",422.0],["10-12",436.0],["10-13",432.0],["10-14",436.0],["10-15",432.0],["10-18",413.0],["10-19",410.0],["10-20",424.0],["10-21",427.0],["10-22",430.0],["10-25",430.0],["10-26",428.0],["10-27",414.5],["10-28",418.0],["10-29",420.0],["11-01",419.0],["11-02",417.0],["11-03",415.0],["11-04",420.0],["11-05",427.0],["11-08",420.0],["11-09",424.0],["11-10",435.0],["11-11",454.0],["11-12",442.0],["11-15",451.0],["11-16",453.0],["11-17",456.0],["11-18",442.0],["11-19",436.0],["11-22",430.0],["11-23",435.0],["11-24",434.0],["11-25",450.0],["11-26",441.0],["11-29",437.0],["11-30",435.0],["12-01",442.0],["12-02",440.0],["12-03",435.0],["12-06",436.0],["12-07",440.0],["12-08",440.0],["12-09",438.0],["12-10",440.0],["12-13",444.0],["12-14",449.0],["12-15",445.0],["12-16",440.0],["12-17",440.0],["12-20",434.0],["12-21",436.0],["12-22",440.0],["12-23",446.0],["12-24",438.0],["12-29",445.0],["12-30",448.0]],"Silver":[["01-04",5.0],["01-05",4.91],["01-06",5.15],["01-07",5.29],["01-08",5.21],["01-11",5.25],["01-12",5.36],["01-13",5.18],["01-14",5.14],["01-15",5.11],["01-18",5.13],["01-19",5.12],["01-20",5.13],["01-21",5.15],["01-22",5.13],["01-25",5.09],["01-26",5.15],["01-27",5.08],["01-28",5.09],["01-29",5.24],["02-01",5.28],["02-02",5.28],["02-03",5.54],["02-04",5.62],["02-05",5.69],["02-08",5.58],["02-09",5.53],["02-10",5.53],["02-11",5.5],["02-12",5.64],["02-15",5.75],["02-16",5.67],["02-17",5.38],["02-18",5.46],["02-19",5.6],["02-22",5.58],["02-23",5.5],["02-24",5.5],["02-25",5.42],["02-26",5.58],["03-01",5.62],["03-02",5.49],["03-03",5.34],["03-04",5.22],["03-05",5.29],["03-08",5.25],["03-09",5.32],["03-10",5.24],["03-11",5.29],["03-12",5.31],["03-15",5.21],["03-16",5.05],["03-17",5.04],["03-18",5.04],["03-19",5.04],["03-22",5.07],["03-23",5.13],["03-24",5.09],["03-25",5.05],["03-26",5.06],["03-29",5.09],["03-30",5.12],["03-31",5.03],["04-01",5.01],["04-06",4.95],["04-07",4.96],["04-08",4.98],["04-09",4.92],["04-12",4.98],["04-13",4.89],["04-14",4.94],["04-15",4.88],["04-16",5.02],["04-19",5.07],["04-20",5.14],["04-21",5.12],["04-22",5.15],["04-23",5.18],["04-26",5.14],["04-27",5.1],["04-28",5.21],["04-29",5.28],["04-30",5.44],["05-04",5.33],["05-05",5.29],["05-06",5.43],["05-07",5.27],["05-10",5.38],["05-11",5.38],["05-12",5.4],["05-13",5.37],["05-14",5.47],["05-17",5.36],["05-18",5.38],["05-19",5.29],["05-20",5.32],["05-21",5.3],["05-24",5.14],["05-25",5.08],["05-26",5.05],["05-27",4.96],["05-28",4.93],["06-01",4.88],["06-02",4.98],["06-03",4.96],["06-04",4.9],["06-07",4.98],["06-08",4.98],["06-09",4.93],["06-10",5.02],["06-11",5.09],["06-14",5.12],["06-15",5.07],["06-16",5.01],["06-17",5.05],["06-18",5.07],["06-21",4.97],["06-22",5.02],["06-23",5.07],["06-24",5.1],["06-25",5.12],["06-28",5.07],["06-29",5.15],["06-30",5.22],["07-01",5.31],["07-02",5.24],["07-05",5.27],["07-06",5.26],["07-07",5.17],["07-08",5.22],["07-09",5.21],["07-12",5.23],["07-13",5.09],["07-14",5.12],["07-15",5.05],["07-16",5.11],["07-19",5.05],["07-20",5.05],["07-21",5.03],["07-22",5.12],["07-23",5.13],["07-26",5.12],["07-27",5.16],["07-28",5.15],["07-29",5.32],["07-30",5.45],["08-02",5.36],["08-03",5.41],["08-04",5.52],["08-05",5.46],["08-06",5.38],["08-09",5.36],["08-10",5.28],["08-11",5.34],["08-12",5.39],["08-13",5.34],["08-16",5.26],["08-17",5.24],["08-18",5.24],["08-19",5.21],["08-20",5.19],["08-23",5.25],["08-24",5.13],["08-25",5.11],["08-26",5.08],["08-27",5.12],["08-31",5.08],["09-01",5.2],["09-02",5.14],["09-03",5.19],["09-06",5.13],["09-07",5.16],["09-08",5.17],["09-09",5.19],["09-10",5.2],["09-13",5.19],["09-14",5.13],["09-15",5.13],["09-16",5.1],["09-17",5.1],["09-20",5.12],["09-21",5.14],["09-22",5.25],["09-23",5.26],["09-24",5.25],["09-27",5.32],["09-28",5.44],["09-29",5.71],["09-30",5.58],["10-01",5.67],["10-04",5.61],["10-05",5.71],["10-06",5.47],["10-07",5.58],["10-08",5.55],["10-11",5.52],["10-12",5.57],["10-13",5.55],["10-14",5.65],["10-15",5.38],["10-18",5.34],["10-19",5.23],["10-20",5.24],["10-21",5.17],["10-22",5.21],["10-25",5.24],["10-26",5.26],["10-27",5.18],["10-28",5.21],["10-29",5.29],["11-01",5.2],["11-02",5.21],["11-03",5.22],["11-04",5.22],["11-05",5.21],["11-08",5.05],["11-09",5.08],["11-10",5.11],["11-11",5.12],["11-12",5.08],["11-15",5.07],["11-16",5.09],["11-17",5.17],["11-18",5.1],["11-19",5.13],["11-22",5.13],["11-23",5.17],["11-24",5.25],["11-25",5.2],["11-26",5.2],["11-29",5.22],["11-30",5.18],["12-01",5.19],["12-02",5.16],["12-03",5.08],["12-06",5.07],["12-07",5.13],["12-08",5.14],["12-09",5.09],["12-10",5.11],["12-13",5.12],["12-14",5.1],["12-15",5.18],["12-16",5.16],["12-17",5.2],["12-20",5.2],["12-21",5.17],["12-22",5.17],["12-23",5.2],["12-24",5.19],["12-29",5.19],["12-30",5.33]]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 10112 entries across 10 years (2000–2009)
+window._loadSpotSeedBundle({"2000":{"Gold":[["01-04",282.05],["01-05",282.1],["01-06",280.35],["01-07",282.0],["01-10",281.7],["01-11",281.7],["01-12",282.25],["01-13",282.2],["01-14",284.15],["01-17",284.9],["01-18",286.85],["01-19",288.75],["01-20",288.35],["01-21",287.7],["01-24",287.45],["01-25",288.7],["01-26",284.9],["01-27",286.5],["01-28",286.15],["01-31",283.05],["02-01",283.65],["02-02",283.1],["02-03",285.25],["02-04",287.5],["02-07",316.6],["02-08",303.15],["02-09",306.0],["02-10",311.25],["02-11",316.5],["02-14",308.75],["02-15",307.0],["02-16",300.5],["02-17",306.25],["02-18",302.25],["02-21",305.75],["02-22",305.4],["02-23",305.25],["02-24",299.9],["02-25",297.15],["02-28",292.75],["02-29",294.0],["03-01",293.75],["03-02",289.0],["03-03",289.3],["03-06",289.25],["03-07",288.35],["03-08",292.75],["03-09",289.0],["03-10",292.1],["03-13",289.65],["03-14",290.3],["03-15",288.7],["03-16",288.4],["03-17",285.5],["03-20",284.85],["03-21",286.15],["03-22",289.4],["03-23",286.5],["03-24",284.9],["03-27",284.35],["03-28",280.3],["03-29",279.1],["03-30",276.7],["03-31",275.9],["04-03",278.8],["04-04",276.75],["04-05",283.1],["04-06",278.85],["04-07",279.95],["04-10",281.5],["04-11",281.2],["04-12",280.25],["04-13",281.4],["04-14",280.65],["04-17",283.5],["04-18",281.8],["04-19",281.4],["04-20",280.5],["04-25",280.0],["04-26",277.7],["04-27",276.1],["04-28",275.85],["05-02",275.0],["05-03",277.6],["05-04",277.3],["05-05",280.5],["05-08",277.25],["05-09",276.9],["05-10",277.8],["05-11",277.0],["05-12",276.2],["05-15",275.65],["05-16",275.7],["05-17",274.85],["05-18",272.5],["05-19",273.75],["05-22",274.0],["05-23",275.15],["05-24",273.9],["05-25",273.0],["05-26",270.45],["05-30",274.4],["05-31",272.25],["06-01",272.8],["06-02",272.95],["06-05",281.7],["06-06",284.8],["06-07",286.95],["06-08",285.1],["06-09",285.15],["06-12",284.1],["06-13",293.0],["06-14",286.05],["06-15",289.15],["06-16",290.3],["06-19",288.1],["06-20",286.4],["06-21",286.6],["06-22",286.1],["06-23",285.3],["06-26",283.0],["06-27",284.2],["06-28",286.35],["06-29",290.85],["06-30",289.15],["07-03",288.05],["07-04",287.8],["07-05",287.7],["07-06",285.4],["07-07",284.15],["07-10",284.25],["07-11",283.6],["07-12",282.85],["07-13",280.65],["07-14",280.65],["07-17",282.4],["07-18",282.65],["07-19",281.8],["07-20",277.9],["07-21",280.35],["07-24",280.05],["07-25",278.75],["07-26",280.15],["07-27",280.2],["07-28",278.45],["07-31",277.4],["08-01",277.3],["08-02",277.15],["08-03",276.65],["08-04",273.3],["08-07",273.5],["08-08",274.0],["08-09",272.3],["08-10",272.45],["08-11",273.15],["08-14",275.45],["08-15",274.7],["08-16",275.5],["08-17",277.15],["08-18",277.15],["08-21",276.4],["08-22",274.0],["08-23",272.45],["08-24",272.0],["08-25",273.35],["08-29",274.0],["08-30",272.6],["08-31",274.95],["09-01",276.6],["09-04",277.0],["09-05",276.2],["09-06",275.3],["09-07",272.95],["09-08",274.1],["09-11",272.6],["09-12",272.8],["09-13",272.8],["09-14",272.8],["09-15",272.85],["09-18",272.45],["09-19",272.0],["09-20",271.1],["09-21",269.65],["09-22",272.35],["09-25",273.55],["09-26",274.05],["09-27",274.75],["09-28",277.2],["09-29",274.1],["10-02",274.3],["10-03",272.4],["10-04",271.3],["10-05",271.35],["10-06",270.8],["10-09",270.25],["10-10",269.75],["10-11",273.0],["10-12",270.8],["10-13",275.85],["10-16",272.05],["10-17",270.55],["10-18",271.3],["10-19",270.5],["10-20",271.5],["10-23",271.25],["10-24",270.4],["10-25",269.3],["10-26",266.75],["10-27",266.05],["10-30",265.65],["10-31",263.8],["11-01",266.0],["11-02",265.75],["11-03",266.45],["11-06",265.75],["11-07",264.1],["11-08",265.0],["11-09",264.3],["11-10",265.15],["11-13",264.3],["11-14",264.5],["11-15",265.25],["11-16",265.4],["11-17",266.5],["11-20",265.75],["11-21",267.25],["11-22",266.45],["11-23",265.9],["11-24",266.0],["11-27",266.2],["11-28",269.75],["11-29",269.0],["11-30",267.0],["12-01",271.2],["12-04",271.15],["12-05",271.85],["12-06",270.85],["12-07",275.1],["12-08",273.3],["12-11",272.5],["12-12",271.0],["12-13",269.95],["12-14",269.7],["12-15",270.3],["12-18",270.5],["12-19",269.45],["12-20",270.2],["12-21",273.0],["12-22",273.95],["12-27",274.7],["12-28",274.6],["12-29",272.65]],"Palladium":[["01-04",444.0],["01-05",438.0],["01-06",435.0],["01-07",433.0],["01-10",445.0],["01-11",450.0],["01-12",450.0],["01-13",440.5],["01-14",437.0],["01-17",440.0],["01-18",435.0],["01-19",443.0],["01-20",442.0],["01-21",450.0],["01-24",460.0],["01-25",474.0],["01-26",472.0],["01-27",475.0],["01-28",488.0],["01-31",482.0],["02-01",483.0],["02-02",496.0],["02-03",502.0],["02-04",515.0],["02-07",531.0],["02-08",566.0],["02-09",574.0],["02-10",575.0],["02-11",588.0],["02-14",600.0],["02-15",655.0],["02-16",652.0],["02-17",725.0],["02-18",715.0],["02-21",800.0],["02-22",767.0],["02-23",798.0],["02-24",700.0],["02-25",675.0],["02-28",710.0],["02-29",735.0],["03-01",710.0],["03-02",695.0],["03-03",650.0],["03-06",655.0],["03-07",650.0],["03-08",675.0],["03-09",700.0],["03-10",705.0],["03-13",697.0],["03-14",688.0],["03-15",700.0],["03-16",718.0],["03-17",715.0],["03-20",706.0],["03-21",690.0],["03-22",660.0],["03-23",655.0],["03-24",630.0],["03-27",615.0],["03-28",615.0],["03-29",620.0],["03-30",610.0],["03-31",592.0],["04-03",575.0],["04-04",580.0],["04-05",595.0],["04-06",582.0],["04-07",575.0],["04-10",560.0],["04-11",553.0],["04-12",560.0],["04-13",558.0],["04-14",560.0],["04-17",572.0],["04-18",575.0],["04-19",585.0],["04-20",560.0],["04-25",567.0],["04-26",575.0],["04-27",570.0],["04-28",597.0],["05-02",605.0],["05-03",582.0],["05-04",565.0],["05-05",572.0],["05-08",572.0],["05-09",578.0],["05-10",574.0],["05-11",575.0],["05-12",572.0],["05-15",567.0],["05-16",565.0],["05-17",570.0],["05-18",570.0],["05-19",573.0],["05-22",564.0],["05-23",565.0],["05-24",560.0],["05-25",560.0],["05-26",564.0],["05-30",566.0],["05-31",570.0],["06-01",572.0],["06-02",577.0],["06-05",608.0],["06-06",610.0],["06-07",625.0],["06-08",640.0],["06-09",644.0],["06-12",642.0],["06-13",648.0],["06-14",661.0],["06-15",660.0],["06-16",682.0],["06-19",691.0],["06-20",690.0],["06-21",686.0],["06-22",665.0],["06-23",652.0],["06-26",666.0],["06-27",662.0],["06-28",650.0],["06-29",660.0],["06-30",635.0],["07-03",620.0],["07-04",625.5],["07-05",618.0],["07-06",623.0],["07-07",643.0],["07-10",664.0],["07-11",670.0],["07-12",670.0],["07-13",663.0],["07-14",672.0],["07-17",698.0],["07-18",710.0],["07-19",712.0],["07-20",718.0],["07-21",783.0],["07-24",772.0],["07-25",768.0],["07-26",766.0],["07-27",761.0],["07-28",768.0],["07-31",820.0],["08-01",835.0],["08-02",855.0],["08-03",830.0],["08-04",800.0],["08-07",745.0],["08-08",725.0],["08-09",778.0],["08-10",792.0],["08-11",790.0],["08-14",765.0],["08-15",742.5],["08-16",755.0],["08-17",748.0],["08-18",755.0],["08-21",735.0],["08-22",745.0],["08-23",733.0],["08-24",723.0],["08-25",718.0],["08-29",715.0],["08-30",710.0],["08-31",719.0],["09-01",724.0],["09-04",718.0],["09-05",715.0],["09-06",727.0],["09-07",750.0],["09-08",765.0],["09-11",757.0],["09-12",755.0],["09-13",753.0],["09-14",730.0],["09-15",708.0],["09-18",718.0],["09-19",720.0],["09-20",720.0],["09-21",723.0],["09-22",730.0],["09-25",725.0],["09-26",715.0],["09-27",715.0],["09-28",713.0],["09-29",712.0],["10-02",712.0],["10-03",715.0],["10-04",725.0],["10-05",736.0],["10-06",742.0],["10-09",735.0],["10-10",735.0],["10-11",738.0],["10-12",736.0],["10-13",734.5],["10-16",733.0],["10-17",735.0],["10-18",738.0],["10-19",740.0],["10-20",750.0],["10-23",755.0],["10-24",751.0],["10-25",745.0],["10-26",752.0],["10-27",754.0],["10-30",752.0],["10-31",754.0],["11-01",772.0],["11-02",780.0],["11-03",794.0],["11-06",775.0],["11-07",778.0],["11-08",780.0],["11-09",777.0],["11-10",782.0],["11-13",777.0],["11-14",777.0],["11-15",780.0],["11-16",778.0],["11-17",777.0],["11-20",783.5],["11-21",787.0],["11-22",785.0],["11-23",784.0],["11-24",784.0],["11-27",789.0],["11-28",798.0],["11-29",799.0],["11-30",808.0],["12-01",818.0],["12-04",875.0],["12-05",873.0],["12-06",855.0],["12-07",860.0],["12-08",900.0],["12-11",915.0],["12-12",940.0],["12-13",935.0],["12-14",916.0],["12-15",940.0],["12-18",935.0],["12-19",930.0],["12-20",933.0],["12-21",948.0],["12-22",958.0],["12-27",972.0],["12-28",968.0],["12-29",954.0]],"Platinum":[["01-04",442.0],["01-05",431.0],["01-06",420.0],["01-07",416.0],["01-10",417.0],["01-11",420.0],["01-12",420.0],["01-13",422.0],["01-14",427.0],["01-17",432.0],["01-18",434.0],["01-19",440.0],["01-20",444.0],["01-21",439.0],["01-24",450.0],["01-25",460.0],["01-26",451.0],["01-27",460.0],["01-28",495.0],["01-31",495.0],["02-01",493.0],["02-02",495.0],["02-03",502.0],["02-04",511.0],["02-07",521.0],["02-08",513.0],["02-09",541.0],["02-10",540.0],["02-11",545.0],["02-14",543.0],["02-15",535.0],["02-16",549.0],["02-17",573.0],["02-18",537.0],["02-21",527.0],["02-22",508.0],["02-23",510.0],["02-24",478.0],["02-25",478.0],["02-28",477.0],["02-29",486.0],["03-01",477.0],["03-02",480.0],["03-03",465.0],["03-06",470.0],["03-07",470.0],["03-08",475.0],["03-09",473.0],["03-10",478.0],["03-13",478.0],["03-14",481.0],["03-15",483.0],["03-16",484.0],["03-17",487.0],["03-20",490.0],["03-21",495.0],["03-22",496.0],["03-23",492.0],["03-24",482.0],["03-27",480.0],["03-28",479.0],["03-29",483.0],["03-30",477.0],["03-31",482.0],["04-03",508.0],["04-04",506.0],["04-05",521.0],["04-06",518.0],["04-07",512.0],["04-10",488.0],["04-11",491.0],["04-12",494.0],["04-13",500.0],["04-14",504.0],["04-17",508.0],["04-18",501.0],["04-19",494.0],["04-20",488.0],["04-25",477.0],["04-26",473.0],["04-27",476.0],["04-28",510.0],["05-02",532.0],["05-03",525.0],["05-04",509.0],["05-05",515.0],["05-08",502.0],["05-09",505.0],["05-10",510.0],["05-11",512.0],["05-12",514.0],["05-15",520.0],["05-16",506.0],["05-17",508.0],["05-18",516.0],["05-19",530.0],["05-22",550.0],["05-23",544.0],["05-24",563.0],["05-25",554.0],["05-26",549.0],["05-30",550.0],["05-31",548.0],["06-01",552.0],["06-02",552.0],["06-05",564.0],["06-06",566.0],["06-07",566.0],["06-08",548.0],["06-09",549.0],["06-12",547.0],["06-13",558.0],["06-14",543.0],["06-15",542.0],["06-16",544.0],["06-19",552.0],["06-20",561.0],["06-21",570.0],["06-22",575.0],["06-23",560.0],["06-26",575.0],["06-27",580.0],["06-28",570.0],["06-29",574.0],["06-30",565.0],["07-03",555.0],["07-04",550.0],["07-05",538.0],["07-06",535.0],["07-07",542.0],["07-10",550.0],["07-11",550.0],["07-12",548.0],["07-13",556.0],["07-14",560.0],["07-17",578.0],["07-18",578.0],["07-19",572.0],["07-20",572.0],["07-21",583.0],["07-24",578.0],["07-25",568.0],["07-26",565.0],["07-27",564.0],["07-28",558.0],["07-31",570.0],["08-01",588.0],["08-02",612.0],["08-03",590.0],["08-04",574.0],["08-07",570.0],["08-08",572.0],["08-09",576.0],["08-10",580.0],["08-11",565.0],["08-14",568.0],["08-15",569.0],["08-16",572.0],["08-17",574.0],["08-18",568.0],["08-21",570.0],["08-22",573.0],["08-23",572.0],["08-24",575.0],["08-25",577.0],["08-29",588.0],["08-30",595.0],["08-31",587.0],["09-01",590.0],["09-04",612.0],["09-05",596.0],["09-06",607.0],["09-07",612.0],["09-08",612.0],["09-11",610.0],["09-12",608.0],["09-13",602.0],["09-14",588.0],["09-15",584.0],["09-18",594.0],["09-19",593.0],["09-20",593.0],["09-21",586.0],["09-22",587.0],["09-25",584.0],["09-26",577.0],["09-27",568.0],["09-28",574.0],["09-29",574.0],["10-02",573.0],["10-03",568.0],["10-04",569.0],["10-05",573.0],["10-06",580.0],["10-09",582.0],["10-10",582.0],["10-11",580.0],["10-12",585.0],["10-13",587.0],["10-16",583.0],["10-17",577.0],["10-18",578.0],["10-19",580.0],["10-20",588.0],["10-23",586.0],["10-24",584.0],["10-25",576.0],["10-26",579.0],["10-27",578.0],["10-30",576.0],["10-31",580.0],["11-01",586.0],["11-02",590.0],["11-03",600.0],["11-06",598.0],["11-07",592.0],["11-08",598.0],["11-09",598.0],["11-10",602.0],["11-13",598.0],["11-14",592.0],["11-15",592.0],["11-16",588.0],["11-17",588.0],["11-20",592.0],["11-21",594.0],["11-22",588.0],["11-23",587.0],["11-24",586.0],["11-27",586.0],["11-28",598.0],["11-29",600.0],["11-30",604.0],["12-01",606.0],["12-04",623.0],["12-05",620.0],["12-06",599.0],["12-07",605.0],["12-08",608.0],["12-11",610.0],["12-12",620.0],["12-13",625.0],["12-14",613.0],["12-15",612.0],["12-18",603.5],["12-19",602.0],["12-20",603.0],["12-21",610.0],["12-22",605.0],["12-27",610.0],["12-28",619.0],["12-29",611.0]],"Silver":[["01-04",5.3],["01-05",5.29],["01-06",5.14],["01-07",5.13],["01-10",5.14],["01-11",5.16],["01-12",5.14],["01-13",5.09],["01-14",5.09],["01-17",5.12],["01-18",5.13],["01-19",5.1],["01-20",5.13],["01-21",5.18],["01-24",5.21],["01-25",5.27],["01-26",5.2],["01-27",5.29],["01-28",5.37],["01-31",5.26],["02-01",5.24],["02-02",5.21],["02-03",5.2],["02-04",5.23],["02-07",5.45],["02-08",5.27],["02-09",5.36],["02-10",5.36],["02-11",5.36],["02-14",5.24],["02-15",5.24],["02-16",5.23],["02-17",5.29],["02-18",5.23],["02-21",5.24],["02-22",5.24],["02-23",5.25],["02-24",5.22],["02-25",5.15],["02-28",5.08],["02-29",5.09],["03-01",5.12],["03-02",5.04],["03-03",5.02],["03-06",5.09],["03-07",5.05],["03-08",5.07],["03-09",5.05],["03-10",5.11],["03-13",5.09],["03-14",5.08],["03-15",5.08],["03-16",5.12],["03-17",5.06],["03-20",5.07],["03-21",5.04],["03-22",5.13],["03-23",5.11],["03-24",5.08],["03-27",5.09],["03-28",5.07],["03-29",5.05],["03-30",4.94],["03-31",4.93],["04-03",5.04],["04-04",4.99],["04-05",5.11],["04-06",5.09],["04-07",5.08],["04-10",5.08],["04-11",5.12],["04-12",5.09],["04-13",5.1],["04-14",5.13],["04-17",5.13],["04-18",5.08],["04-19",5.1],["04-20",5.09],["04-25",4.96],["04-26",4.97],["04-27",4.97],["04-28",4.94],["05-02",5.0],["05-03",5.0],["05-04",5.0],["05-05",5.08],["05-08",4.99],["05-09",4.99],["05-10",5.03],["05-11",5.0],["05-12",4.97],["05-15",4.98],["05-16",5.0],["05-17",5.04],["05-18",4.96],["05-19",4.98],["05-22",4.98],["05-23",5.0],["05-24",4.98],["05-25",4.97],["05-26",4.92],["05-30",4.94],["05-31",4.9],["06-01",4.89],["06-02",4.91],["06-05",5.03],["06-06",5.0],["06-07",5.04],["06-08",5.05],["06-09",5.04],["06-12",5.01],["06-13",5.09],["06-14",5.0],["06-15",5.06],["06-16",5.05],["06-19",5.04],["06-20",4.99],["06-21",5.02],["06-22",4.93],["06-23",4.96],["06-26",4.94],["06-27",4.96],["06-28",4.93],["06-29",4.98],["06-30",5.02],["07-03",5.0],["07-04",4.99],["07-05",4.99],["07-06",4.97],["07-07",4.99],["07-10",4.97],["07-11",4.97],["07-12",4.96],["07-13",4.96],["07-14",4.96],["07-17",5.0],["07-18",5.01],["07-19",4.99],["07-20",4.96],["07-21",4.99],["07-24",4.92],["07-25",4.92],["07-26",4.96],["07-27",4.93],["07-28",4.95],["07-31",4.95],["08-01",4.98],["08-02",4.96],["08-03",4.96],["08-04",4.95],["08-07",4.92],["08-08",4.92],["08-09",4.87],["08-10",4.88],["08-11",4.9],["08-14",4.91],["08-15",4.87],["08-16",4.84],["08-17",4.87],["08-18",4.85],["08-21",4.83],["08-22",4.83],["08-23",4.81],["08-24",4.76],["08-25",4.86],["08-29",4.88],["08-30",4.89],["08-31",4.91],["09-01",4.94],["09-04",4.96],["09-05",4.94],["09-06",4.95],["09-07",4.91],["09-08",4.89],["09-11",4.87],["09-12",4.86],["09-13",4.88],["09-14",4.87],["09-15",4.87],["09-18",4.86],["09-19",4.85],["09-20",4.86],["09-21",4.82],["09-22",4.88],["09-25",4.89],["09-26",4.9],["09-27",4.9],["09-28",4.94],["09-29",4.89],["10-02",4.88],["10-03",4.88],["10-04",4.88],["10-05",4.88],["10-06",4.86],["10-09",4.86],["10-10",4.87],["10-11",4.88],["10-12",4.85],["10-13",4.88],["10-16",4.86],["10-17",4.84],["10-18",4.84],["10-19",4.83],["10-20",4.82],["10-23",4.83],["10-24",4.78],["10-25",4.78],["10-26",4.75],["10-27",4.72],["10-30",4.75],["10-31",4.74],["11-01",4.75],["11-02",4.75],["11-03",4.71],["11-06",4.73],["11-07",4.74],["11-08",4.71],["11-09",4.72],["11-10",4.72],["11-13",4.67],["11-14",4.66],["11-15",4.66],["11-16",4.67],["11-17",4.65],["11-20",4.64],["11-21",4.65],["11-22",4.62],["11-23",4.62],["11-24",4.62],["11-27",4.62],["11-28",4.69],["11-29",4.7],["11-30",4.63],["12-01",4.68],["12-04",4.67],["12-05",4.69],["12-06",4.71],["12-07",4.75],["12-08",4.71],["12-11",4.66],["12-12",4.66],["12-13",4.65],["12-14",4.64],["12-15",4.61],["12-18",4.58],["12-19",4.57],["12-20",4.61],["12-21",4.61],["12-22",4.6],["12-27",4.63],["12-28",4.59],["12-29",4.58]]},"2001":{"Gold":[["01-02",272.8],["01-03",269.0],["01-04",268.75],["01-05",268.0],["01-08",268.6],["01-09",267.75],["01-10",266.7],["01-11",264.8],["01-12",263.65],["01-15",263.35],["01-16",264.5],["01-17",263.1],["01-18",264.1],["01-19",265.75],["01-22",266.1],["01-23",267.1],["01-24",265.7],["01-25",263.6],["01-26",264.5],["01-29",263.1],["01-30",263.4],["01-31",266.2],["02-01",266.85],["02-02",268.0],["02-05",266.25],["02-06",264.55],["02-07",262.9],["02-08",263.4],["02-09",260.5],["02-12",260.9],["02-13",261.5],["02-14",260.9],["02-15",259.5],["02-16",256.7],["02-19",258.95],["02-20",258.3],["02-21",257.3],["02-22",258.0],["02-23",259.95],["02-26",262.8],["02-27",268.1],["02-28",265.0],["03-01",266.7],["03-02",263.35],["03-05",261.85],["03-06",262.6],["03-07",261.55],["03-08",263.6],["03-09",268.75],["03-12",270.5],["03-13",269.4],["03-14",267.45],["03-15",262.7],["03-16",260.2],["03-19",260.5],["03-20",262.6],["03-21",261.2],["03-22",262.25],["03-23",262.3],["03-26",261.3],["03-27",262.75],["03-28",261.2],["03-29",260.2],["03-30",259.05],["04-02",257.55],["04-03",257.0],["04-04",259.2],["04-05",258.2],["04-06",258.1],["04-09",260.9],["04-10",257.05],["04-11",258.45],["04-12",259.4],["04-17",262.15],["04-18",260.1],["04-19",261.35],["04-20",264.2],["04-23",262.9],["04-24",263.65],["04-25",263.95],["04-26",262.2],["04-27",264.45],["04-30",263.45],["05-01",263.8],["05-02",265.0],["05-03",265.3],["05-04",265.8],["05-08",265.6],["05-09",265.2],["05-10",269.4],["05-11",268.95],["05-14",267.7],["05-15",268.05],["05-16",269.1],["05-17",271.75],["05-18",272.1],["05-21",288.35],["05-22",282.75],["05-23",283.85],["05-24",283.45],["05-25",280.65],["05-29",276.65],["05-30",273.65],["05-31",266.1],["06-01",265.65],["06-04",266.25],["06-05",266.15],["06-06",266.95],["06-07",266.25],["06-08",267.25],["06-11",272.75],["06-12",267.9],["06-13",271.8],["06-14",272.2],["06-15",274.35],["06-18",271.5],["06-19",273.95],["06-20",272.4],["06-21",272.65],["06-22",273.2],["06-25",273.1],["06-26",273.85],["06-27",276.0],["06-28",271.45],["06-29",269.9],["07-02",269.1],["07-03",268.6],["07-04",267.6],["07-05",267.55],["07-06",265.2],["07-09",266.85],["07-10",267.2],["07-11",266.55],["07-12",267.55],["07-13",266.4],["07-16",268.0],["07-17",266.85],["07-18",268.1],["07-19",271.55],["07-20",270.1],["07-23",269.25],["07-24",268.9],["07-25",269.25],["07-26",267.15],["07-27",265.85],["07-30",266.4],["07-31",265.55],["08-01",267.7],["08-02",268.3],["08-03",267.5],["08-06",267.9],["08-07",266.7],["08-08",266.5],["08-09",269.0],["08-10",273.35],["08-13",275.1],["08-14",274.1],["08-15",276.35],["08-16",275.1],["08-17",276.25],["08-20",277.75],["08-21",276.95],["08-22",277.25],["08-23",274.3],["08-24",275.15],["08-28",271.6],["08-29",272.85],["08-30",273.4],["08-31",275.35],["09-03",273.55],["09-04",272.25],["09-05",271.7],["09-06",272.0],["09-07",273.15],["09-10",273.2],["09-11",271.4],["09-12",279.5],["09-13",278.5],["09-14",284.5],["09-17",291.0],["09-18",288.65],["09-19",289.35],["09-20",288.2],["09-21",291.3],["09-24",289.65],["09-25",287.95],["09-26",291.6],["09-27",291.25],["09-28",290.85],["10-01",291.65],["10-02",291.1],["10-03",289.95],["10-04",289.15],["10-05",291.6],["10-08",292.85],["10-09",291.1],["10-10",286.5],["10-11",282.35],["10-12",282.85],["10-15",283.75],["10-16",281.25],["10-17",281.65],["10-18",282.2],["10-19",278.7],["10-22",277.55],["10-23",274.9],["10-24",276.15],["10-25",275.35],["10-26",276.95],["10-29",277.7],["10-30",280.2],["10-31",280.95],["11-01",279.45],["11-02",280.2],["11-05",278.95],["11-06",278.9],["11-07",280.5],["11-08",280.2],["11-09",277.3],["11-12",277.7],["11-13",277.65],["11-14",277.55],["11-15",276.05],["11-16",275.5],["11-19",274.2],["11-20",273.75],["11-21",273.15],["11-22",273.2],["11-23",272.55],["11-26",273.05],["11-27",273.65],["11-28",274.6],["11-29",274.65],["11-30",274.7],["12-03",275.25],["12-04",276.55],["12-05",275.75],["12-06",274.1],["12-07",274.75],["12-10",273.35],["12-11",272.6],["12-12",273.25],["12-13",273.95],["12-14",274.85],["12-17",277.8],["12-18",278.85],["12-19",278.9],["12-20",276.25],["12-21",277.8],["12-24",277.7],["12-27",278.05],["12-28",277.6],["12-31",276.5]],"Palladium":[["01-02",965.0],["01-03",975.0],["01-04",993.0],["01-05",977.0],["01-08",1010.0],["01-09",1037.0],["01-10",1047.0],["01-11",1085.0],["01-12",1055.0],["01-15",1050.0],["01-16",1040.0],["01-17",1026.0],["01-18",1015.0],["01-19",1050.0],["01-22",1080.0],["01-23",1065.0],["01-24",1065.0],["01-25",1059.0],["01-26",1094.0],["01-29",1082.0],["01-30",1054.0],["01-31",1055.0],["02-01",1042.0],["02-02",1060.0],["02-05",1065.0],["02-06",1081.0],["02-07",1072.0],["02-08",1058.0],["02-09",1030.0],["02-12",985.0],["02-13",968.0],["02-14",982.0],["02-15",970.0],["02-16",980.0],["02-19",974.0],["02-20",965.0],["02-21",954.0],["02-22",915.0],["02-23",870.0],["02-26",840.0],["02-27",849.0],["02-28",845.0],["03-01",822.0],["03-02",774.0],["03-05",750.0],["03-06",770.0],["03-07",770.0],["03-08",812.0],["03-09",828.0],["03-12",785.0],["03-13",780.0],["03-14",795.0],["03-15",800.0],["03-16",800.0],["03-19",805.0],["03-20",797.0],["03-21",785.0],["03-22",776.0],["03-23",772.0],["03-26",774.0],["03-27",771.0],["03-28",765.0],["03-29",745.0],["03-30",735.0],["04-02",735.0],["04-03",715.0],["04-04",692.0],["04-05",680.0],["04-06",680.0],["04-09",685.0],["04-10",670.0],["04-11",665.0],["04-12",655.0],["04-17",688.0],["04-18",765.0],["04-19",690.0],["04-20",695.0],["04-23",718.0],["04-24",705.0],["04-25",710.0],["04-26",705.0],["04-27",690.0],["04-30",685.0],["05-01",675.0],["05-02",671.0],["05-03",670.0],["05-04",673.0],["05-08",670.0],["05-09",665.0],["05-10",665.0],["05-11",655.0],["05-14",635.0],["05-15",638.0],["05-16",640.0],["05-17",638.0],["05-18",650.0],["05-21",655.0],["05-22",655.0],["05-23",640.0],["05-24",645.0],["05-25",650.0],["05-29",665.0],["05-30",660.0],["05-31",650.0],["06-01",645.0],["06-04",638.0],["06-05",630.0],["06-06",627.0],["06-07",625.0],["06-08",617.0],["06-11",614.0],["06-12",605.0],["06-13",596.5],["06-14",600.0],["06-15",605.0],["06-18",608.0],["06-19",612.0],["06-20",618.0],["06-21",620.0],["06-22",613.0],["06-25",612.0],["06-26",609.0],["06-27",608.0],["06-28",600.0],["06-29",594.0],["07-02",598.0],["07-03",595.0],["07-04",587.0],["07-05",582.0],["07-06",580.0],["07-09",572.0],["07-10",560.0],["07-11",563.0],["07-12",563.0],["07-13",565.0],["07-16",553.0],["07-17",534.0],["07-18",518.0],["07-19",518.0],["07-20",485.0],["07-23",480.0],["07-24",455.0],["07-25",468.0],["07-26",459.0],["07-27",457.0],["07-30",444.0],["07-31",438.0],["08-01",460.0],["08-02",470.0],["08-03",485.0],["08-06",475.0],["08-07",450.0],["08-08",442.0],["08-09",445.0],["08-10",460.0],["08-13",475.0],["08-14",458.0],["08-15",443.0],["08-16",440.0],["08-17",455.0],["08-20",440.0],["08-21",445.0],["08-22",447.0],["08-23",448.0],["08-24",446.0],["08-28",460.0],["08-29",473.0],["08-30",450.0],["08-31",453.0],["09-03",457.0],["09-04",455.0],["09-05",455.0],["09-06",458.0],["09-07",455.0],["09-10",460.0],["09-11",455.0],["09-12",465.0],["09-13",458.0],["09-14",460.0],["09-17",465.0],["09-18",463.0],["09-19",465.0],["09-20",455.0],["09-21",454.0],["09-24",435.0],["09-25",425.0],["09-26",415.0],["09-27",382.0],["09-28",363.0],["10-01",330.0],["10-02",315.0],["10-03",350.0],["10-04",335.0],["10-05",348.0],["10-08",348.0],["10-09",345.0],["10-10",340.0],["10-11",348.0],["10-12",350.0],["10-15",354.5],["10-16",354.5],["10-17",335.0],["10-18",330.0],["10-19",325.0],["10-22",317.25],["10-23",316.0],["10-24",320.0],["10-25",318.0],["10-26",320.0],["10-29",345.0],["10-30",340.0],["10-31",330.0],["11-01",315.0],["11-02",326.0],["11-05",325.0],["11-06",328.0],["11-07",328.0],["11-08",323.0],["11-09",323.0],["11-12",328.0],["11-13",322.0],["11-14",319.0],["11-15",320.5],["11-16",328.0],["11-19",338.0],["11-20",338.0],["11-21",332.5],["11-22",330.0],["11-23",330.0],["11-26",333.5],["11-27",333.0],["11-28",333.0],["11-29",333.0],["11-30",338.0],["12-03",355.0],["12-04",359.0],["12-05",370.0],["12-06",380.0],["12-07",405.0],["12-10",415.0],["12-11",407.0],["12-12",387.0],["12-13",383.0],["12-14",403.0],["12-17",405.0],["12-18",400.0],["12-19",401.0],["12-20",400.0],["12-21",400.0],["12-24",413.0],["12-27",437.0],["12-28",436.0],["12-31",440.0]],"Platinum":[["01-02",610.0],["01-03",614.0],["01-04",638.0],["01-05",618.0],["01-08",626.0],["01-09",632.0],["01-10",637.0],["01-11",645.0],["01-12",632.0],["01-15",640.0],["01-16",637.0],["01-17",628.0],["01-18",610.0],["01-19",619.0],["01-22",624.0],["01-23",620.0],["01-24",612.0],["01-25",610.0],["01-26",616.0],["01-29",610.0],["01-30",604.0],["01-31",605.0],["02-01",602.5],["02-02",597.0],["02-05",600.0],["02-06",608.0],["02-07",606.0],["02-08",602.5],["02-09",597.0],["02-12",596.0],["02-13",595.0],["02-14",595.0],["02-15",595.0],["02-16",598.0],["02-19",602.0],["02-20",603.0],["02-21",607.0],["02-22",601.0],["02-23",599.5],["02-26",605.0],["02-27",607.0],["02-28",613.0],["03-01",609.0],["03-02",599.0],["03-05",578.5],["03-06",585.0],["03-07",586.0],["03-08",595.0],["03-09",600.0],["03-12",595.0],["03-13",589.0],["03-14",592.0],["03-15",592.0],["03-16",587.0],["03-19",587.0],["03-20",583.0],["03-21",584.0],["03-22",579.0],["03-23",575.0],["03-26",575.0],["03-27",579.0],["03-28",581.0],["03-29",572.0],["03-30",564.0],["04-02",558.0],["04-03",565.0],["04-04",582.0],["04-05",575.0],["04-06",570.0],["04-09",579.0],["04-10",578.0],["04-11",588.0],["04-12",592.0],["04-17",622.0],["04-18",630.0],["04-19",619.0],["04-20",622.0],["04-23",616.0],["04-24",610.0],["04-25",606.0],["04-26",599.0],["04-27",598.0],["04-30",596.0],["05-01",600.0],["05-02",603.0],["05-03",606.0],["05-04",622.0],["05-08",604.0],["05-09",604.0],["05-10",604.0],["05-11",606.0],["05-14",605.0],["05-15",604.0],["05-16",609.0],["05-17",610.0],["05-18",613.0],["05-21",616.0],["05-22",614.0],["05-23",612.0],["05-24",613.0],["05-25",616.0],["05-29",620.0],["05-30",618.0],["05-31",608.0],["06-01",596.0],["06-04",593.0],["06-05",589.5],["06-06",585.0],["06-07",589.0],["06-08",589.0],["06-11",588.0],["06-12",581.0],["06-13",574.0],["06-14",578.0],["06-15",580.0],["06-18",582.5],["06-19",580.0],["06-20",580.0],["06-21",581.0],["06-22",574.0],["06-25",574.5],["06-26",570.0],["06-27",567.0],["06-28",565.0],["06-29",558.0],["07-02",560.0],["07-03",557.0],["07-04",559.0],["07-05",557.0],["07-06",553.0],["07-09",560.0],["07-10",554.0],["07-11",555.0],["07-12",558.0],["07-13",560.0],["07-16",552.0],["07-17",549.0],["07-18",524.0],["07-19",517.0],["07-20",510.0],["07-23",498.0],["07-24",496.0],["07-25",502.0],["07-26",506.0],["07-27",504.0],["07-30",498.0],["07-31",473.0],["08-01",470.0],["08-02",472.0],["08-03",481.0],["08-06",473.0],["08-07",450.0],["08-08",442.0],["08-09",433.0],["08-10",444.0],["08-13",454.0],["08-14",441.0],["08-15",427.0],["08-16",422.0],["08-17",448.0],["08-20",439.5],["08-21",442.0],["08-22",447.0],["08-23",458.0],["08-24",458.0],["08-28",461.0],["08-29",465.0],["08-30",449.0],["08-31",446.0],["09-03",442.0],["09-04",443.0],["09-05",442.0],["09-06",442.0],["09-07",442.0],["09-10",443.0],["09-11",443.0],["09-12",455.0],["09-13",453.0],["09-14",473.0],["09-17",474.0],["09-18",482.0],["09-19",490.0],["09-20",495.0],["09-21",490.0],["09-24",480.0],["09-25",461.0],["09-26",440.0],["09-27",442.0],["09-28",430.0],["10-01",424.0],["10-02",406.0],["10-03",438.0],["10-04",430.0],["10-05",446.0],["10-08",440.0],["10-09",435.0],["10-10",424.0],["10-11",433.0],["10-12",433.0],["10-15",462.0],["10-16",457.0],["10-17",442.0],["10-18",437.0],["10-19",433.0],["10-22",428.0],["10-23",428.0],["10-24",420.0],["10-25",417.0],["10-26",419.0],["10-29",431.0],["10-30",430.0],["10-31",427.0],["11-01",419.5],["11-02",422.0],["11-05",421.0],["11-06",420.0],["11-07",418.0],["11-08",416.0],["11-09",420.0],["11-12",428.0],["11-13",428.0],["11-14",430.0],["11-15",424.0],["11-16",427.0],["11-19",430.0],["11-20",440.0],["11-21",441.0],["11-22",437.0],["11-23",434.0],["11-26",441.0],["11-27",440.0],["11-28",438.0],["11-29",436.0],["11-30",441.0],["12-03",453.0],["12-04",454.5],["12-05",453.0],["12-06",456.0],["12-07",467.0],["12-10",470.0],["12-11",460.0],["12-12",466.0],["12-13",463.0],["12-14",462.0],["12-17",461.0],["12-18",459.25],["12-19",456.0],["12-20",453.0],["12-21",457.0],["12-24",463.0],["12-27",470.0],["12-28",477.0],["12-31",477.0]],"Silver":[["01-02",4.59],["01-03",4.53],["01-04",4.5],["01-05",4.52],["01-08",4.57],["01-09",4.55],["01-10",4.53],["01-11",4.54],["01-12",4.56],["01-15",4.6],["01-16",4.61],["01-17",4.67],["01-18",4.72],["01-19",4.82],["01-22",4.78],["01-23",4.8],["01-24",4.76],["01-25",4.78],["01-26",4.79],["01-29",4.79],["01-30",4.8],["01-31",4.79],["02-01",4.8],["02-02",4.75],["02-05",4.72],["02-06",4.66],["02-07",4.63],["02-08",4.58],["02-09",4.57],["02-12",4.55],["02-13",4.57],["02-14",4.55],["02-15",4.51],["02-16",4.5],["02-19",4.5],["02-20",4.5],["02-21",4.42],["02-22",4.42],["02-23",4.45],["02-26",4.43],["02-27",4.46],["02-28",4.43],["03-01",4.51],["03-02",4.42],["03-05",4.4],["03-06",4.42],["03-07",4.42],["03-08",4.46],["03-09",4.5],["03-12",4.51],["03-13",4.42],["03-14",4.45],["03-15",4.42],["03-16",4.35],["03-19",4.33],["03-20",4.33],["03-21",4.33],["03-22",4.34],["03-23",4.34],["03-26",4.35],["03-27",4.37],["03-28",4.43],["03-29",4.36],["03-30",4.33],["04-02",4.29],["04-03",4.33],["04-04",4.33],["04-05",4.34],["04-06",4.35],["04-09",4.35],["04-10",4.33],["04-11",4.33],["04-12",4.37],["04-17",4.41],["04-18",4.33],["04-19",4.38],["04-20",4.43],["04-23",4.42],["04-24",4.43],["04-25",4.43],["04-26",4.38],["04-27",4.4],["04-30",4.37],["05-01",4.34],["05-02",4.38],["05-03",4.38],["05-04",4.36],["05-08",4.33],["05-09",4.32],["05-10",4.39],["05-11",4.34],["05-14",4.34],["05-15",4.34],["05-16",4.33],["05-17",4.42],["05-18",4.45],["05-21",4.58],["05-22",4.51],["05-23",4.52],["05-24",4.62],["05-25",4.57],["05-29",4.52],["05-30",4.51],["05-31",4.42],["06-01",4.39],["06-04",4.41],["06-05",4.35],["06-06",4.36],["06-07",4.33],["06-08",4.34],["06-11",4.36],["06-12",4.33],["06-13",4.38],["06-14",4.4],["06-15",4.45],["06-18",4.38],["06-19",4.43],["06-20",4.4],["06-21",4.35],["06-22",4.33],["06-25",4.32],["06-26",4.3],["06-27",4.35],["06-28",4.3],["06-29",4.33],["07-02",4.3],["07-03",4.29],["07-04",4.27],["07-05",4.26],["07-06",4.22],["07-09",4.26],["07-10",4.26],["07-11",4.25],["07-12",4.26],["07-13",4.25],["07-16",4.31],["07-17",4.22],["07-18",4.24],["07-19",4.27],["07-20",4.22],["07-23",4.26],["07-24",4.26],["07-25",4.24],["07-26",4.24],["07-27",4.25],["07-30",4.22],["07-31",4.21],["08-01",4.24],["08-02",4.23],["08-03",4.24],["08-06",4.22],["08-07",4.14],["08-08",4.16],["08-09",4.16],["08-10",4.22],["08-13",4.17],["08-14",4.16],["08-15",4.23],["08-16",4.17],["08-17",4.21],["08-20",4.24],["08-21",4.17],["08-22",4.21],["08-23",4.2],["08-24",4.22],["08-28",4.21],["08-29",4.21],["08-30",4.2],["08-31",4.2],["09-03",4.2],["09-04",4.17],["09-05",4.19],["09-06",4.18],["09-07",4.18],["09-10",4.18],["09-11",4.18],["09-12",4.22],["09-13",4.21],["09-14",4.27],["09-17",4.29],["09-18",4.37],["09-19",4.46],["09-20",4.62],["09-21",4.6],["09-24",4.51],["09-25",4.52],["09-26",4.55],["09-27",4.54],["09-28",4.58],["10-01",4.58],["10-02",4.59],["10-03",4.59],["10-04",4.61],["10-05",4.64],["10-08",4.64],["10-09",4.63],["10-10",4.49],["10-11",4.42],["10-12",4.42],["10-15",4.42],["10-16",4.36],["10-17",4.38],["10-18",4.34],["10-19",4.24],["10-22",4.24],["10-23",4.22],["10-24",4.25],["10-25",4.19],["10-26",4.21],["10-29",4.21],["10-30",4.29],["10-31",4.28],["11-01",4.24],["11-02",4.22],["11-05",4.12],["11-06",4.12],["11-07",4.14],["11-08",4.13],["11-09",4.11],["11-12",4.15],["11-13",4.11],["11-14",4.18],["11-15",4.11],["11-16",4.12],["11-19",4.11],["11-20",4.08],["11-21",4.07],["11-22",4.07],["11-23",4.09],["11-26",4.07],["11-27",4.07],["11-28",4.09],["11-29",4.14],["11-30",4.14],["12-03",4.18],["12-04",4.21],["12-05",4.14],["12-06",4.22],["12-07",4.27],["12-10",4.24],["12-11",4.25],["12-12",4.29],["12-13",4.27],["12-14",4.36],["12-17",4.38],["12-18",4.44],["12-19",4.49],["12-20",4.38],["12-21",4.52],["12-24",4.54],["12-27",4.54],["12-28",4.5],["12-31",4.52]]},"2002":{"Gold":[["01-02",278.1],["01-03",278.65],["01-04",278.95],["01-07",279.65],["01-08",278.2],["01-09",279.35],["01-10",287.0],["01-11",286.6],["01-14",286.4],["01-15",283.85],["01-16",287.95],["01-17",285.15],["01-18",283.7],["01-21",282.65],["01-22",283.35],["01-23",281.6],["01-24",279.05],["01-25",279.0],["01-28",279.35],["01-29",277.8],["01-30",280.95],["01-31",281.5],["02-01",282.0],["02-04",285.8],["02-05",290.35],["02-06",297.45],["02-07",300.35],["02-08",305.1],["02-11",301.5],["02-12",298.9],["02-13",298.6],["02-14",298.1],["02-15",300.4],["02-18",298.5],["02-19",297.25],["02-20",294.2],["02-21",291.15],["02-22",293.35],["02-25",291.8],["02-26",293.0],["02-27",299.3],["02-28",296.55],["03-01",295.8],["03-04",299.55],["03-05",296.6],["03-06",294.35],["03-07",292.15],["03-08",289.3],["03-11",291.75],["03-12",292.0],["03-13",293.75],["03-14",292.7],["03-15",291.0],["03-18",291.0],["03-19",293.2],["03-20",292.7],["03-21",292.25],["03-22",293.65],["03-25",297.7],["03-26",297.1],["03-27",297.5],["03-28",303.0],["04-02",302.65],["04-03",304.95],["04-04",301.5],["04-05",300.8],["04-08",298.5],["04-09",299.3],["04-10",297.8],["04-11",301.8],["04-12",301.65],["04-15",301.8],["04-16",299.35],["04-17",300.15],["04-18",302.3],["04-19",303.7],["04-22",303.35],["04-23",303.25],["04-24",304.5],["04-25",305.1],["04-26",307.65],["04-29",310.65],["04-30",309.35],["05-01",308.3],["05-02",308.1],["05-03",308.85],["05-07",312.65],["05-08",310.9],["05-09",308.75],["05-10",310.65],["05-13",311.6],["05-14",309.95],["05-15",307.5],["05-16",309.05],["05-17",310.65],["05-20",311.8],["05-21",315.1],["05-22",318.25],["05-23",316.25],["05-24",320.9],["05-27",320.8],["05-28",321.4],["05-29",325.2],["05-30",324.65],["05-31",327.25],["06-05",324.5],["06-06",322.9],["06-07",326.55],["06-10",323.1],["06-11",319.0],["06-12",319.55],["06-13",317.6],["06-14",319.7],["06-17",317.95],["06-18",318.05],["06-19",321.85],["06-20",320.85],["06-21",323.5],["06-24",326.35],["06-25",323.1],["06-26",324.6],["06-27",319.45],["06-28",319.05],["07-01",312.3],["07-02",312.9],["07-03",312.85],["07-04",310.9],["07-05",310.75],["07-08",313.0],["07-09",312.45],["07-10",315.95],["07-11",314.5],["07-12",316.5],["07-15",316.35],["07-16",320.35],["07-17",317.75],["07-18",316.6],["07-19",319.15],["07-22",324.0],["07-23",320.3],["07-24",313.6],["07-25",310.25],["07-26",308.6],["07-29",303.05],["07-30",304.45],["07-31",305.5],["08-01",300.65],["08-02",306.5],["08-05",307.6],["08-06",306.75],["08-07",307.8],["08-08",312.95],["08-09",309.6],["08-12",316.25],["08-13",314.7],["08-14",316.25],["08-15",312.7],["08-16",314.55],["08-19",313.05],["08-20",307.6],["08-21",308.35],["08-22",306.45],["08-23",305.8],["08-27",309.4],["08-28",310.95],["08-29",310.65],["08-30",312.4],["09-02",312.25],["09-03",313.5],["09-04",312.7],["09-05",316.2],["09-06",317.9],["09-09",322.2],["09-10",318.35],["09-11",317.15],["09-12",318.0],["09-13",318.5],["09-16",316.55],["09-17",315.3],["09-18",317.6],["09-19",320.15],["09-20",321.55],["09-23",323.45],["09-24",323.3],["09-25",325.25],["09-26",322.35],["09-27",320.15],["09-30",322.4],["10-01",322.6],["10-02",320.4],["10-03",322.7],["10-04",321.65],["10-07",322.35],["10-08",320.7],["10-09",318.8],["10-10",319.5],["10-11",317.1],["10-14",318.0],["10-15",317.5],["10-16",314.0],["10-17",312.8],["10-18",312.45],["10-21",313.4],["10-22",311.65],["10-23",313.4],["10-24",311.1],["10-25",312.3],["10-28",313.3],["10-29",316.35],["10-30",316.8],["10-31",316.35],["11-01",318.75],["11-04",317.2],["11-05",318.9],["11-06",317.5],["11-07",319.7],["11-08",322.55],["11-11",321.1],["11-12",321.9],["11-13",323.2],["11-14",318.6],["11-15",318.5],["11-18",319.8],["11-19",319.8],["11-20",319.0],["11-21",318.4],["11-22",318.2],["11-25",319.5],["11-26",318.0],["11-27",318.2],["11-28",317.3],["11-29",318.25],["12-02",317.3],["12-03",317.7],["12-04",320.7],["12-05",322.1],["12-06",325.3],["12-09",325.3],["12-10",325.95],["12-11",323.75],["12-12",326.15],["12-13",333.5],["12-16",332.9],["12-17",341.0],["12-18",337.05],["12-19",345.75],["12-20",343.1],["12-23",343.9],["12-24",345.0],["12-27",348.3],["12-30",348.5],["12-31",342.75]],"Palladium":[["01-02",440.0],["01-03",437.0],["01-04",425.0],["01-07",422.0],["01-08",429.0],["01-09",433.0],["01-10",435.0],["01-11",432.0],["01-14",435.0],["01-15",419.0],["01-16",415.0],["01-17",422.0],["01-18",417.0],["01-21",407.0],["01-22",400.0],["01-23",398.0],["01-24",385.0],["01-25",380.0],["01-28",385.0],["01-29",375.0],["01-30",370.0],["01-31",370.0],["02-01",367.0],["02-04",368.0],["02-05",365.0],["02-06",372.0],["02-07",375.0],["02-08",378.0],["02-11",375.0],["02-12",365.0],["02-13",375.0],["02-14",388.0],["02-15",383.0],["02-18",378.0],["02-19",374.0],["02-20",375.0],["02-21",370.0],["02-22",370.0],["02-25",372.0],["02-26",374.0],["02-27",383.0],["02-28",378.0],["03-01",373.0],["03-04",375.0],["03-05",370.0],["03-06",360.0],["03-07",361.0],["03-08",370.0],["03-11",372.0],["03-12",370.0],["03-13",370.0],["03-14",365.0],["03-15",370.0],["03-18",372.0],["03-19",376.0],["03-20",380.0],["03-21",378.0],["03-22",378.0],["03-25",380.0],["03-26",390.0],["03-27",390.0],["03-28",388.0],["04-02",392.0],["04-03",381.0],["04-04",368.0],["04-05",368.0],["04-08",362.0],["04-09",364.0],["04-10",365.0],["04-11",372.0],["04-12",374.0],["04-15",372.0],["04-16",368.0],["04-17",370.0],["04-18",374.0],["04-19",372.0],["04-22",370.0],["04-23",370.0],["04-24",372.0],["04-25",368.0],["04-26",365.0],["04-29",365.0],["04-30",362.0],["05-01",355.0],["05-02",354.0],["05-03",350.0],["05-07",355.0],["05-08",357.0],["05-09",353.0],["05-10",350.0],["05-13",354.0],["05-14",353.0],["05-15",358.0],["05-16",362.0],["05-17",366.0],["05-20",374.0],["05-21",378.0],["05-22",364.0],["05-23",355.0],["05-24",355.0],["05-27",348.0],["05-28",351.0],["05-29",355.0],["05-30",354.0],["05-31",350.0],["06-05",348.0],["06-06",350.0],["06-07",356.0],["06-10",346.0],["06-11",343.0],["06-12",340.0],["06-13",335.0],["06-14",333.0],["06-17",333.0],["06-18",334.5],["06-19",336.0],["06-20",336.0],["06-21",330.0],["06-24",325.0],["06-25",323.0],["06-26",320.0],["06-27",320.0],["06-28",318.0],["07-01",318.0],["07-02",316.0],["07-03",321.0],["07-04",320.0],["07-05",320.0],["07-08",322.0],["07-09",322.0],["07-10",324.0],["07-11",324.0],["07-12",324.0],["07-15",318.0],["07-16",322.0],["07-17",324.0],["07-18",323.0],["07-19",325.0],["07-22",322.0],["07-23",320.0],["07-24",320.0],["07-25",325.0],["07-26",330.0],["07-29",332.0],["07-30",324.0],["07-31",322.0],["08-01",318.0],["08-02",318.0],["08-05",318.0],["08-06",320.0],["08-07",318.0],["08-08",320.0],["08-09",320.0],["08-12",324.0],["08-13",324.0],["08-14",321.0],["08-15",321.0],["08-16",319.0],["08-19",320.0],["08-20",320.0],["08-21",320.0],["08-22",319.0],["08-23",320.0],["08-27",330.0],["08-28",362.0],["08-29",345.0],["08-30",336.0],["09-02",325.0],["09-03",320.0],["09-04",324.0],["09-05",322.0],["09-06",325.0],["09-09",330.0],["09-10",334.0],["09-11",328.0],["09-12",330.0],["09-13",333.0],["09-16",334.0],["09-17",333.0],["09-18",335.0],["09-19",330.0],["09-20",333.0],["09-23",331.0],["09-24",328.0],["09-25",325.0],["09-26",322.0],["09-27",318.0],["09-30",315.0],["10-01",319.0],["10-02",319.0],["10-03",321.0],["10-04",315.0],["10-07",315.0],["10-08",313.0],["10-09",316.0],["10-10",322.0],["10-11",320.0],["10-14",319.0],["10-15",318.0],["10-16",319.0],["10-17",320.0],["10-18",319.0],["10-21",319.0],["10-22",321.0],["10-23",318.0],["10-24",310.0],["10-25",311.0],["10-28",310.0],["10-29",313.0],["10-30",313.0],["10-31",311.0],["11-01",309.0],["11-04",308.0],["11-05",312.0],["11-06",311.0],["11-07",308.0],["11-08",305.0],["11-11",297.0],["11-12",286.0],["11-13",284.0],["11-14",288.0],["11-15",290.0],["11-18",286.0],["11-19",273.0],["11-20",275.0],["11-21",275.0],["11-22",278.0],["11-25",261.0],["11-26",264.0],["11-27",266.0],["11-28",265.0],["11-29",261.0],["12-02",262.0],["12-03",262.0],["12-04",260.0],["12-05",252.0],["12-06",246.0],["12-09",249.0],["12-10",247.0],["12-11",245.0],["12-12",243.0],["12-13",242.0],["12-16",235.0],["12-17",237.0],["12-18",240.0],["12-19",243.0],["12-20",234.0],["12-23",222.0],["12-24",230.0],["12-27",235.0],["12-30",236.0],["12-31",233.0]],"Platinum":[["01-02",481.0],["01-03",480.0],["01-04",476.0],["01-07",470.0],["01-08",474.0],["01-09",475.0],["01-10",477.0],["01-11",480.0],["01-14",482.0],["01-15",473.0],["01-16",476.0],["01-17",481.0],["01-18",482.0],["01-21",477.0],["01-22",477.0],["01-23",475.0],["01-24",467.0],["01-25",465.0],["01-28",466.0],["01-29",459.0],["01-30",457.0],["01-31",457.0],["02-01",449.0],["02-04",452.0],["02-05",453.0],["02-06",464.0],["02-07",468.0],["02-08",474.0],["02-11",475.0],["02-12",468.0],["02-13",467.0],["02-14",479.0],["02-15",479.0],["02-18",469.0],["02-19",470.0],["02-20",471.0],["02-21",470.0],["02-22",475.0],["02-25",477.0],["02-26",480.0],["02-27",494.0],["02-28",493.0],["03-01",486.0],["03-04",512.0],["03-05",507.0],["03-06",508.0],["03-07",508.0],["03-08",520.0],["03-11",526.0],["03-12",519.0],["03-13",517.0],["03-14",508.0],["03-15",510.0],["03-18",512.0],["03-19",520.0],["03-20",514.0],["03-21",512.0],["03-22",512.0],["03-25",515.0],["03-26",511.0],["03-27",516.0],["03-28",514.0],["04-02",537.0],["04-03",534.0],["04-04",525.0],["04-05",532.0],["04-08",530.0],["04-09",526.0],["04-10",526.0],["04-11",532.5],["04-12",536.0],["04-15",543.0],["04-16",537.0],["04-17",542.0],["04-18",558.0],["04-19",558.0],["04-22",557.0],["04-23",552.0],["04-24",553.0],["04-25",554.0],["04-26",553.0],["04-29",548.0],["04-30",537.0],["05-01",523.0],["05-02",519.0],["05-03",524.0],["05-07",522.0],["05-08",525.0],["05-09",528.0],["05-10",522.0],["05-13",525.0],["05-14",532.0],["05-15",537.0],["05-16",539.0],["05-17",538.0],["05-20",542.0],["05-21",546.0],["05-22",541.0],["05-23",539.0],["05-24",541.0],["05-27",538.0],["05-28",540.0],["05-29",547.0],["05-30",547.0],["05-31",548.0],["06-05",552.0],["06-06",549.0],["06-07",564.0],["06-10",558.0],["06-11",557.0],["06-12",558.0],["06-13",555.0],["06-14",556.0],["06-17",560.0],["06-18",562.0],["06-19",565.0],["06-20",565.0],["06-21",567.0],["06-24",563.0],["06-25",560.0],["06-26",551.0],["06-27",541.0],["06-28",547.0],["07-01",532.0],["07-02",530.0],["07-03",531.0],["07-04",523.5],["07-05",520.0],["07-08",524.0],["07-09",519.0],["07-10",524.0],["07-11",526.0],["07-12",529.0],["07-15",529.0],["07-16",531.0],["07-17",526.0],["07-18",525.0],["07-19",528.0],["07-22",526.0],["07-23",522.0],["07-24",520.0],["07-25",524.0],["07-26",529.0],["07-29",528.0],["07-30",527.0],["07-31",530.0],["08-01",522.0],["08-02",526.0],["08-05",525.0],["08-06",527.0],["08-07",526.0],["08-08",535.0],["08-09",538.0],["08-12",553.0],["08-13",552.0],["08-14",558.0],["08-15",558.0],["08-16",552.0],["08-19",555.0],["08-20",547.0],["08-21",543.0],["08-22",541.0],["08-23",541.0],["08-27",553.0],["08-28",574.0],["08-29",559.0],["08-30",568.0],["09-02",563.0],["09-03",552.0],["09-04",545.0],["09-05",540.0],["09-06",543.0],["09-09",549.0],["09-10",549.0],["09-11",551.5],["09-12",549.0],["09-13",552.0],["09-16",554.0],["09-17",547.0],["09-18",552.0],["09-19",559.75],["09-20",570.0],["09-23",565.0],["09-24",568.0],["09-25",564.0],["09-26",564.0],["09-27",560.5],["09-30",563.5],["10-01",567.0],["10-02",569.0],["10-03",565.0],["10-04",560.0],["10-07",558.0],["10-08",562.0],["10-09",577.0],["10-10",585.0],["10-11",593.0],["10-14",589.0],["10-15",586.0],["10-16",589.0],["10-17",598.0],["10-18",590.0],["10-21",588.5],["10-22",584.0],["10-23",580.0],["10-24",582.0],["10-25",586.0],["10-28",590.0],["10-29",590.0],["10-30",590.0],["10-31",583.0],["11-01",578.0],["11-04",580.0],["11-05",581.0],["11-06",586.0],["11-07",585.0],["11-08",588.0],["11-11",583.0],["11-12",580.0],["11-13",591.5],["11-14",587.0],["11-15",602.0],["11-18",601.0],["11-19",599.0],["11-20",593.0],["11-21",590.0],["11-22",594.0],["11-25",591.0],["11-26",587.0],["11-27",587.0],["11-28",585.0],["11-29",589.0],["12-02",592.0],["12-03",590.0],["12-04",592.0],["12-05",596.0],["12-06",597.0],["12-09",602.0],["12-10",599.0],["12-11",595.0],["12-12",594.0],["12-13",604.0],["12-16",603.0],["12-17",607.0],["12-18",598.0],["12-19",601.0],["12-20",593.0],["12-23",594.0],["12-24",585.0],["12-27",594.0],["12-30",598.0],["12-31",598.0]],"Silver":[["01-02",4.59],["01-03",4.63],["01-04",4.68],["01-07",4.71],["01-08",4.77],["01-09",4.75],["01-10",4.84],["01-11",4.76],["01-14",4.67],["01-15",4.55],["01-16",4.67],["01-17",4.57],["01-18",4.41],["01-21",4.36],["01-22",4.34],["01-23",4.3],["01-24",4.29],["01-25",4.33],["01-28",4.29],["01-29",4.24],["01-30",4.29],["01-31",4.28],["02-01",4.25],["02-04",4.3],["02-05",4.3],["02-06",4.47],["02-07",4.37],["02-08",4.38],["02-11",4.4],["02-12",4.39],["02-13",4.44],["02-14",4.51],["02-15",4.58],["02-18",4.54],["02-19",4.51],["02-20",4.5],["02-21",4.41],["02-22",4.45],["02-25",4.39],["02-26",4.38],["02-27",4.45],["02-28",4.43],["03-01",4.5],["03-04",4.6],["03-05",4.57],["03-06",4.53],["03-07",4.48],["03-08",4.49],["03-11",4.53],["03-12",4.49],["03-13",4.5],["03-14",4.54],["03-15",4.49],["03-18",4.49],["03-19",4.51],["03-20",4.51],["03-21",4.51],["03-22",4.5],["03-25",4.54],["03-26",4.56],["03-27",4.64],["03-28",4.67],["04-02",4.67],["04-03",4.7],["04-04",4.61],["04-05",4.62],["04-08",4.56],["04-09",4.57],["04-10",4.55],["04-11",4.62],["04-12",4.57],["04-15",4.58],["04-16",4.46],["04-17",4.45],["04-18",4.46],["04-19",4.5],["04-22",4.54],["04-23",4.53],["04-24",4.58],["04-25",4.59],["04-26",4.62],["04-29",4.63],["04-30",4.6],["05-01",4.54],["05-02",4.52],["05-03",4.57],["05-07",4.62],["05-08",4.62],["05-09",4.56],["05-10",4.62],["05-13",4.69],["05-14",4.62],["05-15",4.6],["05-16",4.63],["05-17",4.64],["05-20",4.66],["05-21",4.79],["05-22",4.82],["05-23",4.78],["05-24",4.86],["05-27",4.77],["05-28",4.82],["05-29",4.91],["05-30",4.91],["05-31",5.04],["06-05",5.05],["06-06",4.93],["06-07",5.01],["06-10",4.94],["06-11",4.89],["06-12",4.88],["06-13",4.87],["06-14",4.89],["06-17",4.82],["06-18",4.84],["06-19",4.89],["06-20",4.86],["06-21",4.88],["06-24",4.91],["06-25",4.85],["06-26",4.88],["06-27",4.82],["06-28",4.87],["07-01",4.8],["07-02",4.87],["07-03",4.92],["07-04",4.91],["07-05",4.91],["07-08",4.94],["07-09",4.96],["07-10",5.04],["07-11",5.02],["07-12",5.06],["07-15",5.04],["07-16",5.1],["07-17",5.0],["07-18",5.0],["07-19",5.01],["07-22",5.05],["07-23",4.99],["07-24",4.86],["07-25",4.86],["07-26",4.83],["07-29",4.65],["07-30",4.66],["07-31",4.66],["08-01",4.54],["08-02",4.62],["08-05",4.62],["08-06",4.61],["08-07",4.64],["08-08",4.68],["08-09",4.63],["08-12",4.71],["08-13",4.6],["08-14",4.63],["08-15",4.49],["08-16",4.5],["08-19",4.5],["08-20",4.43],["08-21",4.44],["08-22",4.42],["08-23",4.44],["08-27",4.44],["08-28",4.5],["08-29",4.5],["08-30",4.57],["09-02",4.47],["09-03",4.49],["09-04",4.46],["09-05",4.5],["09-06",4.53],["09-09",4.54],["09-10",4.54],["09-11",4.53],["09-12",4.55],["09-13",4.59],["09-16",4.54],["09-17",4.55],["09-18",4.58],["09-19",4.65],["09-20",4.62],["09-23",4.64],["09-24",4.62],["09-25",4.62],["09-26",4.55],["09-27",4.51],["09-30",4.53],["10-01",4.52],["10-02",4.49],["10-03",4.49],["10-04",4.47],["10-07",4.49],["10-08",4.44],["10-09",4.36],["10-10",4.34],["10-11",4.29],["10-14",4.33],["10-15",4.3],["10-16",4.32],["10-17",4.36],["10-18",4.34],["10-21",4.38],["10-22",4.38],["10-23",4.41],["10-24",4.39],["10-25",4.38],["10-28",4.42],["10-29",4.43],["10-30",4.48],["10-31",4.47],["11-01",4.54],["11-04",4.45],["11-05",4.5],["11-06",4.47],["11-07",4.5],["11-08",4.59],["11-11",4.53],["11-12",4.57],["11-13",4.57],["11-14",4.55],["11-15",4.55],["11-18",4.54],["11-19",4.55],["11-20",4.54],["11-21",4.54],["11-22",4.46],["11-25",4.5],["11-26",4.47],["11-27",4.44],["11-28",4.43],["11-29",4.43],["12-02",4.43],["12-03",4.44],["12-04",4.57],["12-05",4.62],["12-06",4.65],["12-09",4.62],["12-10",4.58],["12-11",4.62],["12-12",4.65],["12-13",4.74],["12-16",4.7],["12-17",4.72],["12-18",4.62],["12-19",4.72],["12-20",4.67],["12-23",4.62],["12-24",4.62],["12-27",4.67],["12-30",4.72],["12-31",4.67]]},"2003":{"Gold":[["01-02",342.2],["01-03",344.0],["01-06",356.1],["01-07",348.7],["01-08",346.75],["01-09",354.6],["01-10",353.15],["01-13",352.35],["01-14",353.75],["01-15",351.9],["01-16",350.85],["01-17",358.2],["01-20",355.8],["01-21",355.55],["01-22",359.25],["01-23",363.3],["01-24",364.1],["01-27",370.8],["01-28",366.45],["01-29",369.85],["01-30",363.0],["01-31",370.35],["02-03",369.0],["02-04",374.85],["02-05",385.0],["02-06",372.5],["02-07",370.55],["02-10",371.75],["02-11",362.15],["02-12",363.15],["02-13",354.25],["02-14",356.25],["02-17",346.55],["02-18",347.0],["02-19",347.2],["02-20",351.1],["02-21",354.0],["02-24",352.9],["02-25",359.1],["02-26",352.55],["02-27",354.0],["02-28",347.65],["03-03",348.45],["03-04",352.4],["03-05",354.5],["03-06",353.25],["03-07",356.6],["03-10",353.1],["03-11",353.15],["03-12",349.0],["03-13",342.9],["03-14",335.5],["03-17",340.5],["03-18",334.9],["03-19",339.0],["03-20",335.5],["03-21",332.55],["03-24",330.15],["03-25",333.0],["03-26",329.6],["03-27",333.15],["03-28",330.3],["03-31",335.35],["04-01",335.65],["04-02",330.25],["04-03",324.7],["04-04",323.2],["04-07",319.75],["04-08",322.3],["04-09",324.1],["04-10",325.1],["04-11",325.05],["04-14",325.6],["04-15",323.7],["04-16",323.85],["04-17",326.1],["04-22",333.25],["04-23",333.8],["04-24",332.0],["04-25",333.4],["04-28",333.75],["04-29",332.6],["04-30",336.0],["05-01",338.95],["05-02",341.25],["05-06",342.65],["05-07",343.0],["05-08",341.4],["05-09",348.7],["05-12",350.35],["05-13",350.75],["05-14",348.9],["05-15",353.85],["05-16",352.55],["05-19",359.75],["05-20",368.0],["05-21",364.9],["05-22",369.6],["05-23",369.7],["05-27",372.35],["05-28",364.55],["05-29",361.1],["05-30",365.8],["06-02",361.3],["06-03",365.3],["06-04",365.3],["06-05",362.6],["06-06",367.35],["06-09",362.8],["06-10",359.4],["06-11",354.15],["06-12",354.2],["06-13",353.95],["06-16",359.0],["06-17",359.75],["06-18",361.25],["06-19",356.45],["06-20",359.6],["06-23",356.05],["06-24",354.35],["06-25",347.85],["06-26",345.85],["06-27",343.5],["06-30",345.15],["07-01",348.55],["07-02",351.2],["07-03",349.6],["07-04",351.1],["07-07",350.25],["07-08",345.3],["07-09",345.45],["07-10",343.4],["07-11",344.2],["07-14",344.5],["07-15",348.5],["07-16",343.0],["07-17",344.6],["07-18",344.0],["07-21",347.8],["07-22",352.25],["07-23",352.2],["07-24",359.8],["07-25",361.1],["07-28",361.95],["07-29",364.0],["07-30",359.1],["07-31",355.75],["08-01",353.05],["08-04",348.95],["08-05",349.5],["08-06",352.65],["08-07",350.15],["08-08",353.5],["08-11",357.0],["08-12",360.0],["08-13",356.0],["08-14",362.25],["08-15",363.3],["08-18",361.3],["08-19",358.3],["08-20",362.2],["08-21",364.0],["08-22",360.75],["08-26",360.75],["08-27",364.3],["08-28",370.9],["08-29",371.0],["09-01",376.35],["09-02",375.5],["09-03",372.2],["09-04",373.0],["09-05",371.0],["09-08",376.4],["09-09",378.2],["09-10",381.15],["09-11",379.05],["09-12",377.5],["09-15",375.3],["09-16",374.9],["09-17",372.9],["09-18",376.95],["09-19",376.3],["09-22",386.2],["09-23",386.45],["09-24",385.25],["09-25",391.85],["09-26",384.1],["09-29",379.85],["09-30",384.5],["10-01",385.0],["10-02",385.15],["10-03",383.95],["10-06",372.75],["10-07",376.2],["10-08",376.6],["10-09",376.45],["10-10",370.35],["10-13",370.8],["10-14",373.65],["10-15",374.5],["10-16",371.2],["10-17",371.8],["10-20",371.45],["10-21",374.8],["10-22",381.55],["10-23",386.75],["10-24",384.6],["10-27",386.75],["10-28",386.55],["10-29",382.7],["10-30",391.0],["10-31",384.6],["11-03",383.25],["11-04",378.3],["11-05",382.15],["11-06",381.9],["11-07",381.0],["11-10",382.85],["11-11",386.4],["11-12",388.05],["11-13",395.5],["11-14",395.35],["11-17",398.0],["11-18",392.4],["11-19",397.15],["11-20",395.75],["11-21",393.85],["11-24",394.25],["11-25",391.5],["11-26",392.0],["11-27",396.25],["11-28",398.1],["12-01",398.75],["12-02",401.05],["12-03",403.3],["12-04",402.4],["12-05",402.0],["12-08",408.75],["12-09",408.25],["12-10",407.3],["12-11",404.0],["12-12",406.6],["12-15",404.5],["12-16",409.7],["12-17",407.5],["12-18",410.75],["12-19",408.75],["12-22",410.8],["12-23",409.6],["12-24",410.8],["12-29",413.5],["12-30",415.6],["12-31",417.25]],"Palladium":[["01-02",234.0],["01-03",238.0],["01-06",239.0],["01-07",240.0],["01-08",240.0],["01-09",257.0],["01-10",263.0],["01-13",266.0],["01-14",242.0],["01-15",247.0],["01-16",245.0],["01-17",254.0],["01-20",260.0],["01-21",265.0],["01-22",271.0],["01-23",262.0],["01-24",266.0],["01-27",264.0],["01-28",263.0],["01-29",263.0],["01-30",265.0],["01-31",256.0],["02-03",261.0],["02-04",266.0],["02-05",264.0],["02-06",260.0],["02-07",252.0],["02-10",250.0],["02-11",248.0],["02-12",250.0],["02-13",255.0],["02-14",256.0],["02-17",252.0],["02-18",254.0],["02-19",252.0],["02-20",252.0],["02-21",253.0],["02-24",251.0],["02-25",251.0],["02-26",251.0],["02-27",243.0],["02-28",244.0],["03-03",242.0],["03-04",238.0],["03-05",238.0],["03-06",238.0],["03-07",239.0],["03-10",240.0],["03-11",242.0],["03-12",242.0],["03-13",237.0],["03-14",230.0],["03-17",234.0],["03-18",233.0],["03-19",233.0],["03-20",233.0],["03-21",228.0],["03-24",224.0],["03-25",206.0],["03-26",198.0],["03-27",192.0],["03-28",193.0],["03-31",183.0],["04-01",180.0],["04-02",180.0],["04-03",178.0],["04-04",175.0],["04-07",176.0],["04-08",168.0],["04-09",172.0],["04-10",172.0],["04-11",171.0],["04-14",161.0],["04-15",162.0],["04-16",155.0],["04-17",144.0],["04-22",157.0],["04-23",161.0],["04-24",155.0],["04-25",150.0],["04-28",146.0],["04-29",147.0],["04-30",152.0],["05-01",156.0],["05-02",154.0],["05-06",154.0],["05-07",159.0],["05-08",164.0],["05-09",159.0],["05-12",152.0],["05-13",163.0],["05-14",157.0],["05-15",157.0],["05-16",158.0],["05-19",162.0],["05-20",168.0],["05-21",177.0],["05-22",170.0],["05-23",177.0],["05-27",206.0],["05-28",190.0],["05-29",181.0],["05-30",183.0],["06-02",181.0],["06-03",190.0],["06-04",188.0],["06-05",187.0],["06-06",181.0],["06-09",176.0],["06-10",174.0],["06-11",175.0],["06-12",174.0],["06-13",184.0],["06-16",186.0],["06-17",183.0],["06-18",173.0],["06-19",174.5],["06-20",176.0],["06-23",178.0],["06-24",179.0],["06-25",178.0],["06-26",179.0],["06-27",178.0],["06-30",175.0],["07-01",180.0],["07-02",183.0],["07-03",183.0],["07-04",185.0],["07-07",184.0],["07-08",176.0],["07-09",172.0],["07-10",172.0],["07-11",175.0],["07-14",174.0],["07-15",175.0],["07-16",171.0],["07-17",170.0],["07-18",165.0],["07-21",170.0],["07-22",165.0],["07-23",160.0],["07-24",167.0],["07-25",167.0],["07-28",172.0],["07-29",171.0],["07-30",174.0],["07-31",175.0],["08-01",180.0],["08-04",180.0],["08-05",177.0],["08-06",174.0],["08-07",177.0],["08-08",176.0],["08-11",174.0],["08-12",175.0],["08-13",172.0],["08-14",172.0],["08-15",174.0],["08-18",178.0],["08-19",176.0],["08-20",181.0],["08-21",186.0],["08-22",185.0],["08-26",199.0],["08-27",200.0],["08-28",200.0],["08-29",196.0],["09-01",200.0],["09-02",199.0],["09-03",192.0],["09-04",200.0],["09-05",211.0],["09-08",217.0],["09-09",225.0],["09-10",223.0],["09-11",217.0],["09-12",214.0],["09-15",200.0],["09-16",211.0],["09-17",212.0],["09-18",212.0],["09-19",218.0],["09-22",215.0],["09-23",210.0],["09-24",218.0],["09-25",218.0],["09-26",209.0],["09-29",208.0],["09-30",210.0],["10-01",212.0],["10-02",214.0],["10-03",208.0],["10-06",208.0],["10-07",206.0],["10-08",205.0],["10-09",209.0],["10-10",207.0],["10-13",206.0],["10-14",204.0],["10-15",198.0],["10-16",190.5],["10-17",194.0],["10-20",194.0],["10-21",194.0],["10-22",197.0],["10-23",198.0],["10-24",196.0],["10-27",195.0],["10-28",197.0],["10-29",199.0],["10-30",203.0],["10-31",202.5],["11-03",203.0],["11-04",205.5],["11-05",206.0],["11-06",207.0],["11-07",204.0],["11-10",202.0],["11-11",199.0],["11-12",196.0],["11-13",197.5],["11-14",199.0],["11-17",195.0],["11-18",196.0],["11-19",194.0],["11-20",194.0],["11-21",194.0],["11-24",192.0],["11-25",191.0],["11-26",188.0],["11-27",188.0],["11-28",190.0],["12-01",189.0],["12-02",189.0],["12-03",190.0],["12-04",192.0],["12-05",196.0],["12-08",198.0],["12-09",206.0],["12-10",203.0],["12-11",209.0],["12-12",206.0],["12-15",205.0],["12-16",202.5],["12-17",198.0],["12-18",202.0],["12-19",193.0],["12-22",193.0],["12-23",199.5],["12-24",200.0],["12-29",197.0],["12-30",195.0],["12-31",193.0]],"Platinum":[["01-02",600.0],["01-03",606.0],["01-06",607.0],["01-07",606.0],["01-08",607.5],["01-09",624.0],["01-10",618.0],["01-13",619.0],["01-14",617.0],["01-15",619.0],["01-16",619.0],["01-17",623.0],["01-20",630.0],["01-21",632.0],["01-22",648.0],["01-23",648.0],["01-24",650.0],["01-27",646.0],["01-28",642.0],["01-29",649.0],["01-30",671.0],["01-31",669.0],["02-03",690.0],["02-04",703.0],["02-05",689.0],["02-06",676.0],["02-07",690.0],["02-10",685.0],["02-11",677.0],["02-12",692.0],["02-13",689.0],["02-14",693.0],["02-17",684.0],["02-18",684.0],["02-19",672.0],["02-20",670.0],["02-21",664.0],["02-24",670.0],["02-25",681.0],["02-26",677.0],["02-27",682.0],["02-28",680.0],["03-03",683.0],["03-04",686.0],["03-05",699.0],["03-06",695.0],["03-07",691.0],["03-10",696.0],["03-11",705.0],["03-12",700.0],["03-13",700.0],["03-14",688.0],["03-17",694.0],["03-18",686.0],["03-19",680.0],["03-20",670.0],["03-21",662.0],["03-24",660.0],["03-25",655.0],["03-26",644.0],["03-27",643.0],["03-28",625.0],["03-31",645.0],["04-01",642.0],["04-02",640.0],["04-03",624.0],["04-04",616.0],["04-07",615.0],["04-08",611.0],["04-09",625.0],["04-10",625.0],["04-11",623.0],["04-14",623.0],["04-15",625.0],["04-16",624.0],["04-17",628.0],["04-22",636.0],["04-23",638.0],["04-24",638.0],["04-25",635.0],["04-28",626.0],["04-29",606.0],["04-30",606.0],["05-01",606.0],["05-02",607.0],["05-06",612.0],["05-07",628.0],["05-08",630.0],["05-09",640.0],["05-12",644.0],["05-13",662.0],["05-14",662.0],["05-15",662.0],["05-16",663.0],["05-19",654.0],["05-20",664.0],["05-21",680.0],["05-22",671.0],["05-23",669.0],["05-27",682.0],["05-28",671.0],["05-29",648.0],["05-30",643.0],["06-02",638.0],["06-03",652.0],["06-04",669.0],["06-05",669.0],["06-06",660.0],["06-09",659.0],["06-10",663.0],["06-11",655.0],["06-12",649.5],["06-13",661.0],["06-16",670.0],["06-17",668.0],["06-18",662.0],["06-19",665.0],["06-20",674.0],["06-23",668.0],["06-24",665.0],["06-25",670.0],["06-26",662.0],["06-27",664.0],["06-30",665.0],["07-01",671.0],["07-02",673.0],["07-03",673.0],["07-04",676.0],["07-07",674.0],["07-08",665.0],["07-09",665.0],["07-10",673.0],["07-11",675.0],["07-14",677.0],["07-15",687.0],["07-16",685.0],["07-17",685.0],["07-18",684.5],["07-21",685.0],["07-22",692.0],["07-23",690.0],["07-24",695.0],["07-25",691.0],["07-28",694.0],["07-29",700.0],["07-30",693.0],["07-31",687.0],["08-01",677.0],["08-04",677.0],["08-05",683.0],["08-06",684.0],["08-07",682.0],["08-08",680.0],["08-11",690.0],["08-12",698.0],["08-13",688.0],["08-14",694.0],["08-15",697.0],["08-18",698.0],["08-19",696.0],["08-20",704.0],["08-21",703.0],["08-22",702.0],["08-26",691.0],["08-27",696.0],["08-28",709.0],["08-29",707.0],["09-01",707.0],["09-02",714.0],["09-03",712.0],["09-04",713.0],["09-05",710.0],["09-08",710.0],["09-09",709.0],["09-10",703.0],["09-11",697.5],["09-12",701.0],["09-15",701.0],["09-16",696.0],["09-17",696.0],["09-18",702.0],["09-19",699.5],["09-22",705.0],["09-23",704.0],["09-24",705.0],["09-25",710.0],["09-26",708.0],["09-29",702.0],["09-30",708.0],["10-01",712.0],["10-02",712.5],["10-03",718.0],["10-06",713.0],["10-07",722.0],["10-08",730.0],["10-09",732.0],["10-10",729.0],["10-13",728.0],["10-14",730.0],["10-15",726.0],["10-16",725.0],["10-17",727.0],["10-20",732.0],["10-21",738.0],["10-22",737.0],["10-23",740.0],["10-24",740.0],["10-27",743.0],["10-28",747.0],["10-29",750.0],["10-30",759.0],["10-31",752.0],["11-03",738.0],["11-04",742.0],["11-05",755.0],["11-06",758.0],["11-07",755.0],["11-10",759.0],["11-11",760.0],["11-12",760.0],["11-13",769.0],["11-14",771.5],["11-17",765.0],["11-18",762.0],["11-19",769.0],["11-20",765.0],["11-21",765.0],["11-24",762.0],["11-25",758.0],["11-26",763.0],["11-27",766.0],["11-28",765.0],["12-01",770.0],["12-02",778.0],["12-03",779.0],["12-04",796.0],["12-05",787.0],["12-08",799.0],["12-09",799.0],["12-10",802.0],["12-11",810.0],["12-12",820.0],["12-15",829.0],["12-16",826.0],["12-17",838.0],["12-18",842.0],["12-19",826.0],["12-22",814.0],["12-23",805.0],["12-24",812.0],["12-29",820.0],["12-30",812.0],["12-31",814.0]],"Silver":[["01-02",4.74],["01-03",4.79],["01-06",4.91],["01-07",4.84],["01-08",4.78],["01-09",4.83],["01-10",4.84],["01-13",4.82],["01-14",4.81],["01-15",4.73],["01-16",4.77],["01-17",4.81],["01-20",4.79],["01-21",4.76],["01-22",4.83],["01-23",4.85],["01-24",4.78],["01-27",4.91],["01-28",4.8],["01-29",4.85],["01-30",4.79],["01-31",4.87],["02-03",4.84],["02-04",4.85],["02-05",4.93],["02-06",4.78],["02-07",4.71],["02-10",4.65],["02-11",4.57],["02-12",4.57],["02-13",4.52],["02-14",4.53],["02-17",4.49],["02-18",4.51],["02-19",4.58],["02-20",4.64],["02-21",4.64],["02-24",4.67],["02-25",4.7],["02-26",4.62],["02-27",4.65],["02-28",4.59],["03-03",4.61],["03-04",4.68],["03-05",4.66],["03-06",4.63],["03-07",4.67],["03-10",4.67],["03-11",4.66],["03-12",4.67],["03-13",4.58],["03-14",4.54],["03-17",4.57],["03-18",4.47],["03-19",4.48],["03-20",4.41],["03-21",4.4],["03-24",4.38],["03-25",4.39],["03-26",4.38],["03-27",4.41],["03-28",4.38],["03-31",4.46],["04-01",4.44],["04-02",4.39],["04-03",4.37],["04-04",4.39],["04-07",4.38],["04-08",4.42],["04-09",4.47],["04-10",4.47],["04-11",4.46],["04-14",4.48],["04-15",4.51],["04-16",4.49],["04-17",4.48],["04-22",4.54],["04-23",4.57],["04-24",4.61],["04-25",4.62],["04-28",4.62],["04-29",4.55],["04-30",4.61],["05-01",4.66],["05-02",4.75],["05-06",4.79],["05-07",4.76],["05-08",4.72],["05-09",4.78],["05-12",4.79],["05-13",4.83],["05-14",4.82],["05-15",4.87],["05-16",4.79],["05-19",4.83],["05-20",4.84],["05-21",4.74],["05-22",4.71],["05-23",4.67],["05-27",4.68],["05-28",4.59],["05-29",4.61],["05-30",4.56],["06-02",4.5],["06-03",4.51],["06-04",4.52],["06-05",4.48],["06-06",4.53],["06-09",4.52],["06-10",4.51],["06-11",4.48],["06-12",4.5],["06-13",4.51],["06-16",4.59],["06-17",4.62],["06-18",4.57],["06-19",4.52],["06-20",4.55],["06-23",4.53],["06-24",4.54],["06-25",4.5],["06-26",4.53],["06-27",4.53],["06-30",4.5],["07-01",4.55],["07-02",4.58],["07-03",4.62],["07-04",4.66],["07-07",4.66],["07-08",4.69],["07-09",4.74],["07-10",4.83],["07-11",4.75],["07-14",4.79],["07-15",4.78],["07-16",4.67],["07-17",4.68],["07-18",4.66],["07-21",4.73],["07-22",4.75],["07-23",4.83],["07-24",5.06],["07-25",5.01],["07-28",5.08],["07-29",5.02],["07-30",5.1],["07-31",5.08],["08-01",5.12],["08-04",5.04],["08-05",4.98],["08-06",4.93],["08-07",4.93],["08-08",5.05],["08-11",4.98],["08-12",4.98],["08-13",4.87],["08-14",5.04],["08-15",5.01],["08-18",4.92],["08-19",4.92],["08-20",5.0],["08-21",4.99],["08-22",4.93],["08-26",4.95],["08-27",5.0],["08-28",5.09],["08-29",5.11],["09-01",5.16],["09-02",5.11],["09-03",4.97],["09-04",5.01],["09-05",5.0],["09-08",5.09],["09-09",5.13],["09-10",5.21],["09-11",5.22],["09-12",5.32],["09-15",5.16],["09-16",5.17],["09-17",5.16],["09-18",5.3],["09-19",5.2],["09-22",5.31],["09-23",5.25],["09-24",5.22],["09-25",5.32],["09-26",5.19],["09-29",5.12],["09-30",5.12],["10-01",5.12],["10-02",5.08],["10-03",5.08],["10-06",4.83],["10-07",4.84],["10-08",4.89],["10-09",4.82],["10-10",4.86],["10-13",4.88],["10-14",4.94],["10-15",4.91],["10-16",4.91],["10-17",4.92],["10-20",4.92],["10-21",5.0],["10-22",5.08],["10-23",5.14],["10-24",5.15],["10-27",5.12],["10-28",5.15],["10-29",5.09],["10-30",5.18],["10-31",5.13],["11-03",5.06],["11-04",4.93],["11-05",5.01],["11-06",4.96],["11-07",4.96],["11-10",5.03],["11-11",5.06],["11-12",5.08],["11-13",5.32],["11-14",5.3],["11-17",5.38],["11-18",5.21],["11-19",5.32],["11-20",5.26],["11-21",5.24],["11-24",5.24],["11-25",5.21],["11-26",5.3],["11-27",5.34],["11-28",5.35],["12-01",5.36],["12-02",5.46],["12-03",5.47],["12-04",5.44],["12-05",5.42],["12-08",5.5],["12-09",5.54],["12-10",5.61],["12-11",5.54],["12-12",5.62],["12-15",5.55],["12-16",5.66],["12-17",5.63],["12-18",5.7],["12-19",5.67],["12-22",5.72],["12-23",5.68],["12-24",5.72],["12-29",5.86],["12-30",5.91],["12-31",5.96]]},"2004":{"Gold":[["01-02",415.2],["01-05",417.75],["01-06",428.0],["01-07",420.65],["01-08",418.1],["01-09",422.8],["01-12",428.2],["01-13",424.5],["01-14",421.0],["01-15",415.5],["01-16",410.3],["01-19",407.1],["01-20",408.3],["01-21",411.25],["01-22",412.0],["01-23",411.4],["01-26",406.2],["01-27",404.0],["01-28",410.7],["01-29",410.15],["01-30",401.3],["02-02",401.85],["02-03",401.75],["02-04",399.6],["02-05",399.3],["02-06",396.4],["02-09",406.7],["02-10",408.35],["02-11",406.4],["02-12",411.4],["02-13",412.1],["02-16",410.7],["02-17",413.7],["02-18",415.9],["02-19",410.2],["02-20",408.25],["02-23",399.85],["02-24",401.45],["02-25",403.4],["02-26",395.05],["02-27",392.25],["03-01",398.5],["03-02",398.6],["03-03",390.35],["03-04",394.15],["03-05",393.5],["03-08",399.4],["03-09",401.2],["03-10",400.8],["03-11",397.4],["03-12",400.75],["03-15",399.0],["03-16",399.6],["03-17",402.0],["03-18",407.15],["03-19",411.0],["03-22",414.1],["03-23",415.2],["03-24",417.6],["03-25",416.6],["03-26",417.5],["03-29",420.9],["03-30",419.15],["03-31",423.0],["04-01",425.3],["04-02",426.1],["04-05",420.55],["04-06",416.95],["04-07",419.25],["04-08",422.0],["04-13",417.45],["04-14",405.75],["04-15",398.0],["04-16",399.75],["04-19",405.3],["04-20",398.8],["04-21",393.75],["04-22",391.35],["04-23",396.25],["04-26",396.5],["04-27",397.15],["04-28",396.75],["04-29",382.75],["04-30",387.3],["05-04",389.75],["05-05",394.3],["05-06",392.0],["05-07",386.85],["05-10",374.1],["05-11",378.0],["05-12",381.15],["05-13",375.5],["05-14",373.5],["05-17",380.8],["05-18",379.0],["05-19",380.2],["05-20",380.45],["05-21",382.25],["05-24",383.85],["05-25",387.6],["05-26",390.5],["05-27",391.45],["05-28",393.85],["06-01",395.85],["06-02",395.85],["06-03",391.4],["06-04",388.1],["06-07",393.45],["06-08",394.95],["06-09",389.3],["06-10",384.25],["06-11",384.55],["06-14",382.9],["06-15",382.3],["06-16",387.75],["06-17",386.0],["06-18",388.7],["06-21",393.85],["06-22",394.6],["06-23",395.25],["06-24",396.75],["06-25",401.15],["06-28",401.7],["06-29",396.75],["06-30",393.75],["07-01",394.5],["07-02",394.7],["07-05",398.4],["07-06",398.4],["07-07",397.35],["07-08",402.2],["07-09",406.6],["07-12",408.55],["07-13",404.25],["07-14",403.3],["07-15",403.9],["07-16",403.7],["07-19",406.95],["07-20",405.5],["07-21",401.1],["07-22",395.0],["07-23",392.85],["07-26",391.65],["07-27",392.25],["07-28",386.2],["07-29",388.75],["07-30",389.6],["08-02",393.25],["08-03",390.6],["08-04",392.7],["08-05",391.8],["08-06",392.25],["08-09",398.6],["08-10",399.05],["08-11",396.25],["08-12",396.25],["08-13",392.75],["08-16",399.3],["08-17",401.45],["08-18",403.2],["08-19",406.3],["08-20",405.8],["08-23",409.95],["08-24",406.9],["08-25",405.5],["08-26",405.95],["08-27",406.85],["08-31",408.1],["09-01",408.0],["09-02",407.8],["09-03",405.8],["09-06",401.6],["09-07",401.8],["09-08",398.1],["09-09",399.25],["09-10",400.65],["09-13",400.75],["09-14",403.5],["09-15",404.8],["09-16",404.4],["09-17",404.6],["09-20",404.15],["09-21",405.45],["09-22",407.5],["09-23",408.05],["09-24",409.45],["09-27",409.0],["09-28",410.3],["09-29",411.55],["09-30",412.35],["10-01",418.15],["10-04",416.85],["10-05",414.25],["10-06",417.95],["10-07",417.9],["10-08",418.05],["10-11",421.75],["10-12",418.2],["10-13",412.45],["10-14",414.65],["10-15",417.8],["10-18",418.5],["10-19",416.25],["10-20",421.7],["10-21",425.5],["10-22",422.4],["10-25",429.0],["10-26",427.15],["10-27",425.85],["10-28",423.85],["10-29",426.2],["11-01",428.1],["11-02",425.1],["11-03",422.2],["11-04",426.3],["11-05",428.75],["11-08",432.95],["11-09",432.3],["11-10",435.1],["11-11",433.35],["11-12",436.9],["11-15",439.5],["11-16",437.95],["11-17",444.5],["11-18",444.3],["11-19",443.7],["11-22",447.0],["11-23",447.0],["11-24",448.65],["11-25",451.7],["11-26",451.55],["11-29",450.4],["11-30",452.0],["12-01",451.1],["12-02",454.35],["12-03",449.15],["12-06",455.75],["12-07",453.75],["12-08",445.75],["12-09",437.35],["12-10",433.9],["12-13",436.95],["12-14",438.6],["12-15",437.8],["12-16",441.25],["12-17",439.2],["12-20",441.75],["12-21",441.85],["12-22",442.7],["12-23",442.4],["12-24",442.2],["12-29",443.5],["12-30",435.15],["12-31",438.0]],"Palladium":[["01-02",194.0],["01-05",196.0],["01-06",200.0],["01-07",198.0],["01-08",199.0],["01-09",199.0],["01-12",205.5],["01-13",215.0],["01-14",210.0],["01-15",211.0],["01-16",211.0],["01-19",213.0],["01-20",213.0],["01-21",223.5],["01-22",236.5],["01-23",246.0],["01-26",233.0],["01-27",223.0],["01-28",235.0],["01-29",239.0],["01-30",227.0],["02-02",229.5],["02-03",228.0],["02-04",230.0],["02-05",237.0],["02-06",234.0],["02-09",235.0],["02-10",235.5],["02-11",236.0],["02-12",239.5],["02-13",240.0],["02-16",240.0],["02-17",239.0],["02-18",244.0],["02-19",242.5],["02-20",239.0],["02-23",223.0],["02-24",232.0],["02-25",231.0],["02-26",226.0],["02-27",232.0],["03-01",235.0],["03-02",238.0],["03-03",236.0],["03-04",237.0],["03-05",246.0],["03-08",258.0],["03-09",259.0],["03-10",259.0],["03-11",262.5],["03-12",277.0],["03-15",282.0],["03-16",280.0],["03-17",280.0],["03-18",274.0],["03-19",275.0],["03-22",281.0],["03-23",287.0],["03-24",286.0],["03-25",282.0],["03-26",284.0],["03-29",283.0],["03-30",286.0],["03-31",284.0],["04-01",286.0],["04-02",315.0],["04-05",310.0],["04-06",310.0],["04-07",320.0],["04-08",322.0],["04-13",333.0],["04-14",324.5],["04-15",308.0],["04-16",311.0],["04-19",316.0],["04-20",321.0],["04-21",302.0],["04-22",266.0],["04-23",272.0],["04-26",276.0],["04-27",278.5],["04-28",272.0],["04-29",237.0],["04-30",250.0],["05-04",262.0],["05-05",255.0],["05-06",250.0],["05-07",253.0],["05-10",231.0],["05-11",235.0],["05-12",241.0],["05-13",243.0],["05-14",238.0],["05-17",248.0],["05-18",238.0],["05-19",240.0],["05-20",240.0],["05-21",241.0],["05-24",251.0],["05-25",255.0],["05-26",252.0],["05-27",250.0],["05-28",249.7],["06-01",250.0],["06-02",252.0],["06-03",247.0],["06-04",243.5],["06-07",241.0],["06-08",241.0],["06-09",232.0],["06-10",216.0],["06-11",220.0],["06-14",216.0],["06-15",215.5],["06-16",220.0],["06-17",222.0],["06-18",225.0],["06-21",230.0],["06-22",225.0],["06-23",225.0],["06-24",225.0],["06-25",228.0],["06-28",223.0],["06-29",220.0],["06-30",220.0],["07-01",215.0],["07-02",209.0],["07-05",214.0],["07-06",217.0],["07-07",220.0],["07-08",223.0],["07-09",225.0],["07-12",226.0],["07-13",223.0],["07-14",222.5],["07-15",224.0],["07-16",224.0],["07-19",225.0],["07-20",228.0],["07-21",227.0],["07-22",225.0],["07-23",221.0],["07-26",220.0],["07-27",217.0],["07-28",216.0],["07-29",215.0],["07-30",216.0],["08-02",217.0],["08-03",217.0],["08-04",215.0],["08-05",214.0],["08-06",211.0],["08-09",214.0],["08-10",214.0],["08-11",215.0],["08-12",214.0],["08-13",213.0],["08-16",213.0],["08-17",214.0],["08-18",216.0],["08-19",221.5],["08-20",221.0],["08-23",223.0],["08-24",217.5],["08-25",215.0],["08-26",215.0],["08-27",215.0],["08-31",214.0],["09-01",214.0],["09-02",214.0],["09-03",213.0],["09-06",212.0],["09-07",211.0],["09-08",207.0],["09-09",206.0],["09-10",205.0],["09-13",206.0],["09-14",209.0],["09-15",210.5],["09-16",208.0],["09-17",209.0],["09-20",206.0],["09-21",206.0],["09-22",207.0],["09-23",209.0],["09-24",216.0],["09-27",223.0],["09-28",224.0],["09-29",216.0],["09-30",215.0],["10-01",222.0],["10-04",219.0],["10-05",215.0],["10-06",223.0],["10-07",225.0],["10-08",230.0],["10-11",230.0],["10-12",225.0],["10-13",214.0],["10-14",216.0],["10-15",218.0],["10-18",214.0],["10-19",213.0],["10-20",216.75],["10-21",216.0],["10-22",214.0],["10-25",216.0],["10-26",216.0],["10-27",214.0],["10-28",214.0],["10-29",212.0],["11-01",212.0],["11-02",211.0],["11-03",210.0],["11-04",212.0],["11-05",213.0],["11-08",214.0],["11-09",214.0],["11-10",213.0],["11-11",213.0],["11-12",213.0],["11-15",218.0],["11-16",217.0],["11-17",218.0],["11-18",219.0],["11-19",215.0],["11-22",214.0],["11-23",215.0],["11-24",215.0],["11-25",215.0],["11-26",214.0],["11-29",212.0],["11-30",210.0],["12-01",210.5],["12-02",211.0],["12-03",208.0],["12-06",205.0],["12-07",206.0],["12-08",206.0],["12-09",199.5],["12-10",193.0],["12-13",193.0],["12-14",192.0],["12-15",184.0],["12-16",185.0],["12-17",179.0],["12-20",180.0],["12-21",181.0],["12-22",181.5],["12-23",182.0],["12-24",181.0],["12-29",184.0],["12-30",184.0],["12-31",184.0]],"Platinum":[["01-02",815.0],["01-05",826.0],["01-06",850.0],["01-07",842.0],["01-08",842.0],["01-09",852.0],["01-12",854.0],["01-13",868.0],["01-14",854.0],["01-15",856.0],["01-16",849.0],["01-19",862.0],["01-20",858.0],["01-21",864.0],["01-22",862.0],["01-23",866.0],["01-26",857.0],["01-27",854.0],["01-28",858.0],["01-29",852.0],["01-30",829.0],["02-02",832.0],["02-03",824.0],["02-04",826.0],["02-05",824.0],["02-06",823.0],["02-09",841.0],["02-10",838.0],["02-11",837.0],["02-12",849.0],["02-13",851.0],["02-16",850.0],["02-17",857.0],["02-18",860.0],["02-19",860.0],["02-20",857.0],["02-23",842.0],["02-24",857.0],["02-25",861.0],["02-26",860.0],["02-27",873.0],["03-01",894.0],["03-02",887.0],["03-03",878.0],["03-04",884.0],["03-05",883.0],["03-08",896.0],["03-09",895.0],["03-10",908.0],["03-11",905.0],["03-12",910.0],["03-15",911.5],["03-16",900.0],["03-17",905.0],["03-18",900.0],["03-19",897.0],["03-22",895.0],["03-23",905.0],["03-24",923.0],["03-25",907.0],["03-26",909.0],["03-29",904.0],["03-30",888.0],["03-31",900.0],["04-01",910.0],["04-02",888.0],["04-05",899.0],["04-06",886.0],["04-07",887.0],["04-08",892.0],["04-13",934.0],["04-14",925.0],["04-15",926.5],["04-16",920.0],["04-19",937.0],["04-20",927.0],["04-21",904.5],["04-22",860.0],["04-23",850.0],["04-26",827.0],["04-27",848.0],["04-28",835.0],["04-29",783.0],["04-30",798.0],["05-04",816.0],["05-05",822.0],["05-06",800.0],["05-07",798.0],["05-10",775.0],["05-11",785.0],["05-12",791.0],["05-13",794.0],["05-14",789.0],["05-17",816.0],["05-18",802.0],["05-19",804.0],["05-20",806.0],["05-21",808.0],["05-24",818.0],["05-25",836.0],["05-26",843.0],["05-27",841.0],["05-28",838.0],["06-01",844.0],["06-02",843.0],["06-03",832.0],["06-04",830.0],["06-07",833.5],["06-08",836.0],["06-09",819.0],["06-10",799.0],["06-11",795.0],["06-14",792.0],["06-15",774.0],["06-16",780.0],["06-17",777.0],["06-18",795.0],["06-21",811.5],["06-22",804.5],["06-23",809.0],["06-24",810.0],["06-25",810.0],["06-28",795.0],["06-29",778.0],["06-30",790.0],["07-01",783.0],["07-02",780.0],["07-05",782.0],["07-06",778.0],["07-07",791.0],["07-08",808.0],["07-09",813.0],["07-12",824.0],["07-13",807.0],["07-14",815.0],["07-15",808.0],["07-16",820.0],["07-19",828.0],["07-20",836.0],["07-21",832.0],["07-22",825.0],["07-23",816.0],["07-26",815.0],["07-27",809.0],["07-28",805.0],["07-29",814.0],["07-30",816.0],["08-02",827.0],["08-03",829.0],["08-04",833.0],["08-05",830.0],["08-06",827.0],["08-09",833.0],["08-10",836.5],["08-11",843.0],["08-12",845.0],["08-13",847.0],["08-16",870.0],["08-17",871.0],["08-18",854.0],["08-19",862.5],["08-20",851.5],["08-23",844.0],["08-24",844.0],["08-25",850.0],["08-26",852.0],["08-27",868.0],["08-31",866.0],["09-01",866.0],["09-02",873.0],["09-03",866.0],["09-06",848.0],["09-07",850.0],["09-08",838.0],["09-09",838.0],["09-10",832.0],["09-13",836.0],["09-14",840.0],["09-15",843.0],["09-16",843.0],["09-17",837.0],["09-20",835.0],["09-21",848.0],["09-22",847.0],["09-23",844.0],["09-24",851.5],["09-27",856.0],["09-28",869.0],["09-29",845.0],["09-30",850.0],["10-01",863.0],["10-04",852.5],["10-05",834.0],["10-06",848.0],["10-07",845.0],["10-08",845.0],["10-11",847.0],["10-12",847.0],["10-13",830.0],["10-14",838.0],["10-15",838.0],["10-18",845.0],["10-19",838.0],["10-20",844.0],["10-21",854.0],["10-22",848.0],["10-25",857.0],["10-26",846.0],["10-27",842.0],["10-28",832.0],["10-29",835.0],["11-01",834.0],["11-02",828.0],["11-03",828.0],["11-04",841.0],["11-05",845.0],["11-08",846.0],["11-09",848.0],["11-10",848.0],["11-11",850.0],["11-12",868.0],["11-15",878.0],["11-16",869.0],["11-17",866.0],["11-18",869.0],["11-19",853.0],["11-22",852.0],["11-23",853.0],["11-24",860.0],["11-25",865.0],["11-26",865.0],["11-29",861.0],["11-30",865.0],["12-01",866.0],["12-02",875.75],["12-03",870.0],["12-06",873.0],["12-07",868.0],["12-08",856.0],["12-09",827.0],["12-10",832.0],["12-13",836.0],["12-14",835.25],["12-15",835.0],["12-16",845.0],["12-17",840.0],["12-20",844.0],["12-21",843.0],["12-22",843.5],["12-23",840.0],["12-24",846.0],["12-29",867.0],["12-30",859.5],["12-31",861.0]],"Silver":[["01-02",5.99],["01-05",5.97],["01-06",6.28],["01-07",6.21],["01-08",6.2],["01-09",6.25],["01-12",6.65],["01-13",6.62],["01-14",6.54],["01-15",6.32],["01-16",6.21],["01-19",6.33],["01-20",6.39],["01-21",6.3],["01-22",6.26],["01-23",6.34],["01-26",6.25],["01-27",6.24],["01-28",6.54],["01-29",6.54],["01-30",6.22],["02-02",6.21],["02-03",6.17],["02-04",6.08],["02-05",6.14],["02-06",6.09],["02-09",6.34],["02-10",6.43],["02-11",6.29],["02-12",6.54],["02-13",6.56],["02-16",6.54],["02-17",6.64],["02-18",6.82],["02-19",6.62],["02-20",6.61],["02-23",6.49],["02-24",6.54],["02-25",6.76],["02-26",6.36],["02-27",6.58],["03-01",6.73],["03-02",6.86],["03-03",6.59],["03-04",6.82],["03-05",6.79],["03-08",6.92],["03-09",6.92],["03-10",7.17],["03-11",7.09],["03-12",7.21],["03-15",7.11],["03-16",7.16],["03-17",7.16],["03-18",7.24],["03-19",7.42],["03-22",7.65],["03-23",7.54],["03-24",7.67],["03-25",7.54],["03-26",7.49],["03-29",7.67],["03-30",7.61],["03-31",7.83],["04-01",7.94],["04-02",8.29],["04-05",8.2],["04-06",8.14],["04-07",8.15],["04-08",8.09],["04-13",7.86],["04-14",7.16],["04-15",6.86],["04-16",7.12],["04-19",7.28],["04-20",7.04],["04-21",6.42],["04-22",6.14],["04-23",6.19],["04-26",6.22],["04-27",6.28],["04-28",6.23],["04-29",5.57],["04-30",5.95],["05-04",6.1],["05-05",6.08],["05-06",6.03],["05-07",5.8],["05-10",5.5],["05-11",5.67],["05-12",5.63],["05-13",5.55],["05-14",5.56],["05-17",5.81],["05-18",5.74],["05-19",5.72],["05-20",5.83],["05-21",5.86],["05-24",5.83],["05-25",6.03],["05-26",6.11],["05-27",6.07],["05-28",6.17],["06-01",6.17],["06-02",6.09],["06-03",5.82],["06-04",5.76],["06-07",5.87],["06-08",5.9],["06-09",5.74],["06-10",5.66],["06-11",5.69],["06-14",5.66],["06-15",5.63],["06-16",5.65],["06-17",5.75],["06-18",5.95],["06-21",5.94],["06-22",5.8],["06-23",5.88],["06-24",5.88],["06-25",6.15],["06-28",6.18],["06-29",5.89],["06-30",5.91],["07-01",5.88],["07-02",5.88],["07-05",6.04],["07-06",6.03],["07-07",6.04],["07-08",6.2],["07-09",6.5],["07-12",6.53],["07-13",6.38],["07-14",6.42],["07-15",6.54],["07-16",6.62],["07-19",6.71],["07-20",6.58],["07-21",6.47],["07-22",6.34],["07-23",6.31],["07-26",6.29],["07-27",6.24],["07-28",6.19],["07-29",6.32],["07-30",6.42],["08-02",6.64],["08-03",6.5],["08-04",6.62],["08-05",6.64],["08-06",6.68],["08-09",6.7],["08-10",6.68],["08-11",6.6],["08-12",6.58],["08-13",6.48],["08-16",6.69],["08-17",6.71],["08-18",6.7],["08-19",6.82],["08-20",6.8],["08-23",6.77],["08-24",6.65],["08-25",6.57],["08-26",6.6],["08-27",6.67],["08-31",6.74],["09-01",6.73],["09-02",6.76],["09-03",6.71],["09-06",6.54],["09-07",6.51],["09-08",6.18],["09-09",6.13],["09-10",6.14],["09-13",6.13],["09-14",6.19],["09-15",6.18],["09-16",6.27],["09-17",6.26],["09-20",6.21],["09-21",6.28],["09-22",6.3],["09-23",6.39],["09-24",6.42],["09-27",6.39],["09-28",6.59],["09-29",6.53],["09-30",6.67],["10-01",6.84],["10-04",6.83],["10-05",6.74],["10-06",7.15],["10-07",7.13],["10-08",7.15],["10-11",7.24],["10-12",7.03],["10-13",6.79],["10-14",7.0],["10-15",7.06],["10-18",7.04],["10-19",6.96],["10-20",7.24],["10-21",7.33],["10-22",7.21],["10-25",7.44],["10-26",7.31],["10-27",7.32],["10-28",7.06],["10-29",7.16],["11-01",7.24],["11-02",7.2],["11-03",7.04],["11-04",7.25],["11-05",7.36],["11-08",7.45],["11-09",7.43],["11-10",7.5],["11-11",7.42],["11-12",7.49],["11-15",7.59],["11-16",7.5],["11-17",7.62],["11-18",7.66],["11-19",7.58],["11-22",7.62],["11-23",7.57],["11-24",7.56],["11-25",7.69],["11-26",7.67],["11-29",7.65],["11-30",7.75],["12-01",7.71],["12-02",8.04],["12-03",7.83],["12-06",8.0],["12-07",7.84],["12-08",7.48],["12-09",6.9],["12-10",6.71],["12-13",6.83],["12-14",6.76],["12-15",6.78],["12-16",6.79],["12-17",6.68],["12-20",6.81],["12-21",6.85],["12-22",6.84],["12-23",6.88],["12-24",6.88],["12-29",6.97],["12-30",6.77],["12-31",6.82]]},"2005":{"Gold":[["01-04",426.8],["01-05",425.5],["01-06",425.8],["01-07",423.15],["01-10",421.25],["01-11",422.55],["01-12",421.7],["01-13",424.65],["01-14",421.7],["01-17",422.85],["01-18",422.55],["01-19",424.1],["01-20",421.7],["01-21",423.3],["01-24",427.6],["01-25",426.2],["01-26",423.7],["01-27",426.3],["01-28",426.4],["01-31",423.8],["02-01",421.15],["02-02",421.9],["02-03",419.8],["02-04",416.5],["02-07",414.5],["02-08",411.5],["02-09",413.2],["02-10",413.5],["02-11",417.05],["02-14",422.8],["02-15",424.6],["02-16",424.15],["02-17",426.6],["02-18",426.55],["02-21",427.1],["02-22",430.75],["02-23",433.25],["02-24",434.75],["02-25",432.4],["02-28",436.55],["03-01",434.65],["03-02",429.15],["03-03",433.25],["03-04",429.65],["03-07",433.6],["03-08",434.85],["03-09",439.9],["03-10",440.2],["03-11",440.95],["03-14",442.75],["03-15",442.0],["03-16",441.2],["03-17",442.65],["03-18",436.65],["03-21",436.25],["03-22",430.65],["03-23",427.25],["03-24",424.9],["03-29",426.95],["03-30",426.5],["03-31",427.5],["04-01",427.45],["04-04",425.95],["04-05",423.7],["04-06",426.6],["04-07",426.4],["04-08",425.4],["04-11",428.1],["04-12",429.15],["04-13",428.85],["04-14",427.2],["04-15",423.65],["04-18",425.65],["04-19",426.9],["04-20",432.4],["04-21",433.4],["04-22",433.4],["04-25",433.0],["04-26",434.7],["04-27",434.1],["04-28",432.75],["04-29",433.2],["05-03",429.2],["05-04",429.2],["05-05",430.5],["05-06",429.7],["05-09",425.8],["05-10",426.9],["05-11",428.35],["05-12",426.25],["05-13",421.45],["05-16",419.9],["05-17",420.35],["05-18",419.4],["05-19",421.75],["05-20",420.7],["05-23",417.6],["05-24",418.25],["05-25",418.5],["05-26",418.75],["05-27",418.6],["05-31",416.9],["06-01",416.1],["06-02",417.2],["06-03",423.2],["06-06",424.8],["06-07",426.6],["06-08",424.9],["06-09",423.55],["06-10",422.75],["06-13",425.6],["06-14",426.95],["06-15",426.65],["06-16",431.3],["06-17",436.05],["06-20",440.5],["06-21",434.35],["06-22",437.5],["06-23",437.15],["06-24",442.95],["06-27",439.35],["06-28",437.5],["06-29",434.9],["06-30",436.8],["07-01",434.2],["07-04",427.6],["07-05",426.0],["07-06",423.85],["07-07",427.85],["07-08",423.75],["07-11",425.0],["07-12",426.95],["07-13",425.55],["07-14",422.5],["07-15",419.6],["07-18",421.6],["07-19",420.0],["07-20",420.65],["07-21",423.65],["07-22",426.35],["07-25",424.85],["07-26",424.5],["07-27",422.75],["07-28",425.3],["07-29",427.15],["08-01",431.35],["08-02",431.85],["08-03",433.6],["08-04",435.6],["08-05",437.5],["08-08",436.85],["08-09",434.7],["08-10",436.3],["08-11",437.8],["08-12",447.25],["08-15",442.6],["08-16",440.85],["08-17",444.25],["08-18",439.0],["08-19",439.25],["08-22",437.5],["08-23",439.85],["08-24",438.25],["08-25",439.0],["08-26",438.5],["08-30",436.15],["08-31",433.0],["09-01",435.5],["09-02",446.3],["09-05",445.6],["09-06",443.5],["09-07",444.5],["09-08",444.8],["09-09",446.7],["09-12",449.15],["09-13",448.7],["09-14",447.85],["09-15",449.1],["09-16",458.1],["09-19",461.95],["09-20",470.0],["09-21",467.0],["09-22",472.75],["09-23",464.5],["09-26",461.05],["09-27",465.65],["09-28",462.0],["09-29",472.5],["09-30",473.4],["10-03",465.0],["10-04",467.5],["10-05",465.25],["10-06",466.3],["10-07",472.0],["10-10",477.5],["10-11",475.5],["10-12",478.5],["10-13",471.25],["10-14",470.7],["10-17",472.35],["10-18",473.0],["10-19",468.4],["10-20",464.0],["10-21",463.15],["10-24",463.75],["10-25",467.0],["10-26",471.55],["10-27",473.25],["10-28",473.65],["10-31",472.65],["11-01",465.55],["11-02",461.65],["11-03",464.8],["11-04",461.35],["11-07",457.6],["11-08",457.15],["11-09",462.6],["11-10",467.0],["11-11",465.9],["11-14",469.75],["11-15",467.55],["11-16",470.65],["11-17",480.75],["11-18",487.9],["11-21",488.0],["11-22",493.0],["11-23",488.85],["11-24",492.75],["11-25",495.7],["11-28",497.3],["11-29",497.1],["11-30",493.8],["12-01",494.4],["12-02",504.75],["12-05",505.0],["12-06",508.25],["12-07",512.3],["12-08",514.85],["12-09",524.75],["12-12",537.5],["12-13",522.8],["12-14",513.75],["12-15",502.4],["12-16",502.5],["12-19",507.45],["12-20",505.75],["12-21",494.5],["12-22",494.75],["12-23",503.6],["12-28",509.15],["12-29",517.0],["12-30",513.0]],"Palladium":[["01-04",180.0],["01-05",180.0],["01-06",180.5],["01-07",181.0],["01-10",182.0],["01-11",192.0],["01-12",189.5],["01-13",187.0],["01-14",184.0],["01-17",183.0],["01-18",182.0],["01-19",185.0],["01-20",184.0],["01-21",186.0],["01-24",190.0],["01-25",192.0],["01-26",188.0],["01-27",189.0],["01-28",189.0],["01-31",188.0],["02-01",189.5],["02-02",189.0],["02-03",186.0],["02-04",182.0],["02-07",179.5],["02-08",179.0],["02-09",179.0],["02-10",179.25],["02-11",180.5],["02-14",184.0],["02-15",185.0],["02-16",180.0],["02-17",180.5],["02-18",180.75],["02-21",180.0],["02-22",183.0],["02-23",183.0],["02-24",183.0],["02-25",184.0],["02-28",181.0],["03-01",182.0],["03-02",183.0],["03-03",190.0],["03-04",202.0],["03-07",203.0],["03-08",203.5],["03-09",207.0],["03-10",204.0],["03-11",196.0],["03-14",200.0],["03-15",199.0],["03-16",202.0],["03-17",202.0],["03-18",200.0],["03-21",199.5],["03-22",197.0],["03-23",196.0],["03-24",192.0],["03-29",193.0],["03-30",193.0],["03-31",196.0],["04-01",200.0],["04-04",199.0],["04-05",197.0],["04-06",197.5],["04-07",199.0],["04-08",196.0],["04-11",197.0],["04-12",196.75],["04-13",196.0],["04-14",197.5],["04-15",197.5],["04-18",198.0],["04-19",199.0],["04-20",201.0],["04-21",203.0],["04-22",199.0],["04-25",200.0],["04-26",200.0],["04-27",200.0],["04-28",198.0],["04-29",196.0],["05-03",194.0],["05-04",192.0],["05-05",195.0],["05-06",195.0],["05-09",191.0],["05-10",193.0],["05-11",194.5],["05-12",193.0],["05-13",188.0],["05-16",188.0],["05-17",188.0],["05-18",189.0],["05-19",190.5],["05-20",189.0],["05-23",188.0],["05-24",187.0],["05-25",187.0],["05-26",186.0],["05-27",184.0],["05-31",185.0],["06-01",185.0],["06-02",185.0],["06-03",183.75],["06-06",186.5],["06-07",190.5],["06-08",189.0],["06-09",188.0],["06-10",186.0],["06-13",185.0],["06-14",185.0],["06-15",186.0],["06-16",188.0],["06-17",188.5],["06-20",188.0],["06-21",188.0],["06-22",188.5],["06-23",187.5],["06-24",188.0],["06-27",187.0],["06-28",184.0],["06-29",182.5],["06-30",183.0],["07-01",180.0],["07-04",177.0],["07-05",172.0],["07-06",178.0],["07-07",180.0],["07-08",182.0],["07-11",182.0],["07-12",182.5],["07-13",183.75],["07-14",182.0],["07-15",182.5],["07-18",184.0],["07-19",186.75],["07-20",187.0],["07-21",190.0],["07-22",191.5],["07-25",192.0],["07-26",192.0],["07-27",188.0],["07-28",189.0],["07-29",192.0],["08-01",191.5],["08-02",192.0],["08-03",192.0],["08-04",192.5],["08-05",191.5],["08-08",192.5],["08-09",190.0],["08-10",186.5],["08-11",187.0],["08-12",189.0],["08-15",185.0],["08-16",184.5],["08-17",185.0],["08-18",184.5],["08-19",184.0],["08-22",182.5],["08-23",182.5],["08-24",184.0],["08-25",184.0],["08-26",184.0],["08-30",183.0],["08-31",183.0],["09-01",183.0],["09-02",184.0],["09-05",184.0],["09-06",182.5],["09-07",183.0],["09-08",183.5],["09-09",182.5],["09-12",184.0],["09-13",183.0],["09-14",183.0],["09-15",183.0],["09-16",185.5],["09-19",190.5],["09-20",202.0],["09-21",196.5],["09-22",198.0],["09-23",195.0],["09-26",191.5],["09-27",193.0],["09-28",194.0],["09-29",195.0],["09-30",196.0],["10-03",194.0],["10-04",193.0],["10-05",192.0],["10-06",194.0],["10-07",195.0],["10-10",202.0],["10-11",207.0],["10-12",209.0],["10-13",207.0],["10-14",207.0],["10-17",208.5],["10-18",213.0],["10-19",208.0],["10-20",207.0],["10-21",209.25],["10-24",208.0],["10-25",210.0],["10-26",216.0],["10-27",227.0],["10-28",225.0],["10-31",227.0],["11-01",223.0],["11-02",221.0],["11-03",224.0],["11-04",227.0],["11-07",226.0],["11-08",226.0],["11-09",235.0],["11-10",241.0],["11-11",240.0],["11-14",253.0],["11-15",250.0],["11-16",255.0],["11-17",254.0],["11-18",259.0],["11-21",266.0],["11-22",265.0],["11-23",256.0],["11-24",255.0],["11-25",256.0],["11-28",263.0],["11-29",262.0],["11-30",258.0],["12-01",257.0],["12-02",271.0],["12-05",268.0],["12-06",272.0],["12-07",274.0],["12-08",276.0],["12-09",297.0],["12-12",296.0],["12-13",279.0],["12-14",267.0],["12-15",249.0],["12-16",260.0],["12-19",262.0],["12-20",261.0],["12-21",249.0],["12-22",246.0],["12-23",253.0],["12-28",256.0],["12-29",260.0],["12-30",253.0]],"Platinum":[["01-04",848.0],["01-05",843.0],["01-06",847.0],["01-07",847.0],["01-10",845.0],["01-11",856.0],["01-12",856.0],["01-13",862.0],["01-14",856.0],["01-17",855.0],["01-18",858.0],["01-19",869.0],["01-20",863.0],["01-21",863.0],["01-24",869.0],["01-25",866.0],["01-26",863.0],["01-27",869.0],["01-28",867.0],["01-31",871.0],["02-01",881.0],["02-02",876.0],["02-03",870.0],["02-04",866.0],["02-07",867.0],["02-08",855.0],["02-09",847.0],["02-10",852.0],["02-11",868.0],["02-14",873.0],["02-15",858.0],["02-16",856.0],["02-17",859.0],["02-18",864.0],["02-21",861.0],["02-22",871.0],["02-23",869.0],["02-24",869.0],["02-25",865.0],["02-28",870.0],["03-01",866.0],["03-02",861.0],["03-03",866.0],["03-04",865.0],["03-07",869.0],["03-08",868.5],["03-09",876.0],["03-10",875.0],["03-11",867.0],["03-14",870.0],["03-15",872.0],["03-16",879.0],["03-17",883.0],["03-18",873.0],["03-21",873.0],["03-22",862.0],["03-23",858.0],["03-24",859.0],["03-29",860.0],["03-30",860.5],["03-31",863.0],["04-01",862.5],["04-04",859.0],["04-05",858.0],["04-06",862.0],["04-07",865.0],["04-08",861.0],["04-11",861.0],["04-12",864.0],["04-13",863.0],["04-14",863.0],["04-15",861.0],["04-18",862.0],["04-19",863.0],["04-20",872.0],["04-21",871.0],["04-22",872.0],["04-25",875.0],["04-26",878.0],["04-27",873.5],["04-28",867.0],["04-29",867.0],["05-03",867.0],["05-04",869.0],["05-05",875.0],["05-06",875.0],["05-09",875.0],["05-10",875.0],["05-11",881.0],["05-12",871.0],["05-13",866.0],["05-16",856.0],["05-17",855.0],["05-18",858.0],["05-19",867.0],["05-20",865.0],["05-23",860.0],["05-24",865.0],["05-25",866.0],["05-26",864.0],["05-27",860.0],["05-31",863.0],["06-01",867.0],["06-02",873.0],["06-03",876.0],["06-06",877.5],["06-07",878.0],["06-08",877.0],["06-09",874.0],["06-10",869.0],["06-13",869.0],["06-14",870.5],["06-15",873.0],["06-16",879.0],["06-17",889.0],["06-20",900.0],["06-21",882.0],["06-22",890.0],["06-23",888.0],["06-24",893.0],["06-27",891.0],["06-28",884.0],["06-29",882.5],["06-30",885.0],["07-01",880.0],["07-04",872.0],["07-05",870.0],["07-06",864.0],["07-07",872.0],["07-08",865.0],["07-11",866.0],["07-12",872.0],["07-13",873.0],["07-14",867.0],["07-15",866.0],["07-18",867.0],["07-19",867.0],["07-20",869.0],["07-21",877.0],["07-22",884.0],["07-25",887.0],["07-26",885.0],["07-27",880.0],["07-28",883.0],["07-29",896.0],["08-01",901.0],["08-02",909.0],["08-03",909.0],["08-04",914.0],["08-05",909.0],["08-08",899.0],["08-09",905.0],["08-10",902.0],["08-11",909.0],["08-12",924.0],["08-15",908.0],["08-16",892.0],["08-17",890.0],["08-18",888.0],["08-19",887.0],["08-22",887.0],["08-23",894.0],["08-24",894.0],["08-25",897.0],["08-26",895.0],["08-30",895.0],["08-31",891.0],["09-01",893.0],["09-02",909.0],["09-05",908.0],["09-06",907.0],["09-07",906.0],["09-08",912.0],["09-09",909.0],["09-12",913.0],["09-13",909.0],["09-14",908.0],["09-15",912.0],["09-16",915.0],["09-19",920.0],["09-20",930.0],["09-21",927.0],["09-22",930.0],["09-23",924.0],["09-26",910.0],["09-27",917.0],["09-28",910.0],["09-29",923.0],["09-30",929.0],["10-03",924.0],["10-04",920.0],["10-05",914.0],["10-06",921.0],["10-07",932.0],["10-10",937.0],["10-11",941.0],["10-12",941.0],["10-13",937.0],["10-14",925.0],["10-17",935.0],["10-18",933.0],["10-19",927.0],["10-20",920.0],["10-21",926.0],["10-24",924.0],["10-25",932.0],["10-26",941.0],["10-27",944.0],["10-28",941.0],["10-31",939.0],["11-01",930.0],["11-02",925.0],["11-03",936.0],["11-04",933.0],["11-07",930.0],["11-08",931.5],["11-09",955.0],["11-10",956.75],["11-11",957.0],["11-14",969.0],["11-15",968.0],["11-16",982.0],["11-17",974.0],["11-18",983.0],["11-21",979.0],["11-22",977.0],["11-23",970.0],["11-24",979.0],["11-25",984.0],["11-28",997.0],["11-29",993.0],["11-30",980.0],["12-01",985.0],["12-02",1001.0],["12-05",1000.0],["12-06",994.0],["12-07",1000.0],["12-08",995.0],["12-09",1000.0],["12-12",1011.0],["12-13",996.0],["12-14",974.0],["12-15",942.0],["12-16",956.0],["12-19",973.0],["12-20",964.0],["12-21",951.0],["12-22",954.0],["12-23",961.0],["12-28",968.0],["12-29",968.0],["12-30",964.0]],"Silver":[["01-04",6.39],["01-05",6.46],["01-06",6.42],["01-07",6.46],["01-10",6.47],["01-11",6.52],["01-12",6.58],["01-13",6.71],["01-14",6.63],["01-17",6.59],["01-18",6.58],["01-19",6.68],["01-20",6.52],["01-21",6.58],["01-24",6.81],["01-25",6.79],["01-26",6.72],["01-27",6.79],["01-28",6.77],["01-31",6.72],["02-01",6.7],["02-02",6.73],["02-03",6.71],["02-04",6.66],["02-07",6.59],["02-08",6.49],["02-09",6.55],["02-10",6.58],["02-11",6.98],["02-14",7.25],["02-15",7.25],["02-16",7.13],["02-17",7.25],["02-18",7.32],["02-21",7.37],["02-22",7.55],["02-23",7.45],["02-24",7.47],["02-25",7.24],["02-28",7.35],["03-01",7.26],["03-02",7.13],["03-03",7.29],["03-04",7.17],["03-07",7.35],["03-08",7.4],["03-09",7.57],["03-10",7.52],["03-11",7.42],["03-14",7.47],["03-15",7.42],["03-16",7.41],["03-17",7.36],["03-18",7.33],["03-21",7.25],["03-22",7.11],["03-23",6.92],["03-24",6.93],["03-29",6.92],["03-30",6.96],["03-31",7.19],["04-01",7.11],["04-04",6.96],["04-05",6.94],["04-06",7.05],["04-07",7.12],["04-08",7.03],["04-11",7.18],["04-12",7.24],["04-13",7.16],["04-14",7.11],["04-15",7.01],["04-18",7.04],["04-19",7.05],["04-20",7.21],["04-21",7.29],["04-22",7.24],["04-25",7.21],["04-26",7.26],["04-27",7.21],["04-28",7.09],["04-29",6.98],["05-03",6.85],["05-04",6.89],["05-05",7.05],["05-06",7.04],["05-09",6.96],["05-10",7.06],["05-11",7.08],["05-12",7.0],["05-13",6.88],["05-16",6.88],["05-17",6.97],["05-18",7.02],["05-19",7.18],["05-20",7.1],["05-23",6.98],["05-24",7.01],["05-25",7.01],["05-26",7.08],["05-27",7.17],["05-31",7.13],["06-01",7.38],["06-02",7.48],["06-03",7.53],["06-06",7.46],["06-07",7.53],["06-08",7.4],["06-09",7.38],["06-10",7.24],["06-13",7.2],["06-14",7.25],["06-15",7.25],["06-16",7.38],["06-17",7.39],["06-20",7.37],["06-21",7.21],["06-22",7.24],["06-23",7.22],["06-24",7.29],["06-27",7.24],["06-28",7.21],["06-29",7.07],["06-30",7.1],["07-01",7.02],["07-04",6.91],["07-05",6.89],["07-06",6.88],["07-07",7.03],["07-08",6.94],["07-11",7.04],["07-12",7.1],["07-13",7.04],["07-14",6.99],["07-15",6.96],["07-18",7.0],["07-19",6.95],["07-20",6.96],["07-21",7.09],["07-22",7.12],["07-25",7.11],["07-26",7.08],["07-27",6.99],["07-28",7.07],["07-29",7.14],["08-01",7.25],["08-02",7.24],["08-03",7.25],["08-04",7.22],["08-05",7.2],["08-08",7.13],["08-09",7.0],["08-10",7.07],["08-11",7.08],["08-12",7.17],["08-15",7.07],["08-16",6.98],["08-17",7.0],["08-18",6.96],["08-19",7.0],["08-22",6.99],["08-23",7.05],["08-24",6.96],["08-25",6.95],["08-26",6.84],["08-30",6.75],["08-31",6.74],["09-01",6.86],["09-02",7.02],["09-05",7.05],["09-06",7.03],["09-07",7.02],["09-08",7.04],["09-09",6.99],["09-12",6.97],["09-13",6.99],["09-14",6.96],["09-15",7.03],["09-16",7.08],["09-19",7.31],["09-20",7.33],["09-21",7.29],["09-22",7.42],["09-23",7.29],["09-26",7.22],["09-27",7.29],["09-28",7.27],["09-29",7.4],["09-30",7.53],["10-03",7.38],["10-04",7.43],["10-05",7.34],["10-06",7.43],["10-07",7.62],["10-10",7.78],["10-11",7.76],["10-12",7.84],["10-13",7.74],["10-14",7.67],["10-17",7.86],["10-18",7.78],["10-19",7.73],["10-20",7.6],["10-21",7.6],["10-24",7.62],["10-25",7.72],["10-26",7.83],["10-27",7.81],["10-28",7.79],["10-31",7.76],["11-01",7.54],["11-02",7.42],["11-03",7.58],["11-04",7.55],["11-07",7.49],["11-08",7.52],["11-09",7.65],["11-10",7.74],["11-11",7.7],["11-14",7.83],["11-15",7.77],["11-16",7.79],["11-17",8.1],["11-18",8.11],["11-21",8.11],["11-22",8.16],["11-23",8.05],["11-24",8.13],["11-25",8.2],["11-28",8.27],["11-29",8.29],["11-30",8.21],["12-01",8.31],["12-02",8.54],["12-05",8.59],["12-06",8.6],["12-07",8.82],["12-08",8.79],["12-09",8.97],["12-12",9.22],["12-13",8.74],["12-14",8.39],["12-15",8.39],["12-16",8.61],["12-19",8.62],["12-20",8.55],["12-21",8.28],["12-22",8.38],["12-23",8.5],["12-28",8.76],["12-29",8.9],["12-30",8.83]]},"2006":{"Gold":[["01-03",520.75],["01-04",534.35],["01-05",531.6],["01-06",529.5],["01-09",541.0],["01-10",545.25],["01-11",542.25],["01-12",547.5],["01-13",547.25],["01-16",559.4],["01-17",558.05],["01-18",544.75],["01-19",547.7],["01-20",559.25],["01-23",558.5],["01-24",556.65],["01-25",562.25],["01-26",562.25],["01-27",559.75],["01-30",560.3],["01-31",569.8],["02-01",567.2],["02-02",571.85],["02-03",571.85],["02-06",570.0],["02-07",568.25],["02-08",548.65],["02-09",559.0],["02-10",558.75],["02-13",546.6],["02-14",540.5],["02-15",544.3],["02-16",540.65],["02-17",545.75],["02-20",556.0],["02-21",553.4],["02-22",551.75],["02-23",552.5],["02-24",550.75],["02-27",556.1],["02-28",556.5],["03-01",562.6],["03-02",563.75],["03-03",568.6],["03-06",568.0],["03-07",555.25],["03-08",548.6],["03-09",547.25],["03-10",545.4],["03-13",545.25],["03-14",545.25],["03-15",551.25],["03-16",553.25],["03-17",555.5],["03-20",554.25],["03-21",553.0],["03-22",548.5],["03-23",548.0],["03-24",549.75],["03-27",564.0],["03-28",563.75],["03-29",562.25],["03-30",578.5],["03-31",584.0],["04-03",585.5],["04-04",585.0],["04-05",583.85],["04-06",595.5],["04-07",597.0],["04-10",597.5],["04-11",599.5],["04-12",596.75],["04-13",597.0],["04-18",616.75],["04-19",623.75],["04-20",644.5],["04-21",623.5],["04-24",634.0],["04-25",627.75],["04-26",630.75],["04-27",636.5],["04-28",638.25],["05-02",657.75],["05-03",675.25],["05-04",664.65],["05-05",682.0],["05-08",682.0],["05-09",679.75],["05-10",704.3],["05-11",707.0],["05-12",725.75],["05-15",693.0],["05-16",681.0],["05-17",713.0],["05-18",688.0],["05-19",682.0],["05-22",645.5],["05-23",661.7],["05-24",667.5],["05-25",643.75],["05-26",652.0],["05-30",652.25],["05-31",654.0],["06-01",633.25],["06-02",630.8],["06-05",644.5],["06-06",634.6],["06-07",623.5],["06-08",619.0],["06-09",612.25],["06-12",607.75],["06-13",590.75],["06-14",567.25],["06-15",574.25],["06-16",581.5],["06-19",569.75],["06-20",571.0],["06-21",576.5],["06-22",594.4],["06-23",582.6],["06-26",586.25],["06-27",587.7],["06-28",584.0],["06-29",581.75],["06-30",600.4],["07-03",619.5],["07-04",620.9],["07-05",625.75],["07-06",623.75],["07-07",631.0],["07-10",624.5],["07-11",628.35],["07-12",642.0],["07-13",648.8],["07-14",660.4],["07-17",671.5],["07-18",647.5],["07-19",626.0],["07-20",642.9],["07-21",626.75],["07-24",616.4],["07-25",618.75],["07-26",617.75],["07-27",634.2],["07-28",631.25],["07-31",637.0],["08-01",635.5],["08-02",648.25],["08-03",646.25],["08-04",644.5],["08-07",647.25],["08-08",645.4],["08-09",640.5],["08-10",650.5],["08-11",641.55],["08-14",628.0],["08-15",624.75],["08-16",626.0],["08-17",630.75],["08-18",614.75],["08-21",621.5],["08-22",626.5],["08-23",623.5],["08-24",623.5],["08-25",622.0],["08-29",616.85],["08-30",614.7],["08-31",621.75],["09-01",624.0],["09-04",626.75],["09-05",629.75],["09-06",636.7],["09-07",634.0],["09-08",611.5],["09-11",597.1],["09-12",596.0],["09-13",581.5],["09-14",593.4],["09-15",578.6],["09-18",581.5],["09-19",582.5],["09-20",576.25],["09-21",580.5],["09-22",592.0],["09-25",589.5],["09-26",591.25],["09-27",595.1],["09-28",603.5],["09-29",601.75],["10-02",602.0],["10-03",593.0],["10-04",578.5],["10-05",568.25],["10-06",570.6],["10-09",578.25],["10-10",577.25],["10-11",574.0],["10-12",575.9],["10-13",577.9],["10-16",593.0],["10-17",594.9],["10-18",595.25],["10-19",589.75],["10-20",598.0],["10-23",588.5],["10-24",578.4],["10-25",581.6],["10-26",591.8],["10-27",593.75],["10-30",604.75],["10-31",600.9],["11-01",611.25],["11-02",615.75],["11-03",625.65],["11-06",625.75],["11-07",625.75],["11-08",625.5],["11-09",618.0],["11-10",632.25],["11-13",628.5],["11-14",623.4],["11-15",620.25],["11-16",624.5],["11-17",618.25],["11-20",624.0],["11-21",625.0],["11-22",627.75],["11-23",630.7],["11-24",636.0],["11-27",637.5],["11-28",637.75],["11-29",638.25],["11-30",638.4],["12-01",644.4],["12-04",644.8],["12-05",643.0],["12-06",636.75],["12-07",630.5],["12-08",630.9],["12-11",625.5],["12-12",629.5],["12-13",629.0],["12-14",628.75],["12-15",626.0],["12-18",617.5],["12-19",616.0],["12-20",623.4],["12-21",622.0],["12-22",619.75],["12-27",628.3],["12-28",629.0],["12-29",635.7]],"Palladium":[["01-03",261.0],["01-04",275.0],["01-05",267.0],["01-06",262.0],["01-09",273.0],["01-10",275.0],["01-11",269.0],["01-12",272.0],["01-13",273.0],["01-16",283.0],["01-17",282.0],["01-18",266.0],["01-19",272.5],["01-20",276.0],["01-23",276.0],["01-24",274.0],["01-25",277.0],["01-26",278.0],["01-27",274.0],["01-30",274.0],["01-31",282.0],["02-01",287.0],["02-02",296.0],["02-03",315.0],["02-06",313.0],["02-07",302.0],["02-08",286.0],["02-09",298.0],["02-10",294.0],["02-13",278.0],["02-14",276.0],["02-15",281.0],["02-16",277.0],["02-17",280.0],["02-20",289.0],["02-21",289.0],["02-22",289.0],["02-23",285.0],["02-24",284.0],["02-27",284.0],["02-28",282.0],["03-01",286.0],["03-02",292.0],["03-03",305.0],["03-06",303.0],["03-07",294.0],["03-08",286.0],["03-09",284.0],["03-10",289.0],["03-13",289.0],["03-14",299.0],["03-15",305.0],["03-16",312.0],["03-17",313.0],["03-20",315.0],["03-21",309.0],["03-22",317.0],["03-23",314.0],["03-24",320.0],["03-27",333.0],["03-28",338.0],["03-29",328.0],["03-30",344.0],["03-31",335.0],["04-03",336.0],["04-04",335.0],["04-05",334.0],["04-06",354.0],["04-07",350.0],["04-10",355.0],["04-11",360.0],["04-12",341.0],["04-13",340.0],["04-18",359.75],["04-19",366.0],["04-20",370.0],["04-21",349.0],["04-24",364.0],["04-25",357.0],["04-26",363.0],["04-27",363.0],["04-28",362.0],["05-02",378.0],["05-03",385.0],["05-04",370.0],["05-05",378.0],["05-08",377.0],["05-09",376.0],["05-10",388.0],["05-11",390.0],["05-12",402.0],["05-15",377.0],["05-16",362.0],["05-17",384.0],["05-18",373.0],["05-19",365.0],["05-22",338.0],["05-23",340.0],["05-24",360.0],["05-25",342.0],["05-26",352.0],["05-30",353.0],["05-31",354.0],["06-01",343.0],["06-02",342.0],["06-05",361.0],["06-06",349.0],["06-07",334.0],["06-08",319.0],["06-09",315.0],["06-12",317.0],["06-13",289.0],["06-14",286.0],["06-15",298.0],["06-16",305.0],["06-19",298.0],["06-20",295.0],["06-21",306.0],["06-22",317.0],["06-23",306.0],["06-26",310.0],["06-27",314.0],["06-28",309.0],["06-29",307.0],["06-30",316.0],["07-03",326.0],["07-04",326.0],["07-05",324.5],["07-06",320.0],["07-07",325.0],["07-10",318.0],["07-11",322.0],["07-12",327.0],["07-13",327.0],["07-14",330.0],["07-17",328.0],["07-18",316.0],["07-19",310.0],["07-20",314.0],["07-21",308.0],["07-24",304.0],["07-25",313.0],["07-26",314.0],["07-27",315.0],["07-28",310.0],["07-31",312.0],["08-01",313.0],["08-02",319.0],["08-03",323.0],["08-04",323.0],["08-07",321.0],["08-08",321.0],["08-09",317.0],["08-10",324.0],["08-11",319.0],["08-14",316.0],["08-15",317.0],["08-16",323.0],["08-17",338.0],["08-18",330.0],["08-21",334.0],["08-22",344.0],["08-23",341.0],["08-24",345.5],["08-25",343.0],["08-29",338.0],["08-30",341.0],["08-31",341.0],["09-01",345.0],["09-04",344.0],["09-05",346.5],["09-06",347.0],["09-07",351.0],["09-08",343.0],["09-11",317.0],["09-12",320.0],["09-13",307.0],["09-14",324.0],["09-15",315.0],["09-18",308.0],["09-19",312.0],["09-20",303.0],["09-21",306.0],["09-22",316.0],["09-25",316.0],["09-26",317.0],["09-27",317.0],["09-28",320.0],["09-29",320.0],["10-02",315.0],["10-03",305.0],["10-04",299.0],["10-05",298.0],["10-06",298.0],["10-09",303.0],["10-10",306.0],["10-11",298.0],["10-12",306.0],["10-13",309.0],["10-16",322.0],["10-17",323.0],["10-18",321.0],["10-19",327.0],["10-20",324.0],["10-23",318.0],["10-24",317.0],["10-25",320.0],["10-26",320.0],["10-27",320.0],["10-30",322.0],["10-31",319.0],["11-01",323.0],["11-02",321.0],["11-03",330.0],["11-06",332.0],["11-07",328.0],["11-08",330.0],["11-09",325.0],["11-10",334.0],["11-13",329.0],["11-14",319.0],["11-15",320.0],["11-16",321.0],["11-17",315.0],["11-20",320.0],["11-21",329.0],["11-22",325.0],["11-23",325.0],["11-24",326.0],["11-27",329.0],["11-28",326.0],["11-29",318.0],["11-30",321.0],["12-01",326.0],["12-04",327.0],["12-05",326.0],["12-06",327.0],["12-07",326.0],["12-08",327.0],["12-11",328.0],["12-12",329.0],["12-13",328.0],["12-14",327.0],["12-15",326.0],["12-18",323.0],["12-19",321.0],["12-20",326.5],["12-21",324.0],["12-22",326.0],["12-27",326.0],["12-28",324.0],["12-29",324.0]],"Platinum":[["01-03",982.0],["01-04",995.0],["01-05",990.0],["01-06",989.0],["01-09",998.0],["01-10",1020.0],["01-11",1008.0],["01-12",1017.0],["01-13",1029.0],["01-16",1042.0],["01-17",1039.0],["01-18",1025.0],["01-19",1039.0],["01-20",1042.0],["01-23",1041.0],["01-24",1043.0],["01-25",1056.0],["01-26",1061.0],["01-27",1055.0],["01-30",1065.0],["01-31",1074.0],["02-01",1070.0],["02-02",1078.0],["02-03",1080.0],["02-06",1078.0],["02-07",1069.0],["02-08",1048.0],["02-09",1065.0],["02-10",1062.0],["02-13",1026.0],["02-14",1009.0],["02-15",1013.0],["02-16",1002.0],["02-17",1008.0],["02-20",1025.0],["02-21",1027.0],["02-22",1026.0],["02-23",1024.0],["02-24",1028.0],["02-27",1037.0],["02-28",1046.0],["03-01",1046.0],["03-02",1051.0],["03-03",1063.0],["03-06",1053.0],["03-07",1040.0],["03-08",1024.0],["03-09",1017.0],["03-10",1012.0],["03-13",1015.0],["03-14",1016.0],["03-15",1028.0],["03-16",1020.0],["03-17",1033.0],["03-20",1038.0],["03-21",1036.0],["03-22",1040.0],["03-23",1038.0],["03-24",1042.0],["03-27",1059.0],["03-28",1070.0],["03-29",1062.0],["03-30",1082.0],["03-31",1080.0],["04-03",1075.0],["04-04",1075.0],["04-05",1063.0],["04-06",1082.0],["04-07",1082.0],["04-10",1085.0],["04-11",1090.0],["04-12",1083.0],["04-13",1075.0],["04-18",1101.0],["04-19",1117.0],["04-20",1130.0],["04-21",1108.0],["04-24",1126.0],["04-25",1121.0],["04-26",1130.0],["04-27",1140.0],["04-28",1149.0],["05-02",1164.0],["05-03",1184.0],["05-04",1170.0],["05-05",1175.0],["05-08",1190.0],["05-09",1206.0],["05-10",1259.0],["05-11",1274.0],["05-12",1335.0],["05-15",1293.0],["05-16",1275.0],["05-17",1335.0],["05-18",1320.0],["05-19",1313.0],["05-22",1278.0],["05-23",1293.0],["05-24",1322.0],["05-25",1290.0],["05-26",1295.0],["05-30",1292.0],["05-31",1278.0],["06-01",1244.0],["06-02",1227.0],["06-05",1258.0],["06-06",1243.0],["06-07",1234.0],["06-08",1221.0],["06-09",1195.0],["06-12",1189.0],["06-13",1135.0],["06-14",1128.0],["06-15",1148.0],["06-16",1158.0],["06-19",1140.0],["06-20",1160.0],["06-21",1172.0],["06-22",1198.0],["06-23",1171.0],["06-26",1176.0],["06-27",1186.0],["06-28",1184.0],["06-29",1185.0],["06-30",1212.0],["07-03",1243.0],["07-04",1234.0],["07-05",1227.0],["07-06",1226.0],["07-07",1232.0],["07-10",1222.0],["07-11",1230.0],["07-12",1253.0],["07-13",1250.0],["07-14",1248.0],["07-17",1252.0],["07-18",1230.0],["07-19",1211.0],["07-20",1222.0],["07-21",1213.0],["07-24",1204.0],["07-25",1219.0],["07-26",1220.0],["07-27",1231.0],["07-28",1218.0],["07-31",1227.0],["08-01",1227.0],["08-02",1247.0],["08-03",1240.0],["08-04",1240.0],["08-07",1248.0],["08-08",1240.0],["08-09",1236.0],["08-10",1251.0],["08-11",1243.0],["08-14",1229.0],["08-15",1223.0],["08-16",1230.0],["08-17",1240.0],["08-18",1216.0],["08-21",1227.0],["08-22",1233.0],["08-23",1227.0],["08-24",1228.0],["08-25",1223.0],["08-29",1221.0],["08-30",1227.0],["08-31",1240.0],["09-01",1244.0],["09-04",1246.0],["09-05",1261.0],["09-06",1263.0],["09-07",1258.0],["09-08",1244.0],["09-11",1212.0],["09-12",1207.0],["09-13",1180.0],["09-14",1190.0],["09-15",1161.0],["09-18",1161.0],["09-19",1162.0],["09-20",1132.0],["09-21",1132.0],["09-22",1146.0],["09-25",1133.0],["09-26",1131.0],["09-27",1142.0],["09-28",1150.0],["09-29",1144.0],["10-02",1150.0],["10-03",1128.0],["10-04",1108.0],["10-05",1080.0],["10-06",1080.0],["10-09",1087.0],["10-10",1084.0],["10-11",1064.0],["10-12",1074.0],["10-13",1072.0],["10-16",1084.0],["10-17",1094.0],["10-18",1086.0],["10-19",1081.0],["10-20",1083.0],["10-23",1074.0],["10-24",1065.0],["10-25",1066.0],["10-26",1076.0],["10-27",1072.0],["10-30",1088.0],["10-31",1074.0],["11-01",1086.0],["11-02",1096.0],["11-03",1207.0],["11-06",1188.0],["11-07",1173.0],["11-08",1180.0],["11-09",1164.0],["11-10",1227.0],["11-13",1202.0],["11-14",1180.0],["11-15",1179.0],["11-16",1176.0],["11-17",1155.0],["11-20",1262.0],["11-21",1390.0],["11-22",1160.0],["11-23",1160.0],["11-24",1180.0],["11-27",1185.0],["11-28",1155.0],["11-29",1155.0],["11-30",1160.0],["12-01",1175.0],["12-04",1160.0],["12-05",1130.0],["12-06",1124.0],["12-07",1121.0],["12-08",1122.0],["12-11",1110.0],["12-12",1112.0],["12-13",1110.0],["12-14",1106.0],["12-15",1106.0],["12-18",1102.0],["12-19",1107.0],["12-20",1122.0],["12-21",1119.0],["12-22",1121.0],["12-27",1122.0],["12-28",1118.0],["12-29",1117.0]],"Silver":[["01-03",9.04],["01-04",9.14],["01-05",8.99],["01-06",8.83],["01-09",9.1],["01-10",9.04],["01-11",8.9],["01-12",9.0],["01-13",9.01],["01-16",9.19],["01-17",9.04],["01-18",8.88],["01-19",8.9],["01-20",9.08],["01-23",8.93],["01-24",9.0],["01-25",9.43],["01-26",9.49],["01-27",9.69],["01-30",9.65],["01-31",9.91],["02-01",9.77],["02-02",9.82],["02-03",9.81],["02-06",9.76],["02-07",9.72],["02-08",9.28],["02-09",9.5],["02-10",9.55],["02-13",9.26],["02-14",9.22],["02-15",9.32],["02-16",9.2],["02-17",9.46],["02-20",9.54],["02-21",9.49],["02-22",9.53],["02-23",9.57],["02-24",9.54],["02-27",9.66],["02-28",9.7],["03-01",9.8],["03-02",9.79],["03-03",10.26],["03-06",10.22],["03-07",9.99],["03-08",9.95],["03-09",9.88],["03-10",9.86],["03-13",10.02],["03-14",10.06],["03-15",10.25],["03-16",10.28],["03-17",10.37],["03-20",10.34],["03-21",10.28],["03-22",10.53],["03-23",10.5],["03-24",10.68],["03-27",10.89],["03-28",10.81],["03-29",10.88],["03-30",11.45],["03-31",11.76],["04-03",11.59],["04-04",11.74],["04-05",11.65],["04-06",12.03],["04-07",12.16],["04-10",12.42],["04-11",12.67],["04-12",12.75],["04-13",12.61],["04-18",13.63],["04-19",14.27],["04-20",14.31],["04-21",12.19],["04-24",12.78],["04-25",12.46],["04-26",12.72],["04-27",12.52],["04-28",12.55],["05-02",13.92],["05-03",14.42],["05-04",13.69],["05-05",14.07],["05-08",13.75],["05-09",13.89],["05-10",14.34],["05-11",14.43],["05-12",14.94],["05-15",13.25],["05-16",13.22],["05-17",13.82],["05-18",13.12],["05-19",12.43],["05-22",12.16],["05-23",12.87],["05-24",12.8],["05-25",12.57],["05-26",12.7],["05-30",12.9],["05-31",13.13],["06-01",12.05],["06-02",12.15],["06-05",12.37],["06-06",11.87],["06-07",11.46],["06-08",11.55],["06-09",11.41],["06-12",11.02],["06-13",10.47],["06-14",9.72],["06-15",10.15],["06-16",10.28],["06-19",9.89],["06-20",10.15],["06-21",10.27],["06-22",10.54],["06-23",10.09],["06-26",10.36],["06-27",10.26],["06-28",10.38],["06-29",10.38],["06-30",10.7],["07-03",11.28],["07-04",11.23],["07-05",11.45],["07-06",11.31],["07-07",11.51],["07-10",11.04],["07-11",11.29],["07-12",11.75],["07-13",11.62],["07-14",11.63],["07-17",11.5],["07-18",11.01],["07-19",10.52],["07-20",11.08],["07-21",11.01],["07-24",10.74],["07-25",11.01],["07-26",10.9],["07-27",11.22],["07-28",11.34],["07-31",11.44],["08-01",11.36],["08-02",11.75],["08-03",12.06],["08-04",12.2],["08-07",12.45],["08-08",12.13],["08-09",12.27],["08-10",12.43],["08-11",12.28],["08-14",11.76],["08-15",11.99],["08-16",12.15],["08-17",12.28],["08-18",12.01],["08-21",12.24],["08-22",12.2],["08-23",12.42],["08-24",12.58],["08-25",12.4],["08-29",12.14],["08-30",12.22],["08-31",12.6],["09-01",12.75],["09-04",12.99],["09-05",13.15],["09-06",12.95],["09-07",13.06],["09-08",12.29],["09-11",11.76],["09-12",11.34],["09-13",11.0],["09-14",11.35],["09-15",10.7],["09-18",10.97],["09-19",10.91],["09-20",10.74],["09-21",11.02],["09-22",11.28],["09-25",11.05],["09-26",11.11],["09-27",11.58],["09-28",11.66],["09-29",11.55],["10-02",11.58],["10-03",11.34],["10-04",10.82],["10-05",10.96],["10-06",11.01],["10-09",11.34],["10-10",11.21],["10-11",11.14],["10-12",11.3],["10-13",11.4],["10-16",11.72],["10-17",11.85],["10-18",11.76],["10-19",11.62],["10-20",11.98],["10-23",11.71],["10-24",11.57],["10-25",11.75],["10-26",11.97],["10-27",12.05],["10-30",12.13],["10-31",12.08],["11-01",12.36],["11-02",12.41],["11-03",12.62],["11-06",12.51],["11-07",12.62],["11-08",12.61],["11-09",12.6],["11-10",13.03],["11-13",12.86],["11-14",12.85],["11-15",12.69],["11-16",12.94],["11-17",12.75],["11-20",12.92],["11-21",12.92],["11-22",13.07],["11-23",13.12],["11-24",13.37],["11-27",13.48],["11-28",13.44],["11-29",13.65],["11-30",13.68],["12-01",13.85],["12-04",14.05],["12-05",14.04],["12-06",13.68],["12-07",13.67],["12-08",13.84],["12-11",13.72],["12-12",13.85],["12-13",13.79],["12-14",13.77],["12-15",13.73],["12-18",12.97],["12-19",12.46],["12-20",12.8],["12-21",12.52],["12-22",12.5],["12-27",12.86],["12-28",12.84],["12-29",12.9]]},"2007":{"Gold":[["01-02",640.75],["01-03",636.75],["01-04",625.25],["01-05",626.0],["01-08",608.3],["01-09",612.0],["01-10",610.75],["01-11",613.5],["01-12",614.1],["01-15",628.25],["01-16",625.6],["01-17",623.25],["01-18",632.8],["01-19",629.0],["01-22",635.1],["01-23",637.5],["01-24",643.0],["01-25",648.75],["01-26",645.7],["01-29",643.4],["01-30",642.25],["01-31",645.75],["02-01",652.55],["02-02",654.75],["02-05",648.0],["02-06",653.9],["02-07",655.25],["02-08",650.55],["02-09",657.85],["02-12",663.35],["02-13",664.75],["02-14",668.25],["02-15",670.0],["02-16",665.25],["02-19",670.5],["02-20",668.6],["02-21",658.6],["02-22",676.4],["02-23",677.5],["02-26",684.5],["02-27",684.5],["02-28",677.0],["03-01",673.6],["03-02",664.0],["03-05",638.6],["03-06",644.6],["03-07",646.35],["03-08",653.75],["03-09",653.85],["03-12",652.5],["03-13",650.5],["03-14",640.75],["03-15",646.1],["03-16",650.65],["03-19",654.5],["03-20",654.4],["03-21",660.5],["03-22",664.0],["03-23",662.15],["03-26",659.65],["03-27",665.15],["03-28",665.6],["03-29",664.9],["03-30",663.5],["04-02",663.3],["04-03",663.5],["04-04",665.9],["04-05",672.6],["04-10",676.85],["04-11",679.1],["04-12",678.5],["04-13",677.0],["04-16",687.25],["04-17",688.0],["04-18",690.4],["04-19",687.25],["04-20",687.6],["04-23",691.0],["04-24",689.7],["04-25",686.2],["04-26",685.5],["04-27",672.5],["04-30",678.0],["05-01",677.5],["05-02",673.25],["05-03",675.9],["05-04",680.8],["05-08",685.9],["05-09",686.5],["05-10",677.85],["05-11",667.85],["05-14",674.2],["05-15",667.0],["05-16",670.9],["05-17",663.2],["05-18",660.75],["05-21",662.4],["05-22",663.5],["05-23",659.2],["05-24",661.5],["05-25",655.0],["05-29",657.6],["05-30",657.1],["05-31",656.6],["06-01",662.5],["06-04",670.75],["06-05",671.3],["06-06",669.8],["06-07",670.85],["06-08",656.75],["06-11",652.75],["06-12",652.8],["06-13",644.1],["06-14",650.75],["06-15",650.6],["06-18",658.0],["06-19",655.1],["06-20",659.6],["06-21",654.5],["06-22",652.0],["06-25",651.25],["06-26",649.55],["06-27",642.85],["06-28",645.7],["06-29",648.5],["07-02",650.5],["07-03",657.25],["07-04",654.0],["07-05",655.9],["07-06",647.75],["07-09",657.0],["07-10",661.15],["07-11",664.0],["07-12",663.0],["07-13",667.5],["07-16",667.25],["07-17",663.15],["07-18",667.75],["07-19",673.0],["07-20",676.0],["07-23",683.5],["07-24",682.75],["07-25",677.25],["07-26",675.4],["07-27",663.5],["07-30",661.5],["07-31",666.75],["08-01",660.25],["08-02",665.35],["08-03",666.35],["08-06",674.15],["08-07",669.25],["08-08",670.4],["08-09",670.85],["08-10",664.5],["08-13",669.85],["08-14",667.35],["08-15",665.0],["08-16",664.15],["08-17",653.0],["08-20",658.5],["08-21",655.5],["08-22",657.15],["08-23",662.25],["08-24",659.75],["08-28",667.0],["08-29",664.75],["08-30",666.3],["08-31",668.0],["09-03",672.75],["09-04",673.5],["09-05",679.5],["09-06",683.5],["09-07",695.0],["09-10",704.0],["09-11",704.25],["09-12",711.75],["09-13",708.1],["09-14",706.75],["09-17",710.25],["09-18",717.7],["09-19",723.75],["09-20",727.75],["09-21",735.35],["09-24",733.25],["09-25",727.7],["09-26",730.55],["09-27",729.75],["09-28",737.75],["10-01",745.25],["10-02",735.75],["10-03",733.15],["10-04",726.75],["10-05",735.85],["10-08",736.5],["10-09",728.8],["10-10",740.5],["10-11",747.5],["10-12",748.5],["10-15",755.85],["10-16",761.75],["10-17",759.75],["10-18",758.35],["10-19",768.25],["10-22",755.6],["10-23",757.5],["10-24",757.35],["10-25",765.0],["10-26",775.6],["10-29",792.5],["10-30",784.0],["10-31",783.0],["11-01",792.0],["11-02",790.75],["11-05",802.5],["11-06",817.55],["11-07",841.75],["11-08",832.25],["11-09",836.0],["11-12",817.0],["11-13",803.4],["11-14",808.25],["11-15",806.0],["11-16",790.25],["11-19",788.5],["11-20",789.65],["11-21",796.25],["11-22",802.25],["11-23",810.5],["11-26",836.25],["11-27",823.25],["11-28",796.5],["11-29",807.25],["11-30",794.75],["12-03",783.75],["12-04",790.25],["12-05",801.75],["12-06",788.75],["12-07",799.75],["12-10",800.0],["12-11",806.75],["12-12",807.5],["12-13",809.0],["12-14",796.25],["12-17",787.0],["12-18",796.25],["12-19",801.5],["12-20",799.5],["12-21",803.0],["12-24",810.25],["12-27",822.5],["12-28",828.5],["12-31",836.5]],"Palladium":[["01-02",332.0],["01-03",335.0],["01-04",335.0],["01-05",343.0],["01-08",330.0],["01-09",334.0],["01-10",332.0],["01-11",328.0],["01-12",329.0],["01-15",332.0],["01-16",331.0],["01-17",332.0],["01-18",337.0],["01-19",337.0],["01-22",340.0],["01-23",345.0],["01-24",345.0],["01-25",347.0],["01-26",348.0],["01-29",344.0],["01-30",335.0],["01-31",336.0],["02-01",339.0],["02-02",338.0],["02-05",335.0],["02-06",341.0],["02-07",344.0],["02-08",339.0],["02-09",341.0],["02-12",338.0],["02-13",337.0],["02-14",341.0],["02-15",341.5],["02-16",338.0],["02-19",341.0],["02-20",337.5],["02-21",335.0],["02-22",343.0],["02-23",347.0],["02-26",354.0],["02-27",353.0],["02-28",350.0],["03-01",351.0],["03-02",347.0],["03-05",338.0],["03-06",344.0],["03-07",345.0],["03-08",348.0],["03-09",352.0],["03-12",351.0],["03-13",351.0],["03-14",346.0],["03-15",349.0],["03-16",351.0],["03-19",352.0],["03-20",350.0],["03-21",351.0],["03-22",353.0],["03-23",353.0],["03-26",354.0],["03-27",353.0],["03-28",353.5],["03-29",352.0],["03-30",353.0],["04-02",353.0],["04-03",351.0],["04-04",354.0],["04-05",353.0],["04-10",357.0],["04-11",362.0],["04-12",373.0],["04-13",369.0],["04-16",376.0],["04-17",371.0],["04-18",374.0],["04-19",377.0],["04-20",381.0],["04-23",380.0],["04-24",381.0],["04-25",377.0],["04-26",379.0],["04-27",368.0],["04-30",370.0],["05-01",368.0],["05-02",371.0],["05-03",372.0],["05-04",374.0],["05-08",375.0],["05-09",374.0],["05-10",365.0],["05-11",361.0],["05-14",367.0],["05-15",360.0],["05-16",360.0],["05-17",362.0],["05-18",362.0],["05-21",364.0],["05-22",374.0],["05-23",373.0],["05-24",372.0],["05-25",367.5],["05-29",368.0],["05-30",366.5],["05-31",367.0],["06-01",368.0],["06-04",369.0],["06-05",369.0],["06-06",365.0],["06-07",367.5],["06-08",366.0],["06-11",367.0],["06-12",366.0],["06-13",363.5],["06-14",369.0],["06-15",367.0],["06-18",370.0],["06-19",368.5],["06-20",371.0],["06-21",375.0],["06-22",375.0],["06-25",373.5],["06-26",369.0],["06-27",366.0],["06-28",365.5],["06-29",365.0],["07-02",367.0],["07-03",366.0],["07-04",364.0],["07-05",365.0],["07-06",362.5],["07-09",365.0],["07-10",367.0],["07-11",367.0],["07-12",368.0],["07-13",369.0],["07-16",367.5],["07-17",367.0],["07-18",365.0],["07-19",369.0],["07-20",370.0],["07-23",369.75],["07-24",369.0],["07-25",365.0],["07-26",365.0],["07-27",364.0],["07-30",362.0],["07-31",365.0],["08-01",362.0],["08-02",364.0],["08-03",363.0],["08-06",364.0],["08-07",361.0],["08-08",362.0],["08-09",362.0],["08-10",359.0],["08-13",353.0],["08-14",351.0],["08-15",349.0],["08-16",344.0],["08-17",335.0],["08-20",331.0],["08-21",326.0],["08-22",320.0],["08-23",327.0],["08-24",324.0],["08-28",329.0],["08-29",326.0],["08-30",330.5],["08-31",329.0],["09-03",330.0],["09-04",331.0],["09-05",333.0],["09-06",333.0],["09-07",335.0],["09-10",334.5],["09-11",335.0],["09-12",335.0],["09-13",332.0],["09-14",331.0],["09-17",331.0],["09-18",330.5],["09-19",333.0],["09-20",334.0],["09-21",339.5],["09-24",341.0],["09-25",340.0],["09-26",338.0],["09-27",340.0],["09-28",344.0],["10-01",348.0],["10-02",352.0],["10-03",350.0],["10-04",358.0],["10-05",368.0],["10-08",365.0],["10-09",358.0],["10-10",365.5],["10-11",379.0],["10-12",376.0],["10-15",380.0],["10-16",370.0],["10-17",367.0],["10-18",370.0],["10-19",371.0],["10-22",359.0],["10-23",363.0],["10-24",359.0],["10-25",360.0],["10-26",373.0],["10-29",374.0],["10-30",368.0],["10-31",368.0],["11-01",372.0],["11-02",368.0],["11-05",372.5],["11-06",373.5],["11-07",379.0],["11-08",371.0],["11-09",371.0],["11-12",367.0],["11-13",366.0],["11-14",369.0],["11-15",366.0],["11-16",369.0],["11-19",364.0],["11-20",362.0],["11-21",362.0],["11-22",355.5],["11-23",354.0],["11-26",359.5],["11-27",356.0],["11-28",343.0],["11-29",346.0],["11-30",347.0],["12-03",347.0],["12-04",347.0],["12-05",348.0],["12-06",347.0],["12-07",344.0],["12-10",345.0],["12-11",345.0],["12-12",347.0],["12-13",347.0],["12-14",346.0],["12-17",350.0],["12-18",355.0],["12-19",354.0],["12-20",354.0],["12-21",354.0],["12-24",354.5],["12-27",364.0],["12-28",361.0],["12-31",365.0]],"Platinum":[["01-02",1136.0],["01-03",1132.0],["01-04",1124.0],["01-05",1127.0],["01-08",1112.0],["01-09",1124.0],["01-10",1134.0],["01-11",1141.0],["01-12",1140.0],["01-15",1149.0],["01-16",1140.0],["01-17",1139.0],["01-18",1158.0],["01-19",1150.0],["01-22",1162.0],["01-23",1165.0],["01-24",1163.0],["01-25",1172.0],["01-26",1172.0],["01-29",1168.0],["01-30",1162.0],["01-31",1171.0],["02-01",1183.0],["02-02",1174.0],["02-05",1166.0],["02-06",1180.0],["02-07",1189.0],["02-08",1184.0],["02-09",1200.0],["02-12",1195.0],["02-13",1193.0],["02-14",1216.0],["02-15",1213.0],["02-16",1198.0],["02-19",1218.0],["02-20",1213.0],["02-21",1206.0],["02-22",1222.0],["02-23",1225.0],["02-26",1242.0],["02-27",1238.0],["02-28",1253.0],["03-01",1243.0],["03-02",1225.0],["03-05",1185.0],["03-06",1189.0],["03-07",1183.0],["03-08",1197.0],["03-09",1203.0],["03-12",1204.0],["03-13",1207.0],["03-14",1209.0],["03-15",1214.0],["03-16",1217.0],["03-19",1225.0],["03-20",1225.0],["03-21",1232.0],["03-22",1236.0],["03-23",1230.0],["03-26",1231.0],["03-27",1237.0],["03-28",1244.0],["03-29",1240.0],["03-30",1246.0],["04-02",1241.0],["04-03",1244.0],["04-04",1245.0],["04-05",1250.0],["04-10",1257.0],["04-11",1262.0],["04-12",1270.0],["04-13",1265.0],["04-16",1282.0],["04-17",1268.0],["04-18",1281.0],["04-19",1289.0],["04-20",1310.0],["04-23",1323.0],["04-24",1325.0],["04-25",1305.0],["04-26",1310.0],["04-27",1280.0],["04-30",1281.0],["05-01",1288.0],["05-02",1287.0],["05-03",1294.0],["05-04",1300.0],["05-08",1331.0],["05-09",1336.0],["05-10",1323.0],["05-11",1317.0],["05-14",1336.0],["05-15",1323.0],["05-16",1328.0],["05-17",1317.0],["05-18",1310.0],["05-21",1309.0],["05-22",1299.0],["05-23",1290.0],["05-24",1294.0],["05-25",1282.0],["05-29",1270.0],["05-30",1264.0],["05-31",1272.0],["06-01",1287.0],["06-04",1290.0],["06-05",1296.0],["06-06",1296.0],["06-07",1302.0],["06-08",1291.0],["06-11",1290.0],["06-12",1292.0],["06-13",1278.0],["06-14",1281.0],["06-15",1280.0],["06-18",1294.0],["06-19",1289.0],["06-20",1292.0],["06-21",1288.0],["06-22",1293.0],["06-25",1295.0],["06-26",1281.0],["06-27",1267.0],["06-28",1275.0],["06-29",1275.0],["07-02",1272.0],["07-03",1284.0],["07-04",1282.0],["07-05",1287.0],["07-06",1287.0],["07-09",1296.0],["07-10",1296.0],["07-11",1306.0],["07-12",1306.0],["07-13",1313.0],["07-16",1313.0],["07-17",1306.0],["07-18",1312.0],["07-19",1322.0],["07-20",1324.0],["07-23",1332.0],["07-24",1328.0],["07-25",1320.0],["07-26",1321.0],["07-27",1313.0],["07-30",1280.0],["07-31",1292.0],["08-01",1275.0],["08-02",1284.0],["08-03",1284.0],["08-06",1296.0],["08-07",1282.0],["08-08",1282.0],["08-09",1280.0],["08-10",1274.0],["08-13",1273.0],["08-14",1273.0],["08-15",1261.0],["08-16",1255.0],["08-17",1238.0],["08-20",1246.0],["08-21",1243.0],["08-22",1237.0],["08-23",1245.5],["08-24",1238.0],["08-28",1257.0],["08-29",1256.0],["08-30",1263.0],["08-31",1269.0],["09-03",1271.0],["09-04",1272.0],["09-05",1275.0],["09-06",1279.0],["09-07",1287.0],["09-10",1295.0],["09-11",1295.0],["09-12",1305.0],["09-13",1297.0],["09-14",1288.0],["09-17",1300.0],["09-18",1299.0],["09-19",1307.0],["09-20",1313.0],["09-21",1336.0],["09-24",1335.0],["09-25",1336.0],["09-26",1345.0],["09-27",1343.0],["09-28",1361.0],["10-01",1382.0],["10-02",1356.0],["10-03",1353.0],["10-04",1352.0],["10-05",1366.0],["10-08",1370.0],["10-09",1355.0],["10-10",1374.0],["10-11",1396.0],["10-12",1404.0],["10-15",1425.0],["10-16",1415.0],["10-17",1416.0],["10-18",1443.0],["10-19",1454.0],["10-22",1434.0],["10-23",1443.0],["10-24",1440.0],["10-25",1442.0],["10-26",1453.0],["10-29",1462.0],["10-30",1446.0],["10-31",1438.0],["11-01",1448.0],["11-02",1439.5],["11-05",1453.0],["11-06",1464.5],["11-07",1476.0],["11-08",1454.0],["11-09",1452.0],["11-12",1416.0],["11-13",1402.0],["11-14",1435.0],["11-15",1424.5],["11-16",1429.0],["11-19",1456.0],["11-20",1459.0],["11-21",1469.0],["11-22",1467.0],["11-23",1470.0],["11-26",1484.0],["11-27",1466.0],["11-28",1420.0],["11-29",1446.0],["11-30",1443.0],["12-03",1450.0],["12-04",1460.0],["12-05",1472.0],["12-06",1458.0],["12-07",1458.0],["12-10",1459.0],["12-11",1462.0],["12-12",1467.0],["12-13",1478.0],["12-14",1467.0],["12-17",1476.0],["12-18",1500.0],["12-19",1510.0],["12-20",1512.0],["12-21",1513.0],["12-24",1526.0],["12-27",1534.0],["12-28",1529.0],["12-31",1529.0]],"Silver":[["01-02",13.01],["01-03",12.91],["01-04",12.62],["01-05",12.7],["01-08",12.21],["01-09",12.36],["01-10",12.45],["01-11",12.41],["01-12",12.43],["01-15",12.88],["01-16",12.84],["01-17",12.55],["01-18",12.84],["01-19",12.72],["01-22",12.87],["01-23",13.09],["01-24",13.2],["01-25",13.38],["01-26",13.22],["01-29",13.25],["01-30",13.15],["01-31",13.36],["02-01",13.58],["02-02",13.66],["02-05",13.29],["02-06",13.66],["02-07",13.65],["02-08",13.53],["02-09",13.84],["02-12",13.78],["02-13",13.79],["02-14",13.96],["02-15",13.98],["02-16",13.9],["02-19",14.03],["02-20",13.9],["02-21",13.74],["02-22",14.25],["02-23",14.28],["02-26",14.58],["02-27",14.49],["02-28",14.31],["03-01",14.29],["03-02",13.53],["03-05",12.61],["03-06",12.94],["03-07",12.89],["03-08",13.09],["03-09",13.07],["03-12",12.97],["03-13",12.92],["03-14",12.65],["03-15",12.9],["03-16",13.07],["03-19",13.16],["03-20",13.25],["03-21",13.33],["03-22",13.38],["03-23",13.37],["03-26",13.26],["03-27",13.34],["03-28",13.36],["03-29",13.34],["03-30",13.35],["04-02",13.34],["04-03",13.28],["04-04",13.45],["04-05",13.58],["04-10",13.84],["04-11",13.92],["04-12",13.84],["04-13",13.88],["04-16",14.09],["04-17",13.96],["04-18",13.96],["04-19",13.84],["04-20",13.87],["04-23",13.86],["04-24",14.03],["04-25",13.79],["04-26",13.66],["04-27",13.35],["04-30",13.5],["05-01",13.45],["05-02",13.18],["05-03",13.33],["05-04",13.4],["05-08",13.48],["05-09",13.45],["05-10",13.29],["05-11",13.04],["05-14",13.19],["05-15",13.02],["05-16",13.16],["05-17",12.9],["05-18",12.87],["05-21",12.93],["05-22",13.07],["05-23",12.96],["05-24",13.04],["05-25",12.93],["05-29",13.03],["05-30",13.11],["05-31",13.25],["06-01",13.53],["06-04",13.67],["06-05",13.71],["06-06",13.69],["06-07",13.65],["06-08",13.31],["06-11",13.16],["06-12",13.15],["06-13",12.86],["06-14",13.04],["06-15",13.06],["06-18",13.31],["06-19",13.19],["06-20",13.34],["06-21",13.17],["06-22",13.15],["06-25",12.96],["06-26",12.85],["06-27",12.26],["06-28",12.43],["06-29",12.54],["07-02",12.47],["07-03",12.6],["07-04",12.61],["07-05",12.6],["07-06",12.4],["07-09",12.74],["07-10",12.76],["07-11",12.95],["07-12",12.95],["07-13",13.12],["07-16",13.03],["07-17",12.9],["07-18",12.94],["07-19",13.25],["07-20",13.29],["07-23",13.34],["07-24",13.34],["07-25",13.18],["07-26",13.13],["07-27",12.75],["07-30",12.73],["07-31",12.93],["08-01",12.77],["08-02",12.96],["08-03",12.96],["08-06",13.1],["08-07",12.99],["08-08",13.03],["08-09",12.97],["08-10",12.69],["08-13",12.87],["08-14",12.76],["08-15",12.51],["08-16",12.37],["08-17",11.69],["08-20",11.95],["08-21",11.67],["08-22",11.68],["08-23",11.88],["08-24",11.7],["08-28",11.83],["08-29",11.8],["08-30",11.86],["08-31",11.95],["09-03",12.1],["09-04",12.1],["09-05",12.21],["09-06",12.24],["09-07",12.57],["09-10",12.56],["09-11",12.57],["09-12",12.66],["09-13",12.47],["09-14",12.5],["09-17",12.59],["09-18",12.96],["09-19",12.99],["09-20",13.17],["09-21",13.47],["09-24",13.62],["09-25",13.28],["09-26",13.44],["09-27",13.51],["09-28",13.65],["10-01",13.78],["10-02",13.28],["10-03",13.35],["10-04",13.22],["10-05",13.44],["10-08",13.29],["10-09",13.21],["10-10",13.62],["10-11",13.67],["10-12",13.79],["10-15",13.95],["10-16",13.66],["10-17",13.6],["10-18",13.68],["10-19",13.83],["10-22",13.35],["10-23",13.57],["10-24",13.44],["10-25",13.72],["10-26",14.07],["10-29",14.41],["10-30",14.18],["10-31",14.32],["11-01",14.36],["11-02",14.32],["11-05",14.49],["11-06",14.96],["11-07",15.82],["11-08",15.36],["11-09",15.15],["11-12",15.14],["11-13",14.68],["11-14",14.97],["11-15",14.82],["11-16",14.45],["11-19",14.52],["11-20",14.36],["11-21",14.55],["11-22",14.52],["11-23",14.55],["11-26",14.88],["11-27",14.65],["11-28",14.28],["11-29",14.38],["11-30",14.23],["12-03",13.86],["12-04",14.25],["12-05",14.34],["12-06",14.06],["12-07",14.44],["12-10",14.38],["12-11",14.62],["12-12",14.63],["12-13",14.61],["12-14",14.01],["12-17",13.74],["12-18",13.97],["12-19",13.98],["12-20",13.97],["12-21",14.28],["12-24",14.35],["12-27",14.67],["12-28",14.75],["12-31",14.76]]},"2008":{"Gold":[["01-02",840.75],["01-03",865.35],["01-04",858.75],["01-07",857.5],["01-08",873.25],["01-09",887.85],["01-10",874.25],["01-11",893.75],["01-14",911.5],["01-15",904.75],["01-16",881.0],["01-17",881.5],["01-18",872.75],["01-21",874.25],["01-22",862.0],["01-23",887.8],["01-24",891.5],["01-25",921.25],["01-28",916.5],["01-29",927.5],["01-30",923.75],["01-31",923.75],["02-01",933.0],["02-04",899.5],["02-05",889.75],["02-06",892.0],["02-07",908.25],["02-08",914.0],["02-11",925.5],["02-12",920.25],["02-13",905.75],["02-14",910.85],["02-15",909.75],["02-18",905.0],["02-19",916.5],["02-20",924.85],["02-21",943.0],["02-22",945.75],["02-25",947.5],["02-26",934.0],["02-27",958.75],["02-28",957.0],["02-29",969.0],["03-03",978.25],["03-04",981.75],["03-05",966.25],["03-06",986.25],["03-07",978.5],["03-10",973.15],["03-11",980.5],["03-12",975.75],["03-13",988.25],["03-14",997.0],["03-17",1023.5],["03-18",1005.75],["03-19",995.25],["03-20",913.5],["03-25",930.65],["03-26",945.75],["03-27",948.25],["03-28",944.5],["03-31",937.25],["04-01",897.0],["04-02",893.5],["04-03",898.25],["04-04",905.25],["04-07",914.7],["04-08",921.0],["04-09",906.75],["04-10",934.25],["04-11",925.5],["04-14",917.75],["04-15",931.75],["04-16",932.75],["04-17",951.5],["04-18",942.25],["04-21",915.75],["04-22",920.75],["04-23",916.25],["04-24",900.75],["04-25",883.5],["04-28",892.25],["04-29",886.0],["04-30",867.75],["05-01",863.5],["05-02",854.25],["05-06",878.0],["05-07",874.0],["05-08",872.25],["05-09",887.25],["05-12",882.5],["05-13",877.0],["05-14",863.0],["05-15",866.25],["05-16",885.0],["05-19",908.75],["05-20",907.0],["05-21",925.0],["05-22",928.25],["05-23",922.25],["05-27",923.75],["05-28",892.0],["05-29",893.0],["05-30",879.5],["06-02",891.25],["06-03",895.5],["06-04",877.25],["06-05",873.0],["06-06",883.5],["06-09",904.25],["06-10",884.5],["06-11",874.25],["06-12",871.25],["06-13",864.0],["06-16",872.0],["06-17",883.0],["06-18",884.0],["06-19",893.25],["06-20",900.0],["06-23",905.25],["06-24",888.5],["06-25",887.25],["06-26",892.5],["06-27",923.0],["06-30",932.75],["07-01",929.5],["07-02",936.0],["07-03",939.75],["07-04",930.75],["07-07",921.0],["07-08",929.25],["07-09",923.25],["07-10",930.75],["07-11",949.0],["07-14",957.75],["07-15",981.75],["07-16",974.0],["07-17",964.5],["07-18",961.5],["07-21",966.25],["07-22",973.0],["07-23",934.75],["07-24",927.75],["07-25",932.25],["07-28",929.25],["07-29",928.75],["07-30",914.1],["07-31",912.0],["08-01",909.5],["08-04",910.0],["08-05",884.0],["08-06",884.75],["08-07",882.5],["08-08",864.5],["08-11",863.75],["08-12",808.75],["08-13",824.0],["08-14",833.25],["08-15",784.75],["08-18",797.5],["08-19",791.0],["08-20",806.75],["08-21",821.0],["08-22",830.0],["08-26",809.75],["08-27",833.5],["08-28",832.0],["08-29",836.5],["09-01",832.0],["09-02",802.5],["09-03",794.5],["09-04",810.5],["09-05",796.25],["09-08",806.5],["09-09",799.75],["09-10",774.25],["09-11",742.75],["09-12",757.5],["09-15",779.25],["09-16",779.75],["09-17",785.5],["09-18",864.25],["09-19",837.5],["09-22",873.0],["09-23",892.5],["09-24",888.5],["09-25",889.0],["09-26",869.0],["09-29",876.5],["09-30",897.0],["10-01",876.0],["10-02",866.25],["10-03",842.5],["10-06",836.5],["10-07",881.75],["10-08",913.0],["10-09",886.75],["10-10",918.0],["10-13",865.0],["10-14",849.5],["10-15",848.5],["10-16",834.5],["10-17",801.0],["10-20",803.0],["10-21",781.0],["10-22",757.5],["10-23",726.0],["10-24",692.5],["10-27",720.5],["10-28",745.0],["10-29",749.25],["10-30",772.25],["10-31",728.5],["11-03",734.0],["11-04",734.0],["11-05",753.25],["11-06",739.0],["11-07",742.0],["11-10",751.75],["11-11",741.75],["11-12",731.5],["11-13",714.0],["11-14",729.5],["11-17",745.0],["11-18",736.5],["11-19",737.75],["11-20",745.25],["11-21",758.5],["11-24",816.75],["11-25",802.5],["11-26",817.0],["11-27",813.5],["11-28",813.5],["12-01",795.5],["12-02",772.5],["12-03",773.5],["12-04",772.75],["12-05",771.75],["12-08",772.25],["12-09",771.0],["12-10",785.75],["12-11",821.0],["12-12",813.75],["12-15",827.5],["12-16",833.5],["12-17",853.75],["12-18",872.5],["12-19",839.0],["12-22",846.0],["12-23",844.0],["12-24",836.75],["12-29",881.0],["12-30",870.0],["12-31",865.0]],"Palladium":[["01-02",370.0],["01-03",371.0],["01-04",372.0],["01-07",367.0],["01-08",374.5],["01-09",377.0],["01-10",373.0],["01-11",376.0],["01-14",382.0],["01-15",379.0],["01-16",375.0],["01-17",373.0],["01-18",368.0],["01-21",368.0],["01-22",363.0],["01-23",367.0],["01-24",368.0],["01-25",381.0],["01-28",379.0],["01-29",384.0],["01-30",388.0],["01-31",382.0],["02-01",402.0],["02-04",419.5],["02-05",415.0],["02-06",412.0],["02-07",428.0],["02-08",429.0],["02-11",440.0],["02-12",438.0],["02-13",424.0],["02-14",438.5],["02-15",438.0],["02-18",452.5],["02-19",484.0],["02-20",469.0],["02-21",507.0],["02-22",504.0],["02-25",514.0],["02-26",514.0],["02-27",554.0],["02-28",544.0],["02-29",568.0],["03-03",577.0],["03-04",588.0],["03-05",551.0],["03-06",549.0],["03-07",514.0],["03-10",486.0],["03-11",469.0],["03-12",485.0],["03-13",514.0],["03-14",507.0],["03-17",490.0],["03-18",477.0],["03-19",476.0],["03-20",425.0],["03-25",440.0],["03-26",453.0],["03-27",451.0],["03-28",447.0],["03-31",445.0],["04-01",434.0],["04-02",438.0],["04-03",443.0],["04-04",438.0],["04-07",442.0],["04-08",454.0],["04-09",449.0],["04-10",459.0],["04-11",462.0],["04-14",456.0],["04-15",460.0],["04-16",451.0],["04-17",463.0],["04-18",459.0],["04-21",455.0],["04-22",455.0],["04-23",455.0],["04-24",444.0],["04-25",437.0],["04-28",440.0],["04-29",431.0],["04-30",417.0],["05-01",418.0],["05-02",408.0],["05-06",426.0],["05-07",427.0],["05-08",430.0],["05-09",442.0],["05-12",437.0],["05-13",439.0],["05-14",433.0],["05-15",431.0],["05-16",437.0],["05-19",453.0],["05-20",445.0],["05-21",449.0],["05-22",455.0],["05-23",453.0],["05-27",450.0],["05-28",437.0],["05-29",436.0],["05-30",424.0],["06-02",430.0],["06-03",438.0],["06-04",431.0],["06-05",427.0],["06-06",432.0],["06-09",437.0],["06-10",423.5],["06-11",427.0],["06-12",426.0],["06-13",438.0],["06-16",448.0],["06-17",464.0],["06-18",460.0],["06-19",464.0],["06-20",471.0],["06-23",473.0],["06-24",470.0],["06-25",465.0],["06-26",467.0],["06-27",470.0],["06-30",468.0],["07-01",467.0],["07-02",468.0],["07-03",468.0],["07-04",456.0],["07-07",452.0],["07-08",450.0],["07-09",442.0],["07-10",446.0],["07-11",455.0],["07-14",450.0],["07-15",450.0],["07-16",438.0],["07-17",432.0],["07-18",423.0],["07-21",420.0],["07-22",422.0],["07-23",392.0],["07-24",389.0],["07-25",390.0],["07-28",387.0],["07-29",389.0],["07-30",385.0],["07-31",378.0],["08-01",375.0],["08-04",367.0],["08-05",349.0],["08-06",363.0],["08-07",354.0],["08-08",345.0],["08-11",335.0],["08-12",310.0],["08-13",316.0],["08-14",322.0],["08-15",286.0],["08-18",286.0],["08-19",274.0],["08-20",285.0],["08-21",288.0],["08-22",292.0],["08-26",290.0],["08-27",293.0],["08-28",292.0],["08-29",299.0],["09-01",304.0],["09-02",291.0],["09-03",287.0],["09-04",295.0],["09-05",275.0],["09-08",273.0],["09-09",250.0],["09-10",232.0],["09-11",218.0],["09-12",245.0],["09-15",244.0],["09-16",227.0],["09-17",226.0],["09-18",238.0],["09-19",229.0],["09-22",246.0],["09-23",253.0],["09-24",253.0],["09-25",249.0],["09-26",237.0],["09-29",221.0],["09-30",203.0],["10-01",207.0],["10-02",207.0],["10-03",203.0],["10-06",198.0],["10-07",202.0],["10-08",202.0],["10-09",200.0],["10-10",197.0],["10-13",199.0],["10-14",204.0],["10-15",200.0],["10-16",186.0],["10-17",171.0],["10-20",178.0],["10-21",182.0],["10-22",179.0],["10-23",175.0],["10-24",172.0],["10-27",168.0],["10-28",175.0],["10-29",189.0],["10-30",202.0],["10-31",196.0],["11-03",199.0],["11-04",203.0],["11-05",212.0],["11-06",225.0],["11-07",231.0],["11-10",228.0],["11-11",223.0],["11-12",218.0],["11-13",212.5],["11-14",218.0],["11-17",217.0],["11-18",216.0],["11-19",216.0],["11-20",183.0],["11-21",184.0],["11-24",185.0],["11-25",193.0],["11-26",195.0],["11-27",191.0],["11-28",186.0],["12-01",181.0],["12-02",171.5],["12-03",170.0],["12-04",172.0],["12-05",174.0],["12-08",178.0],["12-09",173.0],["12-10",177.0],["12-11",183.0],["12-12",174.0],["12-15",174.0],["12-16",175.0],["12-17",178.0],["12-18",180.0],["12-19",177.0],["12-22",177.0],["12-23",173.0],["12-24",175.0],["12-29",182.0],["12-30",183.5],["12-31",183.5]],"Platinum":[["01-02",1530.0],["01-03",1546.0],["01-04",1545.0],["01-07",1529.0],["01-08",1541.0],["01-09",1555.0],["01-10",1542.0],["01-11",1565.0],["01-14",1589.0],["01-15",1580.0],["01-16",1564.0],["01-17",1561.0],["01-18",1549.0],["01-21",1553.0],["01-22",1522.0],["01-23",1554.0],["01-24",1580.0],["01-25",1649.0],["01-28",1664.0],["01-29",1716.0],["01-30",1686.0],["01-31",1687.0],["02-01",1741.0],["02-04",1783.0],["02-05",1766.0],["02-06",1784.0],["02-07",1852.0],["02-08",1844.0],["02-11",1898.0],["02-12",1951.0],["02-13",1907.0],["02-14",2010.0],["02-15",2025.0],["02-18",2088.0],["02-19",2160.0],["02-20",2080.0],["02-21",2170.0],["02-22",2160.0],["02-25",2161.0],["02-26",2113.0],["02-27",2158.0],["02-28",2093.0],["02-29",2153.0],["03-03",2162.0],["03-04",2276.0],["03-05",2232.0],["03-06",2249.0],["03-07",2147.0],["03-10",2044.0],["03-11",2028.0],["03-12",2024.0],["03-13",2090.0],["03-14",2100.0],["03-17",2000.0],["03-18",1994.0],["03-19",1961.0],["03-20",1824.0],["03-25",1918.0],["03-26",1983.0],["03-27",2007.0],["03-28",2037.0],["03-31",2032.0],["04-01",1938.0],["04-02",1942.0],["04-03",1974.0],["04-04",1988.0],["04-07",2023.0],["04-08",2020.0],["04-09",1983.0],["04-10",2031.0],["04-11",2015.0],["04-14",1949.0],["04-15",1998.0],["04-16",1972.0],["04-17",2065.0],["04-18",2062.0],["04-21",2030.0],["04-22",1996.0],["04-23",2018.0],["04-24",1993.0],["04-25",1932.0],["04-28",1969.0],["04-29",1955.0],["04-30",1923.0],["05-01",1917.0],["05-02",1855.0],["05-06",1930.0],["05-07",1945.0],["05-08",1981.0],["05-09",2082.0],["05-12",2045.0],["05-13",2073.0],["05-14",2010.0],["05-15",2012.0],["05-16",2092.0],["05-19",2168.0],["05-20",2157.0],["05-21",2179.0],["05-22",2192.0],["05-23",2179.0],["05-27",2175.0],["05-28",2072.0],["05-29",2050.0],["05-30",1976.0],["06-02",1993.0],["06-03",2035.0],["06-04",2000.0],["06-05",1990.0],["06-06",2045.0],["06-09",2066.0],["06-10",2015.0],["06-11",2026.0],["06-12",2020.0],["06-13",2031.0],["06-16",2030.0],["06-17",2063.0],["06-18",2080.0],["06-19",2075.0],["06-20",2056.0],["06-23",2060.0],["06-24",2047.0],["06-25",2023.0],["06-26",2046.0],["06-27",2075.0],["06-30",2077.0],["07-01",2075.0],["07-02",2075.0],["07-03",2064.0],["07-04",2022.0],["07-07",1986.0],["07-08",2002.0],["07-09",1966.0],["07-10",1980.0],["07-11",2040.0],["07-14",2021.0],["07-15",2015.0],["07-16",1956.0],["07-17",1948.0],["07-18",1872.0],["07-21",1872.0],["07-22",1877.0],["07-23",1778.0],["07-24",1736.0],["07-25",1750.0],["07-28",1752.0],["07-29",1766.0],["07-30",1762.0],["07-31",1753.0],["08-01",1717.0],["08-04",1631.0],["08-05",1550.0],["08-06",1597.0],["08-07",1592.0],["08-08",1574.0],["08-11",1570.0],["08-12",1490.0],["08-13",1510.0],["08-14",1532.0],["08-15",1390.0],["08-18",1382.0],["08-19",1313.0],["08-20",1357.0],["08-21",1397.0],["08-22",1455.0],["08-26",1423.0],["08-27",1437.0],["08-28",1446.0],["08-29",1475.0],["09-01",1451.0],["09-02",1392.0],["09-03",1386.0],["09-04",1423.0],["09-05",1365.0],["09-08",1365.0],["09-09",1285.0],["09-10",1200.0],["09-11",1152.0],["09-12",1183.0],["09-15",1200.0],["09-16",1120.0],["09-17",1097.0],["09-18",1118.0],["09-19",1083.0],["09-22",1193.0],["09-23",1225.0],["09-24",1225.0],["09-25",1195.0],["09-26",1147.0],["09-29",1107.0],["09-30",1047.0],["10-01",1040.0],["10-02",985.0],["10-03",962.0],["10-06",959.0],["10-07",1002.0],["10-08",999.0],["10-09",1003.0],["10-10",1019.0],["10-13",986.0],["10-14",1031.0],["10-15",1006.0],["10-16",917.0],["10-17",868.0],["10-20",912.0],["10-21",887.0],["10-22",852.0],["10-23",837.0],["10-24",768.0],["10-27",756.0],["10-28",796.0],["10-29",797.0],["10-30",856.0],["10-31",790.0],["11-03",838.0],["11-04",824.0],["11-05",843.0],["11-06",862.0],["11-07",865.0],["11-10",875.0],["11-11",844.0],["11-12",831.0],["11-13",834.0],["11-14",840.0],["11-17",842.0],["11-18",822.0],["11-19",837.0],["11-20",803.0],["11-21",809.0],["11-24",834.0],["11-25",854.0],["11-26",868.0],["11-27",862.0],["11-28",858.0],["12-01",822.0],["12-02",803.0],["12-03",813.0],["12-04",808.0],["12-05",805.0],["12-08",842.0],["12-09",817.0],["12-10",825.0],["12-11",837.0],["12-12",823.0],["12-15",834.0],["12-16",833.0],["12-17",858.0],["12-18",874.0],["12-19",854.0],["12-22",857.0],["12-23",855.0],["12-24",856.0],["12-29",920.0],["12-30",907.0],["12-31",899.0]],"Silver":[["01-02",14.93],["01-03",15.38],["01-04",15.28],["01-07",15.24],["01-08",15.48],["01-09",16.0],["01-10",15.62],["01-11",16.06],["01-14",16.5],["01-15",16.24],["01-16",15.85],["01-17",15.88],["01-18",15.82],["01-21",15.77],["01-22",15.57],["01-23",15.95],["01-24",16.35],["01-25",16.53],["01-28",16.44],["01-29",16.75],["01-30",16.76],["01-31",16.74],["02-01",17.19],["02-04",16.7],["02-05",16.51],["02-06",16.48],["02-07",16.7],["02-08",16.95],["02-11",17.37],["02-12",17.46],["02-13",16.98],["02-14",17.26],["02-15",17.38],["02-18",17.01],["02-19",17.25],["02-20",17.42],["02-21",17.98],["02-22",17.94],["02-25",18.06],["02-26",18.12],["02-27",19.33],["02-28",19.24],["02-29",19.62],["03-03",20.16],["03-04",20.32],["03-05",19.48],["03-06",20.8],["03-07",20.22],["03-10",19.57],["03-11",20.25],["03-12",19.7],["03-13",20.79],["03-14",20.41],["03-17",20.92],["03-18",20.38],["03-19",19.88],["03-20",17.53],["03-25",17.57],["03-26",18.07],["03-27",18.2],["03-28",18.36],["03-31",17.99],["04-01",16.74],["04-02",16.89],["04-03",17.15],["04-04",17.45],["04-07",17.96],["04-08",18.0],["04-09",17.49],["04-10",18.32],["04-11",17.95],["04-14",17.45],["04-15",17.86],["04-16",18.07],["04-17",18.56],["04-18",18.18],["04-21",17.86],["04-22",17.56],["04-23",17.55],["04-24",17.09],["04-25",16.68],["04-28",16.94],["04-29",16.78],["04-30",16.47],["05-01",16.64],["05-02",16.19],["05-06",16.7],["05-07",16.69],["05-08",16.58],["05-09",16.97],["05-12",16.74],["05-13",17.08],["05-14",16.69],["05-15",16.6],["05-16",16.83],["05-19",17.18],["05-20",17.03],["05-21",17.77],["05-22",17.82],["05-23",18.1],["05-27",18.14],["05-28",17.26],["05-29",17.17],["05-30",16.85],["06-02",16.86],["06-03",16.82],["06-04",16.67],["06-05",16.65],["06-06",17.19],["06-09",17.46],["06-10",16.94],["06-11",16.58],["06-12",16.59],["06-13",16.31],["06-16",16.73],["06-17",17.22],["06-18",17.0],["06-19",17.22],["06-20",17.44],["06-23",17.19],["06-24",16.85],["06-25",16.7],["06-26",16.88],["06-27",17.4],["06-30",17.65],["07-01",17.56],["07-02",17.92],["07-03",18.31],["07-04",18.01],["07-07",17.85],["07-08",17.62],["07-09",17.82],["07-10",18.17],["07-11",18.38],["07-14",18.69],["07-15",19.3],["07-16",18.83],["07-17",18.67],["07-18",18.55],["07-21",18.35],["07-22",18.6],["07-23",17.59],["07-24",17.52],["07-25",17.55],["07-28",17.47],["07-29",17.42],["07-30",17.12],["07-31",17.48],["08-01",17.59],["08-04",17.37],["08-05",16.67],["08-06",16.74],["08-07",16.59],["08-08",15.76],["08-11",15.34],["08-12",14.45],["08-13",14.68],["08-14",14.86],["08-15",12.82],["08-18",13.01],["08-19",13.01],["08-20",13.27],["08-21",13.59],["08-22",13.62],["08-26",13.05],["08-27",13.76],["08-28",13.78],["08-29",13.76],["09-01",13.58],["09-02",13.18],["09-03",12.79],["09-04",13.02],["09-05",12.72],["09-08",12.38],["09-09",12.04],["09-10",11.27],["09-11",10.66],["09-12",10.8],["09-15",10.84],["09-16",10.88],["09-17",10.77],["09-18",12.93],["09-19",12.15],["09-22",12.98],["09-23",13.38],["09-24",13.29],["09-25",13.34],["09-26",13.18],["09-29",13.06],["09-30",12.96],["10-01",12.28],["10-02",12.25],["10-03",11.2],["10-06",11.29],["10-07",11.64],["10-08",11.65],["10-09",11.64],["10-10",11.74],["10-13",10.61],["10-14",10.89],["10-15",10.92],["10-16",9.99],["10-17",9.56],["10-20",9.79],["10-21",9.86],["10-22",9.84],["10-23",9.34],["10-24",8.88],["10-27",9.01],["10-28",9.09],["10-29",9.38],["10-30",10.02],["10-31",9.28],["11-03",10.05],["11-04",9.95],["11-05",10.28],["11-06",10.41],["11-07",10.13],["11-10",10.31],["11-11",9.94],["11-12",9.65],["11-13",9.37],["11-14",9.33],["11-17",9.5],["11-18",9.38],["11-19",9.4],["11-20",9.39],["11-21",9.17],["11-24",10.04],["11-25",10.33],["11-26",10.3],["11-27",10.26],["11-28",10.12],["12-01",9.91],["12-02",9.41],["12-03",9.43],["12-04",9.58],["12-05",9.46],["12-08",9.73],["12-09",9.83],["12-10",9.96],["12-11",10.39],["12-12",10.07],["12-15",10.33],["12-16",10.5],["12-17",10.98],["12-18",11.29],["12-19",10.61],["12-22",10.97],["12-23",10.7],["12-24",10.29],["12-29",10.93],["12-30",10.83],["12-31",10.79]]},"2009":{"Gold":[["01-02",869.75],["01-05",860.0],["01-06",844.0],["01-07",864.0],["01-08",842.5],["01-09",854.0],["01-12",848.5],["01-13",815.5],["01-14",827.25],["01-15",813.0],["01-16",824.25],["01-19",842.5],["01-20",835.0],["01-21",860.5],["01-22",847.75],["01-23",873.0],["01-26",906.5],["01-27",896.0],["01-28",891.25],["01-29",878.5],["01-30",918.5],["02-02",913.75],["02-03",902.0],["02-04",902.25],["02-05",914.75],["02-06",914.0],["02-09",901.0],["02-10",896.0],["02-11",922.0],["02-12",944.0],["02-13",939.25],["02-16",943.0],["02-17",962.25],["02-18",964.75],["02-19",973.5],["02-20",981.0],["02-23",987.0],["02-24",989.75],["02-25",956.25],["02-26",945.0],["02-27",943.75],["03-02",949.5],["03-03",924.75],["03-04",911.0],["03-05",913.25],["03-06",937.75],["03-09",934.75],["03-10",911.5],["03-11",900.0],["03-12",914.5],["03-13",920.0],["03-16",923.0],["03-17",920.0],["03-18",910.75],["03-19",937.25],["03-20",957.0],["03-23",952.75],["03-24",928.75],["03-25",921.25],["03-26",935.5],["03-27",927.0],["03-30",923.0],["03-31",918.5],["04-01",919.5],["04-02",914.75],["04-03",901.5],["04-06",879.5],["04-07",879.25],["04-08",887.25],["04-09",883.75],["04-14",895.0],["04-15",892.25],["04-16",889.0],["04-17",872.0],["04-20",870.0],["04-21",888.75],["04-22",885.0],["04-23",894.5],["04-24",909.0],["04-27",911.75],["04-28",897.0],["04-29",894.5],["04-30",889.0],["05-01",881.5],["05-05",903.0],["05-06",903.5],["05-07",912.75],["05-08",917.5],["05-11",912.5],["05-12",920.0],["05-13",925.75],["05-14",923.25],["05-15",925.0],["05-18",929.75],["05-19",921.5],["05-20",928.5],["05-21",940.0],["05-22",952.5],["05-26",942.0],["05-27",949.5],["05-28",949.75],["05-29",972.0],["06-01",987.0],["06-02",973.5],["06-03",979.0],["06-04",967.25],["06-05",977.75],["06-08",946.5],["06-09",952.5],["06-10",961.25],["06-11",953.0],["06-12",950.0],["06-15",932.0],["06-16",936.75],["06-17",933.75],["06-18",936.75],["06-19",933.75],["06-22",924.0],["06-23",920.25],["06-24",928.75],["06-25",934.25],["06-26",943.0],["06-29",939.75],["06-30",941.0],["07-01",931.5],["07-02",936.0],["07-03",932.5],["07-06",921.5],["07-07",925.75],["07-08",920.75],["07-09",914.75],["07-10",910.0],["07-13",908.5],["07-14",921.75],["07-15",930.0],["07-16",935.25],["07-17",934.5],["07-20",952.25],["07-21",947.75],["07-22",945.5],["07-23",955.25],["07-24",949.75],["07-27",956.0],["07-28",955.0],["07-29",935.5],["07-30",932.0],["07-31",936.5],["08-03",954.25],["08-04",953.5],["08-05",964.5],["08-06",960.75],["08-07",960.5],["08-10",953.5],["08-11",946.0],["08-12",943.5],["08-13",956.0],["08-14",957.5],["08-17",937.5],["08-18",938.25],["08-19",934.25],["08-20",943.5],["08-21",941.5],["08-24",953.75],["08-25",947.5],["08-26",949.5],["08-27",943.5],["08-28",950.75],["09-01",949.75],["09-02",955.0],["09-03",982.5],["09-04",987.25],["09-07",992.75],["09-08",1004.5],["09-09",995.75],["09-10",988.5],["09-11",998.25],["09-14",994.25],["09-15",997.5],["09-16",1017.0],["09-17",1020.5],["09-18",1014.0],["09-21",999.25],["09-22",1015.75],["09-23",1014.75],["09-24",1014.0],["09-25",997.0],["09-28",990.5],["09-29",991.75],["09-30",1001.25],["10-01",1005.75],["10-02",998.0],["10-05",1004.25],["10-06",1020.25],["10-07",1047.0],["10-08",1054.75],["10-09",1046.75],["10-12",1052.0],["10-13",1064.5],["10-14",1066.0],["10-15",1052.5],["10-16",1047.75],["10-19",1054.5],["10-20",1064.0],["10-21",1053.5],["10-22",1054.75],["10-23",1061.25],["10-26",1055.0],["10-27",1040.75],["10-28",1035.5],["10-29",1034.0],["10-30",1044.5],["11-02",1052.0],["11-03",1058.0],["11-04",1091.75],["11-05",1088.0],["11-06",1095.0],["11-09",1108.5],["11-10",1099.75],["11-11",1114.75],["11-12",1116.0],["11-13",1107.5],["11-16",1128.75],["11-17",1131.75],["11-18",1146.0],["11-19",1136.0],["11-20",1142.5],["11-23",1166.0],["11-24",1170.25],["11-25",1176.5],["11-26",1183.0],["11-27",1164.5],["11-30",1172.0],["12-01",1193.5],["12-02",1211.5],["12-03",1218.25],["12-04",1203.25],["12-07",1147.5],["12-08",1164.25],["12-09",1142.25],["12-10",1125.75],["12-11",1140.0],["12-14",1120.0],["12-15",1115.0],["12-16",1134.0],["12-17",1121.5],["12-18",1106.5],["12-21",1113.25],["12-22",1094.25],["12-23",1080.5],["12-24",1104.5],["12-29",1103.0],["12-30",1092.5],["12-31",1104.0]],"Palladium":[["01-02",185.0],["01-05",186.0],["01-06",185.0],["01-07",199.0],["01-08",193.5],["01-09",196.0],["01-12",192.0],["01-13",183.0],["01-14",184.0],["01-15",177.0],["01-16",182.0],["01-19",187.0],["01-20",182.0],["01-21",185.0],["01-22",185.0],["01-23",183.0],["01-26",193.0],["01-27",190.0],["01-28",190.0],["01-29",190.0],["01-30",192.0],["02-02",195.0],["02-03",196.0],["02-04",193.0],["02-05",199.0],["02-06",202.0],["02-09",210.0],["02-10",209.0],["02-11",212.0],["02-12",216.0],["02-13",215.0],["02-16",216.0],["02-17",218.0],["02-18",219.0],["02-19",215.0],["02-20",216.0],["02-23",215.0],["02-24",206.0],["02-25",198.0],["02-26",198.0],["02-27",196.0],["03-02",198.0],["03-03",193.0],["03-04",194.0],["03-05",198.0],["03-06",202.0],["03-09",199.0],["03-10",197.0],["03-11",198.0],["03-12",198.0],["03-13",197.0],["03-16",198.0],["03-17",199.0],["03-18",196.0],["03-19",197.0],["03-20",207.0],["03-23",209.0],["03-24",211.0],["03-25",206.0],["03-26",217.0],["03-27",220.0],["03-30",215.0],["03-31",214.0],["04-01",217.0],["04-02",220.0],["04-03",222.0],["04-06",223.0],["04-07",224.5],["04-08",225.0],["04-09",233.0],["04-14",239.0],["04-15",235.0],["04-16",237.0],["04-17",234.0],["04-20",233.0],["04-21",227.0],["04-22",225.0],["04-23",231.0],["04-24",234.0],["04-27",231.0],["04-28",217.0],["04-29",216.0],["04-30",222.0],["05-01",212.5],["05-05",218.0],["05-06",223.0],["05-07",235.0],["05-08",241.0],["05-11",239.5],["05-12",236.0],["05-13",237.0],["05-14",223.5],["05-15",225.0],["05-18",225.0],["05-19",233.0],["05-20",233.0],["05-21",235.0],["05-22",231.0],["05-26",231.0],["05-27",230.0],["05-28",224.0],["05-29",235.0],["06-01",238.0],["06-02",238.0],["06-03",251.0],["06-04",245.0],["06-05",264.0],["06-08",249.0],["06-09",252.0],["06-10",257.0],["06-11",256.5],["06-12",255.0],["06-15",247.0],["06-16",247.0],["06-17",243.0],["06-18",241.5],["06-19",241.0],["06-22",243.0],["06-23",234.0],["06-24",237.0],["06-25",236.0],["06-26",244.0],["06-29",245.0],["06-30",251.0],["07-01",249.0],["07-02",252.0],["07-03",250.0],["07-06",243.0],["07-07",242.0],["07-08",237.0],["07-09",238.0],["07-10",234.0],["07-13",233.0],["07-14",236.5],["07-15",242.0],["07-16",245.0],["07-17",247.0],["07-20",248.0],["07-21",253.0],["07-22",254.0],["07-23",256.0],["07-24",257.0],["07-27",259.0],["07-28",262.0],["07-29",258.0],["07-30",256.0],["07-31",258.0],["08-03",262.0],["08-04",270.0],["08-05",280.0],["08-06",275.0],["08-07",270.0],["08-10",274.0],["08-11",273.0],["08-12",269.0],["08-13",274.0],["08-14",276.0],["08-17",271.0],["08-18",271.0],["08-19",269.0],["08-20",275.0],["08-21",272.0],["08-24",283.0],["08-25",282.0],["08-26",287.0],["08-27",284.5],["08-28",286.0],["09-01",291.0],["09-02",284.0],["09-03",287.0],["09-04",290.0],["09-07",292.0],["09-08",295.0],["09-09",290.0],["09-10",291.0],["09-11",291.0],["09-14",290.0],["09-15",292.0],["09-16",297.0],["09-17",299.0],["09-18",300.0],["09-21",298.0],["09-22",298.0],["09-23",301.0],["09-24",294.0],["09-25",295.0],["09-28",290.0],["09-29",290.0],["09-30",291.0],["10-01",295.0],["10-02",291.0],["10-05",297.0],["10-06",299.5],["10-07",312.0],["10-08",316.0],["10-09",323.0],["10-12",321.0],["10-13",335.0],["10-14",329.0],["10-15",325.0],["10-16",325.0],["10-19",329.0],["10-20",334.0],["10-21",336.0],["10-22",335.0],["10-23",335.0],["10-26",335.0],["10-27",330.0],["10-28",325.0],["10-29",319.0],["10-30",327.0],["11-02",326.0],["11-03",321.0],["11-04",329.0],["11-05",331.0],["11-06",330.0],["11-09",331.5],["11-10",332.0],["11-11",338.0],["11-12",351.0],["11-13",354.0],["11-16",363.0],["11-17",371.0],["11-18",375.0],["11-19",366.0],["11-20",361.0],["11-23",370.0],["11-24",371.5],["11-25",373.0],["11-26",369.0],["11-27",360.0],["11-30",362.0],["12-01",381.0],["12-02",388.0],["12-03",389.0],["12-04",382.0],["12-07",366.5],["12-08",377.0],["12-09",369.0],["12-10",364.0],["12-11",367.0],["12-14",364.0],["12-15",364.0],["12-16",366.0],["12-17",370.0],["12-18",366.0],["12-21",366.0],["12-22",362.0],["12-23",355.0],["12-24",377.0],["12-29",388.0],["12-30",391.0],["12-31",402.0]],"Platinum":[["01-02",934.0],["01-05",935.0],["01-06",945.0],["01-07",991.0],["01-08",988.0],["01-09",991.0],["01-12",991.0],["01-13",940.0],["01-14",960.0],["01-15",915.0],["01-16",935.0],["01-19",965.0],["01-20",945.0],["01-21",939.0],["01-22",930.0],["01-23",929.0],["01-26",959.0],["01-27",949.0],["01-28",942.0],["01-29",953.0],["01-30",975.0],["02-02",975.0],["02-03",967.0],["02-04",964.0],["02-05",975.0],["02-06",982.0],["02-09",982.0],["02-10",1008.0],["02-11",1045.0],["02-12",1084.0],["02-13",1063.0],["02-16",1064.0],["02-17",1078.0],["02-18",1113.0],["02-19",1074.0],["02-20",1083.0],["02-23",1083.0],["02-24",1083.0],["02-25",1040.0],["02-26",1045.0],["02-27",1054.0],["03-02",1094.0],["03-03",1048.0],["03-04",1045.0],["03-05",1050.0],["03-06",1075.0],["03-09",1066.0],["03-10",1045.0],["03-11",1054.0],["03-12",1048.0],["03-13",1050.0],["03-16",1057.0],["03-17",1052.0],["03-18",1050.0],["03-19",1055.0],["03-20",1118.0],["03-23",1125.0],["03-24",1119.0],["03-25",1123.0],["03-26",1144.0],["03-27",1142.0],["03-30",1126.0],["03-31",1125.0],["04-01",1127.0],["04-02",1140.0],["04-03",1153.0],["04-06",1153.0],["04-07",1163.0],["04-08",1155.0],["04-09",1205.0],["04-14",1229.0],["04-15",1228.0],["04-16",1218.0],["04-17",1213.0],["04-20",1181.0],["04-21",1171.0],["04-22",1159.0],["04-23",1177.0],["04-24",1181.0],["04-27",1155.0],["04-28",1098.0],["04-29",1085.0],["04-30",1111.0],["05-01",1096.0],["05-05",1118.0],["05-06",1131.0],["05-07",1164.0],["05-08",1154.0],["05-11",1140.0],["05-12",1128.0],["05-13",1141.0],["05-14",1105.0],["05-15",1116.0],["05-18",1108.0],["05-19",1135.0],["05-20",1148.0],["05-21",1152.0],["05-22",1145.0],["05-26",1134.0],["05-27",1136.0],["05-28",1126.0],["05-29",1163.0],["06-01",1218.0],["06-02",1209.0],["06-03",1247.0],["06-04",1250.0],["06-05",1293.0],["06-08",1235.0],["06-09",1245.0],["06-10",1270.0],["06-11",1262.0],["06-12",1253.0],["06-15",1229.0],["06-16",1224.0],["06-17",1211.0],["06-18",1206.0],["06-19",1209.0],["06-22",1197.0],["06-23",1165.0],["06-24",1175.0],["06-25",1176.0],["06-26",1208.0],["06-29",1184.0],["06-30",1196.0],["07-01",1176.0],["07-02",1188.0],["07-03",1183.0],["07-06",1160.0],["07-07",1141.0],["07-08",1113.0],["07-09",1113.0],["07-10",1106.0],["07-13",1092.0],["07-14",1124.0],["07-15",1145.0],["07-16",1158.0],["07-17",1169.0],["07-20",1174.0],["07-21",1179.0],["07-22",1165.0],["07-23",1178.0],["07-24",1180.0],["07-27",1203.0],["07-28",1212.0],["07-29",1192.0],["07-30",1172.0],["07-31",1186.0],["08-03",1210.0],["08-04",1228.0],["08-05",1286.0],["08-06",1284.0],["08-07",1237.0],["08-10",1252.0],["08-11",1253.0],["08-12",1227.0],["08-13",1260.0],["08-14",1271.0],["08-17",1238.0],["08-18",1236.0],["08-19",1222.0],["08-20",1250.0],["08-21",1232.0],["08-24",1251.0],["08-25",1239.0],["08-26",1248.0],["08-27",1235.0],["08-28",1234.0],["09-01",1249.0],["09-02",1212.0],["09-03",1242.0],["09-04",1248.0],["09-07",1263.0],["09-08",1274.0],["09-09",1283.0],["09-10",1281.0],["09-11",1287.0],["09-14",1298.0],["09-15",1309.0],["09-16",1333.0],["09-17",1343.0],["09-18",1326.0],["09-21",1313.0],["09-22",1327.0],["09-23",1333.0],["09-24",1318.0],["09-25",1295.0],["09-28",1278.0],["09-29",1278.0],["09-30",1283.0],["10-01",1294.0],["10-02",1275.0],["10-05",1285.0],["10-06",1300.0],["10-07",1336.0],["10-08",1336.0],["10-09",1335.0],["10-12",1333.0],["10-13",1357.0],["10-14",1358.0],["10-15",1347.0],["10-16",1341.0],["10-19",1350.0],["10-20",1359.0],["10-21",1355.0],["10-22",1356.0],["10-23",1369.0],["10-26",1359.0],["10-27",1328.0],["10-28",1315.0],["10-29",1318.0],["10-30",1328.0],["11-02",1334.0],["11-03",1334.0],["11-04",1360.0],["11-05",1360.0],["11-06",1362.0],["11-09",1360.0],["11-10",1354.0],["11-11",1365.0],["11-12",1367.0],["11-13",1359.0],["11-16",1418.0],["11-17",1442.0],["11-18",1459.0],["11-19",1430.0],["11-20",1430.0],["11-23",1469.0],["11-24",1453.0],["11-25",1463.0],["11-26",1454.0],["11-27",1433.0],["11-30",1440.0],["12-01",1468.0],["12-02",1492.0],["12-03",1500.0],["12-04",1484.0],["12-07",1433.0],["12-08",1455.0],["12-09",1424.0],["12-10",1413.0],["12-11",1436.0],["12-14",1437.0],["12-15",1437.0],["12-16",1448.0],["12-17",1441.0],["12-18",1435.0],["12-21",1430.0],["12-22",1421.0],["12-23",1397.0],["12-24",1456.0],["12-29",1473.0],["12-30",1464.0],["12-31",1466.0]],"Silver":[["01-02",11.08],["01-05",11.07],["01-06",10.85],["01-07",11.41],["01-08",10.88],["01-09",11.22],["01-12",11.09],["01-13",10.62],["01-14",10.77],["01-15",10.51],["01-16",10.78],["01-19",11.16],["01-20",11.32],["01-21",11.34],["01-22",11.32],["01-23",11.46],["01-26",12.1],["01-27",11.91],["01-28",11.98],["01-29",11.74],["01-30",12.51],["02-02",12.43],["02-03",12.37],["02-04",12.4],["02-05",12.8],["02-06",12.89],["02-09",13.01],["02-10",12.96],["02-11",13.39],["02-12",13.34],["02-13",13.37],["02-16",13.55],["02-17",13.9],["02-18",14.05],["02-19",14.26],["02-20",14.28],["02-23",14.36],["02-24",14.39],["02-25",13.81],["02-26",13.48],["02-27",13.21],["03-02",13.14],["03-03",12.68],["03-04",12.87],["03-05",13.15],["03-06",13.46],["03-09",13.36],["03-10",12.71],["03-11",12.62],["03-12",12.84],["03-13",13.11],["03-16",13.06],["03-17",12.86],["03-18",12.61],["03-19",13.13],["03-20",13.65],["03-23",13.76],["03-24",13.51],["03-25",13.16],["03-26",13.6],["03-27",13.22],["03-30",12.96],["03-31",13.11],["04-01",12.98],["04-02",12.88],["04-03",12.86],["04-06",12.41],["04-07",12.17],["04-08",12.28],["04-09",12.3],["04-14",12.65],["04-15",12.94],["04-16",12.65],["04-17",11.98],["04-20",12.06],["04-21",12.14],["04-22",12.12],["04-23",12.43],["04-24",12.78],["04-27",12.98],["04-28",12.56],["04-29",12.5],["04-30",12.63],["05-01",12.15],["05-05",13.11],["05-06",13.44],["05-07",14.01],["05-08",13.9],["05-11",13.9],["05-12",14.09],["05-13",14.14],["05-14",13.84],["05-15",13.92],["05-18",13.79],["05-19",13.88],["05-20",14.29],["05-21",14.23],["05-22",14.66],["05-26",14.3],["05-27",14.5],["05-28",14.88],["05-29",15.52],["06-01",15.86],["06-02",15.62],["06-03",15.97],["06-04",15.3],["06-05",15.65],["06-08",14.84],["06-09",14.93],["06-10",15.39],["06-11",15.09],["06-12",15.07],["06-15",14.31],["06-16",14.3],["06-17",14.02],["06-18",14.19],["06-19",14.23],["06-22",13.83],["06-23",13.77],["06-24",13.88],["06-25",13.87],["06-26",14.26],["06-29",14.07],["06-30",13.94],["07-01",13.65],["07-02",13.41],["07-03",13.44],["07-06",13.03],["07-07",13.32],["07-08",13.05],["07-09",12.89],["07-10",12.63],["07-13",12.47],["07-14",12.88],["07-15",13.27],["07-16",13.21],["07-17",13.16],["07-20",13.74],["07-21",13.52],["07-22",13.4],["07-23",13.76],["07-24",13.78],["07-27",14.06],["07-28",14.02],["07-29",13.6],["07-30",13.4],["07-31",13.63],["08-03",14.29],["08-04",14.08],["08-05",14.67],["08-06",14.67],["08-07",14.65],["08-10",14.47],["08-11",14.36],["08-12",14.28],["08-13",15.07],["08-14",14.98],["08-17",14.13],["08-18",14.09],["08-19",13.59],["08-20",14.04],["08-21",14.01],["08-24",14.41],["08-25",14.11],["08-26",14.32],["08-27",14.2],["08-28",14.54],["09-01",14.74],["09-02",14.91],["09-03",15.73],["09-04",15.95],["09-07",16.21],["09-08",16.75],["09-09",16.24],["09-10",16.09],["09-11",16.89],["09-14",16.35],["09-15",16.52],["09-16",17.29],["09-17",17.38],["09-18",17.11],["09-21",16.68],["09-22",17.24],["09-23",17.1],["09-24",16.76],["09-25",16.2],["09-28",15.91],["09-29",16.07],["09-30",16.45],["10-01",16.55],["10-02",16.21],["10-05",16.23],["10-06",16.95],["10-07",17.4],["10-08",17.8],["10-09",17.63],["10-12",17.89],["10-13",17.99],["10-14",17.93],["10-15",17.54],["10-16",17.31],["10-19",17.52],["10-20",17.75],["10-21",17.39],["10-22",17.55],["10-23",17.65],["10-26",17.61],["10-27",17.06],["10-28",16.33],["10-29",16.33],["10-30",16.57],["11-02",16.58],["11-03",16.35],["11-04",17.48],["11-05",17.38],["11-06",17.52],["11-09",17.68],["11-10",17.26],["11-11",17.63],["11-12",17.51],["11-13",17.32],["11-16",17.74],["11-17",18.1],["11-18",18.74],["11-19",18.2],["11-20",18.18],["11-23",18.76],["11-24",18.57],["11-25",18.63],["11-26",18.49],["11-27",17.98],["11-30",18.14],["12-01",18.72],["12-02",19.18],["12-03",19.11],["12-04",18.83],["12-07",18.04],["12-08",18.11],["12-09",17.77],["12-10",17.39],["12-11",17.51],["12-14",17.19],["12-15",17.18],["12-16",17.6],["12-17",17.4],["12-18",17.31],["12-21",17.27],["12-22",16.95],["12-23",16.92],["12-24",17.32],["12-29",17.42],["12-30",16.92],["12-31",16.99]]}});
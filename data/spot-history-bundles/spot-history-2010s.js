@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 10104 entries across 10 years (2010–2019)
+window._loadSpotSeedBundle({"2010":{"Gold":[["01-04",1113.0],["01-05",1125.25],["01-06",1125.0],["01-07",1130.75],["01-08",1121.75],["01-11",1158.0],["01-12",1152.75],["01-13",1132.75],["01-14",1137.5],["01-15",1132.0],["01-18",1135.75],["01-19",1134.0],["01-20",1129.0],["01-21",1104.0],["01-22",1096.5],["01-25",1103.5],["01-26",1090.75],["01-27",1094.75],["01-28",1091.75],["01-29",1082.75],["02-01",1082.0],["02-02",1114.0],["02-03",1118.5],["02-04",1102.5],["02-05",1052.25],["02-08",1070.0],["02-09",1068.0],["02-10",1075.5],["02-11",1079.5],["02-12",1078.25],["02-15",1099.5],["02-16",1115.25],["02-17",1118.25],["02-18",1105.5],["02-19",1107.0],["02-22",1119.75],["02-23",1112.0],["02-24",1093.0],["02-25",1092.75],["02-26",1112.5],["03-01",1117.25],["03-02",1116.0],["03-03",1136.25],["03-04",1136.25],["03-05",1135.0],["03-08",1134.0],["03-09",1120.0],["03-10",1124.5],["03-11",1106.0],["03-12",1118.75],["03-15",1104.0],["03-16",1113.25],["03-17",1131.25],["03-18",1122.75],["03-19",1121.5],["03-22",1104.25],["03-23",1100.75],["03-24",1094.0],["03-25",1093.5],["03-26",1098.0],["03-29",1111.25],["03-30",1109.75],["03-31",1109.5],["04-01",1116.0],["04-06",1124.0],["04-07",1133.25],["04-08",1146.5],["04-09",1156.0],["04-12",1163.5],["04-13",1149.25],["04-14",1159.0],["04-15",1151.25],["04-16",1157.0],["04-19",1127.5],["04-20",1142.5],["04-21",1143.75],["04-22",1144.25],["04-23",1140.0],["04-26",1154.0],["04-27",1152.25],["04-28",1164.25],["04-29",1170.0],["04-30",1175.25],["05-04",1184.25],["05-05",1172.0],["05-06",1178.0],["05-07",1199.6],["05-10",1188.25],["05-11",1209.0],["05-12",1241.25],["05-13",1235.0],["05-14",1238.75],["05-17",1230.25],["05-18",1215.0],["05-19",1209.5],["05-20",1187.25],["05-21",1183.5],["05-24",1183.75],["05-25",1189.5],["05-26",1212.5],["05-27",1210.75],["05-28",1214.0],["06-01",1219.75],["06-02",1221.0],["06-03",1219.75],["06-04",1203.5],["06-07",1212.4],["06-08",1248.0],["06-09",1235.0],["06-10",1220.0],["06-11",1220.5],["06-14",1229.5],["06-15",1223.0],["06-16",1235.5],["06-17",1234.5],["06-18",1244.0],["06-21",1259.5],["06-22",1235.25],["06-23",1243.0],["06-24",1233.25],["06-25",1242.5],["06-28",1256.0],["06-29",1236.0],["06-30",1240.5],["07-01",1240.0],["07-02",1210.5],["07-05",1208.5],["07-06",1210.75],["07-07",1186.0],["07-08",1201.25],["07-09",1196.25],["07-12",1203.75],["07-13",1206.5],["07-14",1212.25],["07-15",1211.75],["07-16",1204.75],["07-19",1190.25],["07-20",1181.5],["07-21",1191.25],["07-22",1187.0],["07-23",1198.75],["07-26",1189.0],["07-27",1184.0],["07-28",1164.0],["07-29",1166.0],["07-30",1168.0],["08-02",1178.0],["08-03",1184.0],["08-04",1194.5],["08-05",1195.5],["08-06",1194.5],["08-09",1206.0],["08-10",1196.75],["08-11",1198.0],["08-12",1200.0],["08-13",1215.0],["08-16",1222.0],["08-17",1226.25],["08-18",1223.0],["08-19",1228.0],["08-20",1230.5],["08-23",1227.0],["08-24",1218.0],["08-25",1237.5],["08-26",1240.25],["08-27",1234.5],["08-31",1233.5],["09-01",1250.0],["09-02",1247.75],["09-03",1252.0],["09-06",1249.5],["09-07",1247.25],["09-08",1258.0],["09-09",1253.5],["09-10",1248.75],["09-13",1243.0],["09-14",1253.25],["09-15",1270.4],["09-16",1271.25],["09-17",1281.5],["09-20",1280.25],["09-21",1278.75],["09-22",1291.75],["09-23",1291.5],["09-24",1298.0],["09-27",1298.25],["09-28",1289.0],["09-29",1307.5],["09-30",1311.0],["10-01",1313.0],["10-04",1316.0],["10-05",1325.75],["10-06",1347.0],["10-07",1359.5],["10-08",1330.5],["10-11",1348.5],["10-12",1343.5],["10-13",1358.5],["10-14",1380.75],["10-15",1377.25],["10-18",1359.75],["10-19",1367.75],["10-20",1340.5],["10-21",1345.25],["10-22",1319.0],["10-25",1345.0],["10-26",1334.0],["10-27",1332.25],["10-28",1326.5],["10-29",1336.75],["11-01",1361.5],["11-02",1358.0],["11-03",1358.5],["11-04",1361.0],["11-05",1384.25],["11-08",1390.0],["11-09",1416.25],["11-10",1402.0],["11-11",1413.0],["11-12",1387.0],["11-15",1367.0],["11-16",1363.25],["11-17",1336.5],["11-18",1356.75],["11-19",1357.5],["11-22",1357.5],["11-23",1361.0],["11-24",1376.25],["11-25",1370.5],["11-26",1366.5],["11-29",1360.0],["11-30",1375.0],["12-01",1391.5],["12-02",1390.0],["12-03",1391.75],["12-06",1411.5],["12-07",1426.0],["12-08",1395.0],["12-09",1382.0],["12-10",1390.0],["12-13",1388.25],["12-14",1405.0],["12-15",1388.25],["12-16",1384.0],["12-17",1374.75],["12-20",1381.0],["12-21",1386.0],["12-22",1389.0],["12-23",1384.0],["12-24",1380.5],["12-29",1403.5],["12-30",1411.5],["12-31",1410.25]],"Palladium":[["01-04",420.0],["01-05",425.0],["01-06",424.0],["01-07",423.0],["01-08",424.0],["01-11",429.5],["01-12",435.0],["01-13",421.0],["01-14",429.0],["01-15",452.0],["01-18",459.0],["01-19",462.0],["01-20",460.0],["01-21",462.0],["01-22",435.0],["01-25",438.0],["01-26",428.0],["01-27",418.0],["01-28",421.0],["01-29",419.0],["02-01",419.0],["02-02",434.0],["02-03",446.0],["02-04",430.0],["02-05",387.0],["02-08",406.0],["02-09",410.0],["02-10",416.0],["02-11",416.0],["02-12",414.0],["02-15",418.0],["02-16",431.0],["02-17",438.0],["02-18",429.0],["02-19",428.0],["02-22",442.0],["02-23",445.0],["02-24",429.0],["02-25",416.0],["02-26",430.0],["03-01",438.0],["03-02",438.0],["03-03",444.0],["03-04",458.0],["03-05",465.0],["03-08",477.0],["03-09",462.0],["03-10",473.0],["03-11",451.0],["03-12",466.0],["03-15",458.0],["03-16",462.5],["03-17",476.0],["03-18",474.0],["03-19",477.0],["03-22",458.0],["03-23",458.0],["03-24",454.0],["03-25",447.0],["03-26",458.0],["03-29",461.0],["03-30",473.0],["03-31",479.0],["04-01",489.0],["04-06",496.0],["04-07",509.0],["04-08",501.0],["04-09",511.0],["04-12",515.0],["04-13",510.0],["04-14",545.0],["04-15",540.0],["04-16",542.0],["04-19",522.0],["04-20",542.0],["04-21",563.0],["04-22",566.0],["04-23",560.0],["04-26",570.0],["04-27",562.0],["04-28",535.0],["04-29",546.0],["04-30",551.0],["05-04",540.0],["05-05",510.0],["05-06",507.0],["05-07",507.0],["05-10",531.0],["05-11",522.0],["05-12",534.0],["05-13",542.0],["05-14",541.0],["05-17",515.0],["05-18",503.0],["05-19",475.0],["05-20",438.0],["05-21",416.0],["05-24",446.0],["05-25",426.0],["05-26",450.0],["05-27",452.0],["05-28",469.0],["06-01",454.0],["06-02",452.0],["06-03",462.0],["06-04",450.0],["06-07",421.0],["06-08",432.0],["06-09",445.0],["06-10",448.0],["06-11",451.0],["06-14",458.0],["06-15",456.0],["06-16",472.0],["06-17",471.0],["06-18",478.0],["06-21",498.0],["06-22",492.0],["06-23",486.0],["06-24",467.0],["06-25",472.0],["06-28",480.0],["06-29",460.0],["06-30",449.0],["07-01",441.0],["07-02",438.0],["07-05",433.0],["07-06",439.0],["07-07",433.0],["07-08",447.0],["07-09",448.0],["07-12",454.0],["07-13",455.0],["07-14",467.0],["07-15",468.0],["07-16",463.0],["07-19",456.0],["07-20",445.0],["07-21",448.0],["07-22",449.0],["07-23",462.0],["07-26",476.0],["07-27",476.0],["07-28",470.0],["07-29",473.0],["07-30",491.0],["08-02",498.0],["08-03",509.0],["08-04",500.0],["08-05",495.0],["08-06",488.0],["08-09",487.0],["08-10",476.0],["08-11",475.0],["08-12",465.0],["08-13",475.0],["08-16",480.0],["08-17",490.0],["08-18",494.0],["08-19",489.0],["08-20",483.0],["08-23",476.0],["08-24",476.0],["08-25",487.0],["08-26",501.0],["08-27",500.0],["08-31",487.5],["09-01",508.0],["09-02",519.0],["09-03",526.0],["09-06",529.0],["09-07",524.0],["09-08",524.0],["09-09",522.0],["09-10",523.0],["09-13",522.0],["09-14",543.0],["09-15",551.0],["09-16",551.0],["09-17",554.0],["09-20",543.0],["09-21",534.0],["09-22",537.0],["09-23",542.0],["09-24",558.0],["09-27",557.0],["09-28",543.0],["09-29",566.0],["09-30",568.0],["10-01",570.0],["10-04",566.0],["10-05",566.0],["10-06",589.0],["10-07",601.0],["10-08",575.0],["10-11",588.0],["10-12",580.0],["10-13",593.0],["10-14",595.0],["10-15",597.0],["10-18",574.0],["10-19",586.0],["10-20",576.0],["10-21",596.0],["10-22",583.0],["10-25",607.0],["10-26",607.0],["10-27",624.0],["10-28",625.0],["10-29",629.0],["11-01",655.0],["11-02",653.0],["11-03",641.0],["11-04",669.0],["11-05",678.0],["11-08",686.0],["11-09",721.0],["11-10",714.0],["11-11",714.0],["11-12",684.0],["11-15",671.0],["11-16",673.0],["11-17",639.0],["11-18",683.0],["11-19",701.0],["11-22",710.0],["11-23",685.0],["11-24",693.0],["11-25",693.0],["11-26",683.0],["11-29",688.0],["11-30",697.0],["12-01",707.0],["12-02",749.0],["12-03",763.0],["12-06",765.0],["12-07",762.0],["12-08",737.0],["12-09",737.0],["12-10",742.0],["12-13",746.0],["12-14",759.0],["12-15",756.0],["12-16",753.0],["12-17",745.0],["12-20",742.0],["12-21",750.0],["12-22",755.0],["12-23",750.0],["12-24",764.0],["12-29",788.0],["12-30",797.0],["12-31",791.0]],"Platinum":[["01-04",1496.0],["01-05",1525.0],["01-06",1548.0],["01-07",1542.0],["01-08",1547.0],["01-11",1582.0],["01-12",1613.0],["01-13",1563.0],["01-14",1581.0],["01-15",1610.0],["01-18",1622.0],["01-19",1641.0],["01-20",1639.0],["01-21",1603.0],["01-22",1556.0],["01-25",1543.0],["01-26",1520.0],["01-27",1514.0],["01-28",1517.0],["01-29",1514.0],["02-01",1516.0],["02-02",1548.0],["02-03",1586.0],["02-04",1550.0],["02-05",1477.0],["02-08",1490.0],["02-09",1489.0],["02-10",1499.0],["02-11",1516.0],["02-12",1513.0],["02-15",1517.0],["02-16",1530.0],["02-17",1548.0],["02-18",1512.0],["02-19",1506.0],["02-22",1537.0],["02-23",1539.0],["02-24",1497.0],["02-25",1510.0],["02-26",1540.0],["03-01",1554.0],["03-02",1549.0],["03-03",1581.0],["03-04",1576.0],["03-05",1577.0],["03-08",1598.0],["03-09",1584.0],["03-10",1614.0],["03-11",1587.0],["03-12",1619.0],["03-15",1608.0],["03-16",1620.0],["03-17",1638.0],["03-18",1629.0],["03-19",1623.0],["03-22",1583.0],["03-23",1607.0],["03-24",1590.0],["03-25",1585.0],["03-26",1601.0],["03-29",1610.0],["03-30",1627.0],["03-31",1641.0],["04-01",1659.0],["04-06",1683.0],["04-07",1712.0],["04-08",1699.0],["04-09",1722.0],["04-12",1725.0],["04-13",1708.0],["04-14",1730.0],["04-15",1716.0],["04-16",1720.0],["04-19",1679.0],["04-20",1708.0],["04-21",1739.0],["04-22",1746.0],["04-23",1733.0],["04-26",1751.0],["04-27",1747.0],["04-28",1715.0],["04-29",1721.0],["04-30",1737.0],["05-04",1720.0],["05-05",1665.0],["05-06",1666.0],["05-07",1661.0],["05-10",1696.0],["05-11",1686.0],["05-12",1702.0],["05-13",1731.0],["05-14",1726.0],["05-17",1694.0],["05-18",1675.0],["05-19",1632.0],["05-20",1561.0],["05-21",1494.0],["05-24",1526.0],["05-25",1492.0],["05-26",1530.0],["05-27",1547.0],["05-28",1569.0],["06-01",1544.0],["06-02",1539.0],["06-03",1563.0],["06-04",1546.0],["06-07",1495.0],["06-08",1517.0],["06-09",1530.0],["06-10",1523.0],["06-11",1542.0],["06-14",1555.0],["06-15",1553.0],["06-16",1577.0],["06-17",1565.0],["06-18",1571.0],["06-21",1605.0],["06-22",1592.0],["06-23",1578.0],["06-24",1543.0],["06-25",1557.0],["06-28",1584.0],["06-29",1542.0],["06-30",1533.0],["07-01",1518.0],["07-02",1516.0],["07-05",1511.0],["07-06",1521.0],["07-07",1503.0],["07-08",1526.0],["07-09",1525.0],["07-12",1524.0],["07-13",1523.0],["07-14",1528.0],["07-15",1529.0],["07-16",1518.0],["07-19",1515.0],["07-20",1511.0],["07-21",1509.0],["07-22",1518.0],["07-23",1545.0],["07-26",1551.0],["07-27",1558.0],["07-28",1540.0],["07-29",1545.0],["07-30",1555.0],["08-02",1586.0],["08-03",1590.0],["08-04",1587.0],["08-05",1576.0],["08-06",1567.0],["08-09",1558.0],["08-10",1542.0],["08-11",1534.0],["08-12",1511.0],["08-13",1538.0],["08-16",1533.0],["08-17",1544.0],["08-18",1543.0],["08-19",1536.0],["08-20",1517.0],["08-23",1506.5],["08-24",1497.0],["08-25",1521.0],["08-26",1534.0],["08-27",1530.0],["08-31",1513.0],["09-01",1528.0],["09-02",1538.0],["09-03",1555.0],["09-06",1565.0],["09-07",1552.0],["09-08",1554.0],["09-09",1553.0],["09-10",1553.0],["09-13",1548.0],["09-14",1570.0],["09-15",1590.0],["09-16",1595.0],["09-17",1619.0],["09-20",1623.0],["09-21",1616.0],["09-22",1628.0],["09-23",1632.0],["09-24",1644.0],["09-27",1640.0],["09-28",1612.0],["09-29",1645.0],["09-30",1650.0],["10-01",1669.0],["10-04",1668.0],["10-05",1681.0],["10-06",1701.0],["10-07",1720.0],["10-08",1688.0],["10-11",1697.0],["10-12",1676.0],["10-13",1698.0],["10-14",1713.0],["10-15",1701.0],["10-18",1677.0],["10-19",1695.0],["10-20",1674.0],["10-21",1686.0],["10-22",1661.0],["10-25",1696.0],["10-26",1693.0],["10-27",1698.0],["10-28",1684.0],["10-29",1683.0],["11-01",1718.0],["11-02",1714.0],["11-03",1713.0],["11-04",1739.0],["11-05",1760.0],["11-08",1754.0],["11-09",1780.0],["11-10",1774.0],["11-11",1765.0],["11-12",1705.0],["11-15",1675.0],["11-16",1670.0],["11-17",1639.5],["11-18",1658.0],["11-19",1665.0],["11-22",1666.0],["11-23",1662.0],["11-24",1657.0],["11-25",1655.0],["11-26",1642.0],["11-29",1655.0],["11-30",1651.0],["12-01",1673.0],["12-02",1710.0],["12-03",1721.0],["12-06",1729.0],["12-07",1721.0],["12-08",1686.0],["12-09",1686.0],["12-10",1681.0],["12-13",1690.0],["12-14",1711.0],["12-15",1697.0],["12-16",1703.0],["12-17",1705.0],["12-20",1700.0],["12-21",1715.0],["12-22",1725.0],["12-23",1729.0],["12-24",1725.0],["12-29",1750.0],["12-30",1760.0],["12-31",1731.0]],"Silver":[["01-04",17.17],["01-05",17.57],["01-06",17.89],["01-07",18.09],["01-08",18.12],["01-11",18.84],["01-12",18.41],["01-13",18.35],["01-14",18.58],["01-15",18.52],["01-18",18.66],["01-19",18.5],["01-20",18.48],["01-21",17.68],["01-22",17.28],["01-25",17.16],["01-26",16.79],["01-27",16.74],["01-28",16.62],["01-29",16.29],["02-01",16.23],["02-02",16.78],["02-03",16.79],["02-04",16.13],["02-05",15.17],["02-08",15.14],["02-09",15.2],["02-10",15.6],["02-11",15.37],["02-12",15.33],["02-15",15.57],["02-16",15.82],["02-17",16.21],["02-18",15.83],["02-19",15.95],["02-22",16.44],["02-23",16.1],["02-24",15.76],["02-25",15.92],["02-26",16.12],["03-01",16.5],["03-02",16.57],["03-03",17.17],["03-04",17.34],["03-05",17.25],["03-08",17.33],["03-09",17.05],["03-10",17.47],["03-11",16.91],["03-12",17.31],["03-15",17.02],["03-16",17.24],["03-17",17.54],["03-18",17.49],["03-19",17.31],["03-22",16.78],["03-23",16.78],["03-24",16.68],["03-25",16.79],["03-26",16.85],["03-29",17.15],["03-30",17.41],["03-31",17.5],["04-01",17.69],["04-06",17.92],["04-07",17.97],["04-08",17.98],["04-09",18.34],["04-12",18.49],["04-13",18.16],["04-14",18.39],["04-15",18.27],["04-16",18.35],["04-19",17.5],["04-20",18.0],["04-21",17.82],["04-22",17.98],["04-23",17.89],["04-26",18.35],["04-27",18.16],["04-28",17.96],["04-29",18.15],["04-30",18.62],["05-04",18.71],["05-05",17.63],["05-06",17.69],["05-07",17.7],["05-10",18.46],["05-11",18.42],["05-12",19.59],["05-13",19.43],["05-14",19.64],["05-17",19.11],["05-18",18.82],["05-19",18.53],["05-20",17.93],["05-21",17.72],["05-24",17.78],["05-25",17.63],["05-26",18.27],["05-27",18.36],["05-28",18.53],["06-01",18.3],["06-02",18.43],["06-03",18.27],["06-04",17.76],["06-07",17.36],["06-08",18.34],["06-09",18.27],["06-10",17.98],["06-11",18.31],["06-14",18.43],["06-15",18.42],["06-16",18.51],["06-17",18.5],["06-18",18.77],["06-21",19.37],["06-22",18.62],["06-23",18.91],["06-24",18.38],["06-25",18.65],["06-28",19.11],["06-29",18.57],["06-30",18.74],["07-01",18.65],["07-02",17.98],["07-05",17.85],["07-06",17.85],["07-07",17.65],["07-08",18.0],["07-09",17.87],["07-12",18.06],["07-13",18.0],["07-14",18.29],["07-15",18.42],["07-16",18.25],["07-19",17.78],["07-20",17.55],["07-21",17.88],["07-22",17.82],["07-23",18.17],["07-26",18.01],["07-27",18.16],["07-28",17.63],["07-29",17.6],["07-30",17.66],["08-02",18.11],["08-03",18.42],["08-04",18.5],["08-05",18.35],["08-06",18.3],["08-09",18.48],["08-10",18.09],["08-11",18.12],["08-12",17.92],["08-13",18.06],["08-16",18.2],["08-17",18.54],["08-18",18.36],["08-19",18.45],["08-20",18.14],["08-23",17.94],["08-24",17.88],["08-25",18.63],["08-26",19.11],["08-27",19.03],["08-31",18.87],["09-01",19.47],["09-02",19.45],["09-03",19.66],["09-06",19.86],["09-07",19.65],["09-08",20.02],["09-09",19.97],["09-10",19.9],["09-13",19.93],["09-14",20.31],["09-15",20.44],["09-16",20.76],["09-17",20.85],["09-20",20.91],["09-21",20.76],["09-22",21.08],["09-23",21.08],["09-24",21.35],["09-27",21.54],["09-28",21.16],["09-29",21.87],["09-30",22.07],["10-01",21.95],["10-04",22.03],["10-05",22.24],["10-06",22.92],["10-07",23.38],["10-08",22.37],["10-11",23.31],["10-12",23.03],["10-13",23.53],["10-14",24.49],["10-15",24.42],["10-18",24.02],["10-19",24.26],["10-20",23.71],["10-21",23.9],["10-22",23.05],["10-25",23.71],["10-26",23.48],["10-27",23.77],["10-28",23.73],["10-29",23.96],["11-01",24.91],["11-02",24.73],["11-03",25.0],["11-04",25.38],["11-05",26.14],["11-08",26.72],["11-09",28.55],["11-10",27.53],["11-11",27.75],["11-12",26.79],["11-15",26.01],["11-16",25.48],["11-17",25.2],["11-18",26.57],["11-19",27.07],["11-22",27.42],["11-23",27.31],["11-24",27.41],["11-25",27.44],["11-26",26.62],["11-29",26.74],["11-30",27.13],["12-01",28.74],["12-02",28.5],["12-03",28.74],["12-06",29.6],["12-07",30.5],["12-08",29.02],["12-09",28.41],["12-10",28.79],["12-13",29.33],["12-14",29.88],["12-15",29.06],["12-16",29.15],["12-17",28.78],["12-20",29.21],["12-21",29.25],["12-22",29.35],["12-23",29.18],["12-24",29.07],["12-29",30.44],["12-30",30.7],["12-31",30.63]]},"2011":{"Gold":[["01-04",1405.5],["01-05",1382.75],["01-06",1376.0],["01-07",1358.0],["01-10",1368.25],["01-11",1381.0],["01-12",1383.5],["01-13",1380.75],["01-14",1369.25],["01-17",1357.5],["01-18",1368.75],["01-19",1373.75],["01-20",1364.5],["01-21",1344.0],["01-24",1347.5],["01-25",1326.0],["01-26",1335.5],["01-27",1337.5],["01-28",1316.0],["01-31",1333.5],["02-01",1337.5],["02-02",1337.0],["02-03",1332.5],["02-04",1347.5],["02-07",1347.0],["02-08",1354.0],["02-09",1362.5],["02-10",1358.75],["02-11",1359.0],["02-14",1356.75],["02-15",1372.25],["02-16",1374.5],["02-17",1377.0],["02-18",1385.5],["02-21",1399.5],["02-22",1394.5],["02-23",1401.25],["02-24",1414.5],["02-25",1405.0],["02-28",1409.75],["03-01",1414.5],["03-02",1430.5],["03-03",1430.5],["03-04",1418.0],["03-07",1437.0],["03-08",1435.0],["03-09",1431.5],["03-10",1424.25],["03-11",1409.75],["03-14",1424.5],["03-15",1407.0],["03-16",1398.5],["03-17",1403.5],["03-18",1415.5],["03-21",1427.75],["03-22",1425.5],["03-23",1433.0],["03-24",1441.25],["03-25",1434.0],["03-28",1420.0],["03-29",1414.0],["03-30",1419.0],["03-31",1431.0],["04-01",1434.5],["04-04",1432.5],["04-05",1434.5],["04-06",1457.0],["04-07",1456.5],["04-08",1470.5],["04-11",1469.5],["04-12",1461.25],["04-13",1458.0],["04-14",1457.5],["04-15",1472.5],["04-18",1484.5],["04-19",1495.0],["04-20",1505.0],["04-21",1507.0],["04-26",1505.0],["04-27",1508.0],["04-28",1531.0],["05-03",1546.5],["05-04",1536.0],["05-05",1514.5],["05-06",1487.75],["05-09",1505.0],["05-10",1517.25],["05-11",1524.5],["05-12",1488.25],["05-13",1511.0],["05-16",1495.0],["05-17",1495.5],["05-18",1491.25],["05-19",1488.75],["05-20",1502.75],["05-23",1508.5],["05-24",1520.75],["05-25",1527.0],["05-26",1521.5],["05-27",1525.0],["05-31",1537.0],["06-01",1532.25],["06-02",1540.75],["06-03",1531.0],["06-06",1542.75],["06-07",1548.4],["06-08",1535.5],["06-09",1534.0],["06-10",1541.0],["06-13",1524.7],["06-14",1519.0],["06-15",1517.75],["06-16",1525.0],["06-17",1526.25],["06-20",1537.0],["06-21",1543.0],["06-22",1546.0],["06-23",1541.5],["06-24",1521.0],["06-27",1501.0],["06-28",1502.5],["06-29",1506.0],["06-30",1508.0],["07-01",1492.75],["07-04",1495.25],["07-05",1498.75],["07-06",1515.8],["07-07",1526.25],["07-08",1526.0],["07-11",1543.5],["07-12",1544.5],["07-13",1571.5],["07-14",1592.5],["07-15",1578.5],["07-18",1598.25],["07-19",1602.0],["07-20",1584.25],["07-21",1600.5],["07-22",1588.0],["07-25",1618.5],["07-26",1610.0],["07-27",1621.0],["07-28",1617.5],["07-29",1613.75],["08-01",1613.5],["08-02",1624.0],["08-03",1667.5],["08-04",1664.25],["08-05",1665.0],["08-08",1709.75],["08-09",1770.0],["08-10",1753.75],["08-11",1786.0],["08-12",1755.0],["08-15",1738.0],["08-16",1779.0],["08-17",1792.0],["08-18",1794.5],["08-19",1862.0],["08-22",1877.75],["08-23",1886.5],["08-24",1850.0],["08-25",1716.5],["08-26",1787.0],["08-30",1791.0],["08-31",1826.0],["09-01",1815.5],["09-02",1854.0],["09-05",1896.5],["09-06",1891.0],["09-07",1844.0],["09-08",1827.0],["09-09",1879.5],["09-12",1843.0],["09-13",1806.0],["09-14",1829.0],["09-15",1806.0],["09-16",1778.0],["09-19",1817.0],["09-20",1792.0],["09-21",1810.25],["09-22",1765.5],["09-23",1730.0],["09-26",1615.0],["09-27",1671.0],["09-28",1655.0],["09-29",1620.0],["09-30",1629.0],["10-03",1660.0],["10-04",1672.0],["10-05",1600.0],["10-06",1649.5],["10-07",1651.0],["10-10",1664.0],["10-11",1662.0],["10-12",1687.0],["10-13",1673.0],["10-14",1676.0],["10-17",1689.0],["10-18",1658.0],["10-19",1651.0],["10-20",1629.0],["10-21",1623.0],["10-24",1651.0],["10-25",1656.25],["10-26",1713.0],["10-27",1708.0],["10-28",1735.0],["10-31",1718.0],["11-01",1702.0],["11-02",1731.0],["11-03",1732.5],["11-04",1756.0],["11-07",1764.0],["11-08",1794.0],["11-09",1780.0],["11-10",1766.0],["11-11",1764.0],["11-14",1780.5],["11-15",1765.0],["11-16",1773.0],["11-17",1756.0],["11-18",1730.0],["11-21",1704.0],["11-22",1697.5],["11-23",1686.0],["11-24",1699.0],["11-25",1676.0],["11-28",1714.0],["11-29",1717.0],["11-30",1704.0],["12-01",1750.0],["12-02",1751.0],["12-05",1744.0],["12-06",1720.0],["12-07",1731.0],["12-08",1739.0],["12-09",1712.0],["12-12",1680.0],["12-13",1665.0],["12-14",1635.0],["12-15",1590.0],["12-16",1589.5],["12-19",1593.0],["12-20",1605.0],["12-21",1637.5],["12-22",1609.0],["12-23",1607.5],["12-28",1584.0],["12-29",1537.5],["12-30",1574.5]],"Palladium":[["01-04",792.0],["01-05",764.0],["01-06",770.0],["01-07",741.0],["01-10",750.0],["01-11",762.0],["01-12",805.0],["01-13",815.0],["01-14",802.0],["01-17",786.0],["01-18",806.0],["01-19",823.0],["01-20",815.0],["01-21",808.0],["01-24",818.0],["01-25",786.0],["01-26",797.0],["01-27",809.0],["01-28",803.0],["01-31",811.0],["02-01",820.0],["02-02",823.0],["02-03",809.0],["02-04",812.0],["02-07",818.0],["02-08",828.0],["02-09",836.0],["02-10",818.0],["02-11",820.0],["02-14",824.0],["02-15",837.0],["02-16",842.0],["02-17",837.0],["02-18",843.0],["02-21",859.0],["02-22",837.0],["02-23",814.0],["02-24",767.0],["02-25",778.0],["02-28",790.0],["03-01",804.0],["03-02",814.0],["03-03",823.0],["03-04",811.0],["03-07",814.0],["03-08",789.0],["03-09",798.0],["03-10",770.0],["03-11",756.0],["03-14",756.0],["03-15",723.0],["03-16",711.0],["03-17",708.0],["03-18",722.0],["03-21",741.0],["03-22",738.0],["03-23",742.0],["03-24",747.0],["03-25",749.0],["03-28",740.0],["03-29",744.0],["03-30",758.0],["03-31",761.0],["04-01",768.0],["04-04",780.0],["04-05",785.0],["04-06",787.0],["04-07",784.0],["04-08",789.0],["04-11",795.0],["04-12",785.0],["04-13",771.0],["04-14",771.0],["04-15",769.0],["04-18",762.0],["04-19",736.0],["04-20",751.0],["04-21",771.0],["04-26",753.5],["04-27",750.0],["04-28",769.0],["05-03",774.0],["05-04",772.0],["05-05",739.0],["05-06",717.0],["05-09",732.0],["05-10",733.0],["05-11",734.0],["05-12",706.0],["05-13",723.0],["05-16",708.0],["05-17",716.0],["05-18",731.0],["05-19",725.0],["05-20",731.0],["05-23",728.0],["05-24",737.0],["05-25",738.0],["05-26",747.0],["05-27",754.0],["05-31",775.0],["06-01",773.0],["06-02",771.0],["06-03",772.0],["06-06",787.0],["06-07",796.0],["06-08",802.0],["06-09",806.0],["06-10",817.0],["06-13",808.0],["06-14",805.0],["06-15",790.0],["06-16",768.0],["06-17",744.0],["06-20",742.0],["06-21",755.0],["06-22",766.0],["06-23",757.0],["06-24",744.0],["06-27",729.0],["06-28",734.0],["06-29",742.0],["06-30",759.0],["07-01",752.0],["07-04",758.0],["07-05",759.0],["07-06",776.0],["07-07",770.0],["07-08",782.0],["07-11",768.0],["07-12",756.0],["07-13",772.0],["07-14",785.0],["07-15",774.0],["07-18",785.0],["07-19",796.0],["07-20",793.0],["07-21",795.0],["07-22",805.0],["07-25",806.0],["07-26",811.0],["07-27",838.0],["07-28",830.0],["07-29",827.0],["08-01",840.0],["08-02",831.0],["08-03",824.0],["08-04",788.5],["08-05",739.0],["08-08",730.0],["08-09",722.0],["08-10",747.0],["08-11",736.0],["08-12",737.0],["08-15",753.0],["08-16",746.0],["08-17",759.0],["08-18",777.0],["08-19",747.0],["08-22",754.0],["08-23",764.0],["08-24",762.0],["08-25",748.0],["08-26",747.0],["08-30",757.0],["08-31",780.0],["09-01",786.0],["09-02",786.0],["09-05",776.0],["09-06",766.0],["09-07",749.0],["09-08",757.0],["09-09",762.0],["09-12",732.0],["09-13",715.0],["09-14",721.0],["09-15",717.0],["09-16",735.0],["09-19",726.0],["09-20",718.0],["09-21",716.0],["09-22",675.0],["09-23",665.0],["09-26",628.0],["09-27",647.0],["09-28",650.0],["09-29",626.0],["09-30",627.0],["10-03",604.0],["10-04",592.0],["10-05",561.0],["10-06",595.0],["10-07",598.0],["10-10",615.0],["10-11",605.0],["10-12",614.0],["10-13",605.0],["10-14",605.0],["10-17",642.0],["10-18",606.0],["10-19",614.0],["10-20",597.0],["10-21",596.0],["10-24",622.0],["10-25",643.0],["10-26",648.0],["10-27",653.0],["10-28",667.0],["10-31",651.0],["11-01",635.0],["11-02",641.0],["11-03",646.0],["11-04",658.0],["11-07",650.0],["11-08",672.0],["11-09",662.0],["11-10",645.0],["11-11",648.0],["11-14",659.0],["11-15",656.0],["11-16",659.0],["11-17",642.0],["11-18",610.0],["11-21",595.0],["11-22",591.0],["11-23",594.0],["11-24",587.0],["11-25",570.0],["11-28",593.0],["11-29",583.0],["11-30",574.0],["12-01",613.0],["12-02",657.0],["12-05",650.0],["12-06",632.0],["12-07",676.0],["12-08",672.0],["12-09",665.0],["12-12",668.0],["12-13",654.0],["12-14",642.0],["12-15",614.0],["12-16",627.0],["12-19",623.0],["12-20",617.0],["12-21",635.0],["12-22",632.0],["12-23",653.0],["12-28",658.0],["12-29",636.0],["12-30",636.0]],"Platinum":[["01-04",1768.0],["01-05",1735.0],["01-06",1735.0],["01-07",1716.0],["01-10",1739.0],["01-11",1748.0],["01-12",1789.0],["01-13",1798.0],["01-14",1810.0],["01-17",1806.0],["01-18",1823.0],["01-19",1846.0],["01-20",1823.0],["01-21",1812.0],["01-24",1824.0],["01-25",1787.0],["01-26",1800.0],["01-27",1803.0],["01-28",1790.0],["01-31",1789.0],["02-01",1808.0],["02-02",1830.0],["02-03",1826.0],["02-04",1833.0],["02-07",1842.0],["02-08",1853.0],["02-09",1863.0],["02-10",1834.0],["02-11",1830.0],["02-14",1824.0],["02-15",1840.0],["02-16",1838.0],["02-17",1826.0],["02-18",1833.0],["02-21",1847.0],["02-22",1823.0],["02-23",1804.0],["02-24",1772.0],["02-25",1787.0],["02-28",1807.0],["03-01",1809.0],["03-02",1837.0],["03-03",1846.0],["03-04",1831.0],["03-07",1838.0],["03-08",1815.0],["03-09",1813.0],["03-10",1790.0],["03-11",1768.0],["03-14",1759.0],["03-15",1720.5],["03-16",1696.0],["03-17",1698.0],["03-18",1719.0],["03-21",1740.0],["03-22",1744.0],["03-23",1741.0],["03-24",1753.0],["03-25",1746.0],["03-28",1728.0],["03-29",1745.0],["03-30",1752.0],["03-31",1775.0],["04-01",1779.0],["04-04",1779.0],["04-05",1788.0],["04-06",1796.0],["04-07",1787.0],["04-08",1810.0],["04-11",1804.0],["04-12",1790.0],["04-13",1783.0],["04-14",1784.0],["04-15",1790.0],["04-18",1786.0],["04-19",1782.0],["04-20",1788.0],["04-21",1814.0],["04-26",1809.0],["04-27",1807.0],["04-28",1820.0],["05-03",1858.0],["05-04",1853.0],["05-05",1822.0],["05-06",1787.0],["05-09",1796.0],["05-10",1798.0],["05-11",1803.0],["05-12",1755.0],["05-13",1778.0],["05-16",1756.0],["05-17",1771.0],["05-18",1773.0],["05-19",1769.0],["05-20",1770.0],["05-23",1757.0],["05-24",1761.0],["05-25",1767.0],["05-26",1777.0],["05-27",1781.0],["05-31",1821.0],["06-01",1819.0],["06-02",1818.0],["06-03",1816.0],["06-06",1820.0],["06-07",1820.0],["06-08",1818.0],["06-09",1820.0],["06-10",1842.0],["06-13",1820.0],["06-14",1804.0],["06-15",1789.0],["06-16",1767.0],["06-17",1747.0],["06-20",1746.0],["06-21",1748.0],["06-22",1747.0],["06-23",1728.0],["06-24",1706.0],["06-27",1674.0],["06-28",1691.0],["06-29",1710.0],["06-30",1724.0],["07-01",1703.0],["07-04",1720.0],["07-05",1720.0],["07-06",1738.0],["07-07",1724.0],["07-08",1745.0],["07-11",1727.0],["07-12",1715.0],["07-13",1744.0],["07-14",1770.0],["07-15",1754.0],["07-18",1765.0],["07-19",1784.0],["07-20",1773.0],["07-21",1779.0],["07-22",1785.0],["07-25",1787.0],["07-26",1786.0],["07-27",1810.0],["07-28",1790.0],["07-29",1782.0],["08-01",1796.0],["08-02",1790.0],["08-03",1796.0],["08-04",1757.0],["08-05",1700.0],["08-08",1716.0],["08-09",1723.0],["08-10",1757.0],["08-11",1781.0],["08-12",1790.0],["08-15",1793.0],["08-16",1813.0],["08-17",1829.0],["08-18",1841.0],["08-19",1871.0],["08-22",1894.0],["08-23",1899.0],["08-24",1870.0],["08-25",1805.0],["08-26",1824.0],["08-30",1830.0],["08-31",1855.5],["09-01",1850.0],["09-02",1858.0],["09-05",1881.0],["09-06",1877.0],["09-07",1837.0],["09-08",1834.0],["09-09",1857.0],["09-12",1831.0],["09-13",1818.0],["09-14",1811.0],["09-15",1800.0],["09-16",1799.0],["09-19",1813.0],["09-20",1782.0],["09-21",1784.0],["09-22",1736.0],["09-23",1695.0],["09-26",1542.0],["09-27",1582.0],["09-28",1559.0],["09-29",1542.0],["09-30",1538.0],["10-03",1520.0],["10-04",1484.0],["10-05",1442.0],["10-06",1504.0],["10-07",1521.0],["10-10",1521.0],["10-11",1518.0],["10-12",1543.0],["10-13",1541.0],["10-14",1546.0],["10-17",1574.0],["10-18",1526.0],["10-19",1525.0],["10-20",1490.0],["10-21",1491.0],["10-24",1522.0],["10-25",1554.0],["10-26",1566.0],["10-27",1603.0],["10-28",1645.0],["10-31",1606.0],["11-01",1581.0],["11-02",1595.0],["11-03",1595.0],["11-04",1640.0],["11-07",1627.0],["11-08",1661.0],["11-09",1651.0],["11-10",1628.0],["11-11",1626.0],["11-14",1650.0],["11-15",1630.0],["11-16",1630.0],["11-17",1618.0],["11-18",1595.0],["11-21",1574.0],["11-22",1557.0],["11-23",1557.0],["11-24",1549.0],["11-25",1535.0],["11-28",1557.0],["11-29",1542.0],["11-30",1515.0],["12-01",1552.0],["12-02",1559.0],["12-05",1545.0],["12-06",1514.0],["12-07",1531.0],["12-08",1517.0],["12-09",1491.0],["12-12",1492.0],["12-13",1493.0],["12-14",1476.0],["12-15",1398.0],["12-16",1426.5],["12-19",1416.0],["12-20",1420.0],["12-21",1447.0],["12-22",1429.0],["12-23",1436.0],["12-28",1415.0],["12-29",1364.0],["12-30",1381.0]],"Silver":[["01-04",30.67],["01-05",29.21],["01-06",29.08],["01-07",28.39],["01-10",28.79],["01-11",29.54],["01-12",29.6],["01-13",29.22],["01-14",28.52],["01-17",28.19],["01-18",28.79],["01-19",29.32],["01-20",28.41],["01-21",27.14],["01-24",27.56],["01-25",26.7],["01-26",27.1],["01-27",27.39],["01-28",26.68],["01-31",27.75],["02-01",28.32],["02-02",28.27],["02-03",28.3],["02-04",28.91],["02-07",29.21],["02-08",29.42],["02-09",30.22],["02-10",29.8],["02-11",30.0],["02-14",30.16],["02-15",30.72],["02-16",30.77],["02-17",30.61],["02-18",31.94],["02-21",33.43],["02-22",32.89],["02-23",33.29],["02-24",33.28],["02-25",32.54],["02-28",33.49],["03-01",34.37],["03-02",34.75],["03-03",34.53],["03-04",34.43],["03-07",36.6],["03-08",36.37],["03-09",36.17],["03-10",35.19],["03-11",34.1],["03-14",36.18],["03-15",33.88],["03-16",34.73],["03-17",34.47],["03-18",35.15],["03-21",36.16],["03-22",35.95],["03-23",36.58],["03-24",37.78],["03-25",37.68],["03-28",36.62],["03-29",36.62],["03-30",37.53],["03-31",37.87],["04-01",37.63],["04-04",38.46],["04-05",38.08],["04-06",39.63],["04-07",39.51],["04-08",40.22],["04-11",41.37],["04-12",40.44],["04-13",40.22],["04-14",40.67],["04-15",42.61],["04-18",42.79],["04-19",43.22],["04-20",44.79],["04-21",46.26],["04-26",45.48],["04-27",45.3],["04-28",48.7],["05-03",43.61],["05-04",40.29],["05-05",37.84],["05-06",34.2],["05-09",38.0],["05-10",38.4],["05-11",39.18],["05-12",32.5],["05-13",36.2],["05-16",34.35],["05-17",34.28],["05-18",34.59],["05-19",35.75],["05-20",34.8],["05-23",34.7],["05-24",35.85],["05-25",37.17],["05-26",36.95],["05-27",37.69],["05-31",38.65],["06-01",37.95],["06-02",37.22],["06-03",35.19],["06-06",36.87],["06-07",37.41],["06-08",36.22],["06-09",37.03],["06-10",37.38],["06-13",35.51],["06-14",34.68],["06-15",35.26],["06-16",35.55],["06-17",35.39],["06-20",35.58],["06-21",36.22],["06-22",35.91],["06-23",36.01],["06-24",34.73],["06-27",34.01],["06-28",33.96],["06-29",34.39],["06-30",35.02],["07-01",33.85],["07-04",34.1],["07-05",34.76],["07-06",35.38],["07-07",35.86],["07-08",36.28],["07-11",36.36],["07-12",34.91],["07-13",36.75],["07-14",39.4],["07-15",38.17],["07-18",40.33],["07-19",40.32],["07-20",38.59],["07-21",39.78],["07-22",39.67],["07-25",40.78],["07-26",40.34],["07-27",40.81],["07-28",40.19],["07-29",39.63],["08-01",39.31],["08-02",39.73],["08-03",41.04],["08-04",41.62],["08-05",39.24],["08-08",39.86],["08-09",38.36],["08-10",38.31],["08-11",39.18],["08-12",38.29],["08-15",39.18],["08-16",39.36],["08-17",40.02],["08-18",40.32],["08-19",41.98],["08-22",43.49],["08-23",42.88],["08-24",42.08],["08-25",39.0],["08-26",41.06],["08-30",40.9],["08-31",41.35],["09-01",41.47],["09-02",42.5],["09-05",42.71],["09-06",41.85],["09-07",40.98],["09-08",42.14],["09-09",41.4],["09-12",40.81],["09-13",40.02],["09-14",41.23],["09-15",40.34],["09-16",39.97],["09-19",40.46],["09-20",39.18],["09-21",40.25],["09-22",37.85],["09-23",32.9],["09-26",28.16],["09-27",33.5],["09-28",31.04],["09-29",30.19],["09-30",30.45],["10-03",31.05],["10-04",30.6],["10-05",28.69],["10-06",31.8],["10-07",31.98],["10-10",32.23],["10-11",31.37],["10-12",32.89],["10-13",31.97],["10-14",31.82],["10-17",32.3],["10-18",31.0],["10-19",31.97],["10-20",30.79],["10-21",30.8],["10-24",31.7],["10-25",32.0],["10-26",33.3],["10-27",33.55],["10-28",35.42],["10-31",34.24],["11-01",32.97],["11-02",33.83],["11-03",34.72],["11-04",33.95],["11-07",34.48],["11-08",34.64],["11-09",34.58],["11-10",33.71],["11-11",33.77],["11-14",34.38],["11-15",34.02],["11-16",34.45],["11-17",33.3],["11-18",32.25],["11-21",30.9],["11-22",31.85],["11-23",31.51],["11-24",31.94],["11-25",31.24],["11-28",32.0],["11-29",31.96],["11-30",31.35],["12-01",33.28],["12-02",33.15],["12-05",32.48],["12-06",31.85],["12-07",32.45],["12-08",32.64],["12-09",32.0],["12-12",31.22],["12-13",31.34],["12-14",29.92],["12-15",28.8],["12-16",29.78],["12-19",28.78],["12-20",29.28],["12-21",29.75],["12-22",29.3],["12-23",29.22],["12-28",28.65],["12-29",26.16],["12-30",28.18]]},"2012":{"Gold":[["01-03",1590.0],["01-04",1603.0],["01-05",1614.5],["01-06",1621.0],["01-09",1618.0],["01-10",1627.0],["01-11",1641.0],["01-12",1652.5],["01-13",1642.0],["01-16",1643.5],["01-17",1662.0],["01-18",1657.0],["01-19",1664.0],["01-20",1646.0],["01-23",1675.0],["01-24",1669.0],["01-25",1659.0],["01-26",1713.0],["01-27",1722.0],["01-30",1720.5],["01-31",1738.0],["02-01",1744.0],["02-02",1747.5],["02-03",1759.5],["02-06",1717.0],["02-07",1720.0],["02-08",1743.0],["02-09",1733.0],["02-10",1715.5],["02-13",1727.0],["02-14",1721.0],["02-15",1725.5],["02-16",1716.0],["02-17",1732.0],["02-20",1729.5],["02-21",1737.0],["02-22",1754.75],["02-23",1776.5],["02-24",1778.5],["02-27",1765.0],["02-28",1774.75],["02-29",1788.0],["03-01",1721.0],["03-02",1714.5],["03-05",1698.0],["03-06",1685.5],["03-07",1682.5],["03-08",1701.5],["03-09",1699.5],["03-12",1705.25],["03-13",1694.75],["03-14",1662.0],["03-15",1646.75],["03-16",1649.0],["03-19",1654.0],["03-20",1648.5],["03-21",1656.0],["03-22",1636.0],["03-23",1651.0],["03-26",1658.0],["03-27",1694.0],["03-28",1677.0],["03-29",1655.75],["03-30",1660.75],["04-02",1664.0],["04-03",1674.75],["04-04",1631.75],["04-05",1622.5],["04-10",1643.75],["04-11",1654.0],["04-12",1655.5],["04-13",1670.5],["04-16",1648.25],["04-17",1652.0],["04-18",1646.5],["04-19",1642.0],["04-20",1640.0],["04-23",1632.0],["04-24",1638.75],["04-25",1641.25],["04-26",1648.25],["04-27",1654.0],["04-30",1662.5],["05-01",1661.25],["05-02",1652.5],["05-03",1642.5],["05-04",1629.5],["05-08",1627.0],["05-09",1585.5],["05-10",1590.0],["05-11",1580.75],["05-14",1563.0],["05-15",1559.0],["05-16",1537.5],["05-17",1547.0],["05-18",1588.0],["05-21",1590.25],["05-22",1575.75],["05-23",1555.0],["05-24",1558.5],["05-25",1560.5],["05-28",1579.0],["05-29",1573.75],["05-30",1548.75],["05-31",1567.5],["06-01",1552.5],["06-06",1633.25],["06-07",1620.75],["06-08",1576.0],["06-11",1593.0],["06-12",1589.25],["06-13",1612.75],["06-14",1619.0],["06-15",1622.25],["06-18",1623.5],["06-19",1628.5],["06-20",1618.75],["06-21",1600.0],["06-22",1570.5],["06-25",1569.0],["06-26",1583.25],["06-27",1567.5],["06-28",1567.75],["06-29",1569.5],["07-02",1596.25],["07-03",1608.5],["07-04",1617.0],["07-05",1616.75],["07-06",1591.75],["07-09",1581.0],["07-10",1594.5],["07-11",1576.5],["07-12",1565.5],["07-13",1579.0],["07-16",1584.0],["07-17",1595.0],["07-18",1579.5],["07-19",1580.0],["07-20",1583.0],["07-23",1571.5],["07-24",1573.0],["07-25",1587.5],["07-26",1603.0],["07-27",1618.75],["07-30",1616.5],["07-31",1622.75],["08-01",1614.75],["08-02",1604.5],["08-03",1595.0],["08-06",1606.75],["08-07",1613.0],["08-08",1607.0],["08-09",1612.75],["08-10",1608.5],["08-13",1622.25],["08-14",1614.5],["08-15",1594.75],["08-16",1603.5],["08-17",1616.5],["08-20",1615.25],["08-21",1624.0],["08-22",1640.5],["08-23",1662.5],["08-24",1666.5],["08-28",1663.5],["08-29",1664.25],["08-30",1657.0],["08-31",1657.75],["09-03",1686.0],["09-04",1691.5],["09-05",1689.5],["09-06",1708.5],["09-07",1696.0],["09-10",1732.75],["09-11",1731.0],["09-12",1742.75],["09-13",1730.5],["09-14",1772.5],["09-17",1767.25],["09-18",1756.75],["09-19",1774.5],["09-20",1760.0],["09-21",1773.75],["09-24",1758.5],["09-25",1766.75],["09-26",1763.75],["09-27",1755.25],["09-28",1781.0],["10-01",1770.5],["10-02",1778.5],["10-03",1777.25],["10-04",1786.5],["10-05",1790.0],["10-08",1769.0],["10-09",1770.75],["10-10",1763.0],["10-11",1767.25],["10-12",1767.0],["10-15",1747.25],["10-16",1737.5],["10-17",1747.75],["10-18",1748.0],["10-19",1732.75],["10-22",1725.0],["10-23",1717.0],["10-24",1708.5],["10-25",1715.0],["10-26",1704.0],["10-29",1712.0],["10-30",1713.5],["10-31",1718.0],["11-01",1723.25],["11-02",1708.25],["11-05",1679.0],["11-06",1691.75],["11-07",1730.5],["11-08",1715.0],["11-09",1732.75],["11-12",1735.75],["11-13",1724.75],["11-14",1724.5],["11-15",1723.5],["11-16",1710.0],["11-19",1723.25],["11-20",1734.0],["11-21",1726.75],["11-22",1729.75],["11-23",1734.75],["11-26",1747.25],["11-27",1747.25],["11-28",1741.0],["11-29",1724.5],["11-30",1728.25],["12-03",1718.0],["12-04",1706.75],["12-05",1703.0],["12-06",1693.0],["12-07",1697.0],["12-10",1708.5],["12-11",1709.75],["12-12",1712.5],["12-13",1694.75],["12-14",1696.5],["12-17",1690.0],["12-18",1699.5],["12-19",1674.5],["12-20",1667.0],["12-21",1648.25],["12-24",1662.5],["12-27",1655.25],["12-28",1658.75],["12-31",1664.0]],"Palladium":[["01-03",655.0],["01-04",663.0],["01-05",647.0],["01-06",633.0],["01-09",617.0],["01-10",633.0],["01-11",641.0],["01-12",641.0],["01-13",632.0],["01-16",640.0],["01-17",653.0],["01-18",649.0],["01-19",670.5],["01-20",668.0],["01-23",679.0],["01-24",679.0],["01-25",677.0],["01-26",696.0],["01-27",685.0],["01-30",681.0],["01-31",694.0],["02-01",693.0],["02-02",694.0],["02-03",710.0],["02-06",694.0],["02-07",702.0],["02-08",706.0],["02-09",714.0],["02-10",702.0],["02-13",703.0],["02-14",689.0],["02-15",688.0],["02-16",679.0],["02-17",695.0],["02-20",693.0],["02-21",701.0],["02-22",711.0],["02-23",721.0],["02-24",717.0],["02-27",710.0],["02-28",708.0],["02-29",718.0],["03-01",704.0],["03-02",711.0],["03-05",706.0],["03-06",688.0],["03-07",675.0],["03-08",691.0],["03-09",693.0],["03-12",706.0],["03-13",700.0],["03-14",699.0],["03-15",698.0],["03-16",701.0],["03-19",700.0],["03-20",697.0],["03-21",696.0],["03-22",678.0],["03-23",654.0],["03-26",661.0],["03-27",669.0],["03-28",654.0],["03-29",648.0],["03-30",650.0],["04-02",656.0],["04-03",659.0],["04-04",645.0],["04-05",640.0],["04-10",647.0],["04-11",637.0],["04-12",643.0],["04-13",649.0],["04-16",643.0],["04-17",653.0],["04-18",661.0],["04-19",661.0],["04-20",660.0],["04-23",668.0],["04-24",672.0],["04-25",669.0],["04-26",666.0],["04-27",669.0],["04-30",682.0],["05-01",679.0],["05-02",675.0],["05-03",667.0],["05-04",656.5],["05-08",640.0],["05-09",615.0],["05-10",615.0],["05-11",602.0],["05-14",591.0],["05-15",598.0],["05-16",593.0],["05-17",604.0],["05-18",606.0],["05-21",617.0],["05-22",611.0],["05-23",604.0],["05-24",590.0],["05-25",592.0],["05-28",598.0],["05-29",606.0],["05-30",596.0],["05-31",610.0],["06-01",602.0],["06-06",623.0],["06-07",625.0],["06-08",613.0],["06-11",623.0],["06-12",617.0],["06-13",620.0],["06-14",622.0],["06-15",636.0],["06-18",626.0],["06-19",629.0],["06-20",628.0],["06-21",617.0],["06-22",610.0],["06-25",609.0],["06-26",604.0],["06-27",582.5],["06-28",580.0],["06-29",568.0],["07-02",580.0],["07-03",583.0],["07-04",601.0],["07-05",597.0],["07-06",581.0],["07-09",579.0],["07-10",583.0],["07-11",579.0],["07-12",575.0],["07-13",579.0],["07-16",579.0],["07-17",585.0],["07-18",582.0],["07-19",582.0],["07-20",582.0],["07-23",569.0],["07-24",564.0],["07-25",564.0],["07-26",566.0],["07-27",573.0],["07-30",569.0],["07-31",589.0],["08-01",589.0],["08-02",583.0],["08-03",573.0],["08-06",576.0],["08-07",583.0],["08-08",585.0],["08-09",588.0],["08-10",580.0],["08-13",582.0],["08-14",577.5],["08-15",576.0],["08-16",577.0],["08-17",587.0],["08-20",601.0],["08-21",605.0],["08-22",632.0],["08-23",636.0],["08-24",645.0],["08-28",643.0],["08-29",634.0],["08-30",633.0],["08-31",618.0],["09-03",634.0],["09-04",635.0],["09-05",634.0],["09-06",647.0],["09-07",645.0],["09-10",661.0],["09-11",668.0],["09-12",678.0],["09-13",678.0],["09-14",692.0],["09-17",687.0],["09-18",676.0],["09-19",674.0],["09-20",663.0],["09-21",675.0],["09-24",650.0],["09-25",646.0],["09-26",633.0],["09-27",630.0],["09-28",638.0],["10-01",637.0],["10-02",645.0],["10-03",648.0],["10-04",662.0],["10-05",668.0],["10-08",652.0],["10-09",660.0],["10-10",654.0],["10-11",652.0],["10-12",649.0],["10-15",638.0],["10-16",637.0],["10-17",642.0],["10-18",653.0],["10-19",637.0],["10-22",628.0],["10-23",613.0],["10-24",599.0],["10-25",606.0],["10-26",597.0],["10-29",595.0],["10-30",594.0],["10-31",610.0],["11-01",615.0],["11-02",608.0],["11-05",598.0],["11-06",613.0],["11-07",619.0],["11-08",609.0],["11-09",616.0],["11-12",609.0],["11-13",613.0],["11-14",643.0],["11-15",635.0],["11-16",624.0],["11-19",629.0],["11-20",641.0],["11-21",637.0],["11-22",649.0],["11-23",654.0],["11-26",659.0],["11-27",669.0],["11-28",659.0],["11-29",678.0],["11-30",688.0],["12-03",682.0],["12-04",682.0],["12-05",684.0],["12-06",683.0],["12-07",690.0],["12-10",700.0],["12-11",698.0],["12-12",696.0],["12-13",686.0],["12-14",694.0],["12-17",696.0],["12-18",700.0],["12-19",689.0],["12-20",692.0],["12-21",675.0],["12-24",683.0],["12-27",695.0],["12-28",706.0],["12-31",699.0]],"Platinum":[["01-03",1408.0],["01-04",1431.0],["01-05",1420.0],["01-06",1417.0],["01-09",1405.0],["01-10",1459.0],["01-11",1485.0],["01-12",1500.0],["01-13",1483.0],["01-16",1489.0],["01-17",1526.0],["01-18",1512.0],["01-19",1537.0],["01-20",1507.0],["01-23",1540.0],["01-24",1550.0],["01-25",1550.0],["01-26",1597.0],["01-27",1613.0],["01-30",1601.0],["01-31",1626.0],["02-01",1611.0],["02-02",1619.0],["02-03",1631.0],["02-06",1610.0],["02-07",1623.0],["02-08",1649.0],["02-09",1665.0],["02-10",1648.0],["02-13",1663.0],["02-14",1635.0],["02-15",1633.0],["02-16",1612.0],["02-17",1637.0],["02-20",1648.0],["02-21",1667.0],["02-22",1693.0],["02-23",1728.0],["02-24",1717.0],["02-27",1700.0],["02-28",1710.0],["02-29",1727.0],["03-01",1692.0],["03-02",1701.0],["03-05",1665.0],["03-06",1632.0],["03-07",1620.0],["03-08",1644.0],["03-09",1661.0],["03-12",1684.0],["03-13",1698.0],["03-14",1684.0],["03-15",1680.0],["03-16",1672.0],["03-19",1672.0],["03-20",1664.0],["03-21",1654.0],["03-22",1617.0],["03-23",1625.0],["03-26",1624.0],["03-27",1661.0],["03-28",1640.0],["03-29",1641.0],["03-30",1643.0],["04-02",1636.0],["04-03",1658.0],["04-04",1627.0],["04-05",1605.0],["04-10",1611.0],["04-11",1596.0],["04-12",1594.0],["04-13",1594.0],["04-16",1571.0],["04-17",1572.0],["04-18",1584.0],["04-19",1592.0],["04-20",1577.0],["04-23",1573.0],["04-24",1556.0],["04-25",1550.0],["04-26",1559.0],["04-27",1567.0],["04-30",1574.0],["05-01",1563.0],["05-02",1565.0],["05-03",1557.0],["05-04",1528.0],["05-08",1521.0],["05-09",1505.0],["05-10",1496.0],["05-11",1467.0],["05-14",1451.0],["05-15",1446.0],["05-16",1426.0],["05-17",1446.0],["05-18",1458.0],["05-21",1468.0],["05-22",1461.0],["05-23",1423.0],["05-24",1417.0],["05-25",1430.0],["05-28",1439.0],["05-29",1436.0],["05-30",1413.0],["05-31",1412.0],["06-01",1396.0],["06-06",1462.0],["06-07",1461.0],["06-08",1419.0],["06-11",1444.0],["06-12",1433.0],["06-13",1451.0],["06-14",1485.0],["06-15",1492.0],["06-18",1486.0],["06-19",1486.0],["06-20",1481.0],["06-21",1457.0],["06-22",1434.0],["06-25",1436.0],["06-26",1439.0],["06-27",1409.0],["06-28",1406.0],["06-29",1407.0],["07-02",1442.0],["07-03",1467.0],["07-04",1480.0],["07-05",1487.0],["07-06",1467.0],["07-09",1440.0],["07-10",1439.0],["07-11",1425.0],["07-12",1412.0],["07-13",1426.0],["07-16",1423.0],["07-17",1428.0],["07-18",1417.0],["07-19",1413.0],["07-20",1415.0],["07-23",1394.0],["07-24",1393.0],["07-25",1391.0],["07-26",1401.0],["07-27",1417.0],["07-30",1398.0],["07-31",1419.0],["08-01",1412.0],["08-02",1398.0],["08-03",1392.0],["08-06",1396.0],["08-07",1409.0],["08-08",1405.0],["08-09",1414.0],["08-10",1402.0],["08-13",1400.0],["08-14",1400.0],["08-15",1398.0],["08-16",1398.0],["08-17",1456.0],["08-20",1470.0],["08-21",1483.0],["08-22",1525.0],["08-23",1549.0],["08-24",1536.0],["08-28",1523.0],["08-29",1520.0],["08-30",1524.0],["08-31",1508.0],["09-03",1543.0],["09-04",1553.0],["09-05",1545.0],["09-06",1580.0],["09-07",1579.0],["09-10",1596.0],["09-11",1596.0],["09-12",1636.0],["09-13",1647.0],["09-14",1694.0],["09-17",1695.0],["09-18",1657.0],["09-19",1640.0],["09-20",1612.0],["09-21",1635.0],["09-24",1608.0],["09-25",1619.0],["09-26",1627.0],["09-27",1635.0],["09-28",1661.0],["10-01",1658.0],["10-02",1675.0],["10-03",1674.0],["10-04",1698.0],["10-05",1714.0],["10-08",1679.0],["10-09",1700.0],["10-10",1677.0],["10-11",1676.0],["10-12",1677.0],["10-15",1643.0],["10-16",1641.0],["10-17",1652.0],["10-18",1666.0],["10-19",1634.0],["10-22",1619.0],["10-23",1588.0],["10-24",1569.0],["10-25",1582.0],["10-26",1551.0],["10-29",1545.0],["10-30",1548.0],["10-31",1566.0],["11-01",1573.0],["11-02",1555.0],["11-05",1542.0],["11-06",1548.0],["11-07",1563.0],["11-08",1541.0],["11-09",1565.0],["11-12",1567.0],["11-13",1578.0],["11-14",1594.0],["11-15",1574.0],["11-16",1558.0],["11-19",1561.0],["11-20",1574.0],["11-21",1571.0],["11-22",1581.0],["11-23",1581.0],["11-26",1605.0],["11-27",1619.0],["11-28",1604.0],["11-29",1616.0],["11-30",1617.0],["12-03",1599.0],["12-04",1594.0],["12-05",1592.0],["12-06",1580.0],["12-07",1593.0],["12-10",1618.0],["12-11",1619.0],["12-12",1640.0],["12-13",1618.0],["12-14",1613.0],["12-17",1602.0],["12-18",1610.0],["12-19",1597.0],["12-20",1588.0],["12-21",1550.0],["12-24",1543.0],["12-27",1538.0],["12-28",1530.0],["12-31",1523.0]],"Silver":[["01-03",28.78],["01-04",29.18],["01-05",28.92],["01-06",29.4],["01-09",28.85],["01-10",29.69],["01-11",29.81],["01-12",30.58],["01-13",29.64],["01-16",29.9],["01-17",30.41],["01-18",30.15],["01-19",30.79],["01-20",30.36],["01-23",32.45],["01-24",31.95],["01-25",31.67],["01-26",33.35],["01-27",33.48],["01-30",33.18],["01-31",33.6],["02-01",33.8],["02-02",33.67],["02-03",33.93],["02-06",33.52],["02-07",33.28],["02-08",34.37],["02-09",33.8],["02-10",33.55],["02-13",33.84],["02-14",33.51],["02-15",33.69],["02-16",33.18],["02-17",33.48],["02-20",33.56],["02-21",33.65],["02-22",34.08],["02-23",34.55],["02-24",35.57],["02-27",35.09],["02-28",35.6],["02-29",37.23],["03-01",34.56],["03-02",35.21],["03-05",34.18],["03-06",33.22],["03-07",33.17],["03-08",34.09],["03-09",33.87],["03-12",33.77],["03-13",33.58],["03-14",32.84],["03-15",32.36],["03-16",32.27],["03-19",32.44],["03-20",32.22],["03-21",31.97],["03-22",31.79],["03-23",31.54],["03-26",32.23],["03-27",33.01],["03-28",32.43],["03-29",31.79],["03-30",32.43],["04-02",32.42],["04-03",32.97],["04-04",31.98],["04-05",31.27],["04-10",31.55],["04-11",31.7],["04-12",31.47],["04-13",32.37],["04-16",31.32],["04-17",31.64],["04-18",31.61],["04-19",31.47],["04-20",31.79],["04-23",31.16],["04-24",30.86],["04-25",30.88],["04-26",30.7],["04-27",31.14],["04-30",31.2],["05-01",30.78],["05-02",30.52],["05-03",30.36],["05-04",29.9],["05-08",29.58],["05-09",28.77],["05-10",29.25],["05-11",28.58],["05-14",28.33],["05-15",28.28],["05-16",27.25],["05-17",27.48],["05-18",28.48],["05-21",28.39],["05-22",28.07],["05-23",27.76],["05-24",28.08],["05-25",28.24],["05-28",28.52],["05-29",28.25],["05-30",27.68],["05-31",28.1],["06-01",27.38],["06-06",29.36],["06-07",29.28],["06-08",28.17],["06-11",28.63],["06-12",28.54],["06-13",28.87],["06-14",28.88],["06-15",28.66],["06-18",28.43],["06-19",28.81],["06-20",28.31],["06-21",27.88],["06-22",26.81],["06-25",26.72],["06-26",27.44],["06-27",26.84],["06-28",26.81],["06-29",27.08],["07-02",27.36],["07-03",27.92],["07-04",28.11],["07-05",28.33],["07-06",27.32],["07-09",27.24],["07-10",27.57],["07-11",27.11],["07-12",26.67],["07-13",27.48],["07-16",27.05],["07-17",27.42],["07-18",27.03],["07-19",27.45],["07-20",27.07],["07-23",26.95],["07-24",26.93],["07-25",27.11],["07-26",27.81],["07-27",27.73],["07-30",27.64],["07-31",28.2],["08-01",27.87],["08-02",27.42],["08-03",27.25],["08-06",27.72],["08-07",28.0],["08-08",27.84],["08-09",28.02],["08-10",27.88],["08-13",28.05],["08-14",27.84],["08-15",27.64],["08-16",27.84],["08-17",28.2],["08-20",28.1],["08-21",28.92],["08-22",29.33],["08-23",30.32],["08-24",30.37],["08-28",30.81],["08-29",30.73],["08-30",30.66],["08-31",30.52],["09-03",31.74],["09-04",32.08],["09-05",32.1],["09-06",32.87],["09-07",32.22],["09-10",33.6],["09-11",33.52],["09-12",33.93],["09-13",33.0],["09-14",34.71],["09-17",34.53],["09-18",34.06],["09-19",34.65],["09-20",34.25],["09-21",34.69],["09-24",33.73],["09-25",34.01],["09-26",33.88],["09-27",33.95],["09-28",34.65],["10-01",34.35],["10-02",34.85],["10-03",34.72],["10-04",34.96],["10-05",34.85],["10-08",33.85],["10-09",33.87],["10-10",33.79],["10-11",34.25],["10-12",33.79],["10-15",33.22],["10-16",32.8],["10-17",33.03],["10-18",32.99],["10-19",32.33],["10-22",32.17],["10-23",31.71],["10-24",31.95],["10-25",32.08],["10-26",31.67],["10-29",31.82],["10-30",31.98],["10-31",32.28],["11-01",32.66],["11-02",31.92],["11-05",30.91],["11-06",31.4],["11-07",32.14],["11-08",31.7],["11-09",32.16],["11-12",32.63],["11-13",32.58],["11-14",32.48],["11-15",32.57],["11-16",32.27],["11-19",32.67],["11-20",33.19],["11-21",33.01],["11-22",33.29],["11-23",33.41],["11-26",34.08],["11-27",34.05],["11-28",33.85],["11-29",33.76],["11-30",34.28],["12-03",33.42],["12-04",33.3],["12-05",33.07],["12-06",32.83],["12-07",32.85],["12-10",33.34],["12-11",33.17],["12-12",33.1],["12-13",32.69],["12-14",32.52],["12-17",32.21],["12-18",32.38],["12-19",31.37],["12-20",31.12],["12-21",29.89],["12-24",30.19],["12-27",29.75],["12-28",30.15],["12-31",29.95]]},"2013":{"Gold":[["01-02",1681.5],["01-03",1684.5],["01-04",1632.25],["01-07",1653.75],["01-08",1653.75],["01-09",1663.5],["01-10",1663.0],["01-11",1669.5],["01-14",1667.75],["01-15",1681.0],["01-16",1679.75],["01-17",1683.25],["01-18",1690.0],["01-21",1688.0],["01-22",1692.5],["01-23",1692.25],["01-24",1677.0],["01-25",1670.25],["01-28",1656.75],["01-29",1660.5],["01-30",1666.25],["01-31",1674.5],["02-01",1665.0],["02-04",1664.25],["02-05",1678.0],["02-06",1670.0],["02-07",1675.75],["02-08",1669.75],["02-11",1663.5],["02-12",1641.75],["02-13",1648.0],["02-14",1644.0],["02-15",1629.25],["02-18",1611.25],["02-19",1613.5],["02-20",1602.0],["02-21",1568.5],["02-22",1580.0],["02-25",1592.5],["02-26",1597.25],["02-27",1608.5],["02-28",1591.0],["03-01",1570.0],["03-04",1578.0],["03-05",1584.25],["03-06",1574.0],["03-07",1580.5],["03-08",1577.0],["03-11",1577.5],["03-12",1582.5],["03-13",1591.5],["03-14",1585.0],["03-15",1593.25],["03-18",1599.5],["03-19",1602.5],["03-20",1611.5],["03-21",1608.75],["03-22",1611.5],["03-25",1602.25],["03-26",1597.25],["03-27",1591.0],["03-28",1602.5],["04-02",1597.75],["04-03",1568.5],["04-04",1545.25],["04-05",1552.75],["04-08",1577.25],["04-09",1572.5],["04-10",1581.5],["04-11",1555.75],["04-12",1548.0],["04-15",1416.0],["04-16",1378.0],["04-17",1379.0],["04-18",1397.0],["04-19",1414.0],["04-22",1425.0],["04-23",1417.25],["04-24",1424.5],["04-25",1446.5],["04-26",1462.25],["04-29",1472.5],["04-30",1472.75],["05-01",1469.5],["05-02",1456.0],["05-03",1476.5],["05-07",1463.0],["05-08",1454.0],["05-09",1469.5],["05-10",1449.25],["05-13",1429.75],["05-14",1436.5],["05-15",1412.25],["05-16",1377.0],["05-17",1376.75],["05-20",1353.75],["05-21",1378.75],["05-22",1385.25],["05-23",1386.0],["05-24",1385.25],["05-28",1379.0],["05-29",1384.5],["05-30",1406.25],["05-31",1410.25],["06-03",1396.75],["06-04",1405.25],["06-05",1396.5],["06-06",1399.5],["06-07",1410.0],["06-10",1376.75],["06-11",1369.5],["06-12",1377.25],["06-13",1386.25],["06-14",1379.75],["06-17",1386.0],["06-18",1378.5],["06-19",1366.0],["06-20",1303.25],["06-21",1290.25],["06-24",1283.25],["06-25",1285.0],["06-26",1229.0],["06-27",1232.0],["06-28",1203.25],["07-01",1243.5],["07-02",1260.75],["07-03",1246.0],["07-04",1249.5],["07-05",1232.75],["07-08",1225.5],["07-09",1252.0],["07-10",1252.25],["07-11",1280.75],["07-12",1275.0],["07-15",1281.25],["07-16",1286.0],["07-17",1284.25],["07-18",1279.75],["07-19",1286.0],["07-22",1313.75],["07-23",1326.75],["07-24",1340.0],["07-25",1312.0],["07-26",1327.75],["07-29",1330.75],["07-30",1322.25],["07-31",1331.5],["08-01",1323.75],["08-02",1285.75],["08-05",1311.0],["08-06",1292.0],["08-07",1275.5],["08-08",1287.75],["08-09",1305.5],["08-12",1325.75],["08-13",1334.0],["08-14",1323.25],["08-15",1339.5],["08-16",1360.75],["08-19",1375.25],["08-20",1365.75],["08-21",1360.0],["08-22",1370.5],["08-23",1374.5],["08-27",1411.0],["08-28",1425.5],["08-29",1406.25],["08-30",1392.75],["09-02",1391.25],["09-03",1391.25],["09-04",1403.75],["09-05",1391.75],["09-06",1368.25],["09-09",1386.0],["09-10",1373.0],["09-11",1365.25],["09-12",1340.25],["09-13",1308.25],["09-16",1314.75],["09-17",1317.25],["09-18",1299.75],["09-19",1363.5],["09-20",1355.25],["09-23",1321.75],["09-24",1316.5],["09-25",1320.25],["09-26",1332.5],["09-27",1321.5],["09-30",1335.75],["10-01",1332.25],["10-02",1293.75],["10-03",1309.0],["10-04",1316.0],["10-07",1311.0],["10-08",1321.0],["10-09",1309.5],["10-10",1298.0],["10-11",1285.75],["10-14",1276.0],["10-15",1255.5],["10-16",1278.25],["10-17",1308.5],["10-18",1317.0],["10-21",1316.0],["10-22",1311.75],["10-23",1333.0],["10-24",1336.25],["10-25",1341.75],["10-28",1351.0],["10-29",1346.75],["10-30",1349.5],["10-31",1333.75],["11-01",1314.75],["11-04",1314.25],["11-05",1311.25],["11-06",1317.0],["11-07",1316.0],["11-08",1309.0],["11-11",1283.75],["11-12",1281.0],["11-13",1276.0],["11-14",1283.25],["11-15",1281.75],["11-18",1283.5],["11-19",1272.25],["11-20",1271.5],["11-21",1248.5],["11-22",1241.75],["11-25",1231.75],["11-26",1250.75],["11-27",1250.75],["11-28",1241.75],["11-29",1245.25],["12-02",1237.5],["12-03",1219.0],["12-04",1213.0],["12-05",1234.0],["12-06",1230.75],["12-09",1228.5],["12-10",1245.75],["12-11",1255.25],["12-12",1243.5],["12-13",1222.75],["12-16",1229.5],["12-17",1237.25],["12-18",1233.25],["12-19",1205.25],["12-20",1195.0],["12-23",1192.75],["12-24",1196.5],["12-27",1209.25],["12-30",1201.5],["12-31",1201.5]],"Palladium":[["01-02",707.0],["01-03",703.0],["01-04",682.0],["01-07",682.0],["01-08",672.0],["01-09",683.0],["01-10",700.0],["01-11",695.0],["01-14",701.0],["01-15",715.0],["01-16",707.0],["01-17",720.0],["01-18",725.0],["01-21",714.5],["01-22",717.0],["01-23",725.0],["01-24",720.0],["01-25",726.0],["01-28",743.0],["01-29",740.0],["01-30",754.0],["01-31",742.0],["02-01",745.0],["02-04",756.0],["02-05",754.0],["02-06",767.0],["02-07",760.0],["02-08",747.0],["02-11",753.5],["02-12",755.0],["02-13",773.0],["02-14",767.0],["02-15",761.0],["02-18",754.0],["02-19",766.0],["02-20",762.0],["02-21",715.0],["02-22",738.0],["02-25",747.0],["02-26",729.0],["02-27",739.0],["02-28",741.0],["03-01",719.0],["03-04",719.0],["03-05",724.0],["03-06",739.0],["03-07",747.0],["03-08",763.0],["03-11",770.0],["03-12",772.0],["03-13",769.0],["03-14",763.0],["03-15",773.0],["03-18",763.5],["03-19",756.0],["03-20",741.0],["03-21",759.0],["03-22",755.0],["03-25",761.0],["03-26",755.0],["03-27",758.0],["03-28",764.0],["04-02",774.0],["04-03",761.0],["04-04",748.0],["04-05",728.0],["04-08",731.0],["04-09",734.0],["04-10",716.0],["04-11",718.0],["04-12",721.0],["04-15",673.0],["04-16",672.0],["04-17",676.0],["04-18",672.0],["04-19",679.0],["04-22",676.0],["04-23",670.0],["04-24",680.0],["04-25",676.0],["04-26",678.0],["04-29",684.0],["04-30",699.0],["05-01",697.0],["05-02",685.0],["05-03",701.0],["05-07",691.0],["05-08",686.0],["05-09",695.0],["05-10",704.0],["05-13",704.0],["05-14",722.0],["05-15",722.0],["05-16",720.0],["05-17",736.0],["05-20",736.0],["05-21",742.0],["05-22",752.0],["05-23",736.0],["05-24",737.0],["05-28",733.0],["05-29",750.0],["05-30",752.0],["05-31",755.0],["06-03",749.0],["06-04",751.0],["06-05",755.0],["06-06",755.0],["06-07",760.0],["06-10",754.0],["06-11",761.0],["06-12",749.5],["06-13",748.0],["06-14",732.0],["06-17",730.0],["06-18",703.0],["06-19",709.0],["06-20",681.0],["06-21",675.0],["06-24",670.0],["06-25",670.0],["06-26",649.0],["06-27",644.0],["06-28",647.0],["07-01",677.0],["07-02",686.0],["07-03",682.0],["07-04",680.0],["07-05",673.0],["07-08",679.0],["07-09",702.0],["07-10",699.0],["07-11",724.0],["07-12",717.0],["07-15",726.0],["07-16",727.0],["07-17",730.0],["07-18",729.0],["07-19",744.0],["07-22",747.0],["07-23",736.0],["07-24",737.0],["07-25",740.0],["07-26",741.0],["07-29",724.0],["07-30",737.0],["07-31",737.0],["08-01",728.0],["08-02",730.0],["08-05",733.0],["08-06",727.0],["08-07",720.0],["08-08",728.0],["08-09",738.0],["08-12",742.0],["08-13",741.0],["08-14",736.0],["08-15",750.0],["08-16",754.0],["08-19",756.0],["08-20",746.0],["08-21",743.0],["08-22",750.0],["08-23",753.0],["08-27",747.0],["08-28",747.0],["08-29",739.0],["08-30",731.0],["09-02",726.0],["09-03",719.0],["09-04",716.0],["09-05",693.0],["09-06",687.0],["09-09",696.0],["09-10",689.0],["09-11",702.0],["09-12",686.0],["09-13",690.0],["09-16",705.0],["09-17",706.0],["09-18",700.0],["09-19",718.0],["09-20",724.0],["09-23",719.0],["09-24",713.0],["09-25",719.0],["09-26",725.0],["09-27",720.0],["09-30",730.0],["10-01",726.0],["10-02",713.0],["10-03",717.0],["10-04",703.0],["10-07",697.0],["10-08",709.0],["10-09",710.0],["10-10",702.0],["10-11",708.0],["10-14",715.0],["10-15",707.0],["10-16",705.0],["10-17",716.0],["10-18",738.0],["10-21",745.0],["10-22",745.0],["10-23",744.0],["10-24",747.0],["10-25",741.0],["10-28",742.0],["10-29",743.0],["10-30",746.0],["10-31",742.0],["11-01",738.0],["11-04",741.0],["11-05",743.0],["11-06",757.0],["11-07",759.0],["11-08",760.0],["11-11",754.0],["11-12",749.0],["11-13",741.0],["11-14",738.0],["11-15",735.0],["11-18",726.0],["11-19",717.0],["11-20",718.0],["11-21",718.0],["11-22",719.0],["11-25",713.0],["11-26",722.0],["11-27",724.0],["11-28",718.0],["11-29",722.0],["12-02",717.0],["12-03",712.0],["12-04",714.0],["12-05",726.0],["12-06",735.0],["12-09",733.0],["12-10",738.0],["12-11",736.0],["12-12",734.0],["12-13",724.0],["12-16",716.0],["12-17",718.0],["12-18",709.0],["12-19",696.0],["12-20",698.0],["12-23",701.0],["12-24",696.0],["12-27",706.0],["12-30",708.0],["12-31",711.0]],"Platinum":[["01-02",1559.0],["01-03",1569.0],["01-04",1545.0],["01-07",1556.0],["01-08",1564.0],["01-09",1590.0],["01-10",1613.0],["01-11",1626.0],["01-14",1640.0],["01-15",1697.0],["01-16",1660.0],["01-17",1687.0],["01-18",1693.0],["01-21",1671.0],["01-22",1686.0],["01-23",1694.0],["01-24",1687.0],["01-25",1688.0],["01-28",1689.0],["01-29",1672.0],["01-30",1686.0],["01-31",1680.0],["02-01",1672.0],["02-04",1697.0],["02-05",1698.0],["02-06",1730.0],["02-07",1730.0],["02-08",1715.0],["02-11",1712.0],["02-12",1692.0],["02-13",1721.0],["02-14",1726.0],["02-15",1693.0],["02-18",1686.0],["02-19",1695.0],["02-20",1679.0],["02-21",1608.0],["02-22",1618.0],["02-25",1627.0],["02-26",1592.0],["02-27",1612.0],["02-28",1596.0],["03-01",1565.0],["03-04",1576.0],["03-05",1581.0],["03-06",1594.0],["03-07",1598.0],["03-08",1602.0],["03-11",1598.0],["03-12",1594.0],["03-13",1591.0],["03-14",1585.0],["03-15",1591.0],["03-18",1576.0],["03-19",1575.0],["03-20",1560.0],["03-21",1582.0],["03-22",1582.0],["03-25",1580.0],["03-26",1570.0],["03-27",1573.0],["03-28",1583.0],["04-02",1592.0],["04-03",1561.0],["04-04",1525.0],["04-05",1527.0],["04-08",1538.0],["04-09",1544.0],["04-10",1540.0],["04-11",1525.0],["04-12",1524.0],["04-15",1449.0],["04-16",1432.0],["04-17",1440.0],["04-18",1430.0],["04-19",1439.0],["04-22",1430.0],["04-23",1416.0],["04-24",1429.0],["04-25",1445.0],["04-26",1477.0],["04-29",1493.0],["04-30",1513.0],["05-01",1500.0],["05-02",1477.0],["05-03",1508.0],["05-07",1490.0],["05-08",1489.0],["05-09",1502.0],["05-10",1502.0],["05-13",1487.0],["05-14",1504.0],["05-15",1495.0],["05-16",1470.0],["05-17",1472.0],["05-20",1452.0],["05-21",1468.0],["05-22",1465.0],["05-23",1458.0],["05-24",1460.0],["05-28",1448.0],["05-29",1459.0],["05-30",1462.0],["05-31",1471.0],["06-03",1466.0],["06-04",1489.0],["06-05",1497.0],["06-06",1508.0],["06-07",1536.0],["06-10",1489.0],["06-11",1493.0],["06-12",1483.0],["06-13",1464.0],["06-14",1450.0],["06-17",1448.0],["06-18",1428.0],["06-19",1439.0],["06-20",1400.0],["06-21",1363.0],["06-24",1359.5],["06-25",1351.0],["06-26",1323.0],["06-27",1323.0],["06-28",1325.0],["07-01",1350.0],["07-02",1380.0],["07-03",1362.0],["07-04",1343.0],["07-05",1331.0],["07-08",1335.0],["07-09",1368.0],["07-10",1364.0],["07-11",1401.0],["07-12",1398.0],["07-15",1412.0],["07-16",1412.0],["07-17",1419.0],["07-18",1408.0],["07-19",1419.0],["07-22",1433.0],["07-23",1436.0],["07-24",1445.0],["07-25",1438.0],["07-26",1438.0],["07-29",1428.0],["07-30",1436.0],["07-31",1442.0],["08-01",1436.0],["08-02",1426.0],["08-05",1453.0],["08-06",1443.0],["08-07",1421.0],["08-08",1448.0],["08-09",1487.0],["08-12",1498.0],["08-13",1505.0],["08-14",1491.0],["08-15",1519.0],["08-16",1518.0],["08-19",1515.0],["08-20",1505.0],["08-21",1511.0],["08-22",1519.0],["08-23",1539.0],["08-27",1548.0],["08-28",1533.0],["08-29",1522.0],["08-30",1511.0],["09-02",1527.0],["09-03",1523.0],["09-04",1529.0],["09-05",1495.0],["09-06",1481.0],["09-09",1495.0],["09-10",1477.0],["09-11",1482.0],["09-12",1461.0],["09-13",1432.0],["09-16",1453.0],["09-17",1443.0],["09-18",1425.0],["09-19",1475.0],["09-20",1453.0],["09-23",1432.0],["09-24",1423.0],["09-25",1430.0],["09-26",1432.0],["09-27",1411.0],["09-30",1422.0],["10-01",1407.0],["10-02",1382.0],["10-03",1386.0],["10-04",1375.0],["10-07",1385.0],["10-08",1407.0],["10-09",1399.0],["10-10",1383.0],["10-11",1383.0],["10-14",1375.0],["10-15",1368.0],["10-16",1384.0],["10-17",1412.0],["10-18",1432.0],["10-21",1439.0],["10-22",1425.0],["10-23",1436.0],["10-24",1441.0],["10-25",1443.0],["10-28",1459.0],["10-29",1462.0],["10-30",1467.0],["10-31",1462.0],["11-01",1456.0],["11-04",1449.0],["11-05",1450.0],["11-06",1460.0],["11-07",1466.0],["11-08",1458.0],["11-11",1434.0],["11-12",1432.0],["11-13",1436.0],["11-14",1450.0],["11-15",1443.0],["11-18",1435.0],["11-19",1416.0],["11-20",1410.0],["11-21",1400.0],["11-22",1396.0],["11-25",1381.0],["11-26",1386.0],["11-27",1384.0],["11-28",1361.0],["11-29",1367.0],["12-02",1364.0],["12-03",1345.0],["12-04",1353.0],["12-05",1369.0],["12-06",1363.0],["12-09",1361.0],["12-10",1381.0],["12-11",1386.0],["12-12",1380.0],["12-13",1366.0],["12-16",1357.0],["12-17",1361.0],["12-18",1355.0],["12-19",1328.0],["12-20",1325.0],["12-23",1337.0],["12-24",1327.0],["12-27",1367.0],["12-30",1363.0],["12-31",1358.0]],"Silver":[["01-02",30.87],["01-03",30.91],["01-04",29.32],["01-07",30.14],["01-08",30.39],["01-09",30.39],["01-10",30.49],["01-11",30.67],["01-14",30.76],["01-15",31.19],["01-16",31.23],["01-17",31.5],["01-18",31.82],["01-21",31.9],["01-22",31.94],["01-23",32.23],["01-24",31.85],["01-25",31.56],["01-28",30.87],["01-29",31.06],["01-30",31.35],["01-31",32.03],["02-01",31.43],["02-04",31.51],["02-05",32.01],["02-06",31.7],["02-07",31.75],["02-08",31.52],["02-11",31.16],["02-12",30.84],["02-13",31.04],["02-14",30.88],["02-15",30.18],["02-18",30.0],["02-19",30.0],["02-20",29.11],["02-21",28.72],["02-22",28.79],["02-25",29.17],["02-26",28.75],["02-27",29.07],["02-28",28.95],["03-01",28.01],["03-04",28.69],["03-05",28.93],["03-06",28.74],["03-07",29.01],["03-08",28.78],["03-11",28.9],["03-12",29.25],["03-13",29.12],["03-14",28.64],["03-15",28.91],["03-18",28.8],["03-19",28.85],["03-20",28.9],["03-21",28.91],["03-22",29.06],["03-25",28.67],["03-26",28.83],["03-27",28.33],["03-28",28.64],["04-02",27.96],["04-03",27.19],["04-04",26.8],["04-05",26.97],["04-08",27.27],["04-09",27.25],["04-10",27.74],["04-11",27.57],["04-12",27.4],["04-15",23.54],["04-16",23.47],["04-17",23.31],["04-18",23.51],["04-19",23.66],["04-22",23.6],["04-23",23.01],["04-24",22.91],["04-25",23.3],["04-26",24.02],["04-29",24.27],["04-30",24.42],["05-01",23.97],["05-02",23.69],["05-03",24.25],["05-07",23.75],["05-08",23.86],["05-09",24.07],["05-10",23.37],["05-13",23.66],["05-14",23.44],["05-15",22.87],["05-16",22.26],["05-17",22.52],["05-20",21.66],["05-21",22.44],["05-22",22.62],["05-23",22.47],["05-24",22.38],["05-28",22.36],["05-29",22.36],["05-30",22.68],["05-31",22.57],["06-03",22.43],["06-04",22.51],["06-05",22.37],["06-06",22.62],["06-07",22.6],["06-10",21.81],["06-11",21.58],["06-12",21.78],["06-13",21.83],["06-14",21.69],["06-17",21.87],["06-18",21.8],["06-19",21.62],["06-20",20.24],["06-21",19.87],["06-24",19.65],["06-25",19.77],["06-26",18.67],["06-27",18.61],["06-28",18.86],["07-01",19.44],["07-02",19.62],["07-03",19.55],["07-04",19.57],["07-05",19.32],["07-08",19.16],["07-09",19.1],["07-10",19.37],["07-11",19.85],["07-12",19.66],["07-15",19.82],["07-16",19.95],["07-17",19.83],["07-18",19.49],["07-19",19.42],["07-22",19.95],["07-23",20.18],["07-24",20.39],["07-25",19.92],["07-26",20.02],["07-29",20.1],["07-30",19.68],["07-31",19.94],["08-01",19.72],["08-02",19.46],["08-05",19.76],["08-06",19.78],["08-07",19.27],["08-08",19.73],["08-09",20.31],["08-12",20.84],["08-13",21.46],["08-14",21.5],["08-15",22.0],["08-16",22.83],["08-19",23.23],["08-20",22.87],["08-21",22.94],["08-22",23.07],["08-23",23.06],["08-27",24.29],["08-28",24.74],["08-29",24.11],["08-30",23.64],["09-02",23.97],["09-03",24.21],["09-04",23.71],["09-05",23.52],["09-06",23.05],["09-09",23.64],["09-10",23.32],["09-11",22.91],["09-12",22.67],["09-13",21.72],["09-16",21.88],["09-17",21.97],["09-18",21.47],["09-19",23.0],["09-20",22.74],["09-23",21.68],["09-24",21.44],["09-25",21.68],["09-26",21.97],["09-27",21.61],["09-30",21.68],["10-01",21.7],["10-02",21.14],["10-03",21.57],["10-04",21.65],["10-07",21.77],["10-08",22.3],["10-09",22.1],["10-10",21.93],["10-11",21.52],["10-14",21.52],["10-15",20.49],["10-16",21.32],["10-17",21.72],["10-18",21.87],["10-21",22.09],["10-22",22.06],["10-23",22.53],["10-24",22.67],["10-25",22.35],["10-28",22.54],["10-29",22.31],["10-30",22.74],["10-31",22.2],["11-01",21.75],["11-04",21.85],["11-05",21.6],["11-06",21.94],["11-07",21.75],["11-08",21.7],["11-11",21.39],["11-12",21.1],["11-13",20.7],["11-14",20.78],["11-15",20.64],["11-18",20.64],["11-19",20.44],["11-20",20.24],["11-21",19.97],["11-22",19.93],["11-25",19.71],["11-26",20.11],["11-27",19.98],["11-28",19.76],["11-29",19.93],["12-02",19.75],["12-03",19.17],["12-04",19.05],["12-05",19.46],["12-06",19.49],["12-09",19.5],["12-10",20.05],["12-11",20.39],["12-12",19.8],["12-13",19.55],["12-16",19.5],["12-17",20.02],["12-18",19.94],["12-19",19.34],["12-20",19.33],["12-23",19.37],["12-24",19.4],["12-27",19.92],["12-30",19.65],["12-31",19.5]]},"2014":{"Gold":[["01-02",1219.75],["01-03",1232.25],["01-06",1238.0],["01-07",1237.5],["01-08",1226.5],["01-09",1226.0],["01-10",1232.25],["01-13",1246.0],["01-14",1248.75],["01-15",1238.0],["01-16",1237.25],["01-17",1241.0],["01-20",1254.75],["01-21",1247.75],["01-22",1239.5],["01-23",1244.25],["01-24",1259.25],["01-27",1270.0],["01-28",1253.5],["01-29",1254.75],["01-30",1254.0],["01-31",1246.5],["02-03",1246.5],["02-04",1253.0],["02-05",1257.0],["02-06",1258.5],["02-07",1260.0],["02-10",1273.5],["02-11",1282.75],["02-12",1286.5],["02-13",1290.25],["02-14",1308.5],["02-17",1326.0],["02-18",1314.0],["02-19",1318.75],["02-20",1313.75],["02-21",1320.75],["02-24",1333.0],["02-25",1332.75],["02-26",1340.0],["02-27",1331.0],["02-28",1327.75],["03-03",1344.25],["03-04",1339.5],["03-05",1333.5],["03-06",1334.25],["03-07",1348.25],["03-10",1334.25],["03-11",1348.0],["03-12",1355.75],["03-13",1371.0],["03-14",1370.0],["03-17",1379.0],["03-18",1362.5],["03-19",1346.0],["03-20",1327.0],["03-21",1338.5],["03-24",1322.0],["03-25",1314.75],["03-26",1314.5],["03-27",1295.0],["03-28",1295.75],["03-31",1294.0],["04-01",1286.5],["04-02",1284.0],["04-03",1287.25],["04-04",1293.5],["04-07",1299.0],["04-08",1314.75],["04-09",1309.75],["04-10",1321.5],["04-11",1317.25],["04-14",1324.5],["04-15",1311.5],["04-16",1299.0],["04-17",1299.25],["04-22",1290.75],["04-23",1283.5],["04-24",1283.5],["04-25",1294.25],["04-28",1302.0],["04-29",1289.75],["04-30",1292.0],["05-01",1283.0],["05-02",1285.0],["05-06",1308.5],["05-07",1311.0],["05-08",1291.25],["05-09",1289.0],["05-12",1292.75],["05-13",1292.75],["05-14",1300.25],["05-15",1303.75],["05-16",1293.75],["05-19",1301.0],["05-20",1291.5],["05-21",1292.0],["05-22",1294.5],["05-23",1292.0],["05-27",1283.0],["05-28",1265.25],["05-29",1254.0],["05-30",1254.0],["06-02",1244.75],["06-03",1244.25],["06-04",1246.0],["06-05",1244.75],["06-06",1254.0],["06-09",1255.0],["06-10",1253.5],["06-11",1262.5],["06-12",1261.75],["06-13",1273.0],["06-16",1281.75],["06-17",1264.5],["06-18",1269.0],["06-19",1282.0],["06-20",1310.0],["06-23",1313.5],["06-24",1323.0],["06-25",1312.0],["06-26",1311.5],["06-27",1315.25],["06-30",1313.0],["07-01",1325.75],["07-02",1326.75],["07-03",1322.5],["07-04",1321.5],["07-07",1313.25],["07-08",1318.25],["07-09",1322.5],["07-10",1343.25],["07-11",1336.5],["07-14",1321.25],["07-15",1312.0],["07-16",1297.5],["07-17",1302.75],["07-18",1310.25],["07-21",1312.75],["07-22",1307.0],["07-23",1307.5],["07-24",1300.0],["07-25",1292.5],["07-28",1305.0],["07-29",1307.5],["07-30",1297.5],["07-31",1295.0],["08-01",1284.5],["08-04",1293.5],["08-05",1292.75],["08-06",1288.5],["08-07",1302.0],["08-08",1317.5],["08-11",1308.25],["08-12",1311.0],["08-13",1309.25],["08-14",1315.0],["08-15",1313.6],["08-18",1302.75],["08-19",1300.25],["08-20",1294.5],["08-21",1280.5],["08-22",1281.0],["08-26",1286.5],["08-27",1285.0],["08-28",1288.0],["08-29",1285.75],["09-01",1287.25],["09-02",1277.75],["09-03",1268.5],["09-04",1271.0],["09-05",1264.0],["09-08",1267.25],["09-09",1256.0],["09-10",1254.25],["09-11",1247.0],["09-12",1237.25],["09-15",1234.75],["09-16",1238.75],["09-17",1236.5],["09-18",1223.0],["09-19",1222.5],["09-22",1214.0],["09-23",1225.0],["09-24",1224.0],["09-25",1210.5],["09-26",1222.25],["09-29",1217.75],["09-30",1210.0],["10-01",1208.5],["10-02",1214.5],["10-03",1207.5],["10-06",1193.25],["10-07",1207.5],["10-08",1220.0],["10-09",1227.5],["10-10",1222.25],["10-13",1228.0],["10-14",1233.0],["10-15",1223.5],["10-16",1241.0],["10-17",1238.0],["10-20",1241.0],["10-21",1251.75],["10-22",1246.75],["10-23",1240.5],["10-24",1231.75],["10-27",1230.5],["10-28",1228.25],["10-29",1228.0],["10-30",1205.75],["10-31",1173.25],["11-03",1170.75],["11-04",1169.25],["11-05",1145.25],["11-06",1144.5],["11-07",1145.0],["11-10",1172.0],["11-11",1151.25],["11-12",1163.25],["11-13",1161.0],["11-14",1154.0],["11-17",1187.0],["11-18",1202.0],["11-19",1200.75],["11-20",1194.0],["11-21",1193.25],["11-24",1196.0],["11-25",1202.25],["11-26",1195.75],["11-27",1196.5],["11-28",1184.5],["12-01",1178.75],["12-02",1197.0],["12-03",1203.25],["12-04",1204.0],["12-05",1204.5],["12-08",1195.25],["12-09",1206.5],["12-10",1228.25],["12-11",1219.5],["12-12",1223.5],["12-15",1210.75],["12-16",1199.25],["12-17",1199.0],["12-18",1210.75],["12-19",1197.5],["12-22",1195.25],["12-23",1179.5],["12-24",1177.0],["12-29",1194.0],["12-30",1186.5],["12-31",1199.25]],"Palladium":[["01-02",723.0],["01-03",730.0],["01-06",728.0],["01-07",736.0],["01-08",735.0],["01-09",737.0],["01-10",736.0],["01-13",740.0],["01-14",736.0],["01-15",733.5],["01-16",738.0],["01-17",743.0],["01-20",748.0],["01-21",746.0],["01-22",744.0],["01-23",747.0],["01-24",743.0],["01-27",732.0],["01-28",723.0],["01-29",717.0],["01-30",715.5],["01-31",706.0],["02-03",708.0],["02-04",703.0],["02-05",711.0],["02-06",711.0],["02-07",714.0],["02-10",716.0],["02-11",721.0],["02-12",722.0],["02-13",726.0],["02-14",734.0],["02-17",737.0],["02-18",733.0],["02-19",738.0],["02-20",733.0],["02-21",737.0],["02-24",739.0],["02-25",738.0],["02-26",736.0],["02-27",733.0],["02-28",741.0],["03-03",748.0],["03-04",747.0],["03-05",768.0],["03-06",774.0],["03-07",776.0],["03-10",773.0],["03-11",777.5],["03-12",764.0],["03-13",775.0],["03-14",776.0],["03-17",775.0],["03-18",768.0],["03-19",768.0],["03-20",756.5],["03-21",776.0],["03-24",796.0],["03-25",787.5],["03-26",784.0],["03-27",764.0],["03-28",765.0],["03-31",777.0],["04-01",771.0],["04-02",779.0],["04-03",783.0],["04-04",788.0],["04-07",783.0],["04-08",775.0],["04-09",776.0],["04-10",784.0],["04-11",788.0],["04-14",810.0],["04-15",796.0],["04-16",798.0],["04-17",797.0],["04-22",784.0],["04-23",784.0],["04-24",785.0],["04-25",804.0],["04-28",810.0],["04-29",797.0],["04-30",803.0],["05-01",812.0],["05-02",814.0],["05-06",814.0],["05-07",816.0],["05-08",803.0],["05-09",803.0],["05-12",803.0],["05-13",807.0],["05-14",822.0],["05-15",824.0],["05-16",808.0],["05-19",819.0],["05-20",817.0],["05-21",828.0],["05-22",829.0],["05-23",835.0],["05-27",831.0],["05-28",841.0],["05-29",836.0],["05-30",831.0],["06-02",834.0],["06-03",834.0],["06-04",833.0],["06-05",834.0],["06-06",841.0],["06-09",844.0],["06-10",844.0],["06-11",853.0],["06-12",858.0],["06-13",825.0],["06-16",812.0],["06-17",811.0],["06-18",825.0],["06-19",827.0],["06-20",829.0],["06-23",814.0],["06-24",827.0],["06-25",825.0],["06-26",828.0],["06-27",837.0],["06-30",843.0],["07-01",845.0],["07-02",854.0],["07-03",856.0],["07-04",860.0],["07-07",864.0],["07-08",868.0],["07-09",871.0],["07-10",873.0],["07-11",867.0],["07-14",872.0],["07-15",872.0],["07-16",869.0],["07-17",882.0],["07-18",877.0],["07-21",882.0],["07-22",870.0],["07-23",873.0],["07-24",870.0],["07-25",875.0],["07-28",885.0],["07-29",885.0],["07-30",881.0],["07-31",880.0],["08-01",872.0],["08-04",869.0],["08-05",855.0],["08-06",847.0],["08-07",855.0],["08-08",858.0],["08-11",860.0],["08-12",875.0],["08-13",877.0],["08-14",881.0],["08-15",885.0],["08-18",900.0],["08-19",895.0],["08-20",870.0],["08-21",870.0],["08-22",882.0],["08-26",886.0],["08-27",887.0],["08-28",897.0],["08-29",895.0],["09-01",909.0],["09-02",901.0],["09-03",876.0],["09-04",882.0],["09-05",887.0],["09-08",894.0],["09-09",881.0],["09-10",856.0],["09-11",848.0],["09-12",829.0],["09-15",845.0],["09-16",839.0],["09-17",844.0],["09-18",830.0],["09-19",827.0],["09-22",807.0],["09-23",816.0],["09-24",823.0],["09-25",801.0],["09-26",805.0],["09-29",786.0],["09-30",786.0],["10-01",769.0],["10-02",782.0],["10-03",770.0],["10-06",752.0],["10-07",770.0],["10-08",794.0],["10-09",804.0],["10-10",791.0],["10-13",788.0],["10-14",790.0],["10-15",780.0],["10-16",761.0],["10-17",754.0],["10-20",754.0],["10-21",763.0],["10-22",773.0],["10-23",765.0],["10-24",787.0],["10-27",781.0],["10-28",787.0],["10-29",796.0],["10-30",789.0],["10-31",779.0],["11-03",805.0],["11-04",799.0],["11-05",763.0],["11-06",760.0],["11-07",754.0],["11-10",770.0],["11-11",761.0],["11-12",774.0],["11-13",774.0],["11-14",767.0],["11-17",764.0],["11-18",772.0],["11-19",772.0],["11-20",767.0],["11-21",777.0],["11-24",789.0],["11-25",795.0],["11-26",795.0],["11-27",801.0],["11-28",804.0],["12-01",804.0],["12-02",799.0],["12-03",810.0],["12-04",799.0],["12-05",801.0],["12-08",805.0],["12-09",803.0],["12-10",815.0],["12-11",817.0],["12-12",817.0],["12-15",813.0],["12-16",801.0],["12-17",786.0],["12-18",785.0],["12-19",792.0],["12-22",806.0],["12-23",810.0],["12-24",809.0],["12-29",813.0],["12-30",810.0],["12-31",798.0]],"Platinum":[["01-02",1387.0],["01-03",1407.0],["01-06",1400.0],["01-07",1409.0],["01-08",1406.0],["01-09",1414.0],["01-10",1421.0],["01-13",1434.0],["01-14",1429.0],["01-15",1415.0],["01-16",1418.0],["01-17",1435.0],["01-20",1466.0],["01-21",1456.0],["01-22",1449.0],["01-23",1452.0],["01-24",1450.0],["01-27",1429.0],["01-28",1420.0],["01-29",1405.0],["01-30",1397.0],["01-31",1383.0],["02-03",1386.0],["02-04",1381.0],["02-05",1382.0],["02-06",1379.0],["02-07",1385.0],["02-10",1389.0],["02-11",1391.0],["02-12",1392.0],["02-13",1395.0],["02-14",1422.0],["02-17",1425.0],["02-18",1422.0],["02-19",1418.0],["02-20",1413.0],["02-21",1419.0],["02-24",1429.0],["02-25",1433.0],["02-26",1439.0],["02-27",1427.0],["02-28",1444.0],["03-03",1452.0],["03-04",1450.0],["03-05",1464.0],["03-06",1475.0],["03-07",1481.0],["03-10",1468.0],["03-11",1481.0],["03-12",1458.5],["03-13",1475.0],["03-14",1474.0],["03-17",1475.0],["03-18",1457.0],["03-19",1458.0],["03-20",1438.0],["03-21",1437.0],["03-24",1433.0],["03-25",1433.0],["03-26",1421.5],["03-27",1406.0],["03-28",1404.0],["03-31",1422.0],["04-01",1424.0],["04-02",1429.0],["04-03",1439.0],["04-04",1440.0],["04-07",1434.0],["04-08",1437.0],["04-09",1439.0],["04-10",1449.0],["04-11",1456.0],["04-14",1464.0],["04-15",1449.0],["04-16",1439.0],["04-17",1435.0],["04-22",1410.0],["04-23",1404.0],["04-24",1400.0],["04-25",1412.0],["04-28",1428.0],["04-29",1414.0],["04-30",1421.0],["05-01",1417.0],["05-02",1424.0],["05-06",1448.0],["05-07",1452.0],["05-08",1437.0],["05-09",1431.0],["05-12",1431.0],["05-13",1443.0],["05-14",1466.0],["05-15",1473.5],["05-16",1461.0],["05-19",1479.0],["05-20",1469.0],["05-21",1479.0],["05-22",1477.0],["05-23",1484.0],["05-27",1473.0],["05-28",1462.0],["05-29",1452.0],["05-30",1457.0],["06-02",1440.0],["06-03",1436.0],["06-04",1421.0],["06-05",1429.0],["06-06",1453.0],["06-09",1452.0],["06-10",1462.0],["06-11",1476.0],["06-12",1468.0],["06-13",1447.0],["06-16",1436.0],["06-17",1431.0],["06-18",1447.0],["06-19",1455.0],["06-20",1462.0],["06-23",1448.0],["06-24",1465.0],["06-25",1458.0],["06-26",1460.0],["06-27",1474.0],["06-30",1481.0],["07-01",1486.0],["07-02",1509.0],["07-03",1506.0],["07-04",1500.0],["07-07",1498.0],["07-08",1493.0],["07-09",1499.0],["07-10",1511.0],["07-11",1507.0],["07-14",1498.0],["07-15",1496.0],["07-16",1481.0],["07-17",1492.0],["07-18",1489.0],["07-21",1492.0],["07-22",1484.0],["07-23",1485.0],["07-24",1472.0],["07-25",1471.0],["07-28",1485.0],["07-29",1488.0],["07-30",1483.0],["07-31",1476.0],["08-01",1461.0],["08-04",1467.0],["08-05",1463.0],["08-06",1455.0],["08-07",1466.0],["08-08",1481.0],["08-11",1470.0],["08-12",1471.0],["08-13",1470.0],["08-14",1472.0],["08-15",1460.0],["08-18",1454.0],["08-19",1447.0],["08-20",1432.0],["08-21",1424.0],["08-22",1423.0],["08-26",1422.0],["08-27",1421.0],["08-28",1425.0],["08-29",1424.0],["09-01",1424.0],["09-02",1418.0],["09-03",1406.0],["09-04",1412.0],["09-05",1405.0],["09-08",1410.0],["09-09",1395.0],["09-10",1385.0],["09-11",1377.0],["09-12",1364.0],["09-15",1371.0],["09-16",1369.0],["09-17",1366.0],["09-18",1350.0],["09-19",1347.0],["09-22",1331.0],["09-23",1343.0],["09-24",1335.0],["09-25",1304.0],["09-26",1314.0],["09-29",1303.0],["09-30",1307.0],["10-01",1274.0],["10-02",1279.0],["10-03",1247.0],["10-06",1217.0],["10-07",1264.0],["10-08",1277.0],["10-09",1284.0],["10-10",1265.0],["10-13",1264.0],["10-14",1272.0],["10-15",1251.0],["10-16",1254.0],["10-17",1258.0],["10-20",1268.0],["10-21",1273.0],["10-22",1273.0],["10-23",1260.0],["10-24",1254.0],["10-27",1256.0],["10-28",1258.0],["10-29",1270.0],["10-30",1253.0],["10-31",1232.0],["11-03",1237.0],["11-04",1225.0],["11-05",1200.0],["11-06",1210.0],["11-07",1195.0],["11-10",1211.0],["11-11",1196.0],["11-12",1202.0],["11-13",1202.0],["11-14",1193.0],["11-17",1205.0],["11-18",1206.0],["11-19",1206.0],["11-20",1198.0],["11-21",1216.0],["11-24",1220.0],["11-25",1217.0],["11-26",1221.0],["11-27",1221.0],["11-28",1214.0],["12-01",1198.0],["12-02",1219.0],["12-03",1224.0],["12-04",1236.0],["12-05",1236.0],["12-08",1232.0],["12-09",1232.0],["12-10",1250.0],["12-11",1238.0],["12-12",1239.0],["12-15",1220.0],["12-16",1216.0],["12-17",1201.0],["12-18",1202.0],["12-19",1199.0],["12-22",1199.0],["12-23",1188.0],["12-24",1190.0],["12-29",1216.0],["12-30",1207.0],["12-31",1210.0]],"Silver":[["01-02",19.94],["01-03",20.18],["01-06",20.04],["01-07",20.02],["01-08",19.52],["01-09",19.54],["01-10",19.8],["01-13",20.09],["01-14",20.27],["01-15",20.09],["01-16",20.0],["01-17",20.01],["01-20",20.29],["01-21",20.03],["01-22",19.87],["01-23",20.11],["01-24",20.19],["01-27",19.83],["01-28",19.72],["01-29",19.68],["01-30",19.41],["01-31",19.31],["02-03",19.27],["02-04",19.34],["02-05",19.63],["02-06",20.14],["02-07",19.87],["02-10",20.2],["02-11",20.17],["02-12",20.2],["02-13",20.27],["02-14",21.09],["02-17",21.65],["02-18",21.37],["02-19",21.75],["02-20",21.59],["02-21",21.74],["02-24",22.05],["02-25",21.73],["02-26",21.84],["02-27",21.38],["02-28",21.27],["03-03",21.46],["03-04",21.15],["03-05",21.32],["03-06",21.11],["03-07",21.38],["03-10",20.99],["03-11",21.25],["03-12",20.97],["03-13",21.24],["03-14",21.36],["03-17",21.22],["03-18",20.94],["03-19",20.75],["03-20",20.17],["03-21",20.55],["03-24",20.2],["03-25",20.0],["03-26",20.03],["03-27",19.68],["03-28",19.71],["03-31",19.97],["04-01",19.8],["04-02",19.82],["04-03",19.83],["04-04",19.93],["04-07",19.81],["04-08",20.15],["04-09",19.89],["04-10",20.24],["04-11",20.09],["04-14",19.74],["04-15",19.77],["04-16",19.6],["04-17",19.62],["04-22",19.51],["04-23",19.46],["04-24",19.06],["04-25",19.66],["04-28",19.6],["04-29",19.33],["04-30",19.28],["05-01",19.06],["05-02",19.17],["05-06",19.64],["05-07",19.64],["05-08",19.25],["05-09",19.25],["05-12",19.46],["05-13",19.44],["05-14",19.87],["05-15",19.66],["05-16",19.33],["05-19",19.55],["05-20",19.37],["05-21",19.31],["05-22",19.56],["05-23",19.42],["05-27",19.25],["05-28",19.12],["05-29",18.85],["05-30",19.0],["06-02",18.81],["06-03",18.87],["06-04",18.76],["06-05",18.81],["06-06",19.03],["06-09",19.11],["06-10",19.0],["06-11",19.2],["06-12",19.33],["06-13",19.58],["06-16",19.67],["06-17",19.55],["06-18",19.73],["06-19",19.94],["06-20",20.62],["06-23",20.75],["06-24",21.12],["06-25",20.78],["06-26",20.83],["06-27",21.04],["06-30",20.87],["07-01",21.08],["07-02",21.04],["07-03",21.0],["07-04",21.12],["07-07",20.95],["07-08",21.08],["07-09",21.13],["07-10",21.5],["07-11",21.41],["07-14",21.13],["07-15",20.93],["07-16",20.7],["07-17",20.78],["07-18",20.94],["07-21",20.93],["07-22",20.81],["07-23",20.93],["07-24",20.84],["07-25",20.46],["07-28",20.63],["07-29",20.64],["07-30",20.54],["07-31",20.69],["08-01",20.34],["08-04",20.35],["08-05",20.2],["08-06",19.78],["08-07",20.07],["08-08",20.13],["08-11",19.85],["08-12",20.08],["08-13",19.9],["08-14",19.86],["08-15",19.86],["08-18",19.59],["08-19",19.66],["08-20",19.42],["08-21",19.4],["08-22",19.49],["08-26",19.49],["08-27",19.32],["08-28",19.75],["08-29",19.47],["09-01",19.49],["09-02",19.2],["09-03",19.1],["09-04",19.21],["09-05",19.13],["09-08",19.19],["09-09",19.0],["09-10",19.01],["09-11",18.7],["09-12",18.64],["09-15",18.64],["09-16",18.75],["09-17",18.63],["09-18",18.5],["09-19",18.45],["09-22",17.74],["09-23",17.92],["09-24",17.76],["09-25",17.52],["09-26",17.54],["09-29",17.58],["09-30",17.11],["10-01",17.04],["10-02",17.09],["10-03",16.97],["10-06",17.02],["10-07",17.36],["10-08",17.35],["10-09",17.64],["10-10",17.26],["10-13",17.41],["10-14",17.5],["10-15",17.01],["10-16",17.46],["10-17",17.36],["10-20",17.38],["10-21",17.36],["10-22",17.36],["10-23",17.07],["10-24",17.19],["10-27",17.18],["10-28",17.18],["10-29",17.2],["10-30",16.78],["10-31",16.2],["11-03",16.15],["11-04",16.12],["11-05",15.32],["11-06",15.28],["11-07",15.42],["11-10",15.67],["11-11",15.57],["11-12",15.62],["11-13",15.74],["11-14",15.35],["11-17",16.2],["11-18",16.27],["11-19",16.26],["11-20",16.2],["11-21",16.3],["11-24",16.33],["11-25",16.66],["11-26",16.61],["11-27",16.42],["11-28",15.97],["12-01",15.73],["12-02",16.16],["12-03",16.3],["12-04",16.42],["12-05",16.33],["12-08",16.26],["12-09",16.37],["12-10",17.06],["12-11",16.98],["12-12",17.07],["12-15",16.85],["12-16",16.29],["12-17",15.95],["12-18",16.08],["12-19",15.86],["12-22",16.09],["12-23",15.71],["12-24",15.77],["12-29",16.0],["12-30",15.79],["12-31",15.97]]},"2015":{"Gold":[["01-02",1184.25],["01-05",1192.0],["01-06",1211.0],["01-07",1213.75],["01-08",1206.5],["01-09",1211.25],["01-12",1222.0],["01-13",1239.0],["01-14",1228.75],["01-15",1235.25],["01-16",1258.25],["01-19",1275.5],["01-20",1292.25],["01-21",1298.0],["01-22",1287.0],["01-23",1293.5],["01-26",1282.75],["01-27",1279.0],["01-28",1287.0],["01-29",1275.5],["01-30",1263.5],["02-02",1274.25],["02-03",1281.0],["02-04",1269.25],["02-05",1263.75],["02-06",1264.0],["02-09",1242.25],["02-10",1237.5],["02-11",1235.5],["02-12",1225.25],["02-13",1225.75],["02-16",1233.5],["02-17",1221.75],["02-18",1206.5],["02-19",1217.75],["02-20",1203.5],["02-23",1193.5],["02-24",1195.5],["02-25",1206.5],["02-26",1220.0],["02-27",1205.0],["03-02",1216.75],["03-03",1207.75],["03-04",1204.25],["03-05",1199.75],["03-06",1196.5],["03-09",1173.75],["03-10",1161.0],["03-11",1158.75],["03-12",1161.25],["03-13",1156.5],["03-16",1157.0],["03-17",1154.75],["03-18",1149.0],["03-19",1164.0],["03-20",1171.75],["03-23",1181.4],["03-24",1193.25],["03-25",1192.55],["03-26",1209.4],["03-27",1198.0],["03-30",1187.4],["03-31",1179.25],["04-01",1181.25],["04-02",1201.5],["04-07",1208.5],["04-08",1211.1],["04-09",1196.0],["04-10",1201.9],["04-13",1197.85],["04-14",1191.45],["04-15",1189.85],["04-16",1204.6],["04-17",1204.55],["04-20",1203.25],["04-21",1197.7],["04-22",1202.4],["04-23",1187.75],["04-24",1192.15],["04-27",1182.75],["04-28",1201.4],["04-29",1204.8],["04-30",1204.3],["05-01",1179.0],["05-05",1187.4],["05-06",1191.25],["05-07",1183.0],["05-08",1185.25],["05-11",1184.75],["05-12",1184.45],["05-13",1193.0],["05-14",1214.75],["05-15",1216.3],["05-18",1228.15],["05-19",1219.65],["05-20",1206.75],["05-21",1209.6],["05-22",1211.0],["05-26",1194.0],["05-27",1187.85],["05-28",1189.45],["05-29",1190.4],["06-01",1187.3],["06-02",1188.75],["06-03",1186.6],["06-04",1182.45],["06-05",1175.9],["06-08",1173.4],["06-09",1181.0],["06-10",1186.0],["06-11",1180.5],["06-12",1179.25],["06-15",1178.25],["06-16",1182.1],["06-17",1178.5],["06-18",1198.0],["06-19",1198.15],["06-22",1193.7],["06-23",1183.35],["06-24",1175.75],["06-25",1174.6],["06-26",1174.4],["06-29",1176.5],["06-30",1175.0],["07-01",1171.7],["07-02",1164.3],["07-03",1168.25],["07-06",1164.25],["07-07",1166.25],["07-08",1154.25],["07-09",1162.1],["07-10",1162.4],["07-13",1154.95],["07-14",1153.2],["07-15",1154.75],["07-16",1145.1],["07-17",1143.0],["07-20",1115.0],["07-21",1108.0],["07-22",1096.8],["07-23",1101.65],["07-24",1083.75],["07-27",1098.6],["07-28",1095.6],["07-29",1096.75],["07-30",1085.65],["07-31",1080.05],["08-03",1093.0],["08-04",1092.6],["08-05",1086.5],["08-06",1085.0],["08-07",1091.35],["08-10",1094.8],["08-11",1113.25],["08-12",1116.8],["08-13",1117.35],["08-14",1116.75],["08-17",1117.3],["08-18",1119.15],["08-19",1123.2],["08-20",1137.95],["08-21",1149.35],["08-24",1153.5],["08-25",1154.25],["08-26",1134.4],["08-27",1128.5],["08-28",1125.5],["09-01",1141.9],["09-02",1140.0],["09-03",1130.05],["09-04",1125.0],["09-07",1121.0],["09-08",1120.85],["09-09",1122.3],["09-10",1107.75],["09-11",1106.35],["09-14",1108.0],["09-15",1105.5],["09-16",1109.75],["09-17",1118.15],["09-18",1136.0],["09-21",1136.85],["09-22",1129.3],["09-23",1124.6],["09-24",1134.45],["09-25",1145.5],["09-28",1137.5],["09-29",1124.6],["09-30",1122.5],["10-01",1114.2],["10-02",1106.3],["10-05",1134.35],["10-06",1136.9],["10-07",1147.9],["10-08",1143.3],["10-09",1151.5],["10-12",1164.2],["10-13",1154.4],["10-14",1173.7],["10-15",1183.35],["10-16",1176.35],["10-19",1171.65],["10-20",1173.7],["10-21",1174.4],["10-22",1166.45],["10-23",1171.55],["10-26",1168.5],["10-27",1165.75],["10-28",1171.5],["10-29",1159.0],["10-30",1147.75],["11-02",1135.8],["11-03",1130.9],["11-04",1118.0],["11-05",1107.3],["11-06",1107.7],["11-09",1095.6],["11-10",1092.5],["11-11",1088.6],["11-12",1087.6],["11-13",1083.75],["11-16",1094.5],["11-17",1080.8],["11-18",1070.5],["11-19",1073.1],["11-20",1085.15],["11-23",1068.35],["11-24",1073.0],["11-25",1072.2],["11-26",1070.5],["11-27",1064.65],["11-30",1055.65],["12-01",1069.25],["12-02",1066.9],["12-03",1050.6],["12-04",1063.0],["12-07",1082.7],["12-08",1071.75],["12-09",1078.4],["12-10",1072.0],["12-11",1067.2],["12-14",1068.0],["12-15",1069.15],["12-16",1065.75],["12-17",1065.85],["12-18",1055.25],["12-21",1071.15],["12-22",1077.0],["12-23",1071.5],["12-24",1071.9],["12-29",1067.25],["12-30",1067.8],["12-31",1062.25]],"Palladium":[["01-02",796.0],["01-05",799.0],["01-06",797.0],["01-07",801.0],["01-08",790.0],["01-09",794.0],["01-12",805.0],["01-13",810.0],["01-14",789.0],["01-15",771.0],["01-16",773.0],["01-19",761.0],["01-20",768.0],["01-21",778.0],["01-22",765.0],["01-23",775.0],["01-26",767.0],["01-27",783.0],["01-28",787.0],["01-29",790.0],["01-30",783.0],["02-02",772.0],["02-03",794.0],["02-04",786.0],["02-05",790.0],["02-06",794.0],["02-09",783.0],["02-10",779.0],["02-11",770.0],["02-12",775.0],["02-13",778.0],["02-16",785.0],["02-17",782.0],["02-18",782.0],["02-19",776.0],["02-20",779.0],["02-23",775.0],["02-24",783.0],["02-25",804.0],["02-26",815.0],["02-27",805.0],["03-02",816.0],["03-03",825.0],["03-04",826.0],["03-05",830.0],["03-06",823.0],["03-09",821.0],["03-10",805.0],["03-11",802.0],["03-12",796.0],["03-13",795.0],["03-16",788.0],["03-17",777.0],["03-18",766.0],["03-19",774.0],["03-20",771.0],["03-23",775.0],["03-24",773.0],["03-25",768.0],["03-26",771.0],["03-27",760.0],["03-30",745.0],["03-31",734.0],["04-01",738.0],["04-02",747.0],["04-07",773.0],["04-08",769.0],["04-09",755.0],["04-10",767.0],["04-13",782.0],["04-14",757.0],["04-15",761.0],["04-16",769.0],["04-17",780.0],["04-20",777.0],["04-21",774.0],["04-22",768.0],["04-23",759.0],["04-24",772.0],["04-27",768.0],["04-28",773.0],["04-29",774.0],["04-30",781.0],["05-01",777.0],["05-05",782.0],["05-06",790.0],["05-07",790.0],["05-08",787.0],["05-11",792.0],["05-12",786.0],["05-13",787.0],["05-14",783.0],["05-15",783.0],["05-18",791.0],["05-19",784.0],["05-20",785.0],["05-21",778.0],["05-22",781.0],["05-26",782.0],["05-27",785.0],["05-28",788.0],["05-29",781.0],["06-01",777.0],["06-02",773.0],["06-03",766.0],["06-04",760.0],["06-05",757.0],["06-08",749.0],["06-09",750.0],["06-10",747.0],["06-11",741.0],["06-12",742.0],["06-15",733.0],["06-16",740.0],["06-17",730.0],["06-18",725.0],["06-19",718.0],["06-22",700.0],["06-23",702.0],["06-24",703.0],["06-25",695.0],["06-26",676.0],["06-29",671.0],["06-30",670.0],["07-01",687.0],["07-02",698.0],["07-03",691.0],["07-06",671.0],["07-07",679.0],["07-08",634.0],["07-09",657.0],["07-10",650.0],["07-13",650.0],["07-14",656.0],["07-15",654.0],["07-16",637.0],["07-17",626.0],["07-20",611.0],["07-21",618.0],["07-22",619.0],["07-23",637.0],["07-24",623.0],["07-27",626.0],["07-28",617.0],["07-29",626.0],["07-30",621.0],["07-31",612.0],["08-03",613.0],["08-04",595.0],["08-05",596.0],["08-06",599.0],["08-07",602.0],["08-10",602.0],["08-11",618.0],["08-12",600.0],["08-13",616.0],["08-14",620.0],["08-17",618.0],["08-18",603.0],["08-19",593.0],["08-20",613.0],["08-21",606.0],["08-24",589.0],["08-25",549.0],["08-26",539.0],["08-27",545.0],["08-28",563.0],["09-01",589.0],["09-02",571.0],["09-03",587.0],["09-04",580.0],["09-07",581.0],["09-08",587.0],["09-09",589.0],["09-10",584.0],["09-11",583.0],["09-14",590.0],["09-15",584.0],["09-16",597.0],["09-17",607.0],["09-18",609.0],["09-21",601.0],["09-22",607.0],["09-23",621.0],["09-24",643.0],["09-25",659.0],["09-28",655.0],["09-29",640.0],["09-30",667.0],["10-01",659.0],["10-02",688.0],["10-05",709.0],["10-06",698.0],["10-07",704.0],["10-08",693.0],["10-09",707.0],["10-12",713.0],["10-13",688.0],["10-14",687.0],["10-15",701.0],["10-16",698.0],["10-19",692.0],["10-20",683.0],["10-21",685.0],["10-22",672.0],["10-23",698.0],["10-26",681.0],["10-27",679.0],["10-28",678.0],["10-29",672.0],["10-30",681.0],["11-02",659.0],["11-03",644.0],["11-04",648.0],["11-05",611.0],["11-06",610.0],["11-09",606.0],["11-10",611.5],["11-11",599.0],["11-12",582.0],["11-13",556.0],["11-16",541.0],["11-17",548.0],["11-18",546.0],["11-19",538.0],["11-20",545.0],["11-23",548.0],["11-24",537.0],["11-25",542.0],["11-26",551.0],["11-27",555.0],["11-30",548.0],["12-01",549.0],["12-02",538.0],["12-03",528.0],["12-04",542.0],["12-07",557.0],["12-08",551.0],["12-09",544.0],["12-10",554.0],["12-11",544.0],["12-14",549.0],["12-15",555.0],["12-16",566.0],["12-17",559.0],["12-18",546.0],["12-21",558.0],["12-22",557.0],["12-23",559.0],["12-24",554.0],["12-29",552.0],["12-30",554.0],["12-31",547.0]],"Platinum":[["01-02",1208.0],["01-05",1210.0],["01-06",1214.0],["01-07",1221.0],["01-08",1219.0],["01-09",1221.0],["01-12",1234.0],["01-13",1243.0],["01-14",1230.0],["01-15",1237.0],["01-16",1257.0],["01-19",1265.0],["01-20",1268.0],["01-21",1281.0],["01-22",1277.0],["01-23",1277.0],["01-26",1251.0],["01-27",1257.0],["01-28",1263.0],["01-29",1243.0],["01-30",1230.0],["02-02",1226.0],["02-03",1237.0],["02-04",1236.0],["02-05",1238.0],["02-06",1255.0],["02-09",1225.0],["02-10",1217.0],["02-11",1208.0],["02-12",1202.0],["02-13",1200.0],["02-16",1211.0],["02-17",1196.0],["02-18",1174.0],["02-19",1180.0],["02-20",1157.0],["02-23",1158.0],["02-24",1158.0],["02-25",1171.0],["02-26",1189.0],["02-27",1173.0],["03-02",1182.0],["03-03",1186.0],["03-04",1180.0],["03-05",1182.0],["03-06",1177.0],["03-09",1156.0],["03-10",1135.0],["03-11",1126.0],["03-12",1125.0],["03-13",1121.0],["03-16",1115.0],["03-17",1106.0],["03-18",1093.0],["03-19",1119.0],["03-20",1122.0],["03-23",1136.0],["03-24",1143.0],["03-25",1140.0],["03-26",1157.0],["03-27",1141.0],["03-30",1129.0],["03-31",1121.0],["04-01",1136.0],["04-02",1155.0],["04-07",1167.0],["04-08",1172.0],["04-09",1160.0],["04-10",1167.0],["04-13",1157.0],["04-14",1147.0],["04-15",1147.0],["04-16",1166.0],["04-17",1164.0],["04-20",1167.0],["04-21",1150.0],["04-22",1140.0],["04-23",1130.0],["04-24",1134.0],["04-27",1116.0],["04-28",1141.0],["04-29",1153.0],["04-30",1154.0],["05-01",1139.0],["05-05",1143.0],["05-06",1143.0],["05-07",1136.0],["05-08",1138.0],["05-11",1136.0],["05-12",1128.0],["05-13",1133.0],["05-14",1149.0],["05-15",1156.0],["05-18",1166.0],["05-19",1163.0],["05-20",1152.0],["05-21",1157.0],["05-22",1158.0],["05-26",1135.0],["05-27",1128.0],["05-28",1124.0],["05-29",1114.0],["06-01",1107.0],["06-02",1105.0],["06-03",1111.0],["06-04",1107.0],["06-05",1099.0],["06-08",1097.0],["06-09",1114.0],["06-10",1113.0],["06-11",1109.0],["06-12",1098.0],["06-15",1087.0],["06-16",1088.0],["06-17",1074.0],["06-18",1092.0],["06-19",1081.0],["06-22",1072.0],["06-23",1073.0],["06-24",1070.0],["06-25",1075.0],["06-26",1077.0],["06-29",1075.0],["06-30",1083.0],["07-01",1085.0],["07-02",1079.0],["07-03",1086.0],["07-06",1064.0],["07-07",1058.0],["07-08",1015.0],["07-09",1038.0],["07-10",1033.0],["07-13",1029.0],["07-14",1028.0],["07-15",1026.0],["07-16",1007.0],["07-17",1004.0],["07-20",983.0],["07-21",986.0],["07-22",968.0],["07-23",993.0],["07-24",978.0],["07-27",985.0],["07-28",980.0],["07-29",987.0],["07-30",985.0],["07-31",978.0],["08-03",977.0],["08-04",955.0],["08-05",950.0],["08-06",950.0],["08-07",953.0],["08-10",966.0],["08-11",994.0],["08-12",990.0],["08-13",991.0],["08-14",992.0],["08-17",995.0],["08-18",994.0],["08-19",994.0],["08-20",1016.0],["08-21",1026.0],["08-24",998.0],["08-25",983.0],["08-26",979.0],["08-27",989.0],["08-28",999.0],["09-01",1008.0],["09-02",1008.0],["09-03",1012.0],["09-04",1006.0],["09-07",990.0],["09-08",993.0],["09-09",1002.0],["09-10",988.0],["09-11",976.0],["09-14",956.0],["09-15",953.0],["09-16",960.0],["09-17",965.0],["09-18",977.0],["09-21",980.0],["09-22",964.0],["09-23",942.0],["09-24",942.0],["09-25",944.0],["09-28",926.0],["09-29",904.0],["09-30",924.0],["10-01",912.0],["10-02",899.0],["10-05",922.0],["10-06",919.0],["10-07",939.0],["10-08",933.0],["10-09",973.0],["10-12",986.0],["10-13",982.0],["10-14",992.0],["10-15",1003.0],["10-16",997.0],["10-19",1011.0],["10-20",1009.0],["10-21",1013.0],["10-22",1000.0],["10-23",1011.0],["10-26",986.0],["10-27",989.0],["10-28",997.0],["10-29",996.0],["10-30",994.0],["11-02",974.0],["11-03",971.0],["11-04",961.0],["11-05",952.0],["11-06",952.0],["11-09",936.0],["11-10",911.0],["11-11",900.0],["11-12",884.0],["11-13",877.0],["11-16",865.0],["11-17",867.0],["11-18",851.0],["11-19",859.0],["11-20",864.0],["11-23",847.0],["11-24",840.0],["11-25",840.0],["11-26",851.0],["11-27",848.0],["11-30",829.0],["12-01",842.0],["12-02",843.0],["12-03",829.0],["12-04",852.0],["12-07",874.0],["12-08",863.0],["12-09",848.0],["12-10",860.0],["12-11",855.0],["12-14",843.0],["12-15",848.0],["12-16",865.0],["12-17",862.0],["12-18",842.0],["12-21",868.0],["12-22",878.0],["12-23",875.0],["12-24",874.0],["12-29",883.0],["12-30",888.0],["12-31",872.0]],"Silver":[["01-02",15.71],["01-05",15.88],["01-06",16.29],["01-07",16.33],["01-08",16.37],["01-09",16.24],["01-12",16.52],["01-13",17.0],["01-14",16.64],["01-15",17.12],["01-16",16.92],["01-19",17.65],["01-20",17.8],["01-21",18.22],["01-22",18.08],["01-23",18.23],["01-26",17.83],["01-27",17.87],["01-28",18.01],["01-29",17.43],["01-30",16.92],["02-02",17.22],["02-03",17.59],["02-04",17.39],["02-05",17.0],["02-06",17.22],["02-09",16.97],["02-10",16.8],["02-11",16.95],["02-12",16.89],["02-13",16.86],["02-16",17.27],["02-17",16.82],["02-18",16.42],["02-19",16.73],["02-20",16.34],["02-23",16.2],["02-24",16.32],["02-25",16.51],["02-26",16.82],["02-27",16.53],["03-02",16.63],["03-03",16.42],["03-04",16.32],["03-05",16.19],["03-06",15.99],["03-09",15.92],["03-10",15.78],["03-11",15.64],["03-12",15.68],["03-13",15.5],["03-16",15.58],["03-17",15.56],["03-18",15.47],["03-19",15.88],["03-20",16.17],["03-23",16.73],["03-24",16.97],["03-25",16.94],["03-26",17.13],["03-27",17.14],["03-30",16.65],["03-31",16.6],["04-01",16.56],["04-02",16.84],["04-07",16.86],["04-08",16.84],["04-09",16.3],["04-10",16.55],["04-13",16.27],["04-14",16.08],["04-15",16.18],["04-16",16.47],["04-17",16.36],["04-20",16.09],["04-21",16.08],["04-22",16.05],["04-23",15.86],["04-24",15.83],["04-27",15.84],["04-28",16.32],["04-29",16.48],["04-30",16.52],["05-01",16.17],["05-05",16.42],["05-06",16.41],["05-07",16.35],["05-08",16.31],["05-11",16.39],["05-12",16.46],["05-13",16.65],["05-14",17.4],["05-15",17.25],["05-18",17.7],["05-19",17.4],["05-20",17.07],["05-21",17.18],["05-22",17.25],["05-26",16.79],["05-27",16.66],["05-28",16.68],["05-29",16.67],["06-01",16.61],["06-02",16.7],["06-03",16.6],["06-04",16.47],["06-05",16.15],["06-08",16.06],["06-09",16.13],["06-10",16.13],["06-11",15.87],["06-12",15.93],["06-15",15.93],["06-16",16.03],["06-17",15.98],["06-18",16.24],["06-19",16.12],["06-22",16.19],["06-23",15.96],["06-24",15.89],["06-25",15.77],["06-26",15.83],["06-29",15.83],["06-30",15.7],["07-01",15.63],["07-02",15.61],["07-03",15.64],["07-06",15.59],["07-07",15.61],["07-08",14.99],["07-09",15.38],["07-10",15.45],["07-13",15.45],["07-14",15.28],["07-15",15.31],["07-16",14.93],["07-17",15.01],["07-20",14.84],["07-21",14.75],["07-22",14.78],["07-23",14.88],["07-24",14.49],["07-27",14.69],["07-28",14.54],["07-29",14.61],["07-30",14.64],["07-31",14.56],["08-03",14.73],["08-04",14.54],["08-05",14.52],["08-06",14.59],["08-07",14.75],["08-10",14.88],["08-11",15.31],["08-12",15.36],["08-13",15.33],["08-14",15.55],["08-17",15.23],["08-18",15.23],["08-19",14.84],["08-20",15.5],["08-21",15.46],["08-24",14.94],["08-25",14.87],["08-26",14.41],["08-27",14.27],["08-28",14.44],["09-01",14.68],["09-02",14.56],["09-03",14.71],["09-04",14.69],["09-07",14.54],["09-08",14.63],["09-09",14.77],["09-10",14.72],["09-11",14.58],["09-14",14.43],["09-15",14.35],["09-16",14.51],["09-17",14.76],["09-18",15.26],["09-21",15.18],["09-22",14.94],["09-23",14.8],["09-24",14.79],["09-25",14.99],["09-28",14.7],["09-29",14.56],["09-30",14.65],["10-01",14.55],["10-02",14.43],["10-05",15.25],["10-06",15.67],["10-07",15.82],["10-08",15.61],["10-09",15.99],["10-12",15.96],["10-13",15.61],["10-14",15.84],["10-15",16.18],["10-16",16.04],["10-19",15.86],["10-20",15.86],["10-21",15.75],["10-22",15.77],["10-23",15.98],["10-26",16.1],["10-27",15.8],["10-28",16.03],["10-29",15.82],["10-30",15.63],["11-02",15.4],["11-03",15.38],["11-04",15.26],["11-05",15.02],["11-06",15.08],["11-09",14.78],["11-10",14.55],["11-11",14.44],["11-12",14.39],["11-13",14.39],["11-16",14.36],["11-17",14.25],["11-18",14.17],["11-19",14.21],["11-20",14.29],["11-23",13.98],["11-24",14.14],["11-25",14.07],["11-26",14.29],["11-27",14.11],["11-30",14.08],["12-01",14.21],["12-02",14.14],["12-03",13.93],["12-04",14.13],["12-07",14.49],["12-08",14.24],["12-09",14.27],["12-10",14.17],["12-11",13.92],["12-14",13.71],["12-15",13.74],["12-16",13.74],["12-17",14.08],["12-18",13.82],["12-21",14.2],["12-22",14.24],["12-23",14.33],["12-24",14.2],["12-29",13.93],["12-30",13.82],["12-31",13.82]]},"2016":{"Gold":[["01-04",1072.7],["01-05",1078.0],["01-06",1083.85],["01-07",1096.0],["01-08",1097.45],["01-11",1104.7],["01-12",1094.85],["01-13",1081.8],["01-14",1090.75],["01-15",1081.1],["01-18",1090.45],["01-19",1087.0],["01-20",1093.2],["01-21",1096.8],["01-22",1097.65],["01-25",1103.7],["01-26",1114.7],["01-27",1116.5],["01-28",1119.0],["01-29",1112.9],["02-01",1122.0],["02-02",1123.6],["02-03",1130.0],["02-04",1146.25],["02-05",1158.5],["02-08",1173.4],["02-09",1188.9],["02-10",1183.4],["02-11",1223.25],["02-12",1239.5],["02-15",1208.45],["02-16",1212.0],["02-17",1202.4],["02-18",1204.4],["02-19",1221.5],["02-22",1203.65],["02-23",1218.75],["02-24",1232.25],["02-25",1235.4],["02-26",1231.0],["02-29",1234.15],["03-01",1240.0],["03-02",1229.35],["03-03",1241.95],["03-04",1271.5],["03-07",1267.6],["03-08",1274.1],["03-09",1258.25],["03-10",1247.25],["03-11",1262.25],["03-14",1256.55],["03-15",1233.6],["03-16",1233.1],["03-17",1269.6],["03-18",1254.5],["03-21",1244.25],["03-22",1251.8],["03-23",1232.2],["03-24",1216.45],["03-29",1216.45],["03-30",1238.2],["03-31",1233.6],["04-01",1232.1],["04-04",1215.0],["04-05",1231.5],["04-06",1225.75],["04-07",1237.5],["04-08",1235.0],["04-11",1247.25],["04-12",1259.2],["04-13",1245.75],["04-14",1240.3],["04-15",1229.75],["04-18",1237.7],["04-19",1241.7],["04-20",1247.75],["04-21",1257.65],["04-22",1245.4],["04-25",1230.85],["04-26",1234.5],["04-27",1244.75],["04-28",1256.6],["04-29",1274.5],["05-03",1296.5],["05-04",1280.3],["05-05",1275.75],["05-06",1280.25],["05-09",1277.75],["05-10",1264.85],["05-11",1271.8],["05-12",1268.3],["05-13",1275.15],["05-16",1281.0],["05-17",1270.1],["05-18",1270.9],["05-19",1253.75],["05-20",1256.5],["05-23",1250.4],["05-24",1242.65],["05-25",1220.75],["05-26",1226.65],["05-27",1221.25],["05-31",1210.5],["06-01",1216.25],["06-02",1215.5],["06-03",1211.0],["06-06",1240.55],["06-07",1241.1],["06-08",1252.4],["06-09",1258.35],["06-10",1266.6],["06-13",1284.1],["06-14",1279.4],["06-15",1282.0],["06-16",1307.0],["06-17",1284.5],["06-20",1283.25],["06-21",1280.8],["06-22",1265.0],["06-23",1265.75],["06-24",1313.85],["06-27",1324.6],["06-28",1312.0],["06-29",1317.75],["06-30",1317.0],["07-01",1331.75],["07-04",1348.75],["07-05",1344.75],["07-06",1370.0],["07-07",1367.1],["07-08",1356.1],["07-11",1358.25],["07-12",1352.85],["07-13",1340.25],["07-14",1325.7],["07-15",1330.5],["07-18",1326.15],["07-19",1332.2],["07-20",1325.6],["07-21",1322.0],["07-22",1323.2],["07-25",1315.0],["07-26",1321.25],["07-27",1320.8],["07-28",1341.3],["07-29",1332.5],["08-01",1348.85],["08-02",1358.15],["08-03",1364.4],["08-04",1351.15],["08-05",1362.6],["08-08",1330.0],["08-09",1332.9],["08-10",1351.85],["08-11",1344.55],["08-12",1336.7],["08-15",1339.2],["08-16",1349.1],["08-17",1342.75],["08-18",1347.1],["08-19",1346.85],["08-22",1334.3],["08-23",1338.5],["08-24",1337.3],["08-25",1324.5],["08-26",1324.9],["08-30",1318.85],["08-31",1314.45],["09-01",1305.7],["09-02",1311.5],["09-05",1328.3],["09-06",1330.05],["09-07",1348.75],["09-08",1348.0],["09-09",1335.65],["09-12",1327.5],["09-13",1328.5],["09-14",1323.2],["09-15",1320.1],["09-16",1314.25],["09-19",1315.05],["09-20",1315.4],["09-21",1319.6],["09-22",1332.45],["09-23",1335.9],["09-26",1336.3],["09-27",1335.85],["09-28",1324.8],["09-29",1320.85],["09-30",1327.9],["10-03",1318.65],["10-04",1309.15],["10-05",1274.0],["10-06",1265.5],["10-07",1255.0],["10-10",1262.1],["10-11",1256.4],["10-12",1255.7],["10-13",1258.0],["10-14",1256.15],["10-17",1252.7],["10-18",1261.65],["10-19",1269.75],["10-20",1269.2],["10-21",1263.95],["10-24",1267.0],["10-25",1269.3],["10-26",1273.9],["10-27",1269.3],["10-28",1265.9],["10-31",1274.2],["11-01",1284.4],["11-02",1295.85],["11-03",1293.0],["11-04",1301.7],["11-07",1286.8],["11-08",1284.0],["11-09",1304.55],["11-10",1280.9],["11-11",1255.65],["11-14",1222.6],["11-15",1228.9],["11-16",1225.7],["11-17",1232.0],["11-18",1206.1],["11-21",1214.95],["11-22",1217.55],["11-23",1213.25],["11-24",1187.25],["11-25",1187.5],["11-28",1189.1],["11-29",1187.3],["11-30",1187.4],["12-01",1168.75],["12-02",1171.65],["12-05",1164.9],["12-06",1171.15],["12-07",1171.25],["12-08",1174.75],["12-09",1168.9],["12-12",1154.4],["12-13",1157.35],["12-14",1160.95],["12-15",1132.45],["12-16",1134.85],["12-19",1137.6],["12-20",1132.75],["12-21",1134.4],["12-22",1130.55],["12-23",1131.0],["12-28",1139.75],["12-29",1146.8],["12-30",1159.1]],"Palladium":[["01-04",547.0],["01-05",545.0],["01-06",532.0],["01-07",496.0],["01-08",498.0],["01-11",486.0],["01-12",465.0],["01-13",483.0],["01-14",483.0],["01-15",484.0],["01-18",490.0],["01-19",498.0],["01-20",488.0],["01-21",493.0],["01-22",504.0],["01-25",494.0],["01-26",491.0],["01-27",494.0],["01-28",500.0],["01-29",493.0],["02-01",495.0],["02-02",497.0],["02-03",498.0],["02-04",506.0],["02-05",517.0],["02-08",499.0],["02-09",515.0],["02-10",513.0],["02-11",523.0],["02-12",521.0],["02-15",519.0],["02-16",510.0],["02-17",511.0],["02-18",513.0],["02-19",501.0],["02-22",499.0],["02-23",499.0],["02-24",498.0],["02-25",491.0],["02-26",485.0],["02-29",491.0],["03-01",503.0],["03-02",518.0],["03-03",517.0],["03-04",541.0],["03-07",559.0],["03-08",566.0],["03-09",556.0],["03-10",562.0],["03-11",569.0],["03-14",575.0],["03-15",559.0],["03-16",567.0],["03-17",585.0],["03-18",592.0],["03-21",586.0],["03-22",597.0],["03-23",596.0],["03-24",577.0],["03-29",568.0],["03-30",577.0],["03-31",570.0],["04-01",573.0],["04-04",559.0],["04-05",558.0],["04-06",553.0],["04-07",538.0],["04-08",542.0],["04-11",544.0],["04-12",554.0],["04-13",548.0],["04-14",541.0],["04-15",562.0],["04-18",561.0],["04-19",571.0],["04-20",582.0],["04-21",594.0],["04-22",607.0],["04-25",602.0],["04-26",598.0],["04-27",602.0],["04-28",609.0],["04-29",624.0],["05-03",620.0],["05-04",603.0],["05-05",602.0],["05-06",600.0],["05-09",598.0],["05-10",583.0],["05-11",596.0],["05-12",603.0],["05-13",595.0],["05-16",595.0],["05-17",588.0],["05-18",579.0],["05-19",572.0],["05-20",561.0],["05-23",552.0],["05-24",545.0],["05-25",533.0],["05-26",540.0],["05-27",543.0],["05-31",542.0],["06-01",543.0],["06-02",545.0],["06-03",539.0],["06-06",555.0],["06-07",556.0],["06-08",558.0],["06-09",552.0],["06-10",553.0],["06-13",546.0],["06-14",540.0],["06-15",542.0],["06-16",539.0],["06-17",541.0],["06-20",544.0],["06-21",548.0],["06-22",551.0],["06-23",557.0],["06-24",548.0],["06-27",550.0],["06-28",561.0],["06-29",574.0],["06-30",587.0],["07-01",593.0],["07-04",603.0],["07-05",595.0],["07-06",600.0],["07-07",608.0],["07-08",604.0],["07-11",615.0],["07-12",625.0],["07-13",638.0],["07-14",636.0],["07-15",647.0],["07-18",636.0],["07-19",643.0],["07-20",653.0],["07-21",668.0],["07-22",680.0],["07-25",674.0],["07-26",684.0],["07-27",686.0],["07-28",704.0],["07-29",695.0],["08-01",713.0],["08-02",714.0],["08-03",706.0],["08-04",708.0],["08-05",703.0],["08-08",692.0],["08-09",686.0],["08-10",731.0],["08-11",719.0],["08-12",692.0],["08-15",688.0],["08-16",698.0],["08-17",696.0],["08-18",697.0],["08-19",705.0],["08-22",704.0],["08-23",696.0],["08-24",696.0],["08-25",687.0],["08-26",693.0],["08-30",692.0],["08-31",683.0],["09-01",669.0],["09-02",667.0],["09-05",677.0],["09-06",682.0],["09-07",700.0],["09-08",695.0],["09-09",679.0],["09-12",664.0],["09-13",663.0],["09-14",660.0],["09-15",654.0],["09-16",652.0],["09-19",678.0],["09-20",688.0],["09-21",686.0],["09-22",686.0],["09-23",690.0],["09-26",688.0],["09-27",694.0],["09-28",703.0],["09-29",709.0],["09-30",719.0],["10-03",719.0],["10-04",711.0],["10-05",692.0],["10-06",674.0],["10-07",669.0],["10-10",668.0],["10-11",664.0],["10-12",651.0],["10-13",642.0],["10-14",638.0],["10-17",647.0],["10-18",642.0],["10-19",639.0],["10-20",633.0],["10-21",622.0],["10-24",626.0],["10-25",640.0],["10-26",636.0],["10-27",620.0],["10-28",612.0],["10-31",615.0],["11-01",627.0],["11-02",630.0],["11-03",628.0],["11-04",619.0],["11-07",625.0],["11-08",651.0],["11-09",665.0],["11-10",681.0],["11-11",684.0],["11-14",677.0],["11-15",706.0],["11-16",699.0],["11-17",717.0],["11-18",714.0],["11-21",726.0],["11-22",738.0],["11-23",742.0],["11-24",734.0],["11-25",724.0],["11-28",751.0],["11-29",753.0],["11-30",764.0],["12-01",774.0],["12-02",746.0],["12-05",729.0],["12-06",750.0],["12-07",727.0],["12-08",734.0],["12-09",743.0],["12-12",732.0],["12-13",727.0],["12-14",730.0],["12-15",724.0],["12-16",689.0],["12-19",685.0],["12-20",671.0],["12-21",663.0],["12-22",653.0],["12-23",654.0],["12-28",671.0],["12-29",670.0],["12-30",676.0]],"Platinum":[["01-04",878.0],["01-05",890.0],["01-06",885.0],["01-07",869.0],["01-08",876.0],["01-11",871.0],["01-12",837.0],["01-13",841.0],["01-14",846.0],["01-15",833.0],["01-18",826.0],["01-19",830.0],["01-20",822.0],["01-21",817.0],["01-22",824.0],["01-25",841.0],["01-26",862.0],["01-27",873.0],["01-28",884.0],["01-29",864.0],["02-01",865.0],["02-02",860.0],["02-03",862.0],["02-04",890.0],["02-05",911.0],["02-08",906.0],["02-09",925.0],["02-10",922.0],["02-11",939.0],["02-12",952.0],["02-15",936.0],["02-16",937.0],["02-17",936.0],["02-18",942.0],["02-19",939.0],["02-22",927.0],["02-23",926.0],["02-24",936.0],["02-25",940.0],["02-26",922.0],["02-29",920.0],["03-01",938.0],["03-02",938.0],["03-03",936.0],["03-04",959.0],["03-07",997.0],["03-08",1002.0],["03-09",978.0],["03-10",979.0],["03-11",976.0],["03-14",969.0],["03-15",952.0],["03-16",967.0],["03-17",983.0],["03-18",977.0],["03-21",966.0],["03-22",981.0],["03-23",985.0],["03-24",952.0],["03-29",945.0],["03-30",970.0],["03-31",970.0],["04-01",982.0],["04-04",949.0],["04-05",955.0],["04-06",956.0],["04-07",945.0],["04-08",956.0],["04-11",972.0],["04-12",997.0],["04-13",994.0],["04-14",991.0],["04-15",988.0],["04-18",982.0],["04-19",990.0],["04-20",1008.0],["04-21",1026.0],["04-22",1031.0],["04-25",1008.0],["04-26",1011.0],["04-27",1016.0],["04-28",1032.0],["04-29",1060.0],["05-03",1084.0],["05-04",1056.0],["05-05",1057.0],["05-06",1061.0],["05-09",1070.0],["05-10",1046.0],["05-11",1058.0],["05-12",1058.0],["05-13",1055.0],["05-16",1053.0],["05-17",1050.0],["05-18",1039.0],["05-19",1019.0],["05-20",1019.0],["05-23",1017.0],["05-24",1007.0],["05-25",997.0],["05-26",1001.0],["05-27",993.0],["05-31",977.0],["06-01",974.0],["06-02",974.0],["06-03",960.0],["06-06",986.0],["06-07",992.0],["06-08",1007.0],["06-09",1000.0],["06-10",992.0],["06-13",992.0],["06-14",983.0],["06-15",979.0],["06-16",984.0],["06-17",977.0],["06-20",975.0],["06-21",986.0],["06-22",981.0],["06-23",975.0],["06-24",976.0],["06-27",991.0],["06-28",979.0],["06-29",988.0],["06-30",1004.0],["07-01",1033.0],["07-04",1055.0],["07-05",1057.0],["07-06",1071.0],["07-07",1086.0],["07-08",1077.0],["07-11",1093.0],["07-12",1100.0],["07-13",1092.0],["07-14",1081.0],["07-15",1096.0],["07-18",1085.0],["07-19",1090.0],["07-20",1083.0],["07-21",1087.0],["07-22",1094.0],["07-25",1072.0],["07-26",1087.0],["07-27",1095.0],["07-28",1149.0],["07-29",1128.0],["08-01",1150.0],["08-02",1165.0],["08-03",1163.0],["08-04",1155.0],["08-05",1161.0],["08-08",1143.0],["08-09",1144.0],["08-10",1177.0],["08-11",1175.0],["08-12",1141.0],["08-15",1123.0],["08-16",1126.0],["08-17",1115.0],["08-18",1124.0],["08-19",1115.0],["08-22",1107.0],["08-23",1107.0],["08-24",1105.0],["08-25",1083.0],["08-26",1082.0],["08-30",1076.0],["08-31",1060.0],["09-01",1051.0],["09-02",1044.0],["09-05",1068.0],["09-06",1078.0],["09-07",1095.0],["09-08",1093.0],["09-09",1079.0],["09-12",1049.0],["09-13",1055.0],["09-14",1041.0],["09-15",1034.0],["09-16",1027.0],["09-19",1027.0],["09-20",1026.0],["09-21",1038.0],["09-22",1046.0],["09-23",1055.0],["09-26",1038.0],["09-27",1040.0],["09-28",1025.0],["09-29",1028.0],["09-30",1031.0],["10-03",1020.0],["10-04",1007.0],["10-05",993.0],["10-06",976.0],["10-07",964.0],["10-10",969.0],["10-11",960.0],["10-12",948.0],["10-13",942.0],["10-14",938.0],["10-17",938.0],["10-18",947.0],["10-19",944.0],["10-20",940.0],["10-21",926.0],["10-24",936.0],["10-25",951.0],["10-26",966.0],["10-27",960.0],["10-28",965.0],["10-31",979.0],["11-01",983.0],["11-02",991.0],["11-03",985.0],["11-04",995.0],["11-07",989.0],["11-08",1008.0],["11-09",1005.0],["11-10",994.0],["11-11",973.0],["11-14",940.0],["11-15",942.0],["11-16",933.0],["11-17",942.0],["11-18",925.0],["11-21",928.0],["11-22",946.0],["11-23",938.0],["11-24",917.0],["11-25",911.0],["11-28",916.0],["11-29",923.0],["11-30",918.0],["12-01",903.0],["12-02",916.0],["12-05",925.0],["12-06",939.0],["12-07",930.0],["12-08",947.0],["12-09",937.0],["12-12",915.0],["12-13",928.0],["12-14",937.0],["12-15",922.0],["12-16",904.0],["12-19",924.0],["12-20",914.0],["12-21",914.0],["12-22",910.0],["12-23",905.0],["12-28",903.0],["12-29",905.0],["12-30",907.0]],"Silver":[["01-04",14.0],["01-05",14.01],["01-06",14.01],["01-07",14.03],["01-08",14.04],["01-11",13.97],["01-12",13.88],["01-13",13.83],["01-14",14.02],["01-15",13.8],["01-18",13.88],["01-19",14.03],["01-20",14.05],["01-21",14.01],["01-22",14.17],["01-25",14.22],["01-26",14.33],["01-27",14.38],["01-28",13.58],["01-29",14.08],["02-01",14.33],["02-02",14.26],["02-03",14.41],["02-04",14.74],["02-05",14.91],["02-08",14.94],["02-09",15.34],["02-10",15.12],["02-11",15.65],["02-12",15.64],["02-15",15.26],["02-16",15.35],["02-17",15.25],["02-18",15.25],["02-19",15.37],["02-22",15.0],["02-23",15.21],["02-24",15.32],["02-25",15.16],["02-26",15.17],["02-29",14.75],["03-01",14.99],["03-02",14.82],["03-03",14.97],["03-04",15.43],["03-07",15.66],["03-08",15.66],["03-09",15.27],["03-10",15.27],["03-11",15.5],["03-14",15.6],["03-15",15.32],["03-16",15.29],["03-17",15.73],["03-18",15.94],["03-21",15.81],["03-22",15.89],["03-23",15.58],["03-24",15.28],["03-29",15.06],["03-30",15.38],["03-31",15.38],["04-01",15.38],["04-04",14.96],["04-05",15.19],["04-06",15.07],["04-07",15.22],["04-08",15.16],["04-11",15.56],["04-12",15.96],["04-13",15.98],["04-14",16.13],["04-15",16.17],["04-18",16.2],["04-19",16.62],["04-20",16.97],["04-21",17.32],["04-22",17.19],["04-25",16.86],["04-26",16.95],["04-27",17.34],["04-28",17.35],["04-29",17.86],["05-03",17.49],["05-04",17.18],["05-05",17.38],["05-06",17.31],["05-09",17.33],["05-10",17.04],["05-11",17.51],["05-12",17.23],["05-13",17.09],["05-16",17.32],["05-17",17.08],["05-18",17.05],["05-19",16.6],["05-20",16.56],["05-23",16.31],["05-24",16.27],["05-25",16.2],["05-26",16.46],["05-27",16.3],["05-31",16.06],["06-01",15.95],["06-02",15.98],["06-03",16.1],["06-06",16.4],["06-07",16.31],["06-08",16.75],["06-09",17.05],["06-10",17.32],["06-13",17.32],["06-14",17.25],["06-15",17.41],["06-16",17.71],["06-17",17.37],["06-20",17.34],["06-21",17.36],["06-22",17.2],["06-23",17.29],["06-24",18.04],["06-27",17.7],["06-28",17.57],["06-29",18.21],["06-30",18.36],["07-01",19.24],["07-04",20.36],["07-05",19.73],["07-06",20.43],["07-07",19.95],["07-08",19.72],["07-11",20.47],["07-12",20.35],["07-13",20.29],["07-14",20.25],["07-15",20.14],["07-18",19.72],["07-19",19.99],["07-20",19.7],["07-21",19.34],["07-22",19.7],["07-25",19.41],["07-26",19.68],["07-27",19.58],["07-28",20.41],["07-29",20.04],["08-01",20.51],["08-02",20.71],["08-03",20.59],["08-04",20.16],["08-05",20.22],["08-08",19.66],["08-09",19.7],["08-10",20.34],["08-11",20.21],["08-12",19.87],["08-15",19.9],["08-16",20.04],["08-17",19.57],["08-18",19.78],["08-19",19.41],["08-22",18.91],["08-23",18.98],["08-24",18.84],["08-25",18.5],["08-26",18.67],["08-30",18.78],["08-31",18.74],["09-01",18.65],["09-02",18.75],["09-05",19.46],["09-06",19.6],["09-07",19.92],["09-08",19.93],["09-09",19.41],["09-12",18.72],["09-13",19.16],["09-14",19.04],["09-15",18.96],["09-16",18.91],["09-19",19.12],["09-20",19.17],["09-21",19.43],["09-22",19.88],["09-23",19.82],["09-26",19.44],["09-27",19.42],["09-28",19.12],["09-29",19.01],["09-30",19.35],["10-03",19.18],["10-04",18.74],["10-05",17.8],["10-06",17.76],["10-07",17.33],["10-10",17.78],["10-11",17.48],["10-12",17.44],["10-13",17.59],["10-14",17.47],["10-17",17.4],["10-18",17.65],["10-19",17.69],["10-20",17.6],["10-21",17.51],["10-24",17.64],["10-25",17.73],["10-26",17.66],["10-27",17.66],["10-28",17.61],["10-31",17.76],["11-01",18.24],["11-02",18.54],["11-03",18.07],["11-04",18.3],["11-07",18.22],["11-08",18.26],["11-09",18.81],["11-10",18.75],["11-11",18.59],["11-14",17.2],["11-15",17.0],["11-16",16.95],["11-17",17.04],["11-18",16.51],["11-21",16.68],["11-22",16.76],["11-23",16.56],["11-24",16.31],["11-25",16.46],["11-28",16.68],["11-29",16.54],["11-30",16.67],["12-01",16.3],["12-02",16.35],["12-05",16.62],["12-06",16.79],["12-07",16.77],["12-08",17.13],["12-09",16.95],["12-12",16.86],["12-13",17.01],["12-14",17.11],["12-15",16.14],["12-16",16.05],["12-19",16.0],["12-20",15.8],["12-21",16.03],["12-22",15.77],["12-23",15.74],["12-28",15.85],["12-29",16.06],["12-30",16.24]]},"2017":{"Gold":[["01-03",1148.65],["01-04",1165.9],["01-05",1173.05],["01-06",1178.0],["01-09",1176.1],["01-10",1183.2],["01-11",1187.55],["01-12",1206.65],["01-13",1196.35],["01-16",1202.75],["01-17",1217.5],["01-18",1212.5],["01-19",1203.35],["01-20",1199.1],["01-23",1213.75],["01-24",1213.3],["01-25",1203.5],["01-26",1191.55],["01-27",1184.2],["01-30",1189.85],["01-31",1198.8],["02-01",1210.0],["02-02",1224.05],["02-03",1213.05],["02-06",1221.85],["02-07",1231.0],["02-08",1235.6],["02-09",1241.75],["02-10",1225.75],["02-13",1229.4],["02-14",1229.65],["02-15",1225.15],["02-16",1236.75],["02-17",1241.4],["02-20",1235.35],["02-21",1228.7],["02-22",1237.5],["02-23",1237.35],["02-24",1255.35],["02-27",1256.25],["02-28",1251.9],["03-01",1246.05],["03-02",1243.3],["03-03",1228.75],["03-06",1231.15],["03-07",1223.7],["03-08",1213.3],["03-09",1204.6],["03-10",1196.55],["03-13",1207.8],["03-14",1203.55],["03-15",1202.25],["03-16",1225.6],["03-17",1228.75],["03-20",1233.0],["03-21",1232.05],["03-22",1246.1],["03-23",1247.9],["03-24",1244.0],["03-27",1256.9],["03-28",1253.65],["03-29",1252.9],["03-30",1250.9],["03-31",1241.7],["04-03",1246.25],["04-04",1258.65],["04-05",1252.5],["04-06",1253.75],["04-07",1264.3],["04-10",1253.6],["04-11",1255.7],["04-12",1272.3],["04-13",1286.1],["04-18",1285.0],["04-19",1282.05],["04-20",1279.9],["04-21",1281.5],["04-24",1271.8],["04-25",1270.5],["04-26",1264.95],["04-27",1264.3],["04-28",1265.55],["05-02",1255.8],["05-03",1253.95],["05-04",1235.85],["05-05",1239.4],["05-08",1229.7],["05-09",1225.15],["05-10",1222.95],["05-11",1221.0],["05-12",1227.9],["05-15",1231.5],["05-16",1234.05],["05-17",1244.6],["05-18",1261.35],["05-19",1251.85],["05-22",1255.25],["05-23",1259.9],["05-24",1251.35],["05-25",1257.1],["05-26",1265.0],["05-30",1262.8],["05-31",1263.8],["06-01",1266.15],["06-02",1260.95],["06-05",1280.7],["06-06",1287.85],["06-07",1292.7],["06-08",1284.8],["06-09",1274.25],["06-12",1269.25],["06-13",1261.3],["06-14",1268.25],["06-15",1260.25],["06-16",1256.6],["06-19",1251.1],["06-20",1246.5],["06-21",1247.05],["06-22",1251.4],["06-23",1256.3],["06-26",1240.85],["06-27",1250.4],["06-28",1251.6],["06-29",1246.6],["06-30",1243.25],["07-03",1235.2],["07-04",1224.25],["07-05",1221.9],["07-06",1224.3],["07-07",1220.4],["07-10",1207.55],["07-11",1211.9],["07-12",1219.4],["07-13",1221.4],["07-14",1218.95],["07-17",1229.85],["07-18",1237.1],["07-19",1239.85],["07-20",1236.55],["07-21",1247.25],["07-24",1255.85],["07-25",1252.0],["07-26",1245.4],["07-27",1262.05],["07-28",1259.6],["07-31",1266.35],["08-01",1267.05],["08-02",1266.65],["08-03",1261.8],["08-04",1269.3],["08-07",1257.55],["08-08",1261.45],["08-09",1267.95],["08-10",1278.9],["08-11",1288.3],["08-14",1281.1],["08-15",1274.6],["08-16",1270.15],["08-17",1285.9],["08-18",1295.25],["08-21",1287.6],["08-22",1285.1],["08-23",1286.45],["08-24",1285.9],["08-25",1287.05],["08-29",1323.4],["08-30",1310.6],["08-31",1305.8],["09-01",1318.4],["09-04",1334.6],["09-05",1331.15],["09-06",1340.15],["09-07",1340.45],["09-08",1350.9],["09-11",1338.75],["09-12",1326.25],["09-13",1332.25],["09-14",1323.0],["09-15",1325.0],["09-18",1314.4],["09-19",1308.45],["09-20",1314.9],["09-21",1297.35],["09-22",1297.0],["09-25",1295.5],["09-26",1306.9],["09-27",1291.3],["09-28",1284.3],["09-29",1286.95],["10-02",1273.1],["10-03",1270.7],["10-04",1275.55],["10-05",1278.4],["10-06",1268.2],["10-09",1282.15],["10-10",1289.6],["10-11",1290.2],["10-12",1294.45],["10-13",1293.9],["10-16",1305.15],["10-17",1289.7],["10-18",1280.65],["10-19",1283.4],["10-20",1280.25],["10-23",1275.25],["10-24",1278.3],["10-25",1273.0],["10-26",1278.0],["10-27",1267.8],["10-30",1272.75],["10-31",1274.4],["11-01",1279.25],["11-02",1276.4],["11-03",1275.3],["11-06",1271.6],["11-07",1276.35],["11-08",1282.25],["11-09",1284.0],["11-10",1284.45],["11-13",1278.4],["11-14",1273.7],["11-15",1285.7],["11-16",1277.7],["11-17",1283.85],["11-20",1292.35],["11-21",1280.0],["11-22",1283.95],["11-23",1290.15],["11-24",1289.15],["11-27",1294.7],["11-28",1293.9],["11-29",1294.85],["11-30",1282.15],["12-01",1277.25],["12-04",1279.1],["12-05",1275.9],["12-06",1268.55],["12-07",1256.8],["12-08",1245.85],["12-11",1251.4],["12-12",1243.4],["12-13",1241.6],["12-14",1255.6],["12-15",1257.25],["12-18",1258.65],["12-19",1263.1],["12-20",1265.95],["12-21",1265.85],["12-22",1268.05],["12-27",1285.4],["12-28",1291.6],["12-29",1296.5]],"Palladium":[["01-03",684.0],["01-04",724.0],["01-05",730.0],["01-06",744.0],["01-09",756.0],["01-10",755.0],["01-11",761.0],["01-12",755.0],["01-13",754.0],["01-16",740.0],["01-17",751.0],["01-18",745.0],["01-19",749.0],["01-20",752.0],["01-23",786.0],["01-24",777.0],["01-25",783.0],["01-26",737.0],["01-27",713.0],["01-30",728.0],["01-31",750.0],["02-01",764.0],["02-02",759.0],["02-03",749.0],["02-06",764.0],["02-07",755.0],["02-08",770.0],["02-09",773.0],["02-10",774.0],["02-13",776.0],["02-14",778.0],["02-15",780.0],["02-16",790.0],["02-17",791.0],["02-20",775.0],["02-21",763.0],["02-22",783.0],["02-23",766.0],["02-24",779.0],["02-27",773.0],["02-28",783.0],["03-01",778.0],["03-02",776.0],["03-03",767.0],["03-06",772.0],["03-07",770.0],["03-08",767.0],["03-09",759.0],["03-10",746.0],["03-13",752.0],["03-14",749.0],["03-15",748.0],["03-16",764.0],["03-17",771.0],["03-20",774.0],["03-21",784.0],["03-22",781.0],["03-23",793.0],["03-24",803.0],["03-27",806.0],["03-28",788.0],["03-29",793.0],["03-30",788.0],["03-31",797.0],["04-03",798.0],["04-04",805.0],["04-05",809.0],["04-06",806.0],["04-07",804.0],["04-10",799.0],["04-11",790.0],["04-12",802.0],["04-13",806.0],["04-18",790.0],["04-19",775.0],["04-20",787.0],["04-21",802.0],["04-24",800.0],["04-25",791.0],["04-26",802.0],["04-27",803.0],["04-28",816.0],["05-02",813.0],["05-03",806.0],["05-04",804.0],["05-05",805.0],["05-08",815.0],["05-09",807.0],["05-10",797.0],["05-11",802.0],["05-12",804.0],["05-15",808.0],["05-16",804.0],["05-17",788.0],["05-18",778.0],["05-19",768.0],["05-22",761.0],["05-23",771.0],["05-24",774.0],["05-25",765.0],["05-26",774.0],["05-30",796.0],["05-31",805.0],["06-01",816.0],["06-02",833.0],["06-05",843.0],["06-06",846.0],["06-07",857.0],["06-08",845.0],["06-09",863.0],["06-12",899.0],["06-13",900.0],["06-14",886.0],["06-15",853.0],["06-16",871.0],["06-19",873.0],["06-20",867.0],["06-21",874.0],["06-22",886.0],["06-23",887.0],["06-26",858.0],["06-27",862.0],["06-28",860.0],["06-29",862.0],["06-30",843.0],["07-03",843.0],["07-04",852.0],["07-05",855.0],["07-06",844.0],["07-07",837.0],["07-10",837.0],["07-11",839.0],["07-12",853.0],["07-13",868.0],["07-14",859.0],["07-17",859.0],["07-18",862.0],["07-19",862.0],["07-20",853.0],["07-21",848.0],["07-24",841.0],["07-25",858.0],["07-26",856.0],["07-27",878.0],["07-28",877.0],["07-31",888.0],["08-01",889.0],["08-02",899.0],["08-03",889.0],["08-04",884.0],["08-07",870.0],["08-08",885.0],["08-09",895.0],["08-10",894.0],["08-11",900.0],["08-14",895.0],["08-15",897.0],["08-16",893.0],["08-17",918.0],["08-18",928.0],["08-21",931.0],["08-22",937.0],["08-23",935.0],["08-24",933.0],["08-25",939.0],["08-29",942.0],["08-30",940.0],["08-31",935.0],["09-01",934.0],["09-04",988.0],["09-05",974.0],["09-06",966.0],["09-07",942.0],["09-08",949.0],["09-11",949.0],["09-12",939.0],["09-13",946.0],["09-14",941.0],["09-15",929.0],["09-18",936.0],["09-19",930.0],["09-20",908.0],["09-21",914.0],["09-22",915.0],["09-25",920.0],["09-26",916.0],["09-27",916.0],["09-28",932.0],["09-29",935.0],["10-02",939.0],["10-03",914.0],["10-04",919.0],["10-05",928.0],["10-06",942.0],["10-09",930.0],["10-10",932.0],["10-11",936.0],["10-12",964.0],["10-13",983.0],["10-16",1005.0],["10-17",986.0],["10-18",978.0],["10-19",957.0],["10-20",968.0],["10-23",965.0],["10-24",960.0],["10-25",964.0],["10-26",968.0],["10-27",968.0],["10-30",965.0],["10-31",972.0],["11-01",993.0],["11-02",993.0],["11-03",994.0],["11-06",1001.0],["11-07",993.0],["11-08",1001.0],["11-09",1019.0],["11-10",1008.0],["11-13",988.0],["11-14",994.0],["11-15",978.0],["11-16",986.0],["11-17",994.0],["11-20",996.0],["11-21",994.0],["11-22",1006.0],["11-23",1002.0],["11-24",1009.0],["11-27",996.0],["11-28",1002.0],["11-29",1024.0],["11-30",1018.0],["12-01",1014.0],["12-04",1016.0],["12-05",996.0],["12-06",990.0],["12-07",999.0],["12-08",1015.0],["12-11",1011.0],["12-12",1006.0],["12-13",1005.0],["12-14",1008.0],["12-15",1033.0],["12-18",1021.0],["12-19",1019.0],["12-20",1027.0],["12-21",1029.0],["12-22",1028.0],["12-27",1060.0],["12-28",1058.0],["12-29",1056.0]],"Platinum":[["01-03",906.0],["01-04",942.0],["01-05",952.0],["01-06",968.0],["01-09",971.0],["01-10",971.0],["01-11",980.0],["01-12",990.0],["01-13",975.0],["01-16",983.0],["01-17",994.0],["01-18",974.0],["01-19",964.0],["01-20",955.0],["01-23",979.0],["01-24",979.0],["01-25",990.0],["01-26",981.0],["01-27",970.0],["01-30",978.0],["01-31",987.0],["02-01",996.0],["02-02",1003.0],["02-03",992.0],["02-06",1008.0],["02-07",1005.0],["02-08",1011.0],["02-09",1020.0],["02-10",1003.0],["02-13",1007.0],["02-14",1000.0],["02-15",998.0],["02-16",1012.0],["02-17",1014.0],["02-20",1001.0],["02-21",993.0],["02-22",1003.0],["02-23",995.0],["02-24",1015.0],["02-27",1026.0],["02-28",1026.0],["03-01",1027.0],["03-02",1011.0],["03-03",988.0],["03-06",988.0],["03-07",970.0],["03-08",957.0],["03-09",948.0],["03-10",940.0],["03-13",945.0],["03-14",937.0],["03-15",940.0],["03-16",962.0],["03-17",955.0],["03-20",964.0],["03-21",963.0],["03-22",967.0],["03-23",962.0],["03-24",959.0],["03-27",978.0],["03-28",963.0],["03-29",955.0],["03-30",956.0],["03-31",945.0],["04-03",953.0],["04-04",956.0],["04-05",967.0],["04-06",958.0],["04-07",962.0],["04-10",950.0],["04-11",944.0],["04-12",966.0],["04-13",973.0],["04-18",983.0],["04-19",975.0],["04-20",968.0],["04-21",977.0],["04-24",966.0],["04-25",957.0],["04-26",953.0],["04-27",947.0],["04-28",946.0],["05-02",935.0],["05-03",914.0],["05-04",904.0],["05-05",913.0],["05-08",915.0],["05-09",915.0],["05-10",905.0],["05-11",917.0],["05-12",923.0],["05-15",926.0],["05-16",934.0],["05-17",939.0],["05-18",936.0],["05-19",933.0],["05-22",938.0],["05-23",946.0],["05-24",942.0],["05-25",945.0],["05-26",953.0],["05-30",946.0],["05-31",941.0],["06-01",943.0],["06-02",928.0],["06-05",953.0],["06-06",960.0],["06-07",960.0],["06-08",946.0],["06-09",937.0],["06-12",943.0],["06-13",942.0],["06-14",928.0],["06-15",934.0],["06-16",922.0],["06-19",923.0],["06-20",927.0],["06-21",920.0],["06-22",929.0],["06-23",931.0],["06-26",921.0],["06-27",923.0],["06-28",919.0],["06-29",919.0],["06-30",921.0],["07-03",919.0],["07-04",909.0],["07-05",907.0],["07-06",909.0],["07-07",904.0],["07-10",901.0],["07-11",895.0],["07-12",905.0],["07-13",917.0],["07-14",905.0],["07-17",924.0],["07-18",924.0],["07-19",921.0],["07-20",914.0],["07-21",928.0],["07-24",935.0],["07-25",927.0],["07-26",923.0],["07-27",929.0],["07-28",926.0],["07-31",935.0],["08-01",943.0],["08-02",945.0],["08-03",949.0],["08-04",967.0],["08-07",962.0],["08-08",969.0],["08-09",974.0],["08-10",974.0],["08-11",982.0],["08-14",970.0],["08-15",961.0],["08-16",964.0],["08-17",974.0],["08-18",983.0],["08-21",980.0],["08-22",975.0],["08-23",979.0],["08-24",972.0],["08-25",979.0],["08-29",999.0],["08-30",991.0],["08-31",990.0],["09-01",997.0],["09-04",1011.0],["09-05",1000.0],["09-06",1008.0],["09-07",1005.0],["09-08",1014.0],["09-11",1003.0],["09-12",986.0],["09-13",986.0],["09-14",978.0],["09-15",978.0],["09-18",968.0],["09-19",956.0],["09-20",953.0],["09-21",940.0],["09-22",942.0],["09-25",931.0],["09-26",935.0],["09-27",920.0],["09-28",919.0],["09-29",923.0],["10-02",913.0],["10-03",912.0],["10-04",914.0],["10-05",915.0],["10-06",915.0],["10-09",917.0],["10-10",923.0],["10-11",930.0],["10-12",936.0],["10-13",936.0],["10-16",943.0],["10-17",928.0],["10-18",925.0],["10-19",922.0],["10-20",919.0],["10-23",916.0],["10-24",923.0],["10-25",914.0],["10-26",921.0],["10-27",916.0],["10-30",919.0],["10-31",918.0],["11-01",927.0],["11-02",929.0],["11-03",922.0],["11-06",921.0],["11-07",926.0],["11-08",927.0],["11-09",933.0],["11-10",937.0],["11-13",930.0],["11-14",928.0],["11-15",930.0],["11-16",931.0],["11-17",933.0],["11-20",944.0],["11-21",927.0],["11-22",934.0],["11-23",933.0],["11-24",936.0],["11-27",940.0],["11-28",946.0],["11-29",949.0],["11-30",941.0],["12-01",941.0],["12-04",932.0],["12-05",922.0],["12-06",912.0],["12-07",900.0],["12-08",895.0],["12-11",890.0],["12-12",892.0],["12-13",877.0],["12-14",879.0],["12-15",881.0],["12-18",896.0],["12-19",908.0],["12-20",918.0],["12-21",914.0],["12-22",912.0],["12-27",922.0],["12-28",923.0],["12-29",927.0]],"Silver":[["01-03",15.95],["01-04",16.42],["01-05",16.59],["01-06",16.45],["01-09",16.52],["01-10",16.66],["01-11",16.79],["01-12",16.91],["01-13",16.76],["01-16",16.82],["01-17",17.0],["01-18",17.12],["01-19",16.95],["01-20",16.89],["01-23",17.14],["01-24",17.11],["01-25",16.93],["01-26",16.86],["01-27",16.7],["01-30",17.1],["01-31",17.29],["02-01",17.6],["02-02",17.71],["02-03",17.28],["02-06",17.6],["02-07",17.6],["02-08",17.74],["02-09",17.71],["02-10",17.62],["02-13",17.97],["02-14",17.91],["02-15",17.88],["02-16",18.1],["02-17",18.0],["02-20",17.98],["02-21",17.89],["02-22",18.0],["02-23",18.0],["02-24",18.27],["02-27",18.34],["02-28",18.28],["03-01",18.33],["03-02",18.33],["03-03",17.66],["03-06",17.81],["03-07",17.7],["03-08",17.4],["03-09",17.14],["03-10",16.89],["03-13",17.02],["03-14",17.0],["03-15",16.91],["03-16",17.46],["03-17",17.4],["03-20",17.23],["03-21",17.31],["03-22",17.58],["03-23",17.55],["03-24",17.63],["03-27",17.94],["03-28",17.94],["03-29",18.13],["03-30",18.1],["03-31",18.06],["04-03",18.16],["04-04",18.34],["04-05",18.26],["04-06",18.22],["04-07",18.4],["04-10",17.94],["04-11",17.94],["04-12",18.31],["04-13",18.56],["04-18",18.42],["04-19",18.22],["04-20",18.19],["04-21",17.98],["04-24",17.81],["04-25",17.84],["04-26",17.59],["04-27",17.46],["04-28",17.41],["05-02",16.95],["05-03",16.85],["05-04",16.5],["05-05",16.27],["05-08",16.38],["05-09",16.22],["05-10",16.29],["05-11",16.37],["05-12",16.3],["05-15",16.59],["05-16",16.72],["05-17",16.9],["05-18",16.81],["05-19",16.77],["05-22",16.95],["05-23",17.14],["05-24",17.03],["05-25",17.15],["05-26",17.29],["05-30",17.27],["05-31",17.31],["06-01",17.13],["06-02",17.19],["06-05",17.52],["06-06",17.56],["06-07",17.6],["06-08",17.6],["06-09",17.35],["06-12",17.13],["06-13",16.82],["06-14",16.96],["06-15",16.86],["06-16",16.76],["06-19",16.67],["06-20",16.59],["06-21",16.51],["06-22",16.58],["06-23",16.71],["06-26",16.53],["06-27",16.66],["06-28",16.78],["06-29",16.83],["06-30",16.47],["07-03",16.48],["07-04",16.15],["07-05",15.95],["07-06",16.01],["07-07",15.84],["07-10",15.22],["07-11",15.51],["07-12",15.83],["07-13",15.95],["07-14",15.71],["07-17",16.07],["07-18",16.17],["07-19",16.23],["07-20",16.18],["07-21",16.43],["07-24",16.5],["07-25",16.31],["07-26",16.37],["07-27",16.79],["07-28",16.56],["07-31",16.76],["08-01",16.74],["08-02",16.67],["08-03",16.47],["08-04",16.7],["08-07",16.13],["08-08",16.39],["08-09",16.59],["08-10",17.08],["08-11",17.09],["08-14",16.97],["08-15",16.89],["08-16",16.68],["08-17",17.02],["08-18",17.15],["08-21",17.02],["08-22",17.02],["08-23",17.06],["08-24",16.93],["08-25",17.02],["08-29",17.6],["08-30",17.44],["08-31",17.34],["09-01",17.5],["09-04",17.8],["09-05",17.88],["09-06",17.77],["09-07",17.79],["09-08",18.21],["09-11",17.85],["09-12",17.75],["09-13",17.91],["09-14",17.75],["09-15",17.7],["09-18",17.53],["09-19",17.15],["09-20",17.38],["09-21",16.95],["09-22",16.97],["09-25",16.95],["09-26",17.01],["09-27",16.89],["09-28",16.82],["09-29",16.86],["10-02",16.58],["10-03",16.61],["10-04",16.82],["10-05",16.66],["10-06",16.62],["10-09",16.92],["10-10",17.12],["10-11",17.15],["10-12",17.2],["10-13",17.2],["10-16",17.41],["10-17",17.11],["10-18",16.95],["10-19",17.02],["10-20",17.07],["10-23",17.0],["10-24",17.04],["10-25",16.89],["10-26",16.97],["10-27",16.72],["10-30",16.73],["10-31",16.82],["11-01",16.94],["11-02",17.08],["11-03",17.09],["11-06",16.91],["11-07",17.0],["11-08",17.0],["11-09",17.1],["11-10",17.0],["11-13",16.93],["11-14",16.93],["11-15",17.11],["11-16",17.04],["11-17",17.09],["11-20",17.14],["11-21",17.0],["11-22",16.96],["11-23",17.09],["11-24",17.05],["11-27",17.1],["11-28",17.07],["11-29",16.89],["11-30",16.57],["12-01",16.42],["12-04",16.33],["12-05",16.29],["12-06",16.11],["12-07",15.91],["12-08",15.82],["12-11",15.84],["12-12",15.78],["12-13",15.71],["12-14",16.01],["12-15",15.98],["12-18",16.09],["12-19",16.16],["12-20",16.18],["12-21",16.14],["12-22",16.18],["12-27",16.5],["12-28",16.74],["12-29",16.86]]},"2018":{"Gold":[["01-02",1312.8],["01-03",1314.6],["01-04",1313.7],["01-05",1317.9],["01-08",1318.8],["01-09",1314.95],["01-10",1321.65],["01-11",1319.85],["01-12",1332.9],["01-15",1343.0],["01-16",1334.95],["01-17",1337.35],["01-18",1329.75],["01-19",1335.8],["01-22",1334.15],["01-23",1337.1],["01-24",1350.5],["01-25",1360.25],["01-26",1354.35],["01-29",1348.4],["01-30",1345.7],["01-31",1343.35],["02-01",1341.1],["02-02",1345.0],["02-05",1337.1],["02-06",1344.65],["02-07",1328.5],["02-08",1311.05],["02-09",1316.05],["02-12",1321.7],["02-13",1329.4],["02-14",1330.75],["02-15",1353.7],["02-16",1358.6],["02-19",1347.4],["02-20",1337.4],["02-21",1328.6],["02-22",1323.5],["02-23",1328.9],["02-26",1339.05],["02-27",1332.75],["02-28",1320.3],["03-01",1311.25],["03-02",1316.75],["03-05",1326.3],["03-06",1324.95],["03-07",1332.5],["03-08",1325.4],["03-09",1319.35],["03-12",1317.25],["03-13",1318.7],["03-14",1324.95],["03-15",1323.35],["03-16",1320.05],["03-19",1311.7],["03-20",1312.75],["03-21",1316.35],["03-22",1328.85],["03-23",1342.35],["03-26",1348.4],["03-27",1350.65],["03-28",1341.05],["03-29",1323.9],["04-03",1336.6],["04-04",1343.15],["04-05",1327.05],["04-06",1325.6],["04-09",1328.5],["04-10",1335.95],["04-11",1345.2],["04-12",1345.9],["04-13",1340.75],["04-16",1344.4],["04-17",1342.95],["04-18",1346.55],["04-19",1347.9],["04-20",1340.15],["04-23",1328.0],["04-24",1327.35],["04-25",1325.7],["04-26",1321.9],["04-27",1317.7],["04-30",1316.25],["05-01",1309.2],["05-02",1310.75],["05-03",1313.3],["05-04",1309.35],["05-08",1310.05],["05-09",1306.85],["05-10",1314.8],["05-11",1324.8],["05-14",1320.7],["05-15",1310.05],["05-16",1291.75],["05-17",1288.85],["05-18",1287.2],["05-21",1285.85],["05-22",1293.9],["05-23",1294.0],["05-24",1296.35],["05-25",1303.95],["05-29",1302.05],["05-30",1298.6],["05-31",1303.5],["06-01",1299.15],["06-04",1294.65],["06-05",1292.25],["06-06",1295.25],["06-07",1298.3],["06-08",1299.2],["06-11",1296.05],["06-12",1298.3],["06-13",1294.4],["06-14",1305.3],["06-15",1300.1],["06-18",1281.25],["06-19",1279.0],["06-20",1273.25],["06-21",1263.7],["06-22",1269.7],["06-25",1269.8],["06-26",1257.15],["06-27",1256.8],["06-28",1250.5],["06-29",1250.55],["07-02",1249.0],["07-03",1245.85],["07-04",1256.9],["07-05",1252.5],["07-06",1254.2],["07-09",1262.6],["07-10",1253.7],["07-11",1250.0],["07-12",1244.85],["07-13",1240.5],["07-16",1244.9],["07-17",1243.65],["07-18",1223.45],["07-19",1217.4],["07-20",1224.85],["07-23",1229.45],["07-24",1224.3],["07-25",1230.55],["07-26",1228.35],["07-27",1219.15],["07-30",1222.05],["07-31",1219.2],["08-01",1222.75],["08-02",1217.6],["08-03",1207.7],["08-06",1212.0],["08-07",1215.4],["08-08",1212.35],["08-09",1215.5],["08-10",1211.65],["08-13",1204.4],["08-14",1195.3],["08-15",1186.7],["08-16",1179.65],["08-17",1176.7],["08-20",1188.75],["08-21",1194.1],["08-22",1196.85],["08-23",1187.3],["08-24",1189.95],["08-28",1212.75],["08-29",1204.3],["08-30",1202.35],["08-31",1206.85],["09-03",1201.7],["09-04",1195.75],["09-05",1194.7],["09-06",1204.3],["09-07",1200.75],["09-10",1195.8],["09-11",1194.0],["09-12",1197.8],["09-13",1206.65],["09-14",1206.2],["09-17",1196.8],["09-18",1199.4],["09-19",1203.0],["09-20",1203.0],["09-21",1207.6],["09-24",1198.75],["09-25",1199.45],["09-26",1198.8],["09-27",1196.0],["09-28",1183.5],["10-01",1185.3],["10-02",1192.65],["10-03",1203.5],["10-04",1199.45],["10-05",1201.1],["10-08",1194.8],["10-09",1187.4],["10-10",1186.4],["10-11",1201.1],["10-12",1218.75],["10-15",1233.0],["10-16",1228.85],["10-17",1226.75],["10-18",1224.6],["10-19",1228.25],["10-22",1222.9],["10-23",1235.6],["10-24",1231.65],["10-25",1232.15],["10-26",1236.05],["10-29",1230.75],["10-30",1220.0],["10-31",1217.7],["11-01",1223.25],["11-02",1235.5],["11-05",1231.6],["11-06",1234.85],["11-07",1235.05],["11-08",1223.45],["11-09",1219.05],["11-12",1207.05],["11-13",1197.55],["11-14",1201.45],["11-15",1210.6],["11-16",1215.8],["11-19",1223.55],["11-20",1223.1],["11-21",1224.0],["11-22",1228.25],["11-23",1222.15],["11-26",1226.65],["11-27",1225.05],["11-28",1213.2],["11-29",1226.45],["11-30",1220.45],["12-03",1231.05],["12-04",1239.25],["12-05",1236.15],["12-06",1236.45],["12-07",1241.2],["12-10",1246.8],["12-11",1248.25],["12-12",1244.75],["12-13",1244.45],["12-14",1239.15],["12-17",1239.1],["12-18",1248.8],["12-19",1248.6],["12-20",1255.0],["12-21",1257.6],["12-24",1261.25],["12-27",1271.1],["12-28",1277.25],["12-31",1281.65]],"Palladium":[["01-02",1071.0],["01-03",1083.0],["01-04",1098.0],["01-05",1096.0],["01-08",1096.0],["01-09",1103.0],["01-10",1099.0],["01-11",1082.0],["01-12",1086.0],["01-15",1128.0],["01-16",1111.0],["01-17",1104.0],["01-18",1106.0],["01-19",1111.0],["01-22",1098.0],["01-23",1088.0],["01-24",1099.0],["01-25",1106.0],["01-26",1097.0],["01-29",1090.0],["01-30",1081.0],["01-31",1063.0],["02-01",1031.0],["02-02",1047.0],["02-05",1038.0],["02-06",1029.0],["02-07",1007.0],["02-08",990.0],["02-09",970.0],["02-12",987.0],["02-13",988.0],["02-14",989.0],["02-15",1020.0],["02-16",1028.0],["02-19",1050.0],["02-20",1030.0],["02-21",1027.0],["02-22",1024.0],["02-23",1041.0],["02-26",1061.0],["02-27",1061.0],["02-28",1049.0],["03-01",1020.0],["03-02",991.0],["03-05",992.0],["03-06",981.0],["03-07",979.0],["03-08",970.0],["03-09",978.0],["03-12",991.0],["03-13",981.0],["03-14",1004.0],["03-15",994.0],["03-16",990.0],["03-19",997.0],["03-20",995.0],["03-21",986.0],["03-22",988.0],["03-23",982.0],["03-26",981.0],["03-27",978.0],["03-28",977.0],["03-29",971.0],["04-03",941.0],["04-04",929.0],["04-05",929.0],["04-06",906.0],["04-09",916.0],["04-10",935.0],["04-11",955.0],["04-12",955.0],["04-13",978.0],["04-16",988.0],["04-17",991.0],["04-18",1016.0],["04-19",1055.0],["04-20",1017.0],["04-23",1027.0],["04-24",965.0],["04-25",972.0],["04-26",969.0],["04-27",982.0],["04-30",973.0],["05-01",958.0],["05-02",958.0],["05-03",974.0],["05-04",965.0],["05-08",972.0],["05-09",975.0],["05-10",978.0],["05-11",1004.0],["05-14",995.0],["05-15",977.0],["05-16",983.0],["05-17",982.0],["05-18",981.0],["05-21",972.0],["05-22",998.0],["05-23",978.0],["05-24",968.0],["05-25",980.0],["05-29",980.0],["05-30",979.0],["05-31",989.0],["06-01",989.0],["06-04",1009.0],["06-05",993.0],["06-06",998.0],["06-07",1017.0],["06-08",1013.0],["06-11",1015.0],["06-12",1022.0],["06-13",1007.0],["06-14",1016.0],["06-15",1007.0],["06-18",991.0],["06-19",983.0],["06-20",973.0],["06-21",962.0],["06-22",958.0],["06-25",957.0],["06-26",939.0],["06-27",949.0],["06-28",951.0],["06-29",948.0],["07-02",950.0],["07-03",942.0],["07-04",946.0],["07-05",948.0],["07-06",945.0],["07-09",962.0],["07-10",948.0],["07-11",939.0],["07-12",942.0],["07-13",942.0],["07-16",941.0],["07-17",920.0],["07-18",909.0],["07-19",904.0],["07-20",892.0],["07-23",890.0],["07-24",918.0],["07-25",927.0],["07-26",938.0],["07-27",927.0],["07-30",926.0],["07-31",926.0],["08-01",929.0],["08-02",921.0],["08-03",916.0],["08-06",914.0],["08-07",910.0],["08-08",905.0],["08-09",897.0],["08-10",899.0],["08-13",902.0],["08-14",893.0],["08-15",890.0],["08-16",864.0],["08-17",902.0],["08-20",918.0],["08-21",917.0],["08-22",914.0],["08-23",916.0],["08-24",923.0],["08-28",950.0],["08-29",941.0],["08-30",980.0],["08-31",977.0],["09-03",985.0],["09-04",966.0],["09-05",982.0],["09-06",983.0],["09-07",979.0],["09-10",979.0],["09-11",969.0],["09-12",973.0],["09-13",977.0],["09-14",979.0],["09-17",980.0],["09-18",991.0],["09-19",1014.0],["09-20",1039.0],["09-21",1056.0],["09-24",1053.0],["09-25",1057.0],["09-26",1059.0],["09-27",1075.0],["09-28",1086.0],["10-01",1065.0],["10-02",1054.0],["10-03",1050.0],["10-04",1054.0],["10-05",1055.0],["10-08",1061.0],["10-09",1083.0],["10-10",1073.0],["10-11",1074.0],["10-12",1087.0],["10-15",1080.0],["10-16",1085.0],["10-17",1083.0],["10-18",1076.0],["10-19",1082.0],["10-22",1090.0],["10-23",1136.0],["10-24",1141.0],["10-25",1113.0],["10-26",1084.0],["10-29",1103.0],["10-30",1086.0],["10-31",1072.0],["11-01",1084.0],["11-02",1104.0],["11-05",1122.0],["11-06",1134.0],["11-07",1122.0],["11-08",1123.0],["11-09",1120.0],["11-12",1110.0],["11-13",1105.0],["11-14",1105.0],["11-15",1131.0],["11-16",1163.0],["11-19",1182.0],["11-20",1152.0],["11-21",1154.0],["11-22",1149.0],["11-23",1146.0],["11-26",1138.0],["11-27",1142.0],["11-28",1162.0],["11-29",1183.0],["11-30",1192.0],["12-03",1194.0],["12-04",1235.0],["12-05",1249.0],["12-06",1221.0],["12-07",1211.0],["12-10",1220.0],["12-11",1240.0],["12-12",1255.0],["12-13",1264.0],["12-14",1247.0],["12-17",1249.0],["12-18",1262.0],["12-19",1263.0],["12-20",1274.0],["12-21",1259.0],["12-24",1240.0],["12-27",1260.0],["12-28",1268.0],["12-31",1263.0]],"Platinum":[["01-02",937.0],["01-03",944.0],["01-04",953.0],["01-05",963.0],["01-08",967.0],["01-09",962.0],["01-10",963.0],["01-11",976.0],["01-12",995.0],["01-15",995.0],["01-16",991.0],["01-17",1001.0],["01-18",999.0],["01-19",1012.0],["01-22",1018.0],["01-23",990.0],["01-24",1014.0],["01-25",1020.0],["01-26",1020.0],["01-29",1009.0],["01-30",998.0],["01-31",1004.0],["02-01",997.0],["02-02",1003.0],["02-05",994.0],["02-06",996.0],["02-07",986.0],["02-08",974.0],["02-09",972.0],["02-12",966.0],["02-13",971.0],["02-14",973.0],["02-15",1005.0],["02-16",1011.0],["02-19",1010.0],["02-20",1002.0],["02-21",994.0],["02-22",987.0],["02-23",993.0],["02-26",1005.0],["02-27",996.0],["02-28",981.0],["03-01",972.0],["03-02",960.0],["03-05",967.0],["03-06",960.0],["03-07",960.0],["03-08",949.0],["03-09",951.0],["03-12",958.0],["03-13",961.0],["03-14",969.0],["03-15",957.0],["03-16",957.0],["03-19",942.0],["03-20",950.0],["03-21",946.0],["03-22",956.0],["03-23",954.0],["03-26",950.0],["03-27",957.0],["03-28",942.0],["03-29",936.0],["04-03",934.0],["04-04",924.0],["04-05",910.0],["04-06",911.0],["04-09",918.0],["04-10",933.0],["04-11",931.0],["04-12",926.0],["04-13",933.0],["04-16",930.0],["04-17",928.0],["04-18",944.0],["04-19",950.0],["04-20",931.0],["04-23",922.0],["04-24",919.0],["04-25",923.0],["04-26",909.0],["04-27",908.0],["04-30",907.0],["05-01",900.0],["05-02",898.0],["05-03",901.0],["05-04",899.0],["05-08",909.0],["05-09",909.0],["05-10",916.0],["05-11",927.0],["05-14",926.0],["05-15",905.0],["05-16",897.0],["05-17",888.0],["05-18",886.0],["05-21",880.0],["05-22",903.0],["05-23",904.0],["05-24",908.0],["05-25",912.0],["05-29",906.0],["05-30",906.0],["05-31",912.0],["06-01",910.0],["06-04",901.0],["06-05",897.0],["06-06",902.0],["06-07",907.0],["06-08",898.0],["06-11",904.0],["06-12",906.0],["06-13",893.0],["06-14",905.0],["06-15",903.0],["06-18",886.0],["06-19",880.0],["06-20",862.0],["06-21",864.0],["06-22",865.0],["06-25",877.0],["06-26",862.0],["06-27",861.0],["06-28",852.0],["06-29",846.0],["07-02",842.0],["07-03",822.0],["07-04",838.0],["07-05",841.0],["07-06",839.0],["07-09",857.0],["07-10",842.0],["07-11",841.0],["07-12",832.0],["07-13",832.0],["07-16",831.0],["07-17",827.0],["07-18",806.0],["07-19",804.0],["07-20",815.0],["07-23",827.0],["07-24",834.0],["07-25",838.0],["07-26",838.0],["07-27",820.0],["07-30",824.0],["07-31",826.0],["08-01",830.0],["08-02",817.0],["08-03",824.0],["08-06",832.0],["08-07",834.0],["08-08",827.0],["08-09",828.0],["08-10",830.0],["08-13",818.0],["08-14",804.0],["08-15",788.0],["08-16",781.0],["08-17",782.0],["08-20",795.0],["08-21",800.0],["08-22",790.0],["08-23",780.0],["08-24",784.0],["08-28",807.0],["08-29",792.0],["08-30",791.0],["08-31",798.0],["09-03",787.0],["09-04",778.0],["09-05",774.0],["09-06",790.0],["09-07",793.0],["09-10",782.0],["09-11",789.0],["09-12",789.0],["09-13",804.0],["09-14",807.0],["09-17",795.0],["09-18",801.0],["09-19",820.0],["09-20",822.0],["09-21",838.0],["09-24",826.0],["09-25",830.0],["09-26",826.0],["09-27",829.0],["09-28",811.0],["10-01",813.0],["10-02",824.0],["10-03",829.0],["10-04",821.0],["10-05",821.0],["10-08",815.0],["10-09",820.0],["10-10",820.0],["10-11",823.0],["10-12",839.0],["10-15",844.0],["10-16",843.0],["10-17",840.0],["10-18",832.0],["10-19",828.5],["10-22",833.0],["10-23",828.0],["10-24",827.0],["10-25",828.0],["10-26",826.0],["10-29",832.0],["10-30",833.0],["10-31",831.0],["11-01",848.0],["11-02",865.0],["11-05",869.0],["11-06",869.0],["11-07",876.0],["11-08",871.0],["11-09",861.0],["11-12",851.0],["11-13",844.0],["11-14",833.0],["11-15",833.0],["11-16",841.0],["11-19",844.0],["11-20",849.0],["11-21",845.0],["11-22",846.0],["11-23",842.0],["11-26",846.0],["11-27",841.0],["11-28",831.0],["11-29",823.0],["11-30",810.0],["12-03",811.0],["12-04",806.0],["12-05",797.0],["12-06",791.0],["12-07",789.0],["12-10",787.0],["12-11",780.0],["12-12",787.0],["12-13",800.0],["12-14",792.0],["12-17",784.0],["12-18",792.0],["12-19",791.0],["12-20",791.0],["12-21",793.0],["12-24",792.0],["12-27",796.0],["12-28",795.0],["12-31",794.0]],"Silver":[["01-02",17.06],["01-03",17.12],["01-04",17.13],["01-05",17.16],["01-08",17.17],["01-09",17.05],["01-10",17.14],["01-11",17.01],["01-12",17.12],["01-15",17.32],["01-16",17.09],["01-17",17.21],["01-18",17.09],["01-19",17.04],["01-22",17.04],["01-23",16.98],["01-24",17.19],["01-25",17.52],["01-26",17.4],["01-29",17.34],["01-30",17.3],["01-31",17.23],["02-01",17.19],["02-02",17.14],["02-05",16.88],["02-06",16.8],["02-07",16.69],["02-08",16.34],["02-09",16.36],["02-12",16.43],["02-13",16.61],["02-14",16.58],["02-15",16.82],["02-16",16.84],["02-19",16.72],["02-20",16.57],["02-21",16.43],["02-22",16.46],["02-23",16.61],["02-26",16.67],["02-27",16.61],["02-28",16.44],["03-01",16.32],["03-02",16.45],["03-05",16.51],["03-06",16.62],["03-07",16.64],["03-08",16.48],["03-09",16.48],["03-12",16.45],["03-13",16.51],["03-14",16.61],["03-15",16.52],["03-16",16.48],["03-19",16.29],["03-20",16.25],["03-21",16.25],["03-22",16.52],["03-23",16.53],["03-26",16.61],["03-27",16.64],["03-28",16.45],["03-29",16.28],["04-03",16.52],["04-04",16.46],["04-05",16.3],["04-06",16.27],["04-09",16.34],["04-10",16.49],["04-11",16.57],["04-12",16.66],["04-13",16.5],["04-16",16.6],["04-17",16.62],["04-18",16.95],["04-19",17.2],["04-20",17.11],["04-23",16.93],["04-24",16.59],["04-25",16.57],["04-26",16.57],["04-27",16.53],["04-30",16.38],["05-01",16.25],["05-02",16.35],["05-03",16.46],["05-04",16.41],["05-08",16.45],["05-09",16.44],["05-10",16.6],["05-11",16.76],["05-14",16.64],["05-15",16.41],["05-16",16.25],["05-17",16.39],["05-18",16.39],["05-21",16.34],["05-22",16.58],["05-23",16.53],["05-24",16.51],["05-25",16.67],["05-29",16.48],["05-30",16.37],["05-31",16.55],["06-01",16.42],["06-04",16.44],["06-05",16.39],["06-06",16.55],["06-07",16.75],["06-08",16.72],["06-11",16.76],["06-12",16.86],["06-13",16.91],["06-14",17.12],["06-15",17.23],["06-18",16.61],["06-19",16.36],["06-20",16.29],["06-21",16.25],["06-22",16.43],["06-25",16.38],["06-26",16.23],["06-27",16.21],["06-28",16.11],["06-29",16.03],["07-02",15.98],["07-03",15.93],["07-04",16.05],["07-05",15.95],["07-06",15.99],["07-09",16.2],["07-10",15.93],["07-11",15.91],["07-12",15.84],["07-13",15.81],["07-16",15.81],["07-17",15.77],["07-18",15.44],["07-19",15.26],["07-20",15.37],["07-23",15.48],["07-24",15.51],["07-25",15.56],["07-26",15.54],["07-27",15.36],["07-30",15.49],["07-31",15.43],["08-01",15.47],["08-02",15.45],["08-03",15.36],["08-06",15.35],["08-07",15.46],["08-08",15.35],["08-09",15.48],["08-10",15.38],["08-13",15.19],["08-14",15.04],["08-15",14.82],["08-16",14.61],["08-17",14.66],["08-20",14.76],["08-21",14.79],["08-22",14.81],["08-23",14.62],["08-24",14.62],["08-28",14.9],["08-29",14.69],["08-30",14.66],["08-31",14.65],["09-03",14.53],["09-04",14.25],["09-05",14.17],["09-06",14.27],["09-07",14.19],["09-10",14.21],["09-11",14.12],["09-12",14.15],["09-13",14.22],["09-14",14.21],["09-17",14.17],["09-18",14.21],["09-19",14.19],["09-20",14.23],["09-21",14.33],["09-24",14.31],["09-25",14.29],["09-26",14.47],["09-27",14.42],["09-28",14.3],["10-01",14.55],["10-02",14.51],["10-03",14.73],["10-04",14.63],["10-05",14.63],["10-08",14.46],["10-09",14.32],["10-10",14.38],["10-11",14.4],["10-12",14.6],["10-15",14.74],["10-16",14.76],["10-17",14.65],["10-18",14.52],["10-19",14.61],["10-22",14.63],["10-23",14.71],["10-24",14.74],["10-25",14.74],["10-26",14.69],["10-29",14.65],["10-30",14.43],["10-31",14.34],["11-01",14.45],["11-02",14.82],["11-05",14.73],["11-06",14.7],["11-07",14.67],["11-08",14.49],["11-09",14.34],["11-12",14.16],["11-13",14.02],["11-14",13.97],["11-15",14.13],["11-16",14.29],["11-19",14.36],["11-20",14.44],["11-21",14.42],["11-22",14.52],["11-23",14.26],["11-26",14.38],["11-27",14.28],["11-28",14.15],["11-29",14.27],["11-30",14.23],["12-03",14.38],["12-04",14.54],["12-05",14.48],["12-06",14.38],["12-07",14.48],["12-10",14.53],["12-11",14.64],["12-12",14.65],["12-13",14.68],["12-14",14.58],["12-17",14.6],["12-18",14.65],["12-19",14.64],["12-20",14.77],["12-21",14.69],["12-24",14.68],["12-27",15.05],["12-28",15.29],["12-31",15.46]]},"2019":{"Gold":[["01-02",1287.2],["01-03",1287.95],["01-04",1290.35],["01-07",1291.5],["01-08",1283.9],["01-09",1281.3],["01-10",1292.4],["01-11",1292.8],["01-14",1293.7],["01-15",1289.35],["01-16",1290.5],["01-17",1294.0],["01-18",1285.05],["01-21",1278.7],["01-22",1284.75],["01-23",1284.9],["01-24",1279.75],["01-25",1282.95],["01-28",1301.0],["01-29",1308.35],["01-30",1312.95],["01-31",1322.5],["02-01",1320.75],["02-04",1311.0],["02-05",1314.0],["02-06",1313.35],["02-07",1306.6],["02-08",1311.1],["02-11",1306.75],["02-12",1311.6],["02-13",1311.15],["02-14",1305.65],["02-15",1318.0],["02-18",1323.95],["02-19",1329.55],["02-20",1345.75],["02-21",1335.05],["02-22",1322.25],["02-25",1329.15],["02-26",1327.55],["02-27",1326.45],["02-28",1325.45],["03-01",1309.95],["03-04",1287.45],["03-05",1285.0],["03-06",1285.55],["03-07",1286.4],["03-08",1294.1],["03-11",1296.35],["03-12",1296.95],["03-13",1308.4],["03-14",1299.2],["03-15",1302.65],["03-18",1305.35],["03-19",1308.35],["03-20",1303.0],["03-21",1317.3],["03-22",1311.1],["03-25",1319.35],["03-26",1315.25],["03-27",1318.25],["03-28",1306.9],["03-29",1291.15],["04-01",1291.9],["04-02",1287.2],["04-03",1291.85],["04-04",1291.6],["04-05",1288.9],["04-08",1297.1],["04-09",1301.85],["04-10",1304.8],["04-11",1304.65],["04-12",1296.15],["04-15",1286.75],["04-16",1283.75],["04-17",1276.1],["04-18",1276.5],["04-23",1273.45],["04-24",1273.8],["04-25",1277.85],["04-26",1281.5],["04-29",1282.15],["04-30",1285.15],["05-01",1281.8],["05-02",1271.45],["05-03",1270.05],["05-07",1281.3],["05-08",1287.75],["05-09",1284.1],["05-10",1285.4],["05-13",1282.95],["05-14",1297.6],["05-15",1298.9],["05-16",1295.55],["05-17",1285.8],["05-20",1275.25],["05-21",1276.0],["05-22",1274.0],["05-23",1275.95],["05-24",1281.5],["05-28",1283.9],["05-29",1283.5],["05-30",1276.45],["05-31",1296.0],["06-03",1313.95],["06-04",1323.6],["06-05",1337.75],["06-06",1336.65],["06-07",1334.3],["06-10",1328.6],["06-11",1322.65],["06-12",1336.65],["06-13",1335.8],["06-14",1352.45],["06-17",1333.2],["06-18",1344.55],["06-19",1342.4],["06-20",1381.65],["06-21",1388.35],["06-24",1405.45],["06-25",1429.55],["06-26",1406.75],["06-27",1402.25],["06-28",1413.2],["07-01",1390.05],["07-02",1393.1],["07-03",1425.1],["07-04",1415.25],["07-05",1414.4],["07-08",1404.9],["07-09",1387.9],["07-10",1395.45],["07-11",1423.1],["07-12",1405.6],["07-15",1416.25],["07-16",1416.1],["07-17",1400.8],["07-18",1420.9],["07-19",1437.05],["07-22",1424.45],["07-23",1417.55],["07-24",1425.55],["07-25",1426.35],["07-26",1418.25],["07-29",1418.95],["07-30",1428.45],["07-31",1430.55],["08-01",1406.4],["08-02",1436.05],["08-05",1457.45],["08-06",1461.85],["08-07",1487.65],["08-08",1497.4],["08-09",1503.5],["08-12",1501.95],["08-13",1527.2],["08-14",1500.35],["08-15",1517.65],["08-16",1509.05],["08-19",1499.35],["08-20",1502.65],["08-21",1499.65],["08-22",1498.7],["08-23",1495.5],["08-27",1531.85],["08-28",1541.75],["08-29",1536.65],["08-30",1526.55],["09-02",1523.35],["09-03",1532.45],["09-04",1538.8],["09-05",1542.6],["09-06",1504.95],["09-09",1509.95],["09-10",1494.6],["09-11",1493.65],["09-12",1502.95],["09-13",1506.3],["09-16",1502.05],["09-17",1499.3],["09-18",1502.2],["09-19",1498.4],["09-20",1504.1],["09-23",1519.5],["09-24",1520.25],["09-25",1530.85],["09-26",1507.05],["09-27",1496.15],["09-30",1487.6],["10-01",1466.1],["10-02",1484.05],["10-03",1504.0],["10-04",1509.5],["10-07",1502.15],["10-08",1500.0],["10-09",1503.4],["10-10",1508.2],["10-11",1498.35],["10-14",1494.2],["10-15",1494.75],["10-16",1482.55],["10-17",1484.45],["10-18",1487.5],["10-21",1490.85],["10-22",1487.45],["10-23",1494.25],["10-24",1488.85],["10-25",1504.65],["10-28",1505.05],["10-29",1492.75],["10-30",1490.15],["10-31",1506.4],["11-01",1509.85],["11-04",1509.2],["11-05",1504.6],["11-06",1488.55],["11-07",1484.1],["11-08",1466.85],["11-11",1465.5],["11-12",1455.0],["11-13",1463.45],["11-14",1467.65],["11-15",1465.6],["11-18",1458.4],["11-19",1464.9],["11-20",1475.7],["11-21",1468.9],["11-22",1471.3],["11-25",1459.45],["11-26",1457.65],["11-27",1459.8],["11-28",1457.55],["11-29",1456.35],["12-02",1457.5],["12-03",1470.4],["12-04",1475.85],["12-05",1474.6],["12-06",1474.85],["12-09",1463.6],["12-10",1464.45],["12-11",1468.05],["12-12",1474.7],["12-13",1470.6],["12-16",1477.4],["12-17",1478.4],["12-18",1478.9],["12-19",1474.4],["12-20",1476.9],["12-23",1483.95],["12-24",1490.85],["12-27",1510.6],["12-30",1511.5],["12-31",1523.0]],"Palladium":[["01-02",1263.0],["01-03",1261.0],["01-04",1264.0],["01-07",1311.0],["01-08",1302.0],["01-09",1339.0],["01-10",1319.0],["01-11",1326.0],["01-14",1313.0],["01-15",1324.0],["01-16",1332.0],["01-17",1389.0],["01-18",1417.0],["01-21",1385.0],["01-22",1332.0],["01-23",1347.0],["01-24",1347.0],["01-25",1314.0],["01-28",1349.0],["01-29",1339.0],["01-30",1344.0],["01-31",1368.0],["02-01",1358.0],["02-04",1355.0],["02-05",1371.0],["02-06",1376.0],["02-07",1374.0],["02-08",1397.0],["02-11",1388.0],["02-12",1393.0],["02-13",1409.0],["02-14",1409.0],["02-15",1416.0],["02-18",1458.0],["02-19",1482.0],["02-20",1498.0],["02-21",1463.0],["02-22",1483.0],["02-25",1524.0],["02-26",1541.0],["02-27",1555.0],["02-28",1545.0],["03-01",1533.0],["03-04",1541.0],["03-05",1522.0],["03-06",1510.0],["03-07",1543.0],["03-08",1520.0],["03-11",1513.0],["03-12",1549.0],["03-13",1542.0],["03-14",1553.0],["03-15",1558.0],["03-18",1559.0],["03-19",1596.0],["03-20",1599.0],["03-21",1604.0],["03-22",1584.0],["03-25",1536.0],["03-26",1563.0],["03-27",1513.0],["03-28",1430.0],["03-29",1387.0],["04-01",1379.0],["04-02",1402.0],["04-03",1431.0],["04-04",1406.0],["04-05",1339.0],["04-08",1384.0],["04-09",1393.0],["04-10",1386.0],["04-11",1370.0],["04-12",1369.0],["04-15",1371.0],["04-16",1370.0],["04-17",1362.0],["04-18",1385.0],["04-23",1375.0],["04-24",1397.0],["04-25",1417.0],["04-26",1412.0],["04-29",1458.0],["04-30",1368.0],["05-01",1366.0],["05-02",1344.0],["05-03",1357.0],["05-07",1340.0],["05-08",1328.0],["05-09",1300.0],["05-10",1309.0],["05-13",1334.0],["05-14",1330.0],["05-15",1326.0],["05-16",1337.0],["05-17",1323.0],["05-20",1317.0],["05-21",1331.0],["05-22",1315.0],["05-23",1311.0],["05-24",1334.0],["05-28",1332.0],["05-29",1334.0],["05-30",1339.0],["05-31",1367.0],["06-03",1336.0],["06-04",1327.0],["06-05",1334.0],["06-06",1335.0],["06-07",1347.0],["06-10",1352.0],["06-11",1386.0],["06-12",1396.0],["06-13",1422.0],["06-14",1467.0],["06-17",1467.0],["06-18",1483.0],["06-19",1495.0],["06-20",1524.0],["06-21",1492.0],["06-24",1516.0],["06-25",1527.0],["06-26",1528.0],["06-27",1521.0],["06-28",1535.0],["07-01",1551.0],["07-02",1551.0],["07-03",1559.0],["07-04",1563.0],["07-05",1567.0],["07-08",1571.0],["07-09",1554.0],["07-10",1550.0],["07-11",1601.0],["07-12",1557.0],["07-15",1560.0],["07-16",1552.0],["07-17",1520.0],["07-18",1533.0],["07-19",1522.0],["07-22",1500.0],["07-23",1513.0],["07-24",1530.0],["07-25",1539.0],["07-26",1532.0],["07-29",1532.0],["07-30",1547.0],["07-31",1529.0],["08-01",1514.0],["08-02",1421.0],["08-05",1412.0],["08-06",1433.0],["08-07",1429.0],["08-08",1416.0],["08-09",1429.0],["08-12",1424.0],["08-13",1440.0],["08-14",1443.0],["08-15",1431.0],["08-16",1447.0],["08-19",1455.0],["08-20",1484.0],["08-21",1492.0],["08-22",1467.0],["08-23",1482.0],["08-27",1478.0],["08-28",1478.0],["08-29",1485.0],["08-30",1500.0],["09-02",1535.0],["09-03",1536.0],["09-04",1545.0],["09-05",1560.0],["09-06",1555.0],["09-09",1549.0],["09-10",1544.0],["09-11",1562.0],["09-12",1598.0],["09-13",1608.0],["09-16",1618.0],["09-17",1591.0],["09-18",1597.0],["09-19",1588.0],["09-20",1647.0],["09-23",1658.0],["09-24",1656.0],["09-25",1672.0],["09-26",1648.0],["09-27",1655.0],["09-30",1691.0],["10-01",1667.0],["10-02",1645.0],["10-03",1693.0],["10-04",1661.0],["10-07",1652.0],["10-08",1629.0],["10-09",1659.0],["10-10",1684.0],["10-11",1706.0],["10-14",1701.0],["10-15",1726.0],["10-16",1742.0],["10-17",1769.0],["10-18",1754.0],["10-21",1762.0],["10-22",1756.0],["10-23",1753.0],["10-24",1744.0],["10-25",1775.0],["10-28",1783.0],["10-29",1800.0],["10-30",1785.0],["10-31",1803.0],["11-01",1792.0],["11-04",1815.0],["11-05",1786.0],["11-06",1777.0],["11-07",1797.0],["11-08",1788.0],["11-11",1720.0],["11-12",1701.0],["11-13",1715.0],["11-14",1731.0],["11-15",1732.0],["11-18",1712.0],["11-19",1721.0],["11-20",1766.0],["11-21",1764.0],["11-22",1770.0],["11-25",1786.0],["11-26",1806.0],["11-27",1804.0],["11-28",1833.0],["11-29",1840.0],["12-02",1841.0],["12-03",1861.0],["12-04",1859.0],["12-05",1860.0],["12-06",1868.0],["12-09",1877.0],["12-10",1880.0],["12-11",1899.0],["12-12",1927.0],["12-13",1969.0],["12-16",1961.0],["12-17",1990.0],["12-18",1936.0],["12-19",1926.0],["12-20",1939.0],["12-23",1881.0],["12-24",1876.0],["12-27",1898.0],["12-30",1907.0],["12-31",1920.0]],"Platinum":[["01-02",796.0],["01-03",797.0],["01-04",801.0],["01-07",829.0],["01-08",824.0],["01-09",823.0],["01-10",824.0],["01-11",823.0],["01-14",801.0],["01-15",801.0],["01-16",800.0],["01-17",805.0],["01-18",810.0],["01-21",798.0],["01-22",793.0],["01-23",791.0],["01-24",792.0],["01-25",803.0],["01-28",811.0],["01-29",818.0],["01-30",816.0],["01-31",818.0],["02-01",822.0],["02-04",819.0],["02-05",820.0],["02-06",815.0],["02-07",805.0],["02-08",795.0],["02-11",791.0],["02-12",789.0],["02-13",791.0],["02-14",784.0],["02-15",788.0],["02-18",806.0],["02-19",813.0],["02-20",824.0],["02-21",820.0],["02-22",830.0],["02-25",850.0],["02-26",848.0],["02-27",864.0],["02-28",874.0],["03-01",862.0],["03-04",845.0],["03-05",837.0],["03-06",831.0],["03-07",826.0],["03-08",820.0],["03-11",813.0],["03-12",833.0],["03-13",838.0],["03-14",833.0],["03-15",833.0],["03-18",832.0],["03-19",840.0],["03-20",859.0],["03-21",869.0],["03-22",858.0],["03-25",850.0],["03-26",852.0],["03-27",862.0],["03-28",858.0],["03-29",847.0],["04-01",848.0],["04-02",846.0],["04-03",860.0],["04-04",882.0],["04-05",908.0],["04-08",911.0],["04-09",904.0],["04-10",891.0],["04-11",904.0],["04-12",899.0],["04-15",889.0],["04-16",888.0],["04-17",884.0],["04-18",884.0],["04-23",894.0],["04-24",892.0],["04-25",882.0],["04-26",889.0],["04-29",895.0],["04-30",898.0],["05-01",881.0],["05-02",862.0],["05-03",853.0],["05-07",877.0],["05-08",871.0],["05-09",856.0],["05-10",858.0],["05-13",853.0],["05-14",855.0],["05-15",850.0],["05-16",848.0],["05-17",826.0],["05-20",819.0],["05-21",812.0],["05-22",810.0],["05-23",800.0],["05-24",806.0],["05-28",809.0],["05-29",796.0],["05-30",792.0],["05-31",793.0],["06-03",797.0],["06-04",821.0],["06-05",823.0],["06-06",807.0],["06-07",803.0],["06-10",799.0],["06-11",803.0],["06-12",817.0],["06-13",812.0],["06-14",818.0],["06-17",799.0],["06-18",798.0],["06-19",800.0],["06-20",815.0],["06-21",805.0],["06-24",810.0],["06-25",812.0],["06-26",805.0],["06-27",812.0],["06-28",816.0],["07-01",833.0],["07-02",835.0],["07-03",831.0],["07-04",836.0],["07-05",832.0],["07-08",813.0],["07-09",808.0],["07-10",813.0],["07-11",830.0],["07-12",824.0],["07-15",839.0],["07-16",843.0],["07-17",835.0],["07-18",849.0],["07-19",857.0],["07-22",849.0],["07-23",844.0],["07-24",862.0],["07-25",881.0],["07-26",863.0],["07-29",867.0],["07-30",881.0],["07-31",874.0],["08-01",852.0],["08-02",845.0],["08-05",852.0],["08-06",855.0],["08-07",854.0],["08-08",857.0],["08-09",863.0],["08-12",855.0],["08-13",865.0],["08-14",849.0],["08-15",840.0],["08-16",834.0],["08-19",844.0],["08-20",854.0],["08-21",844.0],["08-22",850.0],["08-23",860.0],["08-27",856.0],["08-28",868.0],["08-29",916.0],["08-30",935.0],["09-02",936.0],["09-03",936.0],["09-04",968.0],["09-05",982.0],["09-06",940.0],["09-09",947.0],["09-10",938.0],["09-11",939.0],["09-12",954.0],["09-13",955.0],["09-16",953.0],["09-17",932.0],["09-18",938.0],["09-19",928.0],["09-20",945.0],["09-23",955.0],["09-24",957.0],["09-25",954.0],["09-26",928.0],["09-27",929.0],["09-30",925.0],["10-01",881.0],["10-02",874.0],["10-03",890.0],["10-04",884.0],["10-07",875.0],["10-08",881.0],["10-09",887.0],["10-10",890.0],["10-11",902.0],["10-14",891.0],["10-15",892.0],["10-16",885.0],["10-17",882.0],["10-18",883.0],["10-21",893.0],["10-22",888.0],["10-23",895.0],["10-24",919.0],["10-25",928.0],["10-28",928.0],["10-29",916.0],["10-30",921.0],["10-31",926.0],["11-01",932.0],["11-04",954.0],["11-05",936.0],["11-06",928.0],["11-07",932.0],["11-08",894.0],["11-11",884.0],["11-12",878.0],["11-13",874.0],["11-14",875.0],["11-15",876.0],["11-18",882.0],["11-19",895.0],["11-20",912.0],["11-21",912.0],["11-22",911.0],["11-25",893.0],["11-26",899.0],["11-27",901.0],["11-28",892.0],["11-29",895.0],["12-02",895.0],["12-03",901.0],["12-04",908.0],["12-05",889.0],["12-06",897.0],["12-09",890.0],["12-10",902.0],["12-11",919.0],["12-12",940.0],["12-13",938.0],["12-16",932.0],["12-17",930.0],["12-18",930.0],["12-19",927.0],["12-20",931.0],["12-23",922.0],["12-24",935.0],["12-27",950.0],["12-30",953.0],["12-31",971.0]],"Silver":[["01-02",15.44],["01-03",15.54],["01-04",15.71],["01-07",15.75],["01-08",15.64],["01-09",15.62],["01-10",15.71],["01-11",15.68],["01-14",15.62],["01-15",15.6],["01-16",15.54],["01-17",15.57],["01-18",15.47],["01-21",15.26],["01-22",15.26],["01-23",15.38],["01-24",15.3],["01-25",15.38],["01-28",15.69],["01-29",15.86],["01-30",15.91],["01-31",16.07],["02-01",16.01],["02-04",15.74],["02-05",15.87],["02-06",15.73],["02-07",15.71],["02-08",15.78],["02-11",15.71],["02-12",15.81],["02-13",15.7],["02-14",15.58],["02-15",15.68],["02-18",15.77],["02-19",15.78],["02-20",16.04],["02-21",15.91],["02-22",15.87],["02-25",15.96],["02-26",15.83],["02-27",15.86],["02-28",15.81],["03-01",15.56],["03-04",15.16],["03-05",15.11],["03-06",15.1],["03-07",15.07],["03-08",15.12],["03-11",15.29],["03-12",15.45],["03-13",15.52],["03-14",15.23],["03-15",15.36],["03-18",15.38],["03-19",15.41],["03-20",15.32],["03-21",15.54],["03-22",15.46],["03-25",15.53],["03-26",15.44],["03-27",15.4],["03-28",15.2],["03-29",15.1],["04-01",15.07],["04-02",15.03],["04-03",15.16],["04-04",15.09],["04-05",15.2],["04-08",15.14],["04-09",15.26],["04-10",15.24],["04-11",15.16],["04-12",15.06],["04-15",14.94],["04-16",14.95],["04-17",15.0],["04-18",14.96],["04-23",14.97],["04-24",14.8],["04-25",14.87],["04-26",15.0],["04-29",14.97],["04-30",14.98],["05-01",14.88],["05-02",14.68],["05-03",14.65],["05-07",14.83],["05-08",14.93],["05-09",14.82],["05-10",14.79],["05-13",14.66],["05-14",14.76],["05-15",14.81],["05-16",14.79],["05-17",14.48],["05-20",14.41],["05-21",14.43],["05-22",14.44],["05-23",14.48],["05-24",14.55],["05-28",14.48],["05-29",14.38],["05-30",14.4],["05-31",14.48],["06-03",14.71],["06-04",14.72],["06-05",14.84],["06-06",14.96],["06-07",14.91],["06-10",14.74],["06-11",14.7],["06-12",14.79],["06-13",14.79],["06-14",15.03],["06-17",14.78],["06-18",14.89],["06-19",14.95],["06-20",15.33],["06-21",15.29],["06-24",15.37],["06-25",15.4],["06-26",15.26],["06-27",15.25],["06-28",15.22],["07-01",15.26],["07-02",15.17],["07-03",15.31],["07-04",15.28],["07-05",15.21],["07-08",15.07],["07-09",15.03],["07-10",15.1],["07-11",15.27],["07-12",15.14],["07-15",15.32],["07-16",15.39],["07-17",15.61],["07-18",16.03],["07-19",16.32],["07-22",16.39],["07-23",16.43],["07-24",16.54],["07-25",16.54],["07-26",16.44],["07-29",16.39],["07-30",16.45],["07-31",16.48],["08-01",16.0],["08-02",16.2],["08-05",16.48],["08-06",16.39],["08-07",16.82],["08-08",17.02],["08-09",17.0],["08-12",16.95],["08-13",17.45],["08-14",17.11],["08-15",17.29],["08-16",17.16],["08-19",16.93],["08-20",17.02],["08-21",17.11],["08-22",16.96],["08-23",17.05],["08-27",17.73],["08-28",18.36],["08-29",18.48],["08-30",18.39],["09-02",18.35],["09-03",18.48],["09-04",19.3],["09-05",19.22],["09-06",18.14],["09-09",18.17],["09-10",17.99],["09-11",18.16],["09-12",18.19],["09-13",18.14],["09-16",17.84],["09-17",17.84],["09-18",17.85],["09-19",17.75],["09-20",17.88],["09-23",18.38],["09-24",18.56],["09-25",18.57],["09-26",17.97],["09-27",17.52],["09-30",17.25],["10-01",17.11],["10-02",17.26],["10-03",17.6],["10-04",17.61],["10-07",17.43],["10-08",17.55],["10-09",17.78],["10-10",17.75],["10-11",17.6],["10-14",17.61],["10-15",17.67],["10-16",17.25],["10-17",17.45],["10-18",17.43],["10-21",17.73],["10-22",17.62],["10-23",17.54],["10-24",17.53],["10-25",18.12],["10-28",18.05],["10-29",17.66],["10-30",17.95],["10-31",18.05],["11-01",18.12],["11-04",18.18],["11-05",18.05],["11-06",17.54],["11-07",17.53],["11-08",16.81],["11-11",16.88],["11-12",16.73],["11-13",16.95],["11-14",17.04],["11-15",16.87],["11-18",16.8],["11-19",17.12],["11-20",17.11],["11-21",17.09],["11-22",17.18],["11-25",16.87],["11-26",16.93],["11-27",17.05],["11-28",16.95],["11-29",16.96],["12-02",16.88],["12-03",17.01],["12-04",17.13],["12-05",16.87],["12-06",16.94],["12-09",16.62],["12-10",16.68],["12-11",16.66],["12-12",16.86],["12-13",16.93],["12-16",17.02],["12-17",17.06],["12-18",17.0],["12-19",16.94],["12-20",17.04],["12-23",17.38],["12-24",17.59],["12-27",17.82],["12-30",17.82],["12-31",18.05]]}});
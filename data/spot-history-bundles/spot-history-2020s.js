@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 6238 entries across 7 years (2020–2026)
+window._loadSpotSeedBundle({"2020":{"Gold":[["01-02",1520.55],["01-03",1547.4],["01-06",1576.85],["01-07",1566.5],["01-08",1582.85],["01-09",1547.85],["01-10",1548.8],["01-13",1550.35],["01-14",1544.95],["01-15",1551.9],["01-16",1555.2],["01-17",1556.5],["01-20",1559.25],["01-21",1556.25],["01-22",1558.1],["01-23",1554.05],["01-24",1561.85],["01-27",1583.45],["01-28",1579.6],["01-29",1571.2],["01-30",1580.4],["01-31",1580.85],["02-03",1578.85],["02-04",1571.2],["02-05",1552.2],["02-06",1564.75],["02-07",1568.3],["02-10",1574.05],["02-11",1567.7],["02-12",1566.75],["02-13",1575.0],["02-14",1576.35],["02-17",1580.3],["02-18",1588.2],["02-19",1609.5],["02-20",1610.35],["02-21",1633.7],["02-24",1682.35],["02-25",1655.9],["02-26",1647.95],["02-27",1646.6],["02-28",1626.35],["03-02",1609.7],["03-03",1599.05],["03-04",1644.8],["03-05",1647.45],["03-06",1687.0],["03-09",1676.6],["03-10",1657.4],["03-11",1662.5],["03-12",1636.65],["03-13",1588.15],["03-16",1504.65],["03-17",1472.35],["03-18",1506.0],["03-19",1480.7],["03-20",1504.45],["03-23",1494.5],["03-24",1599.5],["03-25",1620.95],["03-26",1620.1],["03-27",1621.2],["03-30",1624.45],["03-31",1604.65],["04-01",1594.25],["04-02",1588.05],["04-03",1609.75],["04-06",1636.6],["04-07",1652.2],["04-08",1649.05],["04-09",1662.5],["04-14",1715.85],["04-15",1712.25],["04-16",1717.85],["04-17",1693.15],["04-20",1684.95],["04-21",1678.6],["04-22",1702.65],["04-23",1727.55],["04-24",1727.25],["04-27",1717.25],["04-28",1708.1],["04-29",1706.0],["04-30",1716.75],["05-01",1673.05],["05-04",1703.7],["05-05",1696.3],["05-06",1698.9],["05-07",1688.65],["05-11",1698.8],["05-12",1703.45],["05-13",1699.85],["05-14",1716.4],["05-15",1734.85],["05-18",1756.9],["05-19",1735.25],["05-20",1750.05],["05-21",1732.8],["05-22",1732.45],["05-26",1722.75],["05-27",1705.15],["05-28",1723.3],["05-29",1725.65],["06-01",1734.8],["06-02",1740.25],["06-03",1717.6],["06-04",1706.45],["06-05",1709.55],["06-08",1692.0],["06-09",1707.5],["06-10",1717.65],["06-11",1731.9],["06-12",1735.85],["06-15",1710.4],["06-16",1728.35],["06-17",1717.3],["06-18",1732.65],["06-19",1728.55],["06-22",1745.45],["06-23",1756.6],["06-24",1775.7],["06-25",1758.55],["06-26",1762.1],["06-29",1768.8],["06-30",1770.7],["07-01",1787.4],["07-02",1771.85],["07-03",1774.65],["07-06",1774.4],["07-07",1775.5],["07-08",1799.35],["07-09",1812.45],["07-10",1805.75],["07-13",1808.05],["07-14",1798.2],["07-15",1809.3],["07-16",1804.6],["07-17",1802.9],["07-20",1810.3],["07-21",1823.2],["07-22",1851.0],["07-23",1882.35],["07-24",1893.85],["07-27",1940.55],["07-28",1931.65],["07-29",1954.35],["07-30",1952.2],["07-31",1974.7],["08-03",1972.95],["08-04",1972.25],["08-05",2034.45],["08-06",2049.15],["08-07",2061.5],["08-10",2030.3],["08-11",1996.6],["08-12",1931.7],["08-13",1931.0],["08-14",1948.3],["08-17",1949.85],["08-18",2005.15],["08-19",1993.15],["08-20",1928.05],["08-21",1932.85],["08-24",1947.55],["08-25",1925.45],["08-26",1918.5],["08-27",1938.8],["08-28",1955.85],["09-01",1987.95],["09-02",1969.0],["09-03",1934.1],["09-04",1937.6],["09-07",1928.4],["09-08",1920.6],["09-09",1928.4],["09-10",1944.8],["09-11",1944.5],["09-14",1942.3],["09-15",1963.55],["09-16",1964.8],["09-17",1936.1],["09-18",1954.75],["09-21",1930.9],["09-22",1903.1],["09-23",1888.1],["09-24",1850.75],["09-25",1870.05],["09-28",1850.95],["09-29",1882.4],["09-30",1883.4],["10-01",1895.55],["10-02",1906.4],["10-05",1899.65],["10-06",1912.5],["10-07",1888.0],["10-08",1891.35],["10-09",1912.4],["10-12",1919.8],["10-13",1920.8],["10-14",1896.45],["10-15",1891.7],["10-16",1908.2],["10-19",1910.0],["10-20",1906.35],["10-21",1918.95],["10-22",1916.85],["10-23",1910.6],["10-26",1901.6],["10-27",1898.9],["10-28",1896.85],["10-29",1876.85],["10-30",1875.8],["11-02",1886.75],["11-03",1899.85],["11-04",1888.55],["11-05",1916.8],["11-06",1947.95],["11-09",1957.45],["11-10",1874.9],["11-11",1876.2],["11-12",1868.0],["11-13",1878.2],["11-16",1892.6],["11-17",1885.4],["11-18",1877.2],["11-19",1857.4],["11-20",1867.0],["11-23",1863.8],["11-24",1818.1],["11-25",1808.55],["11-26",1814.85],["11-27",1808.05],["11-30",1771.95],["12-01",1796.2],["12-02",1832.95],["12-03",1834.8],["12-04",1839.3],["12-07",1832.8],["12-08",1864.5],["12-09",1859.8],["12-10",1834.2],["12-11",1833.65],["12-14",1820.25],["12-15",1844.3],["12-16",1861.35],["12-17",1871.95],["12-18",1878.95],["12-21",1869.25],["12-22",1873.3],["12-23",1867.1],["12-24",1872.55],["12-29",1873.9],["12-30",1877.55],["12-31",1891.1]],"Palladium":[["01-02",1950.0],["01-03",1961.0],["01-06",2023.0],["01-07",2028.0],["01-08",2090.0],["01-09",2120.0],["01-10",2120.0],["01-13",2117.0],["01-14",2147.0],["01-15",2186.0],["01-16",2366.0],["01-17",2368.0],["01-20",2573.0],["01-21",2466.0],["01-22",2417.0],["01-23",2479.0],["01-24",2463.0],["01-27",2377.0],["01-28",2281.0],["01-29",2324.0],["01-30",2270.0],["01-31",2300.0],["02-03",2281.0],["02-04",2404.0],["02-05",2483.0],["02-06",2414.0],["02-07",2338.0],["02-10",2367.0],["02-11",2329.0],["02-12",2341.0],["02-13",2400.0],["02-14",2441.0],["02-17",2471.0],["02-18",2542.0],["02-19",2786.0],["02-20",2705.0],["02-21",2714.0],["02-24",2697.0],["02-25",2676.0],["02-26",2719.0],["02-27",2795.0],["02-28",2743.0],["03-02",2660.0],["03-03",2516.0],["03-04",2436.0],["03-05",2495.0],["03-06",2465.0],["03-09",2432.0],["03-10",2458.0],["03-11",2367.0],["03-12",2230.0],["03-13",1975.0],["03-16",1720.0],["03-17",1583.0],["03-18",1588.0],["03-19",1593.0],["03-20",1704.0],["03-23",1659.0],["03-24",1820.0],["03-25",2047.0],["03-26",2258.0],["03-27",2370.0],["03-30",2236.0],["03-31",2317.0],["04-01",2314.0],["04-02",2288.0],["04-03",2234.0],["04-06",2120.0],["04-07",2190.0],["04-08",2160.0],["04-09",2180.0],["04-14",2230.0],["04-15",2229.0],["04-16",2213.0],["04-17",2180.0],["04-20",2165.0],["04-21",2135.0],["04-22",1955.0],["04-23",1950.0],["04-24",2040.0],["04-27",1987.0],["04-28",1913.0],["04-29",1958.0],["04-30",1991.0],["05-01",1927.0],["05-04",1900.0],["05-05",1815.0],["05-06",1775.0],["05-07",1815.0],["05-11",1850.0],["05-12",1865.0],["05-13",1835.0],["05-14",1810.0],["05-15",1825.0],["05-18",1920.0],["05-19",1991.0],["05-20",2068.0],["05-21",2038.0],["05-22",1980.0],["05-26",1957.0],["05-27",1965.0],["05-28",1940.0],["05-29",1921.0],["06-01",1935.0],["06-02",1954.0],["06-03",1952.0],["06-04",1950.0],["06-05",1925.0],["06-08",1950.0],["06-09",1968.0],["06-10",1925.0],["06-11",1927.0],["06-12",1945.0],["06-15",1902.0],["06-16",1966.0],["06-17",1929.0],["06-18",1933.0],["06-19",1899.0],["06-22",1918.0],["06-23",1930.0],["06-24",1940.0],["06-25",1870.0],["06-26",1846.0],["06-29",1875.0],["06-30",1914.0],["07-01",1935.0],["07-02",1905.0],["07-03",1910.0],["07-06",1920.0],["07-07",1923.0],["07-08",1925.0],["07-09",1955.0],["07-10",1946.0],["07-13",1983.0],["07-14",1983.0],["07-15",1976.0],["07-16",1976.0],["07-17",1982.0],["07-20",2027.0],["07-21",2082.0],["07-22",2109.0],["07-23",2156.0],["07-24",2135.0],["07-27",2262.0],["07-28",2281.0],["07-29",2270.0],["07-30",2085.0],["07-31",2094.0],["08-03",2105.0],["08-04",2100.0],["08-05",2154.0],["08-06",2220.0],["08-07",2184.0],["08-10",2190.0],["08-11",2180.0],["08-12",2130.0],["08-13",2145.0],["08-14",2150.0],["08-17",2178.0],["08-18",2215.0],["08-19",2193.0],["08-20",2170.0],["08-21",2180.0],["08-24",2170.0],["08-25",2166.0],["08-26",2165.0],["08-27",2184.0],["08-28",2180.0],["09-01",2273.0],["09-02",2253.0],["09-03",2294.0],["09-04",2283.0],["09-07",2300.0],["09-08",2312.0],["09-09",2256.0],["09-10",2291.0],["09-11",2304.0],["09-14",2324.0],["09-15",2329.0],["09-16",2375.0],["09-17",2365.0],["09-18",2346.0],["09-21",2347.0],["09-22",2267.0],["09-23",2232.0],["09-24",2225.0],["09-25",2236.0],["09-28",2227.0],["09-29",2265.0],["09-30",2309.0],["10-01",2322.0],["10-02",2311.0],["10-05",2315.0],["10-06",2348.0],["10-07",2360.0],["10-08",2368.0],["10-09",2410.0],["10-12",2450.0],["10-13",2416.0],["10-14",2365.0],["10-15",2347.0],["10-16",2347.0],["10-19",2345.0],["10-20",2350.0],["10-21",2400.0],["10-22",2404.0],["10-23",2381.0],["10-26",2363.0],["10-27",2365.0],["10-28",2331.0],["10-29",2233.0],["10-30",2226.0],["11-02",2234.0],["11-03",2251.0],["11-04",2263.0],["11-05",2340.0],["11-06",2391.0],["11-09",2443.0],["11-10",2483.0],["11-11",2465.0],["11-12",2355.0],["11-13",2350.0],["11-16",2345.0],["11-17",2330.0],["11-18",2340.0],["11-19",2316.0],["11-20",2335.0],["11-23",2335.0],["11-24",2334.0],["11-25",2337.0],["11-26",2363.0],["11-27",2390.0],["11-30",2404.0],["12-01",2400.0],["12-02",2418.0],["12-03",2408.0],["12-04",2342.0],["12-07",2328.0],["12-08",2314.0],["12-09",2308.0],["12-10",2288.0],["12-11",2327.0],["12-14",2324.0],["12-15",2325.0],["12-16",2333.0],["12-17",2356.0],["12-18",2335.0],["12-21",2319.0],["12-22",2313.0],["12-23",2336.0],["12-24",2328.0],["12-29",2370.0],["12-30",2342.0],["12-31",2370.0]],"Platinum":[["01-02",981.0],["01-03",988.0],["01-06",986.0],["01-07",966.0],["01-08",965.0],["01-09",954.0],["01-10",973.0],["01-13",968.0],["01-14",968.0],["01-15",998.0],["01-16",1033.0],["01-17",1016.0],["01-20",1025.0],["01-21",1006.0],["01-22",999.0],["01-23",1004.0],["01-24",1004.0],["01-27",993.0],["01-28",984.0],["01-29",992.0],["01-30",971.0],["01-31",974.0],["02-03",952.0],["02-04",980.0],["02-05",971.0],["02-06",976.0],["02-07",969.0],["02-10",970.0],["02-11",965.0],["02-12",966.0],["02-13",965.0],["02-14",972.0],["02-17",968.0],["02-18",980.0],["02-19",1018.0],["02-20",996.0],["02-21",983.0],["02-24",974.0],["02-25",967.0],["02-26",932.0],["02-27",917.0],["02-28",880.0],["03-02",874.0],["03-03",871.0],["03-04",877.0],["03-05",867.0],["03-06",871.0],["03-09",873.0],["03-10",878.0],["03-11",880.0],["03-12",858.0],["03-13",801.0],["03-16",713.0],["03-17",641.0],["03-18",652.0],["03-19",607.0],["03-20",628.0],["03-23",618.0],["03-24",679.0],["03-25",734.0],["03-26",730.0],["03-27",745.0],["03-30",721.0],["03-31",723.0],["04-01",723.0],["04-02",727.0],["04-03",719.0],["04-06",732.0],["04-07",745.0],["04-08",738.0],["04-09",736.0],["04-14",768.0],["04-15",780.0],["04-16",794.0],["04-17",775.0],["04-20",781.0],["04-21",763.0],["04-22",756.0],["04-23",766.0],["04-24",766.0],["04-27",765.0],["04-28",765.0],["04-29",780.0],["04-30",778.0],["05-01",760.0],["05-04",761.0],["05-05",756.0],["05-06",755.0],["05-07",753.0],["05-11",767.0],["05-12",767.0],["05-13",760.0],["05-14",765.0],["05-15",774.0],["05-18",816.0],["05-19",806.0],["05-20",850.0],["05-21",843.0],["05-22",829.0],["05-26",837.0],["05-27",831.0],["05-28",836.0],["05-29",840.0],["06-01",836.0],["06-02",846.0],["06-03",828.0],["06-04",833.0],["06-05",835.0],["06-08",832.0],["06-09",823.0],["06-10",839.0],["06-11",825.0],["06-12",824.0],["06-15",805.0],["06-16",830.0],["06-17",816.0],["06-18",817.0],["06-19",805.0],["06-22",809.0],["06-23",825.0],["06-24",826.0],["06-25",807.0],["06-26",802.0],["06-29",812.0],["06-30",810.0],["07-01",825.0],["07-02",822.0],["07-03",812.0],["07-06",819.0],["07-07",822.0],["07-08",840.0],["07-09",858.0],["07-10",842.0],["07-13",838.0],["07-14",823.0],["07-15",833.0],["07-16",827.0],["07-17",825.0],["07-20",842.0],["07-21",852.0],["07-22",878.0],["07-23",928.0],["07-24",917.0],["07-27",941.0],["07-28",926.0],["07-29",945.0],["07-30",908.0],["07-31",908.0],["08-03",906.0],["08-04",923.0],["08-05",953.0],["08-06",977.0],["08-07",974.0],["08-10",972.0],["08-11",952.0],["08-12",938.0],["08-13",940.0],["08-14",945.0],["08-17",955.0],["08-18",972.0],["08-19",952.0],["08-20",931.0],["08-21",912.0],["08-24",926.0],["08-25",922.0],["08-26",922.0],["08-27",933.0],["08-28",930.0],["09-01",950.0],["09-02",936.0],["09-03",913.0],["09-04",905.0],["09-07",906.0],["09-08",909.0],["09-09",911.0],["09-10",923.0],["09-11",930.0],["09-14",940.0],["09-15",965.0],["09-16",981.0],["09-17",951.0],["09-18",943.0],["09-21",925.0],["09-22",886.0],["09-23",854.0],["09-24",839.0],["09-25",857.0],["09-28",853.0],["09-29",874.0],["09-30",872.0],["10-01",899.0],["10-02",894.0],["10-05",881.0],["10-06",889.0],["10-07",864.0],["10-08",866.0],["10-09",879.0],["10-12",888.0],["10-13",871.0],["10-14",876.0],["10-15",855.0],["10-16",863.0],["10-19",872.0],["10-20",855.0],["10-21",876.0],["10-22",892.0],["10-23",892.0],["10-26",891.0],["10-27",873.0],["10-28",874.0],["10-29",866.0],["10-30",856.0],["11-02",858.0],["11-03",872.0],["11-04",860.0],["11-05",888.0],["11-06",901.0],["11-09",904.0],["11-10",875.0],["11-11",887.0],["11-12",873.0],["11-13",890.0],["11-16",907.0],["11-17",926.0],["11-18",934.0],["11-19",940.0],["11-20",951.0],["11-23",950.0],["11-24",937.0],["11-25",964.0],["11-26",963.0],["11-27",958.0],["11-30",963.0],["12-01",982.0],["12-02",1004.0],["12-03",1022.0],["12-04",1048.0],["12-07",1028.0],["12-08",1022.0],["12-09",1026.0],["12-10",1010.0],["12-11",1022.0],["12-14",1016.0],["12-15",1022.0],["12-16",1048.0],["12-17",1050.0],["12-18",1038.0],["12-21",1016.0],["12-22",1004.0],["12-23",1014.0],["12-24",1021.0],["12-29",1041.0],["12-30",1062.0],["12-31",1075.0]],"Silver":[["01-02",17.93],["01-03",18.21],["01-06",18.44],["01-07",18.14],["01-08",18.42],["01-09",17.91],["01-10",17.91],["01-13",17.98],["01-14",17.77],["01-15",17.85],["01-16",18.01],["01-17",18.06],["01-20",18.05],["01-21",17.98],["01-22",17.77],["01-23",17.6],["01-24",17.83],["01-27",18.3],["01-28",17.98],["01-29",17.47],["01-30",17.73],["01-31",17.89],["02-03",17.77],["02-04",17.73],["02-05",17.62],["02-06",17.77],["02-07",17.77],["02-10",17.79],["02-11",17.7],["02-12",17.56],["02-13",17.64],["02-14",17.7],["02-17",17.8],["02-18",17.89],["02-19",18.34],["02-20",18.39],["02-21",18.56],["02-24",18.77],["02-25",18.33],["02-26",18.07],["02-27",18.05],["02-28",17.18],["03-02",16.91],["03-03",16.81],["03-04",17.25],["03-05",17.2],["03-06",17.48],["03-09",16.89],["03-10",17.07],["03-11",17.02],["03-12",16.52],["03-13",15.77],["03-16",12.96],["03-17",12.44],["03-18",12.42],["03-19",12.01],["03-20",12.63],["03-23",12.51],["03-24",13.62],["03-25",13.96],["03-26",14.41],["03-27",14.31],["03-30",14.05],["03-31",13.93],["04-01",14.02],["04-02",14.18],["04-03",14.39],["04-06",14.55],["04-07",15.07],["04-08",15.06],["04-09",15.18],["04-14",15.51],["04-15",15.57],["04-16",15.5],["04-17",15.16],["04-20",15.15],["04-21",14.97],["04-22",14.91],["04-23",15.3],["04-24",15.31],["04-27",15.21],["04-28",15.14],["04-29",15.16],["04-30",15.34],["05-01",14.85],["05-04",14.93],["05-05",14.75],["05-06",15.07],["05-07",14.98],["05-11",15.45],["05-12",15.48],["05-13",15.56],["05-14",15.53],["05-15",16.25],["05-18",17.35],["05-19",17.12],["05-20",17.47],["05-21",17.2],["05-22",17.0],["05-26",17.3],["05-27",17.19],["05-28",17.34],["05-29",17.59],["06-01",18.16],["06-02",18.27],["06-03",17.86],["06-04",17.75],["06-05",17.58],["06-08",17.63],["06-09",17.63],["06-10",17.71],["06-11",17.88],["06-12",17.62],["06-15",17.09],["06-16",17.41],["06-17",17.47],["06-18",17.61],["06-19",17.52],["06-22",17.86],["06-23",17.81],["06-24",17.86],["06-25",17.53],["06-26",17.83],["06-29",17.91],["06-30",17.84],["07-01",18.22],["07-02",17.93],["07-03",18.02],["07-06",18.25],["07-07",18.02],["07-08",18.48],["07-09",18.84],["07-10",18.77],["07-13",19.09],["07-14",18.89],["07-15",19.33],["07-16",19.25],["07-17",19.16],["07-20",19.44],["07-21",20.55],["07-22",22.25],["07-23",22.86],["07-24",22.48],["07-27",24.38],["07-28",23.55],["07-29",24.34],["07-30",23.16],["07-31",24.07],["08-03",24.23],["08-04",24.33],["08-05",26.95],["08-06",27.89],["08-07",28.33],["08-10",28.27],["08-11",28.28],["08-12",25.81],["08-13",26.25],["08-14",26.7],["08-17",26.91],["08-18",28.32],["08-19",27.44],["08-20",26.91],["08-21",26.85],["08-24",26.89],["08-25",26.5],["08-26",26.39],["08-27",27.25],["08-28",27.35],["09-01",28.89],["09-02",27.7],["09-03",26.9],["09-04",26.82],["09-07",26.83],["09-08",26.68],["09-09",26.54],["09-10",27.11],["09-11",26.88],["09-14",26.89],["09-15",27.55],["09-16",27.38],["09-17",26.75],["09-18",27.06],["09-21",26.36],["09-22",24.3],["09-23",23.59],["09-24",22.22],["09-25",22.63],["09-28",22.89],["09-29",23.84],["09-30",23.73],["10-01",23.62],["10-02",23.86],["10-05",23.91],["10-06",24.3],["10-07",23.53],["10-08",23.96],["10-09",24.32],["10-12",25.06],["10-13",24.93],["10-14",24.18],["10-15",23.93],["10-16",24.36],["10-19",24.84],["10-20",24.63],["10-21",25.02],["10-22",24.91],["10-23",24.76],["10-26",24.28],["10-27",24.43],["10-28",23.93],["10-29",23.02],["10-30",23.62],["11-02",23.98],["11-03",24.17],["11-04",23.98],["11-05",24.57],["11-06",25.78],["11-09",25.11],["11-10",24.2],["11-11",24.21],["11-12",24.21],["11-13",24.25],["11-16",24.27],["11-17",24.63],["11-18",24.32],["11-19",23.98],["11-20",24.16],["11-23",23.91],["11-24",23.16],["11-25",23.41],["11-26",23.36],["11-27",23.14],["11-30",22.15],["12-01",23.54],["12-02",23.98],["12-03",24.17],["12-04",24.23],["12-07",23.75],["12-08",24.48],["12-09",24.09],["12-10",23.89],["12-11",23.82],["12-14",23.86],["12-15",24.21],["12-16",25.13],["12-17",25.74],["12-18",25.82],["12-21",26.16],["12-22",25.77],["12-23",25.32],["12-24",25.78],["12-29",26.15],["12-30",26.3],["12-31",26.48]]},"2021":{"Gold":[["01-04",1930.8],["01-05",1946.55],["01-06",1957.2],["01-07",1911.05],["01-08",1891.3],["01-11",1847.8],["01-12",1861.85],["01-13",1852.4],["01-14",1840.25],["01-15",1853.85],["01-18",1833.95],["01-19",1843.1],["01-20",1854.6],["01-21",1867.65],["01-22",1853.6],["01-25",1855.6],["01-26",1853.2],["01-27",1846.4],["01-28",1839.65],["01-29",1852.7],["02-01",1857.8],["02-02",1847.1],["02-03",1834.7],["02-04",1811.55],["02-05",1808.55],["02-08",1811.65],["02-09",1846.55],["02-10",1843.45],["02-11",1841.7],["02-12",1818.0],["02-15",1817.45],["02-16",1823.45],["02-17",1788.85],["02-18",1782.8],["02-19",1773.75],["02-22",1798.8],["02-23",1809.5],["02-24",1807.25],["02-25",1792.1],["02-26",1765.1],["03-01",1746.95],["03-02",1728.5],["03-03",1727.05],["03-04",1710.05],["03-05",1696.05],["03-08",1694.45],["03-09",1702.85],["03-10",1711.5],["03-11",1736.35],["03-12",1703.85],["03-15",1727.9],["03-16",1732.3],["03-17",1736.95],["03-18",1734.1],["03-19",1737.2],["03-22",1733.4],["03-23",1739.25],["03-24",1734.05],["03-25",1729.2],["03-26",1727.85],["03-29",1723.95],["03-30",1696.7],["03-31",1685.35],["04-01",1715.85],["04-06",1731.05],["04-07",1736.0],["04-08",1743.7],["04-09",1747.95],["04-12",1741.55],["04-13",1728.1],["04-14",1743.3],["04-15",1748.0],["04-16",1766.45],["04-19",1788.4],["04-20",1765.5],["04-21",1781.05],["04-22",1785.65],["04-23",1785.3],["04-26",1779.65],["04-27",1780.9],["04-28",1764.15],["04-29",1774.65],["04-30",1768.8],["05-04",1784.95],["05-05",1778.05],["05-06",1793.15],["05-07",1820.5],["05-10",1834.15],["05-11",1837.15],["05-12",1833.6],["05-13",1814.3],["05-14",1833.5],["05-17",1848.45],["05-18",1867.4],["05-19",1860.0],["05-20",1869.35],["05-21",1877.65],["05-24",1876.85],["05-25",1882.8],["05-26",1904.3],["05-27",1895.05],["05-28",1892.45],["06-01",1907.7],["06-02",1895.9],["06-03",1892.15],["06-04",1869.55],["06-07",1882.05],["06-08",1892.05],["06-09",1890.45],["06-10",1882.0],["06-11",1891.95],["06-14",1859.75],["06-15",1863.85],["06-16",1858.1],["06-17",1806.75],["06-18",1792.35],["06-21",1782.45],["06-22",1779.1],["06-23",1782.9],["06-24",1780.2],["06-25",1783.25],["06-28",1774.25],["06-29",1769.6],["06-30",1757.8],["07-01",1774.0],["07-02",1783.5],["07-05",1790.95],["07-06",1807.8],["07-07",1804.25],["07-08",1810.25],["07-09",1803.4],["07-12",1802.95],["07-13",1807.85],["07-14",1813.05],["07-15",1832.0],["07-16",1822.0],["07-19",1803.25],["07-20",1815.3],["07-21",1805.9],["07-22",1797.4],["07-23",1803.05],["07-26",1808.15],["07-27",1797.15],["07-28",1799.3],["07-29",1819.45],["07-30",1828.25],["08-02",1807.55],["08-03",1809.7],["08-04",1812.45],["08-05",1811.2],["08-06",1799.45],["08-09",1741.5],["08-10",1729.55],["08-11",1734.05],["08-12",1755.5],["08-13",1757.65],["08-16",1775.75],["08-17",1794.05],["08-18",1788.1],["08-19",1788.2],["08-20",1782.95],["08-23",1786.9],["08-24",1802.95],["08-25",1794.7],["08-26",1783.8],["08-27",1795.5],["08-31",1814.3],["09-01",1813.9],["09-02",1815.15],["09-03",1812.05],["09-06",1823.85],["09-07",1810.75],["09-08",1797.95],["09-09",1795.35],["09-10",1799.9],["09-13",1787.85],["09-14",1788.65],["09-15",1801.4],["09-16",1781.45],["09-17",1766.1],["09-20",1757.15],["09-21",1766.45],["09-22",1775.35],["09-23",1771.05],["09-24",1755.15],["09-27",1749.15],["09-28",1739.65],["09-29",1741.65],["09-30",1730.95],["10-01",1755.6],["10-04",1751.85],["10-05",1758.0],["10-06",1748.25],["10-07",1758.55],["10-08",1757.5],["10-11",1752.55],["10-12",1759.1],["10-13",1767.45],["10-14",1797.15],["10-15",1781.45],["10-18",1762.45],["10-19",1779.4],["10-20",1778.15],["10-21",1785.3],["10-22",1792.3],["10-25",1799.2],["10-26",1801.9],["10-27",1783.85],["10-28",1798.2],["10-29",1796.3],["11-01",1786.55],["11-02",1791.5],["11-03",1781.85],["11-04",1778.1],["11-05",1793.2],["11-08",1818.0],["11-09",1824.4],["11-10",1824.95],["11-11",1859.25],["11-12",1850.0],["11-15",1863.8],["11-16",1872.25],["11-17",1858.45],["11-18",1860.5],["11-19",1861.4],["11-22",1841.1],["11-23",1797.3],["11-24",1790.8],["11-25",1790.65],["11-26",1809.8],["11-29",1795.0],["11-30",1797.6],["12-01",1786.8],["12-02",1775.7],["12-03",1773.5],["12-06",1781.25],["12-07",1779.65],["12-08",1789.8],["12-09",1783.4],["12-10",1771.9],["12-13",1784.45],["12-14",1782.35],["12-15",1769.4],["12-16",1785.15],["12-17",1807.5],["12-20",1797.4],["12-21",1795.85],["12-22",1789.9],["12-23",1805.55],["12-24",1786.05],["12-29",1796.35],["12-30",1799.25],["12-31",1820.1]],"Palladium":[["01-04",2419.0],["01-05",2381.0],["01-06",2462.0],["01-07",2430.0],["01-08",2408.0],["01-11",2360.0],["01-12",2382.0],["01-13",2391.0],["01-14",2385.0],["01-15",2392.0],["01-18",2376.0],["01-19",2384.0],["01-20",2370.0],["01-21",2387.0],["01-22",2363.0],["01-25",2368.0],["01-26",2325.0],["01-27",2318.0],["01-28",2301.0],["01-29",2330.0],["02-01",2278.0],["02-02",2267.0],["02-03",2244.0],["02-04",2257.0],["02-05",2318.0],["02-08",2348.0],["02-09",2351.0],["02-10",2350.0],["02-11",2369.0],["02-12",2352.0],["02-15",2403.0],["02-16",2393.0],["02-17",2370.0],["02-18",2375.0],["02-19",2351.0],["02-22",2382.0],["02-23",2385.0],["02-24",2367.0],["02-25",2427.0],["02-26",2379.0],["03-01",2344.0],["03-02",2338.0],["03-03",2350.0],["03-04",2341.0],["03-05",2338.0],["03-08",2332.0],["03-09",2316.0],["03-10",2300.0],["03-11",2330.0],["03-12",2338.0],["03-15",2375.0],["03-16",2389.0],["03-17",2490.0],["03-18",2612.0],["03-19",2607.0],["03-22",2634.0],["03-23",2585.0],["03-24",2627.0],["03-25",2639.0],["03-26",2634.0],["03-29",2625.0],["03-30",2556.0],["03-31",2627.0],["04-01",2630.0],["04-06",2674.0],["04-07",2628.0],["04-08",2614.0],["04-09",2626.0],["04-12",2638.0],["04-13",2701.0],["04-14",2688.0],["04-15",2724.0],["04-16",2740.0],["04-19",2810.0],["04-20",2784.0],["04-21",2778.0],["04-22",2838.0],["04-23",2852.0],["04-26",2888.0],["04-27",2946.0],["04-28",2929.0],["04-29",2929.0],["04-30",2983.0],["05-04",2987.0],["05-05",2997.0],["05-06",2945.0],["05-07",2929.0],["05-10",2953.0],["05-11",2975.0],["05-12",2939.0],["05-13",2860.0],["05-14",2918.0],["05-17",2901.0],["05-18",2928.0],["05-19",2881.0],["05-20",2862.0],["05-21",2832.0],["05-24",2798.0],["05-25",2733.0],["05-26",2782.0],["05-27",2767.0],["05-28",2828.0],["06-01",2866.0],["06-02",2843.0],["06-03",2846.0],["06-04",2833.0],["06-07",2842.0],["06-08",2814.0],["06-09",2795.0],["06-10",2763.0],["06-11",2769.0],["06-14",2765.0],["06-15",2752.0],["06-16",2761.0],["06-17",2765.0],["06-18",2558.0],["06-21",2508.0],["06-22",2578.0],["06-23",2599.0],["06-24",2614.0],["06-25",2644.0],["06-28",2639.0],["06-29",2668.0],["06-30",2673.0],["07-01",2761.0],["07-02",2779.0],["07-05",2795.0],["07-06",2839.0],["07-07",2833.0],["07-08",2831.0],["07-09",2815.0],["07-12",2800.0],["07-13",2838.0],["07-14",2824.0],["07-15",2808.0],["07-16",2712.0],["07-19",2621.0],["07-20",2600.0],["07-21",2663.0],["07-22",2665.0],["07-23",2705.0],["07-26",2673.0],["07-27",2623.0],["07-28",2609.0],["07-29",2646.0],["07-30",2648.0],["08-02",2664.0],["08-03",2678.0],["08-04",2651.0],["08-05",2661.0],["08-06",2654.0],["08-09",2620.0],["08-10",2601.0],["08-11",2637.0],["08-12",2632.0],["08-13",2606.0],["08-16",2613.0],["08-17",2586.0],["08-18",2511.0],["08-19",2378.0],["08-20",2311.0],["08-23",2320.0],["08-24",2438.0],["08-25",2434.0],["08-26",2407.0],["08-27",2420.0],["08-31",2484.0],["09-01",2479.0],["09-02",2444.0],["09-03",2416.0],["09-06",2426.0],["09-07",2396.0],["09-08",2357.0],["09-09",2255.0],["09-10",2216.0],["09-13",2138.0],["09-14",2058.0],["09-15",1968.0],["09-16",2032.0],["09-17",2045.0],["09-20",1989.0],["09-21",1906.0],["09-22",1947.0],["09-23",2067.0],["09-24",1998.0],["09-27",1977.0],["09-28",1946.0],["09-29",1900.0],["09-30",1889.0],["10-01",1892.0],["10-04",1900.0],["10-05",1918.0],["10-06",1894.0],["10-07",1902.0],["10-08",1996.0],["10-11",2174.0],["10-12",2119.0],["10-13",2081.0],["10-14",2180.0],["10-15",2140.0],["10-18",2037.0],["10-19",2081.0],["10-20",2096.0],["10-21",2068.0],["10-22",2015.0],["10-25",2032.0],["10-26",2034.0],["10-27",1985.0],["10-28",1980.0],["10-29",1999.0],["11-01",1978.0],["11-02",2040.0],["11-03",2011.0],["11-04",2041.0],["11-05",2026.0],["11-08",2030.0],["11-09",2097.0],["11-10",2008.0],["11-11",2050.0],["11-12",2030.0],["11-15",2088.0],["11-16",2178.0],["11-17",2154.0],["11-18",2151.0],["11-19",2120.0],["11-22",2060.0],["11-23",1948.0],["11-24",1877.0],["11-25",1872.0],["11-26",1812.0],["11-29",1786.0],["11-30",1753.0],["12-01",1745.0],["12-02",1739.0],["12-03",1807.0],["12-06",1780.0],["12-07",1863.0],["12-08",1844.0],["12-09",1844.0],["12-10",1786.0],["12-13",1763.0],["12-14",1687.0],["12-15",1608.0],["12-16",1660.0],["12-17",1769.0],["12-20",1723.0],["12-21",1810.0],["12-22",1830.0],["12-23",1881.0],["12-29",1965.0],["12-30",1978.0],["12-31",1928.0]],"Platinum":[["01-04",1101.0],["01-05",1073.0],["01-06",1106.0],["01-07",1099.0],["01-08",1104.0],["01-11",1043.0],["01-12",1064.0],["01-13",1075.0],["01-14",1109.0],["01-15",1095.0],["01-18",1079.0],["01-19",1100.0],["01-20",1096.0],["01-21",1121.0],["01-22",1101.0],["01-25",1106.0],["01-26",1087.0],["01-27",1087.0],["01-28",1057.0],["01-29",1087.0],["02-01",1116.0],["02-02",1102.0],["02-03",1094.0],["02-04",1084.0],["02-05",1113.0],["02-08",1149.0],["02-09",1182.0],["02-10",1215.0],["02-11",1253.0],["02-12",1227.0],["02-15",1284.0],["02-16",1306.0],["02-17",1228.0],["02-18",1267.0],["02-19",1271.0],["02-22",1272.0],["02-23",1249.0],["02-24",1263.0],["02-25",1253.0],["02-26",1209.0],["03-01",1206.0],["03-02",1184.0],["03-03",1206.0],["03-04",1154.0],["03-05",1119.0],["03-08",1127.0],["03-09",1170.0],["03-10",1168.0],["03-11",1223.0],["03-12",1173.0],["03-15",1217.0],["03-16",1206.0],["03-17",1210.0],["03-18",1208.0],["03-19",1198.0],["03-22",1172.0],["03-23",1173.0],["03-24",1184.0],["03-25",1167.0],["03-26",1161.0],["03-29",1172.0],["03-30",1179.0],["03-31",1174.0],["04-01",1189.0],["04-06",1206.0],["04-07",1238.0],["04-08",1229.0],["04-09",1213.0],["04-12",1186.0],["04-13",1171.0],["04-14",1180.0],["04-15",1191.0],["04-16",1196.0],["04-19",1219.0],["04-20",1201.0],["04-21",1188.0],["04-22",1203.0],["04-23",1215.0],["04-26",1236.0],["04-27",1241.0],["04-28",1226.0],["04-29",1215.0],["04-30",1209.0],["05-04",1238.0],["05-05",1229.0],["05-06",1235.0],["05-07",1250.0],["05-10",1265.0],["05-11",1248.0],["05-12",1235.0],["05-13",1211.0],["05-14",1228.0],["05-17",1231.0],["05-18",1237.0],["05-19",1216.0],["05-20",1205.0],["05-21",1193.0],["05-24",1164.0],["05-25",1182.0],["05-26",1202.0],["05-27",1190.0],["05-28",1182.0],["06-01",1187.0],["06-02",1187.0],["06-03",1187.0],["06-04",1153.0],["06-07",1165.0],["06-08",1168.0],["06-09",1157.0],["06-10",1141.0],["06-11",1156.0],["06-14",1148.0],["06-15",1158.0],["06-16",1151.0],["06-17",1114.0],["06-18",1080.0],["06-21",1040.0],["06-22",1060.0],["06-23",1086.0],["06-24",1081.0],["06-25",1100.0],["06-28",1106.0],["06-29",1077.0],["06-30",1054.0],["07-01",1084.0],["07-02",1094.0],["07-05",1102.0],["07-06",1110.0],["07-07",1093.0],["07-08",1077.0],["07-09",1081.0],["07-12",1095.0],["07-13",1118.0],["07-14",1114.0],["07-15",1144.0],["07-16",1136.0],["07-19",1086.0],["07-20",1078.0],["07-21",1075.0],["07-22",1080.0],["07-23",1087.0],["07-26",1060.0],["07-27",1053.0],["07-28",1057.0],["07-29",1077.0],["07-30",1057.0],["08-02",1053.0],["08-03",1054.0],["08-04",1045.0],["08-05",1018.0],["08-06",1002.0],["08-09",976.0],["08-10",989.0],["08-11",1003.0],["08-12",1015.0],["08-13",1020.0],["08-16",1012.0],["08-17",1024.0],["08-18",1006.0],["08-19",971.0],["08-20",978.0],["08-23",1017.0],["08-24",1015.0],["08-25",1000.0],["08-26",992.0],["08-27",990.0],["08-31",1010.0],["09-01",1014.0],["09-02",1000.0],["09-03",1005.0],["09-06",1029.0],["09-07",1014.0],["09-08",1001.0],["09-09",983.0],["09-10",987.0],["09-13",954.0],["09-14",956.0],["09-15",935.0],["09-16",942.0],["09-17",949.0],["09-20",928.0],["09-21",925.0],["09-22",970.0],["09-23",1010.0],["09-24",983.0],["09-27",986.0],["09-28",977.0],["09-29",967.0],["09-30",958.0],["10-01",964.0],["10-04",955.0],["10-05",960.0],["10-06",947.0],["10-07",986.0],["10-08",992.0],["10-11",1034.0],["10-12",1014.0],["10-13",1015.0],["10-14",1033.0],["10-15",1057.0],["10-18",1049.0],["10-19",1055.0],["10-20",1044.0],["10-21",1051.0],["10-22",1063.0],["10-25",1044.0],["10-26",1050.0],["10-27",1016.0],["10-28",1016.0],["10-29",1016.0],["11-01",1034.0],["11-02",1058.0],["11-03",1045.0],["11-04",1045.0],["11-05",1031.0],["11-08",1037.0],["11-09",1059.0],["11-10",1055.0],["11-11",1084.0],["11-12",1070.0],["11-15",1077.0],["11-16",1106.0],["11-17",1067.0],["11-18",1066.0],["11-19",1050.0],["11-22",1038.0],["11-23",1001.0],["11-24",984.0],["11-25",994.0],["11-26",972.0],["11-29",972.0],["11-30",947.0],["12-01",953.0],["12-02",941.0],["12-03",944.0],["12-06",934.0],["12-07",956.0],["12-08",963.0],["12-09",948.0],["12-10",942.0],["12-13",942.0],["12-14",928.0],["12-15",911.0],["12-16",929.0],["12-17",934.0],["12-20",924.0],["12-21",943.0],["12-22",939.0],["12-23",973.0],["12-29",971.0],["12-30",967.0],["12-31",962.0]],"Silver":[["01-04",27.27],["01-05",27.51],["01-06",27.52],["01-07",27.13],["01-08",26.64],["01-11",25.02],["01-12",25.52],["01-13",25.34],["01-14",25.25],["01-15",25.25],["01-18",24.86],["01-19",25.3],["01-20",25.3],["01-21",25.86],["01-22",25.32],["01-25",25.64],["01-26",25.4],["01-27",25.18],["01-28",25.2],["01-29",27.41],["02-01",29.59],["02-02",27.32],["02-03",26.8],["02-04",26.4],["02-05",26.53],["02-08",27.18],["02-09",27.64],["02-10",27.23],["02-11",27.12],["02-12",27.07],["02-15",27.57],["02-16",27.57],["02-17",27.11],["02-18",27.16],["02-19",26.95],["02-22",27.45],["02-23",27.96],["02-24",27.75],["02-25",27.93],["02-26",26.68],["03-01",26.89],["03-02",26.26],["03-03",26.59],["03-04",25.95],["03-05",25.36],["03-08",25.16],["03-09",25.75],["03-10",25.64],["03-11",26.25],["03-12",25.48],["03-15",26.1],["03-16",26.08],["03-17",25.85],["03-18",26.13],["03-19",26.18],["03-22",25.74],["03-23",25.62],["03-24",25.2],["03-25",24.67],["03-26",25.05],["03-29",24.83],["03-30",24.34],["03-31",24.0],["04-01",24.32],["04-06",25.04],["04-07",24.98],["04-08",25.33],["04-09",25.23],["04-12",25.16],["04-13",24.95],["04-14",25.33],["04-15",25.59],["04-16",26.14],["04-19",26.11],["04-20",25.88],["04-21",25.91],["04-22",26.3],["04-23",26.12],["04-26",26.11],["04-27",26.29],["04-28",25.87],["04-29",26.29],["04-30",25.88],["05-04",26.82],["05-05",26.3],["05-06",26.73],["05-07",27.38],["05-10",27.73],["05-11",27.48],["05-12",27.41],["05-13",26.82],["05-14",27.23],["05-17",27.61],["05-18",28.48],["05-19",27.68],["05-20",27.74],["05-21",27.8],["05-24",27.64],["05-25",27.55],["05-26",28.12],["05-27",27.66],["05-28",27.63],["06-01",28.21],["06-02",27.75],["06-03",27.75],["06-04",27.36],["06-07",27.58],["06-08",27.71],["06-09",27.58],["06-10",27.66],["06-11",28.14],["06-14",27.73],["06-15",27.62],["06-16",27.71],["06-17",26.59],["06-18",26.39],["06-21",25.95],["06-22",25.97],["06-23",25.95],["06-24",25.99],["06-25",26.13],["06-28",26.09],["06-29",25.95],["06-30",25.77],["07-01",26.26],["07-02",26.17],["07-05",26.55],["07-06",26.61],["07-07",26.39],["07-08",26.11],["07-09",26.01],["07-12",25.93],["07-13",26.11],["07-14",26.17],["07-15",26.2],["07-16",26.11],["07-19",25.32],["07-20",25.09],["07-21",25.11],["07-22",25.07],["07-23",25.16],["07-26",25.36],["07-27",25.11],["07-28",24.8],["07-29",25.45],["07-30",25.49],["08-02",25.41],["08-03",25.46],["08-04",25.67],["08-05",25.45],["08-06",24.98],["08-09",23.84],["08-10",23.39],["08-11",23.41],["08-12",23.41],["08-13",23.39],["08-16",23.54],["08-17",23.9],["08-18",23.67],["08-19",23.34],["08-20",23.2],["08-23",23.43],["08-24",23.76],["08-25",23.75],["08-26",23.68],["08-27",23.61],["08-31",24.05],["09-01",23.92],["09-02",24.16],["09-03",24.05],["09-06",24.7],["09-07",24.25],["09-08",24.32],["09-09",24.14],["09-10",24.02],["09-13",23.58],["09-14",23.6],["09-15",23.84],["09-16",23.47],["09-17",23.01],["09-20",22.39],["09-21",22.55],["09-22",22.73],["09-23",22.74],["09-24",22.66],["09-27",22.55],["09-28",22.2],["09-29",22.32],["09-30",21.52],["10-01",22.09],["10-04",22.31],["10-05",22.48],["10-06",22.3],["10-07",22.69],["10-08",22.55],["10-11",22.52],["10-12",22.64],["10-13",22.89],["10-14",23.34],["10-15",23.24],["10-18",23.22],["10-19",23.73],["10-20",23.95],["10-21",24.23],["10-22",24.31],["10-25",24.38],["10-26",24.32],["10-27",23.95],["10-28",24.07],["10-29",24.01],["11-01",23.86],["11-02",23.86],["11-03",23.58],["11-04",23.73],["11-05",23.82],["11-08",24.28],["11-09",24.38],["11-10",24.18],["11-11",24.98],["11-12",24.95],["11-15",25.21],["11-16",25.27],["11-17",25.04],["11-18",24.97],["11-19",24.79],["11-22",24.69],["11-23",23.82],["11-24",23.5],["11-25",23.69],["11-26",23.63],["11-29",23.23],["11-30",22.86],["12-01",22.86],["12-02",22.39],["12-03",22.35],["12-06",22.34],["12-07",22.43],["12-08",22.43],["12-09",22.25],["12-10",21.89],["12-13",22.22],["12-14",22.17],["12-15",21.8],["12-16",22.18],["12-17",22.64],["12-20",22.3],["12-21",22.75],["12-22",22.66],["12-23",22.82],["12-24",22.66],["12-29",22.84],["12-30",22.77],["12-31",23.09]]},"2022":{"Gold":[["01-04",1809.05],["01-05",1818.5],["01-06",1804.95],["01-07",1792.2],["01-10",1800.55],["01-11",1805.2],["01-12",1816.4],["01-13",1822.4],["01-14",1822.25],["01-17",1820.05],["01-18",1810.8],["01-19",1817.5],["01-20",1836.7],["01-21",1834.25],["01-24",1838.25],["01-25",1835.65],["01-26",1845.2],["01-27",1815.5],["01-28",1790.2],["01-31",1790.6],["02-01",1806.5],["02-02",1802.0],["02-03",1803.75],["02-04",1814.55],["02-07",1811.15],["02-08",1821.0],["02-09",1828.1],["02-10",1832.3],["02-11",1826.25],["02-14",1855.8],["02-15",1855.1],["02-16",1854.4],["02-17",1886.55],["02-18",1886.95],["02-21",1895.45],["02-22",1895.0],["02-23",1895.7],["02-24",1968.35],["02-25",1912.15],["02-28",1903.3],["03-01",1920.45],["03-02",1926.0],["03-03",1935.4],["03-04",1943.8],["03-07",1999.25],["03-08",2007.0],["03-09",2017.15],["03-10",1997.65],["03-11",1991.45],["03-14",1961.6],["03-15",1928.75],["03-16",1918.75],["03-17",1941.4],["03-18",1932.9],["03-21",1925.05],["03-22",1929.35],["03-23",1932.15],["03-24",1945.9],["03-25",1956.65],["03-28",1927.0],["03-29",1911.05],["03-30",1917.8],["03-31",1924.1],["04-01",1933.35],["04-04",1927.1],["04-05",1929.45],["04-06",1929.0],["04-07",1926.4],["04-08",1931.2],["04-11",1956.85],["04-12",1951.4],["04-13",1975.25],["04-14",1970.6],["04-19",1975.95],["04-20",1947.55],["04-21",1945.95],["04-22",1942.0],["04-25",1918.7],["04-26",1903.4],["04-27",1896.15],["04-28",1890.0],["04-29",1915.45],["05-03",1857.9],["05-04",1868.7],["05-05",1895.2],["05-06",1884.3],["05-09",1865.4],["05-10",1862.25],["05-11",1851.75],["05-12",1850.75],["05-13",1824.2],["05-16",1805.8],["05-17",1828.05],["05-18",1818.5],["05-19",1825.55],["05-20",1846.3],["05-23",1864.3],["05-24",1858.6],["05-25",1859.05],["05-26",1845.15],["05-27",1858.95],["05-30",1857.25],["05-31",1854.4],["06-01",1829.7],["06-06",1851.5],["06-07",1846.8],["06-08",1848.35],["06-09",1849.25],["06-10",1843.35],["06-13",1855.95],["06-14",1823.65],["06-15",1823.15],["06-16",1831.55],["06-17",1849.85],["06-20",1841.2],["06-21",1836.5],["06-22",1827.3],["06-23",1831.4],["06-24",1826.5],["06-27",1838.05],["06-28",1827.0],["06-29",1811.85],["06-30",1813.6],["07-01",1795.65],["07-04",1807.05],["07-05",1804.4],["07-06",1766.65],["07-07",1743.45],["07-08",1737.05],["07-11",1737.4],["07-12",1734.35],["07-13",1728.9],["07-14",1716.15],["07-15",1702.55],["07-18",1723.65],["07-19",1712.95],["07-20",1712.65],["07-21",1686.55],["07-22",1725.0],["07-25",1731.95],["07-26",1719.85],["07-27",1723.95],["07-28",1746.6],["07-29",1758.9],["08-01",1766.75],["08-02",1772.9],["08-03",1766.6],["08-04",1777.9],["08-05",1786.75],["08-08",1775.7],["08-09",1790.6],["08-10",1793.5],["08-11",1789.7],["08-12",1788.45],["08-15",1781.45],["08-16",1776.15],["08-17",1773.65],["08-18",1765.6],["08-19",1752.9],["08-22",1732.8],["08-23",1739.45],["08-24",1752.0],["08-25",1762.4],["08-26",1752.1],["08-30",1734.0],["08-31",1712.4],["09-01",1706.0],["09-02",1706.9],["09-05",1711.95],["09-06",1712.5],["09-07",1705.05],["09-08",1720.25],["09-09",1726.95],["09-12",1726.5],["09-13",1727.05],["09-14",1703.8],["09-15",1689.0],["09-16",1664.3],["09-20",1667.9],["09-21",1674.45],["09-22",1671.85],["09-23",1661.45],["09-26",1647.0],["09-27",1632.6],["09-28",1618.2],["09-29",1646.6],["09-30",1672.75],["10-03",1660.8],["10-04",1709.15],["10-05",1712.15],["10-06",1716.0],["10-07",1711.5],["10-10",1680.05],["10-11",1664.15],["10-12",1672.3],["10-13",1676.4],["10-14",1655.15],["10-17",1658.0],["10-18",1652.25],["10-19",1640.7],["10-20",1633.2],["10-21",1624.55],["10-24",1646.35],["10-25",1642.85],["10-26",1670.8],["10-27",1663.3],["10-28",1649.25],["10-31",1638.85],["11-01",1652.55],["11-02",1656.45],["11-03",1620.65],["11-04",1648.8],["11-07",1679.9],["11-08",1670.8],["11-09",1705.15],["11-10",1705.65],["11-11",1764.75],["11-14",1757.35],["11-15",1775.1],["11-16",1783.2],["11-17",1764.55],["11-18",1764.75],["11-21",1739.65],["11-22",1747.0],["11-23",1735.75],["11-24",1755.25],["11-25",1753.55],["11-28",1762.9],["11-29",1755.35],["11-30",1759.65],["12-01",1779.6],["12-02",1800.75],["12-05",1794.35],["12-06",1773.35],["12-07",1771.85],["12-08",1782.45],["12-09",1793.0],["12-12",1790.6],["12-13",1785.15],["12-14",1808.2],["12-15",1775.95],["12-16",1780.15],["12-19",1796.5],["12-20",1806.35],["12-21",1813.5],["12-22",1815.2],["12-23",1797.4],["12-28",1802.65],["12-29",1805.4],["12-30",1812.35]],"Palladium":[["01-04",1869.0],["01-05",1911.0],["01-06",1850.0],["01-07",1890.0],["01-10",1938.0],["01-11",1915.0],["01-12",1913.0],["01-13",1888.0],["01-14",1883.0],["01-17",1890.0],["01-18",1878.0],["01-19",1893.0],["01-20",2045.0],["01-21",2074.0],["01-24",2104.0],["01-25",2174.0],["01-26",2244.0],["01-27",2362.0],["01-28",2276.0],["01-31",2418.0],["02-01",2385.0],["02-02",2376.0],["02-03",2363.0],["02-04",2341.0],["02-07",2248.0],["02-08",2239.0],["02-09",2248.0],["02-10",2290.0],["02-11",2241.0],["02-14",2308.0],["02-15",2284.0],["02-16",2274.0],["02-17",2318.0],["02-18",2316.0],["02-21",2360.0],["02-22",2379.0],["02-23",2349.0],["02-24",2620.0],["02-25",2470.0],["02-28",2491.0],["03-01",2565.0],["03-02",2651.0],["03-03",2750.0],["03-04",2791.0],["03-07",3339.0],["03-08",3057.0],["03-09",3018.0],["03-10",2937.0],["03-11",2958.0],["03-14",2555.0],["03-15",2426.0],["03-16",2495.0],["03-17",2461.0],["03-18",2571.0],["03-21",2531.0],["03-22",2545.0],["03-23",2565.0],["03-24",2495.0],["03-25",2490.0],["03-28",2257.0],["03-29",2241.0],["03-30",2160.0],["03-31",2204.0],["04-01",2275.0],["04-04",2325.0],["04-05",2301.0],["04-06",2251.0],["04-07",2214.0],["04-08",2256.0],["04-11",2516.0],["04-12",2323.0],["04-13",2366.0],["04-14",2368.0],["04-19",2404.0],["04-20",2388.0],["04-21",2465.0],["04-22",2390.0],["04-25",2303.0],["04-26",2168.0],["04-27",2179.0],["04-28",2250.0],["04-29",2303.0],["05-03",2229.0],["05-04",2286.0],["05-05",2252.0],["05-06",2150.0],["05-09",2072.0],["05-10",2093.0],["05-11",2052.0],["05-12",1985.0],["05-13",1926.0],["05-16",1934.0],["05-17",2016.0],["05-18",2096.0],["05-19",1990.0],["05-20",2018.0],["05-23",2013.0],["05-24",2012.0],["05-25",1995.0],["05-26",1994.0],["05-27",2029.0],["05-30",2081.0],["05-31",2070.0],["06-01",2012.0],["06-06",2010.0],["06-07",2010.0],["06-08",1972.0],["06-09",1941.0],["06-10",1920.0],["06-13",1895.0],["06-14",1823.0],["06-15",1833.0],["06-16",1865.0],["06-17",1881.0],["06-20",1832.0],["06-21",1870.0],["06-22",1875.0],["06-23",1869.0],["06-24",1880.0],["06-27",1924.0],["06-28",1893.0],["06-29",1899.0],["06-30",1981.0],["07-01",1907.0],["07-04",1955.0],["07-05",1919.0],["07-06",1948.0],["07-07",1928.0],["07-08",1999.0],["07-11",2148.0],["07-12",2145.0],["07-13",2002.0],["07-14",1958.0],["07-15",1895.0],["07-18",1887.0],["07-19",1872.0],["07-20",1860.0],["07-21",1870.0],["07-22",1897.0],["07-25",1995.0],["07-26",2016.0],["07-27",2023.0],["07-28",2085.0],["07-29",2103.0],["08-01",2158.0],["08-02",2186.0],["08-03",2069.0],["08-04",2058.0],["08-05",2100.0],["08-08",2149.0],["08-09",2208.0],["08-10",2206.0],["08-11",2264.0],["08-12",2260.0],["08-15",2196.0],["08-16",2133.0],["08-17",2156.0],["08-18",2161.0],["08-19",2149.0],["08-22",2085.0],["08-23",2021.0],["08-24",1990.0],["08-25",2045.0],["08-26",2140.0],["08-30",2143.0],["08-31",2096.0],["09-01",2087.0],["09-02",2051.0],["09-05",2032.0],["09-06",2040.0],["09-07",2003.0],["09-08",2052.0],["09-09",2151.0],["09-12",2182.0],["09-13",2200.0],["09-14",2106.0],["09-15",2140.0],["09-16",2090.0],["09-20",2170.0],["09-21",2184.0],["09-22",2151.0],["09-23",2128.0],["09-26",2087.0],["09-27",2049.0],["09-28",2063.0],["09-29",2146.0],["09-30",2227.0],["10-03",2190.0],["10-04",2260.0],["10-05",2314.0],["10-06",2251.0],["10-07",2260.0],["10-10",2182.0],["10-11",2183.0],["10-12",2150.0],["10-13",2138.0],["10-14",2113.0],["10-17",2012.0],["10-18",2009.0],["10-19",2007.0],["10-20",1981.0],["10-21",2027.0],["10-24",2021.0],["10-25",1962.0],["10-26",1960.0],["10-27",1974.0],["10-28",1926.0],["10-31",1908.0],["11-01",1889.0],["11-02",1902.0],["11-03",1832.0],["11-04",1822.0],["11-07",1892.0],["11-08",1860.0],["11-09",1927.0],["11-10",1843.0],["11-11",2024.0],["11-14",2007.0],["11-15",2065.0],["11-16",2096.0],["11-17",2046.0],["11-18",1976.0],["11-21",1879.0],["11-22",1890.0],["11-23",1883.0],["11-24",1895.0],["11-25",1865.0],["11-28",1870.0],["11-29",1850.0],["11-30",1882.0],["12-01",1893.0],["12-02",1900.0],["12-05",1918.0],["12-06",1867.0],["12-07",1848.0],["12-08",1856.0],["12-09",1929.0],["12-12",1929.0],["12-13",1894.0],["12-14",1929.0],["12-15",1873.0],["12-16",1798.0],["12-19",1731.0],["12-20",1687.0],["12-21",1707.0],["12-22",1723.0],["12-23",1658.0],["12-28",1784.0],["12-29",1775.0],["12-30",1788.0]],"Platinum":[["01-04",963.0],["01-05",982.0],["01-06",967.0],["01-07",974.0],["01-10",961.0],["01-11",945.0],["01-12",973.0],["01-13",972.0],["01-14",979.0],["01-17",971.0],["01-18",966.0],["01-19",991.0],["01-20",1045.0],["01-21",1046.0],["01-24",1036.0],["01-25",1021.0],["01-26",1048.0],["01-27",1034.0],["01-28",1006.0],["01-31",1015.0],["02-01",1037.0],["02-02",1039.0],["02-03",1030.0],["02-04",1028.0],["02-07",1014.0],["02-08",1012.0],["02-09",1036.0],["02-10",1028.0],["02-11",1029.0],["02-14",1027.0],["02-15",1023.0],["02-16",1032.0],["02-17",1082.0],["02-18",1092.0],["02-21",1080.0],["02-22",1083.0],["02-23",1079.0],["02-24",1119.0],["02-25",1055.0],["02-28",1063.0],["03-01",1059.0],["03-02",1064.0],["03-03",1089.0],["03-04",1086.0],["03-07",1149.0],["03-08",1149.0],["03-09",1115.0],["03-10",1076.0],["03-11",1066.0],["03-14",1045.0],["03-15",1020.0],["03-16",1012.0],["03-17",1026.0],["03-18",1035.0],["03-21",1029.0],["03-22",1030.0],["03-23",1024.0],["03-24",1010.0],["03-25",1021.0],["03-28",991.0],["03-29",984.0],["03-30",984.0],["03-31",985.0],["04-01",988.0],["04-04",991.0],["04-05",985.0],["04-06",968.0],["04-07",950.0],["04-08",965.0],["04-11",995.0],["04-12",964.0],["04-13",985.0],["04-14",986.0],["04-19",1023.0],["04-20",978.0],["04-21",983.0],["04-22",960.0],["04-25",925.0],["04-26",922.0],["04-27",910.0],["04-28",929.0],["04-29",932.0],["05-03",940.0],["05-04",977.0],["05-05",986.0],["05-06",959.0],["05-09",949.0],["05-10",978.0],["05-11",986.0],["05-12",975.0],["05-13",956.0],["05-16",938.0],["05-17",948.0],["05-18",960.0],["05-19",929.0],["05-20",961.0],["05-23",969.0],["05-24",960.0],["05-25",948.0],["05-26",943.0],["05-27",952.0],["05-30",958.0],["05-31",963.0],["06-01",975.0],["06-06",1031.0],["06-07",1014.0],["06-08",1010.0],["06-09",986.0],["06-10",974.0],["06-13",946.0],["06-14",937.0],["06-15",938.0],["06-16",933.0],["06-17",950.0],["06-20",942.0],["06-21",946.0],["06-22",931.0],["06-23",924.0],["06-24",916.0],["06-27",915.0],["06-28",916.0],["06-29",925.0],["06-30",915.0],["07-01",886.0],["07-04",886.0],["07-05",874.0],["07-06",863.0],["07-07",860.0],["07-08",872.0],["07-11",885.0],["07-12",857.0],["07-13",847.0],["07-14",837.0],["07-15",842.0],["07-18",867.0],["07-19",875.0],["07-20",879.0],["07-21",855.0],["07-22",882.0],["07-25",875.0],["07-26",885.0],["07-27",879.0],["07-28",896.0],["07-29",898.0],["08-01",908.0],["08-02",910.0],["08-03",900.0],["08-04",903.0],["08-05",936.0],["08-08",932.0],["08-09",942.0],["08-10",932.0],["08-11",958.0],["08-12",959.0],["08-15",943.0],["08-16",930.0],["08-17",933.0],["08-18",925.0],["08-19",907.0],["08-22",882.0],["08-23",881.0],["08-24",884.0],["08-25",886.0],["08-26",881.0],["08-30",865.0],["08-31",848.0],["09-01",840.0],["09-02",836.0],["09-05",842.0],["09-06",850.0],["09-07",859.0],["09-08",873.0],["09-09",892.0],["09-12",892.0],["09-13",910.0],["09-14",897.0],["09-15",909.0],["09-16",892.0],["09-20",925.0],["09-21",931.0],["09-22",911.0],["09-23",884.0],["09-26",860.0],["09-27",861.0],["09-28",840.0],["09-29",855.0],["09-30",877.0],["10-03",865.0],["10-04",910.0],["10-05",924.0],["10-06",920.0],["10-07",930.0],["10-10",899.0],["10-11",890.0],["10-12",894.0],["10-13",885.0],["10-14",904.0],["10-17",910.0],["10-18",918.0],["10-19",892.0],["10-20",885.0],["10-21",908.0],["10-24",926.0],["10-25",919.0],["10-26",934.0],["10-27",950.0],["10-28",949.0],["10-31",932.0],["11-01",945.0],["11-02",956.0],["11-03",922.0],["11-04",934.0],["11-07",972.0],["11-08",978.0],["11-09",1002.0],["11-10",992.0],["11-11",1055.0],["11-14",1023.0],["11-15",1027.0],["11-16",1020.0],["11-17",1002.0],["11-18",988.0],["11-21",966.0],["11-22",996.0],["11-23",997.0],["11-24",991.0],["11-25",983.0],["11-28",989.0],["11-29",1003.0],["11-30",1011.0],["12-01",1035.0],["12-02",1041.0],["12-05",1019.0],["12-06",994.0],["12-07",983.0],["12-08",1007.0],["12-09",1001.0],["12-12",1020.0],["12-13",1004.0],["12-14",1038.0],["12-15",1010.0],["12-16",992.0],["12-19",1002.0],["12-20",999.0],["12-21",999.0],["12-22",1005.0],["12-23",995.0],["12-28",1020.0],["12-29",1014.0],["12-30",1065.0]],"Silver":[["01-04",22.89],["01-05",23.05],["01-06",22.25],["01-07",22.24],["01-10",22.45],["01-11",22.59],["01-12",22.75],["01-13",23.25],["01-14",23.1],["01-17",23.02],["01-18",22.91],["01-19",23.77],["01-20",24.23],["01-21",24.32],["01-24",24.07],["01-25",23.66],["01-26",23.86],["01-27",23.17],["01-28",22.5],["01-31",22.5],["02-01",22.88],["02-02",22.78],["02-03",22.36],["02-04",22.5],["02-07",22.86],["02-08",22.86],["02-09",23.25],["02-10",23.36],["02-11",22.89],["02-14",23.69],["02-15",23.29],["02-16",23.5],["02-17",23.59],["02-18",23.77],["02-21",23.73],["02-22",24.01],["02-23",24.11],["02-24",25.32],["02-25",24.21],["02-28",24.35],["03-01",24.64],["03-02",25.07],["03-03",25.31],["03-04",25.15],["03-07",25.74],["03-08",26.12],["03-09",26.18],["03-10",25.95],["03-11",25.66],["03-14",25.38],["03-15",24.64],["03-16",24.95],["03-17",25.34],["03-18",25.23],["03-21",25.04],["03-22",25.09],["03-23",25.02],["03-24",25.32],["03-25",25.62],["03-28",24.91],["03-29",24.64],["03-30",24.75],["03-31",24.82],["04-01",24.69],["04-04",24.66],["04-05",24.68],["04-06",24.27],["04-07",24.38],["04-08",24.62],["04-11",25.05],["04-12",25.0],["04-13",25.64],["04-14",25.66],["04-19",25.91],["04-20",25.2],["04-21",24.64],["04-22",24.34],["04-25",23.52],["04-26",23.77],["04-27",23.64],["04-28",23.16],["04-29",23.45],["05-03",22.63],["05-04",22.59],["05-05",22.91],["05-06",22.48],["05-09",21.86],["05-10",21.86],["05-11",21.79],["05-12",20.98],["05-13",20.84],["05-16",21.17],["05-17",21.78],["05-18",21.66],["05-19",21.56],["05-20",22.03],["05-23",22.09],["05-24",21.93],["05-25",21.83],["05-26",21.89],["05-27",22.27],["05-30",22.04],["05-31",21.77],["06-01",21.61],["06-06",22.25],["06-07",22.09],["06-08",21.92],["06-09",21.93],["06-10",21.59],["06-13",21.56],["06-14",21.23],["06-15",21.46],["06-16",21.43],["06-17",21.84],["06-20",21.66],["06-21",21.67],["06-22",21.42],["06-23",21.18],["06-24",20.86],["06-27",21.46],["06-28",21.23],["06-29",20.98],["06-30",20.41],["07-01",19.73],["07-04",19.86],["07-05",19.84],["07-06",19.22],["07-07",19.43],["07-08",19.2],["07-11",19.21],["07-12",18.86],["07-13",18.95],["07-14",18.76],["07-15",18.46],["07-18",18.88],["07-19",18.9],["07-20",18.78],["07-21",18.27],["07-22",18.81],["07-25",18.75],["07-26",18.54],["07-27",18.77],["07-28",19.32],["07-29",20.07],["08-01",20.41],["08-02",20.34],["08-03",19.92],["08-04",20.27],["08-05",20.06],["08-08",20.2],["08-09",20.6],["08-10",20.43],["08-11",20.54],["08-12",20.27],["08-15",20.33],["08-16",20.12],["08-17",19.91],["08-18",19.82],["08-19",19.23],["08-22",18.89],["08-23",18.99],["08-24",19.0],["08-25",19.32],["08-26",19.21],["08-30",18.7],["08-31",17.95],["09-01",17.77],["09-02",17.91],["09-05",18.23],["09-06",18.39],["09-07",18.17],["09-08",18.62],["09-09",18.77],["09-12",19.21],["09-13",19.93],["09-14",19.5],["09-15",19.37],["09-16",19.0],["09-20",19.32],["09-21",19.51],["09-22",19.59],["09-23",19.0],["09-26",18.64],["09-27",18.68],["09-28",18.25],["09-29",18.67],["09-30",19.02],["10-03",19.41],["10-04",20.93],["10-05",20.43],["10-06",20.54],["10-07",20.62],["10-10",19.82],["10-11",19.39],["10-12",19.18],["10-13",19.18],["10-14",18.77],["10-17",18.59],["10-18",18.7],["10-19",18.43],["10-20",18.79],["10-21",18.39],["10-24",19.21],["10-25",18.88],["10-26",19.59],["10-27",19.37],["10-28",19.23],["10-31",19.16],["11-01",20.0],["11-02",19.78],["11-03",18.92],["11-04",19.96],["11-07",20.67],["11-08",20.75],["11-09",21.32],["11-10",21.09],["11-11",21.48],["11-14",21.47],["11-15",21.94],["11-16",21.95],["11-17",21.07],["11-18",21.09],["11-21",20.64],["11-22",21.27],["11-23",21.27],["11-24",21.56],["11-25",21.34],["11-28",21.48],["11-29",21.36],["11-30",21.56],["12-01",22.14],["12-02",22.61],["12-05",22.98],["12-06",22.54],["12-07",22.39],["12-08",22.7],["12-09",23.11],["12-12",23.39],["12-13",23.39],["12-14",23.61],["12-15",23.16],["12-16",22.83],["12-19",23.24],["12-20",23.74],["12-21",23.89],["12-22",23.73],["12-23",23.73],["12-28",23.86],["12-29",23.86],["12-30",23.95]]},"2023":{"Gold":[["01-03",1835.05],["01-04",1857.55],["01-05",1850.25],["01-06",1834.5],["01-09",1873.8],["01-10",1875.2],["01-11",1884.25],["01-12",1883.1],["01-13",1904.05],["01-16",1915.1],["01-17",1904.95],["01-18",1911.55],["01-19",1907.5],["01-20",1928.75],["01-23",1927.2],["01-24",1936.5],["01-25",1925.85],["01-26",1936.45],["01-27",1928.25],["01-30",1926.75],["01-31",1905.2],["02-01",1925.6],["02-02",1954.9],["02-03",1910.0],["02-06",1873.5],["02-07",1873.8],["02-08",1880.75],["02-09",1882.1],["02-10",1864.1],["02-13",1858.5],["02-14",1860.5],["02-15",1835.45],["02-16",1837.3],["02-17",1824.5],["02-20",1844.2],["02-21",1833.2],["02-22",1833.45],["02-23",1826.95],["02-24",1824.1],["02-27",1809.05],["02-28",1810.2],["03-01",1833.5],["03-02",1831.75],["03-03",1845.55],["03-06",1851.7],["03-07",1843.05],["03-08",1813.35],["03-09",1817.5],["03-10",1834.95],["03-13",1882.1],["03-14",1901.45],["03-15",1906.0],["03-16",1919.4],["03-17",1930.9],["03-20",1981.95],["03-21",1965.95],["03-22",1941.85],["03-23",1977.55],["03-24",1996.15],["03-27",1960.25],["03-28",1949.85],["03-29",1965.85],["03-30",1968.1],["03-31",1978.8],["04-03",1963.1],["04-04",1982.25],["04-05",2022.3],["04-06",2017.25],["04-11",2001.5],["04-12",2008.9],["04-13",2027.1],["04-14",2035.65],["04-17",2009.8],["04-18",1999.3],["04-19",1976.1],["04-20",1994.05],["04-21",1986.1],["04-24",1986.15],["04-25",1990.2],["04-26",1999.05],["04-27",1997.65],["04-28",1982.7],["05-02",1980.9],["05-03",2016.9],["05-04",2036.05],["05-05",2038.9],["05-09",2025.6],["05-10",2029.6],["05-11",2025.75],["05-12",2006.65],["05-15",2015.3],["05-16",2009.9],["05-17",1985.75],["05-18",1976.95],["05-19",1965.55],["05-22",1981.2],["05-23",1959.65],["05-24",1976.8],["05-25",1962.3],["05-26",1953.5],["05-30",1949.5],["05-31",1959.0],["06-01",1958.75],["06-02",1981.0],["06-05",1942.5],["06-06",1961.9],["06-07",1963.05],["06-08",1947.25],["06-09",1963.55],["06-12",1964.15],["06-13",1964.0],["06-14",1951.9],["06-15",1934.65],["06-16",1964.1],["06-19",1954.35],["06-20",1953.85],["06-21",1935.25],["06-22",1927.95],["06-23",1919.35],["06-26",1930.55],["06-27",1923.95],["06-28",1909.85],["06-29",1904.05],["06-30",1903.55],["07-03",1913.75],["07-04",1929.75],["07-05",1928.3],["07-06",1919.15],["07-07",1915.65],["07-10",1925.05],["07-11",1936.2],["07-12",1935.75],["07-13",1959.6],["07-14",1956.5],["07-17",1955.05],["07-18",1961.95],["07-19",1978.15],["07-20",1981.5],["07-21",1963.8],["07-24",1964.75],["07-25",1963.1],["07-26",1972.0],["07-27",1975.2],["07-28",1950.15],["07-31",1955.55],["08-01",1956.75],["08-02",1949.7],["08-03",1936.9],["08-04",1934.0],["08-07",1936.9],["08-08",1934.8],["08-09",1928.4],["08-10",1920.1],["08-11",1918.05],["08-14",1913.5],["08-15",1904.1],["08-16",1906.8],["08-17",1893.95],["08-18",1891.75],["08-21",1890.1],["08-22",1901.85],["08-23",1904.55],["08-24",1920.7],["08-25",1917.85],["08-29",1923.5],["08-30",1938.35],["08-31",1944.2],["09-01",1944.3],["09-04",1942.05],["09-05",1931.8],["09-06",1923.45],["09-07",1919.85],["09-08",1925.55],["09-11",1926.6],["09-12",1918.9],["09-13",1912.15],["09-14",1906.45],["09-15",1918.7],["09-18",1926.4],["09-19",1935.0],["09-20",1930.15],["09-21",1923.4],["09-22",1926.2],["09-25",1922.55],["09-26",1912.3],["09-27",1895.55],["09-28",1874.1],["09-29",1871.6],["10-02",1831.85],["10-03",1828.3],["10-04",1823.25],["10-05",1822.75],["10-06",1821.9],["10-09",1852.3],["10-10",1859.7],["10-11",1870.0],["10-12",1881.15],["10-13",1887.0],["10-16",1914.65],["10-17",1923.45],["10-18",1943.85],["10-19",1948.65],["10-20",1984.2],["10-23",1980.95],["10-24",1967.4],["10-25",1970.15],["10-26",1991.45],["10-27",1987.6],["10-30",1996.15],["10-31",1997.6],["11-01",1982.5],["11-02",1986.7],["11-03",1988.5],["11-06",1987.1],["11-07",1967.8],["11-08",1960.1],["11-09",1946.75],["11-10",1953.45],["11-13",1937.45],["11-14",1946.55],["11-15",1973.4],["11-16",1966.5],["11-17",1992.15],["11-20",1976.05],["11-21",1988.55],["11-22",1999.9],["11-23",1992.6],["11-24",1995.2],["11-27",2011.7],["11-28",2014.0],["11-29",2037.6],["11-30",2037.85],["12-01",2044.55],["12-04",2066.95],["12-05",2023.45],["12-06",2021.4],["12-07",2033.3],["12-08",2030.0],["12-11",1991.95],["12-12",1986.9],["12-13",1981.55],["12-14",2034.1],["12-15",2043.65],["12-18",2020.95],["12-19",2026.0],["12-20",2036.35],["12-21",2034.3],["12-22",2055.6],["12-27",2061.7],["12-28",2077.8],["12-29",2062.4]],"Palladium":[["01-03",1804.0],["01-04",1722.0],["01-05",1805.0],["01-06",1744.0],["01-09",1830.0],["01-10",1783.0],["01-11",1788.0],["01-12",1781.0],["01-13",1793.0],["01-16",1755.0],["01-17",1739.0],["01-18",1752.0],["01-19",1703.0],["01-20",1735.0],["01-23",1730.0],["01-24",1717.0],["01-25",1729.0],["01-26",1682.0],["01-27",1668.0],["01-30",1630.0],["01-31",1603.0],["02-01",1638.0],["02-02",1671.0],["02-03",1689.0],["02-06",1592.0],["02-07",1585.0],["02-08",1671.0],["02-09",1665.0],["02-10",1609.0],["02-13",1544.0],["02-14",1557.0],["02-15",1475.0],["02-16",1463.0],["02-17",1480.0],["02-20",1502.0],["02-21",1499.0],["02-22",1506.0],["02-23",1472.0],["02-24",1444.0],["02-27",1412.0],["02-28",1433.0],["03-01",1424.0],["03-02",1431.0],["03-03",1440.0],["03-06",1430.0],["03-07",1434.0],["03-08",1395.0],["03-09",1367.0],["03-10",1368.0],["03-13",1387.0],["03-14",1455.0],["03-15",1476.0],["03-16",1455.0],["03-17",1441.0],["03-20",1404.0],["03-21",1419.0],["03-22",1391.0],["03-23",1453.0],["03-24",1419.0],["03-27",1397.0],["03-28",1407.0],["03-29",1422.0],["03-30",1443.0],["03-31",1489.0],["04-03",1465.0],["04-04",1462.0],["04-05",1465.0],["04-06",1424.0],["04-11",1442.0],["04-12",1448.0],["04-13",1459.0],["04-14",1482.0],["04-17",1492.0],["04-18",1618.0],["04-19",1620.0],["04-20",1601.0],["04-21",1593.0],["04-24",1590.0],["04-25",1502.0],["04-26",1514.0],["04-27",1519.0],["04-28",1490.0],["05-02",1459.0],["05-03",1436.0],["05-04",1433.0],["05-05",1451.0],["05-09",1538.0],["05-10",1573.0],["05-11",1571.0],["05-12",1573.0],["05-15",1532.0],["05-16",1528.0],["05-17",1490.0],["05-18",1465.0],["05-19",1473.0],["05-22",1517.0],["05-23",1467.0],["05-24",1442.0],["05-25",1404.0],["05-26",1435.0],["05-30",1437.0],["05-31",1397.0],["06-01",1399.0],["06-02",1398.0],["06-05",1425.0],["06-06",1408.0],["06-07",1417.0],["06-08",1381.0],["06-09",1351.0],["06-12",1315.0],["06-13",1343.0],["06-14",1362.0],["06-15",1377.0],["06-16",1391.0],["06-19",1411.0],["06-20",1402.0],["06-21",1351.0],["06-22",1335.0],["06-23",1284.0],["06-26",1290.0],["06-27",1318.0],["06-28",1263.0],["06-29",1247.0],["06-30",1225.0],["07-03",1227.0],["07-04",1251.0],["07-05",1236.0],["07-06",1260.0],["07-07",1228.0],["07-10",1240.0],["07-11",1237.0],["07-12",1265.0],["07-13",1303.0],["07-14",1280.0],["07-17",1266.0],["07-18",1304.0],["07-19",1324.0],["07-20",1306.0],["07-21",1283.0],["07-24",1285.0],["07-25",1295.0],["07-26",1285.0],["07-27",1264.0],["07-28",1234.0],["07-31",1243.0],["08-01",1269.0],["08-02",1232.0],["08-03",1230.0],["08-04",1251.0],["08-07",1271.0],["08-08",1227.0],["08-09",1214.0],["08-10",1258.0],["08-11",1304.0],["08-14",1309.0],["08-15",1262.0],["08-16",1242.0],["08-17",1213.0],["08-18",1225.0],["08-21",1244.0],["08-22",1255.0],["08-23",1271.0],["08-24",1269.0],["08-25",1238.0],["08-29",1246.0],["08-30",1238.0],["08-31",1235.0],["09-01",1225.0],["09-04",1234.0],["09-05",1216.0],["09-06",1204.0],["09-07",1197.0],["09-08",1220.0],["09-11",1210.0],["09-12",1217.0],["09-13",1233.0],["09-14",1260.0],["09-15",1261.0],["09-18",1253.0],["09-19",1252.0],["09-20",1277.0],["09-21",1253.0],["09-22",1270.0],["09-25",1241.0],["09-26",1223.0],["09-27",1236.0],["09-28",1225.0],["09-29",1270.0],["10-02",1242.0],["10-03",1207.0],["10-04",1166.0],["10-05",1168.0],["10-06",1145.0],["10-09",1160.0],["10-10",1140.0],["10-11",1182.0],["10-12",1165.0],["10-13",1143.0],["10-16",1151.0],["10-17",1132.0],["10-18",1143.0],["10-19",1103.0],["10-20",1115.0],["10-23",1091.0],["10-24",1124.0],["10-25",1116.0],["10-26",1122.0],["10-27",1135.0],["10-30",1137.0],["10-31",1127.0],["11-01",1121.0],["11-02",1107.0],["11-03",1116.0],["11-06",1129.0],["11-07",1089.0],["11-08",1018.0],["11-09",1027.0],["11-10",960.0],["11-13",972.0],["11-14",986.0],["11-15",1025.0],["11-16",1042.0],["11-17",1042.0],["11-20",1060.0],["11-21",1080.0],["11-22",1080.0],["11-23",1053.0],["11-24",1056.0],["11-27",1072.0],["11-28",1067.0],["11-29",1047.0],["11-30",1014.0],["12-01",1015.0],["12-04",985.0],["12-05",975.0],["12-06",944.0],["12-07",952.0],["12-08",978.0],["12-11",941.0],["12-12",972.0],["12-13",976.0],["12-14",1021.0],["12-15",1138.0],["12-18",1178.0],["12-19",1186.0],["12-20",1200.0],["12-21",1204.0],["12-22",1223.0],["12-27",1193.0],["12-28",1138.0],["12-29",1119.0]],"Platinum":[["01-03",1086.0],["01-04",1093.0],["01-05",1082.0],["01-06",1048.0],["01-09",1098.0],["01-10",1084.0],["01-11",1096.0],["01-12",1074.0],["01-13",1068.0],["01-16",1061.0],["01-17",1057.0],["01-18",1045.0],["01-19",1029.0],["01-20",1036.0],["01-23",1045.0],["01-24",1050.0],["01-25",1049.0],["01-26",1031.0],["01-27",1013.0],["01-30",1008.0],["01-31",998.0],["02-01",1007.0],["02-02",1015.0],["02-03",1028.0],["02-06",976.0],["02-07",972.0],["02-08",990.0],["02-09",981.0],["02-10",955.0],["02-13",939.0],["02-14",954.0],["02-15",927.0],["02-16",916.0],["02-17",922.0],["02-20",923.0],["02-21",930.0],["02-22",947.0],["02-23",953.0],["02-24",940.0],["02-27",918.0],["02-28",939.0],["03-01",965.0],["03-02",958.0],["03-03",971.0],["03-06",970.0],["03-07",974.0],["03-08",942.0],["03-09",941.0],["03-10",939.0],["03-13",968.0],["03-14",990.0],["03-15",974.0],["03-16",972.0],["03-17",983.0],["03-20",971.0],["03-21",991.0],["03-22",984.0],["03-23",987.0],["03-24",977.0],["03-27",966.0],["03-28",967.0],["03-29",963.0],["03-30",976.0],["03-31",986.0],["04-03",987.0],["04-04",991.0],["04-05",1025.0],["04-06",1007.0],["04-11",1007.0],["04-12",1001.0],["04-13",1022.0],["04-14",1046.0],["04-17",1048.0],["04-18",1064.0],["04-19",1062.0],["04-20",1085.0],["04-21",1094.0],["04-24",1106.0],["04-25",1080.0],["04-26",1101.0],["04-27",1098.0],["04-28",1067.0],["05-02",1051.0],["05-03",1070.0],["05-04",1049.0],["05-05",1043.0],["05-09",1072.0],["05-10",1103.0],["05-11",1104.0],["05-12",1099.0],["05-15",1063.0],["05-16",1070.0],["05-17",1068.0],["05-18",1065.0],["05-19",1058.0],["05-22",1074.0],["05-23",1061.0],["05-24",1046.0],["05-25",1028.0],["05-26",1029.0],["05-30",1034.0],["05-31",1017.0],["06-01",1005.0],["06-02",1016.0],["06-05",1006.0],["06-06",1026.0],["06-07",1042.0],["06-08",1026.0],["06-09",1013.0],["06-12",1008.0],["06-13",993.0],["06-14",982.0],["06-15",967.0],["06-16",993.0],["06-19",983.0],["06-20",972.0],["06-21",957.0],["06-22",943.0],["06-23",928.0],["06-26",934.0],["06-27",929.0],["06-28",914.0],["06-29",917.0],["06-30",895.0],["07-03",898.0],["07-04",922.0],["07-05",918.0],["07-06",919.0],["07-07",908.0],["07-10",912.0],["07-11",936.0],["07-12",937.0],["07-13",961.0],["07-14",967.0],["07-17",971.0],["07-18",987.0],["07-19",988.0],["07-20",975.0],["07-21",960.0],["07-24",964.0],["07-25",974.0],["07-26",969.0],["07-27",974.0],["07-28",937.0],["07-31",930.0],["08-01",943.0],["08-02",930.0],["08-03",921.0],["08-04",916.0],["08-07",928.0],["08-08",916.0],["08-09",903.0],["08-10",902.0],["08-11",917.0],["08-14",916.0],["08-15",898.0],["08-16",895.0],["08-17",891.0],["08-18",900.0],["08-21",909.0],["08-22",920.0],["08-23",926.0],["08-24",931.0],["08-25",940.0],["08-29",968.0],["08-30",983.0],["08-31",978.0],["09-01",976.0],["09-04",959.0],["09-05",945.0],["09-06",921.0],["09-07",908.0],["09-08",903.0],["09-11",904.0],["09-12",902.0],["09-13",906.0],["09-14",901.0],["09-15",917.0],["09-18",933.0],["09-19",939.0],["09-20",945.0],["09-21",920.0],["09-22",934.0],["09-25",921.0],["09-26",909.0],["09-27",906.0],["09-28",891.0],["09-29",918.0],["10-02",906.0],["10-03",883.0],["10-04",871.0],["10-05",868.0],["10-06",859.0],["10-09",888.0],["10-10",891.0],["10-11",887.0],["10-12",893.0],["10-13",871.0],["10-16",885.0],["10-17",895.0],["10-18",908.0],["10-19",882.0],["10-20",903.0],["10-23",897.0],["10-24",893.0],["10-25",884.0],["10-26",907.0],["10-27",909.0],["10-30",917.0],["10-31",937.0],["11-01",925.0],["11-02",930.0],["11-03",930.0],["11-06",932.0],["11-07",900.0],["11-08",884.0],["11-09",865.0],["11-10",855.0],["11-13",852.0],["11-14",874.0],["11-15",891.0],["11-16",904.0],["11-17",903.0],["11-20",903.0],["11-21",923.0],["11-22",937.0],["11-23",924.0],["11-24",921.0],["11-27",936.0],["11-28",924.0],["11-29",938.0],["11-30",931.0],["12-01",937.0],["12-04",928.0],["12-05",915.0],["12-06",901.0],["12-07",899.0],["12-08",920.0],["12-11",921.0],["12-12",921.0],["12-13",931.0],["12-14",946.0],["12-15",964.0],["12-18",950.0],["12-19",946.0],["12-20",954.0],["12-21",963.0],["12-22",970.0],["12-27",984.0],["12-28",1000.0],["12-29",1006.0]],"Silver":[["01-03",24.3],["01-04",24.29],["01-05",23.41],["01-06",23.45],["01-09",23.85],["01-10",23.52],["01-11",23.87],["01-12",23.7],["01-13",23.68],["01-16",24.17],["01-17",24.1],["01-18",24.18],["01-19",23.45],["01-20",23.87],["01-23",23.68],["01-24",23.71],["01-25",23.43],["01-26",23.71],["01-27",23.73],["01-30",23.64],["01-31",23.0],["02-01",23.5],["02-02",24.43],["02-03",23.49],["02-06",22.38],["02-07",22.2],["02-08",22.45],["02-09",22.46],["02-10",22.11],["02-13",21.98],["02-14",21.71],["02-15",21.47],["02-16",21.57],["02-17",21.21],["02-20",21.71],["02-21",21.77],["02-22",21.86],["02-23",21.52],["02-24",21.09],["02-27",20.73],["02-28",20.52],["03-01",21.0],["03-02",20.8],["03-03",21.09],["03-06",21.09],["03-07",20.91],["03-08",20.11],["03-09",20.12],["03-10",20.09],["03-13",21.09],["03-14",21.64],["03-15",22.09],["03-16",22.01],["03-17",21.89],["03-20",22.5],["03-21",22.46],["03-22",22.34],["03-23",22.9],["03-24",23.17],["03-27",22.89],["03-28",23.05],["03-29",23.25],["03-30",23.71],["03-31",23.89],["04-03",23.93],["04-04",24.02],["04-05",24.74],["04-06",24.93],["04-11",25.05],["04-12",25.14],["04-13",25.62],["04-14",26.02],["04-17",25.39],["04-18",25.09],["04-19",24.75],["04-20",25.4],["04-21",25.16],["04-24",25.03],["04-25",24.89],["04-26",24.85],["04-27",25.14],["04-28",24.77],["05-02",24.77],["05-03",25.25],["05-04",25.62],["05-05",25.84],["05-09",25.57],["05-10",25.52],["05-11",24.89],["05-12",23.86],["05-15",23.89],["05-16",23.79],["05-17",23.68],["05-18",23.52],["05-19",23.66],["05-22",23.85],["05-23",23.16],["05-24",23.41],["05-25",23.0],["05-26",23.14],["05-30",23.25],["05-31",23.25],["06-01",23.49],["06-02",23.89],["06-05",23.48],["06-06",23.64],["06-07",23.59],["06-08",23.67],["06-09",24.32],["06-12",24.21],["06-13",24.19],["06-14",23.82],["06-15",23.41],["06-16",23.99],["06-19",23.95],["06-20",23.77],["06-21",23.07],["06-22",22.62],["06-23",22.34],["06-26",22.8],["06-27",22.84],["06-28",22.61],["06-29",22.83],["06-30",22.47],["07-03",22.77],["07-04",23.0],["07-05",22.81],["07-06",23.17],["07-07",22.71],["07-10",23.04],["07-11",23.14],["07-12",23.16],["07-13",24.26],["07-14",24.77],["07-17",24.81],["07-18",24.89],["07-19",25.02],["07-20",25.18],["07-21",24.73],["07-24",24.59],["07-25",24.55],["07-26",24.67],["07-27",25.01],["07-28",24.23],["07-31",24.36],["08-01",24.52],["08-02",24.41],["08-03",23.55],["08-04",23.45],["08-07",23.39],["08-08",23.04],["08-09",22.7],["08-10",22.8],["08-11",22.69],["08-14",22.73],["08-15",22.41],["08-16",22.7],["08-17",22.7],["08-18",22.79],["08-21",22.88],["08-22",23.39],["08-23",23.75],["08-24",24.18],["08-25",24.18],["08-29",24.22],["08-30",24.62],["08-31",24.54],["09-01",24.64],["09-04",24.04],["09-05",23.55],["09-06",23.48],["09-07",23.01],["09-08",23.01],["09-11",23.11],["09-12",22.9],["09-13",22.91],["09-14",22.64],["09-15",23.06],["09-18",23.2],["09-19",23.33],["09-20",23.27],["09-21",23.24],["09-22",23.65],["09-25",23.56],["09-26",23.02],["09-27",22.79],["09-28",22.55],["09-29",23.07],["10-02",21.62],["10-03",21.05],["10-04",21.11],["10-05",21.13],["10-06",21.11],["10-09",21.65],["10-10",21.71],["10-11",22.07],["10-12",22.14],["10-13",22.08],["10-16",22.59],["10-17",22.68],["10-18",23.21],["10-19",22.89],["10-20",23.21],["10-23",23.18],["10-24",22.74],["10-25",22.81],["10-26",22.97],["10-27",22.75],["10-30",23.15],["10-31",23.2],["11-01",22.67],["11-02",23.04],["11-03",22.64],["11-06",23.21],["11-07",22.54],["11-08",22.44],["11-09",22.55],["11-10",22.5],["11-13",22.07],["11-14",22.35],["11-15",23.41],["11-16",23.67],["11-17",24.0],["11-20",23.39],["11-21",23.53],["11-22",23.84],["11-23",23.66],["11-24",23.7],["11-27",24.75],["11-28",24.65],["11-29",24.96],["11-30",25.02],["12-01",25.16],["12-04",25.16],["12-05",24.27],["12-06",24.09],["12-07",23.91],["12-08",23.79],["12-11",22.92],["12-12",22.95],["12-13",22.73],["12-14",23.99],["12-15",24.19],["12-18",23.93],["12-19",23.91],["12-20",23.97],["12-21",24.18],["12-22",24.46],["12-27",24.04],["12-28",24.25],["12-29",23.79]]},"2024":{"Gold":[["01-02",2074.9],["01-03",2054.05],["01-04",2049.05],["01-05",2037.7],["01-08",2028.0],["01-09",2038.15],["01-10",2036.25],["01-11",2031.85],["01-12",2039.55],["01-15",2053.85],["01-16",2039.75],["01-17",2027.55],["01-18",2012.2],["01-19",2029.5],["01-22",2023.9],["01-23",2026.85],["01-24",2030.5],["01-25",2018.15],["01-26",2021.1],["01-29",2027.35],["01-30",2036.8],["01-31",2037.9],["02-01",2037.55],["02-02",2054.2],["02-05",2024.5],["02-06",2025.05],["02-07",2033.2],["02-08",2037.05],["02-09",2031.65],["02-12",2021.0],["02-13",2026.2],["02-14",1990.8],["02-15",1996.9],["02-16",2005.4],["02-19",2020.35],["02-20",2026.8],["02-21",2028.8],["02-22",2030.9],["02-23",2019.3],["02-26",2035.15],["02-27",2036.0],["02-28",2025.25],["02-29",2032.8],["03-01",2050.3],["03-04",2083.15],["03-05",2126.25],["03-06",2127.35],["03-07",2156.85],["03-08",2168.65],["03-11",2178.45],["03-12",2176.4],["03-13",2160.85],["03-14",2169.8],["03-15",2170.35],["03-18",2155.3],["03-19",2154.3],["03-20",2153.4],["03-21",2210.65],["03-22",2166.25],["03-25",2168.35],["03-26",2193.45],["03-27",2192.05],["03-28",2207.0],["04-02",2264.55],["04-03",2270.75],["04-04",2292.5],["04-05",2288.45],["04-08",2336.9],["04-09",2364.2],["04-10",2346.85],["04-11",2331.75],["04-12",2394.8],["04-15",2347.15],["04-16",2369.0],["04-17",2393.75],["04-18",2379.85],["04-19",2381.8],["04-22",2361.45],["04-23",2298.15],["04-24",2312.3],["04-25",2325.65],["04-26",2349.8],["04-29",2337.6],["04-30",2314.8],["05-01",2288.5],["05-02",2300.55],["05-03",2301.1],["05-07",2315.0],["05-08",2308.55],["05-09",2308.7],["05-10",2371.05],["05-13",2340.3],["05-14",2347.4],["05-15",2371.8],["05-16",2383.65],["05-17",2381.75],["05-20",2444.35],["05-21",2417.05],["05-22",2414.25],["05-23",2361.8],["05-24",2339.75],["05-28",2344.7],["05-29",2340.9],["05-30",2337.55],["05-31",2342.9],["06-03",2324.7],["06-04",2330.5],["06-05",2332.25],["06-06",2360.85],["06-07",2338.0],["06-10",2297.65],["06-11",2302.5],["06-12",2314.9],["06-13",2316.35],["06-14",2316.9],["06-17",2320.7],["06-18",2312.05],["06-19",2328.6],["06-20",2332.95],["06-21",2364.0],["06-24",2327.2],["06-25",2332.4],["06-26",2316.1],["06-27",2310.55],["06-28",2327.6],["07-01",2327.8],["07-02",2329.0],["07-03",2342.55],["07-04",2357.2],["07-05",2365.35],["07-08",2371.65],["07-09",2362.4],["07-10",2372.9],["07-11",2383.55],["07-12",2404.15],["07-15",2408.5],["07-16",2439.35],["07-17",2470.35],["07-18",2466.95],["07-19",2415.8],["07-22",2401.4],["07-23",2404.45],["07-24",2411.3],["07-25",2371.25],["07-26",2374.55],["07-29",2392.1],["07-30",2389.15],["07-31",2419.6],["08-01",2434.0],["08-02",2461.75],["08-05",2421.75],["08-06",2414.15],["08-07",2392.85],["08-08",2396.3],["08-09",2423.45],["08-12",2442.1],["08-13",2460.55],["08-14",2472.0],["08-15",2456.25],["08-16",2462.15],["08-19",2500.05],["08-20",2521.55],["08-21",2507.65],["08-22",2505.1],["08-23",2500.3],["08-27",2510.3],["08-28",2509.55],["08-29",2517.05],["08-30",2524.15],["09-02",2502.0],["09-03",2503.25],["09-04",2474.45],["09-05",2516.85],["09-06",2517.7],["09-09",2496.65],["09-10",2502.35],["09-11",2521.9],["09-12",2516.55],["09-13",2571.35],["09-16",2587.45],["09-17",2575.5],["09-18",2568.35],["09-19",2590.6],["09-20",2606.45],["09-23",2617.25],["09-24",2628.55],["09-25",2653.8],["09-26",2668.9],["09-27",2660.55],["09-30",2650.15],["10-01",2648.85],["10-02",2655.1],["10-03",2644.0],["10-04",2657.5],["10-07",2651.6],["10-08",2639.55],["10-09",2617.55],["10-10",2617.25],["10-11",2637.05],["10-14",2659.0],["10-15",2653.25],["10-16",2679.4],["10-17",2678.45],["10-18",2711.6],["10-21",2734.3],["10-22",2733.55],["10-23",2751.0],["10-24",2740.0],["10-25",2719.25],["10-28",2730.4],["10-29",2749.15],["10-30",2783.95],["10-31",2779.4],["11-01",2747.35],["11-04",2741.35],["11-05",2738.75],["11-06",2726.2],["11-07",2667.05],["11-08",2685.2],["11-11",2670.55],["11-12",2590.75],["11-13",2609.75],["11-14",2548.45],["11-15",2566.7],["11-18",2590.1],["11-19",2635.95],["11-20",2624.3],["11-21",2669.7],["11-22",2706.25],["11-25",2670.4],["11-26",2630.3],["11-27",2648.0],["11-28",2646.4],["11-29",2664.3],["12-02",2637.25],["12-03",2645.35],["12-04",2642.05],["12-05",2649.15],["12-06",2636.5],["12-09",2655.85],["12-10",2670.45],["12-11",2697.45],["12-12",2713.6],["12-13",2669.55],["12-16",2660.95],["12-17",2641.6],["12-18",2648.35],["12-19",2621.3],["12-20",2606.15],["12-23",2620.55],["12-24",2613.75],["12-27",2625.55],["12-30",2610.3],["12-31",2610.85]],"Palladium":[["01-02",1112.0],["01-03",1076.0],["01-04",1070.0],["01-05",1027.0],["01-08",1011.0],["01-09",992.0],["01-10",996.0],["01-11",1010.0],["01-12",995.0],["01-15",981.0],["01-16",953.0],["01-17",929.0],["01-18",934.0],["01-19",949.0],["01-22",922.0],["01-23",940.0],["01-24",965.0],["01-25",957.0],["01-26",935.0],["01-29",949.0],["01-30",990.0],["01-31",983.0],["02-01",974.0],["02-02",972.0],["02-05",931.0],["02-06",951.0],["02-07",937.0],["02-08",882.0],["02-09",882.0],["02-12",866.0],["02-13",913.0],["02-14",875.0],["02-15",958.0],["02-16",943.0],["02-19",970.0],["02-20",960.0],["02-21",971.0],["02-22",966.0],["02-23",958.0],["02-26",968.0],["02-27",966.0],["02-28",916.0],["02-29",939.0],["03-01",945.0],["03-04",964.0],["03-05",951.0],["03-06",962.0],["03-07",1026.0],["03-08",1044.0],["03-11",1040.0],["03-12",1026.0],["03-13",1059.0],["03-14",1065.0],["03-15",1095.0],["03-18",1069.0],["03-19",1001.0],["03-20",987.0],["03-21",1011.0],["03-22",1013.0],["03-25",1005.0],["03-26",1008.0],["03-27",988.0],["03-28",994.0],["04-02",1016.0],["04-03",996.0],["04-04",1011.0],["04-05",1010.0],["04-08",1013.0],["04-09",1063.0],["04-10",1084.0],["04-11",1050.0],["04-12",1066.0],["04-15",1041.0],["04-16",1016.0],["04-17",1026.0],["04-18",1036.0],["04-19",1017.0],["04-22",1015.0],["04-23",996.0],["04-24",1023.0],["04-25",1008.0],["04-26",982.0],["04-29",955.0],["04-30",953.0],["05-01",938.0],["05-02",947.0],["05-03",940.0],["05-07",974.0],["05-08",966.0],["05-09",954.0],["05-10",989.0],["05-13",989.0],["05-14",972.0],["05-15",1003.0],["05-16",1006.0],["05-17",983.0],["05-20",1019.0],["05-21",1024.0],["05-22",1019.0],["05-23",981.0],["05-24",972.0],["05-28",980.0],["05-29",971.0],["05-30",949.0],["05-31",953.0],["06-03",906.0],["06-04",915.0],["06-05",932.0],["06-06",937.0],["06-07",917.0],["06-10",917.0],["06-11",892.0],["06-12",890.0],["06-13",896.0],["06-14",900.0],["06-17",893.0],["06-18",885.0],["06-19",908.0],["06-20",909.0],["06-21",942.0],["06-24",998.0],["06-25",989.0],["06-26",956.0],["06-27",928.0],["06-28",963.0],["07-01",985.0],["07-02",986.0],["07-03",1033.0],["07-04",1022.0],["07-05",1035.0],["07-08",1002.0],["07-09",1015.0],["07-10",983.0],["07-11",988.0],["07-12",977.0],["07-15",969.0],["07-16",946.0],["07-17",978.0],["07-18",960.0],["07-19",923.0],["07-22",919.0],["07-23",909.0],["07-24",932.0],["07-25",919.0],["07-26",908.0],["07-29",906.0],["07-30",905.0],["07-31",911.0],["08-01",923.0],["08-02",915.0],["08-05",871.0],["08-06",858.0],["08-07",888.0],["08-08",897.0],["08-09",933.0],["08-12",939.0],["08-13",921.0],["08-14",950.0],["08-15",940.0],["08-16",943.0],["08-19",943.0],["08-20",939.0],["08-21",932.0],["08-22",954.0],["08-23",936.0],["08-27",978.0],["08-28",964.0],["08-29",951.0],["08-30",986.0],["09-02",972.0],["09-03",972.0],["09-04",935.0],["09-05",948.0],["09-06",943.0],["09-09",925.0],["09-10",959.0],["09-11",976.0],["09-12",1007.0],["09-13",1046.0],["09-16",1074.0],["09-17",1087.0],["09-18",1112.0],["09-19",1085.0],["09-20",1083.0],["09-23",1042.0],["09-24",1065.0],["09-25",1043.0],["09-26",1066.0],["09-27",1038.0],["09-30",1014.0],["10-01",1000.0],["10-02",1010.0],["10-03",997.0],["10-04",1007.0],["10-07",1021.0],["10-08",1002.0],["10-09",1019.0],["10-10",1045.0],["10-11",1073.0],["10-14",1061.0],["10-15",1020.0],["10-16",1020.0],["10-17",1025.0],["10-18",1064.0],["10-21",1078.0],["10-22",1073.0],["10-23",1072.0],["10-24",1136.0],["10-25",1128.0],["10-28",1208.0],["10-29",1232.0],["10-30",1175.0],["10-31",1135.0],["11-01",1120.0],["11-04",1108.0],["11-05",1087.0],["11-06",1057.0],["11-07",1035.0],["11-08",1008.0],["11-11",988.0],["11-12",968.0],["11-13",953.0],["11-14",926.0],["11-15",964.0],["11-18",971.0],["11-19",1006.0],["11-20",1025.0],["11-21",1024.0],["11-22",1023.0],["11-25",1005.0],["11-26",983.0],["11-27",985.0],["11-28",987.0],["11-29",993.0],["12-02",975.0],["12-03",996.0],["12-04",968.0],["12-05",985.0],["12-06",974.0],["12-09",983.0],["12-10",975.0],["12-11",964.0],["12-12",982.0],["12-13",969.0],["12-16",962.0],["12-17",944.0],["12-18",934.0],["12-19",920.0],["12-20",912.0],["12-23",922.0],["12-24",953.0],["12-27",920.0],["12-30",912.0],["12-31",909.0]],"Platinum":[["01-02",995.0],["01-03",979.0],["01-04",972.0],["01-05",951.0],["01-08",954.0],["01-09",950.0],["01-10",938.0],["01-11",926.0],["01-12",922.0],["01-15",917.0],["01-16",905.0],["01-17",892.0],["01-18",894.0],["01-19",913.0],["01-22",896.0],["01-23",905.0],["01-24",911.0],["01-25",901.0],["01-26",898.0],["01-29",912.0],["01-30",930.0],["01-31",927.0],["02-01",916.0],["02-02",919.0],["02-05",895.0],["02-06",900.0],["02-07",897.0],["02-08",884.0],["02-09",885.0],["02-12",875.0],["02-13",898.0],["02-14",881.0],["02-15",901.0],["02-16",892.0],["02-19",910.0],["02-20",907.0],["02-21",902.0],["02-22",892.0],["02-23",890.0],["02-26",893.0],["02-27",889.0],["02-28",882.0],["02-29",887.0],["03-01",875.0],["03-04",893.0],["03-05",892.0],["03-06",888.0],["03-07",915.0],["03-08",922.0],["03-11",927.0],["03-12",932.0],["03-13",935.0],["03-14",936.0],["03-15",938.0],["03-18",923.0],["03-19",903.0],["03-20",896.0],["03-21",908.0],["03-22",908.0],["03-25",905.0],["03-26",907.0],["03-27",896.0],["03-28",896.0],["04-02",912.0],["04-03",922.0],["04-04",940.0],["04-05",923.0],["04-08",937.0],["04-09",978.0],["04-10",981.0],["04-11",969.0],["04-12",997.0],["04-15",967.0],["04-16",966.0],["04-17",957.0],["04-18",942.0],["04-19",941.0],["04-22",927.0],["04-23",912.0],["04-24",919.0],["04-25",911.0],["04-26",919.0],["04-29",922.0],["04-30",939.0],["05-01",936.0],["05-02",954.0],["05-03",968.0],["05-07",952.0],["05-08",968.0],["05-09",984.0],["05-10",995.0],["05-13",999.0],["05-14",1005.0],["05-15",1047.0],["05-16",1066.0],["05-17",1058.0],["05-20",1082.0],["05-21",1033.0],["05-22",1052.0],["05-23",1027.0],["05-24",1019.0],["05-28",1048.0],["05-29",1055.0],["05-30",1038.0],["05-31",1028.0],["06-03",1030.0],["06-04",1006.0],["06-05",1000.0],["06-06",996.0],["06-07",996.0],["06-10",971.0],["06-11",959.0],["06-12",955.0],["06-13",949.0],["06-14",953.0],["06-17",952.0],["06-18",971.0],["06-19",983.0],["06-20",982.0],["06-21",989.0],["06-24",1005.0],["06-25",1000.0],["06-26",997.0],["06-27",1005.0],["06-28",1004.0],["07-01",992.0],["07-02",984.0],["07-03",1003.0],["07-04",1012.0],["07-05",1009.0],["07-08",1013.0],["07-09",1002.0],["07-10",989.0],["07-11",984.0],["07-12",996.0],["07-15",998.0],["07-16",989.0],["07-17",1016.0],["07-18",1006.0],["07-19",966.0],["07-22",961.0],["07-23",949.0],["07-24",959.0],["07-25",944.0],["07-26",934.0],["07-29",946.0],["07-30",957.0],["07-31",967.0],["08-01",965.0],["08-02",973.0],["08-05",929.0],["08-06",916.0],["08-07",918.0],["08-08",923.0],["08-09",932.0],["08-12",940.0],["08-13",936.0],["08-14",939.0],["08-15",939.0],["08-16",954.0],["08-19",952.0],["08-20",965.0],["08-21",955.0],["08-22",961.0],["08-23",954.0],["08-27",963.0],["08-28",945.0],["08-29",941.0],["08-30",944.0],["09-02",930.0],["09-03",923.0],["09-04",903.0],["09-05",927.0],["09-06",931.0],["09-09",937.0],["09-10",943.0],["09-11",942.0],["09-12",956.0],["09-13",988.0],["09-16",996.0],["09-17",982.0],["09-18",981.0],["09-19",991.0],["09-20",988.0],["09-23",956.0],["09-24",969.0],["09-25",985.0],["09-26",1006.0],["09-27",1009.0],["09-30",990.0],["10-01",984.0],["10-02",995.0],["10-03",992.0],["10-04",1004.0],["10-07",986.0],["10-08",965.0],["10-09",954.0],["10-10",957.0],["10-11",975.0],["10-14",986.0],["10-15",983.0],["10-16",996.0],["10-17",998.0],["10-18",1010.0],["10-21",1017.0],["10-22",1022.0],["10-23",1035.0],["10-24",1037.0],["10-25",1004.0],["10-28",1018.0],["10-29",1050.0],["10-30",1037.0],["10-31",1005.0],["11-01",995.0],["11-04",999.0],["11-05",995.0],["11-06",987.0],["11-07",980.0],["11-08",987.0],["11-11",977.0],["11-12",952.0],["11-13",950.0],["11-14",933.0],["11-15",948.0],["11-18",956.0],["11-19",964.0],["11-20",965.0],["11-21",956.0],["11-22",962.0],["11-25",952.0],["11-26",933.0],["11-27",931.0],["11-28",937.0],["11-29",945.0],["12-02",942.0],["12-03",955.0],["12-04",944.0],["12-05",948.0],["12-06",936.0],["12-09",950.0],["12-10",939.0],["12-11",933.0],["12-12",944.0],["12-13",930.0],["12-16",925.0],["12-17",930.0],["12-18",934.0],["12-19",928.0],["12-20",922.0],["12-23",940.0],["12-24",942.0],["12-27",939.0],["12-30",921.0],["12-31",914.0]],"Silver":[["01-02",23.95],["01-03",23.28],["01-04",22.96],["01-05",22.98],["01-08",22.84],["01-09",23.12],["01-10",22.96],["01-11",23.03],["01-12",23.05],["01-15",23.21],["01-16",23.05],["01-17",22.8],["01-18",22.61],["01-19",22.8],["01-22",22.2],["01-23",22.26],["01-24",22.77],["01-25",22.88],["01-26",22.91],["01-29",23.0],["01-30",23.07],["01-31",23.09],["02-01",22.67],["02-02",23.23],["02-05",22.5],["02-06",22.3],["02-07",22.29],["02-08",22.35],["02-09",22.66],["02-12",22.91],["02-13",22.87],["02-14",22.09],["02-15",22.62],["02-16",23.01],["02-19",23.09],["02-20",23.06],["02-21",23.07],["02-22",23.07],["02-23",22.71],["02-26",22.51],["02-27",22.67],["02-28",22.34],["02-29",22.34],["03-01",22.72],["03-04",23.1],["03-05",23.93],["03-06",23.8],["03-07",24.16],["03-08",24.5],["03-11",24.36],["03-12",24.38],["03-13",24.3],["03-14",24.97],["03-15",25.22],["03-18",25.18],["03-19",24.93],["03-20",24.86],["03-21",25.43],["03-22",24.59],["03-25",24.66],["03-26",24.82],["03-27",24.52],["03-28",24.54],["04-02",25.65],["04-03",26.25],["04-04",27.0],["04-05",26.78],["04-08",27.82],["04-09",27.96],["04-10",28.07],["04-11",28.02],["04-12",29.02],["04-15",28.44],["04-16",28.25],["04-17",28.47],["04-18",28.47],["04-19",28.24],["04-22",27.73],["04-23",26.91],["04-24",27.12],["04-25",27.36],["04-26",27.62],["04-29",27.38],["04-30",26.66],["05-01",26.48],["05-02",26.23],["05-03",26.5],["05-07",27.26],["05-08",27.23],["05-09",27.62],["05-10",28.64],["05-13",28.12],["05-14",28.43],["05-15",28.82],["05-16",29.67],["05-17",29.68],["05-20",31.8],["05-21",31.64],["05-22",31.82],["05-23",30.54],["05-24",30.59],["05-28",31.55],["05-29",32.01],["05-30",31.52],["05-31",31.27],["06-03",30.37],["06-04",29.7],["06-05",29.61],["06-06",30.3],["06-07",30.27],["06-10",29.68],["06-11",29.25],["06-12",29.38],["06-13",29.24],["06-14",29.21],["06-17",29.23],["06-18",29.13],["06-19",29.48],["06-20",30.23],["06-21",30.43],["06-24",29.56],["06-25",29.56],["06-26",28.84],["06-27",28.87],["06-28",29.37],["07-01",29.25],["07-02",29.31],["07-03",30.13],["07-04",30.34],["07-05",30.58],["07-08",30.99],["07-09",31.05],["07-10",30.93],["07-11",31.02],["07-12",30.72],["07-15",30.74],["07-16",30.86],["07-17",30.91],["07-18",30.47],["07-19",29.11],["07-22",29.07],["07-23",29.05],["07-24",29.29],["07-25",27.99],["07-26",27.75],["07-29",28.14],["07-30",27.88],["07-31",28.56],["08-01",28.88],["08-02",28.95],["08-05",27.11],["08-06",27.07],["08-07",27.15],["08-08",26.93],["08-09",27.57],["08-12",27.96],["08-13",27.7],["08-14",27.95],["08-15",28.05],["08-16",28.14],["08-19",28.83],["08-20",29.77],["08-21",29.56],["08-22",29.57],["08-23",29.43],["08-27",29.9],["08-28",29.43],["08-29",29.49],["08-30",29.47],["09-02",28.62],["09-03",28.32],["09-04",28.08],["09-05",28.72],["09-06",28.84],["09-09",28.13],["09-10",28.43],["09-11",28.82],["09-12",28.77],["09-13",29.96],["09-16",30.91],["09-17",30.68],["09-18",30.59],["09-19",31.16],["09-20",31.32],["09-23",30.63],["09-24",30.88],["09-25",31.84],["09-26",32.48],["09-27",31.91],["09-30",31.07],["10-01",31.36],["10-02",31.39],["10-03",31.5],["10-04",32.06],["10-07",31.88],["10-08",31.28],["10-09",30.68],["10-10",30.67],["10-11",31.2],["10-14",31.25],["10-15",31.16],["10-16",31.8],["10-17",31.81],["10-18",32.12],["10-21",34.0],["10-22",34.42],["10-23",34.51],["10-24",34.13],["10-25",33.15],["10-28",33.38],["10-29",34.15],["10-30",34.03],["10-31",33.59],["11-01",32.8],["11-04",32.84],["11-05",32.65],["11-06",31.8],["11-07",31.11],["11-08",31.55],["11-11",31.32],["11-12",30.41],["11-13",30.91],["11-14",29.99],["11-15",30.66],["11-18",30.74],["11-19",31.29],["11-20",30.87],["11-21",31.07],["11-22",31.25],["11-25",30.79],["11-26",30.54],["11-27",30.49],["11-28",30.07],["11-29",30.7],["12-02",30.45],["12-03",30.91],["12-04",30.84],["12-05",31.34],["12-06",31.11],["12-09",31.63],["12-10",31.9],["12-11",31.7],["12-12",31.88],["12-13",30.73],["12-16",30.66],["12-17",30.31],["12-18",30.36],["12-19",29.49],["12-20",28.8],["12-23",29.61],["12-24",29.48],["12-27",29.64],["12-30",29.46],["12-31",28.91]]},"2025":{"Gold":[["01-02",2644.6],["01-03",2654.3],["01-06",2631.8],["01-07",2644.4],["01-08",2653.45],["01-09",2666.35],["01-10",2679.45],["01-13",2679.8],["01-14",2666.4],["01-15",2686.6],["01-16",2707.45],["01-17",2705.1],["01-20",2707.5],["01-21",2721.4],["01-22",2760.15],["01-23",2747.2],["01-24",2771.05],["01-27",2767.1],["01-28",2743.7],["01-29",2759.4],["01-30",2778.15],["01-31",2791.5],["02-03",2794.15],["02-04",2813.2],["02-05",2873.8],["02-06",2861.2],["02-07",2866.45],["02-10",2895.55],["02-11",2906.85],["02-12",2883.35],["02-13",2917.45],["02-14",2938.05],["02-17",2898.2],["02-18",2908.85],["02-19",2944.4],["02-20",2953.05],["02-21",2929.7],["02-24",2940.6],["02-25",2942.05],["02-26",2913.55],["02-27",2891.65],["02-28",2861.4],["03-03",2868.25],["03-04",2911.6],["03-05",2917.7],["03-06",2901.65],["03-07",2918.5],["03-10",2902.1],["03-11",2913.45],["03-12",2913.6],["03-13",2944.65],["03-14",2999.85],["03-17",2996.15],["03-18",3021.7],["03-19",3034.0],["03-20",3026.2],["03-21",3031.3],["03-24",3030.25],["03-25",3021.35],["03-26",3021.85],["03-27",3051.7],["03-28",3070.4],["03-31",3120.2],["04-01",3131.5],["04-02",3127.05],["04-03",3128.15],["04-04",3090.3],["04-07",3025.1],["04-08",3002.7],["04-09",3044.7],["04-10",3106.65],["04-11",3213.75],["04-14",3220.65],["04-15",3227.35],["04-16",3304.4],["04-17",3324.35],["04-22",3454.7],["04-23",3332.85],["04-24",3331.05],["04-25",3299.35],["04-28",3278.65],["04-29",3314.95],["04-30",3284.3],["05-01",3225.75],["05-02",3263.05],["05-06",3377.35],["05-07",3375.75],["05-08",3341.1],["05-09",3324.45],["05-12",3222.6],["05-13",3254.1],["05-14",3230.95],["05-15",3171.35],["05-16",3210.05],["05-19",3239.05],["05-20",3238.45],["05-21",3310.25],["05-22",3305.9],["05-23",3330.1],["05-27",3295.75],["05-28",3321.65],["05-29",3278.9],["05-30",3293.55],["06-02",3345.1],["06-03",3358.2],["06-04",3363.1],["06-05",3385.6],["06-06",3356.05],["06-09",3317.8],["06-10",3327.65],["06-11",3338.1],["06-12",3360.45],["06-13",3420.2],["06-16",3417.3],["06-17",3380.55],["06-18",3381.35],["06-19",3370.45],["06-20",3355.15],["06-23",3363.0],["06-24",3319.5],["06-25",3322.4],["06-26",3340.2],["06-27",3286.25],["06-30",3277.25],["07-01",3343.15],["07-02",3338.5],["07-03",3350.0],["07-04",3333.7],["07-07",3306.0],["07-08",3322.25],["07-09",3288.05],["07-10",3326.05],["07-11",3336.05],["07-14",3363.55],["07-15",3359.5],["07-16",3339.4],["07-17",3329.3],["07-18",3351.6],["07-21",3362.6],["07-22",3385.6],["07-23",3430.15],["07-24",3361.55],["07-25",3346.6],["07-28",3338.2],["07-29",3325.0],["07-30",3331.7],["07-31",3306.8],["08-01",3294.9],["08-04",3359.05],["08-05",3363.25],["08-06",3362.7],["08-07",3375.95],["08-08",3397.1],["08-11",3358.1],["08-12",3347.55],["08-13",3362.05],["08-14",3356.7],["08-15",3344.35],["08-18",3348.45],["08-19",3337.9],["08-20",3327.25],["08-21",3339.7],["08-22",3328.4],["08-26",3372.9],["08-27",3381.9],["08-28",3397.85],["08-29",3407.5],["09-01",3468.8],["09-02",3478.0],["09-03",3536.9],["09-04",3539.45],["09-05",3548.6],["09-08",3610.5],["09-09",3654.1],["09-10",3646.4],["09-11",3617.95],["09-12",3645.35],["09-15",3638.2],["09-16",3695.4],["09-17",3669.7],["09-18",3672.45],["09-19",3657.85],["09-22",3721.25],["09-23",3788.4],["09-24",3768.05],["09-25",3752.4],["09-26",3748.75],["09-29",3812.85],["09-30",3806.55],["10-01",3886.1],["10-02",3877.5],["10-03",3860.7],["10-06",3941.95],["10-07",3962.3],["10-08",4034.75],["10-09",4040.6],["10-10",3998.05],["10-13",4070.9],["10-14",4143.8],["10-15",4191.25],["10-16",4225.55],["10-17",4338.25],["10-20",4252.75],["10-21",4275.1],["10-22",4081.5],["10-23",4125.7],["10-24",4069.65],["10-27",4029.7],["10-28",3910.2],["10-29",4024.5],["10-30",3986.4],["10-31",4013.2],["11-03",3994.15],["11-04",3992.7],["11-05",3964.85],["11-06",4004.3],["11-07",4006.4],["11-10",4077.6],["11-11",4137.5],["11-12",4120.1],["11-13",4234.3],["11-14",4161.2],["11-17",4083.2],["11-18",4041.05],["11-19",4110.65],["11-20",4062.55],["11-21",4034.3],["11-24",4067.95],["11-25",4130.15],["11-26",4155.95],["11-27",4154.0],["11-28",4159.4],["12-01",4254.1],["12-02",4185.7],["12-03",4200.9],["12-04",4199.5],["12-05",4224.05],["12-08",4204.15],["12-09",4204.85],["12-10",4191.4],["12-11",4213.55],["12-12",4319.5],["12-15",4337.5],["12-16",4276.25],["12-17",4314.85],["12-18",4321.6],["12-19",4327.55],["12-22",4406.1],["12-23",4481.85],["12-24",4480.8],["12-29",4457.75],["12-30",4389.45],["12-31",4307.95]],"Palladium":[["01-02",910.0],["01-03",929.0],["01-06",924.0],["01-07",930.0],["01-08",929.0],["01-09",928.0],["01-10",947.0],["01-13",940.0],["01-14",949.0],["01-15",950.0],["01-16",960.0],["01-17",940.0],["01-20",946.0],["01-21",936.0],["01-22",968.0],["01-23",986.0],["01-24",1001.0],["01-27",975.0],["01-28",965.0],["01-29",957.0],["01-30",982.0],["01-31",991.0],["02-03",1012.0],["02-04",1015.0],["02-05",996.0],["02-06",988.0],["02-07",991.0],["02-10",977.0],["02-11",975.0],["02-12",974.0],["02-13",988.0],["02-14",1004.0],["02-17",985.0],["02-18",984.0],["02-19",990.0],["02-20",986.0],["02-21",969.0],["02-24",961.0],["02-25",940.0],["02-26",939.0],["02-27",927.0],["02-28",917.0],["03-03",933.0],["03-04",947.0],["03-05",958.0],["03-06",935.0],["03-07",953.0],["03-10",957.0],["03-11",952.0],["03-12",955.0],["03-13",950.0],["03-14",968.0],["03-17",976.0],["03-18",980.0],["03-19",964.0],["03-20",950.0],["03-21",947.0],["03-24",963.0],["03-25",960.0],["03-26",956.0],["03-27",970.0],["03-28",982.0],["03-31",980.0],["04-01",991.0],["04-02",989.0],["04-03",966.0],["04-04",929.0],["04-07",922.0],["04-08",920.0],["04-09",911.0],["04-10",921.0],["04-11",921.0],["04-14",938.0],["04-15",953.0],["04-16",970.0],["04-17",954.0],["04-22",946.0],["04-23",944.0],["04-24",942.0],["04-25",943.0],["04-28",949.0],["04-29",948.0],["04-30",936.0],["05-01",946.0],["05-02",946.0],["05-06",954.0],["05-07",979.0],["05-08",961.0],["05-09",984.0],["05-12",973.0],["05-13",950.0],["05-14",961.0],["05-15",952.0],["05-16",958.0],["05-19",969.0],["05-20",976.0],["05-21",1001.0],["05-22",1019.0],["05-23",1007.0],["05-27",981.0],["05-28",982.0],["05-29",972.0],["05-30",970.0],["06-02",976.0],["06-03",991.0],["06-04",1010.0],["06-05",1018.0],["06-06",1020.0],["06-09",1079.0],["06-10",1059.0],["06-11",1083.0],["06-12",1061.0],["06-13",1060.0],["06-16",1046.0],["06-17",1028.0],["06-18",1055.0],["06-19",1035.0],["06-20",1055.0],["06-23",1070.0],["06-24",1073.0],["06-25",1065.0],["06-26",1106.0],["06-27",1131.0],["06-30",1150.0],["07-01",1114.0],["07-02",1107.0],["07-03",1147.0],["07-04",1135.0],["07-07",1111.0],["07-08",1118.0],["07-09",1082.0],["07-10",1113.0],["07-11",1161.0],["07-14",1234.0],["07-15",1194.0],["07-16",1198.0],["07-17",1221.0],["07-18",1304.0],["07-21",1274.0],["07-22",1262.0],["07-23",1282.0],["07-24",1269.0],["07-25",1215.0],["07-28",1235.0],["07-29",1245.0],["07-30",1256.0],["07-31",1224.0],["08-01",1192.0],["08-04",1208.0],["08-05",1191.0],["08-06",1174.0],["08-07",1151.0],["08-08",1138.0],["08-11",1134.0],["08-12",1154.0],["08-13",1127.0],["08-14",1133.0],["08-15",1139.0],["08-18",1119.0],["08-19",1123.0],["08-20",1111.0],["08-21",1099.0],["08-22",1117.0],["08-26",1092.0],["08-27",1095.0],["08-28",1098.0],["08-29",1101.0],["09-01",1117.0],["09-02",1122.0],["09-03",1135.0],["09-04",1140.0],["09-05",1124.0],["09-08",1128.0],["09-09",1143.0],["09-10",1149.0],["09-11",1187.0],["09-12",1203.0],["09-15",1209.0],["09-16",1196.0],["09-17",1152.0],["09-18",1149.0],["09-19",1153.0],["09-22",1165.0],["09-23",1203.0],["09-24",1230.0],["09-25",1232.0],["09-26",1246.0],["09-29",1282.0],["09-30",1230.0],["10-01",1266.0],["10-02",1270.0],["10-03",1262.0],["10-06",1271.0],["10-07",1320.0],["10-08",1391.0],["10-09",1473.0],["10-10",1439.0],["10-13",1458.0],["10-14",1487.0],["10-15",1557.0],["10-16",1550.0],["10-17",1562.0],["10-20",1456.0],["10-21",1438.0],["10-22",1402.0],["10-23",1477.0],["10-24",1405.0],["10-27",1421.0],["10-28",1358.0],["10-29",1413.0],["10-30",1436.0],["10-31",1445.0],["11-03",1461.0],["11-04",1412.0],["11-05",1398.0],["11-06",1429.0],["11-07",1393.0],["11-10",1407.0],["11-11",1447.0],["11-12",1447.0],["11-13",1486.0],["11-14",1419.0],["11-17",1383.0],["11-18",1406.0],["11-19",1423.0],["11-20",1405.0],["11-21",1363.0],["11-24",1371.0],["11-25",1388.0],["11-26",1406.0],["11-27",1428.0],["11-28",1430.0],["12-01",1467.0],["12-02",1422.0],["12-03",1457.0],["12-04",1451.0],["12-05",1466.0],["12-08",1475.0],["12-09",1473.0],["12-10",1499.0],["12-11",1481.0],["12-12",1518.0],["12-15",1524.0],["12-16",1570.0],["12-17",1636.0],["12-18",1675.0],["12-19",1705.0],["12-22",1764.0],["12-23",1803.0],["12-24",1825.0],["12-29",1681.0],["12-30",1623.0],["12-31",1567.0]],"Platinum":[["01-02",911.0],["01-03",934.0],["01-06",947.0],["01-07",945.0],["01-08",955.0],["01-09",959.0],["01-10",968.0],["01-13",960.0],["01-14",958.0],["01-15",943.0],["01-16",947.0],["01-17",941.0],["01-20",939.0],["01-21",937.0],["01-22",949.0],["01-23",946.0],["01-24",952.0],["01-27",945.0],["01-28",947.0],["01-29",945.0],["01-30",963.0],["01-31",977.0],["02-03",968.0],["02-04",969.0],["02-05",980.0],["02-06",990.0],["02-07",998.0],["02-10",986.0],["02-11",987.0],["02-12",986.0],["02-13",1004.0],["02-14",1008.0],["02-17",985.0],["02-18",989.0],["02-19",984.0],["02-20",980.0],["02-21",970.0],["02-24",968.0],["02-25",968.0],["02-26",974.0],["02-27",970.0],["02-28",946.0],["03-03",952.0],["03-04",960.0],["03-05",974.0],["03-06",965.0],["03-07",976.0],["03-10",975.0],["03-11",976.0],["03-12",985.0],["03-13",977.0],["03-14",993.0],["03-17",1000.0],["03-18",1011.0],["03-19",990.0],["03-20",991.0],["03-21",976.0],["03-24",979.0],["03-25",979.0],["03-26",975.0],["03-27",976.0],["03-28",987.0],["03-31",995.0],["04-01",994.0],["04-02",979.0],["04-03",976.0],["04-04",942.0],["04-07",918.0],["04-08",925.0],["04-09",919.0],["04-10",938.0],["04-11",945.0],["04-14",955.0],["04-15",960.0],["04-16",958.0],["04-17",963.0],["04-22",971.0],["04-23",968.0],["04-24",977.0],["04-25",964.0],["04-28",979.0],["04-29",991.0],["04-30",971.0],["05-01",965.0],["05-02",971.0],["05-06",980.0],["05-07",988.0],["05-08",977.0],["05-09",988.0],["05-12",987.0],["05-13",990.0],["05-14",999.0],["05-15",978.0],["05-16",989.0],["05-19",995.0],["05-20",1011.0],["05-21",1045.0],["05-22",1074.0],["05-23",1087.0],["05-27",1077.0],["05-28",1091.0],["05-29",1079.0],["05-30",1078.0],["06-02",1051.0],["06-03",1061.0],["06-04",1092.0],["06-05",1121.0],["06-06",1163.0],["06-09",1206.0],["06-10",1209.0],["06-11",1264.0],["06-12",1262.0],["06-13",1275.0],["06-16",1248.0],["06-17",1254.0],["06-18",1283.0],["06-19",1294.0],["06-20",1292.0],["06-23",1298.0],["06-24",1316.0],["06-25",1314.0],["06-26",1402.0],["06-27",1367.0],["06-30",1358.0],["07-01",1333.0],["07-02",1356.0],["07-03",1414.0],["07-04",1378.0],["07-07",1363.0],["07-08",1373.0],["07-09",1354.0],["07-10",1359.0],["07-11",1357.0],["07-14",1402.0],["07-15",1380.0],["07-16",1378.0],["07-17",1412.0],["07-18",1464.0],["07-21",1450.0],["07-22",1447.0],["07-23",1448.0],["07-24",1388.0],["07-25",1398.0],["07-28",1407.0],["07-29",1388.0],["07-30",1388.0],["07-31",1319.0],["08-01",1264.0],["08-04",1320.0],["08-05",1319.0],["08-06",1327.0],["08-07",1329.0],["08-08",1335.0],["08-11",1319.0],["08-12",1338.0],["08-13",1348.0],["08-14",1345.0],["08-15",1361.0],["08-18",1336.0],["08-19",1346.0],["08-20",1315.0],["08-21",1330.0],["08-22",1342.0],["08-26",1339.0],["08-27",1344.0],["08-28",1351.0],["08-29",1347.0],["09-01",1396.0],["09-02",1390.0],["09-03",1396.0],["09-04",1407.0],["09-05",1386.0],["09-08",1400.0],["09-09",1390.0],["09-10",1387.0],["09-11",1383.0],["09-12",1389.0],["09-15",1399.0],["09-16",1408.0],["09-17",1379.0],["09-18",1391.0],["09-19",1389.0],["09-22",1423.0],["09-23",1439.0],["09-24",1475.0],["09-25",1505.0],["09-26",1541.0],["09-29",1606.0],["09-30",1544.0],["10-01",1594.0],["10-02",1577.0],["10-03",1586.0],["10-06",1612.0],["10-07",1615.0],["10-08",1651.0],["10-09",1664.0],["10-10",1621.0],["10-13",1651.0],["10-14",1664.0],["10-15",1660.0],["10-16",1666.0],["10-17",1668.0],["10-20",1585.0],["10-21",1577.0],["10-22",1553.0],["10-23",1655.0],["10-24",1601.0],["10-27",1594.0],["10-28",1546.0],["10-29",1613.0],["10-30",1608.0],["10-31",1594.0],["11-03",1602.0],["11-04",1555.0],["11-05",1539.0],["11-06",1579.0],["11-07",1557.0],["11-10",1577.0],["11-11",1594.0],["11-12",1583.0],["11-13",1627.0],["11-14",1561.0],["11-17",1551.0],["11-18",1540.0],["11-19",1562.0],["11-20",1544.0],["11-21",1499.0],["11-24",1520.0],["11-25",1545.0],["11-26",1562.0],["11-27",1617.0],["11-28",1635.0],["12-01",1677.0],["12-02",1615.0],["12-03",1646.0],["12-04",1649.0],["12-05",1656.0],["12-08",1658.0],["12-09",1648.0],["12-10",1671.0],["12-11",1673.0],["12-12",1715.0],["12-15",1770.0],["12-16",1806.0],["12-17",1930.0],["12-18",1911.0],["12-19",1932.0],["12-22",2059.0],["12-23",2178.0],["12-24",2295.0],["12-29",2303.0],["12-30",2160.0],["12-31",2027.0]],"Silver":[["01-02",29.41],["01-03",29.82],["01-06",30.27],["01-07",30.23],["01-08",30.14],["01-09",30.29],["01-10",30.36],["01-13",29.88],["01-14",29.73],["01-15",29.99],["01-16",30.7],["01-17",30.63],["01-20",30.25],["01-21",30.48],["01-22",30.8],["01-23",30.48],["01-24",30.84],["01-27",30.58],["01-28",30.15],["01-29",30.44],["01-30",31.0],["01-31",31.61],["02-03",31.29],["02-04",31.59],["02-05",32.27],["02-06",32.02],["02-07",32.27],["02-10",32.27],["02-11",31.73],["02-12",31.77],["02-13",32.27],["02-14",33.1],["02-17",32.48],["02-18",32.46],["02-19",32.91],["02-20",33.06],["02-21",32.93],["02-24",32.51],["02-25",32.15],["02-26",31.71],["02-27",31.73],["02-28",31.14],["03-03",31.52],["03-04",31.91],["03-05",32.26],["03-06",32.43],["03-07",32.49],["03-10",32.51],["03-11",32.55],["03-12",33.03],["03-13",33.15],["03-14",33.9],["03-17",33.77],["03-18",34.09],["03-19",33.92],["03-20",33.31],["03-21",33.18],["03-24",33.09],["03-25",33.44],["03-26",33.76],["03-27",34.11],["03-28",34.4],["03-31",34.05],["04-01",33.97],["04-02",33.87],["04-03",32.48],["04-04",31.34],["04-07",30.32],["04-08",30.32],["04-09",30.18],["04-10",30.93],["04-11",31.27],["04-14",32.27],["04-15",32.31],["04-16",32.95],["04-17",32.31],["04-22",32.61],["04-23",32.96],["04-24",33.4],["04-25",33.34],["04-28",33.01],["04-29",33.23],["04-30",32.23],["05-01",32.12],["05-02",32.37],["05-06",33.02],["05-07",32.88],["05-08",32.43],["05-09",32.52],["05-12",32.02],["05-13",32.98],["05-14",32.88],["05-15",32.09],["05-16",32.13],["05-19",32.52],["05-20",32.5],["05-21",33.16],["05-22",32.73],["05-23",33.09],["05-27",32.9],["05-28",33.28],["05-29",33.37],["05-30",33.08],["06-02",33.24],["06-03",34.25],["06-04",34.35],["06-05",35.8],["06-06",36.19],["06-09",36.25],["06-10",36.76],["06-11",36.2],["06-12",36.18],["06-13",36.08],["06-16",36.38],["06-17",37.06],["06-18",37.16],["06-19",36.31],["06-20",36.13],["06-23",36.13],["06-24",36.06],["06-25",35.77],["06-26",36.59],["06-27",35.98],["06-30",35.98],["07-01",36.51],["07-02",36.3],["07-03",36.88],["07-04",36.88],["07-07",36.24],["07-08",36.77],["07-09",36.59],["07-10",36.81],["07-11",37.5],["07-14",38.99],["07-15",38.26],["07-16",37.88],["07-17",37.76],["07-18",38.27],["07-21",38.47],["07-22",38.84],["07-23",39.32],["07-24",39.02],["07-25",38.73],["07-28",38.12],["07-29",38.1],["07-30",37.92],["07-31",36.22],["08-01",36.49],["08-04",37.15],["08-05",37.35],["08-06",37.77],["08-07",38.38],["08-08",38.29],["08-11",37.76],["08-12",37.69],["08-13",38.6],["08-14",38.31],["08-15",37.73],["08-18",38.09],["08-19",38.07],["08-20",37.08],["08-21",37.56],["08-22",38.01],["08-26",38.42],["08-27",38.22],["08-28",38.94],["08-29",38.8],["09-01",40.58],["09-02",40.52],["09-03",40.86],["09-04",40.97],["09-05",40.74],["09-08",41.19],["09-09",41.24],["09-10",41.2],["09-11",41.08],["09-12",42.26],["09-15",42.2],["09-16",42.69],["09-17",41.27],["09-18",41.85],["09-19",42.23],["09-22",43.73],["09-23",44.33],["09-24",43.88],["09-25",44.94],["09-26",45.0],["09-29",46.95],["09-30",46.17],["10-01",47.28],["10-02",47.4],["10-03",47.6],["10-06",48.56],["10-07",48.45],["10-08",49.01],["10-09",49.7],["10-10",50.76],["10-13",51.24],["10-14",51.52],["10-15",52.59],["10-16",53.02],["10-17",54.1],["10-20",51.8],["10-21",49.95],["10-22",47.76],["10-23",49.1],["10-24",48.01],["10-27",47.37],["10-28",46.44],["10-29",48.17],["10-30",48.18],["10-31",48.96],["11-03",48.77],["11-04",47.76],["11-05",47.61],["11-06",48.69],["11-07",48.7],["11-10",50.04],["11-11",51.24],["11-12",51.53],["11-13",53.87],["11-14",52.01],["11-17",51.05],["11-18",50.3],["11-19",52.2],["11-20",50.84],["11-21",48.91],["11-24",50.04],["11-25",51.2],["11-26",52.48],["11-27",53.4],["11-28",53.91],["12-01",57.49],["12-02",57.44],["12-03",58.37],["12-04",57.56],["12-05",58.1],["12-08",58.38],["12-09",58.63],["12-10",61.03],["12-11",62.12],["12-12",64.51],["12-15",63.87],["12-16",62.98],["12-17",65.94],["12-18",66.3],["12-19",65.78],["12-22",69.22],["12-23",69.74],["12-24",72.18],["12-29",74.64],["12-30",74.83],["12-31",71.99]]},"2026":{"Gold":[["01-02",4386.85],["01-05",4436.7],["01-06",4452.75],["01-07",4459.55],["01-08",4432.1],["01-09",4471.2],["01-12",4587.7],["01-13",4582.8],["01-14",4633.0],["01-15",4611.1],["01-16",4607.25],["01-19",4664.95],["01-20",4723.95],["01-21",4860.75],["01-22",4825.55],["01-23",4926.2],["01-26",5093.55],["01-27",5088.1],["01-28",5277.8],["01-29",5501.7],["01-30",5063.45],["02-02",4685.45],["02-03",4923.65],["02-04",5051.75],["02-05",4859.1],["02-06",4870.1],["02-09",4992.5],["02-10",5047.95],["02-11",5070.3],["02-12",5049.89],["02-13",4952.29],["02-14",5041.6],["02-15",5042.34],["02-16",4977.38],["02-17",4875.96],["02-18",5000.8],["02-19",5001.54],["02-20",5065.11],["02-21",5107.34],["02-22",5105.45],["02-23",5214.24],["02-24",5136.06],["02-25",5212.1],["02-26",5178.7],["03-09",5137.1]],"Palladium":[["01-02",1649.0],["01-05",1677.0],["01-06",1717.0],["01-07",1755.0],["01-08",1725.0],["01-09",1850.0],["01-12",1878.0],["01-13",1829.0],["01-14",1844.0],["01-15",1801.0],["01-16",1755.0],["01-19",1812.0],["01-20",1858.0],["01-21",1867.0],["01-22",1860.0],["01-23",1912.0],["01-26",2090.0],["01-27",2051.0],["01-28",1947.0],["01-29",2076.0],["01-30",1775.0],["02-02",1671.0],["02-03",1808.0],["02-04",1834.0],["02-05",1738.0],["02-06",1651.0],["02-09",1701.0],["02-10",1729.0],["02-11",1761.0],["02-12",1696.59],["02-13",1650.97],["02-14",1698.11],["02-15",1702.87],["02-16",1699.33],["02-17",1691.01],["02-18",1730.83],["02-19",1691.95],["02-20",1757.19],["02-21",1764.33],["02-22",1766.71],["02-23",1761.83],["02-24",1774.73],["02-25",1816.48],["02-26",1761.6],["03-09",1691.97]],"Platinum":[["01-02",2133.0],["01-05",2221.0],["01-06",2310.0],["01-07",2319.0],["01-08",2225.0],["01-09",2295.0],["01-12",2377.0],["01-13",2345.0],["01-14",2401.0],["01-15",2342.0],["01-16",2346.0],["01-19",2362.0],["01-20",2397.0],["01-21",2462.0],["01-22",2480.0],["01-23",2663.0],["01-26",2860.0],["01-27",2685.0],["01-28",2630.0],["01-29",2755.0],["01-30",2210.0],["02-02",2063.0],["02-03",2241.0],["02-04",2283.0],["02-05",2120.0],["02-06",2012.0],["02-09",2069.0],["02-10",2099.0],["02-11",2178.0],["02-12",2083.54],["02-13",2025.47],["02-14",2061.04],["02-15",2065.64],["02-16",2048.2],["02-17",2018.12],["02-18",2085.34],["02-19",2070.99],["02-20",2154.44],["02-21",2161.6],["02-22",2163.5],["02-23",2150.46],["02-24",2147.33],["02-25",2320.54],["02-26",2236.96],["03-09",2185.18]],"Silver":[["01-02",74.22],["01-05",75.07],["01-06",78.47],["01-07",78.98],["01-08",75.2],["01-09",78.14],["01-12",84.07],["01-13",85.82],["01-14",91.09],["01-15",91.27],["01-16",90.8],["01-19",93.0],["01-20",95.7],["01-21",94.86],["01-22",93.38],["01-23",99.0],["01-26",109.61],["01-27",111.56],["01-28",112.8],["01-29",118.45],["01-30",103.19],["02-02",81.97],["02-03",87.49],["02-04",90.59],["02-05",78.71],["02-06",74.94],["02-09",80.36],["02-10",82.28],["02-11",86.1],["02-12",82.39],["02-13",76.56],["02-14",77.4],["02-15",77.4],["02-16",75.18],["02-17",73.48],["02-18",77.88],["02-19",77.87],["02-20",82.36],["02-21",84.72],["02-22",84.75],["02-23",87.14],["02-24",87.08],["02-25",90.78],["02-26",86.7],["03-09",86.21]]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// 47552 entries across 59 years, delta-encoded columns
+window._loadSpotSeedColumnar({"v":1,"years":{"1968":{"Gold":{"n":244,"d0":1,"p0":3518,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBARIBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"/v/+/wAAAAAAAAEAAgABAAAAAQABAAAA//8AAAAAAQAAAAAA//8AAAEAAAAAAP//AAABAP//AQD//wAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYAdj/CgCc/zIA7P8ZACMALQAFAPb/2P8FAEEA5/8eAPb/GQAFADcAAAAPACMACgDY/xQAFAAKANj/FAAyAEsASwAoADwA2P+6/xkA5/8KAPb/GQAZALD/FADx//v/DwD7/1AAuv+I/0YA7P9GAN3/AAAAAOz/CgDx/w8A+//7/wUADwAFAPH/3f/T/7X/4v8FAOf/kv8UAG4A0/8AADcA9v/d/w8AFADs//b/AAAFAAAA+//n//b/DwAPABQABQAKAAUAFABfAL//AADn/w8AAAAZAAUADQD4/wUABQAAAAAAAAAFAA0AAgAjAPb/CAD9//n/BQD7/wIA8f/E//b/fv9GAPb/WgD7/8n/2/8lAAoA9v/n/xkAFADi//H/FwACAAoACAAWAOL/9v/i/yMACAARAAMA8/8KABcAAgAAABkAAAAFAEYAzv/7/woA6v/f/woAAAAFABkAPwDf//b/HAAFAAcANwDY/wgAFgA/APH//f8FAAAAAAAeAPv/"},"Silver":{"n":251,"d0":1,"p0":217,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBBgEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":1,"p":"Bvr/APv9AQT+/AD/AgH//vwF/f76BAL++wIB/P//AAIG/QEFAP8EBAD+DP8A+gYE/QIPDNsc8Ab4AgAG+wP++v/5/gMI//wJBfkFCAD6AQIHAPz6AQL4BwAEAAICBgQBBPgBAgL9+QYA+/8DA/0GB/r6/QAK+v4DA/4AAQH7AwD+/fQK+/4E/Pv6CfwABPsAAPsG+gL6AAL8/v36DQL//gYJ9wP9AP4CAAABAv/++Qj7A/4CAv4B//8A/QH9/fsB/gL//PwE/vz5+AMK9wT+AQAG//39BgIB/QEDAQUBAgH+AvX5Bv/9AQQBBAD6BPwB/QAEAP0A//4D/g=="}},"1969":{"Gold":{"n":254,"d0":1,"p0":4180,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"CgANAAcAIwADAO7/4v8oACMA+/+w/x4AFAAUANj/7P8UABkAAAAKAAAA+//+/xYA+f/4/wAA/v8HAPv/+/8PAP7/AgD7/wMABwD+/wIABQADAP3/AAAPACMAIwAPANP/5f8MAPH/AwDu/xcABQAFAAcADwD7/w0A7v/s/wAAFAAFAAAAAwACAPv/+f/a/xIADwD9/wAA/v8WAPT//f8eAAAABQAAAAAA9P/4/wgAEQD7//H/BQAAAAAAAAD+//3//v8CAAUAAAD2/+D/BwDs/7D/+f+e/93/+/+AAO7/5/8AAOL/GQD2/wUAAADq//3/4v8IAAwADQDz/w8AGgD//xoAIgDs/wAAAAAFAAUA9v8IAPj/CgD7//n/AgD7//P/6f8AAPz/+v8BAOf/+//5/wwAHgDn//b/HADk/woA+f/9//7//f/7//b/AAAFAAAA8P///wsAAQAAAAAACAD7/wIABQAAAAAA9P/9/wMA+P8FAAAA9v/2/wAACgADABUA9//0//7/AgD9//T/BQAFAPj/+f/2//P/9v/i/woACgD+//j/+f/z/+X/+//9/9P/7P+h/x4A9P/k/wAACgD0/7f/l/8KAOX/0P8XAAUA+P/+//j/9v/+//b//f/s/wAAEgAPAPP/7/8HAP7/+P8EAAkABQAFAAAA/v8="},"Silver":{"n":254,"d0":1,"p0":196,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":1,"p":"AQABBP8D/gEB/v0AA/7+AQH//wIA/wD/+v3/AP/8+gj7AwH/AP0AA////wYDBP3++wT9//4B/wIC/v//Av///wMA/QH/AAAAAf8A/QEB/wP+/wAA//8FBP39/AP+Av7/Af8BAv8AAAAA/wH+/f3/AQD/9/8CA/oBAf/+AAP+AAIAAgEE/QID//0BAgH+/gEA/QAB/gH+AQABB/wDA//+/gP+Af//Af8BAgIA/wMD/wID/v8E/gECBQL7/wEE/gP++wT8AgD///8D/QQC/gH/Bv4BAwIF/QIA/f4CAP3/AP7+AgAA/QABAQIB//39Afv7Af4BAP3/AgIBAwL+/w=="}},"1970":{"Gold":{"n":255,"d0":1,"p0":3513,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQQBAQE=","pw":1,"p":"/QPz/vMN+v39+AACAwoG/wIAAP79BQD/AQEAAvz/AgD+AAEB/gIAAAAB/wD7AgEBAQAFAgEW9P0CCwIAAwf7/vsIB/sFCh/3AAEICQXv+QYI/QAFHQX/APjx+gEAA/4A//n9+/Pv+/H2/gEGLe8GBQDw8gz3AwAFEu4DA//+9/z+/QEAAgD+/wEC/gH+/gIBAP//AQEC/QAA+wAD/QAAAAMFEQkBG/cHFhz7+eQcAAcF+ewP/QMH+/YAAwIEE/EZKPb2Bi4LCRL5ChUN8SNfBM/inB7nvx72FyDUFhseyRkAAPv0Fg7w/ecXAP379u/nFQEQI/kB/gL28fr/BQA="},"Silver":{"n":255,"d0":1,"p0":180,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQQBAQE=","pw":1,"p":"AwL9AgD9AgEE/gEC/gABAv7/Bf/+AQL+AAEA/gABAP/+Av8AAP8BAv8BAAP9/wAA//8A/wAC//8AAAIAAAH///8AAP4BAf8AAQAAAP8A//z7/QEA+Aj9AwIA/fwAAv///P77AwMAAvwBAgABAgL8/gABAv0C/wH//wD//wEC/gD+AgAAAAICA/0DAwL//wEFAP8AAf4C/f8C/QECAAMCA/7/AwEB/gAB/wABAAAC/v8A/f4C/f8BAP/8A//7AgEA/gQB/wAA/QIB//4BAAAGAf/+AQH/AQL+AAP9Av0AAf7//gH9+gL+//wE/wH///3+AgMB/f4GAAL8AQAB//8="}},"1971":{"Gold":{"n":253,"d0":3,"p0":3733,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEB","pw":2,"p":"EQAAAPX/DAD//yMAKwDu/wUA+//v/woADwDp//v/FAD5/wIA+/8KABkAIwDq//3/BQAXAAwAAwARAPH/BQD7//v/+f/9/wUA/v/9/wQA/P/7/wgAAAD+////BgADAAwABwAFAPb/+/8CAAgA+P/+//////////n/+P8FAA8A9P8HAAAAAwACAPv/AAD//wQAAgAAAPz/BwALAPf/9/8YABwAEQDu/ywA7P82AOD/6f8jAEYADwD7/x4ACgC6/x4AGQDi/xcA/v/m/woABQDs//T/BwD2/+z/3f/d/wUA+//1/x0AEQD7/wUADwAPAA8A4//9/+z/IAD2/x8A7v8HAPb/CAD8/wsAAAAFAAQAEAApAP3/FgAnAP//8/81AAsADAAbAAAA3/8EAD0A8f8ZACgAyf8wAAUA5P8oAPb/+//x/wAA3f9b//b/4v9aAA0ABwD2/9v/JQD0/wEAGgAEACIA8//7/xkA9v8FACgA4v8mAP3/6v/i/yAA8f8JAAEABQD7/wgABwD6/wQA+f8EAPv/AwD7/wAAAgABAPr/+//l/xsA7P/7/woACgANAA8A+P8FABkADwDt/xMADwAKAPv/EgAaAOH/IAD2//v/CgANABEA/v/k//b/EgD9/wAA/P/r/93/v/83ABQAJgDo/wEAFwD9/wwA"},"Silver":{"n":249,"d0":3,"p0":165,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBCgEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQQBAQE=","pw":1,"p":"AAAEAAL/AP4A+/z/AP4DAvsDAAACAQD+Af0AAQD/AAEBAAAA//4CAQP+AAMCAAH/AAACAP8AAAH+AAMAAAACAAP/AQEA/gD+AAIBAP4A+wIB///+AwAA/gH/AQL+AAD///sD/f8AAf4AAP8ABf4AAf8CAf/+/QL/AQD+/wMA/gH/AQAA/QL+/wH+AAIAAP8BBP//AwL//gEA/AIAAP4B///6/gL//v35Bf3+AgL/AgAA/gAB//8A/wAA+wEB//wB/wIAAgD9/gIAAQH8Av7+AAL/AgL/AAL/Av4B//8C/gH/AgD/AwAF/QECAv7/AAIC/AAAAP0AAv8="}},"1972":{"Gold":{"n":254,"d0":2,"p0":4373,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"PgAIAC0AVwD7/9z/9/8UABwAGQALAO3/8f8OAAQAEQD+/wwAUAD7/zYAbwDs/6v/9v9LAOX/LwDx//v/4v8PAC0A5v8QABQAAwAHAPb/9f/3/8T/KADx//v/HAD9/wUA+f8MAAUA9v8RAPn/+/8FAAAAAAAAAPv/9P8UAPv/AgAAAPb/BQAFAAUAJAA+APj/AAANAOn/EgD7//3/8v8JAAgADABGADIA2P8FABIAawDwALr/4v/s/wAAqgAsAd3/v/9GAB4Aq/8cADkAeAA8AM7/KAAUACMA9AHIAI3/bP2uAfz+WgAUAIj/ZADR/yMA/ADO/4j/ZAC0AJz/DwB9AOz/PAD2/7X/QQCr/xkACgAAACgAzv/d/zcA7P8jAA0ABwC0AJEA9v94AH7/of9BACn/yf8tAPv/ef9kAAUALQAAACMAJgAqAPb/5//T/xQAAAAAAAUAAAAPAP7/DAAKAOz/+//2/7X/YP/x/xQA+/8PAKv/2P8eAC0A+/8AAAAARgBTAN//KADs/+H/tP8HACMAFADn/wsA//8DAOH/EgDn/wAA+//5/8H/GQAIAPj/4v8KAJL/8f/6//f/yf/i/2r/HABwADwA9v83ADIAOgD9/wAAHgDO/9j/CgDn/w8AAADn/woAKwAMAGQAZAC6/87/+/9LAPn/8/8="},"Silver":{"n":252,"d0":2,"p0":137,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"AgP/AwAE/gH+BQAB/gAA/QABBf4DAvwBAv/+AgD8AAABAP8B/gAB/gABAgACAv4CAAAA/gD/AQIB/gD/AgIABP/+AQH/AAD9AQD//wEAAAACAAP//wABAAH//wAAAQH//wH//gABAP7/Av8BAv8AAAEAAQD///8AAQD+AQD/AQUHAv4CBQEBAf0D/AIC/v8J//wE/gAB//4DAP0CAQACAAAEAv4AAgH/AAH//AD9/P8C/vj/AQEB/QAABv8AAgL//wQA//8AAv4DA/8CAP7+AAH+AwH/A/0D/P4C/wAA//8BAQAB/wAEAAIC/gb+AQMC/gAD//7/BQH/AQM="}},"1973":{"Gold":{"n":253,"d0":1,"p0":6499,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBgED","pw":2,"p":"GgD7/wMA+P8AAPb/BQAAAAAA+//n/+//y/8yADwA0/8yACMA4v9aAOz/KABGAOz/yADs/xQAHgC9/zkAZAAOARQARgDwAPAAwgFYAqj9TP+aAUYAZABw/gAAav+WAAAAg//n/4P/rwA8AN3/GQC6/9j/bgBeASYCu/5kAGQAnP8ZACgAXwAZAN3/GQAZAPH/uv+w/+z/hwADAAwA4v/O/yMAGQAAAOL/AAD2/wAAMgCHAPUAqgBZAdUCkAES/eEAowI4/zIAg/8M/l4BRQEsAfoAdwFxAqj9g/+D/9T+RgCCAGr/kAHIADIAcP6vAAAAH/9kAF4BEP9UAc7/OP/6ALX/qQGc/4P/wf2WAAAAtf9kAJz/tf/U/voAfQC1/zIAuv8g/ngAtACD//v/7P+1/wAAwf1q/4n+2v3B/V4BigLbAVf+MgCc/zj/lgBeARkAUf+WAJz/lgBiAGz/5//t/gAApv9g//oAfQC7/r4AVQC1/7//GQCr/5z/Uf/E//H/UwCe/9EBov4sAcgAUf/n/+f/fQC1/5z/nP/n/93/PABq/wAAav8ZAAAASwAAAOL/3f8ZAFoAg//O/7L9KAAAALX/zv8oANj/5/8ZAFAAhQKpAYP/5/8ZAJABGQDhAIP/tf/n//b/+//wAK8Atf+CAEf/mwCQAc7/"},"Silver":{"n":245,"d0":1,"p0":204,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQMBAQEBAwEBAQsBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQYBAw==","pw":1,"p":"/QT++wP9AwAD/AL////9Av8B/gIDAgABB/4EAQv9/QABBRID9QMFBu/4//37Av4HAP8I/vn9A/0G/QT9AAQA/v4A+/sB/gT/AAIA/QAHAAMGBgIBCvf8BAv8/f0ABgkBBgQI7v/8APwFAAIH//0EAP4FBf4BA/4F/QoA+/gLAgEK/QD8Bgb8/gHy/xD+/P77+fcE/vj/BQQCAvb9A/4BBf0BAfsD/wH6Af0CAwf7CwMAAQT9+wEBBf77C/4I/QMI+wr4AP0C/Qf4+wEAAAQAAP/+Avz9/gEAAgP9Af///QwI/AAM/vwJ/QX8//kHDvkJ/Qf+BA=="}},"1974":{"Gold":{"n":254,"d0":1,"p0":11475,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"igIG/2kA0AK7/rv+fQDIAMgAzv9FAcn/ZAU4/+3+Uf87AYcAtf+2/gv/g/8ZAHEC5/8f/yYCLAFFATj/GQAsAWQAOP99AOEAvAIgAzMESwCu/CIBYf7H/FH/dwEgA3b9zv8AAAAAMgCc//QBcQJFAQb/4QAG/4cAyv4yAAAAyADCAUL/Ff9d/VH/AQR2/V4Bov5q/5ABPABQAKz+ZACi/lH/rwCMADwAtf8V/0j+av9kACYCzv+c/zj/5/+lAFv/cP7DAKH/v/+Y/u3+owI+/gAAov5eAakBu/6c/zIAov5FAX0Azv9C/4wAov7O/5z/DP59ADT+NgEf/3b9MgCo/Zz/JgL0Ac7/4PxxAuf/zv/O/14BkAE4/wb/fQCvAMIBXgEgA3b9XgG1/5P+8ABq/2r/5/9LALX/RQEAAO3+GQD6AAoAKAA4/7X/SwAoAFUAEwEyAFH/SwAAAGr/Bv+1/30AxP+///f+nv0cAnT/5/8AAOf/fv/s/5YAWAKWAMn/fAGvAFf+sP9ZASn/Uf/i/2kAtf8yAPoARgDT/0sAvALO/8IBYP9q/+sA8f/qAV4ByABq//QBov6QAV4BlgDIAJz/df7i/9T+MgBeAbX/7f7n/14Bov6C+9sBLAFkALX/nP+i/rgBMAITAcgAu/4AAKMCAADhACwBGPw="},"Silver":{"n":254,"d0":1,"p0":328,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":1,"p":"BfoAB//9BAAR+hP/Hv3uCAsK/Pr8EREOBBISKCfdCR/t5Q8vBw5Q4rIF9tbsHA3YFAgK9PUt/vv0Edf+AhD97wEB8cMh/toY7RwLIiLuHvH3HOoDB/voAxUBDCzcCwDw7QHTF97nLvDu/CD5BhP24Rr98/739g/26wX3DQjb8/n+FwPy4vMaCvARFe0UCBr+HAXoEOPvDf399/IEGOYG/gL2Dfz+6wrxCwDpBgj5BO8S7gLzAA72CwYO9AwHEgAZDwHt/iLq8wEC7w4REPUMDQb/+esD7hQEBPYR8AIC7frh/g/iEQES8wIP5PIK/v74Af8EEwr8DvQHCg395A=="}},"1975":{"Gold":{"n":254,"d0":1,"p0":18500,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"4Pxw/lH/PwJFAWr/fQCi/vAAdP/U/lH/qQEG/87/EwETAaL+PACMAFH/ZAAf//H/ef9kAJz/MgAyABMBowJq/y7/0gAeAOYAuv+5ADj/av+c//H/xP+7/pYAAAAG/68Azv+1/2QAzv8ZABkAAAC1/+f/tf8yAEsAzv8oAHT/W/95/xkAzv8AAM7/av9d/UsAyADwAHT/yv65AMgA7f7O/2QAWgCN/87/H/9kABkAZAAZAKv/IwAoACMAzv9kAAAAGQA/AvH/DwCc/1H/H/8+/n0AjAB0/0sA5/9kALX/DwC//7X/tf9VAMT/nP8AAOf/SwBuAA8ArwBkADj/nP8yAGr/5//XANj/tf/hAJL/xP8UAJL/FACCAMn/DwAyAK8AZABl/xQACgDx//b/pv/2/+f/Bv9BAAoAkv/J/0EAv/8yANP/DwAUAMT/HgDs/yv9zv9w/uEAGQAyACT/4v9q/6v/IwDn/8X+Pf+y/WQAY/z0Ad3/CgD6AOEAJgJLAKL+ov7CAdj/Gv+qAJYAg/9LAGQASwAAAOEAtf/n/2r/CgBH/0sAlgDE/9j/ZAAyAMgAav+c/93/5/8eANP/jf9W/zcAggDY/87/NwC//4P/Uf/2/+L/fQDE/+f/3f+m/8gAKAD7/7r/AAAKACgA5/82AbX/tf9LAOf/tf8="},"Silver":{"n":254,"d0":1,"p0":444,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":1,"p":"9/MF/f79F/MQ8fHwCPv9HATzBArv/v4C/w0F+A8GDPn2F/gP9gTz//oI/vIC/f0OAQMC+Ab1BPf/+QX/AAX39v0E/AEG+P4KBgn8/f8H/wEGBfMH+QYIB/8H/gn29xH+/BL+//b8/PYDAP3+BQz8AfkB/gL9/wP+BwD/BQH8/QX8/w0A+Qz6Af/9Awv4BAwEGwHyAA7++QsF6AAJ9PMJ8wgAAP/vB/X29QgF+QP0Evz+B/75B/j9+wYC/wD9BgT4AP3/9AP+/AX9BgAF+AH6+v0CBPsBBgQO+wMD+v/+/f4C//z9Bvn+AfUAA/v5APYI/wL6BAMD/w8E/wL4AQ=="}},"1976":{"Gold":{"n":255,"d0":1,"p0":14035,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"7P9+/w8Aef9v/x4Apv80/kEAM//n/7H+av/O/58Bav/n/zwAyACc/ygARQGD/1v/8ADY/0L/mwDY/4IAHgCS/0YA7P8AADIAQQCWAHT/BQAPAKb/XwDO/3gA+//n/ygARgC6/zwAyf/2/2kAq/83ALD/BQDx/6b/kv8G/1oA3f8KAGX/KAC6/wUAVQCI/1oA9v/i/ygAyf/7/wAACgAZAFUAxP8PAAoAAACr/87/fQAKAOf/8f/d/xQAAAD2/9P/Zf8UAOz/kv/2/8gAjf9QADwAGQDY/zIA9v8AAPH/0//O//v/v/8jAA8AAAD2/87/zv8eAM7/2P/2/8n/8f8AAPv/DwD2/87/2P/s/xkA0//y/nn/+fwAAH0Aof9QALQA9QAu/6v/pv8eAGQA+/8FAAAAPAAZAOf/2P8jAM7//P6S//H/Vv8k/2D/yAB+/43/XwBPAUz/hQJkAAAAg//hAPv/l/+s/kQCmwBR/14B1wBR/8n/HgCc/4P/2P8PAHn/xP8tAJYAVv+m/24Azv9BAAoAeADE/7X/NwBLAM7/lgAyAEkCiP/i/xQAtAAyAG4AuAEZADUCpv8AAEABp/7P/vz+zQCgAIwAz/4UAH7/g/+HACgAQQDx/8gAeAAtAIcAZACc/0L/UABC/w8AW//hAA8AnP8PAHMALQD2/w=="},"Silver":{"n":255,"d0":1,"p0":416,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"BAUCAPwAAfIE8AXu/gcI+AAEBgH+BPj/BQH7DQEBAfsGAAv6BwL2AAP7AgAHA/0H/v4C+v4G/AH9AP38+vwIAQP6BQMKAf8S+QIP9/79/xH6+AD+/f4CCQn3BgL4BPcC+gj4DAEQ+wb9/wL9EvsJBwL99gIC+gcD9f/6/w3/DgMFBPgD+vEGCPL15Qr9/wQABvz++eoO+/X5BAn+BQH99QgI+Pz0CAL2/hQABgEJ7gL1/QIL/v0LAAQABfoAAv37A/3++/UFAwD7BAD+AgH6Af8N/wP/B/kHA/oLAv8M7P39AwQB/P/++QP8Cf4G//4F/v3/Bfz//wEC/AEDAv8="}},"1977":{"Gold":{"n":252,"d0":3,"p0":13610,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"Lv+L/z4AOP8z/2kAeADY/+f/pQDn/yMAGQC6/zwABQC1/6b/UABLAJf/UADs/1oAqgB9APv/l/9zANj/BQAyAA8AQQAZAEEA6wAjAIwA8f8YAS0A3f8TAfv/b/9zAFv/9v8tAIwAWgC5AHMA+/9VAGkAIwAQ/4j/kv9aAGX/lgCm/1v/qgA8ABgB9v+w/9j/4v+S/2r/lgDi/zP/GQCm//b/ZABBAMn/xP9LAAUABQDn/87/MgAAAA8Apv/7/xkAzv9R/xQAv//T/woAsP83AH7/DwDs/5z/dP/O/0L/2P8EAcT/HgCWAGr/RgBGAEYAbgDY/0EACgAG/1UA3f8UAF8Ajf9fAEsAkQD7/9j/fQCm/woACgCRAOz/GQCX/+f/HgAoAEEAQQDO/w8AIwC///b/5/+I/6H/SwDd/0EA7P/T/xkAKADs/5EAIwDY/zwAoAAFAJz/QQDd/1UA7P/7/woACgB9AAoAhwBVAPb/XwAoABkAAABaAHgAAAAKAKH/v/9AAeL/eADO/xQAVAHs/18AQv+CAK8AUAAPAC7/3f/Y/68AsP+RAJYAtABM//oA7P9zAFv/V/7O/zj/LQBW/0f/uQAyAJL/BAG///v/HgBq/wAACQG//+z/YP+w/7//MQG1/9j/MgAFAAoAAADXAM0AjAAKAA=="},"Silver":{"n":252,"d0":3,"p0":443,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"/AAB/vkCAf8CA/4G/gMFAAX5/wL+Bf4F/QT9/AMAAAIBAgH/CvoO/wgA/Qv/+gL+AQAH/wQDAQH+Avb1BwABBfn0BQIDAP8EAvsABvz3Bfv+BgEA+gIAAAP9Bf4A/PwD+fwB+Af8/wIA/f/1/AP3BAf7CAP4AwEEAQAAAfcC/wL/AgECAwP+BAD/AAUB/f76/wICA/0CAP4B+/f7BP0F/fwF/wACAwIABf/9A/oF/P8CAgf/BgH9AAIBAAIC/gP8AQIFBAH/B/8D+QQCAwL4AQQD/AAFBPoJ/gP69QEBAvv3BP/+CPoBBPgBB/wD//74Bvz/Af8F+gQGBPw="}},"1978":{"Gold":{"n":252,"d0":2,"p0":16860,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"hgGU/QQB4v/qAcT/ggBM/80A7P89/zcALQClANcA9v+c/w8A5/+6/4wAYP8UAB4AFAC6/5z/AAD6AGQAaQBGACMAyADs//v/fQBzAFv/9v+0AOL/HgAeAIIAVAGr/5f/Vv/1AKb/iP+X/8X+Zv6CAGMBbgDO/7b+hwDIANn+jf9PAe3+yf9fAGkAfv+I/8r+TP8yAGb+ggA4/5z/CgB9AEEAq/9zAP8A4v/E/xQAXwCvABkA9v/SALr/IwC+AEYAWgC//+f/2P8TAUABW/99ADj/yf8oAGkAEP8oABQAzQCS/5EADwDcAOf/yf/d//b/AAAPAL//dP/s/8gAxP+h/ygApQDx/yMAZAC6/6H/IwAjAKUATwHbAW//QQAAAJoBCgBcA1f+av/Y/20BrwB9ACn/kAHwAG0B7P/z/eYACP3XAIH8swF//jcA0AJGAFAAuAF+/zcApv8f/97+kQDd/7gByf95/7QA8ADwAGX/5gD1AD3/HgAAANP/tACkASgA7P+1/3MA8AB4ACn/tf9yAX0AH/8tAJsA8v58AUABVQDLAusADP7f+Kv/lvtnAt8C/f1E/c7/lgCY/iL8eABVAPv/iP9ZAYwAz/4G/53+BQAjAG0Bl/+N/wQB4QD5AXn/l//s/xgBlAIvA5j+ov4TAdsB4QCWAA=="},"Silver":{"n":252,"d0":2,"p0":487,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"CvEEAQn+BPoH/vz/AAIL/f7//f8F+vwC//39BQMCAAUCA///Af/4AgT+AQAIGP37BxH7/wPw9AgDDfz4BQj5+Ab4AAMD+/z4+QT0Bfr6BQMA/gcDAfwAAQb9/gMCAgYB/v//BA8L+QX1/AX7/P8BB/kH/wn8+wEAAQP9+v8DAP39BAEAA/38/wAGCw34BPsP/Q/0+/0GAAD3DgQH+PMB8wX1CvsDCgD/B/0A/P79AwII/f4FBQP6BwT5Av8ACgj/APwT/gT4/AgC+QD/+AsRAQ0B8+T8/QgD+ff/Dvf2Cw4BAgMG/vv5AQT/+f0CAAT6AQIBCgX7/AEEBP8="}},"1979":{"Gold":{"n":253,"d0":1,"p0":22715,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"B/4oAKQB/P72/5j+UAA0/vv/9QBYAhgBIgFyAZj+cgE8ALX/4v/Y/8T/v/8G/3oDdwGFAvQBDvw6AtD9gP3kAl8AbQFg/30AvgBfAEz/Bv82AWD/xP+y/aL+DgG7/q8APABW/zIA9v9jATIAR/9R/wkBtf/XAMgAAf8p/z3/KADx//b/RgC//w8A2P/O/+n9OP8TAYoCwP6X/0UBlgBLADIARgCpAZL/uv+vAP8AwP7WAcT/0/8TAQ4BkQD7/2MBmgG1/3T/vAJiAqL+xwHT/8r+1wD0AW//Qv/0AaL+6P4OATIAPAC//5EA9v+HAP8A/P6m/x4AG/4/Atj/lgBZAVkBBQDd/0YADwAp/xgB/gHfAon+YP/+ASIBov6QAWD/tf9e/Ej+vgBN/mr/Pv7MATUC7QOCAKr71QKJ/twAKADs/+wEQv/+AZYAKf/MAab/mwDMARcCiAQ2/A0C4QBW//z+dAT0AQwI0QG//xX/kAGS/wL+CQYzBPoApg7G+KD2dPWdAxkAmQxj/Df73QRg/zz7SP6jAqMC6vyMANwAmPni/5YAdwH7/2L99AHgAcoDAADt/kUBDP59AFH/tf9FAZz/DAM9/yr+HQEoAKsEKwJ2AjgEvAL5/NUC0P31AHQEvAKEA0sAbgAKBQIIdfkV/0wE7QhxAoQD"},"Silver":{"n":253,"d0":1,"p0":608,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"9////wAAAwABAPz/AQD6/wEACgAQAAEAAwAJAPv/DQAMAAIABgD+/wwA+f/+/y4A/v8ZABQAzf8lAOf/7/8fAAkAIgAAABAA+//4/wMA5/8TAPn/BwDg/wIA///x/wIAAQDz/wMA/v8UAAEA/f8GABQA/f8MAAYA9//y//v/AQD9//b/BgAAAAoACQD6//P/+/8FAA0A8f///wkA//8HAAYACAAlAPP/BAAIABsA8P8aAP3/+P8UAPz//P/6/woACwAGAP//DwAVAOT/CgDy/+z/BgAPAO3/BAANAO//8P8NAAYAAAD9/xQAAgAJAAYA7v////b/AQAQAPb/DgAKAAkA/P8PAAgABwDl/w8AIQAQAOv/+/8aAAIA6/8LAAIA7//n/wIAAgD0//L/+P8BABYADAD8/+f/GQD9/xMA9v8BACMA//8aABMADQAfAPn/OgAFADUAawCt/zAAAQAIAN3/agAoAOoB5v5mAAr/xACD//3/nwD6/1QAZQCS/y7/KAAAAFoARgDx/xcATADk/77/xf9uAA4A1f8TAPf/wf+6/xYAOwDk/+L/EgAhABUA3v8BAAQA6P/x/wQACgASAPH/FgDm//X/FAArAH4ARQAiAFgA3P/W/zAA0f/2/1QAHQAmACYARgChAEIA2//6/3QAIwEiALMB"}},"1980":{"Gold":{"n":254,"d0":1,"p0":55900,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"hBzw8dgO3/iO+YQDrwC/DmENbCCl8f0l1gbA4NzTOBj+95bnJBP2CSLyvALU/s37kw0gA/L5KArN+8f8Ev26+mP8ov6l8WYI1P7G+JcE+fyEA8gA1P6J/lIDEv2A8+f/HPNGBcz8DeQd96j9oA9cEtj1hAPCAdL2xPCQAS0FUf+i/l39mwosCxL9Ev1QAG7xCAc4/xkA8/1Q+8kE7gK/DnX5T/dxAoL74QDuAsf8wgG7/gAAzv9SAx//8f+c/+79wwBX/iwBcgHUA9T+EARYDK78RgVGBXIGhgvM94L7j/0CCP/7x/yXBD7+PwL5/HcB7wY/AjkDHAx2/UAGEv2QAe3+/AjN++z6av9W+hD1XgE/Ahf4MwRj/AIIXgGkBmP84QB8/Mb4kAEZAC0FRP2QAYP/dfmD/w4BwQIsAaf5TATIAO8GnP/m+3cBZAAAABL9WAK9ATcAAQTiBHgFsARK/KQGzPc+/gEEV/4yAHkJfwhK/Kj94Pwx/EP5nQOi/tr9fQAgAwz+1QKvAAAASvzhAO3+wf2d/of7owL/+7P3JgIG/+IEAAAS/Vb/WgW8ArP3/fN4Bd/4JwaWAOL/e/28ArAEcQJFAe3+mvewBNr9lgB4BY/9Uf8IAiP7DP7t/vj4zPcw+L4Ks/fJBPQBov4CCPoA7gJR/wv6+gA="},"Silver":{"n":254,"d0":1,"p0":3995,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"2f5X/nEC3P3b/1AACgE6AakBkQEu/mIC0/8X/c3+LgHA/tT+qgAjADH/AwCv/7b/GAKu/2r/WQG0/8H/cf98/9z/2P/p/V4B4v/Y/0YAzv/JADMAs//1/6cAs//L/kn/Cf+WAPf+cf5w/g//lQHDAGP/ygBM/2D/k/43/87/XgE4/+j/uwBiADL/CAAWAH//FAAAAO//2v/A/ywAGQB/AE//DAD8/0n/bgAeALr/NQDq/+X/AgAeAOP/AgDZ/9j/AACR/zAAXQCoAKX/PwBfAND/YgBVAGYAUwAf//L/8P9VAPH/zv8dAOP/FQDn/wEAPAADABAAMQAjABMAzP8NAPb/QgDS/83/4//i/9j/LQAEAMH/FAD1/zMAFQAwAOT/AAD3/87/7/8HACcA7/8ZAAEAzv///w8AAwADANr/IQAMAB4A/P/3//3/CQD2//n/FAABAAgASwBrAEEAYQDi/98AQP8FAMUArv8CAMUAIQAdACr/VACj/6//fQDJ/3//OwAjAPH/QwAKAOv/xf8kAP3/2P/T/9L/FQCm//n//f/m/zAAIQDH//v/XAAjAIP/ef9pAKH/NQATABYA2f8aADEAJwD9/+b/lv8/APT//f8wAOT/8f8PAMf/wv/p/5P/hf/G/6oAZf9CADEA4v89ABgAIwDj/8L/9/8="}},"1981":{"Gold":{"n":251,"d0":4,"p0":59200,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQIBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"1QLm+yT6WALy+a8APv4NAnD+cP7bAeIEfPwk+oH30/ruAmL4+gBv+pv7sQgr/bYDUgMTAQX7gvuc/9r9fgReAV4BnQPH/O3+yADm+wz+2fnH/LYDrfj0AWUEZQR8/MgAqgXVApz/sAT6ALv+QQol/uEASwAtBRH5C/r6ABkAigIzBEP5fPyQAcz38vnuAu3+fQDO/0AGdv19ANT+Pv7B/foAdwHg/FgCov76AIUHiPrO/8H9rwC1/5YADP6vACv9V/61/6kBowL6APn8MgD/+6L+5/8sARkAZAATAQ0C2v2i/tT+Bv+pASwB7f75/M37N/sY/Of/m/t3Af/7AACi/lgCnQP6AFb62wGdA+3+GQBd/X0AfQDU/uEAXf21/ywBBfu1/1UA8ACQAbz9SgGwBJz/kAE4/xQFTATU/jj/AAD4+PoArwAzBNT+hAN3AfQB1P7U/sgAlwTn/zkDtf/a/XECY/ziBGQAH/8S/X0Ah/b0Aaj9awM4/+4CvP3tA7v+GgS///78hwCgAND9zv+d/nr+ggCS/9r9iP/WAWP8owLIALv+RQEu/43/6wAh/Rj8zv+vAMH9Hvv0ARkAAAAM/sgAIAN3AZYAqQHm+xkAXwXCAY/9AAB8/IP/yAABBKj92wEAAO3+av8Y/Gr/rwD5/GQAEwE="},"Silver":{"n":251,"d0":4,"p0":1580,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQIBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":1,"p":"Ms7YF68OBA/n/Asm2bWvDfrWCuPZVvMPN/3M3uAEOfPuGucC/tn4o/0ouR0ZIdr/KCH7LAz4KcMm7BvC7OIR/g/bAN7q0yH69QIq7ATw+/EDB+cL+BQf4PjxAwX/AfTu4fYgAwjtAtH8Cw/7+yAH2ff3+hAR8+u6w+MP8g3oG/ImFQreAB72AN4Q+PAF8AYK5QICDgnwFCv5KN4uHegAAbEMBhsAGRMk9hIQSfIu6/MPnRQG8drnsxn5JQEM1xj7Gv/uAiXt8vPz///z/hbqEwXwDvj+Burl/Ana5w0D//AIBgMDBOwCKBr5CvHxAhTuEgz78+L8/+gACg=="}},"1982":{"Gold":{"n":253,"d0":3,"p0":39900,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"rwB9AMH9lgDB/e3+H//A+XECEv3uAtr9XgH6AFf+AACEA5z/owJE/Qz++gD0AUsA1P6i/swBkv8G/6f+RgC1/+D8fQAl/qL+4QANAiX+Pv6pAbL9DvxE/T7+GPzVAn0AgvvH/KMCdv0WA5n94QBSA1gCDP7z/bv+cQLz/fQBbgCsAwEEGgRX/gAAyQQf/30ARP20+1UAR//IAJEF//sHA3b92wHT+lH/dv1kAF39MgBeAVH/AAAmAhkADQKD/68AjPu3/VgCK/1LAHb9JP8IAqL+uAEgA2H+4QA4/yX+K/2lAMX+qP3m+9sBnP+EA8H9xP/fAkUBH/99APoAEP/G/VkBfgRPBjIAwwWo/Tj/qQHB/b0Gu/4mAl392v3B/fP9yADDA1EB6vxBACz/uvwAABn+JQDCAc7/SwCCBZ8B4wgTAZ8LXPn8CAcD4/np/ZABKhJFAeoLYvggA8X0x/ywBCv9+gBR/3v4GQDcBVf+fQCH9jT+XgHQ+CwBDP7a/fUFwwUbCPP9tgMF+zoHzfvN++IEY/z6AKj9wf1w/j8CcP53AdsB2wHIABL91P5Q+5z/yABw/uD8wgHO/1wDsf4HA5j+n/zn/z8CXgHDBef/lwRX/vQB4QDrBYb8Xf2i/uf/GgSI+nECnP8ZAGQAgAL3/iwBOQMyAGP8"},"Silver":{"n":252,"d0":3,"p0":806,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"CQvxC+sI7+wU8wv4BAbtBhn+GvD5CxkL/PYc9vz/BvPtBOvoDAft9hPx5+3eFf/w+BP5BfMHDgjpAPsH/gUAEQoJ+v4W9AL85AH+AxLqBOwF8Pj+BvD+AfwAC/kH+//z+Avr/ebzCvEAEPD8B/Ph+vPu6AsDEvb+GiX+EQj23xUyB/km8vYR8z/3Ev4J6uP5GhPlDPXo9+cBDfYGPgAxKB7jFRLM/AVqIx7HLcYDEfkc7uIDJ+sC1eoS5wT28BkZKxQi+Sv58ULfN+zt9PvyCx8RCg0A3PgE1tn+DRnyGOzf4xb/HwE8/x76ReTf//I0zhLsCAsW+Awk+u4="}},"1983":{"Gold":{"n":252,"d0":3,"p0":45275,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"yABFAXD+0AdyBhL9IAMr/TMEEv0zBP/7EwFW+p0DRQENApz/GgQmAv/7BwMM/lD77gJX/voAZQTa/UwEJf61/4n+lgDO/6D22v3U/hTs8/1yBksAp/k/AmQAyABrA3z8BwPbAR77K/0sAfP9cQL5/MgAif5LAAAADQLU/n4EEwE4/6L+2wEmAj7+7gLO/9UCav8S/YoCV/5YAkT9fQBK/JYA+gBeATIAov5eAakBkAEM/uf/MgCc/9EBKf+c/6j9qQEjAG0BSP7XAB33Jf6vAD7+0P2m/14B7gKD/yMAG/5FAT8C8/2QAVgC7f7hAPoASvyWAJYAAAC1/x//av/IAFIDVAGzAXD+Lv/3/pYAZACvAEUBDP6c/ywBzv8ZAIn+fPwyAJz/MgBX/pYAlgBw/jsBLQByAb0BMgBLAEL/1wDCATj/g/+7/tj/Tf6CAPoAqgBR//P9lgAAAPAACfzE/xD/lgD0ARMBnP9q/xMBLAHt/jIAPv7a/eb7tf9w/lIDZf9jAX0AJf6vAEUB5/+J/sX+mP5oAQkBAACc/837EwGJ/hL9JgIZAEsA2v0DAlv/lgCr/5EAQQDn/3b95/9q/2kA+/8AAA8AFwLoA6oFK/30AZL/SP6vAOEAuvrwAI3/GQB0/wj9Tf6D/x0BQQA8ANj/9v/6AA=="},"Silver":{"n":253,"d0":3,"p0":1106,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEBAgEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"BAATAPr/TwAUAPT/IgDy/0MA5P8qAOH/AwDB/zkAFgASABIALwAwAMX/QQDr/2v9ZwIpAOX/BwAkAPf/MgD5/wYA6/8BAPv/kf8YAOT/ZP+a/yAA+v/e//T/DAAAACYA9f8HAB8A1v/t//7/2v8kANv/IgDu//j/BwAbAPH/LwAVAPz/9P8JABgA8/8qAAsANgD9/93/MwDY/xkA+f8LAM3/EAAQABcACQD8/xUAGwAcAOb/AAAHAP//KAAFAPT/yP8zAAQABwDz/yAAsP/P//v/0P/B/wEADwAwAAAA/v/h/w8AEQDw/xIAKgD6/xQA/P+9/wQA/f/8/wgA8P/6/xMAKgAFAB4A6f8EAOr//v8SAA0AHQDl/+//IAD5////6//e/wcA/v8IAN7//v8FAPL/DwAJAB0AKQAGAP3/6f8QACcA6P/+/+L/BgDk/xEAAwAPAAQA6f8DAAYAAwDW//X/9f8FABoA+v8AAPf/DwANAO3/AgDt/9H/rP8CALz/PQD9/wsADQDc/wUAEgD9/+T/6v/Z/wIACQD8//b/p/8pAOb/2/8nAPr/FAD4/xUA+P8GAPb/BQAKAP7/0/8CAOr/FgD6//j/CAAQAB8ATwDp/w8A+v/v/wcAGADI/xYA9//7//v/1f/r/wAADwD7/woA+/8BAAsA"}},"1984":{"Gold":{"n":252,"d0":2,"p0":38400,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEGAQM=","pw":2,"p":"Ev0AAC7/CfxFAZYA4QCD/xkAav/O/9sB5/9q/6P9dgDKAFH/BAEJARcCJgJeAbf9jf86Ao3/3v6s/gH/8wI8AJL/+gB3AXcBBwOT/i7/WAKs/nn/mwDtA7H+av/L/TUCPv4AAPoAt/15/7//mwBW/9j/mP4yADwAsf7MAUf/g/+e/b//bgDj/hMBKABaALr/Qv/s/x4ANwCfAdj/Ff+//2b+fv8UAF8AXwAAAFj9cwAB/yIBTP/XAJEAuQBb/xcCiP+//8D+CAL0AbX/fv9TAv4Bzv/E/3T/Fv6i/r38tf+WAC7/Pv5QAKUAR/8sAQH/b/+CAHgAdwEg/rr/UAA5/uD8CvZGBf/7dwHSACkEJf6D/2ICt/2b+/oA5//uAov8LAH1AFf+RAKzAeoBmf0V/yMAcQIS/UQC/gG7/jwAZf9S/gAAewJ0/yT/QQD7/5f/av9D/rv+tACw/xr/kQBVADj/vgB0/2r/VAEKAOf/7gIp/0EAUf8PADwACgATAWD/NwCE/mr/ov4jAOz/IwCWABkAUf+HAGD/jABVAN3/Uf8V//H/jf+//wMCSgFtAfH/5gAf//v/pAFw/r//4v8z/93/CgDs/8n/Bv+Z/Vf+CQHF/qb/QAHd/w8Auv+J/igAXwCI/y/+Fv6k/DIA2v0wAowAtf/O/w=="},"Silver":{"n":252,"d0":2,"p0":896,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEGAQM=","pw":1,"p":"0Pz9zRX3+wz9/P8XBf3kCgX/EQ4bDQTy9igC4P36JQ71CQ0QIfP3Iun+BSz59eUV7gYM0wEDBwL+8gAL+CbxCdoAAeYI/Q379QEEAwsD9f7z8/0DCQDSBvwOCAEKDO8a+gLtGAT8/BgC/fv49vXeBP/76wwB9xHz8f8AA/b4+93r3B7eBgwV8/0O7u37BQTn+RP2IRQQ3hL6KOMcBf38+uECD/oCAPz08/X2B/4AAwD1Cvj0DgACM/QF8v8CBgr9/+P88wEBCAYB9AX9Bwj9/Pv/AP4YCAcc8PkFEO/5Avj7Awf6+fnn//n7BwP+9/L+/APx9ucH7xPzCvc="}},"1985":{"Gold":{"n":253,"d0":1,"p0":30625,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"Xf2LAWL9/QKj/TUCAADt/n0A+/9PAW4ACgDx/yr+5//3/r//6gHO/74A9v+d/jIAqgCh/0L/xP9ZAb//PACWAO0DS/v7/6v/wP6Q/Az+PwLn/xD/FAA3ACn/BAHi/30Aav+HAA8A3f98AUsFKArl9zkDG/4KAG4Fjf9pAP39A/2aAWb+YgIUADoC4QCh/3gAPv5q/9wAKAAu/6z+7P8KADIApQB3/Hn/yf8L/9IAcwCh/0ABIANC/wv/xP+BATX9WgCc//v/C//y/nwBR/9yAcT/av8PAAoAV/76ADIAIwClAJYAuAFjAcD+Xf2N/7QAPADn/xkAjf8+/tP/HgAUAIIABAH2/6b/fQDSAN3/6gE3ALv+YP8XAlf+WgBM/xwCGQDlAXn/Ov1PAWD/tf/hAM7/pAG+ABr/DgGKAoEBif4ZALkAcP6lAJUBpv/3/uL/7f7+/GQAK/2RAOz/yABw/ncB3v7x/8D+KABKAXoDHgAeAKoAb/8L/7H+oADY/2wCUv7x/1UAdP8ZAFAAGQCh/37/pQAZAMT/ZACh/+L/VQAFABkAl/+S/18Al/8UAI3/av9zAMn/tAAyANP/sP8jAF8ARgAZAMIBZACX/47+QQCn/m//yAA4/wAAFf9r/kYAtf+5ACMAbQGw/+YADwDcAKb/+/+HAFUA"},"Silver":{"n":253,"d0":1,"p0":625,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":1,"p":"6QfmGewVAvX/AhEI+wTr+/wAHfkQ/PEABvv++w7/CQL7+wH678kNE/r2AwL8Bv/99AUJ/QghKt0c9/wh/gny9gj1GAAF/wj07v/8BPjoBgYACO8AAf4LCvoHEvsA/Avd//z/+/YQ+A32+wb+/gYAAgj9CQzz7gAE/QH+/vH7A/8CDP/7BQQCD/z3AAT5Af4PAgj49AX8/QT9Dwb5BAUE8/8F9wkK9vv9/ff++Ab9AfkI+wH0BAcRAP0C9v/7BAUb9QEC+/8ABPz3AwD9CPz/AAH8AfkB/wH+/gQABAP9/QAIAP4KAPz4Avv+AP4A+e7+/wn9BvIGAQP4AAn5"}},"1986":{"Gold":{"n":253,"d0":1,"p0":32710,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"kv+0AG4AyAAsASsCggA9/4oClgUV/3D+RQGJ/rv+PwKKAuX8PABkAHT/Z/2L/AH/cwBQAAQBtv5zANn+sv1eAcT/agRD/uf/swElA4r9K/0oAHgAZf+uAVAAnP/s//H/HQESAiT/PAAEAWX/hwBLAGkAMgDg/DwAZPu0AG4AnP9aAJ8BOP/O/9IAJwHZ/jIAb/+qAJEAqgA2AYP/Vv8KADP/8ABVAHD++/88APUA3f9BAJL/l//n/xkAuv9R/1b/UACRAB4ALQBzADwA3f+N/9P/CgAAACMAOgL7/y0Ayf+m/2j8eAAUABQAoAAZAPoANwDn/8MADwBb/87/HgBBAM0AgQHj/g8Ab//d//oAb/8UAE4CMgBR/7v+MgC0APoAPf+AAhMBUf/n/+sAAABkAMEMuPwDAiv98ABt/CX+igITASIB6f1q/2wCyABYAl4BkgTA/pEFSwB2/cgAEv2XBO3+C/8FANIA2gK3Bwj9jf9R/68AOf7H/K4BAAB0BNj/JgL8/pj+A/1FAfH/DP7n/6j9AACoAuz/iP8o+6z++/9M/4n+Bv+I/zQDrwDz/UoBoAAG/wUAxP/XANn58/1eAT7++gBy/CMARQFW/wIDwAPu/Xf8UwL8/r4Afv89/5YAXwDqAab/4v+m/6UAeAD8/lH/KAA4/5YA"},"Silver":{"n":253,"d0":1,"p0":581,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":1,"p":"+gQFBQIU+/sJFfT2Cvv9CQX1AQL5+u4CAv4F+AX8+QcBDPf+Aw7w7P7++A30A/oGBgz4+wn6AgP8A/AF1PgH+g0JAP8JB/UBAu37/AD//AP5CAABAgIH/gH6+P4A/+wHAQcJA/0MAPf+Bf8BDgQJ9PzuAf4DAfsF/fwABQL8/gEEAfsA/v8F+wAAAPoDAQH//QYBCQAE/wMd+QHxBvPzBwAL8v4EAwQAFPUQCA0L8w0CA/38DQ74APvy9PQF/xT+//sE9AX/+v/5BRgD/e8BA/kBAQELAfMKCPsBAwbu9/73/+3/A/4MDPn0B/0C/v0DAgj++v8CA/z5AvwA"}},"1987":{"Gold":{"n":253,"d0":1,"p0":40240,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"rP4OAST/0gBBAP0Cfv9EAjwAzv+jAn/+hvzSAD/9tABPAQwD2v2O/qv/Q/7n/1UACgAZAJEAav+m/3v9pQDd/3r+3f/qASYCl//bAZj+CQF5/7r/iwF8ARH+W/8PALkAcwB9ADT+hwAoAHn/+/+gAHIB1gGO/swBTgLo/s7/rwBg/74Atf9UAVb/OASkAXcBDQI+/jIFEv1sAsADeAXb93D+EwEV/9ME+fxBALr/Pf8mArX/MgCeAtQD/f1cA5H79AGN+mn7IQJg/738TgKLAdT+vQHi/xX/zAHn/7gB6/vwAD7+HQFzAJ/82v3qAXD+8ADMAW4A8AAu/0j+CgCqAPf+OwGX/8n/WQFuANEB2P/j/h0BwwAeALX/pv9uABICGv/BAoQDEwGZ/Zz/G/4+/nIBJP9kADT+/P4KABMB5/+2/qoADgGS/1UAFf/o/lkBMALhAJf/xP8l/iwB9v9S/q8ADwAeAP8ABv+uAS7/GAHj/vb/OP8ZAAf+WgAPAKoAqgDi/14BCgAk/+z/5gD6APUF0gAp+jsBHQHcAHT/bALQ/aP9wwAPAMr+Jv2S/+oBJf7/AKoAeAAL/7QAQQCgAC0AyABmA7QAkv8PAEoGRP02AZf/wP4b/tIA5gCw/xoEBwN3/Gf9RgDA/p3+PAClADIARAL3/tj/"},"Silver":{"n":252,"d0":1,"p0":536,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQE=","pw":2,"p":"AQADAPz/BgD9/wwAAwAEAP////8JAPv/8/8HAP3/BAAHAAsA9P/6//7//P8BAAAABgD9/wEAAAD9//j/AgAAAPr/AQAEAAQA/f8FAP3/AAD8/wEAAwAEAAIAAgD+/wIAAgAJAPb/AwD//////v8BAA8AFAD5/wwAGwAHAPz/BAAFAA8AGQD6//z/GQD///7/JQD7/0EAAAAuAFQAswAI/+z/8//t/2YAtP/3/wkACgAoAAEA+/8VADoA3P8eANf/AgCg/7f/EwATAN7/GAAJAPz/GQD+//H/FgDy/wwA1/8RAOz/AgABAM7/6P8TAPT//v8OABMAEAAIAPL//P8bAPX/GwADAPX/DwD6/w8A+P/u/w4ABQADAPn/AAAGAB0A/v8fABwADQDi//L/4v/m/wkA+v8KAOn/9v8JAAQACgDy/wAADQD7/wMA7v/2/w8ABgACAAEA+//0/wcAFwDl/xAA9//1/wwA5f8eAPT/CgD5/wYA+P8JAPf//v8EAAUAAwAAABEAAQD2//3/DAAxAND/3/8AAAMABADq/wsA4P/m/wwA/P/q/9P/CAAdAOf/CAAPAAcA8f8RAPn//v/8/wMAHQD8/wcABQAZAOb/+v8DAPT/6/8IAAUA/P8dAAMA8//s/wYAAgD+/wEA/v/9/wgA9f8AAA=="}},"1988":{"Gold":{"n":253,"d0":3,"p0":48410,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"WP2uAesAQ/5EArv+v//O/4YBgfxaAGQAg/+HAHn/Av44/xD/Uf/c+zIA2/xK/I8Ckv+E/scBmP4KAEoBQQAPALkA6P6lAI3/rf1r/n7/hvwcAvAAEP+gAA0C4v8oAHMArQIk/yMA6gFM/wH/cgEiATwAhgEQ/6AAoAC6/5ABOP/4/Tn+6wCbAAUAVv9q/60CcgGc/5EAcP6r/6z+av9VADEBEP/f/RX/VAE8ABX/XgHhALr/8ADrAOf/0/+LAfH/dwFb/+f/6f3O/5YALAEQ/wEEtf+6/y/+if7SAGz9HgDO/+sA4/6aAST/Qv8k/8T/DP65AIH8wwDd/0EAGQBGAGkA5/9LAP39qgAdAaH/0//Y/wcDTP8AAJz/S/ubANn+iwFyAaL+W//XAD3/KACY/n7/zQDE/xMBVQDU/ngA3ADy/iwBxP8OAZf/Tf7P/osBef89/0EAv/9kAFoAvvsYAW4A2P9c/sL8jACQ/Dj/4v//+xsDQQBfAAv/Pf87Afb/PwJ9AMgArwC2/oYBLv/RAb4AH/88AKv/V/4eAFoA3f8PAPQBfv+WABAErP76APH/Ff8TAWr/9v/XAOz/RgCd/sX+zv+5AL4AEwGI/0YAsP+kAVb/lAJ0/5P+M/+S/4j/of/T/7QAkPxpANP/QQCvAMMAev7J/9n+"},"Silver":{"n":253,"d0":3,"p0":663,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":1,"p":"8xkZ8Q7z9gMD9AAD+gQE8/8C+P8I6/kF+vwD+wEHAAEH+AMA8vwB+QcD/AcJAvcK+vYECvoBBAcFE/sD/wUG/vPy/P8D+f8KBPgF/P4A/f8N/Pb8AwIBBwn/Agz3/hD2Dvn7+QECCwUuAQX36w/xAAUN+wv8+PX4+Qzn+gQCAQYRAA7sCBsI+PdD+vvzxfrxAgb8+gn+/fb2CgL+BfMDAvsM/wX57PsJAvgF/QYG6wIH/vryBvD+B/IEAwT8+wkBCv8E/vgI+wYH9wIA9AIB/v4K/QcP9gIG+Qv4+gX7+/T5+QQDAAP9+Qn7CPz8BvsCAP8G9QH/BP8B/f7+"}},"1989":{"Gold":{"n":252,"d0":2,"p0":41360,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"yv4G/y0AcP5pADj/hwB5/1H/IwBLAMn/3ABFAQUAz/59AHX++fw3AOP+RgBH/8T/eACX/3IB4v86/Zf/df7/AO79QAE8AEUBLAEZAJYAcP6//zj/8AC+AC7/qALE/8IBev54AA8Ap/5R/10CiP+6/wQBJf7l/EYAVv8sAYIAJP/s/xQA6P47AcT/bQFLAKz+CgAV/2QAhwB5/8MAb/8jAKf+SP7Y/6oApv/x/43/0gDY/8MA5P0PALr/8v4l/kT9nwGm/1AAhgEC/owA8v6+APQB8v4aBKb/sf4F+8gAbgCD/xwCKf8iAbD/1gGm/0QCUf8UAP8A/f2pAdIAWgBOArr/jf+S/0f/EP8u/2b+iP+0APL+WQHn/1AAfv8YARX/4/5VAPv/9v+vAFL+l/+X/30AOP90/6oAIgFg/x4AsP8yAFAAwP4L/43/eABg/3n/MgC//74AsP9BAFH/VQDx/2QA8f8tADcACgDcAHMA0QEp/w4BwP4iAQH/b/9pAFUAtv6//7//Qv/XACMAYwGw//UAKABM/6b/PADDAAoANgG3Agv/C/8ZAPQBuv/fApEALQCh/wQBqgDn/3T/2wHcAKkBdgKWAAIDhwBd/SMAdf7fAlf+Jv3J/3IBNgEDAtIAZAAD/VoAggDd/7kA8f8UAIn+d/w8AA=="},"Silver":{"n":252,"d0":2,"p0":607,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"/PkB/AP7Bfv8BAL/BxEF9wf16/79AP8BCP4F/fUE/Qj7CgACAv0B9/74BQL9Cf4RAAIH+f8K+f4D9PL/+wIE/QEA+wYABv76AvoCAP4F/f70Af////7/CP0C8AH/+frkAQcEDPUA+gYJ+RAC/ewDAf4KAQL2Cf4A/gH+9QIEAwr++PwD+/4FAv38Bf4AAAL++gr//gfzAAAB/AQCBfoG/QEB+vsAAfr+Av8DAQL7AQAB/QEAAAQKC/oD/QL7/wEC9v76/QX/CfgEAPz/AgP/BQj++v8I/wb9AgACBAMNEAMHBAAI/OgB/A769AEFAgUE/fQF//0CAgD56Pk="}},"1990":{"Gold":{"n":253,"d0":1,"p0":40165,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"6f15/3EC/wCX/zsBAgMjAIwA+/8v/iwB1P5C//b/AwJUAcMApQDZ/uf/Uv6aAYwACQFq/3T/AAC7/sIBif5pACn/zQDSAJsA/P7U/h//df4eAOP+DwCs/rQAJP+I/1b/RgDP/pEAiP+gAM0A0/++++sAhwBl+kr8YwEB/5EAXP6oAsn/gQHhAGr/nf6I/3MAdP9VAL4AFACN/+YAxf6n/gUADwD8/psAef/hAEYAEP+CAO3+BQCm/9wAzv88AHIBnP9t/LgBfv/IAPf+OP/E/03+pv/DAHH9IwBuAIIA1P6P/R4AwwDJ/3T/JwG//80AqgDo/jwAlgDWAR4AgQEQ/5YA0/8V/3/+zv9OAlQBiP+I/5EAsP9pAIUCq/9AAS7/uv9KAQAAfgRY/aQBiwFQAG4AIgFbBFYESvwf/2UEKADP/tcAOgKO/mf4p/62/uYAxP+1/yn/bQE8AIX9Zv7hAJYA1wBoAQkBZv7T/5oBBQBUBjT+DwCkAZ79zfs8ACIBGQBR/2MB/P78/n7/e/1i/VT8qQGvALv+4QAjABgBVAGK/esATgJVAN3/8v6zAdIAGAFv/9n+ggAZABH+tADy/r4AKf8dAez/wQLo/jIAMgDT/8/+Jf4eAKL+8v5zAM0AEP9uAA8AcgGr/1AA/QKI/4P/rwClADAC"},"Silver":{"n":253,"d0":1,"p0":521,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":1,"p":"+wQIAP0BBQIA9QEE+v8GAvsF/voBAAsB//4D//4D/AX/AAP++/z/+fsCAP4BAQD9AfoCAQIBAPkBA/MABP0A/QYBDgP8/vwF+AQA/wAC+PoA/gEFAQX9/QMCAP7/AQEJ//0NAAL1+gD+AAT2Av8B/vj5/wH+Av4C/AECAQcF/f3+APgBAgcC+f4F/wEC/f7//wP7DPYFBfoBBg4M+foO//z8Cvfr+v7/Av36BP7//gQD//4AAf8CAgr2+wEA9gACAPwC+ufzAfoCA///AAAA//EHCPwF+gUBA/79AP/9/f8B/QT/Bfn/AvwEA//9A/v+/vv7/wEBDQX1Bv8K"},"Palladium":{"n":189,"d0":91,"p0":12800,"dw":1,"d":"AQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"IwAAAAUAIwDn/+f/AAAjAAUACgDn/xkAtf/i/1b/7f7n/7X/ev4ZAA8AjADi/yT/PADx/ygASwAAAJf/NwCQAR//fQCS/woAMgCc/87/nP8AAIP/lgBR/wAACgAPAOf/av/O/87/AACc/zwA5//2/43/9v8ZACMAVAHO/2QAof94AAAAtf8AAOf/GQBkAM7/nP8yAEsAGQBQAH7/GQDO/+f/5/8KAA8Ag/+c/wAAGQAAAAAA4QCWALX/zv+WAM7/5//n/wAAg//z/ZYAzv/O/zIA5/+1/w8Az/4u/+f/nP8ZAA8A8f9kAM7/5/8f/zj/fQDO/7v+nP+1/4cAWgCc/0sAfQAZAM7/ef/9/RkAov5R/2QAEwFkADIApQCw/+f/GQBBAH0AnP8ZAFH/SwDn/wAAg//n/30A9v+h/y0A2P/O/xkAAABkAAAAHgD7//H/xP+D/0sAAAAjANj/7P8ZAM7/OP/3/uf/KABLAEsAzv+D/4P/nf6I/w=="},"Platinum":{"n":189,"d0":91,"p0":47100,"dw":1,"d":"AQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"4AH2/10Ctf8ZAD7+tf/qAQb/2P8TAWQAlgDIAD7+hf2w/3n/ZABeAYwA4AG6/6j9JgK7/tsBhwDIAOYA4v+TA6b/gAKo/WQAlgC7/nD+Bv/p/X0ASQJK/BMBtf8sAeP+uPyD/5YAyADz/WICOP++AIcAYP9fABgBwgEKAKUA7f6D/wAA9/5D/p/8FwIxARb+YP+BAUsAAACUAk3+ZAAV/8n/8ACyAhcCdv3O/68A0P1VAJABJgL7BHb9AAAgAwAAu/61/6kB/P7E+uf/if6vAEsAAAAG/5YAwvx7/VD7mP6HADIAUAByAbv+EP9H/7v+ZQTX+4v8afuD/3gFAADt/rMBg/9tAVf+ffuZ+Bj8uvpEAs0AxQP+Ad4DhgF0/yX+j/3CAcIGFAAe+1f+1QJw/oP/K/17/coD2P+7/sUDwf3O/97+mQJLAH4E4PzIAMgAk/6fAQkBKf+WALH+A/36AFUAZv6J/ocAyv7IACADV/4+/sT/rP53AQ=="}},"1991":{"Gold":{"n":253,"d0":1,"p0":39250,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"wf2HACIBtAAu/yT/vgDvAQkBOgIc+KL+Uf8sAbH+q/+7/kYANgHv/PH/W/+h/w8Aj/0EAeAB4v+t/fQB7P/E/1v/1P7XAB///P50/6AAWgAsAb0BPf+I/7r/CQF9AK8A7v19ADIALv/s/3T/3AAu/1UAiP+J/qb/yv6GAfv/GQAUADIA8AD1AN7+RgCr/+L/RgAUAGb+q/9BAJz/3v5zAOP+1wAYAab/bgDs/w8ALQDJ/y0AfQDhAEL/rP6X/x0BAABR/zIAUAC9AQUASwD7/zIA2P+0APAAtAADAjP/Gv88AFb/RgC6/zIA2P8k/z3/EwG6/6AArwA4/24ApQBVAG4AFf94AHn/of94AMT/RgBzAPv/7P8z/5f/Qv/Y/4IAjv6CAEYAdf4l/qAAef9zAFUA9v/O/7X/lgC1/14BH/8a/x4ALv/i/3gATP92/TwAmwDJ/37/4v82AW4Ajv4z/z3/jACRAKUAmwA4/5YA3ABzAPb/ev7SAPoAjAAYAez/3AC6/6b/wwAa/zEBVv8k/4cA+gAdAez/AADK/twABv+m/3gAEP8KAKv/7P8z/1oAPf+bABQAhwDi/6v/2wHs/w4BeABZAXgAdP/O/5f/jACMAB//4v8FANcA5gA3AM/+YP8w/XMA2f4oAC0AVv8nARQAtv7o/goA"},"Palladium":{"n":253,"d0":1,"p0":8175,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"MgB9ABkA+gDn/zIAfQANArv+ZABq/30ASwDO/wb/OP+gAKv/SwDa/W4AjABkAB//AAAZAJYAOwFb/87/ZADO/7X/AACc/2H+YP8AAH0AyABLADYBDwDe/uf/QQATARMBif4KAEEA2P/E/+L/zQDO/30AOP9R/3MABAETAcgA5/9VAJL/fQBkABkAhwBBAIP/SwBFAdn++//bAfb/2P++ABD/GQAAALv+uv+X/xkAnP8AABkA7P9BANP/zv/O/xkAGQDO/93/PAAAAOUBjADZ/n7/DwDY/yMAKABLAEEAQv8AAPH/9v/IADwAKADO/5z/q/90/6AAUAC//+f/5/8ZADwAq//O/5z/zv8yAOf/CgAFABkAIwAZAIP/tf/E/3T/u/6D/30AKf9H/30AGQAZAGr/5/8AAAb/g/84/4oCV/7n/0sAnP8PAG4AMgCD/zIAtf9aAPH/zv9kAAAAzv8ZAOf/AADO/0sAMgDn/xkAMgBLABkABv9kAA8ACgCWAAAAMgC1/wAA4QAZAK8AnP9q/+f/GQBaANj/CgDT/yMA9v+//0EACgAZAEsAAADx/xkALv8yADIAAACc/7X/IwDs/zwAGQAAAM7/GQCc/24A3f/O/5z/GQAKAGQAcwDn/+f/zv+c/wAAOP9aAMn/Qv/T/zIAGQC1/wAA"},"Platinum":{"n":253,"d0":1,"p0":41625,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"V/53AWQAGQDt/rX/PwL5AXX+bQGV/B//+gBT/f39m/vO/9r9owJ2/XECyADt/sf8cP5FAa8AGQAM/kUBgQGh/+sASwCD/9r9xf4sATsBIANeAdsBswFy/JYAMQEhAo4DRvv6AI3/mP61/97+TwEw/VkBof8l/jj/oAAiAZABLQCuAYP/fQATAQz+yABR/7v+EwF3ATH8OP8AAEYAef/2/z7+XgFFAUL/cwB+/4IAGQCJ/s7/ZADwAL//xf7E/wQBpQDe/igASwClAPX2awM9/9IACgDhAK8Ag/8yADj/Pv5q/3D+zv+c/9sB6wB5/2//6wDx/8gANgHs/zwAef8TAfAAfv8PAEj+u/4JAfH/4QBkAIj/uv+6/2H+sv0+/gkB4PxeAZYA1/tm/kkC9v9R/wAASwBR/6L++fx9AM8DKf9//on+5P2S/9EBoACP/UUBqQF9ANr9+gDVAocAyv7O/+z/zQAxAYEB5/89/3gAxwGw/4P/F/3SADYB7f5YAiwBnP/U/jIAUgOY/t8Cg/84/5YA0gC+ANT+jf9m/uf/5//z/T8CnP8AABkA0gAu/+EAwf1kAMgAvgDF/lH/dwEPAF4BdwGqAPb/YP/3/swBBv8PAAz+ZAC5ACIByAC1/6z+q//Q/Sn/UPt9AE3+O/yjAlv/f/6o/aQB"},"Silver":{"n":253,"d0":1,"p0":416,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":1,"p":"+gv/Be8GAQUBAfT6AP/79fz+BfsCBf78//8D//AGBQX8/Pz8/PkI/gcHAAcBCAkR7Qj9AAL1CvoD+v3++goN//74BAL9A/wEBQXv/QIA+QP/BAT8CQEAA/0B/Az++P4EBfsBAQj+AQP/AgcZCPcD+wX0CfsBAPYCBvoJAP0BBwP9/AL6/AH+AwX6Afn29v0B+gL++P0CAAEAAvwAAv8J+/kB+gcA//MCBAb5AQ0G9wD/CgIBAP4FDf/+8wQCB/sA/PoBBPkF/v0HAAX//vsD/P0G/gH+A/wA/AEAAf/9BP8EAgMB+wEA/QL+/gACAP38+/YC/gP9/QcBAPwA"}},"1992":{"Gold":{"n":254,"d0":1,"p0":35120,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"eACD/0f/ZACRAOoBUf9q/9wAnP8OAbr/SwDO/+L/M/8jAJEApv9uABX/JwG1/3T/ggCr/7r/NwBuAB4Afv+N/7r/jf9GABQAV/6lAEf/zQDcAAb/LQCw/8T/XwBl//b/CgDd/3T/zv+s/rH+av+m/ygA5//rAEEA2P/wAIP/4QAG/5z/GQA4/7D/RgAEAWQAwP5QAOj+jAAKAB4AM//7/yMALv+WAFUAxP8ZAM7/dP+lAGD/8f+vAKUAaQBQAAH/AADn/+z/kQCD/yMAtf9fANIAiP8UAN3/sP8PAA8A4QDIAPb/+/+I/wQBQv/6APb/q/8UALD/VQAUAGkAcwAoANj/vgDO/5sADwCWADcA3ADO/2cCdP/i/9wAdP8KAH0Al/9v/3gAv/85/g8Ak/48AFoAH/84/yv9u/6WAKH/zQBC/0EAwgGc/87/YP+vANcAH/95/+EAwwB5/3gAef+6/6oAWQEAAMcBLv/Y/7X/jAAAAMn/QQB+/4IAdP8oAEsArwCc/zIA7P9W/y/+8f9l/wAAMgAeAF8Auv9QABr/JP+m/4IAuv8yAMn/R/83ALX/Vv8g/q8AfQBpAK8AKf+bAEz/wwB+/+L/UAD2/7//4v9aADIAUAAAANj/5/9H/zIAHgBuAMT/FAAdAcT/sP84/0z/IwAAAMT/PAA="},"Palladium":{"n":254,"d0":1,"p0":8000,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"AAC1/woA9v99AGQAtf8yABkAfQCvAOf/zv8ZAEEA2P+HAH0AxP9kALX/GQAjANP/q/8jANj/5/8yABQA7P8AAPb/CgDO/zIAb//s/6v/GQD2//v/QQDE/woAAAAyAAoAKAAPANj/AAAAAAAAzv8ZAAAA5/8oADwA8f8PABQAHgDO//H/DwC1/+f/8f8PACgAv/8ZAJz/tf8ZAAAA5/8ZABkAnP8yABkASwDn//v/7P8AAAAAAAAAAAAAIwAtANj/8f/7/+L/CgDn/5z/Ff9VADwAav9zAOf/GQAAACgAPAAZAOz/+//O/woA9v8yAM7/CgAPAAoAcwAAADIAGQAZAAAACgAjAGkAjABFAeL/v/8FAH0A5/9q/8gAv/8oAOf/q//x//oAAf89/yMAuv+qAPb/zv8AAAb/Bv99AKv/WgD7/1oASwAAACMAKAA8ADwADwCWADIAZAAKAHMA2P8V/zIAZABuAHMAav/O/0sAAAB9AA8A8f8yAOEAlgDn/7X/CgCr/1oAfv+MAM7/H/8ZAEsAWgC1//v/3f8oAPH/5//n/+f/KAAKACgACgCvAOf/zv8f/+f/MgA8AA8AMgAZAAoA7P/7/wAAof8jAPb/IwCvAEsA6gHx/0UB9AHU/vb/NgFeAYj/6P6WABkAu/7n/2r/SwDO/+f/AAA="},"Platinum":{"n":254,"d0":1,"p0":33650,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"MgDt/mr/EwGvAHcB2v1M/3IBVQDbAUsAyf+n/mIC9v/6AAMCTv2KApj++AKGAff+kAENApz/EP9UAQAAav+i/rX/u/4TAa8AAv7DAKP9iwG+AI3/TwGS//oAMgBb/1oAGQBR/x//rwDt/k3+sv1FAR//8f/CAZL/g//hAA8ArQLU/rX/nP+Z/Xn/Kf9UAbX/H//hAN7+Tf4jAH0AKACgAKv/u/6QASwB9AH2/2X/9v/IAAoA4v+9AYcAYP9YArv+lgDn/58BIwCHAEAB6P6zAQMC4/66/4n+g/+h/0EAwgG1//f+GQBw/m4AAf8OAQoAav+vAPb/lwSWACYCPADE/6b/DwAQ/wkBfQBJAvz+if7P/qID1vyo/f4BBv8p/6H/rP48AEIE2v3F/jIAyv5FAVH/7/xVAKf5U/0EAdr99AEyAEUByAA+/jIAdwEiATACj/2r/ycBlgCMAL4Afv96/lAALAHIAKkB7f5C/2//NgFAAUEAiP9b/+EAnP84/4cAnP+3/YP/Gv+bAJz/nP8FANwAQQBVAGr/XwD2/y7/kv+gANT+AABkAMgAg/+pARMB5/8c/XX+PAC+APb/HgAPAGQAZAA7AQv/BQAZAIP/5gAIAoP/4QC1/9IAbQHz/YP/lgCRAG//nP8TAVH/8/0ZAEsAbgCS/9T+g/8="},"Silver":{"n":254,"d0":1,"p0":387,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":1,"p":"C/wB/wQQ+f4JABP2A/8E9/0D/Aj1Bf8ABf7//wIB/vz++QQA/gT7AwL9A/8ABAEB/v/9APkD+wgBAAD+AAb9A/oAAAAAAQP//AL5+wED/QD//AQDAAb9AAf9AAIC/gL8AP8CAf7+/QQC/QL9AAEABQH+Af4C+gH+AP79BAIC/QHz/wAF/gEA//4I+wEF/f8A/f4D//oAAgMF/Pv4AAH9AfkAA/v6BAMD/QAC/wAC/vwGBAX//gH9BP8A//gE/v4CAf/+Av/+/wL+AQIH/wD7AAIA/wADAAgE+/H+AAv8AAH+Av4BAAD//gMAAAAAAPsAAQH//wQC/v79//7/AQ=="}},"1993":{"Gold":{"n":253,"d0":3,"p0":32940,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"xP8FAFUAxP+6/woAv/8jALX/LQBzANj/eADT/7D/MgCWAKb/aQCD//H/GQBv/93/7P8PAF8AJwFb/1v/VQDmAAb/0gAk/x4AcwDE/5z/3f8yAEEAl/94AJz/av+6/w8A8f+MAG4A3f9VALQAWgDi/8T/hwAFAJL/oAByAQoA8AD7/6b/fv9GAKb/PAClACT/VAFzABD/b/9FAfgCqQHK/v4Bef/7/7//TwGMAIP/pv9BAEwE2P99AIP/vwTy/jj/UwLL/SIB5/+QAe3+GPzXAMYCM/9W/8r+l/88AHr+fv/0AcT/fQCS/9P/Lv/GAjIAXgHj/ncBjf+/BO3+SwCdA3MAfPz0AXD+EgJ6/rkAq/9+/woA/P5oAeP+gQFM//oArAMsAVH/Uv5c/lH6PADi/6v/qP0W/jEBnP8jAFAAtv5FAav/nP/x/2X/NwB4APz+2v0yAIP/0vum/9EB+fyU/UABAwK+AHgAUABGAIP/bQHx/9T+HgBC/30AoABl/9P/VAFfAA4Bof+8Arr/yf/d/4EBEwH7/6b/VQDU/g8ALQAAAI3/3/0yAGICEgJeAWX/q/+lANj/4/6HAGX/NwCWAPAA9v89/2QAsP8oALL9uv+4AVH/VAFM/xgBFwLs/w0CBQBW/zwAuv+LAZL/H/+//1UAof9JAqv/"},"Palladium":{"n":253,"d0":3,"p0":10625,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"lgCHAK4Bv/84/xkA2P/2/3/+PAD6AAAAWgCN/4P/4QAAAOf/bgBg/24AcwAZAJYAzv+WABMBGQC1/3D++gDd//f+wP6p/LkAef9b/0EAyAAAACwBUf99AM7/5//n/24AvgAAAKv/av8jADIAhwCS/+EAfQAZACgAPAClAMn/8ABLABkAOP+c/0sAMgBkADj/+gD2/zwAVQDwAJz/zv/n/7kAcwC7/rX/XgGvALX/nP8AAHcB1P4yANj/cwAf/+f/fQDO/zwAQQDhADIAzv/O/0sAMgBkAAAASwBkAM7/AABBAC0A1wCc/7//kv+WAGQA4QD6ACYCAABYAvn8AADbAR//Jf6QAVv/KADIAOf/5//n/87/5/99AOf/GQBkAH0AhwAoACgACgCc/yX+rwAAABkAAABq/zIAzv/n/+f/ef8tAGD/ev6k/M7/RQE4/4P/g/9kAFH/V/7x/ywBYP+D/wAALAGWAM7/dwEyAEL/fQBzAIP/WgDY/2QAMgCD/87/SwDIADwAIgEsAUsAv/8V/2QAyABq/0L/DwC1/+f/zv88AKv/xP/7/3MAZACc/9j/5/8PAEEA4v8oAOf/5//O/87/zv9R/9j/9v8KABX/av99AAAAZAAZAK8AGQDO/24ADwAf/wAAGQAAAOf/tf/n//H/DwDd/9j/"},"Platinum":{"n":253,"d0":3,"p0":35270,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"MQHDAHwB/P7O/6b/pv+lADj/GQCgACgAwgFg/woAZABkAJz/yACi/goAav/O/6UAav/cAHYCSwCc/yn/vgBkACX+av9v+r//3f/3/igAvgBC/zj/7f6aAUf/TwHd/4sBwwDi/93/TP8eABkAFwK1/0oBCgC1/wAAyABeATIAYwGX/wb/W//E/+EAGQA/Agb/BwNR/zj/cP70AdsBpQAQ/zkDXgES/Rv+jgOWAGb+Qv8ZAAEEdv2fAVL+rAPz/ef/kAHz/eUBcwASApEAlfzU/voAbgBm/hX/uQDwAC/+DP4TARkAtf/U/lH/4/7GAq8AkAGc/3gA7P8BBFf+yAD1Bef/K/30AQz+YgJg/7X/AAB0/w8AV/4cAgH//wBGAG0BDQKfAcX+4QCF/Y/4cwAAAOf/if4f/30Azv8AADIAu/4dAcT/xP9M/7f9kAFR/1H/j/2r/y/+gvvn/14BYf5m/pYAcQKD/ywBv//wANT+LAEyAB//AAC7/mQAlgCY/gQBRQEZAK8Ajf+jArX/YP+//z8C8AAKAIP/4QBc/jwAAAAZAKL+k/7XAKkBWAJkAM7/OP+WADcAQv9VADj/av9kAJYAfQDp/W4ASwBq/8v9xP9xAs7/vgAjAMgAEwGc/04CQAEV/14BKf8iAfb/ev7n/woAOwFeAZYA"},"Silver":{"n":253,"d0":3,"p0":366,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":1,"p":"/wUA/AEB/wL+AAIAA//+Af0CAvsBAAAA/wIDBv37AAL7/voAAv/+AQAA/wL//gEDBP4DAf4EAP/+AwT+CAv9C/UC9wn/AwP6C/38/QUJCPog+v3+BQb4/P8d9wP6IukBFOwDBAz35wEM8gP++QH3AAoBAfsB/RD9CvwM/RwFEwr78wj3C+8MA/0B9Qn6DvwHEAz89/Td8Q3/9vYS/fsD+gz+//39D//17/795/8E6vIMAgQBAPz9Cv35Av0DA/wKEgQB9xD+9gMJBAL5//wAA/71+AARCgQC/wQB+gb9BggE+/wAA/zw/Bf7F/8NAgELBPsA+Qr/9QT/BgIB"}},"1994":{"Gold":{"n":252,"d0":3,"p0":39500,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"nP+s/goArvzXAPUAM//bATYB9v8UAOL/Of6F/YwAQv9eAYX9BQCGAR0Bof9tAY7+ov7s/8MAkv9QAAQBpv9zAPL+Gv9b/8T/av+gADsBIwAv/n0AM/+HAGX/UAAYASUDsP/7/6H/Gv8iAVoADwCRAL4AlgCm/9T+jf8nARr/Gv/x//b/BQB2/VAAv/8V/3MAdP+d/ocApv/8/oYBFACN/0UBtf+I/wAAVv9cAxkAxf5tAbr/sP++AN7+TwFv/wgChwBW/87/Bv8dAWQAk/6r/wb/GQCMAB4AbgCw/2QAAABoAXn/DQKX/zsBmP54ANP/Tf72/9j/jAAyADIAM/9H/87/ZACHAKb/q/9VAJsAKf/XAJz/fv9LAGQAcwAjALb++//n//39kv9uAKb/4v9aAGD/ZACD/w8AeAAFAEABNwDd/4cAUAD2/x0BCgDn/24A7P9aADwABAFq/8gAl//7//z+LQC+ANIA/wCr//8Akv+D/08B1P5VAEL/QQA9/+f/XwCm/wb/g/9BAFH/uQBpAJz/mwBuAAv/KACw/24Aav+c/3X+KAAFAAAAuv/2/30A+/9fAN3/mwCh/1oAjf9b/woAUAD2/w8ADwCc/93/Kf8f/1v/tf8tAMn/3f9LALkA3f+vANj/uv+gAL4AnP/s/zIAhwC//w=="},"Palladium":{"n":252,"d0":3,"p0":12425,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"yACN//b/nP+1/zIA5/8ZADIAZADn/87/zv/n/wAAIwBaAHn/RgBBAJYAIwAPAGQAEwHn/xMB5/8ZAJYAfQCr/43/zv/O/7X/AADIAIcA9v/d/yn/DP7SAPb/VQBBAJYAMgDn/+f/5/8yAAAAZAAAAAoAWgC1/wAAtf8AAGQAtf+1/wAAGQDO/87/GQDn/wAABQDJ/8gAxP9VAEsAPADT/y0AnwHd/9j/1P59AMT/9/59ACMAQQC1/+f/GQAAABkAfQDx/xX/tf99ABkA9v+//87/GQA8AFoAGQAyAH0AAAB9AJL/RgBBALX/AAAPAPH/AABLAEsAEwGWALX/GQCc/6AADwBLACgA2P9uAOz/CgDO/wAA5/9kABMBLAFq/3T/8AAsAWr/av/E/3T/GQCWAM7/fQDO/zIAAAAyAGQASwCD/87/q//Y/zIAAAA8AEEAZAAPAPH/MgDF/kEA1P4jAHn/rwCWAJYALAHO/0sA5/9q/87/H/9kALX/MgAZABkAKAAKAGr/MgC1/zIAlgBLAAAASwB9AKb/WgBLAGQAuQC1/6v/uQBBAJz/H/9l/7QAiP/i/93/uQCD/87/GQAf/zIAAADO/wAA5//n/0EATP9BAOf/zv9kAOL/of9kAEsAg//n/xkAGQAyADIA5/8AAK8AZAAZAA=="},"Platinum":{"n":252,"d0":3,"p0":39950,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"Bv9h/sr++fwTAfoAQv+QAZ8Bzv8yALX/sv2F/RMB9/5nAhL96wCAApABzv+QAXD+Uf/n/+EAAAAZABcCCQEsAfP9MgDU/lH/cP6lAE8B9v9h/n0AH//IALX/lgAsARoEM/8FAFH/u/4sAaz+YwHSAAAAwgEsAdT+5//VAvz+Fv4ZAFH/pv/W/JYAMgAV/1H/xf6P/Q0C1P4yAA0Cof9D/p8BUgNX/tT+qP0gA3MA/f2KArX/ZABFAT7+rwDn/10C3AAG/8r+mf1eAV4B8/1LAAb/AADSAK8ANwC//+EAGQDCAYP/dwH3/iIBu/7x/4n+1P5zADIA2wEDAvH/Bv9w/s7/zv/hACwBtf8sARMBcwD7/93/Uf9FAVQBzAG1/7v+XgEyAK78Jf7n/4P/OP9xAu3+yAAG/68AhwAu/0UBAABR/wAA5/9kAGQAav9kABMBhwBBAMgAjACs/hMBDP59ACv9IgFuAEUBRQE4//oAkv+m/1oArP5FAbv+4QC1/+EAZABR/7v+ZADO/zj/+gCWAJL/gQGpASX+oAB0//8ASwD8/hz9kAHY/5L/ef8H/loAUf+HACgA2wF5/0sAv/+7/uf/zv9kAIP/AAB5/0YAt/2D/2r/GQAJAQoAtf93AZABH//E/x0BEwHIAMgAnP8G/68ArwCD/w=="},"Silver":{"n":252,"d0":3,"p0":528,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"++sJ7A0H+w8N//8A8vIJ+wTxCQYQABLx9wME+AUH+AX5+/4CA/0GCfcC+QT7AwkP+Aj9+gf+BA4Q/v34/w329f38AO4GAPv8/wAC+vUDBQALAfj3+yAA8w4C/Q73DfwSAvD6+gUE7f/5AQUDA/oJ+hH6DvMG7wT+8wH+CwMC9/gAAQf1+wYD/Av6/wEGAAH8BPz4+wH6AAX8B/ICBv4GBv4ABAAN/gQE/QMHAPoG+wD5/wUFE/kL+wED+AD3CP8ABvv7+wDyAgL7Bf/4Af4I/v30BgT6/f7/+QX+Bf4F//gAAv4CAP368AHt9wT7AwYI+wAG+wQC/PwGCfs="}},"1995":{"Gold":{"n":252,"d0":2,"p0":38140,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"xf67/loAp/6lAFoABAHcABX/LQCaAW4A9v/SAJj+FACI/87/Zv77/ygAnP9uAJL/+//Y/2kANwCw/ygAWgCw/y0AEwHi/wAAAAA8AOj+kv88AEf/vgAZAPAAmgEu//oAtf/1AIwAb/8Q/+L/DwCI/6oADwCh/wUAQQCm/70BOgLi/zcAfQBR/5L/TP9GAAoApAEdAZj+1P5GAKv/3f+7/iIB1P65AC0AlgBpAG//dv3i/2QA7P8UALr/3f/T/+f/zv9pAFUAzQAeAEf/l/+MAIj/UAAtAIIALQB4APb/uv94AEoBsP8KAAoApv/Y//b/BQD7/0f/DwC7/h4A+//x/yMAXwCw/1oAWQGS/wAAbgD7/3T/OP88ABQAq/8eAN7+DwBg/1oACgCgAMT/PAAPANP/8f/Y/2QA2P+S/7kARgA4//b/3f/O/0EAef/n/w8APf/T/9j/mwD6AI3/ZAD6ALr/NwDi/0YAv/8z/x4Al/9pAPv/IwAUAL//q/8jAEsAq//XAAUAAAD2/8T/AADs//v/3f9l/0YAAADx/x4A8f/O/yMACgDi/zwA4v/s//AA4v/hACcBov7O/6H/wwD7/xkAav/t/l8AqgDSAKUAkv+6/6b/BQCCAFAAXwAjAIP/3f8Q/w8AcwBkAKb/ggCI/w8Azv/x/w=="},"Palladium":{"n":252,"d0":2,"p0":15660,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"5/8V/0sApv9pADwAGQCWAIn+ZAClABQA9v+HAKH/PAAZADIAav8yADIA8f8PAOf/AADn/wAAAAAAABkAGQDx/ygA4v8FAAAAzv/O/7X/av+c/4P/PABzABkA+gCc/68AGQCvADIAyAC5AOEAWgAf/08BIAPa/cT/2wGD/2QAcwA8ABkA1P6gAPz+xP8UALX/OwE3AM/+cP5R/z7+MgBR//oAMgAZALX/SwBLAIn+OP+vAIP/EwEjAH/+zv8yAJz/DwBuAOEAfQBLALX/if4yAIP/g//n/2QA5/+WACwBav9LADIAg/8ZAM7/tf9q/xkAVQD6AEf/5/+//93/g/9kAOf/AAAAALX/tf90/x4AIwDO/5z/nP99ADIAtf+vADj/5/+D/xkAnP9kAOf/5/8ZAM7/Bv84/2QASwDO/9IADwAAALX/tf/n//H/R/+c/zIAAAAZAFH/DwBzAOL/CgClAM7/MgDO/9j/xP+o/Zz/rP4JAfH/jAAsAQoAFf9kANr9av+BAUEAAAAAAM7/tf8ZABkAjf+S/87/zv99ABkAnP8ZADwApQBR/7X/nP+c/5YAAACvAM7/jf8oAN3/CgDO/zIAdP/2/xkA5/9VAA8AR/+//1H/AAAsAef/3f+HAOEAav+D/wAAg/9LAIn+4QC1/zIAOP9q/w=="},"Platinum":{"n":252,"d0":2,"p0":41600,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"2v0r/cIB3v4JAcgALAEmAiX+SwCpAZz/zv/6AJP+5gDY/wAAev7XAOf/tf/2/2r/jf+7/pABoAB5/0sAGQCc/xMBfQAAAMT/IwAyADT+3v61/wz+SwBLAKkBzwNR/0UB7f5eAWQA1P5LAGr/AABd/UUBoAAu/5YAuAEB/y0FSAPiBPQBDP5R/5YAu/4yADj/nQPCAXb9RP1X/iX+4QAKABwCif6QAVgC2wGWALr6GPyc/5z/H/9VAKf+jf/hADj/2P+4AUsADQK1/97+/P6MAHT/SwD2/2gBAABFAcgASP4JAUUBtf/n/30Atf+1/9j/jADn/yn/9v/B/c7/MgDn/wAASwC1/xkA+gBR//oALAEAALv+lfyWABMBOP8ZANT+OP9E/UUB5//IABX/LQBaAIP/g/8l/jYB1wATAYoC4QAf/zj/g/9eAakBwf2m/4wAxP90/y7/0gBYAoP/lgANAvf+2wHK/n0AKf+9/HD+rP5eAU3+lgDXAJP+Ev1eAfH/sf7hALkAYP/n/wb/AAAyACMAv/8k/+f/zv+vAEsAOP+J/iwBzv+D/0EAnf6+AO4CnP+EA9T+Pv59AJz/bgB+/6oA7f5R/30Azv//AOL/Uf8ZAKL+aAEoAM7/AABeAZL/9/5X/lH/cwCgAE3+6wDU/sgAov7z/Q=="},"Silver":{"n":252,"d0":2,"p0":484,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"8/cI+gQABgr5AwoC+Aj2//3+9wP+/wf8AP0GA/4BAf7/BQD9B//w8P77Af8LD/v+AQoB/f0BAfULAfkDBwMoDvcPAQT49A33KRrl/wb5BfYZ8xEBCQf00/v9+gf+/gn49wwJAP3v/Qn0C/8E/Qn8/vwN/Qj++vj+AAD5B+f/AAAFBfsECvkEDf7uAAb7/gP2AvkM/wb9BQf8BvgP/g4QDvfxC/cA9PIC/f74EQz2DAL3BAAH+PQK+wj9AgX1+P8C/Qz//wD8AP0AAP4E/v8K/PkD/f4F+f8K/gf/9gL/A/8D+PcDBAD6/AT8BAT/AAD++fsDAQL7BPwE/QE="}},"1996":{"Gold":{"n":254,"d0":1,"p0":38710,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"VAE2ARgB2P/d/24ACQHP/nn/GAFuAHT/uv/0AVUAIwAjAJUBPf99AKL+VAHFA5z/z/7/APT8hwDP/h//WgBBAGr/HQHO/079VQBg/7QAsP+X/wkB+/9b/8H9RgA8AEEArwDE/4wAfv/O//H/2P/d/zwAyABGAJEANwB0/0L/Vv+//8n/MgBKAc/+PAAFAG//5/8u//b/dP9QAEsA3f+1/xMBFf/E/1UAtAB4AOf/9v/T/9j/Zf8AADwADwAyAKv/0//s/yMAuv+WAM7/9v+c/xkA0/8Q/x//DwDi//H/pv8eAGD/hwAjAG4AVv/2/87/cwCr/5z/Vv+6/3MASwBg/woAggB+//AApv+WANP/bgCc/xQAMgAPAEYAsP9BAPH/DwDx/zwAcwAyAFAAWgDE/87/QQCI/zIAyf+r//b/BQBVACMAyf88AJYA3f/E/7D/3f8eAIP/BQDY/8T/Af9GAKH/HgAPAEEA2P8UAMT/fv8oAKUAiP9R/5z/H//XAB4ARgDE/4wA9v9GABkAsP/7/+z/5/+h/ygA8ACbAOf/av88ANP/M/+c/y7/kQA8AHn/AAAtAIwAuQBaAA8A6P7x/3T/HgD2/2D/TP/E/8n/Uf/i/3T/av+MAC7/1gE+/h4AUACc/y0A0//i/0YAPADY/87/FABBAAUA+/8="},"Palladium":{"n":254,"d0":1,"p0":12875,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"qQFq/xkAnP+c//b/v/90/74AMgAPAL//AABkAAAAzv9R/2QAOP9kAOf/MgDuAl4B5/+vAPf+pQBR/zIAlgDIALX/AADn/87/MgCD/xkAtf+1/4P/5/8G/wb/ZAC+AAoAqQH6AM7/OP+1/87/zv9LABkAMgBkABkASwBq/2r/lgB9AM7/zv8yAIP/zv+D/7X/GQBq/xkAAACi/iwB5/+D/68AZv6N/zIA+gCCAB4AWgCD/2r/AAAZAAAAMgCc/4P/u/4ZAH0ASwBR/8gASwAAAAAAUf/O/zj/lgDn/wAAtf9kAOf/SwAyANj/9v8AAAAAZAAyAJYA5/8yAGQAGQCD/wAAnP9R/2QA5/8yABkA4QCc/wAAMgAZAGQAtf/n/wb/PAB5/wAArwCD/5z/GQCD/xkAMgCc/2QAzv9R/1H/Uf+vAEsAnP/n/xkAGQBLAM7/5/8AAOf/MgC1/+f/tf+1/5z/AAAZALX/nP9kAJz/Uf8f/8gASwCD/zIAAACvADIAAACc/2r/5//n/zIAnP+c/wAAAACc/zIArwBkAOf/g/+1/+f/zv8yAOf/GQAyAOf/5/9LABkASwAZAPoABv9kAM7/5//n/wAAzv9R/5z/zv8AABkASwAZAEsA5//O/5YAfQBkAIP/5//O/0sA5/8yAAAAnP/n/+f/5/8="},"Platinum":{"n":254,"d0":1,"p0":40075,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"DQKpAV4BXgGD//H/lgD8/kL/IgGQAVf+GQBFAU8Bq/+i/iYCV/6vAOP+swEaBO3+1P53Afn8MgBX/iwBnP99AJz/+gDO/4/9EP8+/n0A4/6c/+UB9v84/0j+AADXAMgAMgAZAPoAtf9b//b/AAC1/2QAZADn/2QAfQA4/wb/ov6N//b/lgB3AT7+lgAyAPz+dP8f/1H/tf/IAF4Bav9R/8IBSP6S/wAADgGCAEsAZABR/+f/Uf8ZAM7/GQDO/4n+nP8AAIcAxP8AAOEAzv+1/8gAUf8M/qL++gDO/5z/tf99AGr/jAAjAFoAjf/O/wAAAABg/7//q/+5AHMACgA+/sgAlgAG/8gA5/99ADIARQHU/ksAZAAZAOEAKADY//oAGQDO/2QAkAEAABkAnP/t/ksAZAAG/zIAGQAyAGr/Uf/IABkAv/9BAJYAnP/O/wb/av8yAJz/nP+c/0sAnP8AAO3+zv9q/zIAtf/hAFH/Uf9kAEsAnP+i/uf/OP/hABkAGQC1/0sA5/9FAef/H//n/7X/AADn/87/yAD6AAAAov6c/+f/H/8AALX/fQBLAAb/ZADIAGQA9AG1/4P/Uf8yAJz/zv9LAHn/jf/t/oP/ov4ZALX/g/8AABkAtf9w/jIASwC1/zIAg//O/3cBAAAyAGQAzv+c/7X/AAA="},"Silver":{"n":254,"d0":1,"p0":517,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":1,"p":"EgAPA/4DAvb6BgP9+wkJ+/4K9Qf6Bxj9+wfwBvgH/gb5A/7yBPj+AP0GAfzyAQEGBgEIAf7+APsHAwMBBfv0AAH+AgH4BwH8/fAC+AQE/wAF+P8FBQMFAvv//P4E/v75AAAF/QMD/f8F/vH7BAD9+//zEwED9gAAB/38+AICB/r/BfwE/gMAAvEAAfwG+wEACv4EBP3+/f7/CPgEAfsEAAwB/gIE/P0C/gL7Bfr+/AH//f8C/wH1+QMC+v4D/QYA//wD/wkGAf4A+/gBBQMA+AL9+gD9AQL8+wkACP//+wf8AwP5/fn+/wH//gz4DvMFBvwA/v8FAQL7AQQA+A=="}},"1997":{"Gold":{"n":253,"d0":1,"p0":36780,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"ov4H/mD/R/9+/5UBaQAa/xv+mwAKAAoAsP+2/uL/OwEPAJ8BOv2r/1L+g///AMX+GQAG/woAKf89/2ICzv9uAPAACgCD/04CqgBkACgAEwGQAXgA+/+o/Zj+0/9M/w4BNwBW/5sAof8v/psAdwGc/5f/GQBm/g4BIwBVAGD/Uf8yAH0Akv8FADwAOP+X/2H+5/9QAA8A8f9+/y0AFAD2/xr/lgCm/xkALAEp/68A8ABUAab/qgCm/5L/k/6r/+f/RgB+/74AcwBkAAUAUf/s/3T/Vv82AQUADwDi/0L/xP/n/y0AQQBC/8T//P6qAAUAsP/E/7v+0/8p/1UAOv17/Y3/R/+GAV8ASwAV/zIAtf/WAcwBM/9b/wH/DgFaANIAkv/Y/7r/g/+6/z7+CgAJAcwBjABkAH7/hP7/AHX+9v/2//b/aAH2/8T/RgCc/woABv/s/+z/LQCX/wAABQDcAPb/ef9H/0YAMgD7/9j/ggBzAOYAoACqACUDB/6//zEB9/4oALkAt/1aALr/Bv+qAMr+BQCD/+L/PAB0/w78wwD7/x4AmP42Aez/ggAV/2QAnf5aAM7/Uf9//mr/QQATAbH+IwDSAIT+Kv6r/0sAnf4PABD/g//o/mkA/P7T/24Ayv4PAAUAHQFfANwAeACvAIYBJP/U/lb/"},"Palladium":{"n":253,"d0":1,"p0":12075,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"zv8G/zIAfQDrACgAGQCD/4P/fQBLAAAAtf/n/xkAMgBkADIAav/O/wAAMQGRADIAfQAsAUUBfQAyAD8CV/52/SYCav9q/30AkAF9AK8AJwY4/z7+GQAG/6L+XgEZAIoC5/9X/mQAMgDU/rv+WAK7/pz/ZABw/ksASwATAR//nP99AAcDRQH6AO3+H//U/u3++gBLAKkBzv+c/xkARQEu/24Ag/+D/zIALAFR/87/PwKdA1H/4QCWAOf/Bv+KAiwB2v12/akB9QVSA+D8Ev2c/7gLxAn0AdT+dPUgAxj8DP7IAOD8DP68AmQAkAFE/XD++gDO/wz+kAGc/zj/nP8M/q78cP4+/sgAXgFq/1gCBv9eARoEXgG8Amr/+gBkAHD+6AMsAUAGWALiBPj4dv2EAywBDP7O/678OP+o/eD8RP0gA6j9yACo/aj9LAHIAD7+zv9kADj/LAFw/pYAyACQATIAav9q/5z/9AFkABL9JgJw/iwBZADIAAb/Bv/IAPoAnP+KAsIBcP76APoAtgOQAV4BtPt2/dT+yAA4/2QAnP+wBNT+1P7U/sgAlgCo/ZABBv9eAZABzv84/9T+AAD0AcgAcP7U/pz/ZABkAAAAcP7CAc7/nP8AAAAAnP+vAFH/cP4M/kT9OP/6AKL+OP9q/+4CkAG8AsgA"},"Platinum":{"n":253,"d0":1,"p0":36950,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"1P6J/oP/Bv8ZAHcBGQAf/zj/SwBLAJz/u/4ZAOf/yADO/xMBqP1q/+3+AACWADj/lgBq/68A+gBR/1kGOP/t/vQBzv9I/hwCrwAsASwBcgYNAsf8u/67/l39RQEG/9sB5/8G/30Atf8G/7X/rwBq/1H/SwA+/pYAcP61/1H/u/5q/8IBtf93ARkAUf/t/s7/9AFrA68AAADa/c7/+gDO/7v+ZAA4/xkAlgCc//oAowIUBdr9+gBFAZz/wf1LAIoCRP04/z8ClwQUBRL9Pv5q/zQI3AV8FST6lPio/Xb9gvs4/5T4DP70AZYAwgEM/tT+ZwJh/rwCTAQM/nD+2v3O/1D74Pw4/+4CwgHa/XcBg//IACYCMgCWAAAAigLCATIAnP8sAe4CJgIIBxD12v3iBCwBPv76AHz84PwsAeb7fPwgA3b9AADU/pYAXgEAAGQAov4aBEsARQFw/g0CEwFkAJYABv8M/mQAwgG2A5z/IAOo/aj9OP93AeEA2v2WAAz+1P6EA8gAcP6QAfQBov5q/6781P6WAAz+kAEG/xL9Vvq2AxL9UgM4/2QAAACu/DIA4Pyc/ywB1P44/zj/nP/oAwAAcP5R/yX+2v2QATj/yACQAZz/Bv/O/6L+ov4AAPD7NP4+/lD7wgEsAcgAnP/O/yYC9AGc/5z/"},"Silver":{"n":253,"d0":1,"p0":477,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":1,"p":"+f0B/gAJAfn8AwcA/v0DGP0J9fwI+AP7AvgMAfUeAggB/f0H/f4EAgAG/fn9//0L/gAE/vz8B/v6BPgE9/r09AIH+gAC+QABCvUDAfz/A/74AgEHAf0DCAP9BPwB8AT7AP8JAfwO8wL9ARH3+wH+/AABCPgD/Qj9AP78+QAB9vjqAwYC/voE9gQG/AH/AwMCAAIJ/wXv/wUBBAMC+Qz+AAH+EAAABvoE+QQEAPwHAAT++/QECf/9BAMBCx4B/AEN9gf/9gT68wvuAgIBC+75APwCAfwGAQAK+AcBBwQH/gELAhby9wMD+ggA/QIM+y0W5hH0FfwH/f4Y/fzs"}},"1998":{"Gold":{"n":253,"d0":1,"p0":28770,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"3f/V/R4AUACc/6z+NwCtAiD+cQJg/5EA1gG+ABX/GQU+/lH/WAIL/xQAGv8+/nIBDgFg/0sATP8FAJz/4v+WAHT/MgAFAMX+4/77/0YAYwFAAS7/W/9+/9P/FADx/18Ag/9zAJz/3f8q/twA7P+qAF0C3f9GAGMByf8a/6oAGv+ZAvMCTf48AHT/cwCN/zP/vgCm//b/kAFUAT3/g//o/pf/OwE0/kL/uv8+/g8A8f9aAFL+ggAcAvz+uv+m/8MAQQBH/4/9UACc//v/xf6fAX7/DwBC/1MCLv+D/yD+OP8eAMgA0QEjAIcAUABb/7//fQBq/xMBhwB5/0f/tf/7/30AKf+r/7//lgA8AJsAtf9pADcAsP9q/1UA1P7Y/0EAR/8ZAO3+of87ATj/v/8AAFb/ZADo/tIAav9uAIcAM/9LAPH/2P90/2D/Ev2uAeYA3f8/AicBl//F/pYAKgOn/gUAiP9q/0ABfQCY/s7/BAE/AgH/MQHt/uoB8AD3/hD/+gBeAfL+1P4PAOz/xP+9AS7/Bv9pAMX+pv9b/7QASwDn/9j/3f/3/gAAUAAOAYj/v/+5AMT/pAFH/7X/7P9ZAUz/0/8jABkABQDJ/wUAEP83AKH/yf/7/9cAnP+MAMT/z/59AAUAeAB0/xD/g/+c/5f/BQAKAEEA"},"Palladium":{"n":253,"d0":1,"p0":20400,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"AADU/mQALAF4BWQAhAOeB0r81P5w/mr/wgEsAdT+XgHa/Zz/AAD0AcgAOP8AAMgAAADU/tT+ZAD0AZz/AACc/6j9nP+QAQAAyAC8Ajj/cP7U/gAA9AGc/zj/yAD0ARQFLAFABrwCDP4k+twFGPx4BXgFDP58/Dj/tPuo/SADAAB+BPoAUPsUBbwC6ANaCvL5gvvKCOgDkAFQFAz+GPx09XgFOP8sARj8ZABo97r61P4OBoQDMBGQAWwHfPzg/Fz5GPyc/xj8uPI89kT9iPq0+zQI6AM4/7AEMPhE/aj9TASo/SwBCAcM/vQB9AHoA+D8RP0AAMgA1P7IANT+qP2EAwAAlgAG/zj/AACQAfAK3AUsAaj9XPkS/cgAgvtYAjj/qP2QAcgA2v0S/QAAAADU/jj/nP/U/pz/cP6QAQz+ZABYAvQBnP84/3z8qP30AcgAAACQAWQA4PxkAIQDLAFkAJz/AAA4/87/ov6u/DIAWAKQAZz/DP4M/vQBAADO/zIAZACc/+f/GQA4/zj/OP8sATj/OP9kAAAAMgAyACwByADU/tT+OP9kADIAlgCc/zj/AAAAAPoA+gA4/ywBwgG2AyADwPl8/AAALAE+/gAAav/n/2r/rwAyAFH/ZQQUBSwBqP1kALAECAfA+WQAvAK0+8gAQAYgA5z/"},"Platinum":{"n":253,"d0":1,"p0":36600,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"OP+o/QAAWAKc/2QABv+kBtUCUf9w/kT99AEgA3D+9AE4/5YAyADO/2QAOP8AAOgDAADU/kT9+gBeAQz+AAAAAKj91P5YAkT9OP+QAQAADQKvADj/lgCJ/hkAav+QAe4CcP7CAe4CqP0AAGwHcP4HAw0CtPtkAGQARP04/5ABcP7oA/QBqP0mAmQAlgBYAoj6qP1YAs7/XgH0ARj8DP4AANT+AAB2/Wr/LAEM/pz/ZAAM/nD+CAcAAAAAtPuc/6j91P6c/6j91P7g/JABDP75/AcDOP/U/sIBj/2D/9r9Bv8AACADIANw/jj/nP/U/jj/MgA4//oAIAPoA3D+OP8/Ag0CkAFE/ZYA+gCKArYDAABeAUr8OP9w/sgADP5kAAAAAAAAAHD+yAA4//QBMgBq/9T+AAAl/hMBRP2c/5ABAAAsAXD+AABE/dT+fPwUBVgCqP2KAjIAqP3U/iwBLAE4/wAAZACo/dT+AAAG/87/LAEsAaj9DP5kAJABZACu/Nr9WAJYAmr/Ev2WAHD+MgBYAnb92v2QATj/MgDO/5ABAABw/pz/AABkAPQByACc/3D+nP8AAHcBnQMM/l4Bzv+8AsgADP44/14Bov4AAMgAav8G/3D+yADO/87/kAEsAQAAPv6WAJAByAAS/TIAOP+c/2QAkAGEA5YA"},"Silver":{"n":253,"d0":1,"p0":594,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":1,"p":"+g4H/eDrBgsJCvME/wn7Cwv9DvUUDUMyGsL6/PcIAQzO/gfj+PvjIBj19fn/5wYT8gf0++UECScO9AIC/f8M/xz25wj7AO/vFf/8CAEA9fj+CvwH8OwN6gDfCgro7/wN/f3sCesS/gf+BgIV9vvy+AQPBP0CBf38CvcGEfj1/gL/APz+Bv8E+QoDFwIQ6wID8//0/Qn7//T3BfID///+AAYA9/UB7voM/BEG/fANB/f9Av8GAPX/Egz8FgL++vL5BAnr7wP5Ag76/AP///8OBv4B//j8Awn8AP8ADvf3AQX7/AAAAAH//ADtCf4CBAEA/AgHCPcC+gACAQv9"}},"1999":{"Gold":{"n":252,"d0":3,"p0":28825,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQE=","pw":2,"p":"g/8PAJEA5gAjAA8AwP4G/w8AbgAjAHT/eABBAG//ZABq/6L+TwGRAAkBJP/i//oApv+I/8n/KAD2/wkBOP/y/h4AjAAPAMn/yf9kAOL/GQC//xkABQB4ADwAVAHY/+YA8f8Q/0P+3v4tAKb/aQA8AKv/zv9R/1v/4v/n/0YAKf++AA8AeABuAOz/hwD8/gkBSwD2/7//yf8jAMT/YP+CAFoA1wDn//b/BAEq/u3+Ff/i/ygAiP+S/3T/R/+bAC0A9/4tAMX+g/8YAdX9mwDA/gkB8f8G/0f/k/5VAAoAIwC1/woAlgB5/wAA0//IAC0Ajf9QACgAtAD2//v/Zf8C/hQAPACh/0z/hwBH/2kAW//x//b/9QDT/3T/RgDs/zIA4QB0/yMAtACD/6H/cwA3APb/SgEyAG//5//6AN7+AACS/7b+nP/7/5sA9v9VAHT/hwDO/wAAbgBQAMT/KAAKAEYAVv/O/woA9v/kAlAA3ABKBo8CVAu6+rX/awOqBYP/RP3bAQz+PwLU/tcAZ/2lAJ/8SwBX/h//q/9D/g39GgQz/wz+TP/i/zIA5//U/uEAPAC4Aaf+9v+6/1kBTP8FAEYA5gBzAEEAfv9m/pL/xP8p/7j8mP4TAUoBjv6N/4IANwDT/ygAGAF4ACMA8ADE/4wAHQEUAA=="},"Palladium":{"n":252,"d0":3,"p0":33400,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQE=","pw":2,"p":"AAA4/1z5nP/IAGQAcP7U/sgAkAGQAQAAZACc/2QAkAEsAcgA9AH0AQAALAFMBCwBwPmQAaQG1P4AAJz/nP9E/Tj/TARw/uD8ZAC8AsgA1P44/zj/OP84/8gABv/O/5YAwgGc/5z/ZAA4/8gA7gLO/zj/ZABZBlf+DP6c/5z/qP1YAmQAOP8sAZABAACc/ywBsAQsAaL+RP2u/ET9DP52/br6AADw8ez6VAvcBWQAZAAmAvoAWAIM/vQBcP58/AAAZADO/4oCyAAAANT+/gH2/+EA5//IACwBAADU/uD8kAFw/gAAAAAAAHD+cP44/8gAcP6i/gb/AADU/jj/AAAAAOgD9AFkAMgALAEsAWr/Bv+c/2QAWAIAAGQAzv+i/sgAOP9w/pz/vAIAAAb/7gJw/gAAnP9kAHD+ZADIAMgAyABkAGr/Bv/O/87/nP/6ADIAWAL0AcgAOP8AAFgCLAHuAj7++gDU/gb/nP/0ATj/cP4sAfQB8ArA+QAA9AH0AeD8yAAgA8gAkAEY/Dj/GPzIAJz/9AFYAjj/WALIADj/AADIAAAAnP+c/8gAyAAAACwBWAJ4BQz+ZAA4/8gAGPzs+iYCUgN2/ZYAov4G/5z/kAEAAMgA9AEsATj/9AGc/+gDIAOc//QBIAPIADj/OP+QAcgA9AH0AQ=="},"Platinum":{"n":252,"d0":3,"p0":36250,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQE=","pw":2,"p":"AAAG/9T+LAHO/8gAK/21/wb/RQGD/2QAAABq/zj/lgA4/8r+Qv/IAMgAXgHO/7wCdv3IAD8Cg/8sASADov6i/rwC6APa/SYCkAHU/mr/av8G/wb/nP+WAPoAZAB2/Wr/AADU/jj/LAEAAPoA+gDIAAAAov4yAAb/2v04/zIAov44/5YA5/9FAWr/nP8AACwBkAEAANT+1P44/5z/nP8AAKj9ZACc/wAA9AHIADj/nP8sAQAAZADU/gAAMgDO/14Bav9kAGQAPwJ9AAz+lgCWAMIBBv8G/5YAyAAAAHD+AACo/Tj/av9q/3D+MgBkAH0Aif6WADIAwgG7/h//AABq/14BkAE4/zj/zv/O/8gAOP8sATIA4QC1/zIAav/g/MgAAAA4/5ABkAEAANT+LAE4/5z/+gDO/3D+AACQAcgAyABw/mr/H/9LAJYAzv8AAM7/yABkAF4Btf99AF4BvAIaBAb/ZACD/30A+gD0AQz+1P6wBLYD5AwQ9YQD9AEsAUT9IAPoA0T9eAVw/pABcP6U+NT+eAUsASwBAAA4/7r6XgHIAJz/OP84//QBvAJE/ZABTARsB1D7hAPIACwBiPqo/aj99AGc/0AGfPxw/jj/vAI4/wz+ZACQAQAAOP/IAJAB9AFw/gz+AACo/cgAkAFYAuD8vAIsAQ=="},"Silver":{"n":252,"d0":3,"p0":500,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQE=","pw":1,"p":"9xgO+AQL7vz9Av8BAv78BvkBDwQAGggH9fsA/Q4L+OMIDv74APgQBPPx9Af8B/gFAvbw/wAAAwb8/AEDA/f++gEC+gb3BfoOBQf+AwP8/AsHEPX8DvALAAL9CvUC9wP+8Pr99/37Cv76CAD7CQcD+/oEAvYFBQMC+wgHCfkD//cF/wLyA/kG+gD+CQH/BP8RDfcFC/r4/vgGBfv4/gD9/gb0/v0E/Az6BfoDAQIB//oA/QACAgsB/wcMG/MJ+groC/39Bf4K5fz1AfkEAwL4Awj3AQEA//ADAwH8/wII+QMABAj7AAL8Af34/wYB+wIB/gj+BAD9AAP/AA4="}},"2000":{"Gold":{"n":252,"d0":3,"p0":28205,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"BQBR/6UA4v8AADcA+//DAEsAwwC+ANj/v//n/30AhP6gAN3/yv48AMn/1wDhAF4Lv/odAQ0CDQL5/FH/dv0/AnD+XgHd//H/6f3t/kj+fQDn/yX+HgD7/6b/uAGJ/jYBC/9BAGD/4v/e/r//ggBFAd7+YP/J/2v+iP8Q/7D/IgEz/3sCV/5uAJsA4v+h/3MAtf8dAVb/2P+m/87/Gv9g/+f/q/8EAeL/QAG7/t3/WgCw/7D/yf8FAKv/Ff99ABkAcwCD/6b/Af+LASn/NwAPAGsDNgHXAEf/BQCX/3oDSf02AXMAJP9W/xQAzv+w/xr/eADXAMIBVv+S/+f/9v8a/4P/CgC//7X/JP8AAK8AGQCr/3r+9QDi/37/jAAFAFH/l//2//H/zv+x/hQAMgBW/w8ARgDmALX/UAClAAAAtf8Q/2X/0/+HAEEAdP/rAKUAKACw/6b/Ff9zAGr/FAAAAAAABQDY/9P/pv9v/w4BeAAyAEYA9QDK/hQAQv+S/wUAyf/J/87/RQEk//kBhP5q/0sAsP9kAOf/q/+S/wH/uv/Y/0f/3ADn/0YAuv9b/1oAuv9VAKv/FABLAA8AbgC1/5YAsP/J/woAFABjAbX/OP+kAfv/RgCc/6kBTP+w/2r/l//n/zwAFACX/0sAGAFfAEsA9v89/w=="},"Palladium":{"n":252,"d0":3,"p0":44400,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"qP3U/jj/sAT0AQAASvyi/iwBDP4gA5z/IAPoA3gFOP8sARQFqP1kABQFWAIUBUAGrA0gA2QAFAWwBHwV1P6EHBj8NCEc8xwMuNk89qwNxAk89iT6bO70AQz+xAnECfQB4Px8/LAECAfU/nz8wPlI9Az+PPYk+gAA9AEY/Pj4XPn0AdwF7PpE/ST6RP28Ajj/yACwBCwB6AM89rwCIAMM/owKIAME91z5vAIAAFgCcP5kANT+DP44//QBAAAsAXz8ZAAM/gAAkAHIAJAByAD0ARwMyADcBdwFkAE4/1gCFAWc/5gIhAOc/3D+zPfs+ngFcP5Q++gDPPYk+iYCEv30AdAHNAhYAgAARP2EAygKsATIAFgCZBm0+3D+OP8M/rwCUBTcBdAHPPZI9ITqMPi0FHgFOP889jb34gRE/bwCMPjoA1D7GPwM/tT+DP6EA/QBqP3U/rAE/AjcBeD8OP84/wT3aPfoA8gAAAAsAbwCDP4Y/AAAOP+c/wAALAHoA0wEWAJE/QAALAE4/2r/av/IACwByADoA/QBcP6o/bwCyAA4/8gACAcgA3gFlPgsAcgA1P70AQz+AAAsATj/nP+KAl4BOP+c/wAA9AGEA2QAhAPoA0QWOP/4+PQBoA/cBcQJDP6U+GAJDP4M/iwB3AXoA3gFcP6I+g=="},"Platinum":{"n":252,"d0":3,"p0":44200,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"tPu0+3D+ZAAsAQAAyAD0AfQByABYApABDP5MBOgDfPyEA6wNAAA4/8gAvAKEA+gD4PzwCpz/9AE4/+D8eAVgCfDxGPyU+MgAgPMAAJz/hAN8/CwBJPr0AQAA9AE4//QBAAAsAcgAZAAsASwB9AFkAHD+GPw4/5z/kAGo/fQBKAo4/9wF1P6o/aD2LAEsAVgCkAGQAUT9RP2o/bT7cP4sAUgNmAhE/cD5WALs+iwB9AHIAMgAWAKI+sgAIAN4BdAHqP1sB3z8DP5kADj/kAEAALAEyAAAAPj4ZAA4/0wEJPqc/8gAIAOEA4QD9AEk+twF9AEY/JABfPwY/Az+UPvU/rwCIAMAADj/IAOQAQgHAACo/QAATAQM/hj81P6c/6j9sAQIB2AJaPfA+XD+yACQAZABJPosAWQALAHIAKj9yAAsAZz/LAHIAEwEvALg/CwBmAjA+UwE9AEAADj/OP+o/Yj6cP7oA5z/AABE/WQA1P5E/Xz8WAIAAJz/DP5kAJABvALIAAAAOP/0AcgAcP6o/WQAyAAgAzj/OP/g/CwBnP84/5ABWAKQAegDOP+o/VgCAACQAXD+qP0AAHD+AACQAcgAqP2c/5z/AACwBMgAkAHIAKQG1P7M91gCLAHIAOgD9AFQ+5z/rvxq/2QAvAIM/vQBhAPg/A=="},"Silver":{"n":252,"d0":3,"p0":530,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"//H/AQL++wADAf0DBQMG+QkI9f79/wMW7gkAAPQA/wb6AQAB/fn5AQP4/gf8Av4G/v8ABPoB/Qn+/QH+/vX/C/sM/v8ABP0BAwD7Av/zAQD9BgAACPcABP39AQIE+AIAAv7/+wL8/wIM/QQB//0I9wb///sD9wP+Av0FBP7/AP4C/gD/AAAEAf79A/kABP0CAAP+AP/9APsBAgH8/QP+/gD++woCAQIDAv4B/P7+/wL/AP//AfwGAQEABPv/AAAA/gABAf0D/v4A//8B+wD9/QP/AQD8AgH9AQD7/wAB/v8B/QAAAAcB+QX/AgIE/PsA///9/f8EAP8D/P8="}},"2001":{"Gold":{"n":253,"d0":1,"p0":27280,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"hP7n/7X/PACr/5f/Qv+N/+L/cwB0/2QApQAjAGQAdP8u/1oAdP8eABgBQQBzAFH/Vv9b/zIA3v4oADwAxP90/+j+4QC//5z/RgDDAB0BEgLK/qoAsf5q/0sAl//NAAMCrwCS/z3/Jf4G/x4A0gB0/2kABQCc/5EAZf+c/43/av/J/9wAnP/2/xgBf/6MAF8AEwEz/30AHQF+/0sAHgBR/+EAnP8jAHgAHgAyAOz/2P+kAdP/g/8jAGkACQEjAFkG0P1uANj/6P5w/tT+Df3T/zwA9v9QALr/ZAAmAhv+hgEoANcA4/71AGX/GQA3APb/SwDXADn+Zf+w/87/nP/7/xX/pQAjAL//ZACN/6AAjf99AFkBb/+r/93/IwAu/37/NwCr/9cAPACw/ygAiP/s//oAswGvAJz/4QCD/3MAlgCw/x4A2f5VAJ3+fQA3AMMATP9+/8n/HgBzAAUATP8qA5z/WAKKAhX/RgCN/zYBW/9W/20B3f/Y/1AAyf+N/7D/9QB9AFH/NP5h/jIAWgAG/ygANwCi/o3/9/59ALD/oABLAPoASwBq/0sAg//7/6AA4v/e/igA+//2/2r/yf9+/9P/xP8FAL//MgA8AF8ABQAFADcAggCw/1v/QQB0/7X/QQBGAFoAJwFpAAUA9/6bAPb/IwDT/5L/"},"Palladium":{"n":253,"d0":1,"p0":96500,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"6AMIB8D55AyMCugD2A5I9Az+GPyI+rT7rA24CyT6AACo/awNUPsQ9WQA7PoIB/QBQAZ8/Ij6EPVs7lz5eAVQ++gDqP18/LT7xPBs7kj0hANw/gT3QO2g9tAHAABoEEAGNO8M/twF9AEAAPQB4PxQ+3z8cP7IANT+qP0w+Bj8AAAw+AT3UPsAAPQBJPoM/hj85AwUHrTi9AH8COz69AEM/iT6DP4Y/HD+nP8sAdT+DP4AABj8MPgsAcgAOP+wBPQBAAAk+vQB9AHcBQz+GPwM/kT94PzU/jj/4PzU/nz8rvxeAfQBLAGQAVgCyABE/Zz/1P6c/+D8qP2QAdT+4PwM/jj/4PxQ+ywBAADIAFD7lPjA+QAAHPMM/jz2FAV8/Dj/7Pqo/ZgI6APcBRj8PPbg/CwB3AXcBVz5JPrU/twFJPr0AcgAZAA4/3gFFAUE9ywBkAE4/wAALAHU/vQBDP7oA0T9yAD0ATj/yAAY/Jz/lPgY/Bj8HPOU+BzzJPqsDST6FAUAANT+DP4gA8gAwgEAAGL4DP4M/vn8g/+QATj/yADECQz+GPwk+kwEnP8sAQAADP4AAPQBqP3U/pYA7gLoAwAA2v0G/wAAXgHO/wAAAAD0AaQGkAFMBOgDxAnoA+D8MPhw/tAHyAAM/mQAnP8AABQFYAmc/5AB"},"Platinum":{"n":253,"d0":1,"p0":61000,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"kAFgCTD4IANYAvQBIAPs+iAD1P58/Pj4hAP0AXD+4Pw4/1gCqP2o/WQABv/a/SwBIAM4/6L+2v2c/5z/AAAAACwBkAFkAJABqP1q/yYCyABYAnD+GPz+94oCZACEA/QBDP6o/SwBAAAM/gAAcP5kAAz+cP4AAJAByAB8/OD8qP28AqQGRP0M/oQDnP/oA5ABuAsgA7T7LAGo/aj9cP5E/Zz/OP+QASwBLAFABvj4AAAAAMgAnP+c//QBZAAsASwBOP84/2QALAGQATj/GPxQ+9T+ov4+/pABAACc/0T9RP2QAcgA+gAG/wAAZABE/TIAPv7U/jj/RP3IANT+yAA4/3D+vAKo/WQALAHIAOD81P489kT9RP1Q+zj/WAKQATj/qP089tT+yACEA+D8BPfg/Hz8TAToA+z6iPoM/igKrvz6APQBTAQAACwBkAHA+dT+cP5kAJz/AAAAAGQAAACwBDj/0AdkACADIAP0AQz+GPyU+Mz3yABQ+6j9+PiADOD8QAao/Qz+tPuEAwAAVAsM/iT6DP5w/gz+AADg/NT+yACwBJz/1P4S/foAnP+c/zj/OP+QASADAADIAKj9LAEsAegDZABw/tT+vAKc/zj/OP/0AbAElgBq/ywBTAQsARj8WALU/pz/nP9R/7v+1P6QAVgCvAK8AgAA"},"Silver":{"n":253,"d0":1,"p0":459,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":1,"p":"+v0CBf7+AQIEAQYFCvwC/AIBAAH/Afv9+v37//4C/vz/AAD4AAP+A/0I9/4CAAQEAfcD/fn+AAABAAECBvn9/AQAAQEA/gAEBPgFBf8BAPsC/f0EAP79/wf7AAD/CQMN+QEK+/v/9/0C+gH9AQL9BQIF+QX9+/7//gX7A/3//v/8BAD/Af8G9wID+wQA/gAB/f8D/wH++AIABvv/B/oEA/kE/wL/AP8AAP0C/wAAAAT/BgIICRD+9wED/wQAAQACAwD/8vkAAPoC/PYA/gP6AgAI//z+9gAC//4E/Af5Af/9/wAC/gACBQAEA/kIBf0BBP4JAgYF9Q4CAPwC"}},"2002":{"Gold":{"n":252,"d0":1,"p0":27810,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEFAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEDAwE=","pw":2,"p":"NwAeAEYAb/9zAP0C2P/s/wH/mgHo/m//l/9GAFH/Af/7/yMAZf87ATcAMgB8AccBxgIiAdsBmP78/uL/zv/mAEL/g//P/s/+3ABl/3gAdgLt/rX/dwHZ/h//JP/j/vUAGQCvAJf/Vv8AANwAzv/T/4wAlQHE/ygAJgLd/+YAp/66/xr/UABq/5AB8f8PAAv/UADXAIwA3f/2/30APAD/ACwBfv+X/+z/SwB8AVH/Kf++AF8AW/8L/5sAoABzAEoBOwE4/9EB9v88AHwByf8EAe3+YP9tAaf+Zv43AD3/0gBR/woAfAGc/wkBHQG7/pYA/f3Y/139PAD7/z3/8f/hAMn/XgFv/8gA8f+QAfz+jf//AOUBjv5i/bH+W//V/YwAaQAb/kkCbgCr/2kAAwKx/pkCZf+bAJ3+uQBq/9/9SwBC/7//aAGbAOL/rwDx/30AsP9eAaoArgF//oj/VQAyAD3/g//mAP8AjAC+APH/wwDe/iT/4QAUACT/5gCX/0YAW/9C/0YAEP9aAM7/ov6I/93/XwBR/68AGv94AGQAMQEtANP/8ABl/6oAdP/cAB0Bb/9QAIIANP72/4IAAACw/8T/7P+CAGr/FACm/18Aof8oACwBjABAAQAAQQAk//AA3wLE/yoDdf5mA/f+UABuAEoBFADB/Q=="},"Palladium":{"n":252,"d0":1,"p0":44000,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEFAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEDAwE=","pw":2,"p":"1P5Q+9T+vAKQAcgA1P4sAcD5cP68Agz+GPxE/Tj/7PoM/vQBGPwM/gAA1P5kANT+vAIsASwB1P4Y/OgDFAUM/gz+cP5kAAz+AADIAMgAhAMM/gz+yAAM/hj8ZACEA8gAOP8AAAz+9AHIAJABkAE4/wAAyADoAwAAOP+QAbT77PoAAKj9yABkALwCyAA4/3D+yACQATj/OP8AAMgAcP7U/gAA1P5E/Zz/cP70AcgAcP7U/pABnP/0AZABkAEgA5ABiPp8/AAARP0sAZABnP9w/jj/yABYAhj81P7U/gz+OP8AAJYAlgAAAKj9DP44/9T+AAA4/wAAOP/0AZz/AADIAAAAyAAAAAAAqP2QAcgAnP/IANT+OP8AAPQB9AHIAOD8OP9w/gAAAADIADj/yAAAAJABAADU/gAAOP9kAAAAAACc/2QA6AOADFz5fPy0+wz+kAE4/ywB9AGQAaj9yAAsAWQAnP/IAAz+LAE4/9T+1P7U/nD+1P6QAQAAyACo/QAAOP8sAVgCOP+c/5z/ZABkAJz/AADIANT+4PxkAJz/LAEAADj/OP+c/5ABnP/U/tT+4Py0+zj/kAHIAHD+7PrIAAAALAFc+SwByACc/3D+ZAAAADj/4Pyo/SwBOP84/zj/nP9E/cgALAEsAXz8UPsgA/QBZADU/g=="},"Platinum":{"n":252,"d0":1,"p0":48100,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEFAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEDAwE=","pw":2,"p":"nP9w/qj9kAFkAMgALAHIAHz8LAH0AWQADP4AADj/4Pw4/2QARP04/wAA4PwsAWQATASQAVgCZABE/Zz/sAQAABj8ZABkAJz/9AHIACwBeAWc/0T9KAoM/mQAAACwBFgCRP04/3z8yADIACADqP04/wAALAFw/vQBOP/8CNT+fPy8Ajj/cP4AAIoCXgG8Aqj99AFABgAAnP8M/mQAZACc/wz+tPuI+nD+9AE4/ywBLAGo/SwBvAL0AcgAnP+QAZABDP44/8gA1P7IALwCAABkAJAB1P7cBaj9nP9kANT+ZACQAcgALAEAAMgAcP7U/nz8GPxYAiT6OP9kABL9ov6QAQz+9AHIACwBAADIAAz+nP8sATj/cP44/5AB9AGc/5z/LAHg/JABnP/IAJz/hAMsAdwFnP9YAgAAqP0sAeD8cP44/wAAsAQ0CCT6hAMM/rT7RP0M/iwBWAIAAPoABv8sAcgARP30AQcDAQQM/iwBcP4AAKL+LAFeAcgAcP4M/jj/kAHcBSADIANw/tT+LAGEA+D8av8+/nD+yACQAZABAAAAAET9DP7IAGQA9AGc/ywBDP7U/n4EPv7cBZz/OP+o/dT+kAHU/nD+AAA4/5ABLAE4/8gAkAFkAPQB1P5w/pz/6AOc/5ABfPwsAeD8ZAB8/IQDkAEAAA=="},"Silver":{"n":252,"d0":1,"p0":459,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEFAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEDAwE=","pw":1,"p":"BAUDBv4J+Pf0DPbw+/78/wT8+wX//QUAEfYBAv8FBwf8/f/3BPr/B/4HCv38+wEE/AEE+wACAAD/BAIIAwAD9wH6Af4H+wH0/wEEBP8FAQMB/fr+BQUA+gYH+f4DAQINA/wI9wUJAA0B9Aj5+///AvkCBf0CA/oD+gX5BwX/AAMCCP4E/gb2AAEE+vMA/e4BAPQIAP8DBPsI9QPyAQD5Af4CAAYAB/YC/QQDAQD/AgT7AQMH/QL+APn8Av/9AP4C+/j++wT9AgT+BAAD/v8EAQX/B/cF/QMJ+gQA/gD/Af8A+AT9/f8AAAENBQP9/AQDCfwC9gr7+wAFBfs="}},"2003":{"Gold":{"n":253,"d0":1,"p0":34220,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"tAC6BBz9Pf8RA2//sP+MAEf/l//fAhD/5/9yAZUBUACeAk3+VAFT/d8Cef9JAvcDHvs9/3gAQPxkAIb8yAA2/C0AFACGASIBkv9sAnH9kQCF/VAAiwHSAIP/TwGi/gUAYf6e/Rz99AHQ/ZoBov7Z/hD/HQGs/mMB4/75AR4A5P3V/Wr/p/7/ALQAZAD7/zcAQv8PAOEAywI3AEz/jAAjAI3/VAEnAeYAjAAjAGD/2gKlACgAR//vAX7/0AI5A8r+1gEKAAkB9Pyn/tYBPv6QAQAA8v7bATn+rP7z/QUA5//5AUsAlgAg/jsBnf5W/3b9OP8V/6UAVAEJAWD/lgCr/xH+DwAz/1AAHgCQAdr9oADE/3wBvQH7//gCggBVAM0AFv6x/vL+Zv43ADsBBv9PAV4BLAFw/nECaQA4/9T+hgG0ALv+AABjAZQCCgAXAqv/tv5QADj/HAK0ACcBLv9l/yT/2P84/5UBv//eAxkAiP+UAvn8V/7RATIADwCI/6D7WQEoAPH/nv0tAB0BVQC2/jwA3f9PAaMCCAIp/9cA7P9//j4DgP15/xH+gQHn/6b/uQBjAaUA6QLx/wkB0P3bAXT/Qv8oAO3+MgCpAbkAQQDmAOEApv/Y/6MCzv+h/7b+BAEu/wgCJP9FATj/zQCI/3gADgHSAKUA"},"Palladium":{"n":253,"d0":1,"p0":23400,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"kAFkAGQAAACkBlgCLAGg9vQBOP+EA1gC9AFYAnz8kAE4/5z/AADIAHz89AH0ATj/cP7g/Dj/OP/IAPQBZABw/sgAOP8AAGQAOP8AAAAA4PxkADj/cP4AAAAAZABkAMgAAAAM/kT9kAGc/wAAAAAM/nD++Pjg/Kj9ZAAY/NT+AAA4/9T+ZADg/JABAACc/xj8ZABE/bT7FAWQAaj9DP5w/mQA9AGQATj/AAD0AfQBDP5E/UwEqP0AAGQAkAFYAoQDRP28AlQLwPl8/MgAOP+EAzj/nP+o/Qz+OP9kAJz/6APIANT+GPyWAJYAyABkAJz/ZACc/9T+9AEsAQAAyACc/+D8cP4AACwBnP9kAHD+nP8M/vQBDP4M/rwCAAD0AZz/LAFkAPQBAADU/tT+LAGc/zj/ZADU/gAAyACQATj/9AH0AZz/eAVkAAAAcP6QAZz/RP0gA0wEWAIgAzj/qP3U/oj6TARkAAAAWALU/gz+IAMAAHz8nP/IAMgAyACo/QAAOP+c/5ABOP+c/zj/qP0S/V4BAAAAACwBZAA4/5z/yADIAJABzv8yAPoAMgBkANT+OP/U/tT+lgCWAHD+ZAA4/wAAAAA4/5z/1P4AAMgAnP8AAGQAyACQAcgAIAPU/lgC1P6c/wb/Pv6QAXz8AACKAjIA1P44/zj/"},"Platinum":{"n":253,"d0":1,"p0":60000,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"WAJkAJz/lgByBqj9ZAA4/8gAAACQAbwCyABABgAAyABw/nD+vAKYCDj/NAgUBYj67Pp4BQz+4PzcBdT+kAF8/AAAUPs4/6j9WAJMBHD+9AE4/ywBLAEUBXD+cP70AYQDDP4AAFD7WALg/Kj9GPzg/Dj/DP60+5z/+PjQB9T+OP/A+eD8nP9w/ngFAAA4/wAAyACc/5ABIAPIAAAA1P58/DD4AAAAAGQA9AFABsgA6AOQAQgHAAAAAGQAfPzoA0AGfPw4/xQFtPsE9wz+DP54BaQGAAB8/Jz/kAHg/Nr9fgSEAzj/qP0sAYQDqP3U/vQB4PzIAGQAWALIAAAALAE4/3z8AAAgA8gAyADoAzj/AADO/zIAvAI4//QBcP4sAVgCRP2o/Rj8AABYAmQAOP84/+gDIAMY/FgCLAFkADj/IAOc/5z/tPv0ARQFOP8AALwCOP9kANT+AACc/6j92v1eAQAADP4AAFgCBv8mApz/ZAD0ATj/qP1YApABMgAmAgz+hAMgA8gA1P6c/8gAcP6c/8gA9AFYApz/LAEAACwBkAEsAYQDRP2I+pABFAUsAdT+kAFkAAAAhAP6AHb91P68AnD+AADU/nD+9AEsAZz/9AEgA2QApAZ8/LAEAAAsASAD6AOEA9T+sASQAcD5UPt8/LwCIAPg/MgA"},"Silver":{"n":253,"d0":1,"p0":474,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":1,"p":"BQz5+gUB/v/4BAT+/QcC+Q31BfoI/QEI8fn6+AD7AfwCBwYAAwP4A/oCB/79BAD/Aff8A/YB+f/+Af8D/Qj++/4C/wQFAP8CA/7/BgMEAQD5BgUJBP38BgEE/wX4BAH2/fwB9wL7+gEB/AX///0CAQgD+/sD/gH8AwD9BQMEBAADBQn4BP/1Af4HAggX+wf6CP4E+Pr7AAz5APUR/fcACP/6AgUJAgX78gT/CQQIAQrwAf8O9gv6/Qrz+QAA/ADnAQX5BAIG/QABAAgIBgH9A/oJ+/nzCPsABwMCGP4I7wv6/gD9CQQBAQoB/f4IBAf5CPkL/Qf9BfwEDgUF"}},"2004":{"Gold":{"n":254,"d0":1,"p0":41520,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"/wABBCH9Af/WARwCjv6i/tr9+P3A/ngAJwFLAMT/+P0k/54Cyf+L/DcA9v8p/+L/3v4GBKUAPf/0AUYAdP8sAdwAxv09/7j8oADDAL386P5xAgoAx/x8Ab//TgK0ANj/rP5PAVH/PADwAAMCgQE2AW4A8ACc/1oAVAFR/4EB5gBQANX9mP7mABMBOf5u+/n8rwArAnb9B/4Q/+oBGQBBANj/iPrHAfUAxwEa//39BfuGATsBy/04/9oCTP94ABkAtACgAHcBIgFfAPAAyAAAAEP+tv4XApYAy/0H/h4AW//E/yECUf8OAQMCSwBBAJYAuAE3ABH+1P5LABQAcgEAAJf/5QG4AcMAUv6h/zwA7P9FAW//SP6e/Sn/iP88AKP9/wBVAG0B9/7SAKb/LQB7Ai0A6P4AAKL+jwLXAK8ANgHO/58Bz/50/y0AWgB9APb/7P84/1z+FACO/nMAjAAKABMBggDY/xQA0/+CAM0ANwCMANP/ggB9AFAARAJ+//z+cgH7/w8AcgGd/sH93AA7AUYAH/8hAnwByv6UAkf/fv84/+sAvgDU/t7+mgH1AKQBv/8YAVH/YwEEAWX/jwLs/8T/SgEAAKUAMQHx/43/oACm/0UB+P2UAjj/4Py4/Kf+MQGlALD/WQEz//8ACgBVAOL/7P+CAL38HQE="},"Palladium":{"n":254,"d0":1,"p0":19400,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"yACQATj/ZAAAAIoCtgMM/mQAAADIAAAAGgQUBbYD7PoY/LAEkAFQ+/oAav/IALwC1P5kADIAMgBeATIAAACc//QBav+i/sD5hAOc/wz+WAIsASwBOP9kAIQDsARkAAAAXgGqBfQBOP8AAKj9ZABYAlgCnP9w/sgAnP8sATj/yABUCwz+AADoA8gATASu/I75LAH0AfQBlPjw8VgCkAH6AHb9VPIUBbAERP0M/iwBaPeQAVgCyAAM/ugDGPzIAAAAZADoA5AB1P44/+L/HgDIAAz+ov4G/wAAfPzA+ZABcP7O/8IByAAsAfQBDP4AAAAALAEM/tT+AAAM/qj99AEsASwBLAHIAGQA1P7O/5YAAABkACwBnP84/3D+nP/U/pz/nP9kAGQAAAA4/5z/1P4sAQAAZACc/5z/AABkAMgAJgLO/8gA2v0G/wAAAACc/wAAAACc/5z/nP9w/pz/nP9kACwBlgAG/2QA1P4AAGQAyAC8ArwCZADg/Jz/vALU/nD+IAPIAPQBAAAM/rT7yADIAHD+nP93AbX/OP/IAAAAOP8AADj/AACc/5z/yABkAGQAAACc/wAAAAD0AZz/ZABkAHD+nP9kAAAAAACc/zj/OP8yADIA1P7U/mQAAAB2/Xb9AACc/+D8ZACo/WQAZAAyADIAnP8sAQAAAAA="},"Platinum":{"n":254,"d0":1,"p0":81500,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"TARgCeD8AADoA8gAeAWI+sgARP0UBXD+WAI4/5ABfPzU/pABqP0E9ywB4PzIADj/nP8IB9T+nP+wBMgAnP+8AiwBAADU/iT63AWQAZz/FAU0CET9fPxYApz/FAWc/xQF1P70AZYAgvv0AQz+1P44/+gDCAfA+cgADP7A+bAE6ANo90wE7PpkAPQBaBB8/JYAdv2kBhj8Nvee7hj8BPc0COz6sOvcBQgHWAJo9zj/BPfoA1gCLAEM/owKiPrIAMgAyADoAwgHvAI4/9T+WAKc/7T7OP9eAfoAXPkw+HD+1P74+FgC1P4IB3IGRP3CAWQAAAAk+lz5sARE/dT+yABw/hQFpAb0AUwEXPkgA0T9sAQgAyADcP5E/Xz8nP+o/XD+hAPIAEwEyACQAdT+1P5YAl4BigLIAMgA/AhkAFz5UgO0+xL9AABYAsgAQAY4/wAAvAJE/fj4yABQ+wAAqP2QAZABLAEAAKj9OP8UBZz/1P7uAsIBFAWg9vQBFAXm+8b4eAXU/gAAyAAAAFz5IAMAALwCRP1YAugDqP2EA7T7cP4Y/CwBnP+o/QAAFAWQAWQAyAAAAMgACAfoA3z81P4sAcD5nP9kALwC9AEAAHD+kAFkAM8Dwf0sAQz+UPus9PQBkAG1/+f/6AMM/pABnP8yAKL+WAI0CBL9lgA="},"Silver":{"n":254,"d0":1,"p0":599,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":1,"p":"/h/5/wUo/fjq9QwG9/wI9/8eAOD//PcG+xkJ8hkC/goS7P/0BRbYFg8N5Rf9DQAZ+Az2BQAIEhf1DfP7EvoWCyP3+gH66briGhDowuQFAwb7viYP/vvp4hH8+AEZ+f4LA/0UCPwKAPjl+gsD8PgD/f0CChT/8ggAGwPjAv0AEP8BEB4D8QQMCAnz9fP9/vv7DQoW8gwCBAL++P72FQL/DP799PgDBwf/A/vv/d/7Af8G/wn/+wcCCQP9FPoOEf/3Kf4CCevoFQb++BwJ9BfzAeYKCPzwFQsJ/gf4Bwr3DAT4BPv/Df7+Cvwh6xHw3MbtDPkCAfUNBP8EAAnsBQ=="}},"2005":{"Gold":{"n":252,"d0":3,"p0":42680,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"fv8eAPf+Qv+CAKv/JwHZ/nMA4v+bABD/oACuAXT/Bv8EAQoA/P73/ksALv+2/jj/1P6qAB4AYwE/ArQA0//1APv/NwBtAfoAlgAV/58BQv/a/ZoBmP6LAX0A+QEeAEsAtAC1/7D/kQCo/dj/0P2s/hX/zQDT/2QA+/9q/x//IgHs/5z/DgFpAOL/W/+d/sgAfQAmAmQAAADY/6oAxP95/y0AcP4AAIIAsP96/m4AkQAu/yD+Zf8tAKH/6wCX/8r+QQAZABkA8f9W/7D/bgBYAqAAtABW/3n/sP8dAYcA4v/RAdsBvQGZ/TsB3f9EApj+R//8/r4A/P5s/WD/Kf+QAWb+fQDDAHT/z/7e/sgAYP9BACwBDgFq/93/Uf//ALkApAEyAK8AyAC+AL//Kf+gAJYAsQMv/lH/VAHz/RkAUf/rAGD/SwDO/xX/xf76ADgEuv8u/2QAHgC+APUA0/+r/30AhAOBASUD1P4/Asf8p/7MAZP+GgRaALj8+gAf/2kAOgImAjj/LAEr/cn/pQBBADT+SP6r/zwARQHHAaoAKACc/zr9ev47Aaf+if7T/yECuAGS/4EBJP82AfIDywIKAPQBYf6GAScBoADs/7b+PAALBBkARQGVAf8A3gP7BEL6d/yR+woA7wFW/5v7GQB1AysCEQNw/g=="},"Palladium":{"n":252,"d0":3,"p0":18000,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"AAAyADIAZADoAwb/Bv/U/pz/nP8sAZz/yACQAcgAcP5kAAAAnP+WAM7/1P5w/gb/zv8AABkAfQBeAWQADP4yABkAtf8sAQAAAABkANT+ZABkALwCsARkADIAXgHU/uD8kAGc/ywBAAA4/87/Bv+c/3D+ZAAAACwBkAGc/zj/MgCWANT+ZADn/7X/lgAAADIAZADIAMgAcP5kAAAAAAA4/zj/OP84/ywBAABw/sgAlgBq/wz+AAAAAGQAlgBq/5z/nP8AAJz/OP9kAAAAAACD/xMBkAFq/5z/OP+c/wAAZADIADIAzv8AADIAnP8yAJz/1P5q/zIA1P7U/gz+WALIAMgAAAAyAH0AUf8yAJYAEwEZACwBlgAyAAAAcP5kACwBzv8yAAAAMgCc/2QABv+i/jIAyABw/s7/MgDO/87/av8AAJYAAAAAAJz/AAAAAGQAAABq/zIAMgCc/5YAnP8AAAAA+gD0AX4E2v2WANT+ov6WAGQAZABkADj/nP+c/8gAZAC8AvQByAA4/wAAlgDCAQz+nP/hAIP/yABYAkwEOP/IAHD+OP8sASwBnP8AAIQDWAKc/xQF1P70AZz/9AG8Apz/fPyc/2QAvAKc/3D+nP94BdT+kAHIAMgANAic/1z5UPv4+EwEyACc/1D71P68AiwBkAFE/Q=="},"Platinum":{"n":252,"d0":3,"p0":84800,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"DP6QAQAAOP9MBAAAWAKo/Zz/LAFMBKj9AABYAtT+1P5YAjj/kAHoAwz+qP1w/mQAUPvg/PQBQAb0AST6OP8sAfQB1P7oAzj/AABw/vQBcP4M/vQBnP+QAc7/7gKc/+D8LAHIALwCkAEY/AAAtPtw/mQAZAAyAPoAzv+i/pz/kAEsAXD+AAAsAZz/AAA4/2QAZACEA5z/ZAAsASwBPv52/QAAAADIAFgCAAAAAAAAWAIY/Az+GPyc/ywBhAM4/wz+9AFkADj/cP4sAZABWAIsAZYAMgCc/9T+DP4AAJYA+gBYAugDTAT4+CADOP/0ATj/RP1q//oADP7g/Dj/qP0gA0T9ZABYAmQAqP2c/2QAAADIACADvAIsATj/DP4sARQF9AEgAwAA9AEM/hj8WALU/rwC3AXA+cD5OP84/5z/AAC8AgAALAE4/wAAcP7IAEAGnP+c/5z/WALU/pABcP6c/5ABLAH0AegD1P4sAaj9iPq8AkT9FAVYAgz+cP6o/bwCTAT0AZABAABw/lD76AM4/6j9RP1YAjj/IAOEAywB1P44/3z8DP5MBNT+1P6WAC4JrwAZALAEnP94BeD8hANw/jj/RP2EA/QBFAVw/uz69AFABpz/qP1YAgz+9AFMBCT6aPeA83gFpAZ8/Oz6LAG8ArwCAABw/g=="},"Silver":{"n":252,"d0":3,"p0":639,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"B/wEAQUGDfj8/wrwBhf++Qf++/4D/vv59gYDKBsA9AwHBRL2AukL9/MQ9BIFEfv2Bfv/+/348u0B/wQX+PH+Cwf3Dwb4+/YDARAI+/0F+/T18wQQ//gKAvj0AAkFEPj0AwAHCfwZCgX5B/P+8vwFAA0B/vAD/gf7/fID+PX+/w/3Cgb6+/0E+wENA//99wgHC/8B/f758wcBCfb3AvwE/wb3//X3/wwQA/7/Avv+Av0HBRcC/A3z+Qf+DQ3xBfcJExD+CPb5E/j78wACCgv+/v3q9BD9+gMNCfwN+gIfAQAF9QgHBwL4ChcFARb9EhnQ3QAWAfnlCgwaDvk="}},"2006":{"Gold":{"n":252,"d0":2,"p0":52075,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"UAXt/i7/fgSpAdT+DQLn/78Eef/O+icBgwS1/0f/MAIAAAb/NwC2A/z+0QEAAEf/Uf9Y+AsE5/9B+579fAGT/v4BAQT8/lv/SwBR/xcCKABiAnMA5QHE/wX7Z/15/0f/8f8AAFgCyADhAIP/g/8+/s7/rwCRBef/av9ZBiYClgDO/43/jQSWADIAyADt/hkAtwe8AhsIzPcaBI/9LAE/Aq8AngfWBtz7xwYAAB//lwkOAVMHNfNQ+4AMPPao/b7xVAZEArn2OQMZAK8A5fcL/1oFIvyq+z7+Xf0+/lz50va8AtUCaft9ACYC/gZk+20BkQCO/h//SQd2B4wA5QE4/9UCdv2BAVUFqAKIBFYEoPaa95oGsfn1++sAnP9tBtn+PwJq//sEOP9R/xMBR/8W/ugDgfy1+rv+fQDbAcD5owL0AdT+AABq//39Kf/BAuEAEwEsAbcC8v4292D6kv9W+qYEOPoiAWQAj/2pAX4EBv+vAIEBSANR/xkAfPxW+v/76wD9Apz/u/6+AMgA5gW+ACMA2v05A0r8DvxAAfwDwwBMBH/+CwTCAd4DCgAAAOf/Ev2RBYn+Av7F/qkBj/0/AmQAEwEnARIClgAZADIADwBYAigATP+P/Y/9KADk/ZABzv/n/+3+rvxq/+QCdP8f/1cDRgCeAg=="},"Palladium":{"n":252,"d0":2,"p0":26100,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"eAXg/Az+TATIAKj9LAFkAOgDnP/A+YoCXgEAADj/LAFkAHD+AAAgA/QBhANsBzj/tPvA+bAEcP7A+Tj/9AFw/iwBhAMAAAAAcP6c/wAAOP+QAVgCFAU4/3z84Pw4//QBAADoA1gCvAJkAMgAqP0gA9T+WAIUBfQBGPxABnz8ZACc/5z/0Adw/vQB9AGU+Jz/twdxApABzPfcBUT9WAIAAJz/QAa8AiT6IAOc/5z/sATIALAEPPYk+pgItPvg/HT1yADQB/j46ANkAGQAtPuc/2wHUPsk+iT6cP7IABD11P6wBLwCRP3U/kwETAS0+5ABkAEM/jj/hAPoAwAAav8+/vQBRP2QAfQBAAAsATj/UPuo/ZABqP1w/oQDZABkAAz+yABkAFgCkAEAADj/AABw/rwCDP7U/mQAWALcBeD8kAHoA9T+wgEG/wz+LAEAAJABnP/6ADIAkAHg/Nj1LAHs+qQGfPxE/ZABfPwsAegDAABkAAAALAEAAAz+GPyo/Zz/AAD0ASwB4PwgAywBFAVkADj/WALU/qj9nP8sAQAAAADIANT+kAE4/4QDyABw/sgADP6EAwz+GPxkAGQAqP30AYQDcP4AAGQALAHU/uD8LAH0AWQAnP9kAJz/ZABkAGQAnP+c/5z/1P44/yYCBv/IAAAAOP8AAA=="},"Platinum":{"n":252,"d0":2,"p0":98200,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"FAUM/pz/hAOYCFD7hAOwBBQF1P6I+ngFLAGc/8gAFAX0Aaj96AOEA3D+IAPIADj/fPzM96QG1P7w8Vz5kAG0+1gCpAbIAJz/OP+QAYQDhAMAAPQBsAQY/Oz6wPlE/Qz+LAFkALAE4PwUBfQBOP+QATj/kAGkBkwE4PzQBzj/DP4AAFD7bAcAACwB9AFE/eD8KApABhQFaPcIBwz+hAPoA4QD3AXQB4j69AHcBUAGtBTcBdQXmO/4+HAXJPpE/VTy3AVUC4Dz9AHU/oj6uPJc+RwMJPp8/Oz62PWo/ejqRP3QB+gD+PjQB7AEKAp09fQB6AM4/2QAjAocDHz8RP2c/1gCGPwgA/wI1P44/5ABaPeU+EwEfPx8/NwFZABMBOz6hAMAANAHRP0AACAD4Pxw/twF4PyI+qj9vALoA6D2TARYAqj9ZAAM/jj/WAIUBZAByADcBcgADP6I+oDzDP509egDrPQAAGQASPQAAHgF7Po4/0wEIAOo/VgCaPcw+BD1AAC8AtT+MPjoAzj/sAToA+D8DP7IAHz8fPxkAOgDcP5ABoj6sAToA1wrlPgk+rwCwPmcGDz2aPec/9T+zPfMKQAyKKYAANAH9AFI9AAA9AHcBST6SPSo/dT+ZABQ+8gAOP9w/gAAcP70AdwF1P7IAGQAcP6c/w=="},"Silver":{"n":252,"d0":2,"p0":904,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"CgDx//D/GwD6//L/CgABABIA8f/w/wIAEgDx/wcAKwAGABQA/P8aAPL/BQD///v//P/U/xYABQDj//z/CgD0/xoACAD7/wQABAD9/wwABAAKAP//LwD8/+n//P/5//7/EAAEABMAAwAJAP3/+v8ZAP3/EgAVAPj/BwA5AB8A7/8PAPf/JgANABoAGQAIAPL/ZgBAAAQALP87AOD/GgDs/wMAiQAyALf/JgDg/w4ALQAJADMAV//9/zwAuv+7/+X/RwD5/+n/DQAUABcAlP8KABYAzv/X/wkA8v/Z/8n/tf8rAA0A2f8aAAwAGwDT/xsA9v8MAAAAIAA6APv/FgDy/xQA0f8ZAC4A8/8BAPP/z//P/zgA+f/l/xsA9f8gAAwACgD4/ycAHwAOABkA4P8OABAA8f/M/xcAEAANAOX/FwD8/xYAEADu/+b/CAAmAA8AGAAQAOz/CwCz/8v/1v/e/yMAv/8bAPr/7/8cABoA6f8GAC8ACAD1/wMA6P/M/w4ABQAhAPP/+f8QAAoAIAANAPf/8v8kAOX/8v8SABYACAAIAPv/HAAFABUA9f8LAP////8rAO/////w/xkA7f8RAAAADwAFABkACwD8/xUAAwARABQA///c////EQD0/w0A+v/+//z/tP/N/yIA5P/+/yQA/v8GAA=="}},"2007":{"Gold":{"n":253,"d0":1,"p0":64075,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"cP6C+0sAFvlyAYP/EwE8AIcF9/4V/7sDhP5iAvAAJgI/As/+Gv+N/14BqALcAF39TgKHACr+2gImAowAXgGvACX+DQJC/xj89AZuALwCAAAS/az+QPwU9lgCrwDkAgoAef84/zH8FwLHAYEB9v9iAl4BR/8G/yYCLQC6/3T/7P8UAPAAngKpAeEAxP9q/wEESwDwAMX+IwBUAX7/ov66/+z6JgLO/1f+CQHqAf4BPACf/Bj8ewIw/YYB/vwL/6UAbgBS/uYAdv0EAc7/zv9OAjkDNwBq/2kAfvpw/gUAmvyZAvH/5ALe/sIBAv4G/7X/Vv9i/R0BGAHIAKMCu/6+ANH8nQOfAR0BnP/CAef/Zv7MAQ0CLAHuArX/2v1H/1r7OP8NAnb9/gFkAAwDFv5zAC0Ahf0XAgb/Ff+r/6X7JgLU/qUA/gEG/9UCH/+bAKoA2wFLAFgCkAF+BIQDGQDuApP+ef9eAekCXQKQAfgCLv/V/R0BsP8gA+4CSvz8/oD9jgNBAP78kgS8AmQA3wJOAjj/dP/eAw/7vgDx//0CJASaBq78nP+EA4P/lwThBXQJSvx3AZT4sPrlAR//2flR/3MAlAJYAjkDDwrs+o31MwQe+7T7igJ+BOz6TAQZAKMCSwCWAAX7Y/ydAw0COP9eAdUCyQRYAiAD"},"Palladium":{"n":253,"d0":1,"p0":33200,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"LAEAACAD7PqQATj/cP5kACwBnP9kAPQBAAAsAfQBAADIAGQAcP58/GQALAGc/9T+WAIsAQz+yADU/pz/kAEyAKL+LAGi/gb/IAOQAbwCnP/U/mQAcP58/FgCZAAsAZABnP8AAAz+LAHIAGQAOP9kAMgAAABkAJz/MgBq/2QAAAA4/ywBnP+QAfQBTARw/rwCDP4sASwBkAGc/2QAcP7IALT7yAA4/ywBZADIAGQAnP98/HD+WAJE/QAAyAAAAMgA6AOc/5z/Pv4yAGr/MgBkAGQAAABw/voAav9kAJz/Bv8mAjj/LAFq//oAkAEAAGr/Pv7U/s7/zv/IAJz/OP9kAAb/+gDIAAAAZABkAGr/zv84/5ABZADn/7X/cP4AAJz/OP8sAdT+yACc/2QA1P5kAAAA1P6o/Tj/OP8M/nz8cP4M/qj9vALU/vQB1P7CAWr/ZABkAMgAAADIAM7/MgAAANT+nP8AAM7/+gBkACYClgCc/zj/yACQAZABkAE4/yAD6APU/kT97gJGBdT+kAEY/NT+LAFkAFD7kAFw/mQAFAVkAKj9AACQAXD+wgFkACYC4PwAAHD+nP8sAdT+LAEM/jj/AAB2/Wr/JgKi/uz6LAFkAAAAAABkAJz/1P5kAAAAyAAAAJz/kAH0AZz/AAAAADIAtgPU/pAB"},"Platinum":{"n":253,"d0":1,"p0":113600,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"cP7g/CwBJPqwBOgDvAKc/4QDfPyc/2wH4PywBCwBOP+EAwAAcP6o/YQDsAR8/OD8eAWEAwz+QAYM/jj//AjU/iT60AcM/kT9QAYsAaQGcP7cBRj8+Phg8JABqP14BVgCZAAsAcgA9AEsASADAAC8ApABqP1kAFgCvAJw/lgCDP4sAWQA9AG8AvQBIAMM/qQGiPoUBSADNAgUBcgAMPj0AUj0ZAC8Apz/vAJYAhwM9AHs+qj9bAfs+vQBtPtE/Zz/GPx8/JABUPtQ+6j9IAPcBSwBWAIAAFgCtPuc/8gAiPosAZz/eAUM/iwBcP70AcgAiPqI+iADAADU/rAEOP/0AQAAhAMAAOgDAAC8AgAARP1YAugDyAAgA3D+4PxkAOD8HPOwBFz5hAMAALAEiPoAADj/qP2c/wAAUPuo/Vz5IAPU/qj9UgMS/WwHnP+8AlgCyABkACwBkAEgAyADAADoA+D8fPywBJz/IANYAvwInP9kAIQDOP8IBzQI2PXU/pz/eAWQAST6bAeYCCADNAgY/GQAjApMBDD4hAPU/sgATASEA8D54PzoA678RgV+BH4EaPc4//DxiPrkDOb7wgGMCiwB6AM4/ywBeAX4+AjuKArU/rwC6AOwBIj6AABkACwB9AFMBLT7hANgCegDyABkABQFIAMM/gAA"},"Silver":{"n":253,"d0":1,"p0":1301,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":1,"p":"9uMIzw8J/AIt/OMd9A8WCxLwA/YVFgjbJf/0H/oBEQL4DfPwMwMe9+7+tKQh+xT+9vvlGREJCQgF//UIAv4B//oRDRoI+AQV8wD0A/8R6PPhD/vlDwcI/fDnD+8O5v0GDvUI9QoIDhwOBP783vH/4xICGfQP7/7t9cURC/kNAf/sIgITABH38wQfBAUA8Pva/hTwEwAO9QT65BL15/K8GuQBFO4N/QYJDwALAyH/AQntAwklAxIeD94QBw4NzgfzFvH4KQUMEOP6CA/QFvMcIyLpDgT8ES9W0uv/0h3x2wfwE/0DIenbCvHbJwnkJvoYAf7E5RcB/x8HIAgB"}},"2008":{"Gold":{"n":254,"d0":1,"p0":84075,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"nAls/YP/Jwa0BbD6ngfvBl39ufYyAJX8lgA3+xQKcgGfCyX+TASJ/gAAnQPq8jH84QBZBj8CfgTz/Vb6/gGS/yX+fgRDAxcHEwGvALr6qwlR/7AEnQNeAfL50Af5/On93wIl/uIEawNaChH55vsR4LMG5gX6AIn+K/1H8KL+2wG8ArEDdgJv+r4Klfz5/HgFZABTB2P8pvX0AT7+8vlD+WsDj/3f+Ff+Y/xHCXD+Uf/cBSX+2v2I+kUBUwdHCVH/CAdFAaj9lgCZ82QAuvqXBKkB3/hX/hoEGwhJ+P/71P4r/SADTARkAJ0DowINAnX5g/8NAuoLzwO7/ooCdwF8/DH8OQOo/e4CIQdrA2AJ+fxK/NT+2wGjAg/xRP3CAdT+zv9H+i7/Bv8yANj1SwAf//j4tf+E6vUFnQMO7fsEdv0nBpEFhAMX+EcJav/CAT7+evTg/EAGb/oBBF39Cvay88MFfwgyAD8Cwx6N9d4Nngdw/jIAMPjuAgIIzPcx/Ln2qP2tETUMv/U1DEzr8vmc/4j66vLIAGj30vay8+ry8AqSCakB/Ajp7iYCAACFB2/6LAHPAxj8//sq+Q4GDgau/H0A7gItBcEWb/qqBaL+AAD4+AT3ZAC1/5z/MgCD/8MFxQ0r/V8FWALpB1MH6vK8Ajj/K/1JEbT7DP4="},"Palladium":{"n":254,"d0":1,"p0":37000,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"ZABkAAz+7gL6AHD+LAFYAtT+cP44/wz+AAAM/pABZAAUBTj/9AGQAaj90AfWBj7+1P5ABmQATAQ4/4j6qgXO/6oFTgwk+tgO1P7oAwAAoA8Y/GAJhANMBIzxOP9U8hD1XPlABlQLRP1c+ez6nP8U7NwFFAU4/3D+OP+0+5AB9AEM/pABsAQM/ugDLAGo/ZABfPywBHD+cP4AAAAAtPtE/SwBfPyI+mQAGPwIB2QALAGwBAz+yACo/Tj/WAJABuD8kAFYAjj/1P7s+pz/UPtYAiADRP1w/vQB9AG6+l4BnP+wBOgDQAZw/pABvALIANT+DP7IACwBOP+c/2QAAABQ+3D+OP/g/JABhAMM/gAAUPuo/Xz81P7IAEj01P5kANT+yABw/kT91P7g/Pj4eAV8/Hz8GPw89lgCWALw8QAAUPtMBCwBkAE4/ywBnP+8AvQB7Ppw/iADMPg4/wT3+PiI+owKnP9c+Zz/sAR8/KQGvAIAAHD+UPvA+fj4kAEAAHD+DP6QAQAAOP/U/sgA9AFw/oj6JPq8ApAB1P5w/tT+cP68AngFFAWo/SwBkAGEAxQFWALU/gz+DP7a/SYCnP+c/wAAHPNkAGQAIAPIAHD+DP4M/kr8av/IAMgAkAEM/pABWAJ8/AAAZAAsAcgA1P4AAHD+yAC8ApYAAAA="},"Platinum":{"n":254,"d0":1,"p0":153000,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"QAac/8D5sAR4Bez6/AhgCXz8wPnU/lD7kAHk84AMKAr0GtwFUBRI9GQAGBVoEFz5CAeQGuD8GBW0FNDuPCjcBZwYIBzA4CgjGPxkAEDtlBGc5nAXhAOILNDupAYo2MTXwPlw/sgZ6APw2Kj9HPN8yrgkZBlgCbgLDP5I25ABgAx4BawN1P6M8cASwPk45iQT2PVUJNT+gPO48pgIPPYs6HQOiPqA86j9yOdMHdwFEA50J4zx8Apk58gAQB+wHbT7mAgUBez6cP7E12j3GOOkBmgQVPIY/HwVNAgU7EwEqP1MBJz/5AykBgz+lPiQAez6oPb8CFQLyAA4/wAAtPuY7/DxQAbw8XgFcBeU+Kj99Ojg/FDiAAD0AVTZmO94BcgAeAVw/nz88PFo3lzgXBIM/vj4cP7A4NAHmAiIyOD8DOUwEaAPqBaA83gFhANUC6D29Oio/XQOWOkAAMDgzN5A7RwMpAbA4AT3NAhU8vgqgAwAAEj0QO1g8JDoRP2E6gT31P7MENT+kAFABhzzlBE89jzd3OwwETz2VPIk+gzlUPugD2QADBc45sASiPpsB2wHLAHoA+Tz7PosAVgCyAAw+NwFuPJYAsQJ0Ad4Baj9cP7w8ZT46AMM/tT+dA489iADsASI+kwEnP/ECUAGMPgsATj/ZAAAGez64Pw="},"Silver":{"n":254,"d0":1,"p0":1493,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQ==","pw":2,"p":"LQD2//z/GAA0ANr/LAAsAOb/2f8DAPr/+//s/yYAKAASAPf/HwABAP7/LQDP/+3//f8WABkAKgAJAND/HAAMANv/GAARADgA/P8MAAYAeQD3/yYANgAQAKz/hADG/7//RADJ/20A2v8zAMr/zv8V/wQAMgANABAA2/+D/w8AGgAeADMABADN/1MA2//O/ykAFQAxANr/4P/i////0v/X/xoA8P/h/xEA0/8zAP//9f8nAOn/IgDZ//f/FwAjAPH/SgAFABwABACo//f/4P8BAPz/8f/+/zYAGwDM/9z/AQDk/yoAMQDq/xYAFgDn/97/8f8SADQAGQD3/yQAJwDi//D/6f8UACMAFQAfAD0A0f/w//T/7P8ZAJv/+f8DAPj/+//i/yQACwDq/7r/BwDx/63/1v+n/xcAEgA0/xMAAAAaACAAAwDH/0cAAgD+/+7/2P/Z/xcA4v/e/97/s//D/w4ABAAEAPX/2ACy/1MAKAD3/wUA8P/0//b/vP/9/5f/CQAjAAEA//8KAI//HAADAKP/1f8XAAcA/v/O/9L/DQAIAB0AQAC2/00A9v8hAA0A5P8SANv/4//k//z/EQD0/wIA///q/1cAHQD9//z/8v/r/87/AgAPAPT/GwAKAA0AKwDg/xoAEQAwAB8AvP8kAOX/1/9AAPb//P8="}},"2009":{"Gold":{"n":253,"d0":1,"p0":86975,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"MfzA+dAHmvd+BNr9HPOXBG/6ZQQhBxL99gkF+90JFg3m+yX+BfugDyX+afsZAOIEtf/s+gz+KAqYCCX+dwGFB/oAawPuAlgCEwHq8pv7g/8/AlX2ofrhAJIJ1P7r9oL7qgUmAiwB1P5j/FoKtwdX/qD2Ev2RBa78cP4+/mQAJf7T+mj35/8gA6L+ZQTt/rv+XPk4/1MHif62A6oFEwE9+gb/2v0S/WYIMgCdA9sBDP7uAj8CBv+vANsBx/y8An4E4gTm++4CGQCxCNwFuvomAmn7GgTL81gCawPH/NT++PjbAdT+LAHU/jH8if5SAyYCawO7/n0ASvzCAaL+tPupAQz+qP0l/mr/LQU5Aw0Ctf/vBj7+H//PA9r9cQKc/2L4ov7CAe8Gtf9MBIn+5/9E/RL9Bv/iBJYAMPhLAHD+nQM4/8kEj/3IAKj91QKc/w0CvgrbASYClwSV/Cv9zwNw/kUBngdeAXb9PfpyBpz/tf9c+Xb9fQC2A8IB+fxxAkAGcwoHA+D8DQLiBJYAuvol/qMCtgPm+30AigKP/W/68/1q/xoE7gJYAi8Nif68AkYFlfzcBX0ArvxNCCwBkQUY/IoCLgmpAXECigLG+O4CZggIB6MCJPo56osGaPeO+ZEFMPgM/mwHHvsk+qMClPih+mAJav/m+34E"},"Palladium":{"n":253,"d0":1,"p0":18500,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"ZACc/3gF2v36AHD+fPxkAET99AH0AQz+LAEAADj/6APU/gAAAADIACwBZADU/lgCLAEgA5z/LAGQAZz/ZADIAGQAcP5kAJz/fPzg/AAAOP/IAAz+ZACQAZAB1P44/2QAAACc/2QAZADU/mQA6APIAMgADP5MBCwBDP6c/ywBLAHIAGQAlgAyACADWAJw/sgA1P6c/6j9OP9YAiwB1P6I+pz/WAJK/CYC9AGwBFgCav+i/mQAuvqWAAAAIAMAAMgAcP4AAJz/qP1MBCwBAAAUBaj9bAck+iwB9AHO/2r/4PwAAHD+av/O/8gAfPwsAZz/IANkAFgCOP8sATj/RP2c/wz+ZABw/pz/XgEmAiwByABkAPQBZADIAGQAyAAsAXD+OP/IAJABIAPoAwz+DP6QAZz/cP70AcgADP4AADj/WALU/kwEnP/0AQb/lgD0AUT9LAEsAcgALAEM/mQAAACc/8gA9AHIAGQAOP8AACwBRP1kAAz+AABkAJABcP5YAvoA4gSQAbwCOP94Baj9cP4AAJAB9AHIAJz/AAAAAAz+DP6o/SADnP8M/iADyACc/5YAMgBYAhQFLAGEAyADkAF8/Az+hAOWAJYAcP58/MgAbAe8AmQARP3y+RoE4PwM/iwB1P4AAMgAkAFw/gAAcP5E/ZgITAQsAUwE"},"Platinum":{"n":253,"d0":1,"p0":93400,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"ZADoA/gR1P4sAQAAFOzQB2zu0Ae4CzD4qP18/Jz/uAsY/ET9TASYCAAA4PzU/kwEvAIAACgKdA48D8z3ZAB4BawNxPCEAwAAAAA07/QBhAOgDwju1P70AcQJfPzM94QDqP3IALwCDP44//QBnBi8Aqj9kAE0CDj/wPmc/8gAFAUUBQAA6APg/IgTYAmc/xj8DP6A8xj8UPsIB5AB2PW86ez6KAok+pgIFAXkDBj8iPpQ+xQF8PFMBOD8jAoUBZABRP20+8gAGPx0DnwVfPzYDiwBzBBY6egDxAng/Hz8oPYM/uz6DP4sAVD7gPPoA2QAgAyg9rAEMPiwBAz+BPeU+BD1AABE/Yj6gAw0CBQFTAT0AfQBiPoUBcgA/AiEAzD4MPh4BWAJCAeoFjj/pO3cBWQA2PXkDEwEHPM4/4j68Ar4+GwHUPuEA+z6nP/cBYzxuAtYAtwFTASEAzj/WAJMBEwEYAnoA1z57Pp4BVgCJPoE91z5AAD0AUwElPjoA9wFEA4AAJz/OP9gCWQAtPuo/YQDhANw/mQAFAUY/OTz7PosAegDWAIAACgKAADIADj/qP1MBMgA4PwMF2AJpAas9AAAPA/A+egDfPzM97wC8ApgCSADwPkU7JgI5PO0+/wIZAAAAEwERP2o/Qz+fPyg9gwXpAZ8/MgA"},"Silver":{"n":253,"d0":1,"p0":1108,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":1,"p":"/+o4yyLz0Q/mGyYQAv4OQO0H6E34+gMoCQz7K/sDEiMPFQIIA8bf5fnSExwf9r/3Fhv77Oc0NAvn3Sza5g/z9v7T6AsCIx3jvQgI/h8jFNb6DdBgITn1ABMF4gjzCSn6K9wUJkAi6CO9I68JLuL+tP/kEQTY+gv/J+3z4+gD1x3l8ObwKSf6+zrq9CQCHPzW7BdC6zsA/u71+E/3q/zOLf0o4hX0IhQRUhYaNs3xUMoRTQnl1Tjy3sjjECYK3gJILSjvGgr62ekVF9wQCvzJtwAYAelx9g4Q1iX07SokQMr+Ou0G8s0QOi755LEH3toM4P8q7Pf84P0oCs4H"}},"2010":{"Gold":{"n":253,"d0":3,"p0":111300,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"yQTn/z8CfPwpDvP9MPjbAdr9dwFR/wz+PPYS/bwCBfuQAdT+fPy1/4AMwgHA+V/s7wY4/+4CkAGD/00IJwYsAQX7lgD7BPn8lPjn/7cH2wGD/+kHAACD/5z/iPrCAcb4+wQ9+p0DCAeu/IP/Q/mi/l39zv/CAS0Fav/n/4oCIAOdAy0FtgPuAm/6zwP5/D8CevTcBX0AMgBX/ngFUf+wBD8CDQKEAzf7WAJwCJH7GwiZDI/9dwGu/Av62v1P94n+GQA/AvwIUf9FAT8CfQCD/6f5egPoDez6JPoyAIQDdv3iBJz/tgMOBof2BwMx/J0DRgUw+MIBzv969Dj/4QBV9vUFDP7uAhMBPwLO/0T9VvqV/M8DV/6XBDH8DP4w+MgAyADoA1gCGgRkAJz/fgRj/H0AyADcBbwCqQG7/vQB+gCi/nz8ngcTAcH9nP9yBh//qQEG/x//MwQ+/iX+wf0BBLMGVQABBIP/av8UBef/igIZAGP8OgdeAcgALAHPA00I4gSs9AgHDP7cBbEIov4q+SADW/XbAb/1KAq0+1H/wf0BBKsJov4yAPoAFQk/AkEKb/pMBNj1MPiJ/o316QdLAAAAXgH1BcH9cP52/dwFcgZq/68AtweqBeTz7PogA1H/iwZ1+Vf+Y/xxAvQBLAEM/qL+/AggA4P/"},"Palladium":{"n":253,"d0":3,"p0":42000,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"9AGc/5z/ZAAmAiYCiPogA/wIvAIsATj/yAB09SwBGPwY/CwBOP8AANwFsATA+TTvbAeQAVgCAAA4/5ABFAW8Anz8nP94BSwBwPns+ngFIAMAAFgCeAW8ArAEJPpMBGj33AXg/MIBRgU4/ywBlPgAAHD+RP1MBCwBsARYAugDvAIUBeD86AOQAQz+rA0M/sgAMPjQBzQILAGo/egD4Px09UwE9AG0+0j01P4AAGAJfPywBCADnP/Y9VD7EPWM8Wj3uAsw+GAJyACkBiT6OP/oA1D7rPRMBBQFLAEsAbwCOP9ABpz/vALQB6j9qP2U+PQBIAMw+LT74PzU/gz+WAKo/XgFZABYAmQAsARkAAz+RP20+ywBZAAUBXgFAACo/SwBCAe8AkwEfPwM/kT9nP+0+5z/GPzoA/QB6AOQAQz+qP1E/QAATAR4BZz/HvsCCEwEvAIsAQz+AAA4/2QAnP80CCADAAAsAbT7fPwsAfQBQAac/4j6/AjIAMgAcP4AAPwIsATY9RQF4PwUBcgAyAAE97AEGPzQB+z6YAkAAKQGZACQASgKOP9Q+/AKhAMgA6wNRP0AAEj07PrIALjyMBEIB4QDPPYgAwAAGPz0AYQD6ANoEHgFyADU/jz2AAD0AZABFAXU/tT+4PzU/iAD9AEM/ngFYAmEA6j9"},"Platinum":{"n":253,"d0":3,"p0":149600,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"VAv8CKj99AGsDRwMeOwIB1QLsARsBzj/8PGk7ez6BPeo/SwB1P7IAIAM2A7w8XzjFAWc/+gDpAbU/pABFAUIB/DxqP0cDMgAmO8UBbgLeAUM/oAMDP5kADQIiPq4C3T1gAy0+7AECAd8/Kj9YPBgCVz5DP5ABoQDpAZ4BQgHYAlUC+z6/AgsAVz5mAiI+pAB/O9UCxwMvALs+ggHcP6A81gCQAZc+YTqZAAM/qwNGPxABlQLDP6A85T4NO9E5NTlgAy48tgOpAaYCDz2DP5gCVz5FOyYCBQFRP1sBxQFOP9gCVD7WAJIDez6iPpU8ngFjAqY73z8JPo4/wz+6AP4+PwInP+c/5z/9AFkALT71P5w/jj/hAOMClgCvAL4+PQB6AMcDJAB1P60+3z8fPzA+eD8BPeMCgz+TASc/0T9lPjm+0r8YAkUBXD+XPncBegDpAboA+z6yACc/wAADP6YCNAH9AFgCZABRP2wBJABsARw/hD15Az0AWwHnP8UBdAHbAeA84QDzPeYCNwFUPug9ggHzPewBDz2rA3U/vQBiPqc/6wNcP6c/ygKNAio/SgKqP18/JDoSPQM/hb0Oge8AmQAcP4M/jj/7PoUBXD+mAh0DkwEIAPg/FTyAAAM/oQDNAiI+lgCyAAM/twF6AOQAXD+xAnoA6z0"},"Silver":{"n":253,"d0":3,"p0":1717,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"KAAgABQAAwBIANX/+v8XAPr/DgDw//7/sP/Y//T/2//7//T/3//6/zcAAQC+/6D//f8GACgA6f/8/xgAGQAnANr/DAAxAN7/3v8QABQAJgAHADwAEQD3/wgA5P8qAMj/KADj/xYAHgD7/+7/y/8AAPb/CwAGAB4AGgAJABMAFwAFAAEAJAAPAN//FwD0/wgAq/8yAO7/EAD3/y4A7f/s/xMALwAJAJT/BgABAEwA/P91APD/FQDL/+P/4//E/+v/BgDx/0AACQARAOn/DQDw/83/2P9iAPn/4/8hAAwA//8JAP//GwA8ALX/HQDL/xsALgDK/xEA9/+9//P/AADs/yMA8/8TAPr/HQANAO//0f/p/yEA+v8jAPD/DwDL//3/BgAtAB8ACADx//v/EgDZ/wMA7P8OAA4AIgDu/wkA4f/s//r/SwAwAPj/8P88AP7/FQAUAOv/JQD7//n/AwAmAA0AIAAJAAYA8f8gAAAAGwATANr/RwAUAPT/CAAVAEQALgCb/14A5P8yAGAA+f/Y/xgAyf8TAKv/QgDp/x0A/P8XAF8A7v8bACYATAA6ALcAmv8WAKD/sv/L/+T/iQAyACMA9f8KAAMArv8MACcAoQDo/xgAVgBaAGz/w/8mADYANwCu/wkA2/8rAAQACgDv//X/iQAaAPn/"}},"2011":{"Gold":{"n":251,"d0":3,"p0":140550,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"Hfdd/fj4AQT7BPoA7f6C+2n7ZQT0AWP8/vdeAZr3tgPIAJr31gaQAc7/Pv7cBc7/vAJSA4n+GQAf/w4G4QD6AFIDeAUM/qMCLQVK/NsB2wFABgAAHvtsBzj/ov4r/Vb6wwUq+a789AGwBMkEH//uAjkDK/2I+qj99AGwBF4BOP/IAMoIzv94BZz/x/y7/s7/3AWwBBoE6APIADj/LAH8CA4G5vua9431vQbJBNUC1/HjCMD5MgBX/gb/eAU/AskEcQLa/V4BsAQl/lIDMfyXBDUC9vpq/7wCovnG/YP/1QJ9ADMEWAIsAT7+/vcw+JYAXgHIAAv6+gBeAakGFQTn/9YGZACMCjQIiPq3B3cBEflZBh776guu/EwEov6J/uf/GgT+ELv+SwB7EYkXp/mZDOTzXPkEEBQF+gBeGicGawO+8drLihuQAawN5vsKD5oQ2v2k7Vz5ghS+8Yzx/AgE9xD1PA889iEHhe4i8hTT4BXA+VTyhAMcDLAE4ONWE5YAFAU4/8QJiPosARQF5PNE/Wj3qP3wCg0CKxYM/owKXPnA+VQLlgAuCSADuAuI+oj6OP9yBvL5IANc+dj12PV2/YL7FAUE99gOLAHs+vgRZABE/aD2TAQgA3T1gPMk+kj0bO7O/14BsASyDN70av/S9tbtdA4="},"Palladium":{"n":251,"d0":3,"p0":79200,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"EPVYAqz0hAOwBMwQ6APs+sD50AekBuD8RP3oA4DzTASwBKj9IAOEAywBiPosAVgC6AMgA/j4yACQARQF9AEM/lgCQAZo9wT3pO1MBLAEeAXoA4QDUPssATz2hAMQ9Yj6AAAc81D71P54BWwH1P6QAfQByAB8/JABeAUsAbwCsAT0AcgA1P70AVgCGPyI+gAAOP9E/dj13AXQByr5ov5sB/QBOP8c82j33AVkAGQAEPWkBiT6IAPcBaj9WALU/oQDZACEA7wCNAg4/zj/ZADcBYQDWAKQAUwEfPzU/iT6aPeg9jj/FAVMBHz87Pok+vQBIAOkBkT9WAJkAKQGqP2wBIj6UPtABhQFtPtMBEwE1P7IAOgDZAD0AYwK4PzU/hQFfPxE/SLyqux8/OD8xAm0+2QAQAZE/RQFCAdI9LwC6AM4/4j6nP/oA/wIWAIAABj8GPxc+SAD9AFI9Fz5WAJw/ggHfPzg/Dj//O8Y/IzxbAcsAaD2ZAAE91D75PNIDSwBpAYY/IQDfPwAAHQO8PEgA1z5nP8oCjQI9AH0AXgFwPnA+VgC9AGwBOD8mAgY/Fz5LAFMBNT+LAFc+YDzJPpw/iwBRP1c+fwIGPx8/DwPMBFE/fj4MBFw/kT9LAGI+lD7EPUUBXD+qP0IB9T+NAj0AWj3AAA="},"Platinum":{"n":251,"d0":3,"p0":176800,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"HPMAAJT4/AiEAwQQhAOwBHD+pAb8CAT3tPuwBIzxFAUsAez6nP9sB5gIcP68AoQDTAToA6z0cP6o/UAGOP9Q+7wCeAWg9pT4gPPcBdAHyADwCoQDJPq8AgT3OP8E92j3fPz28G72yAA0CDQIkAHU/rAERP34+KQGvAL8CJABAACEAyADfPz8CKj9iPpE/WQAWAJw/nD+WAIoCgz+OP8UBdgODP7k81TyhAPIAPQBQO38CGj33AXIAHD+ZADs+pABWALoA5ABoA84/5z/OP+QAQAAOP/IAJgIaPfA+ST6aPcw+Jz/yACc/5T4aPeA86QGbAd4Bcz3pAYAAAgHiPo0CPj4UPtUCygKwPlMBGwHtPtYAlgCyACc/2AJMPjg/HgFqP1YAsTwvOlABrwCSA1gCYQDLAHQB0AGsAS4C/wI9AGs9JzmbAdYAvYJ2v0gA/wIcP5g8NT+/AjY9ez6RP20+5z/eAXk88gAQO387zzEoA8E91z5cP74+PDxmO84GKQGAADU/sQJOP/0AfAKQO2c/1TyZAAcDIAMsAR0DmgQxPA89ngFAACUEez6SA0Y/AT3OP9gCTD4AABQ+wT3zPdc+QAA4PyI+pgIJPp09XQOvAKI+uTzpAaI+tj1ZABkAFz5iOEiC+b7kAGMCvj4vALM9xTspAY="},"Silver":{"n":251,"d0":3,"p0":3067,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEFAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"bv/z/7v/KABLAAYA2v+6/9//PAA1AKX/gf8qAKr/KAAdALn/awA5APv/AwA9AB4AFQBQANb/FAAQADgABQDw/4UAlQDK/ygA//+2/18AWAAmAOr/9v/ZAOn/7P+e/5P/0AAa/1UA5v9EAGUA6/8/AHgA9v+W/wAAWwAiAOj/UwDa/5sA9P9HAHMAo//q/y0AwgASACsAnQCTALL/7v9UAQP+tP4L/5T+fAEoAE4AZP1yAUf/+f8fAHQAof/2/3MAhADq/0oAYAC6/7f/Nf+oADYAif9RACMARf+t/zoAHQDw/xMAQADh/woAgP+4//v/KwA/AIv/GQBCAD4AMAAqAAgAb/+4AAkBhf/YAP//U/93APX/bwDU/y8Awv/I/+D/KgCDADoAEv8+AGr/+/9XAKf/WQASAEIAHgCmAJcAw/+w/8z+zgDw/y0ADABnABUAqv+p/3QAtv/F/7H/eQCn/9v/MQCA/2sAEP8R/ib+FgIK/6v/GgA8ANP/Qf83ARIAGQCq/5gApP/x/zAAfv9hAIr/AQBaAB4AggAZALsAiv+B/1YAWQCz/zUAEAD6/6n/BgA9ANz/KwCN/5f/ef9fAN7/KwC6/0wA/P/D/8EA8/+9/8H/PAATAMD/sv8MAHL/kP9iAJz/MgAvANP/+P/H/wf/ygA="}},"2012":{"Gold":{"n":252,"d0":2,"p0":159000,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"FAV+BIoC1P6EA3gFfgTm+5YAOgcM/rwC+PhUC6j9GPwYFYQDav/WBlgCXgGwBGbvLAH8CBj8Kvl+BKj9wgFK/EAGBv/uAu8GfwjIALr6zwMtBdTldv2O+R771P5sBzj/PwLm+zXzC/rhAPQB2v3uAjD43AW8AhAOXPmz9/QBRQEzBDTvY/xNCAEElgDcBU/3dwHa/T7+OP/g/KMC+gC8Aj8CUgOD/5X8GPzs+gb/yu/CAWP8Eflw/pr3tgMEEOEAVvrl914ByAA6B/P9PPZTByT6ix8e+4XupAaJ/i4JcQJFAX0A9AEx/K34evRq/5EF2fkZAK8AcwrJBFID5/889s37RgX4+LT7RgX0AUwE8vkyACwBgvuWAKoFDgYnBh//cQLg/P/7SvyXBHECqP0/Alf+XwX5/En4awMUBYP/awNyBpgIkAHU/ksAK/1LAAkLJgI4/2wHHvtbDlH/lwQ3+2gQ8/3m++8GVvpfBQv6OQPU/q78Dwrm+yADg/+dA14BzPevAPn8qQHn/0n4MfwBBBkAC/r5/OD8rvyKArT7IAOWAMIBDQIk+pP0+wQjD/L57wYsAbT75/+c/7r6LQUzBCv9LAH0AeIEAACP/Y75dwH/+5v7if4Y/JABfgR9ABMBEfmvAHb9tgM89hL9rfiRBSv9XgENAg=="},"Palladium":{"n":252,"d0":2,"p0":65500,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"IAPA+Yj6wPlABiADAAB8/CADFAVw/mYIBv9MBAAAOP9sB7T7cP4UBZz/ZABABsD5IAOQASADUPtkAIj6nP98/EAGOP8gA+gD6ANw/kT9OP/oA4j6vAIM/vj47PpABsgAFAWo/Zz/nP8sAZz/1P6c//j4oPa8AiADJPqo/cgAWAIsAYj6DP68Ahj8WAJYAqj96AMgAwAAnP8gA5AB1P7U/iwBFAXU/nD+4Pzm+475PPYAAOz6tPu8Agz+TATIAEwEqP1E/Yj6yABYAiADGPx4BeD8NAjIAFD76AOo/SwByAB4BRj8LAGc/7T7RP2c/wz+mvcG/1D7sAQsAQgHcP7A+Tj/kAFw/nD+kAEAAFgC1P4AAAAA7PoM/gAAyAC8AnD+0AcAAKj9GPwsAbwCyAAsAeD8yAA+/mr/ZADoA3gFkAGMCpABhAM4/3z8nP8k+kAGZACc/xQFOP9ABrwC6AMAAHgFDP60+zj/tPuwBDz2cP7s+tT+IAOc/yADLAF4BVgCwPkgA6j9OP/U/rT7nP/0AUwEwPl8/CT6iPq8Anz8OP+c/0AG9AFE/Rj83AVYAhj8vAJE/ZABuAvg/LT79AGwBHD+sAT0AfQB6AMY/GwH6AOo/QAAyACc/7wC6AM4/zj/GPwgA8gAkAG0+ywBXPkgA7AETARE/Q=="},"Platinum":{"n":252,"d0":2,"p0":140800,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"/Ai0+9T+UPsYFSgK3AVc+VgCdA6I+sQJSPTkDOgDAABcEkAGUPvECST6IAOwBMz3FAUoCkAGXPncBRD1OP/M98QJTARsBygKrA20+1z56AOkBlTyhAPw8RzzUPtgCaQG/Ah4BYj6cP7g/AAA4PwY/IzxIAOc/3QOzPdkAMgARP2YCOTzaPdYAiT6OP8AAAT3ZACwBCADJPpw/lz5qP2EAyADvAK0+8gA4Pys9ET9wPl8/Kz0wPkM/jD40AewBOgDRP0o8aj9FAWEA9T+BPec/8D5yBmc/5jvxAm0+wgHSA28Aqj9AAAM/qD2BPfIACwBSPTU/mQArA3ECRQFvAIw+HT1nP+I+uz6eAXU/vQBtPtw/sgAzPec/zj/6ANABpT4NAhE/Yj6qP2QARQFcP6EA1D7OP8AADj/AACoFngFFAVoEGAJ7Prs+tT+kAHA+awN6APg/KwNnP+kBgAAoA9MBFwSZAAo8Vz5EPX8CHT1TAQgAyADKArU/qQGnP9gCUAGVPI0CAT3nP9kALjyOP9MBHgFgPMk+uTzlPgUBeTzqP0sAQgHvAL4+Oz6WALcBWj3YAnIAEwEQAYw+MD5LAEUBdT+6AMAAGAJeAUk+rAEZAD4+Az+OP9Q+xQFxAlkADQIaPcM/rT7IAPs+nz8KPFE/Qz+4PxE/Q=="},"Silver":{"n":252,"d0":2,"p0":2878,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBBQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMDAQM=","pw":2,"p":"KADm/zAAyf9UAAwATQCi/xoAMwDm/0AA1f/RAM7/5P+oAA0A4v8qABQA8/8aANf/6P9tAMf/5/8dAN//EgDN/x4ACAAJACsALwBmAND/MwCjAPX+QQCZ/6D/+/9cAOr/9v/t/7b/0P/3/xEA6v/n/+7/5/9FAE4Axv/A/0AA//83AJ3/uf8cAA8A6f9aAJf/IAD9//L/IADB/+L/AgDu/ywABgDW/+b/8P/S/+D/r/8wAL3/5//7/5n/FwBkAPf/4P/h/yAAEAAcAOX/x/8qALj/xgD4/5H/LgD3/yEAAQDq/+n/JgDO/9X/lf/3/0gAxP/9/xsAHAA4ABMAFgCb//j/IQDS/9T/UQDV/yUA2f8qANr/9P/+/xIARgD4//f/OADf/9P/7/8vABwA8P8SAPL/EQDr/+z/FAAkAPb/UgApAGMABQAsAPj/+f/y/3oAIgACAE0Av/+KAPj/KQCj/6sA7v/R/zsA2P8sAKD/HADz/wcARgDi/zIA8/8YAPX/nP8CAPj/LgDS/8f/1v8XAPz/vv/w/9L/GAANANf/DwAQAB4AJgC2/5v/MQBKANT/LgAvAPv/9v8JAOL/KAA0AO7/HAAMAEMA/f/s//f/NACq//T/6f/o/wIAMQDv//n/1//v/+H/EQCb/+f/hf8eANT/KADs/w=="}},"2013":{"Gold":{"n":253,"d0":1,"p0":168150,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"LAGX62YIAADPA87/igJR/y0Fg/9eAaMCOP/CAef/C/pd/br6dwE/AjkDSvy1/18F4Pw/Aqj9j/2B93ECcP49+vj44QCC++ryfgTiBNsBZQQq+cz3IANxAv/7igKi/jIA9AGEA3b9OQNxAiwBhAPt/hMBY/wM/o/9fgQl/pP06/buApIJJf6EA/H1+fxwzCjxZAAIB6QGTAT5/NUCmAgnBgEEGQC7/rr6Agi6+nz8DgYX+GL4owKH9jvy5/8E98QJigJLALX/j/0mAn8IkAG6+lIDlfwsARoEA/Mr/QcDhAN2/XECEv0e+33n7PpE/a8AIOosAcX0uQ+9Bj36XgF1+Sv9WgoZACILwf1xAtsBUf8+/nEC1woUBS0FEPUnBiwBrvydA/n8KPHdCZT4jvnJBO8G6Qc5A837WQZNCKoFSvzB/RoEkAFCDqoFe/i6+mr/AADiBFD70vbvBuz6+fw89oDzigL6ACr55xjH/Ory8/13AckEtPuRBaL+9vD1BbwCDP7oA4L7gvs3+zH8/vfjCNELUgOc/1f+TQhFASYCnQNX/hMB2fmU+M7/1P4/Apz/RP0j9u3+DP7VAmr/rwCb+7X/BPdd/Rj8bAcAAHz8XgH5/Mb4qP00CLv+H/+9BrYDafvl96MCBwNw/hD1//sf/3cB+wT5/AAA"},"Palladium":{"n":253,"d0":1,"p0":70700,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"cP7M9wAAGPxMBKQGDP5YAngF4PwUBfQB5vv6ACADDP5YAqQG1P54BVD7LAFMBDj/FAVE/ez6igKWAAgHqP2o/UT9sARw/qTt/AiEA/j46APIAGj3AAD0AdwFIANABrwCyADU/qj96ANK/BL9JPoIB3D+WAKo/SwBWALoA+z67Pow+CwBLAH4+MgALAFA7Zz/kAFw/rwC1P6o/egDcP7IAFgC3AU4/1D7QAYY/Az+hAOEAwAACAcAADj/QAYAAFgC6APA+WQAcP6kBsgALAGo/cgAkAEAAPQBqP28AoL7av/A+Tj/dPVYAhD1qP0M/gAAzPcM/iwBuAuEA3D+OP9E/VgC/AjU/sQJRP2EA2QALAGc/9wFLAG0+2QALAFkAFz5FAUAAHz8yAAsAaj9RP0gA+gDkAGc/wz+eAWQAcgAGPzU/rwCLAGo/QAA4Pzg/Az+RP3U/gT3qP2EA0T9FAXA+ZAB3AVkAKj9CAdYAgz+qP1YAlgCDP7oA3D+7PqQAYj6qP2wBGQA4PxYArwC4Pw4/0wEmAi8AgAAnP8sAaj9ZABkACwBcP5w/iwByAB4BcgAZACo/Qz+4PzU/tT+fPx8/GQAAABkAKj9hAPIAKj9kAEM/gz+yACwBIQDOP/0ATj/OP8Y/OD8yAB8/Oz6yAAsAQz+6APIACwB"},"Platinum":{"n":253,"d0":1,"p0":155900,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"6AOg9kwEIAMoCvwIFAV4BUQWjPGMClgCaPfcBSADRP1kAGQAXPl4Baj94PzECWQAgAwAACT61P4w+FQL9AEc80T9hAPA+UTk6AOEA1Ty0AfA+eTzTAT0ARQFkAGQAXD+cP7U/qj9WAIk+pz/JPqYCAAAOP8Y/CwB6AOEA+Tz8PHIAEwEWAJw/iT6nP+04lz5IAMY/IQDfPyI+hQFQAaADEAG0Afs+gT3HAz4+Jz/FAUAACT6pAZ8/Dz2yAAw+EAG1P5E/cgAUPtMBCwBhAMM/vwIIANMBPAKpO2QARj8lPiI+jj/MPhMBMTwjPGi/q78EPUAAMgAxAm4C/j4lPhQ+5AB5Axw/nQO1P54BQAAvAK0+0wEeAUsAYQDRP0AABj8IANYAqj9GPyMChj8aPeMCjwPTAS8Aoj68Aqc/9T+GPxYAiAD0AeEAyT6tPu0+0AGcP5YArjyiPp4Bfj49AHM96z0NAgY/Pj4iBNo98z3fPy8AsgAzPdMBCT6PPaQAbT76AOYCOD8wPkAAOD8RP1ABvAK0Ae8Aoj6TAT0AcgAQAYsAfQBDP6o/UT9ZADoA1gC4Pyg9jj/kAF4BUT94PyU+Kj9GPxw/iT69AE4/wT3WALU/pT4IANABqj9OP/QB/QBqP2I+nz8kAGo/XT11P6wBBj8oA9w/gz+"},"Silver":{"n":253,"d0":1,"p0":3087,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"BABh/1IAGQAAAAoAEgAJACsABAAbACAACAAEAB0A2v/j/7v/EwAdAEQAxP8IADIA4f8FAOn/3P/g/xQA8P+6/+7/AACn/9n/BwAmANb/IAD0/6L/RAAYAO3/GwDp/wwAIwDz/9D/GwD1/wUABQABAA8A2f8QAM7/HwC8/7P/2f8RAB4A/v8xAO//7/9+/vn/8P8UAA8A+v/F//b/JwBIABkADwDT/+T/OADO/wsAFQC6/x0A6v/H/8P/GgCq/04AEgDx//f//v8AACAA9f/y/wgA8v8ZAP7/sf/p/xQABQDy/xIA+f/u/3b/2//q/wwAkv/6/xkAOgASAPn/AgDn//D/+v8bADAA7f8QAA0A9P/e//n/NQAXABUA0f8KAAgA1v8aAOr/5v8eAAIAzf8uADoANQA+AAQAMgBTACgA3P8HAA0A//97AC0Awf/R/yEAGADO/+3/0f87AOD/1//o/6H/EAAJAM7/mQDm/5b/6P8YAB0A3P8HAAIAyP8rAAgADAA1AOz/7//X/wAAmf9TACgADwAWAP3/LwAOAOD/EwDp/ysAyv/T/woA5/8iAO3/+//h/+P/2P8IAPL/AADs/+z/5f/8/+r/KADz/+r/EQDu/8b/9P8pAAMAAQA3ACIAxf/n//v/NAD4/8T///8EAAMANADl//H/"}},"2014":{"Gold":{"n":253,"d0":1,"p0":121975,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"4gQ/As7/tPvO/3ECXwUTAc37tf93AV8FRP3H/NsB3AUzBI75fQC1/xL9AACKApABlgCWAEYFnQN3AXcBIQfWBlD72wEM/rwCyQTn/9UCfPy7/nIGJf6o/UsAeAWI+l8FBwP1BZz/hAOO+Y75lPh+BI75K/3n/2L4SwBR/xL9Bv9FAXECJgInBgz+lwRX/tUC7Poe+xkArvwr/QAAMwQHAzf74QB8/MgALgn6AEn4H/93AQAA7gJeARj81QJK/DIA+gAG/3z8Efmb+wAAY/zO/68Ag/+dA2QAav+EA7X/ZQRrA0P5wgEUBfAKXgG2A7T7zv93AR//+wRkAFf+nP/H/PQBqQEbCF39C/pj/Fb6DQLuAvoAwf0yABL9Ev3iBPoAGPwG/+b7hAO1/1f+RgUOBmP8EwFR/z8CdP/D+wb/wf2I+jIAJgJq/ywBH/+WAEr8Y/z6AET9RQGb+1H/K/0x/Ab/kAEf/7r6zv+u/EwEnP+6+pcEPv75/Gr/WAJE/W/6kQXiBO4C8/0/AvQBSvzWBtT+LAEzBAz+j/2V/IP/H//n/0/3TvMG/2r/oPa1/zIAjArl97AEH/9E/eQM3AWD/139tf8TAXECdv1LAFD7wf0hB3ECSwAyAGP8ZQR/CJX8kAEF+4L75/+XBNP6H//Z+Qb/pAYS/fsE"},"Palladium":{"n":253,"d0":1,"p0":72300,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"vAI4/yADnP/IAJz/kAFw/gb/wgH0AfQBOP84/ywBcP60+3z8qP1q/0r8yAAM/iADAAAsAcgA9AFkAJABIAMsAXD+9AEM/pAByACc/zj/1P4gA7wCnP80CFgCyADU/sIBuvpMBGQAnP9E/QAAgvueB9AHrvyi/jD4ZACwBKj9IAOQAfQBDP7g/GQAIAOQAZgIiPrIAJz/7PoAAGQAbAdYAuz6WAKEA8gAAADIAOz6AAAAAJAB3AXIAMD5TAQ4/0wEZABYAnD+6AMM/gz+LAEAAJz/ZAC8AiwBAACEA/QBHPPs+pz/eAXIAMgAJPoUBTj/LAGEA1gCyACEA8gAkAGQAZABLAHIAKj99AEAANT+FAUM/vQBUPssAdT+9AHoAwAAcP6c/+D81P6I+uD8IAMsAcgA3AXIAJABkAHcBQz+PPYAALAEkAFkAOgDOP94BeD8PPZYAvQBvALs+jz24PyU+EAGqP30AYj61P4w+IQDvAJo95ABlPgAAFz5FAVQ+/j4CAdgCegD7PrU/sgAGPyU+ET9AACEA+gD4PyYCKj9WAKEA0T9GPwoCqj98PHU/qj9QAZ8/BQFAABE/dT+IAMAAAz+6AOwBFgCAABYAiwBAAAM/kwEtPvIAJABOP+wBMgAAABw/lD7JPqc/7wCeAWQAZz/kAHU/lD7"},"Platinum":{"n":253,"d0":1,"p0":138700,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"0AdE/YQD1P4gA7wCFAUM/oj6LAGkBhwMGPxE/SwBOP/M93z8JPrg/Ij6LAEM/mQA1P5YApAByABkACwBjAosAdT+cP4M/lgC6AOQAVgCUPukBiADOP94BUwEWALs+hQFNvdyBpz/ZAD4+GQAMPic/3D+AACC+/L5OP8IB8gA9AHoA2QAqP0sAcgA6AO8AiADJPoY/HD+PPao/XD+sARABoj6vAJw/rwCYAmQAST6qP0AALAE/AjuAh77CAcY/OgDOP+8ArT7tPsY/PQBXPlw/iT6IANgCZz/6AN4BeD8zPe0+wz+QAYgA7wCiPqkBkT9yAB4BbwC9AH8CNT+qP04/wz+WAKwBHD+fPw4/yT6TATU/iwB4PxkAOz6nP94BSwBDP5E/ST6WAJw/uD8TATcBbT7ZACc/8gAUPuo/UT9JPrg/Jz/nP+c/5ABnP8AAKj9UPtYAkT99AEk+hj84Pzs+rwCOP/U/sD51P7A+bAE4Pzk8+gDtPuQARzz9AGA80j0XBIUBbwClPic/yADzPcsAZAB6AP0AQAA7Pqo/cgAyACwBFz5zPf0AVD7PPboAyT6QAYk+lgCAAB8/LAEZAAAAOD8CAeQAdT+kAEAAET9wPk0CPQBsAQAAHD+AAAIB1D7ZACU+HD+JPpkANT+AAC0+8gAKAp8/CwB"},"Silver":{"n":253,"d0":1,"p0":1994,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":1,"p":"GPL+zgIaHRLu9wEc5vAYCNz1/OX2/AcdM+Uh/QMHUjjkJvAPH+AL0vUT4RHrG9ka5BsM8uTtxibd7APdAxrvAgEK9CLmI/HdA+8C9fvYPPrl++oLLwDZABX+K+vfFu76GfLv8+UP7Qb1BRYI9RQNGQn0EhVEDSXeBRXvFfz8DO8NBSX35OzpCBD/9Az32hEB9g/dAfHWHQbkF+78AOUH6P4JAO8r5ALj9gv4Bu0B4foAC/Tz+7kS8OgCBNH5BfQFIv8d2g8Jzy32Av4A4wz/AALWxvv9sPwOGfYFDNlVB//6CgMh++3T6CsODPf5C0X4CerI3g3qF9oGF+sS"}},"2015":{"Gold":{"n":253,"d0":1,"p0":118425,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"BwNsBxMBK/3bATMEpAb/+4oC/Ai9BosGPwK0+4oCzfuJ/iADgvtQ+zMEowJp+9r9GQCB9yX+OP//+zIABwNp+wv6ZQRv+hj8yABMBEYFJPqXBHz8ov4+/rv+HfcF+x//+gAl/jIAH//B/dwFBwPFA6EEuv+VBoz73PvR/MgA6Qe8AgQBGvpOAmv+gP1g/8MF+/9+/9X91gFH+rgBVPxJB1QBzv8e9kgDgQHH/OEAzv/i/1cDfwibAKEErvz2+h0BjABc+Zn9oABfAMr+kQAp/2H+cf0G//gC9AHa/YP/nP+BAZj+ngcPAEP+9fsI/Y3/7P/SAGr/tv4c/YsBcP7IAFD7EQMeABf9Uf+bADv8Lv8Q9UT9oPvlAQL5zQXU/nMAqvvQ/Q8F2P+e/Wr/ewJZATUHYwE3AMT/NwC5AJUBwwV0BJ8BSwA/+LL91P5oBkL/HfwH/nD+8f+RAFH6dP+lAAb/qQFIA/kGVQAN/Sr+2QNRBOD89vou/8L86vz1Cv8ATAQ0/jQD9gQs/IoHxQNE/Sr+zQBGAOX8/gHP/u3+PwIe+5v7VfsW/vb60vsoAEb7yv56/pz/f/4zBKb6+vsEAbUEcPnRAbD/Vv+3/Xz8UAUV/6L52ASyB7n7mQKA/SD+UABzAKz+CgDc+zYGSQLa/SgAL/43ANX9"},"Palladium":{"n":253,"d0":1,"p0":79600,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"LAE4/5ABtPuQAUwE9AHM9/j4yABQ+7wC6APs+ugD4PxABpABLAFE/bT7mAjg/JABkAG0+3D+fPz0ASwBvALU/gAAqP0sAXD+IAM0CEwEGPxMBIQDZACQAUT9OP/A+dT+qP2c/0T9tPu0+yAD1P6QATj/DP4sAbT7JPq0+5ABhAMoCnD+iPqwBNwFPPaQASADTATU/tT+qP18/BQFcP70AWQAvAJw/vQBIAMAANT+9AGo/WQAcP4AACADRP1kAET9LAFkACwBLAFE/XD+cP5E/aj91P7g/GQA1P6o/WQAfPy8Ahj8DP5E/fj4yABkAOD8lPgM/pz/pAZMBET9MPggA2zu/AhE/QAAWAI4/1z5tPsk+rwCZAAIB4j6LAF8/IQDDP58/GQA+PhkACwBLAEAAEAG+PhABpABOP8k+hj80AdE/Vz5YPAY/FgCCAcoCvj4QAZE/WQAWALIAAz+nP+8Aqj9FAXoA8gA4PxYAngFmAhABnD+JPqMCuD8VAs0CLT7WAK0+3gFWAI89pz/eAXU/qj9fPzIAOz6KApc+Tj/nP+o/YQDaPck+pABjPGc/3D+JgIe+1z52PUk+rwCOP/g/LwCLAG0+/QBhAOQAUT9ZAC0+xj8eAXcBaj9RP3oAxj89AFYAkwERP3s+rAEnP/IAAz+OP/IAET9"},"Platinum":{"n":253,"d0":1,"p0":120800,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":2,"p":"yACQAbwCOP/IABQFhAPs+rwC0AcgAywBFAVw/gAA2PVYAlgCMPjs+nD+TASc/8gApAZI9OD8fPyo/Tj/TAQk+mj3WAIE92QAAAAUBQgHwPmEA5ABqP3IAAz+zPfM93z8nP9w/qj9fPzs+igKLAF4BbwC1P6kBsD5UPvg/NwFbAewBPQBUPu8Ahj8GPwAAGwHOP8sAVz5GPwY/JAB+PjECbAEZAAk+pABAABE/cgAOP/g/PQBQAa8AugD1P60+/QBZAAE90T9cP4Y/ET9OP9YAnD+4Pw4/6QGnP9w/rT7tPtkAIj6CAe0+3z8ZADU/vQByAA4/yADyACo/bwCaPeo/TTv/AgM/nD+nP84/5T41P7M9ywB+PjECST6vAIM/rwCOP9E/Zz/aPcM/gAALAEUBfAKcP5kAGQALAGc/wAAmAjoAxD1JPpw/ugD6AOEAwAAkAGo/cD5LAGEA4j6UPsw+NT+vAL0AbAELAHA+Wj3AADIAPj4aPfQB1D77Pr8CNT+0Aeo/aAPFAVw/ugDTASo/XgFOP+QAez6TAQ89iwBIAOc/zj/MPjU/hj8fPwAAMD5PPa0+8D5RP1Q+8gAwPkgA/QBXPlE/QAATATU/pT4FAVkAIj6/AiYCLT7JPqwBAz+UPv0AaQG1P4w+CgK6APU/pz/hAP0AcD5"},"Silver":{"n":253,"d0":1,"p0":1571,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEB","pw":1,"p":"ESkEBPMcMNww7EkPKvIP2AQOxs0eJezZFufvD/r9KdPYH9nyDBMf4wrr9vPs+fLyBO4I/vcpHTgY/RMBz/v8HAL+yhnk7Qod9eX//e39ATAQBN0Z//r8CAcTS/Et4t8LB9LzAv/6Cfbz4PcHAOYGAAr7GvQH6fn0BgDz+f4D+wLCJwcA7wPaCO/3AwrZFPEHA/gR7f4HEA0rBf0W4ADZQvzM+dLyERj0D/7xCQ778vH4EBky+Ojy/xTj8gn29FIqD+sm/d0XIvLuAPUCFQziF+vt6f706Abi6fX7AP31+AQI4RD5Fu79DfnrFCTnA/bn6wMAIuYmBAnz5fUA"}},"2016":{"Gold":{"n":253,"d0":3,"p0":107270,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"EgJJAr8EkQDVAif85/p/Azv8pwOn/mwCaAFVAF0CTAS0APoAnv2OA6AAgAJZBskE0gUOBtr9kQ9ZBt/zYwFA/MgArgYH+eYFRgU7AUj+OwFJAtf77ASLC3r+igLP+bT73AXG/Qn3zv9CDhr6//vzAlj42fkAAH8INP5q/1L5cgbB/ZcEBv/JBKsEv/rf/eH7GwOQAV0C3gM3+1H6bQEBBKEE/gaYCKz5Of7CAQb/9vq3AqL+rQJJAr77UABN+RMBnv35/HL3TgLk/c37PwK1/z7+iws3AGoEUwI5A9YGKv4EAcQJNveD/wv/1PlLAMoSMwQU+z8Ctf/DBaQGcP7dCd7+tPvXAOT9FPtR+uABTf5dAmz9mP54AMz8cQLT/wIIkPxjBqIDcQLT+nkERPMiAWcHJv3v/PoA3gOF/bMB5/8Z+6QBiP8A+ygAo/1I/pX8RAKQBq8ATge1/y370fxkAO79yv63/VAAIwCkAQUFWQEoANP/r/t1/sECY/xK/EXyrvzm+8YCxv26/+YAR/+n/n8DKgPJ//P9MQHmAMwBNP6s/j4D/AN5BOP+ZgMu+uj+BwjD9iP2F/N2AsD+dgLi9XUDBAFS/tj1GQCgAEz/CgC3+CIBXf1xAgoAXgG3/Vb6JwFoAd708AATARv+pQB//i0AawPBAs4E"},"Palladium":{"n":253,"d0":3,"p0":54700,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"OP/s+vDxyABQ+8z3CAcAAGQAWAIgAxj89AFMBBj81P4sAVgCRP3IAMgAZAAgA0wE+PhABjj/6AM4/zj/fPxkAMgAUPs4/wAAnP9E/aj9WAKwBNwFnP9gCQgHvAIY/FgCvAJYAsD5IAMIB7wCqP1MBJz/lPh8/IQDRP0sAYj6nP8M/iT6kAHIAOgDqP1E/TQInP/oA0wEsAQUBQz+cP6QAbwC3AVw/lz5nP84/zj/JPoUBbwC4PwAAET9fPxE/bT7fPxE/VD7vAIsAZz/ZADIAKj9QAZkAMgAqP1kAET9qP3IANT+yAAsAZABLAFYAnz8yABMBBQFFAVYAugD4Pz0ASADcP5MBOgDFAU4/0wEtPu8AugD3AWwBKj96APIAAgHfPwIB2QA4PzIAAz+tPuo/ZQRUPt09XD+6AM4/2QAIAOc/+D8AAB8/FgCnP98/Ij6OP/oA/QBCAcM/sD5JPqc/9T+qP04/ygK6AM4/wAAkAE4/1gChANYAugDAADg/JT4+PgM/pz/cP7s+nz8cP6EAwz+1P6o/bT7kAF4BXD+wPng/CwBsAQsATj/fPxYAigKeAVABiwBRP1UC0T9CAfU/rAEsASQAeD8GPyMCsgATAToAxD1XPk0CAT3vAKEA7T7DP4sAaj9VPJw/oj64PwY/GQApAac/1gC"},"Platinum":{"n":253,"d0":3,"p0":87800,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"sAQM/sD5vAIM/rjykAH0Aez6RP2QAeD8DP68AqQGNAhMBEwEMPhkAAz+yADwCjQIDP5sB9T+pAYUBcD5ZACc/1gC1P5Q+5z/6AOQAfj4OP8IBwAAOP/8CNgO9AGg9mQA1P5E/Vz53AVABqj9tPvcBZABHPNE/cQJAACwBBzzWAJkALT7TARABsQJ1P7U/tT+qP0gAwgHCAf0AQT3LAH0AUAG8ApgCRD1ZACQAYQDoPawBAAA1P44/9T+tPsw+AAAOP8Y/Bj8kAHg/MD51P4AAIj6KApYAtwFRP3g/AAAfPxw/vQBRP04/0wEDP6o/WQA3AVQ+4QDQAZUC5gIyAB4BdwFfPxABrwC4Py0+9wFtPv0AUT9kAG8Amj33AUgAxgVzPeYCNwFOP/g/FgC+PhkAOQMOP+48vj4LAG0+4QDfPzg/AAAOP9o95z/qP3A+Xz8RP1gCegDpAY4/4j6SPRYAoj6RP1E/QAAnP+wBCADhANc+cgAJPosASwBtPvs+oj6XPlQ+/QBfPxQ+6j9cP4AAIQD1P5w/oj66APcBdwFqP30AXgFkAEgA6j96AOo/WwH1P60+8z3HPPIAHz8hANc+SwBCAfg/Mz3qP30AbwCDP4k+hQFhAN4BXz8pAYY/Gj3FAWEAyT6+PjQBxj8AABw/gz+OP/IAMgA"},"Silver":{"n":253,"d0":3,"p0":1400,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"AQAAAAIAAQD5//f/+/8TAOr/CAAPAAIA/P8QAAUACwAFALD/MgAZAPn/DwAhABEAAwAoAOr/NQD//9r/CQD2/wAADADb/xUACwDw/wEA1v8YAO//DwAuABcAAADZ/wAAFwAKAOT//f8sABUA8/8IAOH/4v/q/yAAAAAAANb/FwD0/w8A+v8oACgAAgAPAAQAAwAqACMAIwDz/9//CQAnAAEAMwDb/+H/FAD5/wIA4/8vAOT/8v8XAOj//f/T//z/5//8//n/GgDw/+j/9f8DAAwAHgD3/ywAHgAbAAAA+f8QAB4A3v/9/wIA8P8JAEsA3v/z/0AADwBYAHAAwf9GAND/6f9LAPT/+v/8//X/1v8bAOP/3P8kAOP/GwD2/1MA2/8vABQA9P/V/wYAyP8EAEAA8//e/wMADgDR/xUA2//O/wcA8v/e/xEACwD8//f/CgBHAA4AIAABAMz/u/8sAPT/+P/7/xUABQAaAC0A+v/a//7/4v/1/yIA7//U/6L//P/V/y0A4v/8/w8A9P/5/xkABAD3//f/DQAJAPn/AAD7/w8AMAAeANH/FwD4/wQANwD6//D/df/s//v/CQDL/xEACADs/+f/DwAWAPL/DQDb/wUAGwARAP7/JADu//f/DwAKAJ//9//7/+z/FwDm//3/CwAVABIA"}},"2017":{"Gold":{"n":252,"d0":2,"p0":114865,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"vQbLAu8BQv/GArMBdgf6+4ACwwUM/m38V/65BdP/LPxV+yH9NQJ/A2AEfQW0+3ADkwPMAWcCwPltARkAPv6IBNEBo/1n/XAD8f8IB1oATf63/e3+UfrwABf98Pua/Nv8ZQRX/n7/Hwk7AakBof99BbQAev4KBbv+tf84/2j8xwHYBJn9fQAfBNL70gB8BmQFkv/Z/in/oAA2/H7/1f2//30AMfxH/+74YwE2/Dn+JP89/7ICaAH/AB8EiwZK/FQB0QGp/D8CFgMk/2QA6wD4/bcHywLlAer84fsM/uX8twLg/JP+2v00/jcAswHqAff5uwN4AAz+sf7b/Ln7Ff/wAHr++/qzAe4CyAAL/0IE1QITAbb+LgRcA3/+bP2BBgv/owJGANj/G/7uAmn7hgGKAkcErAMw/Xb9Q/4nBqcDA/0G/4cAyf9zADMOAPsg/uwEVAan/oQDHgAVBEH7HvtYAmP8yADc+639hQIl+d3/av90BOj5RP0JAZf6EP/lAR0BBPxzBekCPACpAcn/ZQT3+Xf8EwHF/gz+MQHu/fQBBPzvAaUA5QHj/pL/jv7bAU4CrwAtAKP9Kv6wBOD8ZwJSAy37iwFsApz/KwKw/18ACvsW/rkAwP4h/Wn7ufsrAuD8TP94BaUAjAC9AR0B9v/cAMcGbALqAQ=="},"Palladium":{"n":252,"d0":2,"p0":68400,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"oA9YAngFsASc/1gCqP2c/4j6TASo/ZABLAFIDXz8WAII7qD23AWYCHgFDP4Y/NwFfPzcBSwBZADIAMgAyADoA2QAwPlQ+9AHXPkUBaj96AMM/jj/fPz0ATj/1P7g/Oz6WALU/pz/QAa8AiwB6APU/rAE6AMsAfj49AEM/oQDZAC8ApAB1P44/wz+fPywBJABwPkk+rAE3AU4/3z8TARkABQF1P5E/Tj/ZADoA+D8GPz0AcgAkAFw/sD5GPwY/ET96AMsAXz8hAOYCIQDTASkBugDLAFMBFD7CAcQDmQAiPoc8wgHyACo/bwCsARkAKz0kAE4/8gAlPgAAIQDLAG0+0T9AADIAHgF3AV8/AAALAEAAHz8DP5E/aQGOP+YCJz/TARkAOgDGPwM/oj63AXoA5z/WAIM/sgAcP7ECegDLAFYAjj/OP9YAiwBOP8M/pz/GBWI+uD8oPa8AgAAGPy8Agz+UPu8Aqj9aPdYAmQA9AFw/gAAQAYsAZABPPb0AYQDeAVQ+8gAkAHwCmwHmAiU+OD8zPdMBNT+DP6QAZABAADU/rwCNAgAAGQAvALg/CADCAe0+zD4WALA+SADIAPIADj/sARw/rwC7PpYApgIqP1w/sgAMPio/YQDQAZw/gz+nP8sAcQJUPs4/yADyACc/4AMOP84/w=="},"Platinum":{"n":252,"d0":2,"p0":90600,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":2,"p":"EA7oA0AGLAEAAIQD6AMk+iADTAQw+Bj8fPxgCQAATAR8/LT7IAOEA4QDvAK0+0AG1P5YAoQDXPmQAUT9OP94BcgA7Prg/OgD4PzQB0wEAABkAMD5BPcAAPj47Pp8/OD89AHg/CwBmAhE/YQDnP+QAQz+1P5sByT64PxkALT7IAMsAUwEfPyQAVD7qP2YCLwC6APg/ET9hAO0+3z8cP6o/Zz/tPvM9xj8hAPIAAAAGPywBFgCLAEgA/QB1P7U/vQBIANw/iwBIANE/Qz+yAAk+sQJvAIAAIj6fPxYApz/iPpYAlD7ZACQAUT9hAPIABj8yABw/gAAyAA4/xj8OP/IAAz+1P6o/egDsARQ+2wHAADU/kT9eAW8AuD8cP5YAtT+hAMgA8gAkAEIBwz+vAL0AQAAIANQ+3z8LAHoA4QD1P4M/pABRP28AtAH4Pyc/7wCeAW0+yAD1P6EA7T7XPkAAOD8AAAY/FD71P7s+sgAtPuQAST6nP+QARj8nP/IAGQAAADIAFgCvAJYAgAAvAIk+tT+1P7U/tT+vAJ8/LwCDP4sAZz/hAPIAET9nP/0AWQAWAKQAUT9OP/IAGQAyABMBFz5vAKc/ywBkAFYAiwB4PwAAHz8GPwY/FD7DP4M/sgAJPrIAMgA3AWwBOgDcP44/+gDZACQAQ=="},"Silver":{"n":252,"d0":2,"p0":1595,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEFAQE=","pw":1,"p":"LxHyBw4NDPEGEgzv+hn97vnwKBMfC9UgAA799yP6/Rb2/vcLABsH+gUAvQ/14ubnDf73N/rvCBv9CB8AE/38ChL4/BLSACUZ8uz96+8D5/P70vbd6QvwBwj5HQ0S9/wSE/UMDv4E7gYhBAQA5+rhDvb29/j4Bw3uDQwF3AHf7Abvwh0gDOgkCgb7GQftBirpFP757BfHGhQxAfT46yIN8wAE8wk68PYQHgj1Airc9hDw++/aF9UC/gb0+QTkAxXw/B4UAwUAFeLwBwX5BPEI5wEJDA4B7gkACvb5ABL5BQXy/A38Bf3u4PH3/O7s9wL6+R79CwcC/AQgGAw="}},"2018":{"Gold":{"n":253,"d0":1,"p0":131280,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"tACm/6QBWgB//p4CTP8ZBfID2/zwAAj9XQJb/ycBPAXPA7L9rf3y/hX/H/+GAer88wKx+S/59AE1AgIDhwD3COoBoPsY/JD8Av4cAvcDiv0j+3f8JgK7A3n/8wI6/aP9Lv+RAHECYP+2/r38aQBoAeIERgVdAuEAQPxN+fYEjwK2+W//IgHpAp0DRgD9/W0Bb/9oAYcA+fxB+7//W/+E/lz+b/8//ZsA/wB1/kYAwP4bA+gDZv7X+9r43v5b/3n/JQMKAOsA+AJC/6f+6gFN/j7+EP8sATEBWgDF/uEAev5CBPj9o/gf/8H9RfxYAgoAD/vd/4r9BQBl/8X+UQRI/qoASAOG/I7+/f1N/rgBg/8c+KP96QLMAf39cQIk/2j8IgHj/mMB/f0i/K4BVAHP/jsBf/4r/XL8pPw//dn+tQQXAhMBRfwJAegIs/w9/8IB/f2t/Zf/wAOd/hH+TP98AXUD0/9U/AQBaAEAAMwBi/xGAL//6P4e+7QA3wI9BGv+pQCK/Rz9nP++BeUGkQVh/i7/Kf9tAen99gR1/jIAhgHu/c37Gv8rAskEev5FARQAePtI/lD7SvyGAZMDCAIHA9P/WgCpAZ79wgFg/1/7LQWo/SQENAPK/h4A2wEwApEAov7i/+79+//KA+z/gAIEAW0B2QNnArgB"},"Palladium":{"n":253,"d0":1,"p0":107100,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"sATcBTj/AAC8AnD+XPmQAWgQXPlE/cgA9AHs+hj8TAS8Anz8RP18/Pj4gPNABnz8fPxo91z5MPikBmQAZAAcDCADmAgw+NT+1P6kBtAHAABQ+6z0rPRkALT7OP98/CADFAUY/PwIGPxw/rwCOP98/MgAqP2c/9T+nP+o/Uj0UPsAAAT36ANsB9AHAAD8COgDLAHECTwPKPHoA8jnvALU/hQFfPwk+gAAQAZ8/LwCLAEsASgKfPz4+FgCnP+c/3z8KAow+Bj8sAQAAJz/6AMAANAHwPn0AWwHcP7IALwCJPqEA3z8wPng/Bj8tPtw/pz/+PjoA8gA1P7IAOD8kAHIANT+pAaI+nz8LAEAAJz/zPe0+wz+UPs4//AKhANMBLT7nP8AACwB4PwM/jj/cP4M/uD8yAAsAXz81P7Y9dgOQAac/9T+yAC8AowKfPw8D9T+IAOU+EAGZABw/gAAGPyQAZAByABkAEwE/AjECaQG1P6QAcgAQAZMBMz3tPtw/pABZABYApgIGPxkABQFRP30ATj/RP1YAiAD+BH0ARD1rPRsB1z5iPqwBNAHCAewBFD7ZADU/hj8DP4AACgKgAxsB0j0yAAM/tT+4PyQAdAHNAiEA8gABBB4BRD1GPyEA9AH3AWEA1z5yAAUBWQATAQk+pT40AcgAwz+"},"Platinum":{"n":253,"d0":1,"p0":93700,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":2,"p":"vAKEA+gDkAEM/mQAFAVsBwAAcP7oAzj/FAVYAhD1YAlYAgAAtPu0+1gCRP1YAnz8yAAY/FD7OP+o/fQByACADFgCnP/g/OD8RP1YArAEfPwk+nz8UPu8AkT9AAC0+8gAvAIsASADUPsAACT6IANw/ugDOP9w/rwCJPqo/Tj/GPyI+mQAvALcBTj/DP68AtT+OP9ABlgClPh8/NT+kAGI+pz/nP9E/Tj/LAE4/+gDAAC8AkwEnP/M9+D8fPw4/6j9/AhkAJABkAGo/QAAWAI4/3z8cP70AfQBfPxYAsgA7PqwBDj/XPmo/fj4yABkALAEJPqc/3z8qP1w/jD4QAYsATj/CAck+pz/fPwAAJz/cP7M9zj/TASwBLwCkAEAAPj4kAHIAJAB7Pq8AiADyABE/WQAyABQ+4j6wPlE/WQAFAX0ARj8GPyQAfwIJPqc/7wCtPt8/HD+QAYsAbT7vAIAANwFLAFQ+1gCbAfIAEAGUPuQAXD+LAH4+MgATAT0AeD8AACo/fQBAAAsAUAG9AGc/9T+4Pyi/sIBDP6c/2QAOP9YAmQAOP+kBqQGkAEAALwCDP4Y/Bj8RP20+wAAIAMsAfQBcP5kAHD+kAEM/hj84Pzs+mQADP58/Kj9OP84/0T9vAIUBeD84PwgA5z/AADIAJz/kAGc/5z/"},"Silver":{"n":253,"d0":1,"p0":1706,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAwED","pw":1,"p":"BgEDAfQJ8wsU6Qz0+wD6FSH0+vz5/Pvm+PXdAgcS/RgC9PHyAw8G+u/0DQYLAvAA/QYK9/zt/AAbAQgD7e8Y+vD9Bw8ICfAKAiEZ9+7e/gD88fMKC/sE/xAQ9OnwDgD7GPv+EO31EvMC+xAU/QQKBRULwuf5/BL78f72+Pv7DPYEFeX++f0A/N/uCwsDBf7uDfoE/vf/C/UN9u3x6usFCgMC7QAc6/3/9OT4CvgC9wMH//wE/gQK/v4S+/QZ/Bb2AO/yBgIUDgL18wkCCAMA+/zq9wsl9/397vHu8vsQEAcI/grmDPbzDPwPEPr2CgULAQP2AgX/Dfj/JRgR"}},"2019":{"Gold":{"n":253,"d0":1,"p0":128720,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"SwDwAHMACP38/lYEKABaAE3+cwBeAYH8hf1dAg8A/f1AAQ0H3wLMAbsDUf8x/CwBv/9d/cIBTf7lAdP/2v3TBFMCMAJUBtL7APuyAmD/kv+c//L5NvcL/zcAVQACA+EAPAB5BGj8WQEOASwB6f2WBZT9OQNm/iwBkfvZ+UsAKv7RAef/8v40A9sBJwHx/678VPzU/gP9KADP/iMAlQFtAUEALAGx/vX7dP9lBIUCk/6CAAv/uQWCALH+Mfzh+0sAOP/DACsC8ADY/z/9owcDB8UDhwWS/xX/xv2t/XgFq/+BBnv4bwQp/1UPngKuBmoJGPc+/kcE9fYxAYAMJ/yr/0r8XPnzAs0KKvkpBPH/BvraB08GFPtO/SADUADW/EYAtgPSAJH2lQtcCLgBFArPA2ICZf/dCYP1wgak/Db8SgHU/qH/wP4zDt4DAv4O/MD+jgN7AnwBS/H0AQH6of+iA08BV/7t/iIBhP46AgQGSwAkBLT2vvup/Jr3AwfLByYCIf0p/1QB4AEn/GH+NwA8+74AMQFPAaz+qALk/SwGKAAy+/z+WQZZAb//NP67+UP+Q/l5/+b7TQOkATP/MP2KAjgEWP3wAF/7TP/XAB//iP9zAAoFIQKD/xkAm/tVAGgBmQJm/qgCZAAyAD7++gDBArICtwdaAH4E"},"Palladium":{"n":253,"d0":1,"p0":126300,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"OP8sAVwSfPx0DjD4vALs+kwEIANEFvAKgPNM69wFAAAc86wNGPz0AWAJGPzU/kAG9AE4//wIfPz0AUAGAAC8AmgQYAlABlTy0AcEEKQGeAUY/FD7IAOU+FD75AwE90T9EA5E/UwE9AFkAHQOLAH0ATD4QO2MCnjslN807+D8/AhUCzz21OWUEYQDRP3A+Zz/yACc/+D8/AgY/JgI0AcM/vgR2Nw4/2j3FAVc+VD7EPWEA8QJcP5w/kwEiPqo/XgFwPlw/vwIOP/IAPQB8Ark83z8vAJkALAE9AFIDegDKAqUEQAAQAawBFQLgPNgCUwEZABE/XgFQAYAACADkAGQAZABXPlw/uwT0O4sAeD8gPMUBbT7aPcUBaQGhANE/QAA3AX4+CT6rNt8/DQIcP7s+hQFDP5ABiwBUPtABiADVAsgAzz23AVw/gAAvALcBawNZACEA9wFDP6o/Qz+CAcQDugD6AN09VgCfPwMF0wEOP9ABqD2vAIQDqD2aPfAEoDzfPwE97gLxAmYCAz+xAlABowKJPogA6j91P58/BwMIAOkBiT6CAe0+/wIrPR8/NAHfPxw5ZT4eAVABmQAMPiEA5QROP9YAkAG0Ac4/1QLvAJkANAHOP9kACADhAMsAWwH8ApoEOD8VAvo6hj8FAVY6Qz+mAiEAxQF"},"Platinum":{"n":253,"d0":1,"p0":79600,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":2,"p":"ZACQAfAKDP6c/2QAnP9o9wAAnP/0AfQBUPsM/jj/ZABMBCADvAI4/8gAkAHU/mQADP4Y/Bj8cP44/8gARP2QAQgHvAJMBHD+6APQBzj/QAboA1D7XPng/Kj9DP6o/UT90Af0AQz+AACc/yADbAfoA7T74PzIAOgDcP60+2QAOP94BZgIKAosAUT97PoUBQz+GPyc/3D+AADoAzj/GPy8AlgCLAFc+ZT4fPxgCaj9JPrIAAz+yAAM/jj/aPdE/UT9OP8Y/FgCLAHs+nD+ZACQAWAJyADA+XD+cP6QAXgFDP5YApT4nP/IANwFGPz0AcgARP28ApABpAbIAHD+9AFw/pT4DP70AaQGqP3cBZAB4Px4BSAD4PwM/ggHbAf4+JABeAVE/Wj3RP28AiwBnP8sAVgC4PzoA8D5fPyo/egD6AMY/FgC6ANw/rAEwBJsB2QAAACADHgFmO+8Anz8ZADcBWQAOP/M91gCGPykBugDyADU/tj1ZABw/tDuRP1ABqj9fPxYAlgCLAGwBLT7ZABE/dT+ZADoAwz+vAJgCYQDAABQ+/QB9AFYApgI+Pjg/JABKPEY/Kj9cP5kAGQAWAIUBaQGAACc//j4WALIAHz8LAEAAFgCvAKU+CADRP2wBKQGNAg4/6j9OP8AANT+kAF8/BQF3AUsAQgH"},"Silver":{"n":253,"d0":1,"p0":1544,"dw":1,"d":"AQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAwMB","pw":1,"p":"ChEE9f4J/fr++gP26wAM+AgfEQUQ+uUN8v4H+Qr19AoJARrz/AnzA/vn2Pv//QUREAfjDQID9xb4B/f87Pb9/A35C/oM/vj29AEF/AHvBw39Afbs/RIK9f3zCgX+4fkCAQQH+fYCCBcBDAz77/wJABjnCwYm/AgD8v/9BPcO/fny/AcR8xIHFiodBwQLAPb7BgPQFBz3KxT++zLeEvPpCQnxCUQ/DPf8DVL4lAPuEQP74gAB9g0yEgHE0+XyDyIB7gwX/fEBBtYU/h71+P87+dkdCgcG883/uAfxFgnv+SD//gnhBgz2AfgNDOYH4Ab+FAcJBPr6CiIVFwAX"}},"2020":{"Gold":{"n":254,"d0":1,"p0":152055,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"fQqBC/X7YwZU8l8AmwDk/bcCSgGCABMB1P65AGv+DANwCH/+uPyYAy0AOP8D/ZT45wRjAT8Chf2h/zkDhwCLARYDUghVAB8JAROr9eX8ef8X+H/51/vfEQkBcw/w+4D4/gHn9Q7tYt9i8yUNHvZHCR38BClhCKv/bgBFAUT48PuU/XoIfQoYBsX+QQXXFJj+MAJa9sz8hf1lCboJ4v8Y/G38Lv8zBO7u+Qsc/QQB//v3A9EBmP53BjUHnQiL98gFQ/nd/zb8IPkXB+sAkwMhAif3pfs2ASX5Dgb3A5EFiwEP9gMHr/v/BWb+mgZbBHYHTfljAZ4CvgCGBu35GAHn/24AUQkeBWL95gAn/FYEKv5W/+QCCgXcCj8MfgQ+Eob83ggp/8oIUf+6/0wYvgXTBNDz1vKm5rr/wgabAJoVUPuS5uABvgVe90n97gepBooMmfhe8l4BaPz0/AwDaAbi/yT/TQh9AMr0SQev9iT1JPpp8YoHivhJDGQAvwQ9BF39BQVu9k8BOQjkAmQAffYl/nIGtACT/uwELv+P/Xz88v4z/zD4l/9HBB4FlvsJCysMtgPB34IAzPz8A6AFMP3M/ET4wAPA/ibuRfx2Alj95vF5CVsOuQDCAXb9Ygwq/gD2yf/E+mUJqQYkBLwCNvyVAZT9IQKHAG0BSwU="},"Palladium":{"n":254,"d0":1,"p0":195000,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"TAQ4GPQBOBi4CwAA1P64CzwPUEbIABRQNNbc7DgYwPlo3oDazBDo6rgLlPgMMNweDOVQ4lQLKPGwBAwXBBC4C7wbUF9c4IQDXPnM98wQsB2w65TfwMfA4AwXSPQc8ygKdNx8ymScZJx8yvQB9AFcK2zu5D6sWGxSwCuoy6Qf1P7Y9ejqeNNYG0j00AeIE5z/wPkc8yT6SPSwuQz+KCNM6xjjlBHkDADndPXM3mDwoA+sDdwFSPQ89twFHCW8GxQeSPRY6QT3IAM89pT4eAVsBzj/OP889sQJCAc078gACAc07wAZjPGQAbjybAewBOgDqOSg9lQLPA80CEj09AHoAywByAC4C3z8dA4AAET9AABYApQRfBWMClwSzPecMWwHtPu8t4QDTAQM/hgVyBnw8VgCGPx47NwF9AHwCnQOaPcE9+gDGPxw/pz/bAdw/lQkMPgEELT7pAawBCDqrA0UBdAH9AH4ERj8lPhkAMDgVPJE/UwEfPzYDjARFAW0+5AB5AywBCADaBCgD7jyFOz4+AAAOP/0AYgTkAEE9/j4yAC48rjZRP0gA6QGsAQUHuwTUBSgD/j4CNUM/gz+JProA6D2bAcAAJz/LAEoCowKeAVw/ggHGPw45oj6iPqo/TD4PA/U/mQAIAP8CMz3wPmo/fwI4PxoEBD18Ao="},"Platinum":{"n":254,"d0":1,"p0":98100,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"vAI4/zD4nP+0+2wHDP4AALgLrA1c+YQDlPhE/fQBAAC0+3z8IAPM9ywBaPfwCnz89AFE/WQADP5kAJz/vAJw/rAE2A5o9+z6fPxE/VTyJPqM8aj91P5YAhj8kAHIAPQByABo97zpoN3g40wEbO40CBj81Bd8FXD+3AWg9sgAAACQAeD8FAUUBUT9OP+ADLAEeAWU+FgC+PhE/egDAACc/wAA3AU4//j4ZAAM/pz/OP94BQAARP30AYQDaBAY/DARRP2I+iADqP30AZABcP7oA/j49AHIANT+fPxABoj6nP+U+MQJiPpkAFD7kAFABmQAlPgM/ugDOP/cBdT+GPy8AiwBCAcIB8D5cP4k+ugDqP04/6QG6AMoCogTtPtgCST6bAeM8QAAOP+kBrgLYAnU/jj/MPiI+sgA9AHoA6QGMPjM95T4eAVw/gAATATU/tAHiPoE9+D8ZAAsAcgAsAS8AugDxAlABkj04Pz4+MTwgPMk+ggHcP40CDj/jAoM/uz6IAM89sgAFAWEA1z59AHM9yADhANc+TQIQAYAAJz/+PhkAOD8GPzIAHgFUPvwChQFLAGs9LAEiPqkBqQGbAcgA1gCTASc/+z6jAqc/wz+9AFsB5gICAcoCjD4qP2QAcD5sASo/VgCKArIAFD7aPdQ++gDvALQBzQIFAU="},"Silver":{"n":254,"d0":1,"p0":1793,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBAwEBAQQBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQ==","pw":2,"p":"HAAXAOL/HADN/wAABwDr/wgAEAAFAP//+f/r/+//FwAvAOD/zf8aABAA9P/8//X/DwAAAAIA9//y/wgABgAKAAkALQAFABEAFQDU/+b//v+p/+X/9v8sAPv/HADF/xIA+//O/7X/5/7M//7/1/8+APT/bwAiAC0A9v/m//T/CQAQABUAEAA0AP//DAAhAAYA+f/e////7v/6/ycAAQD2//n/AgASAM//CADu/yAA9/8vAAMACAD9/0gAbgDp/yMA5f/s/x4A9f8PABkAOQALANf/9f/v/wUAAAAIABEA5v/L/yAABgAOAPf/IgD7/wUA3/8eAAgA+f8mAOP/CQAXAOn/LgAkAPn/IADs/ywA+P/3/xwAbwCqAD0A2v++AK3/TwCK/1sAEAAKAAYBXgAsAPr/AQAJ/ywALQAVAI0AqP/L//r/BADZ//X/VgAKAJoAif+w//j/AQDx//L/OQDp/wEAQgDv/8H/HwC6/zL/uf93/ykAGgBfAPX/9f8YAAUAJwCz/ysAJABKAPP/tf/n/ysAMADr/ycA9f/x/9D/DwDO/6X/PAAkABMA7f87AHkAvf+l/wEAAAAEAAIAJADh/97/EgDn/7X/GQD7/+r/nf+LACwAEwAGAND/SQDZ/+z/+f8EACMAXAA9AAgAIgDZ/9P/LgAlAA8AEgA="}},"2021":{"Gold":{"n":253,"d0":3,"p0":193080,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"JwYpBPntSfgC730FT/xB+1AFOviTA34EGQWD+sgAEP9Y/V39GQX+AdL7KPv19tT+NgGiDcr+Uf++9sn/WAJ88qP9d/zJCS4EH/8V+nT16fjL+G//XPmI+mD/SANhA7UJTvNlCbgB0QHj/jYBhP5JAvj9G/55/3r+W/WR++oL8AXvAQIDqQGA/b/68AXWATUHkwgO9xMGzAHd/8v9fQB1+RoEt/1PBk795gWvClUFLAGd/nb4gAfXBWcHHP2nAz4DsP9TAmYIY/z8/vUFZPuJ/iz34gToA2D/s/zjA2zzmgHB/fHrYPoi/LH+fAHy/jEBfPwv/mT7VAa2A+kClQad/lgCU/3T/+oBCAJnBxj8rfi1BFT8rvw1Av4BtPvXAN8HcAPq99cAEwGD/2n7XelV+8IBYQjXABIHJget/QoA8/2LAUUGx/y++5IEWAfY/30Ayv6cBOL6APv8/scBS/tQAPsENfgB+oH8ogN6A1L+yvmo/Ur8yADS+6EJif5nAjH8BgSX/xH+jwJDA5oL3vmU+J8Gg//LArwCsgIOAfP4mwVC/zH87wE7/In+5gWwCYACNwBmDWP8ZAVNA5z6zQBaABL45O52/fH/ewc4+gQByPuq+yT/BwNg//cDgP2C++cELv/x+icGuwgO/GX/rf0dBmL4BgQiASUI"},"Palladium":{"n":252,"d0":3,"p0":241900,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEGAQE=","pw":2,"p":"KPGkH4DzaPdA7ZgIhAOo/bwCwPkgA4j6pAag9vQBNO9E/Vz5VAuw67T7BPcUBdQXuAssAZz/bAdc+ewTGPwE9/QBoPYcDCwB+PhwF0DtVPKo/bAEfPzU/qj9wPnA+bgLIAN0DngFdCeoLwz+jArc7GgQsAQM/nz8DOW8GywBMBEI7oj6sASwBJwY7PoQDkAGWBvY9aj9cBd4BRAOqBZc+QAAGBWQAegDsOvA+WAJmAjw8SThqBZc+YwKpO2U+Ej0uPKc5iQTJPrUF9gOBPcsAez6hAMQ9ZT4gPNYAnD+7PqEA5ABJK947FgbNAjcBbgLDP5UC/QBYCIIB0AGMBGo/Tj/wPkk+tgOiPrA+YDadNzM95wYyACgD4DzeOyI+nQOyABABngFdPXoA0T9uPKU+BAODP7Y9bwCdPW04gzM1OWEAxgucP509RQFABkM/lTyEPXoA0j0xPAo2MTwiOHA4NjcABkUBSDqlN8EEOAuDOXM9+TzCO60+ywBIAMIB6D2IAO4JIhFhOoo8awmYPDE1zAR3AUQ9UzrpAbIANzsDP5sB8z3OBis9LgLJPqQASwaPN1oEDD4qBYoI6D21P7k85DoQNRE5Az+kOjY9Rzz4Pyo/ZAadPVsIJT4AABY6QT3UOIk4VAUlCoI7vwh0AfsE9AgFAV47A=="},"Platinum":{"n":252,"d0":3,"p0":110100,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEGAQE=","pw":2,"p":"EPXkDET99AEs6DQITARIDYj6wPk0CHD+xAkw+PQBlPgAAEj0uAtUC4j64PwY/FQLEA7kDOQM2A7Y9UQWmAiI4TwPkAFkAAT3eAUY/NDu1P5o95gIsOtU8iADzBA4/3wVeOwwEbT7kAE4/xj82PVkAEwEXPmo/UwEvAIM/twFpAaADHz8wPl09ST6hANMBPQB/Aj4+Oz63AWwBDQI9AEk+rT7qP1UC3z8WALcBdwFXPns+qD2pAYsAVgCzPe0+1D7rPQIB9AHUPvg/PQBAAAAALjysAQsAbT7wPncBeD86ANE/YzxuPJg8NAHKAoM/mwHWAKs9AT3uAvoAyADIANc+cD5kAF4BfwIcP64C+D8eOzg/NT+9AG8AnT1RP2QAdAHMPhw/mQAfPx09cD52PUUBXgFsAT0AeD8sAT4+FTyvAI8Dzj/JPrg/Dj/0AeQAYj69AFgCST67Pr4+JABHPPIAMz3vAK8Asz31P6UEaAPdPUsAXz8GPx8/FgCfPz0Aez6PA9YAmgQMPhkAAgHYAng/FgCtPu8ArAElPhYArjyAAAAAAgHYAns+gAAiPpYApgIcP5UC4j6vAJUC8TwnP/A+VD7jPFc+egDaPcAADz2WAJQ+ywBGPyYCLwCJPqo/QAAiPpc+QgH9AEY/GwHcP5IDTj/cP4M/g=="},"Silver":{"n":253,"d0":3,"p0":2727,"dw":1,"d":"AQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"GAABANn/z/9e/zIA7v/3/wAA2f8sAAAAOADK/yAA6P/q/wIA3QDaAB3/zP/Y/w0AQQAuANf/9f/7/zIAAADS/wUA6/8yADMA6/8SAIP/FQDB/yEAwP/F/+z/OwD1/z0As/8+AP7/6f8cAAUA1P/0/9b/y/8mAOr/z//e/yAASAD6/yMA9v/5/+v/JgAaADcA/f/p/wMAJwDu////EgDW/yoA1/9eAMz/KwBBACMA5//5/8X/KQAmAFcAsP8GAAYA8P/3/zkA0v/9/zoA0v8AANn/FgANAPP/CAAwANf/9f8JAJD/7P/U/wIA/v8EAA4A/P/y/+7/MQD3/yYABgDq/+T/9v/4/xIABgADAPf/sf/p/wIA/P8JABQA5//h/0EABAD4/wUAFQDq/9H/jv/T/wIAAAD+/w8AJADp/9//8v8XACEA///5//n/LADz/xgA9f9BANP/BwDu//T/1P8CABgA2//S/8L/EAASAAEA+P/1/93/DACw/zkAFgARAO7/JwDy//3/DAAZAC0A9v/+/zMAFgAcAAgABwD6/9v/DAD6//H/AADk/w8ACQAuAAoA7P9QAP3/GgAGAOn/+f/u//b/qf/g/xMA+v/Y/9v/AADR//z///8JAAAA7v/c/yEA+//b/yYALgDe/y0A9/8QAPD/EgD5/yAA"}},"2022":{"Gold":{"n":250,"d0":3,"p0":180905,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"sQO1+gX7QwPRAWAEWALx/yT/Y/yeAoAHC/+QAfz+uwNm9B72KAA2Bj7+rwA4BKz+2QPGAqQBo/2LC7r/uv+PDCgAUgPT/0YAYRwM6ov8swYrAqwDSAOpFQcD9wNi+JT9V/Qr8xj82Qiu/O/8rgEYAV8FMwRr9MX5owJ2Ap0Dj/3rANP//P7gAQUK3/1RCS/+FwLo9GD/df7m9gb6K/2Z/fEJhek4BFoKvvue+MX+5vuc/6H10PixCEX8wQIbCAgHxv0tAJL6ZAVW/+P+WvaECCr+mwBaALL97ARi887/SAMmB5/8Kv5o/JoBFv6DBK/7FfqvAP34dAT3/kHx8PaA/SMAz/7f/QX7sPo+CNL74v/O9QUPtwJG+5oB2QjOBBEDZwKK/WoEdQOv+9IFIgGE/oP/RP3u/Qb/2/wK+yb4mQLnBBAE+vvu+JD3gP1aAPkBNwAX/fAFngLT/zcA6/Y4+lr2aAGPAvz+8Ptb+mD6YPoYCzcKVfvjEiwBgQE+/rfzyvkvA5oBs/cdAcH9ffsS/Z/8hAii/usKEv2D+vD7WgWGAQTy/womDHL8aw0yABYXHP3vBioDt/gUADL23wKb+54HVv+nAw39rgHLB0MIgP3M92r/JAQfBBD/3/0BCWfzpAFjBtkDywKqAAz5DQITAbcC"},"Palladium":{"n":250,"d0":3,"p0":186900,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":4,"p":"aBAAACzo//+gDwAAwBIAAAT3//84////PPb//wz+//+8AgAAUPv//9wFAABgOwAAVAsAALgLAABYGwAAWBsAABguAABo3v//eDcAABzz//98/P//7Pr//2j3//+s2///fPz//4QDAABoEAAA3Oz//ywaAACg9v//GPz//zARAAA4////MBEAAGwHAABI9P//3GkAAGjF//80CAAA6BwAAJghAACsJgAABBAAABDWAADYkf//xPD//1zg//80CAAAlGL//5zN///0GgAAuPL///gqAABg8P//eAUAANAHAACo5P//DP7///yk///A+f//XOD//zARAAC8GwAAiBMAAKD2//947P//jPH//2gQAACQZQAAnLT//8wQAADIAAAAEA4AAMD5//8UHgAAtOL//wTe//9Ey///TAQAALwbAAC0FAAAGOP//0QWAAC48v//KNj//4jh//80CAAA/O///9Tl///06P//IAMAAAggAABAHwAAmNb///AKAAAM/v//nP///1z5//+c////rA0AAFAUAAC0+///WOn//zj///8AAAAAKPH//+Tz///M9///PPb//+Dj///oAwAAgAwAAEAGAADc7P//2A4AAPQBAACo/f//TAQAADARAADk8///WAIAAAggAAAY4///wBIAAPDx//9UCwAAMPj//7wbAAA0OgAA1P7//yTI///Q7v//ZOf//+D8//8k+v//UPv//+gDAACMCgAASCYAADQIAAC8AgAAOBgAAAgHAAB8FQAA8AoAAEzS//+0+///aBAAACQTAAAMFwAAOP///6gWAABw/v//AOf//2Tn///8CAAA9AEAAFD7//8A5///AOf//+Tz//98FQAAHCUAACwBAACk7f//fPz///Dx//+U+P//IAMAAIzx//8kEwAArCYAABwMAAAIBwAASNv//0gNAAB47P//QB8AAHgFAAAc8///BPf///zv//8o8f//eAUAAGwgAACkHwAAjPH//1gbAAAYFQAAZOf//4QDAACI4f//ZAAAABzz//9Q+///PPb//4zY///U/v//OP///9j1///4EQAAqP3///To//84////eAUAAEDt///4+P//lPj//xQFAACo5P//GPz//1gbAACA8///LBoAADDf//+0RgAAXPn//6gWAAAcDAAAeOz//6jk//8c2v//TAQAAET9//+wBAAASPT///QBAAAw+P//gAwAAEwEAAC8AgAACAcAABTs//+U+P//IAMAAIQcAAAAAAAAVPL//6wNAAAg6v//tOL//9Tl///Q7v//0AcAAEAGAACc5v//ODEAAHz8//8UBQAA"},"Platinum":{"n":250,"d0":3,"p0":96300,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"bAck+rwC7PrA+fAKnP+8AuD8DP7ECRgVZAAY/CT6jAqI+hD1hAOYCMgAfPw4/4j6OP9gCeD8ZAA4/3D+hAOIE+gDUPssAXD+oA8A5yADcP70AcQJ1P6cGAAAuPLE8Bj8zPc89uD8eAWEA6j9ZACo/Yj6TARI9ET9AABkACwBLAGo/Vz5+PjcBbgL5PM0CGQAdA5s7vQBBPdU8tT+UPtsBywBIAN0DoQDdPUY/FQLIAO0+5T4+PjoA7AE5POADCADfPxQ+wz+hANYAvQBsATgFVz5cP6g9lD7EPV8/GQADP6kBuD8kAEk+kT94Pyc/2QAhAMY/Kz0AABQ+7T71P6wBBQFEPUY/Bj89AHECSADkAGg9owKRP3oA6j9pAbIAOgDyAAY/CwB5Axw/ugDGPwoCmQAwPns+iwB4Pz4+Dz2nP8sAcgADP7A+Vz54Pxw/lgCIAOEA3gFbAcAAAgH7PqwBFz55AxYAjD4dPWg9mQAzPfcBZgIUPuUEXgFcP7oA+TzfPyQAXz8bAdYAiAD2PVE/fwICAdE/dwFQAac/1z5FAVMBLjysATYDlgCYAkY/JwYgPOQAUT9+PiI+mj3uAtkAKj94PxYAngFIANgCVgCaPc89rT7YAmo/WwHwPlIDRD1+PjoA9T+AABYAhj8xAmo/ewT"},"Silver":{"n":250,"d0":3,"p0":2289,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQUBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBQEB","pw":2,"p":"EACw////FQAOABAAMgDx//j/9f9WAC4ACQDn/9f/FAC7/73/AAAmAPb/1v8OACQAAAAnAAsA0f9QANj/FQAJABIA/P8cAAoAeQCR/w4AHQArABgA8P87ACYABgDp/+P/5P+2/x8AJwD1/+3/BQD5/x4AHgC5/+X/CwAHAPP//f8CANf/CwAYACsA+/9AAAIAGQC5/8j/4v+u/xkA8//Q/x0Arv/8/yAA1f/C/wAA+f+v//L/IQA9APT/9v8vAAYA8P/2/wYAJgDp/+X/8P9AAPD/7/8BAN7//f/f/xcA/f8pAO7/AQDn/+j/4P88AOn/5//H/7z/DQD+/8L/FQDp/wEA3f8JAO3/4v8qAAIA9P/N/zYA+v/r/xcANwBLACIA+f/W/yMA6/8OACgA7/8LAOX/BgDr/+v/9//F/97/CgABACAA9f/N/7X/7v8OACAAEADq/y0ADwAsAEgA1f/z/9v/IAATAAgAxf/c/wQA1f8qACMAJwCYAM7/CwAIALD/1f/r/wAA1//u/wsA5f8kANj/UgDf/0cA6v/y//n/VADq/6r/aABHAAgAOQDp/ycA//8vAAEAqP8CANP/PwAAAB0A6v8OAPT/FAA6AC8AJQDU//H/HwApABwAAAAWANP/3/8pADIADwDw/wAADQAAAAkA"}},"2023":{"Gold":{"n":251,"d0":2,"p0":183505,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBBAEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"yggm/dn5Wg+MAIkDjf8vCFEECfyUAmv+TQhl/6ID1/skBMz8av+V9/gHcgt27r7xHgC3AocA+PjQ/cgAN/a5AAD7sge0+xkAdv3j/h/6cwAaCVH/ZAVnAp/8ZvSfAdEGaxKPB8cBPAV+BPETwPmW9vINRAf68fD7QAbhAC4E3vl7B6UPB/7Z+eQCHAdXA+f15vvw9gMH5fwFAJUBdQN0/yn6TP8QDnsHHQHO+pABf/6K+GED5P2R9pD8jPsdBpX3swZW+pD8cP62A+f/sQj28JQHcwDU+V4GPADx/0b7Q/mBCzH8zv+8+Cb9pPxgBGz9fvq8/c7//ANABm//bfyi/qwDWwTT/1EJyv5v/7ICVAZPARb5XwBb/3oDQAE39hwCeAA//QD73v4iAS7/gP3C/DP/Of5U/A4B+/ok/1v/lwQOAU8G4/41As0FSQIKAB////u9/Jj+OgJpAP78Xf3G/ckEAgNcAxv+Xf0YAZP+//t1+Z/3Bv958J3+B/7O/6v/4AvkAgYEWwRJAs0KcAP4B+AB4w27/rX6EwFSCH/+VwORABr6pAG0AHT/dvj+/Mn6ngLA+Y4DfQpO/QUKtvniBG8EJv0EAXIG5gA4CRkAngLACALvM/+mBLb+I/EH/un9hxS7AyL3+QELBDP/UghiAkoG/Pk="},"Palladium":{"n":251,"d0":2,"p0":180400,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBBAEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"+N9sICzomCGk7fQBRP2wBCjxwPkUBdzsgAwM/uz6sASk7Yj6KPF09awN5AwIBxzaRP2YIaj9IOqc5hQF+N9Q+6QGmAjU/rwCuPIQ9YDzNAh8/LwChAMY/JABxPAQ9WQAbAeQGjQIzPeI+ozx3AUQ9TgYuPJo9+gD3AU0CPgRoPbU/iwB/O8IB1gCTAT8COgDODHIAJT44PzU/qDdsAT0Aaz05PME99T+CAf8IawNOP/IAPzvcP4o8Tz2IAMwEXjsPPYo8RwMyABg8MgAnP+MClz5hAPw8Uj08PHwCmwH3AV4BdAHfPwU7MD5FOxYAvAKhOrA+Wj3yABgCST6YAmA87AE1P7wCtgOBPeI+tgO0Af4+AT3yADoAxj8zPdI9IQDKAqM8Tj/NAjQB9Du7PowEfgR9AGk7TD4rPSwBGwHTARABjj/5PMgA+D81P4Y/IQD+PhQ+0T9/AgY/LwCQAaMCmQA4Pyc/8QJoPakBqz0+PgUBbT7lBEQ9VTy/O/IAAT33AUw+GgQXPlo9yADlPhMBGDwsASg9uQM4PxYAhQFyAAY/Kj9iPqEAxQFYPBE5IQD1OWwBHgFPA+kBgAACAfQBwAAdPUsAUAGDP4w+BzzZABI9Bj85PMgAygKjPEcDJABlBG0LaAPIAN4BZABbAdI9ITqlPg="},"Platinum":{"n":251,"d0":2,"p0":108600,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBBAEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"vAK0+7jyiBOI+rAEaPeo/UT9cP5Q+8D5vAKEA/QBnP/4+Pj4DP4Y/IQDIAMUBbDrcP4IB3z82PXA+dwFdPW0+1gCZAC8AqQGWALs+mj3NAgoCkT9FAWc/5ABgPOc/zj/VAuYCMD5OP9MBFD70AdE/SwBGPy0+2QAcP4UBegDZACQAUgN+PgAAKj9NAhgCcgAQAY4//wIhAOwBNj1NAjU/uTzwPlsB8z3qP1UCxwMZAAM/vDxvAI4/9T+RP1ABuz6JPr4+GQA9AFc+VD7TAQY/NAHQAbA+ez6DP4k+rT7JPooChj8tPsk+oj6JPpYAgz+JPosAWj3LAFgCXD+ZAC0+5ABYAlkAGAJWAKQAUAGZADs+iT6kAHoAwz+9AGM8UT9FAXs+nz8DP6wBFD77Pqc/9wFnP/4+NT+cP6EA4QDTARYAvQBhAPwCtwFDP44/1z5iPqg9uz6DP5kADj/kAEM/kAGQAZYAlgCPPZ4Bez6UPvU/iT6jApQ+wT3UPvU/nz8VAssAXD+WAJo93gF6AMUBdj1NAio/XD+fPz8CMgAIAPQB1D79AEAAMgAgPPA+ZT4GPzU/pgIpAYUBZz/AADQB3gF7PrU/twFUPt4BUT9WAJ8/Oz6iPo4/zQIZAAAAOgD3AUIB4j6cP4gA4QDvAJ4BUAGWAI="},"Silver":{"n":251,"d0":2,"p0":2430,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQUBAQEDAQEBAQMBAQEBBAEBAQQBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQUBAQ==","pw":2,"p":"//+o/wQAKADf/yMA7//+/zEA+f8IALf/KgDt/wMA5P8cAAIA9//A/zIAXQCi/5H/7v8ZAAEA3f/z/+X/6P8KANz/MgAGAAkA3v/V/9z/6/8wAOz/HQAAAO7/sP8BAP3/ZAA3AC0A+P/0/z0A/P/0/zgAGwDk/xAAFAAuABIABAAJAEgAEwAMAAkAMAAoAMH/4v/e/0EA6P/z//L//P8dANv/AAAwACUAFgDl//v/wf+Z/wMA9v/1//D/DgATALv/GQDX/w4ACwAAABgAKADX/xAA+/8IAEEA9f/+/9v/1/86APz/7v+6/9P/5P8uAAQA6f8WANz/HgAXAO3/JADS/yEACgACAG4AMwAEAAgADQAQANP/8v/8/wwAIgCy/w0AEAD1/6r/9v/6/93/3v8KAPX/BADg/x0AAAAJAAkAMwAkACsAAAAEACgA+P8KAMT/z//5/9H/AAAKAOv/AQDl/yoADgANAPr//f8pAPf/yv/p/+j/NABv/8f/BgACAP7/NgAGACQABwD6/zMACQA1AOD/IAD9/9T/BwAQAOr/KAAFAMv/JQDY/zkAvf/2/wsA+//V/xwAagAaACEAw/8OAB8A7v8EAGkA9v8fAAYADgAAAKf/7v/u//T/qf8DAOr/fgAUAOb//v8GABUAHADW/xUA0v8="}},"2024":{"Gold":{"n":254,"d0":1,"p0":207490,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"2/cM/pH7Nvz3A0L/SP4CA5YFfvo8+wH6wgbQ/ScBbQEt+ycBcQKxA24A3f+BBmb0NwAvA4EB5P3X+wgCLPJiAlID1wWFAsgA0gB4+zEGVQDN+/MC1gbVDNYQbgCGC5wE1AMz/+35fwM3AB/6nP+m/10WqO7SAM4JdP/XBXsWbAJ/CGv+7RKqCjn5GvqhGGPtiQirCZL6wwAN+EbnhwU3BW8JPPsY97r1tQQ3AG4Fe/0PAFsY/fPGAogJoQRC/3QYVvXo/oPrY/fvAYT+sf4XAuT4RAKvACwLE/c98OUB2ASRADcAfAGf/HcGswEhDKDxCAKi+dX9qQYUAHgASwW5BS8DdgJj/BoEKQQMCLMBDQwcDKz+Bexg+jEBrQJb8EoB2wbZ/uULoAXXCmDwCP2u91kBmwpJBzUHeQTZ+U4Czg5mCJL6Af8g/ugDtf/uAsYCWfd9AMD0kBBVAMf3OgKjB+n9aBVKBlX7Nf2xCDEGOARqBN0J5gW9/PD7fv9xAqr7RgWy/Uv7aPfi/7wHkwjB/TcKof/zDN4Itf/RBrT75fdbBFMHmA05/nvzqP38/hn75egXB0f61OBsBw7oIQckCekRc/u8EUcO//FW8OoGYP/+Bm/1KgO2/sYCD/uPB7QFjApPBsvupPxx+KMCb/UV+qAFWP2cBAv6NwA="},"Palladium":{"n":254,"d0":1,"p0":111200,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"8PGo/TTvwPmU+JABeAUk+oj6EPWg9vQB3AV09QgHxAng/Gj3eAUEEET9fPw4//zv0AeI+oTqAADA+VwSKPFsICT6jAoY/EwEDP7g/OgDOP947PwIWAJsB+z6TAQAGQgHcP6I+uQMWAK4C9j1cOWI+mAJyADg/CwBMPhYApgIMPjcBZz/LAGIEzQIuPJABjz2PPboA+gDlPg4/5T4jAok+tj1dPU4/yT6hANE/UgN4PxQ+6wNAABc+RwMLAEE9xAO9AEM/ijxfPwgA3z8aPeQAaTthAOkBvQBMPgAADz2OP9YApABRP3g/PwIZADkDOAVfPwc8xD1rA2YCGQAXBK0+xQFHPMUBYDz9AG0++D8BPeADPj4jPFw/hj8/Ajs+rT7OP+c/1gCsATg/NDu7Pq4C4QDEA5YAvj4VAsY/CwBAABw/kT9mAj4+GgQiPrs+qwNiPoAAIzxFAUM/vj4SA2kBhwMPA/wChQFxAl09Tj//O/8CGj3/AgQ9aD2iProA+z66AN4BZT4pAYoCvAKUPv87wAA9AE8D3gFDP6c/wAZ4PxAH2AJvOlg8CT6UPvM90j0aPd09TD4MPgk+nT12A68AqwNbAec/5z/+Pho98gAyABYAvj4NAgQ9aQGtPuEA+D8tPsIB+z6RP34+Bj8iPrg/OgDHAwc8+D81P4="},"Platinum":{"n":254,"d0":1,"p0":99500,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"wPlE/cz3LAFw/lD7UPtw/gz+UPvs+sgAbAdc+YQDWAIY/NT+eAUIB9T+tPssAaD29AHU/uz6ZAAY/PwIXPnQB3z8CAfU/gz+GPw4/ywBcP5E/fQBUPsIB5z/cP6MCrwC9AH0ASwBZADIACT6MPhE/bAEAADU/sgAtPsAAEAG6AMIB1z5eAUEECwBUPvwCkj0nP98/CT6nP+I+iT6vALg/CADLAGkBtT+CAd4BcD5QAZABkwEkAFYAmgQbAfg/GAJ3OxsBzz24PxUC7wCXPkY/MgAoPao/XD+AAA89lD7cP6o/ZABnP9sB7AEnP+8AkAGDP7U/iADnP9Q++D8bAeEA9T+kAG0++z6DP6wBMgAfPyMChj8YPAM/lD76AMk+hj8sARMBOgDOP8gA9Du7PrIAPQBhAMgA3D+LAEAANwFOP8UBRj8WAJE/YQD+Phw/iwBiPpE/TD4YAmQAVgCWAKc/3gFgAwgA4j6nP/oA9T+gPMUBUAGNAgsAZT4qP1MBNT+sAT4+Mz3tPssAQgHTATU/hQFyACwBLwC9AEUBcgAHPN4BYAM7PqA8xj8kAFw/uD8RP28Ahj8PPY4/1z53AUgAyADZAB8/FgCGPyU+Dj/WAIgA9T+FAW0+5ABUPt4BbT7qP1MBIj6DP70AZABqP2o/QgHyADU/vj4RP0="},"Silver":{"n":254,"d0":1,"p0":2395,"dw":1,"d":"AQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEFAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQQBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQMDAQ==","pw":2,"p":"vf/g/wIA8v8cAPD/BwACABAA8P/n/+3/EwDE/wYAMwALAAMACQAHAAIA1v84ALf/7P///wYAHwAZAPz/sv81ACcACAD9/wEAAADc/+z/EADf/wAAJgAmAFMA8/8kACIA8v8CAPj/QwAZAPz/5//5/zkArP8HABAA4v8CAG8APABLAOr/aAAOAAsA+/9kAMb/7f8WAAAA6f/N/67/FQAYABoA6P+4/+7/5/8bAEwA/f8nAGYAzP8fACcAVQABANQA8P8SAID/BQBgAC4Az//n/6b/vf/3/0UA/f/F/9X/DQDy//3/AgD2/yMASwAUAKn/AAC4/wMAMgD0/wYAUgAVABgAKQAGAPT/CQDi/wIADAAFANT/eP/8//7/GAB+/+j/JwDm/0QAIAAHAEj//P8IAOr/QAAnAOb/GQAKAAkARQBeAOv/AQDy/y8A0f8GAP7/q//i/+j/QAAMALn/HgAnAPv/dwBfAOn/9/85ABAAu/8ZAGAAQADH/6z/HQADAAsAOADu/8T/xP///zUABQD3/0AAAQAfALwAKgAJANr/nv8XAE0A9P/U/7H/BADt/6v/u/8sAOn/pf8yAKT/QwAIADcA1v8UABIA0v/n//v/1v8/AOf/LgD5/zIA6f80ABsA7P8SAI3/+f/d/wUAqf+7/1EA8/8QAO7/yf8="}},"2025":{"Gold":{"n":253,"d0":1,"p0":264460,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"ygM29+wEiQMKBR4FIwDE+uQHJQgV//AAbgUjD/H6UQl1/tz2IgZTBzcFCQFxB6wXFPsNAl4LagTS9lINDAhv8CkE4w1hA+H2QgSRAN70cvcv9K0C7xBiArv5lQaY+W8EDwAhDJAVjv77Cc4E9Pz+AZf/hvwyAKkLTgd0E2oEQ/5uADfxiOZA92gQMxjWKbICngIZHssH6zJn0Ez/nvPq9y4OB/Qh6ZIOpixg/3fyf/k32E4M9fa46B4PVAvE/wwcTf50CZXyHgpN77kFIxQeBeoBygh19A/x2QMVBLsIVxfe/qXxUAC++wb6EQMC7yIB9Abt6nz8vhkv/n4Eovku9VkGpPLYDugDvgpr/ib4Dvy2CEwE/AhnETTlKfq4/Nj6ngJG9lr7DxmkAcn/LQVDCMTw4fuqBen9LfuaAeH71/vdBJb7YhGEAzsGxQPyF5gDAhf/AJMDLhgIEf784/S0CjX9WBb29RMBTPrEGDsaDfjj+ZP+ChmK/RMfpPxw+b0f8wdNHEkCYe91HHociRJmDQYsmt67CGC0RBEb6mXwUtGmLB7xeAqP+G//H/VpD9IA0BtmFzT5nCxy44jhie8wGzbt9/QlDUwYFAo9/xwC/iRI5fAFdP+XCTr4RgC/+qcIYykIBxPoFA+jAlMCrx6XHZf///ZS5Srg"},"Palladium":{"n":253,"d0":1,"p0":91000,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"bAcM/lgCnP+c/2wHRP2EA2QA6AMw+FgCGPyADAgH3AXY9Rj84PzECYQDNAgsAZT44PwsAYj6OP+c/3gFQAaU+Jz/WAJw/lz54PzM95z/UPsY/EAGeAVMBAT3CAeQAQz+LAEM/ggHIAOQAcD5iPrU/kAG1P5w/ngFsAQ4/0wEOP8E94zxRP04/3z86AMAAKQG3AWkBsD54Pw4/zj/ZABYApz/UPvoAwAAIAPECfj4/Ai0+wT3TAR8/FgCTAS8AsQJCAdQ+9j1ZAAY/Dj/WALcBWwHIAPIAAwXMPhgCWj3nP+I+vj4jAow+NAH3AUsAeD8BBDECWwH8PFE/aAPUPug9rwC8PEcDMAShBxg8JAB/AhsIEj0UPvQB+z66OrQB+gDTASA84DzQAZc+Vz5BPfs+nD+0Ad09VgCWAIw+JABUPtQ+wgHPPYsASwBLAFABvQBFAX0AcD5kAHcBVgC2A5ABlgC7PrQ7tT+kAGwBNgOjArIAHgFEA6w6xAOkAHg/IQDJBO8GwgguPJsB1QLWBtE/bAEmNb4+PDxTB3g40AGZOd8FfwIhANABtzsiPocDPDxeAWgDwAAPA/U5fDx/AikBvj4mO8gA6QGCAeYCMgAdA5s7qwNqP3cBYQDOP8oCvj4dA5YAvgRyBk8D7gLDBc8D5gIwMdY6SDq"},"Platinum":{"n":253,"d0":1,"p0":91100,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"/AgUBTj/6AOQAYQD4Pw4/yT6kAGo/Tj/OP+wBNT+WAJE/cgAOP8IB3gFfPxkAEwE6AMgA1D7ZACc/wgHkAEE95ABDP5w/hj8OP8AAFgCcP6g9lgCIAN4BXz8TASc/2QAhAPg/EAGvAJMBMz3ZAAk+iwBAABw/mQATAQgA5z/JPrU/rjyoPa8Aqj9bAe8AugD9AE4//QBIAPU/oQD7PrcBbAEMPio/VgChAMgA7T7TASc/ywBhAPM90wEWAJABkgNVAsUBRj8eAVQ+5z/dPXoAxwMVAtoEMwQLAF8FTj/FAV09VgCVAtMBDj/WAIIBzj/YCJU8nz8PPb8CKgW8PEk+ugDlPj0ATj/lBFo9zj/SA1QFIj61P5kAJDo6AOEA5T4AAAM5YTq4BWc/yADyABYAsD5bAfoA9T+QAY89ugD5PPcBbAE1P70AbwCcP4kE6j9WAJMBMz3eAUY/NT+cP5YAugDhAOs9LAEOP9IDUAGEA64CxAOZBnI54gTXPmEAygKLAEQDhQFNO+4CxQFcP5YAsgAlN/g/KD22Cfo6kT9QO0sGgz+iPogA6TtwPmgD2j30AekBrT7MBE45hj8tPuYCPj4bO40CMQJpAZ8FQgHaBDI5xwMLAG8AsgAGPz8CMgAaBB8FRAOcDCU+DQInDF8LrQtIAMkyAzM"},"Silver":{"n":253,"d0":1,"p0":2941,"dw":1,"d":"AQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBBQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEEAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBBAEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAwEBBQEB","pw":2,"p":"KQAtAPz/9/8PAAcA0P/x/xoARwD5/9r/FwAgAOD/JADm/9X/HQA4AD0A4P8eAEQA5/8ZAAAAyv8EADIAUwDC//7/LQAPAPP/1v/c/9T/AgDF/yYAJwAjABEABgACAAQAMAAMAEsA8/8gAO//w//z//f/IwAgACMAHQDd//j/9v91/47/mv8AAPL/SwAiAGQABABAAMD/HgAjACwA+v/f/xYAnP/1/xkAQQDy/9P/CQDO/2AA9v+x/wQAJwD+/0IA1f8kAO3/JgAJAOP/EABlAAoAkQAnAAYAMwDI//7/9v8eAEQACgCr/+7/AAD5/+P/UgDD/wAANQDr/zoAAADA/zUA7v8WAEUAlQC3/9r/9P8zABQAJQAwAOL/4//D//7/7v9W/xsAQgAUACoAPQD3/8v/+f9bAOP/xv8kAP7/nf8wAC0AKQDs/0gA8v+yAPr/IgALAOn/LQAFAPz/9P92APr/MQBy/zoAJgCWADwA0/9qAAYAwwCy/28ADAAUAGAA9f84AEUAagAwABwAawArAGwAGv9H/yX/hgCT/8D/o/+tAAEATgDt/5v/8f9sAAEAhgB4AB0A6gBG/6D/tf++AHj/P/9xAHQAgABcADMAZgH7/10Ar/82ABwAGQDwAG0A7wDA/6f/KAEkAMz/WAE0APQA9gATAOT+"}},"2026":{"Gold":{"n":45,"d0":1,"p0":438685,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAQEBAQEBAQEBAQEBAQs=","pw":4,"p":"eRMAAEUGAACoAgAAR/X//0YPAACCLQAAFv7//5wTAABy9///f/7//4oWAAAMFwAAcDUAAEDy//9RJwAAX0EAAN/9//8aSgAAdlcAAM9U//9YbP//DF0AAAoyAAC/tP//TAQAANAvAACpFQAAuwgAAAf4///g2f//4yIAAEoAAACg5v//Ytj//8QwAABKAAAA1RgAAH8QAABD////fyoAAHbh//+0HQAA9PL//8Dv//8="},"Palladium":{"n":45,"d0":1,"p0":164900,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAQEBAQEBAQEBAQEBAQs=","pw":2,"p":"8AqgD9gOSPTUMPAK3OzcBTTvCO5EFvgRhANE/VAUiEXE8GDXZDJsimDXhDUoCoDaBN6IE/AKgAzX5i7uahLcAZ7+wPyOD9DwfBnKAu4AGP4KBU8QkOrN5A=="},"Platinum":{"n":45,"d0":1,"p0":213300,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAQEBAQEBAQEBAQEBAQs=","pw":4,"p":"YCIAAMQiAACEAwAASNv//1gbAAAIIAAAgPP//+AVAAD06P//kAEAAEAGAACsDQAAZBkAAAgHAAB8RwAA9EwAAKS7//+E6v//1DAAABwr//+Uxv//iEUAAGgQAABUwP//0NX//0QWAAC4CwAA3B4AABrb//9R6f//5Q0AAMwBAAAw+f//QPT//0IaAABl+v//mSAAAMwCAAC+AAAA6Pr//8f+//+pQwAAWt///8br//8="},"Silver":{"n":45,"d0":1,"p0":7422,"dw":1,"d":"AwEBAQEDAQEBAQMBAQEBAwEBAQEDAQEBAQMBAQEBAQEBAQEBAQEBAQEBAQs=","pw":2,"p":"VQBUATMAhv4mAVECrwAPAhIA0f/cAA4BrP9s/zICJQTDAHwANQIK+rb3KAI2AVz7h/4eAsAAfgGN/rn9VAAAACL/Vv+4Af//wQHsAAMA7wD6/3IBaP7P/w=="}}}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// Level-of-detail tier lttb-2000 (line, up to 2000 points per metal)
+window._loadSpotSeedLod("lttb-2000",{"Gold":{"t":["1968-01-02","1968-01-09","1968-01-17","1968-01-23","1968-02-12","1968-02-14","1968-02-27","1968-03-13","1968-04-01","1968-04-09","1968-04-29","1968-05-03","1968-05-21","1968-05-23","1968-06-12","1968-06-14","1968-06-28","1968-07-08","1968-07-17","1968-07-25","1968-08-09","1968-08-21","1968-08-26","1968-09-06","1968-09-24","1968-10-02","1968-10-07","1968-10-22","1968-10-29","1968-11-08","1968-11-20","1968-11-27","1968-12-12","1968-12-18","1969-01-02","1969-01-15","1969-01-24","1969-02-05","1969-02-14","1969-03-03","1969-03-10","1969-03-18","1969-03-27","1969-04-15","1969-04-17","1969-04-30","1969-05-08","1969-05-27","1969-06-06","1969-06-10","1969-06-25","1969-07-08","1969-07-10","1969-07-21","1969-08-07","1969-08-11","1969-08-26","1969-09-03","1969-09-17","1969-09-29","1969-10-03","1969-10-15","1969-10-30","1969-11-10","1969-11-18","1969-11-25","1969-12-09","1969-12-12","1969-12-30","1970-01-09","1970-01-19","1970-01-28","1970-02-11","1970-02-18","1970-03-06","1970-03-13","1970-03-19","1970-04-07","1970-04-15","1970-04-27","1970-05-06","1970-05-21","1970-06-03","1970-06-09","1970-06-17","1970-06-25","1970-07-08","1970-07-20","1970-07-31","1970-08-12","1970-08-20","1970-09-03","1970-09-08","1970-09-25","1970-10-02","1970-10-09","1970-10-27","1970-11-04","1970-11-16","1970-11-24","1970-11-27","1970-12-10","1970-12-18","1971-01-04","1971-01-13","1971-01-25","1971-02-03","1971-02-12","1971-02-22","1971-03-08","1971-03-15","1971-03-30","1971-04-08","1971-04-26","1971-04-30","1971-05-10","1971-05-18","1971-06-01","1971-06-10","1971-06-24","1971-06-29","1971-07-15","1971-07-22","1971-07-30","1971-08-19","1971-08-27","1971-09-03","1971-09-14","1971-09-24","1971-10-05","1971-10-15","1971-11-01","1971-11-08","1971-11-16","1971-11-25","1971-12-07","1971-12-20","1972-01-03","1972-01-07","1972-01-24","1972-02-02","1972-02-07","1972-02-17","1972-03-01","1972-03-09","1972-03-17","1972-04-10","1972-04-13","1972-04-27","1972-05-05","1972-05-17","1972-05-24","1972-06-08","1972-06-14","1972-06-23","1972-07-06","1972-07-20","1972-08-02","1972-08-09","1972-08-14","1972-08-23","1972-09-11","1972-09-18","1972-09-26","1972-10-05","1972-10-23","1972-11-03","1972-11-08","1972-11-17","1972-11-28","1972-12-12","1972-12-19","1972-12-29","1973-01-18","1973-01-29","1973-02-05","1973-02-19","1973-02-23","1973-03-07","1973-03-21","1973-03-27","1973-04-03","1973-04-12","1973-05-04","1973-05-15","1973-05-25","1973-06-05","1973-06-11","1973-06-19","1973-07-06","1973-07-11","1973-07-26","1973-08-07","1973-08-15","1973-08-20","1973-09-06","1973-09-14","1973-09-21","1973-10-05","1973-10-11","1973-10-30","1973-11-08","1973-11-14","1973-11-26","1973-12-07","1973-12-14","1973-12-27","1974-01-08","1974-01-21","1974-02-04","1974-02-12","1974-02-26","1974-03-06","1974-03-08","1974-03-21","1974-04-03","1974-04-09","1974-04-23","1974-05-08","1974-05-13","1974-05-29","1974-06-06","1974-06-19","1974-07-02","1974-07-05","1974-07-23","1974-07-30","1974-08-05","1974-08-19","1974-09-03","1974-09-16","1974-09-18","1974-10-04","1974-10-15","1974-10-24","1974-10-29","1974-11-15","1974-11-18","1974-12-04","1974-12-12","1974-12-30","1975-01-07","1975-01-13","1975-01-23","1975-02-10","1975-02-14","1975-02-25","1975-03-05","1975-03-20","1975-04-02","1975-04-15","1975-04-18","1975-05-05","1975-05-16","1975-05-22","1975-06-02","1975-06-10","1975-06-24","1975-07-01","1975-07-11","1975-07-29","1975-07-30","1975-08-15","1975-08-29","1975-09-03","1975-09-16","1975-09-23","1975-10-02","1975-10-14","1975-10-22","1975-11-06","1975-11-18","1975-11-25","1975-12-09","1975-12-22","1976-01-05","1976-01-12","1976-01-22","1976-02-03","1976-02-10","1976-02-25","1976-03-02","1976-03-11","1976-03-22","1976-03-30","1976-04-12","1976-04-28","1976-05-06","1976-05-17","1976-05-26","1976-06-03","1976-06-22","1976-07-01","1976-07-13","1976-07-20","1976-07-28","1976-08-11","1976-08-24","1976-08-31","1976-09-07","1976-09-22","1976-10-05","1976-10-07","1976-10-25","1976-10-28","1976-11-15","1976-11-18","1976-11-29","1976-12-10","1976-12-20","1977-01-04","1977-01-11","1977-01-21","1977-02-02","1977-02-21","1977-03-02","1977-03-07","1977-03-14","1977-03-25","1977-04-06","1977-04-15","1977-04-28","1977-05-17","1977-05-24","1977-06-08","1977-06-15","1977-06-28","1977-07-04","1977-07-14","1977-07-29","1977-08-04","1977-08-16","1977-08-26","1977-09-05","1977-09-16","1977-09-22","1977-10-07","1977-10-17","1977-10-31","1977-11-11","1977-11-22","1977-11-28","1977-12-13","1977-12-14","1978-01-04","1978-01-09","1978-01-24","1978-02-02","1978-02-10","1978-02-24","1978-03-08","1978-03-20","1978-03-21","1978-04-03","1978-04-20","1978-05-02","1978-05-04","1978-05-18","1978-05-31","1978-06-09","1978-06-20","1978-07-03","1978-07-17","1978-07-24","1978-08-01","1978-08-15","1978-08-23","1978-09-04","1978-09-11","1978-09-21","1978-10-02","1978-10-12","1978-10-27","1978-10-31","1978-11-16","1978-11-24","1978-11-30","1978-12-19","1978-12-21","1979-01-12","1979-01-22","1979-02-02","1979-02-08","1979-02-14","1979-02-23","1979-03-08","1979-03-19","1979-03-27","1979-04-17","1979-04-19","1979-05-09","1979-05-14","1979-05-29","1979-06-11","1979-06-13","1979-06-29","1979-07-06","1979-07-18","1979-07-26","1979-08-07","1979-08-22","1979-09-03","1979-09-13","1979-09-19","1979-10-02","1979-10-05","1979-10-16","1979-10-26","1979-11-07","1979-11-26","1979-12-04","1979-12-10","1979-12-24","1980-01-03","1980-01-18","1980-01-23","1980-02-07","1980-02-20","1980-02-21","1980-03-05","1980-03-18","1980-03-25","1980-04-03","1980-04-22","1980-04-25","1980-05-07","1980-05-27","1980-06-06","1980-06-09","1980-06-23","1980-07-08","1980-07-18","1980-07-25","1980-07-31","1980-08-18","1980-08-21","1980-09-01","1980-09-12","1980-09-23","1980-10-03","1980-10-13","1980-10-24","1980-11-05","1980-11-11","1980-11-21","1980-12-04","1980-12-12","1980-12-24","1981-01-07","1981-01-21","1981-02-03","1981-02-10","1981-02-25","1981-03-05","1981-03-10","1981-03-27","1981-03-31","1981-04-13","1981-04-24","1981-05-11","1981-05-22","1981-06-01","1981-06-05","1981-06-23","1981-07-02","1981-07-08","1981-07-20","1981-08-04","1981-08-10","1981-08-19","1981-09-01","1981-09-14","1981-09-28","1981-10-09","1981-10-12","1981-10-29","1981-11-09","1981-11-17","1981-11-30","1981-12-01","1981-12-14","1981-12-23","1982-01-06","1982-01-18","1982-01-29","1982-02-10","1982-02-18","1982-03-02","1982-03-09","1982-03-19","1982-03-31","1982-04-14","1982-04-22","1982-04-30","1982-05-21","1982-06-02","1982-06-08","1982-06-21","1982-06-24","1982-07-07","1982-07-21","1982-07-29","1982-08-12","1982-08-24","1982-09-01","1982-09-07","1982-09-20","1982-10-05","1982-10-08","1982-10-26","1982-11-03","1982-11-12","1982-11-24","1982-12-07","1982-12-15","1982-12-29","1983-01-07","1983-01-13","1983-01-24","1983-02-03","1983-02-21","1983-03-01","1983-03-10","1983-03-17","1983-03-29","1983-04-14","1983-04-25","1983-04-28","1983-05-11","1983-05-31","1983-06-02","1983-06-15","1983-06-22","1983-07-06","1983-07-12","1983-07-28","1983-08-05","1983-08-18","1983-08-23","1983-09-12","1983-09-15","1983-09-26","1983-10-05","1983-10-17","1983-11-01","1983-11-04","1983-11-21","1983-11-30","1983-12-08","1983-12-20","1984-01-03","1984-01-09","1984-01-27","1984-02-03","1984-02-14","1984-02-23","1984-03-05","1984-03-16","1984-03-29","1984-04-06","1984-04-19","1984-04-27","1984-05-10","1984-05-24","1984-06-04","1984-06-12","1984-06-18","1984-07-04","1984-07-09","1984-07-19","1984-07-27","1984-08-15","1984-08-21","1984-08-30","1984-09-10","1984-09-24","1984-10-03","1984-10-10","1984-10-29","1984-11-06","1984-11-13","1984-11-28","1984-12-06","1984-12-18","1984-12-27","1985-01-07","1985-01-18","1985-01-28","1985-02-06","1985-02-18","1985-02-26","1985-03-18","1985-03-20","1985-04-02","1985-04-12","1985-04-30","1985-05-07","1985-05-14","1985-05-29","1985-06-10","1985-06-19","1985-07-02","1985-07-08","1985-07-18","1985-07-26","1985-08-07","1985-08-19","1985-09-02","1985-09-06","1985-09-18","1985-09-26","1985-10-10","1985-10-23","1985-10-30","1985-11-08","1985-11-26","1985-12-03","1985-12-12","1985-12-23","1986-01-06","1986-01-16","1986-01-27","1986-02-05","1986-02-14","1986-02-25","1986-03-04","1986-03-24","1986-04-01","1986-04-08","1986-04-23","1986-05-02","1986-05-12","1986-05-21","1986-06-10","1986-06-17","1986-06-26","1986-07-09","1986-07-15","1986-07-30","1986-08-11","1986-08-19","1986-08-27","1986-09-05","1986-09-22","1986-09-30","1986-10-07","1986-10-22","1986-10-31","1986-11-10","1986-11-18","1986-12-01","1986-12-05","1986-12-15","1986-12-30","1987-01-14","1987-01-19","1987-02-03","1987-02-13","1987-02-19","1987-03-05","1987-03-16","1987-03-30","1987-04-09","1987-04-15","1987-04-27","1987-05-11","1987-05-20","1987-06-01","1987-06-12","1987-06-23","1987-07-01","1987-07-08","1987-07-27","1987-08-04","1987-08-10","1987-08-21","1987-09-04","1987-09-14","1987-09-24","1987-10-01","1987-10-20","1987-10-21","1987-11-06","1987-11-16","1987-11-30","1987-12-07","1987-12-14","1987-12-22","1988-01-11","1988-01-25","1988-02-03","1988-02-04","1988-02-22","1988-02-29","1988-03-11","1988-03-24","1988-04-07","1988-04-18","1988-04-26","1988-05-04","1988-05-19","1988-05-27","1988-06-03","1988-06-20","1988-06-29","1988-07-12","1988-07-20","1988-07-26","1988-08-10","1988-08-16","1988-08-25","1988-09-09","1988-09-22","1988-09-26","1988-10-11","1988-10-24","1988-11-03","1988-11-04","1988-11-22","1988-12-05","1988-12-09","1988-12-16","1989-01-03","1989-01-11","1989-01-24","1989-02-01","1989-02-17","1989-02-23","1989-03-02","1989-03-20","1989-03-31","1989-04-14","1989-04-19","1989-04-27","1989-05-12","1989-05-22","1989-06-07","1989-06-12","1989-06-26","1989-07-06","1989-07-18","1989-07-27","1989-07-31","1989-08-14","1989-08-23","1989-09-01","1989-09-20","1989-09-27","1989-10-11","1989-10-18","1989-10-24","1989-11-08","1989-11-16","1989-11-24","1989-12-06","1989-12-13","1990-01-04","1990-01-11","1990-01-23","1990-01-29","1990-02-12","1990-02-21","1990-03-01","1990-03-19","1990-03-27","1990-04-06","1990-04-11","1990-04-24","1990-05-03","1990-05-21","1990-05-25","1990-06-14","1990-06-20","1990-07-04","1990-07-12","1990-07-23","1990-08-01","1990-08-14","1990-08-23","1990-08-30","1990-09-11","1990-09-25","1990-10-02","1990-10-09","1990-10-18","1990-11-07","1990-11-15","1990-11-26","1990-12-07","1990-12-18","1990-12-20","1991-01-08","1991-01-16","1991-01-25","1991-02-06","1991-02-13","1991-02-25","1991-03-11","1991-03-15","1991-03-28","1991-04-10","1991-04-29","1991-05-01","1991-05-20","1991-05-28","1991-06-11","1991-06-13","1991-06-25","1991-07-08","1991-07-22","1991-07-25","1991-08-05","1991-08-19","1991-08-30","1991-09-10","1991-09-13","1991-09-27","1991-10-07","1991-10-21","1991-10-31","1991-11-08","1991-11-22","1991-12-02","1991-12-10","1991-12-17","1992-01-07","1992-01-10","1992-01-24","1992-02-03","1992-02-13","1992-02-24","1992-03-06","1992-03-20","1992-03-30","1992-04-08","1992-04-13","1992-04-29","1992-05-13","1992-05-19","1992-06-01","1992-06-11","1992-06-19","1992-06-29","1992-07-13","1992-07-20","1992-08-03","1992-08-14","1992-08-24","1992-09-03","1992-09-17","1992-09-22","1992-10-06","1992-10-15","1992-10-23","1992-11-10","1992-11-16","1992-11-24","1992-12-09","1992-12-17","1992-12-23","1993-01-05","1993-01-15","1993-01-29","1993-02-08","1993-02-17","1993-02-26","1993-03-12","1993-03-19","1993-04-02","1993-04-16","1993-04-29","1993-05-12","1993-05-19","1993-06-02","1993-06-04","1993-06-15","1993-06-29","1993-07-08","1993-07-22","1993-08-02","1993-08-06","1993-08-20","1993-09-01","1993-09-14","1993-09-24","1993-10-06","1993-10-13","1993-10-20","1993-11-02","1993-11-08","1993-11-23","1993-12-01","1993-12-13","1993-12-29","1994-01-04","1994-01-20","1994-01-28","1994-02-04","1994-02-11","1994-02-24","1994-03-08","1994-03-15","1994-03-25","1994-04-11","1994-04-25","1994-04-29","1994-05-18","1994-05-24","1994-06-06","1994-06-20","1994-06-22","1994-07-08","1994-07-18","1994-07-28","1994-08-04","1994-08-16","1994-08-25","1994-09-08","1994-09-15","1994-09-28","1994-10-12","1994-10-21","1994-11-01","1994-11-08","1994-11-15","1994-11-28","1994-12-06","1994-12-21","1995-01-05","1995-01-09","1995-01-23","1995-01-30","1995-02-08","1995-02-20","1995-03-02","1995-03-15","1995-03-30","1995-04-03","1995-04-19","1995-04-27","1995-05-05","1995-05-19","1995-06-05","1995-06-09","1995-06-16","1995-07-03","1995-07-13","1995-07-19","1995-08-01","1995-08-09","1995-08-21","1995-09-06","1995-09-13","1995-09-25","1995-09-29","1995-10-11","1995-10-20","1995-11-07","1995-11-13","1995-11-23","1995-11-30","1995-12-14","1996-01-02","1996-01-05","1996-01-19","1996-02-02","1996-02-08","1996-02-19","1996-03-05","1996-03-13","1996-03-26","1996-04-03","1996-04-09","1996-04-19","1996-05-03","1996-05-13","1996-05-28","1996-06-06","1996-06-19","1996-07-01","1996-07-03","1996-07-16","1996-07-30","1996-08-06","1996-08-16","1996-08-27","1996-09-10","1996-09-19","1996-10-01","1996-10-11","1996-10-23","1996-11-01","1996-11-14","1996-11-15","1996-12-03","1996-12-06","1996-12-27","1997-01-09","1997-01-13","1997-01-28","1997-01-31","1997-02-12","1997-02-28","1997-03-10","1997-03-14","1997-03-26","1997-04-11","1997-04-16","1997-04-29","1997-05-14","1997-05-23","1997-05-30","1997-06-18","1997-06-27","1997-07-09","1997-07-11","1997-07-21","1997-08-06","1997-08-13","1997-08-20","1997-09-02","1997-09-17","1997-10-01","1997-10-02","1997-10-16","1997-10-27","1997-11-05","1997-11-14","1997-11-24","1997-12-05","1997-12-16","1997-12-24","1998-01-12","1998-01-26","1998-02-04","1998-02-06","1998-02-24","1998-03-02","1998-03-18","1998-03-27","1998-04-06","1998-04-16","1998-04-23","1998-05-07","1998-05-22","1998-06-02","1998-06-09","1998-06-16","1998-07-01","1998-07-13","1998-07-21","1998-08-04","1998-08-13","1998-08-19","1998-08-28","1998-09-11","1998-09-23","1998-10-02","1998-10-16","1998-10-26","1998-11-04","1998-11-13","1998-11-19","1998-12-04","1998-12-17","1998-12-24","1999-01-12","1999-01-14","1999-01-28","1999-02-05","1999-02-17","1999-03-04","1999-03-11","1999-03-17","1999-04-06","1999-04-14","1999-04-27","1999-05-06","1999-05-11","1999-05-28","1999-06-10","1999-06-18","1999-07-01","1999-07-07","1999-07-21","1999-07-30","1999-08-06","1999-08-18","1999-08-25","1999-09-09","1999-09-21","1999-09-29","1999-10-05","1999-10-18","1999-10-27","1999-11-08","1999-11-24","1999-12-06","1999-12-08","1999-12-24","2000-01-06","2000-01-19","2000-01-31","2000-02-07","2000-02-16","2000-02-23","2000-03-02","2000-03-22","2000-03-31","2000-04-05","2000-04-17","2000-04-27","2000-05-10","2000-05-26","2000-06-07","2000-06-13","2000-06-26","2000-06-29","2000-07-13","2000-07-27","2000-08-04","2000-08-17","2000-08-24","2000-09-04","2000-09-20","2000-09-28","2000-10-04","2000-10-13","2000-10-31","2000-11-03","2000-11-13","2000-11-30","2000-12-07","2000-12-14","2000-12-28","2001-01-12","2001-01-23","2001-02-02","2001-02-09","2001-02-27","2001-03-05","2001-03-12","2001-03-21","2001-04-03","2001-04-20","2001-04-26","2001-05-14","2001-05-21","2001-05-31","2001-06-11","2001-06-19","2001-06-27","2001-07-06","2001-07-19","2001-07-31","2001-08-15","2001-08-28","2001-09-06","2001-09-17","2001-09-25","2001-10-08","2001-10-11","2001-10-23","2001-10-31","2001-11-08","2001-11-23","2001-12-04","2001-12-11","2001-12-31","2002-01-10","2002-01-16","2002-01-29","2002-02-08","2002-02-21","2002-02-27","2002-03-08","2002-03-21","2002-03-28","2002-04-10","2002-04-29","2002-05-02","2002-05-15","2002-05-29","2002-06-07","2002-06-24","2002-07-01","2002-07-05","2002-07-22","2002-08-01","2002-08-12","2002-08-23","2002-09-04","2002-09-09","2002-09-17","2002-09-26","2002-10-07","2002-10-18","2002-10-28","2002-11-08","2002-11-22","2002-12-03","2002-12-11","2002-12-19","2003-01-02","2003-01-21","2003-01-27","2003-02-05","2003-02-17","2003-02-25","2003-03-11","2003-03-14","2003-04-01","2003-04-07","2003-04-16","2003-04-29","2003-05-14","2003-05-22","2003-06-06","2003-06-11","2003-06-20","2003-07-01","2003-07-16","2003-07-29","2003-08-04","2003-08-15","2003-08-26","2003-09-02","2003-09-17","2003-09-25","2003-10-06","2003-10-20","2003-10-23","2003-11-04","2003-11-13","2003-11-25","2003-12-08","2003-12-15","2004-01-06","2004-01-08","2004-01-19","2004-02-06","2004-02-13","2004-02-18","2004-02-27","2004-03-16","2004-03-24","2004-04-02","2004-04-15","2004-04-29","2004-05-05","2004-05-14","2004-05-28","2004-06-15","2004-06-24","2004-06-30","2004-07-12","2004-07-23","2004-07-28","2004-08-13","2004-08-23","2004-08-26","2004-09-08","2004-09-20","2004-10-01","2004-10-13","2004-10-25","2004-11-03","2004-11-17","2004-11-25","2004-12-06","2004-12-10","2004-12-29","2005-01-07","2005-01-20","2005-01-28","2005-02-08","2005-02-15","2005-03-04","2005-03-14","2005-03-24","2005-04-05","2005-04-15","2005-04-21","2005-05-05","2005-05-13","2005-06-01","2005-06-03","2005-06-20","2005-06-24","2005-07-06","2005-07-19","2005-07-27","2005-08-05","2005-08-12","2005-08-31","2005-09-05","2005-09-22","2005-09-26","2005-10-12","2005-10-21","2005-10-28","2005-11-08","2005-11-18","2005-12-01","2005-12-12","2005-12-21","2006-01-04","2006-01-16","2006-01-24","2006-02-03","2006-02-14","2006-03-01","2006-03-10","2006-03-22","2006-03-31","2006-04-05","2006-04-20","2006-04-26","2006-05-12","2006-05-22","2006-06-05","2006-06-14","2006-06-28","2006-07-03","2006-07-17","2006-07-24","2006-08-02","2006-08-18","2006-08-22","2006-09-06","2006-09-13","2006-09-28","2006-10-05","2006-10-17","2006-10-24","2006-11-03","2006-11-17","2006-11-24","2006-12-04","2006-12-19","2007-01-02","2007-01-08","2007-01-25","2007-01-30","2007-02-15","2007-02-26","2007-03-05","2007-03-09","2007-03-20","2007-04-03","2007-04-18","2007-04-27","2007-05-09","2007-05-18","2007-06-04","2007-06-13","2007-06-20","2007-06-27","2007-07-06","2007-07-23","2007-07-27","2007-08-09","2007-08-17","2007-09-04","2007-09-12","2007-09-21","2007-10-04","2007-10-16","2007-10-24","2007-11-07","2007-11-16","2007-11-26","2007-12-03","2007-12-17","2008-01-02","2008-01-11","2008-01-22","2008-01-25","2008-02-05","2008-02-18","2008-02-22","2008-03-06","2008-03-17","2008-04-01","2008-04-10","2008-04-17","2008-05-02","2008-05-14","2008-05-22","2008-06-05","2008-06-13","2008-06-30","2008-07-09","2008-07-15","2008-07-22","2008-08-11","2008-08-15","2008-08-29","2008-09-11","2008-09-18","2008-09-23","2008-10-10","2008-10-23","2008-10-30","2008-11-04","2008-11-13","2008-11-26","2008-12-09","2008-12-18","2008-12-29","2009-01-15","2009-01-26","2009-01-29","2009-02-10","2009-02-24","2009-03-04","2009-03-20","2009-03-25","2009-04-06","2009-04-20","2009-04-24","2009-05-06","2009-05-19","2009-06-01","2009-06-08","2009-06-23","2009-06-30","2009-07-13","2009-07-20","2009-07-30","2009-08-07","2009-08-19","2009-09-01","2009-09-17","2009-09-28","2009-10-08","2009-10-20","2009-10-29","2009-11-04","2009-11-13","2009-11-26","2009-12-03","2009-12-10","2009-12-23","2010-01-11","2010-01-22","2010-02-03","2010-02-05","2010-02-17","2010-02-25","2010-03-08","2010-03-25","2010-04-08","2010-04-19","2010-04-21","2010-05-05","2010-05-12","2010-05-24","2010-06-08","2010-06-15","2010-06-28","2010-07-07","2010-07-15","2010-07-28","2010-08-04","2010-08-24","2010-08-26","2010-09-13","2010-09-17","2010-09-28","2010-10-14","2010-10-22","2010-11-05","2010-11-09","2010-11-17","2010-12-07","2010-12-09","2010-12-29","2011-01-07","2011-01-12","2011-01-28","2011-02-04","2011-02-14","2011-02-24","2011-03-07","2011-03-16","2011-03-24","2011-04-05","2011-04-20","2011-05-03","2011-05-12","2011-05-25","2011-06-07","2011-06-14","2011-06-22","2011-07-04","2011-07-14","2011-08-01","2011-08-09","2011-08-22","2011-08-25","2011-09-05","2011-09-21","2011-09-26","2011-10-12","2011-10-21","2011-10-28","2011-11-08","2011-11-23","2011-12-02","2011-12-08","2011-12-15","2011-12-29","2012-01-12","2012-01-25","2012-02-03","2012-02-16","2012-02-29","2012-03-01","2012-03-15","2012-03-27","2012-04-05","2012-04-13","2012-05-01","2012-05-09","2012-05-16","2012-06-06","2012-06-08","2012-06-19","2012-06-29","2012-07-12","2012-07-27","2012-08-03","2012-08-15","2012-08-23","2012-08-31","2012-09-14","2012-09-27","2012-10-05","2012-10-16","2012-10-26","2012-11-05","2012-11-12","2012-11-27","2012-12-06","2012-12-12","2013-01-04","2013-01-09","2013-01-22","2013-01-28","2013-02-07","2013-02-21","2013-02-27","2013-03-08","2013-03-22","2013-04-10","2013-04-16","2013-04-26","2013-05-09","2013-05-20","2013-05-31","2013-06-07","2013-06-17","2013-06-28","2013-07-08","2013-07-24","2013-08-02","2013-08-07","2013-08-16","2013-08-28","2013-09-13","2013-09-19","2013-10-02","2013-10-15","2013-10-18","2013-10-30","2013-11-11","2013-11-25","2013-12-04","2013-12-11","2013-12-20","2014-01-06","2014-01-22","2014-01-27","2014-02-03","2014-02-17","2014-02-28","2014-03-13","2014-03-17","2014-03-27","2014-04-14","2014-04-23","2014-05-07","2014-05-09","2014-05-22","2014-06-02","2014-06-17","2014-06-24","2014-07-10","2014-07-16","2014-07-23","2014-08-01","2014-08-14","2014-08-22","2014-09-08","2014-09-18","2014-10-01","2014-10-06","2014-10-21","2014-10-31","2014-11-07","2014-11-18","2014-12-01","2014-12-10","2014-12-24","2015-01-05","2015-01-19","2015-01-21","2015-02-03","2015-02-12","2015-02-26","2015-03-10","2015-03-18","2015-03-26","2015-04-01","2015-04-16","2015-05-01","2015-05-15","2015-05-18","2015-05-28","2015-06-15","2015-06-19","2015-07-02","2015-07-15","2015-07-24","2015-08-06","2015-08-12","2015-08-25","2015-08-28","2015-09-15","2015-09-25","2015-10-02","2015-10-15","2015-10-28","2015-11-05","2015-11-18","2015-11-20","2015-12-03","2015-12-11","2015-12-31","2016-01-11","2016-01-15","2016-02-02","2016-02-12","2016-02-22","2016-03-04","2016-03-15","2016-03-17","2016-04-04","2016-04-12","2016-04-25","2016-05-03","2016-05-16","2016-05-31","2016-06-13","2016-06-23","2016-06-24","2016-07-06","2016-07-14","2016-08-03","2016-08-08","2016-08-16","2016-09-01","2016-09-07","2016-09-16","2016-09-27","2016-10-07","2016-10-17","2016-11-04","2016-11-09","2016-11-18","2016-12-01","2016-12-08","2016-12-22","2017-01-03","2017-01-17","2017-01-27","2017-02-09","2017-02-15","2017-02-27","2017-03-10","2017-03-22","2017-03-31","2017-04-13","2017-04-21","2017-05-04","2017-05-11","2017-05-19","2017-06-07","2017-06-13","2017-06-28","2017-07-10","2017-07-12","2017-07-27","2017-08-07","2017-08-11","2017-08-25","2017-09-08","2017-09-21","2017-09-26","2017-10-03","2017-10-16","2017-10-27","2017-11-09","2017-11-14","2017-11-29","2017-12-08","2017-12-22","2018-01-02","2018-01-15","2018-01-25","2018-02-07","2018-02-16","2018-02-22","2018-03-07","2018-03-19","2018-03-27","2018-04-06","2018-04-19","2018-05-01","2018-05-11","2018-05-18","2018-05-25","2018-06-14","2018-06-21","2018-07-03","2018-07-09","2018-07-19","2018-08-01","2018-08-16","2018-08-28","2018-09-05","2018-09-13","2018-09-21","2018-10-09","2018-10-15","2018-10-22","2018-11-07","2018-11-13","2018-11-22","2018-11-30","2018-12-17","2018-12-28","2019-01-04","2019-01-21","2019-01-31","2019-02-11","2019-02-20","2019-03-04","2019-03-13","2019-03-25","2019-03-29","2019-04-11","2019-04-17","2019-05-03","2019-05-15","2019-05-30","2019-06-05","2019-06-17","2019-06-25","2019-07-09","2019-07-19","2019-08-01","2019-08-13","2019-08-22","2019-08-28","2019-09-10","2019-09-25","2019-10-01","2019-10-10","2019-10-16","2019-11-04","2019-11-12","2019-11-20","2019-11-29","2019-12-06","2019-12-23","2020-01-08","2020-01-14","2020-01-27","2020-02-05","2020-02-17","2020-02-24","2020-03-11","2020-03-17","2020-03-25","2020-04-02","2020-04-16","2020-05-01","2020-05-15","2020-05-18","2020-06-08","2020-06-11","2020-06-19","2020-07-01","2020-07-20","2020-07-27","2020-08-07","2020-08-12","2020-08-26","2020-09-01","2020-09-16","2020-09-24","2020-10-02","2020-10-21","2020-10-30","2020-11-09","2020-11-11","2020-11-30","2020-12-08","2020-12-14","2021-01-05","2021-01-11","2021-01-21","2021-02-04","2021-02-09","2021-02-24","2021-03-05","2021-03-11","2021-03-23","2021-03-31","2021-04-19","2021-04-28","2021-05-13","2021-05-18","2021-06-01","2021-06-11","2021-06-18","2021-06-30","2021-07-15","2021-07-22","2021-07-30","2021-08-10","2021-08-17","2021-09-06","2021-09-08","2021-09-20","2021-09-30","2021-10-14","2021-10-20","2021-11-04","2021-11-16","2021-11-24","2021-12-03","2021-12-17","2021-12-24","2021-12-31","2022-01-20","2022-01-28","2022-02-11","2022-02-17","2022-02-24","2022-03-09","2022-03-16","2022-03-25","2022-04-13","2022-04-19","2022-05-03","2022-05-16","2022-05-23","2022-06-01","2022-06-17","2022-06-27","2022-07-08","2022-07-21","2022-07-29","2022-08-10","2022-08-22","2022-08-25","2022-09-13","2022-09-16","2022-09-28","2022-10-07","2022-10-21","2022-11-03","2022-11-11","2022-11-23","2022-12-02","2022-12-15","2022-12-29","2023-01-04","2023-01-20","2023-02-01","2023-02-02","2023-02-17","2023-02-28","2023-03-09","2023-03-20","2023-03-28","2023-04-05","2023-04-19","2023-05-05","2023-05-19","2023-05-22","2023-06-05","2023-06-16","2023-06-29","2023-07-10","2023-07-20","2023-07-27","2023-08-03","2023-08-21","2023-08-31","2023-09-13","2023-09-19","2023-10-04","2023-10-06","2023-10-20","2023-10-31","2023-11-13","2023-11-17","2023-12-04","2023-12-13","2023-12-15","2024-01-02","2024-01-18","2024-01-19","2024-02-02","2024-02-14","2024-02-28","2024-03-08","2024-03-20","2024-03-25","2024-04-12","2024-04-23","2024-04-26","2024-05-09","2024-05-20","2024-05-29","2024-06-10","2024-06-21","2024-07-02","2024-07-17","2024-07-25","2024-08-02","2024-08-08","2024-08-20","2024-09-04","2024-09-13","2024-09-26","2024-10-09","2024-10-21","2024-10-30","2024-11-07","2024-11-14","2024-11-22","2024-12-02","2024-12-12","2024-12-24","2025-01-06","2025-01-22","2025-01-28","2025-02-05","2025-02-20","2025-02-28","2025-03-14","2025-03-26","2025-04-07","2025-04-17","2025-04-22","2025-05-01","2025-05-15","2025-05-23","2025-06-13","2025-06-24","2025-06-30","2025-07-04","2025-07-23","2025-08-01","2025-08-08","2025-08-22","2025-08-29","2025-09-09","2025-09-19","2025-10-03","2025-10-16","2025-10-17","2025-10-28","2025-11-13","2025-11-21","2025-12-01","2025-12-10","2025-12-23","2025-12-31","2026-01-19","2026-01-29","2026-02-02","2026-02-12","2026-02-23","2026-03-09"],"p":[35.18,35.14,35.2,35.19,35.19,35.2,35.2,35.2,38.0,37.25,38.55,39.6,42.6,41.5,42.1,40.2,40.95,40.95,37.8,39.1,38.45,40.3,39.4,40.0,40.48,38.3,39.8,38.95,39.6,39.4,40.75,39.75,41.3,41.83,41.8,42.75,42.0,42.7,42.5,42.75,43.75,42.85,43.48,42.9,43.23,43.6,43.65,43.5,40.75,41.98,40.9,42.1,41.9,42.0,41.03,41.45,40.9,40.78,41.0,40.65,40.99,40.73,39.98,37.9,37.78,35.35,35.0,35.33,35.23,34.85,34.78,35.0,35.03,34.98,34.95,35.0,35.3,35.28,35.84,35.74,36.24,35.95,35.2,35.7,35.34,35.63,35.3,35.33,35.29,35.25,35.28,36.35,35.95,36.15,36.28,36.79,39.19,36.8,37.9,37.43,37.63,36.98,37.65,37.33,38.28,37.9,38.7,39.05,38.75,38.75,39.08,38.75,38.95,39.0,39.6,39.65,41.2,40.85,39.6,40.4,39.88,40.44,41.59,42.48,43.4,41.1,41.73,41.85,42.65,42.35,42.58,42.13,42.35,43.0,43.64,43.88,42.4,43.73,45.75,45.93,48.6,47.45,48.5,47.8,48.3,48.4,48.4,49.43,49.38,50.53,57.5,56.65,66.75,60.7,64.0,65.9,64.75,70.0,65.7,64.75,67.4,67.2,64.5,63.4,65.63,64.93,64.13,63.85,60.1,63.63,62.75,65.4,64.7,64.63,65.3,66.9,73.7,89.0,81.5,81.8,91.5,89.5,91.1,90.3,107.0,104.75,127.0,115.5,122.5,127.0,119.0,119.5,114.75,92.5,107.25,106.98,100.0,103.25,97.6,103.75,97.0,97.6,90.85,90.0,106.75,104.35,108.75,127.0,141.75,132.25,147.75,177.25,158.25,170.0,177.0,179.5,166.75,174.4,161.5,167.5,154.25,160.75,157.0,138.0,131.5,141.5,160.5,153.1,153.0,158.5,152.75,144.0,158.25,154.2,158.5,169.5,188.0,190.0,170.5,174.0,197.5,171.25,180.0,174.0,173.5,184.0,186.25,177.75,178.25,177.65,164.25,169.4,163.5,165.75,172.75,163.25,166.0,162.25,167.0,163.75,167.75,166.2,161.6,161.5,149.75,148.0,128.75,144.5,141.25,145.25,146.5,140.4,141.9,137.0,142.0,140.15,136.5,124.0,131.65,128.85,133.65,131.55,134.0,134.0,128.6,127.1,128.6,126.9,127.7,124.4,126.9,125.5,123.25,122.0,110.0,115.35,113.65,105.1,103.05,113.0,120.75,114.3,116.25,115.65,123.5,138.2,129.1,128.75,137.0,131.5,136.1,129.4,133.0,131.8,137.25,144.9,147.75,145.65,153.6,147.2,151.4,146.6,147.75,144.8,142.4,137.2,142.7,140.55,144.2,144.5,146.5,143.35,144.2,147.8,147.95,151.5,153.6,160.8,160.8,168.15,156.65,160.5,157.35,160.4,172.5,168.6,177.1,175.0,174.0,183.75,188.8,181.35,177.25,182.75,169.7,169.15,172.85,176.75,184.9,181.0,186.35,183.0,185.05,195.5,207.5,215.9,198.35,212.5,205.7,215.9,217.0,227.2,234.15,243.65,197.1,202.75,193.7,220.35,213.25,216.6,234.4,229.9,254.0,237.6,252.1,238.75,243.85,246.3,231.75,241.0,247.0,250.65,276.1,282.4,276.1,276.45,290.2,303.85,307.0,282.5,311.5,319.3,334.35,376.0,437.0,367.5,398.6,374.8,392.5,393.0,435.0,431.35,485.9,632.0,825.5,650.0,704.0,625.0,646.5,641.75,474.0,548.5,491.25,494.5,552.0,509.25,514.2,598.0,627.5,596.0,688.75,610.0,652.5,618.0,609.75,640.5,626.25,693.5,720.5,670.25,683.5,628.0,655.0,598.75,637.75,632.7,553.5,604.0,588.75,576.0,482.0,517.75,505.75,457.0,484.5,547.25,514.25,475.5,491.75,501.0,472.75,481.25,460.25,465.0,410.0,400.0,414.75,391.75,393.2,433.5,422.5,456.0,427.5,452.25,451.6,422.25,430.1,395.75,415.5,405.0,419.25,402.25,402.0,369.75,388.25,382.6,367.5,363.0,325.5,316.25,320.5,364.75,344.75,356.75,343.25,316.8,330.9,297.0,309.75,307.4,361.5,340.5,333.25,411.5,404.25,488.5,426.25,387.25,438.0,416.5,433.5,400.0,404.5,458.15,435.25,456.75,454.0,491.0,475.75,506.0,503.75,414.5,433.0,416.75,412.0,436.25,442.25,427.0,443.25,439.0,411.5,407.5,421.25,412.25,430.5,426.0,409.0,421.0,425.75,416.9,403.75,416.25,388.75,400.5,376.0,382.5,374.75,405.75,402.0,375.4,384.0,364.25,366.65,386.25,374.95,399.75,406.85,392.8,390.35,378.75,385.0,377.5,370.1,375.3,394.5,375.25,369.4,370.55,332.5,352.35,336.15,353.9,345.4,348.75,337.2,347.25,347.6,337.75,335.8,345.95,350.0,329.1,330.7,308.25,310.25,296.75,306.9,298.6,303.45,314.95,285.0,293.7,333.25,317.0,331.25,324.65,311.25,324.75,311.2,310.75,325.2,310.85,312.2,322.25,317.6,320.65,339.25,335.45,318.75,315.5,330.4,325.55,326.9,326.8,322.1,331.5,322.5,316.05,325.75,327.8,359.6,361.75,335.95,329.5,351.4,337.9,352.4,333.7,340.65,347.25,341.6,344.9,338.6,347.55,337.3,343.8,350.35,345.85,351.35,394.5,372.5,377.8,418.25,442.75,421.2,442.0,426.6,401.5,409.9,388.0,399.6,388.6,394.6,389.4,414.4,421.25,402.0,395.55,392.6,411.45,404.65,421.8,421.5,445.5,476.6,454.75,479.95,443.4,460.8,438.1,449.5,442.15,453.1,476.0,459.5,454.1,464.4,456.6,463.85,454.1,481.6,466.65,458.6,461.75,493.9,480.9,502.75,481.6,485.3,476.5,447.1,437.6,445.1,423.75,444.1,453.9,446.25,457.55,448.25,441.95,456.65,452.5,464.85,453.9,434.9,434.5,445.0,430.15,426.95,432.0,434.8,428.9,399.6,389.05,408.0,406.3,422.9,419.5,416.1,430.4,422.2,412.6,413.6,403.5,407.8,392.0,378.95,389.0,384.1,395.3,382.3,388.55,382.9,384.75,379.65,359.25,375.5,358.5,375.3,384.3,369.7,374.3,369.1,363.0,366.8,358.25,360.75,369.3,360.4,368.1,366.4,386.95,389.1,415.8,402.05,417.1,394.95,413.55,408.6,420.75,415.25,420.6,406.25,401.25,369.75,380.35,374.1,377.95,369.15,373.4,366.35,346.75,347.05,361.25,353.2,361.8,371.1,411.0,415.7,385.8,378.4,406.35,389.25,394.8,370.0,383.5,378.5,387.05,371.1,376.0,384.45,392.8,403.7,373.8,360.9,367.05,357.5,369.25,363.6,354.0,363.65,351.3,356.25,353.9,356.3,372.75,368.4,363.25,371.35,370.1,365.1,355.6,360.75,347.0,351.2,343.5,348.4,359.2,363.1,357.4,353.35,367.2,368.25,370.75,357.1,349.3,356.65,354.5,357.1,356.65,349.0,350.55,337.6,342.75,337.7,342.0,334.75,334.75,340.0,336.8,338.0,343.5,342.55,348.9,358.8,357.3,336.0,341.85,339.05,350.75,347.5,350.5,341.75,343.6,330.2,336.0,333.95,333.4,337.75,332.55,328.8,327.45,330.75,327.6,331.5,328.75,326.5,331.3,339.4,337.0,354.8,356.0,378.75,368.25,377.5,365.0,375.25,398.4,389.0,406.7,381.9,370.35,371.8,342.05,357.4,353.5,366.6,371.6,362.5,377.9,378.05,370.1,387.55,385.65,395.0,392.4,378.15,387.65,381.1,376.0,375.45,386.25,391.8,384.9,370.25,376.45,379.65,388.1,380.25,391.0,393.1,383.4,386.4,387.35,377.5,376.6,383.4,391.0,387.8,397.5,388.2,391.65,383.45,383.1,386.45,384.7,376.55,382.5,375.0,372.45,385.1,375.9,374.8,379.3,374.45,386.6,382.1,392.25,396.95,386.6,391.35,382.6,383.4,386.4,391.3,384.35,389.3,389.25,381.75,384.5,385.55,379.0,385.4,382.2,383.75,384.7,381.85,382.3,389.6,382.55,387.85,385.7,387.1,396.4,396.8,416.25,406.95,405.9,392.9,397.4,399.45,393.8,397.6,389.9,394.0,391.25,392.15,385.7,386.0,380.6,382.5,384.65,384.9,388.85,386.2,389.0,382.45,383.1,377.05,381.85,383.95,377.2,382.65,379.85,369.0,373.0,369.55,354.5,359.6,357.25,345.0,336.9,360.6,349.9,353.0,346.8,348.65,341.45,338.95,349.0,341.65,345.75,342.05,337.3,315.75,320.6,328.05,318.85,328.6,322.0,324.5,319.95,336.8,331.75,327.3,311.8,314.6,304.5,305.5,287.05,283.25,296.1,278.5,304.5,295.2,301.6,292.35,299.75,289.1,302.75,313.5,306.3,314.6,299.0,300.7,289.2,296.25,286.4,297.1,290.7,295.2,285.7,282.7,285.75,273.4,293.75,288.0,301.4,300.45,291.2,290.1,297.2,297.85,292.4,293.75,286.65,291.4,285.7,282.3,289.75,285.35,286.7,293.8,283.9,278.35,283.85,281.5,288.1,278.3,271.05,258.35,260.5,263.0,256.2,252.9,256.75,255.3,261.5,253.2,256.8,255.2,317.25,326.25,317.65,290.4,289.0,297.85,277.25,283.3,287.8,280.35,288.75,283.05,316.6,300.5,305.25,289.0,289.4,275.9,283.1,283.5,276.1,277.8,270.45,286.95,293.0,283.0,290.85,280.65,280.2,273.3,277.15,272.0,277.0,271.1,277.2,271.3,275.85,263.8,266.45,264.3,267.0,275.1,269.7,274.6,263.65,267.1,268.0,260.5,268.1,261.85,270.5,261.2,257.0,264.2,262.2,267.7,288.35,266.1,272.75,273.95,276.0,265.2,271.55,265.55,276.35,271.6,272.0,291.0,287.95,292.85,282.35,274.9,280.95,280.2,272.55,276.55,272.6,276.5,287.0,287.95,277.8,305.1,291.15,299.3,289.3,292.25,303.0,297.8,310.65,308.1,307.5,325.2,326.55,326.35,312.3,310.75,324.0,300.65,316.25,305.8,312.7,322.2,315.3,322.35,322.35,312.45,313.3,322.55,318.2,317.7,323.75,345.75,342.2,355.55,370.8,385.0,346.55,359.1,353.15,335.5,335.65,319.75,323.85,332.6,348.9,369.6,367.35,354.15,359.6,348.55,343.0,364.0,348.95,363.3,360.75,375.5,372.9,391.85,372.75,371.45,386.75,378.3,395.5,391.5,408.75,404.5,428.0,418.1,407.1,396.4,412.1,415.9,392.25,399.6,417.6,426.1,398.0,382.75,394.3,373.5,393.85,382.3,396.75,393.75,408.55,392.85,386.2,392.75,409.95,405.95,398.1,404.15,418.15,412.45,429.0,422.2,444.5,451.7,455.75,433.9,443.5,423.15,421.7,426.4,411.5,424.6,429.65,442.75,424.9,423.7,423.65,433.4,430.5,421.45,416.1,423.2,440.5,442.95,423.85,420.0,422.75,437.5,447.25,433.0,445.6,472.75,461.05,478.5,463.15,473.65,457.15,487.9,494.4,537.5,494.5,534.35,559.4,556.65,571.85,540.5,562.6,545.4,548.5,584.0,583.85,644.5,630.75,725.75,645.5,644.5,567.25,584.0,619.5,671.5,616.4,648.25,614.75,626.5,636.7,581.5,603.5,568.25,594.9,578.4,625.65,618.25,636.0,644.8,616.0,640.75,608.3,648.75,642.25,670.0,684.5,638.6,653.85,654.4,663.5,690.4,672.5,686.5,660.75,670.75,644.1,659.6,642.85,647.75,683.5,663.5,670.85,653.0,673.5,711.75,735.35,726.75,761.75,757.35,841.75,790.25,836.25,783.75,787.0,840.75,893.75,862.0,921.25,889.75,905.0,945.75,986.25,1023.5,897.0,934.25,951.5,854.25,863.0,928.25,873.0,864.0,932.75,923.25,981.75,973.0,863.75,784.75,836.5,742.75,864.25,892.5,918.0,726.0,772.25,734.0,714.0,817.0,771.0,872.5,881.0,813.0,906.5,878.5,896.0,989.75,911.0,957.0,921.25,879.5,870.0,909.0,903.5,921.5,987.0,946.5,920.25,941.0,908.5,952.25,932.0,960.5,934.25,949.75,1020.5,990.5,1054.75,1064.0,1034.0,1091.75,1107.5,1183.0,1218.25,1125.75,1080.5,1158.0,1096.5,1118.5,1052.25,1118.25,1092.75,1134.0,1093.5,1146.5,1127.5,1143.75,1172.0,1241.25,1183.75,1248.0,1223.0,1256.0,1186.0,1211.75,1164.0,1194.5,1218.0,1240.25,1243.0,1281.5,1289.0,1380.75,1319.0,1384.25,1416.25,1336.5,1426.0,1382.0,1403.5,1358.0,1383.5,1316.0,1347.5,1356.75,1414.5,1437.0,1398.5,1441.25,1434.5,1505.0,1546.5,1488.25,1527.0,1548.4,1519.0,1546.0,1495.25,1592.5,1613.5,1770.0,1877.75,1716.5,1896.5,1810.25,1615.0,1687.0,1623.0,1735.0,1794.0,1686.0,1751.0,1739.0,1590.0,1537.5,1652.5,1659.0,1759.5,1716.0,1788.0,1721.0,1646.75,1694.0,1622.5,1670.5,1661.25,1585.5,1537.5,1633.25,1576.0,1628.5,1569.5,1565.5,1618.75,1595.0,1594.75,1662.5,1657.75,1772.5,1755.25,1790.0,1737.5,1704.0,1679.0,1735.75,1747.25,1693.0,1712.5,1632.25,1663.5,1692.5,1656.75,1675.75,1568.5,1608.5,1577.0,1611.5,1581.5,1378.0,1462.25,1469.5,1353.75,1410.25,1410.0,1386.0,1203.25,1225.5,1340.0,1285.75,1275.5,1360.75,1425.5,1308.25,1363.5,1293.75,1255.5,1317.0,1349.5,1283.75,1231.75,1213.0,1255.25,1195.0,1238.0,1239.5,1270.0,1246.5,1326.0,1327.75,1371.0,1379.0,1295.0,1324.5,1283.5,1311.0,1289.0,1294.5,1244.75,1264.5,1323.0,1343.25,1297.5,1307.5,1284.5,1315.0,1281.0,1267.25,1223.0,1208.5,1193.25,1251.75,1173.25,1145.0,1202.0,1178.75,1228.25,1177.0,1192.0,1275.5,1298.0,1281.0,1225.25,1220.0,1161.0,1149.0,1209.4,1181.25,1204.6,1179.0,1216.3,1228.15,1189.45,1178.25,1198.15,1164.3,1154.75,1083.75,1085.0,1116.8,1154.25,1125.5,1105.5,1145.5,1106.3,1183.35,1171.5,1107.3,1070.5,1085.15,1050.6,1067.2,1062.25,1104.7,1081.1,1123.6,1239.5,1203.65,1271.5,1233.6,1269.6,1215.0,1259.2,1230.85,1296.5,1281.0,1210.5,1284.1,1265.75,1313.85,1370.0,1325.7,1364.4,1330.0,1349.1,1305.7,1348.75,1314.25,1335.85,1255.0,1252.7,1301.7,1304.55,1206.1,1168.75,1174.75,1130.55,1148.65,1217.5,1184.2,1241.75,1225.15,1256.25,1196.55,1246.1,1241.7,1286.1,1281.5,1235.85,1221.0,1251.85,1292.7,1261.3,1251.6,1207.55,1219.4,1262.05,1257.55,1288.3,1287.05,1350.9,1297.35,1306.9,1270.7,1305.15,1267.8,1284.0,1273.7,1294.85,1245.85,1268.05,1312.8,1343.0,1360.25,1328.5,1358.6,1323.5,1332.5,1311.7,1350.65,1325.6,1347.9,1309.2,1324.8,1287.2,1303.95,1305.3,1263.7,1245.85,1262.6,1217.4,1222.75,1179.65,1212.75,1194.7,1206.65,1207.6,1187.4,1233.0,1222.9,1235.05,1197.55,1228.25,1220.45,1239.1,1277.25,1290.35,1278.7,1322.5,1306.75,1345.75,1287.45,1308.4,1319.35,1291.15,1304.65,1276.1,1270.05,1298.9,1276.45,1337.75,1333.2,1429.55,1387.9,1437.05,1406.4,1527.2,1498.7,1541.75,1494.6,1530.85,1466.1,1508.2,1482.55,1509.2,1455.0,1475.7,1456.35,1474.85,1483.95,1582.85,1544.95,1583.45,1552.2,1580.3,1682.35,1662.5,1472.35,1620.95,1588.05,1717.85,1673.05,1734.85,1756.9,1692.0,1731.9,1728.55,1787.4,1810.3,1940.55,2061.5,1931.7,1918.5,1987.95,1964.8,1850.75,1906.4,1918.95,1875.8,1957.45,1876.2,1771.95,1864.5,1820.25,1946.55,1847.8,1867.65,1811.55,1846.55,1807.25,1696.05,1736.35,1739.25,1685.35,1788.4,1764.15,1814.3,1867.4,1907.7,1891.95,1792.35,1757.8,1832.0,1797.4,1828.25,1729.55,1794.05,1823.85,1797.95,1757.15,1730.95,1797.15,1778.15,1778.1,1872.25,1790.8,1773.5,1807.5,1786.05,1820.1,1836.7,1790.2,1826.25,1886.55,1968.35,2017.15,1918.75,1956.65,1975.25,1975.95,1857.9,1805.8,1864.3,1829.7,1849.85,1838.05,1737.05,1686.55,1758.9,1793.5,1732.8,1762.4,1727.05,1664.3,1618.2,1711.5,1624.55,1620.65,1764.75,1735.75,1800.75,1775.95,1805.4,1857.55,1928.75,1925.6,1954.9,1824.5,1810.2,1817.5,1981.95,1949.85,2022.3,1976.1,2038.9,1965.55,1981.2,1942.5,1964.1,1904.05,1925.05,1981.5,1975.2,1936.9,1890.1,1944.2,1912.15,1935.0,1823.25,1821.9,1984.2,1997.6,1937.45,1992.15,2066.95,1981.55,2043.65,2074.9,2012.2,2029.5,2054.2,1990.8,2025.25,2168.65,2153.4,2168.35,2394.8,2298.15,2349.8,2308.7,2444.35,2340.9,2297.65,2364.0,2329.0,2470.35,2371.25,2461.75,2396.3,2521.55,2474.45,2571.35,2668.9,2617.55,2734.3,2783.95,2667.05,2548.45,2706.25,2637.25,2713.6,2613.75,2631.8,2760.15,2743.7,2873.8,2953.05,2861.4,2999.85,3021.85,3025.1,3324.35,3454.7,3225.75,3171.35,3330.1,3420.2,3319.5,3277.25,3333.7,3430.15,3294.9,3397.1,3328.4,3407.5,3654.1,3657.85,3860.7,4225.55,4338.25,3910.2,4234.3,4034.3,4254.1,4191.4,4481.85,4307.95,4664.95,5501.7,4685.45,5049.89,5214.24,5137.1]},"Palladium":{"t":["1990-04-02","1990-04-06","1990-04-10","1990-04-20","1990-04-24","1990-05-01","1990-05-08","1990-05-17","1990-05-21","1990-05-29","1990-06-05","1990-06-12","1990-06-15","1990-06-27","1990-07-02","1990-07-06","1990-07-12","1990-07-24","1990-07-25","1990-08-02","1990-08-10","1990-08-14","1990-08-23","1990-08-28","1990-09-06","1990-09-12","1990-09-18","1990-09-24","1990-10-01","1990-10-09","1990-10-12","1990-10-17","1990-10-24","1990-10-31","1990-11-05","1990-11-13","1990-11-20","1990-11-27","1990-12-03","1990-12-11","1990-12-14","1990-12-20","1990-12-31","1991-01-07","1991-01-14","1991-01-17","1991-01-29","1991-01-30","1991-02-11","1991-02-18","1991-02-22","1991-03-01","1991-03-06","1991-03-11","1991-03-15","1991-03-26","1991-04-03","1991-04-08","1991-04-18","1991-04-22","1991-04-26","1991-05-03","1991-05-10","1991-05-16","1991-05-29","1991-05-31","1991-06-06","1991-06-18","1991-06-21","1991-06-27","1991-07-02","1991-07-08","1991-07-16","1991-07-23","1991-07-31","1991-08-05","1991-08-08","1991-08-16","1991-08-22","1991-09-03","1991-09-04","1991-09-16","1991-09-17","1991-09-26","1991-10-01","1991-10-10","1991-10-14","1991-10-18","1991-10-29","1991-11-04","1991-11-08","1991-11-13","1991-11-20","1991-11-28","1991-12-03","1991-12-09","1991-12-20","1991-12-27","1992-01-06","1992-01-13","1992-01-17","1992-01-21","1992-01-30","1992-02-06","1992-02-11","1992-02-19","1992-02-26","1992-03-03","1992-03-06","1992-03-12","1992-03-19","1992-03-24","1992-04-01","1992-04-09","1992-04-13","1992-04-21","1992-04-29","1992-05-05","1992-05-12","1992-05-19","1992-06-01","1992-06-03","1992-06-08","1992-06-15","1992-06-24","1992-06-29","1992-07-08","1992-07-14","1992-07-16","1992-07-23","1992-07-31","1992-08-04","1992-08-12","1992-08-18","1992-08-24","1992-09-02","1992-09-09","1992-09-11","1992-09-21","1992-09-28","1992-10-01","1992-10-12","1992-10-14","1992-10-21","1992-10-29","1992-11-05","1992-11-11","1992-11-18","1992-11-25","1992-11-30","1992-12-08","1992-12-14","1992-12-16","1992-12-23","1993-01-07","1993-01-11","1993-01-15","1993-01-21","1993-02-01","1993-02-05","1993-02-11","1993-02-17","1993-02-25","1993-03-03","1993-03-10","1993-03-12","1993-03-23","1993-03-26","1993-04-06","1993-04-08","1993-04-16","1993-04-23","1993-05-05","1993-05-07","1993-05-13","1993-05-21","1993-05-28","1993-06-03","1993-06-11","1993-06-18","1993-06-23","1993-07-02","1993-07-09","1993-07-12","1993-07-22","1993-07-27","1993-08-04","1993-08-06","1993-08-12","1993-08-23","1993-08-26","1993-09-06","1993-09-08","1993-09-15","1993-09-21","1993-09-28","1993-10-06","1993-10-14","1993-10-20","1993-10-22","1993-11-02","1993-11-05","1993-11-11","1993-11-17","1993-11-29","1993-12-01","1993-12-08","1993-12-14","1993-12-23","1993-12-31","1994-01-05","1994-01-11","1994-01-18","1994-01-28","1994-01-31","1994-02-10","1994-02-16","1994-02-23","1994-03-01","1994-03-04","1994-03-11","1994-03-17","1994-03-25","1994-04-05","1994-04-07","1994-04-18","1994-04-20","1994-05-03","1994-05-06","1994-05-11","1994-05-17","1994-05-24","1994-06-03","1994-06-07","1994-06-16","1994-06-17","1994-06-28","1994-07-04","1994-07-07","1994-07-15","1994-07-25","1994-07-27","1994-08-02","1994-08-09","1994-08-19","1994-08-22","1994-08-26","1994-09-08","1994-09-15","1994-09-21","1994-09-26","1994-09-29","1994-10-07","1994-10-13","1994-10-24","1994-10-28","1994-11-03","1994-11-08","1994-11-15","1994-11-21","1994-11-30","1994-12-06","1994-12-13","1994-12-15","1994-12-29","1995-01-05","1995-01-12","1995-01-16","1995-01-23","1995-01-30","1995-02-01","1995-02-13","1995-02-17","1995-02-27","1995-03-02","1995-03-07","1995-03-13","1995-03-22","1995-03-24","1995-04-05","1995-04-11","1995-04-19","1995-04-25","1995-05-02","1995-05-10","1995-05-16","1995-05-22","1995-05-30","1995-06-06","1995-06-13","1995-06-14","1995-06-23","1995-06-28","1995-07-05","1995-07-11","1995-07-21","1995-07-27","1995-08-03","1995-08-09","1995-08-14","1995-08-18","1995-08-29","1995-08-31","1995-09-06","1995-09-18","1995-09-25","1995-09-29","1995-10-06","1995-10-10","1995-10-18","1995-10-24","1995-11-01","1995-11-07","1995-11-10","1995-11-21","1995-11-22","1995-12-04","1995-12-06","1995-12-12","1995-12-20","1995-12-29","1996-01-03","1996-01-12","1996-01-16","1996-01-25","1996-02-01","1996-02-05","1996-02-12","1996-02-16","1996-02-26","1996-03-05","1996-03-12","1996-03-15","1996-03-20","1996-03-27","1996-04-09","1996-04-12","1996-04-22","1996-04-26","1996-04-30","1996-05-08","1996-05-16","1996-05-21","1996-05-30","1996-06-06","1996-06-10","1996-06-20","1996-06-24","1996-07-03","1996-07-09","1996-07-16","1996-07-23","1996-07-26","1996-08-01","1996-08-07","1996-08-13","1996-08-19","1996-08-29","1996-09-05","1996-09-12","1996-09-19","1996-09-24","1996-09-26","1996-10-04","1996-10-09","1996-10-18","1996-10-23","1996-10-30","1996-11-07","1996-11-14","1996-11-21","1996-11-28","1996-12-02","1996-12-11","1996-12-12","1996-12-24","1997-01-02","1997-01-06","1997-01-10","1997-01-22","1997-01-28","1997-01-31","1997-02-11","1997-02-13","1997-02-20","1997-02-27","1997-03-06","1997-03-11","1997-03-19","1997-03-21","1997-04-04","1997-04-10","1997-04-16","1997-04-21","1997-04-25","1997-05-08","1997-05-12","1997-05-21","1997-05-23","1997-06-03","1997-06-06","1997-06-13","1997-06-23","1997-06-25","1997-07-02","1997-07-10","1997-07-17","1997-07-23","1997-07-29","1997-08-05","1997-08-07","1997-08-14","1997-08-20","1997-08-28","1997-09-09","1997-09-12","1997-09-22","1997-09-23","1997-10-02","1997-10-07","1997-10-16","1997-10-22","1997-10-29","1997-11-03","1997-11-12","1997-11-17","1997-11-20","1997-12-01","1997-12-02","1997-12-10","1997-12-17","1997-12-23","1997-12-31","1998-01-07","1998-01-14","1998-01-20","1998-01-29","1998-02-02","1998-02-10","1998-02-19","1998-02-25","1998-03-02","1998-03-09","1998-03-13","1998-03-18","1998-03-24","1998-03-31","1998-04-07","1998-04-17","1998-04-23","1998-04-28","1998-05-11","1998-05-14","1998-05-19","1998-05-29","1998-06-03","1998-06-09","1998-06-16","1998-06-24","1998-06-26","1998-07-06","1998-07-14","1998-07-17","1998-07-23","1998-08-03","1998-08-05","1998-08-14","1998-08-19","1998-08-24","1998-08-28","1998-09-08","1998-09-14","1998-09-22","1998-09-25","1998-10-01","1998-10-12","1998-10-15","1998-10-22","1998-10-28","1998-11-03","1998-11-11","1998-11-19","1998-11-20","1998-11-27","1998-12-08","1998-12-10","1998-12-17","1998-12-23","1999-01-04","1999-01-08","1999-01-15","1999-01-25","1999-01-29","1999-02-05","1999-02-10","1999-02-18","1999-02-26","1999-03-05","1999-03-12","1999-03-18","1999-03-25","1999-03-26","1999-04-06","1999-04-15","1999-04-20","1999-04-27","1999-05-05","1999-05-07","1999-05-14","1999-05-20","1999-06-01","1999-06-09","1999-06-14","1999-06-21","1999-06-24","1999-07-05","1999-07-09","1999-07-15","1999-07-20","1999-07-26","1999-08-03","1999-08-09","1999-08-16","1999-08-23","1999-08-31","1999-09-03","1999-09-14","1999-09-15","1999-09-27","1999-09-29","1999-10-06","1999-10-12","1999-10-19","1999-10-26","1999-11-03","1999-11-08","1999-11-11","1999-11-19","1999-11-25","1999-11-30","1999-12-10","1999-12-17","1999-12-22","1999-12-30","2000-01-07","2000-01-18","2000-01-25","2000-01-31","2000-02-07","2000-02-08","2000-02-14","2000-02-21","2000-02-25","2000-03-07","2000-03-10","2000-03-20","2000-03-24","2000-04-03","2000-04-05","2000-04-11","2000-04-19","2000-05-02","2000-05-04","2000-05-11","2000-05-19","2000-05-25","2000-06-02","2000-06-08","2000-06-19","2000-06-23","2000-06-29","2000-07-05","2000-07-10","2000-07-14","2000-07-21","2000-08-01","2000-08-08","2000-08-10","2000-08-17","2000-08-25","2000-09-04","2000-09-08","2000-09-15","2000-09-22","2000-09-28","2000-10-02","2000-10-06","2000-10-16","2000-10-23","2000-10-31","2000-11-03","2000-11-09","2000-11-17","2000-11-24","2000-11-29","2000-12-04","2000-12-12","2000-12-19","2000-12-22","2001-01-05","2001-01-11","2001-01-18","2001-01-22","2001-02-01","2001-02-06","2001-02-13","2001-02-19","2001-02-23","2001-03-05","2001-03-09","2001-03-13","2001-03-19","2001-03-28","2001-04-05","2001-04-12","2001-04-18","2001-04-24","2001-05-02","2001-05-08","2001-05-14","2001-05-21","2001-05-29","2001-06-01","2001-06-13","2001-06-20","2001-06-27","2001-06-29","2001-07-10","2001-07-16","2001-07-20","2001-07-24","2001-08-03","2001-08-08","2001-08-13","2001-08-20","2001-08-29","2001-08-31","2001-09-12","2001-09-19","2001-09-25","2001-10-02","2001-10-03","2001-10-15","2001-10-19","2001-10-23","2001-10-29","2001-11-02","2001-11-14","2001-11-19","2001-11-28","2001-12-04","2001-12-07","2001-12-13","2001-12-21","2001-12-27","2002-01-07","2002-01-14","2002-01-16","2002-01-25","2002-02-01","2002-02-05","2002-02-14","2002-02-21","2002-02-27","2002-03-06","2002-03-08","2002-03-14","2002-03-26","2002-04-02","2002-04-08","2002-04-12","2002-04-24","2002-04-26","2002-05-03","2002-05-14","2002-05-21","2002-05-23","2002-05-29","2002-06-07","2002-06-14","2002-06-20","2002-06-26","2002-07-02","2002-07-10","2002-07-15","2002-07-24","2002-07-29","2002-08-02","2002-08-12","2002-08-20","2002-08-28","2002-09-03","2002-09-10","2002-09-11","2002-09-18","2002-09-27","2002-10-03","2002-10-08","2002-10-17","2002-10-22","2002-10-25","2002-11-05","2002-11-12","2002-11-18","2002-11-25","2002-11-27","2002-12-06","2002-12-10","2002-12-16","2002-12-23","2003-01-07","2003-01-10","2003-01-14","2003-01-22","2003-01-31","2003-02-04","2003-02-11","2003-02-14","2003-02-26","2003-02-27","2003-03-11","2003-03-14","2003-03-24","2003-03-27","2003-04-04","2003-04-11","2003-04-17","2003-04-23","2003-04-29","2003-05-08","2003-05-15","2003-05-21","2003-05-27","2003-06-06","2003-06-10","2003-06-16","2003-06-20","2003-07-02","2003-07-07","2003-07-10","2003-07-18","2003-07-23","2003-08-01","2003-08-06","2003-08-14","2003-08-19","2003-08-26","2003-09-03","2003-09-09","2003-09-15","2003-09-19","2003-09-26","2003-10-02","2003-10-13","2003-10-16","2003-10-27","2003-10-30","2003-11-06","2003-11-12","2003-11-18","2003-11-26","2003-12-02","2003-12-09","2003-12-11","2003-12-19","2003-12-24","2004-01-05","2004-01-13","2004-01-20","2004-01-23","2004-01-30","2004-02-05","2004-02-13","2004-02-23","2004-02-24","2004-03-04","2004-03-12","2004-03-18","2004-03-23","2004-03-31","2004-04-02","2004-04-13","2004-04-22","2004-04-27","2004-04-29","2004-05-07","2004-05-14","2004-05-25","2004-06-02","2004-06-08","2004-06-10","2004-06-21","2004-06-25","2004-07-02","2004-07-09","2004-07-14","2004-07-20","2004-07-29","2004-08-03","2004-08-06","2004-08-16","2004-08-23","2004-08-25","2004-09-02","2004-09-10","2004-09-20","2004-09-27","2004-09-30","2004-10-08","2004-10-13","2004-10-15","2004-10-26","2004-11-03","2004-11-05","2004-11-15","2004-11-18","2004-11-25","2004-12-02","2004-12-08","2004-12-17","2004-12-23","2004-12-31","2005-01-05","2005-01-11","2005-01-18","2005-01-25","2005-02-02","2005-02-07","2005-02-15","2005-02-21","2005-03-02","2005-03-04","2005-03-11","2005-03-17","2005-03-24","2005-04-01","2005-04-08","2005-04-13","2005-04-21","2005-04-29","2005-05-04","2005-05-11","2005-05-17","2005-05-27","2005-06-03","2005-06-07","2005-06-13","2005-06-22","2005-06-27","2005-07-05","2005-07-08","2005-07-18","2005-07-22","2005-07-27","2005-08-04","2005-08-10","2005-08-16","2005-08-22","2005-08-26","2005-09-06","2005-09-15","2005-09-20","2005-09-26","2005-10-05","2005-10-11","2005-10-18","2005-10-24","2005-10-27","2005-11-02","2005-11-08","2005-11-14","2005-11-21","2005-12-01","2005-12-02","2005-12-12","2005-12-15","2005-12-22","2006-01-04","2006-01-06","2006-01-16","2006-01-19","2006-01-30","2006-02-03","2006-02-08","2006-02-16","2006-02-21","2006-03-03","2006-03-09","2006-03-16","2006-03-21","2006-03-28","2006-04-05","2006-04-06","2006-04-13","2006-04-21","2006-05-03","2006-05-11","2006-05-12","2006-05-22","2006-05-26","2006-06-05","2006-06-13","2006-06-16","2006-06-22","2006-06-29","2006-07-04","2006-07-14","2006-07-19","2006-07-24","2006-08-03","2006-08-09","2006-08-15","2006-08-17","2006-08-24","2006-09-05","2006-09-07","2006-09-13","2006-09-20","2006-09-29","2006-10-04","2006-10-11","2006-10-16","2006-10-24","2006-10-31","2006-11-03","2006-11-10","2006-11-17","2006-11-27","2006-11-29","2006-12-06","2006-12-12","2006-12-19","2006-12-29","2007-01-05","2007-01-11","2007-01-17","2007-01-26","2007-01-30","2007-02-07","2007-02-13","2007-02-21","2007-02-26","2007-03-05","2007-03-09","2007-03-14","2007-03-22","2007-03-29","2007-04-10","2007-04-12","2007-04-20","2007-04-27","2007-05-04","2007-05-11","2007-05-21","2007-05-22","2007-05-30","2007-06-05","2007-06-13","2007-06-21","2007-06-27","2007-07-04","2007-07-06","2007-07-13","2007-07-23","2007-07-30","2007-08-06","2007-08-09","2007-08-17","2007-08-22","2007-08-28","2007-09-07","2007-09-12","2007-09-18","2007-09-21","2007-09-27","2007-10-05","2007-10-15","2007-10-22","2007-10-26","2007-11-02","2007-11-07","2007-11-12","2007-11-21","2007-11-28","2007-11-30","2007-12-07","2007-12-14","2007-12-24","2008-01-02","2008-01-07","2008-01-14","2008-01-22","2008-01-25","2008-01-31","2008-02-07","2008-02-13","2008-02-21","2008-02-29","2008-03-04","2008-03-11","2008-03-20","2008-03-26","2008-04-01","2008-04-11","2008-04-16","2008-04-23","2008-04-30","2008-05-02","2008-05-09","2008-05-15","2008-05-22","2008-05-30","2008-06-10","2008-06-17","2008-06-23","2008-06-25","2008-07-03","2008-07-09","2008-07-15","2008-07-23","2008-07-29","2008-08-06","2008-08-12","2008-08-19","2008-08-22","2008-09-01","2008-09-08","2008-09-11","2008-09-22","2008-09-25","2008-09-30","2008-10-06","2008-10-14","2008-10-17","2008-10-27","2008-10-30","2008-11-07","2008-11-18","2008-11-20","2008-11-26","2008-12-03","2008-12-11","2008-12-15","2008-12-23","2009-01-06","2009-01-07","2009-01-15","2009-01-26","2009-01-29","2009-02-04","2009-02-12","2009-02-18","2009-02-25","2009-03-03","2009-03-06","2009-03-13","2009-03-19","2009-03-27","2009-03-31","2009-04-14","2009-04-21","2009-04-27","2009-05-01","2009-05-08","2009-05-14","2009-05-21","2009-05-28","2009-06-05","2009-06-08","2009-06-16","2009-06-23","2009-06-30","2009-07-08","2009-07-13","2009-07-16","2009-07-28","2009-07-30","2009-08-05","2009-08-12","2009-08-19","2009-08-26","2009-09-02","2009-09-08","2009-09-14","2009-09-23","2009-09-28","2009-10-06","2009-10-13","2009-10-16","2009-10-21","2009-10-29","2009-11-03","2009-11-10","2009-11-18","2009-11-20","2009-12-03","2009-12-07","2009-12-10","2009-12-22","2009-12-23","2010-01-05","2010-01-13","2010-01-19","2010-01-27","2010-02-02","2010-02-05","2010-02-10","2010-02-17","2010-02-25","2010-03-05","2010-03-11","2010-03-17","2010-03-25","2010-03-26","2010-04-01","2010-04-13","2010-04-21","2010-04-26","2010-05-06","2010-05-13","2010-05-17","2010-05-21","2010-05-28","2010-06-07","2010-06-10","2010-06-21","2010-06-28","2010-07-01","2010-07-07","2010-07-14","2010-07-20","2010-07-29","2010-08-03","2010-08-10","2010-08-18","2010-08-24","2010-08-31","2010-09-03","2010-09-13","2010-09-15","2010-09-21","2010-09-28","2010-10-07","2010-10-12","2010-10-20","2010-10-27","2010-11-03","2010-11-09","2010-11-15","2010-11-17","2010-11-29","2010-12-03","2010-12-08","2010-12-14","2010-12-20","2010-12-30","2011-01-07","2011-01-13","2011-01-24","2011-01-25","2011-02-02","2011-02-10","2011-02-16","2011-02-21","2011-02-24","2011-03-03","2011-03-15","2011-03-17","2011-03-24","2011-03-29","2011-04-05","2011-04-11","2011-04-19","2011-05-03","2011-05-06","2011-05-16","2011-05-18","2011-05-25","2011-06-03","2011-06-10","2011-06-17","2011-06-22","2011-06-27","2011-07-06","2011-07-12","2011-07-19","2011-07-27","2011-08-01","2011-08-05","2011-08-12","2011-08-18","2011-08-26","2011-09-01","2011-09-09","2011-09-13","2011-09-21","2011-09-26","2011-10-05","2011-10-10","2011-10-17","2011-10-21","2011-10-28","2011-11-02","2011-11-09","2011-11-16","2011-11-25","2011-11-30","2011-12-07","2011-12-15","2011-12-16","2011-12-28","2012-01-09","2012-01-11","2012-01-16","2012-01-26","2012-01-30","2012-02-03","2012-02-09","2012-02-16","2012-02-23","2012-02-29","2012-03-07","2012-03-13","2012-03-21","2012-03-29","2012-04-03","2012-04-11","2012-04-18","2012-04-24","2012-05-01","2012-05-11","2012-05-14","2012-05-21","2012-05-25","2012-06-07","2012-06-15","2012-06-20","2012-06-27","2012-07-04","2012-07-06","2012-07-17","2012-07-24","2012-07-30","2012-07-31","2012-08-09","2012-08-16","2012-08-24","2012-08-31","2012-09-05","2012-09-12","2012-09-17","2012-09-26","2012-10-01","2012-10-05","2012-10-15","2012-10-18","2012-10-24","2012-10-30","2012-11-07","2012-11-12","2012-11-19","2012-11-29","2012-11-30","2012-12-10","2012-12-13","2012-12-21","2012-12-28","2013-01-08","2013-01-15","2013-01-21","2013-01-30","2013-01-31","2013-02-06","2013-02-13","2013-02-21","2013-02-28","2013-03-04","2013-03-11","2013-03-20","2013-03-25","2013-04-02","2013-04-09","2013-04-15","2013-04-23","2013-04-30","2013-05-08","2013-05-10","2013-05-22","2013-05-28","2013-05-31","2013-06-11","2013-06-17","2013-06-20","2013-06-27","2013-07-08","2013-07-11","2013-07-19","2013-07-22","2013-07-29","2013-08-07","2013-08-09","2013-08-19","2013-08-28","2013-08-30","2013-09-06","2013-09-12","2013-09-20","2013-09-30","2013-10-04","2013-10-07","2013-10-16","2013-10-18","2013-10-30","2013-11-01","2013-11-08","2013-11-19","2013-11-25","2013-11-27","2013-12-03","2013-12-10","2013-12-19","2013-12-24","2014-01-03","2014-01-13","2014-01-15","2014-01-23","2014-01-31","2014-02-04","2014-02-07","2014-02-14","2014-02-26","2014-03-04","2014-03-06","2014-03-12","2014-03-24","2014-03-27","2014-04-04","2014-04-09","2014-04-14","2014-04-22","2014-05-02","2014-05-12","2014-05-14","2014-05-20","2014-05-28","2014-06-04","2014-06-12","2014-06-16","2014-06-23","2014-06-27","2014-07-09","2014-07-11","2014-07-17","2014-07-24","2014-07-31","2014-08-06","2014-08-15","2014-08-21","2014-08-28","2014-09-01","2014-09-08","2014-09-12","2014-09-24","2014-10-01","2014-10-06","2014-10-09","2014-10-17","2014-10-24","2014-11-03","2014-11-07","2014-11-12","2014-11-20","2014-11-25","2014-12-03","2014-12-04","2014-12-12","2014-12-18","2014-12-29","2015-01-08","2015-01-13","2015-01-19","2015-01-28","2015-02-02","2015-02-06","2015-02-11","2015-02-23","2015-02-26","2015-03-05","2015-03-09","2015-03-18","2015-03-26","2015-03-31","2015-04-07","2015-04-14","2015-04-17","2015-04-27","2015-05-06","2015-05-11","2015-05-14","2015-05-28","2015-05-29","2015-06-05","2015-06-16","2015-06-22","2015-06-29","2015-07-02","2015-07-08","2015-07-14","2015-07-20","2015-07-29","2015-08-04","2015-08-11","2015-08-17","2015-08-25","2015-09-01","2015-09-04","2015-09-15","2015-09-21","2015-09-25","2015-09-29","2015-10-05","2015-10-12","2015-10-22","2015-10-23","2015-10-30","2015-11-05","2015-11-16","2015-11-24","2015-11-27","2015-12-03","2015-12-08","2015-12-16","2015-12-24","2016-01-05","2016-01-12","2016-01-13","2016-01-22","2016-01-26","2016-02-05","2016-02-08","2016-02-12","2016-02-19","2016-02-29","2016-03-08","2016-03-15","2016-03-18","2016-03-23","2016-04-01","2016-04-07","2016-04-14","2016-04-22","2016-04-29","2016-05-04","2016-05-12","2016-05-17","2016-05-25","2016-06-03","2016-06-08","2016-06-14","2016-06-20","2016-06-27","2016-07-01","2016-07-08","2016-07-18","2016-07-22","2016-08-01","2016-08-08","2016-08-10","2016-08-15","2016-08-22","2016-09-02","2016-09-07","2016-09-15","2016-09-20","2016-09-26","2016-10-03","2016-10-06","2016-10-14","2016-10-21","2016-10-25","2016-11-04","2016-11-10","2016-11-14","2016-11-22","2016-12-01","2016-12-05","2016-12-14","2016-12-16","2016-12-22","2017-01-03","2017-01-06","2017-01-16","2017-01-23","2017-01-27","2017-02-02","2017-02-09","2017-02-17","2017-02-21","2017-02-28","2017-03-10","2017-03-15","2017-03-17","2017-03-24","2017-03-30","2017-04-06","2017-04-19","2017-04-21","2017-04-28","2017-05-10","2017-05-15","2017-05-22","2017-05-25","2017-06-02","2017-06-12","2017-06-15","2017-06-23","2017-06-30","2017-07-10","2017-07-13","2017-07-21","2017-07-24","2017-08-02","2017-08-07","2017-08-16","2017-08-18","2017-08-30","2017-09-04","2017-09-07","2017-09-13","2017-09-20","2017-10-02","2017-10-03","2017-10-13","2017-10-16","2017-10-20","2017-10-30","2017-11-02","2017-11-09","2017-11-15","2017-11-22","2017-11-29","2017-12-06","2017-12-15","2017-12-19","2018-01-02","2018-01-04","2018-01-15","2018-01-17","2018-01-25","2018-02-01","2018-02-05","2018-02-09","2018-02-19","2018-02-27","2018-03-02","2018-03-08","2018-03-14","2018-03-26","2018-04-04","2018-04-09","2018-04-13","2018-04-19","2018-04-24","2018-05-02","2018-05-11","2018-05-15","2018-05-22","2018-05-30","2018-06-07","2018-06-14","2018-06-21","2018-06-26","2018-06-29","2018-07-09","2018-07-16","2018-07-20","2018-07-26","2018-08-01","2018-08-09","2018-08-16","2018-08-20","2018-08-30","2018-09-04","2018-09-11","2018-09-17","2018-09-21","2018-09-28","2018-10-04","2018-10-12","2018-10-23","2018-10-26","2018-10-31","2018-11-06","2018-11-14","2018-11-19","2018-11-26","2018-12-05","2018-12-07","2018-12-13","2018-12-24","2019-01-04","2019-01-09","2019-01-14","2019-01-18","2019-01-25","2019-01-31","2019-02-11","2019-02-15","2019-02-20","2019-02-27","2019-03-06","2019-03-11","2019-03-21","2019-03-26","2019-03-29","2019-04-05","2019-04-11","2019-04-25","2019-04-29","2019-05-02","2019-05-10","2019-05-16","2019-05-23","2019-05-31","2019-06-10","2019-06-14","2019-06-20","2019-06-27","2019-07-05","2019-07-11","2019-07-17","2019-07-22","2019-07-30","2019-08-02","2019-08-12","2019-08-21","2019-08-28","2019-09-02","2019-09-10","2019-09-13","2019-09-19","2019-09-25","2019-10-03","2019-10-08","2019-10-17","2019-10-24","2019-10-29","2019-11-04","2019-11-12","2019-11-18","2019-11-20","2019-11-29","2019-12-09","2019-12-13","2019-12-17","2019-12-24","2020-01-03","2020-01-13","2020-01-20","2020-01-22","2020-01-30","2020-02-05","2020-02-11","2020-02-19","2020-02-21","2020-02-27","2020-03-10","2020-03-17","2020-03-23","2020-03-27","2020-04-06","2020-04-14","2020-04-20","2020-04-22","2020-04-30","2020-05-06","2020-05-15","2020-05-20","2020-05-29","2020-06-02","2020-06-09","2020-06-15","2020-06-24","2020-06-26","2020-07-08","2020-07-09","2020-07-17","2020-07-28","2020-07-30","2020-08-06","2020-08-12","2020-08-18","2020-08-26","2020-09-03","2020-09-09","2020-09-16","2020-09-23","2020-09-28","2020-10-01","2020-10-12","2020-10-15","2020-10-22","2020-10-30","2020-11-06","2020-11-10","2020-11-17","2020-11-25","2020-12-02","2020-12-04","2020-12-10","2020-12-17","2020-12-30","2021-01-06","2021-01-11","2021-01-15","2021-01-25","2021-02-03","2021-02-05","2021-02-15","2021-02-19","2021-02-25","2021-03-02","2021-03-10","2021-03-18","2021-03-25","2021-03-30","2021-04-01","2021-04-12","2021-04-19","2021-04-27","2021-05-05","2021-05-13","2021-05-18","2021-05-25","2021-06-01","2021-06-07","2021-06-15","2021-06-21","2021-06-25","2021-07-02","2021-07-06","2021-07-13","2021-07-20","2021-07-26","2021-08-03","2021-08-10","2021-08-16","2021-08-20","2021-08-31","2021-09-06","2021-09-14","2021-09-15","2021-09-23","2021-09-30","2021-10-07","2021-10-11","2021-10-18","2021-10-28","2021-11-02","2021-11-10","2021-11-16","2021-11-22","2021-11-26","2021-12-02","2021-12-07","2021-12-15","2021-12-23","2021-12-30","2022-01-06","2022-01-18","2022-01-20","2022-01-27","2022-02-01","2022-02-08","2022-02-16","2022-02-24","2022-02-28","2022-03-07","2022-03-15","2022-03-23","2022-03-28","2022-03-30","2022-04-11","2022-04-12","2022-04-21","2022-04-27","2022-05-05","2022-05-13","2022-05-18","2022-05-25","2022-05-31","2022-06-14","2022-06-17","2022-06-23","2022-06-30","2022-07-05","2022-07-12","2022-07-20","2022-07-28","2022-08-04","2022-08-09","2022-08-12","2022-08-23","2022-08-26","2022-09-05","2022-09-13","2022-09-16","2022-09-27","2022-09-30","2022-10-05","2022-10-17","2022-10-21","2022-10-24","2022-11-03","2022-11-10","2022-11-16","2022-11-21","2022-11-29","2022-12-05","2022-12-12","2022-12-14","2022-12-23","2022-12-28","2023-01-09","2023-01-12","2023-01-19","2023-01-25","2023-01-31","2023-02-09","2023-02-15","2023-02-22","2023-02-27","2023-03-03","2023-03-09","2023-03-16","2023-03-27","2023-03-31","2023-04-06","2023-04-18","2023-04-24","2023-05-03","2023-05-10","2023-05-17","2023-05-22","2023-05-25","2023-06-05","2023-06-12","2023-06-19","2023-06-23","2023-06-27","2023-07-07","2023-07-13","2023-07-19","2023-07-21","2023-07-28","2023-08-09","2023-08-11","2023-08-17","2023-08-23","2023-09-01","2023-09-07","2023-09-14","2023-09-20","2023-09-29","2023-10-06","2023-10-11","2023-10-19","2023-10-23","2023-10-30","2023-11-06","2023-11-10","2023-11-21","2023-11-27","2023-11-30","2023-12-06","2023-12-13","2023-12-18","2023-12-27","2024-01-05","2024-01-11","2024-01-17","2024-01-22","2024-01-30","2024-02-08","2024-02-14","2024-02-19","2024-02-28","2024-03-05","2024-03-08","2024-03-15","2024-03-20","2024-03-27","2024-04-09","2024-04-10","2024-04-17","2024-04-24","2024-05-01","2024-05-10","2024-05-14","2024-05-21","2024-05-30","2024-06-03","2024-06-10","2024-06-18","2024-06-24","2024-06-28","2024-07-05","2024-07-16","2024-07-17","2024-07-26","2024-08-05","2024-08-09","2024-08-13","2024-08-21","2024-08-30","2024-09-04","2024-09-09","2024-09-18","2024-09-23","2024-09-26","2024-10-03","2024-10-11","2024-10-16","2024-10-28","2024-10-29","2024-11-08","2024-11-14","2024-11-20","2024-11-26","2024-12-03","2024-12-06","2024-12-12","2024-12-20","2025-01-02","2025-01-03","2025-01-10","2025-01-21","2025-01-24","2025-01-29","2025-02-05","2025-02-14","2025-02-20","2025-02-28","2025-03-05","2025-03-13","2025-03-18","2025-03-21","2025-04-01","2025-04-04","2025-04-09","2025-04-16","2025-04-30","2025-05-07","2025-05-13","2025-05-21","2025-05-22","2025-05-30","2025-06-09","2025-06-17","2025-06-18","2025-06-30","2025-07-02","2025-07-09","2025-07-18","2025-07-22","2025-07-30","2025-08-01","2025-08-08","2025-08-15","2025-08-21","2025-08-28","2025-09-08","2025-09-12","2025-09-18","2025-09-24","2025-09-30","2025-10-06","2025-10-15","2025-10-22","2025-10-28","2025-11-03","2025-11-07","2025-11-13","2025-11-21","2025-12-01","2025-12-02","2025-12-11","2025-12-19","2025-12-24","2025-12-31","2026-01-09","2026-01-16","2026-01-20","2026-01-29","2026-02-02","2026-02-11","2026-02-13","2026-02-19","2026-02-25","2026-03-09"],"p":[128.0,128.75,128.25,128.75,127.7,118.35,119.85,118.2,122.75,121.25,117.5,117.5,115.25,112.75,116.75,117.5,116.5,118.55,117.25,116.75,114.75,118.5,117.75,111.25,111.4,105.0,106.25,101.25,97.0,100.5,93.5,88.5,95.4,96.5,94.0,94.25,92.75,94.3,92.25,93.0,87.85,89.5,81.75,83.75,93.0,89.25,87.75,82.25,88.4,86.0,79.25,86.35,83.35,89.5,86.1,84.25,92.75,92.25,99.5,96.5,102.65,96.55,94.75,95.0,94.25,100.5,96.0,96.0,99.0,95.25,97.0,97.35,94.75,95.75,87.25,84.5,86.25,78.75,81.5,80.75,81.65,81.5,81.0,83.75,82.4,86.0,88.0,85.5,85.25,87.0,85.0,86.0,85.0,85.1,83.25,85.75,80.2,80.5,79.25,80.75,84.5,83.75,87.25,85.8,85.5,86.0,83.5,84.25,83.75,84.9,84.0,84.0,85.5,83.85,84.4,82.25,81.75,83.25,82.75,83.55,79.15,80.6,80.0,81.5,80.75,81.1,83.35,89.4,88.45,90.0,91.0,86.5,87.25,82.65,85.15,87.25,91.5,88.75,90.5,92.5,96.75,96.0,93.25,94.35,93.5,96.25,93.0,95.0,93.9,94.5,110.0,113.5,109.5,106.25,113.4,110.75,106.65,110.65,109.75,113.75,117.75,115.15,99.6,105.25,103.75,106.75,105.5,109.25,114.75,111.75,112.0,118.25,115.5,120.75,122.75,118.5,122.75,122.25,126.25,129.0,126.25,145.0,135.0,139.0,138.25,139.5,144.0,138.25,140.25,137.35,123.25,122.5,116.5,116.5,124.25,124.0,124.25,134.25,134.25,130.85,128.65,130.75,129.25,129.75,125.85,122.0,126.25,127.25,124.0,123.25,126.25,123.25,125.25,123.65,124.35,133.25,136.0,132.25,135.5,128.0,133.0,132.75,135.25,134.75,133.25,132.5,132.0,139.75,136.0,134.0,135.5,137.0,134.5,134.25,139.0,137.9,138.5,144.25,142.75,146.35,146.5,152.25,154.75,150.0,153.75,154.5,151.5,154.75,148.25,156.0,156.0,151.75,153.4,151.75,155.6,160.1,161.0,156.2,158.0,154.25,154.4,152.5,154.0,152.5,156.5,154.0,155.75,153.5,157.6,156.5,157.5,157.0,157.75,155.75,152.0,154.0,157.5,164.5,175.85,176.25,171.65,174.8,161.5,163.5,158.5,162.1,157.25,162.75,156.25,161.25,159.75,157.25,160.85,156.5,157.25,152.5,155.25,151.0,151.75,146.75,150.1,148.35,145.5,144.5,146.75,135.35,142.25,134.0,138.5,137.75,134.5,137.5,133.0,136.25,134.75,133.35,130.0,133.0,136.0,129.0,127.5,133.0,127.6,130.0,128.25,128.5,139.5,138.25,141.5,140.25,132.25,142.0,138.75,138.5,141.25,140.5,137.5,132.25,135.5,130.25,135.75,133.75,128.25,131.5,127.25,128.5,129.25,129.25,133.75,129.75,133.5,134.25,130.75,131.75,128.5,129.25,123.5,126.0,125.5,122.0,121.5,116.5,119.25,120.75,118.0,115.25,118.5,115.5,116.0,120.5,118.0,114.25,114.5,118.25,119.25,117.25,120.75,117.75,122.25,121.0,123.25,121.25,135.0,141.25,133.0,157.0,144.75,155.0,145.75,148.5,145.5,160.25,149.5,157.0,159.0,156.75,171.75,180.5,168.5,180.0,240.0,203.0,204.0,193.0,193.0,168.0,175.5,200.0,198.0,245.5,221.0,219.0,196.0,188.0,186.0,193.5,196.0,188.5,191.0,194.5,220.0,203.0,215.0,206.0,212.5,207.0,214.0,204.0,208.5,207.75,188.0,183.5,204.0,202.0,248.5,230.5,232.0,239.0,233.0,230.0,243.0,234.0,238.0,275.0,262.0,295.0,262.0,272.0,301.5,390.0,348.0,315.5,384.0,398.0,293.0,261.0,302.0,274.0,310.0,295.0,287.0,293.0,340.0,312.5,307.0,294.0,284.0,279.0,291.0,273.0,277.0,291.0,275.5,286.0,280.0,280.0,274.0,274.0,280.0,273.0,272.0,292.0,300.0,273.5,270.75,295.0,323.0,304.0,334.0,314.0,312.0,321.0,335.0,357.0,362.0,348.0,357.0,346.0,351.0,348.0,356.0,372.25,355.0,366.0,384.0,353.0,284.0,328.0,344.0,331.0,337.0,349.0,338.0,338.0,328.0,315.0,330.0,339.0,334.0,342.0,333.0,345.0,337.0,345.0,339.0,348.0,369.5,365.0,363.0,396.0,382.0,398.0,377.0,394.0,392.0,396.0,419.0,392.0,401.0,394.0,410.0,440.0,438.0,454.0,433.0,435.0,474.0,482.0,531.0,566.0,600.0,800.0,675.0,650.0,705.0,706.0,630.0,575.0,595.0,553.0,585.0,605.0,565.0,575.0,573.0,560.0,577.0,640.0,691.0,652.0,660.0,618.0,664.0,672.0,783.0,835.0,725.0,792.0,748.0,718.0,718.0,765.0,708.0,730.0,713.0,712.0,742.0,733.0,755.0,754.0,794.0,777.0,777.0,784.0,799.0,875.0,940.0,930.0,958.0,977.0,1085.0,1015.0,1080.0,1042.0,1081.0,968.0,974.0,870.0,750.0,828.0,780.0,805.0,765.0,680.0,655.0,765.0,705.0,671.0,670.0,635.0,655.0,665.0,645.0,596.5,618.0,608.0,594.0,560.0,553.0,485.0,455.0,485.0,442.0,475.0,440.0,473.0,453.0,465.0,465.0,425.0,315.0,350.0,354.5,325.0,316.0,345.0,326.0,319.0,338.0,333.0,359.0,405.0,383.0,400.0,437.0,422.0,435.0,415.0,380.0,367.0,365.0,388.0,370.0,383.0,360.0,370.0,365.0,390.0,392.0,362.0,374.0,372.0,365.0,350.0,353.0,378.0,355.0,355.0,356.0,333.0,336.0,320.0,316.0,324.0,318.0,320.0,332.0,318.0,324.0,320.0,362.0,320.0,334.0,328.0,335.0,318.0,321.0,313.0,320.0,321.0,311.0,312.0,286.0,286.0,261.0,266.0,246.0,247.0,235.0,222.0,240.0,263.0,242.0,271.0,256.0,266.0,248.0,256.0,251.0,243.0,242.0,230.0,224.0,192.0,175.0,171.0,144.0,161.0,147.0,164.0,157.0,177.0,206.0,181.0,174.0,186.0,176.0,183.0,184.0,172.0,165.0,160.0,180.0,174.0,172.0,176.0,199.0,192.0,225.0,200.0,218.0,209.0,214.0,206.0,190.5,195.0,203.0,207.0,196.0,196.0,188.0,189.0,206.0,209.0,193.0,200.0,196.0,215.0,213.0,246.0,227.0,237.0,240.0,223.0,232.0,237.0,277.0,274.0,287.0,284.0,315.0,333.0,266.0,278.5,237.0,253.0,238.0,255.0,252.0,241.0,216.0,230.0,228.0,209.0,225.0,222.5,228.0,215.0,217.0,211.0,213.0,223.0,215.0,214.0,205.0,206.0,223.0,215.0,230.0,214.0,218.0,216.0,210.0,213.0,218.0,219.0,215.0,211.0,206.0,179.0,182.0,184.0,180.0,192.0,182.0,192.0,189.0,179.5,185.0,180.0,183.0,202.0,196.0,202.0,192.0,200.0,196.0,196.0,203.0,196.0,192.0,194.5,188.0,184.0,183.75,190.5,185.0,188.5,187.0,172.0,182.0,184.0,191.5,188.0,192.5,186.5,184.5,182.5,184.0,182.5,183.0,202.0,191.5,192.0,207.0,213.0,208.0,227.0,221.0,226.0,253.0,266.0,257.0,271.0,296.0,249.0,246.0,275.0,262.0,283.0,272.5,274.0,315.0,286.0,277.0,289.0,305.0,284.0,312.0,309.0,338.0,334.0,354.0,340.0,349.0,385.0,390.0,402.0,338.0,352.0,361.0,289.0,305.0,317.0,307.0,326.0,330.0,310.0,304.0,323.0,317.0,317.0,338.0,345.5,346.5,351.0,307.0,303.0,320.0,299.0,298.0,322.0,317.0,319.0,330.0,334.0,315.0,329.0,318.0,327.0,329.0,321.0,324.0,343.0,328.0,332.0,348.0,335.0,344.0,337.0,335.0,354.0,338.0,352.0,346.0,353.0,352.0,357.0,373.0,381.0,368.0,374.0,361.0,364.0,374.0,366.5,369.0,363.5,375.0,366.0,364.0,362.5,369.0,369.75,362.0,364.0,362.0,335.0,320.0,329.0,335.0,335.0,330.5,339.5,340.0,368.0,380.0,359.0,373.0,368.0,379.0,367.0,362.0,343.0,347.0,344.0,346.0,354.5,370.0,367.0,382.0,363.0,381.0,382.0,428.0,424.0,507.0,568.0,588.0,469.0,425.0,453.0,434.0,462.0,451.0,455.0,417.0,408.0,442.0,431.0,455.0,424.0,423.5,464.0,473.0,465.0,468.0,442.0,450.0,392.0,389.0,363.0,310.0,274.0,292.0,304.0,273.0,218.0,246.0,249.0,203.0,198.0,204.0,171.0,168.0,202.0,231.0,216.0,183.0,195.0,170.0,183.0,174.0,173.0,185.0,199.0,177.0,193.0,190.0,193.0,216.0,219.0,198.0,193.0,202.0,197.0,197.0,220.0,214.0,239.0,227.0,231.0,212.5,241.0,223.5,235.0,224.0,264.0,249.0,247.0,234.0,251.0,237.0,233.0,245.0,262.0,256.0,280.0,269.0,269.0,287.0,284.0,295.0,290.0,301.0,290.0,299.5,335.0,325.0,336.0,319.0,321.0,332.0,375.0,361.0,389.0,366.5,364.0,362.0,355.0,425.0,421.0,462.0,418.0,434.0,387.0,416.0,438.0,416.0,465.0,451.0,476.0,447.0,458.0,489.0,510.0,563.0,570.0,507.0,542.0,515.0,416.0,469.0,421.0,448.0,498.0,480.0,441.0,433.0,467.0,445.0,473.0,509.0,476.0,494.0,476.0,487.5,526.0,522.0,551.0,534.0,543.0,601.0,580.0,576.0,624.0,641.0,721.0,671.0,639.0,688.0,763.0,737.0,759.0,742.0,797.0,741.0,815.0,818.0,786.0,823.0,818.0,842.0,859.0,767.0,823.0,723.0,708.0,747.0,744.0,785.0,795.0,736.0,774.0,717.0,708.0,731.0,738.0,772.0,817.0,744.0,766.0,729.0,776.0,756.0,796.0,838.0,840.0,739.0,737.0,777.0,747.0,786.0,762.0,715.0,716.0,628.0,561.0,615.0,642.0,596.0,667.0,641.0,662.0,659.0,570.0,574.0,676.0,614.0,627.0,658.0,617.0,641.0,640.0,696.0,681.0,710.0,714.0,679.0,721.0,718.0,675.0,700.0,696.0,648.0,659.0,637.0,661.0,672.0,679.0,602.0,591.0,617.0,592.0,625.0,636.0,628.0,582.5,601.0,581.0,585.0,564.0,569.0,589.0,588.0,577.0,645.0,618.0,634.0,678.0,687.0,633.0,637.0,668.0,638.0,653.0,599.0,594.0,619.0,609.0,629.0,678.0,688.0,700.0,686.0,675.0,706.0,672.0,715.0,714.5,754.0,742.0,767.0,773.0,715.0,741.0,719.0,770.0,741.0,761.0,774.0,734.0,673.0,670.0,699.0,686.0,704.0,752.0,733.0,755.0,761.0,730.0,681.0,644.0,679.0,724.0,744.0,747.0,724.0,720.0,738.0,756.0,747.0,731.0,687.0,686.0,724.0,730.0,703.0,697.0,705.0,738.0,746.0,738.0,760.0,717.0,713.0,724.0,712.0,738.0,696.0,696.0,730.0,740.0,733.5,747.0,706.0,703.0,714.0,734.0,736.0,747.0,774.0,764.0,796.0,764.0,788.0,776.0,810.0,784.0,814.0,803.0,822.0,817.0,841.0,833.0,858.0,812.0,814.0,837.0,871.0,867.0,882.0,870.0,880.0,847.0,885.0,870.0,897.0,909.0,894.0,829.0,823.0,769.0,752.0,804.0,754.0,787.0,805.0,754.0,774.0,767.0,795.0,810.0,799.0,817.0,785.0,813.0,790.0,810.0,761.0,787.0,772.0,794.0,770.0,775.0,815.0,830.0,821.0,766.0,771.0,734.0,773.0,757.0,780.0,768.0,790.0,792.0,783.0,788.0,781.0,757.0,740.0,700.0,671.0,698.0,634.0,656.0,611.0,626.0,595.0,618.0,618.0,549.0,589.0,580.0,584.0,601.0,659.0,640.0,709.0,713.0,672.0,698.0,681.0,611.0,541.0,537.0,555.0,528.0,551.0,566.0,554.0,545.0,465.0,483.0,504.0,491.0,517.0,499.0,521.0,501.0,491.0,566.0,559.0,592.0,596.0,573.0,538.0,541.0,607.0,624.0,603.0,603.0,588.0,533.0,539.0,558.0,540.0,544.0,550.0,593.0,604.0,636.0,680.0,713.0,692.0,731.0,688.0,704.0,667.0,700.0,654.0,688.0,688.0,719.0,674.0,638.0,622.0,640.0,619.0,681.0,677.0,738.0,774.0,729.0,730.0,689.0,653.0,684.0,744.0,740.0,786.0,713.0,759.0,773.0,791.0,763.0,783.0,746.0,748.0,771.0,803.0,788.0,806.0,775.0,802.0,816.0,797.0,808.0,761.0,765.0,833.0,899.0,853.0,887.0,843.0,837.0,868.0,848.0,841.0,899.0,870.0,893.0,928.0,940.0,988.0,942.0,946.0,908.0,939.0,914.0,983.0,1005.0,968.0,965.0,993.0,1019.0,978.0,1006.0,1024.0,990.0,1033.0,1019.0,1071.0,1098.0,1128.0,1104.0,1106.0,1031.0,1038.0,970.0,1050.0,1061.0,991.0,970.0,1004.0,981.0,929.0,916.0,978.0,1055.0,965.0,958.0,1004.0,977.0,998.0,979.0,1017.0,1016.0,962.0,939.0,948.0,962.0,941.0,892.0,938.0,929.0,897.0,864.0,918.0,980.0,966.0,969.0,980.0,1056.0,1086.0,1054.0,1087.0,1136.0,1084.0,1072.0,1134.0,1105.0,1182.0,1138.0,1249.0,1211.0,1264.0,1240.0,1264.0,1339.0,1313.0,1417.0,1314.0,1368.0,1388.0,1416.0,1498.0,1555.0,1510.0,1513.0,1604.0,1563.0,1387.0,1339.0,1370.0,1417.0,1458.0,1344.0,1309.0,1337.0,1311.0,1367.0,1352.0,1467.0,1524.0,1521.0,1567.0,1601.0,1520.0,1500.0,1547.0,1421.0,1424.0,1492.0,1478.0,1535.0,1544.0,1608.0,1588.0,1672.0,1693.0,1629.0,1769.0,1744.0,1800.0,1815.0,1701.0,1712.0,1766.0,1840.0,1877.0,1969.0,1990.0,1876.0,1961.0,2117.0,2573.0,2417.0,2270.0,2483.0,2329.0,2786.0,2714.0,2795.0,2458.0,1583.0,1659.0,2370.0,2120.0,2230.0,2165.0,1955.0,1991.0,1775.0,1825.0,2068.0,1921.0,1954.0,1968.0,1902.0,1940.0,1846.0,1925.0,1955.0,1982.0,2281.0,2085.0,2220.0,2130.0,2215.0,2165.0,2294.0,2256.0,2375.0,2232.0,2227.0,2322.0,2450.0,2347.0,2404.0,2226.0,2391.0,2483.0,2330.0,2337.0,2418.0,2342.0,2288.0,2356.0,2342.0,2462.0,2360.0,2392.0,2368.0,2244.0,2318.0,2403.0,2351.0,2427.0,2338.0,2300.0,2612.0,2639.0,2556.0,2630.0,2638.0,2810.0,2946.0,2997.0,2860.0,2928.0,2733.0,2866.0,2842.0,2752.0,2508.0,2644.0,2779.0,2839.0,2838.0,2600.0,2673.0,2678.0,2601.0,2613.0,2311.0,2484.0,2426.0,2058.0,1968.0,2067.0,1889.0,1902.0,2174.0,2037.0,1980.0,2040.0,2008.0,2178.0,2060.0,1812.0,1739.0,1863.0,1608.0,1881.0,1978.0,1850.0,1878.0,2045.0,2362.0,2385.0,2239.0,2274.0,2620.0,2491.0,3339.0,2426.0,2565.0,2257.0,2160.0,2516.0,2323.0,2465.0,2179.0,2252.0,1926.0,2096.0,1995.0,2070.0,1823.0,1881.0,1869.0,1981.0,1919.0,2145.0,1860.0,2085.0,2058.0,2208.0,2260.0,2021.0,2140.0,2032.0,2200.0,2090.0,2049.0,2227.0,2314.0,2012.0,2027.0,2021.0,1832.0,1843.0,2096.0,1879.0,1850.0,1918.0,1929.0,1929.0,1658.0,1784.0,1830.0,1781.0,1703.0,1729.0,1603.0,1665.0,1475.0,1506.0,1412.0,1440.0,1367.0,1455.0,1397.0,1489.0,1424.0,1618.0,1590.0,1436.0,1573.0,1490.0,1517.0,1404.0,1425.0,1315.0,1411.0,1284.0,1318.0,1228.0,1303.0,1324.0,1283.0,1234.0,1214.0,1304.0,1213.0,1271.0,1225.0,1197.0,1260.0,1277.0,1270.0,1145.0,1182.0,1103.0,1091.0,1137.0,1129.0,960.0,1080.0,1072.0,1014.0,944.0,976.0,1178.0,1193.0,1027.0,1010.0,929.0,922.0,990.0,882.0,875.0,970.0,916.0,951.0,1044.0,1095.0,987.0,988.0,1063.0,1084.0,1026.0,1023.0,938.0,989.0,972.0,1024.0,949.0,906.0,917.0,885.0,998.0,963.0,1035.0,946.0,978.0,908.0,871.0,933.0,921.0,932.0,986.0,935.0,925.0,1112.0,1042.0,1066.0,997.0,1073.0,1020.0,1208.0,1232.0,1008.0,926.0,1025.0,983.0,996.0,974.0,982.0,912.0,910.0,929.0,947.0,936.0,1001.0,957.0,996.0,1004.0,986.0,917.0,958.0,950.0,980.0,947.0,991.0,929.0,911.0,970.0,936.0,979.0,950.0,1001.0,1019.0,970.0,1079.0,1028.0,1055.0,1150.0,1107.0,1082.0,1304.0,1262.0,1256.0,1192.0,1138.0,1139.0,1099.0,1098.0,1128.0,1203.0,1149.0,1230.0,1230.0,1271.0,1557.0,1402.0,1358.0,1461.0,1393.0,1486.0,1363.0,1467.0,1422.0,1481.0,1705.0,1825.0,1567.0,1850.0,1755.0,1858.0,2076.0,1671.0,1761.0,1650.97,1691.95,1816.48,1691.97]},"Platinum":{"t":["1990-04-02","1990-04-05","1990-04-11","1990-04-23","1990-04-27","1990-05-04","1990-05-09","1990-05-18","1990-05-23","1990-05-29","1990-06-04","1990-06-12","1990-06-15","1990-06-27","1990-07-04","1990-07-09","1990-07-12","1990-07-24","1990-07-30","1990-08-02","1990-08-08","1990-08-14","1990-08-23","1990-08-30","1990-09-06","1990-09-12","1990-09-18","1990-09-25","1990-09-28","1990-10-09","1990-10-16","1990-10-19","1990-10-24","1990-11-01","1990-11-05","1990-11-12","1990-11-16","1990-11-26","1990-11-30","1990-12-06","1990-12-14","1990-12-20","1990-12-28","1991-01-10","1991-01-16","1991-01-21","1991-01-24","1991-02-01","1991-02-06","1991-02-18","1991-02-22","1991-03-01","1991-03-05","1991-03-11","1991-03-15","1991-03-27","1991-04-05","1991-04-10","1991-04-18","1991-04-19","1991-04-29","1991-05-03","1991-05-10","1991-05-20","1991-05-29","1991-05-30","1991-06-07","1991-06-17","1991-06-21","1991-06-25","1991-07-05","1991-07-12","1991-07-18","1991-07-23","1991-07-26","1991-08-05","1991-08-12","1991-08-15","1991-08-21","1991-08-30","1991-09-10","1991-09-13","1991-09-18","1991-09-27","1991-10-04","1991-10-09","1991-10-14","1991-10-21","1991-10-29","1991-11-05","1991-11-08","1991-11-15","1991-11-22","1991-11-28","1991-12-03","1991-12-10","1991-12-20","1991-12-23","1991-12-31","1992-01-10","1992-01-14","1992-01-22","1992-01-28","1992-02-05","1992-02-07","1992-02-19","1992-02-26","1992-02-28","1992-03-06","1992-03-16","1992-03-19","1992-03-24","1992-04-01","1992-04-09","1992-04-15","1992-04-21","1992-04-29","1992-05-05","1992-05-13","1992-05-19","1992-06-01","1992-06-03","1992-06-10","1992-06-15","1992-06-22","1992-06-29","1992-07-02","1992-07-14","1992-07-20","1992-07-22","1992-07-31","1992-08-10","1992-08-14","1992-08-18","1992-08-24","1992-09-01","1992-09-07","1992-09-17","1992-09-22","1992-09-25","1992-10-05","1992-10-09","1992-10-20","1992-10-21","1992-10-30","1992-11-06","1992-11-11","1992-11-18","1992-11-23","1992-11-27","1992-12-08","1992-12-10","1992-12-17","1992-12-31","1993-01-07","1993-01-13","1993-01-18","1993-01-21","1993-01-29","1993-02-08","1993-02-11","1993-02-17","1993-02-23","1993-03-04","1993-03-11","1993-03-18","1993-03-24","1993-03-29","1993-04-02","1993-04-08","1993-04-22","1993-04-27","1993-04-30","1993-05-11","1993-05-13","1993-05-25","1993-06-01","1993-06-03","1993-06-11","1993-06-22","1993-06-23","1993-07-05","1993-07-07","1993-07-13","1993-07-22","1993-07-23","1993-08-04","1993-08-06","1993-08-13","1993-08-23","1993-08-31","1993-09-06","1993-09-08","1993-09-15","1993-09-22","1993-09-30","1993-10-05","1993-10-13","1993-10-18","1993-10-25","1993-11-02","1993-11-05","1993-11-12","1993-11-23","1993-11-24","1993-12-01","1993-12-09","1993-12-14","1993-12-23","1994-01-04","1994-01-10","1994-01-17","1994-01-24","1994-01-28","1994-02-04","1994-02-09","1994-02-17","1994-02-18","1994-02-24","1994-03-08","1994-03-11","1994-03-21","1994-03-25","1994-03-31","1994-04-12","1994-04-14","1994-04-20","1994-05-03","1994-05-06","1994-05-10","1994-05-18","1994-05-24","1994-06-02","1994-06-07","1994-06-16","1994-06-22","1994-06-28","1994-07-04","1994-07-11","1994-07-15","1994-07-22","1994-07-27","1994-08-04","1994-08-09","1994-08-19","1994-08-25","1994-08-31","1994-09-08","1994-09-15","1994-09-21","1994-09-28","1994-09-29","1994-10-07","1994-10-14","1994-10-21","1994-10-28","1994-11-01","1994-11-10","1994-11-15","1994-11-21","1994-11-30","1994-12-05","1994-12-13","1994-12-15","1994-12-21","1995-01-05","1995-01-06","1995-01-13","1995-01-23","1995-01-30","1995-02-01","1995-02-08","1995-02-17","1995-02-24","1995-03-02","1995-03-08","1995-03-15","1995-03-22","1995-03-28","1995-04-05","1995-04-11","1995-04-19","1995-04-25","1995-05-03","1995-05-05","1995-05-12","1995-05-23","1995-05-26","1995-06-05","1995-06-13","1995-06-14","1995-06-21","1995-06-28","1995-07-04","1995-07-11","1995-07-19","1995-07-24","1995-08-01","1995-08-04","1995-08-14","1995-08-18","1995-08-29","1995-08-31","1995-09-06","1995-09-15","1995-09-22","1995-09-29","1995-10-03","1995-10-10","1995-10-16","1995-10-26","1995-10-30","1995-11-06","1995-11-10","1995-11-16","1995-11-23","1995-12-04","1995-12-06","1995-12-11","1995-12-20","1995-12-29","1996-01-05","1996-01-15","1996-01-17","1996-01-25","1996-02-02","1996-02-08","1996-02-12","1996-02-20","1996-02-23","1996-03-05","1996-03-08","1996-03-13","1996-03-20","1996-03-27","1996-04-02","1996-04-12","1996-04-19","1996-04-26","1996-04-30","1996-05-08","1996-05-17","1996-05-21","1996-06-03","1996-06-06","1996-06-10","1996-06-19","1996-06-27","1996-07-03","1996-07-04","1996-07-16","1996-07-17","1996-07-26","1996-08-01","1996-08-07","1996-08-15","1996-08-19","1996-08-27","1996-09-06","1996-09-09","1996-09-16","1996-09-25","1996-10-01","1996-10-03","1996-10-10","1996-10-21","1996-10-24","1996-10-30","1996-11-06","1996-11-12","1996-11-21","1996-11-28","1996-12-02","1996-12-09","1996-12-17","1996-12-23","1997-01-02","1997-01-08","1997-01-13","1997-01-21","1997-01-28","1997-01-31","1997-02-10","1997-02-13","1997-02-20","1997-02-28","1997-03-06","1997-03-11","1997-03-20","1997-03-25","1997-04-04","1997-04-10","1997-04-16","1997-04-18","1997-04-29","1997-05-07","1997-05-12","1997-05-19","1997-05-27","1997-06-03","1997-06-06","1997-06-13","1997-06-18","1997-06-25","1997-07-01","1997-07-10","1997-07-14","1997-07-24","1997-07-30","1997-08-05","1997-08-07","1997-08-14","1997-08-20","1997-09-03","1997-09-04","1997-09-12","1997-09-17","1997-09-24","1997-10-02","1997-10-07","1997-10-14","1997-10-17","1997-10-28","1997-11-05","1997-11-06","1997-11-18","1997-11-20","1997-11-26","1997-12-02","1997-12-10","1997-12-16","1997-12-29","1998-01-06","1998-01-12","1998-01-15","1998-01-20","1998-01-29","1998-02-05","1998-02-10","1998-02-17","1998-02-24","1998-02-27","1998-03-09","1998-03-17","1998-03-19","1998-03-24","1998-03-31","1998-04-06","1998-04-15","1998-04-23","1998-05-01","1998-05-08","1998-05-18","1998-05-22","1998-05-29","1998-06-03","1998-06-09","1998-06-15","1998-06-19","1998-06-29","1998-07-03","1998-07-13","1998-07-20","1998-07-23","1998-08-03","1998-08-07","1998-08-13","1998-08-21","1998-08-27","1998-08-28","1998-09-07","1998-09-16","1998-09-18","1998-09-25","1998-10-06","1998-10-08","1998-10-14","1998-10-22","1998-11-02","1998-11-05","1998-11-11","1998-11-19","1998-11-20","1998-12-03","1998-12-08","1998-12-10","1998-12-22","1998-12-31","1999-01-05","1999-01-12","1999-01-15","1999-01-21","1999-01-29","1999-02-05","1999-02-11","1999-02-19","1999-02-24","1999-03-04","1999-03-09","1999-03-16","1999-03-23","1999-03-31","1999-04-07","1999-04-15","1999-04-20","1999-04-23","1999-04-29","1999-05-07","1999-05-18","1999-05-24","1999-05-28","1999-06-04","1999-06-15","1999-06-18","1999-06-28","1999-07-01","1999-07-07","1999-07-12","1999-07-22","1999-07-28","1999-08-04","1999-08-06","1999-08-17","1999-08-20","1999-08-25","1999-09-06","1999-09-14","1999-09-17","1999-09-24","1999-09-29","1999-10-06","1999-10-12","1999-10-19","1999-10-22","1999-11-03","1999-11-08","1999-11-11","1999-11-22","1999-11-25","1999-11-30","1999-12-09","1999-12-14","1999-12-20","1999-12-30","2000-01-07","2000-01-13","2000-01-21","2000-01-28","2000-02-02","2000-02-09","2000-02-17","2000-02-24","2000-02-29","2000-03-03","2000-03-13","2000-03-22","2000-03-28","2000-04-03","2000-04-05","2000-04-11","2000-04-25","2000-05-02","2000-05-04","2000-05-16","2000-05-22","2000-05-24","2000-06-06","2000-06-08","2000-06-15","2000-06-22","2000-06-27","2000-07-06","2000-07-12","2000-07-17","2000-07-21","2000-07-28","2000-08-02","2000-08-11","2000-08-21","2000-08-23","2000-09-04","2000-09-05","2000-09-12","2000-09-20","2000-09-27","2000-10-04","2000-10-06","2000-10-13","2000-10-20","2000-10-30","2000-11-03","2000-11-10","2000-11-16","2000-11-24","2000-11-27","2000-12-04","2000-12-13","2000-12-19","2000-12-28","2001-01-02","2001-01-11","2001-01-18","2001-01-22","2001-01-30","2001-02-06","2001-02-09","2001-02-15","2001-02-21","2001-03-05","2001-03-09","2001-03-13","2001-03-23","2001-03-28","2001-04-02","2001-04-10","2001-04-18","2001-04-26","2001-04-30","2001-05-04","2001-05-15","2001-05-21","2001-05-29","2001-06-01","2001-06-13","2001-06-18","2001-06-25","2001-06-29","2001-07-06","2001-07-13","2001-07-20","2001-07-27","2001-07-31","2001-08-09","2001-08-16","2001-08-17","2001-08-29","2001-08-31","2001-09-11","2001-09-19","2001-09-24","2001-10-02","2001-10-05","2001-10-10","2001-10-16","2001-10-25","2001-10-29","2001-11-08","2001-11-12","2001-11-21","2001-11-23","2001-11-29","2001-12-07","2001-12-12","2001-12-20","2001-12-28","2002-01-07","2002-01-11","2002-01-18","2002-01-28","2002-02-01","2002-02-08","2002-02-15","2002-02-21","2002-02-27","2002-03-01","2002-03-11","2002-03-14","2002-03-26","2002-04-02","2002-04-10","2002-04-16","2002-04-18","2002-04-29","2002-05-02","2002-05-13","2002-05-21","2002-05-27","2002-05-29","2002-06-07","2002-06-13","2002-06-21","2002-06-27","2002-07-05","2002-07-12","2002-07-16","2002-07-24","2002-07-26","2002-08-07","2002-08-12","2002-08-15","2002-08-23","2002-08-30","2002-09-05","2002-09-11","2002-09-20","2002-09-27","2002-10-04","2002-10-11","2002-10-17","2002-10-23","2002-10-28","2002-11-01","2002-11-12","2002-11-15","2002-11-21","2002-11-28","2002-12-09","2002-12-12","2002-12-17","2002-12-24","2003-01-07","2003-01-09","2003-01-16","2003-01-22","2003-01-28","2003-02-04","2003-02-11","2003-02-14","2003-02-21","2003-03-05","2003-03-11","2003-03-17","2003-03-21","2003-03-28","2003-04-01","2003-04-08","2003-04-17","2003-04-24","2003-04-29","2003-05-06","2003-05-13","2003-05-21","2003-06-02","2003-06-04","2003-06-12","2003-06-16","2003-06-26","2003-07-02","2003-07-09","2003-07-15","2003-07-21","2003-07-29","2003-08-01","2003-08-08","2003-08-12","2003-08-20","2003-08-26","2003-09-02","2003-09-11","2003-09-17","2003-09-22","2003-09-29","2003-10-03","2003-10-09","2003-10-16","2003-10-23","2003-10-30","2003-11-04","2003-11-14","2003-11-18","2003-11-25","2003-12-01","2003-12-04","2003-12-15","2003-12-18","2003-12-24","2004-01-05","2004-01-13","2004-01-16","2004-01-23","2004-01-30","2004-02-06","2004-02-12","2004-02-23","2004-02-27","2004-03-01","2004-03-12","2004-03-16","2004-03-24","2004-03-30","2004-04-07","2004-04-13","2004-04-19","2004-04-23","2004-04-29","2004-05-10","2004-05-17","2004-05-21","2004-05-26","2004-06-08","2004-06-15","2004-06-21","2004-06-25","2004-06-29","2004-07-06","2004-07-12","2004-07-20","2004-07-28","2004-08-04","2004-08-09","2004-08-16","2004-08-23","2004-08-27","2004-09-02","2004-09-10","2004-09-20","2004-09-21","2004-09-28","2004-10-05","2004-10-13","2004-10-21","2004-10-25","2004-11-02","2004-11-05","2004-11-15","2004-11-19","2004-11-29","2004-12-06","2004-12-09","2004-12-16","2004-12-23","2004-12-29","2005-01-05","2005-01-13","2005-01-18","2005-01-26","2005-02-01","2005-02-09","2005-02-14","2005-02-21","2005-02-24","2005-03-04","2005-03-09","2005-03-17","2005-03-23","2005-04-05","2005-04-07","2005-04-18","2005-04-20","2005-05-03","2005-05-05","2005-05-11","2005-05-17","2005-05-27","2005-06-03","2005-06-10","2005-06-14","2005-06-20","2005-06-30","2005-07-06","2005-07-07","2005-07-19","2005-07-22","2005-07-27","2005-08-04","2005-08-12","2005-08-16","2005-08-22","2005-08-31","2005-09-05","2005-09-14","2005-09-20","2005-09-26","2005-10-05","2005-10-11","2005-10-14","2005-10-24","2005-10-27","2005-11-02","2005-11-08","2005-11-16","2005-11-23","2005-11-28","2005-12-02","2005-12-12","2005-12-15","2005-12-29","2005-12-30","2006-01-10","2006-01-18","2006-01-19","2006-01-31","2006-02-06","2006-02-14","2006-02-16","2006-02-21","2006-03-03","2006-03-10","2006-03-16","2006-03-17","2006-03-24","2006-03-30","2006-04-10","2006-04-13","2006-04-25","2006-05-04","2006-05-08","2006-05-12","2006-05-22","2006-05-30","2006-06-02","2006-06-13","2006-06-19","2006-06-22","2006-06-29","2006-07-04","2006-07-12","2006-07-19","2006-07-24","2006-08-02","2006-08-07","2006-08-15","2006-08-17","2006-08-29","2006-09-05","2006-09-07","2006-09-15","2006-09-20","2006-10-02","2006-10-05","2006-10-11","2006-10-17","2006-10-24","2006-10-31","2006-11-03","2006-11-09","2006-11-21","2006-11-22","2006-12-01","2006-12-06","2006-12-14","2006-12-20","2007-01-02","2007-01-08","2007-01-11","2007-01-17","2007-01-25","2007-01-30","2007-02-05","2007-02-14","2007-02-21","2007-02-28","2007-03-05","2007-03-09","2007-03-14","2007-03-22","2007-04-02","2007-04-10","2007-04-17","2007-04-23","2007-04-27","2007-05-02","2007-05-09","2007-05-16","2007-05-25","2007-05-30","2007-06-07","2007-06-13","2007-06-18","2007-06-27","2007-07-02","2007-07-11","2007-07-17","2007-07-23","2007-07-30","2007-08-06","2007-08-07","2007-08-17","2007-08-24","2007-08-31","2007-09-04","2007-09-12","2007-09-14","2007-09-21","2007-10-01","2007-10-09","2007-10-12","2007-10-19","2007-10-29","2007-10-31","2007-11-07","2007-11-13","2007-11-21","2007-11-28","2007-12-05","2007-12-10","2007-12-17","2007-12-19","2008-01-03","2008-01-07","2008-01-14","2008-01-22","2008-01-25","2008-01-31","2008-02-06","2008-02-13","2008-02-19","2008-02-28","2008-03-04","2008-03-10","2008-03-20","2008-03-28","2008-04-01","2008-04-07","2008-04-14","2008-04-18","2008-04-25","2008-05-02","2008-05-09","2008-05-15","2008-05-22","2008-05-30","2008-06-09","2008-06-12","2008-06-18","2008-06-25","2008-07-02","2008-07-09","2008-07-15","2008-07-24","2008-07-31","2008-08-05","2008-08-11","2008-08-19","2008-08-22","2008-08-29","2008-09-08","2008-09-11","2008-09-19","2008-09-24","2008-10-03","2008-10-10","2008-10-14","2008-10-17","2008-10-27","2008-10-30","2008-11-10","2008-11-13","2008-11-20","2008-11-26","2008-12-02","2008-12-12","2008-12-18","2008-12-24","2009-01-05","2009-01-07","2009-01-15","2009-01-20","2009-01-28","2009-02-04","2009-02-12","2009-02-18","2009-02-25","2009-03-02","2009-03-05","2009-03-17","2009-03-20","2009-03-26","2009-04-01","2009-04-14","2009-04-21","2009-04-24","2009-04-29","2009-05-07","2009-05-14","2009-05-21","2009-05-28","2009-06-05","2009-06-08","2009-06-15","2009-06-23","2009-06-26","2009-07-08","2009-07-13","2009-07-17","2009-07-28","2009-07-30","2009-08-05","2009-08-12","2009-08-19","2009-08-24","2009-09-02","2009-09-09","2009-09-17","2009-09-23","2009-09-28","2009-10-05","2009-10-08","2009-10-14","2009-10-23","2009-10-28","2009-11-04","2009-11-13","2009-11-18","2009-11-20","2009-12-03","2009-12-07","2009-12-10","2009-12-22","2009-12-23","2010-01-06","2010-01-13","2010-01-19","2010-01-22","2010-01-29","2010-02-03","2010-02-10","2010-02-17","2010-02-24","2010-03-03","2010-03-11","2010-03-17","2010-03-22","2010-03-29","2010-04-07","2010-04-14","2010-04-19","2010-04-26","2010-05-05","2010-05-13","2010-05-18","2010-05-21","2010-05-28","2010-06-07","2010-06-11","2010-06-21","2010-06-24","2010-07-02","2010-07-07","2010-07-14","2010-07-21","2010-07-27","2010-08-03","2010-08-11","2010-08-18","2010-08-24","2010-08-26","2010-09-06","2010-09-13","2010-09-17","2010-09-21","2010-09-28","2010-10-07","2010-10-12","2010-10-19","2010-10-22","2010-11-03","2010-11-09","2010-11-12","2010-11-17","2010-11-26","2010-12-03","2010-12-10","2010-12-14","2010-12-20","2010-12-30","2011-01-07","2011-01-14","2011-01-19","2011-01-25","2011-01-31","2011-02-09","2011-02-11","2011-02-21","2011-02-24","2011-03-03","2011-03-15","2011-03-17","2011-03-24","2011-03-29","2011-04-08","2011-04-13","2011-04-19","2011-05-03","2011-05-06","2011-05-12","2011-05-23","2011-05-31","2011-06-03","2011-06-10","2011-06-17","2011-06-22","2011-06-27","2011-07-06","2011-07-12","2011-07-19","2011-07-27","2011-08-02","2011-08-05","2011-08-15","2011-08-22","2011-08-25","2011-09-05","2011-09-07","2011-09-13","2011-09-21","2011-09-26","2011-10-05","2011-10-07","2011-10-17","2011-10-21","2011-10-28","2011-11-02","2011-11-09","2011-11-16","2011-11-25","2011-12-02","2011-12-07","2011-12-15","2011-12-21","2011-12-29","2012-01-09","2012-01-12","2012-01-20","2012-01-26","2012-01-31","2012-02-06","2012-02-09","2012-02-16","2012-02-23","2012-02-29","2012-03-07","2012-03-13","2012-03-22","2012-03-27","2012-04-03","2012-04-16","2012-04-19","2012-04-25","2012-04-30","2012-05-08","2012-05-16","2012-05-21","2012-05-30","2012-06-06","2012-06-12","2012-06-19","2012-06-28","2012-07-04","2012-07-11","2012-07-17","2012-07-23","2012-07-27","2012-08-03","2012-08-09","2012-08-16","2012-08-23","2012-08-31","2012-09-06","2012-09-13","2012-09-17","2012-09-24","2012-09-28","2012-10-05","2012-10-15","2012-10-18","2012-10-26","2012-11-01","2012-11-08","2012-11-14","2012-11-19","2012-11-27","2012-12-05","2012-12-12","2012-12-18","2012-12-21","2012-12-31","2013-01-08","2013-01-15","2013-01-21","2013-01-24","2013-02-01","2013-02-06","2013-02-14","2013-02-21","2013-03-01","2013-03-08","2013-03-11","2013-03-20","2013-03-22","2013-04-02","2013-04-10","2013-04-16","2013-04-23","2013-04-30","2013-05-02","2013-05-14","2013-05-20","2013-05-28","2013-06-03","2013-06-07","2013-06-17","2013-06-21","2013-06-26","2013-07-08","2013-07-11","2013-07-18","2013-07-24","2013-07-29","2013-08-07","2013-08-09","2013-08-15","2013-08-27","2013-08-30","2013-09-04","2013-09-13","2013-09-19","2013-09-24","2013-10-04","2013-10-08","2013-10-15","2013-10-18","2013-10-30","2013-11-04","2013-11-07","2013-11-18","2013-11-21","2013-11-28","2013-12-03","2013-12-11","2013-12-20","2013-12-24","2014-01-03","2014-01-08","2014-01-20","2014-01-24","2014-01-31","2014-02-06","2014-02-13","2014-02-14","2014-02-21","2014-02-27","2014-03-07","2014-03-17","2014-03-20","2014-03-28","2014-04-03","2014-04-11","2014-04-14","2014-04-24","2014-05-06","2014-05-12","2014-05-15","2014-05-23","2014-05-29","2014-06-04","2014-06-11","2014-06-17","2014-06-20","2014-07-02","2014-07-08","2014-07-10","2014-07-16","2014-07-29","2014-08-01","2014-08-08","2014-08-14","2014-08-21","2014-08-28","2014-09-01","2014-09-08","2014-09-12","2014-09-23","2014-09-25","2014-10-06","2014-10-09","2014-10-15","2014-10-22","2014-10-29","2014-11-05","2014-11-10","2014-11-20","2014-11-21","2014-12-01","2014-12-04","2014-12-12","2014-12-23","2014-12-29","2015-01-05","2015-01-14","2015-01-21","2015-01-28","2015-01-30","2015-02-06","2015-02-16","2015-02-20","2015-02-26","2015-03-05","2015-03-11","2015-03-18","2015-03-26","2015-03-31","2015-04-08","2015-04-14","2015-04-20","2015-04-27","2015-04-30","2015-05-12","2015-05-18","2015-05-22","2015-05-29","2015-06-10","2015-06-15","2015-06-17","2015-06-24","2015-07-03","2015-07-08","2015-07-15","2015-07-22","2015-07-29","2015-08-05","2015-08-11","2015-08-19","2015-08-21","2015-08-26","2015-09-03","2015-09-15","2015-09-21","2015-09-23","2015-10-02","2015-10-09","2015-10-15","2015-10-21","2015-10-26","2015-10-30","2015-11-09","2015-11-12","2015-11-18","2015-11-30","2015-12-07","2015-12-09","2015-12-18","2015-12-22","2016-01-05","2016-01-12","2016-01-14","2016-01-21","2016-01-28","2016-02-03","2016-02-11","2016-02-12","2016-02-22","2016-02-29","2016-03-08","2016-03-15","2016-03-17","2016-03-29","2016-04-01","2016-04-07","2016-04-13","2016-04-25","2016-05-03","2016-05-04","2016-05-16","2016-05-19","2016-05-23","2016-06-03","2016-06-08","2016-06-15","2016-06-23","2016-06-28","2016-07-01","2016-07-07","2016-07-15","2016-07-25","2016-07-28","2016-08-08","2016-08-11","2016-08-15","2016-08-24","2016-09-02","2016-09-07","2016-09-15","2016-09-20","2016-09-23","2016-10-03","2016-10-07","2016-10-14","2016-10-21","2016-10-26","2016-11-04","2016-11-09","2016-11-14","2016-11-22","2016-11-25","2016-12-06","2016-12-14","2016-12-16","2016-12-28","2017-01-03","2017-01-06","2017-01-17","2017-01-20","2017-01-26","2017-02-02","2017-02-09","2017-02-15","2017-02-27","2017-03-01","2017-03-10","2017-03-14","2017-03-20","2017-03-27","2017-03-31","2017-04-11","2017-04-18","2017-04-24","2017-05-04","2017-05-10","2017-05-17","2017-05-19","2017-05-26","2017-06-02","2017-06-08","2017-06-16","2017-06-23","2017-07-03","2017-07-07","2017-07-11","2017-07-17","2017-07-26","2017-07-31","2017-08-04","2017-08-15","2017-08-18","2017-08-24","2017-09-04","2017-09-08","2017-09-18","2017-09-21","2017-09-27","2017-10-03","2017-10-12","2017-10-16","2017-10-20","2017-10-27","2017-11-02","2017-11-10","2017-11-21","2017-11-22","2017-11-29","2017-12-08","2017-12-13","2017-12-20","2017-12-28","2018-01-05","2018-01-10","2018-01-19","2018-01-23","2018-01-29","2018-02-08","2018-02-12","2018-02-16","2018-02-26","2018-03-02","2018-03-08","2018-03-14","2018-03-21","2018-03-27","2018-04-05","2018-04-11","2018-04-19","2018-04-26","2018-05-04","2018-05-14","2018-05-17","2018-05-25","2018-05-31","2018-06-05","2018-06-14","2018-06-20","2018-06-25","2018-07-03","2018-07-09","2018-07-12","2018-07-19","2018-07-25","2018-08-02","2018-08-10","2018-08-16","2018-08-21","2018-08-28","2018-09-05","2018-09-13","2018-09-17","2018-09-21","2018-09-28","2018-10-08","2018-10-15","2018-10-19","2018-10-26","2018-11-02","2018-11-07","2018-11-14","2018-11-20","2018-11-26","2018-11-30","2018-12-11","2018-12-13","2018-12-19","2019-01-03","2019-01-07","2019-01-14","2019-01-23","2019-01-29","2019-02-05","2019-02-08","2019-02-14","2019-02-20","2019-02-28","2019-03-08","2019-03-11","2019-03-21","2019-03-25","2019-04-02","2019-04-05","2019-04-15","2019-04-25","2019-04-30","2019-05-03","2019-05-14","2019-05-17","2019-05-30","2019-06-05","2019-06-07","2019-06-14","2019-06-19","2019-07-01","2019-07-08","2019-07-09","2019-07-19","2019-07-25","2019-07-26","2019-08-02","2019-08-13","2019-08-16","2019-08-27","2019-08-30","2019-09-05","2019-09-11","2019-09-23","2019-09-30","2019-10-02","2019-10-11","2019-10-17","2019-10-22","2019-10-25","2019-11-04","2019-11-08","2019-11-14","2019-11-20","2019-11-28","2019-12-09","2019-12-12","2019-12-19","2019-12-23","2020-01-03","2020-01-09","2020-01-16","2020-01-22","2020-01-30","2020-02-03","2020-02-13","2020-02-19","2020-02-25","2020-02-28","2020-03-10","2020-03-17","2020-03-23","2020-03-25","2020-04-03","2020-04-07","2020-04-16","2020-04-22","2020-04-29","2020-05-07","2020-05-14","2020-05-20","2020-05-27","2020-06-02","2020-06-10","2020-06-15","2020-06-24","2020-06-26","2020-07-08","2020-07-09","2020-07-17","2020-07-23","2020-08-03","2020-08-06","2020-08-12","2020-08-18","2020-08-25","2020-09-01","2020-09-07","2020-09-16","2020-09-24","2020-09-25","2020-10-01","2020-10-08","2020-10-20","2020-10-22","2020-10-30","2020-11-06","2020-11-12","2020-11-20","2020-11-24","2020-12-03","2020-12-04","2020-12-10","2020-12-22","2020-12-31","2021-01-06","2021-01-11","2021-01-15","2021-01-21","2021-01-28","2021-02-04","2021-02-11","2021-02-22","2021-02-26","2021-03-05","2021-03-11","2021-03-18","2021-03-22","2021-03-31","2021-04-07","2021-04-13","2021-04-19","2021-04-27","2021-04-30","2021-05-10","2021-05-18","2021-05-24","2021-05-27","2021-06-04","2021-06-15","2021-06-21","2021-06-25","2021-06-30","2021-07-06","2021-07-15","2021-07-20","2021-07-29","2021-08-03","2021-08-09","2021-08-13","2021-08-19","2021-08-25","2021-09-06","2021-09-09","2021-09-20","2021-09-23","2021-09-30","2021-10-06","2021-10-11","2021-10-19","2021-10-27","2021-11-02","2021-11-08","2021-11-16","2021-11-17","2021-11-24","2021-12-02","2021-12-08","2021-12-15","2021-12-23","2022-01-05","2022-01-11","2022-01-18","2022-01-20","2022-01-28","2022-02-02","2022-02-08","2022-02-18","2022-02-24","2022-03-01","2022-03-08","2022-03-15","2022-03-22","2022-03-29","2022-04-04","2022-04-07","2022-04-19","2022-04-25","2022-04-27","2022-05-05","2022-05-16","2022-05-23","2022-05-26","2022-06-06","2022-06-14","2022-06-21","2022-06-24","2022-06-29","2022-07-06","2022-07-14","2022-07-19","2022-07-27","2022-08-04","2022-08-05","2022-08-12","2022-08-22","2022-08-25","2022-09-02","2022-09-09","2022-09-20","2022-09-26","2022-10-03","2022-10-05","2022-10-13","2022-10-20","2022-10-27","2022-11-03","2022-11-09","2022-11-11","2022-11-21","2022-11-24","2022-12-02","2022-12-07","2022-12-14","2022-12-23","2023-01-04","2023-01-06","2023-01-12","2023-01-19","2023-01-25","2023-02-03","2023-02-07","2023-02-16","2023-02-23","2023-02-27","2023-03-03","2023-03-10","2023-03-17","2023-03-27","2023-03-29","2023-04-05","2023-04-13","2023-04-24","2023-05-02","2023-05-10","2023-05-15","2023-05-22","2023-05-25","2023-06-01","2023-06-07","2023-06-15","2023-06-21","2023-06-30","2023-07-07","2023-07-13","2023-07-19","2023-07-27","2023-07-28","2023-08-09","2023-08-11","2023-08-17","2023-08-30","2023-09-04","2023-09-08","2023-09-14","2023-09-20","2023-09-29","2023-10-06","2023-10-10","2023-10-13","2023-10-25","2023-10-31","2023-11-06","2023-11-10","2023-11-16","2023-11-22","2023-12-01","2023-12-07","2023-12-15","2023-12-19","2023-12-29","2024-01-05","2024-01-09","2024-01-17","2024-01-26","2024-01-30","2024-02-08","2024-02-12","2024-02-19","2024-02-23","2024-03-01","2024-03-08","2024-03-15","2024-03-20","2024-03-28","2024-04-09","2024-04-12","2024-04-18","2024-04-25","2024-05-03","2024-05-07","2024-05-16","2024-05-24","2024-05-29","2024-06-03","2024-06-13","2024-06-17","2024-06-24","2024-07-02","2024-07-04","2024-07-11","2024-07-17","2024-07-26","2024-08-02","2024-08-06","2024-08-16","2024-08-20","2024-08-27","2024-09-04","2024-09-06","2024-09-16","2024-09-23","2024-09-27","2024-10-08","2024-10-10","2024-10-18","2024-10-24","2024-10-29","2024-11-04","2024-11-14","2024-11-20","2024-11-27","2024-12-03","2024-12-06","2024-12-12","2024-12-24","2025-01-02","2025-01-06","2025-01-10","2025-01-17","2025-01-27","2025-01-31","2025-02-07","2025-02-14","2025-02-21","2025-02-28","2025-03-05","2025-03-13","2025-03-18","2025-03-21","2025-04-01","2025-04-07","2025-04-11","2025-04-17","2025-04-29","2025-05-01","2025-05-09","2025-05-19","2025-05-23","2025-06-02","2025-06-06","2025-06-11","2025-06-23","2025-06-26","2025-07-01","2025-07-11","2025-07-18","2025-07-24","2025-07-28","2025-08-01","2025-08-08","2025-08-15","2025-08-20","2025-09-01","2025-09-04","2025-09-11","2025-09-19","2025-09-26","2025-09-29","2025-10-10","2025-10-16","2025-10-22","2025-10-29","2025-11-05","2025-11-06","2025-11-13","2025-11-21","2025-12-01","2025-12-02","2025-12-11","2025-12-16","2025-12-24","2025-12-31","2026-01-07","2026-01-19","2026-01-23","2026-01-29","2026-02-02","2026-02-11","2026-02-13","2026-02-17","2026-02-25","2026-03-09"],"p":[471.0,481.75,476.0,483.25,473.6,482.95,476.25,488.6,503.25,499.75,484.65,487.25,474.75,478.75,488.75,484.75,469.0,482.1,475.85,490.5,479.65,502.75,504.5,484.5,486.0,455.65,462.0,462.5,431.25,448.0,389.75,407.25,426.15,435.75,419.0,407.3,423.0,432.75,425.1,431.25,415.75,424.0,411.25,413.5,424.0,415.5,392.25,394.75,379.75,388.5,379.35,401.75,397.0,416.1,401.75,390.0,403.25,406.0,404.5,394.75,387.5,393.5,390.0,388.5,392.65,369.5,382.5,369.75,375.35,372.55,381.65,375.25,381.0,378.4,363.85,348.75,353.5,340.5,345.5,335.25,349.6,345.8,354.75,348.8,360.25,356.75,369.0,371.25,357.25,364.35,358.75,358.75,371.6,371.85,364.5,371.5,334.75,341.5,334.2,341.0,333.7,339.75,353.4,358.25,367.5,358.5,353.8,359.65,363.75,361.0,348.0,348.85,360.25,345.85,348.5,341.25,340.75,352.75,352.8,363.0,367.25,376.75,367.25,371.65,363.8,366.75,385.5,392.1,392.0,377.9,385.5,375.75,345.65,342.75,353.5,361.75,359.1,367.25,361.15,368.1,365.85,355.45,358.75,357.25,353.5,362.25,350.65,353.5,358.65,355.25,368.75,362.25,365.5,355.25,361.5,356.6,356.5,363.0,364.5,359.25,368.5,368.25,347.1,339.75,348.95,348.75,356.9,356.25,365.8,360.0,365.75,377.15,386.5,378.75,389.25,385.25,398.0,386.25,387.65,375.5,372.65,391.5,408.75,401.25,399.5,404.9,417.75,392.35,387.25,388.1,383.25,372.65,356.5,353.0,362.75,357.75,356.65,370.1,367.1,376.35,365.85,378.25,378.8,378.0,372.65,366.75,379.5,387.6,385.25,399.5,382.0,393.5,380.5,379.25,395.5,389.5,403.0,397.75,389.5,390.5,405.5,398.1,408.25,415.25,397.25,399.25,385.75,401.0,387.75,396.9,397.25,407.0,397.0,395.25,406.0,408.75,398.6,410.15,402.5,410.0,411.75,423.0,409.75,406.25,413.5,411.5,412.0,421.15,409.5,420.0,419.4,416.0,420.75,414.25,425.25,424.0,414.0,409.25,415.75,411.25,409.6,401.0,411.0,408.15,417.75,403.25,407.75,418.0,419.25,413.6,415.5,408.75,415.75,417.25,404.0,419.5,422.75,412.25,416.5,457.5,449.0,461.25,438.75,452.75,459.0,433.5,427.35,437.75,431.5,441.0,436.6,442.75,442.0,433.5,433.75,440.25,429.75,418.75,423.75,415.5,430.0,434.5,427.85,425.15,440.85,424.5,423.9,412.75,416.85,412.5,412.25,406.5,404.85,422.25,415.0,412.0,410.0,414.0,417.0,405.65,398.25,413.75,412.85,419.75,418.0,433.0,423.25,419.5,423.75,410.6,406.35,410.5,413.75,410.5,414.5,405.35,408.0,399.25,406.0,400.5,406.25,402.0,397.25,401.0,390.75,392.75,393.4,389.5,391.75,387.25,395.0,392.0,398.75,403.5,400.0,400.5,397.25,401.0,393.0,393.75,388.0,388.25,381.5,384.0,387.25,383.0,387.5,380.5,379.25,388.25,384.25,374.25,373.75,368.0,367.25,372.5,369.5,359.0,363.25,356.25,360.5,350.25,351.5,368.5,363.85,398.75,377.25,382.75,379.0,376.5,363.75,369.75,365.0,378.75,373.25,373.0,395.25,388.75,392.75,404.0,495.0,437.0,411.0,414.0,434.0,397.0,409.0,415.5,426.0,460.0,426.5,431.0,406.5,407.5,418.0,427.0,421.0,443.0,429.5,423.0,439.0,425.5,398.5,408.0,399.5,386.0,396.0,380.0,388.0,377.0,345.5,364.0,358.0,364.0,385.75,373.0,388.5,397.0,387.0,388.0,376.0,385.25,381.5,395.0,414.0,423.0,405.0,420.0,428.0,422.0,397.5,393.0,403.0,382.0,364.0,355.25,362.5,347.0,359.0,349.5,366.0,373.5,395.5,380.0,374.0,379.5,370.25,372.0,358.0,349.0,369.0,365.0,356.0,359.0,340.0,352.0,340.5,337.0,336.0,344.0,338.0,356.0,358.0,345.0,346.0,353.0,347.0,361.5,362.5,361.5,351.0,354.0,345.0,359.0,359.0,380.0,384.0,372.0,377.0,364.0,374.0,361.0,356.0,358.0,365.0,357.0,349.0,356.0,354.0,356.0,365.0,367.5,362.0,352.5,346.0,352.5,345.5,351.0,353.75,344.0,352.0,349.0,347.0,355.0,347.25,351.5,376.5,373.75,374.5,429.0,411.0,436.0,410.0,430.0,415.0,420.0,454.0,430.0,450.0,435.0,438.0,449.0,434.0,448.0,416.0,422.0,439.0,495.0,495.0,541.0,573.0,478.0,486.0,465.0,478.0,496.0,479.0,508.0,521.0,491.0,477.0,532.0,509.0,506.0,550.0,563.0,566.0,548.0,542.0,575.0,580.0,535.0,548.0,578.0,583.0,558.0,612.0,565.0,570.0,572.0,612.0,596.0,608.0,593.0,568.0,569.0,580.0,587.0,588.0,576.0,600.0,602.0,588.0,586.0,586.0,623.0,625.0,602.0,619.0,610.0,645.0,610.0,624.0,604.0,608.0,597.0,595.0,607.0,578.5,600.0,589.0,575.0,581.0,558.0,578.0,630.0,599.0,596.0,622.0,604.0,616.0,620.0,596.0,574.0,582.5,574.5,558.0,553.0,560.0,510.0,504.0,473.0,433.0,422.0,448.0,465.0,446.0,443.0,490.0,480.0,406.0,446.0,424.0,457.0,417.0,431.0,416.0,428.0,441.0,434.0,436.0,467.0,466.0,453.0,477.0,470.0,480.0,482.0,466.0,449.0,474.0,479.0,470.0,494.0,486.0,526.0,508.0,511.0,537.0,526.0,537.0,558.0,548.0,519.0,525.0,546.0,538.0,547.0,564.0,555.0,567.0,541.0,520.0,529.0,531.0,520.0,529.0,526.0,553.0,558.0,541.0,568.0,540.0,551.5,570.0,560.5,560.0,593.0,598.0,580.0,590.0,578.0,580.0,602.0,590.0,585.0,602.0,594.0,607.0,585.0,606.0,624.0,619.0,648.0,642.0,703.0,677.0,693.0,664.0,699.0,705.0,694.0,662.0,625.0,642.0,611.0,628.0,638.0,606.0,612.0,662.0,680.0,638.0,669.0,649.5,670.0,662.0,673.0,665.0,687.0,685.0,700.0,677.0,680.0,698.0,704.0,691.0,714.0,697.5,696.0,705.0,702.0,718.0,732.0,725.0,740.0,759.0,742.0,771.5,762.0,758.0,770.0,796.0,829.0,842.0,812.0,826.0,868.0,849.0,866.0,829.0,823.0,849.0,842.0,873.0,894.0,910.0,900.0,923.0,888.0,887.0,934.0,937.0,850.0,783.0,775.0,816.0,808.0,843.0,836.0,774.0,811.5,810.0,778.0,778.0,824.0,836.0,805.0,833.0,833.0,870.0,844.0,868.0,873.0,832.0,835.0,848.0,869.0,834.0,830.0,854.0,857.0,828.0,845.0,878.0,853.0,861.0,873.0,827.0,845.0,840.0,867.0,843.0,862.0,858.0,863.0,881.0,847.0,873.0,861.0,869.0,865.0,876.0,883.0,858.0,858.0,865.0,862.0,872.0,867.0,875.0,881.0,855.0,860.0,876.0,869.0,870.5,900.0,885.0,864.0,872.0,867.0,884.0,880.0,914.0,924.0,892.0,887.0,891.0,908.0,908.0,930.0,910.0,914.0,941.0,925.0,924.0,944.0,925.0,931.5,982.0,970.0,997.0,1001.0,1011.0,942.0,968.0,964.0,1020.0,1025.0,1039.0,1074.0,1078.0,1009.0,1002.0,1027.0,1063.0,1012.0,1020.0,1033.0,1042.0,1082.0,1085.0,1075.0,1121.0,1170.0,1190.0,1335.0,1278.0,1292.0,1227.0,1135.0,1140.0,1198.0,1185.0,1234.0,1253.0,1211.0,1204.0,1247.0,1248.0,1223.0,1240.0,1221.0,1261.0,1258.0,1161.0,1132.0,1150.0,1080.0,1064.0,1094.0,1065.0,1074.0,1207.0,1164.0,1390.0,1160.0,1175.0,1124.0,1106.0,1122.0,1136.0,1112.0,1141.0,1139.0,1172.0,1162.0,1166.0,1216.0,1206.0,1253.0,1185.0,1203.0,1209.0,1236.0,1241.0,1257.0,1268.0,1323.0,1280.0,1287.0,1336.0,1328.0,1282.0,1264.0,1302.0,1278.0,1294.0,1267.0,1272.0,1306.0,1306.0,1332.0,1280.0,1296.0,1282.0,1238.0,1238.0,1269.0,1272.0,1305.0,1288.0,1336.0,1382.0,1355.0,1404.0,1454.0,1462.0,1438.0,1476.0,1402.0,1469.0,1420.0,1472.0,1459.0,1476.0,1510.0,1546.0,1529.0,1589.0,1522.0,1649.0,1687.0,1784.0,1907.0,2160.0,2093.0,2276.0,2044.0,1824.0,2037.0,1938.0,2023.0,1949.0,2062.0,1932.0,1855.0,2082.0,2012.0,2192.0,1976.0,2066.0,2020.0,2080.0,2023.0,2075.0,1966.0,2015.0,1736.0,1753.0,1550.0,1570.0,1313.0,1455.0,1475.0,1365.0,1152.0,1083.0,1225.0,962.0,1019.0,1031.0,868.0,756.0,856.0,875.0,834.0,803.0,868.0,803.0,823.0,874.0,856.0,935.0,991.0,915.0,945.0,942.0,964.0,1084.0,1113.0,1040.0,1094.0,1050.0,1052.0,1118.0,1144.0,1127.0,1229.0,1171.0,1181.0,1085.0,1164.0,1105.0,1152.0,1126.0,1293.0,1235.0,1229.0,1165.0,1208.0,1113.0,1092.0,1169.0,1212.0,1172.0,1286.0,1227.0,1222.0,1251.0,1212.0,1283.0,1343.0,1333.0,1278.0,1285.0,1336.0,1358.0,1369.0,1315.0,1360.0,1359.0,1459.0,1430.0,1500.0,1433.0,1413.0,1421.0,1397.0,1548.0,1563.0,1641.0,1556.0,1514.0,1586.0,1499.0,1548.0,1497.0,1581.0,1587.0,1638.0,1583.0,1610.0,1712.0,1730.0,1679.0,1751.0,1665.0,1731.0,1675.0,1494.0,1569.0,1495.0,1542.0,1605.0,1543.0,1516.0,1503.0,1528.0,1509.0,1558.0,1590.0,1534.0,1543.0,1497.0,1534.0,1565.0,1548.0,1619.0,1616.0,1612.0,1720.0,1676.0,1695.0,1661.0,1713.0,1780.0,1705.0,1639.5,1642.0,1721.0,1681.0,1711.0,1700.0,1760.0,1716.0,1810.0,1846.0,1787.0,1789.0,1863.0,1830.0,1847.0,1772.0,1846.0,1720.5,1698.0,1753.0,1745.0,1810.0,1783.0,1782.0,1858.0,1787.0,1755.0,1757.0,1821.0,1816.0,1842.0,1747.0,1747.0,1674.0,1738.0,1715.0,1784.0,1810.0,1790.0,1700.0,1793.0,1894.0,1805.0,1881.0,1837.0,1818.0,1784.0,1542.0,1442.0,1521.0,1574.0,1491.0,1645.0,1595.0,1651.0,1630.0,1535.0,1559.0,1531.0,1398.0,1447.0,1364.0,1405.0,1500.0,1507.0,1597.0,1626.0,1610.0,1665.0,1612.0,1728.0,1727.0,1620.0,1698.0,1617.0,1661.0,1658.0,1571.0,1592.0,1550.0,1574.0,1521.0,1426.0,1468.0,1413.0,1462.0,1433.0,1486.0,1406.0,1480.0,1425.0,1428.0,1394.0,1417.0,1392.0,1414.0,1398.0,1549.0,1508.0,1580.0,1647.0,1695.0,1608.0,1661.0,1714.0,1643.0,1666.0,1551.0,1573.0,1541.0,1594.0,1561.0,1619.0,1592.0,1640.0,1610.0,1550.0,1523.0,1564.0,1697.0,1671.0,1687.0,1672.0,1730.0,1726.0,1608.0,1565.0,1602.0,1598.0,1560.0,1582.0,1592.0,1540.0,1432.0,1416.0,1513.0,1477.0,1504.0,1452.0,1448.0,1466.0,1536.0,1448.0,1363.0,1323.0,1335.0,1401.0,1408.0,1445.0,1428.0,1421.0,1487.0,1519.0,1548.0,1511.0,1529.0,1432.0,1475.0,1423.0,1375.0,1407.0,1368.0,1432.0,1467.0,1449.0,1466.0,1435.0,1400.0,1361.0,1345.0,1386.0,1325.0,1327.0,1407.0,1406.0,1466.0,1450.0,1383.0,1379.0,1395.0,1422.0,1419.0,1427.0,1481.0,1475.0,1438.0,1404.0,1439.0,1456.0,1464.0,1400.0,1448.0,1431.0,1473.5,1484.0,1452.0,1421.0,1476.0,1431.0,1462.0,1509.0,1493.0,1511.0,1481.0,1488.0,1461.0,1481.0,1472.0,1424.0,1425.0,1424.0,1410.0,1364.0,1343.0,1304.0,1217.0,1284.0,1251.0,1273.0,1270.0,1200.0,1211.0,1198.0,1216.0,1198.0,1236.0,1239.0,1188.0,1216.0,1210.0,1230.0,1281.0,1263.0,1230.0,1255.0,1211.0,1157.0,1189.0,1182.0,1126.0,1093.0,1157.0,1121.0,1172.0,1147.0,1167.0,1116.0,1154.0,1128.0,1166.0,1158.0,1114.0,1113.0,1087.0,1074.0,1070.0,1086.0,1015.0,1026.0,968.0,987.0,950.0,994.0,994.0,1026.0,979.0,1012.0,953.0,980.0,942.0,899.0,973.0,1003.0,1013.0,986.0,994.0,936.0,884.0,851.0,829.0,874.0,848.0,842.0,878.0,890.0,837.0,846.0,817.0,884.0,862.0,939.0,952.0,927.0,920.0,1002.0,952.0,983.0,945.0,982.0,945.0,994.0,1008.0,1084.0,1056.0,1053.0,1019.0,1017.0,960.0,1007.0,979.0,975.0,979.0,1033.0,1086.0,1096.0,1072.0,1149.0,1143.0,1175.0,1123.0,1105.0,1044.0,1095.0,1034.0,1026.0,1055.0,1020.0,964.0,938.0,926.0,966.0,995.0,1005.0,940.0,946.0,911.0,939.0,937.0,904.0,903.0,906.0,968.0,994.0,955.0,981.0,1003.0,1020.0,998.0,1026.0,1027.0,940.0,937.0,964.0,978.0,945.0,944.0,983.0,966.0,904.0,905.0,939.0,933.0,953.0,928.0,946.0,922.0,931.0,919.0,904.0,895.0,924.0,923.0,935.0,967.0,961.0,983.0,972.0,1011.0,1014.0,968.0,940.0,920.0,912.0,936.0,943.0,919.0,916.0,929.0,937.0,927.0,934.0,949.0,895.0,877.0,918.0,923.0,963.0,963.0,1012.0,990.0,1009.0,974.0,966.0,1011.0,1005.0,960.0,949.0,969.0,946.0,957.0,910.0,931.0,950.0,909.0,899.0,926.0,888.0,912.0,912.0,897.0,905.0,862.0,877.0,822.0,857.0,832.0,804.0,838.0,817.0,830.0,781.0,800.0,807.0,774.0,804.0,795.0,838.0,811.0,815.0,844.0,828.5,826.0,865.0,876.0,833.0,849.0,846.0,810.0,780.0,800.0,791.0,797.0,829.0,801.0,791.0,818.0,820.0,795.0,784.0,824.0,874.0,820.0,813.0,869.0,850.0,846.0,908.0,889.0,882.0,898.0,853.0,855.0,826.0,792.0,823.0,803.0,818.0,800.0,833.0,813.0,808.0,857.0,881.0,863.0,845.0,865.0,834.0,856.0,935.0,982.0,939.0,955.0,925.0,874.0,902.0,882.0,888.0,928.0,954.0,894.0,875.0,912.0,892.0,890.0,940.0,927.0,922.0,988.0,954.0,1033.0,999.0,971.0,952.0,965.0,1018.0,967.0,880.0,878.0,641.0,618.0,734.0,719.0,745.0,794.0,756.0,780.0,753.0,765.0,850.0,831.0,846.0,839.0,805.0,826.0,802.0,840.0,858.0,825.0,928.0,906.0,977.0,938.0,972.0,922.0,950.0,906.0,981.0,839.0,857.0,899.0,866.0,855.0,892.0,856.0,901.0,873.0,951.0,937.0,1022.0,1048.0,1010.0,1004.0,1075.0,1106.0,1043.0,1095.0,1121.0,1057.0,1084.0,1253.0,1272.0,1209.0,1119.0,1223.0,1208.0,1172.0,1174.0,1238.0,1171.0,1219.0,1241.0,1209.0,1265.0,1237.0,1164.0,1190.0,1153.0,1158.0,1040.0,1100.0,1054.0,1110.0,1144.0,1078.0,1077.0,1054.0,976.0,1020.0,971.0,1000.0,1029.0,983.0,928.0,1010.0,958.0,947.0,1034.0,1055.0,1016.0,1058.0,1037.0,1106.0,1067.0,984.0,941.0,963.0,911.0,973.0,982.0,945.0,966.0,1045.0,1006.0,1039.0,1012.0,1092.0,1119.0,1059.0,1149.0,1020.0,1030.0,984.0,991.0,950.0,1023.0,925.0,910.0,986.0,938.0,969.0,943.0,1031.0,937.0,946.0,916.0,925.0,863.0,837.0,875.0,879.0,903.0,936.0,959.0,882.0,886.0,836.0,892.0,925.0,860.0,865.0,924.0,885.0,885.0,950.0,922.0,1002.0,1055.0,966.0,991.0,1041.0,983.0,1038.0,995.0,1093.0,1048.0,1074.0,1029.0,1049.0,1028.0,972.0,916.0,953.0,918.0,971.0,939.0,983.0,966.0,963.0,1025.0,1022.0,1106.0,1051.0,1103.0,1063.0,1074.0,1028.0,1005.0,1042.0,967.0,957.0,895.0,908.0,961.0,988.0,974.0,937.0,903.0,917.0,891.0,983.0,959.0,903.0,901.0,945.0,918.0,859.0,891.0,871.0,884.0,937.0,932.0,855.0,904.0,937.0,937.0,899.0,964.0,946.0,1006.0,951.0,950.0,892.0,898.0,930.0,884.0,875.0,910.0,890.0,875.0,922.0,938.0,896.0,896.0,978.0,997.0,942.0,911.0,968.0,952.0,1066.0,1019.0,1055.0,1030.0,949.0,952.0,1005.0,984.0,1012.0,984.0,1016.0,934.0,973.0,916.0,954.0,965.0,963.0,903.0,931.0,996.0,956.0,1009.0,965.0,957.0,1010.0,1037.0,1050.0,999.0,933.0,965.0,931.0,955.0,936.0,944.0,942.0,911.0,947.0,968.0,941.0,945.0,977.0,998.0,1008.0,970.0,946.0,974.0,977.0,1011.0,976.0,994.0,918.0,945.0,963.0,991.0,965.0,988.0,995.0,1087.0,1051.0,1163.0,1264.0,1298.0,1402.0,1333.0,1357.0,1464.0,1388.0,1407.0,1264.0,1335.0,1361.0,1315.0,1396.0,1407.0,1383.0,1389.0,1541.0,1606.0,1621.0,1666.0,1553.0,1613.0,1539.0,1579.0,1627.0,1499.0,1677.0,1615.0,1673.0,1806.0,2295.0,2027.0,2319.0,2362.0,2663.0,2755.0,2063.0,2178.0,2025.47,2018.12,2320.54,2185.18]},"Silver":{"t":["1968-01-02","1968-01-03","1968-01-16","1968-01-26","1968-02-06","1968-02-14","1968-03-01","1968-03-13","1968-03-18","1968-03-27","1968-04-05","1968-04-22","1968-05-07","1968-05-17","1968-05-21","1968-05-29","1968-06-12","1968-06-21","1968-07-04","1968-07-18","1968-07-24","1968-08-09","1968-08-13","1968-08-21","1968-09-10","1968-09-18","1968-09-25","1968-10-08","1968-10-17","1968-10-29","1968-11-07","1968-11-18","1968-11-27","1968-12-09","1968-12-27","1969-01-10","1969-01-17","1969-01-31","1969-02-07","1969-02-14","1969-03-04","1969-03-07","1969-03-18","1969-04-03","1969-04-09","1969-04-22","1969-04-28","1969-05-08","1969-05-20","1969-06-05","1969-06-18","1969-06-20","1969-07-03","1969-07-15","1969-07-22","1969-08-05","1969-08-14","1969-08-28","1969-09-09","1969-09-16","1969-09-24","1969-10-06","1969-10-17","1969-10-31","1969-11-03","1969-11-19","1969-12-02","1969-12-10","1969-12-18","1969-12-24","1970-01-12","1970-01-20","1970-01-29","1970-02-16","1970-02-25","1970-03-05","1970-03-13","1970-04-01","1970-04-10","1970-04-21","1970-04-30","1970-05-05","1970-05-13","1970-05-26","1970-06-10","1970-06-15","1970-07-02","1970-07-13","1970-07-16","1970-07-28","1970-08-11","1970-08-19","1970-08-26","1970-09-09","1970-09-25","1970-09-30","1970-10-08","1970-10-20","1970-10-28","1970-11-10","1970-11-25","1970-12-01","1970-12-17","1970-12-22","1970-12-31","1971-01-11","1971-01-22","1971-02-03","1971-02-10","1971-02-25","1971-03-10","1971-03-15","1971-03-25","1971-04-08","1971-04-22","1971-04-27","1971-05-14","1971-05-24","1971-06-07","1971-06-09","1971-06-22","1971-07-02","1971-07-16","1971-07-27","1971-08-04","1971-08-23","1971-09-06","1971-09-08","1971-09-17","1971-10-04","1971-10-11","1971-10-19","1971-11-02","1971-11-16","1971-11-26","1971-12-06","1971-12-17","1971-12-28","1972-01-03","1972-01-11","1972-01-26","1972-02-02","1972-02-14","1972-02-29","1972-03-07","1972-03-17","1972-04-04","1972-04-06","1972-04-20","1972-05-01","1972-05-11","1972-05-17","1972-06-01","1972-06-15","1972-06-29","1972-07-05","1972-07-13","1972-07-28","1972-08-01","1972-08-14","1972-08-24","1972-09-05","1972-09-19","1972-09-27","1972-10-04","1972-10-23","1972-10-31","1972-11-06","1972-11-20","1972-11-28","1972-12-06","1972-12-20","1973-01-04","1973-01-08","1973-01-23","1973-01-29","1973-02-20","1973-03-01","1973-03-16","1973-03-26","1973-04-02","1973-04-11","1973-04-24","1973-05-07","1973-05-15","1973-06-05","1973-06-12","1973-06-18","1973-07-03","1973-07-11","1973-07-17","1973-08-01","1973-08-09","1973-08-21","1973-08-29","1973-09-13","1973-09-21","1973-10-05","1973-10-17","1973-10-29","1973-11-06","1973-11-14","1973-11-27","1973-11-29","1973-12-14","1973-12-20","1974-01-14","1974-01-21","1974-01-31","1974-02-12","1974-02-19","1974-02-26","1974-03-11","1974-03-19","1974-04-01","1974-04-11","1974-04-25","1974-05-07","1974-05-14","1974-05-29","1974-06-10","1974-06-12","1974-07-01","1974-07-04","1974-07-12","1974-07-30","1974-08-05","1974-08-14","1974-08-30","1974-09-12","1974-09-18","1974-10-03","1974-10-10","1974-10-17","1974-10-28","1974-11-11","1974-11-22","1974-12-02","1974-12-10","1974-12-27","1975-01-06","1975-01-15","1975-01-23","1975-01-30","1975-02-11","1975-02-21","1975-03-05","1975-03-14","1975-03-25","1975-04-14","1975-04-18","1975-05-05","1975-05-14","1975-05-16","1975-05-28","1975-06-06","1975-06-24","1975-07-01","1975-07-08","1975-07-23","1975-07-29","1975-08-08","1975-08-19","1975-09-02","1975-09-15","1975-09-23","1975-10-02","1975-10-09","1975-10-28","1975-11-06","1975-11-11","1975-11-25","1975-12-09","1975-12-15","1975-12-23","1976-01-13","1976-01-21","1976-01-30","1976-02-10","1976-02-20","1976-03-02","1976-03-10","1976-03-22","1976-03-30","1976-04-13","1976-04-27","1976-05-05","1976-05-13","1976-05-24","1976-06-01","1976-06-14","1976-06-29","1976-07-07","1976-07-20","1976-07-28","1976-08-03","1976-08-20","1976-09-01","1976-09-08","1976-09-14","1976-09-27","1976-10-11","1976-10-14","1976-10-27","1976-11-11","1976-11-15","1976-11-29","1976-12-09","1976-12-23","1977-01-04","1977-01-11","1977-01-27","1977-01-31","1977-02-16","1977-02-23","1977-03-07","1977-03-11","1977-03-25","1977-04-06","1977-04-22","1977-04-29","1977-05-13","1977-05-24","1977-06-02","1977-06-14","1977-06-21","1977-07-04","1977-07-15","1977-07-26","1977-07-29","1977-08-11","1977-08-23","1977-09-05","1977-09-14","1977-09-22","1977-10-06","1977-10-17","1977-10-20","1977-11-09","1977-11-15","1977-11-22","1977-12-06","1977-12-13","1978-01-04","1978-01-05","1978-01-24","1978-02-03","1978-02-09","1978-02-20","1978-03-06","1978-03-14","1978-03-21","1978-04-03","1978-04-12","1978-04-25","1978-05-05","1978-05-15","1978-05-31","1978-06-09","1978-06-20","1978-06-30","1978-07-07","1978-07-19","1978-08-01","1978-08-04","1978-08-15","1978-08-25","1978-09-11","1978-09-21","1978-10-02","1978-10-10","1978-10-24","1978-10-31","1978-11-10","1978-11-24","1978-11-29","1978-12-12","1978-12-19","1979-01-10","1979-01-15","1979-01-30","1979-02-08","1979-02-14","1979-02-21","1979-03-13","1979-03-22","1979-03-27","1979-04-04","1979-04-23","1979-05-01","1979-05-10","1979-05-29","1979-06-04","1979-06-13","1979-06-22","1979-07-03","1979-07-18","1979-07-27","1979-08-07","1979-08-20","1979-08-31","1979-09-06","1979-09-18","1979-09-25","1979-10-03","1979-10-15","1979-10-29","1979-11-07","1979-11-22","1979-12-03","1979-12-10","1979-12-24","1980-01-02","1980-01-09","1980-01-18","1980-01-31","1980-02-11","1980-02-20","1980-03-05","1980-03-18","1980-03-24","1980-03-31","1980-04-14","1980-05-01","1980-05-06","1980-05-22","1980-05-28","1980-06-09","1980-06-17","1980-07-02","1980-07-15","1980-07-25","1980-08-01","1980-08-07","1980-08-18","1980-09-04","1980-09-12","1980-09-24","1980-10-03","1980-10-10","1980-10-23","1980-11-05","1980-11-07","1980-11-20","1980-12-04","1980-12-12","1980-12-24","1981-01-06","1981-01-21","1981-02-03","1981-02-09","1981-02-16","1981-03-05","1981-03-10","1981-03-23","1981-04-01","1981-04-13","1981-04-22","1981-05-05","1981-05-12","1981-05-27","1981-06-03","1981-06-23","1981-06-30","1981-07-13","1981-07-14","1981-08-03","1981-08-14","1981-08-25","1981-09-01","1981-09-14","1981-09-18","1981-09-28","1981-10-15","1981-10-21","1981-11-04","1981-11-17","1981-11-23","1981-12-04","1981-12-17","1981-12-29","1982-01-06","1982-01-14","1982-01-25","1982-02-05","1982-02-16","1982-02-23","1982-03-09","1982-03-24","1982-03-29","1982-04-14","1982-04-26","1982-04-29","1982-05-19","1982-05-26","1982-06-02","1982-06-21","1982-06-28","1982-07-02","1982-07-21","1982-07-27","1982-08-11","1982-08-17","1982-08-24","1982-09-07","1982-09-22","1982-10-04","1982-10-14","1982-10-21","1982-10-28","1982-11-05","1982-11-24","1982-12-03","1982-12-07","1982-12-17","1983-01-07","1983-01-17","1983-01-24","1983-02-05","1983-02-09","1983-02-22","1983-03-01","1983-03-15","1983-03-23","1983-04-13","1983-04-18","1983-04-28","1983-05-11","1983-05-25","1983-05-31","1983-06-07","1983-06-24","1983-07-06","1983-07-12","1983-07-21","1983-08-05","1983-08-10","1983-08-23","1983-08-31","1983-09-12","1983-09-26","1983-10-05","1983-10-11","1983-10-27","1983-11-01","1983-11-10","1983-11-21","1983-11-30","1983-12-19","1984-01-03","1984-01-09","1984-01-24","1984-02-02","1984-02-14","1984-02-23","1984-03-05","1984-03-08","1984-03-16","1984-03-29","1984-04-06","1984-04-24","1984-05-08","1984-05-17","1984-05-24","1984-06-04","1984-06-18","1984-07-02","1984-07-09","1984-07-16","1984-07-30","1984-08-10","1984-08-21","1984-08-29","1984-09-05","1984-09-18","1984-09-26","1984-10-10","1984-10-17","1984-11-01","1984-11-07","1984-11-22","1984-11-30","1984-12-06","1984-12-20","1985-01-07","1985-01-18","1985-01-25","1985-02-01","1985-02-20","1985-02-25","1985-03-12","1985-03-20","1985-03-26","1985-04-15","1985-04-24","1985-05-07","1985-05-14","1985-05-29","1985-05-30","1985-06-19","1985-06-21","1985-07-03","1985-07-17","1985-07-31","1985-08-07","1985-08-19","1985-08-28","1985-09-06","1985-09-18","1985-09-23","1985-10-04","1985-10-17","1985-10-23","1985-11-08","1985-11-14","1985-11-26","1985-12-11","1985-12-17","1986-01-03","1986-01-16","1986-01-20","1986-01-30","1986-02-14","1986-02-25","1986-03-04","1986-03-13","1986-04-02","1986-04-11","1986-04-14","1986-04-25","1986-05-12","1986-05-20","1986-05-30","1986-06-12","1986-06-17","1986-07-02","1986-07-16","1986-07-23","1986-07-30","1986-08-11","1986-08-19","1986-09-02","1986-09-10","1986-09-22","1986-09-30","1986-10-09","1986-10-20","1986-11-05","1986-11-14","1986-11-24","1986-12-01","1986-12-10","1986-12-31","1987-01-13","1987-01-19","1987-01-28","1987-02-04","1987-02-18","1987-03-02","1987-03-13","1987-03-23","1987-03-31","1987-04-14","1987-04-27","1987-05-01","1987-05-18","1987-05-27","1987-06-10","1987-06-23","1987-07-02","1987-07-06","1987-07-16","1987-08-03","1987-08-10","1987-08-17","1987-08-25","1987-09-11","1987-09-21","1987-09-28","1987-10-12","1987-10-19","1987-11-05","1987-11-09","1987-11-23","1987-11-30","1987-12-08","1987-12-30","1988-01-07","1988-01-13","1988-01-25","1988-02-04","1988-02-18","1988-02-29","1988-03-08","1988-03-14","1988-03-31","1988-04-08","1988-04-18","1988-05-04","1988-05-16","1988-05-27","1988-06-03","1988-06-20","1988-06-29","1988-07-05","1988-07-20","1988-07-28","1988-08-04","1988-08-10","1988-08-25","1988-09-09","1988-09-12","1988-09-26","1988-10-06","1988-10-18","1988-10-28","1988-11-03","1988-11-22","1988-11-28","1988-12-02","1988-12-15","1989-01-03","1989-01-16","1989-01-24","1989-02-01","1989-02-15","1989-02-23","1989-03-02","1989-03-15","1989-03-31","1989-04-04","1989-04-13","1989-04-28","1989-05-12","1989-05-22","1989-05-26","1989-06-12","1989-06-20","1989-06-30","1989-07-06","1989-07-20","1989-08-04","1989-08-11","1989-08-23","1989-09-01","1989-09-18","1989-09-25","1989-10-05","1989-10-11","1989-10-23","1989-10-30","1989-11-13","1989-11-24","1989-11-30","1989-12-12","1989-12-29","1990-01-12","1990-01-16","1990-01-30","1990-02-02","1990-02-20","1990-02-28","1990-03-08","1990-03-20","1990-04-02","1990-04-06","1990-04-26","1990-05-04","1990-05-16","1990-05-29","1990-06-01","1990-06-15","1990-06-26","1990-07-03","1990-07-18","1990-08-01","1990-08-02","1990-08-17","1990-08-30","1990-09-05","1990-09-24","1990-09-25","1990-10-12","1990-10-16","1990-10-29","1990-11-08","1990-11-21","1990-11-26","1990-12-14","1990-12-21","1991-01-08","1991-01-16","1991-01-25","1991-02-01","1991-02-12","1991-02-25","1991-03-11","1991-03-19","1991-03-28","1991-04-04","1991-04-18","1991-04-25","1991-05-15","1991-05-20","1991-06-04","1991-06-10","1991-06-24","1991-07-05","1991-07-18","1991-07-26","1991-08-05","1991-08-19","1991-08-23","1991-08-30","1991-09-13","1991-09-24","1991-10-08","1991-10-21","1991-10-29","1991-11-05","1991-11-15","1991-11-25","1991-12-09","1991-12-13","1992-01-02","1992-01-10","1992-01-17","1992-01-31","1992-02-06","1992-02-19","1992-03-06","1992-03-17","1992-03-20","1992-04-01","1992-04-13","1992-04-29","1992-05-06","1992-05-15","1992-06-01","1992-06-12","1992-06-19","1992-07-02","1992-07-08","1992-07-23","1992-08-04","1992-08-10","1992-08-14","1992-08-26","1992-09-11","1992-09-16","1992-09-29","1992-10-14","1992-10-21","1992-11-05","1992-11-11","1992-11-18","1992-12-07","1992-12-09","1992-12-18","1993-01-05","1993-01-14","1993-01-21","1993-02-08","1993-02-11","1993-02-22","1993-03-09","1993-03-24","1993-04-02","1993-04-07","1993-04-22","1993-04-29","1993-05-12","1993-05-19","1993-06-02","1993-06-15","1993-06-29","1993-07-07","1993-07-15","1993-07-30","1993-08-09","1993-08-11","1993-09-01","1993-09-08","1993-09-14","1993-09-30","1993-10-08","1993-10-21","1993-11-02","1993-11-05","1993-11-22","1993-12-01","1993-12-08","1993-12-14","1994-01-04","1994-01-10","1994-01-18","1994-01-28","1994-02-10","1994-02-22","1994-03-08","1994-03-11","1994-03-24","1994-03-31","1994-04-15","1994-04-25","1994-05-06","1994-05-24","1994-05-27","1994-06-07","1994-06-20","1994-06-28","1994-07-14","1994-07-20","1994-08-01","1994-08-15","1994-08-22","1994-09-07","1994-09-16","1994-09-23","1994-10-07","1994-10-14","1994-10-27","1994-11-01","1994-11-10","1994-11-28","1994-12-06","1994-12-13","1994-12-29","1995-01-05","1995-01-19","1995-01-30","1995-02-03","1995-02-23","1995-03-02","1995-03-08","1995-03-27","1995-03-31","1995-04-19","1995-04-27","1995-05-05","1995-05-12","1995-05-26","1995-06-05","1995-06-20","1995-07-03","1995-07-11","1995-07-18","1995-08-01","1995-08-04","1995-08-21","1995-08-31","1995-09-06","1995-09-19","1995-10-04","1995-10-09","1995-10-20","1995-10-26","1995-11-07","1995-11-21","1995-11-30","1995-12-06","1995-12-28","1996-01-05","1996-01-15","1996-01-29","1996-02-02","1996-02-19","1996-02-23","1996-03-05","1996-03-13","1996-03-27","1996-04-15","1996-04-19","1996-04-26","1996-05-08","1996-05-20","1996-06-03","1996-06-14","1996-06-19","1996-06-28","1996-07-16","1996-07-22","1996-08-01","1996-08-15","1996-08-27","1996-09-05","1996-09-19","1996-09-23","1996-10-07","1996-10-14","1996-10-24","1996-11-07","1996-11-12","1996-11-28","1996-12-06","1996-12-17","1996-12-30","1997-01-06","1997-01-22","1997-01-28","1997-02-12","1997-02-17","1997-03-03","1997-03-10","1997-03-20","1997-04-04","1997-04-17","1997-04-29","1997-05-12","1997-05-19","1997-05-30","1997-06-04","1997-06-24","1997-07-03","1997-07-08","1997-07-17","1997-08-05","1997-08-07","1997-08-26","1997-09-03","1997-09-12","1997-09-23","1997-09-30","1997-10-09","1997-10-17","1997-11-03","1997-11-10","1997-11-24","1997-12-04","1997-12-11","1997-12-24","1998-01-12","1998-01-16","1998-01-30","1998-02-06","1998-02-12","1998-02-26","1998-03-05","1998-03-18","1998-04-03","1998-04-16","1998-04-23","1998-05-05","1998-05-13","1998-05-29","1998-06-09","1998-06-15","1998-06-23","1998-07-01","1998-07-13","1998-07-24","1998-08-04","1998-08-13","1998-09-01","1998-09-07","1998-09-22","1998-09-30","1998-10-12","1998-10-16","1998-10-26","1998-11-06","1998-11-13","1998-12-03","1998-12-04","1998-12-17","1999-01-05","1999-01-12","1999-01-27","1999-02-05","1999-02-17","1999-03-01","1999-03-04","1999-03-12","1999-03-22","1999-04-13","1999-04-20","1999-04-30","1999-05-14","1999-05-25","1999-06-01","1999-06-14","1999-06-21","1999-07-01","1999-07-15","1999-07-28","1999-08-04","1999-08-10","1999-08-26","1999-09-01","1999-09-17","1999-09-29","1999-10-06","1999-10-14","1999-10-21","1999-11-04","1999-11-15","1999-11-24","1999-12-03","1999-12-14","1999-12-30","2000-01-07","2000-01-19","2000-01-28","2000-02-07","2000-02-16","2000-03-03","2000-03-10","2000-03-22","2000-03-31","2000-04-11","2000-04-28","2000-05-05","2000-05-12","2000-06-01","2000-06-13","2000-06-22","2000-06-30","2000-07-06","2000-07-18","2000-07-27","2000-08-14","2000-08-24","2000-09-01","2000-09-12","2000-09-21","2000-09-28","2000-10-06","2000-10-23","2000-10-27","2000-11-07","2000-11-22","2000-11-29","2000-12-07","2000-12-19","2001-01-04","2001-01-19","2001-01-30","2001-02-08","2001-02-21","2001-03-01","2001-03-12","2001-03-16","2001-03-28","2001-04-04","2001-04-20","2001-05-01","2001-05-16","2001-05-24","2001-06-01","2001-06-15","2001-06-22","2001-07-06","2001-07-16","2001-07-25","2001-08-07","2001-08-10","2001-08-24","2001-09-11","2001-09-20","2001-09-24","2001-10-08","2001-10-19","2001-10-30","2001-11-05","2001-11-14","2001-11-27","2001-12-13","2001-12-19","2001-12-31","2002-01-10","2002-01-18","2002-01-29","2002-02-15","2002-02-26","2002-03-04","2002-03-12","2002-03-28","2002-04-03","2002-04-17","2002-04-26","2002-05-09","2002-05-20","2002-05-31","2002-06-17","2002-06-19","2002-07-01","2002-07-16","2002-07-22","2002-08-01","2002-08-12","2002-08-20","2002-08-30","2002-09-19","2002-09-27","2002-10-07","2002-10-11","2002-10-25","2002-11-01","2002-11-13","2002-11-28","2002-12-06","2002-12-13","2002-12-24","2003-01-06","2003-01-16","2003-01-27","2003-02-13","2003-02-25","2003-02-28","2003-03-12","2003-03-20","2003-04-07","2003-04-09","2003-04-29","2003-05-02","2003-05-15","2003-06-02","2003-06-11","2003-06-17","2003-06-30","2003-07-10","2003-07-18","2003-07-28","2003-08-13","2003-08-15","2003-09-03","2003-09-12","2003-09-25","2003-10-06","2003-10-16","2003-10-23","2003-11-04","2003-11-13","2003-11-25","2003-12-02","2003-12-15","2003-12-23","2004-01-12","2004-01-16","2004-01-28","2004-02-04","2004-02-18","2004-02-26","2004-03-10","2004-03-17","2004-04-01","2004-04-13","2004-04-22","2004-04-29","2004-05-10","2004-05-26","2004-06-01","2004-06-10","2004-06-25","2004-07-02","2004-07-19","2004-07-28","2004-08-02","2004-08-13","2004-08-20","2004-09-09","2004-09-20","2004-09-27","2004-10-06","2004-10-13","2004-10-25","2004-11-03","2004-11-15","2004-12-02","2004-12-10","2004-12-21","2005-01-04","2005-01-13","2005-01-20","2005-02-07","2005-02-14","2005-02-22","2005-03-02","2005-03-10","2005-03-23","2005-04-12","2005-04-15","2005-04-26","2005-05-04","2005-05-23","2005-06-03","2005-06-13","2005-06-20","2005-07-05","2005-07-12","2005-07-19","2005-08-01","2005-08-09","2005-08-23","2005-08-31","2005-09-14","2005-09-22","2005-10-05","2005-10-12","2005-10-26","2005-11-02","2005-11-17","2005-11-23","2005-12-07","2005-12-12","2005-12-21","2006-01-04","2006-01-23","2006-01-31","2006-02-08","2006-02-16","2006-03-03","2006-03-10","2006-03-21","2006-03-31","2006-04-18","2006-04-21","2006-05-03","2006-05-12","2006-05-22","2006-06-05","2006-06-14","2006-06-29","2006-07-05","2006-07-19","2006-08-01","2006-08-07","2006-08-14","2006-09-04","2006-09-13","2006-09-20","2006-09-28","2006-10-05","2006-10-24","2006-11-03","2006-11-10","2006-11-17","2006-12-04","2006-12-14","2006-12-19","2007-01-02","2007-01-11","2007-01-25","2007-02-05","2007-02-09","2007-02-26","2007-03-05","2007-03-14","2007-03-22","2007-04-03","2007-04-16","2007-05-02","2007-05-08","2007-05-18","2007-06-05","2007-06-13","2007-06-20","2007-07-06","2007-07-13","2007-07-24","2007-08-08","2007-08-17","2007-08-29","2007-09-07","2007-09-17","2007-09-24","2007-10-09","2007-10-15","2007-10-24","2007-11-07","2007-11-16","2007-11-26","2007-12-03","2007-12-17","2008-01-02","2008-01-14","2008-01-22","2008-02-01","2008-02-06","2008-02-18","2008-03-06","2008-03-17","2008-03-20","2008-04-01","2008-04-17","2008-04-25","2008-05-02","2008-05-22","2008-05-27","2008-06-04","2008-06-13","2008-07-03","2008-07-08","2008-07-15","2008-08-04","2008-08-12","2008-08-15","2008-08-29","2008-09-11","2008-09-23","2008-10-03","2008-10-10","2008-10-24","2008-10-30","2008-11-14","2008-11-25","2008-12-02","2008-12-17","2008-12-24","2009-01-07","2009-01-15","2009-01-30","2009-02-04","2009-02-19","2009-03-03","2009-03-06","2009-03-18","2009-03-26","2009-04-07","2009-04-20","2009-05-01","2009-05-08","2009-05-26","2009-06-03","2009-06-17","2009-06-26","2009-07-06","2009-07-13","2009-07-23","2009-08-05","2009-08-19","2009-09-01","2009-09-08","2009-09-17","2009-09-28","2009-10-08","2009-10-20","2009-10-28","2009-11-04","2009-11-18","2009-12-02","2009-12-10","2009-12-23","2010-01-04","2010-01-11","2010-01-20","2010-02-05","2010-02-17","2010-02-24","2010-03-04","2010-03-17","2010-03-24","2010-04-09","2010-04-19","2010-04-30","2010-05-14","2010-05-21","2010-05-28","2010-06-07","2010-06-21","2010-07-02","2010-07-15","2010-07-20","2010-08-04","2010-08-12","2010-08-24","2010-08-27","2010-09-13","2010-09-28","2010-10-07","2010-10-14","2010-10-22","2010-11-09","2010-11-17","2010-11-19","2010-12-07","2010-12-10","2010-12-30","2011-01-07","2011-01-19","2011-01-28","2011-02-09","2011-02-17","2011-03-07","2011-03-15","2011-03-24","2011-03-29","2011-04-13","2011-04-28","2011-05-06","2011-05-23","2011-05-31","2011-06-03","2011-06-21","2011-07-01","2011-07-12","2011-07-18","2011-08-03","2011-08-12","2011-08-22","2011-08-25","2011-09-08","2011-09-26","2011-09-27","2011-10-11","2011-10-21","2011-10-28","2011-11-16","2011-11-21","2011-12-01","2011-12-15","2011-12-29","2011-12-30","2012-01-20","2012-01-26","2012-02-08","2012-02-16","2012-02-29","2012-03-06","2012-03-22","2012-04-03","2012-04-05","2012-04-20","2012-04-30","2012-05-16","2012-05-18","2012-06-01","2012-06-14","2012-06-22","2012-07-05","2012-07-12","2012-07-31","2012-08-03","2012-08-20","2012-08-23","2012-09-12","2012-09-13","2012-10-02","2012-10-11","2012-10-23","2012-11-01","2012-11-05","2012-11-14","2012-11-30","2012-12-12","2012-12-21","2013-01-04","2013-01-17","2013-01-28","2013-02-05","2013-02-13","2013-02-21","2013-03-01","2013-03-12","2013-03-26","2013-04-12","2013-04-15","2013-04-30","2013-05-09","2013-05-20","2013-05-30","2013-06-17","2013-06-26","2013-07-02","2013-07-09","2013-07-24","2013-08-07","2013-08-16","2013-08-28","2013-08-30","2013-09-13","2013-09-19","2013-10-02","2013-10-15","2013-10-24","2013-11-06","2013-11-13","2013-11-25","2013-12-04","2013-12-11","2013-12-20","2014-01-14","2014-01-24","2014-02-03","2014-02-06","2014-02-24","2014-02-28","2014-03-14","2014-03-20","2014-03-28","2014-04-10","2014-04-24","2014-05-06","2014-05-14","2014-05-29","2014-06-10","2014-06-20","2014-06-24","2014-07-10","2014-07-16","2014-07-31","2014-08-06","2014-08-15","2014-08-28","2014-09-08","2014-09-16","2014-10-01","2014-10-09","2014-10-27","2014-11-05","2014-11-14","2014-11-25","2014-12-01","2014-12-10","2014-12-23","2015-01-05","2015-01-21","2015-01-30","2015-02-03","2015-02-18","2015-02-26","2015-03-11","2015-03-18","2015-03-26","2015-04-14","2015-04-27","2015-04-29","2015-05-18","2015-05-20","2015-06-05","2015-06-18","2015-06-25","2015-07-08","2015-07-13","2015-07-24","2015-08-05","2015-08-14","2015-08-27","2015-09-03","2015-09-18","2015-10-01","2015-10-09","2015-10-13","2015-10-26","2015-11-11","2015-11-23","2015-11-26","2015-12-07","2015-12-14","2015-12-24","2016-01-15","2016-01-27","2016-01-28","2016-02-11","2016-02-22","2016-02-29","2016-03-18","2016-03-29","2016-04-08","2016-04-21","2016-04-29","2016-05-04","2016-05-16","2016-06-01","2016-06-10","2016-06-22","2016-07-04","2016-07-08","2016-07-25","2016-08-02","2016-08-08","2016-08-25","2016-09-06","2016-09-12","2016-09-22","2016-10-05","2016-10-07","2016-10-27","2016-11-02","2016-11-10","2016-11-18","2016-12-01","2016-12-14","2016-12-20","2017-01-03","2017-01-18","2017-01-27","2017-02-02","2017-02-21","2017-03-02","2017-03-10","2017-03-20","2017-03-29","2017-04-13","2017-04-25","2017-05-05","2017-05-12","2017-05-26","2017-06-08","2017-06-13","2017-06-29","2017-07-10","2017-07-13","2017-07-27","2017-08-07","2017-08-14","2017-08-24","2017-09-08","2017-09-21","2017-10-02","2017-10-12","2017-10-16","2017-10-27","2017-11-03","2017-11-20","2017-11-28","2017-12-08","2017-12-22","2018-01-03","2018-01-11","2018-01-25","2018-02-08","2018-02-16","2018-02-21","2018-03-07","2018-03-20","2018-03-27","2018-04-06","2018-04-19","2018-05-01","2018-05-11","2018-05-21","2018-06-05","2018-06-15","2018-06-20","2018-07-09","2018-07-18","2018-07-19","2018-08-07","2018-08-16","2018-08-28","2018-09-05","2018-09-17","2018-09-26","2018-10-09","2018-10-15","2018-10-30","2018-11-02","2018-11-14","2018-11-22","2018-12-06","2018-12-19","2019-01-04","2019-01-10","2019-01-22","2019-01-31","2019-02-14","2019-02-20","2019-03-05","2019-03-13","2019-03-25","2019-03-29","2019-04-09","2019-04-24","2019-05-08","2019-05-20","2019-05-30","2019-06-06","2019-06-17","2019-06-25","2019-07-09","2019-07-19","2019-08-01","2019-08-13","2019-08-22","2019-09-04","2019-09-06","2019-09-25","2019-10-01","2019-10-09","2019-10-18","2019-11-04","2019-11-08","2019-11-22","2019-12-04","2019-12-09","2019-12-31","2020-01-06","2020-01-14","2020-01-27","2020-02-05","2020-02-20","2020-02-24","2020-03-11","2020-03-19","2020-03-26","2020-04-15","2020-04-22","2020-05-05","2020-05-18","2020-05-22","2020-06-02","2020-06-15","2020-06-22","2020-07-07","2020-07-20","2020-07-23","2020-08-07","2020-08-12","2020-09-01","2020-09-03","2020-09-15","2020-09-24","2020-10-12","2020-10-15","2020-10-29","2020-11-06","2020-11-12","2020-11-30","2020-12-03","2020-12-14","2021-01-05","2021-01-11","2021-01-27","2021-02-01","2021-02-08","2021-02-25","2021-03-05","2021-03-11","2021-03-30","2021-03-31","2021-04-16","2021-04-30","2021-05-10","2021-05-18","2021-06-04","2021-06-11","2021-06-21","2021-07-06","2021-07-09","2021-07-20","2021-08-04","2021-08-10","2021-08-20","2021-09-06","2021-09-15","2021-09-20","2021-09-30","2021-10-18","2021-10-22","2021-11-03","2021-11-16","2021-11-24","2021-12-02","2021-12-15","2021-12-31","2022-01-07","2022-01-21","2022-01-28","2022-02-03","2022-02-21","2022-02-24","2022-03-09","2022-03-16","2022-04-04","2022-04-19","2022-04-25","2022-05-05","2022-05-13","2022-05-27","2022-06-01","2022-06-17","2022-06-27","2022-07-06","2022-07-21","2022-08-01","2022-08-11","2022-08-22","2022-09-01","2022-09-13","2022-09-26","2022-10-04","2022-10-14","2022-10-21","2022-11-03","2022-11-09","2022-11-21","2022-12-05","2022-12-16","2022-12-21","2023-01-05","2023-01-16","2023-01-30","2023-02-02","2023-02-15","2023-02-28","2023-03-10","2023-03-15","2023-03-27","2023-04-14","2023-04-19","2023-05-05","2023-05-12","2023-05-25","2023-06-09","2023-06-22","2023-06-30","2023-07-12","2023-07-14","2023-07-27","2023-08-09","2023-08-21","2023-08-30","2023-09-07","2023-09-25","2023-10-03","2023-10-06","2023-10-18","2023-10-31","2023-11-13","2023-11-17","2023-12-04","2023-12-13","2023-12-22","2024-01-04","2024-01-15","2024-01-22","2024-02-02","2024-02-14","2024-02-29","2024-03-08","2024-03-21","2024-03-28","2024-04-12","2024-04-23","2024-05-02","2024-05-13","2024-05-20","2024-05-29","2024-06-11","2024-06-27","2024-07-08","2024-07-17","2024-07-26","2024-08-02","2024-08-08","2024-08-20","2024-09-04","2024-09-16","2024-09-26","2024-10-09","2024-10-21","2024-10-29","2024-11-07","2024-11-14","2024-11-22","2024-12-10","2024-12-20","2024-12-23","2025-01-14","2025-01-16","2025-01-28","2025-02-05","2025-02-20","2025-02-28","2025-03-14","2025-03-27","2025-04-07","2025-04-16","2025-04-24","2025-05-01","2025-05-16","2025-06-02","2025-06-06","2025-06-18","2025-06-25","2025-07-14","2025-07-23","2025-07-31","2025-08-07","2025-08-20","2025-09-01","2025-09-11","2025-09-17","2025-09-29","2025-10-16","2025-10-22","2025-11-05","2025-11-13","2025-11-21","2025-12-01","2025-12-09","2025-12-24","2026-01-08","2026-01-14","2026-01-29","2026-02-02","2026-02-17","2026-02-25","2026-03-09"],"p":[2.17,2.23,2.07,2.07,1.95,1.92,2.2,2.37,2.12,2.3,2.1,2.36,2.25,2.5,2.55,2.42,2.58,2.45,2.49,2.24,2.33,2.15,2.06,2.33,2.17,2.25,2.22,2.09,1.84,1.97,1.96,2.1,1.92,2.04,1.94,2.04,1.99,2.0,1.89,1.77,1.8,1.93,1.81,1.83,1.8,1.77,1.81,1.85,1.75,1.77,1.58,1.63,1.57,1.68,1.68,1.6,1.71,1.66,1.76,1.77,1.89,1.82,1.81,1.95,2.0,1.88,1.92,1.76,1.72,1.8,1.81,1.89,1.92,1.9,1.87,1.93,1.87,1.88,1.84,1.86,1.72,1.65,1.72,1.57,1.69,1.63,1.64,1.62,1.69,1.78,1.73,1.84,1.86,1.87,1.73,1.7,1.76,1.72,1.79,1.82,1.66,1.61,1.59,1.67,1.63,1.71,1.56,1.62,1.58,1.57,1.67,1.66,1.66,1.75,1.74,1.67,1.7,1.61,1.58,1.63,1.58,1.6,1.55,1.55,1.63,1.59,1.47,1.37,1.42,1.38,1.3,1.34,1.27,1.34,1.31,1.4,1.43,1.36,1.37,1.48,1.46,1.55,1.49,1.47,1.54,1.51,1.6,1.57,1.54,1.6,1.58,1.6,1.54,1.59,1.55,1.56,1.75,1.84,1.79,1.79,1.9,1.91,1.69,1.69,1.78,1.85,1.8,1.86,1.79,1.81,1.93,1.94,2.05,1.98,1.96,1.96,2.2,2.49,2.15,2.29,2.17,2.25,2.1,2.19,2.47,2.73,2.46,2.6,2.68,2.67,2.91,2.92,2.63,2.69,2.58,2.52,2.73,2.7,3.0,2.82,2.87,2.77,2.76,2.96,2.97,3.2,3.34,3.93,3.87,5.54,5.13,6.76,5.02,5.62,5.32,4.34,5.58,5.21,6.02,4.62,5.2,4.79,4.69,4.12,3.79,5.03,4.49,4.61,4.12,4.12,3.83,4.68,4.97,4.48,5.15,5.06,4.21,4.61,4.17,4.78,4.22,4.45,3.99,4.32,4.22,4.68,4.34,4.5,4.24,4.1,4.33,4.3,4.64,4.45,4.61,4.41,4.46,4.58,4.51,4.66,5.13,5.21,4.77,4.42,4.58,4.4,4.54,4.3,4.18,4.44,4.45,4.31,3.93,3.96,4.24,4.24,3.83,4.01,3.95,4.23,4.14,4.3,4.23,4.03,4.45,4.57,4.36,4.55,4.38,4.68,4.94,4.7,5.08,4.44,4.6,4.25,4.35,4.09,4.45,4.15,4.43,4.13,4.21,4.15,4.46,4.57,4.25,4.39,4.31,4.43,4.31,4.53,4.45,4.5,4.55,4.88,4.81,4.97,4.7,4.86,4.71,4.79,4.61,4.58,4.33,4.5,4.43,4.56,4.63,4.52,4.56,4.36,4.52,4.45,4.62,4.63,4.82,4.77,4.96,4.8,4.7,4.78,4.66,4.97,4.82,5.05,4.9,4.85,5.05,5.0,5.48,5.17,5.42,5.31,4.92,5.09,5.07,5.47,5.26,5.41,5.28,5.24,5.24,5.72,5.52,5.74,5.4,5.47,5.68,5.67,5.99,5.83,6.26,5.73,6.04,5.9,5.84,6.03,5.98,5.94,6.59,7.51,6.95,7.85,7.13,7.58,7.73,7.33,7.36,8.02,8.38,8.95,8.43,8.29,8.76,8.6,9.56,9.5,8.78,9.15,10.32,12.55,18.3,14.75,17.0,17.74,15.79,16.74,16.19,19.88,19.01,24.6,39.95,33.15,49.45,35.28,40.25,30.0,36.31,16.6,23.05,13.49,15.84,12.0,13.4,10.89,13.98,17.85,15.5,17.29,15.5,16.65,15.61,16.15,15.48,16.28,21.65,23.54,19.91,21.47,19.0,20.1,17.5,19.29,18.62,14.3,16.5,16.3,15.35,12.47,13.9,12.73,11.26,12.13,13.31,12.03,10.95,11.55,10.88,11.1,10.24,10.5,10.24,8.3,9.02,8.68,8.24,9.31,8.7,9.15,11.24,10.06,8.77,9.69,9.1,9.15,8.04,8.03,8.75,8.82,8.05,8.26,7.72,7.73,8.52,8.57,7.84,7.0,7.29,7.01,7.61,7.39,7.01,6.76,6.6,5.97,4.9,5.1,5.88,7.05,7.21,6.24,6.34,8.15,9.45,9.1,8.13,9.8,10.46,9.76,10.58,9.01,10.43,11.06,10.3,11.23,12.97,12.2,7.54,13.83,14.41,10.68,11.25,10.23,11.22,12.29,11.8,13.16,13.28,13.54,11.09,12.3,11.42,12.38,12.55,11.59,11.48,12.77,11.99,12.27,12.07,9.74,10.56,8.59,8.37,9.01,8.39,9.81,8.64,8.96,7.9,7.98,8.83,8.64,9.75,10.11,9.66,9.43,9.8,9.11,9.35,8.59,9.06,8.92,9.38,8.44,8.29,7.24,7.59,6.92,7.88,7.48,7.61,7.11,6.98,7.58,7.11,7.28,7.18,7.85,7.58,7.05,7.08,6.22,5.83,6.26,5.95,6.29,6.23,5.45,5.52,6.46,6.26,6.75,6.12,6.14,6.54,6.0,6.16,6.42,6.11,5.89,6.25,6.33,6.11,6.39,6.4,6.0,5.89,6.17,6.36,6.13,6.21,6.04,6.15,6.25,5.79,5.9,5.75,6.31,6.09,6.17,5.79,6.05,5.57,5.79,5.1,5.41,5.48,5.07,5.22,4.85,5.21,5.42,5.08,5.11,5.08,4.97,4.98,5.49,5.08,5.21,5.78,6.03,5.52,5.72,5.55,5.74,5.84,5.26,5.5,5.32,5.28,5.54,5.65,5.73,5.5,5.39,5.43,5.66,5.56,6.3,6.87,10.93,7.93,9.44,7.3,7.93,6.76,7.38,7.2,7.79,8.6,7.73,7.53,7.75,7.82,7.36,7.63,7.83,8.31,6.29,6.66,6.63,7.25,6.71,6.7,7.0,6.76,6.75,6.34,6.43,6.14,6.38,6.23,6.75,6.42,6.5,6.32,6.67,6.58,7.22,7.22,6.71,6.72,7.82,6.78,6.85,6.6,6.78,6.63,6.42,6.1,6.32,6.41,6.21,6.5,6.07,6.17,6.11,6.19,6.07,5.87,6.21,5.82,5.8,5.97,5.76,6.13,5.77,5.83,5.88,5.64,5.66,5.09,5.33,5.19,5.34,5.17,5.36,5.18,5.29,5.13,5.23,5.05,5.07,5.32,5.25,5.04,5.08,5.25,5.3,5.88,5.57,5.7,5.22,5.33,5.22,5.2,5.32,5.36,5.12,5.14,5.12,4.94,5.18,4.96,5.06,5.02,5.24,5.07,4.84,4.8,4.96,4.83,4.81,4.93,5.21,4.84,4.76,4.83,4.93,4.25,4.2,4.07,4.26,4.11,4.19,3.96,4.15,4.25,4.22,3.83,3.88,3.66,3.55,4.17,3.94,3.84,4.06,4.12,3.87,4.12,4.0,4.15,4.57,4.34,4.53,4.45,4.1,3.94,4.05,3.88,3.81,3.96,4.25,4.07,4.17,4.05,4.11,4.01,4.14,4.07,3.85,3.87,4.14,4.33,4.13,4.22,4.06,4.15,4.04,4.1,4.15,4.12,3.94,4.07,4.12,4.03,4.11,4.11,4.07,3.91,4.01,3.88,3.98,3.81,3.65,3.69,3.84,3.73,3.71,3.81,3.87,3.69,3.77,3.76,3.71,3.77,3.65,3.69,3.72,3.66,3.77,3.58,3.56,3.65,3.97,3.79,3.88,4.36,4.23,4.74,4.37,4.22,4.46,5.17,4.92,5.3,4.67,4.79,4.83,4.25,3.92,4.03,4.37,4.51,4.21,4.48,4.73,4.43,4.96,5.14,5.28,4.91,5.33,4.97,5.29,5.16,5.18,5.45,5.75,5.74,5.29,5.09,5.07,5.73,5.45,5.28,5.61,5.26,5.16,5.32,5.33,5.05,5.23,5.51,5.38,5.71,5.66,5.37,5.39,5.22,5.13,5.17,4.65,4.81,4.9,4.62,4.92,4.67,4.74,4.82,4.42,4.68,4.63,5.16,5.92,5.58,6.04,5.39,5.49,5.23,5.51,5.08,5.12,5.36,5.03,5.2,5.8,5.32,5.21,5.56,5.33,5.44,5.33,5.44,5.28,5.38,5.18,5.26,5.13,5.5,5.4,5.51,5.83,5.71,5.51,5.35,5.58,5.69,5.5,5.25,5.37,5.48,5.29,5.38,4.98,5.21,5.03,5.15,4.97,5.15,5.04,5.25,5.2,5.06,4.88,4.86,5.04,4.98,4.74,4.91,4.73,4.89,4.8,4.88,4.67,4.7,5.03,4.82,5.22,5.31,5.14,5.24,4.74,4.83,4.64,4.86,4.68,4.86,4.72,4.8,4.65,4.25,4.22,4.51,4.33,4.66,4.63,4.78,4.68,5.17,5.24,4.92,4.78,4.87,5.47,5.29,6.05,6.27,5.53,5.89,6.05,7.81,7.0,6.05,6.32,5.8,6.73,6.07,6.32,6.24,5.46,4.96,5.46,5.09,5.36,5.53,5.27,5.83,5.38,5.11,4.73,5.04,4.89,5.38,4.84,4.96,4.86,5.04,5.13,4.69,4.78,5.02,4.91,5.36,5.08,5.69,5.38,5.62,5.22,5.31,5.07,4.89,5.14,5.44,5.47,5.08,4.88,5.12,4.97,5.31,5.05,5.15,5.52,5.28,5.08,5.2,5.1,5.71,5.47,5.65,5.17,5.22,5.07,5.25,5.08,5.1,5.33,5.13,5.1,5.37,5.45,5.23,5.02,5.11,5.13,4.93,5.12,4.94,5.08,4.97,4.89,5.09,4.93,5.02,4.97,5.01,4.93,4.91,4.76,4.94,4.86,4.82,4.94,4.86,4.83,4.72,4.74,4.62,4.7,4.75,4.57,4.5,4.82,4.8,4.58,4.42,4.51,4.51,4.35,4.43,4.33,4.43,4.34,4.33,4.62,4.39,4.45,4.33,4.22,4.31,4.24,4.14,4.22,4.22,4.18,4.62,4.51,4.64,4.24,4.29,4.12,4.18,4.07,4.27,4.49,4.52,4.84,4.41,4.24,4.58,4.38,4.6,4.49,4.67,4.7,4.45,4.62,4.56,4.66,5.04,4.82,4.89,4.8,5.1,5.05,4.54,4.71,4.43,4.57,4.65,4.51,4.49,4.29,4.38,4.54,4.57,4.43,4.65,4.74,4.62,4.91,4.77,4.91,4.52,4.7,4.59,4.67,4.41,4.38,4.47,4.55,4.75,4.87,4.5,4.48,4.62,4.5,4.83,4.66,5.08,4.87,5.01,4.97,5.32,5.32,4.83,4.91,5.14,4.93,5.32,5.21,5.46,5.55,5.68,6.65,6.21,6.54,6.08,6.82,6.36,7.17,7.16,7.94,7.86,6.14,5.57,5.5,6.11,6.17,5.66,6.15,5.88,6.71,6.19,6.64,6.48,6.8,6.13,6.21,6.39,7.15,6.79,7.44,7.04,7.59,8.04,6.71,6.85,6.39,6.71,6.52,6.59,7.25,7.55,7.13,7.52,6.92,7.24,7.01,7.26,6.89,6.98,7.53,7.2,7.37,6.89,7.1,6.95,7.25,7.0,7.05,6.74,6.96,7.42,7.34,7.84,7.83,7.42,8.1,8.05,8.82,9.22,8.28,9.14,8.93,9.91,9.28,9.2,10.26,9.86,10.28,11.76,13.63,12.19,14.42,14.94,12.16,12.37,9.72,10.38,11.45,10.52,11.36,12.45,11.76,12.99,11.0,10.74,11.66,10.96,11.57,12.62,13.03,12.75,14.05,13.77,12.46,13.01,12.41,13.38,13.29,13.84,14.58,12.61,12.65,13.38,13.28,14.09,13.18,13.48,12.87,13.71,12.86,13.34,12.4,13.12,13.34,13.03,11.69,11.8,12.57,12.59,13.62,13.21,13.95,13.44,15.82,14.45,14.88,13.86,13.74,14.93,16.5,15.57,17.19,16.48,17.01,20.8,20.92,17.53,16.74,18.56,16.68,16.19,17.82,18.14,16.67,16.31,18.31,17.62,19.3,17.37,14.45,12.82,13.76,10.66,13.38,11.2,11.74,8.88,10.02,9.33,10.33,9.41,10.98,10.29,11.41,10.51,12.51,12.4,14.26,12.68,13.46,12.61,13.6,12.17,12.06,12.15,13.9,14.3,15.97,14.02,14.26,13.03,12.47,13.76,14.67,13.59,14.74,16.75,17.38,15.91,17.8,17.75,16.33,17.48,18.74,19.18,17.39,16.92,17.17,18.84,18.48,15.17,16.21,15.76,17.34,17.54,16.68,18.34,17.5,18.62,19.64,17.72,18.53,17.36,19.37,17.98,18.42,17.55,18.5,17.92,17.88,19.03,19.93,21.16,23.38,24.49,23.05,28.55,25.2,27.07,30.5,28.79,30.7,28.39,29.32,26.68,30.22,30.61,36.6,33.88,37.78,36.62,40.22,48.7,34.2,34.7,38.65,35.19,36.22,33.85,34.91,40.33,41.04,38.29,43.49,39.0,42.14,28.16,33.5,31.37,30.8,35.42,34.45,30.9,33.28,28.8,26.16,28.18,30.36,33.35,34.37,33.18,37.23,33.22,31.79,32.97,31.27,31.79,31.2,27.25,28.48,27.38,28.88,26.81,28.33,26.67,28.2,27.25,28.1,30.32,33.93,33.0,34.85,34.25,31.71,32.66,30.91,32.48,34.28,33.1,29.89,29.32,31.5,30.87,32.01,31.04,28.72,28.01,29.25,28.83,27.4,23.54,24.42,24.07,21.66,22.68,21.87,18.67,19.62,19.1,20.39,19.27,22.83,24.74,23.64,21.72,23.0,21.14,20.49,22.67,21.94,20.7,19.71,19.05,20.39,19.33,20.27,20.19,19.27,20.14,22.05,21.27,21.36,20.17,19.71,20.24,19.06,19.64,19.87,18.85,19.0,20.62,21.12,21.5,20.7,20.69,19.78,19.86,19.75,19.19,18.75,17.04,17.64,17.18,15.32,15.35,16.66,15.73,17.06,15.71,15.88,18.22,16.92,17.59,16.42,16.82,15.64,15.47,17.13,16.08,15.84,16.48,17.7,17.07,16.15,16.24,15.77,14.99,15.45,14.49,14.52,15.55,14.27,14.71,15.26,14.55,15.99,15.61,16.1,14.44,13.98,14.29,14.49,13.71,14.2,13.8,14.38,13.58,15.65,15.0,14.75,15.94,15.06,15.16,17.32,17.86,17.18,17.32,15.95,17.32,17.2,20.36,19.72,19.41,20.71,19.66,18.5,19.6,18.72,19.88,17.8,17.33,17.66,18.54,18.75,16.51,16.3,17.11,15.8,15.95,17.12,16.7,17.71,17.89,18.33,16.89,17.23,18.13,18.56,17.84,16.27,16.3,17.29,17.6,16.82,16.83,15.22,15.95,16.79,16.13,16.97,16.93,18.21,16.95,16.58,17.2,17.41,16.72,17.09,17.14,17.07,15.82,16.18,17.12,17.01,17.52,16.34,16.84,16.43,16.64,16.25,16.64,16.27,17.2,16.25,16.76,16.34,16.39,17.23,16.29,16.2,15.44,15.26,15.46,14.61,14.9,14.17,14.17,14.47,14.32,14.74,14.43,14.82,13.97,14.52,14.38,14.64,15.71,15.71,15.26,16.07,15.58,16.04,15.11,15.52,15.53,15.1,15.26,14.8,14.93,14.41,14.4,14.96,14.78,15.4,15.03,16.32,16.0,17.45,16.96,19.3,18.14,18.57,17.11,17.78,17.43,18.18,16.81,17.18,17.13,16.62,18.05,18.44,17.77,18.3,17.62,18.39,18.77,17.02,12.01,14.41,15.57,14.91,14.75,17.35,17.0,18.27,17.09,17.86,18.02,19.44,22.86,28.33,25.81,28.89,26.9,27.55,22.22,25.06,23.93,23.02,25.78,24.21,22.15,24.17,23.86,27.51,25.02,25.18,29.59,27.18,27.93,25.36,26.25,24.34,24.0,26.14,25.88,27.73,28.48,27.36,28.14,25.95,26.61,26.01,25.09,25.67,23.39,23.2,24.7,23.84,22.39,21.52,23.22,24.31,23.58,25.27,23.5,22.39,21.8,23.09,22.24,24.32,22.5,22.36,23.73,25.32,26.18,24.95,24.66,25.91,23.52,22.91,20.84,22.27,21.61,21.84,21.46,19.22,18.27,20.41,20.54,18.89,17.77,19.93,18.64,20.93,18.77,18.39,18.92,21.32,20.64,22.98,22.83,23.89,23.41,24.17,23.64,24.43,21.47,20.52,20.09,22.09,22.89,26.02,24.75,25.84,23.86,23.0,24.32,22.62,22.47,23.16,24.77,25.01,22.7,22.88,24.62,23.01,23.56,21.05,21.11,23.21,23.2,22.07,24.0,25.16,22.73,24.46,22.96,23.21,22.2,23.23,22.09,22.34,24.5,25.43,24.54,29.02,26.91,26.23,28.12,31.8,32.01,29.25,28.87,30.99,30.91,27.75,28.95,26.93,29.77,28.08,30.91,32.48,30.68,34.0,34.15,31.11,29.99,31.25,31.9,28.8,29.61,29.73,30.7,30.15,32.27,33.06,31.14,33.9,34.11,30.32,32.95,33.4,32.12,32.13,33.24,36.19,37.16,35.77,38.99,39.32,36.22,38.38,37.08,40.58,41.08,41.27,46.95,53.02,47.76,47.61,53.87,48.91,57.49,58.63,72.18,75.2,91.09,118.45,81.97,73.48,90.78,86.21]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// Level-of-detail tier lttb-500 (line, up to 500 points per metal)
+window._loadSpotSeedLod("lttb-500",{"Gold":{"t":["1968-01-02","1968-02-12","1968-03-14","1968-05-21","1968-06-14","1968-07-17","1968-08-21","1968-10-02","1968-12-02","1969-01-15","1969-03-10","1969-03-18","1969-05-27","1969-06-25","1969-07-22","1969-10-03","1969-11-20","1969-12-09","1970-01-19","1970-03-13","1970-05-06","1970-06-04","1970-08-06","1970-08-19","1970-10-27","1970-11-04","1971-01-04","1971-02-12","1971-04-15","1971-05-18","1971-06-15","1971-08-10","1971-09-01","1971-10-08","1971-12-20","1972-02-02","1972-03-01","1972-04-27","1972-06-08","1972-06-19","1972-08-02","1972-09-26","1972-11-17","1972-12-01","1973-01-29","1973-03-02","1973-05-07","1973-06-05","1973-07-06","1973-08-15","1973-10-11","1973-11-26","1974-01-21","1974-02-27","1974-03-18","1974-05-02","1974-07-05","1974-07-30","1974-09-18","1974-11-18","1974-12-04","1975-02-14","1975-02-25","1975-04-15","1975-05-22","1975-07-29","1975-09-18","1975-09-23","1975-11-06","1976-01-22","1976-02-03","1976-03-18","1976-04-21","1976-06-22","1976-07-20","1976-08-31","1976-11-15","1976-11-18","1977-02-02","1977-03-21","1977-04-14","1977-06-15","1977-06-28","1977-08-23","1977-10-19","1977-11-22","1977-12-13","1978-01-24","1978-03-08","1978-04-25","1978-07-06","1978-08-15","1978-08-23","1978-10-31","1978-11-29","1979-01-02","1979-02-08","1979-04-17","1979-05-29","1979-07-24","1979-08-07","1979-10-02","1979-11-02","1979-12-10","1980-01-21","1980-03-18","1980-04-09","1980-05-22","1980-07-08","1980-08-18","1980-09-24","1980-12-12","1981-01-06","1981-02-03","1981-03-27","1981-04-29","1981-07-08","1981-08-10","1981-09-22","1981-11-17","1981-12-04","1982-02-10","1982-03-15","1982-04-14","1982-06-21","1982-08-09","1982-09-07","1982-10-05","1982-11-24","1983-01-19","1983-03-01","1983-03-15","1983-05-26","1983-06-08","1983-07-21","1983-09-26","1983-11-01","1983-11-30","1984-01-09","1984-03-05","1984-04-06","1984-06-04","1984-07-09","1984-08-15","1984-09-18","1984-11-13","1984-12-20","1985-02-26","1985-03-20","1985-05-07","1985-07-03","1985-08-19","1985-09-18","1985-10-04","1985-12-12","1986-01-16","1986-02-14","1986-03-25","1986-05-21","1986-07-30","1986-08-11","1986-09-22","1986-11-24","1987-01-15","1987-02-19","1987-03-23","1987-04-27","1987-06-23","1987-08-04","1987-08-21","1987-11-10","1987-12-14","1988-02-04","1988-02-29","1988-03-31","1988-06-03","1988-06-29","1988-08-25","1988-09-26","1988-11-03","1988-12-05","1989-02-17","1989-03-10","1989-04-10","1989-05-22","1989-07-06","1989-09-01","1989-10-23","1989-11-24","1990-01-04","1990-02-21","1990-03-27","1990-05-21","1990-06-20","1990-08-23","1990-09-11","1990-10-17","1991-01-02","1991-01-16","1991-02-22","1991-04-29","1991-06-11","1991-07-22","1991-09-13","1991-10-21","1991-12-10","1992-01-07","1992-02-13","1992-03-20","1992-05-13","1992-07-10","1992-07-28","1992-08-27","1992-10-06","1992-11-17","1993-01-15","1993-03-12","1993-04-22","1993-05-19","1993-07-30","1993-08-13","1993-09-14","1993-11-08","1994-01-04","1994-01-28","1994-03-25","1994-04-25","1994-06-22","1994-08-15","1994-09-28","1994-10-14","1994-12-09","1995-01-23","1995-03-02","1995-04-19","1995-05-11","1995-06-16","1995-09-06","1995-09-13","1995-11-23","1996-01-02","1996-02-02","1996-03-05","1996-04-09","1996-07-01","1996-08-06","1996-08-27","1996-10-01","1996-11-14","1997-01-09","1997-02-12","1997-03-14","1997-06-09","1997-07-09","1997-07-29","1997-10-01","1997-10-27","1997-12-12","1998-01-26","1998-03-18","1998-04-23","1998-06-02","1998-07-01","1998-08-28","1998-10-02","1998-11-03","1998-12-11","1999-01-28","1999-03-11","1999-05-06","1999-06-10","1999-08-25","1999-10-05","1999-10-27","1999-12-06","2000-02-07","2000-03-02","2000-03-31","2000-06-13","2000-06-26","2000-08-09","2000-09-28","2000-10-31","2000-12-07","2001-02-16","2001-03-12","2001-05-21","2001-06-01","2001-08-08","2001-09-17","2001-10-23","2001-12-11","2002-02-07","2002-03-08","2002-03-28","2002-05-31","2002-07-29","2002-08-12","2002-09-25","2002-12-02","2002-12-19","2003-02-05","2003-04-07","2003-05-22","2003-06-27","2003-08-07","2003-09-25","2003-10-20","2003-12-08","2004-01-12","2004-03-03","2004-04-02","2004-05-10","2004-07-12","2004-07-28","2004-10-13","2004-11-25","2004-12-10","2005-02-08","2005-03-14","2005-04-15","2005-06-24","2005-07-15","2005-09-22","2005-11-02","2005-12-12","2005-12-22","2006-02-02","2006-03-23","2006-05-12","2006-06-14","2006-08-02","2006-10-05","2006-11-10","2006-12-19","2007-02-15","2007-03-05","2007-04-18","2007-06-13","2007-07-23","2007-08-21","2007-09-21","2007-11-07","2007-12-17","2008-02-01","2008-03-17","2008-05-02","2008-07-11","2008-08-15","2008-09-30","2008-10-24","2008-12-18","2009-01-15","2009-02-24","2009-04-20","2009-06-01","2009-07-13","2009-09-01","2009-09-17","2009-12-02","2009-12-23","2010-02-05","2010-03-03","2010-04-19","2010-06-21","2010-07-28","2010-09-13","2010-10-14","2010-12-07","2011-01-28","2011-03-02","2011-05-03","2011-05-06","2011-07-04","2011-08-23","2011-09-26","2011-11-08","2011-12-29","2012-02-03","2012-02-29","2012-05-16","2012-06-06","2012-07-23","2012-09-14","2012-11-05","2012-11-27","2012-12-21","2013-02-07","2013-04-16","2013-05-03","2013-06-28","2013-08-28","2013-09-13","2013-10-30","2013-12-20","2014-02-17","2014-03-17","2014-04-03","2014-06-03","2014-07-10","2014-09-22","2014-10-21","2014-11-06","2015-01-21","2015-03-10","2015-03-26","2015-05-18","2015-06-08","2015-07-31","2015-09-01","2015-10-15","2015-12-03","2016-01-19","2016-03-04","2016-04-04","2016-06-03","2016-07-06","2016-09-08","2016-10-07","2016-11-09","2016-12-15","2017-02-09","2017-03-10","2017-04-18","2017-07-10","2017-08-11","2017-09-08","2017-10-06","2017-12-13","2018-01-25","2018-02-09","2018-04-19","2018-06-14","2018-07-19","2018-08-17","2018-10-15","2018-11-13","2019-01-04","2019-02-20","2019-03-05","2019-05-22","2019-06-25","2019-08-01","2019-08-28","2019-10-01","2019-12-02","2020-01-08","2020-03-16","2020-04-14","2020-06-08","2020-07-20","2020-08-07","2020-09-24","2020-11-09","2020-11-30","2021-01-21","2021-03-05","2021-05-18","2021-06-30","2021-07-15","2021-08-11","2021-09-30","2021-11-16","2021-12-15","2022-03-09","2022-03-16","2022-04-29","2022-07-15","2022-08-10","2022-09-28","2022-11-03","2022-12-02","2023-02-02","2023-03-08","2023-04-05","2023-06-29","2023-07-20","2023-08-18","2023-10-06","2023-12-04","2023-12-18","2024-02-14","2024-04-12","2024-05-01","2024-06-27","2024-07-17","2024-09-04","2024-10-30","2024-12-20","2025-02-13","2025-03-03","2025-04-22","2025-05-15","2025-08-01","2025-08-22","2025-10-17","2025-10-28","2025-12-31","2026-01-29","2026-03-09"],"p":[35.18,35.19,35.2,42.6,40.2,37.8,40.3,38.3,39.9,42.75,43.75,42.85,43.5,40.9,41.95,40.99,36.0,35.0,34.78,35.0,36.24,35.18,35.3,35.25,39.19,36.8,37.33,39.05,38.89,41.2,39.49,43.3,40.7,42.5,42.4,48.6,47.8,49.38,66.75,60.6,70.0,63.4,60.1,63.9,65.3,87.0,90.3,127.0,127.0,92.5,103.75,90.0,141.75,178.0,162.5,170.5,131.5,160.5,144.0,190.0,170.5,184.0,186.25,164.25,172.75,167.75,142.9,128.75,146.5,124.0,131.65,134.3,127.45,125.5,110.0,103.05,138.2,129.1,131.8,151.4,152.2,137.2,142.7,143.75,161.55,156.65,157.35,177.1,188.8,168.0,183.45,215.9,198.35,243.65,193.65,227.15,254.0,231.75,276.1,306.5,282.5,437.0,373.0,431.35,843.0,474.0,547.0,507.5,688.75,609.75,711.0,553.5,599.25,482.0,547.25,478.5,400.0,393.2,460.25,395.75,423.5,382.6,314.25,364.75,297.0,337.75,488.5,387.25,404.5,497.75,414.5,436.5,441.25,402.25,429.25,416.25,376.0,405.75,364.25,406.85,378.75,394.5,332.5,353.9,336.5,350.0,303.25,285.0,333.25,311.25,310.4,339.25,315.5,330.55,316.05,359.6,329.5,352.9,338.6,351.35,394.5,442.75,380.4,415.0,392.6,406.6,476.6,438.1,476.0,454.1,458.75,502.75,437.6,423.75,458.0,464.85,434.9,434.8,389.05,422.9,430.4,378.95,397.0,381.6,359.25,384.3,358.25,365.8,415.8,394.95,420.6,369.75,373.4,347.05,415.7,378.4,365.75,392.5,403.7,358.9,351.3,372.75,370.1,343.5,363.1,370.75,349.3,356.65,337.6,334.75,348.75,359.25,338.75,350.5,333.85,327.45,326.5,337.7,378.75,403.7,370.45,342.05,377.9,395.0,378.15,391.8,370.25,393.1,376.45,397.5,387.1,376.1,385.1,374.45,396.95,383.1,391.3,379.0,385.4,382.55,387.1,416.25,392.9,397.6,380.6,388.85,389.0,377.05,382.65,354.5,336.9,353.0,343.85,315.75,327.5,336.8,311.8,283.05,304.5,289.1,314.6,289.2,297.1,273.4,301.4,290.1,294.3,282.3,293.8,288.1,258.35,253.2,326.25,290.4,277.25,316.6,289.0,275.9,293.0,283.0,272.3,277.2,263.8,275.1,256.7,270.5,288.35,265.65,266.5,291.0,274.9,272.6,300.35,289.3,303.0,327.25,303.05,316.25,325.25,317.3,345.75,385.0,319.75,369.6,343.5,350.15,391.85,371.45,408.75,428.2,390.35,426.1,374.1,408.55,386.2,412.45,451.7,433.9,411.5,442.75,423.65,442.95,419.6,472.75,461.65,537.5,494.75,571.85,548.0,725.75,567.25,648.25,568.25,632.25,616.0,670.0,638.6,690.4,644.1,683.5,655.5,735.35,841.75,787.0,933.0,1023.5,854.25,949.0,784.75,897.0,692.5,872.5,813.0,989.75,870.0,987.0,908.5,949.75,1020.5,1211.5,1080.5,1052.25,1136.25,1127.5,1259.5,1164.0,1243.0,1380.75,1426.0,1316.0,1430.5,1546.5,1487.75,1495.25,1886.5,1615.0,1794.0,1537.5,1759.5,1788.0,1537.5,1633.25,1571.5,1772.5,1679.0,1747.25,1648.25,1675.75,1378.0,1476.5,1203.25,1425.5,1308.25,1349.5,1195.0,1326.0,1379.0,1287.25,1244.25,1343.25,1214.0,1251.75,1144.5,1298.0,1161.0,1209.4,1228.15,1173.4,1080.05,1141.9,1183.35,1050.6,1087.0,1271.5,1215.0,1211.0,1370.0,1348.0,1255.0,1304.55,1132.45,1241.75,1196.55,1285.0,1207.55,1288.3,1350.9,1268.2,1241.6,1360.25,1316.05,1347.9,1305.3,1217.4,1176.7,1233.0,1197.55,1290.35,1345.75,1285.0,1274.0,1429.55,1406.4,1541.75,1466.1,1457.5,1582.85,1504.65,1715.85,1692.0,1810.3,2061.5,1850.75,1957.45,1771.95,1867.65,1696.05,1867.4,1757.8,1832.0,1734.05,1730.95,1872.25,1769.4,2017.15,1918.75,1915.45,1702.55,1793.5,1618.2,1620.65,1800.75,1954.9,1813.35,2022.3,1904.05,1981.5,1891.75,1821.9,2066.95,2020.95,1990.8,2394.8,2288.5,2310.55,2470.35,2474.45,2783.95,2606.15,2917.45,2868.25,3454.7,3171.35,3294.9,3328.4,4338.25,3910.2,4307.95,5501.7,5137.1]},"Palladium":{"t":["1990-04-02","1990-04-20","1990-05-01","1990-05-29","1990-06-27","1990-07-24","1990-08-23","1990-09-28","1990-10-17","1990-10-31","1990-12-11","1990-12-31","1991-01-21","1991-02-22","1991-03-26","1991-04-26","1991-05-09","1991-05-31","1991-07-22","1991-08-15","1991-08-19","1991-09-17","1991-10-14","1991-11-15","1991-12-09","1992-01-08","1992-01-30","1992-02-26","1992-04-01","1992-04-21","1992-05-19","1992-06-04","1992-07-14","1992-08-14","1992-09-09","1992-10-01","1992-10-14","1992-11-30","1992-12-14","1992-12-30","1993-02-11","1993-02-25","1993-04-02","1993-04-16","1993-05-13","1993-06-23","1993-07-02","1993-08-04","1993-09-08","1993-10-13","1993-10-20","1993-12-01","1993-12-14","1994-01-25","1994-02-16","1994-03-04","1994-03-25","1994-05-03","1994-05-27","1994-06-28","1994-07-27","1994-08-02","1994-09-15","1994-09-21","1994-11-03","1994-12-01","1994-12-30","1995-01-16","1995-02-01","1995-03-02","1995-03-24","1995-04-27","1995-05-30","1995-06-28","1995-07-21","1995-08-22","1995-09-25","1995-10-02","1995-10-24","1995-12-04","1995-12-12","1996-01-29","1996-02-07","1996-03-05","1996-03-27","1996-04-30","1996-06-06","1996-07-03","1996-07-23","1996-08-19","1996-09-05","1996-09-27","1996-11-14","1996-11-28","1996-12-12","1997-01-31","1997-02-27","1997-03-06","1997-04-04","1997-05-08","1997-06-06","1997-07-10","1997-08-05","1997-08-20","1997-09-09","1997-10-17","1997-10-28","1997-12-16","1998-01-14","1998-01-20","1998-03-03","1998-03-31","1998-04-23","1998-05-18","1998-06-03","1998-06-24","1998-07-20","1998-08-17","1998-09-14","1998-10-15","1998-11-20","1998-12-08","1998-12-30","1999-01-25","1999-02-12","1999-03-10","1999-04-20","1999-05-05","1999-06-09","1999-07-05","1999-07-22","1999-08-31","1999-09-29","1999-10-15","1999-11-11","1999-11-30","2000-01-18","2000-02-15","2000-02-21","2000-04-03","2000-05-02","2000-05-25","2000-06-19","2000-07-05","2000-08-02","2000-08-25","2000-10-02","2000-11-03","2000-11-27","2000-12-12","2001-01-11","2001-02-06","2001-03-05","2001-03-19","2001-04-12","2001-05-29","2001-07-02","2001-07-24","2001-08-03","2001-09-17","2001-10-02","2001-10-15","2001-11-14","2001-12-10","2002-01-14","2002-02-01","2002-02-27","2002-04-02","2002-05-03","2002-05-21","2002-06-28","2002-07-29","2002-08-28","2002-09-03","2002-09-24","2002-11-05","2002-11-25","2002-12-23","2003-01-13","2003-02-04","2003-03-20","2003-04-17","2003-05-12","2003-05-27","2003-06-18","2003-07-23","2003-08-19","2003-09-09","2003-10-16","2003-11-06","2003-11-26","2004-01-02","2004-01-23","2004-02-23","2004-03-12","2004-04-13","2004-04-29","2004-05-25","2004-07-02","2004-07-20","2004-08-09","2004-09-10","2004-10-08","2004-10-29","2004-11-25","2004-12-17","2005-01-25","2005-02-21","2005-03-09","2005-04-21","2005-05-13","2005-06-07","2005-07-05","2005-07-22","2005-08-22","2005-09-15","2005-10-24","2005-11-21","2005-12-09","2005-12-22","2006-02-03","2006-02-14","2006-03-13","2006-04-06","2006-05-12","2006-06-14","2006-07-03","2006-07-24","2006-09-07","2006-09-13","2006-10-11","2006-11-10","2006-11-29","2007-01-05","2007-02-05","2007-02-26","2007-04-03","2007-04-20","2007-05-15","2007-06-21","2007-07-06","2007-08-06","2007-08-22","2007-10-05","2007-10-15","2007-11-28","2007-12-14","2008-01-22","2008-02-13","2008-03-04","2008-03-20","2008-04-17","2008-05-30","2008-06-23","2008-07-15","2008-08-15","2008-09-01","2008-09-17","2008-10-17","2008-11-07","2008-12-03","2009-01-15","2009-02-18","2009-03-03","2009-04-14","2009-05-01","2009-06-05","2009-06-23","2009-07-13","2009-08-05","2009-09-02","2009-10-13","2009-11-03","2009-11-18","2009-12-23","2010-01-19","2010-02-05","2010-03-08","2010-03-25","2010-04-26","2010-05-21","2010-06-21","2010-07-08","2010-08-24","2010-09-03","2010-10-18","2010-11-09","2010-11-17","2010-12-14","2011-01-07","2011-02-21","2011-03-17","2011-04-11","2011-05-12","2011-06-10","2011-06-27","2011-07-27","2011-08-09","2011-09-02","2011-10-05","2011-10-28","2011-11-25","2011-12-14","2012-01-13","2012-02-09","2012-03-19","2012-03-29","2012-04-30","2012-05-24","2012-06-21","2012-07-24","2012-08-24","2012-09-14","2012-10-24","2012-11-12","2012-11-30","2013-01-08","2013-02-06","2013-02-21","2013-04-02","2013-04-15","2013-05-22","2013-06-24","2013-06-27","2013-07-19","2013-09-06","2013-09-20","2013-10-07","2013-11-08","2013-12-19","2014-01-20","2014-02-04","2014-03-07","2014-03-20","2014-04-14","2014-05-12","2014-06-23","2014-07-10","2014-08-06","2014-09-01","2014-10-06","2014-10-09","2014-11-07","2014-12-11","2015-01-19","2015-01-29","2015-03-05","2015-03-31","2015-04-17","2015-05-28","2015-06-26","2015-07-02","2015-08-04","2015-08-26","2015-10-05","2015-10-30","2015-11-16","2015-12-16","2016-01-12","2016-02-05","2016-02-26","2016-03-18","2016-04-29","2016-05-25","2016-06-27","2016-07-28","2016-08-10","2016-09-16","2016-10-03","2016-10-28","2016-12-01","2016-12-22","2017-01-11","2017-01-30","2017-03-15","2017-03-24","2017-04-19","2017-05-25","2017-06-12","2017-07-10","2017-08-22","2017-09-04","2017-09-22","2017-11-09","2017-11-15","2018-01-04","2018-01-15","2018-02-09","2018-02-28","2018-04-06","2018-04-23","2018-06-12","2018-06-26","2018-07-23","2018-08-16","2018-08-31","2018-09-28","2018-10-31","2018-12-05","2018-12-24","2019-01-18","2019-02-07","2019-03-21","2019-04-05","2019-04-29","2019-06-04","2019-07-11","2019-08-02","2019-08-28","2019-09-20","2019-10-08","2019-10-29","2019-11-21","2019-12-30","2020-01-20","2020-02-27","2020-03-17","2020-03-31","2020-05-06","2020-05-27","2020-06-26","2020-07-28","2020-08-12","2020-09-16","2020-10-12","2020-10-30","2020-12-02","2021-01-06","2021-02-03","2021-03-08","2021-03-18","2021-04-27","2021-05-25","2021-06-21","2021-07-06","2021-07-20","2021-09-01","2021-09-21","2021-10-11","2021-11-16","2021-12-15","2022-01-18","2022-01-27","2022-03-07","2022-03-15","2022-04-21","2022-05-13","2022-06-14","2022-07-20","2022-08-11","2022-08-24","2022-10-05","2022-11-04","2022-11-16","2022-12-23","2023-01-09","2023-02-16","2023-03-09","2023-03-31","2023-04-19","2023-05-22","2023-06-30","2023-07-19","2023-08-09","2023-09-20","2023-10-06","2023-11-10","2023-12-06","2023-12-22","2024-01-17","2024-02-12","2024-03-15","2024-03-27","2024-04-24","2024-06-12","2024-07-03","2024-07-23","2024-08-06","2024-09-18","2024-10-03","2024-10-29","2024-11-14","2025-01-02","2025-01-24","2025-02-27","2025-03-18","2025-04-09","2025-05-15","2025-06-09","2025-07-09","2025-07-18","2025-08-21","2025-09-22","2025-10-15","2025-10-28","2025-11-24","2025-12-24","2026-01-26","2026-02-06","2026-03-09"],"p":[128.0,128.75,118.35,121.25,112.75,118.55,117.75,97.75,88.5,96.5,93.0,81.75,91.25,79.25,84.25,102.65,94.75,100.5,95.5,80.75,85.25,81.0,88.0,84.25,85.75,79.25,87.25,83.5,85.5,82.25,83.55,79.1,89.4,82.25,91.5,96.75,93.25,94.5,113.5,106.25,117.75,99.6,113.75,112.0,122.75,126.25,145.0,144.0,116.5,133.5,134.25,122.0,127.25,123.75,136.0,128.0,135.25,139.75,133.75,138.5,152.25,154.75,148.25,156.0,161.0,152.6,156.75,153.5,157.5,152.0,175.85,160.25,162.75,160.85,152.5,150.25,135.35,142.35,134.5,130.0,136.0,127.25,141.0,132.25,141.25,130.25,127.25,133.75,134.25,123.5,125.5,118.0,120.5,114.25,119.25,121.25,157.0,144.75,145.5,156.75,240.0,168.0,245.5,196.0,186.0,223.5,203.0,190.0,248.5,230.5,234.0,262.0,390.0,407.0,261.0,310.0,343.0,280.0,291.0,274.0,300.0,270.75,330.0,321.0,359.0,345.0,384.0,284.0,349.0,315.0,341.0,339.0,396.0,376.0,419.0,394.0,435.0,655.0,800.0,575.0,605.0,560.0,691.0,618.0,855.0,718.0,712.0,794.0,789.0,940.0,1085.0,1081.0,750.0,805.0,655.0,665.0,598.0,455.0,485.0,465.0,315.0,354.5,319.0,415.0,435.0,367.0,383.0,392.0,350.0,378.0,318.0,332.0,362.0,320.0,328.0,312.0,261.0,222.0,266.0,266.0,233.0,144.0,152.0,206.0,173.0,160.0,176.0,225.0,190.5,207.0,188.0,194.0,246.0,223.0,277.0,333.0,237.0,255.0,209.0,228.0,214.0,205.0,230.0,212.0,215.0,179.0,192.0,180.0,207.0,203.0,188.0,190.5,172.0,191.5,182.5,183.0,208.0,266.0,297.0,246.0,315.0,276.0,289.0,354.0,402.0,286.0,326.0,304.0,351.0,307.0,298.0,334.0,318.0,343.0,335.0,354.0,351.0,381.0,360.0,375.0,362.5,364.0,320.0,368.0,380.0,343.0,346.0,363.0,424.0,588.0,425.0,463.0,424.0,473.0,450.0,286.0,304.0,226.0,171.0,231.0,170.0,177.0,219.0,193.0,239.0,212.5,264.0,234.0,233.0,280.0,284.0,335.0,321.0,375.0,355.0,462.0,387.0,477.0,447.0,570.0,416.0,498.0,447.0,476.0,526.0,574.0,721.0,639.0,759.0,741.0,859.0,708.0,795.0,706.0,817.0,729.0,838.0,722.0,786.0,561.0,667.0,570.0,642.0,632.0,714.0,700.0,648.0,682.0,590.0,617.0,564.0,645.0,692.0,599.0,609.0,688.0,672.0,767.0,715.0,774.0,673.0,752.0,670.0,644.0,744.0,687.0,724.0,697.0,760.0,696.0,748.0,703.0,776.0,756.5,810.0,803.0,814.0,873.0,847.0,909.0,752.0,804.0,754.0,817.0,761.0,790.0,830.0,734.0,780.0,788.0,676.0,698.0,595.0,539.0,709.0,681.0,541.0,566.0,465.0,517.0,485.0,592.0,624.0,533.0,550.0,704.0,731.0,652.0,719.0,612.0,774.0,653.0,761.0,728.0,748.0,803.0,775.0,765.0,899.0,837.0,937.0,988.0,915.0,1019.0,978.0,1098.0,1128.0,970.0,1049.0,906.0,1027.0,1022.0,939.0,890.0,864.0,977.0,1086.0,1072.0,1249.0,1240.0,1417.0,1374.0,1604.0,1339.0,1458.0,1327.0,1601.0,1421.0,1478.0,1647.0,1629.0,1800.0,1764.0,1907.0,2573.0,2795.0,1583.0,2317.0,1775.0,1965.0,1846.0,2281.0,2130.0,2375.0,2450.0,2226.0,2418.0,2462.0,2244.0,2332.0,2612.0,2946.0,2733.0,2508.0,2839.0,2600.0,2479.0,1906.0,2174.0,2178.0,1608.0,1878.0,2362.0,3339.0,2426.0,2465.0,1926.0,1823.0,1860.0,2264.0,1990.0,2314.0,1822.0,2096.0,1658.0,1830.0,1463.0,1367.0,1489.0,1620.0,1517.0,1225.0,1324.0,1214.0,1277.0,1145.0,960.0,944.0,1223.0,929.0,866.0,1095.0,988.0,1023.0,890.0,1033.0,909.0,858.0,1112.0,997.0,1232.0,926.0,910.0,1001.0,927.0,980.0,911.0,952.0,1079.0,1082.0,1304.0,1099.0,1165.0,1557.0,1358.0,1371.0,1825.0,2090.0,1651.0,1691.97]},"Platinum":{"t":["1990-04-02","1990-04-05","1990-05-23","1990-06-15","1990-07-04","1990-07-18","1990-08-23","1990-09-12","1990-10-16","1990-10-31","1990-12-18","1991-01-16","1991-01-28","1991-02-22","1991-03-11","1991-04-29","1991-05-29","1991-06-19","1991-07-08","1991-08-15","1991-08-30","1991-09-24","1991-10-21","1991-11-08","1991-12-09","1991-12-30","1992-02-07","1992-02-26","1992-04-01","1992-04-29","1992-05-29","1992-06-22","1992-07-14","1992-08-14","1992-09-01","1992-09-25","1992-10-09","1992-11-11","1992-12-08","1993-01-04","1993-02-17","1993-03-04","1993-04-02","1993-04-22","1993-06-01","1993-06-23","1993-07-07","1993-08-04","1993-09-08","1993-10-05","1993-10-20","1993-12-01","1993-12-16","1994-01-26","1994-02-17","1994-03-04","1994-03-31","1994-04-20","1994-05-24","1994-06-28","1994-07-27","1994-08-09","1994-09-08","1994-10-14","1994-10-21","1994-12-05","1994-12-21","1995-01-05","1995-02-01","1995-03-06","1995-04-05","1995-05-05","1995-05-18","1995-06-16","1995-08-01","1995-08-21","1995-09-15","1995-10-03","1995-11-06","1995-11-21","1995-12-29","1996-02-02","1996-02-23","1996-03-13","1996-04-19","1996-05-08","1996-06-06","1996-07-04","1996-08-01","1996-08-27","1996-09-16","1996-10-01","1996-11-12","1996-12-09","1996-12-23","1997-02-05","1997-02-28","1997-03-06","1997-04-07","1997-05-22","1997-06-06","1997-06-19","1997-08-05","1997-08-20","1997-09-24","1997-10-14","1997-10-28","1997-12-16","1998-01-13","1998-01-15","1998-02-24","1998-03-24","1998-04-15","1998-05-18","1998-06-03","1998-07-16","1998-07-27","1998-08-28","1998-09-11","1998-10-06","1998-11-20","1998-12-03","1999-01-04","1999-01-29","1999-02-24","1999-03-16","1999-04-29","1999-05-28","1999-06-22","1999-07-01","1999-07-28","1999-09-06","1999-09-29","1999-10-19","1999-11-11","1999-11-30","2000-01-10","2000-02-11","2000-03-03","2000-04-05","2000-04-26","2000-05-24","2000-06-15","2000-06-29","2000-08-02","2000-08-21","2000-09-18","2000-10-25","2000-11-10","2000-12-19","2001-01-11","2001-02-02","2001-02-28","2001-04-02","2001-04-18","2001-05-29","2001-06-13","2001-07-13","2001-08-09","2001-09-18","2001-10-02","2001-10-15","2001-11-09","2001-12-10","2002-01-18","2002-02-01","2002-03-11","2002-03-26","2002-04-18","2002-05-15","2002-06-21","2002-07-09","2002-08-28","2002-09-05","2002-10-17","2002-11-01","2002-11-15","2002-12-24","2003-02-03","2003-02-21","2003-03-11","2003-04-04","2003-05-01","2003-05-21","2003-06-26","2003-07-29","2003-08-08","2003-09-02","2003-09-29","2003-10-30","2003-11-25","2003-12-18","2004-02-05","2004-03-01","2004-03-24","2004-04-19","2004-04-29","2004-05-26","2004-06-29","2004-07-20","2004-08-17","2004-09-10","2004-10-01","2004-11-02","2004-12-02","2004-12-15","2005-02-01","2005-02-09","2005-03-17","2005-04-05","2005-05-11","2005-06-20","2005-07-06","2005-08-04","2005-08-22","2005-09-20","2005-10-20","2005-11-16","2005-12-15","2006-01-16","2006-02-03","2006-02-16","2006-03-14","2006-04-25","2006-05-12","2006-06-14","2006-07-03","2006-07-24","2006-09-06","2006-09-20","2006-10-25","2006-11-21","2006-11-28","2007-01-08","2007-02-14","2007-03-07","2007-03-22","2007-04-24","2007-05-30","2007-06-07","2007-07-23","2007-08-17","2007-08-24","2007-10-09","2007-10-19","2007-11-13","2007-12-27","2008-01-22","2008-02-18","2008-03-04","2008-03-20","2008-05-02","2008-05-22","2008-06-05","2008-07-15","2008-08-19","2008-08-29","2008-09-17","2008-10-24","2008-11-10","2008-12-05","2009-01-07","2009-01-28","2009-02-20","2009-04-14","2009-04-29","2009-06-05","2009-06-23","2009-07-13","2009-08-05","2009-09-02","2009-09-23","2009-10-28","2009-12-03","2009-12-23","2010-01-19","2010-02-05","2010-03-22","2010-04-09","2010-05-13","2010-05-21","2010-06-21","2010-07-21","2010-08-03","2010-08-31","2010-10-07","2010-11-09","2010-11-17","2011-01-06","2011-01-19","2011-02-21","2011-03-16","2011-04-08","2011-05-03","2011-06-10","2011-06-27","2011-08-05","2011-08-23","2011-09-19","2011-10-05","2011-10-28","2011-12-02","2011-12-29","2012-01-27","2012-02-23","2012-03-07","2012-04-03","2012-05-16","2012-06-15","2012-06-28","2012-08-06","2012-08-23","2012-09-14","2012-10-05","2012-10-29","2012-12-12","2012-12-31","2013-01-18","2013-02-14","2013-04-02","2013-04-16","2013-05-03","2013-06-07","2013-06-26","2013-07-24","2013-08-27","2013-10-04","2013-10-30","2013-11-14","2013-12-19","2014-01-20","2014-02-06","2014-03-07","2014-03-28","2014-04-14","2014-05-23","2014-06-04","2014-07-02","2014-08-14","2014-09-08","2014-10-06","2014-10-09","2014-11-07","2014-12-23","2015-01-21","2015-01-30","2015-03-13","2015-04-08","2015-04-27","2015-05-18","2015-06-30","2015-07-22","2015-08-20","2015-08-26","2015-10-02","2015-10-21","2015-11-18","2015-12-30","2016-01-21","2016-02-12","2016-03-08","2016-04-07","2016-05-03","2016-06-03","2016-06-28","2016-07-07","2016-08-10","2016-09-02","2016-09-23","2016-10-14","2016-11-09","2016-12-16","2017-01-12","2017-02-09","2017-03-10","2017-04-18","2017-05-04","2017-06-06","2017-06-16","2017-07-11","2017-08-11","2017-09-08","2017-09-27","2017-10-25","2017-11-29","2017-12-13","2018-01-22","2018-02-26","2018-03-08","2018-04-19","2018-05-02","2018-06-12","2018-07-03","2018-07-26","2018-08-16","2018-09-21","2018-09-28","2018-11-07","2018-12-11","2019-01-07","2019-01-23","2019-02-28","2019-03-11","2019-04-08","2019-04-30","2019-05-23","2019-07-09","2019-07-25","2019-08-16","2019-09-05","2019-10-02","2019-11-04","2019-12-05","2020-01-03","2020-01-16","2020-02-19","2020-03-19","2020-04-16","2020-05-07","2020-06-02","2020-06-26","2020-08-06","2020-08-21","2020-09-16","2020-10-07","2020-11-12","2020-12-04","2020-12-22","2021-01-28","2021-02-16","2021-03-10","2021-04-07","2021-05-10","2021-06-21","2021-07-15","2021-08-09","2021-09-06","2021-09-21","2021-10-15","2021-11-16","2021-12-02","2022-01-11","2022-01-21","2022-03-08","2022-03-16","2022-04-27","2022-05-11","2022-06-06","2022-07-14","2022-08-12","2022-09-02","2022-09-21","2022-10-20","2022-11-11","2022-12-07","2023-01-09","2023-02-16","2023-03-03","2023-03-29","2023-04-24","2023-06-07","2023-06-30","2023-07-19","2023-08-17","2023-08-30","2023-10-06","2023-10-31","2023-11-13","2023-12-29","2024-01-17","2024-02-12","2024-03-15","2024-03-28","2024-05-16","2024-06-12","2024-07-04","2024-07-26","2024-08-06","2024-09-04","2024-09-27","2024-10-29","2024-11-14","2025-01-02","2025-01-10","2025-02-14","2025-02-28","2025-04-09","2025-05-15","2025-06-02","2025-06-26","2025-08-01","2025-08-15","2025-09-17","2025-10-09","2025-10-28","2025-12-09","2025-12-24","2026-01-26","2026-02-06","2026-03-09"],"p":[471.0,481.75,503.25,474.75,488.75,470.9,504.5,455.65,389.75,435.55,414.0,424.0,386.25,379.35,416.1,387.5,392.65,368.25,384.05,340.5,335.25,358.3,371.25,358.75,372.25,330.0,367.5,353.8,360.25,340.75,370.05,363.8,392.1,345.65,361.75,368.1,355.45,350.65,368.75,352.7,368.25,339.75,365.8,365.75,398.0,372.65,408.75,417.75,356.5,356.65,375.25,366.75,388.75,380.6,403.0,389.25,415.25,385.75,407.0,398.6,423.0,406.25,421.15,414.25,425.25,401.0,417.75,403.25,415.5,405.5,457.5,459.0,427.5,442.5,418.75,432.25,440.85,412.75,404.85,416.5,398.25,433.0,410.6,413.75,399.25,406.25,390.75,387.25,403.5,401.0,388.0,381.5,388.25,368.0,372.5,349.75,398.75,377.25,362.25,389.0,495.0,416.0,460.0,406.5,443.0,439.0,398.5,345.5,361.5,385.75,376.0,423.0,428.0,403.0,355.25,392.0,377.0,349.0,366.0,340.0,358.0,345.0,362.5,345.0,384.0,364.0,349.0,365.0,347.0,352.5,344.0,351.5,429.0,410.0,454.0,435.0,417.0,545.0,465.0,521.0,473.0,563.0,542.0,574.0,612.0,570.0,594.0,576.0,602.0,602.0,645.0,597.0,613.0,558.0,630.0,620.0,574.0,560.0,433.0,482.0,406.0,462.0,420.0,470.0,482.0,449.0,526.0,511.0,558.0,537.0,567.0,519.0,574.0,540.0,598.0,578.0,602.0,585.0,690.0,664.0,705.0,616.0,606.0,680.0,662.0,700.0,680.0,714.0,702.0,759.0,758.0,842.0,824.0,894.0,923.0,937.0,783.0,843.0,778.0,836.0,871.0,832.0,863.0,828.0,875.75,835.0,881.0,847.0,883.0,858.0,881.0,900.0,864.0,914.0,887.0,930.0,920.0,982.0,942.0,1042.0,1080.0,1002.0,1016.0,1121.0,1335.0,1128.0,1243.0,1204.0,1263.0,1132.0,1066.0,1390.0,1155.0,1112.0,1216.0,1183.0,1236.0,1325.0,1264.0,1302.0,1332.0,1238.0,1238.0,1355.0,1454.0,1402.0,1534.0,1522.0,2088.0,2276.0,1824.0,1855.0,2192.0,1990.0,2015.0,1313.0,1475.0,1097.0,768.0,875.0,805.0,991.0,942.0,1083.0,1229.0,1085.0,1293.0,1165.0,1092.0,1286.0,1212.0,1333.0,1315.0,1500.0,1397.0,1641.0,1477.0,1583.0,1722.0,1731.0,1494.0,1605.0,1509.0,1590.0,1513.0,1720.0,1780.0,1639.5,1735.0,1846.0,1847.0,1696.0,1810.0,1858.0,1842.0,1674.0,1700.0,1899.0,1813.0,1442.0,1645.0,1559.0,1364.0,1613.0,1728.0,1620.0,1658.0,1426.0,1492.0,1406.0,1396.0,1549.0,1694.0,1714.0,1545.0,1640.0,1523.0,1693.0,1726.0,1592.0,1432.0,1508.0,1536.0,1323.0,1445.0,1548.0,1375.0,1467.0,1450.0,1328.0,1466.0,1379.0,1481.0,1404.0,1464.0,1484.0,1421.0,1509.0,1472.0,1410.0,1217.0,1284.0,1195.0,1188.0,1281.0,1230.0,1121.0,1172.0,1116.0,1166.0,1083.0,968.0,1016.0,979.0,899.0,1013.0,851.0,888.0,817.0,952.0,1002.0,945.0,1084.0,960.0,979.0,1086.0,1177.0,1044.0,1055.0,938.0,1005.0,904.0,990.0,1020.0,940.0,983.0,904.0,960.0,922.0,895.0,982.0,1014.0,920.0,914.0,949.0,877.0,1018.0,1005.0,949.0,950.0,898.0,906.0,822.0,838.0,781.0,838.0,811.0,876.0,780.0,829.0,791.0,874.0,813.0,911.0,898.0,800.0,808.0,881.0,834.0,982.0,874.0,954.0,889.0,988.0,1033.0,1018.0,607.0,794.0,753.0,846.0,802.0,977.0,912.0,981.0,864.0,873.0,1048.0,1004.0,1057.0,1306.0,1168.0,1238.0,1265.0,1040.0,1144.0,976.0,1029.0,925.0,1057.0,1106.0,941.0,945.0,1046.0,1149.0,1012.0,910.0,986.0,1031.0,837.0,959.0,836.0,931.0,885.0,1055.0,983.0,1098.0,916.0,971.0,963.0,1106.0,1042.0,895.0,988.0,891.0,983.0,859.0,937.0,852.0,1006.0,892.0,875.0,938.0,896.0,1066.0,955.0,1012.0,934.0,916.0,903.0,1009.0,1050.0,933.0,911.0,968.0,1008.0,946.0,919.0,978.0,1051.0,1402.0,1264.0,1361.0,1379.0,1664.0,1546.0,1648.0,2295.0,2860.0,2012.0,2185.18]},"Silver":{"t":["1968-01-02","1968-02-12","1968-03-14","1968-04-05","1968-05-21","1968-07-01","1968-08-13","1968-09-18","1968-10-24","1969-01-15","1969-02-14","1969-03-07","1969-05-08","1969-06-18","1969-08-05","1969-09-24","1969-11-03","1969-12-18","1970-01-29","1970-03-05","1970-04-22","1970-05-26","1970-07-07","1970-08-26","1970-09-30","1970-11-10","1970-12-10","1971-01-14","1971-02-25","1971-04-08","1971-06-07","1971-08-04","1971-09-08","1971-11-02","1971-12-10","1971-12-29","1972-02-07","1972-03-17","1972-06-01","1972-07-04","1972-07-28","1972-09-19","1972-11-28","1972-12-12","1973-02-23","1973-03-16","1973-05-03","1973-06-05","1973-07-24","1973-09-13","1973-10-17","1973-11-27","1974-01-14","1974-02-26","1974-04-11","1974-05-14","1974-07-12","1974-08-01","1974-09-17","1974-10-28","1974-12-04","1975-02-21","1975-04-07","1975-05-22","1975-06-06","1975-08-08","1975-09-02","1975-10-02","1975-12-09","1975-12-23","1976-02-05","1976-03-30","1976-04-28","1976-07-07","1976-08-09","1976-09-08","1976-10-15","1976-11-24","1977-01-11","1977-03-23","1977-04-06","1977-06-14","1977-07-26","1977-08-23","1977-10-26","1977-11-22","1978-01-24","1978-02-09","1978-03-14","1978-04-25","1978-06-05","1978-08-01","1978-08-25","1978-10-31","1978-11-17","1979-01-15","1979-02-21","1979-04-23","1979-05-29","1979-06-29","1979-08-21","1979-09-18","1979-11-26","1980-01-18","1980-01-28","1980-03-05","1980-04-15","1980-06-09","1980-08-18","1980-09-24","1980-10-03","1980-12-12","1981-01-06","1981-03-05","1981-03-23","1981-06-15","1981-06-30","1981-09-09","1981-09-14","1981-11-17","1981-12-17","1982-02-16","1982-03-09","1982-04-14","1982-06-21","1982-08-16","1982-09-07","1982-10-05","1982-11-24","1983-02-01","1983-02-05","1983-04-18","1983-05-31","1983-06-15","1983-08-23","1983-09-26","1983-11-01","1983-11-30","1984-01-12","1984-03-05","1984-05-08","1984-06-04","1984-07-09","1984-08-15","1984-09-21","1984-11-13","1985-01-07","1985-02-25","1985-03-29","1985-04-25","1985-07-03","1985-08-19","1985-09-18","1985-10-15","1985-12-18","1986-01-16","1986-04-01","1986-04-14","1986-05-20","1986-07-30","1986-08-11","1986-09-22","1986-11-25","1987-01-19","1987-03-02","1987-03-23","1987-04-27","1987-06-23","1987-08-04","1987-09-01","1987-10-19","1987-11-20","1988-01-11","1988-02-29","1988-03-31","1988-05-10","1988-07-20","1988-08-10","1988-09-26","1988-11-10","1988-12-07","1989-01-24","1989-03-20","1989-05-22","1989-06-08","1989-07-14","1989-09-25","1989-10-23","1989-11-24","1990-01-03","1990-02-20","1990-03-26","1990-05-29","1990-06-20","1990-08-23","1990-10-12","1990-10-29","1991-01-08","1991-02-12","1991-03-11","1991-04-25","1991-06-10","1991-08-05","1991-08-30","1991-09-25","1991-12-13","1992-01-17","1992-02-19","1992-04-01","1992-04-29","1992-06-15","1992-08-26","1992-09-16","1992-11-06","1992-11-30","1993-02-11","1993-03-09","1993-05-13","1993-06-23","1993-08-02","1993-09-14","1993-10-13","1993-12-01","1993-12-14","1994-01-28","1994-03-24","1994-04-25","1994-06-20","1994-08-15","1994-09-23","1994-10-14","1994-12-06","1995-01-19","1995-03-06","1995-04-19","1995-05-15","1995-08-01","1995-08-21","1995-09-21","1995-11-30","1995-12-28","1996-02-02","1996-03-05","1996-05-08","1996-06-14","1996-07-16","1996-08-27","1996-10-01","1996-12-03","1997-01-15","1997-03-03","1997-04-04","1997-06-06","1997-07-08","1997-08-07","1997-10-06","1997-11-03","1997-12-11","1998-02-06","1998-02-26","1998-04-08","1998-05-29","1998-07-24","1998-09-01","1998-09-30","1998-12-03","1999-01-12","1999-02-15","1999-03-17","1999-05-14","1999-06-21","1999-08-04","1999-10-05","1999-10-21","1999-12-06","2000-02-07","2000-03-03","2000-04-17","2000-06-01","2000-06-30","2000-08-24","2000-09-28","2000-11-22","2001-01-19","2001-02-21","2001-04-02","2001-05-24","2001-06-07","2001-08-07","2001-09-20","2001-11-05","2002-01-02","2002-01-29","2002-02-15","2002-04-17","2002-05-31","2002-07-16","2002-08-20","2002-09-19","2002-12-02","2003-01-06","2003-02-17","2003-04-03","2003-05-15","2003-06-11","2003-08-01","2003-09-25","2003-10-09","2003-11-25","2004-01-12","2004-02-26","2004-04-02","2004-05-10","2004-07-19","2004-09-08","2004-10-06","2004-11-30","2004-12-10","2005-02-08","2005-03-09","2005-05-03","2005-06-03","2005-07-06","2005-08-31","2005-11-07","2005-12-12","2005-12-21","2006-03-10","2006-04-19","2006-05-12","2006-06-14","2006-09-04","2006-09-15","2006-11-10","2007-01-08","2007-02-15","2007-03-05","2007-04-16","2007-06-27","2007-07-23","2007-08-21","2007-09-24","2007-11-07","2007-12-17","2008-03-06","2008-04-01","2008-05-27","2008-07-15","2008-08-15","2008-09-25","2008-10-24","2008-12-05","2009-02-11","2009-02-24","2009-04-17","2009-06-03","2009-07-13","2009-09-08","2009-09-28","2009-12-02","2009-12-14","2010-02-08","2010-03-04","2010-05-14","2010-06-07","2010-08-20","2010-09-28","2010-11-09","2010-11-17","2011-01-28","2011-03-07","2011-04-28","2011-05-12","2011-07-01","2011-08-22","2011-09-26","2011-10-28","2011-12-29","2012-01-27","2012-02-29","2012-05-16","2012-06-06","2012-07-24","2012-09-14","2012-11-05","2012-11-30","2012-12-21","2013-02-05","2013-04-17","2013-05-09","2013-06-27","2013-08-28","2013-09-18","2013-10-30","2013-12-04","2014-02-19","2014-03-27","2014-05-01","2014-06-24","2014-07-10","2014-08-28","2014-10-01","2014-11-06","2015-01-21","2015-03-11","2015-03-26","2015-05-18","2015-06-11","2015-07-24","2015-10-09","2015-11-18","2015-12-14","2016-01-28","2016-02-19","2016-04-29","2016-06-01","2016-07-04","2016-09-08","2016-10-07","2016-11-09","2016-12-23","2017-02-27","2017-03-10","2017-04-19","2017-07-10","2017-07-27","2017-09-08","2017-10-06","2017-12-13","2018-01-25","2018-02-12","2018-04-19","2018-06-15","2018-06-21","2018-09-05","2018-10-03","2018-11-14","2019-01-04","2019-02-20","2019-03-07","2019-05-20","2019-07-08","2019-07-19","2019-09-04","2019-10-01","2019-12-09","2020-01-06","2020-03-17","2020-03-26","2020-05-05","2020-07-20","2020-08-07","2020-09-24","2020-11-06","2020-11-30","2021-02-01","2021-03-31","2021-05-18","2021-06-21","2021-07-06","2021-08-12","2021-09-30","2021-11-16","2021-12-15","2022-03-09","2022-04-19","2022-05-13","2022-06-17","2022-07-21","2022-10-04","2022-10-21","2022-12-14","2023-02-02","2023-03-10","2023-04-14","2023-06-23","2023-07-20","2023-08-15","2023-10-03","2023-12-01","2024-01-22","2024-02-29","2024-04-12","2024-05-02","2024-06-06","2024-08-08","2024-09-26","2024-10-23","2024-12-20","2025-02-05","2025-03-18","2025-04-09","2025-06-10","2025-07-31","2025-08-27","2025-10-17","2025-11-21","2026-01-20","2026-01-29","2026-03-09"],"p":[2.17,1.93,2.49,2.1,2.55,2.51,2.06,2.25,1.9,2.04,1.77,1.93,1.85,1.58,1.6,1.89,2.0,1.72,1.92,1.93,1.86,1.57,1.6,1.86,1.7,1.82,1.58,1.68,1.57,1.75,1.58,1.63,1.37,1.27,1.42,1.36,1.54,1.51,1.54,1.55,1.84,1.69,1.81,1.97,2.46,2.15,2.12,2.73,2.96,2.52,3.0,2.76,3.34,6.76,4.34,6.02,3.79,4.95,3.83,5.15,4.19,4.68,4.11,4.74,4.41,5.21,4.42,4.54,3.93,4.24,3.94,4.03,4.51,5.08,4.16,4.45,4.16,4.35,4.31,4.97,4.7,4.33,4.63,4.36,4.88,4.7,5.05,4.85,5.48,4.92,5.34,5.72,5.4,6.26,5.78,5.94,7.85,7.36,8.95,8.54,9.16,18.3,16.28,49.45,35.3,36.31,14.55,17.85,15.48,23.54,19.91,14.3,16.3,11.26,13.31,10.54,8.3,10.19,11.24,8.04,8.82,8.57,7.0,7.61,4.9,6.28,9.45,7.97,9.01,14.3,7.54,12.29,13.54,11.4,12.77,12.07,8.37,9.81,7.97,10.11,8.59,9.38,7.24,7.92,7.14,7.83,5.83,5.45,6.66,6.18,5.89,6.39,5.89,6.26,5.76,6.31,5.18,5.48,4.85,4.98,5.49,6.03,5.25,5.65,5.43,5.56,10.93,6.76,8.73,7.45,8.31,6.6,6.99,6.14,6.75,6.45,7.82,6.6,6.1,6.52,6.11,6.21,6.15,5.09,5.42,5.18,5.32,5.08,5.88,5.16,5.36,4.96,5.24,4.82,5.22,4.25,4.07,4.25,3.66,4.17,3.87,4.57,3.94,3.81,4.24,3.85,4.33,4.06,4.15,3.94,4.12,3.65,3.84,3.91,3.73,3.77,3.56,4.52,4.27,5.42,3.92,4.45,4.43,5.14,4.97,5.75,5.09,5.61,5.05,5.71,5.37,4.65,4.92,4.42,5.92,5.33,5.03,5.8,5.36,5.18,5.13,5.83,5.35,5.48,4.98,5.15,5.25,4.85,4.71,4.65,5.31,4.74,4.9,4.25,4.33,5.28,4.78,6.05,7.81,6.05,6.46,4.96,5.83,4.73,5.38,4.69,5.36,5.75,5.04,5.47,4.97,5.52,5.71,5.17,5.07,5.45,5.02,5.13,4.89,5.02,4.76,4.94,4.62,4.82,4.42,4.29,4.62,4.33,4.14,4.62,4.12,4.59,4.24,4.58,4.45,5.04,5.1,4.43,4.65,4.43,4.91,4.49,4.37,4.87,4.48,5.12,5.32,4.82,5.21,6.65,6.36,8.29,5.5,6.71,6.18,7.15,7.75,6.71,6.49,7.57,6.85,7.53,6.88,6.74,7.49,9.22,8.28,9.86,14.27,14.94,9.72,12.99,10.7,13.03,12.21,13.98,12.61,14.09,12.26,13.34,11.67,13.62,15.82,13.74,20.8,16.74,18.14,19.3,12.82,13.34,8.88,9.46,13.39,14.39,11.98,15.97,12.47,16.75,15.91,19.18,17.19,15.14,17.34,19.64,17.36,18.14,21.16,28.55,25.2,26.68,36.6,48.7,32.5,33.85,43.49,28.16,35.42,26.16,33.48,37.23,27.25,29.36,26.93,34.71,30.91,34.28,29.89,32.01,23.31,24.07,18.61,24.74,21.47,22.74,19.05,21.75,19.68,19.06,21.12,21.5,19.75,17.04,15.28,18.22,15.64,17.13,17.7,15.87,14.49,15.99,14.17,13.71,13.58,15.37,17.86,15.95,20.36,19.93,17.33,18.81,15.74,18.34,16.89,18.22,15.22,16.79,18.21,16.62,15.71,17.52,16.43,17.2,17.23,16.25,14.17,14.73,13.97,15.71,16.04,15.07,14.41,15.07,16.32,19.3,17.11,16.62,18.44,12.44,14.41,14.75,19.44,28.33,22.22,25.78,22.15,29.59,24.0,28.48,25.95,26.61,23.41,21.52,25.27,21.8,26.18,25.91,20.84,21.84,18.27,20.93,18.39,23.61,24.43,20.09,26.02,22.34,25.18,22.41,21.05,25.16,22.2,22.34,29.02,26.23,30.3,26.93,32.48,34.51,28.8,32.27,34.09,30.18,36.76,36.22,38.22,54.1,48.91,95.7,118.45,86.21]}});
@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// Level-of-detail tier monthly (ohlc, up to 699 points per metal)
+window._loadSpotSeedLod("monthly",{"Gold":{"t":["1968-01-01","1968-02-01","1968-03-01","1968-04-01","1968-05-01","1968-06-01","1968-07-01","1968-08-01","1968-09-01","1968-10-01","1968-11-01","1968-12-01","1969-01-01","1969-02-01","1969-03-01","1969-04-01","1969-05-01","1969-06-01","1969-07-01","1969-08-01","1969-09-01","1969-10-01","1969-11-01","1969-12-01","1970-01-01","1970-02-01","1970-03-01","1970-04-01","1970-05-01","1970-06-01","1970-07-01","1970-08-01","1970-09-01","1970-10-01","1970-11-01","1970-12-01","1971-01-01","1971-02-01","1971-03-01","1971-04-01","1971-05-01","1971-06-01","1971-07-01","1971-08-01","1971-09-01","1971-10-01","1971-11-01","1971-12-01","1972-01-01","1972-02-01","1972-03-01","1972-04-01","1972-05-01","1972-06-01","1972-07-01","1972-08-01","1972-09-01","1972-10-01","1972-11-01","1972-12-01","1973-01-01","1973-02-01","1973-03-01","1973-04-01","1973-05-01","1973-06-01","1973-07-01","1973-08-01","1973-09-01","1973-10-01","1973-11-01","1973-12-01","1974-01-01","1974-02-01","1974-03-01","1974-04-01","1974-05-01","1974-06-01","1974-07-01","1974-08-01","1974-09-01","1974-10-01","1974-11-01","1974-12-01","1975-01-01","1975-02-01","1975-03-01","1975-04-01","1975-05-01","1975-06-01","1975-07-01","1975-08-01","1975-09-01","1975-10-01","1975-11-01","1975-12-01","1976-01-01","1976-02-01","1976-03-01","1976-04-01","1976-05-01","1976-06-01","1976-07-01","1976-08-01","1976-09-01","1976-10-01","1976-11-01","1976-12-01","1977-01-01","1977-02-01","1977-03-01","1977-04-01","1977-05-01","1977-06-01","1977-07-01","1977-08-01","1977-09-01","1977-10-01","1977-11-01","1977-12-01","1978-01-01","1978-02-01","1978-03-01","1978-04-01","1978-05-01","1978-06-01","1978-07-01","1978-08-01","1978-09-01","1978-10-01","1978-11-01","1978-12-01","1979-01-01","1979-02-01","1979-03-01","1979-04-01","1979-05-01","1979-06-01","1979-07-01","1979-08-01","1979-09-01","1979-10-01","1979-11-01","1979-12-01","1980-01-01","1980-02-01","1980-03-01","1980-04-01","1980-05-01","1980-06-01","1980-07-01","1980-08-01","1980-09-01","1980-10-01","1980-11-01","1980-12-01","1981-01-01","1981-02-01","1981-03-01","1981-04-01","1981-05-01","1981-06-01","1981-07-01","1981-08-01","1981-09-01","1981-10-01","1981-11-01","1981-12-01","1982-01-01","1982-02-01","1982-03-01","1982-04-01","1982-05-01","1982-06-01","1982-07-01","1982-08-01","1982-09-01","1982-10-01","1982-11-01","1982-12-01","1983-01-01","1983-02-01","1983-03-01","1983-04-01","1983-05-01","1983-06-01","1983-07-01","1983-08-01","1983-09-01","1983-10-01","1983-11-01","1983-12-01","1984-01-01","1984-02-01","1984-03-01","1984-04-01","1984-05-01","1984-06-01","1984-07-01","1984-08-01","1984-09-01","1984-10-01","1984-11-01","1984-12-01","1985-01-01","1985-02-01","1985-03-01","1985-04-01","1985-05-01","1985-06-01","1985-07-01","1985-08-01","1985-09-01","1985-10-01","1985-11-01","1985-12-01","1986-01-01","1986-02-01","1986-03-01","1986-04-01","1986-05-01","1986-06-01","1986-07-01","1986-08-01","1986-09-01","1986-10-01","1986-11-01","1986-12-01","1987-01-01","1987-02-01","1987-03-01","1987-04-01","1987-05-01","1987-06-01","1987-07-01","1987-08-01","1987-09-01","1987-10-01","1987-11-01","1987-12-01","1988-01-01","1988-02-01","1988-03-01","1988-04-01","1988-05-01","1988-06-01","1988-07-01","1988-08-01","1988-09-01","1988-10-01","1988-11-01","1988-12-01","1989-01-01","1989-02-01","1989-03-01","1989-04-01","1989-05-01","1989-06-01","1989-07-01","1989-08-01","1989-09-01","1989-10-01","1989-11-01","1989-12-01","1990-01-01","1990-02-01","1990-03-01","1990-04-01","1990-05-01","1990-06-01","1990-07-01","1990-08-01","1990-09-01","1990-10-01","1990-11-01","1990-12-01","1991-01-01","1991-02-01","1991-03-01","1991-04-01","1991-05-01","1991-06-01","1991-07-01","1991-08-01","1991-09-01","1991-10-01","1991-11-01","1991-12-01","1992-01-01","1992-02-01","1992-03-01","1992-04-01","1992-05-01","1992-06-01","1992-07-01","1992-08-01","1992-09-01","1992-10-01","1992-11-01","1992-12-01","1993-01-01","1993-02-01","1993-03-01","1993-04-01","1993-05-01","1993-06-01","1993-07-01","1993-08-01","1993-09-01","1993-10-01","1993-11-01","1993-12-01","1994-01-01","1994-02-01","1994-03-01","1994-04-01","1994-05-01","1994-06-01","1994-07-01","1994-08-01","1994-09-01","1994-10-01","1994-11-01","1994-12-01","1995-01-01","1995-02-01","1995-03-01","1995-04-01","1995-05-01","1995-06-01","1995-07-01","1995-08-01","1995-09-01","1995-10-01","1995-11-01","1995-12-01","1996-01-01","1996-02-01","1996-03-01","1996-04-01","1996-05-01","1996-06-01","1996-07-01","1996-08-01","1996-09-01","1996-10-01","1996-11-01","1996-12-01","1997-01-01","1997-02-01","1997-03-01","1997-04-01","1997-05-01","1997-06-01","1997-07-01","1997-08-01","1997-09-01","1997-10-01","1997-11-01","1997-12-01","1998-01-01","1998-02-01","1998-03-01","1998-04-01","1998-05-01","1998-06-01","1998-07-01","1998-08-01","1998-09-01","1998-10-01","1998-11-01","1998-12-01","1999-01-01","1999-02-01","1999-03-01","1999-04-01","1999-05-01","1999-06-01","1999-07-01","1999-08-01","1999-09-01","1999-10-01","1999-11-01","1999-12-01","2000-01-01","2000-02-01","2000-03-01","2000-04-01","2000-05-01","2000-06-01","2000-07-01","2000-08-01","2000-09-01","2000-10-01","2000-11-01","2000-12-01","2001-01-01","2001-02-01","2001-03-01","2001-04-01","2001-05-01","2001-06-01","2001-07-01","2001-08-01","2001-09-01","2001-10-01","2001-11-01","2001-12-01","2002-01-01","2002-02-01","2002-03-01","2002-04-01","2002-05-01","2002-06-01","2002-07-01","2002-08-01","2002-09-01","2002-10-01","2002-11-01","2002-12-01","2003-01-01","2003-02-01","2003-03-01","2003-04-01","2003-05-01","2003-06-01","2003-07-01","2003-08-01","2003-09-01","2003-10-01","2003-11-01","2003-12-01","2004-01-01","2004-02-01","2004-03-01","2004-04-01","2004-05-01","2004-06-01","2004-07-01","2004-08-01","2004-09-01","2004-10-01","2004-11-01","2004-12-01","2005-01-01","2005-02-01","2005-03-01","2005-04-01","2005-05-01","2005-06-01","2005-07-01","2005-08-01","2005-09-01","2005-10-01","2005-11-01","2005-12-01","2006-01-01","2006-02-01","2006-03-01","2006-04-01","2006-05-01","2006-06-01","2006-07-01","2006-08-01","2006-09-01","2006-10-01","2006-11-01","2006-12-01","2007-01-01","2007-02-01","2007-03-01","2007-04-01","2007-05-01","2007-06-01","2007-07-01","2007-08-01","2007-09-01","2007-10-01","2007-11-01","2007-12-01","2008-01-01","2008-02-01","2008-03-01","2008-04-01","2008-05-01","2008-06-01","2008-07-01","2008-08-01","2008-09-01","2008-10-01","2008-11-01","2008-12-01","2009-01-01","2009-02-01","2009-03-01","2009-04-01","2009-05-01","2009-06-01","2009-07-01","2009-08-01","2009-09-01","2009-10-01","2009-11-01","2009-12-01","2010-01-01","2010-02-01","2010-03-01","2010-04-01","2010-05-01","2010-06-01","2010-07-01","2010-08-01","2010-09-01","2010-10-01","2010-11-01","2010-12-01","2011-01-01","2011-02-01","2011-03-01","2011-04-01","2011-05-01","2011-06-01","2011-07-01","2011-08-01","2011-09-01","2011-10-01","2011-11-01","2011-12-01","2012-01-01","2012-02-01","2012-03-01","2012-04-01","2012-05-01","2012-06-01","2012-07-01","2012-08-01","2012-09-01","2012-10-01","2012-11-01","2012-12-01","2013-01-01","2013-02-01","2013-03-01","2013-04-01","2013-05-01","2013-06-01","2013-07-01","2013-08-01","2013-09-01","2013-10-01","2013-11-01","2013-12-01","2014-01-01","2014-02-01","2014-03-01","2014-04-01","2014-05-01","2014-06-01","2014-07-01","2014-08-01","2014-09-01","2014-10-01","2014-11-01","2014-12-01","2015-01-01","2015-02-01","2015-03-01","2015-04-01","2015-05-01","2015-06-01","2015-07-01","2015-08-01","2015-09-01","2015-10-01","2015-11-01","2015-12-01","2016-01-01","2016-02-01","2016-03-01","2016-04-01","2016-05-01","2016-06-01","2016-07-01","2016-08-01","2016-09-01","2016-10-01","2016-11-01","2016-12-01","2017-01-01","2017-02-01","2017-03-01","2017-04-01","2017-05-01","2017-06-01","2017-07-01","2017-08-01","2017-09-01","2017-10-01","2017-11-01","2017-12-01","2018-01-01","2018-02-01","2018-03-01","2018-04-01","2018-05-01","2018-06-01","2018-07-01","2018-08-01","2018-09-01","2018-10-01","2018-11-01","2018-12-01","2019-01-01","2019-02-01","2019-03-01","2019-04-01","2019-05-01","2019-06-01","2019-07-01","2019-08-01","2019-09-01","2019-10-01","2019-11-01","2019-12-01","2020-01-01","2020-02-01","2020-03-01","2020-04-01","2020-05-01","2020-06-01","2020-07-01","2020-08-01","2020-09-01","2020-10-01","2020-11-01","2020-12-01","2021-01-01","2021-02-01","2021-03-01","2021-04-01","2021-05-01","2021-06-01","2021-07-01","2021-08-01","2021-09-01","2021-10-01","2021-11-01","2021-12-01","2022-01-01","2022-02-01","2022-03-01","2022-04-01","2022-05-01","2022-06-01","2022-07-01","2022-08-01","2022-09-01","2022-10-01","2022-11-01","2022-12-01","2023-01-01","2023-02-01","2023-03-01","2023-04-01","2023-05-01","2023-06-01","2023-07-01","2023-08-01","2023-09-01","2023-10-01","2023-11-01","2023-12-01","2024-01-01","2024-02-01","2024-03-01","2024-04-01","2024-05-01","2024-06-01","2024-07-01","2024-08-01","2024-09-01","2024-10-01","2024-11-01","2024-12-01","2025-01-01","2025-02-01","2025-03-01","2025-04-01","2025-05-01","2025-06-01","2025-07-01","2025-08-01","2025-09-01","2025-10-01","2025-11-01","2025-12-01","2026-01-01","2026-02-01","2026-03-01"],"o":[35.18,35.2,35.2,38.0,39.1,41.2,40.9,38.8,39.98,39.6,38.9,39.9,41.8,42.5,42.75,43.1,43.6,42.95,41.1,41.39,40.79,40.75,39.58,35.53,35.13,34.95,35.0,35.33,35.85,35.45,35.5,35.3,35.85,36.43,37.7,37.35,37.33,38.1,38.75,38.95,39.42,40.85,40.1,42.48,40.7,42.18,42.13,43.5,43.73,47.49,47.8,48.4,50.2,58.8,64.25,68.8,66.8,64.1,63.8,63.9,64.99,66.4,86.0,89.25,90.7,117.0,123.0,117.0,105.5,98.5,97.25,100.0,114.75,132.0,172.4,173.0,169.9,156.5,144.5,157.5,158.0,153.5,168.75,185.5,185.0,177.25,181.6,177.25,166.25,163.25,167.0,166.5,154.25,143.75,143.0,138.15,140.35,128.4,132.45,129.15,128.25,126.05,123.25,111.5,104.0,116.25,122.0,130.5,136.1,132.85,142.1,148.25,147.5,143.75,143.05,144.8,145.6,155.1,162.55,160.1,168.6,176.6,183.8,182.75,169.15,183.25,183.0,207.5,208.1,217.0,238.65,194.05,227.15,232.4,249.3,240.05,247.7,276.7,282.2,290.95,319.3,399.5,379.7,428.0,559.0,675.0,637.0,501.5,507.75,563.0,656.0,622.0,626.25,679.25,634.3,635.5,592.0,493.25,474.5,516.75,484.75,481.25,421.25,392.5,422.5,435.25,431.0,405.0,399.0,381.25,358.75,325.5,343.5,319.0,311.75,352.13,404.25,397.75,426.75,440.0,452.75,508.5,414.5,425.75,431.0,416.25,416.75,413.25,415.8,393.5,376.0,398.5,384.0,377.25,395.25,387.25,376.4,389.4,370.45,337.35,346.2,344.75,333.85,327.7,306.25,304.8,288.1,324.65,315.6,316.85,315.35,326.75,335.45,323.15,324.65,323.95,327.1,347.35,339.45,333.7,345.6,343.0,345.65,360.5,392.0,425.5,400.3,399.6,402.4,406.45,404.4,418.5,452.15,443.4,449.5,473.25,453.1,454.1,469.95,486.9,484.1,454.65,429.15,456.0,444.3,457.0,436.5,436.4,430.3,394.2,411.0,425.5,413.6,392.0,386.1,385.3,376.9,360.8,375.4,369.95,358.25,366.45,373.6,414.15,401.65,413.25,406.25,368.0,368.95,363.1,357.1,371.1,387.5,400.0,380.1,381.75,392.5,367.95,367.45,357.9,356.25,361.5,368.65,364.3,347.6,353.0,357.5,368.25,351.2,357.1,350.55,343.75,337.1,336.8,343.6,357.3,342.65,347.6,339.3,334.6,329.4,329.5,328.4,337.0,353.4,378.25,377.85,406.7,371.8,353.9,367.95,370.1,395.0,382.1,381.1,387.4,375.7,387.25,386.8,384.0,386.0,393.45,383.45,381.2,381.4,376.25,376.3,392.25,386.5,383.2,384.35,381.75,381.8,383.1,382.5,387.15,387.1,406.6,400.3,395.0,391.0,390.8,380.6,386.65,386.9,377.05,377.2,370.5,367.8,343.75,361.8,349.85,339.55,344.0,333.6,325.3,324.4,336.8,313.5,293.35,287.7,302.0,299.75,301.6,306.1,292.35,297.1,286.65,277.7,299.0,292.75,293.35,288.25,287.1,287.05,280.5,285.6,265.5,263.0,255.35,255.45,303.0,293.85,291.4,282.05,283.65,293.75,278.8,275.0,272.8,288.05,277.3,276.6,274.3,266.0,271.2,272.8,266.85,266.7,257.55,263.8,265.65,269.1,267.7,273.55,291.65,279.45,275.25,278.1,282.0,295.8,302.65,308.3,324.5,312.3,300.65,312.25,322.6,318.75,317.3,342.2,369.0,348.45,335.65,338.95,361.3,348.55,353.05,376.35,385.0,383.25,398.75,415.2,401.85,398.5,425.3,389.75,395.85,394.5,393.25,408.0,418.15,428.1,451.1,426.8,421.15,434.65,427.45,429.2,416.1,434.2,431.35,435.5,465.0,465.55,494.4,520.75,567.2,562.6,585.5,657.75,633.25,619.5,635.5,624.0,602.0,611.25,644.4,640.75,652.55,673.6,663.3,677.5,662.5,650.5,660.25,672.75,745.25,792.0,783.75,840.75,933.0,978.25,897.0,863.5,891.25,929.5,909.5,832.0,876.0,734.0,795.5,869.75,913.75,949.5,919.5,881.5,987.0,931.5,954.25,949.75,1005.75,1052.0,1193.5,1113.0,1082.0,1117.25,1116.0,1184.25,1219.75,1240.0,1178.0,1250.0,1313.0,1361.5,1391.5,1405.5,1337.5,1414.5,1434.5,1546.5,1532.25,1492.75,1613.5,1815.5,1660.0,1702.0,1750.0,1590.0,1744.0,1721.0,1664.0,1661.25,1552.5,1596.25,1614.75,1686.0,1770.5,1723.25,1718.0,1681.5,1665.0,1570.0,1597.75,1469.5,1396.75,1243.5,1323.75,1391.25,1332.25,1314.75,1237.5,1219.75,1246.5,1344.25,1286.5,1283.0,1244.75,1325.75,1284.5,1287.25,1208.5,1170.75,1178.75,1184.25,1274.25,1216.75,1181.25,1179.0,1187.3,1171.7,1093.0,1141.9,1114.2,1135.8,1069.25,1072.7,1122.0,1240.0,1232.1,1296.5,1216.25,1331.75,1348.85,1305.7,1318.65,1284.4,1168.75,1148.65,1210.0,1246.05,1246.25,1255.8,1266.15,1235.2,1267.05,1318.4,1273.1,1279.25,1277.25,1312.8,1341.1,1311.25,1336.6,1309.2,1299.15,1249.0,1222.75,1201.7,1185.3,1223.25,1231.05,1287.2,1320.75,1309.95,1291.9,1281.8,1313.95,1390.05,1406.4,1523.35,1466.1,1509.85,1457.5,1520.55,1578.85,1609.7,1594.25,1673.05,1734.8,1787.4,1972.95,1987.95,1895.55,1886.75,1796.2,1930.8,1857.8,1746.95,1715.85,1784.95,1907.7,1774.0,1807.55,1813.9,1755.6,1786.55,1786.8,1809.05,1806.5,1920.45,1933.35,1857.9,1829.7,1795.65,1766.75,1706.0,1660.8,1652.55,1779.6,1835.05,1925.6,1833.5,1963.1,1980.9,1958.75,1913.75,1956.75,1944.3,1831.85,1982.5,2044.55,2074.9,2037.55,2050.3,2264.55,2288.5,2324.7,2327.8,2434.0,2502.0,2648.85,2747.35,2637.25,2644.6,2794.15,2868.25,3131.5,3225.75,3345.1,3343.15,3294.9,3468.8,3886.1,3994.15,4254.1,4386.85,4685.45,5137.1],"h":[35.2,35.2,35.2,39.1,42.6,42.1,41.1,40.3,40.55,39.8,40.75,42.0,42.75,42.78,43.75,43.6,43.65,42.95,42.1,41.45,41.0,40.99,39.58,35.53,35.13,35.03,35.3,35.98,36.24,35.7,35.5,35.87,36.35,39.19,37.9,37.71,38.28,39.05,39.08,39.6,41.2,40.85,42.48,43.4,42.73,42.6,43.65,43.9,47.0,48.7,48.47,49.5,59.3,66.75,68.9,70.0,67.2,65.7,64.13,65.4,66.2,89.0,91.5,91.25,114.5,127.0,127.0,117.0,106.98,103.75,101.5,112.75,141.75,178.0,177.0,179.5,170.5,160.75,160.5,157.5,158.5,169.5,190.0,197.5,185.0,186.25,181.6,177.65,172.75,166.0,167.75,166.5,154.25,146.0,146.5,142.0,140.35,133.65,134.3,129.25,128.25,127.0,123.25,113.65,120.75,123.5,138.2,137.0,136.1,142.25,153.6,152.3,148.15,143.75,145.8,146.5,153.9,163.65,168.15,165.6,177.1,183.75,188.8,182.75,184.9,186.35,198.9,215.9,219.1,243.65,238.65,224.5,235.1,254.0,249.3,243.45,277.15,284.5,307.0,318.65,397.0,437.0,417.2,524.0,843.0,714.5,641.75,552.0,531.4,662.5,688.75,640.5,720.5,683.5,655.0,635.5,599.25,517.75,547.25,534.25,501.0,481.25,421.25,433.5,460.25,452.25,431.0,423.5,402.0,384.5,363.0,364.75,343.5,330.9,363.75,425.25,488.5,448.0,433.5,458.15,503.0,511.5,436.5,443.0,443.25,423.25,430.5,425.75,420.0,400.75,405.75,403.5,384.0,400.0,406.85,387.25,385.5,394.5,370.55,353.9,347.25,347.6,350.0,330.9,307.0,314.95,333.25,331.5,324.75,325.2,328.1,339.3,335.45,330.55,331.5,327.0,361.75,351.4,352.9,347.25,345.6,347.95,357.75,394.5,442.75,442.0,410.25,399.6,421.25,406.7,421.8,476.6,479.95,460.8,464.25,476.0,464.4,481.6,493.9,502.75,485.3,455.15,458.0,458.0,460.25,464.85,445.0,436.4,430.3,413.05,423.3,430.4,413.6,394.1,397.0,388.55,379.65,376.3,384.3,371.55,369.3,378.5,417.15,417.1,420.75,421.4,406.4,380.35,373.4,363.1,371.1,415.7,406.35,400.0,387.05,391.0,403.7,368.3,369.25,363.65,361.55,372.75,371.35,364.3,352.4,363.1,368.4,370.75,357.35,357.1,351.0,343.75,340.0,344.1,359.3,357.3,350.75,350.5,339.3,337.75,330.75,331.65,336.9,354.8,381.0,379.0,403.7,406.7,371.8,371.6,378.15,391.5,395.0,387.65,391.8,387.4,388.1,393.1,387.8,386.25,397.5,394.1,386.45,383.15,385.1,379.6,386.6,396.95,391.35,391.3,389.3,385.55,385.65,384.7,389.6,389.7,407.4,416.25,400.3,397.6,394.0,390.8,385.5,389.0,387.2,383.95,382.65,373.0,367.8,360.6,361.8,350.7,349.0,344.0,333.6,328.6,328.75,336.8,314.6,296.1,304.5,302.0,302.75,314.6,306.1,296.25,297.1,288.85,296.85,302.35,297.85,294.9,291.4,290.05,293.8,285.85,288.1,267.05,263.0,261.5,317.25,326.25,298.5,291.4,288.75,316.6,293.75,283.5,280.5,293.0,288.05,277.3,277.2,275.85,269.75,275.1,272.8,268.1,270.5,264.45,288.35,276.0,271.55,277.75,291.6,292.85,280.5,278.9,287.95,305.1,303.0,310.65,327.25,326.55,324.0,316.25,325.25,322.7,323.2,348.5,370.8,385.0,356.6,336.0,372.35,367.35,364.0,371.0,391.85,391.0,398.1,417.25,428.2,415.9,423.0,426.1,394.3,401.7,408.55,409.95,412.35,429.0,452.0,455.75,427.6,436.55,442.75,434.7,430.5,442.95,434.2,447.25,473.4,478.5,497.3,537.5,569.8,571.85,584.0,644.5,725.75,644.5,671.5,650.5,636.7,604.75,638.4,644.8,648.75,684.5,673.6,691.0,686.5,671.3,683.5,674.15,737.75,792.5,841.75,836.5,927.5,969.0,1023.5,951.5,928.25,932.75,981.75,910.0,897.0,918.0,817.0,881.0,918.5,989.75,957.0,919.5,972.0,987.0,956.0,964.5,1020.5,1066.0,1183.0,1218.25,1158.0,1119.75,1136.25,1175.25,1241.25,1259.5,1240.0,1240.25,1311.0,1380.75,1416.25,1426.0,1405.5,1414.5,1441.25,1531.0,1546.5,1548.4,1621.0,1886.5,1896.5,1735.0,1794.0,1751.0,1738.0,1788.0,1721.0,1674.75,1661.25,1633.25,1622.75,1666.5,1781.0,1790.0,1747.25,1718.0,1692.5,1678.0,1611.5,1597.75,1476.5,1410.0,1340.0,1425.5,1403.75,1351.0,1317.0,1255.25,1270.0,1340.0,1379.0,1324.5,1311.0,1323.0,1343.25,1317.5,1287.25,1251.75,1202.25,1228.25,1298.0,1281.0,1216.75,1211.1,1228.15,1198.15,1171.7,1154.25,1145.5,1183.35,1135.8,1082.7,1119.0,1239.5,1274.1,1274.5,1296.5,1324.6,1370.0,1364.4,1348.75,1318.65,1304.55,1174.75,1217.5,1256.25,1256.9,1286.1,1265.0,1292.7,1266.35,1323.4,1350.9,1305.15,1294.85,1296.5,1360.25,1358.6,1350.65,1347.9,1324.8,1305.3,1262.6,1222.75,1207.6,1236.05,1235.5,1281.65,1322.5,1345.75,1319.35,1304.8,1298.9,1429.55,1437.05,1541.75,1542.6,1509.5,1509.85,1523.0,1583.45,1682.35,1687.0,1727.55,1756.9,1775.7,1974.7,2061.5,1987.95,1920.8,1957.45,1891.1,1957.2,1857.8,1746.95,1788.4,1904.3,1907.7,1832.0,1814.3,1823.85,1801.9,1872.25,1820.1,1845.2,1968.35,2017.15,1975.95,1895.2,1855.95,1807.05,1793.5,1727.05,1716.0,1783.2,1815.2,1936.5,1954.9,1996.15,2035.65,2038.9,1981.0,1981.5,1956.75,1944.3,1997.6,2037.85,2077.8,2074.9,2054.2,2210.65,2394.8,2444.35,2364.0,2470.35,2524.15,2668.9,2783.95,2747.35,2713.6,2791.5,2953.05,3120.2,3454.7,3377.35,3420.2,3430.15,3407.5,3812.85,4338.25,4234.3,4481.85,5501.7,5214.24,5137.1],"l":[35.14,35.19,35.2,36.7,39.1,40.2,37.8,38.45,39.7,38.3,38.9,39.9,41.8,42.48,42.75,42.9,43.08,40.7,41.1,40.9,40.65,39.85,35.35,35.0,34.78,34.95,34.95,35.28,35.5,35.18,35.28,35.25,35.85,36.28,36.8,36.98,37.33,38.1,38.7,38.83,39.42,39.49,40.1,41.0,40.7,42.18,42.13,42.4,43.73,47.45,47.8,48.3,50.2,58.8,64.25,64.75,63.4,64.1,60.1,62.75,64.1,66.4,80.25,89.25,90.3,115.5,114.0,92.5,100.0,97.0,89.75,100.0,114.75,132.0,158.25,166.75,154.25,143.65,131.5,152.25,144.0,153.5,168.6,170.5,171.25,173.5,176.5,164.25,163.5,162.25,162.75,161.4,128.75,137.5,138.25,137.0,124.0,128.4,128.6,127.1,124.4,123.8,110.0,103.05,104.0,113.65,122.0,130.5,129.4,131.8,142.1,146.5,143.2,137.2,140.55,143.35,145.6,153.6,156.65,157.35,166.3,174.0,177.25,168.0,169.15,181.0,183.0,198.35,205.7,217.0,193.65,194.05,216.55,229.9,238.75,231.75,245.9,273.6,281.8,282.5,319.3,367.5,373.0,427.25,559.0,625.0,474.0,491.25,507.5,554.5,610.0,609.75,626.25,628.0,598.75,553.5,505.0,482.0,457.0,475.5,467.75,421.5,400.0,391.75,422.5,422.25,395.75,396.25,369.75,360.5,314.25,325.5,324.75,297.0,307.4,332.88,394.75,387.25,400.0,435.25,452.75,419.75,411.25,423.0,431.0,402.25,412.25,408.0,403.75,383.5,374.75,375.4,364.25,374.95,385.75,376.2,370.1,369.0,332.5,337.35,336.5,334.5,328.6,303.25,296.75,285.0,286.7,317.0,311.2,310.75,310.4,319.65,315.5,323.15,322.1,316.05,326.0,329.5,337.9,333.7,338.6,337.3,343.5,358.5,392.0,401.5,380.4,385.25,399.0,392.6,403.7,418.5,447.9,438.1,442.15,454.1,453.1,454.1,458.6,480.9,465.25,423.75,429.15,446.25,441.95,434.9,428.75,426.35,389.05,394.2,411.0,410.15,394.3,378.95,382.3,381.3,359.25,358.5,368.8,359.6,358.1,360.4,373.6,400.4,394.95,408.8,369.75,368.0,363.25,346.75,353.2,371.1,378.4,365.75,377.05,371.1,369.6,357.5,354.0,351.3,353.9,361.5,362.3,347.0,343.5,353.0,353.35,353.3,349.3,348.8,337.6,334.75,334.75,336.8,343.6,336.0,339.05,338.2,330.2,332.3,327.45,327.6,326.5,336.95,352.75,365.0,377.85,370.05,342.05,353.5,362.5,370.1,378.15,376.0,375.45,370.25,372.8,380.25,383.4,376.45,386.0,387.1,383.1,376.1,372.45,374.8,374.45,386.6,381.85,383.2,383.2,381.65,379.0,381.85,382.2,385.7,387.1,397.7,392.9,389.9,390.55,381.3,380.6,386.2,379.3,377.05,371.9,368.3,345.0,336.9,346.8,338.95,339.55,334.05,315.75,318.85,319.95,310.4,296.15,283.05,278.5,292.3,289.1,299.3,292.4,286.1,289.15,273.4,277.7,291.2,290.1,286.65,282.3,285.35,279.8,278.35,268.25,258.35,252.9,253.15,254.05,290.4,289.0,277.25,280.35,283.1,275.9,275.85,270.45,272.8,277.4,272.0,269.65,263.8,264.1,269.45,263.1,256.7,259.05,257.0,263.8,265.65,265.2,266.5,271.4,274.9,272.55,272.6,277.8,282.0,289.3,297.8,307.5,317.6,303.05,300.65,312.25,311.1,317.2,317.3,342.2,346.55,329.6,319.75,338.95,343.5,343.0,348.95,371.0,370.35,378.3,398.75,401.3,392.25,390.35,382.75,373.5,382.3,386.2,390.6,398.1,412.45,422.2,433.9,421.25,411.5,424.9,423.65,416.9,416.1,419.6,431.35,435.5,463.15,457.15,494.4,520.75,540.5,545.25,583.85,643.75,567.25,616.4,614.7,576.25,568.25,611.25,616.0,608.3,648.0,638.6,663.3,655.0,642.85,647.75,653.0,672.75,726.75,788.5,783.75,840.75,889.75,913.5,867.75,854.25,864.0,912.0,784.75,742.75,692.5,714.0,771.0,813.0,896.0,900.0,870.0,881.5,920.25,908.5,934.25,949.75,998.0,1052.0,1080.5,1082.75,1052.25,1093.5,1116.0,1172.0,1203.5,1164.0,1178.0,1243.0,1313.0,1336.5,1374.75,1316.0,1332.5,1398.5,1432.5,1487.75,1501.0,1492.75,1613.5,1615.0,1600.0,1676.0,1537.5,1590.0,1715.5,1636.0,1622.5,1537.5,1552.5,1565.5,1594.75,1686.0,1704.0,1679.0,1648.25,1632.25,1568.5,1570.0,1378.0,1353.75,1203.25,1225.5,1275.5,1299.75,1255.5,1231.75,1192.75,1219.75,1246.5,1294.0,1283.5,1254.0,1244.25,1292.5,1280.5,1210.0,1173.25,1144.5,1177.0,1184.25,1193.5,1149.0,1181.25,1179.0,1173.4,1080.05,1085.0,1105.5,1106.3,1055.65,1050.6,1072.7,1122.0,1216.45,1215.0,1210.5,1211.0,1315.0,1314.45,1305.7,1252.7,1187.25,1130.55,1148.65,1210.0,1196.55,1246.25,1221.0,1240.85,1207.55,1257.55,1284.3,1267.8,1271.6,1241.6,1312.8,1311.05,1311.25,1316.25,1285.85,1250.5,1217.4,1176.7,1183.5,1185.3,1197.55,1231.05,1278.7,1305.65,1285.0,1273.45,1270.05,1313.95,1387.9,1406.4,1487.6,1466.1,1455.0,1457.5,1520.55,1552.2,1472.35,1588.05,1673.05,1692.0,1771.85,1918.5,1850.75,1875.8,1771.95,1796.2,1833.95,1765.1,1685.35,1715.85,1778.05,1757.8,1774.0,1729.55,1730.95,1748.25,1778.1,1769.4,1790.2,1802.0,1911.05,1890.0,1805.8,1811.85,1686.55,1712.4,1618.2,1624.55,1620.65,1771.85,1834.5,1809.05,1813.35,1963.1,1949.5,1903.55,1913.75,1890.1,1871.6,1821.9,1937.45,1981.55,2012.2,1990.8,2050.3,2264.55,2288.5,2297.65,2327.8,2392.85,2474.45,2617.25,2548.45,2606.15,2631.8,2794.15,2868.25,3002.7,3171.35,3277.25,3288.05,3294.9,3468.8,3860.7,3964.85,4185.7,4386.85,4685.45,5137.1],"c":[35.2,35.2,35.2,39.1,42.0,40.95,38.9,39.85,39.7,39.2,39.85,41.95,42.55,42.78,43.1,43.6,43.15,41.23,41.45,40.95,40.65,39.85,35.55,35.21,34.98,35.0,35.3,35.85,35.5,35.51,35.29,35.78,36.24,37.4,37.6,37.38,38.0,38.79,38.8,39.6,40.8,40.2,42.48,41.0,42.48,42.4,43.55,43.62,46.95,48.4,48.38,49.5,59.3,64.1,68.9,66.8,64.1,64.43,63.6,64.7,66.0,85.3,90.25,90.7,114.5,123.5,115.2,104.0,100.25,97.25,100.25,112.25,133.25,169.5,173.0,168.5,156.5,146.75,154.0,155.25,147.5,166.4,182.0,187.5,176.25,181.75,177.75,167.4,167.75,166.0,166.4,161.5,138.25,143.4,138.25,140.25,128.0,132.3,129.5,128.15,125.25,123.8,112.4,103.05,116.1,122.3,130.1,134.55,132.1,142.25,149.8,146.5,143.2,142.95,144.5,146.0,153.9,160.8,159.8,165.6,175.2,182.0,180.75,170.0,184.9,183.2,198.9,207.3,217.45,243.65,193.7,224.5,233.05,250.9,239.65,243.45,277.15,276.45,295.35,317.75,397.0,379.75,417.2,524.0,668.0,640.0,503.25,519.25,531.4,662.5,618.0,633.75,670.0,636.0,621.5,589.5,507.5,490.25,514.25,481.0,478.75,421.5,405.25,425.5,426.5,429.0,415.5,400.0,388.25,363.25,320.5,356.75,325.5,314.0,342.5,409.6,394.75,422.0,428.25,448.0,503.0,419.75,414.25,428.5,439.0,416.75,422.25,414.5,404.0,383.5,405.75,381.5,371.9,396.6,388.5,376.2,383.45,375.25,341.6,347.7,344.15,334.5,328.6,309.0,304.9,290.5,329.8,324.65,313.15,316.5,328.1,335.75,326.5,325.75,327.4,327.0,354.0,338.25,345.5,344.75,343.35,345.5,357.75,386.0,421.2,401.5,390.0,390.9,407.3,405.75,419.0,454.5,451.75,447.1,464.25,455.9,459.15,468.0,493.9,486.5,465.25,423.75,458.0,449.75,454.0,436.85,432.7,426.35,396.15,412.3,421.3,410.15,394.85,386.75,382.3,381.3,363.5,371.15,369.1,359.6,369.0,376.05,406.8,401.0,417.55,409.1,372.2,371.55,363.7,352.4,371.1,388.1,406.1,379.25,384.8,391.0,369.6,363.0,354.0,353.45,361.55,366.9,363.6,347.0,350.5,357.4,366.85,353.4,354.15,353.05,341.5,336.25,337.55,343.4,357.95,340.5,349.0,338.8,333.7,332.9,330.75,328.75,336.9,353.45,381.0,379.0,403.7,370.6,352.65,369.1,370.8,390.65,378.2,380.75,389.7,376.45,386.25,385.4,384.05,386.25,395.35,387.4,383.35,382.5,375.85,375.7,386.55,389.5,384.25,387.6,383.35,381.65,383.75,382.4,387.85,386.7,403.2,400.35,396.7,390.15,390.55,381.3,385.5,387.25,379.3,379.3,371.9,369.55,345.0,360.6,349.5,340.45,345.75,334.05,326.0,325.4,328.75,310.4,296.9,289.2,301.8,296.55,299.9,310.7,292.4,295.75,289.4,273.4,294.1,293.1,295.75,287.45,285.65,286.8,279.8,285.85,271.05,261.2,256.75,254.6,303.75,298.85,292.0,290.85,283.05,294.0,275.9,275.85,272.25,289.15,277.4,274.95,274.1,263.8,267.0,272.65,266.2,265.0,259.05,263.45,266.1,269.9,265.55,275.35,290.85,280.95,274.7,276.5,281.5,296.55,303.0,309.35,327.25,319.05,305.5,312.4,322.4,316.35,318.25,342.75,370.35,347.65,335.35,336.0,365.8,345.15,355.75,371.0,384.5,384.6,398.1,417.25,401.3,392.25,423.0,387.3,393.85,393.75,389.6,408.1,412.35,426.2,452.0,438.0,423.8,436.55,427.5,433.2,416.9,436.8,427.15,433.0,473.4,472.65,493.8,513.0,569.8,556.5,584.0,638.25,654.0,600.4,637.0,621.75,601.75,600.9,638.4,635.7,645.75,677.0,663.5,678.0,656.6,648.5,666.75,668.0,737.75,783.0,794.75,836.5,923.75,969.0,937.25,867.75,879.5,932.75,912.0,836.5,897.0,728.5,813.5,865.0,918.5,943.75,918.5,889.0,972.0,941.0,936.5,950.75,1001.25,1044.5,1172.0,1104.0,1082.75,1112.5,1109.5,1175.25,1214.0,1240.5,1168.0,1233.5,1311.0,1336.75,1375.0,1410.25,1333.5,1409.75,1431.0,1531.0,1537.0,1508.0,1613.75,1826.0,1629.0,1718.0,1704.0,1574.5,1738.0,1788.0,1660.75,1662.5,1567.5,1569.5,1622.75,1657.75,1781.0,1718.0,1728.25,1664.0,1674.5,1591.0,1602.5,1472.75,1410.25,1203.25,1331.5,1392.75,1335.75,1333.75,1245.25,1201.5,1246.5,1327.75,1294.0,1292.0,1254.0,1313.0,1295.0,1285.75,1210.0,1173.25,1184.5,1199.25,1263.5,1205.0,1179.25,1204.3,1190.4,1175.0,1080.05,1125.5,1122.5,1147.75,1055.65,1062.25,1112.9,1234.15,1233.6,1274.5,1210.5,1317.0,1332.5,1314.45,1327.9,1274.2,1187.4,1159.1,1198.8,1251.9,1241.7,1265.55,1263.8,1243.25,1266.35,1305.8,1286.95,1274.4,1282.15,1296.5,1343.35,1320.3,1323.9,1316.25,1303.5,1250.55,1219.2,1206.85,1183.5,1217.7,1220.45,1281.65,1322.5,1325.45,1291.15,1285.15,1296.0,1413.2,1430.55,1526.55,1487.6,1506.4,1456.35,1523.0,1580.85,1626.35,1604.65,1716.75,1725.65,1770.7,1974.7,1955.85,1883.4,1875.8,1771.95,1891.1,1852.7,1765.1,1685.35,1768.8,1892.45,1757.8,1828.25,1814.3,1730.95,1796.3,1797.6,1820.1,1790.6,1903.3,1924.1,1915.45,1854.4,1813.6,1758.9,1712.4,1672.75,1638.85,1759.65,1812.35,1905.2,1810.2,1978.8,1982.7,1959.0,1903.55,1955.55,1944.2,1871.6,1997.6,2037.85,2062.4,2037.9,2032.8,2207.0,2314.8,2342.9,2327.6,2419.6,2524.15,2650.15,2779.4,2664.3,2610.85,2791.5,2861.4,3120.2,3284.3,3293.55,3277.25,3306.8,3407.5,3806.55,4013.2,4159.4,4307.95,5063.45,5178.7,5137.1],"m":[35.18,35.2,35.2,37.88,40.69,41.11,39.53,39.17,40.2,39.21,39.8,41.11,42.29,42.62,43.17,43.3,43.46,41.44,41.76,41.13,40.87,40.48,37.45,35.19,34.95,34.99,35.09,35.62,35.96,35.44,35.33,35.38,36.2,37.55,37.46,37.44,37.87,38.72,38.87,39.0,40.49,40.11,40.93,42.72,41.98,42.48,42.84,43.46,45.64,48.24,48.29,49.03,54.5,62.17,65.56,66.92,65.59,64.82,62.73,63.78,65.13,73.97,84.1,90.44,101.62,119.8,120.36,106.22,103.03,99.92,94.65,106.24,129.03,150.0,168.3,172.22,163.57,154.01,142.28,154.36,151.66,158.53,181.48,183.68,176.86,179.55,178.2,170.07,167.29,164.25,164.87,163.17,144.31,142.69,142.56,139.28,131.7,130.94,132.68,127.91,126.91,125.68,117.87,110.05,114.1,116.1,130.34,133.67,132.31,136.16,148.34,149.18,146.54,140.83,143.4,145.01,149.33,158.85,162.13,160.48,173.21,178.36,183.77,175.32,176.19,183.76,188.57,206.45,212.21,227.43,207.08,207.89,226.99,245.59,242.35,239.17,257.74,279.36,295.01,300.79,354.5,390.96,391.52,463.67,674.58,665.89,554.28,516.71,514.27,600.79,645.75,626.36,673.94,662.27,623.88,596.71,557.81,500.8,499.69,496.62,480.32,460.5,409.28,410.24,443.77,437.68,413.4,410.12,384.16,374.46,330.41,350.33,334.51,314.96,337.9,363.41,438.15,422.79,415.11,444.78,481.84,493.49,420.71,433.17,437.39,413.15,422.65,416.2,412.25,394.25,381.02,388.06,370.73,386.04,394.74,381.37,376.96,378.31,347.61,347.68,340.94,340.22,341.29,319.62,302.85,300.33,303.2,324.88,316.4,316.3,317.2,330.13,323.76,326.09,325.55,321.99,345.56,339.05,346.09,340.72,342.32,342.8,348.55,376.29,418.15,423.86,396.98,391.6,408.52,401.05,408.85,439.67,461.65,449.28,450.33,460.99,460.12,465.76,468.14,487.08,477.76,442.12,443.49,451.56,451.32,451.66,437.45,431.06,413.44,406.39,419.97,419.25,404.45,387.97,390.27,384.72,371.35,367.73,375.21,365.55,361.8,366.8,394.36,409.66,410.12,416.54,393.66,374.93,368.85,352.66,361.82,394.86,389.56,381.33,381.87,378.16,384.59,363.75,363.39,358.05,357.12,366.36,368.01,356.72,348.46,358.83,359.96,361.88,354.44,353.85,344.64,338.73,337.04,340.78,352.45,343.6,345.3,344.28,334.92,334.66,328.99,329.31,329.97,341.95,367.04,371.91,392.03,379.8,355.56,364.0,373.94,383.24,387.11,381.66,384.0,377.91,381.34,385.71,385.45,380.21,391.35,390.16,384.38,379.48,378.74,376.75,381.82,391.34,385.23,387.62,386.14,383.5,382.93,383.2,385.21,387.44,398.7,404.92,396.51,392.87,391.99,385.25,383.46,387.51,383.29,380.91,377.87,369.34,355.02,346.4,352.31,344.71,344.1,340.8,323.78,324.0,322.62,324.85,306.35,288.78,289.26,297.74,295.87,308.56,298.97,292.22,292.87,284.23,288.66,296.6,294.24,291.36,287.33,287.5,286.24,282.62,276.93,261.4,256.2,256.94,264.47,311.56,293.65,283.74,284.59,300.85,286.7,279.96,275.29,285.37,282.15,274.52,273.68,270.4,265.99,271.89,265.93,262.02,263.27,260.75,272.06,270.74,267.71,272.66,282.48,283.32,276.25,275.99,281.76,295.68,294.35,302.86,314.48,321.54,313.57,310.05,318.8,316.75,319.25,333.3,356.86,359.57,341.56,328.21,355.4,356.91,350.77,358.99,378.86,379.09,390.2,407.67,414.5,404.73,405.98,404.85,383.95,391.78,398.44,400.13,405.4,420.21,439.06,442.97,424.08,423.43,434.35,429.14,422.9,430.3,424.75,437.77,455.94,470.11,476.67,509.42,549.43,555.52,557.22,611.85,676.77,597.9,633.09,631.56,600.15,586.65,626.83,629.51,630.35,665.1,655.89,680.01,668.31,655.71,665.27,664.53,710.64,754.48,808.31,803.62,887.78,924.28,971.06,911.6,889.12,889.54,941.17,840.39,824.92,812.82,757.85,819.94,857.73,939.76,925.99,892.66,926.86,947.81,934.27,949.5,996.44,1043.51,1126.12,1135.01,1119.58,1095.8,1115.55,1148.47,1204.32,1232.38,1196.0,1213.46,1271.46,1343.19,1371.78,1393.51,1360.47,1371.31,1422.85,1474.43,1512.19,1528.38,1568.53,1759.5,1780.65,1667.89,1735.98,1652.72,1656.1,1743.1,1675.06,1648.54,1585.11,1595.63,1592.78,1625.68,1741.92,1746.35,1724.35,1687.34,1671.89,1630.69,1591.01,1485.9,1416.14,1342.7,1284.35,1345.05,1348.46,1314.4,1277.42,1221.59,1243.07,1298.71,1336.56,1299.17,1288.91,1277.86,1312.99,1297.01,1241.33,1223.57,1176.41,1200.44,1249.33,1231.1,1180.64,1198.25,1197.68,1182.25,1131.58,1117.53,1124.9,1157.12,1088.39,1068.32,1095.65,1194.89,1246.31,1241.45,1259.76,1273.58,1337.43,1340.86,1326.62,1268.93,1240.29,1152.16,1192.65,1233.39,1231.06,1267.15,1245.25,1261.28,1235.1,1281.72,1317.05,1280.68,1283.19,1265.67,1332.81,1333.78,1325.56,1334.38,1303.61,1282.13,1238.06,1201.86,1199.2,1214.73,1221.28,1249.89,1291.63,1319.76,1302.29,1287.65,1283.1,1358.49,1414.61,1497.1,1510.34,1494.77,1471.92,1480.03,1560.67,1598.82,1593.76,1680.03,1715.7,1734.03,1840.81,1971.17,1923.48,1902.53,1869.5,1853.8,1869.67,1814.01,1721.56,1758.8,1847.56,1836.1,1805.87,1784.09,1780.95,1774.5,1820.29,1788.63,1816.31,1857.72,1947.42,1935.04,1851.54,1835.33,1738.84,1765.62,1685.38,1665.61,1725.4,1794.24,1897.7,1858.11,1908.59,1998.84,1992.79,1943.61,1949.57,1921.22,1918.43,1912.92,1983.75,2033.31,2035.22,2025.66,2158.46,2336.29,2350.55,2325.34,2390.49,2468.24,2568.12,2690.05,2656.09,2643.83,2707.58,2896.68,2981.74,3212.12,3280.51,3351.7,3342.4,3358.18,3658.09,4058.28,4084.61,4299.97,4747.0,5020.07,5137.1],"n":[22,21,10,20,23,19,23,22,20,23,21,20,22,20,21,20,21,21,23,21,21,23,20,21,21,20,20,22,20,22,23,20,22,22,21,22,20,20,23,20,20,22,22,19,22,21,22,22,21,21,22,19,22,22,21,22,21,22,22,19,22,20,22,19,22,21,22,22,20,23,22,18,22,20,21,20,22,20,23,21,21,23,21,20,22,20,19,22,21,21,23,20,22,23,20,21,21,20,23,20,20,22,22,21,22,21,22,21,20,20,23,19,22,20,21,22,22,21,22,20,21,20,21,20,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,21,20,20,21,23,20,22,23,20,21,20,20,22,20,19,22,22,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,20,22,21,22,22,21,22,20,21,21,22,19,21,21,22,22,20,23,22,18,22,20,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,21,23,19,20,22,21,22,22,21,22,20,21,20,21,20,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,21,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,21,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,22,18,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,23,20,19,22,22,21,22,21,22,21,20,20,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,18,20,22,21,22,22,21,22,20,21,21,22,19,22,19,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,21,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,21,20,21,21,22,22,20,23,22,19,22,20,21,20,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,21,20,21,22,21,21,22,20,21,20,23,18,20,22,21,22,21,22,22,19,22,21,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,23,1]},"Palladium":{"t":["1990-04-01","1990-05-01","1990-06-01","1990-07-01","1990-08-01","1990-09-01","1990-10-01","1990-11-01","1990-12-01","1991-01-01","1991-02-01","1991-03-01","1991-04-01","1991-05-01","1991-06-01","1991-07-01","1991-08-01","1991-09-01","1991-10-01","1991-11-01","1991-12-01","1992-01-01","1992-02-01","1992-03-01","1992-04-01","1992-05-01","1992-06-01","1992-07-01","1992-08-01","1992-09-01","1992-10-01","1992-11-01","1992-12-01","1993-01-01","1993-02-01","1993-03-01","1993-04-01","1993-05-01","1993-06-01","1993-07-01","1993-08-01","1993-09-01","1993-10-01","1993-11-01","1993-12-01","1994-01-01","1994-02-01","1994-03-01","1994-04-01","1994-05-01","1994-06-01","1994-07-01","1994-08-01","1994-09-01","1994-10-01","1994-11-01","1994-12-01","1995-01-01","1995-02-01","1995-03-01","1995-04-01","1995-05-01","1995-06-01","1995-07-01","1995-08-01","1995-09-01","1995-10-01","1995-11-01","1995-12-01","1996-01-01","1996-02-01","1996-03-01","1996-04-01","1996-05-01","1996-06-01","1996-07-01","1996-08-01","1996-09-01","1996-10-01","1996-11-01","1996-12-01","1997-01-01","1997-02-01","1997-03-01","1997-04-01","1997-05-01","1997-06-01","1997-07-01","1997-08-01","1997-09-01","1997-10-01","1997-11-01","1997-12-01","1998-01-01","1998-02-01","1998-03-01","1998-04-01","1998-05-01","1998-06-01","1998-07-01","1998-08-01","1998-09-01","1998-10-01","1998-11-01","1998-12-01","1999-01-01","1999-02-01","1999-03-01","1999-04-01","1999-05-01","1999-06-01","1999-07-01","1999-08-01","1999-09-01","1999-10-01","1999-11-01","1999-12-01","2000-01-01","2000-02-01","2000-03-01","2000-04-01","2000-05-01","2000-06-01","2000-07-01","2000-08-01","2000-09-01","2000-10-01","2000-11-01","2000-12-01","2001-01-01","2001-02-01","2001-03-01","2001-04-01","2001-05-01","2001-06-01","2001-07-01","2001-08-01","2001-09-01","2001-10-01","2001-11-01","2001-12-01","2002-01-01","2002-02-01","2002-03-01","2002-04-01","2002-05-01","2002-06-01","2002-07-01","2002-08-01","2002-09-01","2002-10-01","2002-11-01","2002-12-01","2003-01-01","2003-02-01","2003-03-01","2003-04-01","2003-05-01","2003-06-01","2003-07-01","2003-08-01","2003-09-01","2003-10-01","2003-11-01","2003-12-01","2004-01-01","2004-02-01","2004-03-01","2004-04-01","2004-05-01","2004-06-01","2004-07-01","2004-08-01","2004-09-01","2004-10-01","2004-11-01","2004-12-01","2005-01-01","2005-02-01","2005-03-01","2005-04-01","2005-05-01","2005-06-01","2005-07-01","2005-08-01","2005-09-01","2005-10-01","2005-11-01","2005-12-01","2006-01-01","2006-02-01","2006-03-01","2006-04-01","2006-05-01","2006-06-01","2006-07-01","2006-08-01","2006-09-01","2006-10-01","2006-11-01","2006-12-01","2007-01-01","2007-02-01","2007-03-01","2007-04-01","2007-05-01","2007-06-01","2007-07-01","2007-08-01","2007-09-01","2007-10-01","2007-11-01","2007-12-01","2008-01-01","2008-02-01","2008-03-01","2008-04-01","2008-05-01","2008-06-01","2008-07-01","2008-08-01","2008-09-01","2008-10-01","2008-11-01","2008-12-01","2009-01-01","2009-02-01","2009-03-01","2009-04-01","2009-05-01","2009-06-01","2009-07-01","2009-08-01","2009-09-01","2009-10-01","2009-11-01","2009-12-01","2010-01-01","2010-02-01","2010-03-01","2010-04-01","2010-05-01","2010-06-01","2010-07-01","2010-08-01","2010-09-01","2010-10-01","2010-11-01","2010-12-01","2011-01-01","2011-02-01","2011-03-01","2011-04-01","2011-05-01","2011-06-01","2011-07-01","2011-08-01","2011-09-01","2011-10-01","2011-11-01","2011-12-01","2012-01-01","2012-02-01","2012-03-01","2012-04-01","2012-05-01","2012-06-01","2012-07-01","2012-08-01","2012-09-01","2012-10-01","2012-11-01","2012-12-01","2013-01-01","2013-02-01","2013-03-01","2013-04-01","2013-05-01","2013-06-01","2013-07-01","2013-08-01","2013-09-01","2013-10-01","2013-11-01","2013-12-01","2014-01-01","2014-02-01","2014-03-01","2014-04-01","2014-05-01","2014-06-01","2014-07-01","2014-08-01","2014-09-01","2014-10-01","2014-11-01","2014-12-01","2015-01-01","2015-02-01","2015-03-01","2015-04-01","2015-05-01","2015-06-01","2015-07-01","2015-08-01","2015-09-01","2015-10-01","2015-11-01","2015-12-01","2016-01-01","2016-02-01","2016-03-01","2016-04-01","2016-05-01","2016-06-01","2016-07-01","2016-08-01","2016-09-01","2016-10-01","2016-11-01","2016-12-01","2017-01-01","2017-02-01","2017-03-01","2017-04-01","2017-05-01","2017-06-01","2017-07-01","2017-08-01","2017-09-01","2017-10-01","2017-11-01","2017-12-01","2018-01-01","2018-02-01","2018-03-01","2018-04-01","2018-05-01","2018-06-01","2018-07-01","2018-08-01","2018-09-01","2018-10-01","2018-11-01","2018-12-01","2019-01-01","2019-02-01","2019-03-01","2019-04-01","2019-05-01","2019-06-01","2019-07-01","2019-08-01","2019-09-01","2019-10-01","2019-11-01","2019-12-01","2020-01-01","2020-02-01","2020-03-01","2020-04-01","2020-05-01","2020-06-01","2020-07-01","2020-08-01","2020-09-01","2020-10-01","2020-11-01","2020-12-01","2021-01-01","2021-02-01","2021-03-01","2021-04-01","2021-05-01","2021-06-01","2021-07-01","2021-08-01","2021-09-01","2021-10-01","2021-11-01","2021-12-01","2022-01-01","2022-02-01","2022-03-01","2022-04-01","2022-05-01","2022-06-01","2022-07-01","2022-08-01","2022-09-01","2022-10-01","2022-11-01","2022-12-01","2023-01-01","2023-02-01","2023-03-01","2023-04-01","2023-05-01","2023-06-01","2023-07-01","2023-08-01","2023-09-01","2023-10-01","2023-11-01","2023-12-01","2024-01-01","2024-02-01","2024-03-01","2024-04-01","2024-05-01","2024-06-01","2024-07-01","2024-08-01","2024-09-01","2024-10-01","2024-11-01","2024-12-01","2025-01-01","2025-02-01","2025-03-01","2025-04-01","2025-05-01","2025-06-01","2025-07-01","2025-08-01","2025-09-01","2025-10-01","2025-11-01","2025-12-01","2026-01-01","2026-02-01","2026-03-01"],"o":[128.0,118.35,118.75,116.75,116.6,112.25,97.0,95.5,92.25,81.75,84.75,86.35,90.75,100.5,97.55,97.65,88.5,81.5,82.4,86.25,84.25,80.0,86.75,83.6,85.5,82.5,79.15,82.25,88.45,87.1,96.75,94.0,96.25,106.25,109.75,102.25,111.35,116.25,123.25,139.0,143.5,124.0,125.5,129.25,122.0,124.25,125.0,135.5,134.75,139.75,135.25,142.75,151.75,152.6,152.0,158.5,152.6,156.6,157.5,153.25,175.4,163.25,158.25,158.1,151.75,146.0,142.35,137.5,131.75,128.75,128.5,137.25,139.75,130.75,131.5,132.5,131.75,125.25,118.5,115.75,114.5,120.75,124.3,150.5,146.0,155.5,181.0,194.0,227.0,193.0,193.5,206.0,204.0,204.0,239.0,234.0,270.0,363.0,286.0,294.0,307.0,278.0,280.0,272.0,272.0,334.0,340.0,354.0,361.0,297.0,337.0,320.0,334.0,341.5,380.0,394.0,398.0,444.0,483.0,710.0,575.0,605.0,572.0,620.0,835.0,724.0,712.0,772.0,818.0,965.0,1042.0,822.0,735.0,675.0,645.0,598.0,460.0,457.0,330.0,315.0,355.0,440.0,367.0,373.0,392.0,355.0,348.0,318.0,318.0,325.0,319.0,309.0,262.0,234.0,261.0,242.0,180.0,156.0,181.0,180.0,180.0,200.0,212.0,203.0,189.0,194.0,229.5,235.0,286.0,262.0,250.0,215.0,217.0,214.0,222.0,212.0,210.5,180.0,189.5,182.0,200.0,194.0,185.0,180.0,191.5,183.0,194.0,223.0,257.0,261.0,287.0,286.0,336.0,378.0,343.0,326.0,313.0,345.0,315.0,323.0,326.0,332.0,339.0,351.0,353.0,368.0,368.0,367.0,362.0,330.0,348.0,372.0,347.0,370.0,402.0,577.0,434.0,418.0,430.0,467.0,375.0,304.0,207.0,199.0,181.0,185.0,195.0,198.0,217.0,212.5,238.0,249.0,262.0,291.0,295.0,326.0,381.0,420.0,419.0,438.0,489.0,540.0,454.0,441.0,498.0,508.0,570.0,655.0,707.0,792.0,820.0,804.0,768.0,774.0,773.0,752.0,840.0,786.0,604.0,635.0,613.0,655.0,693.0,704.0,656.0,679.0,602.0,580.0,589.0,634.0,637.0,615.0,682.0,707.0,745.0,719.0,774.0,697.0,749.0,677.0,728.0,726.0,726.0,738.0,717.0,723.0,708.0,748.0,771.0,812.0,834.0,845.0,872.0,909.0,769.0,805.0,804.0,796.0,772.0,816.0,738.0,777.0,777.0,687.0,613.0,589.0,659.0,659.0,549.0,547.0,495.0,503.0,573.0,620.0,543.0,593.0,713.0,669.0,719.0,627.0,774.0,684.0,764.0,778.0,798.0,813.0,816.0,843.0,889.0,934.0,939.0,993.0,1014.0,1071.0,1031.0,1020.0,941.0,958.0,989.0,950.0,929.0,985.0,1065.0,1084.0,1194.0,1263.0,1358.0,1533.0,1379.0,1366.0,1336.0,1551.0,1514.0,1535.0,1667.0,1792.0,1841.0,1950.0,2281.0,2660.0,2314.0,1927.0,1935.0,1935.0,2105.0,2273.0,2322.0,2234.0,2400.0,2419.0,2278.0,2344.0,2630.0,2987.0,2866.0,2761.0,2664.0,2479.0,1892.0,1978.0,1745.0,1869.0,2385.0,2565.0,2275.0,2229.0,2012.0,1907.0,2158.0,2087.0,2190.0,1889.0,1893.0,1804.0,1638.0,1424.0,1465.0,1459.0,1399.0,1227.0,1269.0,1225.0,1242.0,1121.0,1015.0,1112.0,974.0,945.0,1016.0,938.0,906.0,985.0,923.0,972.0,1000.0,1120.0,975.0,910.0,1012.0,933.0,991.0,946.0,976.0,1114.0,1192.0,1117.0,1266.0,1461.0,1467.0,1649.0,1671.0,1691.97],"h":[128.75,122.75,119.0,118.55,118.75,112.25,100.5,95.75,93.35,93.0,88.4,89.5,102.65,100.5,99.0,97.65,88.5,83.75,88.0,87.1,85.75,87.25,87.1,85.2,85.5,83.55,82.25,91.0,88.45,95.25,96.75,96.25,113.5,113.4,117.75,111.9,119.5,122.75,139.0,145.0,144.0,125.25,134.25,130.75,127.25,126.25,136.0,135.5,135.6,139.75,140.0,152.25,154.75,156.25,160.1,161.0,156.75,158.0,157.75,175.85,176.25,164.25,161.25,158.1,152.0,147.25,142.35,137.5,136.0,133.0,142.25,142.0,141.0,135.75,132.25,134.25,131.75,125.5,120.75,120.5,119.25,123.25,157.0,155.0,160.25,196.5,240.0,211.0,245.5,196.0,223.5,214.0,208.5,248.5,243.0,295.0,390.0,407.0,310.0,343.0,307.0,291.0,281.0,300.0,330.0,335.0,362.0,372.25,384.0,344.0,349.0,342.0,345.0,396.0,398.0,419.0,454.0,488.0,800.0,718.0,597.0,605.0,691.0,820.0,855.0,765.0,755.0,808.0,972.0,1094.0,1081.0,828.0,765.0,675.0,645.0,598.0,485.0,465.0,354.5,338.0,440.0,440.0,388.0,390.0,392.0,378.0,356.0,332.0,362.0,335.0,322.0,312.0,262.0,271.0,266.0,242.0,180.0,206.0,190.0,185.0,200.0,225.0,214.0,207.0,209.0,246.0,244.0,287.0,333.0,262.0,252.0,228.0,223.0,224.0,230.0,219.0,211.0,192.0,189.5,207.0,203.0,195.0,190.5,192.0,192.5,202.0,227.0,266.0,297.0,283.0,315.0,344.0,370.0,402.0,361.0,330.0,345.5,351.0,327.0,334.0,329.0,348.0,354.0,354.0,381.0,375.0,375.0,370.0,364.0,344.0,380.0,379.0,365.0,388.0,568.0,588.0,463.0,455.0,473.0,468.0,375.0,304.0,207.0,231.0,183.5,199.0,219.0,220.0,239.0,241.0,264.0,262.0,287.0,301.0,336.0,375.0,402.0,462.0,446.0,479.0,570.0,542.0,498.0,491.0,509.0,568.0,629.0,721.0,797.0,823.0,859.0,823.0,795.0,775.0,817.0,838.0,840.0,786.0,667.0,672.0,676.0,696.0,721.0,711.0,682.0,679.0,636.0,601.0,645.0,692.0,668.0,688.0,706.0,754.0,773.0,773.0,774.0,755.0,761.0,747.0,756.0,730.0,747.0,760.0,738.0,748.0,741.0,796.0,810.0,841.0,858.0,885.0,900.0,909.0,804.0,805.0,817.0,810.0,815.0,830.0,782.0,792.0,777.0,698.0,620.0,667.0,713.0,659.0,566.0,547.0,523.0,597.0,624.0,620.0,587.0,704.0,731.0,719.0,719.0,764.0,774.0,786.0,791.0,806.0,816.0,815.0,900.0,888.0,942.0,988.0,1005.0,1024.0,1060.0,1128.0,1061.0,1020.0,1055.0,1004.0,1022.0,962.0,980.0,1086.0,1141.0,1192.0,1274.0,1417.0,1555.0,1604.0,1458.0,1367.0,1535.0,1601.0,1514.0,1691.0,1803.0,1840.0,1990.0,2573.0,2795.0,2660.0,2314.0,2068.0,1968.0,2281.0,2220.0,2375.0,2450.0,2483.0,2418.0,2462.0,2427.0,2639.0,2983.0,2997.0,2866.0,2839.0,2678.0,2479.0,2180.0,2178.0,1978.0,2418.0,2620.0,3339.0,2516.0,2286.0,2012.0,2148.0,2264.0,2227.0,2314.0,2096.0,1929.0,1830.0,1689.0,1489.0,1620.0,1573.0,1425.0,1324.0,1309.0,1277.0,1242.0,1129.0,1223.0,1112.0,974.0,1095.0,1084.0,1024.0,998.0,1035.0,986.0,1112.0,1232.0,1120.0,996.0,1001.0,1015.0,982.0,991.0,1019.0,1150.0,1304.0,1208.0,1282.0,1562.0,1486.0,1825.0,2090.0,1834.0,1691.97],"l":[122.25,117.65,112.75,116.25,111.25,97.75,88.5,92.75,81.75,81.75,79.25,83.35,90.75,93.65,95.25,87.25,78.75,80.75,82.4,84.0,79.75,79.25,83.5,83.6,81.75,81.5,79.1,82.25,82.25,87.1,93.25,93.0,96.25,106.25,99.6,102.25,111.35,115.5,122.25,135.0,122.75,116.35,124.25,123.5,122.0,123.25,125.0,128.0,132.0,133.75,134.0,142.75,149.75,148.25,151.75,153.75,152.25,153.5,154.25,152.0,160.25,157.25,156.0,152.5,145.5,135.35,134.0,132.4,127.5,127.25,128.5,132.25,130.25,128.25,127.25,129.75,123.5,116.5,115.25,114.25,114.5,117.75,124.3,144.5,145.5,155.5,180.0,168.0,188.0,186.0,191.0,203.5,183.5,201.0,230.0,234.0,270.0,293.0,261.0,287.0,273.0,275.0,273.0,272.0,270.25,310.0,340.0,345.0,333.0,284.0,320.0,315.0,333.0,341.5,376.0,392.0,398.0,433.0,483.0,592.0,553.0,560.0,572.0,618.0,710.0,708.0,712.0,772.0,818.0,965.0,840.0,735.0,655.0,635.0,594.0,438.0,440.0,363.0,315.0,315.0,355.0,370.0,365.0,360.0,362.0,348.0,318.0,316.0,318.0,315.0,310.0,261.0,222.0,234.0,243.0,183.0,144.0,152.0,173.0,160.0,172.0,192.0,190.5,188.0,189.0,194.0,223.0,235.0,237.0,231.0,215.5,209.0,211.0,205.0,212.0,210.0,179.0,180.0,179.0,182.0,196.0,184.0,182.5,172.0,182.5,182.5,192.0,221.0,246.0,261.0,276.0,284.0,334.0,338.0,286.0,304.0,313.0,303.0,298.0,315.0,321.0,328.0,335.0,338.0,351.0,360.0,363.5,362.0,320.0,330.0,348.0,343.0,344.0,363.0,402.0,425.0,417.0,408.0,423.5,378.0,274.0,203.0,168.0,183.0,170.0,177.0,193.0,193.0,216.0,212.5,234.0,233.0,262.0,284.0,291.0,321.0,355.0,418.0,387.0,438.0,489.0,416.0,421.0,433.0,465.0,508.0,566.0,639.0,707.0,741.0,767.0,708.0,736.0,706.0,729.0,752.0,722.0,626.0,561.0,570.0,613.0,617.0,679.0,648.0,637.0,590.0,568.0,564.0,573.0,630.0,594.0,598.0,675.0,672.0,715.0,719.0,670.0,685.0,644.0,673.0,720.0,686.0,697.0,713.0,696.0,706.0,703.0,747.0,771.0,803.0,811.0,845.0,847.0,786.0,752.0,754.0,785.0,761.0,770.0,734.0,738.0,777.0,670.0,611.0,539.0,571.0,659.0,537.0,528.0,465.0,485.0,503.0,538.0,533.0,539.0,593.0,683.0,652.0,612.0,619.0,653.0,684.0,749.0,746.0,775.0,761.0,816.0,837.0,870.0,908.0,914.0,978.0,990.0,1063.0,970.0,970.0,906.0,958.0,939.0,890.0,864.0,966.0,1050.0,1084.0,1194.0,1261.0,1355.0,1387.0,1339.0,1300.0,1327.0,1500.0,1412.0,1535.0,1629.0,1701.0,1841.0,1950.0,2281.0,1583.0,1913.0,1775.0,1846.0,1905.0,2100.0,2225.0,2226.0,2234.0,2288.0,2301.0,2244.0,2300.0,2614.0,2733.0,2508.0,2600.0,2311.0,1889.0,1892.0,1753.0,1608.0,1850.0,2239.0,2160.0,2168.0,1926.0,1823.0,1860.0,1990.0,2003.0,1908.0,1822.0,1658.0,1603.0,1412.0,1367.0,1424.0,1397.0,1225.0,1227.0,1213.0,1197.0,1091.0,960.0,941.0,922.0,866.0,945.0,953.0,938.0,885.0,905.0,858.0,925.0,997.0,926.0,909.0,910.0,917.0,933.0,911.0,946.0,976.0,1082.0,1092.0,1117.0,1262.0,1363.0,1422.0,1649.0,1650.97,1691.97],"c":[122.25,119.75,113.35,116.5,111.75,97.75,96.5,93.5,81.75,83.35,83.25,88.0,100.5,100.5,96.85,87.25,81.0,82.25,86.0,84.75,79.75,86.5,83.65,85.2,82.25,81.5,82.25,91.0,86.5,95.25,93.9,94.5,106.25,111.35,100.25,111.9,119.5,122.75,139.0,143.1,126.0,124.5,130.1,123.5,123.25,124.35,135.6,133.75,135.6,135.0,140.0,149.35,152.0,152.75,159.35,154.4,156.75,157.0,154.25,174.25,162.75,162.0,158.75,153.0,145.5,142.25,135.85,132.4,127.5,128.0,137.5,138.25,130.25,131.5,132.0,130.0,125.5,118.5,116.0,114.25,116.5,121.25,155.0,145.25,156.75,188.5,190.0,211.0,191.0,196.0,209.0,208.0,204.0,237.0,237.0,262.0,360.0,293.0,297.0,305.0,273.0,275.0,274.0,273.5,329.0,335.0,357.0,362.0,333.0,340.0,320.0,338.0,339.0,380.0,394.0,394.0,454.0,482.0,735.0,592.0,597.0,570.0,635.0,820.0,719.0,712.0,754.0,808.0,954.0,1055.0,845.0,735.0,685.0,650.0,594.0,438.0,453.0,363.0,330.0,338.0,440.0,370.0,378.0,388.0,362.0,350.0,318.0,322.0,336.0,315.0,311.0,261.0,233.0,256.0,244.0,183.0,152.0,183.0,175.0,175.0,196.0,210.0,202.5,190.0,193.0,227.0,232.0,284.0,250.0,249.7,220.0,216.0,214.0,215.0,212.0,210.0,184.0,188.0,181.0,196.0,196.0,185.0,183.0,192.0,183.0,196.0,227.0,258.0,253.0,282.0,282.0,335.0,362.0,354.0,316.0,312.0,341.0,320.0,319.0,321.0,324.0,336.0,350.0,353.0,370.0,367.0,365.0,365.0,329.0,344.0,368.0,347.0,365.0,382.0,568.0,445.0,417.0,424.0,468.0,378.0,299.0,203.0,196.0,186.0,183.5,192.0,196.0,214.0,222.0,235.0,251.0,258.0,286.0,291.0,327.0,362.0,402.0,419.0,430.0,479.0,551.0,469.0,449.0,491.0,487.5,568.0,629.0,697.0,791.0,811.0,790.0,761.0,769.0,775.0,759.0,827.0,780.0,627.0,651.0,574.0,636.0,694.0,718.0,650.0,682.0,610.0,568.0,589.0,618.0,638.0,610.0,688.0,699.0,742.0,741.0,764.0,699.0,755.0,647.0,737.0,731.0,730.0,742.0,722.0,711.0,706.0,741.0,777.0,803.0,831.0,843.0,880.0,895.0,786.0,779.0,804.0,798.0,783.0,805.0,734.0,781.0,781.0,670.0,612.0,563.0,667.0,681.0,548.0,547.0,493.0,491.0,570.0,624.0,542.0,587.0,695.0,683.0,719.0,615.0,764.0,676.0,750.0,783.0,797.0,816.0,805.0,843.0,888.0,935.0,935.0,972.0,1018.0,1056.0,1063.0,1049.0,971.0,973.0,989.0,948.0,926.0,977.0,1086.0,1072.0,1192.0,1263.0,1368.0,1545.0,1387.0,1368.0,1367.0,1535.0,1529.0,1500.0,1691.0,1803.0,1840.0,1920.0,2300.0,2743.0,2317.0,1991.0,1921.0,1914.0,2094.0,2180.0,2309.0,2226.0,2404.0,2370.0,2330.0,2379.0,2627.0,2983.0,2828.0,2673.0,2648.0,2484.0,1889.0,1999.0,1753.0,1928.0,2418.0,2491.0,2204.0,2303.0,2070.0,1981.0,2103.0,2096.0,2227.0,1908.0,1882.0,1788.0,1603.0,1433.0,1489.0,1490.0,1397.0,1225.0,1243.0,1235.0,1270.0,1127.0,1014.0,1119.0,983.0,939.0,994.0,953.0,953.0,963.0,911.0,986.0,1014.0,1135.0,993.0,909.0,991.0,917.0,980.0,936.0,970.0,1150.0,1224.0,1101.0,1230.0,1445.0,1430.0,1567.0,1775.0,1761.6,1691.97],"m":[127.38,119.59,115.68,117.05,115.8,105.57,95.51,93.94,89.63,87.08,84.22,86.03,96.57,95.63,97.0,94.73,83.2,81.88,85.29,85.43,82.73,82.91,85.56,84.37,83.52,82.81,80.69,87.04,85.54,90.8,94.75,94.52,106.73,109.83,110.44,106.02,114.83,119.6,126.85,139.42,137.17,121.37,129.72,128.45,124.71,124.32,131.74,133.07,133.66,136.19,137.2,145.99,152.17,152.99,154.63,156.51,153.62,156.01,157.03,162.59,170.2,160.68,158.68,155.3,149.57,143.6,137.1,134.47,131.77,129.65,139.25,138.17,136.57,132.08,129.49,132.06,127.27,121.75,117.58,116.99,117.01,121.14,135.8,149.24,153.67,171.32,204.26,187.78,214.68,191.18,205.13,208.43,198.87,226.21,236.6,262.41,320.77,354.47,287.32,306.72,287.88,283.14,277.26,277.21,297.06,321.65,351.7,353.21,361.93,329.74,337.36,331.77,340.12,361.5,387.14,401.48,424.6,451.68,636.29,667.43,572.17,570.9,646.64,702.12,759.7,728.24,739.43,783.84,917.11,1039.95,975.25,782.32,696.21,655.48,614.12,526.09,455.45,445.0,335.4,328.39,399.79,410.5,374.25,374.4,370.19,356.86,334.81,322.52,324.43,327.38,316.57,285.81,242.65,254.55,253.25,225.86,163.1,167.35,179.5,173.3,181.6,210.86,201.61,197.05,197.9,215.6,234.65,268.33,296.5,245.93,228.95,220.57,215.67,211.2,218.23,213.95,191.88,185.6,182.4,197.14,198.44,189.85,186.49,184.48,186.84,188.75,207.56,246.14,265.3,273.4,289.25,309.13,353.26,368.76,315.27,318.55,328.7,323.55,313.18,324.82,325.87,336.68,341.65,349.89,368.74,367.76,368.36,366.31,344.16,335.02,365.28,363.32,351.29,374.43,466.4,491.79,447.36,436.5,449.02,428.22,316.05,249.82,190.96,206.78,176.74,187.6,207.2,202.86,227.28,229.87,246.14,248.24,275.18,293.0,321.52,351.67,374.02,434.23,424.2,461.2,533.75,490.74,461.55,456.0,487.21,538.36,591.76,683.23,755.14,793.15,820.6,761.7,770.92,736.0,771.23,787.52,763.11,712.73,615.86,625.91,643.0,658.74,702.29,685.41,656.84,616.61,612.34,579.14,600.16,657.2,633.74,634.77,691.05,712.43,751.48,753.52,703.14,721.71,714.62,716.26,739.95,708.71,724.39,733.9,716.4,733.5,726.55,771.21,789.75,819.65,832.29,870.91,875.8,844.18,777.35,778.15,804.43,784.86,785.35,788.23,767.2,784.84,728.41,643.48,593.95,605.95,689.36,577.4,550.62,498.2,504.81,563.81,572.48,577.5,551.32,642.24,699.95,681.95,650.48,693.41,707.4,746.38,772.25,775.04,799.17,792.62,862.91,855.67,910.36,937.1,956.5,999.5,1020.58,1095.27,1023.35,986.95,969.95,978.38,985.57,931.0,917.18,1009.1,1082.04,1137.41,1246.0,1331.14,1439.75,1535.95,1388.7,1332.1,1439.5,1544.91,1455.24,1600.62,1723.87,1769.33,1903.75,2246.64,2532.3,2133.14,2121.6,1905.11,1925.14,2035.65,2167.95,2291.5,2352.59,2352.57,2342.1,2376.6,2348.3,2466.39,2770.0,2885.0,2722.5,2731.27,2538.38,2129.5,2024.9,2005.0,1800.5,2020.75,2345.0,2611.39,2318.16,2061.57,1909.25,1972.0,2135.14,2111.38,2087.05,1917.95,1824.35,1737.76,1545.35,1423.78,1510.33,1481.05,1349.68,1267.43,1250.14,1237.0,1146.09,1052.86,1070.42,985.27,938.0,1012.65,1017.95,977.57,923.65,961.35,931.48,1018.67,1069.61,1010.29,952.95,951.95,975.9,958.86,944.65,972.05,1055.76,1195.7,1134.8,1177.05,1415.52,1415.1,1575.33,1844.19,1732.94,1691.97],"n":[19,21,21,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,21,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,21,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,22,18,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,23,20,19,22,22,21,22,21,22,21,20,20,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,18,20,22,21,22,22,21,22,20,21,21,22,19,22,19,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,21,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,21,20,21,21,22,22,20,23,22,19,22,20,21,20,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,20,23,19,21,20,21,22,21,21,22,20,21,20,23,18,20,22,21,22,21,22,22,19,22,21,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,23,1]},"Platinum":{"t":["1990-04-01","1990-05-01","1990-06-01","1990-07-01","1990-08-01","1990-09-01","1990-10-01","1990-11-01","1990-12-01","1991-01-01","1991-02-01","1991-03-01","1991-04-01","1991-05-01","1991-06-01","1991-07-01","1991-08-01","1991-09-01","1991-10-01","1991-11-01","1991-12-01","1992-01-01","1992-02-01","1992-03-01","1992-04-01","1992-05-01","1992-06-01","1992-07-01","1992-08-01","1992-09-01","1992-10-01","1992-11-01","1992-12-01","1993-01-01","1993-02-01","1993-03-01","1993-04-01","1993-05-01","1993-06-01","1993-07-01","1993-08-01","1993-09-01","1993-10-01","1993-11-01","1993-12-01","1994-01-01","1994-02-01","1994-03-01","1994-04-01","1994-05-01","1994-06-01","1994-07-01","1994-08-01","1994-09-01","1994-10-01","1994-11-01","1994-12-01","1995-01-01","1995-02-01","1995-03-01","1995-04-01","1995-05-01","1995-06-01","1995-07-01","1995-08-01","1995-09-01","1995-10-01","1995-11-01","1995-12-01","1996-01-01","1996-02-01","1996-03-01","1996-04-01","1996-05-01","1996-06-01","1996-07-01","1996-08-01","1996-09-01","1996-10-01","1996-11-01","1996-12-01","1997-01-01","1997-02-01","1997-03-01","1997-04-01","1997-05-01","1997-06-01","1997-07-01","1997-08-01","1997-09-01","1997-10-01","1997-11-01","1997-12-01","1998-01-01","1998-02-01","1998-03-01","1998-04-01","1998-05-01","1998-06-01","1998-07-01","1998-08-01","1998-09-01","1998-10-01","1998-11-01","1998-12-01","1999-01-01","1999-02-01","1999-03-01","1999-04-01","1999-05-01","1999-06-01","1999-07-01","1999-08-01","1999-09-01","1999-10-01","1999-11-01","1999-12-01","2000-01-01","2000-02-01","2000-03-01","2000-04-01","2000-05-01","2000-06-01","2000-07-01","2000-08-01","2000-09-01","2000-10-01","2000-11-01","2000-12-01","2001-01-01","2001-02-01","2001-03-01","2001-04-01","2001-05-01","2001-06-01","2001-07-01","2001-08-01","2001-09-01","2001-10-01","2001-11-01","2001-12-01","2002-01-01","2002-02-01","2002-03-01","2002-04-01","2002-05-01","2002-06-01","2002-07-01","2002-08-01","2002-09-01","2002-10-01","2002-11-01","2002-12-01","2003-01-01","2003-02-01","2003-03-01","2003-04-01","2003-05-01","2003-06-01","2003-07-01","2003-08-01","2003-09-01","2003-10-01","2003-11-01","2003-12-01","2004-01-01","2004-02-01","2004-03-01","2004-04-01","2004-05-01","2004-06-01","2004-07-01","2004-08-01","2004-09-01","2004-10-01","2004-11-01","2004-12-01","2005-01-01","2005-02-01","2005-03-01","2005-04-01","2005-05-01","2005-06-01","2005-07-01","2005-08-01","2005-09-01","2005-10-01","2005-11-01","2005-12-01","2006-01-01","2006-02-01","2006-03-01","2006-04-01","2006-05-01","2006-06-01","2006-07-01","2006-08-01","2006-09-01","2006-10-01","2006-11-01","2006-12-01","2007-01-01","2007-02-01","2007-03-01","2007-04-01","2007-05-01","2007-06-01","2007-07-01","2007-08-01","2007-09-01","2007-10-01","2007-11-01","2007-12-01","2008-01-01","2008-02-01","2008-03-01","2008-04-01","2008-05-01","2008-06-01","2008-07-01","2008-08-01","2008-09-01","2008-10-01","2008-11-01","2008-12-01","2009-01-01","2009-02-01","2009-03-01","2009-04-01","2009-05-01","2009-06-01","2009-07-01","2009-08-01","2009-09-01","2009-10-01","2009-11-01","2009-12-01","2010-01-01","2010-02-01","2010-03-01","2010-04-01","2010-05-01","2010-06-01","2010-07-01","2010-08-01","2010-09-01","2010-10-01","2010-11-01","2010-12-01","2011-01-01","2011-02-01","2011-03-01","2011-04-01","2011-05-01","2011-06-01","2011-07-01","2011-08-01","2011-09-01","2011-10-01","2011-11-01","2011-12-01","2012-01-01","2012-02-01","2012-03-01","2012-04-01","2012-05-01","2012-06-01","2012-07-01","2012-08-01","2012-09-01","2012-10-01","2012-11-01","2012-12-01","2013-01-01","2013-02-01","2013-03-01","2013-04-01","2013-05-01","2013-06-01","2013-07-01","2013-08-01","2013-09-01","2013-10-01","2013-11-01","2013-12-01","2014-01-01","2014-02-01","2014-03-01","2014-04-01","2014-05-01","2014-06-01","2014-07-01","2014-08-01","2014-09-01","2014-10-01","2014-11-01","2014-12-01","2015-01-01","2015-02-01","2015-03-01","2015-04-01","2015-05-01","2015-06-01","2015-07-01","2015-08-01","2015-09-01","2015-10-01","2015-11-01","2015-12-01","2016-01-01","2016-02-01","2016-03-01","2016-04-01","2016-05-01","2016-06-01","2016-07-01","2016-08-01","2016-09-01","2016-10-01","2016-11-01","2016-12-01","2017-01-01","2017-02-01","2017-03-01","2017-04-01","2017-05-01","2017-06-01","2017-07-01","2017-08-01","2017-09-01","2017-10-01","2017-11-01","2017-12-01","2018-01-01","2018-02-01","2018-03-01","2018-04-01","2018-05-01","2018-06-01","2018-07-01","2018-08-01","2018-09-01","2018-10-01","2018-11-01","2018-12-01","2019-01-01","2019-02-01","2019-03-01","2019-04-01","2019-05-01","2019-06-01","2019-07-01","2019-08-01","2019-09-01","2019-10-01","2019-11-01","2019-12-01","2020-01-01","2020-02-01","2020-03-01","2020-04-01","2020-05-01","2020-06-01","2020-07-01","2020-08-01","2020-09-01","2020-10-01","2020-11-01","2020-12-01","2021-01-01","2021-02-01","2021-03-01","2021-04-01","2021-05-01","2021-06-01","2021-07-01","2021-08-01","2021-09-01","2021-10-01","2021-11-01","2021-12-01","2022-01-01","2022-02-01","2022-03-01","2022-04-01","2022-05-01","2022-06-01","2022-07-01","2022-08-01","2022-09-01","2022-10-01","2022-11-01","2022-12-01","2023-01-01","2023-02-01","2023-03-01","2023-04-01","2023-05-01","2023-06-01","2023-07-01","2023-08-01","2023-09-01","2023-10-01","2023-11-01","2023-12-01","2024-01-01","2024-02-01","2024-03-01","2024-04-01","2024-05-01","2024-06-01","2024-07-01","2024-08-01","2024-09-01","2024-10-01","2024-11-01","2024-12-01","2025-01-01","2025-02-01","2025-03-01","2025-04-01","2025-05-01","2025-06-01","2025-07-01","2025-08-01","2025-09-01","2025-10-01","2025-11-01","2025-12-01","2026-01-01","2026-02-01","2026-03-01"],"o":[471.0,473.25,490.0,487.0,485.15,487.0,430.0,435.75,429.25,416.25,394.75,401.75,394.5,394.25,376.3,379.85,363.5,338.5,354.0,362.0,369.5,336.5,357.0,358.5,360.25,347.75,367.25,380.0,380.0,361.75,366.5,354.5,362.75,352.7,361.0,346.4,362.25,379.0,398.0,385.5,418.65,381.5,358.75,369.5,366.75,399.5,388.0,394.4,412.65,401.0,402.25,405.0,422.5,413.0,416.0,414.0,403.75,416.0,415.5,409.0,440.0,442.75,431.5,434.0,418.75,429.25,420.25,409.0,413.5,400.75,422.5,412.75,406.5,400.5,401.0,390.5,403.5,395.5,381.5,379.75,373.75,369.5,350.25,390.5,369.5,372.25,405.5,434.0,436.5,410.0,435.0,407.0,384.0,366.0,389.0,387.0,409.0,397.5,368.0,360.0,374.0,362.0,353.0,336.0,351.5,362.5,347.0,378.0,361.5,349.0,360.0,352.5,344.0,349.0,410.0,419.0,442.0,442.0,493.0,477.0,508.0,532.0,552.0,555.0,588.0,590.0,573.0,586.0,606.0,610.0,602.5,609.0,558.0,600.0,596.0,560.0,470.0,442.0,424.0,419.5,453.0,481.0,449.0,486.0,537.0,523.0,552.0,532.0,522.0,563.0,567.0,578.0,592.0,600.0,690.0,683.0,642.0,606.0,638.0,671.0,677.0,707.0,712.0,738.0,770.0,815.0,832.0,894.0,910.0,816.0,844.0,783.0,827.0,866.0,863.0,834.0,866.0,848.0,881.0,866.0,862.5,867.0,867.0,880.0,901.0,893.0,924.0,930.0,985.0,982.0,1070.0,1046.0,1075.0,1164.0,1244.0,1243.0,1227.0,1244.0,1150.0,1086.0,1175.0,1136.0,1183.0,1243.0,1241.0,1288.0,1287.0,1272.0,1275.0,1271.0,1382.0,1448.0,1450.0,1530.0,1741.0,2162.0,1938.0,1917.0,1993.0,2075.0,1717.0,1451.0,1040.0,838.0,822.0,934.0,975.0,1094.0,1127.0,1096.0,1218.0,1176.0,1210.0,1249.0,1294.0,1334.0,1468.0,1496.0,1516.0,1554.0,1659.0,1720.0,1544.0,1518.0,1586.0,1528.0,1669.0,1718.0,1673.0,1768.0,1808.0,1809.0,1779.0,1858.0,1819.0,1703.0,1796.0,1850.0,1520.0,1581.0,1552.0,1408.0,1611.0,1692.0,1636.0,1563.0,1396.0,1442.0,1412.0,1543.0,1658.0,1573.0,1599.0,1559.0,1672.0,1565.0,1592.0,1500.0,1466.0,1350.0,1436.0,1527.0,1407.0,1456.0,1364.0,1387.0,1386.0,1452.0,1424.0,1417.0,1440.0,1486.0,1461.0,1424.0,1274.0,1237.0,1198.0,1208.0,1226.0,1182.0,1136.0,1139.0,1107.0,1085.0,977.0,1008.0,912.0,974.0,842.0,878.0,865.0,938.0,982.0,1084.0,974.0,1033.0,1150.0,1051.0,1020.0,983.0,903.0,906.0,996.0,1027.0,953.0,935.0,943.0,919.0,943.0,997.0,913.0,927.0,941.0,937.0,997.0,972.0,934.0,900.0,910.0,842.0,830.0,787.0,813.0,848.0,811.0,796.0,822.0,862.0,848.0,881.0,797.0,833.0,852.0,936.0,881.0,932.0,895.0,981.0,952.0,874.0,723.0,760.0,836.0,825.0,906.0,950.0,899.0,858.0,982.0,1101.0,1116.0,1206.0,1189.0,1238.0,1187.0,1084.0,1053.0,1014.0,964.0,1034.0,953.0,963.0,1037.0,1059.0,988.0,940.0,975.0,886.0,908.0,840.0,865.0,945.0,1035.0,1086.0,1007.0,965.0,987.0,1051.0,1005.0,898.0,943.0,976.0,906.0,925.0,937.0,995.0,916.0,875.0,912.0,936.0,1030.0,992.0,965.0,930.0,984.0,995.0,942.0,911.0,968.0,952.0,994.0,965.0,1051.0,1333.0,1264.0,1396.0,1594.0,1602.0,1677.0,2133.0,2063.0,2185.18],"h":[485.25,503.25,491.75,488.75,504.5,487.0,448.0,435.75,431.9,424.3,397.0,416.1,406.0,394.25,382.5,384.05,363.5,358.3,371.25,371.85,372.25,353.4,367.5,363.75,360.25,370.05,378.5,392.1,380.0,368.1,366.5,362.25,368.75,364.5,368.5,361.75,386.5,396.55,398.0,414.5,418.65,381.5,376.35,379.25,393.5,399.5,403.0,415.25,412.65,407.0,408.75,423.0,423.0,421.15,425.25,418.0,417.75,419.25,417.25,431.6,461.25,459.0,442.75,440.25,434.5,440.85,420.25,422.25,417.0,423.5,433.0,414.5,410.5,406.25,401.0,399.5,403.75,396.0,387.5,388.25,373.75,369.5,398.75,390.5,380.5,417.5,495.0,434.0,460.0,443.0,439.0,408.0,388.0,388.5,397.0,423.0,428.0,403.0,368.0,395.5,379.5,369.0,354.0,358.0,361.5,362.5,384.0,378.0,365.0,365.0,367.5,353.75,355.0,429.0,436.0,456.0,449.0,495.0,573.0,496.0,521.0,563.0,580.0,583.0,612.0,612.0,588.0,604.0,625.0,645.0,613.0,609.0,630.0,622.0,596.0,560.0,481.0,495.0,462.0,441.0,477.0,482.0,494.0,526.0,558.0,548.0,567.0,532.0,574.0,570.0,598.0,602.0,607.0,671.0,703.0,705.0,642.0,682.0,674.0,700.0,709.0,714.0,759.0,771.5,842.0,868.0,873.0,923.0,937.0,843.0,844.0,836.0,871.0,873.0,863.0,878.0,875.75,871.0,881.0,883.0,878.0,881.0,900.0,896.0,924.0,930.0,944.0,997.0,1011.0,1074.0,1080.0,1082.0,1149.0,1335.0,1258.0,1253.0,1251.0,1263.0,1150.0,1390.0,1175.0,1172.0,1253.0,1246.0,1325.0,1336.0,1302.0,1332.0,1296.0,1361.0,1462.0,1484.0,1534.0,1716.0,2170.0,2276.0,2065.0,2192.0,2080.0,2075.0,1717.0,1451.0,1040.0,875.0,920.0,991.0,1113.0,1144.0,1229.0,1164.0,1293.0,1212.0,1286.0,1343.0,1369.0,1469.0,1500.0,1641.0,1586.0,1641.0,1751.0,1731.0,1605.0,1558.0,1590.0,1650.0,1720.0,1780.0,1760.0,1846.0,1863.0,1846.0,1820.0,1858.0,1842.0,1810.0,1899.0,1881.0,1645.0,1661.0,1559.0,1626.0,1728.0,1701.0,1658.0,1565.0,1492.0,1487.0,1549.0,1695.0,1714.0,1619.0,1640.0,1697.0,1730.0,1602.0,1592.0,1508.0,1536.0,1445.0,1548.0,1529.0,1467.0,1466.0,1386.0,1466.0,1444.0,1481.0,1464.0,1484.0,1481.0,1511.0,1481.0,1424.0,1284.0,1237.0,1250.0,1281.0,1255.0,1186.0,1172.0,1166.0,1114.0,1086.0,1026.0,1012.0,1013.0,974.0,888.0,890.0,952.0,1002.0,1060.0,1084.0,1007.0,1149.0,1177.0,1095.0,1020.0,1008.0,947.0,994.0,1026.0,1027.0,983.0,953.0,960.0,935.0,999.0,1014.0,943.0,949.0,941.0,1020.0,1011.0,972.0,950.0,927.0,910.0,857.0,834.0,838.0,844.0,876.0,811.0,829.0,874.0,869.0,911.0,881.0,823.0,881.0,935.0,982.0,928.0,954.0,971.0,1033.0,1018.0,880.0,794.0,850.0,846.0,945.0,977.0,981.0,899.0,964.0,1075.0,1121.0,1306.0,1223.0,1241.0,1265.0,1187.0,1144.0,1054.0,1029.0,1063.0,1106.0,973.0,1048.0,1119.0,1149.0,1023.0,986.0,1031.0,898.0,959.0,931.0,950.0,1055.0,1065.0,1098.0,1028.0,991.0,1106.0,1104.0,1042.0,988.0,983.0,976.0,937.0,938.0,1006.0,995.0,919.0,938.0,997.0,1082.0,1030.0,1016.0,973.0,1009.0,1050.0,999.0,955.0,977.0,1008.0,1011.0,994.0,1091.0,1402.0,1464.0,1361.0,1606.0,1668.0,1635.0,2303.0,2860.0,2320.54,2185.18],"l":[471.0,473.25,473.0,469.0,479.65,431.25,389.75,407.3,411.25,386.25,379.35,390.0,387.5,369.5,368.25,358.5,335.25,338.5,351.25,358.75,330.0,332.75,353.8,348.0,340.75,347.75,363.8,374.0,342.75,354.65,353.5,350.65,355.25,352.7,344.1,339.75,360.0,374.15,372.65,385.5,379.25,351.5,356.65,365.85,366.75,379.25,388.0,389.25,385.75,387.75,395.25,402.5,406.25,409.5,414.25,408.9,401.0,403.25,408.75,404.0,438.75,427.35,431.5,425.75,415.5,420.25,406.5,404.85,398.25,400.75,408.0,406.35,399.25,397.25,388.65,387.25,397.0,383.5,380.5,374.25,367.25,350.25,349.75,372.0,362.25,372.25,404.0,397.0,405.0,407.5,398.5,380.0,345.5,358.0,376.0,381.5,404.0,364.0,347.0,360.0,349.0,348.0,335.0,336.0,345.0,345.0,347.0,361.0,349.0,349.0,346.0,344.0,344.0,348.5,410.0,415.0,434.0,416.0,477.0,465.0,473.0,502.0,542.0,535.0,565.0,568.0,568.0,586.0,599.0,604.0,595.0,564.0,558.0,600.0,558.0,473.0,422.0,430.0,406.0,416.0,453.0,457.0,449.0,486.0,525.0,519.0,541.0,519.0,522.0,540.0,558.0,578.0,585.0,600.0,664.0,625.0,606.0,606.0,638.0,665.0,677.0,696.0,712.0,738.0,770.0,815.0,823.0,878.0,783.0,775.0,774.0,778.0,827.0,832.0,830.0,828.0,827.0,843.0,847.0,858.0,858.0,855.0,867.0,864.0,887.0,893.0,914.0,925.0,942.0,982.0,1002.0,1012.0,1063.0,1164.0,1128.0,1204.0,1216.0,1131.0,1064.0,1086.0,1102.0,1112.0,1166.0,1183.0,1241.0,1264.0,1267.0,1272.0,1237.0,1271.0,1352.0,1402.0,1450.0,1522.0,1741.0,1824.0,1923.0,1855.0,1990.0,1736.0,1313.0,1047.0,756.0,803.0,803.0,915.0,964.0,1045.0,1085.0,1096.0,1165.0,1092.0,1210.0,1212.0,1275.0,1334.0,1397.0,1496.0,1477.0,1549.0,1659.0,1492.0,1495.0,1503.0,1497.0,1528.0,1661.0,1639.5,1673.0,1716.0,1772.0,1696.0,1779.0,1755.0,1674.0,1703.0,1700.0,1538.0,1442.0,1515.0,1364.0,1405.0,1610.0,1617.0,1550.0,1412.0,1396.0,1391.0,1392.0,1543.0,1545.0,1541.0,1523.0,1545.0,1592.0,1560.0,1416.0,1448.0,1323.0,1331.0,1421.0,1411.0,1368.0,1361.0,1325.0,1383.0,1379.0,1404.0,1400.0,1417.0,1421.0,1471.0,1421.0,1303.0,1217.0,1193.0,1188.0,1208.0,1157.0,1093.0,1116.0,1114.0,1070.0,968.0,950.0,904.0,899.0,829.0,829.0,817.0,860.0,936.0,945.0,977.0,960.0,1033.0,1060.0,1025.0,926.0,911.0,903.0,906.0,992.0,937.0,944.0,904.0,919.0,895.0,943.0,919.0,912.0,921.0,877.0,937.0,966.0,936.0,907.0,880.0,846.0,804.0,780.0,774.0,813.0,810.0,780.0,791.0,784.0,813.0,846.0,792.0,797.0,808.0,834.0,925.0,874.0,874.0,889.0,954.0,880.0,607.0,719.0,753.0,802.0,812.0,906.0,839.0,855.0,858.0,982.0,1043.0,1084.0,1119.0,1171.0,1164.0,1040.0,1053.0,971.0,925.0,947.0,947.0,911.0,945.0,1012.0,984.0,910.0,929.0,915.0,837.0,848.0,836.0,865.0,922.0,983.0,998.0,916.0,939.0,987.0,1017.0,895.0,898.0,891.0,891.0,859.0,852.0,899.0,892.0,875.0,875.0,911.0,936.0,949.0,934.0,916.0,903.0,954.0,931.0,914.0,911.0,946.0,952.0,918.0,965.0,1051.0,1319.0,1264.0,1379.0,1546.0,1499.0,1615.0,2133.0,2012.0,2185.18],"c":[472.25,492.5,482.5,478.25,486.25,431.25,435.55,425.1,415.0,392.75,397.0,391.6,391.0,378.25,376.75,362.0,335.25,350.9,362.0,369.35,334.2,349.4,359.65,353.4,344.75,370.05,378.5,385.5,356.15,367.5,353.5,357.55,355.25,364.5,344.5,361.75,386.5,396.55,385.7,414.5,383.25,357.75,373.0,367.35,393.5,381.6,394.5,415.25,392.5,398.75,400.25,419.0,412.0,419.25,421.4,409.6,416.5,415.75,409.75,431.6,446.5,434.1,439.75,425.75,427.85,423.9,409.5,413.25,398.25,418.15,412.85,410.0,400.5,399.0,388.65,399.5,397.0,383.5,380.5,374.5,370.25,350.25,398.75,373.5,374.25,410.0,423.0,429.0,410.0,432.75,409.0,382.0,362.0,388.0,385.25,405.0,404.0,364.0,352.0,378.0,349.0,349.0,336.0,353.0,361.5,345.0,379.5,361.0,350.0,365.0,348.0,346.0,349.0,401.0,420.0,435.0,448.0,495.0,486.0,482.0,510.0,548.0,565.0,570.0,587.0,574.0,580.0,604.0,611.0,605.0,613.0,564.0,596.0,608.0,558.0,473.0,446.0,430.0,427.0,441.0,477.0,457.0,493.0,514.0,537.0,548.0,547.0,530.0,568.0,563.5,583.0,589.0,598.0,669.0,680.0,645.0,606.0,643.0,665.0,687.0,707.0,708.0,752.0,765.0,814.0,829.0,873.0,900.0,798.0,838.0,790.0,816.0,866.0,850.0,835.0,865.0,861.0,871.0,870.0,863.0,867.0,863.0,885.0,896.0,891.0,929.0,939.0,980.0,964.0,1074.0,1046.0,1080.0,1149.0,1278.0,1212.0,1227.0,1240.0,1144.0,1074.0,1160.0,1117.0,1171.0,1253.0,1246.0,1281.0,1272.0,1275.0,1292.0,1269.0,1361.0,1438.0,1443.0,1529.0,1687.0,2153.0,2032.0,1923.0,1976.0,2077.0,1753.0,1475.0,1047.0,790.0,858.0,899.0,975.0,1054.0,1125.0,1111.0,1163.0,1196.0,1186.0,1234.0,1283.0,1328.0,1440.0,1466.0,1514.0,1540.0,1641.0,1737.0,1569.0,1533.0,1555.0,1513.0,1650.0,1683.0,1651.0,1731.0,1789.0,1807.0,1775.0,1820.0,1821.0,1724.0,1782.0,1855.5,1538.0,1606.0,1515.0,1381.0,1626.0,1727.0,1643.0,1574.0,1412.0,1407.0,1419.0,1508.0,1661.0,1566.0,1617.0,1523.0,1680.0,1596.0,1583.0,1513.0,1471.0,1325.0,1442.0,1511.0,1422.0,1462.0,1367.0,1358.0,1383.0,1444.0,1422.0,1421.0,1457.0,1481.0,1476.0,1424.0,1307.0,1232.0,1214.0,1210.0,1230.0,1173.0,1121.0,1154.0,1114.0,1083.0,978.0,999.0,924.0,994.0,829.0,872.0,864.0,920.0,970.0,1060.0,977.0,1004.0,1128.0,1060.0,1031.0,979.0,918.0,907.0,987.0,1026.0,945.0,946.0,941.0,921.0,935.0,990.0,923.0,918.0,941.0,927.0,1004.0,981.0,936.0,907.0,912.0,846.0,826.0,798.0,811.0,831.0,810.0,794.0,818.0,874.0,847.0,898.0,793.0,816.0,874.0,935.0,925.0,926.0,895.0,971.0,974.0,880.0,723.0,778.0,840.0,810.0,908.0,930.0,872.0,856.0,963.0,1075.0,1087.0,1209.0,1174.0,1209.0,1182.0,1054.0,1057.0,1010.0,958.0,1016.0,947.0,962.0,1015.0,1063.0,985.0,932.0,963.0,915.0,898.0,848.0,877.0,932.0,1011.0,1065.0,998.0,939.0,986.0,1067.0,1017.0,895.0,930.0,978.0,918.0,937.0,931.0,1006.0,927.0,887.0,896.0,939.0,1028.0,1004.0,967.0,944.0,990.0,1005.0,945.0,914.0,977.0,946.0,995.0,971.0,1078.0,1358.0,1319.0,1347.0,1544.0,1594.0,1635.0,2027.0,2210.0,2236.96,2185.18],"m":[478.34,487.8,481.44,478.96,491.91,462.63,424.04,421.19,420.99,408.72,386.27,400.42,397.68,389.89,375.84,376.14,347.23,348.9,362.53,364.82,354.71,341.41,361.67,356.85,347.7,357.87,369.25,383.36,359.82,362.12,358.13,355.71,362.09,359.28,359.13,350.03,369.14,385.26,383.61,402.9,393.38,362.49,367.95,374.62,382.75,387.97,393.68,400.29,396.84,398.32,401.38,411.17,412.3,417.19,419.27,412.56,409.7,413.64,414.11,416.5,449.05,437.39,438.37,433.45,424.58,430.01,412.94,413.37,409.81,416.1,420.57,411.19,404.25,401.28,392.54,393.26,400.3,390.07,384.07,381.95,370.56,359.44,364.68,379.68,371.03,389.59,431.36,415.51,425.48,424.97,423.76,392.91,367.0,375.27,386.49,398.8,413.77,389.39,356.02,377.75,369.94,359.86,342.64,346.75,350.45,354.69,364.81,370.48,357.99,355.67,356.69,349.48,349.8,372.18,422.6,435.14,440.8,440.75,517.24,480.74,498.28,526.76,559.68,560.48,577.95,592.9,579.27,593.5,610.76,622.14,601.48,585.75,595.0,609.86,579.74,531.91,451.02,458.1,432.17,429.61,461.99,473.05,471.35,512.35,541.45,534.68,557.22,526.24,545.38,555.3,580.93,588.45,596.6,629.57,682.4,676.52,625.3,649.9,662.31,682.2,692.8,705.14,732.28,760.38,808.48,850.95,846.1,899.33,881.85,809.58,807.16,809.32,846.83,847.98,844.21,854.18,850.62,858.65,864.85,867.9,865.71,866.65,880.34,874.38,899.95,914.59,931.14,963.15,977.85,1029.05,1041.05,1041.96,1101.78,1263.86,1189.27,1229.14,1233.45,1185.67,1085.0,1182.73,1121.26,1147.32,1205.4,1219.18,1278.32,1303.33,1287.24,1304.18,1264.16,1306.95,1409.52,1448.8,1487.37,1582.14,1995.1,2058.32,1989.82,2054.5,2040.62,1916.0,1491.9,1225.41,914.26,842.25,844.86,952.9,1038.1,1082.32,1165.1,1133.68,1221.0,1161.26,1244.65,1289.68,1333.36,1402.19,1448.1,1563.8,1521.0,1600.04,1717.5,1630.16,1552.45,1526.77,1541.12,1591.36,1688.52,1696.25,1711.81,1787.05,1826.0,1767.98,1794.22,1787.65,1771.55,1757.19,1805.93,1755.73,1535.33,1596.05,1465.12,1507.43,1658.38,1657.91,1589.26,1469.45,1446.53,1427.0,1450.82,1617.9,1636.17,1576.68,1586.68,1643.27,1674.95,1582.8,1489.0,1478.05,1431.72,1399.91,1492.76,1461.95,1413.57,1422.38,1357.3,1421.91,1408.55,1450.62,1431.15,1455.78,1452.43,1491.35,1450.4,1365.27,1261.0,1209.75,1216.76,1243.14,1200.55,1140.55,1151.15,1142.0,1091.23,1016.3,984.55,969.09,975.59,889.48,860.19,853.45,918.71,967.62,992.81,1035.85,984.32,1086.24,1127.14,1048.55,960.43,954.64,919.25,970.9,1006.4,964.35,961.17,929.52,933.14,917.0,971.91,969.19,921.59,932.91,907.42,987.77,990.8,954.95,924.55,904.38,884.81,830.73,806.0,804.55,828.28,847.18,793.05,807.91,817.4,842.76,887.4,834.62,808.6,843.43,859.43,944.71,896.13,902.62,923.0,988.55,965.05,765.5,757.85,795.05,822.05,862.22,941.75,910.14,876.0,914.33,1027.19,1089.5,1206.85,1180.48,1207.6,1217.95,1125.27,1089.0,1009.05,976.05,1017.19,1036.0,945.2,994.75,1049.4,1045.61,965.21,958.81,951.2,871.43,911.14,877.9,911.62,988.73,1012.15,1054.81,956.6,970.22,1049.5,1060.2,974.95,947.95,924.14,921.81,892.45,908.27,945.05,926.73,895.0,909.75,941.95,1014.95,985.15,981.57,944.95,963.48,1000.43,962.1,935.8,948.55,980.5,980.57,959.65,1017.45,1244.29,1389.39,1332.75,1428.32,1615.43,1567.45,1856.14,2419.9,2124.27,2185.18],"n":[19,21,21,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,21,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,21,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,22,18,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,23,20,19,22,22,21,22,21,22,21,20,20,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,18,20,22,21,22,22,21,22,20,21,21,22,19,22,19,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,21,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,21,20,21,21,22,22,20,23,22,19,22,20,21,20,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,20,23,19,21,20,21,22,21,21,22,20,21,20,23,18,20,22,21,22,21,22,22,19,22,21,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,23,1]},"Silver":{"t":["1968-01-01","1968-02-01","1968-03-01","1968-04-01","1968-05-01","1968-06-01","1968-07-01","1968-08-01","1968-09-01","1968-10-01","1968-11-01","1968-12-01","1969-01-01","1969-02-01","1969-03-01","1969-04-01","1969-05-01","1969-06-01","1969-07-01","1969-08-01","1969-09-01","1969-10-01","1969-11-01","1969-12-01","1970-01-01","1970-02-01","1970-03-01","1970-04-01","1970-05-01","1970-06-01","1970-07-01","1970-08-01","1970-09-01","1970-10-01","1970-11-01","1970-12-01","1971-01-01","1971-02-01","1971-03-01","1971-04-01","1971-05-01","1971-06-01","1971-07-01","1971-08-01","1971-09-01","1971-10-01","1971-11-01","1971-12-01","1972-01-01","1972-02-01","1972-03-01","1972-04-01","1972-05-01","1972-06-01","1972-07-01","1972-08-01","1972-09-01","1972-10-01","1972-11-01","1972-12-01","1973-01-01","1973-02-01","1973-03-01","1973-04-01","1973-05-01","1973-06-01","1973-07-01","1973-08-01","1973-09-01","1973-10-01","1973-11-01","1973-12-01","1974-01-01","1974-02-01","1974-03-01","1974-04-01","1974-05-01","1974-06-01","1974-07-01","1974-08-01","1974-09-01","1974-10-01","1974-11-01","1974-12-01","1975-01-01","1975-02-01","1975-03-01","1975-04-01","1975-05-01","1975-06-01","1975-07-01","1975-08-01","1975-09-01","1975-10-01","1975-11-01","1975-12-01","1976-01-01","1976-02-01","1976-03-01","1976-04-01","1976-05-01","1976-06-01","1976-07-01","1976-08-01","1976-09-01","1976-10-01","1976-11-01","1976-12-01","1977-01-01","1977-02-01","1977-03-01","1977-04-01","1977-05-01","1977-06-01","1977-07-01","1977-08-01","1977-09-01","1977-10-01","1977-11-01","1977-12-01","1978-01-01","1978-02-01","1978-03-01","1978-04-01","1978-05-01","1978-06-01","1978-07-01","1978-08-01","1978-09-01","1978-10-01","1978-11-01","1978-12-01","1979-01-01","1979-02-01","1979-03-01","1979-04-01","1979-05-01","1979-06-01","1979-07-01","1979-08-01","1979-09-01","1979-10-01","1979-11-01","1979-12-01","1980-01-01","1980-02-01","1980-03-01","1980-04-01","1980-05-01","1980-06-01","1980-07-01","1980-08-01","1980-09-01","1980-10-01","1980-11-01","1980-12-01","1981-01-01","1981-02-01","1981-03-01","1981-04-01","1981-05-01","1981-06-01","1981-07-01","1981-08-01","1981-09-01","1981-10-01","1981-11-01","1981-12-01","1982-01-01","1982-02-01","1982-03-01","1982-04-01","1982-05-01","1982-06-01","1982-07-01","1982-08-01","1982-09-01","1982-10-01","1982-11-01","1982-12-01","1983-01-01","1983-02-01","1983-03-01","1983-04-01","1983-05-01","1983-06-01","1983-07-01","1983-08-01","1983-09-01","1983-10-01","1983-11-01","1983-12-01","1984-01-01","1984-02-01","1984-03-01","1984-04-01","1984-05-01","1984-06-01","1984-07-01","1984-08-01","1984-09-01","1984-10-01","1984-11-01","1984-12-01","1985-01-01","1985-02-01","1985-03-01","1985-04-01","1985-05-01","1985-06-01","1985-07-01","1985-08-01","1985-09-01","1985-10-01","1985-11-01","1985-12-01","1986-01-01","1986-02-01","1986-03-01","1986-04-01","1986-05-01","1986-06-01","1986-07-01","1986-08-01","1986-09-01","1986-10-01","1986-11-01","1986-12-01","1987-01-01","1987-02-01","1987-03-01","1987-04-01","1987-05-01","1987-06-01","1987-07-01","1987-08-01","1987-09-01","1987-10-01","1987-11-01","1987-12-01","1988-01-01","1988-02-01","1988-03-01","1988-04-01","1988-05-01","1988-06-01","1988-07-01","1988-08-01","1988-09-01","1988-10-01","1988-11-01","1988-12-01","1989-01-01","1989-02-01","1989-03-01","1989-04-01","1989-05-01","1989-06-01","1989-07-01","1989-08-01","1989-09-01","1989-10-01","1989-11-01","1989-12-01","1990-01-01","1990-02-01","1990-03-01","1990-04-01","1990-05-01","1990-06-01","1990-07-01","1990-08-01","1990-09-01","1990-10-01","1990-11-01","1990-12-01","1991-01-01","1991-02-01","1991-03-01","1991-04-01","1991-05-01","1991-06-01","1991-07-01","1991-08-01","1991-09-01","1991-10-01","1991-11-01","1991-12-01","1992-01-01","1992-02-01","1992-03-01","1992-04-01","1992-05-01","1992-06-01","1992-07-01","1992-08-01","1992-09-01","1992-10-01","1992-11-01","1992-12-01","1993-01-01","1993-02-01","1993-03-01","1993-04-01","1993-05-01","1993-06-01","1993-07-01","1993-08-01","1993-09-01","1993-10-01","1993-11-01","1993-12-01","1994-01-01","1994-02-01","1994-03-01","1994-04-01","1994-05-01","1994-06-01","1994-07-01","1994-08-01","1994-09-01","1994-10-01","1994-11-01","1994-12-01","1995-01-01","1995-02-01","1995-03-01","1995-04-01","1995-05-01","1995-06-01","1995-07-01","1995-08-01","1995-09-01","1995-10-01","1995-11-01","1995-12-01","1996-01-01","1996-02-01","1996-03-01","1996-04-01","1996-05-01","1996-06-01","1996-07-01","1996-08-01","1996-09-01","1996-10-01","1996-11-01","1996-12-01","1997-01-01","1997-02-01","1997-03-01","1997-04-01","1997-05-01","1997-06-01","1997-07-01","1997-08-01","1997-09-01","1997-10-01","1997-11-01","1997-12-01","1998-01-01","1998-02-01","1998-03-01","1998-04-01","1998-05-01","1998-06-01","1998-07-01","1998-08-01","1998-09-01","1998-10-01","1998-11-01","1998-12-01","1999-01-01","1999-02-01","1999-03-01","1999-04-01","1999-05-01","1999-06-01","1999-07-01","1999-08-01","1999-09-01","1999-10-01","1999-11-01","1999-12-01","2000-01-01","2000-02-01","2000-03-01","2000-04-01","2000-05-01","2000-06-01","2000-07-01","2000-08-01","2000-09-01","2000-10-01","2000-11-01","2000-12-01","2001-01-01","2001-02-01","2001-03-01","2001-04-01","2001-05-01","2001-06-01","2001-07-01","2001-08-01","2001-09-01","2001-10-01","2001-11-01","2001-12-01","2002-01-01","2002-02-01","2002-03-01","2002-04-01","2002-05-01","2002-06-01","2002-07-01","2002-08-01","2002-09-01","2002-10-01","2002-11-01","2002-12-01","2003-01-01","2003-02-01","2003-03-01","2003-04-01","2003-05-01","2003-06-01","2003-07-01","2003-08-01","2003-09-01","2003-10-01","2003-11-01","2003-12-01","2004-01-01","2004-02-01","2004-03-01","2004-04-01","2004-05-01","2004-06-01","2004-07-01","2004-08-01","2004-09-01","2004-10-01","2004-11-01","2004-12-01","2005-01-01","2005-02-01","2005-03-01","2005-04-01","2005-05-01","2005-06-01","2005-07-01","2005-08-01","2005-09-01","2005-10-01","2005-11-01","2005-12-01","2006-01-01","2006-02-01","2006-03-01","2006-04-01","2006-05-01","2006-06-01","2006-07-01","2006-08-01","2006-09-01","2006-10-01","2006-11-01","2006-12-01","2007-01-01","2007-02-01","2007-03-01","2007-04-01","2007-05-01","2007-06-01","2007-07-01","2007-08-01","2007-09-01","2007-10-01","2007-11-01","2007-12-01","2008-01-01","2008-02-01","2008-03-01","2008-04-01","2008-05-01","2008-06-01","2008-07-01","2008-08-01","2008-09-01","2008-10-01","2008-11-01","2008-12-01","2009-01-01","2009-02-01","2009-03-01","2009-04-01","2009-05-01","2009-06-01","2009-07-01","2009-08-01","2009-09-01","2009-10-01","2009-11-01","2009-12-01","2010-01-01","2010-02-01","2010-03-01","2010-04-01","2010-05-01","2010-06-01","2010-07-01","2010-08-01","2010-09-01","2010-10-01","2010-11-01","2010-12-01","2011-01-01","2011-02-01","2011-03-01","2011-04-01","2011-05-01","2011-06-01","2011-07-01","2011-08-01","2011-09-01","2011-10-01","2011-11-01","2011-12-01","2012-01-01","2012-02-01","2012-03-01","2012-04-01","2012-05-01","2012-06-01","2012-07-01","2012-08-01","2012-09-01","2012-10-01","2012-11-01","2012-12-01","2013-01-01","2013-02-01","2013-03-01","2013-04-01","2013-05-01","2013-06-01","2013-07-01","2013-08-01","2013-09-01","2013-10-01","2013-11-01","2013-12-01","2014-01-01","2014-02-01","2014-03-01","2014-04-01","2014-05-01","2014-06-01","2014-07-01","2014-08-01","2014-09-01","2014-10-01","2014-11-01","2014-12-01","2015-01-01","2015-02-01","2015-03-01","2015-04-01","2015-05-01","2015-06-01","2015-07-01","2015-08-01","2015-09-01","2015-10-01","2015-11-01","2015-12-01","2016-01-01","2016-02-01","2016-03-01","2016-04-01","2016-05-01","2016-06-01","2016-07-01","2016-08-01","2016-09-01","2016-10-01","2016-11-01","2016-12-01","2017-01-01","2017-02-01","2017-03-01","2017-04-01","2017-05-01","2017-06-01","2017-07-01","2017-08-01","2017-09-01","2017-10-01","2017-11-01","2017-12-01","2018-01-01","2018-02-01","2018-03-01","2018-04-01","2018-05-01","2018-06-01","2018-07-01","2018-08-01","2018-09-01","2018-10-01","2018-11-01","2018-12-01","2019-01-01","2019-02-01","2019-03-01","2019-04-01","2019-05-01","2019-06-01","2019-07-01","2019-08-01","2019-09-01","2019-10-01","2019-11-01","2019-12-01","2020-01-01","2020-02-01","2020-03-01","2020-04-01","2020-05-01","2020-06-01","2020-07-01","2020-08-01","2020-09-01","2020-10-01","2020-11-01","2020-12-01","2021-01-01","2021-02-01","2021-03-01","2021-04-01","2021-05-01","2021-06-01","2021-07-01","2021-08-01","2021-09-01","2021-10-01","2021-11-01","2021-12-01","2022-01-01","2022-02-01","2022-03-01","2022-04-01","2022-05-01","2022-06-01","2022-07-01","2022-08-01","2022-09-01","2022-10-01","2022-11-01","2022-12-01","2023-01-01","2023-02-01","2023-03-01","2023-04-01","2023-05-01","2023-06-01","2023-07-01","2023-08-01","2023-09-01","2023-10-01","2023-11-01","2023-12-01","2024-01-01","2024-02-01","2024-03-01","2024-04-01","2024-05-01","2024-06-01","2024-07-01","2024-08-01","2024-09-01","2024-10-01","2024-11-01","2024-12-01","2025-01-01","2025-02-01","2025-03-01","2025-04-01","2025-05-01","2025-06-01","2025-07-01","2025-08-01","2025-09-01","2025-10-01","2025-11-01","2025-12-01","2026-01-01","2026-02-01","2026-03-01"],"o":[2.17,2.0,2.2,2.26,2.36,2.43,2.51,2.23,2.24,2.14,1.9,1.94,1.96,1.99,1.81,1.81,1.78,1.77,1.59,1.61,1.69,1.86,2.0,1.91,1.8,1.89,1.89,1.88,1.73,1.65,1.62,1.78,1.85,1.72,1.79,1.61,1.65,1.59,1.6,1.71,1.68,1.61,1.6,1.58,1.48,1.38,1.29,1.32,1.37,1.53,1.48,1.6,1.6,1.54,1.56,1.79,1.9,1.74,1.83,1.87,2.04,2.03,2.49,2.17,2.15,2.61,2.7,2.92,2.61,2.71,2.83,2.92,3.28,4.04,5.73,5.32,5.4,4.74,4.69,4.95,4.23,4.43,4.89,4.61,4.44,4.13,4.5,4.28,4.3,4.43,4.58,5.0,4.53,4.5,4.2,4.12,4.16,3.99,4.19,4.12,4.41,4.68,4.82,4.47,4.09,4.36,4.3,4.24,4.43,4.47,4.72,4.84,4.77,4.58,4.52,4.51,4.47,4.66,4.88,4.78,4.87,5.0,5.01,5.42,4.98,5.4,5.27,5.72,5.52,5.67,6.13,5.95,6.08,6.64,7.62,7.46,8.02,8.63,8.7,9.1,10.9,17.09,16.32,19.88,39.95,35.31,34.75,16.99,12.0,14.65,17.1,15.61,15.99,21.75,18.83,18.9,15.8,12.86,11.6,12.03,11.13,10.67,8.45,8.24,9.15,9.32,9.17,8.07,8.06,8.12,7.74,7.11,6.9,6.1,5.71,6.89,7.69,8.23,10.18,10.14,11.06,14.3,10.68,10.97,12.12,12.74,11.56,11.8,12.16,10.4,8.37,9.58,8.96,8.7,9.62,9.74,8.93,9.36,8.29,7.01,7.32,7.45,7.18,7.0,6.25,6.29,5.61,6.52,6.15,6.21,6.09,6.25,6.22,6.0,6.07,6.1,5.81,6.04,5.65,5.18,5.11,5.21,5.09,5.05,5.21,5.57,5.62,5.5,5.36,5.53,5.43,6.26,7.93,7.34,7.3,8.6,7.45,7.55,7.0,6.99,6.63,6.54,6.21,6.73,6.36,6.71,6.69,6.86,6.55,6.12,6.28,6.16,6.07,5.82,5.84,5.79,5.65,5.16,5.19,5.25,5.05,5.23,5.17,5.71,5.21,5.21,5.14,4.94,4.95,5.07,4.91,4.81,4.85,4.79,4.18,4.13,4.16,3.88,3.75,3.94,3.97,4.16,4.45,4.05,3.83,4.15,4.1,4.09,3.87,4.18,4.09,4.15,4.01,4.03,4.05,3.94,3.75,3.75,3.76,3.76,3.66,3.66,3.58,3.86,4.27,4.62,4.55,5.42,4.83,4.06,4.29,4.43,5.28,5.12,5.33,5.64,5.29,5.54,5.36,5.33,5.4,5.53,5.22,4.92,4.84,4.68,4.47,5.3,5.7,5.26,5.08,5.03,5.34,5.42,5.33,5.22,5.17,5.59,5.53,5.52,5.33,5.38,5.05,5.15,5.18,4.85,4.8,4.73,4.77,4.88,5.31,5.04,4.67,4.73,4.64,4.47,4.66,5.18,4.78,5.24,5.94,6.25,6.61,6.46,6.17,5.14,5.53,5.41,4.73,5.36,5.04,4.88,5.0,5.28,5.62,5.01,5.33,4.88,5.31,5.36,5.2,5.67,5.2,5.19,5.3,5.24,5.12,5.04,5.0,4.89,5.0,4.98,4.94,4.88,4.75,4.68,4.59,4.8,4.51,4.29,4.34,4.39,4.3,4.24,4.2,4.58,4.24,4.18,4.59,4.25,4.5,4.67,4.54,5.05,4.8,4.54,4.47,4.52,4.54,4.43,4.74,4.84,4.61,4.44,4.66,4.5,4.55,5.12,5.16,5.12,5.06,5.36,5.99,6.21,6.73,7.94,6.1,6.17,5.88,6.64,6.73,6.84,7.24,7.71,6.39,6.7,7.26,7.11,6.85,7.38,7.02,7.25,6.86,7.38,7.54,8.31,9.04,9.77,9.8,11.59,13.92,12.05,11.28,11.36,12.75,11.58,12.36,13.85,13.01,13.58,14.29,13.34,13.45,13.53,12.47,12.77,12.1,13.78,14.36,13.86,14.93,17.19,20.16,16.74,16.64,16.86,17.56,17.59,13.58,12.28,10.05,9.91,11.08,12.43,13.14,12.98,12.15,15.86,13.65,14.29,14.74,16.55,16.58,18.72,17.17,16.23,16.5,17.69,18.71,18.3,18.65,18.11,19.47,21.95,24.91,28.74,30.67,28.32,34.37,37.63,43.61,37.95,33.85,39.31,41.47,31.05,32.97,33.28,28.78,33.8,34.56,32.42,30.78,27.38,27.36,27.87,31.74,34.35,32.66,33.42,30.87,31.43,28.01,27.96,23.97,22.43,19.44,19.72,23.97,21.7,21.75,19.75,19.94,19.27,21.46,19.8,19.06,18.81,21.08,20.34,19.49,17.04,16.15,15.73,15.71,17.22,16.63,16.56,16.17,16.61,15.63,14.73,14.68,14.55,15.4,14.21,14.0,14.33,14.99,15.38,17.49,15.95,19.24,20.51,18.65,19.18,18.24,16.3,15.95,17.6,18.33,18.16,16.95,17.13,16.48,16.74,17.5,16.58,16.94,16.42,17.06,17.19,16.32,16.52,16.25,16.42,15.98,15.47,14.53,14.55,14.45,14.38,15.44,16.01,15.56,15.07,14.88,14.71,15.26,16.0,18.35,17.11,18.12,16.88,17.93,17.77,16.91,14.02,14.85,18.16,18.22,24.23,28.89,23.62,23.98,23.54,27.27,29.59,26.89,24.32,26.82,28.21,26.26,25.41,23.92,22.09,23.86,22.86,22.89,22.88,24.64,24.69,22.63,21.61,19.73,20.41,17.77,19.41,20.0,22.14,24.3,23.5,21.0,23.93,24.77,23.49,22.77,24.52,24.64,21.62,22.67,25.16,23.95,22.67,22.72,25.65,26.48,30.37,29.25,28.88,28.62,31.36,32.8,30.45,29.41,31.29,31.52,33.97,32.12,33.24,36.51,36.49,40.58,47.28,48.77,57.49,74.22,81.97,86.21],"h":[2.23,2.1,2.49,2.4,2.55,2.58,2.51,2.33,2.27,2.14,2.1,2.04,2.04,1.99,1.93,1.83,1.85,1.77,1.68,1.71,1.89,1.95,2.0,1.92,1.92,1.92,1.93,1.89,1.75,1.69,1.78,1.86,1.87,1.8,1.82,1.67,1.71,1.62,1.69,1.75,1.7,1.64,1.6,1.63,1.5,1.38,1.34,1.43,1.52,1.55,1.56,1.6,1.6,1.59,1.84,1.91,1.91,1.85,1.86,2.03,2.05,2.46,2.49,2.25,2.55,2.73,2.96,2.92,2.78,3.0,2.96,3.26,4.01,6.76,5.73,5.62,6.02,5.2,5.03,4.95,4.25,5.15,5.06,4.78,4.45,4.68,4.5,4.43,4.74,4.58,5.14,5.21,4.58,4.54,4.45,4.25,4.27,4.26,4.3,4.57,4.67,4.94,5.08,4.47,4.45,4.36,4.57,4.39,4.53,4.73,4.97,4.89,4.79,4.58,4.63,4.58,4.64,4.88,4.97,4.8,5.05,5.05,5.48,5.42,5.47,5.45,5.6,5.74,5.73,6.26,6.13,6.03,6.71,7.85,7.73,7.65,8.95,8.82,9.58,10.39,18.3,18.1,19.0,32.2,49.45,40.25,36.31,17.6,13.98,17.85,17.46,16.23,23.54,21.75,20.1,18.9,16.3,13.9,13.31,12.33,11.42,10.67,9.02,9.72,11.24,9.69,9.17,8.82,8.28,8.66,7.93,7.61,6.9,6.1,7.21,8.25,9.45,10.46,10.58,11.11,13.82,14.67,11.25,12.42,13.54,12.74,12.55,12.77,12.38,10.56,9.81,9.81,8.96,9.87,10.11,9.74,9.2,9.38,8.29,7.92,7.65,7.61,7.85,7.1,6.33,6.32,6.66,6.75,6.56,6.42,6.33,6.4,6.22,6.36,6.25,6.1,6.31,6.05,5.79,5.48,5.23,5.42,5.11,5.49,6.03,5.82,5.84,5.5,5.73,5.56,6.3,10.93,9.44,7.93,8.32,8.73,7.82,8.31,7.25,7.04,7.0,6.62,6.75,6.73,6.76,7.28,7.82,6.86,6.63,6.41,6.52,6.19,6.21,5.97,6.15,5.88,5.67,5.42,5.36,5.29,5.32,5.25,5.88,5.71,5.33,5.36,5.14,5.18,5.24,5.09,4.96,5.22,4.93,4.79,4.26,4.19,4.25,3.88,4.17,4.12,4.14,4.57,4.53,4.05,4.25,4.22,4.14,4.09,4.33,4.22,4.17,4.15,4.12,4.12,4.07,3.98,3.84,3.81,3.91,3.77,3.72,3.77,3.89,4.36,4.74,4.62,5.3,5.42,4.83,4.51,4.73,5.14,5.34,5.46,5.75,5.64,5.73,5.61,5.41,5.38,5.71,5.66,5.32,4.93,4.92,4.82,5.16,5.92,6.04,5.51,5.36,5.8,5.56,5.44,5.43,5.26,5.62,5.83,5.69,5.54,5.48,5.38,5.15,5.25,5.2,5.04,4.93,4.89,5.03,5.25,5.31,5.04,4.87,4.9,4.65,4.72,5.17,5.28,5.47,6.27,6.16,7.81,6.61,6.73,6.24,5.46,5.83,5.47,5.38,5.36,5.13,5.03,5.36,5.75,5.62,5.44,5.47,5.22,5.45,5.52,5.71,5.71,5.25,5.33,5.37,5.45,5.13,5.13,5.08,5.09,5.01,4.98,4.96,4.88,4.75,4.75,4.82,4.8,4.51,4.43,4.62,4.45,4.31,4.24,4.62,4.64,4.24,4.54,4.84,4.58,4.67,4.7,5.04,5.05,5.1,4.71,4.65,4.52,4.59,4.74,4.91,4.93,4.68,4.62,4.87,4.62,5.1,5.12,5.32,5.18,5.38,5.96,6.65,6.82,7.83,8.29,6.17,6.18,6.71,6.82,6.76,7.44,7.75,8.04,6.81,7.55,7.57,7.29,7.18,7.53,7.14,7.25,7.53,7.86,8.29,9.22,9.91,9.82,11.76,14.31,14.94,12.37,11.75,12.6,13.15,12.13,13.68,14.05,13.38,14.58,14.29,14.09,13.48,13.71,13.34,13.1,13.65,14.41,15.82,14.76,16.76,19.62,20.92,18.56,18.14,17.65,19.3,17.59,13.58,12.28,10.41,11.29,12.51,14.39,13.76,12.98,15.52,15.97,14.06,15.07,17.38,17.99,18.76,19.18,18.84,16.79,17.54,18.62,19.64,19.37,18.65,19.11,22.07,24.49,28.55,30.7,30.67,33.49,37.87,48.7,43.61,37.95,40.81,43.49,42.71,35.42,34.72,33.28,33.6,37.23,35.21,32.97,30.78,29.36,28.33,30.81,34.71,34.96,34.28,33.42,32.23,32.01,29.25,27.96,24.25,22.62,20.39,24.74,24.21,22.74,21.94,20.39,20.29,22.05,21.46,20.24,19.87,21.12,21.5,20.35,19.49,17.64,16.66,17.07,18.23,17.59,17.14,16.86,17.7,16.7,15.64,15.55,15.26,16.18,15.4,14.49,14.38,15.65,15.94,17.86,17.51,18.36,20.47,20.71,19.93,19.18,18.81,17.13,17.29,18.34,18.33,18.56,17.31,17.6,16.79,17.6,18.21,17.41,17.14,16.86,17.52,17.19,16.64,17.2,16.76,17.23,16.2,15.48,14.53,14.76,14.82,15.46,16.07,16.04,15.56,15.26,14.93,15.4,16.54,18.48,19.3,18.12,18.18,18.05,18.44,18.77,17.48,15.57,17.59,18.27,24.38,28.33,28.89,25.06,25.78,26.48,27.52,29.59,26.89,26.3,28.48,28.21,26.61,25.67,24.7,24.38,25.27,23.09,24.32,25.32,26.18,25.91,22.91,22.25,20.07,20.6,19.93,20.93,21.95,23.95,24.3,24.43,23.89,26.02,25.84,24.32,25.18,24.62,24.64,23.21,25.02,25.16,23.95,23.23,25.43,29.02,32.01,30.43,31.05,29.9,32.48,34.51,32.84,31.9,31.61,33.1,34.4,33.97,33.37,37.16,39.32,38.94,46.95,54.1,53.91,74.83,118.45,90.78,86.21],"l":[1.96,1.92,2.12,2.1,2.25,2.42,2.23,2.06,2.17,1.84,1.9,1.94,1.96,1.77,1.8,1.77,1.75,1.56,1.57,1.6,1.69,1.81,1.87,1.72,1.8,1.87,1.86,1.72,1.57,1.61,1.6,1.73,1.7,1.71,1.65,1.58,1.56,1.57,1.6,1.67,1.6,1.57,1.54,1.5,1.37,1.29,1.27,1.32,1.37,1.47,1.48,1.54,1.55,1.54,1.55,1.79,1.69,1.74,1.79,1.87,1.96,2.03,2.15,2.1,2.12,2.46,2.67,2.56,2.52,2.7,2.76,2.92,3.27,4.04,5.01,4.34,4.62,4.48,3.79,4.12,3.83,4.43,4.21,4.17,3.99,4.11,4.24,4.08,4.3,4.41,4.51,4.63,4.39,4.18,4.2,3.93,3.83,3.94,4.03,4.09,4.36,4.63,4.44,4.11,4.09,4.13,4.25,4.24,4.31,4.45,4.72,4.7,4.54,4.33,4.43,4.36,4.45,4.63,4.7,4.66,4.82,4.85,4.99,4.92,4.98,5.25,5.24,5.35,5.47,5.67,5.67,5.84,5.93,6.62,7.13,7.33,7.89,8.29,8.6,8.78,10.9,14.9,16.02,19.01,32.75,30.0,13.49,13.56,10.89,14.17,15.36,15.48,15.99,18.64,17.5,14.3,13.05,12.47,11.26,10.95,10.24,8.3,8.2,8.24,8.77,8.93,8.03,8.05,7.72,7.84,6.96,7.01,6.36,4.9,5.53,6.24,7.69,7.97,9.01,10.13,11.06,7.54,10.23,10.97,12.12,11.09,11.42,11.48,11.24,8.59,8.37,8.64,7.9,8.63,9.39,8.96,8.59,8.36,6.92,7.01,6.98,7.11,7.05,6.22,5.83,5.45,5.52,6.12,6.0,6.06,5.89,6.11,5.89,6.0,6.04,5.76,5.75,5.67,5.55,5.03,4.85,5.04,4.97,5.05,5.21,5.5,5.25,5.28,5.36,5.39,5.43,6.26,7.3,6.76,7.2,7.53,7.36,6.88,6.29,6.63,6.5,6.14,6.2,6.36,6.32,6.65,6.69,6.46,6.1,6.12,6.07,6.05,5.85,5.79,5.76,5.64,5.09,5.16,5.15,5.07,5.05,5.04,5.16,5.22,5.16,5.12,4.96,4.94,4.95,4.8,4.8,4.81,4.75,4.07,4.09,3.95,3.81,3.55,3.75,3.87,3.93,4.15,4.05,3.81,3.83,4.05,4.01,3.82,3.87,4.06,4.02,3.94,4.01,3.99,3.91,3.65,3.69,3.71,3.69,3.66,3.65,3.57,3.56,3.79,4.23,4.22,4.55,4.59,3.92,4.05,4.21,4.43,4.91,5.12,5.18,5.09,5.07,5.25,5.16,5.05,5.38,5.31,5.08,4.64,4.62,4.49,4.42,5.21,5.28,5.23,5.07,5.03,5.21,5.32,5.18,5.11,5.17,5.46,5.35,5.25,5.29,4.98,4.97,5.04,4.85,4.83,4.73,4.71,4.65,4.8,5.09,4.64,4.66,4.71,4.22,4.33,4.59,4.79,4.78,5.24,5.53,6.05,5.8,6.07,4.96,5.09,5.27,4.79,4.73,4.8,4.92,4.69,4.91,5.28,5.03,4.88,4.93,4.88,5.03,5.08,5.1,5.17,5.05,5.07,5.09,5.08,4.93,4.94,4.9,4.89,4.92,4.76,4.82,4.72,4.62,4.57,4.5,4.42,4.33,4.29,4.32,4.3,4.21,4.14,4.17,4.19,4.07,4.14,4.24,4.25,4.48,4.45,4.52,4.82,4.65,4.42,4.46,4.29,4.43,4.43,4.73,4.49,4.38,4.37,4.56,4.48,4.55,4.87,4.97,4.82,4.93,5.36,5.97,6.08,6.59,5.57,5.5,5.63,5.88,6.48,6.13,6.74,7.04,6.68,6.39,6.49,6.92,6.94,6.85,7.07,6.88,6.74,6.86,7.34,7.42,8.28,8.83,9.2,9.79,11.59,12.16,9.72,10.52,11.36,10.7,10.82,12.36,12.46,12.21,13.29,12.61,13.28,12.87,12.26,12.4,11.67,12.1,13.21,14.23,13.74,14.93,16.48,17.53,16.47,16.19,16.31,17.12,12.82,10.66,8.88,9.17,9.41,10.51,12.37,12.61,11.98,12.15,13.77,12.47,13.59,14.74,16.21,16.35,16.92,16.29,15.14,16.5,17.5,17.63,17.36,17.55,17.88,19.45,21.95,24.73,28.41,26.68,28.27,33.88,37.63,32.5,33.96,33.85,38.29,28.16,28.69,30.9,26.16,28.78,33.18,31.54,30.7,27.25,26.72,26.67,27.25,31.74,31.67,30.91,29.75,29.32,28.72,28.01,22.91,21.66,18.61,19.1,19.27,21.44,20.49,19.71,19.05,19.31,19.27,19.68,19.06,18.85,18.76,20.46,19.32,17.11,16.2,15.28,15.71,15.71,16.2,15.47,15.83,16.17,15.7,14.49,14.27,14.35,14.43,13.98,13.71,13.58,14.26,14.82,14.96,16.06,15.95,19.24,18.5,18.65,17.33,16.31,15.74,15.95,17.28,16.89,17.41,16.22,16.47,15.22,16.13,16.82,16.58,16.57,15.71,16.98,16.34,16.25,16.27,16.25,16.03,15.26,14.61,14.12,14.32,13.97,14.38,15.26,15.58,15.07,14.8,14.38,14.7,15.03,16.0,17.25,17.11,16.73,16.62,17.47,17.18,12.01,14.02,14.75,17.09,17.93,24.23,22.22,23.02,22.15,23.54,24.86,26.4,24.0,24.32,26.3,25.77,24.8,23.2,21.52,22.09,22.86,21.8,22.24,22.36,24.64,23.16,20.84,20.41,18.27,17.95,17.77,18.39,18.92,22.14,23.0,20.52,20.09,23.93,23.0,22.34,22.71,22.41,22.55,21.05,22.07,22.73,22.2,22.09,22.72,25.65,26.23,28.84,27.75,26.93,28.08,30.67,29.99,28.8,29.41,31.14,31.52,30.18,32.02,33.24,36.22,36.49,40.52,46.44,47.61,57.44,74.22,73.48,86.21],"c":[1.96,2.08,2.28,2.4,2.48,2.5,2.29,2.24,2.17,1.93,1.97,1.95,2.0,1.82,1.82,1.78,1.77,1.56,1.63,1.67,1.88,1.95,1.89,1.79,1.91,1.9,1.88,1.72,1.63,1.61,1.77,1.84,1.7,1.78,1.65,1.63,1.59,1.59,1.69,1.69,1.6,1.57,1.59,1.5,1.38,1.31,1.33,1.37,1.5,1.47,1.56,1.57,1.55,1.56,1.83,1.91,1.74,1.8,1.85,2.03,2.01,2.43,2.2,2.15,2.55,2.67,2.76,2.6,2.7,2.83,2.92,3.26,3.87,5.68,5.35,5.62,4.92,4.61,4.79,4.12,4.25,4.86,4.46,4.47,4.15,4.42,4.28,4.43,4.53,4.57,5.0,4.63,4.44,4.19,4.23,4.18,4.01,4.16,4.11,4.43,4.62,4.83,4.54,4.11,4.39,4.27,4.28,4.36,4.45,4.73,4.83,4.71,4.56,4.51,4.52,4.45,4.64,4.85,4.74,4.76,4.95,4.97,5.34,5.0,5.47,5.28,5.57,5.53,5.67,6.26,5.91,6.02,6.71,7.69,7.45,7.65,8.77,8.54,9.08,10.32,16.25,16.6,19.0,32.2,35.28,35.52,13.49,13.83,13.7,16.75,15.78,16.06,20.5,18.88,18.42,15.5,13.15,12.53,12.33,11.06,10.59,8.3,8.51,9.15,8.95,9.12,8.27,8.15,8.28,7.84,7.06,7.06,6.36,5.73,6.63,7.73,8.19,9.87,9.54,10.87,13.82,11.7,10.5,11.96,13.54,11.6,12.14,11.99,11.24,8.74,9.81,8.91,8.43,9.64,9.65,8.96,9.12,8.39,7.11,7.45,7.43,7.2,7.05,6.29,6.33,5.71,6.66,6.32,6.08,6.11,6.33,6.25,6.05,6.14,6.15,5.8,6.1,5.67,5.62,5.11,5.21,5.04,5.04,5.17,5.52,5.61,5.38,5.28,5.55,5.47,6.3,8.12,7.68,7.14,8.32,7.55,7.64,6.88,7.25,6.7,6.55,6.14,6.75,6.46,6.6,6.65,6.8,6.46,6.17,6.31,6.07,6.05,5.85,5.86,5.77,5.64,5.22,5.17,5.15,5.07,5.28,5.23,5.57,5.22,5.21,5.12,4.97,4.94,5.07,4.84,4.86,4.83,4.79,4.22,4.09,4.19,3.83,3.68,3.84,3.93,4.13,4.45,4.07,3.81,4.13,4.09,4.07,3.86,4.13,4.12,4.12,3.98,4.06,4.03,3.95,3.72,3.77,3.76,3.73,3.67,3.71,3.57,3.89,4.3,4.71,4.58,5.3,4.84,4.03,4.4,4.47,5.12,5.06,5.24,5.74,5.28,5.5,5.25,5.29,5.36,5.62,5.34,5.08,4.85,4.7,4.49,5.16,5.83,5.29,5.33,5.1,5.32,5.53,5.36,5.18,5.14,5.52,5.52,5.52,5.28,5.33,5.03,5.11,5.2,4.88,4.83,4.74,4.8,4.96,5.25,5.13,4.66,4.86,4.71,4.38,4.72,5.17,4.82,5.3,6.0,6.05,6.37,6.34,6.21,4.96,5.36,5.53,4.79,5.38,5.05,4.92,5.0,5.24,5.58,5.03,5.44,4.93,5.22,5.45,5.08,5.58,5.29,5.18,5.33,5.26,5.09,4.93,4.94,4.9,5.02,4.95,4.91,4.89,4.74,4.63,4.58,4.79,4.43,4.33,4.37,4.42,4.33,4.21,4.2,4.58,4.28,4.14,4.52,4.28,4.43,4.67,4.6,5.04,4.87,4.66,4.57,4.53,4.47,4.43,4.67,4.87,4.59,4.46,4.61,4.56,4.5,5.08,5.11,5.12,5.13,5.35,5.96,6.22,6.58,7.83,5.95,6.17,5.91,6.42,6.74,6.67,7.16,7.75,6.82,6.72,7.35,7.19,6.98,7.13,7.1,7.14,6.74,7.53,7.76,8.21,8.83,9.91,9.7,11.76,12.55,13.13,10.7,11.44,12.6,11.55,12.08,13.68,12.9,13.36,14.31,13.35,13.5,13.25,12.54,12.93,11.95,13.65,14.32,14.23,14.76,16.74,19.62,17.99,16.47,16.85,17.65,17.48,13.76,12.96,9.28,10.12,10.79,12.51,13.21,13.11,12.63,15.52,13.94,13.63,14.54,16.45,16.57,18.14,16.99,16.29,16.12,17.5,18.62,18.53,18.74,17.66,18.87,22.07,23.96,27.13,30.63,27.75,33.49,37.87,48.7,38.65,35.02,39.63,41.35,30.45,34.24,31.35,28.18,33.6,37.23,32.43,31.2,28.1,27.08,28.2,30.52,34.65,32.28,34.28,29.95,32.03,28.95,28.64,24.42,22.57,18.86,19.94,23.64,21.68,22.2,19.93,19.5,19.31,21.27,19.97,19.28,19.0,20.87,20.69,19.47,17.11,16.2,15.97,15.97,16.92,16.53,16.6,16.52,16.67,15.7,14.56,14.44,14.65,15.63,14.08,13.82,14.08,14.75,15.38,17.86,16.06,18.36,20.04,18.74,19.35,17.76,16.67,16.24,17.29,18.28,18.06,17.41,17.31,16.47,16.76,17.34,16.86,16.82,16.57,16.86,17.23,16.44,16.28,16.38,16.55,16.03,15.43,14.65,14.3,14.34,14.23,15.46,16.07,15.81,15.1,14.98,14.48,15.22,16.48,18.39,17.25,18.05,16.96,18.05,17.89,17.18,13.93,15.34,17.59,17.84,24.07,27.35,23.73,23.62,22.15,26.48,27.41,26.68,24.0,25.88,27.63,25.77,25.49,24.05,21.52,24.01,22.86,23.09,22.5,24.35,24.82,23.45,21.77,20.41,20.07,17.95,19.02,19.16,21.56,23.95,23.0,20.52,23.89,24.77,23.25,22.47,24.36,24.54,23.07,23.2,25.02,23.79,23.09,22.34,24.54,26.66,31.27,29.37,28.56,29.47,31.07,33.59,30.7,28.91,31.61,31.14,34.05,32.23,33.08,35.98,36.22,38.8,46.17,48.96,53.91,71.99,103.19,86.7,86.21],"m":[2.09,2.0,2.25,2.25,2.42,2.48,2.36,2.21,2.23,1.99,2.01,1.98,2.0,1.86,1.84,1.8,1.78,1.66,1.63,1.66,1.79,1.86,1.93,1.8,1.86,1.89,1.88,1.85,1.68,1.64,1.68,1.79,1.8,1.75,1.76,1.63,1.63,1.59,1.66,1.72,1.66,1.6,1.57,1.59,1.42,1.32,1.31,1.38,1.46,1.5,1.53,1.57,1.58,1.57,1.72,1.84,1.78,1.8,1.82,1.95,2.0,2.22,2.23,2.18,2.35,2.58,2.81,2.67,2.63,2.85,2.83,3.09,3.59,5.26,5.35,5.01,5.37,4.83,4.35,4.44,4.05,4.79,4.68,4.42,4.23,4.39,4.38,4.23,4.53,4.49,4.69,4.93,4.49,4.33,4.32,4.09,4.07,4.09,4.2,4.35,4.47,4.79,4.77,4.26,4.3,4.23,4.36,4.34,4.4,4.53,4.86,4.79,4.7,4.47,4.53,4.47,4.54,4.76,4.83,4.72,4.94,4.96,5.26,5.16,5.14,5.33,5.35,5.54,5.59,5.94,5.88,5.93,6.21,7.35,7.42,7.45,8.39,8.55,9.16,9.32,13.75,16.68,16.62,22.39,39.28,35.6,24.74,14.98,12.66,15.81,16.32,15.92,19.89,20.22,18.63,16.42,14.74,13.08,12.32,11.51,10.86,9.99,8.59,8.9,10.04,9.24,8.53,8.47,7.98,8.28,7.22,7.29,6.67,5.57,6.44,7.07,8.74,9.4,9.78,10.57,12.42,13.67,10.65,11.73,12.96,11.78,12.05,12.06,11.96,9.88,8.81,9.18,8.2,9.11,9.65,9.25,8.96,8.77,7.45,7.6,7.24,7.29,7.5,6.67,6.09,6.08,5.95,6.45,6.26,6.17,6.08,6.25,6.06,6.18,6.12,5.89,6.06,5.88,5.66,5.22,5.09,5.15,5.04,5.21,5.67,5.65,5.57,5.37,5.52,5.48,5.66,7.47,8.47,7.43,7.64,7.87,7.6,7.6,6.72,6.81,6.73,6.34,6.41,6.45,6.54,7.01,7.1,6.71,6.37,6.28,6.3,6.12,5.99,5.88,5.95,5.79,5.45,5.28,5.23,5.18,5.13,5.14,5.48,5.57,5.25,5.29,5.08,5.06,5.07,4.92,4.87,5.0,4.8,4.39,4.17,4.08,4.05,3.74,3.95,3.98,4.05,4.39,4.35,3.96,4.04,4.11,4.07,3.95,4.12,4.15,4.11,4.05,4.08,4.06,3.97,3.82,3.77,3.75,3.77,3.73,3.68,3.66,3.65,3.96,4.45,4.38,5.02,4.84,4.22,4.34,4.53,4.97,5.14,5.25,5.44,5.31,5.42,5.39,5.28,5.19,5.52,5.46,5.19,4.78,4.77,4.72,4.65,5.5,5.54,5.36,5.16,5.39,5.44,5.37,5.32,5.18,5.48,5.65,5.53,5.41,5.37,5.16,5.06,5.13,5.04,4.93,4.83,4.82,4.77,5.07,5.2,4.77,4.76,4.75,4.37,4.5,4.73,5.03,5.08,5.79,5.88,6.83,6.24,6.33,5.56,5.27,5.45,5.18,5.0,5.0,4.97,4.88,5.15,5.53,5.19,5.07,5.27,5.03,5.18,5.27,5.23,5.41,5.16,5.16,5.19,5.25,5.06,5.06,4.99,5.0,4.97,4.88,4.89,4.83,4.68,4.64,4.66,4.55,4.4,4.37,4.43,4.36,4.25,4.2,4.35,4.4,4.12,4.35,4.51,4.42,4.53,4.57,4.71,4.89,4.92,4.55,4.55,4.4,4.51,4.63,4.81,4.65,4.53,4.49,4.74,4.53,4.8,4.99,5.17,5.0,5.18,5.62,6.32,6.44,7.23,7.06,5.85,5.86,6.32,6.66,6.39,7.1,7.49,7.1,6.61,7.03,7.26,7.12,7.02,7.31,7.01,7.04,7.15,7.67,7.87,8.64,9.15,9.54,10.38,12.61,13.45,10.8,11.23,12.18,11.68,11.56,12.93,13.36,12.84,13.91,13.19,13.74,13.15,13.14,12.91,12.36,12.83,13.67,14.7,14.3,15.96,17.57,19.51,17.5,17.05,16.97,18.03,14.69,12.37,10.44,9.87,10.29,11.29,13.41,13.12,12.52,14.03,14.65,13.36,14.35,16.39,17.24,17.82,17.67,17.79,15.87,17.11,18.1,18.42,18.45,17.96,18.36,20.55,23.39,26.54,29.35,28.4,30.78,35.81,41.97,36.75,35.8,37.92,40.3,38.15,31.97,33.08,30.41,30.77,34.14,32.95,31.55,28.67,28.05,27.43,28.7,33.61,33.19,32.77,31.96,31.11,30.33,28.8,25.2,23.01,21.11,19.71,21.84,22.56,21.92,20.76,19.61,19.91,20.83,20.74,19.71,19.36,19.78,20.92,19.8,18.49,17.19,15.97,16.24,17.1,16.84,16.22,16.32,16.8,16.1,15.07,14.94,14.72,15.71,14.51,14.05,14.02,15.07,15.42,16.26,16.89,17.18,19.93,19.64,19.29,17.74,17.42,16.38,16.81,17.87,17.59,18.06,16.76,16.95,16.14,16.91,17.45,16.94,17.0,16.16,17.17,16.66,16.47,16.61,16.47,16.53,15.71,15.01,14.26,14.58,14.37,14.69,15.59,15.81,15.32,15.04,14.63,15.0,15.75,17.14,18.17,17.62,17.18,17.11,17.96,17.92,14.92,15.03,16.23,17.72,20.41,26.89,25.89,24.25,24.05,24.89,25.9,27.35,25.61,25.64,27.46,26.98,25.75,24.02,23.31,23.3,24.2,22.47,23.13,23.47,25.24,24.54,21.9,21.49,19.08,19.75,18.84,19.36,21.0,23.24,23.75,22.01,21.92,25.0,24.15,23.41,24.04,23.44,23.24,22.32,23.39,23.98,22.95,22.68,24.45,27.58,29.4,29.59,29.75,28.52,30.01,32.41,31.14,30.46,30.37,32.18,33.18,32.27,32.7,35.95,37.67,37.94,42.54,49.43,50.73,64.34,92.13,81.92,86.21],"n":[22,21,20,20,23,19,23,22,20,23,18,20,22,20,21,20,21,21,23,21,21,23,20,21,21,20,20,22,20,22,23,20,22,22,21,22,20,20,23,20,20,22,22,16,22,21,22,21,21,21,22,19,22,20,21,22,21,22,22,19,22,18,16,19,22,21,22,22,20,23,22,18,22,20,21,20,22,20,23,21,21,23,21,20,22,20,19,22,21,21,23,20,22,23,20,21,21,20,23,20,20,22,22,21,22,21,22,21,20,20,23,19,22,20,21,22,22,21,22,20,21,20,21,20,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,21,20,20,21,23,20,22,23,20,21,20,20,22,20,19,22,22,20,22,22,21,21,20,20,22,20,19,22,22,21,22,21,22,21,20,21,23,19,20,22,21,22,22,21,22,20,21,21,22,19,21,21,22,22,20,23,22,18,22,20,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,21,21,21,20,21,23,19,20,22,21,22,22,21,22,20,21,20,21,20,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,21,21,20,21,20,23,21,21,23,21,20,22,20,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,20,20,21,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,20,20,21,22,18,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,23,20,19,22,22,21,22,21,22,21,20,20,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,22,19,21,21,22,22,20,23,22,19,22,21,19,22,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,18,20,22,21,22,22,21,22,20,21,21,22,19,22,19,22,22,20,23,22,19,22,20,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,20,22,20,19,22,23,20,22,22,21,21,20,21,21,21,20,22,21,22,22,21,22,20,21,20,23,18,21,22,21,22,21,22,22,19,22,20,21,20,21,21,22,22,20,23,22,19,22,20,21,20,21,20,23,21,21,23,21,20,22,20,22,20,19,22,23,20,22,22,21,21,20,20,23,20,19,22,22,21,22,21,22,21,20,20,23,19,21,20,21,22,21,21,22,20,21,20,23,18,20,22,21,22,21,22,22,19,22,21,20,21,21,20,23,21,21,23,21,20,22,20,21,20,20,21,23,20,22,23,20,21,21,23,1]}});
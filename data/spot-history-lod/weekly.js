@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// Level-of-detail tier weekly (ohlc, up to 3034 points per metal)
+window._loadSpotSeedLod("weekly",{"Gold":{"t":["1968-01-01","1968-01-08","1968-01-15","1968-01-22","1968-01-29","1968-02-05","1968-02-12","1968-02-19","1968-02-26","1968-03-04","1968-03-11","1968-04-01","1968-04-08","1968-04-15","1968-04-22","1968-04-29","1968-05-06","1968-05-13","1968-05-20","1968-05-27","1968-06-03","1968-06-10","1968-06-17","1968-06-24","1968-07-01","1968-07-08","1968-07-15","1968-07-22","1968-07-29","1968-08-05","1968-08-12","1968-08-19","1968-08-26","1968-09-02","1968-09-09","1968-09-16","1968-09-23","1968-09-30","1968-10-07","1968-10-14","1968-10-21","1968-10-28","1968-11-04","1968-11-11","1968-11-18","1968-11-25","1968-12-02","1968-12-09","1968-12-16","1968-12-23","1968-12-30","1969-01-06","1969-01-13","1969-01-20","1969-01-27","1969-02-03","1969-02-10","1969-02-17","1969-02-24","1969-03-03","1969-03-10","1969-03-17","1969-03-24","1969-03-31","1969-04-07","1969-04-14","1969-04-21","1969-04-28","1969-05-05","1969-05-12","1969-05-19","1969-05-26","1969-06-02","1969-06-09","1969-06-16","1969-06-23","1969-06-30","1969-07-07","1969-07-14","1969-07-21","1969-07-28","1969-08-04","1969-08-11","1969-08-18","1969-08-25","1969-09-01","1969-09-08","1969-09-15","1969-09-22","1969-09-29","1969-10-06","1969-10-13","1969-10-20","1969-10-27","1969-11-03","1969-11-10","1969-11-17","1969-11-24","1969-12-01","1969-12-08","1969-12-15","1969-12-22","1969-12-29","1970-01-05","1970-01-12","1970-01-19","1970-01-26","1970-02-02","1970-02-09","1970-02-16","1970-02-23","1970-03-02","1970-03-09","1970-03-16","1970-03-23","1970-03-30","1970-04-06","1970-04-13","1970-04-20","1970-04-27","1970-05-04","1970-05-11","1970-05-18","1970-05-25","1970-06-01","1970-06-08","1970-06-15","1970-06-22","1970-06-29","1970-07-06","1970-07-13","1970-07-20","1970-07-27","1970-08-03","1970-08-10","1970-08-17","1970-08-24","1970-08-31","1970-09-07","1970-09-14","1970-09-21","1970-09-28","1970-10-05","1970-10-12","1970-10-19","1970-10-26","1970-11-02","1970-11-09","1970-11-16","1970-11-23","1970-11-30","1970-12-07","1970-12-14","1970-12-21","1970-12-28","1971-01-04","1971-01-11","1971-01-18","1971-01-25","1971-02-01","1971-02-08","1971-02-15","1971-02-22","1971-03-01","1971-03-08","1971-03-15","1971-03-22","1971-03-29","1971-04-05","1971-04-12","1971-04-19","1971-04-26","1971-05-03","1971-05-10","1971-05-17","1971-05-24","1971-05-31","1971-06-07","1971-06-14","1971-06-21","1971-06-28","1971-07-05","1971-07-12","1971-07-19","1971-07-26","1971-08-02","1971-08-09","1971-08-16","1971-08-23","1971-08-30","1971-09-06","1971-09-13","1971-09-20","1971-09-27","1971-10-04","1971-10-11","1971-10-18","1971-10-25","1971-11-01","1971-11-08","1971-11-15","1971-11-22","1971-11-29","1971-12-06","1971-12-13","1971-12-20","1971-12-27","1972-01-03","1972-01-10","1972-01-17","1972-01-24","1972-01-31","1972-02-07","1972-02-14","1972-02-21","1972-02-28","1972-03-06","1972-03-13","1972-03-20","1972-03-27","1972-04-03","1972-04-10","1972-04-17","1972-04-24","1972-05-01","1972-05-08","1972-05-15","1972-05-22","1972-05-29","1972-06-05","1972-06-12","1972-06-19","1972-06-26","1972-07-03","1972-07-10","1972-07-17","1972-07-24","1972-07-31","1972-08-07","1972-08-14","1972-08-21","1972-08-28","1972-09-04","1972-09-11","1972-09-18","1972-09-25","1972-10-02","1972-10-09","1972-10-16","1972-10-23","1972-10-30","1972-11-06","1972-11-13","1972-11-20","1972-11-27","1972-12-04","1972-12-11","1972-12-18","1972-12-25","1973-01-01","1973-01-08","1973-01-15","1973-01-22","1973-01-29","1973-02-05","1973-02-12","1973-02-19","1973-02-26","1973-03-05","1973-03-12","1973-03-19","1973-03-26","1973-04-02","1973-04-09","1973-04-16","1973-04-23","1973-04-30","1973-05-07","1973-05-14","1973-05-21","1973-05-28","1973-06-04","1973-06-11","1973-06-18","1973-06-25","1973-07-02","1973-07-09","1973-07-16","1973-07-23","1973-07-30","1973-08-06","1973-08-13","1973-08-20","1973-08-27","1973-09-03","1973-09-10","1973-09-17","1973-09-24","1973-10-01","1973-10-08","1973-10-15","1973-10-22","1973-10-29","1973-11-05","1973-11-12","1973-11-19","1973-11-26","1973-12-03","1973-12-10","1973-12-17","1973-12-24","1973-12-31","1974-01-07","1974-01-14","1974-01-21","1974-01-28","1974-02-04","1974-02-11","1974-02-18","1974-02-25","1974-03-04","1974-03-11","1974-03-18","1974-03-25","1974-04-01","1974-04-08","1974-04-15","1974-04-22","1974-04-29","1974-05-06","1974-05-13","1974-05-20","1974-05-27","1974-06-03","1974-06-10","1974-06-17","1974-06-24","1974-07-01","1974-07-08","1974-07-15","1974-07-22","1974-07-29","1974-08-05","1974-08-12","1974-08-19","1974-08-26","1974-09-02","1974-09-09","1974-09-16","1974-09-23","1974-09-30","1974-10-07","1974-10-14","1974-10-21","1974-10-28","1974-11-04","1974-11-11","1974-11-18","1974-11-25","1974-12-02","1974-12-09","1974-12-16","1974-12-23","1974-12-30","1975-01-06","1975-01-13","1975-01-20","1975-01-27","1975-02-03","1975-02-10","1975-02-17","1975-02-24","1975-03-03","1975-03-10","1975-03-17","1975-03-24","1975-03-31","1975-04-07","1975-04-14","1975-04-21","1975-04-28","1975-05-05","1975-05-12","1975-05-19","1975-05-26","1975-06-02","1975-06-09","1975-06-16","1975-06-23","1975-06-30","1975-07-07","1975-07-14","1975-07-21","1975-07-28","1975-08-04","1975-08-11","1975-08-18","1975-08-25","1975-09-01","1975-09-08","1975-09-15","1975-09-22","1975-09-29","1975-10-06","1975-10-13","1975-10-20","1975-10-27","1975-11-03","1975-11-10","1975-11-17","1975-11-24","1975-12-01","1975-12-08","1975-12-15","1975-12-22","1975-12-29","1976-01-05","1976-01-12","1976-01-19","1976-01-26","1976-02-02","1976-02-09","1976-02-16","1976-02-23","1976-03-01","1976-03-08","1976-03-15","1976-03-22","1976-03-29","1976-04-05","1976-04-12","1976-04-19","1976-04-26","1976-05-03","1976-05-10","1976-05-17","1976-05-24","1976-05-31","1976-06-07","1976-06-14","1976-06-21","1976-06-28","1976-07-05","1976-07-12","1976-07-19","1976-07-26","1976-08-02","1976-08-09","1976-08-16","1976-08-23","1976-08-30","1976-09-06","1976-09-13","1976-09-20","1976-09-27","1976-10-04","1976-10-11","1976-10-18","1976-10-25","1976-11-01","1976-11-08","1976-11-15","1976-11-22","1976-11-29","1976-12-06","1976-12-13","1976-12-20","1976-12-27","1977-01-03","1977-01-10","1977-01-17","1977-01-24","1977-01-31","1977-02-07","1977-02-14","1977-02-21","1977-02-28","1977-03-07","1977-03-14","1977-03-21","1977-03-28","1977-04-04","1977-04-11","1977-04-18","1977-04-25","1977-05-02","1977-05-09","1977-05-16","1977-05-23","1977-05-30","1977-06-06","1977-06-13","1977-06-20","1977-06-27","1977-07-04","1977-07-11","1977-07-18","1977-07-25","1977-08-01","1977-08-08","1977-08-15","1977-08-22","1977-08-29","1977-09-05","1977-09-12","1977-09-19","1977-09-26","1977-10-03","1977-10-10","1977-10-17","1977-10-24","1977-10-31","1977-11-07","1977-11-14","1977-11-21","1977-11-28","1977-12-05","1977-12-12","1977-12-19","1977-12-26","1978-01-02","1978-01-09","1978-01-16","1978-01-23","1978-01-30","1978-02-06","1978-02-13","1978-02-20","1978-02-27","1978-03-06","1978-03-13","1978-03-20","1978-03-27","1978-04-03","1978-04-10","1978-04-17","1978-04-24","1978-05-01","1978-05-08","1978-05-15","1978-05-22","1978-05-29","1978-06-05","1978-06-12","1978-06-19","1978-06-26","1978-07-03","1978-07-10","1978-07-17","1978-07-24","1978-07-31","1978-08-07","1978-08-14","1978-08-21","1978-08-28","1978-09-04","1978-09-11","1978-09-18","1978-09-25","1978-10-02","1978-10-09","1978-10-16","1978-10-23","1978-10-30","1978-11-06","1978-11-13","1978-11-20","1978-11-27","1978-12-04","1978-12-11","1978-12-18","1978-12-25","1979-01-01","1979-01-08","1979-01-15","1979-01-22","1979-01-29","1979-02-05","1979-02-12","1979-02-19","1979-02-26","1979-03-05","1979-03-12","1979-03-19","1979-03-26","1979-04-02","1979-04-09","1979-04-16","1979-04-23","1979-04-30","1979-05-07","1979-05-14","1979-05-21","1979-05-28","1979-06-04","1979-06-11","1979-06-18","1979-06-25","1979-07-02","1979-07-09","1979-07-16","1979-07-23","1979-07-30","1979-08-06","1979-08-13","1979-08-20","1979-08-27","1979-09-03","1979-09-10","1979-09-17","1979-09-24","1979-10-01","1979-10-08","1979-10-15","1979-10-22","1979-10-29","1979-11-05","1979-11-12","1979-11-19","1979-11-26","1979-12-03","1979-12-10","1979-12-17","1979-12-24","1979-12-31","1980-01-07","1980-01-14","1980-01-21","1980-01-28","1980-02-04","1980-02-11","1980-02-18","1980-02-25","1980-03-03","1980-03-10","1980-03-17","1980-03-24","1980-03-31","1980-04-07","1980-04-14","1980-04-21","1980-04-28","1980-05-05","1980-05-12","1980-05-19","1980-05-26","1980-06-02","1980-06-09","1980-06-16","1980-06-23","1980-06-30","1980-07-07","1980-07-14","1980-07-21","1980-07-28","1980-08-04","1980-08-11","1980-08-18","1980-08-25","1980-09-01","1980-09-08","1980-09-15","1980-09-22","1980-09-29","1980-10-06","1980-10-13","1980-10-20","1980-10-27","1980-11-03","1980-11-10","1980-11-17","1980-11-24","1980-12-01","1980-12-08","1980-12-15","1980-12-22","1980-12-29","1981-01-05","1981-01-12","1981-01-19","1981-01-26","1981-02-02","1981-02-09","1981-02-16","1981-02-23","1981-03-02","1981-03-09","1981-03-16","1981-03-23","1981-03-30","1981-04-06","1981-04-13","1981-04-20","1981-04-27","1981-05-04","1981-05-11","1981-05-18","1981-05-25","1981-06-01","1981-06-08","1981-06-15","1981-06-22","1981-06-29","1981-07-06","1981-07-13","1981-07-20","1981-07-27","1981-08-03","1981-08-10","1981-08-17","1981-08-24","1981-08-31","1981-09-07","1981-09-14","1981-09-21","1981-09-28","1981-10-05","1981-10-12","1981-10-19","1981-10-26","1981-11-02","1981-11-09","1981-11-16","1981-11-23","1981-11-30","1981-12-07","1981-12-14","1981-12-21","1981-12-28","1982-01-04","1982-01-11","1982-01-18","1982-01-25","1982-02-01","1982-02-08","1982-02-15","1982-02-22","1982-03-01","1982-03-08","1982-03-15","1982-03-22","1982-03-29","1982-04-05","1982-04-12","1982-04-19","1982-04-26","1982-05-03","1982-05-10","1982-05-17","1982-05-24","1982-05-31","1982-06-07","1982-06-14","1982-06-21","1982-06-28","1982-07-05","1982-07-12","1982-07-19","1982-07-26","1982-08-02","1982-08-09","1982-08-16","1982-08-23","1982-08-30","1982-09-06","1982-09-13","1982-09-20","1982-09-27","1982-10-04","1982-10-11","1982-10-18","1982-10-25","1982-11-01","1982-11-08","1982-11-15","1982-11-22","1982-11-29","1982-12-06","1982-12-13","1982-12-20","1982-12-27","1983-01-03","1983-01-10","1983-01-17","1983-01-24","1983-01-31","1983-02-07","1983-02-14","1983-02-21","1983-02-28","1983-03-07","1983-03-14","1983-03-21","1983-03-28","1983-04-04","1983-04-11","1983-04-18","1983-04-25","1983-05-02","1983-05-09","1983-05-16","1983-05-23","1983-05-30","1983-06-06","1983-06-13","1983-06-20","1983-06-27","1983-07-04","1983-07-11","1983-07-18","1983-07-25","1983-08-01","1983-08-08","1983-08-15","1983-08-22","1983-08-29","1983-09-05","1983-09-12","1983-09-19","1983-09-26","1983-10-03","1983-10-10","1983-10-17","1983-10-24","1983-10-31","1983-11-07","1983-11-14","1983-11-21","1983-11-28","1983-12-05","1983-12-12","1983-12-19","1983-12-26","1984-01-02","1984-01-09","1984-01-16","1984-01-23","1984-01-30","1984-02-06","1984-02-13","1984-02-20","1984-02-27","1984-03-05","1984-03-12","1984-03-19","1984-03-26","1984-04-02","1984-04-09","1984-04-16","1984-04-23","1984-04-30","1984-05-07","1984-05-14","1984-05-21","1984-05-28","1984-06-04","1984-06-11","1984-06-18","1984-06-25","1984-07-02","1984-07-09","1984-07-16","1984-07-23","1984-07-30","1984-08-06","1984-08-13","1984-08-20","1984-08-27","1984-09-03","1984-09-10","1984-09-17","1984-09-24","1984-10-01","1984-10-08","1984-10-15","1984-10-22","1984-10-29","1984-11-05","1984-11-12","1984-11-19","1984-11-26","1984-12-03","1984-12-10","1984-12-17","1984-12-24","1984-12-31","1985-01-07","1985-01-14","1985-01-21","1985-01-28","1985-02-04","1985-02-11","1985-02-18","1985-02-25","1985-03-04","1985-03-11","1985-03-18","1985-03-25","1985-04-01","1985-04-08","1985-04-15","1985-04-22","1985-04-29","1985-05-06","1985-05-13","1985-05-20","1985-05-27","1985-06-03","1985-06-10","1985-06-17","1985-06-24","1985-07-01","1985-07-08","1985-07-15","1985-07-22","1985-07-29","1985-08-05","1985-08-12","1985-08-19","1985-08-26","1985-09-02","1985-09-09","1985-09-16","1985-09-23","1985-09-30","1985-10-07","1985-10-14","1985-10-21","1985-10-28","1985-11-04","1985-11-11","1985-11-18","1985-11-25","1985-12-02","1985-12-09","1985-12-16","1985-12-23","1985-12-30","1986-01-06","1986-01-13","1986-01-20","1986-01-27","1986-02-03","1986-02-10","1986-02-17","1986-02-24","1986-03-03","1986-03-10","1986-03-17","1986-03-24","1986-03-31","1986-04-07","1986-04-14","1986-04-21","1986-04-28","1986-05-05","1986-05-12","1986-05-19","1986-05-26","1986-06-02","1986-06-09","1986-06-16","1986-06-23","1986-06-30","1986-07-07","1986-07-14","1986-07-21","1986-07-28","1986-08-04","1986-08-11","1986-08-18","1986-08-25","1986-09-01","1986-09-08","1986-09-15","1986-09-22","1986-09-29","1986-10-06","1986-10-13","1986-10-20","1986-10-27","1986-11-03","1986-11-10","1986-11-17","1986-11-24","1986-12-01","1986-12-08","1986-12-15","1986-12-22","1986-12-29","1987-01-05","1987-01-12","1987-01-19","1987-01-26","1987-02-02","1987-02-09","1987-02-16","1987-02-23","1987-03-02","1987-03-09","1987-03-16","1987-03-23","1987-03-30","1987-04-06","1987-04-13","1987-04-20","1987-04-27","1987-05-04","1987-05-11","1987-05-18","1987-05-25","1987-06-01","1987-06-08","1987-06-15","1987-06-22","1987-06-29","1987-07-06","1987-07-13","1987-07-20","1987-07-27","1987-08-03","1987-08-10","1987-08-17","1987-08-24","1987-08-31","1987-09-07","1987-09-14","1987-09-21","1987-09-28","1987-10-05","1987-10-12","1987-10-19","1987-10-26","1987-11-02","1987-11-09","1987-11-16","1987-11-23","1987-11-30","1987-12-07","1987-12-14","1987-12-21","1987-12-28","1988-01-04","1988-01-11","1988-01-18","1988-01-25","1988-02-01","1988-02-08","1988-02-15","1988-02-22","1988-02-29","1988-03-07","1988-03-14","1988-03-21","1988-03-28","1988-04-04","1988-04-11","1988-04-18","1988-04-25","1988-05-02","1988-05-09","1988-05-16","1988-05-23","1988-05-30","1988-06-06","1988-06-13","1988-06-20","1988-06-27","1988-07-04","1988-07-11","1988-07-18","1988-07-25","1988-08-01","1988-08-08","1988-08-15","1988-08-22","1988-08-29","1988-09-05","1988-09-12","1988-09-19","1988-09-26","1988-10-03","1988-10-10","1988-10-17","1988-10-24","1988-10-31","1988-11-07","1988-11-14","1988-11-21","1988-11-28","1988-12-05","1988-12-12","1988-12-19","1988-12-26","1989-01-02","1989-01-09","1989-01-16","1989-01-23","1989-01-30","1989-02-06","1989-02-13","1989-02-20","1989-02-27","1989-03-06","1989-03-13","1989-03-20","1989-03-27","1989-04-03","1989-04-10","1989-04-17","1989-04-24","1989-05-01","1989-05-08","1989-05-15","1989-05-22","1989-05-29","1989-06-05","1989-06-12","1989-06-19","1989-06-26","1989-07-03","1989-07-10","1989-07-17","1989-07-24","1989-07-31","1989-08-07","1989-08-14","1989-08-21","1989-08-28","1989-09-04","1989-09-11","1989-09-18","1989-09-25","1989-10-02","1989-10-09","1989-10-16","1989-10-23","1989-10-30","1989-11-06","1989-11-13","1989-11-20","1989-11-27","1989-12-04","1989-12-11","1989-12-18","1989-12-25","1990-01-01","1990-01-08","1990-01-15","1990-01-22","1990-01-29","1990-02-05","1990-02-12","1990-02-19","1990-02-26","1990-03-05","1990-03-12","1990-03-19","1990-03-26","1990-04-02","1990-04-09","1990-04-16","1990-04-23","1990-04-30","1990-05-07","1990-05-14","1990-05-21","1990-05-28","1990-06-04","1990-06-11","1990-06-18","1990-06-25","1990-07-02","1990-07-09","1990-07-16","1990-07-23","1990-07-30","1990-08-06","1990-08-13","1990-08-20","1990-08-27","1990-09-03","1990-09-10","1990-09-17","1990-09-24","1990-10-01","1990-10-08","1990-10-15","1990-10-22","1990-10-29","1990-11-05","1990-11-12","1990-11-19","1990-11-26","1990-12-03","1990-12-10","1990-12-17","1990-12-24","1990-12-31","1991-01-07","1991-01-14","1991-01-21","1991-01-28","1991-02-04","1991-02-11","1991-02-18","1991-02-25","1991-03-04","1991-03-11","1991-03-18","1991-03-25","1991-04-01","1991-04-08","1991-04-15","1991-04-22","1991-04-29","1991-05-06","1991-05-13","1991-05-20","1991-05-27","1991-06-03","1991-06-10","1991-06-17","1991-06-24","1991-07-01","1991-07-08","1991-07-15","1991-07-22","1991-07-29","1991-08-05","1991-08-12","1991-08-19","1991-08-26","1991-09-02","1991-09-09","1991-09-16","1991-09-23","1991-09-30","1991-10-07","1991-10-14","1991-10-21","1991-10-28","1991-11-04","1991-11-11","1991-11-18","1991-11-25","1991-12-02","1991-12-09","1991-12-16","1991-12-23","1991-12-30","1992-01-06","1992-01-13","1992-01-20","1992-01-27","1992-02-03","1992-02-10","1992-02-17","1992-02-24","1992-03-02","1992-03-09","1992-03-16","1992-03-23","1992-03-30","1992-04-06","1992-04-13","1992-04-20","1992-04-27","1992-05-04","1992-05-11","1992-05-18","1992-05-25","1992-06-01","1992-06-08","1992-06-15","1992-06-22","1992-06-29","1992-07-06","1992-07-13","1992-07-20","1992-07-27","1992-08-03","1992-08-10","1992-08-17","1992-08-24","1992-08-31","1992-09-07","1992-09-14","1992-09-21","1992-09-28","1992-10-05","1992-10-12","1992-10-19","1992-10-26","1992-11-02","1992-11-09","1992-11-16","1992-11-23","1992-11-30","1992-12-07","1992-12-14","1992-12-21","1992-12-28","1993-01-04","1993-01-11","1993-01-18","1993-01-25","1993-02-01","1993-02-08","1993-02-15","1993-02-22","1993-03-01","1993-03-08","1993-03-15","1993-03-22","1993-03-29","1993-04-05","1993-04-12","1993-04-19","1993-04-26","1993-05-03","1993-05-10","1993-05-17","1993-05-24","1993-05-31","1993-06-07","1993-06-14","1993-06-21","1993-06-28","1993-07-05","1993-07-12","1993-07-19","1993-07-26","1993-08-02","1993-08-09","1993-08-16","1993-08-23","1993-08-30","1993-09-06","1993-09-13","1993-09-20","1993-09-27","1993-10-04","1993-10-11","1993-10-18","1993-10-25","1993-11-01","1993-11-08","1993-11-15","1993-11-22","1993-11-29","1993-12-06","1993-12-13","1993-12-20","1993-12-27","1994-01-03","1994-01-10","1994-01-17","1994-01-24","1994-01-31","1994-02-07","1994-02-14","1994-02-21","1994-02-28","1994-03-07","1994-03-14","1994-03-21","1994-03-28","1994-04-04","1994-04-11","1994-04-18","1994-04-25","1994-05-02","1994-05-09","1994-05-16","1994-05-23","1994-05-30","1994-06-06","1994-06-13","1994-06-20","1994-06-27","1994-07-04","1994-07-11","1994-07-18","1994-07-25","1994-08-01","1994-08-08","1994-08-15","1994-08-22","1994-08-29","1994-09-05","1994-09-12","1994-09-19","1994-09-26","1994-10-03","1994-10-10","1994-10-17","1994-10-24","1994-10-31","1994-11-07","1994-11-14","1994-11-21","1994-11-28","1994-12-05","1994-12-12","1994-12-19","1994-12-26","1995-01-02","1995-01-09","1995-01-16","1995-01-23","1995-01-30","1995-02-06","1995-02-13","1995-02-20","1995-02-27","1995-03-06","1995-03-13","1995-03-20","1995-03-27","1995-04-03","1995-04-10","1995-04-17","1995-04-24","1995-05-01","1995-05-08","1995-05-15","1995-05-22","1995-05-29","1995-06-05","1995-06-12","1995-06-19","1995-06-26","1995-07-03","1995-07-10","1995-07-17","1995-07-24","1995-07-31","1995-08-07","1995-08-14","1995-08-21","1995-08-28","1995-09-04","1995-09-11","1995-09-18","1995-09-25","1995-10-02","1995-10-09","1995-10-16","1995-10-23","1995-10-30","1995-11-06","1995-11-13","1995-11-20","1995-11-27","1995-12-04","1995-12-11","1995-12-18","1995-12-25","1996-01-01","1996-01-08","1996-01-15","1996-01-22","1996-01-29","1996-02-05","1996-02-12","1996-02-19","1996-02-26","1996-03-04","1996-03-11","1996-03-18","1996-03-25","1996-04-01","1996-04-08","1996-04-15","1996-04-22","1996-04-29","1996-05-06","1996-05-13","1996-05-20","1996-05-27","1996-06-03","1996-06-10","1996-06-17","1996-06-24","1996-07-01","1996-07-08","1996-07-15","1996-07-22","1996-07-29","1996-08-05","1996-08-12","1996-08-19","1996-08-26","1996-09-02","1996-09-09","1996-09-16","1996-09-23","1996-09-30","1996-10-07","1996-10-14","1996-10-21","1996-10-28","1996-11-04","1996-11-11","1996-11-18","1996-11-25","1996-12-02","1996-12-09","1996-12-16","1996-12-23","1996-12-30","1997-01-06","1997-01-13","1997-01-20","1997-01-27","1997-02-03","1997-02-10","1997-02-17","1997-02-24","1997-03-03","1997-03-10","1997-03-17","1997-03-24","1997-03-31","1997-04-07","1997-04-14","1997-04-21","1997-04-28","1997-05-05","1997-05-12","1997-05-19","1997-05-26","1997-06-02","1997-06-09","1997-06-16","1997-06-23","1997-06-30","1997-07-07","1997-07-14","1997-07-21","1997-07-28","1997-08-04","1997-08-11","1997-08-18","1997-08-25","1997-09-01","1997-09-08","1997-09-15","1997-09-22","1997-09-29","1997-10-06","1997-10-13","1997-10-20","1997-10-27","1997-11-03","1997-11-10","1997-11-17","1997-11-24","1997-12-01","1997-12-08","1997-12-15","1997-12-22","1997-12-29","1998-01-05","1998-01-12","1998-01-19","1998-01-26","1998-02-02","1998-02-09","1998-02-16","1998-02-23","1998-03-02","1998-03-09","1998-03-16","1998-03-23","1998-03-30","1998-04-06","1998-04-13","1998-04-20","1998-04-27","1998-05-04","1998-05-11","1998-05-18","1998-05-25","1998-06-01","1998-06-08","1998-06-15","1998-06-22","1998-06-29","1998-07-06","1998-07-13","1998-07-20","1998-07-27","1998-08-03","1998-08-10","1998-08-17","1998-08-24","1998-08-31","1998-09-07","1998-09-14","1998-09-21","1998-09-28","1998-10-05","1998-10-12","1998-10-19","1998-10-26","1998-11-02","1998-11-09","1998-11-16","1998-11-23","1998-11-30","1998-12-07","1998-12-14","1998-12-21","1998-12-28","1999-01-04","1999-01-11","1999-01-18","1999-01-25","1999-02-01","1999-02-08","1999-02-15","1999-02-22","1999-03-01","1999-03-08","1999-03-15","1999-03-22","1999-03-29","1999-04-05","1999-04-12","1999-04-19","1999-04-26","1999-05-03","1999-05-10","1999-05-17","1999-05-24","1999-05-31","1999-06-07","1999-06-14","1999-06-21","1999-06-28","1999-07-05","1999-07-12","1999-07-19","1999-07-26","1999-08-02","1999-08-09","1999-08-16","1999-08-23","1999-08-30","1999-09-06","1999-09-13","1999-09-20","1999-09-27","1999-10-04","1999-10-11","1999-10-18","1999-10-25","1999-11-01","1999-11-08","1999-11-15","1999-11-22","1999-11-29","1999-12-06","1999-12-13","1999-12-20","1999-12-27","2000-01-03","2000-01-10","2000-01-17","2000-01-24","2000-01-31","2000-02-07","2000-02-14","2000-02-21","2000-02-28","2000-03-06","2000-03-13","2000-03-20","2000-03-27","2000-04-03","2000-04-10","2000-04-17","2000-04-24","2000-05-01","2000-05-08","2000-05-15","2000-05-22","2000-05-29","2000-06-05","2000-06-12","2000-06-19","2000-06-26","2000-07-03","2000-07-10","2000-07-17","2000-07-24","2000-07-31","2000-08-07","2000-08-14","2000-08-21","2000-08-28","2000-09-04","2000-09-11","2000-09-18","2000-09-25","2000-10-02","2000-10-09","2000-10-16","2000-10-23","2000-10-30","2000-11-06","2000-11-13","2000-11-20","2000-11-27","2000-12-04","2000-12-11","2000-12-18","2000-12-25","2001-01-01","2001-01-08","2001-01-15","2001-01-22","2001-01-29","2001-02-05","2001-02-12","2001-02-19","2001-02-26","2001-03-05","2001-03-12","2001-03-19","2001-03-26","2001-04-02","2001-04-09","2001-04-16","2001-04-23","2001-04-30","2001-05-07","2001-05-14","2001-05-21","2001-05-28","2001-06-04","2001-06-11","2001-06-18","2001-06-25","2001-07-02","2001-07-09","2001-07-16","2001-07-23","2001-07-30","2001-08-06","2001-08-13","2001-08-20","2001-08-27","2001-09-03","2001-09-10","2001-09-17","2001-09-24","2001-10-01","2001-10-08","2001-10-15","2001-10-22","2001-10-29","2001-11-05","2001-11-12","2001-11-19","2001-11-26","2001-12-03","2001-12-10","2001-12-17","2001-12-24","2001-12-31","2002-01-07","2002-01-14","2002-01-21","2002-01-28","2002-02-04","2002-02-11","2002-02-18","2002-02-25","2002-03-04","2002-03-11","2002-03-18","2002-03-25","2002-04-01","2002-04-08","2002-04-15","2002-04-22","2002-04-29","2002-05-06","2002-05-13","2002-05-20","2002-05-27","2002-06-03","2002-06-10","2002-06-17","2002-06-24","2002-07-01","2002-07-08","2002-07-15","2002-07-22","2002-07-29","2002-08-05","2002-08-12","2002-08-19","2002-08-26","2002-09-02","2002-09-09","2002-09-16","2002-09-23","2002-09-30","2002-10-07","2002-10-14","2002-10-21","2002-10-28","2002-11-04","2002-11-11","2002-11-18","2002-11-25","2002-12-02","2002-12-09","2002-12-16","2002-12-23","2002-12-30","2003-01-06","2003-01-13","2003-01-20","2003-01-27","2003-02-03","2003-02-10","2003-02-17","2003-02-24","2003-03-03","2003-03-10","2003-03-17","2003-03-24","2003-03-31","2003-04-07","2003-04-14","2003-04-21","2003-04-28","2003-05-05","2003-05-12","2003-05-19","2003-05-26","2003-06-02","2003-06-09","2003-06-16","2003-06-23","2003-06-30","2003-07-07","2003-07-14","2003-07-21","2003-07-28","2003-08-04","2003-08-11","2003-08-18","2003-08-25","2003-09-01","2003-09-08","2003-09-15","2003-09-22","2003-09-29","2003-10-06","2003-10-13","2003-10-20","2003-10-27","2003-11-03","2003-11-10","2003-11-17","2003-11-24","2003-12-01","2003-12-08","2003-12-15","2003-12-22","2003-12-29","2004-01-05","2004-01-12","2004-01-19","2004-01-26","2004-02-02","2004-02-09","2004-02-16","2004-02-23","2004-03-01","2004-03-08","2004-03-15","2004-03-22","2004-03-29","2004-04-05","2004-04-12","2004-04-19","2004-04-26","2004-05-03","2004-05-10","2004-05-17","2004-05-24","2004-05-31","2004-06-07","2004-06-14","2004-06-21","2004-06-28","2004-07-05","2004-07-12","2004-07-19","2004-07-26","2004-08-02","2004-08-09","2004-08-16","2004-08-23","2004-08-30","2004-09-06","2004-09-13","2004-09-20","2004-09-27","2004-10-04","2004-10-11","2004-10-18","2004-10-25","2004-11-01","2004-11-08","2004-11-15","2004-11-22","2004-11-29","2004-12-06","2004-12-13","2004-12-20","2004-12-27","2005-01-03","2005-01-10","2005-01-17","2005-01-24","2005-01-31","2005-02-07","2005-02-14","2005-02-21","2005-02-28","2005-03-07","2005-03-14","2005-03-21","2005-03-28","2005-04-04","2005-04-11","2005-04-18","2005-04-25","2005-05-02","2005-05-09","2005-05-16","2005-05-23","2005-05-30","2005-06-06","2005-06-13","2005-06-20","2005-06-27","2005-07-04","2005-07-11","2005-07-18","2005-07-25","2005-08-01","2005-08-08","2005-08-15","2005-08-22","2005-08-29","2005-09-05","2005-09-12","2005-09-19","2005-09-26","2005-10-03","2005-10-10","2005-10-17","2005-10-24","2005-10-31","2005-11-07","2005-11-14","2005-11-21","2005-11-28","2005-12-05","2005-12-12","2005-12-19","2005-12-26","2006-01-02","2006-01-09","2006-01-16","2006-01-23","2006-01-30","2006-02-06","2006-02-13","2006-02-20","2006-02-27","2006-03-06","2006-03-13","2006-03-20","2006-03-27","2006-04-03","2006-04-10","2006-04-17","2006-04-24","2006-05-01","2006-05-08","2006-05-15","2006-05-22","2006-05-29","2006-06-05","2006-06-12","2006-06-19","2006-06-26","2006-07-03","2006-07-10","2006-07-17","2006-07-24","2006-07-31","2006-08-07","2006-08-14","2006-08-21","2006-08-28","2006-09-04","2006-09-11","2006-09-18","2006-09-25","2006-10-02","2006-10-09","2006-10-16","2006-10-23","2006-10-30","2006-11-06","2006-11-13","2006-11-20","2006-11-27","2006-12-04","2006-12-11","2006-12-18","2006-12-25","2007-01-01","2007-01-08","2007-01-15","2007-01-22","2007-01-29","2007-02-05","2007-02-12","2007-02-19","2007-02-26","2007-03-05","2007-03-12","2007-03-19","2007-03-26","2007-04-02","2007-04-09","2007-04-16","2007-04-23","2007-04-30","2007-05-07","2007-05-14","2007-05-21","2007-05-28","2007-06-04","2007-06-11","2007-06-18","2007-06-25","2007-07-02","2007-07-09","2007-07-16","2007-07-23","2007-07-30","2007-08-06","2007-08-13","2007-08-20","2007-08-27","2007-09-03","2007-09-10","2007-09-17","2007-09-24","2007-10-01","2007-10-08","2007-10-15","2007-10-22","2007-10-29","2007-11-05","2007-11-12","2007-11-19","2007-11-26","2007-12-03","2007-12-10","2007-12-17","2007-12-24","2007-12-31","2008-01-07","2008-01-14","2008-01-21","2008-01-28","2008-02-04","2008-02-11","2008-02-18","2008-02-25","2008-03-03","2008-03-10","2008-03-17","2008-03-24","2008-03-31","2008-04-07","2008-04-14","2008-04-21","2008-04-28","2008-05-05","2008-05-12","2008-05-19","2008-05-26","2008-06-02","2008-06-09","2008-06-16","2008-06-23","2008-06-30","2008-07-07","2008-07-14","2008-07-21","2008-07-28","2008-08-04","2008-08-11","2008-08-18","2008-08-25","2008-09-01","2008-09-08","2008-09-15","2008-09-22","2008-09-29","2008-10-06","2008-10-13","2008-10-20","2008-10-27","2008-11-03","2008-11-10","2008-11-17","2008-11-24","2008-12-01","2008-12-08","2008-12-15","2008-12-22","2008-12-29","2009-01-05","2009-01-12","2009-01-19","2009-01-26","2009-02-02","2009-02-09","2009-02-16","2009-02-23","2009-03-02","2009-03-09","2009-03-16","2009-03-23","2009-03-30","2009-04-06","2009-04-13","2009-04-20","2009-04-27","2009-05-04","2009-05-11","2009-05-18","2009-05-25","2009-06-01","2009-06-08","2009-06-15","2009-06-22","2009-06-29","2009-07-06","2009-07-13","2009-07-20","2009-07-27","2009-08-03","2009-08-10","2009-08-17","2009-08-24","2009-08-31","2009-09-07","2009-09-14","2009-09-21","2009-09-28","2009-10-05","2009-10-12","2009-10-19","2009-10-26","2009-11-02","2009-11-09","2009-11-16","2009-11-23","2009-11-30","2009-12-07","2009-12-14","2009-12-21","2009-12-28","2010-01-04","2010-01-11","2010-01-18","2010-01-25","2010-02-01","2010-02-08","2010-02-15","2010-02-22","2010-03-01","2010-03-08","2010-03-15","2010-03-22","2010-03-29","2010-04-05","2010-04-12","2010-04-19","2010-04-26","2010-05-03","2010-05-10","2010-05-17","2010-05-24","2010-05-31","2010-06-07","2010-06-14","2010-06-21","2010-06-28","2010-07-05","2010-07-12","2010-07-19","2010-07-26","2010-08-02","2010-08-09","2010-08-16","2010-08-23","2010-08-30","2010-09-06","2010-09-13","2010-09-20","2010-09-27","2010-10-04","2010-10-11","2010-10-18","2010-10-25","2010-11-01","2010-11-08","2010-11-15","2010-11-22","2010-11-29","2010-12-06","2010-12-13","2010-12-20","2010-12-27","2011-01-03","2011-01-10","2011-01-17","2011-01-24","2011-01-31","2011-02-07","2011-02-14","2011-02-21","2011-02-28","2011-03-07","2011-03-14","2011-03-21","2011-03-28","2011-04-04","2011-04-11","2011-04-18","2011-04-25","2011-05-02","2011-05-09","2011-05-16","2011-05-23","2011-05-30","2011-06-06","2011-06-13","2011-06-20","2011-06-27","2011-07-04","2011-07-11","2011-07-18","2011-07-25","2011-08-01","2011-08-08","2011-08-15","2011-08-22","2011-08-29","2011-09-05","2011-09-12","2011-09-19","2011-09-26","2011-10-03","2011-10-10","2011-10-17","2011-10-24","2011-10-31","2011-11-07","2011-11-14","2011-11-21","2011-11-28","2011-12-05","2011-12-12","2011-12-19","2011-12-26","2012-01-02","2012-01-09","2012-01-16","2012-01-23","2012-01-30","2012-02-06","2012-02-13","2012-02-20","2012-02-27","2012-03-05","2012-03-12","2012-03-19","2012-03-26","2012-04-02","2012-04-09","2012-04-16","2012-04-23","2012-04-30","2012-05-07","2012-05-14","2012-05-21","2012-05-28","2012-06-04","2012-06-11","2012-06-18","2012-06-25","2012-07-02","2012-07-09","2012-07-16","2012-07-23","2012-07-30","2012-08-06","2012-08-13","2012-08-20","2012-08-27","2012-09-03","2012-09-10","2012-09-17","2012-09-24","2012-10-01","2012-10-08","2012-10-15","2012-10-22","2012-10-29","2012-11-05","2012-11-12","2012-11-19","2012-11-26","2012-12-03","2012-12-10","2012-12-17","2012-12-24","2012-12-31","2013-01-07","2013-01-14","2013-01-21","2013-01-28","2013-02-04","2013-02-11","2013-02-18","2013-02-25","2013-03-04","2013-03-11","2013-03-18","2013-03-25","2013-04-01","2013-04-08","2013-04-15","2013-04-22","2013-04-29","2013-05-06","2013-05-13","2013-05-20","2013-05-27","2013-06-03","2013-06-10","2013-06-17","2013-06-24","2013-07-01","2013-07-08","2013-07-15","2013-07-22","2013-07-29","2013-08-05","2013-08-12","2013-08-19","2013-08-26","2013-09-02","2013-09-09","2013-09-16","2013-09-23","2013-09-30","2013-10-07","2013-10-14","2013-10-21","2013-10-28","2013-11-04","2013-11-11","2013-11-18","2013-11-25","2013-12-02","2013-12-09","2013-12-16","2013-12-23","2013-12-30","2014-01-06","2014-01-13","2014-01-20","2014-01-27","2014-02-03","2014-02-10","2014-02-17","2014-02-24","2014-03-03","2014-03-10","2014-03-17","2014-03-24","2014-03-31","2014-04-07","2014-04-14","2014-04-21","2014-04-28","2014-05-05","2014-05-12","2014-05-19","2014-05-26","2014-06-02","2014-06-09","2014-06-16","2014-06-23","2014-06-30","2014-07-07","2014-07-14","2014-07-21","2014-07-28","2014-08-04","2014-08-11","2014-08-18","2014-08-25","2014-09-01","2014-09-08","2014-09-15","2014-09-22","2014-09-29","2014-10-06","2014-10-13","2014-10-20","2014-10-27","2014-11-03","2014-11-10","2014-11-17","2014-11-24","2014-12-01","2014-12-08","2014-12-15","2014-12-22","2014-12-29","2015-01-05","2015-01-12","2015-01-19","2015-01-26","2015-02-02","2015-02-09","2015-02-16","2015-02-23","2015-03-02","2015-03-09","2015-03-16","2015-03-23","2015-03-30","2015-04-06","2015-04-13","2015-04-20","2015-04-27","2015-05-04","2015-05-11","2015-05-18","2015-05-25","2015-06-01","2015-06-08","2015-06-15","2015-06-22","2015-06-29","2015-07-06","2015-07-13","2015-07-20","2015-07-27","2015-08-03","2015-08-10","2015-08-17","2015-08-24","2015-08-31","2015-09-07","2015-09-14","2015-09-21","2015-09-28","2015-10-05","2015-10-12","2015-10-19","2015-10-26","2015-11-02","2015-11-09","2015-11-16","2015-11-23","2015-11-30","2015-12-07","2015-12-14","2015-12-21","2015-12-28","2016-01-04","2016-01-11","2016-01-18","2016-01-25","2016-02-01","2016-02-08","2016-02-15","2016-02-22","2016-02-29","2016-03-07","2016-03-14","2016-03-21","2016-03-28","2016-04-04","2016-04-11","2016-04-18","2016-04-25","2016-05-02","2016-05-09","2016-05-16","2016-05-23","2016-05-30","2016-06-06","2016-06-13","2016-06-20","2016-06-27","2016-07-04","2016-07-11","2016-07-18","2016-07-25","2016-08-01","2016-08-08","2016-08-15","2016-08-22","2016-08-29","2016-09-05","2016-09-12","2016-09-19","2016-09-26","2016-10-03","2016-10-10","2016-10-17","2016-10-24","2016-10-31","2016-11-07","2016-11-14","2016-11-21","2016-11-28","2016-12-05","2016-12-12","2016-12-19","2016-12-26","2017-01-02","2017-01-09","2017-01-16","2017-01-23","2017-01-30","2017-02-06","2017-02-13","2017-02-20","2017-02-27","2017-03-06","2017-03-13","2017-03-20","2017-03-27","2017-04-03","2017-04-10","2017-04-17","2017-04-24","2017-05-01","2017-05-08","2017-05-15","2017-05-22","2017-05-29","2017-06-05","2017-06-12","2017-06-19","2017-06-26","2017-07-03","2017-07-10","2017-07-17","2017-07-24","2017-07-31","2017-08-07","2017-08-14","2017-08-21","2017-08-28","2017-09-04","2017-09-11","2017-09-18","2017-09-25","2017-10-02","2017-10-09","2017-10-16","2017-10-23","2017-10-30","2017-11-06","2017-11-13","2017-11-20","2017-11-27","2017-12-04","2017-12-11","2017-12-18","2017-12-25","2018-01-01","2018-01-08","2018-01-15","2018-01-22","2018-01-29","2018-02-05","2018-02-12","2018-02-19","2018-02-26","2018-03-05","2018-03-12","2018-03-19","2018-03-26","2018-04-02","2018-04-09","2018-04-16","2018-04-23","2018-04-30","2018-05-07","2018-05-14","2018-05-21","2018-05-28","2018-06-04","2018-06-11","2018-06-18","2018-06-25","2018-07-02","2018-07-09","2018-07-16","2018-07-23","2018-07-30","2018-08-06","2018-08-13","2018-08-20","2018-08-27","2018-09-03","2018-09-10","2018-09-17","2018-09-24","2018-10-01","2018-10-08","2018-10-15","2018-10-22","2018-10-29","2018-11-05","2018-11-12","2018-11-19","2018-11-26","2018-12-03","2018-12-10","2018-12-17","2018-12-24","2018-12-31","2019-01-07","2019-01-14","2019-01-21","2019-01-28","2019-02-04","2019-02-11","2019-02-18","2019-02-25","2019-03-04","2019-03-11","2019-03-18","2019-03-25","2019-04-01","2019-04-08","2019-04-15","2019-04-22","2019-04-29","2019-05-06","2019-05-13","2019-05-20","2019-05-27","2019-06-03","2019-06-10","2019-06-17","2019-06-24","2019-07-01","2019-07-08","2019-07-15","2019-07-22","2019-07-29","2019-08-05","2019-08-12","2019-08-19","2019-08-26","2019-09-02","2019-09-09","2019-09-16","2019-09-23","2019-09-30","2019-10-07","2019-10-14","2019-10-21","2019-10-28","2019-11-04","2019-11-11","2019-11-18","2019-11-25","2019-12-02","2019-12-09","2019-12-16","2019-12-23","2019-12-30","2020-01-06","2020-01-13","2020-01-20","2020-01-27","2020-02-03","2020-02-10","2020-02-17","2020-02-24","2020-03-02","2020-03-09","2020-03-16","2020-03-23","2020-03-30","2020-04-06","2020-04-13","2020-04-20","2020-04-27","2020-05-04","2020-05-11","2020-05-18","2020-05-25","2020-06-01","2020-06-08","2020-06-15","2020-06-22","2020-06-29","2020-07-06","2020-07-13","2020-07-20","2020-07-27","2020-08-03","2020-08-10","2020-08-17","2020-08-24","2020-08-31","2020-09-07","2020-09-14","2020-09-21","2020-09-28","2020-10-05","2020-10-12","2020-10-19","2020-10-26","2020-11-02","2020-11-09","2020-11-16","2020-11-23","2020-11-30","2020-12-07","2020-12-14","2020-12-21","2020-12-28","2021-01-04","2021-01-11","2021-01-18","2021-01-25","2021-02-01","2021-02-08","2021-02-15","2021-02-22","2021-03-01","2021-03-08","2021-03-15","2021-03-22","2021-03-29","2021-04-05","2021-04-12","2021-04-19","2021-04-26","2021-05-03","2021-05-10","2021-05-17","2021-05-24","2021-05-31","2021-06-07","2021-06-14","2021-06-21","2021-06-28","2021-07-05","2021-07-12","2021-07-19","2021-07-26","2021-08-02","2021-08-09","2021-08-16","2021-08-23","2021-08-30","2021-09-06","2021-09-13","2021-09-20","2021-09-27","2021-10-04","2021-10-11","2021-10-18","2021-10-25","2021-11-01","2021-11-08","2021-11-15","2021-11-22","2021-11-29","2021-12-06","2021-12-13","2021-12-20","2021-12-27","2022-01-03","2022-01-10","2022-01-17","2022-01-24","2022-01-31","2022-02-07","2022-02-14","2022-02-21","2022-02-28","2022-03-07","2022-03-14","2022-03-21","2022-03-28","2022-04-04","2022-04-11","2022-04-18","2022-04-25","2022-05-02","2022-05-09","2022-05-16","2022-05-23","2022-05-30","2022-06-06","2022-06-13","2022-06-20","2022-06-27","2022-07-04","2022-07-11","2022-07-18","2022-07-25","2022-08-01","2022-08-08","2022-08-15","2022-08-22","2022-08-29","2022-09-05","2022-09-12","2022-09-19","2022-09-26","2022-10-03","2022-10-10","2022-10-17","2022-10-24","2022-10-31","2022-11-07","2022-11-14","2022-11-21","2022-11-28","2022-12-05","2022-12-12","2022-12-19","2022-12-26","2023-01-02","2023-01-09","2023-01-16","2023-01-23","2023-01-30","2023-02-06","2023-02-13","2023-02-20","2023-02-27","2023-03-06","2023-03-13","2023-03-20","2023-03-27","2023-04-03","2023-04-10","2023-04-17","2023-04-24","2023-05-01","2023-05-08","2023-05-15","2023-05-22","2023-05-29","2023-06-05","2023-06-12","2023-06-19","2023-06-26","2023-07-03","2023-07-10","2023-07-17","2023-07-24","2023-07-31","2023-08-07","2023-08-14","2023-08-21","2023-08-28","2023-09-04","2023-09-11","2023-09-18","2023-09-25","2023-10-02","2023-10-09","2023-10-16","2023-10-23","2023-10-30","2023-11-06","2023-11-13","2023-11-20","2023-11-27","2023-12-04","2023-12-11","2023-12-18","2023-12-25","2024-01-01","2024-01-08","2024-01-15","2024-01-22","2024-01-29","2024-02-05","2024-02-12","2024-02-19","2024-02-26","2024-03-04","2024-03-11","2024-03-18","2024-03-25","2024-04-01","2024-04-08","2024-04-15","2024-04-22","2024-04-29","2024-05-06","2024-05-13","2024-05-20","2024-05-27","2024-06-03","2024-06-10","2024-06-17","2024-06-24","2024-07-01","2024-07-08","2024-07-15","2024-07-22","2024-07-29","2024-08-05","2024-08-12","2024-08-19","2024-08-26","2024-09-02","2024-09-09","2024-09-16","2024-09-23","2024-09-30","2024-10-07","2024-10-14","2024-10-21","2024-10-28","2024-11-04","2024-11-11","2024-11-18","2024-11-25","2024-12-02","2024-12-09","2024-12-16","2024-12-23","2024-12-30","2025-01-06","2025-01-13","2025-01-20","2025-01-27","2025-02-03","2025-02-10","2025-02-17","2025-02-24","2025-03-03","2025-03-10","2025-03-17","2025-03-24","2025-03-31","2025-04-07","2025-04-14","2025-04-21","2025-04-28","2025-05-05","2025-05-12","2025-05-19","2025-05-26","2025-06-02","2025-06-09","2025-06-16","2025-06-23","2025-06-30","2025-07-07","2025-07-14","2025-07-21","2025-07-28","2025-08-04","2025-08-11","2025-08-18","2025-08-25","2025-09-01","2025-09-08","2025-09-15","2025-09-22","2025-09-29","2025-10-06","2025-10-13","2025-10-20","2025-10-27","2025-11-03","2025-11-10","2025-11-17","2025-11-24","2025-12-01","2025-12-08","2025-12-15","2025-12-22","2025-12-29","2026-01-05","2026-01-12","2026-01-19","2026-01-26","2026-02-02","2026-02-09","2026-02-16","2026-02-23","2026-03-09"],"o":[35.18,35.14,35.18,35.19,35.19,35.19,35.19,35.2,35.2,35.2,35.2,38.0,37.0,38.1,38.3,38.55,39.7,39.4,42.0,41.5,41.2,41.35,40.9,41.05,40.9,40.95,39.15,38.65,38.9,38.85,38.6,39.15,39.4,39.98,40.0,40.2,40.43,39.7,39.8,39.3,39.1,39.38,39.25,39.5,40.0,40.3,39.9,40.63,40.98,41.7,42.0,42.03,42.0,42.2,42.2,42.5,42.55,42.65,42.7,42.75,43.75,43.03,43.25,43.1,43.35,43.28,43.2,43.55,43.48,43.45,43.48,43.5,42.95,40.7,41.25,41.23,41.23,41.76,41.95,42.0,41.72,41.4,41.45,41.2,41.0,40.79,40.9,41.0,40.88,40.65,40.9,40.63,40.48,40.15,39.58,37.9,37.9,35.83,35.53,35.2,35.2,35.04,35.23,35.1,34.98,34.78,34.98,34.95,35.01,35.0,35.0,35.0,34.97,35.05,35.15,35.3,35.33,35.43,35.76,35.74,35.9,36.15,35.98,35.85,35.45,35.25,35.64,35.4,35.48,35.35,35.33,35.33,35.3,35.3,35.3,35.25,35.5,35.85,36.23,36.35,36.23,36.18,36.53,37.25,37.66,39.15,37.7,37.23,37.9,37.55,37.6,37.5,37.2,37.63,37.34,37.33,37.5,38.1,37.9,38.1,38.5,38.9,38.75,38.75,38.75,39.08,38.95,38.83,38.9,38.9,38.95,39.0,39.42,39.65,41.1,40.75,40.85,40.5,39.6,39.95,40.08,40.23,40.35,41.01,41.45,42.48,42.9,43.0,43.25,41.0,41.8,41.59,42.05,42.35,42.5,42.45,42.51,42.48,42.13,42.35,42.85,43.25,43.65,43.9,43.65,42.4,43.3,43.73,45.7,45.98,45.93,46.95,47.45,48.2,48.4,48.49,48.0,48.35,48.35,48.35,48.4,48.4,49.35,49.35,50.2,51.6,52.8,57.2,58.7,59.4,59.0,60.6,63.5,64.25,65.05,65.2,65.1,68.9,68.4,64.75,66.6,66.6,66.85,67.2,64.5,63.8,64.1,65.7,64.85,64.93,64.5,64.05,62.54,60.38,63.05,63.4,63.0,64.4,64.9,64.99,65.15,65.1,64.6,65.3,66.9,68.53,73.7,83.0,83.0,81.75,82.25,86.0,89.25,90.75,89.6,90.9,90.7,90.3,99.75,112.5,108.25,120.75,115.5,122.0,118.0,123.0,126.0,119.75,118.5,114.0,115.5,103.75,107.25,102.0,105.5,105.25,102.5,102.5,98.5,102.25,101.75,100.0,98.5,98.0,97.25,90.5,90.0,100.0,105.5,106.75,108.75,112.25,119.8,123.75,141.75,139.75,132.25,144.5,150.0,166.5,168.25,163.5,162.5,176.75,173.0,168.5,174.0,173.6,166.75,167.4,167.5,164.25,157.0,156.5,156.5,157.5,152.0,144.5,137.0,139.5,144.0,152.5,153.1,153.0,153.0,153.25,158.0,156.0,152.75,147.75,147.5,160.0,154.5,157.5,165.0,168.6,182.5,190.0,182.25,185.5,179.25,184.0,192.25,197.5,173.0,180.0,172.75,179.5,177.25,173.5,182.5,184.4,181.6,176.75,177.75,177.25,177.25,173.25,171.0,168.0,165.5,163.5,165.15,166.75,172.75,163.25,165.0,164.0,162.5,166.0,163.0,166.0,163.6,166.75,166.35,162.5,162.25,162.0,154.25,152.75,148.25,138.0,136.0,137.5,142.5,143.75,143.6,143.0,144.0,142.1,141.35,138.15,137.9,138.65,142.0,141.25,140.15,136.5,129.35,126.65,128.4,130.75,131.6,131.5,132.45,133.15,133.9,134.0,131.1,127.7,127.1,128.0,127.5,128.25,128.25,127.7,125.6,126.05,127.0,125.8,125.6,124.3,123.1,122.2,117.75,111.1,111.5,112.8,113.35,107.3,103.05,112.0,113.95,115.1,118.75,114.9,113.65,116.2,115.65,122.0,130.0,138.2,132.75,128.75,133.0,136.0,131.5,134.2,136.1,131.45,131.0,132.3,132.1,133.3,136.3,137.25,142.25,147.75,145.65,151.4,151.2,149.75,149.5,151.0,149.3,147.5,147.8,147.6,146.55,144.0,142.4,139.5,139.5,141.6,140.55,141.05,143.75,145.75,144.8,146.15,144.3,144.2,145.65,147.8,148.0,149.2,152.35,155.1,156.8,160.8,162.7,160.8,166.5,166.5,158.5,160.5,158.6,158.0,159.75,164.1,168.6,168.6,174.45,174.95,175.9,175.5,176.5,181.6,182.1,184.1,185.2,181.35,183.2,182.75,178.7,175.1,169.0,169.15,171.95,175.0,179.35,181.7,182.5,181.4,184.15,185.1,183.0,185.5,185.05,195.5,198.9,205.0,212.25,205.15,199.4,212.5,205.7,209.3,216.65,217.0,222.45,224.3,229.0,241.3,208.25,209.1,199.15,199.7,197.7,205.4,212.2,220.75,227.15,224.1,216.55,234.4,234.05,238.8,249.6,249.6,250.3,242.8,241.1,243.85,244.3,240.05,240.0,231.75,236.75,243.45,250.2,250.65,261.05,276.1,273.6,282.4,279.9,284.5,282.2,290.25,291.4,303.6,304.65,287.0,304.1,299.1,316.2,319.3,336.4,350.75,377.0,399.5,376.75,400.2,395.5,374.5,378.0,393.0,390.0,393.0,428.0,431.35,460.6,485.9,524.0,634.0,647.75,843.0,629.0,672.0,714.5,665.25,625.0,637.0,602.0,480.0,544.0,503.25,518.4,532.8,506.5,535.25,517.5,510.5,515.1,514.2,563.0,627.5,599.0,596.0,662.5,665.75,649.0,620.75,643.25,622.25,614.5,609.75,629.0,626.25,660.0,672.5,698.75,687.25,671.5,683.5,664.2,633.5,634.3,617.0,609.25,635.0,635.5,615.25,581.0,594.0,602.25,592.0,564.25,558.75,530.25,493.25,515.0,487.0,506.5,474.5,473.25,499.25,535.75,529.5,534.25,475.5,481.0,488.75,476.75,501.0,481.75,468.5,481.25,460.0,472.25,462.0,431.5,403.5,417.75,414.75,409.75,392.5,393.2,409.5,428.5,422.5,437.25,456.0,459.25,427.5,440.75,451.6,440.75,428.0,431.0,430.1,408.25,396.0,415.5,417.25,419.25,413.75,396.25,399.0,392.0,369.75,373.5,381.25,381.5,375.55,364.0,358.75,335.5,314.25,318.5,319.5,336.0,352.5,356.75,361.0,343.5,329.5,337.25,331.85,319.0,322.9,322.25,297.0,303.4,315.5,338.5,350.0,357.0,352.13,337.75,337.25,381.75,409.6,458.0,440.0,426.25,414.25,392.75,432.75,426.5,420.5,426.75,411.0,404.5,413.4,428.5,443.0,438.75,440.75,456.75,452.75,474.0,494.5,475.75,503.0,489.0,500.5,503.75,419.75,421.25,431.75,414.5,412.0,425.75,427.75,443.0,442.25,431.0,435.0,438.5,433.0,439.0,408.75,412.0,411.25,423.25,416.0,426.15,423.25,423.25,413.25,410.5,415.3,421.25,418.85,420.0,416.9,410.25,416.25,393.5,399.25,400.5,396.25,383.5,377.0,382.6,374.75,381.25,402.4,390.9,376.65,379.1,384.0,364.25,370.25,371.25,369.25,380.4,377.5,384.5,394.0,406.85,397.5,392.15,388.5,387.25,381.5,380.0,384.6,376.2,371.5,371.2,380.35,385.5,394.5,383.6,369.4,370.45,370.45,332.5,352.25,335.25,339.15,352.4,343.0,349.7,348.15,346.2,337.2,338.0,347.25,344.75,342.75,338.25,338.0,335.8,342.3,345.8,343.0,339.5,327.7,326.25,316.85,310.25,309.0,296.75,301.25,307.0,298.6,301.25,300.0,314.95,290.0,288.3,290.25,293.7,315.9,324.65,323.1,330.3,328.1,323.0,311.25,316.75,323.65,313.9,316.85,310.75,317.25,314.1,315.35,312.2,317.15,317.4,323.0,323.0,326.6,339.25,335.25,335.45,320.2,318.85,328.1,326.5,326.25,326.6,326.5,326.5,325.6,323.25,323.75,330.5,323.95,320.15,318.25,325.75,326.15,327.8,340.75,353.25,361.75,347.35,340.5,333.0,343.35,339.45,341.8,348.2,352.4,333.7,336.5,343.2,342.45,344.4,341.55,344.9,342.05,341.15,343.0,341.85,346.5,340.5,345.5,344.45,346.2,353.0,350.8,358.75,394.5,377.25,379.3,392.0,419.0,416.0,442.75,429.45,436.5,431.4,420.0,409.6,400.3,409.9,393.25,380.4,399.6,390.5,394.6,395.35,391.4,399.0,409.9,421.25,405.35,406.45,402.95,397.2,403.0,404.4,404.85,404.65,406.6,421.8,420.55,436.5,454.3,476.6,464.5,454.75,476.5,459.65,443.4,454.4,450.35,443.6,446.0,443.1,443.7,449.65,453.1,473.25,459.5,454.8,455.8,453.1,463.35,456.6,458.85,460.9,455.15,461.85,479.5,474.85,469.95,463.5,461.75,468.25,493.9,480.9,502.75,481.0,489.55,484.1,485.3,475.85,476.5,454.65,443.05,443.6,445.1,423.75,436.0,441.9,446.5,453.1,456.0,450.15,457.55,449.75,444.3,443.6,453.4,460.25,454.0,464.1,450.5,453.9,442.0,437.15,439.65,437.65,442.2,436.4,431.85,431.15,429.7,429.4,427.0,418.0,409.0,389.05,394.2,406.25,411.15,406.3,412.3,422.0,420.65,416.6,421.4,430.4,421.0,413.65,413.65,413.6,404.45,401.75,407.75,394.3,390.25,386.7,382.15,390.75,388.4,393.1,395.3,391.25,385.3,381.6,385.15,383.9,376.9,377.15,374.25,359.25,362.1,367.7,358.5,363.6,375.3,375.4,382.45,370.9,372.0,369.1,367.25,363.0,365.5,360.0,358.75,358.1,360.1,368.75,366.45,362.95,366.45,365.8,378.5,378.15,389.05,396.05,417.15,409.9,414.0,411.65,409.45,401.65,403.75,415.3,408.7,420.75,418.75,415.25,416.95,412.75,403.0,400.4,401.25,379.25,368.0,378.85,373.85,375.65,371.55,372.1,368.3,373.4,368.35,358.75,354.7,349.0,351.4,357.1,359.9,362.5,361.8,367.8,380.0,399.9,410.9,392.55,387.5,382.5,387.9,390.15,400.0,391.25,381.85,368.5,371.0,377.05,381.9,377.6,387.05,381.75,372.25,376.85,382.0,391.0,391.0,395.35,378.25,374.5,367.0,368.0,364.6,357.5,365.5,369.25,363.4,361.75,357.9,358.8,360.6,356.25,351.3,356.25,356.75,353.9,356.3,361.5,367.6,367.3,365.2,368.65,371.35,369.1,370.1,366.0,355.6,357.75,360.75,354.1,347.6,350.1,344.9,349.05,350.5,359.2,360.3,363.1,359.5,356.65,354.9,360.05,368.4,368.25,370.2,360.05,359.2,353.3,351.15,354.9,356.6,354.85,357.1,354.7,354.2,349.0,350.55,349.0,346.75,338.0,342.75,340.5,342.0,338.2,336.5,336.5,336.5,339.2,337.0,336.8,338.5,342.25,341.6,342.55,346.2,348.9,358.8,358.0,357.3,350.75,337.5,341.85,342.65,343.25,342.75,348.25,349.0,348.75,348.1,342.25,341.3,339.3,335.0,336.0,334.25,333.7,335.5,335.3,336.35,332.9,329.4,328.4,327.9,328.6,329.5,327.6,328.35,328.9,328.4,328.7,327.9,332.2,331.6,339.35,336.95,340.4,348.55,353.4,356.25,367.85,380.0,378.25,375.45,366.3,369.55,378.1,387.25,394.4,392.8,389.75,406.7,382.5,373.5,373.6,370.6,364.2,348.25,353.5,357.25,355.5,360.55,365.0,371.5,367.95,377.9,373.9,378.15,376.7,376.15,387.55,389.75,385.65,395.0,382.2,392.6,381.5,378.2,383.95,381.9,379.75,380.75,377.0,386.3,386.8,390.9,387.4,384.9,377.35,370.25,375.7,381.4,380.65,386.75,386.25,380.25,382.5,391.0,390.25,387.3,384.4,386.4,384.85,384.0,377.7,376.45,381.6,386.15,386.9,391.5,390.15,395.4,393.45,391.95,388.95,389.2,387.4,383.2,384.9,383.6,384.7,377.3,376.85,379.0,381.8,381.4,372.45,377.45,385.1,375.9,375.25,375.6,379.3,376.8,376.6,382.75,382.45,382.3,392.25,390.9,394.1,391.05,386.5,389.9,383.9,382.35,386.1,383.4,387.6,390.5,389.3,384.35,385.75,388.2,386.45,383.35,383.75,383.5,385.55,383.25,379.85,381.9,384.95,382.2,383.1,384.65,384.0,382.55,382.05,382.5,389.6,386.55,385.2,386.25,389.7,387.0,387.35,387.1,396.0,395.0,401.8,405.45,415.25,405.25,405.9,399.55,398.65,396.6,395.45,398.0,395.0,397.6,393.75,390.7,390.75,393.75,391.25,391.65,392.15,390.8,385.55,384.55,383.7,380.6,382.3,383.55,384.5,385.05,387.95,387.2,386.25,389.0,386.9,385.0,382.65,381.2,379.3,379.6,381.05,380.0,382.8,378.65,379.75,379.7,375.1,370.5,368.5,368.6,368.7,369.6,359.25,359.6,354.2,353.1,343.75,341.0,343.6,352.45,361.8,349.9,352.05,350.65,349.85,347.85,346.65,342.15,341.25,342.8,348.2,343.35,343.55,344.0,343.85,340.95,336.95,334.05,318.75,321.35,328.05,325.4,324.05,326.2,326.05,325.4,324.4,322.05,323.15,321.1,327.05,334.15,328.8,324.25,311.8,313.5,309.7,303.0,305.5,293.35,288.1,283.2,290.45,293.9,287.35,278.5,285.75,304.5,302.0,300.0,297.7,295.2,299.75,294.45,294.15,292.8,302.2,313.5,309.5,307.3,311.4,304.2,299.0,299.7,298.85,292.35,290.3,286.1,294.75,293.0,293.15,290.7,294.65,290.75,286.65,286.2,283.3,284.3,277.7,288.35,290.3,292.1,293.8,298.75,296.65,298.35,291.2,292.75,292.4,295.35,295.6,295.75,292.35,291.25,289.95,286.7,288.25,291.25,286.95,286.3,287.1,288.85,290.05,287.2,287.05,288.5,291.25,284.5,280.35,278.35,282.7,284.65,283.1,285.6,280.65,276.1,272.2,265.5,266.35,259.3,259.15,260.0,262.85,256.05,253.15,253.5,255.35,256.45,259.25,257.5,254.6,254.9,256.6,255.3,281.7,311.75,317.75,317.65,302.4,293.85,289.0,292.7,294.4,293.1,277.25,279.75,284.25,290.65,282.05,281.7,284.9,287.45,283.05,316.6,308.75,305.75,292.75,289.25,289.65,284.85,284.35,278.8,281.5,283.5,280.0,275.0,277.25,275.65,274.0,274.4,281.7,284.1,288.1,283.0,288.05,284.25,282.4,280.05,277.4,273.5,275.45,276.4,274.0,277.0,272.6,272.45,273.55,274.3,270.25,272.05,271.25,265.65,265.75,264.3,265.75,266.2,271.15,272.5,270.5,274.7,272.8,268.6,263.35,266.1,263.1,266.25,260.9,258.95,262.8,261.85,270.5,260.5,261.3,257.55,260.9,262.15,262.9,263.45,265.6,267.7,288.35,276.65,266.25,272.75,271.5,273.1,269.1,266.85,268.0,269.25,266.4,267.9,275.1,277.75,271.6,273.55,273.2,291.0,289.65,291.65,292.85,283.75,277.55,277.7,278.95,277.7,274.2,273.05,275.25,273.35,277.8,277.7,276.5,279.65,286.4,282.65,279.35,285.8,301.5,298.5,291.8,299.55,291.75,291.0,297.7,302.65,298.5,301.8,303.35,310.65,312.65,311.6,311.8,320.8,324.5,323.1,317.95,326.35,312.3,313.0,316.35,324.0,303.05,307.6,316.25,313.05,309.4,312.25,322.2,316.55,323.45,322.4,322.35,318.0,313.4,313.3,317.2,321.1,319.8,319.5,317.3,325.3,332.9,343.9,348.5,356.1,352.35,355.8,370.8,369.0,371.75,346.55,352.9,348.45,353.1,340.5,330.15,335.35,319.75,325.6,333.25,333.75,342.65,350.35,359.75,372.35,361.3,362.8,359.0,356.05,345.15,350.25,344.5,347.8,361.95,348.95,357.0,361.3,360.75,376.35,376.4,375.3,386.2,379.85,372.75,370.8,371.45,386.75,383.25,382.85,398.0,394.25,398.75,408.75,404.5,410.8,413.5,417.75,428.2,407.1,406.2,401.85,406.7,410.7,399.85,398.5,399.4,399.0,414.1,420.9,420.55,417.45,405.3,396.5,389.75,374.1,380.8,383.85,395.85,393.45,382.9,393.85,401.7,398.4,408.55,406.95,391.65,393.25,398.6,399.3,409.95,408.1,401.6,400.75,404.15,409.0,416.85,421.75,418.5,429.0,428.1,432.95,439.5,447.0,450.4,455.75,436.95,441.75,443.5,426.8,421.25,422.85,427.6,423.8,414.5,422.8,427.1,436.55,433.6,442.75,436.25,426.95,425.95,428.1,425.65,433.0,429.2,425.8,419.9,417.6,416.9,424.8,425.6,440.5,439.35,427.6,425.0,421.6,424.85,431.35,436.85,442.6,437.5,436.15,445.6,449.15,461.95,461.05,465.0,477.5,472.35,463.75,472.65,457.6,469.75,488.0,497.3,505.0,537.5,507.45,509.15,520.75,541.0,559.4,558.5,560.3,570.0,546.6,556.0,556.1,568.0,545.25,554.25,564.0,585.5,597.5,616.75,634.0,657.75,682.0,693.0,645.5,652.25,644.5,607.75,569.75,586.25,619.5,624.5,671.5,616.4,637.0,647.25,628.0,621.5,616.85,626.75,597.1,581.5,589.5,602.0,578.25,593.0,588.5,604.75,625.75,628.5,624.0,637.5,644.8,625.5,617.5,628.3,640.75,608.3,628.25,635.1,643.4,648.0,663.35,670.5,684.5,638.6,652.5,654.5,659.65,663.3,676.85,687.25,691.0,678.0,685.9,674.2,662.4,657.6,670.75,652.75,658.0,651.25,650.5,657.0,667.25,683.5,661.5,674.15,669.85,658.5,667.0,672.75,704.0,710.25,733.25,745.25,736.5,755.85,755.6,792.5,802.5,817.0,788.5,836.25,783.75,800.0,787.0,810.25,836.5,857.5,911.5,874.25,916.5,899.5,925.5,905.0,947.5,978.25,973.15,1023.5,930.65,937.25,914.7,917.75,915.75,892.25,878.0,882.5,908.75,923.75,891.25,904.25,872.0,905.25,932.75,921.0,957.75,966.25,929.25,910.0,863.75,797.5,809.75,832.0,806.5,779.25,873.0,876.5,836.5,865.0,803.0,720.5,734.0,751.75,745.0,816.75,795.5,772.25,827.5,846.0,881.0,860.0,848.5,842.5,906.5,913.75,901.0,943.0,987.0,949.5,934.75,923.0,952.75,923.0,879.5,895.0,870.0,911.75,903.0,912.5,929.75,942.0,987.0,946.5,932.0,924.0,939.75,921.5,908.5,952.25,956.0,954.25,953.5,937.5,953.75,949.75,992.75,994.25,999.25,990.5,1004.25,1052.0,1054.5,1055.0,1052.0,1108.5,1128.75,1166.0,1172.0,1147.5,1120.0,1113.25,1103.0,1113.0,1158.0,1135.75,1103.5,1082.0,1070.0,1099.5,1119.75,1117.25,1134.0,1104.0,1104.25,1111.25,1124.0,1163.5,1127.5,1154.0,1184.25,1188.25,1230.25,1183.75,1219.75,1212.4,1229.5,1259.5,1256.0,1208.5,1203.75,1190.25,1189.0,1178.0,1206.0,1222.0,1227.0,1233.5,1249.5,1243.0,1280.25,1298.25,1316.0,1348.5,1359.75,1345.0,1361.5,1390.0,1367.0,1357.5,1360.0,1411.5,1388.25,1381.0,1403.5,1405.5,1368.25,1357.5,1347.5,1333.5,1347.0,1356.75,1399.5,1409.75,1437.0,1424.5,1427.75,1420.0,1432.5,1469.5,1484.5,1505.0,1546.5,1505.0,1495.0,1508.5,1537.0,1542.75,1524.7,1537.0,1501.0,1495.25,1543.5,1598.25,1618.5,1613.5,1709.75,1738.0,1877.75,1791.0,1896.5,1843.0,1817.0,1615.0,1660.0,1664.0,1689.0,1651.0,1718.0,1764.0,1780.5,1704.0,1714.0,1744.0,1680.0,1593.0,1584.0,1590.0,1618.0,1643.5,1675.0,1720.5,1717.0,1727.0,1729.5,1765.0,1698.0,1705.25,1654.0,1658.0,1664.0,1643.75,1648.25,1632.0,1662.5,1627.0,1563.0,1590.25,1579.0,1633.25,1593.0,1623.5,1569.0,1596.25,1581.0,1584.0,1571.5,1616.5,1606.75,1622.25,1615.25,1663.5,1686.0,1732.75,1767.25,1758.5,1770.5,1769.0,1747.25,1725.0,1712.0,1679.0,1735.75,1723.25,1747.25,1718.0,1708.5,1690.0,1662.5,1664.0,1653.75,1667.75,1688.0,1656.75,1664.25,1663.5,1611.25,1592.5,1578.0,1577.5,1599.5,1602.25,1597.75,1577.25,1416.0,1425.0,1472.5,1463.0,1429.75,1353.75,1379.0,1396.75,1376.75,1386.0,1283.25,1243.5,1225.5,1281.25,1313.75,1330.75,1311.0,1325.75,1375.25,1411.0,1391.25,1386.0,1314.75,1321.75,1335.75,1311.0,1276.0,1316.0,1351.0,1314.25,1283.75,1283.5,1231.75,1237.5,1228.5,1229.5,1192.75,1201.5,1238.0,1246.0,1254.75,1270.0,1246.5,1273.5,1326.0,1333.0,1344.25,1334.25,1379.0,1322.0,1294.0,1299.0,1324.5,1290.75,1302.0,1308.5,1292.75,1301.0,1283.0,1244.75,1255.0,1281.75,1313.5,1313.0,1313.25,1321.25,1312.75,1305.0,1293.5,1308.25,1302.75,1286.5,1287.25,1267.25,1234.75,1214.0,1217.75,1193.25,1228.0,1241.0,1230.5,1170.75,1172.0,1187.0,1196.0,1178.75,1195.25,1210.75,1195.25,1194.0,1192.0,1222.0,1275.5,1282.75,1274.25,1242.25,1233.5,1193.5,1216.75,1173.75,1157.0,1181.4,1187.4,1208.5,1197.85,1203.25,1182.75,1187.4,1184.75,1228.15,1194.0,1187.3,1173.4,1178.25,1193.7,1176.5,1164.25,1154.95,1115.0,1098.6,1093.0,1094.8,1117.3,1153.5,1141.9,1121.0,1108.0,1136.85,1137.5,1134.35,1164.2,1171.65,1168.5,1135.8,1095.6,1094.5,1068.35,1055.65,1082.7,1068.0,1071.15,1067.25,1072.7,1104.7,1090.45,1103.7,1122.0,1173.4,1208.45,1203.65,1234.15,1267.6,1256.55,1244.25,1216.45,1215.0,1247.25,1237.7,1230.85,1296.5,1277.75,1281.0,1250.4,1210.5,1240.55,1284.1,1283.25,1324.6,1348.75,1358.25,1326.15,1315.0,1348.85,1330.0,1339.2,1334.3,1318.85,1328.3,1327.5,1315.05,1336.3,1318.65,1262.1,1252.7,1267.0,1274.2,1286.8,1222.6,1214.95,1189.1,1164.9,1154.4,1137.6,1139.75,1148.65,1176.1,1202.75,1213.75,1189.85,1221.85,1229.4,1235.35,1256.25,1231.15,1207.8,1233.0,1256.9,1246.25,1253.6,1285.0,1271.8,1255.8,1229.7,1231.5,1255.25,1262.8,1280.7,1269.25,1251.1,1240.85,1235.2,1207.55,1229.85,1255.85,1266.35,1257.55,1281.1,1287.6,1323.4,1334.6,1338.75,1314.4,1295.5,1273.1,1282.15,1305.15,1275.25,1272.75,1271.6,1278.4,1292.35,1294.7,1279.1,1251.4,1258.65,1285.4,1312.8,1318.8,1343.0,1334.15,1348.4,1337.1,1321.7,1347.4,1339.05,1326.3,1317.25,1311.7,1348.4,1336.6,1328.5,1344.4,1328.0,1316.25,1310.05,1320.7,1285.85,1302.05,1294.65,1296.05,1281.25,1269.8,1249.0,1262.6,1244.9,1229.45,1222.05,1212.0,1204.4,1188.75,1212.75,1201.7,1195.8,1196.8,1198.75,1185.3,1194.8,1233.0,1222.9,1230.75,1231.6,1207.05,1223.55,1226.65,1231.05,1246.8,1239.1,1261.25,1281.65,1291.5,1293.7,1278.7,1301.0,1311.0,1306.75,1323.95,1329.15,1287.45,1296.35,1305.35,1319.35,1291.9,1297.1,1286.75,1273.45,1282.15,1281.3,1282.95,1275.25,1283.9,1313.95,1328.6,1333.2,1405.45,1390.05,1404.9,1416.25,1424.45,1418.95,1457.45,1501.95,1499.35,1531.85,1523.35,1509.95,1502.05,1519.5,1487.6,1502.15,1494.2,1490.85,1505.05,1509.2,1465.5,1458.4,1459.45,1457.5,1463.6,1477.4,1483.95,1511.5,1576.85,1550.35,1559.25,1583.45,1578.85,1574.05,1580.3,1682.35,1609.7,1676.6,1504.65,1494.5,1624.45,1636.6,1715.85,1684.95,1717.25,1703.7,1698.8,1756.9,1722.75,1734.8,1692.0,1710.4,1745.45,1768.8,1774.4,1808.05,1810.3,1940.55,1972.95,2030.3,1949.85,1947.55,1987.95,1928.4,1942.3,1930.9,1850.95,1899.65,1919.8,1910.0,1901.6,1886.75,1957.45,1892.6,1863.8,1771.95,1832.8,1820.25,1869.25,1873.9,1930.8,1847.8,1833.95,1855.6,1857.8,1811.65,1817.45,1798.8,1746.95,1694.45,1727.9,1733.4,1723.95,1731.05,1741.55,1788.4,1779.65,1784.95,1834.15,1848.45,1876.85,1907.7,1882.05,1859.75,1782.45,1774.25,1790.95,1802.95,1803.25,1808.15,1807.55,1741.5,1775.75,1786.9,1814.3,1823.85,1787.85,1757.15,1749.15,1751.85,1752.55,1762.45,1799.2,1786.55,1818.0,1863.8,1841.1,1795.0,1781.25,1784.45,1797.4,1796.35,1809.05,1800.55,1820.05,1838.25,1790.6,1811.15,1855.8,1895.45,1903.3,1999.25,1961.6,1925.05,1927.0,1927.1,1956.85,1975.95,1918.7,1857.9,1865.4,1805.8,1864.3,1857.25,1851.5,1855.95,1841.2,1838.05,1807.05,1737.4,1723.65,1731.95,1766.75,1775.7,1781.45,1732.8,1734.0,1711.95,1726.5,1667.9,1647.0,1660.8,1680.05,1658.0,1646.35,1638.85,1679.9,1757.35,1739.65,1762.9,1794.35,1790.6,1796.5,1802.65,1835.05,1873.8,1915.1,1927.2,1926.75,1873.5,1858.5,1844.2,1809.05,1851.7,1882.1,1981.95,1960.25,1963.1,2001.5,2009.8,1986.15,1980.9,2025.6,2015.3,1981.2,1949.5,1942.5,1964.15,1954.35,1930.55,1913.75,1925.05,1955.05,1964.75,1955.55,1936.9,1913.5,1890.1,1923.5,1942.05,1926.6,1926.4,1922.55,1831.85,1852.3,1914.65,1980.95,1996.15,1987.1,1937.45,1976.05,2011.7,2066.95,1991.95,2020.95,2061.7,2074.9,2028.0,2053.85,2023.9,2027.35,2024.5,2021.0,2020.35,2035.15,2083.15,2178.45,2155.3,2168.35,2264.55,2336.9,2347.15,2361.45,2337.6,2315.0,2340.3,2444.35,2344.7,2324.7,2297.65,2320.7,2327.2,2327.8,2371.65,2408.5,2401.4,2392.1,2421.75,2442.1,2500.05,2510.3,2502.0,2496.65,2587.45,2617.25,2650.15,2651.6,2659.0,2734.3,2730.4,2741.35,2670.55,2590.1,2670.4,2637.25,2655.85,2660.95,2620.55,2610.3,2631.8,2679.8,2707.5,2767.1,2794.15,2895.55,2898.2,2940.6,2868.25,2902.1,2996.15,3030.25,3120.2,3025.1,3220.65,3454.7,3278.65,3377.35,3222.6,3239.05,3295.75,3345.1,3317.8,3417.3,3363.0,3277.25,3306.0,3363.55,3362.6,3338.2,3359.05,3358.1,3348.45,3372.9,3468.8,3610.5,3638.2,3721.25,3812.85,3941.95,4070.9,4252.75,4029.7,3994.15,4077.6,4083.2,4067.95,4254.1,4204.15,4337.5,4406.1,4457.75,4436.7,4587.7,4664.95,5093.55,4685.45,4992.5,4977.38,5214.24,5137.1],"h":[35.18,35.18,35.2,35.2,35.2,35.2,35.2,35.2,35.2,35.2,35.2,38.0,38.05,38.1,38.5,39.6,39.8,41.6,42.6,42.0,41.4,42.1,41.4,41.05,41.1,40.95,39.15,39.2,39.1,38.85,39.1,40.3,39.85,40.0,40.18,40.55,40.48,39.7,39.8,39.4,39.3,39.6,39.53,40.0,40.75,40.3,40.78,41.3,41.83,41.7,42.0,42.48,42.75,42.6,42.55,42.7,42.6,42.65,42.78,43.6,43.75,43.18,43.48,43.35,43.4,43.28,43.4,43.6,43.65,43.5,43.5,43.5,42.95,41.98,41.5,41.23,41.51,42.1,42.0,42.0,41.72,41.4,41.45,41.2,41.0,40.9,40.98,41.0,40.88,40.99,40.9,40.73,40.48,40.15,39.58,38.2,37.9,35.83,35.53,35.33,35.2,35.18,35.23,35.13,34.98,34.99,35.0,35.0,35.03,35.0,35.0,35.01,35.0,35.3,35.3,35.4,35.43,35.84,35.98,35.88,36.24,36.15,35.98,35.85,35.45,35.7,35.64,35.63,35.51,35.35,35.33,35.33,35.31,35.33,35.3,35.33,35.87,36.35,36.3,36.35,36.3,36.43,36.93,37.63,38.2,39.19,37.7,37.6,37.9,37.79,37.6,37.5,37.71,37.65,37.38,37.51,38.28,38.18,38.1,38.7,39.05,38.95,38.8,38.78,39.03,39.08,38.95,38.95,38.95,38.93,39.09,39.6,40.2,40.85,41.2,40.98,40.85,40.5,39.95,40.4,40.41,40.3,40.6,41.59,42.48,42.8,43.3,43.4,43.25,41.73,41.8,42.23,42.65,42.73,42.5,42.6,42.55,42.51,42.4,42.63,43.15,43.64,43.73,43.9,43.65,43.53,43.62,45.75,45.73,46.09,47.0,48.6,48.4,48.5,48.7,48.49,48.3,48.47,48.4,48.43,48.4,49.43,49.48,49.5,50.7,54.0,57.5,57.5,59.3,66.75,63.3,64.0,65.1,65.9,65.7,65.6,67.45,70.0,68.4,66.25,67.4,66.8,67.1,67.2,64.65,64.15,65.63,65.7,65.05,64.93,64.5,64.05,62.54,62.55,63.9,63.4,63.4,65.4,64.9,65.25,65.15,65.1,65.6,67.1,69.2,73.0,89.0,87.0,83.0,82.6,82.5,91.5,91.1,91.25,90.78,90.9,90.7,96.3,111.0,112.5,117.0,127.0,120.0,122.5,123.5,127.0,126.0,120.75,119.75,117.0,115.5,103.75,107.25,105.75,106.98,105.25,103.75,102.5,98.58,103.75,102.75,100.0,98.5,98.5,97.25,90.5,101.5,106.75,105.5,109.05,112.75,121.25,127.0,128.5,141.75,139.75,141.5,149.0,158.5,178.0,170.0,163.5,177.0,176.75,179.5,177.0,174.0,174.4,170.5,168.0,167.5,164.25,161.0,160.75,158.0,157.5,152.0,144.5,142.0,146.0,149.0,160.5,155.5,155.5,156.0,155.25,158.5,156.0,152.75,147.75,158.25,160.0,155.25,165.5,169.5,179.0,188.0,190.0,185.75,185.5,179.25,188.75,194.5,197.5,180.25,180.0,177.0,179.5,177.25,184.0,185.1,186.25,181.6,178.5,178.25,177.75,177.65,173.5,171.0,168.75,167.4,166.0,166.25,172.75,172.75,165.9,166.0,164.1,164.25,167.0,164.9,166.0,165.0,167.75,166.35,163.25,162.25,162.0,154.25,152.75,148.25,138.0,144.5,142.0,143.75,146.0,144.0,146.5,144.0,142.25,141.9,139.1,139.4,139.15,142.0,141.25,140.15,136.5,129.35,129.0,131.65,131.3,131.6,133.65,133.2,134.0,134.3,134.0,131.1,128.3,128.0,128.0,128.6,128.25,128.25,127.7,126.4,126.9,127.0,125.8,125.6,124.3,123.2,122.25,117.75,115.35,112.8,113.65,113.35,107.3,107.35,114.0,116.85,120.75,118.75,116.25,115.0,116.2,123.5,125.6,135.9,138.2,134.15,131.15,137.0,136.0,133.9,134.65,136.1,131.65,133.0,132.95,132.85,136.25,136.6,140.85,145.35,147.75,150.25,153.6,151.2,149.75,152.3,151.0,149.3,148.15,147.85,147.75,146.55,144.0,142.4,139.8,141.0,143.05,142.2,144.2,145.0,145.8,146.5,146.5,144.4,144.4,146.2,147.85,148.0,151.5,153.9,155.2,157.7,161.55,163.65,164.7,168.15,166.5,159.0,160.5,161.25,160.4,162.05,165.6,172.5,174.2,174.45,177.1,176.6,175.7,179.6,183.75,183.8,188.8,187.65,182.1,183.2,182.75,180.7,175.1,170.0,172.85,175.1,178.65,180.25,184.9,183.4,184.0,186.35,185.25,185.0,186.7,190.75,198.8,207.5,209.85,215.9,207.3,208.1,212.5,211.2,215.9,219.1,223.4,227.2,229.25,234.15,243.65,221.75,210.6,202.75,199.7,200.35,205.6,220.35,224.5,227.15,224.1,230.7,235.1,234.05,254.0,249.6,252.1,250.9,242.8,243.35,243.85,246.3,240.5,240.0,241.0,242.75,247.7,251.7,257.55,270.0,277.15,280.75,282.4,281.95,284.5,290.2,290.75,303.85,307.0,304.65,302.8,304.1,314.7,318.65,340.85,345.75,376.0,397.0,437.0,409.25,400.2,395.5,379.75,392.5,393.0,396.8,417.2,435.0,459.5,494.0,515.0,632.0,634.0,825.5,843.0,703.5,704.0,714.5,665.25,640.0,641.75,602.0,561.0,548.5,503.25,547.0,532.8,552.0,535.25,517.5,518.5,515.1,531.4,598.0,627.5,603.75,631.5,672.0,688.75,649.0,652.5,645.5,635.5,626.0,640.5,633.75,647.5,693.5,678.25,720.5,687.25,683.5,683.5,664.2,643.5,655.0,617.0,637.75,635.0,635.5,615.25,581.0,604.0,602.25,599.25,566.75,576.0,530.25,506.5,517.75,514.75,506.5,475.75,492.0,512.75,547.25,529.5,534.25,483.0,497.0,488.75,482.75,501.0,483.25,478.75,481.25,467.0,472.25,465.0,431.5,415.25,417.75,414.75,409.75,399.0,411.5,433.5,428.5,440.25,448.0,456.0,460.25,435.25,452.25,451.6,440.75,431.5,431.0,430.1,408.25,411.25,423.5,417.25,419.25,413.75,400.0,402.0,392.0,377.75,388.25,384.5,382.6,376.25,368.0,363.0,335.5,322.4,333.0,326.6,356.75,364.75,356.75,361.0,343.5,333.5,343.25,332.0,322.0,330.9,322.25,309.75,314.0,322.35,353.75,363.75,357.0,355.5,337.75,379.0,425.25,454.75,488.5,452.0,441.5,414.25,438.0,448.0,439.0,422.25,433.5,412.0,417.0,413.75,440.75,458.15,449.25,448.5,457.25,458.0,491.0,497.75,493.5,508.5,506.0,511.5,503.75,431.75,433.0,436.5,420.75,417.25,428.5,436.25,443.0,442.25,435.0,443.25,442.15,441.25,439.0,413.25,416.5,421.25,423.25,422.75,430.5,429.25,426.25,413.75,412.0,421.0,425.75,418.85,420.0,416.9,413.25,416.25,397.25,400.75,400.5,396.25,383.5,382.15,383.25,375.9,405.75,402.4,390.9,379.5,381.5,384.0,371.25,373.0,371.25,386.25,384.95,383.1,399.75,400.0,406.85,400.0,393.7,390.35,387.25,382.8,385.0,384.6,378.3,373.0,376.65,380.5,389.4,394.5,383.6,373.0,375.25,370.55,346.0,352.35,345.0,347.5,352.4,353.9,351.75,348.8,346.2,339.5,340.0,347.25,347.6,342.75,340.0,340.25,339.0,348.1,350.0,343.0,339.5,330.9,327.6,316.85,310.25,309.0,304.4,306.9,307.0,304.9,303.45,304.9,314.95,290.75,289.3,290.25,333.25,329.9,324.65,331.25,331.5,328.1,324.65,314.5,324.75,323.65,315.0,316.85,315.75,325.2,316.5,315.35,315.05,322.25,322.75,328.1,323.0,335.4,339.25,339.3,335.45,322.0,319.2,330.4,330.55,326.95,326.85,326.9,326.8,325.6,325.0,326.0,331.5,324.5,320.15,323.55,325.75,327.1,339.45,359.6,356.5,361.75,347.35,340.5,343.7,351.4,343.0,349.8,351.35,352.9,336.6,340.65,343.2,347.25,345.6,344.6,344.9,342.05,343.35,343.0,347.95,346.5,343.8,345.65,350.35,348.35,353.5,360.5,361.85,394.5,384.65,386.0,418.25,419.0,423.0,442.75,436.9,442.0,431.4,426.8,409.6,410.25,409.9,393.25,390.0,399.6,390.5,394.6,395.35,402.4,402.25,415.0,421.25,416.5,406.45,404.4,397.5,406.7,411.45,409.25,406.4,415.9,421.8,432.3,445.5,462.6,476.6,464.5,466.7,479.95,459.65,454.7,460.8,452.75,443.6,449.5,445.3,452.9,454.75,464.25,476.0,463.2,457.65,458.5,464.4,463.35,461.35,463.85,460.9,461.75,464.25,481.6,479.65,470.1,464.2,466.25,478.75,493.9,495.0,502.75,483.75,489.55,484.1,485.3,477.85,476.5,455.15,443.8,446.25,445.1,431.55,444.1,447.15,453.9,458.0,456.0,453.85,458.0,452.15,445.95,451.05,456.65,460.25,464.85,464.1,452.65,453.9,443.85,439.15,439.65,445.0,442.2,436.4,431.85,432.4,434.8,430.3,428.9,421.9,410.4,398.6,404.25,408.6,413.05,407.5,422.9,422.25,423.3,422.6,425.5,430.4,421.4,417.55,413.65,413.6,405.5,404.5,407.8,394.85,394.1,386.7,389.25,390.75,397.0,394.45,396.0,391.25,386.6,388.55,385.25,385.85,378.2,379.65,374.4,367.2,363.5,375.5,365.75,370.4,376.3,384.3,382.45,372.25,374.3,371.55,367.25,367.6,366.8,361.2,360.0,359.8,364.1,369.3,366.9,362.95,368.5,371.55,378.85,387.4,393.85,415.8,417.15,409.9,417.1,413.2,409.45,401.65,413.9,415.3,419.1,420.75,421.4,419.75,420.6,412.75,404.8,400.4,401.25,379.25,380.35,378.85,376.8,377.95,371.55,372.1,369.7,373.4,368.35,359.8,356.0,350.0,353.1,361.25,359.9,362.5,370.6,382.6,388.75,411.0,415.7,392.55,388.85,384.3,390.55,406.35,400.0,394.8,381.85,377.3,380.1,386.3,383.45,380.2,387.05,381.75,374.3,384.45,385.4,392.5,392.8,403.7,381.25,377.6,368.3,368.0,364.6,367.45,367.5,369.25,364.2,361.75,358.3,363.65,361.2,356.9,356.45,356.85,360.25,356.75,361.55,365.8,372.75,368.0,366.9,370.25,371.35,370.35,370.1,366.0,357.85,358.0,360.75,355.3,349.15,351.2,349.55,352.4,357.2,359.55,360.3,363.1,359.8,356.65,356.45,367.2,368.4,368.25,370.75,360.05,359.4,353.4,356.65,357.3,357.35,356.5,357.1,356.65,354.2,353.05,351.0,349.0,346.75,340.75,343.75,341.0,342.0,338.6,337.1,336.75,338.15,340.0,338.45,339.85,340.25,343.5,344.1,345.8,348.75,353.15,359.3,359.25,357.3,350.75,338.6,341.85,342.65,343.25,350.75,348.9,349.0,350.5,348.1,343.6,341.3,339.3,335.0,336.0,334.75,335.9,335.5,337.75,336.35,332.9,329.7,328.5,329.85,330.75,329.6,331.65,331.5,330.35,329.7,328.7,331.3,332.7,339.4,339.35,339.2,341.55,354.8,357.5,367.0,378.75,381.0,378.25,375.45,370.65,374.6,390.0,398.4,395.7,392.8,403.7,406.7,382.5,373.65,373.6,371.8,364.2,352.3,357.4,357.25,357.85,366.6,371.6,371.5,374.4,377.9,375.75,378.15,376.7,382.5,387.6,389.75,391.5,395.0,389.5,392.7,384.5,387.65,383.95,384.75,379.75,381.1,387.1,386.3,391.8,390.9,387.4,384.9,377.35,376.45,375.7,382.15,383.0,388.1,387.25,383.3,387.1,393.1,390.25,387.8,385.75,386.4,387.35,384.0,378.3,381.05,383.4,387.1,391.0,391.5,396.5,397.5,394.1,391.95,391.65,389.9,387.4,385.25,386.45,384.55,384.7,377.3,380.1,382.5,383.15,381.4,379.8,383.1,385.1,376.35,376.4,376.9,379.6,376.8,383.5,386.6,383.25,386.55,393.75,390.9,396.95,391.05,391.35,389.9,384.1,385.8,386.1,386.4,391.3,390.7,389.35,384.8,389.3,389.3,386.65,384.35,384.5,384.85,385.55,383.25,383.05,385.4,385.65,383.75,383.35,384.7,384.0,382.7,382.8,386.65,389.6,386.8,388.95,389.35,389.7,388.4,387.35,396.4,399.4,398.9,407.4,416.25,415.25,405.25,405.9,400.35,398.65,397.4,397.3,400.0,395.0,397.6,393.75,393.1,394.0,393.75,392.5,391.65,392.15,390.8,385.55,386.0,384.85,382.5,384.0,384.65,385.2,387.15,388.85,387.7,387.5,389.0,387.2,385.0,383.3,383.25,380.2,381.85,381.05,383.95,382.8,379.25,382.65,379.7,375.1,373.0,369.6,369.6,369.55,369.6,359.25,359.6,354.2,357.25,346.3,343.0,350.75,360.6,361.8,353.15,352.7,350.9,350.7,349.1,346.65,342.15,341.25,344.8,349.0,343.35,345.75,344.0,344.0,342.05,338.7,334.05,320.6,323.45,328.05,327.5,324.05,328.6,326.05,325.4,324.5,323.25,323.15,325.45,336.8,334.15,328.8,324.25,314.0,314.6,310.6,306.4,305.5,293.5,288.1,289.25,296.1,293.9,287.35,287.35,293.8,304.5,302.0,300.75,299.2,296.55,299.75,295.25,294.15,302.75,305.95,313.5,309.5,314.6,311.4,304.2,302.3,300.7,298.85,293.35,296.25,293.4,295.55,297.1,294.35,294.35,295.2,291.0,288.85,286.2,285.75,284.3,285.4,293.75,290.85,296.35,301.4,302.35,300.45,298.35,293.75,293.6,297.2,297.85,296.25,295.75,294.9,293.75,289.95,287.45,290.9,291.4,287.75,287.3,289.75,288.85,290.05,287.2,287.9,293.8,291.25,285.1,280.5,281.6,283.9,284.65,285.85,288.1,280.65,276.1,272.65,267.05,266.35,260.5,261.15,263.0,262.85,256.05,255.35,256.75,257.5,260.7,261.5,257.5,255.45,256.8,257.4,265.6,317.25,326.25,323.5,317.65,302.4,293.85,296.25,295.45,298.5,293.1,283.3,283.05,287.8,290.85,282.1,284.15,288.75,288.7,287.5,316.6,308.75,305.75,294.0,292.75,290.3,289.4,284.35,283.1,281.5,283.5,280.0,280.5,277.8,275.7,275.15,274.4,286.95,293.0,288.1,290.85,288.05,284.25,282.65,280.2,277.4,274.0,277.15,276.4,276.6,277.0,272.85,272.45,277.2,274.3,275.85,272.05,271.25,266.45,265.75,266.5,267.25,271.2,275.1,272.5,273.95,274.7,272.8,268.6,265.75,267.1,268.0,266.25,261.5,259.95,268.1,268.75,270.5,262.6,262.75,259.2,260.9,264.2,264.45,265.8,269.4,272.1,288.35,276.65,267.25,274.35,273.95,276.0,269.1,267.55,271.55,269.25,268.3,273.35,276.35,277.75,275.35,273.55,284.5,291.3,291.6,291.65,292.85,283.75,277.55,280.95,280.5,277.7,274.2,274.7,276.55,274.85,278.9,278.05,278.95,287.0,287.95,283.35,282.0,305.1,301.5,298.5,299.3,299.55,293.75,293.65,303.0,304.95,301.8,303.7,307.65,310.65,312.65,311.6,320.9,327.25,326.55,323.1,323.5,326.35,312.9,316.5,320.35,324.0,306.5,312.95,316.25,313.05,312.4,317.9,322.2,321.55,325.25,322.7,322.35,318.0,313.4,318.75,322.55,323.2,319.8,319.5,325.3,333.5,345.75,348.3,348.5,356.1,358.2,364.1,370.8,385.0,371.75,354.0,359.1,356.6,353.15,340.5,333.15,335.65,325.1,326.1,333.8,341.25,348.7,353.85,369.7,372.35,367.35,362.8,361.25,356.05,351.2,350.25,348.5,361.1,364.0,353.5,363.3,364.0,371.0,376.35,381.15,376.95,391.85,385.15,376.6,374.5,386.75,391.0,383.25,395.5,398.0,398.1,403.3,408.75,410.75,410.8,417.25,428.0,428.2,412.0,410.7,401.85,412.1,415.9,403.4,398.6,401.2,411.0,417.6,426.1,422.0,417.45,405.3,397.15,394.3,381.15,382.25,393.85,395.85,394.95,388.7,401.15,401.7,406.6,408.55,406.95,392.25,393.25,399.05,406.3,409.95,408.1,401.8,404.8,409.45,418.15,418.05,421.75,425.5,429.0,428.75,436.9,444.5,451.7,454.35,455.75,441.25,442.7,443.5,426.8,424.65,424.1,427.6,423.8,417.05,426.6,434.75,436.55,440.95,442.75,436.25,427.5,426.6,429.15,433.4,434.7,430.5,428.35,421.75,418.75,423.2,426.6,436.05,442.95,439.35,427.85,426.95,426.35,427.15,437.5,447.25,444.25,439.85,446.3,446.7,458.1,472.75,473.4,472.0,478.5,473.0,473.65,472.65,467.0,487.9,495.7,504.75,524.75,537.5,507.45,517.0,534.35,547.5,559.4,562.25,571.85,570.0,546.6,556.0,568.6,568.0,555.5,554.25,584.0,597.0,599.5,644.5,638.25,682.0,725.75,713.0,667.5,654.0,644.5,607.75,594.4,600.4,631.0,660.4,671.5,634.2,648.25,650.5,630.75,626.5,624.0,636.7,597.1,592.0,603.5,602.0,578.25,598.0,593.75,625.65,632.25,628.5,636.0,644.4,644.8,629.5,623.4,635.7,640.75,614.1,632.8,648.75,654.75,657.85,670.0,677.5,684.5,653.85,652.5,664.0,665.6,672.6,679.1,690.4,691.0,680.8,686.5,674.2,663.5,662.5,671.3,652.8,659.6,651.25,657.25,667.5,676.0,683.5,666.75,674.15,669.85,662.25,668.0,695.0,711.75,735.35,737.75,745.25,748.5,768.25,775.6,792.5,841.75,817.0,810.5,836.25,801.75,809.0,803.0,828.5,865.35,893.75,911.5,921.25,933.0,914.0,925.5,945.75,969.0,986.25,997.0,1023.5,948.25,937.25,934.25,951.5,920.75,892.25,887.25,885.0,928.25,923.75,895.5,904.25,900.0,923.0,939.75,949.0,981.75,973.0,929.25,910.0,863.75,830.0,836.5,832.0,806.5,864.25,892.5,897.0,918.0,865.0,803.0,772.25,753.25,751.75,758.5,817.0,795.5,821.0,872.5,846.0,881.0,864.0,848.5,873.0,918.5,914.75,944.0,981.0,989.75,949.5,934.75,957.0,952.75,923.0,887.25,895.0,909.0,911.75,917.5,925.75,952.5,972.0,987.0,961.25,936.75,943.0,941.0,925.75,935.25,955.25,956.0,964.5,957.5,943.5,953.75,987.25,1004.5,1020.5,1015.75,1005.75,1054.75,1066.0,1064.0,1055.0,1095.0,1116.0,1146.0,1183.0,1218.25,1164.25,1134.0,1113.25,1104.0,1130.75,1158.0,1135.75,1103.5,1118.5,1079.5,1118.25,1119.75,1136.25,1134.0,1131.25,1104.25,1116.0,1156.0,1163.5,1144.25,1175.25,1199.6,1241.25,1230.25,1214.0,1221.0,1248.0,1244.0,1259.5,1256.0,1210.75,1212.25,1198.75,1189.0,1195.5,1215.0,1230.5,1240.25,1252.0,1258.0,1281.5,1298.0,1313.0,1359.5,1380.75,1367.75,1345.0,1384.25,1416.25,1367.0,1376.25,1391.75,1426.0,1405.0,1389.0,1411.5,1405.5,1383.5,1373.75,1347.5,1347.5,1362.5,1385.5,1414.5,1430.5,1437.0,1424.5,1441.25,1434.5,1470.5,1472.5,1507.0,1531.0,1546.5,1524.5,1502.75,1527.0,1540.75,1548.4,1526.25,1546.0,1508.0,1526.25,1592.5,1602.0,1621.0,1667.5,1786.0,1862.0,1886.5,1854.0,1896.5,1843.0,1817.0,1671.0,1672.0,1687.0,1689.0,1735.0,1756.0,1794.0,1780.5,1704.0,1751.0,1744.0,1680.0,1637.5,1584.0,1621.0,1652.5,1664.0,1722.0,1759.5,1743.0,1732.0,1778.5,1788.0,1701.5,1705.25,1656.0,1694.0,1674.75,1670.5,1652.0,1654.0,1662.5,1627.0,1588.0,1590.25,1579.0,1633.25,1622.25,1628.5,1583.25,1617.0,1594.5,1595.0,1618.75,1622.75,1613.0,1622.25,1666.5,1664.25,1708.5,1772.5,1774.5,1781.0,1790.0,1770.75,1748.0,1725.0,1723.25,1732.75,1735.75,1734.75,1747.25,1718.0,1712.5,1699.5,1662.5,1684.5,1669.5,1690.0,1692.5,1674.5,1678.0,1663.5,1613.5,1608.5,1584.25,1593.25,1611.5,1602.5,1597.75,1581.5,1416.0,1462.25,1476.5,1469.5,1436.5,1386.0,1410.25,1410.0,1386.25,1386.0,1285.0,1260.75,1280.75,1286.0,1340.0,1331.5,1311.0,1360.75,1375.25,1425.5,1403.75,1386.0,1363.5,1332.5,1335.75,1321.0,1317.0,1341.75,1351.0,1317.0,1283.75,1283.5,1250.75,1237.5,1255.25,1237.25,1209.25,1232.25,1238.0,1248.75,1259.25,1270.0,1260.0,1308.5,1326.0,1340.0,1348.25,1371.0,1379.0,1322.0,1294.0,1321.5,1324.5,1294.25,1302.0,1311.0,1303.75,1301.0,1283.0,1254.0,1273.0,1310.0,1323.0,1326.75,1343.25,1321.25,1312.75,1307.5,1317.5,1315.0,1302.75,1288.0,1287.25,1267.25,1238.75,1225.0,1217.75,1227.5,1241.0,1251.75,1230.5,1170.75,1172.0,1202.0,1202.25,1204.5,1228.25,1210.75,1195.25,1199.25,1213.75,1258.25,1298.0,1287.0,1281.0,1242.25,1233.5,1220.0,1216.75,1173.75,1171.75,1209.4,1201.5,1211.1,1204.6,1203.25,1204.8,1191.25,1216.3,1228.15,1194.0,1188.75,1186.0,1198.15,1193.7,1176.5,1166.25,1154.95,1115.0,1098.6,1093.0,1117.35,1149.35,1154.25,1141.9,1122.3,1136.0,1145.5,1137.5,1151.5,1183.35,1174.4,1171.5,1135.8,1095.6,1094.5,1073.0,1069.25,1082.7,1069.15,1077.0,1067.8,1097.45,1104.7,1097.65,1119.0,1158.5,1239.5,1221.5,1235.4,1271.5,1274.1,1269.6,1251.8,1238.2,1237.5,1259.2,1257.65,1274.5,1296.5,1277.75,1281.0,1250.4,1216.25,1266.6,1307.0,1313.85,1331.75,1370.0,1358.25,1332.2,1341.3,1364.4,1351.85,1349.1,1338.5,1318.85,1348.75,1328.5,1335.9,1336.3,1318.65,1262.1,1269.75,1273.9,1301.7,1304.55,1232.0,1217.55,1189.1,1174.75,1160.95,1137.6,1159.1,1178.0,1206.65,1217.5,1213.75,1224.05,1241.75,1241.4,1255.35,1256.25,1231.15,1228.75,1247.9,1256.9,1264.3,1286.1,1285.0,1271.8,1255.8,1229.7,1261.35,1265.0,1266.15,1292.7,1269.25,1256.3,1251.6,1235.2,1221.4,1247.25,1262.05,1269.3,1288.3,1295.25,1287.6,1323.4,1350.9,1338.75,1314.9,1306.9,1278.4,1294.45,1305.15,1278.3,1279.25,1284.45,1285.7,1292.35,1294.85,1279.1,1257.25,1268.05,1296.5,1317.9,1332.9,1343.0,1360.25,1348.4,1344.65,1358.6,1347.4,1339.05,1332.5,1324.95,1342.35,1350.65,1343.15,1345.9,1347.9,1328.0,1316.25,1324.8,1320.7,1303.95,1303.5,1299.2,1305.3,1281.25,1269.8,1256.9,1262.6,1244.9,1230.55,1222.75,1215.5,1204.4,1196.85,1212.75,1204.3,1206.65,1207.6,1199.45,1203.5,1218.75,1233.0,1236.05,1235.5,1235.05,1215.8,1228.25,1226.65,1241.2,1248.25,1257.6,1277.25,1290.35,1292.8,1294.0,1284.9,1322.5,1314.0,1318.0,1345.75,1329.15,1294.1,1308.4,1317.3,1319.35,1291.9,1304.8,1286.75,1281.5,1285.15,1287.75,1298.9,1281.5,1296.0,1337.75,1352.45,1388.35,1429.55,1425.1,1423.1,1437.05,1426.35,1436.05,1503.5,1527.2,1502.65,1541.75,1542.6,1509.95,1504.1,1530.85,1509.5,1508.2,1494.75,1504.65,1509.85,1509.2,1467.65,1475.7,1459.8,1475.85,1474.7,1478.9,1510.6,1547.4,1582.85,1556.5,1561.85,1583.45,1578.85,1576.35,1633.7,1682.35,1687.0,1676.6,1506.0,1621.2,1624.45,1662.5,1717.85,1727.55,1717.25,1703.7,1734.85,1756.9,1725.65,1740.25,1735.85,1732.65,1775.7,1787.4,1812.45,1809.3,1893.85,1974.7,2061.5,2030.3,2005.15,1955.85,1987.95,1944.8,1964.8,1930.9,1906.4,1912.5,1920.8,1918.95,1901.6,1947.95,1957.45,1892.6,1863.8,1839.3,1864.5,1878.95,1873.3,1891.1,1957.2,1861.85,1867.65,1855.6,1857.8,1846.55,1823.45,1809.5,1746.95,1736.35,1737.2,1739.25,1723.95,1747.95,1766.45,1788.4,1780.9,1820.5,1837.15,1877.65,1904.3,1907.7,1892.05,1863.85,1783.25,1783.5,1810.25,1832.0,1815.3,1828.25,1812.45,1757.65,1794.05,1802.95,1815.15,1823.85,1801.4,1775.35,1755.6,1758.55,1797.15,1792.3,1801.9,1793.2,1859.25,1872.25,1841.1,1797.6,1789.8,1807.5,1805.55,1820.1,1818.5,1822.4,1836.7,1845.2,1814.55,1832.3,1886.95,1968.35,1943.8,2017.15,1961.6,1956.65,1933.35,1931.2,1975.25,1975.95,1918.7,1895.2,1865.4,1846.3,1864.3,1857.25,1851.5,1855.95,1841.2,1838.05,1807.05,1737.4,1725.0,1758.9,1786.75,1793.5,1781.45,1762.4,1734.0,1726.95,1727.05,1674.45,1672.75,1716.0,1680.05,1658.0,1670.8,1656.45,1764.75,1783.2,1755.25,1800.75,1794.35,1808.2,1815.2,1812.35,1857.55,1904.05,1928.75,1936.5,1954.9,1882.1,1860.5,1844.2,1845.55,1851.7,1930.9,1996.15,1978.8,2022.3,2035.65,2009.8,1999.05,2038.9,2029.6,2015.3,1981.2,1981.0,1963.55,1964.15,1954.35,1930.55,1929.75,1959.6,1981.5,1975.2,1956.75,1936.9,1913.5,1920.7,1944.3,1942.05,1926.6,1935.0,1922.55,1831.85,1887.0,1984.2,1991.45,1997.6,1987.1,1992.15,1999.9,2044.55,2066.95,2043.65,2055.6,2077.8,2074.9,2039.55,2053.85,2030.5,2054.2,2037.05,2026.2,2030.9,2050.3,2168.65,2178.45,2210.65,2207.0,2292.5,2394.8,2393.75,2361.45,2337.6,2371.05,2383.65,2444.35,2344.7,2360.85,2316.9,2364.0,2332.4,2365.35,2404.15,2470.35,2411.3,2461.75,2423.45,2472.0,2521.55,2524.15,2517.7,2571.35,2606.45,2668.9,2657.5,2651.6,2711.6,2751.0,2783.95,2741.35,2670.55,2706.25,2670.4,2649.15,2713.6,2660.95,2625.55,2654.3,2679.45,2707.45,2771.05,2791.5,2873.8,2938.05,2953.05,2942.05,2918.5,2999.85,3034.0,3070.4,3131.5,3213.75,3324.35,3454.7,3314.95,3377.35,3254.1,3330.1,3321.65,3385.6,3420.2,3417.3,3363.0,3350.0,3336.05,3363.55,3430.15,3338.2,3397.1,3362.05,3348.45,3407.5,3548.6,3654.1,3695.4,3788.4,3886.1,4040.6,4338.25,4275.1,4029.7,4006.4,4234.3,4110.65,4159.4,4254.1,4319.5,4337.5,4481.85,4457.75,4471.2,4633.0,4926.2,5501.7,5051.75,5070.3,5107.34,5214.24,5137.1],"l":[35.14,35.14,35.18,35.19,35.19,35.19,35.19,35.2,35.2,35.2,35.2,36.7,37.0,37.6,38.05,38.55,39.3,39.4,41.5,41.5,41.2,40.2,40.7,40.8,40.85,39.1,37.8,38.65,38.8,38.45,38.6,39.15,39.4,39.9,40.0,40.2,40.3,38.3,38.83,38.95,38.95,38.9,39.25,39.5,40.0,39.75,39.9,40.63,40.98,41.7,41.8,42.03,41.9,42.0,42.2,42.48,42.5,42.6,42.68,42.75,43.0,42.85,43.25,43.1,43.35,42.9,43.18,43.55,43.4,43.45,43.43,43.08,40.75,40.7,41.25,40.9,41.1,41.76,41.9,41.85,41.39,41.03,41.1,41.05,40.9,40.78,40.9,40.85,40.75,40.65,40.75,40.58,39.95,39.85,38.85,37.8,36.0,35.35,35.23,35.0,35.0,35.04,35.13,34.85,34.78,34.78,34.98,34.95,34.98,34.98,34.98,34.95,34.97,35.05,35.15,35.3,35.28,35.43,35.76,35.74,35.9,35.94,35.88,35.5,35.18,35.25,35.34,35.4,35.39,35.3,35.3,35.28,35.29,35.3,35.25,35.25,35.5,35.85,35.95,36.08,36.15,36.18,36.53,37.25,37.66,37.4,36.8,37.11,37.35,37.43,37.35,36.98,37.2,37.4,37.33,37.33,37.5,37.93,37.9,38.1,38.5,38.78,38.75,38.7,38.75,38.93,38.9,38.75,38.9,38.89,38.91,38.91,39.42,39.65,40.5,40.7,40.53,39.6,39.49,39.95,39.88,40.2,40.35,40.98,41.45,42.15,42.75,43.0,41.1,40.7,41.33,41.59,42.05,42.18,42.35,42.45,42.48,42.4,42.13,42.35,42.81,43.2,43.5,43.5,43.05,42.4,43.3,43.73,45.25,45.75,45.93,46.95,47.45,47.9,48.4,47.8,48.0,48.3,48.35,48.23,48.3,48.4,49.25,49.21,50.2,51.6,52.8,56.65,58.7,59.4,59.0,60.6,62.3,64.25,64.85,64.75,65.1,67.75,65.7,64.75,66.6,66.6,66.85,66.1,64.35,63.4,64.1,64.43,64.8,64.55,63.8,62.6,60.1,60.38,63.05,62.85,62.75,64.15,64.7,64.99,65.05,64.1,64.6,65.3,66.9,68.53,73.7,81.2,81.5,80.25,81.4,86.0,89.25,90.4,89.4,90.1,90.3,90.3,99.75,104.75,108.25,118.5,115.5,118.5,118.0,121.0,119.0,116.0,118.5,114.0,107.5,92.5,100.5,102.0,104.5,100.0,100.5,100.25,97.6,98.75,101.0,98.5,97.0,97.35,90.85,89.75,90.0,100.0,104.35,106.75,108.75,112.25,119.8,123.75,135.25,132.0,132.25,144.5,148.0,166.5,158.25,163.0,162.5,172.5,173.0,166.75,169.0,168.5,166.75,161.5,164.25,160.25,154.25,153.0,153.5,153.0,143.65,131.5,133.5,138.5,141.5,152.5,152.25,152.25,153.0,153.25,156.75,152.75,144.0,146.0,147.5,154.95,154.2,157.5,165.0,168.6,179.0,181.75,182.0,170.5,174.0,184.0,192.25,177.0,171.25,174.5,172.75,176.0,173.5,173.5,180.4,181.75,177.75,176.75,177.5,176.5,174.6,172.5,164.25,164.9,165.5,163.5,165.15,166.75,167.75,163.25,164.75,162.5,162.25,164.0,162.75,163.4,163.6,166.2,165.0,161.6,161.6,161.4,149.75,147.9,137.0,128.75,136.0,137.5,141.25,143.5,141.75,143.0,143.25,140.4,138.25,137.85,137.0,138.65,140.5,140.25,136.2,129.6,124.0,126.4,128.4,128.85,130.5,131.5,131.55,132.9,133.25,132.2,128.6,127.4,127.1,127.4,127.5,126.9,127.5,125.6,124.4,126.05,126.3,125.1,124.5,123.1,122.6,119.1,110.0,111.1,111.5,112.8,109.0,103.5,103.05,111.75,109.5,115.1,116.1,114.3,113.65,114.85,115.65,122.0,130.0,129.1,130.0,128.75,133.0,133.0,131.5,134.2,132.83,129.4,131.0,131.3,131.8,133.3,135.9,137.25,142.1,145.75,145.65,151.35,148.25,147.2,149.5,148.1,146.5,147.0,147.1,146.8,143.9,142.45,140.0,137.2,139.5,141.6,140.55,141.05,143.75,144.5,144.8,145.5,143.35,143.75,145.6,146.85,147.75,149.2,152.35,153.6,156.5,159.65,161.2,160.8,164.7,159.75,156.65,158.6,158.6,157.35,159.75,164.1,166.3,168.6,172.3,174.95,175.0,174.0,176.5,181.35,182.0,184.1,184.5,177.25,179.4,178.65,178.2,169.7,168.0,169.15,171.95,175.0,178.95,181.7,181.0,181.4,184.15,183.2,183.0,185.35,185.05,194.05,198.9,205.0,210.45,198.35,199.4,208.6,205.7,209.3,216.65,217.0,222.45,224.3,226.3,219.55,208.25,197.1,197.9,193.65,195.5,202.8,212.2,220.75,222.1,216.6,216.55,230.8,229.9,238.8,237.6,248.0,247.8,238.75,239.4,240.25,239.65,239.8,233.75,231.75,236.75,243.45,247.0,250.65,261.05,272.6,273.6,276.1,279.25,276.45,281.8,288.6,291.4,303.0,288.5,282.5,293.0,298.9,314.05,319.3,334.35,350.75,370.8,367.5,376.75,382.0,374.8,373.0,378.0,386.75,389.0,393.0,427.25,431.35,460.6,485.9,524.0,599.25,647.75,650.0,629.0,661.25,674.5,625.0,625.0,602.25,502.75,474.0,486.0,491.25,518.4,495.5,494.5,507.75,509.25,510.0,507.5,514.2,554.5,588.75,590.75,596.0,656.0,663.5,610.0,611.5,618.0,622.25,613.25,609.75,629.0,626.25,660.0,668.0,697.0,670.0,671.5,667.75,628.0,631.0,603.0,598.75,609.25,613.5,620.25,553.5,559.75,594.0,587.0,573.75,561.5,552.0,505.0,482.0,492.5,487.0,490.25,457.0,473.25,498.25,531.0,514.25,491.0,475.5,481.0,478.5,476.75,480.75,472.75,467.75,460.25,460.0,457.75,443.75,410.0,400.0,403.25,407.5,402.25,391.75,393.2,409.5,410.5,422.5,434.25,446.75,450.5,426.5,434.95,441.25,433.3,422.25,427.75,412.25,395.75,396.0,405.0,407.0,413.25,402.25,396.25,396.25,371.0,369.75,373.5,376.25,378.0,367.5,360.5,340.0,322.5,314.25,318.5,319.5,336.0,352.5,344.75,350.75,335.25,329.5,337.25,324.75,316.8,322.9,307.5,297.0,303.4,307.4,338.5,344.25,340.5,346.13,332.88,337.25,381.75,404.25,448.25,440.0,426.25,394.75,387.25,429.5,426.25,416.5,423.0,400.0,404.0,404.5,428.25,439.0,435.25,440.75,448.0,452.75,474.0,487.0,475.75,498.25,489.0,500.5,470.75,414.5,421.25,416.75,411.25,412.0,423.0,427.75,434.0,427.0,431.0,435.0,437.5,433.0,411.5,402.25,407.5,411.25,413.75,412.25,421.75,423.25,422.25,409.0,408.0,415.3,419.25,414.5,413.0,403.75,410.25,404.0,388.75,395.75,390.0,384.5,376.0,377.0,376.25,374.75,381.25,388.5,381.0,375.4,379.0,374.4,364.25,368.25,365.2,369.25,379.25,374.95,384.5,394.0,396.35,392.8,388.0,385.75,378.75,380.2,380.0,377.5,376.2,370.1,371.2,375.3,383.45,387.1,373.9,369.4,369.0,358.0,332.5,346.25,335.25,337.35,343.9,343.0,345.4,347.7,338.5,337.2,336.5,344.0,344.75,337.75,338.25,338.0,333.85,342.3,345.05,342.0,328.6,327.7,321.75,303.25,309.5,299.5,296.75,301.25,299.25,298.6,300.6,300.0,298.8,285.0,286.7,288.75,293.7,315.9,317.0,323.1,325.5,322.4,313.7,311.25,316.75,316.35,311.2,314.75,310.75,315.25,314.1,310.4,312.2,316.8,317.4,319.65,320.65,326.2,333.6,335.25,318.75,318.0,315.5,328.1,323.15,325.55,324.6,325.65,324.65,322.1,322.7,323.75,326.75,322.5,316.05,318.25,324.8,326.0,327.8,338.8,349.5,353.8,335.95,329.5,332.4,337.85,337.9,341.65,348.2,344.9,333.7,336.5,339.3,342.45,341.6,341.55,342.5,338.6,341.15,341.4,341.85,337.3,340.5,343.5,344.45,345.85,348.5,350.8,358.5,384.0,372.5,377.8,392.0,407.0,413.55,432.25,421.2,428.15,420.0,413.0,401.5,400.3,406.85,387.0,380.4,385.25,387.25,392.5,391.0,389.4,399.0,408.6,403.55,405.35,401.75,395.55,392.6,401.95,403.7,404.85,404.65,406.6,418.5,419.8,436.5,446.8,451.75,456.7,454.75,468.6,447.9,443.4,452.05,448.25,438.1,443.0,442.15,443.7,449.65,453.1,464.0,457.4,454.1,455.8,453.1,458.0,456.6,458.85,454.1,455.15,459.45,466.65,468.0,458.6,458.75,461.75,468.25,485.75,480.9,484.55,481.0,486.5,477.3,480.9,475.85,465.25,437.6,439.25,443.45,432.65,423.75,435.7,441.9,446.5,453.1,446.25,447.0,453.15,448.25,441.95,443.6,452.7,452.5,454.0,455.0,449.8,447.0,434.9,437.15,434.5,437.25,428.75,431.25,426.95,429.0,429.7,426.35,427.0,417.3,399.3,389.05,394.2,404.7,410.55,406.3,411.0,419.5,419.75,416.1,421.3,422.2,412.6,413.2,410.15,408.0,403.5,401.75,402.05,390.85,390.25,378.95,382.15,384.1,386.3,389.25,393.4,382.3,384.2,381.6,382.9,381.3,376.5,376.0,366.25,359.25,360.8,365.0,358.5,363.6,371.15,375.4,375.0,368.8,371.5,369.1,364.4,363.0,361.15,358.25,358.1,358.1,360.1,366.1,363.6,360.4,365.65,365.8,373.6,378.15,389.05,396.05,406.8,402.05,409.45,411.3,400.4,394.95,402.7,410.6,408.6,413.25,418.5,414.9,415.0,406.25,399.7,397.35,389.9,369.75,368.0,374.1,373.85,371.35,368.95,368.25,367.4,363.25,363.1,353.25,346.75,347.05,350.3,357.1,353.2,360.1,361.8,367.8,380.0,399.25,407.85,385.8,384.6,378.4,386.0,390.15,389.25,388.3,365.75,368.5,371.0,377.05,378.5,377.35,384.25,371.1,371.9,376.0,382.0,386.75,388.5,380.0,373.8,367.95,360.9,362.05,358.9,357.5,363.6,363.6,362.0,354.0,357.85,358.8,357.1,353.0,351.3,356.25,354.95,353.9,356.3,361.5,367.6,367.3,363.25,366.65,367.9,368.5,364.7,360.35,355.6,356.5,354.4,347.0,347.0,343.5,344.9,348.4,350.5,357.25,356.4,359.8,357.4,353.35,354.9,359.85,365.45,365.7,358.9,356.25,356.1,351.2,349.3,353.4,354.5,354.15,354.95,354.7,352.35,348.8,349.6,347.25,337.6,337.75,340.25,337.7,336.8,336.55,334.75,334.85,334.75,337.2,337.0,336.8,337.7,340.9,341.6,342.55,345.8,348.9,357.1,356.75,349.25,336.0,336.55,338.75,339.05,341.05,342.75,347.5,347.6,348.75,341.75,342.25,338.2,336.7,330.2,333.6,333.95,333.7,333.4,334.7,332.55,332.3,328.8,327.45,327.9,328.6,327.8,327.6,328.35,328.75,328.4,326.5,327.9,331.3,331.6,337.15,336.95,337.7,348.55,352.75,355.35,366.6,374.35,368.25,369.6,365.0,367.0,375.25,387.25,390.4,389.0,389.75,381.9,370.45,370.35,370.05,363.7,351.35,342.05,353.5,352.65,353.5,359.6,365.0,368.5,362.5,375.5,373.7,376.1,370.1,374.35,385.8,385.75,385.65,390.6,382.2,387.85,378.15,378.2,380.25,381.9,376.0,375.65,375.45,383.0,386.8,386.75,384.85,376.2,372.4,370.25,372.8,378.5,379.65,383.4,382.75,380.25,382.5,389.5,385.4,383.4,384.0,384.1,384.05,377.5,376.7,376.45,381.25,386.0,386.9,387.8,390.15,394.15,391.9,387.1,388.95,388.4,383.45,383.1,384.9,383.6,378.95,376.1,376.85,379.0,381.8,375.0,372.45,377.45,380.0,375.25,374.8,375.6,379.0,374.45,376.6,382.75,381.4,382.1,391.95,389.1,390.35,386.6,386.5,383.1,382.6,381.85,383.2,383.4,386.8,389.4,387.45,384.35,384.95,385.85,383.2,381.75,383.75,383.0,382.6,381.65,379.0,381.9,382.95,382.2,382.25,384.0,381.85,382.4,382.05,382.3,384.65,382.55,385.2,386.25,385.7,387.0,386.7,387.1,395.65,395.0,401.8,403.2,406.95,403.0,397.75,397.7,392.9,395.6,394.7,396.7,393.8,394.55,389.9,390.35,390.15,392.8,391.25,390.65,390.55,385.7,383.2,384.2,381.3,380.6,381.0,383.55,384.4,384.9,387.75,386.2,386.25,387.25,385.6,382.2,382.5,380.3,377.05,379.6,379.6,380.0,377.2,377.9,379.75,376.9,371.9,368.3,368.5,368.3,368.7,364.3,354.5,352.45,349.8,345.0,340.9,336.9,343.6,352.45,351.7,349.9,347.4,346.8,347.35,347.85,341.2,340.7,338.95,340.65,347.0,341.65,343.55,340.7,341.2,339.55,336.95,325.2,315.75,318.75,321.8,325.3,318.85,323.5,321.8,324.7,321.6,321.0,319.95,320.7,327.05,327.9,324.2,321.9,310.4,312.25,304.5,303.0,296.15,287.05,283.05,283.2,290.45,287.7,281.8,278.5,285.75,298.25,295.2,298.0,297.7,292.3,294.25,294.0,289.1,292.8,299.3,308.35,306.3,307.2,306.1,299.0,295.6,298.1,292.4,289.2,288.1,286.1,293.25,293.0,291.35,290.7,292.9,289.15,285.7,282.7,283.3,273.4,277.7,284.15,287.65,288.0,293.8,296.35,296.0,292.85,291.2,290.1,291.75,294.4,295.6,292.4,292.35,291.25,286.65,286.7,287.0,285.7,285.9,282.3,287.1,287.1,285.35,286.1,286.4,288.5,283.45,282.0,279.8,278.35,281.25,283.35,281.5,283.4,277.2,272.85,268.25,263.85,258.35,258.9,258.7,260.0,256.2,253.75,252.9,253.5,255.3,256.45,258.6,253.15,254.05,254.9,255.2,255.2,281.7,311.75,316.0,303.25,290.4,291.75,289.0,292.0,294.4,280.85,277.25,279.75,284.25,290.65,280.35,281.7,284.9,284.9,283.05,303.15,300.5,297.15,289.0,288.35,285.5,284.85,275.9,276.75,280.25,280.5,275.85,275.0,276.2,272.5,270.45,272.25,281.7,284.1,285.3,283.0,284.15,280.65,277.9,278.45,273.3,272.3,274.7,272.0,272.6,272.95,272.6,269.65,273.55,270.8,269.75,270.5,266.05,263.8,264.1,264.3,265.75,266.2,270.85,269.7,269.45,272.65,268.0,263.65,263.1,263.6,263.1,260.5,256.7,257.3,262.8,261.55,260.2,260.5,259.05,257.0,257.05,260.1,262.2,263.45,265.2,267.7,280.65,265.65,266.15,267.9,271.5,269.9,265.2,266.4,266.85,265.85,265.55,266.5,274.1,274.3,271.6,271.7,271.4,288.2,287.95,289.15,282.35,278.7,274.9,277.7,277.3,275.5,272.55,273.05,274.1,272.6,276.25,277.6,276.5,278.2,283.7,279.0,277.8,285.8,298.1,291.15,291.8,289.3,291.0,291.0,297.1,300.8,297.8,299.35,303.25,308.1,308.75,307.5,311.8,320.8,322.9,317.6,317.95,319.05,310.75,312.45,316.35,308.6,300.65,306.75,312.7,305.8,309.4,312.25,317.15,315.3,320.15,320.4,317.1,312.45,311.1,313.3,317.2,318.5,318.2,317.3,317.3,323.75,332.9,343.9,342.2,346.75,350.85,355.55,363.0,369.0,354.25,346.55,347.65,348.45,335.5,332.55,329.6,323.2,319.75,323.7,332.0,332.6,341.4,348.9,359.75,361.1,361.3,353.95,356.45,343.5,345.15,343.4,343.0,347.8,353.05,348.95,356.0,358.3,360.75,371.0,376.4,372.9,384.1,379.85,370.35,370.8,371.45,382.7,378.3,382.85,392.4,391.5,398.75,404.0,404.5,409.6,413.5,417.75,410.3,407.1,401.3,396.4,406.4,408.25,392.25,390.35,397.4,399.0,414.1,419.15,416.95,398.0,391.35,382.75,386.85,373.5,379.0,383.85,388.1,384.25,382.3,393.85,393.75,397.35,403.3,392.85,386.2,390.6,392.75,399.3,405.5,405.8,398.1,400.75,404.15,409.0,414.25,412.45,416.25,423.85,422.2,432.3,437.95,447.0,449.15,433.9,436.95,441.75,435.15,423.15,421.25,421.7,423.7,416.5,411.5,422.8,427.1,429.15,433.6,436.65,424.9,426.5,423.7,423.65,425.65,432.75,429.2,421.45,419.4,417.6,416.1,422.75,425.6,434.35,434.2,423.75,419.6,420.0,422.75,431.35,434.7,439.0,437.5,433.0,443.5,447.85,461.95,461.05,465.0,470.7,463.15,463.75,461.35,457.15,467.55,488.0,493.8,505.0,502.4,494.5,509.15,520.75,541.0,544.75,556.65,560.3,548.65,540.5,550.75,556.1,545.4,545.25,548.0,562.25,583.85,596.75,616.75,627.75,657.75,679.75,681.0,643.75,630.8,612.25,567.25,569.75,581.75,619.5,624.5,626.0,616.4,635.5,640.5,614.75,621.5,614.7,611.5,578.6,576.25,589.5,568.25,574.0,589.75,578.4,600.9,618.0,618.25,624.0,637.5,630.5,625.5,616.0,628.3,625.25,608.3,623.25,635.1,642.25,648.0,663.35,658.6,664.0,638.6,640.75,654.4,659.65,663.3,676.85,687.25,672.5,673.25,667.85,660.75,655.0,656.6,656.75,644.1,652.0,642.85,647.75,657.0,663.15,663.5,660.25,664.5,653.0,655.5,664.75,672.75,704.0,710.25,727.7,726.75,728.8,755.85,755.6,783.0,802.5,790.25,788.5,794.75,783.75,796.25,787.0,810.25,836.5,857.5,872.75,862.0,916.5,889.75,905.75,905.0,934.0,966.25,973.15,913.5,930.65,893.5,906.75,917.75,883.5,854.25,872.25,863.0,907.0,879.5,873.0,864.0,872.0,887.25,929.5,921.0,957.75,927.75,909.5,864.5,784.75,791.0,809.75,794.5,742.75,779.25,869.0,842.5,836.5,801.0,692.5,720.5,734.0,714.0,736.5,802.5,771.75,771.0,827.5,836.75,865.0,842.5,813.0,835.0,878.5,902.0,896.0,943.0,943.75,911.0,900.0,910.75,921.25,901.5,879.25,872.0,870.0,881.5,903.0,912.5,921.5,942.0,967.25,946.5,932.0,920.25,931.5,910.0,908.5,945.5,932.0,953.5,943.5,934.25,943.5,949.75,988.5,994.25,997.0,990.5,1004.25,1047.75,1053.5,1034.0,1052.0,1099.75,1128.75,1164.5,1172.0,1125.75,1106.5,1080.5,1092.5,1113.0,1132.0,1096.5,1082.75,1052.25,1068.0,1099.5,1092.75,1116.0,1106.0,1104.0,1093.5,1109.5,1124.0,1149.25,1127.5,1152.25,1172.0,1188.25,1183.5,1183.75,1203.5,1212.4,1223.0,1233.25,1210.5,1186.0,1203.75,1181.5,1164.0,1178.0,1196.75,1222.0,1218.0,1233.5,1247.25,1243.0,1278.75,1289.0,1316.0,1343.5,1319.0,1326.5,1358.0,1387.0,1336.5,1357.5,1360.0,1382.0,1374.75,1380.5,1403.5,1358.0,1368.25,1344.0,1316.0,1332.5,1347.0,1356.75,1394.5,1409.75,1409.75,1398.5,1425.5,1414.0,1432.5,1457.5,1484.5,1505.0,1487.75,1488.25,1488.75,1508.5,1531.0,1534.0,1517.75,1521.0,1492.75,1495.25,1543.5,1584.25,1610.0,1613.5,1709.75,1738.0,1716.5,1791.0,1827.0,1778.0,1730.0,1615.0,1600.0,1662.0,1623.0,1651.0,1702.0,1764.0,1730.0,1676.0,1704.0,1712.0,1589.5,1593.0,1537.5,1590.0,1618.0,1643.5,1659.0,1720.5,1715.5,1716.0,1729.5,1714.5,1682.5,1646.75,1636.0,1655.75,1622.5,1643.75,1640.0,1632.0,1629.5,1580.75,1537.5,1555.0,1548.75,1576.0,1589.25,1570.5,1567.5,1591.75,1565.5,1579.5,1571.5,1595.0,1606.75,1594.75,1615.25,1657.0,1686.0,1730.5,1756.75,1755.25,1770.5,1763.0,1732.75,1704.0,1708.25,1679.0,1710.0,1723.25,1724.5,1693.0,1694.75,1648.25,1655.25,1632.25,1653.75,1667.75,1670.25,1656.75,1664.25,1629.25,1568.5,1570.0,1574.0,1577.5,1599.5,1591.0,1545.25,1548.0,1378.0,1417.25,1456.0,1449.25,1376.75,1353.75,1379.0,1396.5,1369.5,1290.25,1203.25,1232.75,1225.5,1279.75,1312.0,1285.75,1275.5,1323.25,1360.0,1392.75,1368.25,1308.25,1299.75,1316.5,1293.75,1285.75,1255.5,1311.75,1314.75,1309.0,1276.0,1241.75,1231.75,1213.0,1222.75,1195.0,1192.75,1201.5,1226.0,1237.25,1239.5,1246.5,1246.5,1273.5,1313.75,1327.75,1333.5,1334.25,1327.0,1295.0,1284.0,1299.0,1299.0,1283.5,1283.0,1289.0,1292.75,1291.5,1254.0,1244.25,1253.5,1264.5,1311.5,1313.0,1313.25,1297.5,1292.5,1284.5,1288.5,1308.25,1280.5,1285.0,1264.0,1237.25,1222.5,1210.5,1207.5,1193.25,1223.5,1231.75,1173.25,1144.5,1151.25,1187.0,1184.5,1178.75,1195.25,1197.5,1177.0,1184.25,1192.0,1222.0,1275.5,1263.5,1263.75,1225.25,1203.5,1193.5,1196.5,1156.5,1149.0,1181.4,1179.25,1196.0,1189.85,1187.75,1179.0,1183.0,1184.45,1206.75,1187.85,1175.9,1173.4,1178.25,1174.4,1164.3,1154.25,1143.0,1083.75,1080.05,1085.0,1094.8,1117.3,1125.5,1125.0,1106.35,1105.5,1124.6,1106.3,1134.35,1154.4,1166.45,1147.75,1107.3,1083.75,1070.5,1064.65,1050.6,1067.2,1055.25,1071.15,1062.25,1072.7,1081.1,1087.0,1103.7,1122.0,1173.4,1202.4,1203.65,1229.35,1247.25,1233.1,1216.45,1216.45,1215.0,1229.75,1237.7,1230.85,1275.75,1264.85,1253.75,1220.75,1210.5,1240.55,1279.4,1265.0,1312.0,1344.75,1325.7,1322.0,1315.0,1348.85,1330.0,1339.2,1324.5,1305.7,1328.3,1314.25,1315.05,1320.85,1255.0,1255.7,1252.7,1265.9,1274.2,1255.65,1206.1,1187.25,1168.75,1164.9,1132.45,1130.55,1139.75,1148.65,1176.1,1199.1,1184.2,1189.85,1221.85,1225.15,1228.7,1228.75,1196.55,1202.25,1232.05,1241.7,1246.25,1253.6,1279.9,1264.3,1235.85,1221.0,1231.5,1251.35,1260.95,1274.25,1256.6,1246.5,1240.85,1220.4,1207.55,1229.85,1245.4,1261.8,1257.55,1270.15,1285.1,1305.8,1331.15,1323.0,1297.0,1284.3,1268.2,1282.15,1280.25,1267.8,1272.75,1271.6,1273.7,1280.0,1277.25,1245.85,1241.6,1258.65,1285.4,1312.8,1314.95,1329.75,1334.15,1341.1,1311.05,1321.7,1323.5,1311.25,1319.35,1317.25,1311.7,1323.9,1325.6,1328.5,1340.15,1317.7,1309.2,1306.85,1287.2,1285.85,1298.6,1292.25,1294.4,1263.7,1250.5,1245.85,1240.5,1217.4,1219.15,1207.7,1211.65,1176.7,1187.3,1202.35,1194.7,1194.0,1196.8,1183.5,1185.3,1186.4,1224.6,1222.9,1217.7,1219.05,1197.55,1222.15,1213.2,1231.05,1239.15,1239.1,1261.25,1281.65,1281.3,1285.05,1278.7,1301.0,1306.6,1305.65,1322.25,1309.95,1285.0,1296.35,1303.0,1291.15,1287.2,1296.15,1276.1,1273.45,1270.05,1281.3,1282.95,1274.0,1276.45,1313.95,1322.65,1333.2,1402.25,1390.05,1387.9,1400.8,1417.55,1406.4,1457.45,1500.35,1495.5,1526.55,1504.95,1493.65,1498.4,1496.15,1466.1,1498.35,1482.55,1487.45,1490.15,1466.85,1455.0,1458.4,1456.35,1457.5,1463.6,1474.4,1483.95,1511.5,1547.85,1544.95,1554.05,1571.2,1552.2,1566.75,1580.3,1626.35,1599.05,1588.15,1472.35,1494.5,1588.05,1636.6,1693.15,1678.6,1673.05,1688.65,1698.8,1732.45,1705.15,1706.45,1692.0,1710.4,1745.45,1768.8,1774.4,1798.2,1810.3,1931.65,1972.25,1931.0,1928.05,1918.5,1934.1,1920.6,1936.1,1850.75,1850.95,1888.0,1891.7,1906.35,1875.8,1886.75,1868.0,1857.4,1808.05,1771.95,1832.8,1820.25,1867.1,1873.9,1891.3,1840.25,1833.95,1839.65,1808.55,1811.65,1773.75,1765.1,1696.05,1694.45,1727.9,1727.85,1685.35,1731.05,1728.1,1765.5,1764.15,1778.05,1814.3,1848.45,1876.85,1869.55,1882.0,1792.35,1779.1,1757.8,1790.95,1802.95,1797.4,1797.15,1799.45,1729.55,1775.75,1783.8,1812.05,1795.35,1766.1,1755.15,1730.95,1748.25,1752.55,1762.45,1783.85,1778.1,1818.0,1858.45,1790.65,1773.5,1771.9,1769.4,1786.05,1796.35,1792.2,1800.55,1810.8,1790.2,1790.6,1811.15,1854.4,1895.0,1903.3,1991.45,1918.75,1925.05,1911.05,1926.4,1951.4,1942.0,1890.0,1857.9,1824.2,1805.8,1845.15,1829.7,1843.35,1823.15,1826.5,1795.65,1737.05,1702.55,1686.55,1719.85,1766.6,1775.7,1752.9,1732.8,1706.0,1705.05,1664.3,1661.45,1618.2,1660.8,1655.15,1624.55,1642.85,1620.65,1670.8,1757.35,1735.75,1755.35,1771.85,1775.95,1796.5,1802.65,1834.5,1873.8,1904.95,1925.85,1905.2,1864.1,1824.5,1824.1,1809.05,1813.35,1882.1,1941.85,1949.85,1963.1,2001.5,1976.1,1982.7,1980.9,2006.65,1965.55,1953.5,1949.5,1942.5,1934.65,1919.35,1903.55,1913.75,1925.05,1955.05,1950.15,1934.0,1918.05,1891.75,1890.1,1923.5,1919.85,1906.45,1923.4,1871.6,1821.9,1852.3,1914.65,1967.4,1982.5,1946.75,1937.45,1976.05,2011.7,2021.4,1981.55,2020.95,2061.7,2037.7,2028.0,2012.2,2018.15,2027.35,2024.5,1990.8,2019.3,2025.25,2083.15,2160.85,2153.4,2168.35,2264.55,2331.75,2347.15,2298.15,2288.5,2308.55,2340.3,2339.75,2337.55,2324.7,2297.65,2312.05,2310.55,2327.8,2362.4,2408.5,2371.25,2389.15,2392.85,2442.1,2500.05,2509.55,2474.45,2496.65,2568.35,2617.25,2644.0,2617.25,2653.25,2719.25,2730.4,2667.05,2548.45,2590.1,2630.3,2636.5,2655.85,2606.15,2613.75,2610.3,2631.8,2666.4,2707.5,2743.7,2794.15,2883.35,2898.2,2861.4,2868.25,2902.1,2996.15,3021.35,3090.3,3002.7,3220.65,3299.35,3225.75,3324.45,3171.35,3238.45,3278.9,3345.1,3317.8,3355.15,3286.25,3277.25,3288.05,3329.3,3346.6,3294.9,3359.05,3344.35,3327.25,3372.9,3468.8,3610.5,3638.2,3721.25,3806.55,3941.95,4070.9,4069.65,3910.2,3964.85,4077.6,4034.3,4067.95,4185.7,4191.4,4276.25,4406.1,4307.95,4432.1,4582.8,4664.95,5063.45,4685.45,4952.29,4875.96,5136.06,5137.1],"c":[35.14,35.18,35.19,35.2,35.2,35.2,35.2,35.2,35.2,35.2,35.2,37.2,38.05,37.65,38.5,39.6,39.8,41.6,41.75,42.0,41.2,40.2,41.05,40.95,41.1,39.1,39.1,38.75,38.8,38.45,39.1,39.65,39.85,40.0,40.18,40.5,40.3,38.9,39.2,39.4,39.3,38.9,39.4,40.0,40.2,39.85,40.35,40.9,41.65,41.7,41.9,42.3,41.9,42.0,42.55,42.55,42.5,42.63,42.78,43.6,43.0,43.18,43.3,43.35,43.35,43.2,43.25,43.6,43.6,43.5,43.5,43.15,40.75,41.55,41.45,41.1,41.5,41.9,41.9,41.85,41.39,41.15,41.1,41.05,40.95,40.9,40.95,40.85,40.75,40.99,40.75,40.58,40.05,39.85,38.85,37.8,36.1,35.55,35.23,35.33,35.0,35.18,35.13,34.85,34.78,34.99,34.98,35.0,34.98,34.99,35.0,34.95,35.0,35.18,35.3,35.35,35.38,35.75,35.81,35.85,36.23,35.95,35.88,35.5,35.19,35.64,35.37,35.45,35.39,35.31,35.31,35.28,35.29,35.3,35.25,35.33,35.78,36.3,36.3,36.2,36.15,36.28,36.79,37.56,38.2,37.4,37.0,37.6,37.6,37.63,37.55,37.19,37.65,37.4,37.38,37.51,38.15,37.95,38.0,38.45,39.05,38.78,38.79,38.76,39.03,39.03,38.9,38.83,38.95,38.93,39.09,39.6,39.88,40.8,41.05,40.8,40.6,39.65,39.9,40.11,40.41,40.24,40.6,41.58,42.48,42.65,43.28,43.3,41.1,41.73,41.58,42.1,42.65,42.18,42.5,42.58,42.48,42.4,42.25,42.6,43.15,43.33,43.73,43.68,43.05,43.29,43.62,45.75,45.73,45.89,47.0,47.55,48.25,48.24,48.6,48.05,48.23,48.4,48.4,48.38,48.35,49.35,49.38,49.5,50.53,52.8,56.5,57.5,59.2,65.6,61.8,64.0,64.1,65.8,65.2,65.3,67.45,67.75,66.1,66.25,67.05,66.8,67.1,66.1,64.65,64.1,65.3,64.5,64.9,64.55,64.13,62.6,60.1,62.55,63.9,63.0,63.4,64.15,64.7,65.23,65.1,64.1,65.6,67.1,69.2,73.0,89.0,87.0,83.0,82.6,82.5,90.25,91.1,90.4,90.78,90.45,90.3,96.3,105.75,104.75,117.0,118.5,120.0,120.25,123.5,127.0,120.5,116.0,118.8,115.7,107.5,102.5,100.5,104.0,105.5,100.0,103.25,100.25,97.6,102.0,101.0,98.5,98.0,98.5,91.25,89.75,100.25,106.75,104.35,107.2,112.75,118.75,121.75,127.95,138.4,132.0,141.5,149.0,158.5,172.4,170.0,163.5,174.5,173.0,175.25,170.5,173.0,168.5,169.75,168.0,165.9,160.6,156.5,157.5,158.0,153.0,146.75,131.5,139.75,146.0,149.0,156.75,152.25,152.75,154.0,155.25,157.5,153.4,148.0,146.0,158.25,156.25,155.0,165.5,168.75,177.5,188.0,181.75,182.0,178.25,178.4,185.5,194.5,177.0,178.75,174.5,176.75,176.25,174.5,184.0,185.1,181.75,179.25,178.25,177.5,177.75,174.6,172.5,169.4,166.0,165.75,166.0,165.75,172.6,167.75,165.25,164.75,162.5,164.25,164.5,163.75,163.4,165.0,166.5,165.0,161.6,161.8,161.5,152.25,147.9,137.0,133.5,141.0,141.0,143.75,143.5,143.4,145.0,143.25,141.85,138.25,138.25,139.35,138.9,140.5,140.35,136.2,129.6,128.15,128.0,131.15,131.3,131.0,132.3,133.2,133.3,133.45,132.2,129.25,128.3,127.6,127.4,128.15,128.15,127.7,125.8,125.25,126.5,126.3,125.6,124.8,123.1,122.6,119.1,110.3,112.4,112.8,113.0,109.0,104.2,105.55,114.0,116.85,118.45,116.25,114.55,115.0,116.15,122.3,125.6,135.0,131.15,130.0,131.0,137.0,133.15,133.05,134.55,133.45,131.25,133.0,131.3,132.4,135.15,136.6,140.85,145.0,145.75,150.25,153.6,148.25,148.9,151.4,149.6,146.5,147.75,147.6,147.05,143.9,142.6,140.0,139.2,140.9,143.05,142.2,144.15,144.3,144.5,146.0,145.5,144.4,144.2,146.2,147.15,147.95,151.4,153.9,153.6,157.4,160.95,161.2,164.7,168.15,160.2,157.9,158.6,158.8,159.25,162.05,165.6,168.9,172.4,173.3,176.15,175.2,174.0,179.6,183.75,183.8,186.9,184.5,182.1,180.75,179.25,178.2,171.0,170.0,172.55,175.1,178.65,178.95,184.5,181.0,184.0,185.2,183.2,183.85,186.0,190.75,198.8,201.35,209.85,212.75,198.85,208.1,208.6,210.65,214.35,217.45,223.2,225.05,227.45,234.15,219.55,209.6,198.3,202.75,194.05,200.35,205.6,216.0,224.5,226.7,216.6,230.7,234.35,229.9,243.9,245.95,252.1,248.7,240.5,243.35,242.15,239.65,239.85,233.75,237.8,242.75,247.65,251.1,257.5,270.0,276.7,277.4,279.3,281.95,276.45,290.2,288.6,298.5,305.4,288.5,302.8,298.7,314.7,317.75,331.15,345.75,373.0,397.0,367.5,387.75,388.75,374.8,373.0,389.75,386.75,390.15,417.2,428.9,459.5,474.9,515.0,596.0,610.0,825.5,691.5,675.0,688.5,674.5,643.5,640.0,602.25,502.75,535.0,490.0,491.25,532.0,511.75,552.0,510.0,510.5,516.1,510.5,531.4,598.0,609.25,603.75,631.5,668.5,663.5,610.0,652.5,622.0,631.25,626.0,639.5,633.75,647.5,693.5,674.5,697.0,670.25,683.5,667.75,628.0,636.0,603.0,615.7,637.75,621.5,620.25,553.5,573.5,604.0,589.5,579.75,562.75,552.0,507.5,506.5,492.5,514.75,490.25,462.0,492.0,509.5,547.25,523.5,491.0,481.5,491.75,484.75,481.75,482.5,472.75,478.75,460.25,467.0,457.75,443.75,413.75,415.25,414.5,407.5,405.25,399.0,411.5,428.5,425.5,440.25,447.75,446.75,451.75,433.25,452.25,441.25,433.5,429.0,427.75,414.0,401.0,411.25,423.5,409.0,415.25,404.0,400.0,397.75,377.25,377.75,388.25,384.5,379.0,368.75,363.25,340.0,322.5,316.25,322.75,326.6,352.5,363.75,346.75,356.75,336.25,331.75,343.25,325.5,318.5,327.0,307.5,304.0,313.0,322.35,345.75,363.75,342.5,346.13,337.75,379.0,425.25,454.75,448.25,445.5,438.5,397.75,438.0,437.25,426.25,422.0,423.0,400.0,417.0,413.75,440.75,439.0,440.5,448.5,448.0,454.0,483.75,490.25,492.5,501.0,506.0,502.25,470.75,415.5,424.0,419.75,411.25,414.25,423.0,435.75,436.25,428.5,431.5,438.0,439.0,436.85,413.25,413.25,416.5,420.75,416.75,422.75,421.75,424.25,422.25,409.0,411.6,419.1,419.25,418.3,414.5,405.25,413.25,404.0,395.7,400.75,393.6,387.25,382.5,381.15,376.25,375.9,403.5,388.5,381.0,379.5,381.5,374.4,370.0,372.75,366.65,386.25,380.9,382.0,396.1,396.8,402.0,392.8,388.0,388.5,378.75,380.2,385.0,377.5,378.3,373.0,375.0,380.5,389.4,387.1,373.9,373.0,375.25,358.0,341.6,346.5,336.15,347.5,350.5,351.25,350.35,347.7,339.5,339.4,339.75,344.15,346.55,337.9,339.6,338.15,339.0,345.85,345.05,342.0,328.6,330.0,321.75,308.85,309.5,303.45,304.0,306.9,299.25,304.8,300.6,304.9,298.8,288.1,289.0,289.9,320.75,329.8,317.0,331.25,327.7,322.5,313.7,313.55,319.8,316.35,313.15,315.0,315.75,315.25,316.5,310.9,315.05,319.0,317.6,319.65,322.4,335.4,333.6,335.75,318.75,321.75,319.2,328.95,330.55,325.8,326.25,325.65,324.65,322.1,324.55,326.0,327.4,322.5,317.9,323.55,324.8,326.0,339.45,357.25,355.25,354.0,337.9,329.5,339.0,338.25,342.0,347.6,351.35,345.5,335.6,340.25,341.0,344.3,341.6,344.25,342.75,340.85,343.35,341.5,347.4,338.9,343.55,343.8,347.65,347.1,349.0,360.5,361.85,386.4,384.65,386.0,418.25,418.75,423.0,434.0,436.9,428.15,420.0,413.0,401.5,408.3,409.0,389.5,390.0,388.6,389.7,394.15,391.0,402.4,402.25,414.5,403.55,407.3,402.7,395.55,397.5,405.75,406.5,409.25,405.0,415.9,418.65,432.3,441.0,462.6,452.15,456.7,466.7,473.6,451.75,454.7,460.8,452.25,441.4,443.0,444.25,452.5,454.0,464.25,464.0,457.4,454.1,455.9,464.4,460.9,461.35,461.0,455.0,461.75,464.25,472.65,468.0,458.6,464.2,466.25,477.8,485.75,495.0,484.55,483.75,486.5,479.5,484.8,477.85,465.25,444.15,440.3,443.45,432.65,430.75,444.1,442.8,451.5,458.0,448.6,453.85,453.15,449.75,445.95,451.05,456.5,452.5,464.85,457.1,449.8,447.0,436.5,438.9,438.1,443.2,432.7,431.45,428.4,432.4,433.75,428.95,428.9,417.3,399.3,396.15,404.25,406.5,410.55,407.3,419.5,420.75,419.75,422.6,423.8,422.2,412.6,417.55,410.15,408.45,403.5,404.5,402.05,390.85,393.8,378.95,389.25,386.5,397.0,389.25,396.0,382.3,384.4,388.55,385.25,381.3,377.3,379.65,366.25,367.2,362.7,371.25,365.75,369.5,371.15,383.6,375.0,372.25,371.95,371.55,364.4,366.3,361.15,358.25,359.85,359.65,364.1,369.0,363.6,362.9,366.7,371.55,378.85,386.45,393.85,415.8,414.15,408.85,410.35,413.2,401.0,401.2,413.9,410.6,419.1,417.35,418.5,414.9,415.0,406.4,399.7,399.2,393.6,372.2,380.35,375.25,376.8,371.4,371.4,368.25,369.7,366.35,363.1,353.6,347.05,349.35,352.4,360.35,359.1,360.75,368.5,375.8,388.75,410.5,412.0,388.1,388.85,384.3,390.1,406.1,393.0,388.3,371.75,377.3,379.75,384.85,380.3,380.0,384.8,371.1,373.15,383.25,385.4,388.1,390.4,380.0,373.8,367.95,368.3,366.25,358.9,367.45,367.5,363.6,362.95,354.0,358.3,361.45,357.1,354.15,356.45,356.3,354.95,355.5,361.55,365.8,369.0,367.4,366.9,370.25,367.9,370.3,364.7,360.35,357.85,357.25,354.4,347.0,347.0,343.5,347.55,348.4,357.0,357.25,360.25,362.0,357.5,353.35,355.3,367.2,366.85,367.9,358.9,356.25,356.1,352.4,356.65,357.3,354.5,354.15,355.4,355.35,353.25,353.05,350.55,347.25,337.6,340.35,340.25,341.0,336.8,336.55,337.1,334.85,338.15,337.2,337.55,338.85,340.25,343.5,343.35,345.8,348.75,352.65,357.9,357.95,349.85,336.0,337.35,340.5,341.3,341.05,348.65,348.35,348.0,349.8,341.75,343.6,338.8,336.7,334.25,335.55,334.0,335.9,334.2,337.15,332.9,332.9,329.1,327.45,329.4,330.75,327.8,330.0,331.1,328.75,329.7,326.5,331.3,332.7,339.4,337.85,337.0,340.95,353.45,357.5,366.6,374.05,381.0,377.5,370.2,370.65,374.6,390.0,389.4,393.65,392.6,403.7,381.9,370.45,370.35,370.05,363.7,356.0,352.3,357.4,353.9,357.85,365.35,370.65,369.1,374.4,376.75,375.75,376.3,372.75,382.3,385.8,386.6,390.65,390.7,389.5,387.85,378.15,387.65,381.1,382.05,377.6,375.65,387.1,385.9,391.8,389.7,384.85,376.2,372.85,376.45,372.8,381.45,381.55,383.4,382.75,383.3,385.75,390.7,386.8,383.4,384.85,384.1,384.05,378.6,377.7,381.05,383.3,387.1,389.5,388.25,396.5,395.35,392.85,387.1,391.65,388.4,383.9,385.25,385.25,384.55,378.95,376.1,379.7,381.3,382.5,375.9,379.8,383.0,380.0,376.35,376.4,376.55,379.6,376.35,383.5,382.75,383.25,386.55,392.0,389.9,390.35,389.5,391.35,384.1,382.6,385.8,384.6,386.4,391.3,389.4,387.6,384.8,388.2,385.85,383.2,384.35,383.9,384.85,382.6,381.8,383.05,385.25,383.25,383.75,382.5,384.0,381.85,382.55,382.8,386.65,386.6,383.5,387.15,389.35,385.85,387.2,386.7,396.4,396.35,396.8,407.4,416.25,408.3,403.05,397.75,400.3,394.85,395.6,397.3,396.7,394.3,395.2,389.9,393.1,394.0,392.8,392.5,390.65,390.55,385.85,383.2,384.2,381.3,381.0,384.0,384.35,384.9,387.15,388.4,386.2,387.5,387.25,385.6,382.5,382.5,380.3,380.2,381.85,379.6,382.2,377.2,378.35,379.85,376.9,371.9,373.0,369.05,369.2,369.55,364.3,358.55,354.1,352.95,345.0,340.9,342.5,350.75,360.6,351.7,353.0,351.7,349.5,347.35,348.65,342.0,341.35,339.8,344.8,347.0,341.65,345.75,343.8,341.2,339.55,337.3,325.2,320.6,323.45,324.5,325.3,321.6,323.5,321.8,325.4,321.6,323.25,321.15,325.45,331.1,327.9,324.2,321.9,310.4,313.25,304.5,303.4,296.9,287.05,283.05,289.25,296.1,287.7,281.9,287.35,291.45,301.8,301.6,298.0,298.35,296.55,294.25,295.15,291.1,302.75,305.95,308.35,308.2,312.65,306.1,299.15,302.3,300.7,292.4,292.2,288.1,293.4,294.5,293.9,291.35,293.6,293.75,289.4,286.2,284.8,284.45,273.4,285.4,293.75,290.85,296.35,301.4,299.65,300.45,292.85,293.1,293.6,297.2,296.05,295.7,292.4,294.3,292.35,286.65,287.45,290.9,285.85,287.75,285.65,289.75,287.4,287.05,286.8,287.9,293.65,283.45,282.0,280.5,281.6,283.9,283.7,285.85,283.4,277.2,274.85,271.05,266.5,259.2,260.5,261.15,262.9,257.0,254.8,254.9,256.75,255.3,260.7,258.6,254.7,255.4,256.2,255.2,265.6,303.0,322.75,316.0,303.25,298.85,292.0,292.8,293.7,297.2,280.85,278.45,283.05,287.8,290.85,282.0,284.15,287.7,286.15,287.5,316.5,302.25,297.15,289.3,292.1,285.5,284.9,275.9,279.95,280.65,280.5,275.85,280.5,276.2,273.75,270.45,272.95,285.15,290.3,285.3,289.15,284.15,280.65,280.35,278.45,273.3,273.15,277.15,273.35,276.6,274.1,272.85,272.35,274.1,270.8,275.85,271.5,266.05,266.45,265.15,266.5,266.0,271.2,273.3,270.3,273.95,272.65,268.0,263.65,265.75,264.5,268.0,260.5,256.7,259.95,263.35,268.75,260.2,262.3,259.05,258.1,259.4,264.2,264.45,265.8,268.95,272.1,280.65,265.65,267.25,274.35,273.2,269.9,265.2,266.4,270.1,265.85,267.5,273.35,276.25,275.15,275.35,273.15,284.5,291.3,290.85,291.6,282.85,278.7,276.95,280.2,277.3,275.5,272.55,274.7,274.75,274.85,277.8,277.6,278.95,286.6,283.7,279.0,282.0,305.1,300.4,293.35,295.8,289.3,291.0,293.65,303.0,300.8,301.65,303.7,307.65,308.85,310.65,310.65,320.9,327.25,326.55,319.7,323.5,319.05,310.75,316.5,319.15,308.6,306.5,309.6,314.55,305.8,312.4,317.9,318.5,321.55,320.15,321.65,317.1,312.45,312.3,318.75,322.55,318.5,318.2,318.25,325.3,333.5,343.1,348.3,344.0,353.15,358.2,364.1,370.35,370.55,356.25,354.0,347.65,356.6,335.5,332.55,330.3,323.2,325.05,326.1,333.4,341.25,348.7,352.55,369.7,365.8,367.35,353.95,359.6,343.5,351.1,344.2,344.0,361.1,353.05,353.5,363.3,360.75,371.0,371.0,377.5,376.3,384.1,383.95,370.35,371.8,384.6,384.6,381.0,395.35,393.85,398.1,402.0,406.6,408.75,410.8,415.2,422.8,410.3,411.4,401.3,396.4,412.1,408.25,392.25,393.5,400.75,411.0,417.5,426.1,422.0,399.75,396.25,387.3,386.85,373.5,382.25,393.85,388.1,384.55,388.7,401.15,394.7,406.6,403.7,392.85,389.6,392.25,392.75,405.8,406.85,405.8,400.65,404.6,409.45,418.15,418.05,417.8,422.4,426.2,428.75,436.9,443.7,451.55,449.15,433.9,439.2,442.2,438.0,423.15,421.7,423.3,426.4,416.5,417.05,426.55,432.4,429.65,440.95,436.65,424.9,427.45,425.4,423.65,433.4,433.2,429.7,421.45,420.7,418.6,423.2,422.75,436.05,442.95,434.2,423.75,419.6,426.35,427.15,437.5,447.25,439.25,438.5,446.3,446.7,458.1,464.5,473.4,472.0,470.7,463.15,473.65,461.35,465.9,487.9,495.7,504.75,524.75,502.5,503.6,513.0,529.5,547.25,559.25,559.75,571.85,558.75,545.75,550.75,568.6,545.4,555.5,549.75,584.0,597.0,597.0,623.5,638.25,682.0,725.75,682.0,652.0,630.8,612.25,581.5,582.6,600.4,631.0,660.4,626.75,631.25,644.5,641.55,614.75,622.0,624.0,611.5,578.6,592.0,601.75,570.6,577.9,598.0,593.75,625.65,632.25,618.25,636.0,644.4,630.9,626.0,619.75,635.7,626.0,614.1,629.0,645.7,654.75,657.85,665.25,677.5,664.0,653.85,650.65,662.15,663.5,672.6,677.0,687.6,672.5,680.8,667.85,660.75,655.0,662.5,656.75,650.6,652.0,648.5,647.75,667.5,676.0,663.5,666.35,664.5,653.0,659.75,668.0,695.0,706.75,735.35,737.75,735.85,748.5,768.25,775.6,790.75,836.0,790.25,810.5,794.75,799.75,796.25,803.0,828.5,858.75,893.75,872.75,921.25,933.0,914.0,909.75,945.75,969.0,978.5,997.0,913.5,944.5,905.25,925.5,942.25,883.5,854.25,887.25,885.0,922.25,879.5,883.5,864.0,900.0,923.0,930.75,949.0,961.5,932.25,909.5,864.5,784.75,830.0,836.5,796.25,757.5,837.5,869.0,842.5,918.0,801.0,692.5,728.5,742.0,729.5,758.5,813.5,771.75,813.75,839.0,836.75,869.75,854.0,824.25,873.0,918.5,914.0,939.25,981.0,943.75,937.75,920.0,957.0,927.0,901.5,883.75,872.0,909.0,881.5,917.5,925.0,952.5,972.0,977.75,950.0,933.75,943.0,932.5,910.0,934.5,949.75,936.5,960.5,957.5,941.5,950.75,987.25,998.25,1014.0,997.0,998.0,1046.75,1047.75,1061.25,1044.5,1095.0,1107.5,1142.5,1164.5,1203.25,1140.0,1106.5,1104.5,1104.0,1121.75,1132.0,1096.5,1082.75,1052.25,1078.25,1107.0,1112.5,1135.0,1118.75,1121.5,1098.0,1116.0,1156.0,1157.0,1140.0,1175.25,1199.6,1238.75,1183.5,1214.0,1203.5,1220.5,1244.0,1242.5,1210.5,1196.25,1204.75,1198.75,1168.0,1194.5,1215.0,1230.5,1234.5,1252.0,1248.75,1281.5,1298.0,1313.0,1330.5,1377.25,1319.0,1336.75,1384.25,1387.0,1357.5,1366.5,1391.75,1390.0,1374.75,1380.5,1410.25,1358.0,1369.25,1344.0,1316.0,1347.5,1359.0,1385.5,1405.0,1418.0,1409.75,1415.5,1434.0,1434.5,1470.5,1472.5,1507.0,1531.0,1487.75,1511.0,1502.75,1525.0,1531.0,1541.0,1526.25,1521.0,1492.75,1526.0,1578.5,1588.0,1613.75,1665.0,1755.0,1862.0,1787.0,1854.0,1879.5,1778.0,1730.0,1629.0,1651.0,1676.0,1623.0,1735.0,1756.0,1764.0,1730.0,1676.0,1751.0,1712.0,1589.5,1607.5,1574.5,1621.0,1642.0,1646.0,1722.0,1759.5,1715.5,1732.0,1778.5,1714.5,1699.5,1649.0,1651.0,1660.75,1622.5,1670.5,1640.0,1654.0,1629.5,1580.75,1588.0,1560.5,1552.5,1576.0,1622.25,1570.5,1569.5,1591.75,1579.0,1583.0,1618.75,1595.0,1608.5,1616.5,1666.5,1657.75,1696.0,1772.5,1773.75,1781.0,1790.0,1767.0,1732.75,1704.0,1708.25,1732.75,1710.0,1734.75,1728.25,1697.0,1696.5,1648.25,1658.75,1632.25,1669.5,1690.0,1670.25,1665.0,1669.75,1629.25,1580.0,1570.0,1577.0,1593.25,1611.5,1602.5,1552.75,1548.0,1414.0,1462.25,1476.5,1449.25,1376.75,1385.25,1410.25,1410.0,1379.75,1290.25,1203.25,1232.75,1275.0,1286.0,1327.75,1285.75,1305.5,1360.75,1374.5,1392.75,1368.25,1308.25,1355.25,1321.5,1316.0,1285.75,1317.0,1341.75,1314.75,1309.0,1281.75,1241.75,1245.25,1230.75,1222.75,1195.0,1209.25,1232.25,1232.25,1241.0,1259.25,1246.5,1260.0,1308.5,1320.75,1327.75,1348.25,1370.0,1338.5,1295.75,1293.5,1317.25,1299.25,1294.25,1285.0,1289.0,1293.75,1292.0,1254.0,1254.0,1273.0,1310.0,1315.25,1321.5,1336.5,1310.25,1292.5,1284.5,1317.5,1313.6,1281.0,1285.75,1264.0,1237.25,1222.5,1222.25,1207.5,1222.25,1238.0,1231.75,1173.25,1145.0,1154.0,1193.25,1184.5,1204.5,1223.5,1197.5,1177.0,1184.25,1211.25,1258.25,1293.5,1263.5,1264.0,1225.75,1203.5,1205.0,1196.5,1156.5,1171.75,1198.0,1201.5,1201.9,1204.55,1192.15,1179.0,1185.25,1216.3,1211.0,1190.4,1175.9,1179.25,1198.15,1174.4,1168.25,1162.4,1143.0,1083.75,1080.05,1091.35,1116.75,1149.35,1125.5,1125.0,1106.35,1136.0,1145.5,1106.3,1151.5,1176.35,1171.55,1147.75,1107.7,1083.75,1085.15,1064.65,1063.0,1067.2,1055.25,1071.9,1062.25,1097.45,1081.1,1097.65,1112.9,1158.5,1239.5,1221.5,1231.0,1271.5,1262.25,1254.5,1216.45,1232.1,1235.0,1229.75,1245.4,1274.5,1280.25,1275.15,1256.5,1221.25,1211.0,1266.6,1284.5,1313.85,1331.75,1356.1,1330.5,1323.2,1332.5,1362.6,1336.7,1346.85,1324.9,1311.5,1335.65,1314.25,1335.9,1327.9,1255.0,1256.15,1263.95,1265.9,1301.7,1255.65,1206.1,1187.5,1171.65,1168.9,1134.85,1131.0,1159.1,1178.0,1196.35,1199.1,1184.2,1213.05,1225.75,1241.4,1255.35,1228.75,1196.55,1228.75,1244.0,1241.7,1264.3,1286.1,1281.5,1265.55,1239.4,1227.9,1251.85,1265.0,1260.95,1274.25,1256.6,1256.3,1243.25,1220.4,1218.95,1247.25,1259.6,1269.3,1288.3,1295.25,1287.05,1318.4,1350.9,1325.0,1297.0,1286.95,1268.2,1293.9,1280.25,1267.8,1275.3,1284.45,1283.85,1289.15,1277.25,1245.85,1257.25,1268.05,1296.5,1317.9,1332.9,1335.8,1354.35,1345.0,1316.05,1358.6,1328.9,1316.75,1319.35,1320.05,1342.35,1323.9,1325.6,1340.75,1340.15,1317.7,1309.35,1324.8,1287.2,1303.95,1299.15,1299.2,1300.1,1269.7,1250.55,1254.2,1240.5,1224.85,1219.15,1207.7,1211.65,1176.7,1189.95,1206.85,1200.75,1206.2,1207.6,1183.5,1201.1,1218.75,1228.25,1236.05,1235.5,1219.05,1215.8,1222.15,1220.45,1241.2,1239.15,1257.6,1277.25,1290.35,1292.8,1285.05,1282.95,1320.75,1311.1,1318.0,1322.25,1309.95,1294.1,1302.65,1311.1,1291.15,1288.9,1296.15,1276.5,1281.5,1270.05,1285.4,1285.8,1281.5,1296.0,1334.3,1352.45,1388.35,1413.2,1414.4,1405.6,1437.05,1418.25,1436.05,1503.5,1509.05,1495.5,1526.55,1504.95,1506.3,1504.1,1496.15,1509.5,1498.35,1487.5,1504.65,1509.85,1466.85,1465.6,1471.3,1456.35,1474.85,1470.6,1476.9,1510.6,1547.4,1548.8,1556.5,1561.85,1580.85,1568.3,1576.35,1633.7,1626.35,1687.0,1588.15,1504.45,1621.2,1609.75,1662.5,1693.15,1727.25,1673.05,1688.65,1734.85,1732.45,1725.65,1709.55,1735.85,1728.55,1762.1,1774.65,1805.75,1802.9,1893.85,1974.7,2061.5,1948.3,1932.85,1955.85,1937.6,1944.5,1954.75,1870.05,1906.4,1912.4,1908.2,1910.6,1875.8,1947.95,1878.2,1867.0,1808.05,1839.3,1833.65,1878.95,1872.55,1891.1,1891.3,1853.85,1853.6,1852.7,1808.55,1818.0,1773.75,1765.1,1696.05,1703.85,1737.2,1727.85,1715.85,1747.95,1766.45,1785.3,1768.8,1820.5,1833.5,1877.65,1892.45,1869.55,1891.95,1792.35,1783.25,1783.5,1803.4,1822.0,1803.05,1828.25,1799.45,1757.65,1782.95,1795.5,1812.05,1799.9,1766.1,1755.15,1755.6,1757.5,1781.45,1792.3,1796.3,1793.2,1850.0,1861.4,1809.8,1773.5,1771.9,1807.5,1786.05,1820.1,1792.2,1822.25,1834.25,1790.2,1814.55,1826.25,1886.95,1912.15,1943.8,1991.45,1932.9,1956.65,1933.35,1931.2,1970.6,1942.0,1915.45,1884.3,1824.2,1846.3,1858.95,1829.7,1843.35,1849.85,1826.5,1795.65,1737.05,1702.55,1725.0,1758.9,1786.75,1788.45,1752.9,1752.1,1706.9,1726.95,1664.3,1661.45,1672.75,1711.5,1655.15,1624.55,1649.25,1648.8,1764.75,1764.75,1753.55,1800.75,1793.0,1780.15,1797.4,1812.35,1834.5,1904.05,1928.75,1928.25,1910.0,1864.1,1824.5,1824.1,1845.55,1834.95,1930.9,1996.15,1978.8,2017.25,2035.65,1986.1,1982.7,2038.9,2006.65,1965.55,1953.5,1981.0,1963.55,1964.1,1919.35,1903.55,1915.65,1956.5,1963.8,1950.15,1934.0,1918.05,1891.75,1917.85,1944.3,1925.55,1918.7,1926.2,1871.6,1821.9,1887.0,1984.2,1987.6,1988.5,1953.45,1992.15,1995.2,2044.55,2030.0,2043.65,2055.6,2062.4,2037.7,2039.55,2029.5,2021.1,2054.2,2031.65,2005.4,2019.3,2050.3,2168.65,2170.35,2166.25,2207.0,2288.45,2394.8,2381.8,2349.8,2301.1,2371.05,2381.75,2339.75,2342.9,2338.0,2316.9,2364.0,2327.6,2365.35,2404.15,2415.8,2374.55,2461.75,2423.45,2462.15,2500.3,2524.15,2517.7,2571.35,2606.45,2660.55,2657.5,2637.05,2711.6,2719.25,2747.35,2685.2,2566.7,2706.25,2664.3,2636.5,2669.55,2606.15,2625.55,2654.3,2679.45,2705.1,2771.05,2791.5,2866.45,2938.05,2929.7,2861.4,2918.5,2999.85,3031.3,3070.4,3090.3,3213.75,3324.35,3299.35,3263.05,3324.45,3210.05,3330.1,3293.55,3356.05,3420.2,3355.15,3286.25,3333.7,3336.05,3351.6,3346.6,3294.9,3397.1,3344.35,3328.4,3407.5,3548.6,3645.35,3657.85,3748.75,3860.7,3998.05,4338.25,4069.65,4013.2,4006.4,4161.2,4034.3,4159.4,4224.05,4319.5,4327.55,4480.8,4386.85,4471.2,4607.25,4926.2,5063.45,4870.1,5042.34,5105.45,5178.7,5137.1],"m":[35.16,35.16,35.19,35.2,35.2,35.19,35.2,35.2,35.2,35.2,35.2,37.44,37.48,37.84,38.29,39.12,39.6,40.31,42.01,41.67,41.26,41.27,41.02,40.92,40.96,40.04,38.59,38.87,38.9,38.7,38.88,39.62,39.63,39.96,40.05,40.45,40.42,39.1,39.36,39.21,39.15,39.28,39.4,39.75,40.25,39.97,40.33,40.85,41.47,41.7,41.91,42.27,42.35,42.28,42.44,42.57,42.55,42.63,42.72,43.05,43.25,43.05,43.36,43.21,43.37,43.14,43.26,43.58,43.52,43.49,43.46,43.28,41.81,41.52,41.41,41.08,41.32,41.91,41.95,41.92,41.51,41.17,41.25,41.11,40.94,40.84,40.93,40.95,40.83,40.76,40.79,40.65,40.22,40.03,39.3,37.96,36.97,35.59,35.38,35.14,35.08,35.12,35.2,35.01,34.89,34.87,34.99,34.99,35.0,34.99,35.0,34.99,34.99,35.14,35.23,35.34,35.36,35.66,35.86,35.82,36.16,36.0,35.95,35.7,35.26,35.54,35.46,35.47,35.47,35.32,35.32,35.31,35.3,35.31,35.27,35.27,35.67,36.14,36.19,36.23,36.22,36.27,36.76,37.45,37.92,38.57,37.21,37.36,37.61,37.61,37.53,37.26,37.51,37.56,37.36,37.45,37.98,38.04,38.02,38.42,38.8,38.88,38.77,38.75,38.88,38.99,38.92,38.83,38.92,38.91,38.98,39.22,39.8,40.4,40.93,40.84,40.66,40.0,39.74,40.16,40.13,40.25,40.43,41.27,42.04,42.45,43.09,43.23,42.66,41.26,41.62,41.93,42.29,42.49,42.45,42.54,42.51,42.47,42.23,42.52,42.96,43.36,43.61,43.71,43.47,43.06,43.49,44.63,45.49,45.92,46.26,47.8,48.05,48.18,48.59,48.19,48.21,48.38,48.39,48.35,48.36,48.89,49.38,49.35,50.42,52.94,55.69,57.16,59.0,63.25,61.28,61.76,63.66,65.35,65.18,65.19,65.85,68.83,66.52,65.76,67.07,66.75,66.96,66.82,64.51,63.83,64.79,65.06,64.9,64.69,64.18,63.4,61.72,61.71,63.56,63.07,63.06,64.57,64.81,65.17,65.11,64.74,65.08,66.2,68.52,70.71,80.06,84.5,82.7,81.62,82.09,89.05,90.12,90.9,90.13,90.51,90.5,92.83,105.4,109.7,112.81,121.4,117.04,120.7,120.62,123.45,122.15,119.05,119.11,115.53,112.3,98.6,103.35,104.31,105.7,102.37,102.48,101.59,98.07,101.7,101.8,99.53,97.6,97.83,93.47,90.13,95.96,103.15,104.7,107.85,110.75,116.75,122.56,126.24,138.43,135.94,137.3,146.6,151.45,172.73,163.7,163.2,171.05,174.42,176.07,170.69,171.62,171.9,169.08,164.48,165.73,161.71,157.19,156.85,156.35,155.32,147.53,137.0,138.75,141.0,144.35,156.25,153.47,153.8,154.82,154.22,157.65,153.93,148.85,147.04,153.74,157.07,154.69,159.49,167.51,175.12,183.8,186.11,183.45,178.3,177.53,186.1,193.0,186.75,176.05,177.48,175.0,177.27,175.02,176.65,182.66,183.88,179.77,177.75,177.95,177.12,176.44,173.05,167.33,166.88,166.28,164.9,165.71,169.17,170.56,164.68,165.28,163.47,163.22,165.3,163.78,164.62,164.47,166.72,165.64,162.53,161.88,161.65,152.4,150.04,144.2,133.48,140.7,140.28,142.5,144.7,143.05,144.6,143.6,141.51,140.55,138.37,138.53,138.82,141.25,140.71,138.37,132.87,126.4,127.41,130.07,130.26,131.06,132.37,132.34,133.33,133.65,133.15,129.52,127.79,127.65,127.56,128.0,127.79,127.86,126.77,125.23,126.53,126.77,125.54,125.08,123.67,123.01,121.47,111.86,113.0,112.33,113.25,110.92,105.12,104.99,112.75,113.7,118.38,117.07,114.95,114.51,115.64,119.25,123.66,133.23,132.98,131.86,130.3,134.97,134.23,133.02,134.47,134.09,130.84,132.36,132.33,132.35,135.18,136.24,138.85,143.92,146.97,147.58,152.36,149.63,148.68,151.35,149.8,147.43,147.6,147.59,147.21,144.92,143.2,141.27,138.66,140.22,142.52,141.29,142.83,144.27,145.27,145.67,145.95,143.98,144.11,145.86,147.43,147.87,150.41,153.0,154.65,157.12,160.71,162.52,162.6,166.71,162.09,158.11,159.77,159.93,158.93,160.28,165.07,169.07,172.32,173.43,176.24,175.58,174.84,178.28,182.14,183.04,186.63,185.93,179.81,181.51,180.49,179.33,172.58,168.89,171.21,173.43,176.78,179.5,183.59,182.24,182.64,185.47,184.65,183.94,185.85,186.87,195.55,202.55,207.09,213.41,202.47,205.35,210.98,208.3,212.83,217.56,221.08,224.86,227.2,230.57,232.71,214.12,204.42,200.05,195.66,197.66,204.17,215.71,222.75,224.61,221.26,223.81,233.83,232.61,245.65,244.43,250.02,249.4,240.67,240.71,242.23,243.12,240.02,238.11,236.26,240.65,246.26,250.0,255.04,264.72,275.64,277.36,279.1,280.48,281.03,284.85,290.02,298.07,305.1,294.46,290.43,298.51,306.76,316.66,328.89,338.42,369.29,381.39,403.4,390.15,391.19,387.62,376.59,387.11,388.9,392.16,403.97,430.73,448.42,476.05,503.22,577.75,613.45,729.7,731.9,670.7,684.35,695.25,648.4,633.75,629.7,566.11,512.8,518.7,498.5,534.23,513.01,514.8,517.05,512.75,514.27,510.93,522.65,573.0,605.4,598.8,613.6,664.7,672.2,626.95,630.45,633.05,630.0,618.54,626.65,632.31,635.99,678.0,673.45,706.45,676.5,678.15,675.0,650.74,637.5,634.81,612.39,625.2,623.1,629.04,589.85,572.65,598.17,592.92,586.7,564.25,563.45,516.85,496.6,504.75,501.55,500.3,467.1,480.55,506.0,536.25,520.2,512.45,480.06,490.06,483.45,480.12,487.55,479.2,471.75,470.55,463.5,464.05,457.5,419.6,405.65,412.15,410.0,405.06,394.17,403.44,424.9,418.45,432.38,440.7,452.75,455.95,431.0,442.94,445.77,435.87,427.51,429.28,418.37,401.35,404.2,413.65,411.75,416.75,405.94,397.83,399.15,383.3,374.35,379.85,380.9,380.52,372.71,363.7,353.17,330.05,317.68,325.85,323.57,347.88,360.88,348.12,355.8,339.19,331.3,340.45,328.02,319.07,327.31,314.98,302.65,310.58,313.84,344.95,355.55,347.45,349.92,335.88,352.52,406.1,419.21,468.15,445.9,434.0,405.91,407.55,437.95,430.75,419.9,428.15,408.2,409.47,409.33,434.65,446.38,441.05,444.93,454.0,454.88,484.45,491.4,487.0,503.35,495.7,505.4,486.15,422.5,424.95,425.75,414.9,413.88,425.94,432.35,439.05,433.9,433.0,438.75,439.43,437.19,420.0,406.63,411.82,417.4,417.15,415.8,425.86,425.4,424.7,412.4,410.65,419.08,422.5,416.86,416.05,407.76,411.8,411.45,393.59,398.75,394.89,391.9,381.05,380.56,380.32,375.59,396.05,398.13,388.05,377.74,379.87,377.85,368.4,370.6,367.58,377.48,381.86,380.01,392.12,396.53,402.14,396.39,391.49,388.44,381.85,381.7,381.54,381.49,377.31,371.81,374.2,378.76,385.77,392.2,376.65,370.89,371.3,366.95,339.07,348.97,338.33,341.75,347.46,349.52,348.52,348.35,341.25,338.45,338.83,345.25,345.95,339.55,339.17,339.14,335.76,345.6,346.44,342.59,332.46,329.97,325.73,309.19,309.88,304.55,301.5,303.78,303.43,302.96,301.91,302.91,304.3,288.87,288.43,289.85,313.49,324.07,319.94,326.66,328.4,324.32,318.24,313.16,320.91,318.06,313.31,315.55,313.52,320.27,315.85,311.64,314.11,319.38,319.13,324.15,322.07,329.12,336.34,337.18,327.58,320.39,317.63,328.91,325.86,326.13,326.04,326.18,326.05,324.12,324.0,324.93,329.32,323.19,317.4,321.64,325.13,326.56,332.19,348.34,353.45,355.87,339.36,336.19,337.47,343.19,340.91,345.07,350.04,348.93,335.35,338.84,340.9,344.83,343.74,343.14,343.34,340.24,342.21,341.85,346.45,339.98,342.37,344.49,347.29,346.88,351.15,354.74,360.16,388.45,379.03,381.77,403.39,414.35,416.37,435.63,427.71,436.37,426.98,422.36,406.48,406.47,408.12,389.85,383.49,391.79,389.08,393.67,393.03,393.52,400.81,412.48,412.26,409.77,403.1,401.56,395.42,404.1,406.74,406.79,405.42,411.82,419.64,423.47,440.81,454.18,458.15,458.84,460.24,474.0,453.16,450.18,456.06,450.94,441.02,446.6,443.92,448.9,453.07,457.65,470.39,460.62,455.77,457.17,459.05,461.2,458.72,461.58,457.61,458.11,461.39,474.04,474.0,465.07,462.15,464.31,475.88,489.1,485.74,491.16,482.4,487.65,481.29,482.89,476.94,469.91,447.73,441.32,444.39,438.73,428.87,437.83,443.89,450.26,454.95,450.41,449.94,455.85,449.8,444.39,447.95,454.48,456.54,457.61,459.67,450.81,450.0,438.82,438.14,437.5,441.26,433.1,433.08,428.89,430.95,432.61,428.75,427.71,419.9,403.98,395.69,399.21,406.81,411.39,406.97,415.64,421.27,421.82,418.62,422.82,426.05,418.93,414.77,412.3,410.14,404.36,402.7,405.67,392.94,392.0,383.45,385.83,386.84,391.46,392.42,394.7,385.21,384.98,385.37,384.49,384.04,377.23,377.72,371.92,363.13,362.27,370.81,361.34,367.14,374.01,379.84,379.08,370.63,372.51,370.06,365.88,365.52,364.61,359.76,359.18,359.06,361.71,367.95,365.6,362.22,367.08,368.11,376.17,384.89,390.65,405.37,411.85,405.83,413.4,412.46,403.62,398.52,407.95,413.07,413.46,417.34,419.41,416.59,417.92,408.66,402.3,398.67,395.56,373.05,375.1,375.88,375.49,374.23,370.31,370.26,368.82,368.61,365.21,356.65,351.5,348.77,351.62,358.99,356.69,361.24,367.31,373.68,384.66,404.43,411.29,388.89,387.19,381.6,388.2,401.25,392.97,391.23,372.9,372.31,376.69,382.62,381.47,378.93,385.22,376.19,372.92,379.47,383.72,389.59,390.68,392.11,377.65,371.88,365.37,366.04,362.07,361.41,365.43,365.54,362.93,357.71,358.04,361.17,360.04,355.24,354.56,356.45,357.66,355.58,359.85,362.86,369.69,367.56,365.33,368.54,369.46,369.49,366.99,363.31,356.7,357.35,357.27,352.48,347.93,347.55,347.27,350.68,354.42,358.42,358.66,362.14,358.56,355.23,355.58,362.68,366.84,366.72,366.73,357.77,358.23,352.57,351.83,355.16,356.37,355.44,356.01,355.66,353.27,350.47,350.38,348.56,341.24,339.39,341.9,339.22,339.3,337.91,336.29,336.09,336.16,338.26,337.55,338.38,338.46,342.18,343.24,344.0,347.13,351.21,358.1,358.03,352.41,344.2,337.34,340.46,340.85,342.21,346.91,348.38,348.26,349.71,343.67,342.94,339.38,337.82,332.92,334.88,334.32,335.04,334.45,335.96,334.04,332.7,329.17,328.08,328.97,329.75,328.88,329.14,329.83,329.39,329.01,327.11,329.27,332.15,335.62,338.2,337.68,339.95,351.86,354.94,360.24,372.66,377.92,373.6,371.93,368.27,370.87,380.04,392.06,393.19,391.5,394.63,398.13,378.37,372.57,371.95,368.82,357.35,347.65,354.79,354.52,355.54,363.6,369.53,369.37,367.39,376.73,374.57,377.14,372.97,378.49,386.67,387.43,389.27,392.57,385.52,391.61,381.61,383.38,381.59,383.36,377.79,378.33,378.97,385.35,388.85,388.81,385.57,379.45,374.46,373.68,374.38,381.03,381.48,386.11,384.96,381.63,384.47,390.85,386.83,385.63,384.77,385.31,385.82,380.49,377.56,377.95,382.43,386.38,388.72,389.68,393.53,395.38,392.89,389.11,390.03,389.18,384.5,384.04,385.7,384.15,382.38,376.68,378.74,380.98,382.48,377.64,375.79,380.69,381.76,375.92,375.5,376.23,379.18,375.92,380.64,384.49,382.56,383.26,392.49,389.93,393.69,389.44,389.06,385.12,383.41,383.33,384.54,384.92,388.24,390.2,388.6,384.57,386.81,388.09,385.64,382.97,384.11,383.99,383.65,382.15,380.37,384.03,384.36,383.19,382.76,384.53,383.36,382.55,382.39,384.11,386.51,384.94,387.29,387.58,387.56,387.54,386.97,391.9,396.83,397.2,403.64,407.64,411.49,403.95,401.38,399.33,394.84,396.34,395.56,398.55,394.36,395.62,391.97,391.34,391.74,393.35,391.77,391.17,391.48,388.13,384.69,384.79,383.37,381.35,382.64,384.01,384.81,385.85,388.24,386.91,387.04,388.24,386.33,383.06,382.89,381.68,379.05,380.99,380.6,382.45,380.39,378.41,381.27,378.4,373.53,370.24,368.91,368.94,369.05,367.81,357.15,355.49,352.09,350.96,343.5,340.45,346.26,355.39,356.63,352.02,350.56,349.46,349.25,348.33,343.38,341.47,340.0,342.66,347.92,342.54,344.93,342.94,342.91,340.82,337.9,331.32,318.47,320.41,324.94,326.12,321.36,326.64,322.77,325.2,322.86,321.67,321.34,322.48,331.09,331.84,326.8,323.03,312.73,313.38,308.65,303.9,299.45,290.97,285.57,285.77,292.92,290.43,283.21,282.38,290.02,301.76,299.48,299.34,298.27,293.88,296.47,294.63,291.89,298.42,301.79,310.19,308.09,310.59,308.87,301.46,298.74,299.51,294.31,291.83,292.34,289.47,294.39,295.1,292.83,292.73,294.18,290.13,286.85,284.74,284.32,281.0,280.69,287.84,289.66,291.11,297.03,299.19,297.3,295.54,292.91,291.49,293.59,295.65,295.94,293.67,293.91,292.48,288.25,286.98,288.38,288.48,287.0,285.47,288.28,287.7,287.23,286.77,286.94,291.87,285.95,283.92,280.18,280.15,282.84,284.03,283.39,285.65,278.51,274.58,270.73,265.73,261.95,259.47,259.77,261.58,258.75,254.89,253.86,254.59,256.02,258.25,259.39,254.55,254.88,255.76,256.32,260.42,298.79,320.75,320.08,309.03,298.1,292.38,292.23,293.5,296.93,289.32,279.72,280.64,286.01,290.75,281.62,282.4,287.31,286.74,284.51,310.7,304.95,302.69,291.76,290.29,288.51,286.36,279.27,279.49,281.0,281.8,277.41,277.6,277.03,274.49,273.3,273.1,284.74,288.52,286.5,286.71,286.62,282.4,281.02,279.52,276.36,273.08,275.99,273.64,274.54,275.11,272.77,271.51,274.73,272.03,271.93,271.18,268.75,265.53,264.86,265.19,266.27,268.63,272.45,270.69,271.42,273.98,269.64,266.3,264.16,265.4,265.51,263.52,259.9,258.5,265.19,263.67,266.05,261.77,260.9,258.01,258.95,261.95,263.43,264.67,267.29,269.74,283.81,270.51,266.57,271.8,272.74,272.86,267.61,266.91,268.92,268.08,267.09,268.69,275.38,276.28,273.3,272.53,277.42,289.7,290.26,290.69,287.13,281.51,276.18,279.7,279.17,276.89,273.37,274.13,275.28,273.6,277.92,277.78,278.05,282.16,285.41,281.13,280.32,295.81,299.5,294.89,295.29,294.39,292.24,292.56,298.82,302.48,299.81,301.46,304.77,309.05,310.74,309.75,316.46,323.86,324.65,319.79,320.44,322.51,311.94,314.48,318.04,315.35,304.03,308.94,314.89,308.25,310.85,314.51,318.84,318.23,322.9,321.95,319.69,314.95,312.37,316.31,319.17,320.66,319.04,318.25,320.62,326.93,339.96,345.73,344.36,351.86,353.41,359.6,368.09,374.38,361.51,349.17,353.24,353.04,346.73,336.49,331.24,329.83,323.26,324.81,333.11,336.51,343.94,351.28,366.39,365.95,364.37,356.9,359.21,349.52,349.12,345.72,344.92,354.63,358.77,350.95,359.71,361.31,366.74,373.61,378.46,375.27,386.77,383.69,374.47,372.39,379.83,386.32,381.32,389.63,395.43,394.42,401.5,406.98,408.24,410.4,415.39,421.46,419.9,410.01,406.47,399.78,408.99,411.75,398.4,395.02,399.91,403.75,416.2,422.89,419.69,405.24,397.09,392.09,390.73,376.45,380.54,389.45,392.8,389.3,385.53,396.32,396.28,400.59,404.74,400.28,389.69,392.12,396.58,403.21,407.03,407.43,400.28,403.61,406.92,412.27,417.0,416.97,420.87,426.41,426.09,434.12,441.99,449.18,451.4,445.3,438.76,442.18,438.88,425.31,422.37,422.9,426.04,420.63,413.95,424.94,431.65,432.65,437.9,441.05,429.76,427.1,425.61,427.39,430.35,433.55,429.65,425.75,420.42,418.34,418.35,424.52,429.31,438.49,436.55,425.81,423.92,422.45,424.91,433.98,438.58,441.19,438.62,437.74,445.02,450.58,467.24,466.92,467.21,474.69,468.18,469.84,465.2,462.05,475.32,491.66,497.47,513.03,515.79,501.21,513.05,529.05,544.65,553.83,559.88,568.2,560.93,543.56,552.88,561.51,552.9,550.1,550.7,570.5,589.37,597.69,627.12,633.45,669.91,699.76,691.4,654.09,642.58,626.77,584.3,578.85,588.02,624.18,640.81,642.93,623.67,642.3,645.04,624.85,623.4,619.33,627.74,589.32,582.55,596.22,582.47,576.66,594.18,586.81,611.66,625.45,622.98,628.69,639.26,637.19,627.75,619.73,631.0,632.19,611.73,627.78,642.01,647.74,653.11,666.32,670.32,676.72,647.43,648.1,659.11,663.76,666.33,677.86,688.1,684.98,677.09,679.52,667.21,660.32,658.45,667.89,650.2,655.84,647.57,653.08,662.53,669.43,676.48,664.04,669.83,663.87,658.63,666.51,680.85,706.97,722.96,731.8,735.35,740.36,760.79,762.21,788.45,826.01,804.98,797.43,811.6,792.85,803.9,797.45,820.42,850.34,877.32,890.3,887.36,924.9,900.7,914.42,927.02,953.25,978.2,982.93,984.5,942.29,906.25,920.44,935.2,907.4,872.75,877.88,874.75,918.25,897.06,884.1,879.65,886.45,899.3,933.75,930.65,967.9,946.8,918.72,885.15,822.9,809.25,827.94,807.15,776.15,809.25,882.4,871.65,887.2,839.7,752.0,743.1,740.45,733.7,744.6,812.65,777.2,792.75,845.25,842.25,871.44,852.9,825.7,851.75,898.15,909.35,920.45,964.9,964.35,927.25,916.15,929.6,933.05,915.45,882.44,887.06,889.45,894.75,909.19,921.3,934.45,953.31,976.9,952.65,934.6,930.05,936.15,918.55,926.0,950.1,943.0,958.7,951.3,939.0,949.0,968.62,995.95,1008.65,1008.15,997.45,1034.6,1056.55,1057.6,1041.95,1076.95,1109.3,1137.0,1172.05,1199.7,1143.95,1119.4,1098.12,1099.83,1123.15,1142.6,1119.85,1092.7,1093.85,1074.25,1109.1,1106.0,1128.15,1120.65,1118.55,1098.1,1111.62,1139.94,1156.0,1139.6,1163.15,1183.46,1222.45,1205.1,1202.1,1216.0,1227.18,1233.3,1242.7,1236.6,1200.55,1207.8,1189.75,1174.2,1189.3,1203.15,1225.95,1231.45,1245.81,1251.4,1263.88,1288.05,1303.75,1335.75,1361.7,1346.45,1334.9,1364.65,1401.65,1356.2,1366.35,1381.65,1400.9,1388.05,1384.1,1408.42,1380.56,1376.55,1361.7,1332.5,1337.6,1356.25,1373.2,1402.95,1420.65,1427.5,1409.8,1432.3,1423.7,1450.2,1463.75,1497.88,1514.67,1521.19,1509.2,1494.65,1520.55,1535.25,1540.33,1522.54,1537.7,1502.05,1512.41,1566.1,1594.6,1616.15,1646.85,1754.9,1793.1,1823.55,1821.62,1867.6,1812.4,1782.95,1638.0,1646.5,1672.4,1650.0,1692.65,1727.9,1773.6,1760.9,1692.5,1727.2,1729.2,1631.9,1610.4,1565.33,1607.12,1636.1,1654.5,1687.6,1741.9,1725.7,1724.3,1755.25,1752.65,1693.4,1671.55,1649.1,1669.1,1648.25,1655.94,1645.75,1642.85,1649.65,1595.81,1558.9,1568.0,1564.3,1610.0,1607.25,1608.25,1571.4,1606.05,1579.3,1584.3,1590.75,1610.7,1609.6,1610.3,1641.75,1660.62,1694.3,1741.9,1766.45,1765.05,1780.55,1767.4,1742.65,1713.9,1715.0,1709.8,1723.7,1729.7,1737.65,1703.55,1704.4,1675.85,1658.83,1665.56,1660.7,1680.35,1684.0,1664.6,1671.55,1645.3,1595.05,1591.85,1578.75,1585.95,1606.75,1598.25,1566.06,1567.0,1396.8,1435.1,1469.45,1458.94,1406.45,1377.8,1395.0,1401.6,1377.9,1344.8,1246.5,1246.5,1257.1,1283.45,1324.05,1318.8,1294.35,1336.65,1369.2,1408.88,1389.25,1354.55,1330.1,1322.5,1317.35,1305.05,1287.05,1327.75,1339.15,1313.5,1281.15,1263.5,1244.05,1226.85,1239.15,1220.05,1199.5,1213.75,1232.05,1242.2,1249.1,1255.75,1255.0,1288.3,1318.65,1332.9,1339.95,1355.8,1350.6,1308.4,1289.05,1312.45,1308.56,1288.0,1290.35,1299.94,1296.65,1294.2,1264.06,1246.75,1261.15,1281.45,1315.05,1321.9,1326.75,1308.75,1303.95,1297.9,1298.85,1311.42,1291.8,1286.31,1273.7,1252.35,1231.1,1219.15,1211.65,1214.1,1232.7,1242.35,1213.15,1154.95,1160.3,1195.4,1195.0,1197.5,1214.6,1203.45,1183.92,1191.0,1206.9,1236.65,1289.25,1277.55,1270.45,1233.25,1216.6,1204.1,1205.0,1162.25,1159.3,1194.92,1187.35,1204.38,1197.66,1196.65,1194.45,1186.72,1198.65,1215.03,1190.42,1184.2,1180.03,1187.0,1180.36,1171.15,1161.85,1150.2,1101.04,1091.33,1089.69,1111.79,1129.39,1139.23,1134.24,1115.65,1115.48,1134.14,1121.02,1142.79,1170.4,1171.55,1162.5,1119.94,1089.61,1080.81,1069.74,1061.08,1074.41,1064.8,1072.89,1065.77,1085.6,1090.64,1093.02,1113.36,1136.07,1201.69,1209.75,1224.21,1243.39,1261.89,1249.47,1236.17,1230.09,1228.95,1244.45,1246.04,1248.24,1283.2,1271.57,1266.45,1232.34,1213.31,1251.8,1287.4,1281.73,1320.62,1357.34,1341.51,1325.83,1326.17,1357.03,1339.2,1345.0,1331.9,1312.62,1338.15,1322.71,1323.68,1329.14,1284.46,1257.67,1263.45,1269.08,1289.83,1282.38,1223.06,1204.1,1180.84,1170.19,1148.0,1133.26,1148.55,1166.4,1189.97,1207.04,1201.26,1207.15,1231.19,1232.47,1238.85,1245.25,1213.86,1213.59,1240.61,1251.21,1255.09,1266.92,1282.11,1267.42,1246.25,1225.34,1244.67,1257.72,1263.42,1284.06,1263.13,1250.47,1246.54,1225.21,1215.84,1238.12,1254.98,1266.23,1270.83,1281.4,1286.42,1314.55,1339.45,1329.05,1306.42,1292.99,1273.19,1290.06,1287.83,1274.47,1275.62,1279.73,1279.87,1287.12,1288.57,1265.24,1249.85,1264.32,1291.17,1314.75,1321.63,1336.17,1347.27,1344.71,1327.47,1338.83,1333.16,1324.02,1325.7,1320.86,1322.4,1341.0,1333.1,1339.26,1344.39,1324.13,1311.77,1314.12,1299.71,1294.81,1300.83,1295.93,1298.83,1273.38,1256.96,1251.69,1250.33,1230.85,1226.36,1217.86,1213.38,1188.55,1191.39,1206.56,1199.44,1200.09,1201.96,1195.3,1196.4,1197.69,1228.29,1231.67,1225.44,1228.8,1206.49,1224.21,1222.36,1236.82,1244.68,1249.82,1269.87,1286.79,1288.38,1290.52,1282.21,1313.11,1311.21,1310.63,1331.31,1323.71,1287.7,1300.71,1309.02,1310.18,1290.29,1300.91,1280.78,1276.65,1278.12,1284.64,1292.16,1276.54,1284.96,1329.25,1335.23,1358.03,1411.44,1407.58,1403.39,1418.22,1422.43,1424.08,1481.57,1511.24,1499.17,1534.2,1528.43,1501.49,1501.21,1514.76,1490.25,1502.42,1488.69,1493.21,1500.84,1490.66,1463.44,1467.84,1458.16,1470.64,1468.28,1477.2,1495.13,1525.61,1564.57,1551.78,1557.9,1579.1,1567.06,1571.97,1604.41,1651.83,1637.6,1644.26,1493.63,1591.25,1604.23,1650.09,1709.78,1704.2,1704.23,1696.89,1710.67,1741.49,1719.21,1721.73,1716.98,1723.45,1759.68,1774.68,1793.49,1804.61,1852.14,1950.69,2018.06,1967.58,1961.81,1937.23,1957.16,1933.34,1952.3,1888.58,1883.74,1900.78,1907.39,1912.55,1890.0,1907.98,1890.95,1875.92,1822.67,1815.04,1844.99,1855.36,1870.55,1880.85,1927.38,1851.23,1850.58,1849.51,1831.94,1832.27,1797.26,1794.55,1721.72,1709.8,1733.69,1732.75,1705.46,1739.67,1745.48,1781.18,1773.63,1794.16,1830.54,1864.57,1890.29,1891.33,1887.7,1836.16,1781.58,1771.83,1803.33,1815.57,1804.98,1810.46,1808.07,1743.65,1785.81,1792.77,1813.85,1805.56,1785.09,1765.03,1743.4,1754.83,1771.54,1779.52,1795.89,1786.24,1835.32,1863.28,1805.93,1785.72,1781.2,1785.77,1794.95,1805.23,1806.17,1813.36,1823.86,1824.96,1803.48,1823.76,1867.76,1913.33,1925.79,2002.5,1936.68,1937.82,1922.66,1928.63,1963.53,1952.86,1904.74,1876.53,1850.87,1824.84,1857.21,1847.12,1847.85,1836.83,1832.58,1817.23,1771.72,1723.87,1712.16,1736.25,1774.18,1787.59,1769.95,1747.75,1714.83,1715.34,1702.13,1668.91,1643.43,1701.92,1669.61,1641.74,1654.51,1643.46,1705.25,1768.99,1746.24,1771.65,1783.0,1788.01,1805.79,1806.8,1844.34,1884.08,1913.57,1930.85,1924.49,1874.85,1843.25,1832.38,1826.01,1832.11,1907.97,1972.69,1964.57,1996.22,2018.29,1993.07,1991.15,2018.19,2021.9,1990.69,1966.69,1962.06,1955.65,1955.76,1938.15,1914.39,1921.32,1942.62,1968.09,1965.04,1946.58,1927.65,1902.02,1907.01,1937.59,1928.54,1916.56,1928.23,1895.22,1825.61,1870.03,1942.96,1979.51,1990.29,1963.04,1963.21,1990.46,2029.14,2035.02,2007.63,2034.64,2067.3,2053.93,2034.76,2032.57,2024.1,2038.76,2030.29,2008.06,2025.23,2035.9,2132.45,2171.17,2167.98,2190.21,2279.06,2354.9,2374.31,2329.47,2308.51,2325.82,2364.98,2395.44,2341.51,2337.26,2309.66,2331.66,2322.77,2344.38,2378.93,2440.19,2392.59,2419.32,2409.7,2458.61,2506.93,2515.26,2502.85,2521.76,2585.67,2645.81,2651.12,2632.6,2676.34,2735.62,2758.05,2711.71,2597.24,2645.26,2651.88,2642.06,2681.38,2635.67,2619.95,2630.01,2655.09,2689.07,2741.46,2767.97,2841.76,2908.25,2926.84,2909.85,2903.54,2934.73,3021.87,3039.11,3119.44,3078.58,3269.19,3354.49,3273.34,3354.66,3217.81,3284.75,3297.46,3361.61,3352.84,3380.96,3326.27,3328.52,3315.68,3348.67,3377.3,3319.32,3371.61,3353.75,3336.34,3390.04,3514.35,3634.86,3666.72,3755.77,3848.74,3995.53,4193.95,4160.94,3992.8,3992.48,4146.14,4066.35,4133.49,4212.85,4226.69,4315.55,4456.25,4385.5,4450.46,4604.37,4800.28,5204.92,4878.01,5028.12,5019.08,5185.27,5137.1],"n":[4,5,5,5,5,5,5,5,5,5,4,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,3,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,4,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,7,7,4,1]},"Palladium":{"t":["1990-04-02","1990-04-09","1990-04-16","1990-04-23","1990-04-30","1990-05-07","1990-05-14","1990-05-21","1990-05-28","1990-06-04","1990-06-11","1990-06-18","1990-06-25","1990-07-02","1990-07-09","1990-07-16","1990-07-23","1990-07-30","1990-08-06","1990-08-13","1990-08-20","1990-08-27","1990-09-03","1990-09-10","1990-09-17","1990-09-24","1990-10-01","1990-10-08","1990-10-15","1990-10-22","1990-10-29","1990-11-05","1990-11-12","1990-11-19","1990-11-26","1990-12-03","1990-12-10","1990-12-17","1990-12-24","1990-12-31","1991-01-07","1991-01-14","1991-01-21","1991-01-28","1991-02-04","1991-02-11","1991-02-18","1991-02-25","1991-03-04","1991-03-11","1991-03-18","1991-03-25","1991-04-01","1991-04-08","1991-04-15","1991-04-22","1991-04-29","1991-05-06","1991-05-13","1991-05-20","1991-05-27","1991-06-03","1991-06-10","1991-06-17","1991-06-24","1991-07-01","1991-07-08","1991-07-15","1991-07-22","1991-07-29","1991-08-05","1991-08-12","1991-08-19","1991-08-26","1991-09-02","1991-09-09","1991-09-16","1991-09-23","1991-09-30","1991-10-07","1991-10-14","1991-10-21","1991-10-28","1991-11-04","1991-11-11","1991-11-18","1991-11-25","1991-12-02","1991-12-09","1991-12-16","1991-12-23","1991-12-30","1992-01-06","1992-01-13","1992-01-20","1992-01-27","1992-02-03","1992-02-10","1992-02-17","1992-02-24","1992-03-02","1992-03-09","1992-03-16","1992-03-23","1992-03-30","1992-04-06","1992-04-13","1992-04-20","1992-04-27","1992-05-04","1992-05-11","1992-05-18","1992-05-25","1992-06-01","1992-06-08","1992-06-15","1992-06-22","1992-06-29","1992-07-06","1992-07-13","1992-07-20","1992-07-27","1992-08-03","1992-08-10","1992-08-17","1992-08-24","1992-08-31","1992-09-07","1992-09-14","1992-09-21","1992-09-28","1992-10-05","1992-10-12","1992-10-19","1992-10-26","1992-11-02","1992-11-09","1992-11-16","1992-11-23","1992-11-30","1992-12-07","1992-12-14","1992-12-21","1992-12-28","1993-01-04","1993-01-11","1993-01-18","1993-01-25","1993-02-01","1993-02-08","1993-02-15","1993-02-22","1993-03-01","1993-03-08","1993-03-15","1993-03-22","1993-03-29","1993-04-05","1993-04-12","1993-04-19","1993-04-26","1993-05-03","1993-05-10","1993-05-17","1993-05-24","1993-05-31","1993-06-07","1993-06-14","1993-06-21","1993-06-28","1993-07-05","1993-07-12","1993-07-19","1993-07-26","1993-08-02","1993-08-09","1993-08-16","1993-08-23","1993-08-30","1993-09-06","1993-09-13","1993-09-20","1993-09-27","1993-10-04","1993-10-11","1993-10-18","1993-10-25","1993-11-01","1993-11-08","1993-11-15","1993-11-22","1993-11-29","1993-12-06","1993-12-13","1993-12-20","1993-12-27","1994-01-03","1994-01-10","1994-01-17","1994-01-24","1994-01-31","1994-02-07","1994-02-14","1994-02-21","1994-02-28","1994-03-07","1994-03-14","1994-03-21","1994-03-28","1994-04-04","1994-04-11","1994-04-18","1994-04-25","1994-05-02","1994-05-09","1994-05-16","1994-05-23","1994-05-30","1994-06-06","1994-06-13","1994-06-20","1994-06-27","1994-07-04","1994-07-11","1994-07-18","1994-07-25","1994-08-01","1994-08-08","1994-08-15","1994-08-22","1994-08-29","1994-09-05","1994-09-12","1994-09-19","1994-09-26","1994-10-03","1994-10-10","1994-10-17","1994-10-24","1994-10-31","1994-11-07","1994-11-14","1994-11-21","1994-11-28","1994-12-05","1994-12-12","1994-12-19","1994-12-26","1995-01-02","1995-01-09","1995-01-16","1995-01-23","1995-01-30","1995-02-06","1995-02-13","1995-02-20","1995-02-27","1995-03-06","1995-03-13","1995-03-20","1995-03-27","1995-04-03","1995-04-10","1995-04-17","1995-04-24","1995-05-01","1995-05-08","1995-05-15","1995-05-22","1995-05-29","1995-06-05","1995-06-12","1995-06-19","1995-06-26","1995-07-03","1995-07-10","1995-07-17","1995-07-24","1995-07-31","1995-08-07","1995-08-14","1995-08-21","1995-08-28","1995-09-04","1995-09-11","1995-09-18","1995-09-25","1995-10-02","1995-10-09","1995-10-16","1995-10-23","1995-10-30","1995-11-06","1995-11-13","1995-11-20","1995-11-27","1995-12-04","1995-12-11","1995-12-18","1995-12-25","1996-01-01","1996-01-08","1996-01-15","1996-01-22","1996-01-29","1996-02-05","1996-02-12","1996-02-19","1996-02-26","1996-03-04","1996-03-11","1996-03-18","1996-03-25","1996-04-01","1996-04-08","1996-04-15","1996-04-22","1996-04-29","1996-05-06","1996-05-13","1996-05-20","1996-05-27","1996-06-03","1996-06-10","1996-06-17","1996-06-24","1996-07-01","1996-07-08","1996-07-15","1996-07-22","1996-07-29","1996-08-05","1996-08-12","1996-08-19","1996-08-26","1996-09-02","1996-09-09","1996-09-16","1996-09-23","1996-09-30","1996-10-07","1996-10-14","1996-10-21","1996-10-28","1996-11-04","1996-11-11","1996-11-18","1996-11-25","1996-12-02","1996-12-09","1996-12-16","1996-12-23","1996-12-30","1997-01-06","1997-01-13","1997-01-20","1997-01-27","1997-02-03","1997-02-10","1997-02-17","1997-02-24","1997-03-03","1997-03-10","1997-03-17","1997-03-24","1997-03-31","1997-04-07","1997-04-14","1997-04-21","1997-04-28","1997-05-05","1997-05-12","1997-05-19","1997-05-26","1997-06-02","1997-06-09","1997-06-16","1997-06-23","1997-06-30","1997-07-07","1997-07-14","1997-07-21","1997-07-28","1997-08-04","1997-08-11","1997-08-18","1997-08-25","1997-09-01","1997-09-08","1997-09-15","1997-09-22","1997-09-29","1997-10-06","1997-10-13","1997-10-20","1997-10-27","1997-11-03","1997-11-10","1997-11-17","1997-11-24","1997-12-01","1997-12-08","1997-12-15","1997-12-22","1997-12-29","1998-01-05","1998-01-12","1998-01-19","1998-01-26","1998-02-02","1998-02-09","1998-02-16","1998-02-23","1998-03-02","1998-03-09","1998-03-16","1998-03-23","1998-03-30","1998-04-06","1998-04-13","1998-04-20","1998-04-27","1998-05-04","1998-05-11","1998-05-18","1998-05-25","1998-06-01","1998-06-08","1998-06-15","1998-06-22","1998-06-29","1998-07-06","1998-07-13","1998-07-20","1998-07-27","1998-08-03","1998-08-10","1998-08-17","1998-08-24","1998-08-31","1998-09-07","1998-09-14","1998-09-21","1998-09-28","1998-10-05","1998-10-12","1998-10-19","1998-10-26","1998-11-02","1998-11-09","1998-11-16","1998-11-23","1998-11-30","1998-12-07","1998-12-14","1998-12-21","1998-12-28","1999-01-04","1999-01-11","1999-01-18","1999-01-25","1999-02-01","1999-02-08","1999-02-15","1999-02-22","1999-03-01","1999-03-08","1999-03-15","1999-03-22","1999-03-29","1999-04-05","1999-04-12","1999-04-19","1999-04-26","1999-05-03","1999-05-10","1999-05-17","1999-05-24","1999-05-31","1999-06-07","1999-06-14","1999-06-21","1999-06-28","1999-07-05","1999-07-12","1999-07-19","1999-07-26","1999-08-02","1999-08-09","1999-08-16","1999-08-23","1999-08-30","1999-09-06","1999-09-13","1999-09-20","1999-09-27","1999-10-04","1999-10-11","1999-10-18","1999-10-25","1999-11-01","1999-11-08","1999-11-15","1999-11-22","1999-11-29","1999-12-06","1999-12-13","1999-12-20","1999-12-27","2000-01-03","2000-01-10","2000-01-17","2000-01-24","2000-01-31","2000-02-07","2000-02-14","2000-02-21","2000-02-28","2000-03-06","2000-03-13","2000-03-20","2000-03-27","2000-04-03","2000-04-10","2000-04-17","2000-04-24","2000-05-01","2000-05-08","2000-05-15","2000-05-22","2000-05-29","2000-06-05","2000-06-12","2000-06-19","2000-06-26","2000-07-03","2000-07-10","2000-07-17","2000-07-24","2000-07-31","2000-08-07","2000-08-14","2000-08-21","2000-08-28","2000-09-04","2000-09-11","2000-09-18","2000-09-25","2000-10-02","2000-10-09","2000-10-16","2000-10-23","2000-10-30","2000-11-06","2000-11-13","2000-11-20","2000-11-27","2000-12-04","2000-12-11","2000-12-18","2000-12-25","2001-01-01","2001-01-08","2001-01-15","2001-01-22","2001-01-29","2001-02-05","2001-02-12","2001-02-19","2001-02-26","2001-03-05","2001-03-12","2001-03-19","2001-03-26","2001-04-02","2001-04-09","2001-04-16","2001-04-23","2001-04-30","2001-05-07","2001-05-14","2001-05-21","2001-05-28","2001-06-04","2001-06-11","2001-06-18","2001-06-25","2001-07-02","2001-07-09","2001-07-16","2001-07-23","2001-07-30","2001-08-06","2001-08-13","2001-08-20","2001-08-27","2001-09-03","2001-09-10","2001-09-17","2001-09-24","2001-10-01","2001-10-08","2001-10-15","2001-10-22","2001-10-29","2001-11-05","2001-11-12","2001-11-19","2001-11-26","2001-12-03","2001-12-10","2001-12-17","2001-12-24","2001-12-31","2002-01-07","2002-01-14","2002-01-21","2002-01-28","2002-02-04","2002-02-11","2002-02-18","2002-02-25","2002-03-04","2002-03-11","2002-03-18","2002-03-25","2002-04-01","2002-04-08","2002-04-15","2002-04-22","2002-04-29","2002-05-06","2002-05-13","2002-05-20","2002-05-27","2002-06-03","2002-06-10","2002-06-17","2002-06-24","2002-07-01","2002-07-08","2002-07-15","2002-07-22","2002-07-29","2002-08-05","2002-08-12","2002-08-19","2002-08-26","2002-09-02","2002-09-09","2002-09-16","2002-09-23","2002-09-30","2002-10-07","2002-10-14","2002-10-21","2002-10-28","2002-11-04","2002-11-11","2002-11-18","2002-11-25","2002-12-02","2002-12-09","2002-12-16","2002-12-23","2002-12-30","2003-01-06","2003-01-13","2003-01-20","2003-01-27","2003-02-03","2003-02-10","2003-02-17","2003-02-24","2003-03-03","2003-03-10","2003-03-17","2003-03-24","2003-03-31","2003-04-07","2003-04-14","2003-04-21","2003-04-28","2003-05-05","2003-05-12","2003-05-19","2003-05-26","2003-06-02","2003-06-09","2003-06-16","2003-06-23","2003-06-30","2003-07-07","2003-07-14","2003-07-21","2003-07-28","2003-08-04","2003-08-11","2003-08-18","2003-08-25","2003-09-01","2003-09-08","2003-09-15","2003-09-22","2003-09-29","2003-10-06","2003-10-13","2003-10-20","2003-10-27","2003-11-03","2003-11-10","2003-11-17","2003-11-24","2003-12-01","2003-12-08","2003-12-15","2003-12-22","2003-12-29","2004-01-05","2004-01-12","2004-01-19","2004-01-26","2004-02-02","2004-02-09","2004-02-16","2004-02-23","2004-03-01","2004-03-08","2004-03-15","2004-03-22","2004-03-29","2004-04-05","2004-04-12","2004-04-19","2004-04-26","2004-05-03","2004-05-10","2004-05-17","2004-05-24","2004-05-31","2004-06-07","2004-06-14","2004-06-21","2004-06-28","2004-07-05","2004-07-12","2004-07-19","2004-07-26","2004-08-02","2004-08-09","2004-08-16","2004-08-23","2004-08-30","2004-09-06","2004-09-13","2004-09-20","2004-09-27","2004-10-04","2004-10-11","2004-10-18","2004-10-25","2004-11-01","2004-11-08","2004-11-15","2004-11-22","2004-11-29","2004-12-06","2004-12-13","2004-12-20","2004-12-27","2005-01-03","2005-01-10","2005-01-17","2005-01-24","2005-01-31","2005-02-07","2005-02-14","2005-02-21","2005-02-28","2005-03-07","2005-03-14","2005-03-21","2005-03-28","2005-04-04","2005-04-11","2005-04-18","2005-04-25","2005-05-02","2005-05-09","2005-05-16","2005-05-23","2005-05-30","2005-06-06","2005-06-13","2005-06-20","2005-06-27","2005-07-04","2005-07-11","2005-07-18","2005-07-25","2005-08-01","2005-08-08","2005-08-15","2005-08-22","2005-08-29","2005-09-05","2005-09-12","2005-09-19","2005-09-26","2005-10-03","2005-10-10","2005-10-17","2005-10-24","2005-10-31","2005-11-07","2005-11-14","2005-11-21","2005-11-28","2005-12-05","2005-12-12","2005-12-19","2005-12-26","2006-01-02","2006-01-09","2006-01-16","2006-01-23","2006-01-30","2006-02-06","2006-02-13","2006-02-20","2006-02-27","2006-03-06","2006-03-13","2006-03-20","2006-03-27","2006-04-03","2006-04-10","2006-04-17","2006-04-24","2006-05-01","2006-05-08","2006-05-15","2006-05-22","2006-05-29","2006-06-05","2006-06-12","2006-06-19","2006-06-26","2006-07-03","2006-07-10","2006-07-17","2006-07-24","2006-07-31","2006-08-07","2006-08-14","2006-08-21","2006-08-28","2006-09-04","2006-09-11","2006-09-18","2006-09-25","2006-10-02","2006-10-09","2006-10-16","2006-10-23","2006-10-30","2006-11-06","2006-11-13","2006-11-20","2006-11-27","2006-12-04","2006-12-11","2006-12-18","2006-12-25","2007-01-01","2007-01-08","2007-01-15","2007-01-22","2007-01-29","2007-02-05","2007-02-12","2007-02-19","2007-02-26","2007-03-05","2007-03-12","2007-03-19","2007-03-26","2007-04-02","2007-04-09","2007-04-16","2007-04-23","2007-04-30","2007-05-07","2007-05-14","2007-05-21","2007-05-28","2007-06-04","2007-06-11","2007-06-18","2007-06-25","2007-07-02","2007-07-09","2007-07-16","2007-07-23","2007-07-30","2007-08-06","2007-08-13","2007-08-20","2007-08-27","2007-09-03","2007-09-10","2007-09-17","2007-09-24","2007-10-01","2007-10-08","2007-10-15","2007-10-22","2007-10-29","2007-11-05","2007-11-12","2007-11-19","2007-11-26","2007-12-03","2007-12-10","2007-12-17","2007-12-24","2007-12-31","2008-01-07","2008-01-14","2008-01-21","2008-01-28","2008-02-04","2008-02-11","2008-02-18","2008-02-25","2008-03-03","2008-03-10","2008-03-17","2008-03-24","2008-03-31","2008-04-07","2008-04-14","2008-04-21","2008-04-28","2008-05-05","2008-05-12","2008-05-19","2008-05-26","2008-06-02","2008-06-09","2008-06-16","2008-06-23","2008-06-30","2008-07-07","2008-07-14","2008-07-21","2008-07-28","2008-08-04","2008-08-11","2008-08-18","2008-08-25","2008-09-01","2008-09-08","2008-09-15","2008-09-22","2008-09-29","2008-10-06","2008-10-13","2008-10-20","2008-10-27","2008-11-03","2008-11-10","2008-11-17","2008-11-24","2008-12-01","2008-12-08","2008-12-15","2008-12-22","2008-12-29","2009-01-05","2009-01-12","2009-01-19","2009-01-26","2009-02-02","2009-02-09","2009-02-16","2009-02-23","2009-03-02","2009-03-09","2009-03-16","2009-03-23","2009-03-30","2009-04-06","2009-04-13","2009-04-20","2009-04-27","2009-05-04","2009-05-11","2009-05-18","2009-05-25","2009-06-01","2009-06-08","2009-06-15","2009-06-22","2009-06-29","2009-07-06","2009-07-13","2009-07-20","2009-07-27","2009-08-03","2009-08-10","2009-08-17","2009-08-24","2009-08-31","2009-09-07","2009-09-14","2009-09-21","2009-09-28","2009-10-05","2009-10-12","2009-10-19","2009-10-26","2009-11-02","2009-11-09","2009-11-16","2009-11-23","2009-11-30","2009-12-07","2009-12-14","2009-12-21","2009-12-28","2010-01-04","2010-01-11","2010-01-18","2010-01-25","2010-02-01","2010-02-08","2010-02-15","2010-02-22","2010-03-01","2010-03-08","2010-03-15","2010-03-22","2010-03-29","2010-04-05","2010-04-12","2010-04-19","2010-04-26","2010-05-03","2010-05-10","2010-05-17","2010-05-24","2010-05-31","2010-06-07","2010-06-14","2010-06-21","2010-06-28","2010-07-05","2010-07-12","2010-07-19","2010-07-26","2010-08-02","2010-08-09","2010-08-16","2010-08-23","2010-08-30","2010-09-06","2010-09-13","2010-09-20","2010-09-27","2010-10-04","2010-10-11","2010-10-18","2010-10-25","2010-11-01","2010-11-08","2010-11-15","2010-11-22","2010-11-29","2010-12-06","2010-12-13","2010-12-20","2010-12-27","2011-01-03","2011-01-10","2011-01-17","2011-01-24","2011-01-31","2011-02-07","2011-02-14","2011-02-21","2011-02-28","2011-03-07","2011-03-14","2011-03-21","2011-03-28","2011-04-04","2011-04-11","2011-04-18","2011-04-25","2011-05-02","2011-05-09","2011-05-16","2011-05-23","2011-05-30","2011-06-06","2011-06-13","2011-06-20","2011-06-27","2011-07-04","2011-07-11","2011-07-18","2011-07-25","2011-08-01","2011-08-08","2011-08-15","2011-08-22","2011-08-29","2011-09-05","2011-09-12","2011-09-19","2011-09-26","2011-10-03","2011-10-10","2011-10-17","2011-10-24","2011-10-31","2011-11-07","2011-11-14","2011-11-21","2011-11-28","2011-12-05","2011-12-12","2011-12-19","2011-12-26","2012-01-02","2012-01-09","2012-01-16","2012-01-23","2012-01-30","2012-02-06","2012-02-13","2012-02-20","2012-02-27","2012-03-05","2012-03-12","2012-03-19","2012-03-26","2012-04-02","2012-04-09","2012-04-16","2012-04-23","2012-04-30","2012-05-07","2012-05-14","2012-05-21","2012-05-28","2012-06-04","2012-06-11","2012-06-18","2012-06-25","2012-07-02","2012-07-09","2012-07-16","2012-07-23","2012-07-30","2012-08-06","2012-08-13","2012-08-20","2012-08-27","2012-09-03","2012-09-10","2012-09-17","2012-09-24","2012-10-01","2012-10-08","2012-10-15","2012-10-22","2012-10-29","2012-11-05","2012-11-12","2012-11-19","2012-11-26","2012-12-03","2012-12-10","2012-12-17","2012-12-24","2012-12-31","2013-01-07","2013-01-14","2013-01-21","2013-01-28","2013-02-04","2013-02-11","2013-02-18","2013-02-25","2013-03-04","2013-03-11","2013-03-18","2013-03-25","2013-04-01","2013-04-08","2013-04-15","2013-04-22","2013-04-29","2013-05-06","2013-05-13","2013-05-20","2013-05-27","2013-06-03","2013-06-10","2013-06-17","2013-06-24","2013-07-01","2013-07-08","2013-07-15","2013-07-22","2013-07-29","2013-08-05","2013-08-12","2013-08-19","2013-08-26","2013-09-02","2013-09-09","2013-09-16","2013-09-23","2013-09-30","2013-10-07","2013-10-14","2013-10-21","2013-10-28","2013-11-04","2013-11-11","2013-11-18","2013-11-25","2013-12-02","2013-12-09","2013-12-16","2013-12-23","2013-12-30","2014-01-06","2014-01-13","2014-01-20","2014-01-27","2014-02-03","2014-02-10","2014-02-17","2014-02-24","2014-03-03","2014-03-10","2014-03-17","2014-03-24","2014-03-31","2014-04-07","2014-04-14","2014-04-21","2014-04-28","2014-05-05","2014-05-12","2014-05-19","2014-05-26","2014-06-02","2014-06-09","2014-06-16","2014-06-23","2014-06-30","2014-07-07","2014-07-14","2014-07-21","2014-07-28","2014-08-04","2014-08-11","2014-08-18","2014-08-25","2014-09-01","2014-09-08","2014-09-15","2014-09-22","2014-09-29","2014-10-06","2014-10-13","2014-10-20","2014-10-27","2014-11-03","2014-11-10","2014-11-17","2014-11-24","2014-12-01","2014-12-08","2014-12-15","2014-12-22","2014-12-29","2015-01-05","2015-01-12","2015-01-19","2015-01-26","2015-02-02","2015-02-09","2015-02-16","2015-02-23","2015-03-02","2015-03-09","2015-03-16","2015-03-23","2015-03-30","2015-04-06","2015-04-13","2015-04-20","2015-04-27","2015-05-04","2015-05-11","2015-05-18","2015-05-25","2015-06-01","2015-06-08","2015-06-15","2015-06-22","2015-06-29","2015-07-06","2015-07-13","2015-07-20","2015-07-27","2015-08-03","2015-08-10","2015-08-17","2015-08-24","2015-08-31","2015-09-07","2015-09-14","2015-09-21","2015-09-28","2015-10-05","2015-10-12","2015-10-19","2015-10-26","2015-11-02","2015-11-09","2015-11-16","2015-11-23","2015-11-30","2015-12-07","2015-12-14","2015-12-21","2015-12-28","2016-01-04","2016-01-11","2016-01-18","2016-01-25","2016-02-01","2016-02-08","2016-02-15","2016-02-22","2016-02-29","2016-03-07","2016-03-14","2016-03-21","2016-03-28","2016-04-04","2016-04-11","2016-04-18","2016-04-25","2016-05-02","2016-05-09","2016-05-16","2016-05-23","2016-05-30","2016-06-06","2016-06-13","2016-06-20","2016-06-27","2016-07-04","2016-07-11","2016-07-18","2016-07-25","2016-08-01","2016-08-08","2016-08-15","2016-08-22","2016-08-29","2016-09-05","2016-09-12","2016-09-19","2016-09-26","2016-10-03","2016-10-10","2016-10-17","2016-10-24","2016-10-31","2016-11-07","2016-11-14","2016-11-21","2016-11-28","2016-12-05","2016-12-12","2016-12-19","2016-12-26","2017-01-02","2017-01-09","2017-01-16","2017-01-23","2017-01-30","2017-02-06","2017-02-13","2017-02-20","2017-02-27","2017-03-06","2017-03-13","2017-03-20","2017-03-27","2017-04-03","2017-04-10","2017-04-17","2017-04-24","2017-05-01","2017-05-08","2017-05-15","2017-05-22","2017-05-29","2017-06-05","2017-06-12","2017-06-19","2017-06-26","2017-07-03","2017-07-10","2017-07-17","2017-07-24","2017-07-31","2017-08-07","2017-08-14","2017-08-21","2017-08-28","2017-09-04","2017-09-11","2017-09-18","2017-09-25","2017-10-02","2017-10-09","2017-10-16","2017-10-23","2017-10-30","2017-11-06","2017-11-13","2017-11-20","2017-11-27","2017-12-04","2017-12-11","2017-12-18","2017-12-25","2018-01-01","2018-01-08","2018-01-15","2018-01-22","2018-01-29","2018-02-05","2018-02-12","2018-02-19","2018-02-26","2018-03-05","2018-03-12","2018-03-19","2018-03-26","2018-04-02","2018-04-09","2018-04-16","2018-04-23","2018-04-30","2018-05-07","2018-05-14","2018-05-21","2018-05-28","2018-06-04","2018-06-11","2018-06-18","2018-06-25","2018-07-02","2018-07-09","2018-07-16","2018-07-23","2018-07-30","2018-08-06","2018-08-13","2018-08-20","2018-08-27","2018-09-03","2018-09-10","2018-09-17","2018-09-24","2018-10-01","2018-10-08","2018-10-15","2018-10-22","2018-10-29","2018-11-05","2018-11-12","2018-11-19","2018-11-26","2018-12-03","2018-12-10","2018-12-17","2018-12-24","2018-12-31","2019-01-07","2019-01-14","2019-01-21","2019-01-28","2019-02-04","2019-02-11","2019-02-18","2019-02-25","2019-03-04","2019-03-11","2019-03-18","2019-03-25","2019-04-01","2019-04-08","2019-04-15","2019-04-22","2019-04-29","2019-05-06","2019-05-13","2019-05-20","2019-05-27","2019-06-03","2019-06-10","2019-06-17","2019-06-24","2019-07-01","2019-07-08","2019-07-15","2019-07-22","2019-07-29","2019-08-05","2019-08-12","2019-08-19","2019-08-26","2019-09-02","2019-09-09","2019-09-16","2019-09-23","2019-09-30","2019-10-07","2019-10-14","2019-10-21","2019-10-28","2019-11-04","2019-11-11","2019-11-18","2019-11-25","2019-12-02","2019-12-09","2019-12-16","2019-12-23","2019-12-30","2020-01-06","2020-01-13","2020-01-20","2020-01-27","2020-02-03","2020-02-10","2020-02-17","2020-02-24","2020-03-02","2020-03-09","2020-03-16","2020-03-23","2020-03-30","2020-04-06","2020-04-13","2020-04-20","2020-04-27","2020-05-04","2020-05-11","2020-05-18","2020-05-25","2020-06-01","2020-06-08","2020-06-15","2020-06-22","2020-06-29","2020-07-06","2020-07-13","2020-07-20","2020-07-27","2020-08-03","2020-08-10","2020-08-17","2020-08-24","2020-08-31","2020-09-07","2020-09-14","2020-09-21","2020-09-28","2020-10-05","2020-10-12","2020-10-19","2020-10-26","2020-11-02","2020-11-09","2020-11-16","2020-11-23","2020-11-30","2020-12-07","2020-12-14","2020-12-21","2020-12-28","2021-01-04","2021-01-11","2021-01-18","2021-01-25","2021-02-01","2021-02-08","2021-02-15","2021-02-22","2021-03-01","2021-03-08","2021-03-15","2021-03-22","2021-03-29","2021-04-05","2021-04-12","2021-04-19","2021-04-26","2021-05-03","2021-05-10","2021-05-17","2021-05-24","2021-05-31","2021-06-07","2021-06-14","2021-06-21","2021-06-28","2021-07-05","2021-07-12","2021-07-19","2021-07-26","2021-08-02","2021-08-09","2021-08-16","2021-08-23","2021-08-30","2021-09-06","2021-09-13","2021-09-20","2021-09-27","2021-10-04","2021-10-11","2021-10-18","2021-10-25","2021-11-01","2021-11-08","2021-11-15","2021-11-22","2021-11-29","2021-12-06","2021-12-13","2021-12-20","2021-12-27","2022-01-03","2022-01-10","2022-01-17","2022-01-24","2022-01-31","2022-02-07","2022-02-14","2022-02-21","2022-02-28","2022-03-07","2022-03-14","2022-03-21","2022-03-28","2022-04-04","2022-04-11","2022-04-18","2022-04-25","2022-05-02","2022-05-09","2022-05-16","2022-05-23","2022-05-30","2022-06-06","2022-06-13","2022-06-20","2022-06-27","2022-07-04","2022-07-11","2022-07-18","2022-07-25","2022-08-01","2022-08-08","2022-08-15","2022-08-22","2022-08-29","2022-09-05","2022-09-12","2022-09-19","2022-09-26","2022-10-03","2022-10-10","2022-10-17","2022-10-24","2022-10-31","2022-11-07","2022-11-14","2022-11-21","2022-11-28","2022-12-05","2022-12-12","2022-12-19","2022-12-26","2023-01-02","2023-01-09","2023-01-16","2023-01-23","2023-01-30","2023-02-06","2023-02-13","2023-02-20","2023-02-27","2023-03-06","2023-03-13","2023-03-20","2023-03-27","2023-04-03","2023-04-10","2023-04-17","2023-04-24","2023-05-01","2023-05-08","2023-05-15","2023-05-22","2023-05-29","2023-06-05","2023-06-12","2023-06-19","2023-06-26","2023-07-03","2023-07-10","2023-07-17","2023-07-24","2023-07-31","2023-08-07","2023-08-14","2023-08-21","2023-08-28","2023-09-04","2023-09-11","2023-09-18","2023-09-25","2023-10-02","2023-10-09","2023-10-16","2023-10-23","2023-10-30","2023-11-06","2023-11-13","2023-11-20","2023-11-27","2023-12-04","2023-12-11","2023-12-18","2023-12-25","2024-01-01","2024-01-08","2024-01-15","2024-01-22","2024-01-29","2024-02-05","2024-02-12","2024-02-19","2024-02-26","2024-03-04","2024-03-11","2024-03-18","2024-03-25","2024-04-01","2024-04-08","2024-04-15","2024-04-22","2024-04-29","2024-05-06","2024-05-13","2024-05-20","2024-05-27","2024-06-03","2024-06-10","2024-06-17","2024-06-24","2024-07-01","2024-07-08","2024-07-15","2024-07-22","2024-07-29","2024-08-05","2024-08-12","2024-08-19","2024-08-26","2024-09-02","2024-09-09","2024-09-16","2024-09-23","2024-09-30","2024-10-07","2024-10-14","2024-10-21","2024-10-28","2024-11-04","2024-11-11","2024-11-18","2024-11-25","2024-12-02","2024-12-09","2024-12-16","2024-12-23","2024-12-30","2025-01-06","2025-01-13","2025-01-20","2025-01-27","2025-02-03","2025-02-10","2025-02-17","2025-02-24","2025-03-03","2025-03-10","2025-03-17","2025-03-24","2025-03-31","2025-04-07","2025-04-14","2025-04-21","2025-04-28","2025-05-05","2025-05-12","2025-05-19","2025-05-26","2025-06-02","2025-06-09","2025-06-16","2025-06-23","2025-06-30","2025-07-07","2025-07-14","2025-07-21","2025-07-28","2025-08-04","2025-08-11","2025-08-18","2025-08-25","2025-09-01","2025-09-08","2025-09-15","2025-09-22","2025-09-29","2025-10-06","2025-10-13","2025-10-20","2025-10-27","2025-11-03","2025-11-10","2025-11-17","2025-11-24","2025-12-01","2025-12-08","2025-12-15","2025-12-22","2025-12-29","2026-01-05","2026-01-12","2026-01-19","2026-01-26","2026-02-02","2026-02-09","2026-02-16","2026-02-23","2026-03-09"],"o":[128.0,128.5,128.65,128.0,122.25,119.85,118.5,122.75,121.25,118.75,117.35,114.75,114.0,116.75,117.5,117.75,117.75,116.75,114.5,117.0,118.25,111.25,112.25,106.25,105.25,101.25,97.0,100.25,93.75,93.25,94.6,94.0,93.0,93.25,94.0,92.25,92.75,87.6,87.75,81.75,83.75,93.0,91.25,87.0,85.75,88.4,86.0,79.25,86.5,89.5,85.5,86.0,90.75,92.25,96.75,96.5,100.25,95.5,95.0,94.0,94.25,97.55,96.75,96.1,98.5,97.65,97.35,95.0,95.5,91.75,84.5,84.5,85.25,80.65,81.5,82.0,81.5,82.25,82.25,84.5,88.0,86.4,85.9,87.0,85.5,84.6,84.75,84.25,85.75,83.75,79.75,79.75,79.25,80.75,84.25,85.6,86.75,85.75,86.0,84.55,83.6,84.25,84.5,84.25,85.0,85.0,84.4,82.25,82.5,83.25,82.75,83.1,82.65,79.15,80.0,81.5,80.75,81.1,83.25,86.15,89.75,89.75,88.45,87.75,83.5,85.15,87.1,90.25,89.25,90.5,92.5,95.75,96.0,95.15,94.25,94.0,95.5,94.25,94.85,94.5,105.0,113.5,108.0,106.5,106.25,110.75,107.25,108.25,109.75,113.25,113.0,100.75,102.25,104.25,106.75,106.6,109.65,114.5,112.5,114.5,117.25,116.25,120.0,120.25,119.75,123.25,123.5,125.75,128.0,131.0,137.25,139.0,139.25,139.25,143.5,140.0,139.25,137.35,126.0,122.5,117.75,120.5,125.25,126.0,127.6,131.25,131.0,129.25,129.75,129.6,128.5,125.85,124.25,127.1,125.25,124.0,124.25,124.0,124.25,123.75,124.35,128.0,133.25,133.5,135.6,130.1,133.5,133.25,134.5,134.75,133.5,132.5,134.25,139.75,137.25,136.25,135.75,135.0,134.0,136.5,138.6,138.5,144.25,144.5,146.15,146.5,151.75,149.75,151.75,154.5,152.0,154.25,152.25,151.5,156.0,152.0,153.5,153.75,155.6,159.35,157.75,156.15,154.25,154.0,153.0,153.25,153.0,155.5,156.6,153.85,153.5,157.6,156.5,157.25,157.0,157.45,155.75,153.75,157.5,165.85,170.35,175.4,172.25,174.25,166.0,163.25,160.5,161.75,157.25,162.75,157.5,158.25,159.75,157.5,158.1,157.25,154.65,153.75,153.0,151.75,146.75,150.25,148.35,146.0,145.5,146.75,135.35,142.35,137.85,137.25,135.0,135.25,134.0,135.75,134.25,133.25,130.0,133.75,132.0,131.0,128.75,130.75,129.5,130.5,127.25,139.5,138.25,141.5,140.25,134.75,139.5,138.25,140.25,139.75,140.5,136.75,132.25,131.4,134.85,133.0,131.5,128.75,131.5,128.5,129.25,129.25,132.5,131.5,131.25,133.25,131.35,129.5,128.25,123.5,125.0,125.25,124.5,122.25,118.75,118.5,119.75,117.25,115.75,116.25,116.0,117.0,119.0,117.5,114.5,115.5,117.75,118.25,116.75,117.75,122.5,122.0,122.75,124.3,133.75,130.5,138.25,150.5,148.5,152.0,147.5,146.0,146.75,155.25,157.0,156.9,159.0,171.75,171.0,172.75,181.0,237.0,205.0,204.0,190.0,185.0,173.5,189.5,202.0,233.0,233.0,211.0,200.0,193.0,190.0,194.0,196.0,194.0,195.5,204.0,212.5,204.0,206.0,205.0,207.0,207.0,204.0,207.0,197.0,185.0,195.0,204.0,220.0,232.0,238.5,239.0,236.0,238.0,234.0,234.0,238.0,282.0,281.0,268.0,284.0,302.0,324.0,375.0,353.0,315.5,407.0,362.0,286.0,290.0,280.0,295.0,295.0,287.0,293.0,343.0,303.0,307.0,291.0,280.0,291.0,278.0,285.0,291.0,284.0,285.0,279.5,280.0,275.0,275.0,272.0,272.0,275.0,284.0,273.5,272.5,292.0,308.0,322.0,334.0,316.0,316.0,321.0,340.0,341.0,358.0,355.0,354.0,348.0,350.0,357.5,368.0,355.0,363.0,381.0,358.0,297.0,329.0,339.0,332.0,337.0,344.0,338.0,338.0,326.0,315.0,331.0,335.0,342.0,334.0,345.0,337.0,345.0,339.0,353.0,362.0,362.0,363.0,385.0,394.0,378.0,392.0,394.0,396.0,415.0,397.5,395.0,405.0,420.0,442.0,449.0,444.0,445.0,440.0,460.0,482.0,531.0,600.0,800.0,710.0,655.0,697.0,706.0,615.0,575.0,560.0,572.0,567.0,605.0,572.0,567.0,564.0,566.0,608.0,642.0,691.0,666.0,620.0,664.0,698.0,772.0,820.0,745.0,765.0,735.0,715.0,718.0,757.0,718.0,725.0,712.0,735.0,733.0,755.0,752.0,775.0,777.0,783.5,789.0,875.0,915.0,935.0,972.0,965.0,1010.0,1050.0,1080.0,1082.0,1065.0,985.0,974.0,840.0,750.0,785.0,805.0,774.0,735.0,685.0,688.0,718.0,685.0,670.0,635.0,655.0,665.0,638.0,614.0,608.0,612.0,598.0,572.0,553.0,480.0,444.0,475.0,475.0,440.0,460.0,457.0,460.0,465.0,435.0,330.0,348.0,354.5,317.25,345.0,325.0,328.0,338.0,333.5,355.0,415.0,405.0,413.0,440.0,422.0,435.0,407.0,385.0,368.0,375.0,378.0,372.0,375.0,372.0,372.0,380.0,392.0,362.0,372.0,370.0,365.0,355.0,354.0,374.0,348.0,348.0,346.0,333.0,325.0,318.0,322.0,318.0,322.0,332.0,318.0,324.0,320.0,330.0,325.0,330.0,334.0,331.0,315.0,315.0,319.0,319.0,310.0,308.0,297.0,286.0,261.0,262.0,249.0,235.0,222.0,236.0,239.0,266.0,260.0,264.0,261.0,250.0,252.0,251.0,242.0,240.0,234.0,224.0,183.0,176.0,161.0,157.0,146.0,154.0,152.0,162.0,206.0,181.0,176.0,186.0,178.0,175.0,184.0,174.0,170.0,172.0,180.0,174.0,178.0,199.0,200.0,217.0,200.0,215.0,208.0,208.0,206.0,194.0,195.0,203.0,202.0,195.0,192.0,189.0,198.0,205.0,193.0,197.0,196.0,205.5,213.0,233.0,229.5,235.0,240.0,223.0,235.0,258.0,282.0,281.0,283.0,310.0,333.0,316.0,276.0,262.0,231.0,248.0,251.0,250.0,241.0,216.0,230.0,223.0,214.0,226.0,225.0,220.0,217.0,214.0,213.0,223.0,214.0,212.0,206.0,206.0,223.0,219.0,230.0,214.0,216.0,212.0,214.0,218.0,214.0,212.0,205.0,193.0,180.0,184.0,180.0,182.0,183.0,190.0,188.0,179.5,184.0,180.0,181.0,203.0,200.0,199.5,193.0,199.0,197.0,198.0,200.0,194.0,191.0,188.0,188.0,185.0,186.5,185.0,188.0,187.0,177.0,182.0,184.0,192.0,191.5,192.5,185.0,182.5,183.0,184.0,184.0,190.5,191.5,194.0,202.0,208.5,208.0,227.0,226.0,253.0,266.0,263.0,268.0,296.0,262.0,256.0,261.0,273.0,283.0,276.0,274.0,313.0,278.0,289.0,284.0,303.0,289.0,315.0,333.0,336.0,355.0,359.75,364.0,378.0,377.0,377.0,338.0,353.0,361.0,317.0,298.0,310.0,326.0,318.0,328.0,304.0,312.0,321.0,316.0,334.0,338.0,344.0,317.0,308.0,316.0,315.0,303.0,322.0,318.0,322.0,332.0,329.0,320.0,329.0,327.0,328.0,323.0,326.0,332.0,330.0,332.0,340.0,344.0,335.0,338.0,341.0,354.0,338.0,351.0,352.0,354.0,353.0,357.0,376.0,380.0,370.0,375.0,367.0,364.0,368.0,369.0,367.0,370.0,373.5,367.0,365.0,367.5,369.75,362.0,364.0,353.0,331.0,329.0,330.0,334.5,331.0,341.0,348.0,365.0,380.0,359.0,374.0,372.5,367.0,364.0,359.5,347.0,345.0,350.0,354.5,365.0,367.0,382.0,368.0,379.0,419.5,440.0,452.5,514.0,577.0,486.0,490.0,440.0,445.0,442.0,456.0,455.0,440.0,426.0,437.0,453.0,450.0,430.0,437.0,448.0,473.0,468.0,452.0,450.0,420.0,387.0,367.0,335.0,286.0,290.0,304.0,273.0,244.0,246.0,221.0,198.0,199.0,178.0,168.0,199.0,228.0,217.0,185.0,181.0,178.0,174.0,177.0,182.0,186.0,192.0,187.0,193.0,195.0,210.0,216.0,215.0,198.0,199.0,198.0,209.0,215.0,223.0,239.0,233.0,231.0,218.0,239.5,225.0,231.0,238.0,249.0,247.0,243.0,245.0,243.0,233.0,248.0,259.0,262.0,274.0,271.0,283.0,291.0,292.0,290.0,298.0,290.0,297.0,321.0,329.0,335.0,326.0,331.5,363.0,370.0,362.0,366.5,364.0,366.0,388.0,420.0,429.5,459.0,438.0,419.0,406.0,418.0,442.0,438.0,477.0,458.0,458.0,461.0,496.0,515.0,522.0,570.0,540.0,531.0,515.0,446.0,454.0,421.0,458.0,498.0,480.0,433.0,454.0,456.0,476.0,498.0,487.0,480.0,476.0,487.5,529.0,522.0,543.0,557.0,566.0,588.0,574.0,607.0,655.0,686.0,671.0,710.0,688.0,765.0,746.0,742.0,788.0,792.0,750.0,786.0,818.0,811.0,818.0,824.0,859.0,790.0,814.0,756.0,741.0,740.0,780.0,795.0,762.0,753.5,774.0,732.0,708.0,728.0,775.0,787.0,808.0,742.0,729.0,758.0,768.0,785.0,806.0,840.0,730.0,753.0,754.0,757.0,776.0,732.0,726.0,628.0,604.0,615.0,642.0,622.0,651.0,650.0,659.0,595.0,593.0,650.0,668.0,623.0,658.0,655.0,617.0,640.0,679.0,681.0,694.0,703.0,693.0,710.0,706.0,706.0,700.0,661.0,656.0,647.0,643.0,668.0,682.0,640.0,591.0,617.0,598.0,623.0,623.0,626.0,609.0,580.0,579.0,579.0,569.0,569.0,576.0,582.0,601.0,643.0,634.0,661.0,687.0,650.0,637.0,652.0,638.0,628.0,595.0,598.0,609.0,629.0,659.0,682.0,700.0,696.0,683.0,699.0,682.0,701.0,714.5,743.0,756.0,753.5,754.0,747.0,719.0,770.0,763.5,761.0,774.0,731.0,673.0,676.0,684.0,691.0,704.0,736.0,733.0,749.0,754.0,730.0,670.0,677.0,679.0,726.0,747.0,724.0,733.0,742.0,756.0,747.0,726.0,696.0,705.0,719.0,730.0,697.0,715.0,745.0,742.0,741.0,754.0,726.0,713.0,717.0,733.0,716.0,701.0,708.0,728.0,740.0,748.0,732.0,708.0,716.0,737.0,739.0,748.0,773.0,775.0,796.0,777.0,783.0,810.0,784.0,810.0,814.0,803.0,819.0,831.0,834.0,844.0,812.0,814.0,843.0,864.0,872.0,882.0,885.0,869.0,860.0,900.0,886.0,909.0,894.0,845.0,807.0,786.0,752.0,788.0,754.0,781.0,805.0,770.0,764.0,789.0,804.0,805.0,813.0,806.0,813.0,799.0,805.0,761.0,767.0,772.0,783.0,785.0,775.0,816.0,821.0,788.0,775.0,745.0,773.0,782.0,777.0,768.0,782.0,792.0,791.0,782.0,777.0,749.0,733.0,700.0,671.0,671.0,650.0,611.0,626.0,613.0,602.0,618.0,589.0,589.0,581.0,590.0,601.0,655.0,709.0,713.0,692.0,681.0,659.0,606.0,541.0,548.0,548.0,557.0,549.0,558.0,552.0,547.0,486.0,490.0,494.0,495.0,499.0,519.0,499.0,491.0,559.0,575.0,586.0,568.0,559.0,544.0,561.0,602.0,620.0,598.0,595.0,552.0,542.0,555.0,546.0,544.0,550.0,603.0,615.0,636.0,674.0,713.0,692.0,688.0,704.0,692.0,677.0,664.0,678.0,688.0,719.0,668.0,647.0,626.0,615.0,625.0,677.0,726.0,751.0,729.0,732.0,685.0,671.0,684.0,756.0,740.0,786.0,728.0,764.0,776.0,775.0,773.0,772.0,752.0,774.0,806.0,798.0,799.0,790.0,800.0,813.0,815.0,808.0,761.0,796.0,843.0,899.0,873.0,858.0,843.0,837.0,859.0,841.0,888.0,870.0,895.0,931.0,942.0,988.0,949.0,936.0,920.0,939.0,930.0,1005.0,965.0,965.0,1001.0,988.0,996.0,996.0,1016.0,1011.0,1021.0,1060.0,1071.0,1096.0,1128.0,1098.0,1090.0,1038.0,987.0,1050.0,1061.0,992.0,991.0,997.0,981.0,941.0,916.0,988.0,1027.0,973.0,972.0,995.0,972.0,980.0,1009.0,1015.0,991.0,957.0,950.0,962.0,941.0,890.0,926.0,914.0,902.0,918.0,950.0,985.0,979.0,980.0,1053.0,1065.0,1061.0,1080.0,1090.0,1103.0,1122.0,1110.0,1182.0,1138.0,1194.0,1220.0,1249.0,1240.0,1263.0,1311.0,1313.0,1385.0,1349.0,1355.0,1388.0,1458.0,1524.0,1541.0,1513.0,1559.0,1536.0,1379.0,1384.0,1371.0,1375.0,1458.0,1340.0,1334.0,1317.0,1332.0,1336.0,1352.0,1467.0,1516.0,1551.0,1571.0,1560.0,1500.0,1532.0,1412.0,1424.0,1455.0,1478.0,1535.0,1549.0,1618.0,1658.0,1691.0,1652.0,1701.0,1762.0,1783.0,1815.0,1720.0,1712.0,1786.0,1841.0,1877.0,1961.0,1881.0,1907.0,2023.0,2117.0,2573.0,2377.0,2281.0,2367.0,2471.0,2697.0,2660.0,2432.0,1720.0,1659.0,2236.0,2120.0,2230.0,2165.0,1987.0,1900.0,1850.0,1920.0,1957.0,1935.0,1950.0,1902.0,1918.0,1875.0,1920.0,1983.0,2027.0,2262.0,2105.0,2190.0,2178.0,2170.0,2273.0,2300.0,2324.0,2347.0,2227.0,2315.0,2450.0,2345.0,2363.0,2234.0,2443.0,2345.0,2335.0,2404.0,2328.0,2324.0,2319.0,2370.0,2419.0,2360.0,2376.0,2368.0,2278.0,2348.0,2403.0,2382.0,2344.0,2332.0,2375.0,2634.0,2625.0,2674.0,2638.0,2810.0,2888.0,2987.0,2953.0,2901.0,2798.0,2866.0,2842.0,2765.0,2508.0,2639.0,2795.0,2800.0,2621.0,2673.0,2664.0,2620.0,2613.0,2320.0,2484.0,2426.0,2138.0,1989.0,1977.0,1900.0,2174.0,2037.0,2032.0,1978.0,2030.0,2088.0,2060.0,1786.0,1780.0,1763.0,1723.0,1965.0,1869.0,1938.0,1890.0,2104.0,2418.0,2248.0,2308.0,2360.0,2491.0,3339.0,2555.0,2531.0,2257.0,2325.0,2516.0,2404.0,2303.0,2229.0,2072.0,1934.0,2013.0,2081.0,2010.0,1895.0,1832.0,1924.0,1955.0,2148.0,1887.0,1995.0,2158.0,2149.0,2196.0,2085.0,2143.0,2032.0,2182.0,2170.0,2087.0,2190.0,2182.0,2012.0,2021.0,1908.0,1892.0,2007.0,1879.0,1870.0,1918.0,1929.0,1731.0,1784.0,1804.0,1830.0,1755.0,1730.0,1630.0,1592.0,1544.0,1502.0,1412.0,1430.0,1387.0,1404.0,1397.0,1465.0,1442.0,1492.0,1590.0,1459.0,1538.0,1532.0,1517.0,1437.0,1425.0,1315.0,1411.0,1290.0,1227.0,1240.0,1266.0,1285.0,1243.0,1271.0,1309.0,1244.0,1246.0,1234.0,1210.0,1253.0,1241.0,1242.0,1160.0,1151.0,1091.0,1137.0,1129.0,972.0,1060.0,1072.0,985.0,941.0,1178.0,1193.0,1112.0,1011.0,981.0,922.0,949.0,931.0,866.0,970.0,968.0,964.0,1040.0,1069.0,1005.0,1016.0,1013.0,1041.0,1015.0,955.0,974.0,989.0,1019.0,980.0,906.0,917.0,893.0,998.0,985.0,1002.0,969.0,919.0,906.0,871.0,939.0,943.0,978.0,972.0,925.0,1074.0,1042.0,1014.0,1021.0,1061.0,1078.0,1208.0,1108.0,988.0,971.0,1005.0,975.0,983.0,962.0,922.0,912.0,924.0,940.0,946.0,975.0,1012.0,977.0,985.0,961.0,933.0,957.0,976.0,963.0,980.0,922.0,938.0,946.0,949.0,954.0,973.0,969.0,981.0,976.0,1079.0,1046.0,1070.0,1150.0,1111.0,1234.0,1274.0,1235.0,1208.0,1134.0,1119.0,1092.0,1117.0,1128.0,1209.0,1165.0,1282.0,1271.0,1458.0,1456.0,1421.0,1461.0,1407.0,1383.0,1371.0,1467.0,1475.0,1524.0,1764.0,1681.0,1677.0,1878.0,1812.0,2090.0,1671.0,1701.0,1699.33,1761.83,1691.97],"h":[128.75,128.6,128.75,128.0,122.25,119.85,119.25,122.75,121.25,119.0,117.5,114.75,114.0,117.5,117.5,117.75,118.55,116.75,114.75,118.75,118.25,112.75,112.25,106.25,106.25,102.5,99.25,100.5,93.75,95.4,96.5,94.75,94.25,94.0,94.3,93.35,93.0,89.5,87.75,83.5,87.75,93.0,91.25,87.75,85.75,88.4,86.0,86.35,86.75,89.5,88.0,88.0,93.35,96.1,99.5,102.65,100.5,95.75,95.45,94.5,100.5,97.55,98.15,99.0,98.5,97.65,97.35,95.15,95.75,91.75,86.25,84.5,85.25,82.25,81.65,82.0,82.25,83.75,84.0,86.25,88.0,86.4,86.25,87.1,86.0,85.25,85.1,84.6,85.75,83.75,80.5,80.0,81.5,84.5,84.65,87.25,87.1,86.2,86.0,84.55,84.25,84.9,84.5,85.0,85.5,85.0,84.4,82.5,82.75,83.25,82.75,83.55,82.75,80.6,81.25,81.5,81.25,83.0,84.75,89.4,90.0,91.0,88.45,87.75,84.4,86.5,89.25,91.5,92.5,92.65,96.75,95.9,96.0,95.15,94.25,96.25,95.5,95.1,94.85,101.9,110.0,113.5,108.0,106.5,113.4,111.0,110.65,111.35,113.75,117.75,115.5,102.6,105.25,106.75,106.75,109.25,113.75,114.75,114.0,118.25,119.5,120.75,122.75,121.0,122.75,123.25,126.25,129.0,128.75,145.0,142.0,139.75,139.5,143.1,144.0,140.25,139.25,137.35,126.0,122.5,121.0,124.75,125.5,127.0,134.25,134.25,131.0,130.75,129.9,130.0,128.5,125.85,126.5,127.25,125.25,124.0,126.25,124.0,125.25,125.0,127.0,133.25,136.0,134.25,135.6,133.0,133.5,135.25,134.5,134.75,133.5,134.0,135.6,139.75,137.25,136.25,137.0,135.25,136.0,139.0,139.25,142.75,144.35,146.35,146.25,152.25,154.75,152.25,153.75,154.5,153.25,154.75,152.25,156.25,156.0,153.4,153.5,156.5,160.1,161.0,158.0,158.0,154.75,154.4,153.5,154.0,154.0,156.75,156.6,157.25,156.35,158.0,157.5,157.25,157.75,157.5,155.75,157.25,163.6,175.85,174.5,176.25,172.25,174.8,166.0,164.25,160.5,162.1,162.0,162.75,157.5,161.25,160.0,160.85,158.1,157.25,155.0,155.25,153.0,151.75,150.1,150.25,148.35,146.25,147.25,146.75,142.25,142.35,138.5,137.75,136.0,137.5,136.25,135.75,134.75,134.25,133.0,136.0,132.75,131.0,133.0,130.75,130.15,130.5,136.0,141.0,142.25,141.5,140.25,135.25,142.0,139.25,141.25,141.0,140.5,137.0,135.5,134.55,135.75,133.75,131.5,131.5,131.5,128.75,129.75,132.25,133.75,131.5,133.5,134.25,131.75,129.75,129.25,126.0,126.0,125.5,124.5,122.25,119.25,120.75,119.75,117.25,118.5,116.25,116.75,120.5,119.0,117.5,116.25,119.25,118.25,118.25,120.75,122.25,122.5,122.0,123.25,130.5,141.25,136.0,157.0,150.75,155.0,152.0,148.5,148.75,160.25,155.25,159.0,158.0,162.5,173.75,180.5,196.5,240.0,237.0,205.0,204.0,194.0,185.0,179.0,201.0,227.0,245.5,233.0,211.0,200.0,193.0,193.5,195.0,196.0,196.0,205.5,223.5,212.5,215.0,209.5,212.5,214.0,208.0,208.5,207.75,197.0,191.0,204.0,219.0,248.5,238.0,238.5,239.0,239.0,238.0,243.0,239.0,275.0,282.0,295.0,281.5,292.0,328.5,390.0,375.0,354.0,388.0,407.0,362.0,292.0,302.0,295.0,310.0,297.0,297.5,340.0,343.0,309.0,307.0,291.0,286.0,291.0,284.0,290.0,291.0,286.0,285.0,281.0,280.0,275.0,280.0,275.0,277.0,300.0,284.0,273.5,298.0,323.0,315.0,330.0,334.0,317.0,321.0,335.0,357.0,362.0,359.0,357.0,354.0,351.0,350.0,372.25,368.0,362.0,369.0,384.0,358.0,328.0,344.0,344.0,340.0,344.25,349.0,342.0,338.0,326.0,330.0,339.0,341.0,342.0,340.0,345.0,344.0,345.0,348.0,359.0,369.5,366.0,396.0,392.0,398.0,388.0,394.0,396.0,419.0,415.0,406.0,400.0,411.0,440.0,444.0,454.0,444.0,450.0,450.0,488.0,515.0,588.0,725.0,800.0,735.0,705.0,718.0,706.0,620.0,595.0,560.0,585.0,597.0,605.0,578.0,573.0,565.0,577.0,644.0,682.0,691.0,666.0,643.0,672.0,783.0,772.0,855.0,792.0,765.0,745.0,724.0,765.0,757.0,730.0,725.0,742.0,738.0,750.0,755.0,794.0,782.0,780.0,787.0,818.0,900.0,940.0,958.0,972.0,993.0,1085.0,1050.0,1094.0,1082.0,1081.0,985.0,974.0,849.0,828.0,800.0,805.0,774.0,735.0,685.0,765.0,718.0,685.0,670.0,650.0,655.0,665.0,638.0,614.0,620.0,612.0,598.0,572.0,553.0,480.0,485.0,475.0,475.0,448.0,473.0,458.0,465.0,465.0,435.0,350.0,350.0,354.5,320.0,345.0,328.0,328.0,338.0,338.0,405.0,415.0,405.0,437.0,440.0,435.0,435.0,407.0,385.0,378.0,388.0,378.0,383.0,375.0,372.0,380.0,390.0,392.0,374.0,374.0,372.0,365.0,357.0,366.0,378.0,355.0,356.0,346.0,336.0,325.0,321.0,324.0,325.0,330.0,332.0,320.0,324.0,320.0,362.0,325.0,334.0,335.0,331.0,321.0,322.0,320.0,321.0,313.0,312.0,297.0,286.0,266.0,262.0,249.0,243.0,235.0,238.0,263.0,266.0,271.0,265.0,266.0,256.0,254.0,251.0,242.0,242.0,234.0,224.0,183.0,176.0,162.0,161.0,156.0,164.0,163.0,177.0,206.0,190.0,184.0,186.0,179.0,185.0,184.0,175.0,170.0,180.0,180.0,175.0,186.0,200.0,211.0,225.0,218.0,218.0,214.0,209.0,206.0,198.0,203.0,207.0,202.0,196.0,192.0,196.0,209.0,205.0,200.0,197.0,200.0,215.0,246.0,239.0,237.0,240.0,244.0,232.0,246.0,277.0,282.0,287.0,315.0,322.0,333.0,321.0,278.5,262.0,243.0,248.0,255.0,252.0,241.0,225.0,230.0,223.0,225.0,226.0,228.0,220.0,217.0,215.0,221.5,223.0,214.0,212.0,210.5,216.0,224.0,230.0,230.0,216.75,216.0,213.0,214.0,219.0,215.0,212.0,206.0,193.0,182.0,184.0,181.0,192.0,186.0,192.0,189.5,180.5,185.0,184.0,202.0,207.0,202.0,199.5,200.0,199.0,197.5,203.0,200.0,195.0,194.5,190.5,188.0,185.0,190.5,188.5,188.5,187.0,182.0,183.75,191.5,192.0,192.5,192.5,185.0,184.0,184.0,184.0,185.5,202.0,196.0,195.0,209.0,213.0,227.0,227.0,241.0,259.0,266.0,271.0,297.0,296.0,262.0,260.0,275.0,275.0,283.0,278.0,315.0,313.0,281.0,289.0,305.0,303.0,313.0,320.0,344.0,354.0,360.0,370.0,364.0,385.0,402.0,384.0,360.0,354.0,361.0,317.0,317.0,316.0,326.0,330.0,328.0,315.0,323.0,324.0,338.0,345.5,345.0,351.0,324.0,316.0,320.0,315.0,309.0,327.0,320.0,330.0,334.0,329.0,329.0,329.0,327.0,329.0,326.5,326.0,343.0,334.0,337.0,348.0,344.0,344.0,341.5,347.0,354.0,352.0,351.0,353.0,354.0,354.0,373.0,381.0,381.0,374.0,375.0,367.0,374.0,368.0,369.0,369.0,375.0,373.5,367.0,369.0,370.0,369.75,365.0,364.0,353.0,331.0,330.5,335.0,335.0,339.5,344.0,368.0,379.0,380.0,373.0,374.0,379.0,369.0,364.0,359.5,348.0,347.0,355.0,364.0,372.0,377.0,382.0,381.0,402.0,429.0,440.0,507.0,568.0,588.0,514.0,490.0,453.0,445.0,462.0,463.0,455.0,440.0,442.0,439.0,455.0,450.0,438.0,438.0,471.0,473.0,468.0,455.0,450.0,422.0,389.0,367.0,335.0,292.0,299.0,304.0,273.0,244.0,253.0,221.0,202.0,204.0,182.0,202.0,231.0,228.0,217.0,195.0,181.0,183.0,180.0,177.0,185.0,199.0,192.0,187.0,193.0,202.0,216.0,219.0,215.0,202.0,199.0,207.0,220.0,222.0,233.0,239.0,234.0,231.0,241.0,239.5,235.0,235.0,264.0,257.0,247.0,244.0,252.0,243.0,247.0,257.0,262.0,280.0,276.0,275.0,287.0,291.0,295.0,300.0,301.0,295.0,323.0,335.0,336.0,335.0,331.0,354.0,375.0,373.0,389.0,377.0,370.0,377.0,402.0,425.0,452.0,462.0,438.0,446.0,416.0,438.0,445.0,465.0,477.0,477.0,458.0,489.0,511.0,545.0,566.0,570.0,540.0,542.0,515.0,469.0,462.0,451.0,478.0,498.0,480.0,448.0,468.0,462.0,491.0,509.0,487.0,494.0,501.0,526.0,529.0,554.0,558.0,570.0,601.0,597.0,596.0,629.0,678.0,721.0,701.0,710.0,763.0,765.0,759.0,764.0,797.0,792.0,815.0,823.0,818.0,823.0,836.0,843.0,859.0,823.0,814.0,756.0,749.0,768.0,789.0,795.0,771.0,769.0,774.0,734.0,731.0,754.0,775.0,817.0,808.0,766.0,759.0,782.0,785.0,805.0,838.0,840.0,747.0,777.0,764.0,786.0,776.0,735.0,726.0,650.0,604.0,615.0,642.0,667.0,658.0,672.0,659.0,595.0,657.0,676.0,668.0,653.0,658.0,663.0,641.0,670.5,696.0,710.0,714.0,703.0,721.0,718.0,706.0,706.0,700.0,669.0,659.0,649.0,661.0,672.0,682.0,640.0,606.0,617.0,610.0,625.0,636.0,629.0,609.0,601.0,583.0,585.0,573.0,589.0,588.0,587.0,645.0,643.0,647.0,692.0,687.0,650.0,668.0,660.0,653.0,628.0,615.0,619.0,643.0,654.0,688.0,690.0,700.0,700.0,706.0,707.0,700.0,725.0,726.0,754.0,767.0,773.0,766.0,747.0,763.0,773.0,763.5,764.0,774.0,734.0,679.0,680.0,701.0,704.0,736.0,752.0,755.0,760.0,761.0,730.0,670.0,686.0,724.0,744.0,747.0,737.0,738.0,754.0,756.0,747.0,726.0,702.0,724.0,725.0,730.0,710.0,738.0,747.0,746.0,760.0,754.0,726.0,724.0,735.0,738.0,718.0,706.0,730.0,737.0,743.0,748.0,732.0,714.0,734.0,738.0,741.0,776.0,777.5,776.0,796.0,788.0,788.0,810.0,804.0,814.0,816.0,824.0,835.0,841.0,841.0,858.0,829.0,837.0,860.0,873.0,882.0,882.0,885.0,869.0,885.0,900.0,897.0,909.0,894.0,845.0,823.0,786.0,804.0,790.0,787.0,796.0,805.0,774.0,777.0,804.0,810.0,817.0,813.0,810.0,813.0,801.0,810.0,778.0,790.0,794.0,783.0,785.0,815.0,830.0,821.0,788.0,775.0,747.0,773.0,782.0,777.0,781.0,790.0,792.0,791.0,788.0,777.0,750.0,740.0,703.0,698.0,679.0,656.0,637.0,626.0,613.0,620.0,618.0,589.0,589.0,589.0,609.0,659.0,688.0,709.0,713.0,698.0,681.0,659.0,611.5,548.0,555.0,549.0,557.0,566.0,559.0,554.0,547.0,486.0,504.0,500.0,517.0,523.0,519.0,499.0,541.0,569.0,592.0,597.0,577.0,559.0,562.0,607.0,624.0,620.0,603.0,595.0,552.0,545.0,558.0,546.0,557.0,593.0,608.0,647.0,680.0,704.0,714.0,731.0,705.0,704.0,692.0,700.0,664.0,690.0,719.0,719.0,668.0,647.0,640.0,630.0,684.0,717.0,742.0,774.0,750.0,732.0,685.0,676.0,744.0,761.0,752.0,786.0,764.0,774.0,791.0,783.0,783.0,772.0,771.0,803.0,806.0,809.0,806.0,802.0,816.0,813.0,815.0,808.0,774.0,833.0,863.0,900.0,887.0,862.0,855.0,868.0,862.0,878.0,899.0,900.0,928.0,939.0,942.0,988.0,949.0,936.0,935.0,942.0,983.0,1005.0,968.0,994.0,1019.0,994.0,1009.0,1024.0,1016.0,1033.0,1029.0,1060.0,1098.0,1103.0,1128.0,1106.0,1090.0,1038.0,1028.0,1050.0,1061.0,992.0,1004.0,997.0,981.0,941.0,978.0,1055.0,1027.0,974.0,1004.0,995.0,998.0,989.0,1017.0,1022.0,991.0,957.0,950.0,962.0,941.0,938.0,929.0,914.0,902.0,923.0,980.0,985.0,979.0,1056.0,1086.0,1065.0,1087.0,1085.0,1141.0,1104.0,1134.0,1163.0,1182.0,1192.0,1249.0,1264.0,1274.0,1268.0,1264.0,1339.0,1417.0,1385.0,1368.0,1397.0,1416.0,1498.0,1555.0,1543.0,1558.0,1604.0,1563.0,1431.0,1393.0,1385.0,1417.0,1458.0,1340.0,1337.0,1334.0,1367.0,1347.0,1467.0,1524.0,1535.0,1567.0,1601.0,1560.0,1539.0,1547.0,1433.0,1447.0,1492.0,1500.0,1560.0,1608.0,1647.0,1672.0,1693.0,1706.0,1769.0,1775.0,1803.0,1815.0,1732.0,1770.0,1840.0,1868.0,1969.0,1990.0,1898.0,1961.0,2120.0,2368.0,2573.0,2377.0,2483.0,2441.0,2786.0,2795.0,2660.0,2458.0,1720.0,2370.0,2317.0,2190.0,2230.0,2165.0,1991.0,1900.0,1865.0,2068.0,1965.0,1954.0,1968.0,1966.0,1940.0,1935.0,1955.0,1983.0,2156.0,2281.0,2220.0,2190.0,2215.0,2184.0,2294.0,2312.0,2375.0,2347.0,2322.0,2410.0,2450.0,2404.0,2365.0,2391.0,2483.0,2345.0,2390.0,2418.0,2328.0,2356.0,2336.0,2370.0,2462.0,2392.0,2387.0,2368.0,2318.0,2369.0,2403.0,2427.0,2350.0,2338.0,2612.0,2639.0,2630.0,2674.0,2740.0,2852.0,2983.0,2997.0,2975.0,2928.0,2828.0,2866.0,2842.0,2765.0,2644.0,2779.0,2839.0,2838.0,2705.0,2673.0,2678.0,2637.0,2613.0,2438.0,2484.0,2426.0,2138.0,2067.0,1977.0,1996.0,2180.0,2096.0,2034.0,2041.0,2097.0,2178.0,2060.0,1807.0,1863.0,1769.0,1881.0,1978.0,1911.0,1938.0,2074.0,2362.0,2418.0,2290.0,2318.0,2620.0,2791.0,3339.0,2571.0,2565.0,2275.0,2325.0,2516.0,2465.0,2303.0,2286.0,2093.0,2096.0,2029.0,2081.0,2010.0,1895.0,1880.0,1981.0,1999.0,2148.0,1897.0,2103.0,2186.0,2264.0,2196.0,2140.0,2143.0,2151.0,2200.0,2184.0,2227.0,2314.0,2183.0,2027.0,2021.0,1908.0,2024.0,2096.0,1895.0,1900.0,1929.0,1929.0,1731.0,1788.0,1805.0,1830.0,1755.0,1730.0,1689.0,1671.0,1557.0,1506.0,1440.0,1434.0,1476.0,1453.0,1489.0,1465.0,1482.0,1620.0,1590.0,1459.0,1573.0,1532.0,1517.0,1437.0,1425.0,1391.0,1411.0,1318.0,1260.0,1303.0,1324.0,1295.0,1269.0,1304.0,1309.0,1271.0,1246.0,1234.0,1261.0,1277.0,1270.0,1242.0,1182.0,1151.0,1135.0,1137.0,1129.0,1042.0,1080.0,1072.0,985.0,1138.0,1223.0,1193.0,1112.0,1011.0,981.0,965.0,990.0,951.0,958.0,971.0,968.0,1044.0,1095.0,1069.0,1008.0,1016.0,1084.0,1041.0,1023.0,955.0,989.0,1006.0,1024.0,980.0,937.0,917.0,942.0,998.0,1035.0,1015.0,978.0,932.0,923.0,933.0,950.0,954.0,986.0,972.0,1046.0,1112.0,1066.0,1014.0,1073.0,1064.0,1136.0,1232.0,1108.0,988.0,1025.0,1005.0,996.0,983.0,962.0,953.0,929.0,947.0,960.0,1001.0,991.0,1015.0,1004.0,990.0,961.0,958.0,968.0,980.0,982.0,991.0,922.0,970.0,946.0,949.0,984.0,973.0,1019.0,982.0,1020.0,1083.0,1055.0,1131.0,1150.0,1161.0,1304.0,1282.0,1256.0,1208.0,1154.0,1123.0,1101.0,1140.0,1203.0,1209.0,1246.0,1282.0,1473.0,1562.0,1477.0,1445.0,1461.0,1486.0,1423.0,1430.0,1467.0,1518.0,1705.0,1825.0,1681.0,1850.0,1878.0,1912.0,2090.0,1834.0,1761.0,1766.71,1816.48,1691.97],"l":[128.0,128.25,128.5,123.0,118.35,117.65,118.2,120.5,118.75,117.25,115.25,113.75,112.75,116.25,116.5,116.25,117.0,115.5,114.5,117.0,116.5,111.25,108.35,105.0,103.25,97.75,97.0,93.5,88.5,93.25,94.6,93.25,93.0,92.75,93.5,92.25,87.85,87.6,82.95,81.75,83.75,89.25,86.25,82.25,83.5,86.25,79.25,79.25,83.35,85.75,85.2,84.25,90.75,92.25,95.5,96.5,96.55,94.75,94.5,93.65,94.25,96.0,96.25,96.0,95.25,96.5,94.5,94.75,93.15,86.35,84.5,78.75,80.5,80.65,80.75,81.5,81.0,81.25,82.25,83.75,85.25,85.65,85.25,85.0,84.25,84.4,84.0,83.25,83.75,80.2,79.75,79.75,79.25,80.75,83.75,85.6,85.8,85.5,85.5,83.5,83.6,84.25,84.0,84.0,84.85,83.85,83.0,82.25,81.75,82.75,82.75,82.95,81.5,79.1,80.0,80.75,80.75,81.1,83.25,86.15,88.0,88.5,86.15,82.25,82.65,85.15,87.1,88.75,89.25,90.5,92.5,94.6,93.25,94.0,93.5,94.0,93.0,94.25,93.9,94.5,105.0,109.5,106.25,106.25,106.25,106.65,107.25,108.25,109.75,113.25,109.3,99.6,102.25,103.75,104.4,105.5,109.65,111.75,112.0,114.4,116.5,115.5,119.0,118.5,119.25,122.25,123.5,125.75,126.25,131.0,135.0,137.35,138.25,139.25,138.25,138.75,136.9,122.75,121.5,116.35,116.5,120.5,124.0,124.25,127.6,130.85,129.5,128.6,129.1,129.0,125.75,122.0,124.25,125.0,123.85,123.25,124.25,123.25,124.0,123.65,124.35,128.0,133.25,132.25,128.0,130.0,132.75,133.25,133.75,133.25,132.5,132.0,134.25,136.0,134.0,135.25,133.75,134.5,134.0,136.5,138.5,138.5,142.75,144.5,145.5,146.5,151.15,149.75,151.75,151.5,152.0,151.6,148.25,151.5,151.75,152.0,151.75,153.75,155.6,158.5,156.2,156.15,154.25,152.6,152.25,152.5,153.0,155.5,154.0,153.85,153.5,156.65,156.5,157.0,157.0,156.5,152.0,153.75,157.5,164.5,169.75,173.25,171.1,167.75,160.25,162.75,158.5,157.75,157.25,158.25,156.0,158.25,157.25,157.5,156.5,154.35,152.5,153.25,151.0,148.75,146.75,148.5,145.5,144.5,145.5,138.75,135.35,134.0,137.85,135.5,134.5,135.0,133.0,134.6,133.25,131.75,130.0,133.25,129.0,127.5,128.75,127.6,129.5,128.25,127.25,138.35,138.25,140.0,137.25,132.25,138.75,137.75,138.25,139.75,137.5,135.5,132.25,130.25,133.0,132.75,128.25,128.75,127.25,127.75,129.25,129.25,132.5,129.75,131.25,130.75,130.0,128.5,125.25,123.5,125.0,124.75,122.0,120.5,116.5,118.5,117.75,115.25,115.75,115.5,116.0,117.0,118.0,114.25,114.5,115.5,117.25,117.0,116.5,117.75,120.0,121.0,121.25,124.3,133.75,130.5,138.25,144.75,148.5,145.75,144.5,145.5,146.75,149.5,155.5,155.5,156.75,170.0,168.5,172.75,180.0,203.0,192.0,193.0,190.0,168.0,172.0,189.5,198.0,221.0,217.0,196.0,188.0,187.0,186.0,190.0,188.5,191.0,194.5,204.0,203.0,203.0,203.5,205.0,207.0,206.0,204.0,202.0,187.0,183.5,195.0,201.0,220.0,230.5,232.0,237.0,233.0,230.0,234.0,234.0,238.0,262.0,279.0,262.0,272.0,301.5,324.0,348.0,318.5,315.5,363.0,293.0,261.0,269.0,274.0,295.0,293.0,287.0,293.0,312.5,301.0,294.0,284.0,279.0,273.0,278.0,277.0,287.5,275.5,275.0,279.5,274.0,273.0,274.0,272.0,272.0,275.0,273.5,270.25,270.75,292.0,304.0,322.0,314.0,310.0,316.0,321.0,340.0,341.0,348.0,347.0,346.0,345.0,348.0,355.0,361.0,355.0,363.0,365.0,333.0,284.0,329.0,331.0,331.5,337.0,344.0,338.0,328.0,317.0,315.0,331.0,334.0,338.0,333.0,340.0,337.0,340.0,339.0,353.0,362.0,360.0,363.0,382.0,376.0,377.0,392.0,392.0,396.0,392.0,397.5,394.0,405.0,420.0,438.0,449.0,433.0,437.0,435.0,460.0,482.0,531.0,600.0,675.0,650.0,650.0,688.0,630.0,592.0,575.0,553.0,560.0,567.0,565.0,572.0,565.0,560.0,566.0,608.0,642.0,652.0,635.0,618.0,663.0,698.0,761.0,800.0,725.0,742.5,718.0,710.0,715.0,708.0,718.0,712.0,712.0,734.5,733.0,745.0,752.0,775.0,777.0,783.5,789.0,855.0,915.0,930.0,954.0,965.0,1010.0,1015.0,1059.0,1042.0,1030.0,968.0,870.0,774.0,750.0,780.0,772.0,735.0,680.0,655.0,688.0,690.0,670.0,655.0,635.0,640.0,645.0,617.0,596.5,608.0,594.0,580.0,560.0,485.0,455.0,438.0,442.0,440.0,440.0,450.0,455.0,455.0,454.0,363.0,315.0,340.0,325.0,316.0,315.0,323.0,319.0,330.0,333.0,355.0,383.0,400.0,413.0,425.0,422.0,415.0,380.0,367.0,365.0,365.0,370.0,372.0,360.0,365.0,372.0,380.0,368.0,362.0,368.0,365.0,350.0,350.0,353.0,355.0,348.0,348.0,333.0,330.0,318.0,316.0,322.0,318.0,320.0,318.0,318.0,319.0,319.0,330.0,320.0,328.0,330.0,318.0,315.0,313.0,318.0,310.0,309.0,305.0,284.0,273.0,261.0,246.0,242.0,234.0,222.0,233.0,239.0,242.0,260.0,256.0,252.0,248.0,252.0,243.0,238.0,230.0,228.0,192.0,175.0,168.0,144.0,150.0,146.0,154.0,152.0,162.0,181.0,181.0,174.0,173.0,178.0,175.0,172.0,165.0,160.0,171.0,174.0,172.0,176.0,196.0,192.0,214.0,200.0,209.0,208.0,205.0,190.5,194.0,195.0,203.0,196.0,194.0,188.0,189.0,198.0,193.0,193.0,193.0,196.0,205.5,213.0,223.0,228.0,235.0,239.0,223.0,235.0,258.0,274.0,281.0,283.0,310.0,308.0,266.0,237.0,250.0,231.0,238.0,249.7,243.5,216.0,215.5,225.0,209.0,214.0,222.5,221.0,215.0,211.0,213.0,213.0,215.0,213.0,205.0,206.0,206.0,215.0,215.0,214.0,213.0,212.0,210.0,213.0,215.0,214.0,208.0,193.0,179.0,180.0,184.0,180.0,182.0,182.0,188.0,182.0,179.0,180.0,180.0,181.0,196.0,199.0,192.0,193.0,196.0,196.0,198.0,196.0,192.0,188.0,188.0,184.0,183.75,186.0,185.0,187.5,180.0,172.0,182.0,184.0,188.0,191.5,186.5,184.0,182.5,183.0,182.5,183.0,190.5,191.5,192.0,202.0,207.0,208.0,221.0,226.0,250.0,255.0,257.0,268.0,249.0,246.0,253.0,261.0,269.0,266.0,274.0,274.0,286.0,276.0,284.0,282.0,284.0,289.0,309.0,328.0,334.0,340.0,349.0,357.0,370.0,376.0,362.0,338.0,342.0,315.0,286.0,295.0,307.0,320.0,318.0,308.0,304.0,312.0,317.0,316.0,334.0,338.0,343.0,307.0,303.0,316.0,298.0,298.0,321.0,317.0,319.0,325.0,315.0,320.0,318.0,326.0,326.0,321.0,324.0,332.0,328.0,331.0,340.0,335.0,335.0,337.0,335.0,347.0,338.0,346.0,350.0,352.0,351.0,357.0,371.0,368.0,368.0,361.0,360.0,364.0,366.5,365.0,363.5,368.5,365.0,362.5,365.0,365.0,364.0,362.0,359.0,335.0,320.0,326.0,330.0,331.0,330.5,338.0,348.0,358.0,367.0,359.0,368.0,371.0,366.0,354.0,343.0,344.0,345.0,350.0,354.5,365.0,367.0,368.0,363.0,379.0,412.0,424.0,452.5,514.0,514.0,469.0,425.0,440.0,434.0,442.0,451.0,437.0,408.0,426.0,431.0,445.0,424.0,427.0,423.5,448.0,465.0,456.0,442.0,423.0,389.0,375.0,345.0,286.0,274.0,290.0,275.0,218.0,226.0,237.0,203.0,197.0,171.0,172.0,168.0,199.0,212.5,183.0,185.0,170.0,173.0,174.0,173.0,182.0,185.0,177.0,182.0,190.0,193.0,209.0,215.0,196.0,193.0,197.0,196.0,206.0,214.0,223.0,234.0,225.0,212.5,218.0,223.5,225.0,224.0,238.0,249.0,241.0,234.0,245.0,234.0,233.0,248.0,256.0,262.0,269.0,269.0,282.0,284.0,290.0,290.0,294.0,290.0,297.0,321.0,329.0,319.0,321.0,331.5,361.0,360.0,362.0,364.0,364.0,355.0,388.0,420.0,421.0,435.0,418.0,387.0,406.0,418.0,416.0,438.0,451.0,458.0,447.0,461.0,496.0,510.0,522.0,535.0,507.0,522.0,416.0,426.0,450.0,421.0,456.0,467.0,438.0,433.0,454.0,445.0,470.0,488.0,465.0,480.0,476.0,487.5,522.0,522.0,534.0,543.0,566.0,580.0,574.0,607.0,641.0,684.0,639.0,683.0,688.0,737.0,745.0,742.0,788.0,741.0,750.0,786.0,786.0,809.0,818.0,824.0,767.0,790.0,756.0,708.0,738.0,740.0,780.0,769.0,736.0,750.0,717.0,706.0,708.0,728.0,771.0,787.0,744.0,742.0,729.0,758.0,756.0,785.0,806.0,739.0,722.0,746.0,747.0,757.0,749.0,715.0,665.0,626.0,561.0,605.0,596.0,622.0,635.0,645.0,610.0,570.0,574.0,632.0,614.0,617.0,636.0,633.0,617.0,640.0,677.0,681.0,694.0,679.0,693.0,704.0,675.0,698.0,654.0,648.0,640.0,637.0,643.0,666.0,656.5,602.0,591.0,590.0,596.0,613.0,617.0,610.0,568.0,580.0,575.0,579.0,564.0,569.0,576.0,576.0,601.0,618.0,634.0,661.0,663.0,630.0,637.0,649.0,637.0,597.0,594.0,598.0,609.0,629.0,659.0,682.0,686.0,675.0,683.0,682.0,672.0,701.0,714.5,740.0,747.0,753.5,715.0,719.0,719.0,763.0,741.0,755.0,728.0,716.0,672.0,670.0,684.0,686.0,704.0,736.0,733.0,749.0,732.0,675.0,644.0,673.0,679.0,726.0,736.0,724.0,720.0,736.0,743.0,731.0,687.0,686.0,700.0,713.0,703.0,697.0,705.0,741.0,738.0,741.0,735.0,717.0,713.0,712.0,724.0,696.0,696.0,708.0,728.0,733.5,743.0,706.0,703.0,716.0,733.0,733.0,747.0,764.0,756.5,764.0,771.0,775.0,796.0,784.0,797.0,803.0,803.0,817.0,831.0,833.0,825.0,811.0,814.0,843.0,864.0,869.0,870.0,872.0,847.0,860.0,870.0,886.0,876.0,829.0,827.0,801.0,769.0,752.0,754.0,754.0,779.0,754.0,761.0,764.0,789.0,799.0,803.0,785.0,806.0,796.0,790.0,771.0,761.0,767.0,772.0,770.0,776.0,775.0,816.0,795.0,766.0,760.0,734.0,755.0,757.0,759.0,768.0,782.0,783.0,778.0,781.0,757.0,741.0,718.0,676.0,670.0,634.0,626.0,611.0,612.0,595.0,600.0,593.0,539.0,571.0,581.0,584.0,601.0,640.0,693.0,687.0,672.0,672.0,610.0,556.0,538.0,537.0,528.0,544.0,546.0,554.0,547.0,496.0,465.0,488.0,491.0,495.0,499.0,501.0,485.0,491.0,556.0,559.0,577.0,568.0,538.0,541.0,561.0,598.0,600.0,583.0,561.0,533.0,539.0,552.0,539.0,544.0,550.0,595.0,615.0,636.0,674.0,703.0,686.0,688.0,687.0,667.0,677.0,652.0,678.0,688.0,669.0,638.0,622.0,612.0,615.0,625.0,677.0,724.0,746.0,727.0,689.0,653.0,670.0,684.0,754.0,740.0,713.0,728.0,755.0,776.0,763.0,767.0,746.0,748.0,774.0,788.0,798.0,790.0,775.0,791.0,804.0,797.0,768.0,761.0,796.0,843.0,853.0,867.0,843.0,837.0,837.0,848.0,841.0,884.0,870.0,893.0,931.0,934.0,942.0,929.0,908.0,916.0,914.0,930.0,957.0,960.0,965.0,993.0,978.0,994.0,996.0,990.0,1005.0,1019.0,1056.0,1071.0,1082.0,1104.0,1088.0,1031.0,970.0,987.0,1024.0,991.0,970.0,981.0,982.0,971.0,906.0,916.0,988.0,965.0,958.0,972.0,977.0,968.0,979.0,993.0,1007.0,958.0,939.0,942.0,939.0,892.0,890.0,916.0,897.0,864.0,914.0,941.0,966.0,969.0,980.0,1053.0,1050.0,1061.0,1076.0,1084.0,1072.0,1120.0,1105.0,1146.0,1138.0,1194.0,1220.0,1249.0,1240.0,1261.0,1302.0,1313.0,1314.0,1339.0,1355.0,1388.0,1458.0,1524.0,1510.0,1513.0,1559.0,1387.0,1339.0,1369.0,1362.0,1375.0,1344.0,1300.0,1323.0,1311.0,1332.0,1327.0,1352.0,1467.0,1516.0,1551.0,1550.0,1520.0,1500.0,1421.0,1412.0,1424.0,1455.0,1478.0,1535.0,1544.0,1588.0,1648.0,1645.0,1629.0,1701.0,1744.0,1783.0,1777.0,1701.0,1712.0,1786.0,1841.0,1877.0,1926.0,1876.0,1907.0,2023.0,2117.0,2417.0,2270.0,2281.0,2329.0,2471.0,2676.0,2436.0,1975.0,1583.0,1659.0,2234.0,2120.0,2180.0,1950.0,1913.0,1775.0,1810.0,1920.0,1921.0,1925.0,1925.0,1899.0,1846.0,1875.0,1920.0,1976.0,2027.0,2085.0,2100.0,2130.0,2170.0,2165.0,2253.0,2256.0,2324.0,2225.0,2227.0,2315.0,2347.0,2345.0,2226.0,2234.0,2350.0,2316.0,2334.0,2342.0,2288.0,2324.0,2313.0,2342.0,2381.0,2360.0,2363.0,2301.0,2244.0,2348.0,2351.0,2367.0,2338.0,2300.0,2375.0,2585.0,2556.0,2614.0,2638.0,2778.0,2888.0,2929.0,2860.0,2832.0,2733.0,2833.0,2763.0,2558.0,2508.0,2639.0,2795.0,2712.0,2600.0,2609.0,2651.0,2601.0,2311.0,2320.0,2416.0,2216.0,1968.0,1906.0,1889.0,1894.0,2081.0,2015.0,1980.0,1978.0,2008.0,2088.0,1812.0,1739.0,1780.0,1608.0,1723.0,1928.0,1850.0,1883.0,1878.0,2104.0,2341.0,2239.0,2274.0,2349.0,2491.0,2937.0,2426.0,2490.0,2160.0,2214.0,2323.0,2388.0,2168.0,2150.0,1926.0,1934.0,1994.0,2012.0,1920.0,1823.0,1832.0,1893.0,1919.0,1895.0,1860.0,1995.0,2058.0,2149.0,2133.0,1990.0,2051.0,2003.0,2090.0,2128.0,2049.0,2190.0,2113.0,1981.0,1926.0,1822.0,1843.0,1976.0,1865.0,1850.0,1848.0,1798.0,1658.0,1775.0,1722.0,1781.0,1703.0,1668.0,1603.0,1585.0,1463.0,1444.0,1412.0,1367.0,1387.0,1391.0,1397.0,1424.0,1442.0,1492.0,1490.0,1433.0,1538.0,1465.0,1404.0,1397.0,1351.0,1315.0,1284.0,1225.0,1227.0,1237.0,1266.0,1234.0,1230.0,1214.0,1213.0,1238.0,1225.0,1197.0,1210.0,1252.0,1223.0,1145.0,1140.0,1103.0,1091.0,1107.0,960.0,972.0,1053.0,1014.0,944.0,941.0,1178.0,1119.0,1027.0,992.0,929.0,922.0,949.0,882.0,866.0,958.0,916.0,951.0,1026.0,987.0,988.0,996.0,1013.0,1016.0,982.0,938.0,954.0,972.0,972.0,949.0,906.0,890.0,885.0,928.0,985.0,977.0,923.0,908.0,905.0,858.0,921.0,932.0,951.0,935.0,925.0,1074.0,1038.0,997.0,1002.0,1020.0,1072.0,1120.0,1008.0,926.0,971.0,983.0,968.0,964.0,912.0,920.0,909.0,924.0,940.0,936.0,957.0,988.0,974.0,969.0,917.0,933.0,950.0,947.0,956.0,929.0,911.0,938.0,942.0,936.0,954.0,950.0,969.0,970.0,976.0,1059.0,1028.0,1065.0,1107.0,1082.0,1194.0,1215.0,1192.0,1138.0,1127.0,1099.0,1092.0,1117.0,1128.0,1149.0,1165.0,1230.0,1271.0,1458.0,1402.0,1358.0,1393.0,1407.0,1363.0,1371.0,1422.0,1473.0,1524.0,1764.0,1567.0,1677.0,1755.0,1812.0,1775.0,1651.0,1650.97,1691.01,1761.6,1691.97],"c":[128.75,128.6,128.75,123.0,120.15,118.1,118.75,120.75,118.75,117.25,115.25,114.1,113.35,117.5,116.75,117.5,117.0,115.5,114.75,118.75,116.5,111.75,108.35,105.4,103.25,97.75,99.0,93.5,92.25,94.35,95.75,93.25,93.65,94.0,93.5,92.95,87.85,89.0,82.95,83.5,87.75,90.5,87.85,84.75,85.25,86.75,79.25,86.35,86.75,86.1,88.0,88.0,93.35,96.1,96.55,102.65,96.55,94.75,94.5,93.65,100.5,96.35,96.25,99.0,96.85,96.75,94.5,95.15,93.15,86.35,84.75,78.75,80.5,81.0,81.0,81.5,82.0,81.25,84.0,86.25,85.5,86.0,86.25,85.0,84.25,85.25,84.75,84.6,83.75,80.2,80.5,80.0,81.5,84.5,84.25,86.5,86.15,86.0,86.0,83.65,83.75,84.5,84.25,84.85,84.85,84.0,83.0,82.25,82.5,82.75,82.75,82.95,81.5,80.25,81.25,80.85,81.0,83.0,84.75,88.5,89.35,91.0,87.85,82.25,84.4,86.5,89.25,88.75,91.0,92.65,96.5,94.6,94.25,94.4,93.9,96.0,94.1,94.9,94.15,101.75,110.0,111.25,107.0,106.25,112.75,106.65,109.5,111.35,113.75,117.0,109.3,100.25,104.75,106.75,105.25,109.25,113.75,111.75,112.0,118.25,119.5,120.75,119.75,118.5,122.75,123.0,126.25,129.0,128.75,145.0,135.0,139.5,139.5,143.1,138.25,138.75,136.9,122.75,121.5,119.35,121.0,124.1,125.5,127.0,133.6,130.85,130.1,130.75,129.9,129.0,125.75,123.25,126.0,125.25,123.85,123.25,125.0,123.75,124.0,123.65,127.0,133.0,134.0,134.25,128.0,133.0,133.25,135.25,133.75,133.25,132.5,133.4,135.6,136.0,135.6,135.5,133.75,134.5,136.0,137.9,138.65,142.75,144.35,146.35,145.5,149.35,151.15,152.25,153.75,151.5,153.25,151.6,150.0,156.25,152.75,153.4,152.25,156.5,160.1,160.0,156.5,156.5,154.25,153.25,152.25,152.75,153.75,156.75,154.75,157.25,156.25,158.0,157.5,157.0,157.75,156.5,152.6,157.25,163.6,175.85,174.25,174.85,171.1,167.75,162.75,164.25,159.0,158.25,162.0,158.75,156.75,161.0,157.25,158.75,157.25,154.35,152.5,153.25,152.0,148.75,150.1,148.5,146.0,145.8,147.25,138.75,142.25,134.0,138.0,135.5,135.0,135.0,136.25,134.75,133.5,131.75,132.4,133.25,130.5,127.5,131.75,127.6,129.5,129.25,136.0,140.0,141.5,140.0,137.25,135.25,138.75,139.25,138.25,140.0,137.5,135.75,135.5,134.55,133.0,132.75,130.5,131.5,128.75,128.5,129.25,132.0,132.5,131.0,133.0,130.75,130.5,129.25,125.25,124.75,125.5,124.75,122.0,120.5,118.0,120.75,118.25,115.25,117.0,115.75,116.75,118.0,118.0,114.25,116.0,118.0,118.25,117.0,120.25,122.25,122.0,121.75,121.25,130.5,137.0,134.25,155.0,148.25,151.5,148.5,145.25,145.5,157.5,152.75,159.0,156.0,162.5,173.5,168.5,188.5,240.0,203.0,200.0,195.0,190.0,170.0,179.0,201.0,227.0,230.0,217.0,198.0,191.0,187.0,193.5,195.0,193.0,193.0,201.5,223.5,203.0,209.0,207.5,210.0,210.0,208.0,207.0,202.0,187.0,191.0,204.0,219.0,236.0,235.0,237.0,239.0,238.0,234.0,237.0,236.0,275.0,267.0,279.0,281.5,292.0,301.5,385.0,363.0,318.5,388.0,363.0,293.0,292.0,269.0,290.0,295.0,293.0,295.0,340.0,314.5,305.0,294.0,284.0,286.0,273.0,284.0,290.0,287.5,286.0,280.0,279.75,277.0,274.5,274.0,274.0,277.0,300.0,273.5,272.0,298.0,307.0,306.0,329.0,314.0,312.0,320.0,335.0,357.0,359.0,359.0,357.0,346.0,351.0,350.0,372.25,361.0,360.0,369.0,365.0,333.0,328.0,344.0,331.0,340.0,344.25,346.0,338.0,330.0,317.0,330.0,337.5,341.0,338.0,337.5,341.0,344.0,340.0,348.0,359.0,364.5,360.0,380.0,392.0,376.0,386.0,394.0,396.0,414.0,392.0,397.5,400.0,410.0,440.0,444.0,454.0,433.0,437.0,450.0,488.0,515.0,588.0,715.0,675.0,650.0,705.0,715.0,630.0,592.0,575.0,560.0,560.0,597.0,572.0,572.0,573.0,564.0,577.0,644.0,682.0,652.0,635.0,643.0,672.0,783.0,768.0,800.0,790.0,755.0,718.0,724.0,765.0,708.0,730.0,712.0,742.0,734.5,750.0,754.0,794.0,782.0,777.0,784.0,818.0,900.0,940.0,958.0,954.0,977.0,1055.0,1050.0,1094.0,1060.0,1030.0,980.0,870.0,774.0,828.0,800.0,772.0,735.0,680.0,655.0,695.0,690.0,673.0,655.0,650.0,650.0,645.0,617.0,605.0,613.0,594.0,580.0,565.0,485.0,457.0,485.0,460.0,455.0,446.0,453.0,455.0,460.0,454.0,363.0,348.0,350.0,325.0,320.0,326.0,323.0,328.0,330.0,338.0,405.0,403.0,400.0,436.0,425.0,432.0,417.0,380.0,367.0,378.0,383.0,370.0,373.0,370.0,370.0,378.0,388.0,368.0,374.0,372.0,365.0,350.0,350.0,366.0,355.0,350.0,356.0,333.0,330.0,318.0,320.0,324.0,325.0,330.0,318.0,320.0,319.0,320.0,336.0,325.0,333.0,333.0,318.0,315.0,320.0,319.0,311.0,309.0,305.0,290.0,278.0,261.0,246.0,242.0,234.0,235.0,238.0,263.0,254.0,266.0,256.0,252.0,256.0,253.0,244.0,239.0,230.0,228.0,193.0,175.0,171.0,144.0,150.0,154.0,159.0,158.0,177.0,183.0,181.0,184.0,176.0,178.0,185.0,175.0,165.0,167.0,180.0,176.0,174.0,185.0,196.0,211.0,214.0,218.0,209.0,208.0,207.0,194.0,196.0,202.5,204.0,199.0,194.0,190.0,196.0,206.0,193.0,200.0,194.0,199.0,211.0,246.0,227.0,234.0,240.0,239.0,232.0,246.0,277.0,275.0,284.0,315.0,322.0,311.0,272.0,250.0,253.0,238.0,241.0,249.7,243.5,220.0,225.0,228.0,209.0,225.0,224.0,221.0,216.0,211.0,213.0,221.0,215.0,213.0,205.0,209.0,216.0,222.0,230.0,218.0,214.0,212.0,213.0,213.0,215.0,214.0,208.0,193.0,179.0,181.0,184.0,181.0,184.0,186.0,189.0,182.0,180.5,180.75,184.0,202.0,196.0,200.0,192.0,200.0,196.0,197.5,199.0,196.0,195.0,188.0,189.0,184.0,183.75,186.0,188.5,188.0,180.0,182.0,182.5,191.5,192.0,191.5,189.0,184.0,184.0,184.0,182.5,185.5,195.0,196.0,195.0,207.0,209.25,225.0,227.0,240.0,259.0,256.0,271.0,297.0,260.0,253.0,253.0,262.0,273.0,276.0,274.0,315.0,294.0,280.0,284.0,305.0,289.0,313.0,320.0,335.0,350.0,340.0,349.0,362.0,378.0,402.0,365.0,352.0,342.0,315.0,305.0,306.0,316.0,325.0,330.0,308.0,310.0,323.0,319.0,330.0,343.0,345.0,343.0,315.0,316.0,320.0,298.0,309.0,324.0,320.0,330.0,334.0,315.0,326.0,326.0,327.0,326.0,326.0,324.0,343.0,329.0,337.0,348.0,338.0,341.0,338.0,347.0,347.0,352.0,351.0,353.0,353.0,353.0,369.0,381.0,368.0,374.0,361.0,362.0,367.5,368.0,366.0,367.0,375.0,365.0,362.5,369.0,370.0,364.0,363.0,359.0,335.0,324.0,329.0,335.0,331.0,339.5,344.0,368.0,376.0,371.0,373.0,368.0,371.0,369.0,354.0,347.0,344.0,346.0,354.0,361.0,372.0,376.0,368.0,381.0,402.0,429.0,438.0,504.0,568.0,514.0,507.0,425.0,447.0,438.0,462.0,459.0,437.0,408.0,442.0,437.0,453.0,424.0,432.0,438.0,471.0,470.0,456.0,455.0,423.0,390.0,375.0,345.0,286.0,292.0,299.0,275.0,245.0,229.0,237.0,203.0,197.0,171.0,172.0,196.0,231.0,218.0,184.0,186.0,174.0,174.0,177.0,175.0,185.0,196.0,182.0,183.0,192.0,202.0,215.0,216.0,196.0,202.0,197.0,207.0,220.0,222.0,233.0,234.0,234.0,212.5,241.0,225.0,231.0,235.0,264.0,255.0,241.0,244.0,250.0,234.0,247.0,257.0,258.0,270.0,276.0,272.0,286.0,290.0,291.0,300.0,295.0,291.0,323.0,325.0,335.0,327.0,330.0,354.0,361.0,360.0,382.0,367.0,366.0,377.0,402.0,424.0,452.0,435.0,419.0,387.0,414.0,428.0,430.0,465.0,466.0,477.0,458.0,489.0,511.0,542.0,560.0,551.0,507.0,541.0,416.0,469.0,450.0,451.0,478.0,472.0,438.0,448.0,463.0,462.0,491.0,488.0,475.0,483.0,500.0,526.0,523.0,554.0,558.0,570.0,575.0,597.0,583.0,629.0,678.0,684.0,701.0,683.0,763.0,742.0,745.0,764.0,791.0,741.0,802.0,808.0,803.0,812.0,820.0,843.0,778.0,811.0,756.0,722.0,749.0,768.0,789.0,769.0,771.0,769.0,717.0,723.0,731.0,754.0,772.0,817.0,744.0,744.0,752.0,782.0,774.0,805.0,827.0,739.0,737.0,747.0,747.0,786.0,762.0,735.0,665.0,627.0,598.0,605.0,596.0,667.0,658.0,648.0,610.0,570.0,657.0,665.0,627.0,653.0,636.0,633.0,632.0,668.0,685.0,710.0,702.0,695.0,717.0,711.0,693.0,701.0,654.0,650.0,640.0,649.0,660.0,669.0,656.5,602.0,606.0,592.0,602.0,613.0,636.0,610.0,568.0,581.0,579.0,582.0,573.0,573.0,580.0,587.0,645.0,618.0,645.0,692.0,675.0,638.0,668.0,649.0,637.0,597.0,608.0,616.0,624.0,654.0,688.0,690.0,694.0,675.0,706.0,682.0,695.0,725.0,726.0,745.0,747.0,761.0,738.0,719.0,763.0,773.0,755.0,764.0,728.0,721.0,679.0,678.0,701.0,704.0,736.0,737.0,755.0,760.0,732.0,675.0,647.0,673.0,717.0,744.0,741.0,730.0,738.0,754.0,753.0,731.0,687.0,690.0,724.0,720.0,703.0,708.0,738.0,741.0,738.0,760.0,735.0,719.0,722.0,735.0,724.0,698.0,706.0,730.0,736.0,743.0,743.0,706.0,714.0,734.0,737.0,741.0,776.0,776.0,776.0,765.0,788.0,788.0,797.0,804.0,814.0,803.0,808.0,835.0,831.0,841.0,825.0,829.0,837.0,860.0,867.0,877.0,875.0,872.0,858.0,885.0,882.0,895.0,887.0,829.0,827.0,805.0,770.0,791.0,754.0,787.0,779.0,754.0,767.0,777.0,804.0,801.0,817.0,792.0,809.0,796.0,794.0,773.0,775.0,783.0,794.0,778.0,779.0,805.0,823.0,795.0,771.0,760.0,747.0,767.0,780.0,772.0,777.0,787.0,783.0,781.0,781.0,757.0,742.0,718.0,676.0,691.0,650.0,626.0,623.0,612.0,602.0,620.0,606.0,563.0,580.0,583.0,609.0,659.0,688.0,707.0,698.0,698.0,681.0,610.0,556.0,545.0,555.0,542.0,544.0,546.0,554.0,547.0,498.0,484.0,504.0,493.0,517.0,521.0,501.0,485.0,541.0,569.0,592.0,577.0,573.0,542.0,562.0,607.0,624.0,600.0,595.0,561.0,543.0,539.0,553.0,541.0,548.0,593.0,604.0,647.0,680.0,695.0,703.0,692.0,705.0,693.0,667.0,679.0,652.0,690.0,719.0,669.0,638.0,622.0,612.0,619.0,684.0,714.0,724.0,746.0,743.0,689.0,654.0,676.0,744.0,754.0,752.0,713.0,749.0,774.0,791.0,779.0,767.0,746.0,771.0,803.0,797.0,804.0,806.0,802.0,816.0,805.0,804.0,768.0,774.0,833.0,863.0,871.0,887.0,843.0,837.0,859.0,848.0,877.0,884.0,900.0,928.0,939.0,934.0,949.0,929.0,915.0,935.0,942.0,983.0,968.0,968.0,994.0,1008.0,994.0,1009.0,1014.0,1015.0,1033.0,1028.0,1056.0,1096.0,1086.0,1111.0,1097.0,1047.0,970.0,1028.0,1041.0,991.0,978.0,990.0,982.0,971.0,906.0,978.0,1017.0,982.0,965.0,1004.0,981.0,980.0,989.0,1013.0,1007.0,958.0,948.0,945.0,942.0,892.0,927.0,916.0,899.0,902.0,923.0,977.0,979.0,979.0,1056.0,1086.0,1055.0,1087.0,1082.0,1084.0,1104.0,1120.0,1163.0,1146.0,1192.0,1211.0,1247.0,1259.0,1268.0,1264.0,1326.0,1417.0,1314.0,1358.0,1397.0,1416.0,1483.0,1533.0,1520.0,1558.0,1584.0,1387.0,1339.0,1369.0,1385.0,1412.0,1357.0,1309.0,1323.0,1334.0,1367.0,1347.0,1467.0,1492.0,1535.0,1567.0,1557.0,1522.0,1532.0,1421.0,1429.0,1447.0,1482.0,1500.0,1555.0,1608.0,1647.0,1655.0,1661.0,1706.0,1754.0,1775.0,1792.0,1788.0,1732.0,1770.0,1840.0,1868.0,1969.0,1939.0,1898.0,1961.0,2120.0,2368.0,2463.0,2300.0,2338.0,2441.0,2714.0,2743.0,2465.0,1975.0,1704.0,2370.0,2234.0,2180.0,2180.0,2040.0,1927.0,1815.0,1825.0,1980.0,1921.0,1925.0,1945.0,1899.0,1846.0,1910.0,1946.0,1982.0,2135.0,2094.0,2184.0,2150.0,2180.0,2180.0,2283.0,2304.0,2346.0,2236.0,2311.0,2410.0,2347.0,2381.0,2226.0,2391.0,2350.0,2335.0,2390.0,2342.0,2327.0,2335.0,2328.0,2370.0,2408.0,2392.0,2363.0,2330.0,2318.0,2352.0,2351.0,2379.0,2338.0,2338.0,2607.0,2634.0,2630.0,2626.0,2740.0,2852.0,2983.0,2929.0,2918.0,2832.0,2828.0,2833.0,2769.0,2558.0,2644.0,2779.0,2815.0,2712.0,2705.0,2648.0,2654.0,2606.0,2311.0,2420.0,2416.0,2216.0,2045.0,1998.0,1892.0,1996.0,2140.0,2015.0,1999.0,2026.0,2030.0,2120.0,1812.0,1807.0,1786.0,1769.0,1881.0,1928.0,1890.0,1883.0,2074.0,2276.0,2341.0,2241.0,2316.0,2470.0,2791.0,2958.0,2571.0,2490.0,2275.0,2256.0,2368.0,2390.0,2303.0,2150.0,1926.0,2018.0,2029.0,2012.0,1920.0,1881.0,1880.0,1907.0,1999.0,1895.0,1897.0,2103.0,2100.0,2260.0,2149.0,2140.0,2051.0,2151.0,2090.0,2128.0,2227.0,2260.0,2113.0,2027.0,1926.0,1822.0,2024.0,1976.0,1865.0,1900.0,1929.0,1798.0,1658.0,1788.0,1744.0,1793.0,1735.0,1668.0,1689.0,1609.0,1480.0,1444.0,1440.0,1368.0,1441.0,1419.0,1489.0,1424.0,1482.0,1593.0,1490.0,1451.0,1573.0,1473.0,1435.0,1398.0,1351.0,1391.0,1284.0,1225.0,1228.0,1280.0,1283.0,1234.0,1251.0,1304.0,1225.0,1238.0,1225.0,1220.0,1261.0,1270.0,1270.0,1145.0,1143.0,1115.0,1135.0,1116.0,960.0,1042.0,1056.0,1015.0,978.0,1138.0,1223.0,1119.0,1027.0,995.0,949.0,935.0,972.0,882.0,943.0,958.0,945.0,1044.0,1095.0,1013.0,994.0,1010.0,1066.0,1017.0,982.0,940.0,989.0,983.0,972.0,953.0,917.0,900.0,942.0,963.0,1035.0,977.0,923.0,908.0,915.0,933.0,943.0,936.0,986.0,943.0,1046.0,1083.0,1038.0,1007.0,1073.0,1064.0,1128.0,1120.0,1008.0,964.0,1023.0,993.0,974.0,969.0,912.0,920.0,929.0,947.0,940.0,1001.0,991.0,991.0,1004.0,969.0,917.0,953.0,968.0,947.0,982.0,929.0,921.0,954.0,943.0,946.0,984.0,958.0,1007.0,970.0,1020.0,1060.0,1055.0,1131.0,1135.0,1161.0,1304.0,1215.0,1192.0,1138.0,1139.0,1117.0,1101.0,1124.0,1203.0,1153.0,1246.0,1262.0,1439.0,1562.0,1405.0,1445.0,1393.0,1419.0,1363.0,1430.0,1466.0,1518.0,1705.0,1825.0,1649.0,1850.0,1755.0,1912.0,1775.0,1651.0,1702.87,1766.71,1761.6,1691.97],"m":[128.37,128.4,128.66,125.59,119.62,118.46,118.79,121.28,120.0,117.95,116.62,114.34,113.19,116.81,116.85,117.1,117.61,116.42,114.65,117.85,117.65,112.0,111.05,105.58,105.2,100.45,98.37,98.58,90.85,94.27,95.52,94.2,93.65,93.2,94.03,92.91,91.32,88.57,85.73,82.31,86.05,90.65,88.87,85.02,84.35,87.08,83.42,82.37,84.84,86.74,86.54,85.91,92.34,94.22,96.91,100.46,99.01,95.19,94.95,94.08,97.03,96.51,96.98,97.54,96.95,96.93,95.87,94.93,94.53,88.47,85.45,82.1,81.8,81.41,81.28,81.75,81.7,82.7,83.03,84.85,86.25,86.03,85.86,86.59,85.35,84.9,84.72,83.84,85.0,82.09,80.17,79.88,79.97,82.15,84.18,86.49,86.49,85.89,85.88,83.96,83.8,84.55,84.35,84.5,85.11,84.22,83.79,82.38,82.35,82.99,82.75,83.15,82.35,79.82,80.48,81.13,80.92,82.27,83.66,88.32,89.32,89.48,87.16,85.85,83.52,85.64,88.09,90.39,90.87,91.63,94.8,95.42,94.5,94.46,93.88,95.03,93.87,94.8,94.4,98.28,107.78,111.51,107.25,106.33,109.85,109.9,109.38,110.17,111.72,116.05,113.09,100.89,103.6,104.72,105.41,107.62,111.38,113.44,112.88,115.6,117.67,117.88,120.1,119.67,120.42,122.81,124.8,126.75,127.62,137.5,138.25,138.67,138.9,140.82,142.53,139.85,138.33,130.19,123.56,119.09,118.25,123.29,124.83,125.4,131.89,132.27,130.17,129.4,129.47,129.57,126.87,123.57,125.5,125.92,124.47,123.63,125.15,123.65,124.6,124.05,125.94,131.1,134.63,133.05,133.45,131.09,133.15,134.27,134.12,133.81,132.85,132.89,135.12,138.54,135.75,135.6,135.57,134.97,134.97,137.78,138.7,139.8,143.72,145.4,145.88,149.62,152.53,150.9,152.55,152.78,152.46,153.85,149.87,154.45,153.8,152.73,152.4,154.9,157.54,159.84,157.05,156.73,154.45,153.6,152.89,153.05,153.6,156.25,155.43,155.45,155.35,157.4,157.17,157.1,157.37,157.19,153.57,155.4,160.37,168.16,172.42,175.15,171.71,172.14,162.5,163.45,159.56,159.62,159.18,160.44,156.7,160.15,159.05,158.89,157.42,156.22,154.03,154.0,151.95,151.0,148.22,149.45,146.59,145.44,146.47,143.47,138.54,138.57,138.27,136.92,135.25,135.87,134.45,134.95,133.82,133.15,131.63,134.15,131.1,129.17,131.25,129.35,129.73,129.7,129.6,139.62,140.2,140.95,138.65,134.13,140.25,138.5,140.0,140.31,139.0,136.15,134.35,132.04,134.53,133.2,129.7,130.62,129.3,128.4,129.37,130.9,132.95,130.7,132.55,133.0,130.72,129.15,127.7,124.9,125.44,125.15,123.05,121.25,118.2,119.75,118.4,116.25,117.4,115.9,116.3,118.25,118.35,115.3,115.5,117.6,117.8,117.5,118.56,119.92,121.4,121.45,122.05,126.86,136.5,133.65,146.2,148.5,152.05,149.4,146.44,146.69,155.35,152.35,156.75,156.63,158.88,172.25,174.5,186.44,209.2,215.2,198.6,196.9,191.6,174.4,175.6,196.4,209.2,231.4,224.9,202.4,193.25,189.1,189.3,192.5,192.3,193.5,199.6,214.0,205.9,208.6,206.9,209.6,210.0,207.2,206.9,205.75,190.5,186.5,201.25,206.2,234.5,234.1,234.5,238.2,236.0,234.0,238.2,236.2,254.2,273.0,285.2,270.3,283.25,311.25,354.2,361.6,339.38,351.7,386.2,331.25,278.6,283.6,283.2,300.4,295.0,294.3,309.6,325.4,305.0,298.1,287.4,281.8,284.2,280.5,283.4,289.3,280.7,280.0,280.05,277.0,274.1,276.8,273.5,273.5,285.5,277.1,271.9,283.65,304.0,308.25,327.0,325.8,313.6,319.4,327.8,346.8,353.2,354.4,352.4,350.0,347.2,349.4,359.55,363.5,359.5,366.4,376.8,344.7,305.5,335.3,337.0,336.3,341.34,346.8,338.8,332.0,321.1,320.0,335.3,337.2,339.9,336.9,341.6,340.2,342.0,342.62,354.6,365.7,362.6,377.4,386.6,388.4,382.2,392.8,393.8,406.6,408.0,400.3,397.0,408.0,429.4,441.2,451.5,437.5,444.5,442.0,473.8,495.6,566.8,669.4,748.0,700.0,677.0,703.6,668.2,610.4,581.4,558.2,573.0,577.25,581.0,574.2,569.0,562.6,571.25,625.4,658.6,676.8,654.6,625.9,667.8,724.2,767.0,828.0,766.0,753.1,730.8,717.0,735.0,740.6,722.2,716.0,726.0,735.7,739.2,751.4,770.4,778.4,777.8,784.7,802.4,872.6,929.2,940.8,964.67,977.5,1046.8,1036.2,1072.6,1058.6,1061.2,977.0,935.6,826.0,786.0,792.0,787.0,758.0,700.4,668.75,709.5,705.6,674.8,663.75,640.2,649.0,655.0,627.4,604.1,614.2,604.6,588.4,564.6,521.6,463.8,459.4,454.4,454.2,445.2,459.0,456.0,459.6,460.4,404.0,335.6,346.2,339.8,318.25,331.2,325.4,323.5,333.7,334.1,373.8,399.0,401.2,428.67,435.5,430.2,421.6,394.0,373.4,371.6,377.2,373.4,376.0,367.2,369.4,376.8,387.0,377.25,367.4,371.2,369.0,357.2,353.75,358.6,365.2,351.6,351.33,339.4,333.9,321.2,319.0,323.2,322.4,323.4,322.8,319.2,321.8,319.8,343.25,323.2,331.0,333.0,324.8,317.8,317.2,319.0,315.8,311.2,308.8,289.0,277.4,263.4,256.4,245.2,237.8,229.0,235.25,247.8,250.8,264.8,262.2,260.6,251.8,252.6,248.0,239.0,238.2,232.2,202.6,179.2,171.8,155.5,155.75,151.0,159.0,157.4,170.8,190.0,185.4,176.6,178.5,178.4,181.2,175.8,171.0,165.8,174.4,176.8,173.4,181.2,198.75,200.4,219.2,210.6,214.0,210.4,207.0,198.5,195.8,199.3,205.1,198.7,194.6,189.8,191.2,204.4,200.1,197.5,194.75,198.4,210.5,226.4,231.4,231.7,237.2,240.9,228.8,238.4,263.1,278.2,284.0,290.8,315.5,319.12,295.4,262.7,255.0,237.6,241.4,251.54,248.12,230.0,219.7,226.6,217.4,219.8,223.9,225.2,216.8,214.8,214.0,217.1,217.1,213.75,208.2,208.5,208.8,220.0,222.4,220.6,214.75,214.4,211.6,213.4,217.4,214.6,210.3,201.9,186.6,181.1,184.0,180.38,186.9,184.0,189.6,186.9,179.45,182.05,182.6,187.6,202.7,200.6,196.12,195.5,197.7,196.95,200.0,198.8,194.0,191.9,188.9,186.4,184.69,188.0,186.5,188.0,183.3,177.8,182.55,187.85,190.6,191.9,189.0,184.6,183.4,183.25,183.1,183.7,196.4,193.9,193.6,206.4,209.15,217.2,224.4,233.6,254.2,259.6,262.2,277.4,270.2,254.2,256.33,266.25,272.4,275.9,275.8,290.8,298.6,278.4,287.2,289.8,291.2,303.6,315.0,335.6,341.8,349.0,361.19,361.8,377.75,386.6,372.2,346.4,348.0,335.6,299.0,304.4,311.2,324.3,324.8,315.2,311.2,318.0,320.4,324.8,341.5,341.25,346.3,316.6,309.0,318.0,303.0,304.4,323.4,319.0,323.0,329.8,320.8,325.0,324.0,326.6,327.6,324.1,324.67,336.25,330.6,333.8,345.0,338.4,340.0,339.1,340.7,351.0,345.4,349.6,351.8,353.1,352.75,365.25,375.8,377.0,371.0,368.75,362.2,370.1,367.38,367.3,366.5,371.9,367.8,364.9,367.2,367.7,366.55,363.2,361.6,346.4,325.6,328.62,332.4,333.5,333.6,340.6,355.2,368.7,371.6,362.8,370.0,373.4,367.4,359.5,350.3,346.6,346.0,353.4,359.83,369.5,373.5,375.4,369.4,387.0,420.7,435.7,483.3,538.8,555.8,492.2,467.0,447.75,439.6,453.2,457.8,449.2,422.8,431.25,435.4,451.0,436.75,431.6,430.3,461.4,469.0,465.4,449.0,438.6,402.6,382.8,355.6,313.8,285.0,293.5,290.4,243.6,232.8,247.6,208.2,199.8,192.0,177.2,186.0,214.0,219.9,203.2,190.0,173.7,177.0,176.8,175.0,183.5,191.9,183.6,184.4,191.0,197.0,212.4,216.8,202.6,197.0,197.8,199.4,212.6,217.6,226.38,236.25,230.0,219.7,229.25,232.2,231.4,230.0,247.2,253.9,243.9,238.8,249.4,238.8,240.7,253.6,258.6,271.4,273.2,271.6,284.5,288.0,291.8,295.6,297.2,291.4,309.5,327.0,333.8,327.2,327.4,341.3,367.2,368.7,380.4,368.7,366.0,365.0,393.67,423.2,433.3,455.6,424.8,423.2,412.4,428.8,432.4,448.6,465.8,469.5,455.0,475.5,504.25,530.4,550.6,552.8,516.0,534.0,469.4,448.6,454.5,439.4,467.0,483.0,453.6,440.0,461.4,452.0,477.2,498.0,475.6,487.2,488.0,510.12,524.4,544.2,542.8,560.8,579.4,590.6,583.0,618.4,659.2,703.8,673.4,692.8,720.8,748.6,751.8,752.2,792.0,766.75,786.8,807.6,802.6,815.0,824.0,836.6,811.0,808.4,785.4,724.0,743.4,754.2,785.0,778.2,755.0,757.5,750.5,725.6,722.2,740.8,772.75,801.6,783.0,752.8,743.2,769.0,771.0,794.8,822.4,804.5,734.4,756.4,755.0,777.25,762.0,724.0,700.0,635.6,590.0,608.8,611.0,646.6,646.2,655.4,645.2,587.4,604.0,659.0,641.0,632.0,643.33,649.5,632.8,656.1,683.2,694.4,703.6,690.8,708.6,710.2,690.6,700.8,685.0,656.4,650.0,644.0,655.6,668.8,671.9,618.0,598.4,602.8,602.4,620.33,623.6,622.0,588.7,588.4,579.0,582.0,567.2,580.6,582.4,579.9,623.8,632.0,639.0,675.4,675.0,639.4,652.0,653.4,641.4,608.6,604.4,611.0,624.8,642.0,670.6,684.2,694.8,690.4,694.67,697.75,686.4,713.6,720.5,744.8,756.8,761.9,747.0,735.0,738.4,769.4,754.9,759.5,752.75,724.0,674.4,676.0,693.2,694.0,720.8,740.6,747.5,754.0,748.9,699.6,656.0,679.6,704.2,731.2,740.2,731.2,729.2,744.6,749.6,741.0,708.2,692.6,710.6,719.2,717.8,705.2,716.2,744.4,742.2,752.0,743.4,719.6,719.8,720.8,733.0,707.4,701.0,718.0,734.4,738.1,745.6,718.7,709.4,723.8,735.6,737.4,762.6,773.1,768.7,779.3,779.6,781.2,800.25,789.25,807.2,809.0,812.8,825.6,834.75,835.2,844.8,820.8,826.2,851.6,868.6,874.4,874.0,880.6,856.8,875.6,883.4,891.25,891.0,861.6,837.0,810.4,778.6,782.2,774.6,768.4,786.4,776.2,769.2,770.4,796.8,802.6,811.4,795.4,808.33,804.25,796.2,789.6,769.4,782.0,787.2,777.0,780.8,796.4,824.0,803.8,775.2,769.4,741.0,766.0,769.8,770.0,774.6,787.25,786.2,783.8,784.0,766.6,745.8,729.2,695.2,683.4,658.2,644.6,621.6,620.4,601.0,611.2,606.6,557.0,581.75,584.8,597.4,626.2,661.8,702.2,697.4,686.0,678.2,634.4,590.9,543.6,546.6,541.0,550.0,555.0,557.0,551.0,523.6,480.2,494.6,494.4,502.6,514.2,510.8,494.4,514.0,562.4,575.6,589.0,572.0,550.0,549.8,583.0,607.0,606.25,595.0,579.0,542.6,542.25,554.8,541.6,549.6,573.0,602.0,632.2,656.0,688.6,708.8,704.0,696.8,695.2,677.75,686.6,658.6,685.6,702.6,693.0,652.6,636.6,626.8,623.8,661.2,702.6,732.8,757.6,736.6,720.4,665.2,672.33,720.5,756.2,747.4,759.2,750.0,767.2,783.0,773.2,775.4,762.8,756.8,787.0,794.4,804.4,799.25,788.5,802.4,807.0,805.0,789.2,769.0,812.5,850.8,881.8,877.4,857.0,846.2,851.2,856.8,862.0,889.8,888.8,906.2,935.0,937.75,963.8,940.8,920.6,923.8,928.4,949.0,978.8,965.0,983.4,1004.4,988.0,1001.4,1010.8,1003.2,1012.6,1024.8,1058.0,1087.0,1093.2,1112.0,1097.6,1062.4,1006.8,1002.4,1034.4,1036.4,980.0,992.0,989.6,976.75,926.25,947.8,1013.4,983.0,965.6,982.25,983.6,979.2,984.25,1006.0,1013.4,973.4,948.8,946.2,946.6,913.2,920.0,923.6,905.0,890.2,917.6,962.0,979.0,975.4,1016.0,1066.0,1055.6,1075.6,1081.2,1112.8,1089.8,1124.2,1122.8,1156.6,1163.4,1222.0,1245.2,1261.4,1256.0,1262.75,1319.4,1355.0,1345.0,1351.6,1374.6,1403.0,1476.8,1539.6,1527.2,1543.0,1588.4,1485.8,1391.4,1380.4,1372.0,1400.25,1378.6,1319.25,1330.0,1321.6,1343.0,1335.8,1404.6,1492.2,1525.4,1558.2,1566.6,1537.4,1522.8,1508.6,1423.8,1437.0,1476.0,1485.25,1546.2,1572.2,1608.2,1657.8,1671.4,1666.0,1738.4,1758.0,1792.6,1792.6,1719.8,1746.6,1813.8,1857.8,1910.4,1950.4,1885.0,1934.5,2076.2,2236.8,2479.6,2310.4,2384.0,2375.6,2643.6,2726.0,2514.4,2292.4,1637.6,2030.8,2277.8,2162.5,2213.0,2049.0,1955.2,1826.25,1837.0,1999.4,1945.75,1943.2,1943.0,1925.8,1900.8,1907.8,1933.8,1980.0,2101.8,2198.4,2152.6,2159.0,2187.2,2173.0,2275.75,2292.6,2347.8,2261.4,2286.8,2360.2,2385.0,2376.0,2303.6,2295.8,2419.2,2333.2,2351.8,2394.4,2313.0,2334.6,2324.0,2360.67,2420.0,2382.0,2376.0,2328.4,2272.8,2354.0,2378.4,2388.0,2342.2,2323.2,2494.6,2623.8,2609.5,2635.5,2698.2,2812.4,2935.0,2964.5,2929.0,2880.8,2781.6,2847.0,2796.6,2720.2,2588.6,2704.0,2822.6,2796.4,2650.8,2639.8,2661.6,2619.2,2479.8,2403.8,2455.75,2330.0,2048.2,1981.4,1920.8,1922.0,2138.8,2059.4,2006.0,2019.2,2043.0,2138.2,1913.8,1766.0,1823.4,1697.4,1811.0,1957.0,1880.0,1907.4,1956.0,2232.0,2376.6,2253.2,2300.0,2435.6,2649.6,3061.8,2501.6,2525.2,2227.4,2269.4,2393.25,2411.75,2240.6,2229.25,2025.6,2010.8,2008.6,2054.33,1970.6,1859.4,1865.2,1920.8,1949.8,2029.6,1877.2,2044.4,2114.2,2217.4,2159.0,2056.2,2094.25,2055.6,2143.6,2158.25,2114.4,2255.0,2153.2,2007.2,1968.6,1870.6,1909.2,2038.0,1882.4,1879.0,1883.6,1884.6,1701.2,1782.33,1768.75,1795.0,1736.8,1705.2,1646.2,1624.4,1503.8,1484.6,1428.0,1398.8,1442.8,1417.2,1431.6,1454.0,1457.75,1584.8,1523.0,1444.75,1563.75,1497.6,1453.0,1407.75,1396.4,1357.6,1356.6,1268.6,1240.4,1265.0,1296.6,1272.6,1245.0,1254.8,1250.2,1255.4,1236.0,1214.2,1236.2,1261.0,1239.0,1185.6,1158.0,1128.8,1117.6,1121.6,1044.6,1013.4,1065.8,1043.0,966.8,1009.6,1198.2,1150.0,1071.25,1000.8,949.2,943.8,973.6,916.6,911.0,965.0,946.8,989.4,1057.0,1016.2,998.75,1008.25,1055.2,1027.2,1004.8,946.6,970.75,990.6,1003.0,963.25,921.4,899.0,907.4,966.8,1012.2,993.0,955.2,917.4,912.0,889.4,938.6,940.8,969.75,954.0,982.6,1088.2,1050.8,1005.6,1032.0,1038.0,1097.4,1174.0,1059.0,959.8,1009.8,990.6,979.6,974.6,934.4,931.67,915.0,931.6,947.8,967.4,974.0,1000.4,983.6,982.8,936.8,945.2,956.4,963.4,966.2,971.0,919.0,953.75,943.75,945.0,969.5,958.8,994.4,976.25,1003.0,1068.4,1043.8,1089.0,1130.6,1117.0,1230.2,1260.4,1230.4,1172.4,1137.4,1113.8,1096.5,1127.6,1162.0,1171.8,1215.2,1262.0,1378.8,1522.8,1435.6,1414.6,1418.6,1441.2,1396.0,1404.6,1452.6,1489.2,1622.0,1797.33,1630.0,1744.8,1821.4,1861.8,1987.8,1740.4,1705.65,1728.76,1778.66,1691.97],"n":[5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,7,7,4,1]},"Platinum":{"t":["1990-04-02","1990-04-09","1990-04-16","1990-04-23","1990-04-30","1990-05-07","1990-05-14","1990-05-21","1990-05-28","1990-06-04","1990-06-11","1990-06-18","1990-06-25","1990-07-02","1990-07-09","1990-07-16","1990-07-23","1990-07-30","1990-08-06","1990-08-13","1990-08-20","1990-08-27","1990-09-03","1990-09-10","1990-09-17","1990-09-24","1990-10-01","1990-10-08","1990-10-15","1990-10-22","1990-10-29","1990-11-05","1990-11-12","1990-11-19","1990-11-26","1990-12-03","1990-12-10","1990-12-17","1990-12-24","1990-12-31","1991-01-07","1991-01-14","1991-01-21","1991-01-28","1991-02-04","1991-02-11","1991-02-18","1991-02-25","1991-03-04","1991-03-11","1991-03-18","1991-03-25","1991-04-01","1991-04-08","1991-04-15","1991-04-22","1991-04-29","1991-05-06","1991-05-13","1991-05-20","1991-05-27","1991-06-03","1991-06-10","1991-06-17","1991-06-24","1991-07-01","1991-07-08","1991-07-15","1991-07-22","1991-07-29","1991-08-05","1991-08-12","1991-08-19","1991-08-26","1991-09-02","1991-09-09","1991-09-16","1991-09-23","1991-09-30","1991-10-07","1991-10-14","1991-10-21","1991-10-28","1991-11-04","1991-11-11","1991-11-18","1991-11-25","1991-12-02","1991-12-09","1991-12-16","1991-12-23","1991-12-30","1992-01-06","1992-01-13","1992-01-20","1992-01-27","1992-02-03","1992-02-10","1992-02-17","1992-02-24","1992-03-02","1992-03-09","1992-03-16","1992-03-23","1992-03-30","1992-04-06","1992-04-13","1992-04-20","1992-04-27","1992-05-04","1992-05-11","1992-05-18","1992-05-25","1992-06-01","1992-06-08","1992-06-15","1992-06-22","1992-06-29","1992-07-06","1992-07-13","1992-07-20","1992-07-27","1992-08-03","1992-08-10","1992-08-17","1992-08-24","1992-08-31","1992-09-07","1992-09-14","1992-09-21","1992-09-28","1992-10-05","1992-10-12","1992-10-19","1992-10-26","1992-11-02","1992-11-09","1992-11-16","1992-11-23","1992-11-30","1992-12-07","1992-12-14","1992-12-21","1992-12-28","1993-01-04","1993-01-11","1993-01-18","1993-01-25","1993-02-01","1993-02-08","1993-02-15","1993-02-22","1993-03-01","1993-03-08","1993-03-15","1993-03-22","1993-03-29","1993-04-05","1993-04-12","1993-04-19","1993-04-26","1993-05-03","1993-05-10","1993-05-17","1993-05-24","1993-05-31","1993-06-07","1993-06-14","1993-06-21","1993-06-28","1993-07-05","1993-07-12","1993-07-19","1993-07-26","1993-08-02","1993-08-09","1993-08-16","1993-08-23","1993-08-30","1993-09-06","1993-09-13","1993-09-20","1993-09-27","1993-10-04","1993-10-11","1993-10-18","1993-10-25","1993-11-01","1993-11-08","1993-11-15","1993-11-22","1993-11-29","1993-12-06","1993-12-13","1993-12-20","1993-12-27","1994-01-03","1994-01-10","1994-01-17","1994-01-24","1994-01-31","1994-02-07","1994-02-14","1994-02-21","1994-02-28","1994-03-07","1994-03-14","1994-03-21","1994-03-28","1994-04-04","1994-04-11","1994-04-18","1994-04-25","1994-05-02","1994-05-09","1994-05-16","1994-05-23","1994-05-30","1994-06-06","1994-06-13","1994-06-20","1994-06-27","1994-07-04","1994-07-11","1994-07-18","1994-07-25","1994-08-01","1994-08-08","1994-08-15","1994-08-22","1994-08-29","1994-09-05","1994-09-12","1994-09-19","1994-09-26","1994-10-03","1994-10-10","1994-10-17","1994-10-24","1994-10-31","1994-11-07","1994-11-14","1994-11-21","1994-11-28","1994-12-05","1994-12-12","1994-12-19","1994-12-26","1995-01-02","1995-01-09","1995-01-16","1995-01-23","1995-01-30","1995-02-06","1995-02-13","1995-02-20","1995-02-27","1995-03-06","1995-03-13","1995-03-20","1995-03-27","1995-04-03","1995-04-10","1995-04-17","1995-04-24","1995-05-01","1995-05-08","1995-05-15","1995-05-22","1995-05-29","1995-06-05","1995-06-12","1995-06-19","1995-06-26","1995-07-03","1995-07-10","1995-07-17","1995-07-24","1995-07-31","1995-08-07","1995-08-14","1995-08-21","1995-08-28","1995-09-04","1995-09-11","1995-09-18","1995-09-25","1995-10-02","1995-10-09","1995-10-16","1995-10-23","1995-10-30","1995-11-06","1995-11-13","1995-11-20","1995-11-27","1995-12-04","1995-12-11","1995-12-18","1995-12-25","1996-01-01","1996-01-08","1996-01-15","1996-01-22","1996-01-29","1996-02-05","1996-02-12","1996-02-19","1996-02-26","1996-03-04","1996-03-11","1996-03-18","1996-03-25","1996-04-01","1996-04-08","1996-04-15","1996-04-22","1996-04-29","1996-05-06","1996-05-13","1996-05-20","1996-05-27","1996-06-03","1996-06-10","1996-06-17","1996-06-24","1996-07-01","1996-07-08","1996-07-15","1996-07-22","1996-07-29","1996-08-05","1996-08-12","1996-08-19","1996-08-26","1996-09-02","1996-09-09","1996-09-16","1996-09-23","1996-09-30","1996-10-07","1996-10-14","1996-10-21","1996-10-28","1996-11-04","1996-11-11","1996-11-18","1996-11-25","1996-12-02","1996-12-09","1996-12-16","1996-12-23","1996-12-30","1997-01-06","1997-01-13","1997-01-20","1997-01-27","1997-02-03","1997-02-10","1997-02-17","1997-02-24","1997-03-03","1997-03-10","1997-03-17","1997-03-24","1997-03-31","1997-04-07","1997-04-14","1997-04-21","1997-04-28","1997-05-05","1997-05-12","1997-05-19","1997-05-26","1997-06-02","1997-06-09","1997-06-16","1997-06-23","1997-06-30","1997-07-07","1997-07-14","1997-07-21","1997-07-28","1997-08-04","1997-08-11","1997-08-18","1997-08-25","1997-09-01","1997-09-08","1997-09-15","1997-09-22","1997-09-29","1997-10-06","1997-10-13","1997-10-20","1997-10-27","1997-11-03","1997-11-10","1997-11-17","1997-11-24","1997-12-01","1997-12-08","1997-12-15","1997-12-22","1997-12-29","1998-01-05","1998-01-12","1998-01-19","1998-01-26","1998-02-02","1998-02-09","1998-02-16","1998-02-23","1998-03-02","1998-03-09","1998-03-16","1998-03-23","1998-03-30","1998-04-06","1998-04-13","1998-04-20","1998-04-27","1998-05-04","1998-05-11","1998-05-18","1998-05-25","1998-06-01","1998-06-08","1998-06-15","1998-06-22","1998-06-29","1998-07-06","1998-07-13","1998-07-20","1998-07-27","1998-08-03","1998-08-10","1998-08-17","1998-08-24","1998-08-31","1998-09-07","1998-09-14","1998-09-21","1998-09-28","1998-10-05","1998-10-12","1998-10-19","1998-10-26","1998-11-02","1998-11-09","1998-11-16","1998-11-23","1998-11-30","1998-12-07","1998-12-14","1998-12-21","1998-12-28","1999-01-04","1999-01-11","1999-01-18","1999-01-25","1999-02-01","1999-02-08","1999-02-15","1999-02-22","1999-03-01","1999-03-08","1999-03-15","1999-03-22","1999-03-29","1999-04-05","1999-04-12","1999-04-19","1999-04-26","1999-05-03","1999-05-10","1999-05-17","1999-05-24","1999-05-31","1999-06-07","1999-06-14","1999-06-21","1999-06-28","1999-07-05","1999-07-12","1999-07-19","1999-07-26","1999-08-02","1999-08-09","1999-08-16","1999-08-23","1999-08-30","1999-09-06","1999-09-13","1999-09-20","1999-09-27","1999-10-04","1999-10-11","1999-10-18","1999-10-25","1999-11-01","1999-11-08","1999-11-15","1999-11-22","1999-11-29","1999-12-06","1999-12-13","1999-12-20","1999-12-27","2000-01-03","2000-01-10","2000-01-17","2000-01-24","2000-01-31","2000-02-07","2000-02-14","2000-02-21","2000-02-28","2000-03-06","2000-03-13","2000-03-20","2000-03-27","2000-04-03","2000-04-10","2000-04-17","2000-04-24","2000-05-01","2000-05-08","2000-05-15","2000-05-22","2000-05-29","2000-06-05","2000-06-12","2000-06-19","2000-06-26","2000-07-03","2000-07-10","2000-07-17","2000-07-24","2000-07-31","2000-08-07","2000-08-14","2000-08-21","2000-08-28","2000-09-04","2000-09-11","2000-09-18","2000-09-25","2000-10-02","2000-10-09","2000-10-16","2000-10-23","2000-10-30","2000-11-06","2000-11-13","2000-11-20","2000-11-27","2000-12-04","2000-12-11","2000-12-18","2000-12-25","2001-01-01","2001-01-08","2001-01-15","2001-01-22","2001-01-29","2001-02-05","2001-02-12","2001-02-19","2001-02-26","2001-03-05","2001-03-12","2001-03-19","2001-03-26","2001-04-02","2001-04-09","2001-04-16","2001-04-23","2001-04-30","2001-05-07","2001-05-14","2001-05-21","2001-05-28","2001-06-04","2001-06-11","2001-06-18","2001-06-25","2001-07-02","2001-07-09","2001-07-16","2001-07-23","2001-07-30","2001-08-06","2001-08-13","2001-08-20","2001-08-27","2001-09-03","2001-09-10","2001-09-17","2001-09-24","2001-10-01","2001-10-08","2001-10-15","2001-10-22","2001-10-29","2001-11-05","2001-11-12","2001-11-19","2001-11-26","2001-12-03","2001-12-10","2001-12-17","2001-12-24","2001-12-31","2002-01-07","2002-01-14","2002-01-21","2002-01-28","2002-02-04","2002-02-11","2002-02-18","2002-02-25","2002-03-04","2002-03-11","2002-03-18","2002-03-25","2002-04-01","2002-04-08","2002-04-15","2002-04-22","2002-04-29","2002-05-06","2002-05-13","2002-05-20","2002-05-27","2002-06-03","2002-06-10","2002-06-17","2002-06-24","2002-07-01","2002-07-08","2002-07-15","2002-07-22","2002-07-29","2002-08-05","2002-08-12","2002-08-19","2002-08-26","2002-09-02","2002-09-09","2002-09-16","2002-09-23","2002-09-30","2002-10-07","2002-10-14","2002-10-21","2002-10-28","2002-11-04","2002-11-11","2002-11-18","2002-11-25","2002-12-02","2002-12-09","2002-12-16","2002-12-23","2002-12-30","2003-01-06","2003-01-13","2003-01-20","2003-01-27","2003-02-03","2003-02-10","2003-02-17","2003-02-24","2003-03-03","2003-03-10","2003-03-17","2003-03-24","2003-03-31","2003-04-07","2003-04-14","2003-04-21","2003-04-28","2003-05-05","2003-05-12","2003-05-19","2003-05-26","2003-06-02","2003-06-09","2003-06-16","2003-06-23","2003-06-30","2003-07-07","2003-07-14","2003-07-21","2003-07-28","2003-08-04","2003-08-11","2003-08-18","2003-08-25","2003-09-01","2003-09-08","2003-09-15","2003-09-22","2003-09-29","2003-10-06","2003-10-13","2003-10-20","2003-10-27","2003-11-03","2003-11-10","2003-11-17","2003-11-24","2003-12-01","2003-12-08","2003-12-15","2003-12-22","2003-12-29","2004-01-05","2004-01-12","2004-01-19","2004-01-26","2004-02-02","2004-02-09","2004-02-16","2004-02-23","2004-03-01","2004-03-08","2004-03-15","2004-03-22","2004-03-29","2004-04-05","2004-04-12","2004-04-19","2004-04-26","2004-05-03","2004-05-10","2004-05-17","2004-05-24","2004-05-31","2004-06-07","2004-06-14","2004-06-21","2004-06-28","2004-07-05","2004-07-12","2004-07-19","2004-07-26","2004-08-02","2004-08-09","2004-08-16","2004-08-23","2004-08-30","2004-09-06","2004-09-13","2004-09-20","2004-09-27","2004-10-04","2004-10-11","2004-10-18","2004-10-25","2004-11-01","2004-11-08","2004-11-15","2004-11-22","2004-11-29","2004-12-06","2004-12-13","2004-12-20","2004-12-27","2005-01-03","2005-01-10","2005-01-17","2005-01-24","2005-01-31","2005-02-07","2005-02-14","2005-02-21","2005-02-28","2005-03-07","2005-03-14","2005-03-21","2005-03-28","2005-04-04","2005-04-11","2005-04-18","2005-04-25","2005-05-02","2005-05-09","2005-05-16","2005-05-23","2005-05-30","2005-06-06","2005-06-13","2005-06-20","2005-06-27","2005-07-04","2005-07-11","2005-07-18","2005-07-25","2005-08-01","2005-08-08","2005-08-15","2005-08-22","2005-08-29","2005-09-05","2005-09-12","2005-09-19","2005-09-26","2005-10-03","2005-10-10","2005-10-17","2005-10-24","2005-10-31","2005-11-07","2005-11-14","2005-11-21","2005-11-28","2005-12-05","2005-12-12","2005-12-19","2005-12-26","2006-01-02","2006-01-09","2006-01-16","2006-01-23","2006-01-30","2006-02-06","2006-02-13","2006-02-20","2006-02-27","2006-03-06","2006-03-13","2006-03-20","2006-03-27","2006-04-03","2006-04-10","2006-04-17","2006-04-24","2006-05-01","2006-05-08","2006-05-15","2006-05-22","2006-05-29","2006-06-05","2006-06-12","2006-06-19","2006-06-26","2006-07-03","2006-07-10","2006-07-17","2006-07-24","2006-07-31","2006-08-07","2006-08-14","2006-08-21","2006-08-28","2006-09-04","2006-09-11","2006-09-18","2006-09-25","2006-10-02","2006-10-09","2006-10-16","2006-10-23","2006-10-30","2006-11-06","2006-11-13","2006-11-20","2006-11-27","2006-12-04","2006-12-11","2006-12-18","2006-12-25","2007-01-01","2007-01-08","2007-01-15","2007-01-22","2007-01-29","2007-02-05","2007-02-12","2007-02-19","2007-02-26","2007-03-05","2007-03-12","2007-03-19","2007-03-26","2007-04-02","2007-04-09","2007-04-16","2007-04-23","2007-04-30","2007-05-07","2007-05-14","2007-05-21","2007-05-28","2007-06-04","2007-06-11","2007-06-18","2007-06-25","2007-07-02","2007-07-09","2007-07-16","2007-07-23","2007-07-30","2007-08-06","2007-08-13","2007-08-20","2007-08-27","2007-09-03","2007-09-10","2007-09-17","2007-09-24","2007-10-01","2007-10-08","2007-10-15","2007-10-22","2007-10-29","2007-11-05","2007-11-12","2007-11-19","2007-11-26","2007-12-03","2007-12-10","2007-12-17","2007-12-24","2007-12-31","2008-01-07","2008-01-14","2008-01-21","2008-01-28","2008-02-04","2008-02-11","2008-02-18","2008-02-25","2008-03-03","2008-03-10","2008-03-17","2008-03-24","2008-03-31","2008-04-07","2008-04-14","2008-04-21","2008-04-28","2008-05-05","2008-05-12","2008-05-19","2008-05-26","2008-06-02","2008-06-09","2008-06-16","2008-06-23","2008-06-30","2008-07-07","2008-07-14","2008-07-21","2008-07-28","2008-08-04","2008-08-11","2008-08-18","2008-08-25","2008-09-01","2008-09-08","2008-09-15","2008-09-22","2008-09-29","2008-10-06","2008-10-13","2008-10-20","2008-10-27","2008-11-03","2008-11-10","2008-11-17","2008-11-24","2008-12-01","2008-12-08","2008-12-15","2008-12-22","2008-12-29","2009-01-05","2009-01-12","2009-01-19","2009-01-26","2009-02-02","2009-02-09","2009-02-16","2009-02-23","2009-03-02","2009-03-09","2009-03-16","2009-03-23","2009-03-30","2009-04-06","2009-04-13","2009-04-20","2009-04-27","2009-05-04","2009-05-11","2009-05-18","2009-05-25","2009-06-01","2009-06-08","2009-06-15","2009-06-22","2009-06-29","2009-07-06","2009-07-13","2009-07-20","2009-07-27","2009-08-03","2009-08-10","2009-08-17","2009-08-24","2009-08-31","2009-09-07","2009-09-14","2009-09-21","2009-09-28","2009-10-05","2009-10-12","2009-10-19","2009-10-26","2009-11-02","2009-11-09","2009-11-16","2009-11-23","2009-11-30","2009-12-07","2009-12-14","2009-12-21","2009-12-28","2010-01-04","2010-01-11","2010-01-18","2010-01-25","2010-02-01","2010-02-08","2010-02-15","2010-02-22","2010-03-01","2010-03-08","2010-03-15","2010-03-22","2010-03-29","2010-04-05","2010-04-12","2010-04-19","2010-04-26","2010-05-03","2010-05-10","2010-05-17","2010-05-24","2010-05-31","2010-06-07","2010-06-14","2010-06-21","2010-06-28","2010-07-05","2010-07-12","2010-07-19","2010-07-26","2010-08-02","2010-08-09","2010-08-16","2010-08-23","2010-08-30","2010-09-06","2010-09-13","2010-09-20","2010-09-27","2010-10-04","2010-10-11","2010-10-18","2010-10-25","2010-11-01","2010-11-08","2010-11-15","2010-11-22","2010-11-29","2010-12-06","2010-12-13","2010-12-20","2010-12-27","2011-01-03","2011-01-10","2011-01-17","2011-01-24","2011-01-31","2011-02-07","2011-02-14","2011-02-21","2011-02-28","2011-03-07","2011-03-14","2011-03-21","2011-03-28","2011-04-04","2011-04-11","2011-04-18","2011-04-25","2011-05-02","2011-05-09","2011-05-16","2011-05-23","2011-05-30","2011-06-06","2011-06-13","2011-06-20","2011-06-27","2011-07-04","2011-07-11","2011-07-18","2011-07-25","2011-08-01","2011-08-08","2011-08-15","2011-08-22","2011-08-29","2011-09-05","2011-09-12","2011-09-19","2011-09-26","2011-10-03","2011-10-10","2011-10-17","2011-10-24","2011-10-31","2011-11-07","2011-11-14","2011-11-21","2011-11-28","2011-12-05","2011-12-12","2011-12-19","2011-12-26","2012-01-02","2012-01-09","2012-01-16","2012-01-23","2012-01-30","2012-02-06","2012-02-13","2012-02-20","2012-02-27","2012-03-05","2012-03-12","2012-03-19","2012-03-26","2012-04-02","2012-04-09","2012-04-16","2012-04-23","2012-04-30","2012-05-07","2012-05-14","2012-05-21","2012-05-28","2012-06-04","2012-06-11","2012-06-18","2012-06-25","2012-07-02","2012-07-09","2012-07-16","2012-07-23","2012-07-30","2012-08-06","2012-08-13","2012-08-20","2012-08-27","2012-09-03","2012-09-10","2012-09-17","2012-09-24","2012-10-01","2012-10-08","2012-10-15","2012-10-22","2012-10-29","2012-11-05","2012-11-12","2012-11-19","2012-11-26","2012-12-03","2012-12-10","2012-12-17","2012-12-24","2012-12-31","2013-01-07","2013-01-14","2013-01-21","2013-01-28","2013-02-04","2013-02-11","2013-02-18","2013-02-25","2013-03-04","2013-03-11","2013-03-18","2013-03-25","2013-04-01","2013-04-08","2013-04-15","2013-04-22","2013-04-29","2013-05-06","2013-05-13","2013-05-20","2013-05-27","2013-06-03","2013-06-10","2013-06-17","2013-06-24","2013-07-01","2013-07-08","2013-07-15","2013-07-22","2013-07-29","2013-08-05","2013-08-12","2013-08-19","2013-08-26","2013-09-02","2013-09-09","2013-09-16","2013-09-23","2013-09-30","2013-10-07","2013-10-14","2013-10-21","2013-10-28","2013-11-04","2013-11-11","2013-11-18","2013-11-25","2013-12-02","2013-12-09","2013-12-16","2013-12-23","2013-12-30","2014-01-06","2014-01-13","2014-01-20","2014-01-27","2014-02-03","2014-02-10","2014-02-17","2014-02-24","2014-03-03","2014-03-10","2014-03-17","2014-03-24","2014-03-31","2014-04-07","2014-04-14","2014-04-21","2014-04-28","2014-05-05","2014-05-12","2014-05-19","2014-05-26","2014-06-02","2014-06-09","2014-06-16","2014-06-23","2014-06-30","2014-07-07","2014-07-14","2014-07-21","2014-07-28","2014-08-04","2014-08-11","2014-08-18","2014-08-25","2014-09-01","2014-09-08","2014-09-15","2014-09-22","2014-09-29","2014-10-06","2014-10-13","2014-10-20","2014-10-27","2014-11-03","2014-11-10","2014-11-17","2014-11-24","2014-12-01","2014-12-08","2014-12-15","2014-12-22","2014-12-29","2015-01-05","2015-01-12","2015-01-19","2015-01-26","2015-02-02","2015-02-09","2015-02-16","2015-02-23","2015-03-02","2015-03-09","2015-03-16","2015-03-23","2015-03-30","2015-04-06","2015-04-13","2015-04-20","2015-04-27","2015-05-04","2015-05-11","2015-05-18","2015-05-25","2015-06-01","2015-06-08","2015-06-15","2015-06-22","2015-06-29","2015-07-06","2015-07-13","2015-07-20","2015-07-27","2015-08-03","2015-08-10","2015-08-17","2015-08-24","2015-08-31","2015-09-07","2015-09-14","2015-09-21","2015-09-28","2015-10-05","2015-10-12","2015-10-19","2015-10-26","2015-11-02","2015-11-09","2015-11-16","2015-11-23","2015-11-30","2015-12-07","2015-12-14","2015-12-21","2015-12-28","2016-01-04","2016-01-11","2016-01-18","2016-01-25","2016-02-01","2016-02-08","2016-02-15","2016-02-22","2016-02-29","2016-03-07","2016-03-14","2016-03-21","2016-03-28","2016-04-04","2016-04-11","2016-04-18","2016-04-25","2016-05-02","2016-05-09","2016-05-16","2016-05-23","2016-05-30","2016-06-06","2016-06-13","2016-06-20","2016-06-27","2016-07-04","2016-07-11","2016-07-18","2016-07-25","2016-08-01","2016-08-08","2016-08-15","2016-08-22","2016-08-29","2016-09-05","2016-09-12","2016-09-19","2016-09-26","2016-10-03","2016-10-10","2016-10-17","2016-10-24","2016-10-31","2016-11-07","2016-11-14","2016-11-21","2016-11-28","2016-12-05","2016-12-12","2016-12-19","2016-12-26","2017-01-02","2017-01-09","2017-01-16","2017-01-23","2017-01-30","2017-02-06","2017-02-13","2017-02-20","2017-02-27","2017-03-06","2017-03-13","2017-03-20","2017-03-27","2017-04-03","2017-04-10","2017-04-17","2017-04-24","2017-05-01","2017-05-08","2017-05-15","2017-05-22","2017-05-29","2017-06-05","2017-06-12","2017-06-19","2017-06-26","2017-07-03","2017-07-10","2017-07-17","2017-07-24","2017-07-31","2017-08-07","2017-08-14","2017-08-21","2017-08-28","2017-09-04","2017-09-11","2017-09-18","2017-09-25","2017-10-02","2017-10-09","2017-10-16","2017-10-23","2017-10-30","2017-11-06","2017-11-13","2017-11-20","2017-11-27","2017-12-04","2017-12-11","2017-12-18","2017-12-25","2018-01-01","2018-01-08","2018-01-15","2018-01-22","2018-01-29","2018-02-05","2018-02-12","2018-02-19","2018-02-26","2018-03-05","2018-03-12","2018-03-19","2018-03-26","2018-04-02","2018-04-09","2018-04-16","2018-04-23","2018-04-30","2018-05-07","2018-05-14","2018-05-21","2018-05-28","2018-06-04","2018-06-11","2018-06-18","2018-06-25","2018-07-02","2018-07-09","2018-07-16","2018-07-23","2018-07-30","2018-08-06","2018-08-13","2018-08-20","2018-08-27","2018-09-03","2018-09-10","2018-09-17","2018-09-24","2018-10-01","2018-10-08","2018-10-15","2018-10-22","2018-10-29","2018-11-05","2018-11-12","2018-11-19","2018-11-26","2018-12-03","2018-12-10","2018-12-17","2018-12-24","2018-12-31","2019-01-07","2019-01-14","2019-01-21","2019-01-28","2019-02-04","2019-02-11","2019-02-18","2019-02-25","2019-03-04","2019-03-11","2019-03-18","2019-03-25","2019-04-01","2019-04-08","2019-04-15","2019-04-22","2019-04-29","2019-05-06","2019-05-13","2019-05-20","2019-05-27","2019-06-03","2019-06-10","2019-06-17","2019-06-24","2019-07-01","2019-07-08","2019-07-15","2019-07-22","2019-07-29","2019-08-05","2019-08-12","2019-08-19","2019-08-26","2019-09-02","2019-09-09","2019-09-16","2019-09-23","2019-09-30","2019-10-07","2019-10-14","2019-10-21","2019-10-28","2019-11-04","2019-11-11","2019-11-18","2019-11-25","2019-12-02","2019-12-09","2019-12-16","2019-12-23","2019-12-30","2020-01-06","2020-01-13","2020-01-20","2020-01-27","2020-02-03","2020-02-10","2020-02-17","2020-02-24","2020-03-02","2020-03-09","2020-03-16","2020-03-23","2020-03-30","2020-04-06","2020-04-13","2020-04-20","2020-04-27","2020-05-04","2020-05-11","2020-05-18","2020-05-25","2020-06-01","2020-06-08","2020-06-15","2020-06-22","2020-06-29","2020-07-06","2020-07-13","2020-07-20","2020-07-27","2020-08-03","2020-08-10","2020-08-17","2020-08-24","2020-08-31","2020-09-07","2020-09-14","2020-09-21","2020-09-28","2020-10-05","2020-10-12","2020-10-19","2020-10-26","2020-11-02","2020-11-09","2020-11-16","2020-11-23","2020-11-30","2020-12-07","2020-12-14","2020-12-21","2020-12-28","2021-01-04","2021-01-11","2021-01-18","2021-01-25","2021-02-01","2021-02-08","2021-02-15","2021-02-22","2021-03-01","2021-03-08","2021-03-15","2021-03-22","2021-03-29","2021-04-05","2021-04-12","2021-04-19","2021-04-26","2021-05-03","2021-05-10","2021-05-17","2021-05-24","2021-05-31","2021-06-07","2021-06-14","2021-06-21","2021-06-28","2021-07-05","2021-07-12","2021-07-19","2021-07-26","2021-08-02","2021-08-09","2021-08-16","2021-08-23","2021-08-30","2021-09-06","2021-09-13","2021-09-20","2021-09-27","2021-10-04","2021-10-11","2021-10-18","2021-10-25","2021-11-01","2021-11-08","2021-11-15","2021-11-22","2021-11-29","2021-12-06","2021-12-13","2021-12-20","2021-12-27","2022-01-03","2022-01-10","2022-01-17","2022-01-24","2022-01-31","2022-02-07","2022-02-14","2022-02-21","2022-02-28","2022-03-07","2022-03-14","2022-03-21","2022-03-28","2022-04-04","2022-04-11","2022-04-18","2022-04-25","2022-05-02","2022-05-09","2022-05-16","2022-05-23","2022-05-30","2022-06-06","2022-06-13","2022-06-20","2022-06-27","2022-07-04","2022-07-11","2022-07-18","2022-07-25","2022-08-01","2022-08-08","2022-08-15","2022-08-22","2022-08-29","2022-09-05","2022-09-12","2022-09-19","2022-09-26","2022-10-03","2022-10-10","2022-10-17","2022-10-24","2022-10-31","2022-11-07","2022-11-14","2022-11-21","2022-11-28","2022-12-05","2022-12-12","2022-12-19","2022-12-26","2023-01-02","2023-01-09","2023-01-16","2023-01-23","2023-01-30","2023-02-06","2023-02-13","2023-02-20","2023-02-27","2023-03-06","2023-03-13","2023-03-20","2023-03-27","2023-04-03","2023-04-10","2023-04-17","2023-04-24","2023-05-01","2023-05-08","2023-05-15","2023-05-22","2023-05-29","2023-06-05","2023-06-12","2023-06-19","2023-06-26","2023-07-03","2023-07-10","2023-07-17","2023-07-24","2023-07-31","2023-08-07","2023-08-14","2023-08-21","2023-08-28","2023-09-04","2023-09-11","2023-09-18","2023-09-25","2023-10-02","2023-10-09","2023-10-16","2023-10-23","2023-10-30","2023-11-06","2023-11-13","2023-11-20","2023-11-27","2023-12-04","2023-12-11","2023-12-18","2023-12-25","2024-01-01","2024-01-08","2024-01-15","2024-01-22","2024-01-29","2024-02-05","2024-02-12","2024-02-19","2024-02-26","2024-03-04","2024-03-11","2024-03-18","2024-03-25","2024-04-01","2024-04-08","2024-04-15","2024-04-22","2024-04-29","2024-05-06","2024-05-13","2024-05-20","2024-05-27","2024-06-03","2024-06-10","2024-06-17","2024-06-24","2024-07-01","2024-07-08","2024-07-15","2024-07-22","2024-07-29","2024-08-05","2024-08-12","2024-08-19","2024-08-26","2024-09-02","2024-09-09","2024-09-16","2024-09-23","2024-09-30","2024-10-07","2024-10-14","2024-10-21","2024-10-28","2024-11-04","2024-11-11","2024-11-18","2024-11-25","2024-12-02","2024-12-09","2024-12-16","2024-12-23","2024-12-30","2025-01-06","2025-01-13","2025-01-20","2025-01-27","2025-02-03","2025-02-10","2025-02-17","2025-02-24","2025-03-03","2025-03-10","2025-03-17","2025-03-24","2025-03-31","2025-04-07","2025-04-14","2025-04-21","2025-04-28","2025-05-05","2025-05-12","2025-05-19","2025-05-26","2025-06-02","2025-06-09","2025-06-16","2025-06-23","2025-06-30","2025-07-07","2025-07-14","2025-07-21","2025-07-28","2025-08-04","2025-08-11","2025-08-18","2025-08-25","2025-09-01","2025-09-08","2025-09-15","2025-09-22","2025-09-29","2025-10-06","2025-10-13","2025-10-20","2025-10-27","2025-11-03","2025-11-10","2025-11-17","2025-11-24","2025-12-01","2025-12-08","2025-12-15","2025-12-22","2025-12-29","2026-01-05","2026-01-12","2026-01-19","2026-01-26","2026-02-02","2026-02-09","2026-02-16","2026-02-23","2026-03-09"],"o":[471.0,481.25,478.4,483.25,472.25,482.25,483.25,497.75,499.75,484.65,484.25,476.25,479.0,487.0,484.75,477.4,475.5,475.85,483.5,490.0,504.25,488.5,487.0,471.25,458.3,451.25,430.0,444.35,403.25,412.35,413.75,419.0,407.3,417.25,432.75,429.25,420.25,417.1,415.25,415.0,416.75,424.3,415.5,386.25,392.0,385.0,388.5,382.35,406.1,416.1,401.0,396.75,394.5,402.0,401.25,392.75,387.5,392.2,389.5,388.5,391.0,376.3,381.25,369.75,374.0,379.85,384.05,377.9,379.1,366.5,348.75,353.5,351.5,335.25,338.5,348.25,347.85,353.75,350.9,359.25,369.0,371.25,362.5,362.25,359.75,362.5,371.5,369.5,372.25,359.5,341.5,330.0,334.25,335.5,343.75,348.25,357.0,366.5,362.5,357.9,358.5,362.1,361.0,349.0,353.25,355.5,348.5,341.25,344.85,352.75,353.0,357.0,365.15,367.25,369.45,371.65,363.8,366.75,385.5,386.25,392.0,378.35,380.0,375.75,348.25,353.5,361.75,359.1,358.0,362.6,366.9,365.85,357.0,357.9,356.0,354.5,362.0,353.05,358.65,357.55,365.1,365.2,358.5,359.5,352.7,358.4,356.5,361.5,361.0,359.25,365.35,347.75,346.4,342.0,350.6,354.35,356.25,364.75,362.25,373.5,375.5,379.0,380.65,386.9,390.5,398.0,389.85,383.0,377.25,385.5,391.5,406.25,405.0,402.35,418.65,393.5,388.5,388.1,383.25,372.65,355.6,361.0,363.25,360.25,364.5,367.1,376.35,369.5,379.25,376.9,376.75,373.0,374.4,384.4,389.5,388.5,399.5,382.0,393.5,380.5,381.6,391.5,392.0,398.25,394.5,391.25,403.45,398.1,411.25,412.65,405.35,395.15,388.5,401.0,395.75,398.5,404.8,398.75,395.25,399.0,408.5,401.6,410.15,402.5,412.75,415.0,422.5,408.25,409.25,413.5,413.5,417.1,420.5,413.5,419.4,416.0,419.0,416.75,420.5,421.4,415.15,411.0,411.25,410.25,401.0,407.0,413.75,416.0,416.0,404.85,413.25,419.25,413.6,413.15,413.0,417.0,412.65,405.5,418.25,419.0,415.0,440.0,452.25,456.75,443.5,442.75,445.5,431.25,427.75,437.0,431.5,439.0,441.75,440.85,434.0,434.5,437.25,429.75,425.75,421.4,415.5,432.25,434.5,428.65,432.0,437.75,421.1,420.25,415.0,412.5,410.25,406.5,404.85,419.25,414.8,412.75,410.0,417.0,408.4,407.0,400.75,417.25,412.85,419.0,419.25,430.25,419.5,424.25,411.85,410.75,411.0,411.25,412.25,406.5,410.5,405.4,401.25,401.6,405.25,402.5,398.25,398.0,401.0,392.75,392.15,391.75,390.5,390.75,391.75,394.0,399.0,403.75,399.25,397.25,401.0,395.5,393.75,388.0,386.5,383.5,383.5,384.75,383.0,383.0,381.0,383.25,385.0,381.75,373.75,368.0,367.75,372.5,370.25,362.75,363.25,359.5,357.75,350.25,351.5,363.75,371.0,390.5,378.0,380.5,375.75,369.5,362.25,368.25,380.5,376.5,374.0,395.25,388.75,392.75,405.5,480.0,435.0,422.0,423.0,419.0,409.0,413.5,426.5,442.0,442.0,426.0,408.0,410.0,422.0,428.5,436.0,429.0,426.0,434.0,422.5,413.0,407.0,392.0,387.0,390.25,384.0,380.5,357.5,354.0,364.0,364.0,364.0,380.0,387.0,389.0,394.0,388.0,378.0,387.0,381.5,401.0,417.75,407.0,420.0,422.0,414.0,407.0,396.0,394.0,403.0,381.0,368.0,358.0,347.0,357.0,349.5,364.0,373.5,395.5,377.0,374.0,378.0,366.0,368.0,362.0,369.0,364.0,356.0,353.0,345.5,343.0,340.5,337.0,336.0,339.0,346.0,353.0,353.0,346.5,348.5,349.0,351.0,362.5,359.5,354.25,350.5,347.0,352.5,370.0,374.5,378.0,376.0,366.0,372.0,368.5,358.0,360.5,365.0,356.0,349.0,354.0,354.0,356.0,360.0,365.0,362.0,351.0,346.0,347.0,351.0,348.0,353.5,344.0,352.0,347.0,351.0,349.0,351.5,366.0,375.0,386.5,415.0,422.0,413.0,430.0,419.0,420.0,451.0,430.0,437.0,436.0,444.0,434.0,445.0,442.0,417.0,432.0,450.0,495.0,521.0,543.0,527.0,477.0,470.0,478.0,490.0,480.0,508.0,488.0,508.0,477.0,532.0,502.0,520.0,550.0,550.0,564.0,547.0,552.0,575.0,555.0,550.0,578.0,578.0,570.0,570.0,568.0,570.0,588.0,612.0,610.0,594.0,584.0,573.0,582.0,583.0,586.0,576.0,598.0,598.0,592.0,586.0,623.0,610.0,603.5,610.0,610.0,626.0,640.0,624.0,610.0,600.0,596.0,602.0,605.0,578.5,595.0,587.0,575.0,558.0,579.0,622.0,616.0,596.0,604.0,605.0,616.0,620.0,593.0,588.0,582.5,574.5,560.0,560.0,552.0,498.0,498.0,473.0,454.0,439.5,461.0,442.0,443.0,474.0,480.0,424.0,440.0,462.0,428.0,431.0,421.0,428.0,430.0,441.0,453.0,470.0,461.0,463.0,477.0,470.0,482.0,477.0,466.0,452.0,475.0,469.0,477.0,512.0,526.0,512.0,515.0,537.0,530.0,543.0,557.0,548.0,522.0,525.0,542.0,538.0,552.0,558.0,560.0,563.0,532.0,524.0,529.0,526.0,528.0,525.0,553.0,555.0,553.0,563.0,549.0,554.0,565.0,563.5,558.0,589.0,588.5,590.0,580.0,583.0,601.0,591.0,592.0,602.0,603.0,594.0,598.0,607.0,619.0,630.0,646.0,690.0,685.0,684.0,670.0,683.0,696.0,694.0,660.0,645.0,615.0,623.0,636.0,626.0,612.0,644.0,654.0,682.0,638.0,659.0,670.0,668.0,665.0,674.0,677.0,685.0,694.0,677.0,690.0,698.0,691.0,707.0,710.0,701.0,705.0,702.0,713.0,728.0,732.0,743.0,738.0,759.0,765.0,762.0,770.0,799.0,829.0,814.0,820.0,826.0,854.0,862.0,857.0,832.0,841.0,850.0,842.0,894.0,896.0,911.5,895.0,904.0,899.0,934.0,937.0,827.0,816.0,775.0,816.0,818.0,844.0,833.5,792.0,811.5,795.0,782.0,824.0,828.0,815.0,827.0,833.0,870.0,844.0,866.0,848.0,836.0,835.0,856.0,852.5,847.0,845.0,857.0,834.0,846.0,878.0,852.0,861.0,873.0,836.0,844.0,867.0,848.0,845.0,855.0,869.0,871.0,867.0,873.0,861.0,870.0,869.0,870.0,873.0,860.0,859.0,861.0,862.0,875.0,867.0,875.0,856.0,860.0,863.0,877.5,869.0,900.0,891.0,872.0,866.0,867.0,887.0,901.0,899.0,908.0,887.0,895.0,908.0,913.0,920.0,910.0,924.0,937.0,935.0,924.0,939.0,930.0,969.0,979.0,997.0,1000.0,1011.0,973.0,968.0,982.0,998.0,1042.0,1041.0,1065.0,1078.0,1026.0,1025.0,1037.0,1053.0,1015.0,1038.0,1059.0,1075.0,1085.0,1101.0,1126.0,1164.0,1190.0,1293.0,1278.0,1292.0,1258.0,1189.0,1140.0,1176.0,1243.0,1222.0,1252.0,1204.0,1227.0,1248.0,1229.0,1227.0,1221.0,1246.0,1212.0,1161.0,1133.0,1150.0,1087.0,1084.0,1074.0,1088.0,1188.0,1202.0,1262.0,1185.0,1160.0,1110.0,1102.0,1122.0,1136.0,1112.0,1149.0,1162.0,1168.0,1166.0,1195.0,1218.0,1242.0,1185.0,1204.0,1225.0,1231.0,1241.0,1257.0,1282.0,1323.0,1281.0,1331.0,1336.0,1309.0,1270.0,1290.0,1290.0,1294.0,1295.0,1272.0,1296.0,1313.0,1332.0,1280.0,1296.0,1273.0,1246.0,1257.0,1271.0,1295.0,1300.0,1335.0,1382.0,1370.0,1425.0,1434.0,1462.0,1453.0,1416.0,1456.0,1484.0,1450.0,1459.0,1476.0,1526.0,1529.0,1529.0,1589.0,1553.0,1664.0,1783.0,1898.0,2088.0,2161.0,2162.0,2044.0,2000.0,1918.0,2032.0,2023.0,1949.0,2030.0,1969.0,1930.0,2045.0,2168.0,2175.0,1993.0,2066.0,2030.0,2060.0,2077.0,1986.0,2021.0,1872.0,1752.0,1631.0,1570.0,1382.0,1423.0,1451.0,1365.0,1200.0,1193.0,1107.0,959.0,986.0,912.0,756.0,838.0,875.0,842.0,834.0,822.0,842.0,834.0,857.0,920.0,935.0,991.0,965.0,959.0,975.0,982.0,1064.0,1083.0,1094.0,1066.0,1057.0,1125.0,1126.0,1153.0,1229.0,1181.0,1155.0,1118.0,1140.0,1108.0,1134.0,1218.0,1235.0,1229.0,1197.0,1184.0,1160.0,1092.0,1174.0,1203.0,1210.0,1252.0,1238.0,1251.0,1249.0,1263.0,1298.0,1313.0,1278.0,1285.0,1333.0,1350.0,1359.0,1334.0,1360.0,1418.0,1469.0,1440.0,1433.0,1437.0,1430.0,1473.0,1496.0,1582.0,1622.0,1543.0,1516.0,1490.0,1517.0,1537.0,1554.0,1598.0,1608.0,1583.0,1610.0,1683.0,1725.0,1679.0,1751.0,1720.0,1696.0,1694.0,1526.0,1544.0,1495.0,1555.0,1605.0,1584.0,1511.0,1524.0,1515.0,1551.0,1586.0,1558.0,1533.0,1506.5,1513.0,1565.0,1548.0,1623.0,1640.0,1668.0,1697.0,1677.0,1696.0,1718.0,1754.0,1675.0,1666.0,1655.0,1729.0,1690.0,1700.0,1750.0,1768.0,1739.0,1806.0,1824.0,1789.0,1842.0,1824.0,1847.0,1807.0,1838.0,1759.0,1740.0,1728.0,1779.0,1804.0,1786.0,1809.0,1858.0,1796.0,1756.0,1757.0,1821.0,1820.0,1820.0,1746.0,1674.0,1720.0,1727.0,1765.0,1787.0,1796.0,1716.0,1793.0,1894.0,1830.0,1881.0,1831.0,1813.0,1542.0,1520.0,1521.0,1574.0,1522.0,1606.0,1627.0,1650.0,1574.0,1557.0,1545.0,1492.0,1416.0,1415.0,1408.0,1405.0,1489.0,1540.0,1601.0,1610.0,1663.0,1648.0,1700.0,1665.0,1684.0,1672.0,1624.0,1636.0,1611.0,1571.0,1573.0,1574.0,1521.0,1451.0,1468.0,1439.0,1462.0,1444.0,1486.0,1436.0,1442.0,1440.0,1423.0,1394.0,1398.0,1396.0,1400.0,1470.0,1523.0,1543.0,1596.0,1695.0,1608.0,1658.0,1679.0,1643.0,1619.0,1545.0,1542.0,1567.0,1561.0,1605.0,1599.0,1618.0,1602.0,1543.0,1523.0,1556.0,1640.0,1671.0,1689.0,1697.0,1712.0,1686.0,1627.0,1576.0,1598.0,1576.0,1580.0,1592.0,1538.0,1449.0,1430.0,1493.0,1490.0,1487.0,1452.0,1448.0,1466.0,1489.0,1448.0,1359.5,1350.0,1335.0,1412.0,1433.0,1428.0,1453.0,1498.0,1515.0,1548.0,1527.0,1495.0,1453.0,1432.0,1422.0,1385.0,1375.0,1439.0,1459.0,1449.0,1434.0,1435.0,1381.0,1364.0,1361.0,1357.0,1337.0,1363.0,1400.0,1434.0,1466.0,1429.0,1386.0,1389.0,1425.0,1429.0,1452.0,1468.0,1475.0,1433.0,1422.0,1434.0,1464.0,1410.0,1428.0,1448.0,1431.0,1479.0,1473.0,1440.0,1452.0,1436.0,1448.0,1481.0,1498.0,1498.0,1492.0,1485.0,1467.0,1470.0,1454.0,1422.0,1424.0,1410.0,1371.0,1331.0,1303.0,1217.0,1264.0,1268.0,1256.0,1237.0,1211.0,1205.0,1220.0,1198.0,1232.0,1220.0,1199.0,1216.0,1210.0,1234.0,1265.0,1251.0,1226.0,1225.0,1211.0,1158.0,1182.0,1156.0,1115.0,1136.0,1129.0,1167.0,1157.0,1167.0,1116.0,1143.0,1136.0,1166.0,1135.0,1107.0,1097.0,1087.0,1072.0,1075.0,1064.0,1029.0,983.0,985.0,977.0,966.0,995.0,998.0,1008.0,990.0,956.0,980.0,926.0,922.0,986.0,1011.0,986.0,974.0,936.0,865.0,847.0,829.0,874.0,843.0,868.0,883.0,878.0,871.0,826.0,841.0,865.0,906.0,936.0,927.0,920.0,997.0,969.0,966.0,945.0,949.0,972.0,982.0,1008.0,1084.0,1070.0,1053.0,1017.0,977.0,986.0,992.0,975.0,991.0,1055.0,1093.0,1085.0,1072.0,1150.0,1143.0,1123.0,1107.0,1076.0,1068.0,1049.0,1027.0,1038.0,1020.0,969.0,938.0,936.0,979.0,989.0,940.0,928.0,916.0,925.0,915.0,924.0,903.0,906.0,971.0,983.0,979.0,978.0,1008.0,1007.0,1001.0,1026.0,988.0,945.0,964.0,978.0,953.0,950.0,983.0,966.0,935.0,915.0,926.0,938.0,946.0,953.0,943.0,923.0,921.0,919.0,901.0,924.0,935.0,935.0,962.0,970.0,980.0,999.0,1011.0,1003.0,968.0,931.0,913.0,917.0,943.0,916.0,919.0,921.0,930.0,944.0,940.0,932.0,890.0,896.0,922.0,937.0,967.0,995.0,1018.0,1009.0,994.0,966.0,1010.0,1005.0,967.0,958.0,942.0,950.0,934.0,918.0,930.0,922.0,907.0,909.0,926.0,880.0,906.0,901.0,904.0,886.0,877.0,842.0,857.0,831.0,827.0,824.0,832.0,818.0,795.0,807.0,787.0,782.0,795.0,826.0,813.0,815.0,844.0,833.0,832.0,869.0,851.0,844.0,846.0,811.0,787.0,784.0,792.0,794.0,829.0,801.0,798.0,811.0,819.0,791.0,806.0,850.0,845.0,813.0,832.0,850.0,848.0,911.0,889.0,894.0,895.0,877.0,853.0,819.0,809.0,797.0,799.0,799.0,810.0,833.0,813.0,839.0,849.0,867.0,852.0,855.0,844.0,856.0,936.0,947.0,953.0,955.0,925.0,875.0,891.0,893.0,928.0,954.0,884.0,882.0,893.0,895.0,890.0,932.0,922.0,953.0,986.0,968.0,1025.0,993.0,952.0,970.0,968.0,974.0,874.0,873.0,713.0,618.0,721.0,732.0,768.0,781.0,765.0,761.0,767.0,816.0,837.0,836.0,832.0,805.0,809.0,812.0,819.0,838.0,842.0,941.0,906.0,972.0,955.0,926.0,950.0,906.0,940.0,925.0,853.0,881.0,888.0,872.0,891.0,858.0,904.0,907.0,950.0,963.0,1028.0,1016.0,1016.0,1041.0,1101.0,1043.0,1079.0,1106.0,1116.0,1149.0,1284.0,1272.0,1206.0,1127.0,1217.0,1172.0,1172.0,1206.0,1186.0,1219.0,1236.0,1238.0,1265.0,1231.0,1164.0,1187.0,1165.0,1148.0,1040.0,1106.0,1102.0,1095.0,1086.0,1060.0,1053.0,976.0,1012.0,1017.0,1010.0,1029.0,954.0,928.0,986.0,955.0,1034.0,1049.0,1044.0,1034.0,1037.0,1077.0,1038.0,972.0,934.0,942.0,924.0,971.0,963.0,961.0,971.0,1036.0,1015.0,1014.0,1027.0,1080.0,1063.0,1149.0,1045.0,1029.0,991.0,991.0,995.0,1023.0,925.0,940.0,949.0,938.0,969.0,958.0,1031.0,946.0,942.0,915.0,886.0,885.0,867.0,875.0,908.0,932.0,943.0,882.0,865.0,842.0,892.0,925.0,860.0,865.0,899.0,910.0,926.0,932.0,972.0,1023.0,966.0,989.0,1019.0,1020.0,1002.0,1020.0,1086.0,1098.0,1061.0,1045.0,1008.0,976.0,939.0,923.0,918.0,970.0,968.0,971.0,966.0,987.0,1007.0,1048.0,1106.0,1051.0,1072.0,1063.0,1074.0,1034.0,1006.0,1008.0,983.0,934.0,898.0,912.0,971.0,964.0,930.0,928.0,916.0,909.0,968.0,959.0,904.0,933.0,921.0,906.0,888.0,885.0,897.0,917.0,932.0,852.0,903.0,936.0,928.0,921.0,950.0,984.0,995.0,954.0,917.0,896.0,912.0,895.0,875.0,910.0,893.0,893.0,927.0,923.0,905.0,912.0,937.0,967.0,927.0,922.0,952.0,999.0,1082.0,1048.0,1030.0,971.0,952.0,1005.0,992.0,1013.0,998.0,961.0,946.0,929.0,940.0,952.0,963.0,930.0,937.0,996.0,956.0,990.0,986.0,986.0,1017.0,1018.0,999.0,977.0,956.0,952.0,942.0,950.0,925.0,940.0,921.0,947.0,960.0,939.0,945.0,968.0,986.0,985.0,968.0,952.0,975.0,1000.0,979.0,995.0,918.0,955.0,971.0,979.0,980.0,987.0,995.0,1077.0,1051.0,1206.0,1248.0,1298.0,1358.0,1363.0,1402.0,1450.0,1407.0,1320.0,1319.0,1336.0,1339.0,1396.0,1400.0,1399.0,1423.0,1606.0,1612.0,1651.0,1585.0,1594.0,1602.0,1577.0,1551.0,1520.0,1677.0,1658.0,1770.0,2059.0,2303.0,2221.0,2377.0,2362.0,2860.0,2063.0,2069.0,2048.2,2150.46,2185.18],"h":[481.75,481.25,481.75,485.25,482.95,482.25,488.9,503.25,499.75,491.75,487.25,479.1,482.5,488.75,484.75,477.4,482.1,490.5,485.25,504.25,504.5,488.5,487.0,471.25,462.0,462.5,445.6,448.0,407.25,426.15,435.75,426.25,423.0,421.25,432.75,431.9,423.6,424.0,415.25,416.25,419.25,424.3,415.5,394.75,392.0,387.1,389.25,401.75,407.0,416.1,401.45,396.75,403.25,406.0,404.5,393.45,394.25,393.75,392.9,392.75,392.65,382.5,381.75,375.35,376.75,381.65,384.05,381.0,379.1,366.5,354.6,353.5,351.5,341.5,344.0,349.6,354.75,358.3,360.25,365.25,369.35,371.25,363.0,364.5,363.65,371.6,371.85,370.25,372.25,359.5,341.5,337.0,341.0,343.0,345.85,353.4,367.5,367.5,363.0,359.85,363.75,363.25,361.0,353.35,360.25,355.5,348.5,343.25,347.75,352.75,358.6,363.0,370.05,376.75,372.4,371.65,366.85,386.1,385.5,392.1,392.0,385.5,380.0,375.75,351.5,356.15,361.75,362.4,367.25,368.1,367.5,365.85,357.25,358.75,356.5,362.25,362.0,355.5,358.65,363.75,368.75,365.5,360.6,359.5,361.5,358.4,363.0,364.5,361.1,368.5,368.25,347.75,346.4,350.9,350.6,357.0,365.8,364.75,368.25,373.5,386.5,384.75,389.25,392.0,396.55,398.0,389.85,383.0,381.5,395.75,408.75,407.35,405.0,414.5,418.65,393.5,388.5,388.1,383.25,372.65,359.25,362.75,363.25,362.75,370.1,375.35,376.35,378.25,379.25,377.75,378.0,373.0,379.5,388.75,389.5,393.5,399.5,389.35,393.5,386.75,395.5,391.75,403.0,398.25,394.5,405.5,403.5,408.25,415.25,412.65,405.35,395.15,393.75,401.0,398.25,401.75,407.0,402.25,399.65,406.0,408.75,405.0,410.15,410.0,413.9,423.0,423.0,412.5,413.5,413.5,415.75,421.15,420.5,420.5,419.4,420.75,419.0,425.25,424.0,421.4,415.15,415.75,411.5,410.25,404.0,411.0,417.75,417.75,416.0,418.0,418.25,419.25,415.75,414.35,415.75,417.25,412.65,421.0,422.75,419.0,431.6,457.5,452.25,461.25,446.5,459.0,445.5,432.1,437.75,437.0,435.75,442.5,442.75,442.25,434.0,436.5,440.25,432.5,425.75,422.75,430.0,432.25,434.5,433.25,440.85,439.0,424.6,420.25,416.85,413.35,412.25,409.5,422.25,419.25,416.5,415.3,414.0,417.0,410.0,407.0,413.75,417.35,419.75,423.5,433.0,431.0,422.75,424.25,412.85,410.75,413.75,412.5,414.5,406.75,410.5,405.4,406.0,404.5,406.25,402.75,398.6,400.25,401.0,392.75,393.4,391.75,391.75,391.25,395.0,398.75,403.5,403.75,400.5,399.5,401.0,396.0,393.75,390.0,388.25,384.25,387.25,384.75,387.5,383.0,382.25,388.25,385.0,381.75,373.75,369.25,371.5,372.5,370.25,363.0,363.25,359.5,360.5,351.75,368.5,369.25,398.75,390.5,382.75,380.5,376.5,369.5,370.0,378.75,380.5,376.5,382.25,395.5,396.0,417.5,495.0,480.0,435.0,422.0,434.0,419.0,409.0,422.0,436.5,460.0,442.0,426.0,410.0,418.75,427.0,428.5,443.0,435.0,434.0,439.0,424.0,413.0,408.0,394.0,396.0,390.25,388.0,380.5,357.5,359.0,366.0,364.0,385.75,386.0,388.5,397.0,394.0,388.0,385.25,387.0,393.5,414.0,423.0,415.0,420.5,428.0,422.0,407.0,399.0,403.0,403.0,381.0,368.0,362.5,363.0,357.0,370.0,379.0,392.0,395.5,378.0,379.5,378.0,372.0,368.0,368.5,369.0,365.0,359.0,354.0,352.0,347.0,340.5,341.0,344.0,351.0,358.0,354.5,353.0,353.0,356.0,349.0,361.5,362.5,361.5,354.25,352.0,359.0,362.0,380.0,384.0,378.0,377.0,369.5,374.0,368.5,358.0,361.0,365.0,356.0,356.0,357.0,357.5,365.0,367.5,366.0,362.0,351.0,352.5,353.0,351.0,353.75,353.5,352.0,352.0,355.0,351.0,350.5,359.0,376.5,382.5,429.0,429.0,436.0,430.0,430.0,427.0,454.0,456.0,450.0,442.0,440.0,449.0,446.0,448.0,442.0,427.0,444.0,495.0,511.0,545.0,573.0,527.0,486.0,478.0,487.0,496.0,483.0,521.0,504.0,508.0,510.0,532.0,514.0,530.0,563.0,552.0,566.0,558.0,575.0,580.0,555.0,560.0,583.0,578.0,612.0,580.0,574.0,577.0,595.0,612.0,610.0,594.0,584.0,580.0,587.0,588.0,586.0,600.0,602.0,598.0,594.0,606.0,623.0,625.0,610.0,619.0,638.0,645.0,640.0,624.0,610.0,608.0,598.0,607.0,613.0,600.0,595.0,587.0,581.0,582.0,592.0,630.0,616.0,622.0,606.0,613.0,616.0,620.0,593.0,588.0,582.5,574.5,560.0,560.0,552.0,506.0,498.0,473.0,454.0,458.0,465.0,443.0,473.0,495.0,480.0,446.0,440.0,462.0,428.0,431.0,421.0,430.0,441.0,441.0,467.0,470.0,461.0,477.0,481.0,480.0,482.0,477.0,466.0,474.0,479.0,475.0,494.0,520.0,526.0,520.0,516.0,537.0,536.0,558.0,557.0,548.0,528.0,539.0,546.0,548.0,564.0,558.0,567.0,563.0,532.0,529.0,531.0,529.0,530.0,538.0,558.0,555.0,574.0,563.0,552.0,570.0,568.0,569.0,593.0,598.0,588.5,590.0,588.0,602.0,601.0,591.0,597.0,604.0,607.0,594.0,606.0,624.0,623.0,650.0,671.0,703.0,693.0,684.0,682.0,699.0,705.0,694.0,660.0,645.0,625.0,628.0,638.0,626.0,640.0,663.0,680.0,682.0,669.0,663.0,674.0,670.0,676.0,675.0,687.0,695.0,700.0,684.0,698.0,704.0,709.0,714.0,710.0,702.0,710.0,718.0,732.0,730.0,740.0,759.0,758.0,771.5,769.0,766.0,796.0,820.0,842.0,814.0,820.0,852.0,868.0,866.0,858.0,832.0,851.0,860.0,873.0,894.0,910.0,911.5,923.0,910.0,899.0,934.0,937.0,848.0,822.0,794.0,816.0,843.0,844.0,836.0,795.0,811.5,795.0,813.0,824.0,836.0,816.0,833.0,847.0,871.0,868.0,873.0,850.0,843.0,851.5,869.0,852.5,847.0,854.0,857.0,845.0,868.0,878.0,865.0,875.75,873.0,845.0,846.0,867.0,848.0,862.0,869.0,869.0,881.0,868.0,873.0,871.0,870.0,876.0,883.0,873.0,863.0,865.0,864.0,872.0,878.0,875.0,881.0,867.0,866.0,876.0,878.0,889.0,900.0,891.0,872.0,873.0,884.0,896.0,914.0,924.0,908.0,897.0,909.0,912.0,915.0,930.0,929.0,932.0,941.0,935.0,944.0,939.0,957.0,983.0,984.0,1001.0,1000.0,1011.0,973.0,968.0,995.0,1029.0,1042.0,1061.0,1080.0,1078.0,1026.0,1028.0,1063.0,1053.0,1033.0,1042.0,1082.0,1082.0,1090.0,1130.0,1149.0,1184.0,1335.0,1335.0,1322.0,1292.0,1258.0,1189.0,1198.0,1212.0,1243.0,1253.0,1252.0,1231.0,1247.0,1251.0,1240.0,1233.0,1244.0,1263.0,1212.0,1162.0,1150.0,1150.0,1087.0,1094.0,1076.0,1207.0,1227.0,1202.0,1390.0,1185.0,1160.0,1112.0,1122.0,1122.0,1136.0,1141.0,1158.0,1172.0,1183.0,1200.0,1216.0,1225.0,1253.0,1203.0,1217.0,1236.0,1246.0,1250.0,1270.0,1310.0,1325.0,1300.0,1336.0,1336.0,1309.0,1287.0,1302.0,1292.0,1294.0,1295.0,1287.0,1313.0,1324.0,1332.0,1292.0,1296.0,1273.0,1246.0,1269.0,1287.0,1305.0,1336.0,1361.0,1382.0,1404.0,1454.0,1453.0,1462.0,1476.0,1435.0,1470.0,1484.0,1472.0,1478.0,1513.0,1534.0,1546.0,1565.0,1589.0,1649.0,1741.0,1852.0,2025.0,2170.0,2161.0,2276.0,2100.0,2000.0,2037.0,2032.0,2031.0,2065.0,2030.0,1969.0,2082.0,2092.0,2192.0,2175.0,2045.0,2066.0,2080.0,2075.0,2077.0,2040.0,2021.0,1877.0,1766.0,1631.0,1570.0,1455.0,1475.0,1451.0,1365.0,1200.0,1225.0,1107.0,1019.0,1031.0,912.0,856.0,865.0,875.0,842.0,868.0,822.0,842.0,874.0,857.0,934.0,991.0,991.0,965.0,975.0,982.0,1084.0,1113.0,1083.0,1094.0,1066.0,1118.0,1144.0,1153.0,1205.0,1229.0,1181.0,1155.0,1164.0,1141.0,1152.0,1163.0,1293.0,1270.0,1229.0,1208.0,1196.0,1160.0,1169.0,1180.0,1212.0,1286.0,1271.0,1250.0,1251.0,1249.0,1287.0,1343.0,1333.0,1294.0,1336.0,1358.0,1369.0,1359.0,1362.0,1367.0,1459.0,1469.0,1500.0,1455.0,1448.0,1456.0,1473.0,1548.0,1613.0,1641.0,1543.0,1586.0,1516.0,1548.0,1540.0,1581.0,1619.0,1638.0,1607.0,1659.0,1722.0,1730.0,1746.0,1751.0,1720.0,1731.0,1694.0,1569.0,1563.0,1542.0,1577.0,1605.0,1584.0,1526.0,1529.0,1545.0,1558.0,1590.0,1558.0,1544.0,1534.0,1555.0,1565.0,1619.0,1644.0,1669.0,1720.0,1713.0,1695.0,1698.0,1760.0,1780.0,1675.0,1666.0,1721.0,1729.0,1711.0,1729.0,1760.0,1768.0,1810.0,1846.0,1824.0,1833.0,1863.0,1840.0,1847.0,1846.0,1838.0,1759.0,1753.0,1779.0,1810.0,1804.0,1814.0,1820.0,1858.0,1803.0,1773.0,1781.0,1821.0,1842.0,1820.0,1748.0,1724.0,1745.0,1770.0,1785.0,1810.0,1796.0,1790.0,1871.0,1899.0,1858.0,1881.0,1831.0,1813.0,1582.0,1521.0,1546.0,1574.0,1645.0,1640.0,1661.0,1650.0,1574.0,1559.0,1545.0,1493.0,1447.0,1415.0,1431.0,1500.0,1537.0,1613.0,1631.0,1665.0,1663.0,1728.0,1727.0,1665.0,1698.0,1672.0,1661.0,1658.0,1611.0,1592.0,1573.0,1574.0,1521.0,1458.0,1468.0,1439.0,1462.0,1492.0,1486.0,1439.0,1487.0,1440.0,1428.0,1417.0,1419.0,1414.0,1456.0,1549.0,1524.0,1580.0,1694.0,1695.0,1661.0,1714.0,1700.0,1666.0,1619.0,1573.0,1565.0,1594.0,1581.0,1619.0,1599.0,1640.0,1610.0,1543.0,1569.0,1626.0,1697.0,1694.0,1689.0,1730.0,1726.0,1695.0,1627.0,1602.0,1598.0,1582.0,1583.0,1592.0,1544.0,1449.0,1477.0,1513.0,1502.0,1504.0,1468.0,1471.0,1536.0,1493.0,1448.0,1359.5,1380.0,1401.0,1419.0,1445.0,1442.0,1487.0,1519.0,1539.0,1548.0,1529.0,1495.0,1475.0,1432.0,1422.0,1407.0,1432.0,1443.0,1467.0,1466.0,1450.0,1435.0,1386.0,1369.0,1386.0,1361.0,1367.0,1407.0,1421.0,1435.0,1466.0,1429.0,1386.0,1422.0,1425.0,1444.0,1481.0,1481.0,1475.0,1433.0,1440.0,1456.0,1464.0,1412.0,1428.0,1452.0,1473.5,1484.0,1473.0,1453.0,1476.0,1462.0,1474.0,1509.0,1511.0,1498.0,1492.0,1488.0,1481.0,1472.0,1454.0,1425.0,1424.0,1410.0,1371.0,1343.0,1307.0,1284.0,1272.0,1273.0,1270.0,1237.0,1211.0,1216.0,1221.0,1236.0,1250.0,1220.0,1199.0,1216.0,1221.0,1257.0,1281.0,1263.0,1255.0,1225.0,1211.0,1189.0,1186.0,1156.0,1122.0,1157.0,1155.0,1172.0,1166.0,1167.0,1154.0,1143.0,1156.0,1166.0,1135.0,1111.0,1114.0,1092.0,1077.0,1086.0,1064.0,1029.0,993.0,987.0,977.0,994.0,1026.0,999.0,1012.0,1002.0,977.0,980.0,926.0,973.0,1003.0,1013.0,997.0,974.0,936.0,867.0,851.0,852.0,874.0,865.0,878.0,888.0,890.0,871.0,830.0,884.0,911.0,952.0,942.0,940.0,959.0,1002.0,983.0,985.0,982.0,956.0,997.0,1031.0,1060.0,1084.0,1070.0,1053.0,1017.0,977.0,1007.0,992.0,986.0,1033.0,1086.0,1100.0,1094.0,1149.0,1165.0,1177.0,1126.0,1107.0,1076.0,1095.0,1055.0,1055.0,1040.0,1020.0,969.0,947.0,966.0,995.0,1008.0,942.0,946.0,923.0,947.0,937.0,924.0,907.0,968.0,990.0,994.0,990.0,1003.0,1020.0,1014.0,1015.0,1027.0,988.0,962.0,967.0,978.0,967.0,973.0,983.0,966.0,935.0,923.0,939.0,953.0,946.0,960.0,943.0,931.0,923.0,919.0,917.0,928.0,935.0,967.0,982.0,983.0,980.0,999.0,1014.0,1003.0,968.0,935.0,915.0,936.0,943.0,923.0,929.0,937.0,933.0,944.0,949.0,932.0,892.0,918.0,927.0,963.0,995.0,1012.0,1020.0,1009.0,996.0,1011.0,1010.0,1005.0,967.0,969.0,956.0,957.0,934.0,933.0,950.0,923.0,907.0,927.0,926.0,912.0,912.0,907.0,906.0,886.0,877.0,842.0,857.0,831.0,838.0,830.0,834.0,818.0,800.0,807.0,793.0,807.0,838.0,830.0,829.0,839.0,844.0,833.0,865.0,876.0,851.0,849.0,846.0,811.0,800.0,793.0,796.0,801.0,829.0,810.0,803.0,822.0,820.0,791.0,830.0,874.0,845.0,838.0,869.0,862.0,908.0,911.0,889.0,894.0,898.0,877.0,855.0,819.0,809.0,823.0,818.0,815.0,816.0,836.0,830.0,857.0,881.0,881.0,863.0,865.0,860.0,935.0,982.0,955.0,953.0,957.0,925.0,902.0,892.0,928.0,932.0,954.0,884.0,912.0,901.0,908.0,940.0,932.0,950.0,988.0,986.0,1033.0,1025.0,993.0,980.0,972.0,1018.0,974.0,877.0,880.0,713.0,745.0,727.0,745.0,794.0,781.0,780.0,761.0,774.0,850.0,840.0,846.0,839.0,830.0,826.0,825.0,858.0,838.0,928.0,945.0,977.0,972.0,972.0,933.0,950.0,930.0,981.0,925.0,899.0,889.0,888.0,892.0,891.0,901.0,904.0,951.0,964.0,1048.0,1028.0,1050.0,1021.0,1075.0,1106.0,1109.0,1121.0,1106.0,1116.0,1253.0,1306.0,1272.0,1206.0,1223.0,1217.0,1184.0,1189.0,1238.0,1196.0,1219.0,1241.0,1250.0,1265.0,1237.0,1202.0,1187.0,1168.0,1158.0,1100.0,1106.0,1110.0,1144.0,1087.0,1077.0,1054.0,1020.0,1024.0,1017.0,1014.0,1029.0,956.0,1010.0,986.0,992.0,1057.0,1063.0,1050.0,1058.0,1084.0,1106.0,1038.0,972.0,963.0,942.0,973.0,971.0,982.0,979.0,1046.0,1048.0,1039.0,1036.0,1092.0,1119.0,1089.0,1149.0,1045.0,1030.0,991.0,991.0,995.0,1023.0,932.0,986.0,986.0,961.0,969.0,975.0,1031.0,950.0,946.0,925.0,886.0,885.0,882.0,898.0,936.0,959.0,943.0,886.0,865.0,892.0,910.0,931.0,877.0,930.0,904.0,918.0,950.0,956.0,1055.0,1027.0,997.0,1041.0,1019.0,1038.0,1005.0,1065.0,1093.0,1098.0,1061.0,1050.0,1028.0,990.0,954.0,953.0,971.0,974.0,990.0,991.0,986.0,1025.0,1046.0,1094.0,1106.0,1070.0,1104.0,1070.0,1074.0,1034.0,1042.0,1008.0,983.0,934.0,922.0,967.0,988.0,974.0,943.0,928.0,916.0,940.0,983.0,959.0,917.0,945.0,921.0,906.0,893.0,908.0,909.0,937.0,932.0,904.0,937.0,938.0,928.0,964.0,970.0,1006.0,995.0,954.0,917.0,911.0,930.0,900.0,901.0,910.0,893.0,922.0,938.0,923.0,907.0,940.0,997.0,967.0,927.0,968.0,995.0,1066.0,1082.0,1055.0,1030.0,971.0,989.0,1005.0,1012.0,1013.0,1016.0,961.0,973.0,932.0,954.0,965.0,963.0,931.0,988.0,996.0,1009.0,1004.0,986.0,1010.0,1037.0,1050.0,999.0,977.0,965.0,952.0,955.0,950.0,934.0,942.0,934.0,968.0,960.0,952.0,977.0,998.0,1008.0,989.0,974.0,976.0,993.0,1011.0,987.0,995.0,945.0,963.0,977.0,991.0,988.0,999.0,1087.0,1091.0,1163.0,1275.0,1294.0,1402.0,1414.0,1373.0,1464.0,1450.0,1407.0,1335.0,1361.0,1346.0,1351.0,1407.0,1400.0,1408.0,1541.0,1606.0,1664.0,1668.0,1655.0,1613.0,1602.0,1627.0,1562.0,1635.0,1677.0,1715.0,1932.0,2295.0,2303.0,2319.0,2401.0,2663.0,2860.0,2283.0,2178.0,2163.5,2320.54,2185.18],"l":[471.0,476.0,478.0,473.6,472.25,476.25,483.25,496.85,490.0,482.25,474.75,473.0,478.75,484.75,469.0,470.9,475.5,475.85,479.65,490.0,500.25,484.5,477.7,455.65,454.5,431.25,430.0,413.25,389.75,412.35,413.75,413.75,407.3,413.85,424.75,427.9,415.75,414.0,411.25,412.0,413.5,413.0,391.75,386.25,379.75,380.0,379.35,382.35,397.0,401.75,394.25,390.0,394.5,401.0,394.75,392.0,387.5,390.0,389.1,388.5,369.5,376.3,373.75,368.25,372.55,378.9,375.25,377.75,363.85,352.85,348.75,340.5,336.35,335.25,338.5,345.8,347.85,348.8,350.9,356.25,365.75,362.75,357.25,358.75,358.75,362.5,367.25,364.5,361.65,334.75,336.0,330.0,332.75,333.7,339.75,346.5,357.0,364.1,358.5,353.8,358.5,359.25,348.0,348.85,353.25,345.85,345.6,341.25,340.75,351.0,352.8,357.0,365.15,367.25,367.25,365.25,363.8,366.75,382.35,382.7,377.9,374.0,374.25,345.65,342.75,349.0,354.65,357.2,358.0,361.15,364.5,355.45,355.0,357.25,353.5,354.5,350.65,353.05,355.25,357.55,362.25,362.75,358.5,355.25,352.7,356.25,356.5,361.5,359.1,359.25,362.0,344.1,339.75,342.0,348.45,353.6,356.25,360.0,362.25,365.75,374.75,374.15,378.75,382.6,385.25,386.25,383.4,378.0,372.65,384.5,391.5,401.25,399.5,402.35,392.35,387.25,385.25,379.25,373.5,356.25,351.5,359.75,357.75,356.65,363.35,367.1,372.15,365.85,376.75,374.25,372.65,366.75,374.4,384.4,385.25,388.5,389.75,382.0,386.85,379.25,381.6,389.5,392.0,389.5,389.25,390.5,398.5,398.1,408.0,406.25,396.9,385.75,388.35,387.75,391.75,397.25,395.25,397.0,395.25,399.0,405.35,398.6,403.0,402.5,411.75,415.0,409.5,406.25,409.25,411.5,412.0,417.1,409.5,413.5,416.0,416.0,414.25,416.75,420.5,414.0,409.25,411.0,410.25,402.5,401.0,407.0,413.75,416.0,403.25,404.85,413.25,415.6,413.6,408.75,413.0,416.4,404.0,405.5,418.25,412.25,415.0,440.0,447.5,447.75,438.75,442.75,433.5,427.5,427.35,431.5,431.5,436.6,441.25,439.75,433.5,433.75,428.25,427.75,418.75,420.25,415.5,426.75,427.85,425.15,432.0,424.5,420.25,412.75,412.5,410.5,409.75,406.5,404.85,414.75,412.0,412.75,410.0,407.25,405.0,398.25,400.75,414.75,412.85,418.0,418.15,423.25,419.5,410.6,408.0,406.35,411.0,410.5,410.0,405.25,406.0,399.25,401.25,400.5,404.25,402.0,397.25,398.0,390.75,390.75,391.75,388.65,387.25,388.25,391.75,394.0,398.5,400.0,399.0,397.25,397.0,393.0,389.5,387.75,383.75,381.5,383.5,383.5,383.0,379.75,379.25,383.25,382.9,374.25,372.0,368.0,367.25,371.0,366.5,359.0,359.0,356.25,350.25,349.75,351.5,363.75,371.0,377.25,378.0,377.25,372.0,363.75,362.25,365.0,374.5,372.25,373.0,389.75,387.0,392.75,404.0,437.0,411.0,414.0,419.5,397.0,403.5,413.5,426.0,426.5,423.0,406.5,405.0,407.5,418.0,421.0,431.0,429.0,423.0,425.5,419.0,398.5,399.5,389.0,386.0,380.0,384.0,362.0,345.5,353.5,362.0,358.0,361.5,373.0,385.0,387.0,387.0,379.0,376.0,382.75,381.5,395.0,412.0,405.0,414.0,408.0,412.0,397.5,393.0,385.0,382.0,364.0,355.25,349.5,347.0,351.0,349.5,364.0,373.5,380.0,377.0,374.0,370.25,365.0,349.0,362.0,360.0,356.0,353.0,348.0,340.0,340.5,335.0,336.0,336.0,338.0,346.0,351.0,345.0,346.0,348.5,346.0,351.0,357.0,351.0,352.5,345.0,347.0,352.5,363.0,374.5,372.0,369.0,364.0,370.5,361.0,356.0,358.0,357.0,349.0,349.0,353.0,354.0,356.0,360.0,362.5,352.5,347.0,346.0,345.5,348.0,348.0,344.0,344.0,349.0,347.0,347.25,348.5,351.5,366.0,374.5,386.5,411.0,422.0,410.0,414.5,415.0,420.0,436.0,430.0,435.0,436.0,440.0,434.0,445.0,416.0,417.0,432.0,450.0,493.0,513.0,535.0,478.0,465.0,470.0,478.0,482.0,477.0,506.0,488.0,488.0,473.0,509.0,502.0,506.0,544.0,548.0,548.0,542.0,552.0,565.0,535.0,548.0,572.0,558.0,570.0,565.0,568.0,570.0,587.0,596.0,584.0,586.0,568.0,568.0,580.0,577.0,576.0,576.0,592.0,588.0,586.0,586.0,599.0,610.0,602.0,610.0,610.0,626.0,610.0,610.0,597.0,597.0,595.0,599.5,599.0,578.5,587.0,575.0,564.0,558.0,578.0,619.0,598.0,596.0,604.0,604.0,612.0,596.0,585.0,574.0,574.0,558.0,553.0,554.0,510.0,496.0,470.0,433.0,422.0,439.5,446.0,442.0,443.0,474.0,430.0,406.0,424.0,433.0,417.0,419.5,416.0,424.0,430.0,436.0,453.0,460.0,453.0,463.0,476.0,470.0,473.0,465.0,449.0,452.0,467.0,469.0,477.0,507.0,508.0,512.0,511.0,525.0,526.0,537.0,552.0,519.0,522.0,525.0,539.0,538.0,549.0,555.0,560.0,541.0,520.0,519.0,525.0,520.0,522.0,525.0,552.0,541.0,553.0,540.0,549.0,547.0,560.5,560.0,558.0,586.0,580.0,578.0,580.0,580.0,590.0,585.0,590.0,594.0,593.0,585.0,598.0,606.0,617.0,630.0,642.0,676.0,677.0,664.0,670.0,683.0,688.0,662.0,625.0,616.0,611.0,623.0,635.0,606.0,612.0,644.0,654.0,643.0,638.0,649.5,662.0,662.0,665.0,665.0,677.0,685.0,677.0,677.0,688.0,696.0,691.0,707.0,697.5,696.0,704.0,702.0,713.0,725.0,732.0,743.0,738.0,759.0,762.0,758.0,770.0,799.0,826.0,805.0,812.0,826.0,849.0,858.0,829.0,823.0,837.0,850.0,842.0,878.0,895.0,897.0,895.0,888.0,886.0,920.0,850.0,783.0,798.0,775.0,802.0,818.0,830.0,795.0,774.0,804.5,778.0,778.0,807.0,816.0,805.0,827.0,833.0,851.5,844.0,866.0,832.0,836.0,835.0,845.0,834.0,830.0,838.0,832.0,828.0,846.0,853.0,852.0,861.0,827.0,835.0,840.0,859.5,843.0,845.0,855.0,863.0,866.0,847.0,856.0,861.0,861.0,867.0,870.0,858.0,860.0,858.0,861.0,862.0,867.0,867.0,866.0,855.0,860.0,863.0,869.0,869.0,882.0,880.0,864.0,866.0,867.0,880.0,901.0,899.0,887.0,887.0,891.0,906.0,908.0,920.0,910.0,914.0,925.0,920.0,924.0,925.0,930.0,968.0,970.0,980.0,994.0,942.0,951.0,964.0,982.0,998.0,1025.0,1041.0,1065.0,1048.0,1002.0,1024.0,1037.0,1012.0,1015.0,1036.0,1059.0,1063.0,1075.0,1101.0,1121.0,1164.0,1190.0,1275.0,1278.0,1227.0,1195.0,1128.0,1140.0,1176.0,1226.0,1222.0,1211.0,1204.0,1227.0,1236.0,1216.0,1223.0,1221.0,1244.0,1161.0,1132.0,1131.0,1080.0,1064.0,1081.0,1065.0,1074.0,1164.0,1155.0,1160.0,1155.0,1121.0,1106.0,1102.0,1117.0,1124.0,1112.0,1139.0,1162.0,1162.0,1166.0,1193.0,1206.0,1225.0,1183.0,1204.0,1225.0,1231.0,1241.0,1257.0,1268.0,1280.0,1281.0,1317.0,1310.0,1282.0,1264.0,1290.0,1278.0,1288.0,1267.0,1272.0,1296.0,1306.0,1313.0,1275.0,1274.0,1238.0,1237.0,1256.0,1271.0,1288.0,1299.0,1335.0,1352.0,1355.0,1415.0,1434.0,1438.0,1452.0,1402.0,1456.0,1420.0,1450.0,1459.0,1476.0,1526.0,1529.0,1529.0,1549.0,1522.0,1664.0,1766.0,1898.0,2080.0,2093.0,2147.0,2024.0,1824.0,1918.0,1938.0,1983.0,1949.0,1932.0,1855.0,1930.0,2010.0,2157.0,1976.0,1990.0,2015.0,2030.0,2023.0,2022.0,1966.0,1872.0,1736.0,1717.0,1550.0,1390.0,1313.0,1423.0,1365.0,1152.0,1083.0,1147.0,962.0,959.0,868.0,768.0,756.0,824.0,831.0,803.0,834.0,803.0,817.0,833.0,855.0,899.0,935.0,915.0,929.0,942.0,964.0,982.0,1064.0,1040.0,1045.0,1045.0,1050.0,1119.0,1125.0,1153.0,1213.0,1159.0,1085.0,1118.0,1105.0,1108.0,1126.0,1209.0,1235.0,1206.0,1165.0,1176.0,1106.0,1092.0,1165.0,1172.0,1210.0,1227.0,1222.0,1234.0,1212.0,1263.0,1298.0,1295.0,1275.0,1285.0,1333.0,1350.0,1315.0,1334.0,1354.0,1418.0,1433.0,1440.0,1413.0,1435.0,1397.0,1464.0,1496.0,1563.0,1556.0,1514.0,1477.0,1489.0,1506.0,1497.0,1549.0,1584.0,1608.0,1583.0,1610.0,1683.0,1708.0,1679.0,1715.0,1661.0,1686.0,1494.0,1492.0,1539.0,1495.0,1553.0,1543.0,1516.0,1503.0,1518.0,1509.0,1540.0,1567.0,1511.0,1517.0,1497.0,1513.0,1552.0,1548.0,1616.0,1612.0,1668.0,1676.0,1661.0,1683.0,1713.0,1705.0,1639.5,1642.0,1651.0,1681.0,1690.0,1700.0,1731.0,1716.0,1739.0,1806.0,1787.0,1789.0,1830.0,1824.0,1772.0,1807.0,1768.0,1696.0,1740.0,1728.0,1779.0,1783.0,1782.0,1807.0,1787.0,1755.0,1756.0,1757.0,1816.0,1818.0,1747.0,1706.0,1674.0,1720.0,1715.0,1765.0,1782.0,1700.0,1716.0,1793.0,1805.0,1830.0,1834.0,1799.0,1695.0,1538.0,1442.0,1518.0,1490.0,1522.0,1581.0,1626.0,1595.0,1535.0,1515.0,1491.0,1398.0,1416.0,1364.0,1408.0,1405.0,1489.0,1540.0,1601.0,1610.0,1612.0,1648.0,1692.0,1620.0,1672.0,1617.0,1624.0,1605.0,1594.0,1571.0,1550.0,1528.0,1467.0,1426.0,1417.0,1396.0,1419.0,1433.0,1434.0,1406.0,1442.0,1412.0,1413.0,1391.0,1392.0,1396.0,1398.0,1470.0,1508.0,1543.0,1596.0,1612.0,1608.0,1658.0,1676.0,1634.0,1551.0,1545.0,1541.0,1558.0,1561.0,1604.0,1580.0,1613.0,1550.0,1530.0,1523.0,1556.0,1640.0,1671.0,1672.0,1697.0,1692.0,1608.0,1565.0,1576.0,1585.0,1560.0,1570.0,1525.0,1524.0,1430.0,1416.0,1477.0,1489.0,1470.0,1452.0,1448.0,1466.0,1450.0,1363.0,1323.0,1331.0,1335.0,1408.0,1433.0,1426.0,1421.0,1491.0,1505.0,1511.0,1481.0,1432.0,1425.0,1411.0,1375.0,1383.0,1368.0,1425.0,1456.0,1449.0,1432.0,1396.0,1361.0,1345.0,1361.0,1325.0,1327.0,1358.0,1400.0,1415.0,1449.0,1383.0,1379.0,1389.0,1413.0,1427.0,1450.0,1458.5,1437.0,1404.0,1422.0,1434.0,1435.0,1400.0,1414.0,1431.0,1431.0,1469.0,1452.0,1421.0,1447.0,1431.0,1448.0,1481.0,1493.0,1481.0,1471.0,1461.0,1455.0,1460.0,1423.0,1421.0,1405.0,1364.0,1347.0,1304.0,1247.0,1217.0,1251.0,1254.0,1232.0,1195.0,1193.0,1198.0,1214.0,1198.0,1232.0,1199.0,1188.0,1207.0,1210.0,1230.0,1265.0,1230.0,1226.0,1200.0,1157.0,1158.0,1177.0,1121.0,1093.0,1136.0,1121.0,1160.0,1147.0,1130.0,1116.0,1136.0,1128.0,1152.0,1114.0,1099.0,1097.0,1074.0,1070.0,1075.0,1015.0,1004.0,968.0,978.0,950.0,966.0,994.0,979.0,1006.0,976.0,953.0,942.0,899.0,919.0,982.0,1000.0,986.0,952.0,877.0,851.0,840.0,829.0,848.0,842.0,868.0,872.0,869.0,833.0,817.0,841.0,860.0,906.0,936.0,922.0,920.0,976.0,952.0,952.0,945.0,945.0,972.0,982.0,1008.0,1056.0,1046.0,1019.0,993.0,960.0,986.0,977.0,975.0,979.0,1055.0,1081.0,1083.0,1072.0,1150.0,1141.0,1115.0,1082.0,1044.0,1068.0,1027.0,1026.0,1025.0,964.0,938.0,926.0,936.0,979.0,973.0,925.0,911.0,903.0,925.0,904.0,905.0,903.0,906.0,971.0,955.0,970.0,978.0,1003.0,998.0,993.0,988.0,940.0,937.0,959.0,945.0,953.0,944.0,968.0,946.0,904.0,905.0,926.0,938.0,928.0,937.0,922.0,920.0,919.0,904.0,895.0,914.0,923.0,935.0,962.0,961.0,972.0,990.0,1000.0,978.0,940.0,919.0,912.0,917.0,919.0,914.0,918.0,921.0,928.0,927.0,940.0,895.0,877.0,896.0,922.0,937.0,962.0,991.0,990.0,997.0,972.0,966.0,987.0,960.0,949.0,957.0,942.0,936.0,910.0,918.0,928.0,908.0,898.0,909.0,886.0,880.0,906.0,897.0,893.0,862.0,846.0,822.0,832.0,804.0,820.0,817.0,827.0,781.0,780.0,791.0,774.0,782.0,795.0,811.0,813.0,815.0,828.5,826.0,831.0,861.0,833.0,842.0,810.0,789.0,780.0,784.0,792.0,794.0,823.0,800.0,791.0,811.0,795.0,784.0,806.0,848.0,820.0,813.0,832.0,847.0,846.0,891.0,884.0,882.0,853.0,856.0,826.0,800.0,792.0,797.0,799.0,798.0,805.0,831.0,808.0,835.0,844.0,845.0,852.0,834.0,844.0,856.0,936.0,938.0,928.0,928.0,874.0,875.0,882.0,888.0,916.0,894.0,874.0,882.0,892.0,889.0,890.0,927.0,922.0,953.0,954.0,968.0,999.0,971.0,952.0,965.0,968.0,880.0,867.0,801.0,607.0,618.0,719.0,732.0,768.0,756.0,760.0,753.0,760.0,806.0,831.0,828.0,823.0,805.0,802.0,810.0,819.0,823.0,842.0,908.0,906.0,938.0,912.0,922.0,905.0,906.0,940.0,839.0,853.0,864.0,855.0,855.0,856.0,858.0,873.0,907.0,937.0,963.0,1010.0,1016.0,1004.0,1041.0,1073.0,1043.0,1079.0,1057.0,1084.0,1149.0,1228.0,1209.0,1119.0,1127.0,1198.0,1161.0,1172.0,1206.0,1171.0,1188.0,1209.0,1229.0,1211.0,1193.0,1164.0,1153.0,1141.0,1080.0,1040.0,1054.0,1077.0,1095.0,1075.0,1053.0,1002.0,976.0,971.0,990.0,1000.0,983.0,935.0,925.0,958.0,947.0,1014.0,1044.0,1016.0,1031.0,1037.0,1050.0,972.0,941.0,934.0,911.0,924.0,962.0,963.0,945.0,966.0,1006.0,1015.0,1012.0,1023.0,1055.0,1059.0,1066.0,1012.0,1010.0,984.0,950.0,964.0,960.0,910.0,940.0,949.0,929.0,943.0,958.0,974.0,933.0,916.0,886.0,860.0,837.0,855.0,875.0,900.0,932.0,907.0,881.0,836.0,842.0,892.0,884.0,840.0,865.0,885.0,885.0,919.0,922.0,972.0,988.0,966.0,989.0,983.0,992.0,995.0,1014.0,1048.0,1068.0,1029.0,1013.0,998.0,955.0,916.0,923.0,918.0,939.0,968.0,971.0,963.0,987.0,1001.0,1048.0,1067.0,1043.0,1072.0,1058.0,1028.0,1005.0,1006.0,967.0,928.0,895.0,898.0,912.0,960.0,937.0,916.0,902.0,891.0,909.0,968.0,903.0,901.0,920.0,891.0,859.0,871.0,882.0,884.0,917.0,855.0,852.0,903.0,924.0,899.0,921.0,946.0,984.0,951.0,922.0,892.0,896.0,912.0,884.0,875.0,890.0,875.0,888.0,927.0,896.0,896.0,912.0,937.0,941.0,911.0,922.0,952.0,999.0,1019.0,1028.0,996.0,949.0,952.0,997.0,984.0,984.0,966.0,934.0,946.0,916.0,936.0,952.0,941.0,903.0,937.0,981.0,956.0,984.0,954.0,983.0,1004.0,995.0,980.0,933.0,956.0,931.0,936.0,930.0,922.0,939.0,911.0,945.0,941.0,937.0,945.0,968.0,986.0,970.0,946.0,952.0,975.0,976.0,975.0,942.0,918.0,955.0,964.0,965.0,977.0,978.0,995.0,1077.0,1051.0,1206.0,1248.0,1298.0,1333.0,1354.0,1378.0,1388.0,1264.0,1319.0,1319.0,1315.0,1339.0,1386.0,1383.0,1379.0,1423.0,1544.0,1612.0,1651.0,1553.0,1546.0,1539.0,1561.0,1499.0,1520.0,1615.0,1648.0,1770.0,2059.0,2027.0,2221.0,2342.0,2362.0,2210.0,2012.0,2025.47,2018.12,2147.33,2185.18],"c":[481.0,480.9,481.75,473.6,482.95,478.5,488.6,498.25,490.0,485.0,474.75,477.1,482.5,484.75,474.35,475.5,476.4,484.0,484.5,504.25,501.9,486.25,477.7,457.5,454.5,431.25,445.6,413.25,407.25,420.0,423.25,413.75,423.0,421.25,425.1,427.9,415.75,419.75,411.25,415.75,419.25,413.0,391.75,394.75,384.75,386.15,379.35,401.75,407.0,401.75,397.7,391.6,403.25,403.0,394.75,392.0,393.5,390.0,389.1,390.25,378.25,382.5,373.75,375.35,376.75,381.65,375.25,379.8,363.85,352.85,352.75,341.75,336.35,335.25,341.0,345.8,352.55,348.8,360.25,361.65,369.35,362.75,362.0,358.75,358.75,371.6,369.35,370.25,361.65,334.75,336.0,337.0,341.0,343.0,345.75,349.4,367.5,366.0,363.0,359.65,363.75,359.25,351.25,351.0,356.5,349.25,345.6,343.25,347.75,351.0,358.6,361.0,370.05,373.2,372.4,366.35,366.85,386.1,385.0,382.7,380.5,385.5,377.5,345.65,351.5,356.15,357.6,357.2,364.5,368.1,364.5,355.45,357.25,358.1,353.5,362.25,353.15,355.5,355.25,363.0,363.75,363.75,360.6,355.25,358.9,356.25,361.4,364.5,360.75,367.5,362.0,344.5,343.85,350.9,349.0,356.25,365.8,360.0,365.75,370.75,386.5,384.75,382.75,386.5,396.55,388.75,387.65,380.25,381.5,395.75,401.25,405.0,404.9,414.5,392.35,387.25,385.25,379.25,373.5,359.75,358.0,362.75,358.75,362.75,367.75,374.1,373.0,378.25,378.8,375.25,374.5,372.5,378.5,386.6,385.35,393.5,389.75,389.35,386.85,379.25,395.5,391.75,397.75,391.15,389.25,405.5,401.5,408.25,415.25,406.25,396.9,388.0,392.5,387.75,397.5,398.75,395.25,397.75,399.65,404.75,405.35,405.0,403.0,410.0,411.75,419.0,409.5,411.75,413.5,412.5,415.75,417.75,412.4,420.5,419.25,420.75,414.25,425.25,424.0,416.5,410.6,414.5,410.25,402.5,403.25,411.0,414.25,416.5,407.75,418.0,416.75,417.5,414.65,414.35,415.75,417.25,404.75,421.0,420.5,417.1,431.6,450.75,447.5,447.75,446.5,459.0,433.5,429.75,437.75,432.9,435.75,442.5,441.25,439.75,433.75,434.75,428.25,427.75,423.75,420.25,430.0,430.25,429.25,433.25,440.85,424.5,423.9,412.75,412.5,410.5,410.25,408.4,422.25,416.1,413.25,413.5,413.5,407.25,405.0,398.25,413.75,414.75,415.75,423.5,433.0,423.75,421.75,410.6,412.75,410.5,411.35,412.5,410.0,406.75,408.0,399.25,406.0,404.5,404.25,402.0,398.0,399.0,393.25,390.75,391.75,388.65,389.25,391.25,393.75,398.75,403.5,401.75,399.0,399.5,397.0,393.0,389.5,388.25,383.75,384.25,387.0,383.5,384.0,379.75,382.25,384.5,382.9,374.5,372.0,369.0,371.5,371.0,366.5,363.0,360.5,358.25,350.25,349.75,366.5,369.25,398.75,380.5,381.25,377.5,373.5,363.75,370.0,378.75,377.0,372.5,382.25,394.5,387.0,410.0,495.0,437.0,417.5,416.0,419.5,404.5,408.0,422.0,436.5,439.0,423.0,408.0,410.0,418.75,427.0,426.5,431.0,431.0,430.0,425.5,420.5,409.0,400.0,389.0,392.0,382.0,384.0,362.0,355.0,359.0,366.0,363.0,384.0,382.0,388.0,397.0,388.0,385.0,385.25,383.0,393.5,410.0,414.0,415.0,420.5,408.0,412.0,397.5,393.0,403.0,382.0,364.0,361.0,349.5,359.0,351.5,366.0,372.0,392.0,382.0,378.0,379.5,373.0,372.0,349.0,368.5,366.0,356.0,359.0,354.0,350.5,347.0,337.5,336.0,343.0,351.0,358.0,351.0,347.0,353.0,348.5,347.0,361.5,360.0,351.0,352.5,345.0,359.0,362.0,380.0,379.5,373.5,369.0,369.5,371.0,361.5,357.25,361.0,357.0,350.0,356.0,357.0,357.5,365.0,367.5,366.0,352.5,349.75,349.25,353.0,350.0,353.0,346.0,349.0,351.0,355.0,349.5,350.5,359.0,373.75,374.5,410.0,429.0,432.0,430.0,420.0,427.0,442.0,436.0,441.0,435.0,440.0,440.0,438.0,448.0,416.0,427.0,439.0,495.0,511.0,545.0,537.0,478.0,465.0,478.0,487.0,482.0,482.0,512.0,504.0,488.0,510.0,515.0,514.0,530.0,549.0,552.0,549.0,544.0,560.0,565.0,542.0,560.0,583.0,558.0,574.0,565.0,568.0,577.0,590.0,612.0,584.0,587.0,574.0,580.0,587.0,588.0,578.0,600.0,602.0,588.0,586.0,606.0,608.0,612.0,605.0,611.0,618.0,632.0,619.0,616.0,597.0,597.0,598.0,599.5,599.0,600.0,587.0,575.0,564.0,570.0,592.0,622.0,598.0,622.0,606.0,613.0,616.0,596.0,589.0,580.0,574.0,558.0,553.0,560.0,510.0,504.0,481.0,444.0,448.0,458.0,446.0,442.0,473.0,490.0,430.0,446.0,433.0,433.0,419.0,422.0,420.0,427.0,434.0,441.0,467.0,462.0,457.0,477.0,476.0,480.0,482.0,465.0,449.0,474.0,479.0,475.0,486.0,520.0,510.0,512.0,514.0,532.0,536.0,558.0,553.0,524.0,522.0,538.0,541.0,548.0,564.0,556.0,567.0,547.0,520.0,529.0,528.0,529.0,526.0,538.0,552.0,541.0,568.0,543.0,552.0,570.0,560.5,560.0,593.0,590.0,586.0,578.0,588.0,602.0,594.0,589.0,597.0,604.0,593.0,594.0,606.0,618.0,623.0,650.0,669.0,690.0,693.0,664.0,680.0,691.0,688.0,662.0,625.0,616.0,623.0,628.0,635.0,607.0,640.0,663.0,669.0,643.0,660.0,661.0,674.0,664.0,676.0,675.0,684.5,691.0,677.0,680.0,697.0,702.0,707.0,710.0,701.0,699.5,708.0,718.0,729.0,727.0,740.0,752.0,755.0,771.5,765.0,765.0,787.0,820.0,826.0,812.0,815.0,852.0,849.0,866.0,829.0,823.0,851.0,857.0,873.0,883.0,910.0,897.0,909.0,888.0,892.0,920.0,850.0,798.0,798.0,789.0,808.0,838.0,830.0,795.0,795.0,810.0,780.0,813.0,820.0,816.0,816.0,827.0,847.0,851.5,868.0,866.0,832.0,837.0,851.5,863.0,845.0,838.0,848.0,835.0,845.0,868.0,853.0,865.0,870.0,832.0,840.0,846.0,861.0,847.0,856.0,863.0,867.0,866.0,868.0,864.0,865.0,865.0,867.0,873.0,859.0,862.5,861.0,861.0,872.0,867.0,875.0,866.0,865.0,860.0,876.0,869.0,889.0,893.0,880.0,865.0,866.0,884.0,896.0,909.0,924.0,887.0,895.0,909.0,909.0,915.0,924.0,929.0,932.0,925.0,926.0,941.0,933.0,957.0,983.0,984.0,1001.0,1000.0,956.0,961.0,964.0,989.0,1029.0,1042.0,1055.0,1080.0,1062.0,1008.0,1028.0,1063.0,1012.0,1033.0,1042.0,1080.0,1082.0,1075.0,1108.0,1149.0,1175.0,1335.0,1313.0,1295.0,1227.0,1195.0,1158.0,1171.0,1212.0,1232.0,1248.0,1213.0,1218.0,1240.0,1243.0,1216.0,1223.0,1244.0,1244.0,1161.0,1146.0,1144.0,1080.0,1072.0,1083.0,1072.0,1207.0,1227.0,1155.0,1180.0,1175.0,1122.0,1106.0,1121.0,1117.0,1127.0,1140.0,1150.0,1172.0,1174.0,1200.0,1198.0,1225.0,1225.0,1203.0,1217.0,1230.0,1246.0,1250.0,1265.0,1310.0,1280.0,1300.0,1317.0,1310.0,1282.0,1287.0,1291.0,1280.0,1293.0,1275.0,1287.0,1313.0,1324.0,1313.0,1284.0,1274.0,1238.0,1238.0,1269.0,1287.0,1288.0,1336.0,1361.0,1366.0,1404.0,1454.0,1453.0,1439.5,1452.0,1429.0,1470.0,1443.0,1458.0,1467.0,1513.0,1529.0,1545.0,1565.0,1549.0,1649.0,1741.0,1844.0,2025.0,2160.0,2153.0,2147.0,2100.0,1824.0,2037.0,1988.0,2015.0,2062.0,1932.0,1855.0,2082.0,2092.0,2179.0,1976.0,2045.0,2031.0,2056.0,2075.0,2022.0,2040.0,1872.0,1750.0,1717.0,1574.0,1390.0,1455.0,1475.0,1365.0,1183.0,1083.0,1147.0,962.0,1019.0,868.0,768.0,790.0,865.0,840.0,809.0,858.0,805.0,823.0,854.0,856.0,934.0,991.0,935.0,929.0,975.0,982.0,1063.0,1083.0,1054.0,1075.0,1050.0,1118.0,1142.0,1153.0,1205.0,1213.0,1181.0,1096.0,1154.0,1116.0,1145.0,1163.0,1293.0,1253.0,1209.0,1208.0,1183.0,1106.0,1169.0,1180.0,1186.0,1237.0,1271.0,1232.0,1234.0,1248.0,1287.0,1326.0,1295.0,1275.0,1335.0,1341.0,1369.0,1328.0,1362.0,1359.0,1430.0,1433.0,1484.0,1436.0,1435.0,1456.0,1466.0,1547.0,1610.0,1556.0,1514.0,1477.0,1513.0,1506.0,1540.0,1577.0,1619.0,1623.0,1601.0,1659.0,1722.0,1720.0,1733.0,1737.0,1661.0,1726.0,1494.0,1569.0,1546.0,1542.0,1571.0,1557.0,1516.0,1525.0,1518.0,1545.0,1555.0,1567.0,1538.0,1517.0,1530.0,1555.0,1553.0,1619.0,1644.0,1669.0,1688.0,1701.0,1661.0,1683.0,1760.0,1705.0,1665.0,1642.0,1721.0,1681.0,1705.0,1725.0,1731.0,1716.0,1810.0,1812.0,1790.0,1833.0,1830.0,1833.0,1787.0,1831.0,1768.0,1719.0,1746.0,1779.0,1810.0,1790.0,1814.0,1820.0,1787.0,1778.0,1770.0,1781.0,1816.0,1842.0,1747.0,1706.0,1703.0,1745.0,1754.0,1785.0,1782.0,1700.0,1790.0,1871.0,1824.0,1858.0,1857.0,1799.0,1695.0,1538.0,1521.0,1546.0,1491.0,1645.0,1640.0,1626.0,1595.0,1535.0,1559.0,1491.0,1426.5,1436.0,1381.0,1417.0,1483.0,1507.0,1613.0,1631.0,1648.0,1637.0,1717.0,1701.0,1661.0,1672.0,1625.0,1643.0,1605.0,1594.0,1577.0,1567.0,1528.0,1467.0,1458.0,1430.0,1396.0,1419.0,1492.0,1434.0,1407.0,1467.0,1426.0,1415.0,1417.0,1392.0,1402.0,1456.0,1536.0,1508.0,1579.0,1694.0,1635.0,1661.0,1714.0,1677.0,1634.0,1551.0,1555.0,1565.0,1558.0,1581.0,1617.0,1593.0,1613.0,1550.0,1530.0,1545.0,1626.0,1693.0,1688.0,1672.0,1715.0,1693.0,1618.0,1565.0,1602.0,1591.0,1582.0,1583.0,1527.0,1524.0,1439.0,1477.0,1508.0,1502.0,1472.0,1460.0,1471.0,1536.0,1450.0,1363.0,1325.0,1331.0,1398.0,1419.0,1438.0,1426.0,1487.0,1518.0,1539.0,1511.0,1481.0,1432.0,1453.0,1411.0,1375.0,1383.0,1432.0,1443.0,1456.0,1458.0,1443.0,1396.0,1367.0,1363.0,1366.0,1325.0,1367.0,1407.0,1421.0,1435.0,1450.0,1383.0,1385.0,1422.0,1419.0,1444.0,1481.0,1474.0,1437.0,1404.0,1440.0,1456.0,1435.0,1412.0,1424.0,1431.0,1461.0,1484.0,1457.0,1453.0,1447.0,1462.0,1474.0,1500.0,1507.0,1489.0,1471.0,1461.0,1481.0,1460.0,1423.0,1424.0,1405.0,1364.0,1347.0,1314.0,1247.0,1265.0,1258.0,1254.0,1232.0,1195.0,1193.0,1216.0,1214.0,1236.0,1239.0,1199.0,1190.0,1208.0,1221.0,1257.0,1277.0,1230.0,1255.0,1200.0,1157.0,1173.0,1177.0,1121.0,1122.0,1141.0,1155.0,1167.0,1164.0,1134.0,1139.0,1138.0,1156.0,1158.0,1114.0,1099.0,1098.0,1081.0,1077.0,1086.0,1033.0,1004.0,978.0,978.0,953.0,992.0,1026.0,999.0,1006.0,976.0,977.0,944.0,899.0,973.0,997.0,1011.0,994.0,952.0,877.0,864.0,848.0,852.0,855.0,842.0,874.0,872.0,876.0,833.0,824.0,864.0,911.0,952.0,939.0,922.0,959.0,976.0,977.0,952.0,982.0,956.0,988.0,1031.0,1060.0,1061.0,1055.0,1019.0,993.0,960.0,992.0,977.0,976.0,1033.0,1077.0,1096.0,1094.0,1128.0,1161.0,1141.0,1115.0,1082.0,1044.0,1079.0,1027.0,1055.0,1031.0,964.0,938.0,926.0,965.0,995.0,973.0,925.0,911.0,916.0,937.0,904.0,905.0,907.0,968.0,975.0,955.0,970.0,992.0,1003.0,1014.0,1015.0,988.0,940.0,955.0,959.0,945.0,962.0,973.0,977.0,946.0,913.0,923.0,933.0,953.0,928.0,937.0,922.0,931.0,921.0,904.0,905.0,928.0,926.0,967.0,982.0,983.0,979.0,997.0,1014.0,978.0,942.0,923.0,915.0,936.0,919.0,916.0,922.0,937.0,933.0,936.0,941.0,895.0,881.0,912.0,927.0,963.0,995.0,1012.0,1020.0,1003.0,972.0,1011.0,993.0,960.0,951.0,957.0,954.0,936.0,911.0,933.0,931.0,908.0,899.0,927.0,886.0,912.0,910.0,898.0,903.0,865.0,846.0,839.0,832.0,815.0,820.0,824.0,830.0,782.0,784.0,798.0,793.0,807.0,838.0,811.0,821.0,839.0,828.5,826.0,865.0,861.0,841.0,842.0,810.0,789.0,792.0,793.0,795.0,801.0,823.0,810.0,803.0,822.0,795.0,788.0,830.0,862.0,820.0,833.0,858.0,847.0,908.0,899.0,884.0,889.0,853.0,858.0,826.0,806.0,793.0,803.0,818.0,805.0,816.0,832.0,824.0,857.0,863.0,845.0,863.0,834.0,860.0,935.0,940.0,955.0,945.0,929.0,884.0,902.0,883.0,928.0,932.0,894.0,876.0,911.0,895.0,897.0,938.0,931.0,950.0,988.0,973.0,1016.0,1004.0,974.0,969.0,972.0,983.0,880.0,871.0,801.0,628.0,745.0,719.0,736.0,775.0,766.0,760.0,753.0,774.0,829.0,840.0,835.0,824.0,805.0,802.0,812.0,842.0,825.0,917.0,908.0,974.0,945.0,912.0,930.0,905.0,930.0,943.0,857.0,894.0,879.0,863.0,892.0,856.0,901.0,890.0,951.0,958.0,1048.0,1022.0,1038.0,1021.0,1075.0,1104.0,1095.0,1101.0,1087.0,1113.0,1227.0,1271.0,1209.0,1119.0,1173.0,1198.0,1161.0,1189.0,1213.0,1196.0,1215.0,1209.0,1250.0,1228.0,1193.0,1182.0,1153.0,1156.0,1080.0,1100.0,1094.0,1081.0,1136.0,1087.0,1057.0,1002.0,1020.0,978.0,990.0,1005.0,987.0,949.0,983.0,964.0,992.0,1057.0,1063.0,1016.0,1031.0,1070.0,1050.0,972.0,944.0,942.0,934.0,973.0,962.0,974.0,979.0,1046.0,1006.0,1028.0,1029.0,1092.0,1055.0,1086.0,1066.0,1035.0,1021.0,988.0,965.0,986.0,960.0,932.0,959.0,956.0,961.0,952.0,975.0,974.0,950.0,916.0,886.0,872.0,842.0,882.0,898.0,936.0,959.0,907.0,881.0,836.0,892.0,892.0,884.0,877.0,930.0,904.0,908.0,949.0,934.0,1055.0,988.0,983.0,1041.0,1001.0,992.0,995.0,1065.0,1048.0,1068.0,1036.0,1013.0,1028.0,955.0,922.0,940.0,971.0,939.0,983.0,977.0,986.0,1007.0,1046.0,1094.0,1067.0,1043.0,1099.0,1058.0,1029.0,1016.0,1013.0,993.0,928.0,895.0,908.0,967.0,960.0,937.0,916.0,917.0,900.0,940.0,976.0,903.0,917.0,934.0,918.0,859.0,871.0,903.0,909.0,930.0,855.0,903.0,921.0,937.0,920.0,964.0,970.0,1006.0,951.0,922.0,913.0,898.0,919.0,885.0,892.0,890.0,875.0,922.0,938.0,908.0,896.0,923.0,997.0,941.0,919.0,968.0,995.0,1058.0,1019.0,1028.0,996.0,953.0,989.0,1004.0,1009.0,996.0,966.0,934.0,973.0,932.0,954.0,954.0,944.0,931.0,988.0,988.0,1009.0,1004.0,975.0,1010.0,1004.0,995.0,987.0,948.0,962.0,945.0,936.0,930.0,922.0,939.0,934.0,968.0,941.0,952.0,977.0,998.0,1008.0,970.0,946.0,976.0,993.0,976.0,987.0,942.0,945.0,963.0,964.0,971.0,988.0,989.0,1087.0,1078.0,1163.0,1275.0,1292.0,1367.0,1378.0,1357.0,1464.0,1398.0,1264.0,1335.0,1361.0,1342.0,1347.0,1386.0,1389.0,1389.0,1541.0,1586.0,1621.0,1668.0,1601.0,1594.0,1557.0,1561.0,1499.0,1635.0,1656.0,1715.0,1932.0,2295.0,2133.0,2295.0,2346.0,2663.0,2210.0,2012.0,2065.64,2163.5,2236.96,2185.18],"m":[477.05,478.73,479.73,479.45,476.67,479.69,486.39,498.67,494.69,485.91,481.33,476.74,480.06,486.72,477.57,474.21,478.1,482.75,482.68,497.9,502.38,486.88,484.44,460.13,457.98,447.97,440.97,436.31,398.68,421.1,425.31,420.45,415.45,417.92,427.62,430.01,420.37,418.17,413.72,414.75,416.15,419.38,402.33,390.65,384.65,384.3,385.52,392.02,402.03,406.74,398.5,392.59,398.8,403.05,399.85,392.61,391.72,392.36,390.85,390.49,382.85,379.29,378.35,371.12,374.59,380.06,380.69,379.29,372.79,360.67,352.67,347.15,344.89,337.98,340.95,347.23,352.11,354.92,354.73,359.83,367.82,366.47,361.35,362.42,360.88,366.56,369.97,367.42,368.15,346.98,339.12,334.43,336.15,337.57,343.66,350.11,361.18,366.32,361.4,357.79,361.62,361.82,354.48,350.89,356.13,349.59,347.21,342.24,344.42,351.88,354.95,360.4,366.89,372.54,369.04,368.3,365.77,379.37,384.44,387.26,383.46,377.97,377.19,362.11,347.7,352.28,357.38,360.06,362.75,364.71,366.13,360.58,356.06,358.04,354.88,357.6,354.33,353.98,356.57,361.71,364.67,364.19,359.34,357.08,357.31,357.4,359.5,362.9,360.31,364.89,365.27,346.04,343.4,346.44,349.41,355.62,360.86,361.9,364.69,370.3,379.38,380.29,382.08,386.95,390.73,390.56,386.38,380.6,377.33,387.39,400.7,405.12,403.35,407.32,411.13,391.4,387.65,385.37,379.5,362.63,355.47,361.32,360.35,360.28,367.01,372.93,373.4,370.77,378.36,375.98,375.13,370.52,376.78,386.52,387.0,391.33,394.77,385.74,391.92,382.07,389.72,390.85,398.02,393.53,391.98,394.85,401.74,403.1,410.69,408.66,399.5,390.38,391.18,394.81,396.03,399.05,402.59,398.94,397.32,402.5,406.79,401.04,406.83,406.4,413.15,419.53,415.85,409.7,411.27,412.2,413.56,418.7,414.93,417.75,418.51,418.45,416.4,419.68,422.11,417.5,411.22,414.16,410.9,407.0,402.68,409.18,415.65,416.75,409.38,410.47,415.9,417.55,414.85,412.2,413.9,416.88,408.03,414.7,420.6,416.57,420.47,450.65,449.56,455.12,442.17,451.75,437.25,429.85,431.42,433.88,433.48,439.67,441.85,440.94,433.8,434.7,436.6,430.25,422.4,421.55,421.67,429.45,430.09,428.31,436.24,433.32,422.32,415.62,414.92,412.41,410.8,408.23,412.27,416.22,414.06,413.96,412.92,412.48,407.41,402.92,407.69,416.24,415.92,420.87,422.78,427.1,421.6,418.24,410.89,408.49,412.07,411.4,412.5,405.96,408.0,402.08,403.35,402.06,405.06,402.4,397.87,399.25,395.7,391.7,392.41,390.36,390.08,390.1,393.05,396.38,400.8,401.8,399.7,398.87,399.38,394.7,391.75,388.5,386.65,383.4,385.2,384.05,385.4,381.3,380.9,385.95,383.93,377.45,372.7,368.65,369.7,371.83,369.12,361.1,360.7,357.35,355.2,350.55,358.55,366.77,382.85,383.9,380.9,378.45,374.44,367.25,366.95,369.5,377.5,373.75,376.19,393.45,390.05,406.19,433.9,456.3,419.1,417.83,426.1,405.3,406.75,416.1,429.0,439.9,434.7,414.1,407.38,413.05,423.25,424.8,436.4,431.45,429.0,433.6,421.8,405.8,404.5,391.4,391.4,384.35,385.5,372.62,352.2,355.5,363.75,361.4,374.75,379.8,387.0,391.4,390.3,384.4,379.85,384.85,388.5,403.0,415.95,408.2,418.5,418.0,415.7,403.9,395.5,394.8,390.6,373.0,362.05,356.25,354.2,353.7,359.5,371.95,383.2,385.5,377.8,376.5,374.25,368.2,360.8,365.12,364.2,361.6,355.5,351.4,346.8,343.2,337.8,338.4,340.4,341.55,351.7,352.1,349.1,349.7,351.4,347.25,357.5,360.4,355.95,353.55,348.88,351.9,357.65,369.9,379.8,374.4,372.3,366.7,372.3,363.5,357.19,359.3,361.6,353.0,352.0,355.2,354.8,359.95,363.0,364.7,357.3,348.75,348.65,348.3,349.3,351.45,348.3,349.0,350.7,350.6,349.05,349.25,355.05,373.05,377.4,404.5,418.4,431.6,420.8,422.1,419.6,435.0,447.6,438.0,437.8,438.8,443.6,438.8,446.5,427.25,421.2,437.8,463.2,499.2,532.0,547.4,500.2,477.0,473.2,482.6,491.0,480.2,513.0,495.4,497.75,484.0,520.25,508.6,516.0,552.0,550.5,558.6,546.8,563.6,572.8,544.0,552.8,576.6,566.6,586.8,572.6,570.2,573.4,590.0,607.8,598.4,590.6,575.4,572.6,583.2,581.2,580.6,586.4,597.6,591.6,589.4,598.8,611.0,616.0,604.7,613.33,620.0,634.4,626.8,616.4,603.7,602.7,595.8,602.5,606.6,588.9,591.0,581.6,574.2,570.0,584.25,623.25,605.8,605.4,604.5,608.2,614.2,610.5,589.1,580.2,579.5,566.9,557.2,557.4,530.4,501.2,478.8,448.4,438.4,448.9,455.25,442.2,453.4,486.2,450.6,428.8,433.0,446.2,422.4,425.9,419.0,427.4,436.4,439.2,456.7,464.2,457.25,470.0,478.5,475.2,478.8,472.2,457.6,462.2,473.6,471.0,486.0,511.0,516.0,514.0,514.0,532.0,530.1,547.6,553.8,530.2,524.25,534.2,541.8,544.0,555.0,556.8,563.8,552.4,527.3,524.4,527.8,524.2,526.6,530.2,554.6,545.4,563.5,548.6,550.1,556.55,564.3,564.9,575.0,590.4,584.1,586.2,584.0,588.7,595.4,587.8,593.4,598.8,600.4,591.0,600.5,612.5,619.4,641.6,655.4,689.6,687.2,674.8,678.0,690.8,697.8,678.4,645.4,633.4,619.8,625.0,636.75,610.2,627.5,658.6,667.6,661.0,657.6,657.5,667.8,665.8,671.6,670.4,683.7,690.6,690.2,681.2,693.4,700.6,700.75,711.2,704.1,698.9,706.4,710.5,725.2,727.2,737.4,750.2,749.6,763.9,765.2,762.8,782.0,806.0,832.2,810.33,815.25,842.4,856.2,862.4,850.0,825.8,843.2,856.8,858.6,885.2,902.8,902.7,907.8,898.0,891.0,926.38,895.7,818.2,809.0,786.8,807.2,835.2,837.25,816.5,783.6,809.0,785.2,794.4,814.8,827.4,811.8,829.2,840.9,861.8,851.6,867.75,841.2,839.8,845.1,856.6,844.9,840.0,845.8,842.4,835.2,852.0,867.0,859.0,867.55,851.2,838.25,843.3,862.5,846.25,855.0,861.6,866.8,872.8,857.8,862.0,867.0,865.6,871.1,875.4,863.0,861.5,861.0,862.4,868.0,872.1,871.5,873.6,860.2,863.0,869.75,875.1,876.1,890.6,884.5,868.6,868.8,872.8,886.2,908.4,907.8,893.0,893.4,897.0,908.4,911.4,926.2,917.8,922.2,936.2,928.2,936.4,932.6,946.05,975.2,977.8,991.2,997.8,975.8,960.6,966.67,989.0,1014.4,1037.4,1051.2,1073.4,1064.4,1011.6,1026.0,1048.6,1029.2,1022.4,1038.8,1070.6,1075.4,1083.25,1114.0,1133.2,1173.25,1252.8,1307.2,1295.6,1260.25,1230.2,1151.6,1168.2,1188.6,1232.4,1240.6,1225.6,1218.4,1236.2,1243.6,1227.6,1227.6,1233.0,1254.4,1190.0,1146.6,1140.0,1109.2,1076.2,1085.6,1070.6,1110.2,1186.4,1178.4,1230.4,1166.0,1131.4,1108.8,1114.2,1119.0,1129.75,1130.2,1147.2,1166.8,1171.6,1183.8,1203.0,1216.8,1240.2,1191.4,1210.2,1229.6,1239.6,1245.0,1263.5,1286.0,1308.6,1290.0,1326.75,1322.8,1294.8,1273.25,1295.0,1284.2,1291.2,1278.6,1282.4,1303.4,1315.4,1322.8,1283.0,1282.8,1260.0,1241.9,1261.25,1276.8,1296.0,1311.0,1344.0,1361.8,1379.8,1430.6,1442.4,1446.7,1459.9,1421.3,1464.2,1451.8,1459.6,1466.6,1502.2,1529.67,1537.5,1546.4,1568.6,1571.6,1698.8,1805.8,1958.2,2131.6,2135.6,2213.2,2057.2,1944.75,1986.25,1974.8,2014.4,2009.2,1993.8,1923.8,1984.5,2046.4,2175.0,2068.25,2012.6,2031.6,2060.8,2050.2,2062.6,1994.8,1962.4,1802.6,1750.0,1588.8,1498.4,1380.8,1445.25,1403.4,1237.0,1123.6,1197.0,1028.2,996.4,961.6,851.2,799.0,846.4,844.8,822.6,855.2,810.2,828.8,850.6,856.0,915.0,970.0,948.2,941.6,955.6,972.6,1036.4,1082.4,1061.0,1062.4,1052.6,1066.4,1130.6,1134.2,1169.0,1222.0,1173.8,1109.0,1141.75,1126.0,1137.6,1139.75,1243.4,1253.0,1215.8,1184.2,1185.4,1126.6,1137.6,1175.2,1193.0,1249.0,1252.6,1235.6,1241.4,1237.75,1277.6,1321.8,1317.2,1281.6,1318.4,1347.2,1357.8,1329.6,1350.0,1361.0,1435.8,1454.4,1476.8,1432.2,1439.6,1426.0,1467.67,1531.6,1589.8,1612.2,1521.6,1535.4,1501.4,1522.6,1524.6,1567.4,1600.4,1623.6,1593.2,1634.25,1704.0,1719.8,1721.0,1734.2,1678.0,1708.2,1611.2,1532.8,1548.0,1521.4,1564.2,1575.0,1538.6,1517.2,1524.4,1519.6,1549.8,1581.2,1536.6,1534.6,1517.7,1533.5,1555.4,1584.4,1628.6,1643.2,1691.6,1697.0,1678.6,1690.8,1728.8,1755.6,1661.5,1656.4,1682.0,1700.6,1701.2,1718.8,1747.0,1738.5,1776.8,1822.0,1800.8,1817.2,1844.4,1832.2,1806.6,1826.0,1804.8,1718.5,1744.8,1755.8,1792.0,1790.2,1792.5,1812.0,1830.0,1786.0,1767.8,1768.6,1818.5,1824.0,1785.4,1735.0,1700.4,1729.4,1742.0,1777.2,1791.0,1767.8,1753.4,1829.4,1858.4,1848.38,1857.2,1811.8,1762.0,1552.6,1494.2,1533.8,1521.2,1578.0,1603.4,1638.6,1624.6,1554.4,1545.0,1519.6,1457.1,1429.6,1386.67,1419.0,1466.4,1514.2,1570.0,1617.6,1639.0,1636.0,1690.6,1706.0,1644.4,1683.6,1646.4,1641.8,1631.5,1598.75,1579.2,1561.0,1557.4,1497.25,1445.4,1439.8,1419.2,1447.33,1461.0,1468.8,1419.4,1468.6,1428.4,1419.2,1399.2,1403.8,1405.2,1410.4,1512.6,1518.75,1560.0,1633.8,1647.8,1630.0,1683.8,1681.8,1647.2,1581.8,1557.4,1551.8,1574.2,1573.6,1612.2,1591.6,1621.6,1589.4,1537.0,1549.0,1589.8,1675.4,1685.2,1679.8,1714.0,1708.8,1657.2,1598.4,1590.2,1591.8,1575.0,1576.5,1551.25,1534.2,1438.0,1439.4,1498.2,1495.75,1485.6,1460.6,1460.0,1499.2,1475.8,1415.6,1336.3,1353.2,1373.2,1414.0,1438.0,1433.6,1450.4,1506.2,1517.8,1528.5,1511.0,1469.4,1449.8,1425.6,1394.4,1391.4,1394.2,1436.8,1461.2,1456.6,1439.0,1411.4,1375.8,1358.8,1374.8,1345.2,1343.67,1378.75,1410.0,1426.2,1454.6,1406.8,1382.6,1397.8,1419.4,1434.4,1464.4,1471.3,1453.0,1419.5,1430.8,1443.0,1446.75,1406.5,1420.8,1442.0,1454.9,1477.6,1461.0,1435.8,1461.0,1446.2,1461.0,1496.4,1501.6,1491.2,1480.8,1478.6,1466.4,1468.6,1436.0,1423.0,1413.0,1386.2,1360.6,1325.4,1282.0,1261.4,1259.8,1265.6,1253.8,1213.4,1200.8,1206.2,1218.6,1222.6,1238.2,1207.6,1192.33,1210.25,1217.0,1240.2,1273.6,1248.8,1238.4,1210.4,1183.6,1169.8,1181.4,1132.6,1111.0,1143.4,1135.25,1166.5,1156.2,1144.2,1140.6,1140.0,1140.4,1159.2,1125.25,1105.8,1106.2,1084.4,1073.4,1081.6,1041.6,1018.8,981.6,983.0,957.0,986.6,1005.0,989.6,1008.5,989.8,962.2,954.4,913.0,937.2,992.0,1008.8,992.4,962.0,901.6,861.2,845.2,839.0,860.0,852.0,873.75,881.0,879.6,845.6,823.8,864.8,877.6,928.8,938.0,930.2,938.2,986.4,969.6,971.0,966.75,952.2,988.4,1007.4,1025.4,1064.5,1057.4,1036.0,1003.0,971.25,995.4,983.0,978.6,999.0,1069.2,1092.4,1087.8,1106.2,1158.8,1156.0,1120.6,1096.8,1057.75,1082.6,1041.2,1038.4,1032.4,992.0,951.4,939.0,955.6,986.6,993.8,936.4,928.0,915.2,935.6,921.2,913.4,905.0,942.0,977.4,974.0,979.8,991.2,1009.4,1006.2,1001.4,1015.6,960.6,947.8,963.0,959.4,959.2,958.25,975.75,953.8,916.5,915.0,933.6,944.8,939.5,951.2,933.8,926.0,920.6,909.6,904.6,922.2,928.0,947.8,972.2,970.4,977.0,994.25,1007.6,986.2,951.8,925.6,913.8,928.4,927.4,918.0,923.0,928.8,930.4,934.8,943.4,912.2,883.8,909.6,924.0,949.25,972.6,999.6,1012.4,1002.2,984.4,985.2,997.2,982.8,957.4,960.4,949.6,946.25,919.75,928.2,936.6,916.2,901.0,915.25,900.4,901.4,908.5,901.0,902.2,871.4,859.6,836.4,840.8,816.6,831.4,824.2,830.2,794.6,789.8,797.0,784.4,794.2,815.2,824.4,821.6,823.4,837.5,828.4,841.8,869.2,840.4,845.2,830.2,798.8,789.2,790.2,794.33,797.0,824.6,803.4,795.4,817.0,810.8,788.6,818.6,859.6,831.8,830.0,851.6,853.8,868.8,901.8,886.25,889.25,877.8,865.5,846.4,809.4,797.5,810.2,809.8,803.4,811.0,833.4,817.6,844.6,859.8,863.8,856.2,848.6,850.4,893.75,952.4,946.6,939.2,944.6,890.8,887.0,886.6,904.6,924.6,928.8,877.4,902.4,896.0,898.0,917.8,930.0,935.67,973.25,968.8,996.6,1007.6,982.8,969.6,967.6,989.0,934.0,872.0,858.0,648.2,701.2,722.6,737.75,779.25,766.4,769.6,756.25,766.6,828.8,836.0,835.6,828.6,814.6,813.8,816.2,836.2,829.2,883.4,925.6,946.6,949.4,944.4,926.6,926.0,915.8,956.0,872.2,878.4,875.8,870.6,877.4,872.0,875.8,885.8,931.6,954.4,1003.8,1021.6,1034.8,1013.75,1059.33,1096.6,1077.2,1099.4,1084.8,1101.8,1205.2,1271.2,1249.2,1173.8,1172.2,1207.8,1171.4,1178.5,1221.5,1184.8,1205.2,1225.4,1238.0,1237.4,1216.4,1184.0,1178.5,1157.4,1130.2,1073.4,1083.0,1092.6,1121.4,1081.2,1060.8,1034.4,1000.6,998.2,1002.8,1007.25,1002.8,947.2,963.2,970.4,968.0,1030.6,1052.4,1028.4,1042.6,1061.0,1073.2,997.8,951.4,948.6,928.8,944.75,966.67,971.5,966.0,1003.8,1029.0,1029.8,1023.8,1051.2,1083.2,1072.2,1111.0,1027.6,1022.8,986.4,971.8,982.5,986.0,923.6,965.5,968.8,947.2,954.4,965.33,1003.0,940.8,931.8,911.4,871.0,853.6,871.6,886.6,911.4,944.6,927.6,882.8,847.25,863.2,900.0,912.75,858.6,909.8,894.4,902.6,935.6,937.8,999.8,1012.0,986.6,1015.8,1000.8,1012.8,1000.0,1033.0,1077.25,1084.0,1045.6,1037.6,1011.2,974.8,931.6,938.6,950.2,953.2,977.4,982.0,971.6,1002.5,1019.0,1070.6,1090.4,1053.25,1094.5,1064.8,1047.6,1018.0,1022.6,988.6,956.6,917.8,913.0,942.6,976.2,963.6,928.0,913.2,900.0,925.2,976.25,927.2,906.0,934.2,909.0,877.4,886.0,894.6,898.0,927.8,887.2,884.8,921.6,933.2,912.6,936.6,956.6,996.67,974.25,938.0,904.2,902.2,920.8,892.2,889.4,900.2,885.2,902.0,933.6,907.6,901.0,924.25,972.4,954.6,917.6,943.8,974.75,1035.0,1042.6,1042.25,1005.6,957.4,975.4,1002.2,1000.0,996.8,995.0,949.4,961.6,923.6,941.6,957.4,948.25,922.8,953.2,987.6,985.0,993.0,967.4,994.6,1023.0,1021.0,989.6,952.0,960.6,939.6,945.0,939.2,927.8,940.33,920.0,954.8,949.8,944.6,955.4,981.0,994.2,981.6,965.2,965.4,981.2,993.6,979.2,977.2,929.0,959.0,970.0,975.4,983.25,988.6,1042.4,1081.25,1097.6,1243.2,1274.2,1339.4,1367.8,1361.2,1407.2,1426.2,1353.2,1326.0,1342.2,1333.8,1345.25,1395.0,1389.8,1393.2,1476.6,1581.4,1632.6,1661.8,1594.2,1591.0,1566.4,1588.4,1539.2,1575.8,1648.6,1673.0,1869.8,2177.33,2155.75,2274.0,2362.2,2472.8,2628.0,2143.8,2083.1,2100.31,2213.82,2185.18],"n":[5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,7,7,4,1]},"Silver":{"t":["1968-01-01","1968-01-08","1968-01-15","1968-01-22","1968-01-29","1968-02-05","1968-02-12","1968-02-19","1968-02-26","1968-03-04","1968-03-11","1968-03-18","1968-03-25","1968-04-01","1968-04-08","1968-04-15","1968-04-22","1968-04-29","1968-05-06","1968-05-13","1968-05-20","1968-05-27","1968-06-03","1968-06-10","1968-06-17","1968-06-24","1968-07-01","1968-07-08","1968-07-15","1968-07-22","1968-07-29","1968-08-05","1968-08-12","1968-08-19","1968-08-26","1968-09-02","1968-09-09","1968-09-16","1968-09-23","1968-09-30","1968-10-07","1968-10-14","1968-10-21","1968-10-28","1968-11-04","1968-11-11","1968-11-18","1968-11-25","1968-12-02","1968-12-09","1968-12-16","1968-12-23","1968-12-30","1969-01-06","1969-01-13","1969-01-20","1969-01-27","1969-02-03","1969-02-10","1969-02-17","1969-02-24","1969-03-03","1969-03-10","1969-03-17","1969-03-24","1969-03-31","1969-04-07","1969-04-14","1969-04-21","1969-04-28","1969-05-05","1969-05-12","1969-05-19","1969-05-26","1969-06-02","1969-06-09","1969-06-16","1969-06-23","1969-06-30","1969-07-07","1969-07-14","1969-07-21","1969-07-28","1969-08-04","1969-08-11","1969-08-18","1969-08-25","1969-09-01","1969-09-08","1969-09-15","1969-09-22","1969-09-29","1969-10-06","1969-10-13","1969-10-20","1969-10-27","1969-11-03","1969-11-10","1969-11-17","1969-11-24","1969-12-01","1969-12-08","1969-12-15","1969-12-22","1969-12-29","1970-01-05","1970-01-12","1970-01-19","1970-01-26","1970-02-02","1970-02-09","1970-02-16","1970-02-23","1970-03-02","1970-03-09","1970-03-16","1970-03-23","1970-03-30","1970-04-06","1970-04-13","1970-04-20","1970-04-27","1970-05-04","1970-05-11","1970-05-18","1970-05-25","1970-06-01","1970-06-08","1970-06-15","1970-06-22","1970-06-29","1970-07-06","1970-07-13","1970-07-20","1970-07-27","1970-08-03","1970-08-10","1970-08-17","1970-08-24","1970-08-31","1970-09-07","1970-09-14","1970-09-21","1970-09-28","1970-10-05","1970-10-12","1970-10-19","1970-10-26","1970-11-02","1970-11-09","1970-11-16","1970-11-23","1970-11-30","1970-12-07","1970-12-14","1970-12-21","1970-12-28","1971-01-04","1971-01-11","1971-01-18","1971-01-25","1971-02-01","1971-02-08","1971-02-15","1971-02-22","1971-03-01","1971-03-08","1971-03-15","1971-03-22","1971-03-29","1971-04-05","1971-04-12","1971-04-19","1971-04-26","1971-05-03","1971-05-10","1971-05-17","1971-05-24","1971-05-31","1971-06-07","1971-06-14","1971-06-21","1971-06-28","1971-07-05","1971-07-12","1971-07-19","1971-07-26","1971-08-02","1971-08-09","1971-08-23","1971-08-30","1971-09-06","1971-09-13","1971-09-20","1971-09-27","1971-10-04","1971-10-11","1971-10-18","1971-10-25","1971-11-01","1971-11-08","1971-11-15","1971-11-22","1971-11-29","1971-12-06","1971-12-13","1971-12-20","1971-12-27","1972-01-03","1972-01-10","1972-01-17","1972-01-24","1972-01-31","1972-02-07","1972-02-14","1972-02-21","1972-02-28","1972-03-06","1972-03-13","1972-03-20","1972-03-27","1972-04-03","1972-04-10","1972-04-17","1972-04-24","1972-05-01","1972-05-08","1972-05-15","1972-05-22","1972-05-29","1972-06-05","1972-06-12","1972-06-19","1972-06-26","1972-07-03","1972-07-10","1972-07-17","1972-07-24","1972-07-31","1972-08-07","1972-08-14","1972-08-21","1972-08-28","1972-09-04","1972-09-11","1972-09-18","1972-09-25","1972-10-02","1972-10-09","1972-10-16","1972-10-23","1972-10-30","1972-11-06","1972-11-13","1972-11-20","1972-11-27","1972-12-04","1972-12-11","1972-12-18","1972-12-25","1973-01-01","1973-01-08","1973-01-15","1973-01-22","1973-01-29","1973-02-05","1973-02-12","1973-02-19","1973-02-26","1973-03-12","1973-03-19","1973-03-26","1973-04-02","1973-04-09","1973-04-16","1973-04-23","1973-04-30","1973-05-07","1973-05-14","1973-05-21","1973-05-28","1973-06-04","1973-06-11","1973-06-18","1973-06-25","1973-07-02","1973-07-09","1973-07-16","1973-07-23","1973-07-30","1973-08-06","1973-08-13","1973-08-20","1973-08-27","1973-09-03","1973-09-10","1973-09-17","1973-09-24","1973-10-01","1973-10-08","1973-10-15","1973-10-22","1973-10-29","1973-11-05","1973-11-12","1973-11-19","1973-11-26","1973-12-03","1973-12-10","1973-12-17","1973-12-24","1973-12-31","1974-01-07","1974-01-14","1974-01-21","1974-01-28","1974-02-04","1974-02-11","1974-02-18","1974-02-25","1974-03-04","1974-03-11","1974-03-18","1974-03-25","1974-04-01","1974-04-08","1974-04-15","1974-04-22","1974-04-29","1974-05-06","1974-05-13","1974-05-20","1974-05-27","1974-06-03","1974-06-10","1974-06-17","1974-06-24","1974-07-01","1974-07-08","1974-07-15","1974-07-22","1974-07-29","1974-08-05","1974-08-12","1974-08-19","1974-08-26","1974-09-02","1974-09-09","1974-09-16","1974-09-23","1974-09-30","1974-10-07","1974-10-14","1974-10-21","1974-10-28","1974-11-04","1974-11-11","1974-11-18","1974-11-25","1974-12-02","1974-12-09","1974-12-16","1974-12-23","1974-12-30","1975-01-06","1975-01-13","1975-01-20","1975-01-27","1975-02-03","1975-02-10","1975-02-17","1975-02-24","1975-03-03","1975-03-10","1975-03-17","1975-03-24","1975-03-31","1975-04-07","1975-04-14","1975-04-21","1975-04-28","1975-05-05","1975-05-12","1975-05-19","1975-05-26","1975-06-02","1975-06-09","1975-06-16","1975-06-23","1975-06-30","1975-07-07","1975-07-14","1975-07-21","1975-07-28","1975-08-04","1975-08-11","1975-08-18","1975-08-25","1975-09-01","1975-09-08","1975-09-15","1975-09-22","1975-09-29","1975-10-06","1975-10-13","1975-10-20","1975-10-27","1975-11-03","1975-11-10","1975-11-17","1975-11-24","1975-12-01","1975-12-08","1975-12-15","1975-12-22","1975-12-29","1976-01-05","1976-01-12","1976-01-19","1976-01-26","1976-02-02","1976-02-09","1976-02-16","1976-02-23","1976-03-01","1976-03-08","1976-03-15","1976-03-22","1976-03-29","1976-04-05","1976-04-12","1976-04-19","1976-04-26","1976-05-03","1976-05-10","1976-05-17","1976-05-24","1976-05-31","1976-06-07","1976-06-14","1976-06-21","1976-06-28","1976-07-05","1976-07-12","1976-07-19","1976-07-26","1976-08-02","1976-08-09","1976-08-16","1976-08-23","1976-08-30","1976-09-06","1976-09-13","1976-09-20","1976-09-27","1976-10-04","1976-10-11","1976-10-18","1976-10-25","1976-11-01","1976-11-08","1976-11-15","1976-11-22","1976-11-29","1976-12-06","1976-12-13","1976-12-20","1976-12-27","1977-01-03","1977-01-10","1977-01-17","1977-01-24","1977-01-31","1977-02-07","1977-02-14","1977-02-21","1977-02-28","1977-03-07","1977-03-14","1977-03-21","1977-03-28","1977-04-04","1977-04-11","1977-04-18","1977-04-25","1977-05-02","1977-05-09","1977-05-16","1977-05-23","1977-05-30","1977-06-06","1977-06-13","1977-06-20","1977-06-27","1977-07-04","1977-07-11","1977-07-18","1977-07-25","1977-08-01","1977-08-08","1977-08-15","1977-08-22","1977-08-29","1977-09-05","1977-09-12","1977-09-19","1977-09-26","1977-10-03","1977-10-10","1977-10-17","1977-10-24","1977-10-31","1977-11-07","1977-11-14","1977-11-21","1977-11-28","1977-12-05","1977-12-12","1977-12-19","1977-12-26","1978-01-02","1978-01-09","1978-01-16","1978-01-23","1978-01-30","1978-02-06","1978-02-13","1978-02-20","1978-02-27","1978-03-06","1978-03-13","1978-03-20","1978-03-27","1978-04-03","1978-04-10","1978-04-17","1978-04-24","1978-05-01","1978-05-08","1978-05-15","1978-05-22","1978-05-29","1978-06-05","1978-06-12","1978-06-19","1978-06-26","1978-07-03","1978-07-10","1978-07-17","1978-07-24","1978-07-31","1978-08-07","1978-08-14","1978-08-21","1978-08-28","1978-09-04","1978-09-11","1978-09-18","1978-09-25","1978-10-02","1978-10-09","1978-10-16","1978-10-23","1978-10-30","1978-11-06","1978-11-13","1978-11-20","1978-11-27","1978-12-04","1978-12-11","1978-12-18","1978-12-25","1979-01-01","1979-01-08","1979-01-15","1979-01-22","1979-01-29","1979-02-05","1979-02-12","1979-02-19","1979-02-26","1979-03-05","1979-03-12","1979-03-19","1979-03-26","1979-04-02","1979-04-09","1979-04-16","1979-04-23","1979-04-30","1979-05-07","1979-05-14","1979-05-21","1979-05-28","1979-06-04","1979-06-11","1979-06-18","1979-06-25","1979-07-02","1979-07-09","1979-07-16","1979-07-23","1979-07-30","1979-08-06","1979-08-13","1979-08-20","1979-08-27","1979-09-03","1979-09-10","1979-09-17","1979-09-24","1979-10-01","1979-10-08","1979-10-15","1979-10-22","1979-10-29","1979-11-05","1979-11-12","1979-11-19","1979-11-26","1979-12-03","1979-12-10","1979-12-17","1979-12-24","1979-12-31","1980-01-07","1980-01-14","1980-01-21","1980-01-28","1980-02-04","1980-02-11","1980-02-18","1980-02-25","1980-03-03","1980-03-10","1980-03-17","1980-03-24","1980-03-31","1980-04-07","1980-04-14","1980-04-21","1980-04-28","1980-05-05","1980-05-12","1980-05-19","1980-05-26","1980-06-02","1980-06-09","1980-06-16","1980-06-23","1980-06-30","1980-07-07","1980-07-14","1980-07-21","1980-07-28","1980-08-04","1980-08-11","1980-08-18","1980-08-25","1980-09-01","1980-09-08","1980-09-15","1980-09-22","1980-09-29","1980-10-06","1980-10-13","1980-10-20","1980-10-27","1980-11-03","1980-11-10","1980-11-17","1980-11-24","1980-12-01","1980-12-08","1980-12-15","1980-12-22","1980-12-29","1981-01-05","1981-01-12","1981-01-19","1981-01-26","1981-02-02","1981-02-09","1981-02-16","1981-02-23","1981-03-02","1981-03-09","1981-03-16","1981-03-23","1981-03-30","1981-04-06","1981-04-13","1981-04-20","1981-04-27","1981-05-04","1981-05-11","1981-05-18","1981-05-25","1981-06-01","1981-06-08","1981-06-15","1981-06-22","1981-06-29","1981-07-06","1981-07-13","1981-07-20","1981-07-27","1981-08-03","1981-08-10","1981-08-17","1981-08-24","1981-08-31","1981-09-07","1981-09-14","1981-09-21","1981-09-28","1981-10-05","1981-10-12","1981-10-19","1981-10-26","1981-11-02","1981-11-09","1981-11-16","1981-11-23","1981-11-30","1981-12-07","1981-12-14","1981-12-21","1981-12-28","1982-01-04","1982-01-11","1982-01-18","1982-01-25","1982-02-01","1982-02-08","1982-02-15","1982-02-22","1982-03-01","1982-03-08","1982-03-15","1982-03-22","1982-03-29","1982-04-05","1982-04-12","1982-04-19","1982-04-26","1982-05-03","1982-05-10","1982-05-17","1982-05-24","1982-05-31","1982-06-07","1982-06-14","1982-06-21","1982-06-28","1982-07-05","1982-07-12","1982-07-19","1982-07-26","1982-08-02","1982-08-09","1982-08-16","1982-08-23","1982-08-30","1982-09-06","1982-09-13","1982-09-20","1982-09-27","1982-10-04","1982-10-11","1982-10-18","1982-10-25","1982-11-01","1982-11-08","1982-11-15","1982-11-22","1982-11-29","1982-12-06","1982-12-13","1982-12-20","1982-12-27","1983-01-03","1983-01-10","1983-01-17","1983-01-24","1983-01-31","1983-02-07","1983-02-14","1983-02-21","1983-02-28","1983-03-07","1983-03-14","1983-03-21","1983-03-28","1983-04-04","1983-04-11","1983-04-18","1983-04-25","1983-05-02","1983-05-09","1983-05-16","1983-05-23","1983-05-30","1983-06-06","1983-06-13","1983-06-20","1983-06-27","1983-07-04","1983-07-11","1983-07-18","1983-07-25","1983-08-01","1983-08-08","1983-08-15","1983-08-22","1983-08-29","1983-09-05","1983-09-12","1983-09-19","1983-09-26","1983-10-03","1983-10-10","1983-10-17","1983-10-24","1983-10-31","1983-11-07","1983-11-14","1983-11-21","1983-11-28","1983-12-05","1983-12-12","1983-12-19","1983-12-26","1984-01-02","1984-01-09","1984-01-16","1984-01-23","1984-01-30","1984-02-06","1984-02-13","1984-02-20","1984-02-27","1984-03-05","1984-03-12","1984-03-19","1984-03-26","1984-04-02","1984-04-09","1984-04-16","1984-04-23","1984-04-30","1984-05-07","1984-05-14","1984-05-21","1984-05-28","1984-06-04","1984-06-11","1984-06-18","1984-06-25","1984-07-02","1984-07-09","1984-07-16","1984-07-23","1984-07-30","1984-08-06","1984-08-13","1984-08-20","1984-08-27","1984-09-03","1984-09-10","1984-09-17","1984-09-24","1984-10-01","1984-10-08","1984-10-15","1984-10-22","1984-10-29","1984-11-05","1984-11-12","1984-11-19","1984-11-26","1984-12-03","1984-12-10","1984-12-17","1984-12-24","1984-12-31","1985-01-07","1985-01-14","1985-01-21","1985-01-28","1985-02-04","1985-02-11","1985-02-18","1985-02-25","1985-03-04","1985-03-11","1985-03-18","1985-03-25","1985-04-01","1985-04-08","1985-04-15","1985-04-22","1985-04-29","1985-05-06","1985-05-13","1985-05-20","1985-05-27","1985-06-03","1985-06-10","1985-06-17","1985-06-24","1985-07-01","1985-07-08","1985-07-15","1985-07-22","1985-07-29","1985-08-05","1985-08-12","1985-08-19","1985-08-26","1985-09-02","1985-09-09","1985-09-16","1985-09-23","1985-09-30","1985-10-07","1985-10-14","1985-10-21","1985-10-28","1985-11-04","1985-11-11","1985-11-18","1985-11-25","1985-12-02","1985-12-09","1985-12-16","1985-12-23","1985-12-30","1986-01-06","1986-01-13","1986-01-20","1986-01-27","1986-02-03","1986-02-10","1986-02-17","1986-02-24","1986-03-03","1986-03-10","1986-03-17","1986-03-24","1986-03-31","1986-04-07","1986-04-14","1986-04-21","1986-04-28","1986-05-05","1986-05-12","1986-05-19","1986-05-26","1986-06-02","1986-06-09","1986-06-16","1986-06-23","1986-06-30","1986-07-07","1986-07-14","1986-07-21","1986-07-28","1986-08-04","1986-08-11","1986-08-18","1986-08-25","1986-09-01","1986-09-08","1986-09-15","1986-09-22","1986-09-29","1986-10-06","1986-10-13","1986-10-20","1986-10-27","1986-11-03","1986-11-10","1986-11-17","1986-11-24","1986-12-01","1986-12-08","1986-12-15","1986-12-22","1986-12-29","1987-01-05","1987-01-12","1987-01-19","1987-01-26","1987-02-02","1987-02-09","1987-02-16","1987-02-23","1987-03-02","1987-03-09","1987-03-16","1987-03-23","1987-03-30","1987-04-06","1987-04-13","1987-04-20","1987-04-27","1987-05-04","1987-05-11","1987-05-18","1987-05-25","1987-06-01","1987-06-08","1987-06-15","1987-06-22","1987-06-29","1987-07-06","1987-07-13","1987-07-20","1987-07-27","1987-08-03","1987-08-10","1987-08-17","1987-08-24","1987-08-31","1987-09-07","1987-09-14","1987-09-21","1987-09-28","1987-10-05","1987-10-12","1987-10-19","1987-10-26","1987-11-02","1987-11-09","1987-11-16","1987-11-23","1987-11-30","1987-12-07","1987-12-14","1987-12-21","1987-12-28","1988-01-04","1988-01-11","1988-01-18","1988-01-25","1988-02-01","1988-02-08","1988-02-15","1988-02-22","1988-02-29","1988-03-07","1988-03-14","1988-03-21","1988-03-28","1988-04-04","1988-04-11","1988-04-18","1988-04-25","1988-05-02","1988-05-09","1988-05-16","1988-05-23","1988-05-30","1988-06-06","1988-06-13","1988-06-20","1988-06-27","1988-07-04","1988-07-11","1988-07-18","1988-07-25","1988-08-01","1988-08-08","1988-08-15","1988-08-22","1988-08-29","1988-09-05","1988-09-12","1988-09-19","1988-09-26","1988-10-03","1988-10-10","1988-10-17","1988-10-24","1988-10-31","1988-11-07","1988-11-14","1988-11-21","1988-11-28","1988-12-05","1988-12-12","1988-12-19","1988-12-26","1989-01-02","1989-01-09","1989-01-16","1989-01-23","1989-01-30","1989-02-06","1989-02-13","1989-02-20","1989-02-27","1989-03-06","1989-03-13","1989-03-20","1989-03-27","1989-04-03","1989-04-10","1989-04-17","1989-04-24","1989-05-01","1989-05-08","1989-05-15","1989-05-22","1989-05-29","1989-06-05","1989-06-12","1989-06-19","1989-06-26","1989-07-03","1989-07-10","1989-07-17","1989-07-24","1989-07-31","1989-08-07","1989-08-14","1989-08-21","1989-08-28","1989-09-04","1989-09-11","1989-09-18","1989-09-25","1989-10-02","1989-10-09","1989-10-16","1989-10-23","1989-10-30","1989-11-06","1989-11-13","1989-11-20","1989-11-27","1989-12-04","1989-12-11","1989-12-18","1989-12-25","1990-01-01","1990-01-08","1990-01-15","1990-01-22","1990-01-29","1990-02-05","1990-02-12","1990-02-19","1990-02-26","1990-03-05","1990-03-12","1990-03-19","1990-03-26","1990-04-02","1990-04-09","1990-04-16","1990-04-23","1990-04-30","1990-05-07","1990-05-14","1990-05-21","1990-05-28","1990-06-04","1990-06-11","1990-06-18","1990-06-25","1990-07-02","1990-07-09","1990-07-16","1990-07-23","1990-07-30","1990-08-06","1990-08-13","1990-08-20","1990-08-27","1990-09-03","1990-09-10","1990-09-17","1990-09-24","1990-10-01","1990-10-08","1990-10-15","1990-10-22","1990-10-29","1990-11-05","1990-11-12","1990-11-19","1990-11-26","1990-12-03","1990-12-10","1990-12-17","1990-12-24","1990-12-31","1991-01-07","1991-01-14","1991-01-21","1991-01-28","1991-02-04","1991-02-11","1991-02-18","1991-02-25","1991-03-04","1991-03-11","1991-03-18","1991-03-25","1991-04-01","1991-04-08","1991-04-15","1991-04-22","1991-04-29","1991-05-06","1991-05-13","1991-05-20","1991-05-27","1991-06-03","1991-06-10","1991-06-17","1991-06-24","1991-07-01","1991-07-08","1991-07-15","1991-07-22","1991-07-29","1991-08-05","1991-08-12","1991-08-19","1991-08-26","1991-09-02","1991-09-09","1991-09-16","1991-09-23","1991-09-30","1991-10-07","1991-10-14","1991-10-21","1991-10-28","1991-11-04","1991-11-11","1991-11-18","1991-11-25","1991-12-02","1991-12-09","1991-12-16","1991-12-23","1991-12-30","1992-01-06","1992-01-13","1992-01-20","1992-01-27","1992-02-03","1992-02-10","1992-02-17","1992-02-24","1992-03-02","1992-03-09","1992-03-16","1992-03-23","1992-03-30","1992-04-06","1992-04-13","1992-04-20","1992-04-27","1992-05-04","1992-05-11","1992-05-18","1992-05-25","1992-06-01","1992-06-08","1992-06-15","1992-06-22","1992-06-29","1992-07-06","1992-07-13","1992-07-20","1992-07-27","1992-08-03","1992-08-10","1992-08-17","1992-08-24","1992-08-31","1992-09-07","1992-09-14","1992-09-21","1992-09-28","1992-10-05","1992-10-12","1992-10-19","1992-10-26","1992-11-02","1992-11-09","1992-11-16","1992-11-23","1992-11-30","1992-12-07","1992-12-14","1992-12-21","1992-12-28","1993-01-04","1993-01-11","1993-01-18","1993-01-25","1993-02-01","1993-02-08","1993-02-15","1993-02-22","1993-03-01","1993-03-08","1993-03-15","1993-03-22","1993-03-29","1993-04-05","1993-04-12","1993-04-19","1993-04-26","1993-05-03","1993-05-10","1993-05-17","1993-05-24","1993-05-31","1993-06-07","1993-06-14","1993-06-21","1993-06-28","1993-07-05","1993-07-12","1993-07-19","1993-07-26","1993-08-02","1993-08-09","1993-08-16","1993-08-23","1993-08-30","1993-09-06","1993-09-13","1993-09-20","1993-09-27","1993-10-04","1993-10-11","1993-10-18","1993-10-25","1993-11-01","1993-11-08","1993-11-15","1993-11-22","1993-11-29","1993-12-06","1993-12-13","1993-12-20","1993-12-27","1994-01-03","1994-01-10","1994-01-17","1994-01-24","1994-01-31","1994-02-07","1994-02-14","1994-02-21","1994-02-28","1994-03-07","1994-03-14","1994-03-21","1994-03-28","1994-04-04","1994-04-11","1994-04-18","1994-04-25","1994-05-02","1994-05-09","1994-05-16","1994-05-23","1994-05-30","1994-06-06","1994-06-13","1994-06-20","1994-06-27","1994-07-04","1994-07-11","1994-07-18","1994-07-25","1994-08-01","1994-08-08","1994-08-15","1994-08-22","1994-08-29","1994-09-05","1994-09-12","1994-09-19","1994-09-26","1994-10-03","1994-10-10","1994-10-17","1994-10-24","1994-10-31","1994-11-07","1994-11-14","1994-11-21","1994-11-28","1994-12-05","1994-12-12","1994-12-19","1994-12-26","1995-01-02","1995-01-09","1995-01-16","1995-01-23","1995-01-30","1995-02-06","1995-02-13","1995-02-20","1995-02-27","1995-03-06","1995-03-13","1995-03-20","1995-03-27","1995-04-03","1995-04-10","1995-04-17","1995-04-24","1995-05-01","1995-05-08","1995-05-15","1995-05-22","1995-05-29","1995-06-05","1995-06-12","1995-06-19","1995-06-26","1995-07-03","1995-07-10","1995-07-17","1995-07-24","1995-07-31","1995-08-07","1995-08-14","1995-08-21","1995-08-28","1995-09-04","1995-09-11","1995-09-18","1995-09-25","1995-10-02","1995-10-09","1995-10-16","1995-10-23","1995-10-30","1995-11-06","1995-11-13","1995-11-20","1995-11-27","1995-12-04","1995-12-11","1995-12-18","1995-12-25","1996-01-01","1996-01-08","1996-01-15","1996-01-22","1996-01-29","1996-02-05","1996-02-12","1996-02-19","1996-02-26","1996-03-04","1996-03-11","1996-03-18","1996-03-25","1996-04-01","1996-04-08","1996-04-15","1996-04-22","1996-04-29","1996-05-06","1996-05-13","1996-05-20","1996-05-27","1996-06-03","1996-06-10","1996-06-17","1996-06-24","1996-07-01","1996-07-08","1996-07-15","1996-07-22","1996-07-29","1996-08-05","1996-08-12","1996-08-19","1996-08-26","1996-09-02","1996-09-09","1996-09-16","1996-09-23","1996-09-30","1996-10-07","1996-10-14","1996-10-21","1996-10-28","1996-11-04","1996-11-11","1996-11-18","1996-11-25","1996-12-02","1996-12-09","1996-12-16","1996-12-23","1996-12-30","1997-01-06","1997-01-13","1997-01-20","1997-01-27","1997-02-03","1997-02-10","1997-02-17","1997-02-24","1997-03-03","1997-03-10","1997-03-17","1997-03-24","1997-03-31","1997-04-07","1997-04-14","1997-04-21","1997-04-28","1997-05-05","1997-05-12","1997-05-19","1997-05-26","1997-06-02","1997-06-09","1997-06-16","1997-06-23","1997-06-30","1997-07-07","1997-07-14","1997-07-21","1997-07-28","1997-08-04","1997-08-11","1997-08-18","1997-08-25","1997-09-01","1997-09-08","1997-09-15","1997-09-22","1997-09-29","1997-10-06","1997-10-13","1997-10-20","1997-10-27","1997-11-03","1997-11-10","1997-11-17","1997-11-24","1997-12-01","1997-12-08","1997-12-15","1997-12-22","1997-12-29","1998-01-05","1998-01-12","1998-01-19","1998-01-26","1998-02-02","1998-02-09","1998-02-16","1998-02-23","1998-03-02","1998-03-09","1998-03-16","1998-03-23","1998-03-30","1998-04-06","1998-04-13","1998-04-20","1998-04-27","1998-05-04","1998-05-11","1998-05-18","1998-05-25","1998-06-01","1998-06-08","1998-06-15","1998-06-22","1998-06-29","1998-07-06","1998-07-13","1998-07-20","1998-07-27","1998-08-03","1998-08-10","1998-08-17","1998-08-24","1998-08-31","1998-09-07","1998-09-14","1998-09-21","1998-09-28","1998-10-05","1998-10-12","1998-10-19","1998-10-26","1998-11-02","1998-11-09","1998-11-16","1998-11-23","1998-11-30","1998-12-07","1998-12-14","1998-12-21","1998-12-28","1999-01-04","1999-01-11","1999-01-18","1999-01-25","1999-02-01","1999-02-08","1999-02-15","1999-02-22","1999-03-01","1999-03-08","1999-03-15","1999-03-22","1999-03-29","1999-04-05","1999-04-12","1999-04-19","1999-04-26","1999-05-03","1999-05-10","1999-05-17","1999-05-24","1999-05-31","1999-06-07","1999-06-14","1999-06-21","1999-06-28","1999-07-05","1999-07-12","1999-07-19","1999-07-26","1999-08-02","1999-08-09","1999-08-16","1999-08-23","1999-08-30","1999-09-06","1999-09-13","1999-09-20","1999-09-27","1999-10-04","1999-10-11","1999-10-18","1999-10-25","1999-11-01","1999-11-08","1999-11-15","1999-11-22","1999-11-29","1999-12-06","1999-12-13","1999-12-20","1999-12-27","2000-01-03","2000-01-10","2000-01-17","2000-01-24","2000-01-31","2000-02-07","2000-02-14","2000-02-21","2000-02-28","2000-03-06","2000-03-13","2000-03-20","2000-03-27","2000-04-03","2000-04-10","2000-04-17","2000-04-24","2000-05-01","2000-05-08","2000-05-15","2000-05-22","2000-05-29","2000-06-05","2000-06-12","2000-06-19","2000-06-26","2000-07-03","2000-07-10","2000-07-17","2000-07-24","2000-07-31","2000-08-07","2000-08-14","2000-08-21","2000-08-28","2000-09-04","2000-09-11","2000-09-18","2000-09-25","2000-10-02","2000-10-09","2000-10-16","2000-10-23","2000-10-30","2000-11-06","2000-11-13","2000-11-20","2000-11-27","2000-12-04","2000-12-11","2000-12-18","2000-12-25","2001-01-01","2001-01-08","2001-01-15","2001-01-22","2001-01-29","2001-02-05","2001-02-12","2001-02-19","2001-02-26","2001-03-05","2001-03-12","2001-03-19","2001-03-26","2001-04-02","2001-04-09","2001-04-16","2001-04-23","2001-04-30","2001-05-07","2001-05-14","2001-05-21","2001-05-28","2001-06-04","2001-06-11","2001-06-18","2001-06-25","2001-07-02","2001-07-09","2001-07-16","2001-07-23","2001-07-30","2001-08-06","2001-08-13","2001-08-20","2001-08-27","2001-09-03","2001-09-10","2001-09-17","2001-09-24","2001-10-01","2001-10-08","2001-10-15","2001-10-22","2001-10-29","2001-11-05","2001-11-12","2001-11-19","2001-11-26","2001-12-03","2001-12-10","2001-12-17","2001-12-24","2001-12-31","2002-01-07","2002-01-14","2002-01-21","2002-01-28","2002-02-04","2002-02-11","2002-02-18","2002-02-25","2002-03-04","2002-03-11","2002-03-18","2002-03-25","2002-04-01","2002-04-08","2002-04-15","2002-04-22","2002-04-29","2002-05-06","2002-05-13","2002-05-20","2002-05-27","2002-06-03","2002-06-10","2002-06-17","2002-06-24","2002-07-01","2002-07-08","2002-07-15","2002-07-22","2002-07-29","2002-08-05","2002-08-12","2002-08-19","2002-08-26","2002-09-02","2002-09-09","2002-09-16","2002-09-23","2002-09-30","2002-10-07","2002-10-14","2002-10-21","2002-10-28","2002-11-04","2002-11-11","2002-11-18","2002-11-25","2002-12-02","2002-12-09","2002-12-16","2002-12-23","2002-12-30","2003-01-06","2003-01-13","2003-01-20","2003-01-27","2003-02-03","2003-02-10","2003-02-17","2003-02-24","2003-03-03","2003-03-10","2003-03-17","2003-03-24","2003-03-31","2003-04-07","2003-04-14","2003-04-21","2003-04-28","2003-05-05","2003-05-12","2003-05-19","2003-05-26","2003-06-02","2003-06-09","2003-06-16","2003-06-23","2003-06-30","2003-07-07","2003-07-14","2003-07-21","2003-07-28","2003-08-04","2003-08-11","2003-08-18","2003-08-25","2003-09-01","2003-09-08","2003-09-15","2003-09-22","2003-09-29","2003-10-06","2003-10-13","2003-10-20","2003-10-27","2003-11-03","2003-11-10","2003-11-17","2003-11-24","2003-12-01","2003-12-08","2003-12-15","2003-12-22","2003-12-29","2004-01-05","2004-01-12","2004-01-19","2004-01-26","2004-02-02","2004-02-09","2004-02-16","2004-02-23","2004-03-01","2004-03-08","2004-03-15","2004-03-22","2004-03-29","2004-04-05","2004-04-12","2004-04-19","2004-04-26","2004-05-03","2004-05-10","2004-05-17","2004-05-24","2004-05-31","2004-06-07","2004-06-14","2004-06-21","2004-06-28","2004-07-05","2004-07-12","2004-07-19","2004-07-26","2004-08-02","2004-08-09","2004-08-16","2004-08-23","2004-08-30","2004-09-06","2004-09-13","2004-09-20","2004-09-27","2004-10-04","2004-10-11","2004-10-18","2004-10-25","2004-11-01","2004-11-08","2004-11-15","2004-11-22","2004-11-29","2004-12-06","2004-12-13","2004-12-20","2004-12-27","2005-01-03","2005-01-10","2005-01-17","2005-01-24","2005-01-31","2005-02-07","2005-02-14","2005-02-21","2005-02-28","2005-03-07","2005-03-14","2005-03-21","2005-03-28","2005-04-04","2005-04-11","2005-04-18","2005-04-25","2005-05-02","2005-05-09","2005-05-16","2005-05-23","2005-05-30","2005-06-06","2005-06-13","2005-06-20","2005-06-27","2005-07-04","2005-07-11","2005-07-18","2005-07-25","2005-08-01","2005-08-08","2005-08-15","2005-08-22","2005-08-29","2005-09-05","2005-09-12","2005-09-19","2005-09-26","2005-10-03","2005-10-10","2005-10-17","2005-10-24","2005-10-31","2005-11-07","2005-11-14","2005-11-21","2005-11-28","2005-12-05","2005-12-12","2005-12-19","2005-12-26","2006-01-02","2006-01-09","2006-01-16","2006-01-23","2006-01-30","2006-02-06","2006-02-13","2006-02-20","2006-02-27","2006-03-06","2006-03-13","2006-03-20","2006-03-27","2006-04-03","2006-04-10","2006-04-17","2006-04-24","2006-05-01","2006-05-08","2006-05-15","2006-05-22","2006-05-29","2006-06-05","2006-06-12","2006-06-19","2006-06-26","2006-07-03","2006-07-10","2006-07-17","2006-07-24","2006-07-31","2006-08-07","2006-08-14","2006-08-21","2006-08-28","2006-09-04","2006-09-11","2006-09-18","2006-09-25","2006-10-02","2006-10-09","2006-10-16","2006-10-23","2006-10-30","2006-11-06","2006-11-13","2006-11-20","2006-11-27","2006-12-04","2006-12-11","2006-12-18","2006-12-25","2007-01-01","2007-01-08","2007-01-15","2007-01-22","2007-01-29","2007-02-05","2007-02-12","2007-02-19","2007-02-26","2007-03-05","2007-03-12","2007-03-19","2007-03-26","2007-04-02","2007-04-09","2007-04-16","2007-04-23","2007-04-30","2007-05-07","2007-05-14","2007-05-21","2007-05-28","2007-06-04","2007-06-11","2007-06-18","2007-06-25","2007-07-02","2007-07-09","2007-07-16","2007-07-23","2007-07-30","2007-08-06","2007-08-13","2007-08-20","2007-08-27","2007-09-03","2007-09-10","2007-09-17","2007-09-24","2007-10-01","2007-10-08","2007-10-15","2007-10-22","2007-10-29","2007-11-05","2007-11-12","2007-11-19","2007-11-26","2007-12-03","2007-12-10","2007-12-17","2007-12-24","2007-12-31","2008-01-07","2008-01-14","2008-01-21","2008-01-28","2008-02-04","2008-02-11","2008-02-18","2008-02-25","2008-03-03","2008-03-10","2008-03-17","2008-03-24","2008-03-31","2008-04-07","2008-04-14","2008-04-21","2008-04-28","2008-05-05","2008-05-12","2008-05-19","2008-05-26","2008-06-02","2008-06-09","2008-06-16","2008-06-23","2008-06-30","2008-07-07","2008-07-14","2008-07-21","2008-07-28","2008-08-04","2008-08-11","2008-08-18","2008-08-25","2008-09-01","2008-09-08","2008-09-15","2008-09-22","2008-09-29","2008-10-06","2008-10-13","2008-10-20","2008-10-27","2008-11-03","2008-11-10","2008-11-17","2008-11-24","2008-12-01","2008-12-08","2008-12-15","2008-12-22","2008-12-29","2009-01-05","2009-01-12","2009-01-19","2009-01-26","2009-02-02","2009-02-09","2009-02-16","2009-02-23","2009-03-02","2009-03-09","2009-03-16","2009-03-23","2009-03-30","2009-04-06","2009-04-13","2009-04-20","2009-04-27","2009-05-04","2009-05-11","2009-05-18","2009-05-25","2009-06-01","2009-06-08","2009-06-15","2009-06-22","2009-06-29","2009-07-06","2009-07-13","2009-07-20","2009-07-27","2009-08-03","2009-08-10","2009-08-17","2009-08-24","2009-08-31","2009-09-07","2009-09-14","2009-09-21","2009-09-28","2009-10-05","2009-10-12","2009-10-19","2009-10-26","2009-11-02","2009-11-09","2009-11-16","2009-11-23","2009-11-30","2009-12-07","2009-12-14","2009-12-21","2009-12-28","2010-01-04","2010-01-11","2010-01-18","2010-01-25","2010-02-01","2010-02-08","2010-02-15","2010-02-22","2010-03-01","2010-03-08","2010-03-15","2010-03-22","2010-03-29","2010-04-05","2010-04-12","2010-04-19","2010-04-26","2010-05-03","2010-05-10","2010-05-17","2010-05-24","2010-05-31","2010-06-07","2010-06-14","2010-06-21","2010-06-28","2010-07-05","2010-07-12","2010-07-19","2010-07-26","2010-08-02","2010-08-09","2010-08-16","2010-08-23","2010-08-30","2010-09-06","2010-09-13","2010-09-20","2010-09-27","2010-10-04","2010-10-11","2010-10-18","2010-10-25","2010-11-01","2010-11-08","2010-11-15","2010-11-22","2010-11-29","2010-12-06","2010-12-13","2010-12-20","2010-12-27","2011-01-03","2011-01-10","2011-01-17","2011-01-24","2011-01-31","2011-02-07","2011-02-14","2011-02-21","2011-02-28","2011-03-07","2011-03-14","2011-03-21","2011-03-28","2011-04-04","2011-04-11","2011-04-18","2011-04-25","2011-05-02","2011-05-09","2011-05-16","2011-05-23","2011-05-30","2011-06-06","2011-06-13","2011-06-20","2011-06-27","2011-07-04","2011-07-11","2011-07-18","2011-07-25","2011-08-01","2011-08-08","2011-08-15","2011-08-22","2011-08-29","2011-09-05","2011-09-12","2011-09-19","2011-09-26","2011-10-03","2011-10-10","2011-10-17","2011-10-24","2011-10-31","2011-11-07","2011-11-14","2011-11-21","2011-11-28","2011-12-05","2011-12-12","2011-12-19","2011-12-26","2012-01-02","2012-01-09","2012-01-16","2012-01-23","2012-01-30","2012-02-06","2012-02-13","2012-02-20","2012-02-27","2012-03-05","2012-03-12","2012-03-19","2012-03-26","2012-04-02","2012-04-09","2012-04-16","2012-04-23","2012-04-30","2012-05-07","2012-05-14","2012-05-21","2012-05-28","2012-06-04","2012-06-11","2012-06-18","2012-06-25","2012-07-02","2012-07-09","2012-07-16","2012-07-23","2012-07-30","2012-08-06","2012-08-13","2012-08-20","2012-08-27","2012-09-03","2012-09-10","2012-09-17","2012-09-24","2012-10-01","2012-10-08","2012-10-15","2012-10-22","2012-10-29","2012-11-05","2012-11-12","2012-11-19","2012-11-26","2012-12-03","2012-12-10","2012-12-17","2012-12-24","2012-12-31","2013-01-07","2013-01-14","2013-01-21","2013-01-28","2013-02-04","2013-02-11","2013-02-18","2013-02-25","2013-03-04","2013-03-11","2013-03-18","2013-03-25","2013-04-01","2013-04-08","2013-04-15","2013-04-22","2013-04-29","2013-05-06","2013-05-13","2013-05-20","2013-05-27","2013-06-03","2013-06-10","2013-06-17","2013-06-24","2013-07-01","2013-07-08","2013-07-15","2013-07-22","2013-07-29","2013-08-05","2013-08-12","2013-08-19","2013-08-26","2013-09-02","2013-09-09","2013-09-16","2013-09-23","2013-09-30","2013-10-07","2013-10-14","2013-10-21","2013-10-28","2013-11-04","2013-11-11","2013-11-18","2013-11-25","2013-12-02","2013-12-09","2013-12-16","2013-12-23","2013-12-30","2014-01-06","2014-01-13","2014-01-20","2014-01-27","2014-02-03","2014-02-10","2014-02-17","2014-02-24","2014-03-03","2014-03-10","2014-03-17","2014-03-24","2014-03-31","2014-04-07","2014-04-14","2014-04-21","2014-04-28","2014-05-05","2014-05-12","2014-05-19","2014-05-26","2014-06-02","2014-06-09","2014-06-16","2014-06-23","2014-06-30","2014-07-07","2014-07-14","2014-07-21","2014-07-28","2014-08-04","2014-08-11","2014-08-18","2014-08-25","2014-09-01","2014-09-08","2014-09-15","2014-09-22","2014-09-29","2014-10-06","2014-10-13","2014-10-20","2014-10-27","2014-11-03","2014-11-10","2014-11-17","2014-11-24","2014-12-01","2014-12-08","2014-12-15","2014-12-22","2014-12-29","2015-01-05","2015-01-12","2015-01-19","2015-01-26","2015-02-02","2015-02-09","2015-02-16","2015-02-23","2015-03-02","2015-03-09","2015-03-16","2015-03-23","2015-03-30","2015-04-06","2015-04-13","2015-04-20","2015-04-27","2015-05-04","2015-05-11","2015-05-18","2015-05-25","2015-06-01","2015-06-08","2015-06-15","2015-06-22","2015-06-29","2015-07-06","2015-07-13","2015-07-20","2015-07-27","2015-08-03","2015-08-10","2015-08-17","2015-08-24","2015-08-31","2015-09-07","2015-09-14","2015-09-21","2015-09-28","2015-10-05","2015-10-12","2015-10-19","2015-10-26","2015-11-02","2015-11-09","2015-11-16","2015-11-23","2015-11-30","2015-12-07","2015-12-14","2015-12-21","2015-12-28","2016-01-04","2016-01-11","2016-01-18","2016-01-25","2016-02-01","2016-02-08","2016-02-15","2016-02-22","2016-02-29","2016-03-07","2016-03-14","2016-03-21","2016-03-28","2016-04-04","2016-04-11","2016-04-18","2016-04-25","2016-05-02","2016-05-09","2016-05-16","2016-05-23","2016-05-30","2016-06-06","2016-06-13","2016-06-20","2016-06-27","2016-07-04","2016-07-11","2016-07-18","2016-07-25","2016-08-01","2016-08-08","2016-08-15","2016-08-22","2016-08-29","2016-09-05","2016-09-12","2016-09-19","2016-09-26","2016-10-03","2016-10-10","2016-10-17","2016-10-24","2016-10-31","2016-11-07","2016-11-14","2016-11-21","2016-11-28","2016-12-05","2016-12-12","2016-12-19","2016-12-26","2017-01-02","2017-01-09","2017-01-16","2017-01-23","2017-01-30","2017-02-06","2017-02-13","2017-02-20","2017-02-27","2017-03-06","2017-03-13","2017-03-20","2017-03-27","2017-04-03","2017-04-10","2017-04-17","2017-04-24","2017-05-01","2017-05-08","2017-05-15","2017-05-22","2017-05-29","2017-06-05","2017-06-12","2017-06-19","2017-06-26","2017-07-03","2017-07-10","2017-07-17","2017-07-24","2017-07-31","2017-08-07","2017-08-14","2017-08-21","2017-08-28","2017-09-04","2017-09-11","2017-09-18","2017-09-25","2017-10-02","2017-10-09","2017-10-16","2017-10-23","2017-10-30","2017-11-06","2017-11-13","2017-11-20","2017-11-27","2017-12-04","2017-12-11","2017-12-18","2017-12-25","2018-01-01","2018-01-08","2018-01-15","2018-01-22","2018-01-29","2018-02-05","2018-02-12","2018-02-19","2018-02-26","2018-03-05","2018-03-12","2018-03-19","2018-03-26","2018-04-02","2018-04-09","2018-04-16","2018-04-23","2018-04-30","2018-05-07","2018-05-14","2018-05-21","2018-05-28","2018-06-04","2018-06-11","2018-06-18","2018-06-25","2018-07-02","2018-07-09","2018-07-16","2018-07-23","2018-07-30","2018-08-06","2018-08-13","2018-08-20","2018-08-27","2018-09-03","2018-09-10","2018-09-17","2018-09-24","2018-10-01","2018-10-08","2018-10-15","2018-10-22","2018-10-29","2018-11-05","2018-11-12","2018-11-19","2018-11-26","2018-12-03","2018-12-10","2018-12-17","2018-12-24","2018-12-31","2019-01-07","2019-01-14","2019-01-21","2019-01-28","2019-02-04","2019-02-11","2019-02-18","2019-02-25","2019-03-04","2019-03-11","2019-03-18","2019-03-25","2019-04-01","2019-04-08","2019-04-15","2019-04-22","2019-04-29","2019-05-06","2019-05-13","2019-05-20","2019-05-27","2019-06-03","2019-06-10","2019-06-17","2019-06-24","2019-07-01","2019-07-08","2019-07-15","2019-07-22","2019-07-29","2019-08-05","2019-08-12","2019-08-19","2019-08-26","2019-09-02","2019-09-09","2019-09-16","2019-09-23","2019-09-30","2019-10-07","2019-10-14","2019-10-21","2019-10-28","2019-11-04","2019-11-11","2019-11-18","2019-11-25","2019-12-02","2019-12-09","2019-12-16","2019-12-23","2019-12-30","2020-01-06","2020-01-13","2020-01-20","2020-01-27","2020-02-03","2020-02-10","2020-02-17","2020-02-24","2020-03-02","2020-03-09","2020-03-16","2020-03-23","2020-03-30","2020-04-06","2020-04-13","2020-04-20","2020-04-27","2020-05-04","2020-05-11","2020-05-18","2020-05-25","2020-06-01","2020-06-08","2020-06-15","2020-06-22","2020-06-29","2020-07-06","2020-07-13","2020-07-20","2020-07-27","2020-08-03","2020-08-10","2020-08-17","2020-08-24","2020-08-31","2020-09-07","2020-09-14","2020-09-21","2020-09-28","2020-10-05","2020-10-12","2020-10-19","2020-10-26","2020-11-02","2020-11-09","2020-11-16","2020-11-23","2020-11-30","2020-12-07","2020-12-14","2020-12-21","2020-12-28","2021-01-04","2021-01-11","2021-01-18","2021-01-25","2021-02-01","2021-02-08","2021-02-15","2021-02-22","2021-03-01","2021-03-08","2021-03-15","2021-03-22","2021-03-29","2021-04-05","2021-04-12","2021-04-19","2021-04-26","2021-05-03","2021-05-10","2021-05-17","2021-05-24","2021-05-31","2021-06-07","2021-06-14","2021-06-21","2021-06-28","2021-07-05","2021-07-12","2021-07-19","2021-07-26","2021-08-02","2021-08-09","2021-08-16","2021-08-23","2021-08-30","2021-09-06","2021-09-13","2021-09-20","2021-09-27","2021-10-04","2021-10-11","2021-10-18","2021-10-25","2021-11-01","2021-11-08","2021-11-15","2021-11-22","2021-11-29","2021-12-06","2021-12-13","2021-12-20","2021-12-27","2022-01-03","2022-01-10","2022-01-17","2022-01-24","2022-01-31","2022-02-07","2022-02-14","2022-02-21","2022-02-28","2022-03-07","2022-03-14","2022-03-21","2022-03-28","2022-04-04","2022-04-11","2022-04-18","2022-04-25","2022-05-02","2022-05-09","2022-05-16","2022-05-23","2022-05-30","2022-06-06","2022-06-13","2022-06-20","2022-06-27","2022-07-04","2022-07-11","2022-07-18","2022-07-25","2022-08-01","2022-08-08","2022-08-15","2022-08-22","2022-08-29","2022-09-05","2022-09-12","2022-09-19","2022-09-26","2022-10-03","2022-10-10","2022-10-17","2022-10-24","2022-10-31","2022-11-07","2022-11-14","2022-11-21","2022-11-28","2022-12-05","2022-12-12","2022-12-19","2022-12-26","2023-01-02","2023-01-09","2023-01-16","2023-01-23","2023-01-30","2023-02-06","2023-02-13","2023-02-20","2023-02-27","2023-03-06","2023-03-13","2023-03-20","2023-03-27","2023-04-03","2023-04-10","2023-04-17","2023-04-24","2023-05-01","2023-05-08","2023-05-15","2023-05-22","2023-05-29","2023-06-05","2023-06-12","2023-06-19","2023-06-26","2023-07-03","2023-07-10","2023-07-17","2023-07-24","2023-07-31","2023-08-07","2023-08-14","2023-08-21","2023-08-28","2023-09-04","2023-09-11","2023-09-18","2023-09-25","2023-10-02","2023-10-09","2023-10-16","2023-10-23","2023-10-30","2023-11-06","2023-11-13","2023-11-20","2023-11-27","2023-12-04","2023-12-11","2023-12-18","2023-12-25","2024-01-01","2024-01-08","2024-01-15","2024-01-22","2024-01-29","2024-02-05","2024-02-12","2024-02-19","2024-02-26","2024-03-04","2024-03-11","2024-03-18","2024-03-25","2024-04-01","2024-04-08","2024-04-15","2024-04-22","2024-04-29","2024-05-06","2024-05-13","2024-05-20","2024-05-27","2024-06-03","2024-06-10","2024-06-17","2024-06-24","2024-07-01","2024-07-08","2024-07-15","2024-07-22","2024-07-29","2024-08-05","2024-08-12","2024-08-19","2024-08-26","2024-09-02","2024-09-09","2024-09-16","2024-09-23","2024-09-30","2024-10-07","2024-10-14","2024-10-21","2024-10-28","2024-11-04","2024-11-11","2024-11-18","2024-11-25","2024-12-02","2024-12-09","2024-12-16","2024-12-23","2024-12-30","2025-01-06","2025-01-13","2025-01-20","2025-01-27","2025-02-03","2025-02-10","2025-02-17","2025-02-24","2025-03-03","2025-03-10","2025-03-17","2025-03-24","2025-03-31","2025-04-07","2025-04-14","2025-04-21","2025-04-28","2025-05-05","2025-05-12","2025-05-19","2025-05-26","2025-06-02","2025-06-09","2025-06-16","2025-06-23","2025-06-30","2025-07-07","2025-07-14","2025-07-21","2025-07-28","2025-08-04","2025-08-11","2025-08-18","2025-08-25","2025-09-01","2025-09-08","2025-09-15","2025-09-22","2025-09-29","2025-10-06","2025-10-13","2025-10-20","2025-10-27","2025-11-03","2025-11-10","2025-11-17","2025-11-24","2025-12-01","2025-12-08","2025-12-15","2025-12-22","2025-12-29","2026-01-05","2026-01-12","2026-01-19","2026-01-26","2026-02-02","2026-02-09","2026-02-16","2026-02-23","2026-03-09"],"o":[2.17,2.16,2.11,2.09,2.04,2.0,1.93,1.97,2.06,2.19,2.2,2.12,2.24,2.26,2.13,2.25,2.36,2.4,2.33,2.36,2.51,2.52,2.43,2.45,2.43,2.48,2.51,2.44,2.39,2.29,2.28,2.19,2.12,2.18,2.24,2.24,2.24,2.21,2.23,2.17,2.1,2.03,1.97,1.91,1.96,2.0,2.1,2.1,1.94,2.04,1.96,1.97,1.97,1.97,2.02,1.99,2.0,1.99,1.88,1.85,1.83,1.81,1.9,1.83,1.85,1.82,1.83,1.8,1.8,1.81,1.77,1.79,1.76,1.78,1.77,1.72,1.68,1.57,1.56,1.59,1.65,1.67,1.65,1.62,1.69,1.68,1.67,1.69,1.73,1.78,1.82,1.84,1.82,1.83,1.85,1.91,2.0,1.94,1.92,1.9,1.91,1.86,1.76,1.76,1.82,1.83,1.81,1.87,1.9,1.89,1.91,1.9,1.88,1.89,1.89,1.87,1.86,1.88,1.87,1.85,1.86,1.84,1.73,1.75,1.7,1.57,1.65,1.65,1.63,1.64,1.62,1.62,1.62,1.69,1.73,1.78,1.76,1.79,1.84,1.85,1.85,1.84,1.77,1.76,1.73,1.75,1.74,1.79,1.79,1.79,1.78,1.75,1.65,1.64,1.63,1.65,1.64,1.65,1.71,1.63,1.59,1.59,1.61,1.58,1.6,1.6,1.66,1.66,1.67,1.69,1.74,1.75,1.71,1.72,1.68,1.67,1.68,1.61,1.61,1.58,1.62,1.61,1.6,1.58,1.59,1.56,1.56,1.58,1.61,1.59,1.5,1.47,1.37,1.42,1.4,1.38,1.3,1.34,1.31,1.29,1.3,1.32,1.31,1.33,1.4,1.4,1.39,1.36,1.37,1.44,1.5,1.49,1.5,1.54,1.49,1.49,1.47,1.52,1.54,1.52,1.52,1.6,1.59,1.56,1.55,1.6,1.59,1.58,1.59,1.57,1.55,1.57,1.58,1.57,1.56,1.7,1.77,1.76,1.83,1.82,1.79,1.84,1.88,1.9,1.83,1.7,1.69,1.74,1.8,1.8,1.85,1.82,1.86,1.82,1.79,1.81,1.89,1.95,1.97,1.99,2.04,1.98,2.04,1.99,1.96,2.04,2.25,2.19,2.35,2.32,2.17,2.29,2.17,2.21,2.21,2.1,2.15,2.19,2.37,2.49,2.45,2.65,2.5,2.6,2.58,2.7,2.8,2.81,2.9,2.77,2.84,2.65,2.67,2.57,2.61,2.6,2.57,2.73,2.71,2.81,2.95,2.89,2.82,2.87,2.82,2.8,2.79,2.92,3.04,3.04,3.24,3.26,3.27,3.34,3.93,4.01,4.21,5.15,5.4,5.96,5.63,5.02,5.17,5.6,5.32,4.41,4.58,5.12,5.34,5.45,5.58,5.61,4.87,4.74,5.2,4.89,4.73,4.69,4.33,4.05,4.18,4.98,4.49,4.33,4.39,4.38,4.23,4.07,3.96,3.98,4.25,4.84,4.62,4.79,5.15,4.71,5.06,4.69,4.38,4.61,4.25,4.4,4.55,4.75,4.22,4.42,3.99,4.31,4.13,4.3,4.48,4.58,4.5,4.3,4.42,4.31,4.28,4.11,4.1,4.29,4.32,4.3,4.57,4.62,4.71,4.43,4.46,4.49,4.48,4.57,4.52,4.69,4.63,4.86,5.14,4.97,4.9,4.84,4.53,4.51,4.58,4.45,4.47,4.46,4.31,4.35,4.21,4.2,4.42,4.33,4.25,4.12,4.03,3.96,4.2,4.25,4.2,4.23,4.03,3.9,3.99,4.0,4.11,4.17,4.19,4.26,4.28,4.23,4.07,4.09,4.27,4.55,4.4,4.41,4.56,4.51,4.38,4.68,4.63,4.94,4.79,4.71,4.99,4.97,4.71,4.54,4.47,4.16,4.33,4.27,4.11,4.35,4.18,4.23,4.43,4.31,4.13,4.2,4.15,4.3,4.39,4.57,4.38,4.25,4.37,4.34,4.32,4.35,4.43,4.38,4.35,4.43,4.45,4.53,4.5,4.55,4.73,4.88,4.82,4.95,4.87,4.89,4.77,4.83,4.82,4.77,4.74,4.77,4.65,4.57,4.54,4.42,4.47,4.5,4.43,4.47,4.54,4.62,4.51,4.57,4.42,4.4,4.42,4.52,4.5,4.56,4.59,4.66,4.66,4.82,4.83,4.85,4.93,4.91,4.79,4.79,4.71,4.74,4.68,4.76,4.87,4.87,4.99,4.94,4.96,4.92,4.93,5.05,4.95,5.0,5.31,5.29,5.41,5.42,5.25,5.14,4.98,4.98,5.05,5.07,5.21,5.36,5.34,5.25,5.32,5.33,5.27,5.28,5.25,5.54,5.57,5.58,5.67,5.41,5.43,5.59,5.47,5.55,5.69,5.67,5.8,5.89,5.91,6.25,5.78,5.72,5.92,6.02,5.94,5.9,5.98,5.99,6.08,6.01,5.94,6.33,6.61,7.08,7.37,7.69,7.75,7.37,7.26,7.35,7.67,7.46,7.49,7.34,7.36,7.65,8.28,8.27,8.43,8.95,8.43,8.62,8.48,8.82,8.7,8.89,9.07,9.56,9.33,8.86,9.09,9.15,9.95,10.9,12.2,13.4,16.0,17.09,15.3,17.74,17.45,15.79,16.2,16.45,16.38,16.28,19.88,19.01,21.6,24.6,32.2,39.0,39.75,49.0,35.3,34.5,40.25,35.75,32.8,34.75,30.62,19.01,23.05,13.49,16.62,15.84,14.2,13.75,13.4,12.74,12.4,12.3,14.65,17.85,16.0,15.46,16.75,16.8,15.9,15.56,16.37,15.68,15.66,15.48,16.1,15.99,18.1,19.73,22.92,21.31,20.5,21.26,20.15,18.9,18.83,18.55,18.15,19.0,18.9,17.43,16.0,15.91,16.21,15.8,14.82,14.86,13.4,12.86,13.9,12.73,13.0,11.6,11.8,12.47,13.31,12.53,12.33,10.95,11.13,11.23,10.88,11.42,10.95,10.34,10.67,10.1,10.54,10.07,8.59,8.2,9.02,8.88,8.51,8.24,8.35,8.97,9.49,9.15,9.85,11.24,10.26,8.77,9.45,9.48,9.36,8.95,9.17,9.11,8.29,8.03,8.27,8.68,8.7,8.64,8.05,8.06,8.01,7.79,7.73,8.12,8.48,8.51,8.08,7.74,7.34,6.96,7.07,7.01,7.28,7.39,7.47,7.39,6.9,6.7,6.76,6.57,6.1,5.92,5.82,4.9,5.1,5.96,6.31,6.55,7.12,6.89,6.58,6.28,7.85,7.73,9.15,8.78,8.68,8.48,8.13,9.1,9.58,10.07,10.18,10.22,9.35,9.63,9.53,10.37,10.3,10.38,11.11,11.06,12.02,12.97,12.2,13.82,13.69,14.17,14.46,11.7,10.48,10.94,10.24,10.31,10.97,11.11,12.29,12.27,12.12,12.61,12.97,12.73,13.54,11.72,11.73,11.56,12.26,11.64,12.08,11.95,12.11,11.8,11.57,12.01,12.38,12.27,12.34,12.27,11.94,12.07,10.4,10.43,10.4,9.62,8.74,8.82,8.96,8.39,8.71,9.67,9.47,8.64,8.79,8.96,7.9,8.06,8.26,8.29,8.73,8.7,9.13,9.53,10.11,9.69,9.46,9.39,9.74,9.19,9.14,9.35,8.96,8.59,8.83,9.15,9.2,9.38,9.01,8.44,8.52,8.29,7.24,7.59,7.2,6.92,7.7,7.59,7.79,7.61,7.32,7.16,7.1,7.65,7.45,7.28,7.21,7.18,7.21,7.5,7.67,7.53,7.45,7.0,6.85,6.57,6.28,6.29,5.83,6.0,6.21,5.95,6.14,6.08,6.27,5.45,5.64,5.64,5.71,6.3,6.52,6.63,6.75,6.44,6.24,6.14,6.36,6.56,6.1,6.21,6.08,6.21,6.11,6.09,5.93,6.08,6.12,6.23,6.18,6.27,6.39,6.3,6.22,6.06,6.0,6.17,6.05,6.25,6.22,6.16,6.16,6.08,6.08,6.09,6.25,6.1,5.99,5.84,5.86,5.87,5.79,6.06,6.09,6.25,6.04,5.93,5.86,5.91,5.65,5.55,5.66,5.7,5.18,5.24,5.48,5.16,5.1,5.14,5.22,5.05,5.09,5.21,5.15,5.26,5.11,5.04,5.06,5.04,5.03,5.02,5.14,5.49,5.21,5.12,5.21,5.54,5.8,6.03,5.64,5.74,5.65,5.55,5.63,5.62,5.79,5.66,5.26,5.5,5.37,5.45,5.41,5.32,5.37,5.51,5.65,5.55,5.53,5.53,5.45,5.48,5.43,5.55,5.56,5.56,6.23,6.5,6.89,7.84,10.93,8.95,8.29,9.44,8.03,7.34,7.86,7.5,7.0,6.95,7.2,7.55,7.53,7.68,8.6,7.73,7.53,7.62,7.45,7.69,7.55,7.36,7.63,7.57,7.83,8.31,7.57,7.0,6.66,6.56,6.63,7.25,6.63,7.04,6.77,6.81,6.63,6.99,6.7,6.75,6.54,6.33,6.35,6.38,6.14,6.36,6.23,6.36,6.65,6.73,6.41,6.5,6.41,6.36,6.38,6.67,6.76,6.6,7.23,6.98,7.22,6.84,6.71,7.09,7.24,7.58,6.86,6.8,6.7,6.62,6.51,6.49,6.42,6.29,6.1,6.12,6.35,6.34,6.22,6.31,6.42,6.38,6.14,6.17,6.19,6.14,6.09,6.09,6.07,5.93,5.87,6.16,5.87,5.82,5.79,5.93,5.95,5.83,6.04,6.15,5.97,5.79,5.76,5.8,5.76,5.65,5.6,5.5,5.09,5.22,5.31,5.19,5.32,5.31,5.19,5.26,5.23,5.21,5.15,5.16,5.17,5.21,5.12,5.07,5.07,5.07,5.32,5.23,5.13,5.17,5.08,5.25,5.23,5.3,5.69,5.84,5.65,5.66,5.59,5.53,5.21,5.28,5.33,5.2,5.26,5.33,5.3,5.33,5.24,5.12,5.12,5.12,4.96,4.94,5.14,5.05,5.08,4.94,5.03,5.05,5.13,5.24,5.05,5.0,4.83,4.84,4.91,4.88,4.92,4.88,4.83,4.88,5.08,5.2,4.92,4.85,4.77,4.79,4.83,4.79,4.67,4.26,4.23,4.07,4.17,4.21,4.13,4.19,4.13,4.1,3.95,4.04,4.19,4.2,4.2,4.04,3.81,3.86,3.82,3.78,3.55,3.75,4.17,4.05,3.95,3.94,3.96,3.98,3.92,3.89,4.03,4.04,4.0,4.06,4.16,4.57,4.39,4.34,4.45,4.5,4.39,4.4,4.11,3.94,3.99,4.05,3.95,3.83,4.0,4.06,4.12,4.13,4.13,4.1,4.17,4.08,4.08,4.04,4.05,4.14,4.09,4.07,3.87,3.89,3.86,3.94,4.07,4.23,4.17,4.18,4.19,4.15,4.08,4.09,4.16,4.11,4.11,4.15,4.09,4.12,3.98,3.99,4.01,4.11,4.1,4.09,4.03,4.05,4.12,4.05,3.99,4.05,3.94,4.0,3.97,3.94,3.98,3.82,3.76,3.75,3.73,3.75,3.82,3.81,3.75,3.74,3.72,3.75,3.76,3.86,3.76,3.75,3.73,3.76,3.73,3.75,3.67,3.66,3.67,3.67,3.69,3.66,3.66,3.69,3.58,3.58,3.58,3.62,3.68,3.7,3.86,3.87,3.98,4.02,4.27,4.28,4.46,4.72,4.62,4.36,4.22,4.29,4.5,4.88,5.07,5.07,4.97,5.42,4.67,4.77,4.78,4.84,4.53,4.06,4.11,4.11,4.09,4.38,4.36,4.43,4.29,4.52,4.52,4.73,4.63,4.84,5.1,5.12,5.09,5.28,4.91,5.34,5.04,5.06,5.31,5.26,5.18,5.24,5.23,5.37,5.41,5.7,5.64,5.46,5.25,5.09,5.29,5.39,5.39,5.71,5.5,5.27,5.33,5.61,5.39,5.39,5.25,5.25,5.26,5.33,5.11,5.05,5.23,5.38,5.41,5.51,5.43,5.66,5.53,5.61,5.39,5.32,5.34,5.23,5.16,5.15,5.17,4.74,4.73,4.77,4.81,4.84,4.64,4.77,4.92,4.67,4.7,4.74,4.78,4.65,4.42,4.62,4.68,4.63,5.3,5.33,5.66,5.7,5.7,5.92,5.33,5.37,5.46,5.23,5.43,5.43,5.33,5.08,5.17,5.23,5.22,5.1,5.17,5.23,5.8,5.58,5.31,5.4,5.49,5.41,5.42,5.44,5.38,5.37,5.33,5.29,5.42,5.35,5.28,5.18,5.25,5.15,5.16,5.17,5.53,5.4,5.5,5.51,5.8,5.64,5.71,5.49,5.49,5.49,5.55,5.63,5.52,5.54,5.5,5.29,5.29,5.46,5.38,5.29,5.34,5.38,5.2,5.17,5.11,5.05,5.12,5.13,4.97,5.09,5.1,5.04,5.08,5.25,5.18,5.12,5.04,4.88,4.88,4.86,5.04,4.9,4.92,4.81,4.83,4.91,4.83,4.73,4.76,4.81,4.83,4.88,4.67,4.76,4.75,4.94,4.88,4.92,5.22,5.21,5.31,5.14,5.25,5.13,5.04,4.76,4.72,4.75,4.72,4.75,4.86,4.68,4.75,4.73,4.81,4.71,4.72,4.71,4.47,4.34,4.32,4.34,4.46,4.39,4.53,4.66,4.66,4.71,4.76,4.71,4.87,5.28,5.18,4.94,4.83,4.78,4.87,5.13,5.47,5.24,5.43,5.96,6.05,6.24,5.88,5.53,5.76,5.94,6.25,7.19,7.09,6.47,6.61,6.06,6.12,6.32,6.35,6.63,6.41,6.27,6.21,6.24,5.79,5.42,5.28,5.14,5.25,5.09,5.31,5.3,5.32,5.27,5.39,5.62,5.41,5.29,5.13,5.16,4.73,5.04,4.96,5.0,5.14,5.16,4.84,4.9,4.86,5.04,5.0,5.04,4.92,4.92,4.76,4.79,4.95,4.92,5.0,5.25,5.13,5.09,5.28,5.58,5.75,5.58,5.62,5.25,5.21,5.07,5.09,4.95,4.98,5.07,5.14,5.33,5.38,5.36,5.14,4.88,4.98,5.12,4.97,5.07,5.27,5.23,5.05,5.12,5.36,5.36,5.26,5.25,5.08,5.13,5.19,5.12,5.32,5.61,5.52,5.34,5.24,5.2,5.05,5.07,5.13,5.22,5.07,5.12,5.2,5.19,5.3,5.14,5.12,5.21,5.26,5.45,5.24,5.24,5.08,5.09,5.09,5.07,5.09,5.04,5.08,5.13,4.96,5.0,4.99,4.98,4.98,4.94,5.03,5.01,5.04,4.94,5.0,4.97,5.0,4.92,4.95,4.92,4.91,4.83,4.88,4.96,4.87,4.86,4.89,4.88,4.86,4.86,4.83,4.75,4.73,4.67,4.64,4.62,4.67,4.66,4.58,4.63,4.59,4.57,4.6,4.78,4.79,4.72,4.55,4.5,4.43,4.4,4.51,4.33,4.35,4.29,4.35,4.41,4.42,4.37,4.33,4.34,4.58,4.52,4.41,4.36,4.38,4.32,4.3,4.26,4.31,4.26,4.22,4.22,4.17,4.24,4.21,4.2,4.18,4.29,4.51,4.58,4.64,4.42,4.24,4.21,4.12,4.15,4.11,4.07,4.18,4.24,4.38,4.54,4.52,4.71,4.67,4.36,4.29,4.3,4.4,4.54,4.39,4.6,4.53,4.49,4.54,4.67,4.56,4.58,4.54,4.63,4.62,4.69,4.66,4.77,5.05,4.94,4.82,4.91,4.8,4.94,5.04,5.05,4.65,4.62,4.71,4.5,4.44,4.47,4.54,4.54,4.64,4.53,4.49,4.33,4.38,4.42,4.45,4.53,4.54,4.5,4.43,4.62,4.7,4.62,4.72,4.91,4.82,4.79,4.91,4.84,4.65,4.49,4.67,4.61,4.67,4.57,4.38,4.46,4.38,4.48,4.54,4.62,4.79,4.79,4.83,4.68,4.5,4.52,4.59,4.53,4.5,4.66,4.79,4.73,5.08,5.04,4.98,4.92,4.95,5.16,5.09,5.16,5.31,5.12,4.83,4.88,4.92,5.12,5.06,5.03,5.38,5.24,5.36,5.5,5.55,5.72,5.86,5.97,6.65,6.33,6.25,6.21,6.34,6.54,6.49,6.73,6.92,7.11,7.65,7.67,8.2,7.86,7.28,6.22,6.1,5.5,5.81,5.83,6.17,5.87,5.66,5.94,6.18,6.04,6.53,6.71,6.29,6.64,6.7,6.69,6.77,6.74,6.54,6.13,6.21,6.39,6.83,7.24,7.04,7.44,7.24,7.45,7.59,7.62,7.65,8.0,6.83,6.81,6.97,6.39,6.47,6.59,6.81,6.72,6.59,7.25,7.37,7.35,7.35,7.47,7.25,6.92,6.96,7.18,7.04,7.21,6.85,6.96,6.88,6.98,7.13,7.46,7.2,7.37,7.24,6.91,7.04,7.0,7.11,7.25,7.13,7.07,6.99,6.75,7.05,6.97,7.31,7.22,7.38,7.78,7.86,7.62,7.76,7.49,7.83,8.11,8.27,8.59,9.22,8.62,8.76,9.04,9.1,9.19,8.93,9.65,9.76,9.26,9.54,9.66,10.22,10.02,10.34,10.89,11.59,12.42,13.63,12.78,13.92,13.75,13.25,12.16,12.9,12.37,11.02,9.89,10.36,11.28,11.04,11.5,10.74,11.44,12.45,11.76,12.24,12.14,12.99,11.76,10.97,11.05,11.58,11.34,11.72,11.71,12.13,12.51,12.86,12.92,13.48,14.05,13.72,12.97,12.86,13.01,12.21,12.88,12.87,13.25,13.29,13.78,14.03,14.58,12.61,12.97,13.16,13.26,13.34,13.84,14.09,13.86,13.5,13.48,13.19,12.93,13.03,13.67,13.16,13.31,12.96,12.47,12.74,13.03,13.34,12.73,13.1,12.87,11.95,11.83,12.1,12.56,12.59,13.62,13.78,13.29,13.95,13.35,14.41,14.49,15.14,14.52,14.88,13.86,14.38,13.74,14.35,14.76,15.24,16.5,15.77,16.44,16.7,17.37,17.01,18.06,20.16,19.57,20.92,17.57,17.99,17.96,17.45,17.86,16.94,16.7,16.74,17.18,18.14,16.86,17.46,16.73,17.19,17.65,17.85,18.69,18.35,17.47,17.37,15.34,13.01,13.05,13.58,12.38,10.84,12.98,13.06,11.29,10.61,9.79,9.01,10.05,10.31,9.5,10.04,9.91,9.73,10.33,10.97,10.93,11.07,11.09,11.16,12.1,12.43,13.01,13.55,14.36,13.14,13.36,13.06,13.76,12.96,12.41,12.65,12.06,12.98,13.11,13.9,13.79,14.3,15.86,14.84,14.31,13.83,14.07,13.03,12.47,13.74,14.06,14.29,14.47,14.13,14.41,14.74,16.21,16.35,16.68,15.91,16.23,17.89,17.52,17.61,16.58,17.68,17.74,18.76,18.14,18.04,17.19,17.27,17.42,17.17,18.84,18.66,17.16,16.23,15.14,15.57,16.44,16.5,17.33,17.02,16.78,17.15,17.92,18.49,17.5,18.35,18.71,18.46,19.11,17.78,18.3,17.36,18.43,19.37,19.11,17.85,18.06,17.78,18.01,18.11,18.48,18.2,17.94,18.87,19.86,19.93,20.91,21.54,22.03,23.31,24.02,23.71,24.91,26.72,26.01,27.42,26.74,29.6,29.33,29.21,30.44,30.67,28.79,28.19,27.56,27.75,29.21,30.16,33.43,33.49,36.6,36.18,36.16,36.62,38.46,41.37,42.79,45.48,43.61,38.0,34.35,34.7,38.65,36.87,35.51,35.58,34.01,34.1,36.36,40.33,40.78,39.31,39.86,39.18,43.49,40.9,42.71,40.81,40.46,28.16,31.05,32.23,32.3,31.7,34.24,34.48,34.38,30.9,32.0,32.48,31.22,28.78,28.65,28.78,28.85,29.9,32.45,33.18,33.52,33.84,33.56,35.09,34.18,33.77,32.44,32.23,32.42,31.55,31.32,31.16,31.2,29.58,28.33,28.39,28.52,29.36,28.63,28.43,26.72,27.36,27.24,27.05,26.95,27.64,27.72,28.05,28.1,30.81,31.74,33.6,34.53,33.73,34.35,33.85,33.22,32.17,31.82,30.91,32.63,32.67,34.08,33.42,33.34,32.21,30.19,29.95,30.14,30.76,31.9,30.87,31.51,31.16,30.0,29.17,28.69,28.9,28.8,28.67,27.96,27.27,23.54,23.6,24.27,23.75,23.66,21.66,22.36,22.43,21.81,21.87,19.65,19.44,19.16,19.82,19.95,20.1,19.76,20.84,23.23,24.29,23.97,23.64,21.88,21.68,21.68,21.77,21.52,22.09,22.54,21.85,21.39,20.64,19.71,19.75,19.5,19.5,19.37,19.65,20.04,20.09,20.29,19.83,19.27,20.2,21.65,22.05,21.46,20.99,21.22,20.2,19.97,19.81,19.74,19.51,19.6,19.64,19.46,19.55,19.25,18.81,19.11,19.67,20.75,20.87,20.95,21.13,20.93,20.63,20.35,19.85,19.59,19.49,19.49,19.19,18.64,17.74,17.58,17.02,17.41,17.38,17.18,16.15,15.67,16.2,16.33,15.73,16.26,16.85,16.09,16.0,15.88,16.52,17.65,17.83,17.22,16.97,17.27,16.2,16.63,15.92,15.58,16.73,16.65,16.86,16.27,16.09,15.84,16.42,16.39,17.7,16.79,16.61,16.06,15.93,16.19,15.83,15.59,15.45,14.84,14.69,14.73,14.88,15.23,14.94,14.68,14.54,14.43,15.18,14.7,15.25,15.96,15.86,16.1,15.4,14.78,14.36,13.98,14.08,14.49,13.71,14.2,13.93,14.0,13.97,13.88,14.22,14.33,14.94,15.26,15.0,14.75,15.66,15.6,15.81,15.06,14.96,15.56,16.2,16.86,17.49,17.33,17.32,16.31,16.06,16.4,17.32,17.34,17.7,20.36,20.47,19.72,19.41,20.51,19.66,19.9,18.91,18.78,19.46,18.72,19.12,19.44,19.18,17.78,17.4,17.64,17.76,18.22,17.2,16.68,16.68,16.62,16.86,16.0,15.85,15.95,16.52,16.82,17.14,17.1,17.6,17.97,17.98,18.34,17.81,17.02,17.23,17.94,18.16,17.94,18.42,17.81,16.95,16.38,16.59,16.95,17.27,17.52,17.13,16.67,16.53,16.48,15.22,16.07,16.5,16.76,16.13,16.97,17.02,17.6,17.8,17.85,17.53,16.95,16.58,16.92,17.41,17.0,16.73,16.91,16.93,17.14,17.1,16.33,15.84,16.09,16.5,17.06,17.17,17.32,17.04,17.34,16.88,16.43,16.72,16.67,16.51,16.45,16.29,16.61,16.52,16.34,16.6,16.93,16.38,16.45,16.64,16.34,16.48,16.44,16.76,16.61,16.38,15.98,16.2,15.81,15.48,15.49,15.35,15.19,14.76,14.9,14.53,14.21,14.17,14.31,14.55,14.46,14.74,14.63,14.65,14.73,14.16,14.36,14.38,14.38,14.53,14.6,14.68,15.46,15.75,15.62,15.26,15.69,15.74,15.71,15.77,15.96,15.16,15.29,15.38,15.53,15.07,15.14,14.94,14.97,14.97,14.83,14.66,14.41,14.48,14.71,14.74,14.78,15.37,15.26,15.07,15.32,16.39,16.39,16.48,16.95,16.93,17.73,18.35,18.17,17.84,18.38,17.25,17.43,17.61,17.73,18.05,18.18,16.88,16.8,16.87,16.88,16.62,17.02,17.38,17.82,18.44,17.98,18.05,18.3,17.77,17.79,17.8,18.77,16.91,16.89,12.96,12.51,14.05,14.55,15.51,15.15,15.21,14.93,15.45,17.35,17.3,18.16,17.63,17.09,17.86,17.91,18.25,19.09,19.44,24.38,24.23,28.27,26.91,26.89,28.89,26.83,26.89,26.36,22.89,23.91,25.06,24.84,24.28,23.98,25.11,24.27,23.91,22.15,23.75,23.86,26.16,26.15,27.27,25.02,24.86,25.64,29.59,27.18,27.57,27.45,26.89,25.16,26.1,25.74,24.83,25.04,25.16,26.11,26.11,26.82,27.73,27.61,27.64,28.21,27.58,27.73,25.95,26.09,26.55,25.93,25.32,25.36,25.41,23.84,23.54,23.43,24.05,24.7,23.58,22.39,22.55,22.31,22.52,23.22,24.38,23.86,24.28,25.21,24.69,23.23,22.34,22.22,22.3,22.84,22.89,22.45,23.02,24.07,22.5,22.86,23.69,23.73,24.35,25.74,25.38,25.04,24.91,24.66,25.05,25.91,23.52,22.63,21.86,21.17,22.09,22.04,22.25,21.56,21.66,21.46,19.86,19.21,18.88,18.75,20.41,20.2,20.33,18.89,18.7,18.23,19.21,19.32,18.64,19.41,19.82,18.59,19.21,19.16,20.67,21.47,20.64,21.48,22.98,23.39,23.24,23.86,24.3,23.85,24.17,23.68,23.64,22.38,21.98,21.71,20.73,21.09,21.09,22.5,22.89,23.93,25.05,25.39,25.03,24.77,25.57,23.89,23.85,23.25,23.48,24.21,23.95,22.8,22.77,23.04,24.81,24.59,24.36,23.39,22.73,22.88,24.22,24.04,23.11,23.2,23.56,21.62,21.65,22.59,23.18,23.15,23.21,22.07,23.39,24.75,25.16,22.92,23.93,24.04,23.95,22.84,23.21,22.2,23.0,22.5,22.91,23.09,22.51,23.1,24.36,25.18,24.66,25.65,27.82,28.44,27.73,27.38,27.26,28.12,31.8,31.55,30.37,29.68,29.23,29.56,29.25,30.99,30.74,29.07,28.14,27.11,27.96,28.83,29.9,28.62,28.13,30.91,30.63,31.07,31.88,31.25,34.0,33.38,32.84,31.32,30.74,30.79,30.45,31.63,30.66,29.61,29.46,30.27,29.88,30.25,30.58,31.29,32.27,32.48,32.51,31.52,32.51,33.77,33.09,34.05,30.32,32.27,32.61,33.01,33.02,32.02,32.52,32.9,33.24,36.25,36.38,36.13,35.98,36.24,38.99,38.47,38.12,37.15,37.76,38.09,38.42,40.58,41.19,42.2,43.73,46.95,48.56,51.24,51.8,47.37,48.77,50.04,51.05,50.04,57.49,58.38,63.87,69.22,74.64,75.07,84.07,93.0,109.61,81.97,80.36,75.18,87.14,86.21],"h":[2.23,2.16,2.11,2.09,2.04,2.0,2.0,2.03,2.2,2.23,2.49,2.4,2.3,2.26,2.21,2.3,2.36,2.4,2.36,2.5,2.55,2.52,2.48,2.58,2.53,2.51,2.51,2.44,2.39,2.33,2.29,2.21,2.21,2.33,2.24,2.27,2.25,2.25,2.23,2.17,2.1,2.03,1.97,1.97,1.99,2.09,2.1,2.1,2.04,2.04,2.0,1.97,1.97,2.04,2.04,2.02,2.0,1.99,1.88,1.85,1.83,1.93,1.9,1.83,1.85,1.83,1.83,1.81,1.8,1.81,1.85,1.79,1.76,1.78,1.77,1.72,1.68,1.59,1.59,1.66,1.68,1.68,1.65,1.62,1.71,1.69,1.67,1.71,1.8,1.81,1.89,1.89,1.86,1.84,1.87,1.95,2.0,1.96,1.92,1.9,1.92,1.86,1.76,1.8,1.82,1.85,1.88,1.89,1.92,1.92,1.91,1.9,1.9,1.93,1.89,1.88,1.88,1.89,1.87,1.86,1.86,1.84,1.73,1.75,1.7,1.63,1.65,1.69,1.66,1.65,1.64,1.62,1.69,1.74,1.78,1.78,1.76,1.84,1.86,1.85,1.87,1.84,1.78,1.76,1.76,1.75,1.74,1.8,1.81,1.82,1.79,1.75,1.65,1.64,1.65,1.67,1.65,1.69,1.71,1.63,1.61,1.62,1.61,1.6,1.6,1.64,1.67,1.68,1.69,1.71,1.75,1.75,1.74,1.72,1.69,1.7,1.68,1.64,1.61,1.63,1.64,1.61,1.6,1.59,1.59,1.56,1.6,1.63,1.61,1.59,1.5,1.47,1.42,1.42,1.4,1.38,1.32,1.34,1.33,1.29,1.33,1.34,1.33,1.35,1.42,1.43,1.39,1.38,1.44,1.48,1.51,1.52,1.55,1.54,1.5,1.5,1.5,1.54,1.54,1.55,1.56,1.6,1.59,1.56,1.57,1.6,1.6,1.6,1.59,1.57,1.58,1.59,1.58,1.57,1.68,1.76,1.78,1.84,1.83,1.82,1.84,1.9,1.91,1.91,1.83,1.72,1.75,1.78,1.8,1.84,1.85,1.84,1.86,1.82,1.82,1.87,1.93,1.98,2.0,2.03,2.05,2.01,2.04,1.99,2.03,2.14,2.25,2.46,2.49,2.32,2.22,2.29,2.24,2.25,2.21,2.14,2.19,2.36,2.47,2.49,2.61,2.73,2.53,2.6,2.68,2.8,2.8,2.91,2.96,2.92,2.84,2.65,2.69,2.63,2.62,2.6,2.73,2.78,2.77,2.87,3.0,2.95,2.87,2.87,2.82,2.83,2.96,3.07,3.09,3.2,3.24,3.33,3.34,3.64,3.93,4.04,4.75,5.59,5.82,6.76,5.63,5.4,5.62,5.6,5.32,4.74,4.78,5.58,5.62,5.46,6.02,5.61,5.08,5.02,5.2,4.89,4.73,4.69,4.36,4.37,4.72,5.03,4.62,4.61,4.44,4.38,4.23,4.12,3.97,4.18,4.83,4.97,4.65,5.09,5.15,4.99,5.06,4.69,4.57,4.61,4.25,4.6,4.78,4.75,4.27,4.45,4.27,4.32,4.25,4.55,4.68,4.62,4.5,4.5,4.48,4.31,4.33,4.18,4.33,4.32,4.43,4.51,4.64,4.74,4.71,4.46,4.58,4.49,4.53,4.58,4.64,4.69,4.82,5.14,5.21,5.06,4.9,4.84,4.55,4.57,4.58,4.48,4.54,4.46,4.35,4.4,4.24,4.44,4.45,4.33,4.31,4.15,4.03,4.06,4.24,4.25,4.27,4.24,4.03,4.01,4.03,4.1,4.23,4.26,4.23,4.3,4.28,4.23,4.15,4.28,4.45,4.55,4.57,4.47,4.56,4.51,4.67,4.68,4.92,4.94,4.89,4.96,5.08,4.97,4.71,4.6,4.47,4.32,4.35,4.27,4.29,4.45,4.28,4.38,4.43,4.34,4.21,4.21,4.28,4.36,4.46,4.57,4.39,4.33,4.39,4.38,4.35,4.37,4.43,4.38,4.42,4.53,4.5,4.54,4.53,4.65,4.8,4.88,4.92,4.97,4.87,4.89,4.8,4.86,4.82,4.78,4.79,4.77,4.65,4.58,4.54,4.44,4.5,4.52,4.46,4.56,4.58,4.63,4.58,4.57,4.43,4.41,4.47,4.52,4.5,4.62,4.64,4.67,4.76,4.84,4.88,4.89,4.97,4.91,4.79,4.79,4.78,4.74,4.72,4.8,4.97,4.98,4.99,5.05,5.0,4.92,5.02,5.05,5.01,5.32,5.48,5.29,5.41,5.42,5.31,5.14,5.0,5.09,5.12,5.2,5.21,5.47,5.35,5.33,5.41,5.37,5.3,5.32,5.41,5.6,5.72,5.63,5.74,5.46,5.53,5.59,5.6,5.68,5.73,5.85,6.01,5.99,6.12,6.26,5.89,5.86,6.04,6.02,5.94,5.9,6.03,6.03,6.08,6.02,6.24,6.55,6.71,7.51,7.37,7.85,7.75,7.39,7.34,7.58,7.73,7.46,7.58,7.52,7.57,8.02,8.38,8.47,8.74,8.95,8.64,8.62,8.76,8.82,8.93,9.19,9.56,9.58,9.33,9.13,9.25,9.76,10.39,12.55,13.0,18.3,16.31,18.1,16.98,17.74,17.45,16.6,16.74,16.45,16.45,19.0,19.88,20.9,23.87,27.85,39.95,39.0,49.45,49.0,37.35,39.12,40.25,35.75,35.52,36.31,30.62,22.6,23.05,16.99,17.6,15.84,15.52,13.87,13.4,13.06,12.4,13.98,17.02,17.85,16.0,16.26,17.29,17.46,15.99,16.65,16.37,16.16,15.86,16.23,16.16,17.03,21.65,21.75,23.54,21.75,21.47,21.26,20.15,19.45,20.1,18.55,19.29,19.0,18.9,17.43,16.0,16.5,16.21,16.3,15.15,15.35,13.53,13.35,13.9,13.3,13.02,11.97,12.14,12.98,13.31,12.53,12.33,11.28,11.55,11.23,11.11,11.42,10.95,10.59,10.67,10.47,10.54,10.24,8.59,8.92,9.02,8.88,8.51,8.51,9.31,9.72,9.49,9.95,10.92,11.24,10.32,9.33,9.49,9.69,9.36,9.15,9.17,9.11,8.29,8.23,8.75,8.78,8.82,8.64,8.15,8.26,8.09,7.92,8.28,8.52,8.66,8.57,8.08,7.93,7.34,7.15,7.29,7.11,7.47,7.61,7.47,7.39,6.9,6.7,6.76,6.6,6.1,6.08,5.82,5.22,5.88,6.24,6.62,7.14,7.21,7.08,6.58,7.45,8.25,8.8,9.45,9.16,9.1,8.48,8.9,9.8,10.46,10.07,10.58,10.22,9.83,9.63,10.43,11.06,10.82,10.75,11.11,11.29,12.44,13.11,13.35,14.36,14.26,14.67,14.46,11.7,10.98,11.25,10.6,10.65,11.18,11.75,12.42,12.31,12.44,13.16,13.41,13.35,13.54,11.73,11.73,12.3,12.26,12.03,12.38,12.55,12.43,11.93,11.72,12.48,12.77,12.27,12.38,12.27,11.94,12.07,10.42,10.56,10.4,9.62,8.9,9.03,9.06,8.61,9.81,9.81,9.47,8.84,8.91,8.96,8.11,8.29,8.26,8.87,9.05,9.15,9.75,9.87,10.11,9.87,9.55,9.8,9.74,9.29,9.32,9.35,9.05,8.75,9.06,9.16,9.36,9.38,9.01,8.65,8.52,8.29,7.54,7.59,7.24,7.54,7.88,7.92,7.79,7.61,7.32,7.19,7.14,7.65,7.61,7.28,7.28,7.33,7.42,7.85,7.83,7.58,7.45,7.1,6.85,6.57,6.38,6.29,6.11,6.26,6.25,6.33,6.2,6.32,6.27,5.77,5.68,5.66,6.46,6.66,6.52,6.68,6.75,6.44,6.32,6.35,6.54,6.56,6.16,6.21,6.24,6.42,6.15,6.09,6.05,6.25,6.16,6.33,6.18,6.35,6.39,6.4,6.22,6.06,6.01,6.17,6.36,6.28,6.26,6.21,6.17,6.08,6.15,6.17,6.25,6.1,5.99,5.9,5.86,5.87,6.11,6.31,6.2,6.25,6.04,5.93,5.99,6.05,5.7,5.79,5.75,5.73,5.18,5.41,5.48,5.16,5.12,5.23,5.22,5.05,5.21,5.21,5.42,5.26,5.11,5.11,5.11,5.08,5.03,5.05,5.2,5.49,5.26,5.17,5.46,5.78,5.89,6.03,5.76,5.74,5.65,5.82,5.66,5.74,5.84,5.66,5.38,5.5,5.37,5.45,5.41,5.36,5.42,5.58,5.65,5.73,5.56,5.54,5.45,5.5,5.53,5.66,5.59,5.96,6.35,6.9,7.24,9.14,10.93,8.95,8.86,9.44,8.03,7.88,7.93,7.67,7.0,7.38,7.66,7.79,7.75,8.32,8.73,7.86,7.76,7.75,7.68,7.82,7.71,7.66,7.64,7.82,7.83,8.31,7.57,7.0,6.71,6.73,7.0,7.25,7.01,7.04,6.78,6.81,7.0,6.99,6.73,6.75,6.62,6.33,6.43,6.38,6.27,6.39,6.37,6.67,6.75,6.73,6.46,6.5,6.5,6.37,6.55,6.72,6.76,7.22,7.28,7.16,7.22,6.96,6.95,7.32,7.82,7.58,6.86,6.8,6.75,6.78,6.57,6.63,6.51,6.35,6.21,6.32,6.35,6.41,6.25,6.5,6.52,6.43,6.14,6.17,6.19,6.19,6.12,6.09,6.07,5.96,5.99,6.21,5.87,5.93,5.88,5.97,5.95,6.04,6.13,6.15,5.97,5.83,5.88,5.82,5.81,5.65,5.67,5.51,5.33,5.22,5.42,5.31,5.34,5.31,5.36,5.26,5.25,5.23,5.29,5.17,5.24,5.23,5.13,5.12,5.09,5.21,5.32,5.25,5.13,5.17,5.17,5.25,5.29,5.66,5.88,5.84,5.65,5.7,5.6,5.53,5.28,5.33,5.33,5.28,5.32,5.33,5.34,5.36,5.24,5.14,5.12,5.12,5.0,5.18,5.14,5.09,5.1,5.06,5.05,5.05,5.22,5.24,5.09,5.01,4.84,4.84,4.96,4.9,4.92,4.9,4.93,4.94,5.21,5.22,4.92,4.85,4.82,4.81,4.93,4.79,4.69,4.26,4.23,4.23,4.26,4.21,4.15,4.19,4.16,4.1,4.15,4.1,4.21,4.25,4.22,4.04,3.88,3.86,3.82,3.78,3.75,4.0,4.17,4.05,3.95,4.07,4.02,4.12,3.94,4.02,4.06,4.12,4.09,4.14,4.49,4.57,4.48,4.45,4.53,4.5,4.45,4.4,4.11,3.97,3.99,4.05,3.95,3.93,4.06,4.09,4.25,4.22,4.13,4.12,4.17,4.11,4.11,4.05,4.13,4.14,4.09,4.07,3.88,3.9,3.98,4.14,4.33,4.29,4.24,4.22,4.21,4.15,4.12,4.15,4.17,4.11,4.11,4.15,4.13,4.12,4.02,4.01,4.07,4.12,4.12,4.1,4.09,4.11,4.12,4.06,4.07,4.05,3.95,4.01,3.97,3.94,3.98,3.82,3.76,3.75,3.75,3.84,3.83,3.81,3.76,3.74,3.81,3.77,3.91,3.86,3.77,3.76,3.76,3.76,3.77,3.75,3.67,3.7,3.69,3.72,3.71,3.67,3.77,3.71,3.6,3.59,3.64,3.68,3.72,3.97,3.88,3.93,3.98,4.36,4.36,4.52,4.74,4.72,4.62,4.39,4.34,4.43,4.83,5.17,5.09,5.07,5.3,5.42,4.8,4.77,4.78,4.84,4.53,4.1,4.14,4.11,4.37,4.45,4.51,4.43,4.48,4.58,4.69,4.73,4.66,4.99,5.14,5.12,5.12,5.28,5.21,5.34,5.13,5.46,5.31,5.33,5.21,5.33,5.45,5.45,5.75,5.74,5.64,5.46,5.26,5.28,5.29,5.42,5.57,5.73,5.54,5.39,5.53,5.61,5.39,5.41,5.32,5.32,5.33,5.33,5.19,5.17,5.25,5.44,5.51,5.51,5.71,5.7,5.66,5.61,5.41,5.39,5.34,5.23,5.24,5.17,5.17,4.74,4.82,4.83,4.9,4.84,4.84,4.92,4.92,4.74,4.76,4.76,4.82,4.65,4.68,4.73,4.7,5.16,5.41,5.34,5.92,5.83,6.04,5.92,5.45,5.49,5.46,5.37,5.46,5.51,5.33,5.12,5.26,5.36,5.22,5.2,5.31,5.66,5.8,5.58,5.5,5.54,5.56,5.53,5.42,5.44,5.38,5.44,5.36,5.43,5.42,5.38,5.28,5.26,5.25,5.17,5.16,5.5,5.56,5.49,5.62,5.83,5.82,5.75,5.71,5.53,5.49,5.59,5.6,5.69,5.53,5.54,5.5,5.37,5.41,5.48,5.4,5.34,5.37,5.38,5.2,5.21,5.18,5.14,5.13,5.15,5.03,5.15,5.12,5.09,5.21,5.25,5.2,5.12,5.06,4.93,4.91,5.03,5.04,4.98,4.92,4.83,4.91,4.93,4.83,4.89,4.87,4.88,4.88,4.88,4.75,4.76,4.97,5.03,4.91,5.14,5.24,5.25,5.31,5.27,5.25,5.17,5.04,4.83,4.83,4.76,4.74,4.83,4.87,4.72,4.86,4.9,4.81,4.8,4.8,4.71,4.47,4.34,4.32,4.47,4.51,4.48,4.53,4.72,4.71,4.78,4.76,4.76,5.18,5.28,5.18,5.08,4.83,4.95,5.06,5.25,5.47,5.32,6.05,6.08,6.27,6.24,6.09,5.89,5.88,6.16,7.81,7.19,7.21,6.47,6.61,6.31,6.12,6.46,6.73,6.63,6.41,6.32,6.21,6.24,5.79,5.42,5.28,5.23,5.46,5.32,5.39,5.53,5.34,5.36,5.83,5.67,5.47,5.29,5.16,5.16,4.98,5.05,5.0,5.18,5.38,5.22,4.96,4.9,5.06,5.04,5.13,5.04,4.93,4.92,4.83,5.02,4.95,5.03,5.29,5.36,5.15,5.24,5.69,5.64,5.75,5.58,5.62,5.32,5.21,5.13,5.12,4.98,5.02,5.18,5.44,5.43,5.47,5.38,5.14,4.98,5.09,5.12,5.12,5.31,5.27,5.23,5.13,5.45,5.52,5.39,5.26,5.25,5.2,5.2,5.19,5.26,5.71,5.71,5.65,5.34,5.29,5.22,5.12,5.17,5.25,5.22,5.14,5.2,5.2,5.33,5.3,5.16,5.18,5.37,5.26,5.45,5.29,5.25,5.12,5.11,5.12,5.13,5.09,5.11,5.13,5.13,4.97,5.08,5.03,5.04,5.0,4.94,5.05,5.09,5.04,5.02,5.0,4.97,5.01,4.96,4.98,4.92,4.91,4.86,4.94,4.96,4.88,4.88,4.94,4.88,4.88,4.86,4.83,4.75,4.74,4.67,4.65,4.7,4.75,4.66,4.61,4.63,4.59,4.57,4.82,4.8,4.8,4.72,4.57,4.5,4.51,4.5,4.51,4.34,4.43,4.35,4.37,4.43,4.43,4.38,4.39,4.45,4.62,4.52,4.41,4.45,4.43,4.35,4.3,4.26,4.31,4.26,4.24,4.22,4.23,4.24,4.21,4.2,4.27,4.62,4.58,4.64,4.64,4.42,4.25,4.29,4.14,4.18,4.11,4.14,4.27,4.36,4.52,4.54,4.68,4.84,4.67,4.36,4.29,4.47,4.58,4.54,4.5,4.6,4.54,4.51,4.67,4.7,4.62,4.58,4.62,4.63,4.62,4.69,4.86,5.04,5.05,4.94,4.89,4.91,4.92,5.06,5.1,5.05,4.66,4.68,4.71,4.5,4.57,4.53,4.59,4.65,4.64,4.53,4.49,4.36,4.41,4.54,4.59,4.57,4.55,4.5,4.65,4.74,4.72,4.67,4.79,4.91,4.82,4.85,4.91,4.93,4.65,4.64,4.7,4.68,4.67,4.57,4.41,4.46,4.47,4.51,4.62,4.75,4.79,4.87,4.84,4.68,4.53,4.52,4.62,4.54,4.66,4.83,4.79,5.06,5.12,5.05,5.04,5.0,5.11,5.16,5.32,5.3,5.32,5.12,4.89,4.94,5.15,5.18,5.06,5.32,5.38,5.35,5.47,5.62,5.7,5.72,5.99,6.28,6.65,6.39,6.54,6.21,6.56,6.82,6.76,6.86,7.21,7.42,7.67,8.29,8.2,7.86,7.28,6.28,6.1,5.67,5.86,6.17,6.17,5.9,5.95,6.15,6.18,6.5,6.62,6.71,6.42,6.68,6.7,6.82,6.77,6.76,6.54,6.27,6.42,6.84,7.15,7.24,7.33,7.44,7.36,7.5,7.66,7.69,8.04,8.0,6.83,6.88,6.97,6.46,6.71,6.68,6.81,6.73,6.98,7.32,7.55,7.35,7.57,7.47,7.25,7.19,7.12,7.24,7.29,7.26,7.05,7.08,7.18,7.17,7.53,7.53,7.39,7.37,7.24,7.03,7.1,7.12,7.14,7.25,7.17,7.07,7.05,7.02,7.05,7.08,7.42,7.53,7.62,7.84,7.86,7.83,7.76,7.74,8.11,8.2,8.54,8.97,9.22,8.62,8.9,9.14,9.1,9.19,9.69,9.91,9.76,9.46,9.57,10.26,10.22,10.37,10.68,11.76,12.16,12.75,14.31,12.78,14.42,14.94,13.82,12.87,13.13,12.37,11.02,10.54,10.7,11.51,11.75,11.5,11.34,12.2,12.45,12.28,12.58,12.75,13.15,11.76,11.28,11.66,11.58,11.4,11.98,12.05,12.62,13.03,12.94,13.37,13.85,14.05,13.85,12.97,12.9,13.01,12.45,12.88,13.38,13.66,13.84,13.98,14.28,14.58,13.09,13.07,13.38,13.36,13.58,13.92,14.09,14.03,13.5,13.48,13.19,13.07,13.53,13.71,13.16,13.34,12.96,12.61,13.12,13.29,13.34,12.96,13.1,12.87,11.95,11.95,12.57,12.66,13.47,13.65,13.78,13.79,13.95,14.07,14.41,15.82,15.14,14.55,14.88,14.44,14.63,14.28,14.75,15.38,16.06,16.5,16.53,17.19,16.95,17.46,17.98,19.62,20.8,20.79,20.92,18.36,17.99,18.32,18.56,17.86,16.94,16.97,17.08,18.1,18.14,17.19,17.46,17.44,17.4,18.31,18.38,19.3,18.6,17.59,17.37,15.34,13.62,13.78,13.58,12.38,12.93,13.38,13.06,11.74,10.92,9.86,10.02,10.41,10.31,9.5,10.33,9.91,10.39,11.29,10.97,11.08,11.41,11.09,11.46,12.51,12.89,13.39,14.28,14.39,13.46,13.36,13.65,13.76,13.11,12.41,12.94,12.78,12.98,14.01,14.14,14.66,15.52,15.97,15.39,14.31,14.26,14.07,13.32,13.27,13.78,14.06,14.67,15.07,14.13,14.54,15.95,16.89,17.38,17.24,16.55,17.8,17.99,17.75,17.61,17.52,17.68,18.74,18.76,19.18,18.11,17.6,17.32,17.42,18.12,18.84,18.66,17.16,16.79,15.6,16.21,16.44,17.34,17.47,17.54,16.85,17.69,18.34,18.49,18.0,18.62,18.71,19.64,19.11,18.53,18.43,18.34,18.77,19.37,19.11,18.0,18.42,18.17,18.16,18.5,18.48,18.54,19.11,19.66,20.02,20.85,21.35,22.07,23.38,24.49,24.26,23.96,26.14,28.55,27.07,27.44,28.74,30.5,29.88,29.35,30.7,30.67,29.6,29.32,27.56,28.91,30.22,31.94,33.43,34.75,36.6,36.18,37.78,37.87,40.22,42.61,46.26,48.7,43.61,39.18,35.75,37.69,38.65,37.41,35.55,36.22,35.02,36.28,39.4,40.33,40.81,41.62,39.86,41.98,43.49,42.5,42.71,41.23,40.46,33.5,31.98,32.89,32.3,35.42,34.72,34.64,34.45,31.94,33.28,32.64,31.34,29.75,28.65,29.4,30.58,30.79,33.48,33.93,34.37,33.84,35.57,37.23,34.18,33.77,32.44,33.01,32.97,32.37,31.79,31.16,31.2,29.58,28.48,28.39,28.52,29.36,28.88,28.81,27.44,28.33,27.57,27.45,27.81,28.2,28.02,28.2,30.37,30.81,32.87,34.71,34.69,34.65,34.96,34.25,33.22,32.17,32.66,32.16,32.63,33.41,34.28,33.42,33.34,32.38,30.19,30.91,30.67,31.82,32.23,32.03,32.01,31.16,30.0,29.17,29.01,29.25,29.06,28.83,27.96,27.74,23.66,24.02,24.42,24.07,23.66,22.62,22.68,22.62,21.83,21.87,19.77,19.62,19.85,19.95,20.39,20.1,20.31,22.83,23.23,24.74,24.21,23.64,23.0,21.97,21.7,22.3,21.87,22.67,22.74,21.94,21.39,20.64,20.11,19.75,20.39,20.02,19.92,20.18,20.04,20.27,20.29,19.83,20.14,21.09,21.75,22.05,21.46,21.36,21.22,20.2,19.97,20.24,19.77,19.66,19.6,19.64,19.87,19.56,19.25,19.03,19.58,20.62,21.12,21.12,21.5,21.13,20.93,20.69,20.35,20.08,19.66,19.75,19.49,19.19,18.75,17.92,17.58,17.64,17.5,17.38,17.2,16.15,15.74,16.3,16.66,16.42,17.07,16.85,16.09,16.0,16.37,17.12,18.23,18.01,17.59,16.97,17.27,16.82,16.63,15.92,16.17,17.14,16.84,16.86,16.47,16.09,16.52,16.42,17.4,17.7,16.79,16.7,16.13,16.24,16.19,15.83,15.61,15.45,14.88,14.69,14.75,15.55,15.5,14.94,14.71,14.77,15.26,15.18,14.7,15.99,16.18,15.98,16.1,15.4,14.78,14.36,14.29,14.21,14.49,14.08,14.33,13.93,14.04,14.02,14.17,14.38,14.91,15.65,15.37,15.32,15.43,15.66,15.94,15.89,15.38,15.22,16.17,17.32,17.86,17.49,17.51,17.32,16.46,16.1,17.32,17.71,18.04,19.24,20.43,20.47,19.99,20.41,20.71,20.34,20.04,18.98,18.78,19.93,19.16,19.88,19.44,19.18,17.78,17.69,17.73,18.54,18.81,17.2,16.76,16.68,17.13,17.11,16.03,16.24,16.59,16.91,17.12,17.14,17.71,17.74,18.1,18.27,18.34,17.81,17.46,17.63,18.13,18.4,18.56,18.42,17.84,16.95,16.38,16.9,17.29,17.31,17.6,17.13,16.71,16.83,16.48,15.95,16.43,16.79,16.76,17.09,17.15,17.06,17.6,18.21,17.91,17.53,17.01,16.82,17.2,17.41,17.04,17.09,17.1,17.11,17.14,17.1,16.33,16.01,16.18,16.86,17.16,17.17,17.32,17.52,17.34,16.88,16.84,16.72,16.67,16.64,16.61,16.53,16.64,16.52,16.66,17.2,16.93,16.46,16.76,16.64,16.67,16.55,16.75,17.23,16.61,16.38,16.05,16.2,15.81,15.56,15.49,15.48,15.19,14.81,14.9,14.53,14.22,14.33,14.47,14.73,14.6,14.76,14.74,14.82,14.73,14.29,14.52,14.38,14.54,14.68,14.77,15.29,15.71,15.75,15.62,15.38,16.07,15.87,15.81,16.04,15.96,15.16,15.52,15.54,15.53,15.2,15.26,15.0,15.0,14.98,14.93,14.81,14.55,14.48,14.96,15.03,15.33,15.4,15.31,15.27,16.32,16.54,16.48,17.02,17.45,17.11,18.48,19.3,18.19,17.88,18.57,17.61,17.78,17.67,18.12,18.12,18.18,17.04,17.18,17.05,17.13,16.93,17.06,17.82,18.21,18.44,18.06,18.05,18.3,17.77,17.79,18.56,18.77,17.48,17.07,12.96,14.41,14.39,15.18,15.57,15.31,15.34,15.07,16.25,17.47,17.59,18.27,17.88,17.61,17.86,18.22,18.84,19.33,22.86,24.38,28.33,28.28,28.32,27.35,28.89,27.11,27.55,26.36,23.86,24.32,25.06,25.02,24.43,25.78,25.11,24.63,23.91,24.23,24.48,25.82,26.16,26.48,27.52,25.52,25.86,27.41,29.59,27.64,27.57,27.96,26.89,26.25,26.18,25.74,24.83,25.33,26.14,26.3,26.29,27.38,27.73,28.48,28.12,28.21,28.14,27.73,26.13,26.26,26.61,26.2,25.32,25.49,25.67,23.84,23.9,23.76,24.16,24.7,23.84,22.74,22.55,22.69,23.34,24.31,24.38,23.86,24.98,25.27,24.69,23.23,22.43,22.64,22.82,23.09,23.05,23.25,24.32,24.07,22.88,23.36,23.77,25.32,25.31,26.18,25.38,25.62,24.91,24.68,25.66,25.91,23.77,22.91,21.86,22.03,22.27,22.04,22.25,21.84,21.67,21.46,19.86,19.21,18.9,20.07,20.41,20.6,20.33,19.32,18.7,18.77,19.93,19.59,19.02,20.93,19.82,18.79,19.59,20.0,21.48,21.95,21.56,22.61,23.11,23.61,23.89,23.95,24.3,23.87,24.18,23.73,24.43,22.46,21.98,21.86,21.09,21.09,22.09,23.17,23.89,24.93,26.02,25.4,25.14,25.84,25.57,23.89,23.85,23.89,24.32,24.21,23.95,22.84,23.17,24.77,25.18,25.01,24.52,23.39,22.79,24.18,24.64,24.04,23.11,23.65,23.56,21.62,22.14,23.21,23.18,23.2,23.21,24.0,23.84,25.16,25.16,24.19,24.46,24.25,23.95,23.12,23.21,22.91,23.23,22.66,23.01,23.09,22.72,24.5,25.22,25.43,24.82,27.0,29.02,28.47,27.73,27.38,28.64,29.68,31.82,32.01,30.37,29.68,30.43,29.56,30.58,31.05,30.91,29.29,28.95,27.57,28.14,29.77,29.9,28.84,29.96,31.32,32.48,32.06,31.88,32.12,34.51,34.15,32.84,31.32,31.29,30.79,31.34,31.9,30.66,29.64,29.82,30.36,30.7,30.84,31.61,32.27,33.1,33.06,32.51,32.49,33.9,34.09,34.4,34.05,31.27,32.95,33.4,33.23,33.02,32.98,33.16,33.37,36.19,36.76,37.16,36.59,36.88,37.5,38.99,39.32,38.12,38.38,38.6,38.09,38.94,40.97,42.26,42.69,45.0,47.6,50.76,54.1,51.8,48.96,48.77,53.87,52.2,53.91,58.37,64.51,66.3,72.18,74.83,78.98,91.27,99.0,118.45,90.59,86.1,84.75,90.78,86.21],"l":[2.16,2.08,2.06,2.02,1.96,1.94,1.92,1.97,2.06,2.13,2.2,2.12,2.24,2.1,2.13,2.23,2.3,2.3,2.25,2.36,2.47,2.42,2.42,2.45,2.43,2.48,2.46,2.32,2.24,2.28,2.23,2.15,2.06,2.18,2.22,2.24,2.17,2.21,2.19,2.08,2.01,1.84,1.88,1.9,1.96,2.0,2.08,1.92,1.94,1.98,1.96,1.94,1.95,1.97,1.99,1.98,1.98,1.89,1.77,1.8,1.8,1.8,1.83,1.81,1.81,1.8,1.8,1.8,1.77,1.78,1.76,1.75,1.75,1.77,1.75,1.68,1.58,1.56,1.56,1.59,1.64,1.64,1.61,1.6,1.65,1.66,1.66,1.69,1.73,1.77,1.82,1.84,1.82,1.81,1.85,1.89,1.96,1.92,1.88,1.87,1.85,1.75,1.72,1.76,1.79,1.82,1.81,1.87,1.87,1.89,1.89,1.87,1.87,1.89,1.87,1.86,1.86,1.88,1.84,1.85,1.85,1.72,1.65,1.68,1.62,1.57,1.61,1.63,1.63,1.63,1.61,1.6,1.62,1.69,1.73,1.74,1.73,1.79,1.84,1.84,1.84,1.78,1.73,1.7,1.71,1.72,1.72,1.77,1.78,1.78,1.74,1.66,1.61,1.58,1.59,1.63,1.63,1.65,1.68,1.56,1.56,1.59,1.58,1.58,1.57,1.6,1.66,1.66,1.66,1.69,1.73,1.71,1.71,1.67,1.66,1.67,1.66,1.6,1.59,1.58,1.61,1.58,1.57,1.58,1.55,1.54,1.55,1.58,1.57,1.56,1.48,1.37,1.37,1.4,1.38,1.33,1.3,1.29,1.29,1.27,1.3,1.32,1.31,1.32,1.37,1.39,1.39,1.36,1.37,1.44,1.49,1.46,1.5,1.51,1.49,1.48,1.47,1.52,1.51,1.52,1.52,1.57,1.55,1.54,1.55,1.58,1.58,1.58,1.56,1.54,1.55,1.57,1.56,1.55,1.55,1.68,1.74,1.75,1.79,1.79,1.79,1.84,1.88,1.86,1.78,1.69,1.69,1.74,1.78,1.78,1.81,1.8,1.8,1.8,1.79,1.81,1.87,1.95,1.94,1.99,2.01,1.98,2.0,1.96,1.96,2.04,2.19,2.19,2.35,2.15,2.15,2.17,2.17,2.21,2.11,2.1,2.12,2.19,2.34,2.39,2.45,2.5,2.46,2.56,2.58,2.68,2.67,2.81,2.9,2.76,2.63,2.56,2.56,2.57,2.57,2.52,2.57,2.7,2.7,2.79,2.9,2.87,2.82,2.84,2.77,2.8,2.76,2.92,2.97,3.04,3.22,3.26,3.27,3.34,3.72,3.87,4.21,5.15,5.13,5.68,5.01,5.02,5.17,5.17,5.02,4.34,4.39,5.12,5.34,5.21,5.58,4.98,4.62,4.7,4.79,4.68,4.48,4.1,3.79,3.99,4.18,4.66,4.47,4.33,4.31,4.12,4.0,3.94,3.83,3.98,4.25,4.63,4.48,4.79,4.86,4.71,4.75,4.21,4.38,4.19,4.17,4.4,4.55,4.35,4.19,4.15,3.99,4.15,4.11,4.22,4.38,4.42,4.33,4.3,4.32,4.24,4.14,4.11,4.08,4.25,4.3,4.3,4.45,4.56,4.53,4.41,4.46,4.45,4.46,4.51,4.51,4.6,4.63,4.86,5.05,4.81,4.77,4.63,4.42,4.39,4.48,4.4,4.44,4.3,4.27,4.27,4.18,4.2,4.36,4.28,4.22,4.03,3.93,3.96,4.2,4.16,4.2,3.98,3.83,3.9,3.94,3.95,4.06,4.16,4.14,4.23,4.2,4.13,4.03,4.09,4.27,4.41,4.4,4.36,4.47,4.38,4.38,4.64,4.63,4.81,4.77,4.7,4.99,4.82,4.44,4.54,4.23,4.16,4.19,4.11,4.09,4.27,4.15,4.23,4.36,4.24,4.13,4.18,4.15,4.29,4.33,4.31,4.32,4.24,4.34,4.33,4.31,4.35,4.39,4.31,4.35,4.43,4.45,4.47,4.5,4.55,4.72,4.81,4.82,4.95,4.76,4.7,4.77,4.8,4.71,4.72,4.74,4.69,4.54,4.55,4.39,4.33,4.42,4.5,4.43,4.47,4.54,4.52,4.51,4.51,4.37,4.36,4.42,4.45,4.45,4.55,4.59,4.63,4.66,4.77,4.8,4.84,4.87,4.8,4.7,4.7,4.71,4.66,4.66,4.76,4.82,4.87,4.92,4.94,4.9,4.85,4.93,5.03,4.95,5.0,5.31,5.17,5.29,5.25,5.22,4.99,4.92,4.98,5.05,5.07,5.17,5.36,5.26,5.25,5.32,5.28,5.24,5.28,5.24,5.45,5.52,5.49,5.53,5.35,5.43,5.5,5.47,5.55,5.66,5.67,5.8,5.89,5.83,5.81,5.73,5.67,5.92,5.9,5.84,5.84,5.94,5.99,5.98,5.93,5.94,6.28,6.59,7.0,6.95,7.69,7.5,7.23,7.13,7.32,7.45,7.33,7.39,7.34,7.36,7.65,8.12,8.27,8.43,8.63,8.43,8.29,8.45,8.53,8.6,8.89,9.07,9.37,9.0,8.78,8.84,9.15,9.95,10.9,11.94,13.4,14.72,14.9,15.3,16.21,16.49,15.79,16.2,16.06,16.08,16.28,19.1,19.01,21.6,24.6,32.2,33.15,39.75,38.3,35.28,33.76,36.11,30.0,32.8,32.45,23.01,16.6,13.99,13.49,15.54,14.55,13.56,12.0,12.7,12.74,10.89,12.3,14.17,15.3,15.5,15.46,16.75,16.2,15.36,15.45,15.61,15.68,15.65,15.48,16.06,15.99,18.1,19.73,21.4,19.91,20.5,20.6,18.93,18.64,17.5,17.6,18.15,17.94,18.05,14.3,14.45,15.91,15.5,15.4,14.82,14.21,13.05,12.47,12.69,12.73,12.53,11.26,11.74,12.42,12.7,12.03,11.4,10.95,11.13,11.03,10.88,10.87,10.65,10.24,9.99,10.1,9.91,9.2,8.3,8.2,8.68,8.46,8.35,8.24,8.35,8.97,8.7,9.15,9.85,10.06,9.54,8.77,9.04,9.3,9.08,8.93,9.01,8.58,8.04,8.03,8.07,8.48,8.52,8.29,8.05,8.06,7.72,7.79,7.73,8.05,8.38,8.25,7.84,7.53,7.0,6.96,7.06,7.01,7.28,7.39,7.18,7.01,6.8,6.65,6.69,6.36,5.92,5.88,5.14,4.9,5.1,5.53,6.24,6.42,6.63,6.81,6.24,6.28,7.85,7.69,8.75,8.78,8.68,8.19,7.97,9.1,9.58,9.76,10.18,9.37,9.35,9.01,9.53,10.37,10.3,10.38,10.87,11.06,12.02,12.69,12.2,7.54,13.69,14.17,13.26,10.6,10.48,10.62,10.23,10.31,10.97,11.11,11.91,11.8,12.12,12.61,12.96,12.73,12.2,11.09,11.4,11.56,11.56,11.42,11.97,11.95,12.11,11.59,11.48,12.01,12.21,11.99,12.15,11.63,11.79,11.24,9.74,10.2,9.51,8.59,8.37,8.82,8.59,8.39,8.71,9.25,8.85,8.64,8.79,8.41,7.9,8.01,7.98,8.29,8.63,8.64,9.13,9.53,9.66,9.42,9.39,9.39,9.11,9.13,9.14,9.09,8.93,8.59,8.83,8.92,9.12,9.12,8.65,8.44,8.36,7.6,7.2,7.39,6.99,6.92,7.36,7.59,7.48,7.45,7.11,7.08,6.98,7.43,7.45,7.11,7.16,7.18,7.18,7.5,7.59,7.48,7.05,6.99,6.67,6.22,6.28,6.02,5.83,5.99,5.95,5.95,6.13,6.08,6.0,5.45,5.62,5.52,5.71,6.26,6.39,6.63,6.4,6.12,6.15,6.14,6.36,6.15,6.0,6.06,6.08,6.11,6.11,5.89,5.93,6.08,6.08,6.13,6.11,6.26,6.21,6.25,6.0,5.97,5.89,6.06,6.0,6.22,6.13,6.13,6.07,6.04,6.08,6.09,6.13,6.06,5.78,5.76,5.78,5.75,5.79,6.01,6.09,6.1,5.86,5.79,5.86,5.67,5.57,5.55,5.66,5.57,5.1,5.24,5.21,5.07,5.03,5.14,5.06,4.85,5.09,5.1,5.15,5.07,5.04,5.04,5.06,5.03,4.97,4.98,5.14,5.28,5.08,5.1,5.21,5.54,5.76,5.76,5.52,5.6,5.5,5.55,5.59,5.61,5.74,5.45,5.25,5.31,5.32,5.36,5.3,5.28,5.36,5.51,5.47,5.55,5.49,5.43,5.39,5.45,5.43,5.53,5.55,5.56,6.23,6.5,6.87,7.84,7.93,8.1,8.29,8.97,7.3,7.34,7.71,7.47,6.76,6.95,7.2,7.55,7.53,7.68,7.99,7.63,7.53,7.55,7.45,7.52,7.51,7.36,7.53,7.57,7.7,7.5,6.88,6.29,6.41,6.56,6.63,6.84,6.63,6.71,6.73,6.7,6.5,6.76,6.67,6.55,6.34,6.27,6.35,6.2,6.14,6.29,6.23,6.36,6.64,6.42,6.36,6.41,6.37,6.32,6.38,6.56,6.57,6.6,6.98,6.98,6.91,6.65,6.71,6.89,7.15,6.78,6.76,6.6,6.62,6.62,6.46,6.49,6.42,6.17,6.1,6.12,6.25,6.32,6.21,6.28,6.41,6.21,6.07,6.07,6.11,6.08,6.08,6.05,5.96,5.91,5.87,6.08,5.81,5.82,5.79,5.93,5.76,5.8,6.04,6.06,5.77,5.79,5.76,5.76,5.64,5.62,5.59,5.37,5.09,5.16,5.24,5.19,5.24,5.17,5.19,5.18,5.18,5.21,5.15,5.13,5.17,5.12,5.05,5.06,5.06,5.07,5.26,5.15,5.04,5.09,5.08,5.16,5.23,5.3,5.69,5.57,5.53,5.55,5.56,5.22,5.16,5.25,5.21,5.2,5.2,5.3,5.29,5.25,5.12,5.11,5.06,5.05,4.96,4.94,5.08,5.05,4.96,4.94,5.0,5.02,5.09,5.07,4.99,4.84,4.82,4.8,4.88,4.8,4.83,4.84,4.81,4.87,5.07,5.12,4.83,4.76,4.75,4.79,4.78,4.69,4.25,4.2,4.22,4.07,4.17,4.14,4.11,4.09,4.12,3.96,3.95,4.04,4.1,4.08,4.04,3.83,3.81,3.8,3.66,3.62,3.55,3.75,3.98,3.94,3.84,3.94,3.96,3.95,3.87,3.89,4.03,4.0,4.0,4.06,4.15,4.46,4.39,4.34,4.42,4.38,4.37,4.1,3.97,3.94,3.95,3.88,3.81,3.83,3.96,4.06,4.09,4.13,4.05,4.05,4.09,4.05,4.03,4.01,4.04,4.07,4.05,3.85,3.82,3.89,3.86,3.94,4.05,4.2,4.13,4.17,4.18,4.06,4.07,4.09,4.11,4.02,4.09,4.09,4.09,4.03,3.98,3.94,4.01,4.08,4.07,4.06,4.03,4.05,4.09,4.02,3.99,3.91,3.92,3.95,3.92,3.88,3.81,3.73,3.65,3.72,3.69,3.75,3.79,3.73,3.73,3.71,3.72,3.75,3.76,3.69,3.75,3.75,3.73,3.71,3.71,3.69,3.66,3.65,3.67,3.67,3.67,3.66,3.66,3.64,3.57,3.57,3.56,3.62,3.65,3.7,3.79,3.87,3.88,4.02,4.25,4.23,4.4,4.52,4.37,4.3,4.22,4.27,4.46,4.88,4.92,4.94,4.97,4.82,4.59,4.66,4.69,4.55,4.24,3.92,4.04,4.03,4.05,4.29,4.36,4.39,4.21,4.52,4.52,4.64,4.43,4.83,5.02,5.0,5.09,5.02,4.91,5.18,4.97,5.06,5.21,5.23,5.16,5.19,5.18,5.36,5.41,5.61,5.46,5.28,5.2,5.09,5.07,5.26,5.39,5.45,5.34,5.27,5.33,5.37,5.25,5.24,5.16,5.21,5.26,5.16,5.11,5.05,5.21,5.36,5.41,5.38,5.43,5.62,5.53,5.37,5.36,5.31,5.22,5.13,5.16,5.15,4.92,4.64,4.73,4.75,4.81,4.62,4.64,4.77,4.76,4.67,4.67,4.73,4.75,4.42,4.42,4.62,4.58,4.63,5.21,5.21,5.64,5.58,5.7,5.39,5.33,5.28,5.26,5.23,5.33,5.35,5.26,5.07,5.12,5.16,5.08,5.03,5.17,5.23,5.56,5.32,5.21,5.4,5.36,5.41,5.32,5.38,5.33,5.34,5.31,5.28,5.32,5.21,5.18,5.18,5.11,5.12,5.13,5.17,5.46,5.4,5.5,5.51,5.66,5.64,5.51,5.46,5.35,5.49,5.5,5.52,5.51,5.46,5.25,5.29,5.28,5.42,5.36,5.29,5.33,5.16,4.98,5.11,5.03,5.05,5.08,5.0,4.97,5.07,5.04,5.04,5.08,5.18,5.14,5.05,4.95,4.85,4.85,4.86,4.89,4.9,4.8,4.74,4.83,4.86,4.73,4.71,4.76,4.8,4.83,4.7,4.66,4.65,4.7,4.88,4.8,4.82,5.17,5.19,5.17,5.14,5.17,5.09,4.74,4.76,4.72,4.71,4.64,4.72,4.83,4.66,4.72,4.72,4.71,4.71,4.72,4.55,4.25,4.22,4.28,4.34,4.33,4.39,4.5,4.66,4.63,4.67,4.59,4.68,4.87,5.14,4.92,4.9,4.79,4.78,4.87,5.11,5.24,5.24,5.38,5.84,6.03,5.94,5.74,5.53,5.76,5.94,6.25,7.0,6.69,6.05,6.31,6.06,5.8,6.32,6.34,6.38,6.07,6.23,6.11,5.88,5.46,5.21,4.96,5.12,5.17,5.09,5.29,5.3,5.29,5.27,5.39,5.53,5.38,5.11,5.1,4.79,4.73,4.85,4.93,4.88,5.14,5.01,4.8,4.86,4.86,4.92,4.99,4.95,4.92,4.69,4.76,4.79,4.89,4.92,4.91,5.11,5.12,5.08,5.28,5.5,5.38,5.42,5.22,5.24,5.04,5.05,5.01,4.92,4.88,5.07,5.1,5.27,5.37,5.29,4.93,4.88,4.93,5.01,4.97,5.07,5.17,5.05,5.03,5.12,5.36,5.28,5.19,5.08,5.08,5.13,5.1,5.12,5.32,5.47,5.38,5.17,5.18,5.2,5.05,5.07,5.13,5.08,5.07,5.1,5.17,5.19,5.13,5.09,5.1,5.2,5.2,5.27,5.23,5.15,5.02,5.05,5.06,5.04,4.93,4.99,5.08,5.08,4.94,5.0,4.97,4.96,4.92,4.89,5.0,5.0,4.93,4.93,4.97,4.96,4.96,4.92,4.95,4.87,4.84,4.76,4.88,4.89,4.86,4.82,4.89,4.86,4.85,4.82,4.72,4.71,4.71,4.65,4.62,4.62,4.67,4.61,4.57,4.58,4.5,4.53,4.6,4.76,4.75,4.57,4.5,4.42,4.42,4.4,4.35,4.33,4.33,4.29,4.33,4.33,4.38,4.34,4.32,4.33,4.51,4.39,4.33,4.33,4.33,4.3,4.22,4.25,4.22,4.24,4.21,4.14,4.16,4.17,4.2,4.17,4.18,4.29,4.51,4.58,4.42,4.24,4.19,4.21,4.11,4.11,4.07,4.07,4.14,4.24,4.38,4.5,4.52,4.71,4.41,4.29,4.24,4.3,4.39,4.41,4.38,4.48,4.49,4.49,4.54,4.61,4.55,4.45,4.53,4.52,4.56,4.6,4.66,4.77,4.93,4.87,4.82,4.82,4.8,4.94,5.0,4.83,4.54,4.61,4.49,4.42,4.44,4.46,4.53,4.54,4.51,4.47,4.29,4.3,4.38,4.42,4.45,4.53,4.46,4.43,4.43,4.58,4.62,4.62,4.67,4.78,4.73,4.76,4.79,4.71,4.52,4.49,4.59,4.61,4.54,4.4,4.38,4.37,4.38,4.48,4.54,4.55,4.72,4.79,4.67,4.56,4.48,4.48,4.52,4.5,4.5,4.66,4.66,4.73,5.02,4.93,4.87,4.92,4.95,4.97,5.09,5.16,5.19,5.08,4.82,4.88,4.92,5.09,4.93,5.03,5.21,5.21,5.36,5.5,5.55,5.68,5.86,5.97,6.21,6.26,6.22,6.08,6.29,6.54,6.36,6.59,6.92,7.11,7.49,7.61,8.09,6.86,6.14,5.57,5.8,5.5,5.72,5.83,5.76,5.66,5.63,5.8,5.88,6.03,6.38,6.31,6.19,6.5,6.48,6.69,6.57,6.71,6.13,6.13,6.21,6.39,6.74,6.79,6.96,7.06,7.04,7.42,7.5,7.56,7.65,6.71,6.68,6.81,6.77,6.39,6.47,6.52,6.72,6.66,6.49,7.13,7.24,7.13,7.35,7.33,6.92,6.92,6.94,7.01,7.04,6.98,6.85,6.88,6.88,6.98,7.13,7.24,7.2,7.21,7.02,6.88,6.96,6.95,6.99,7.2,7.0,6.96,6.84,6.74,6.99,6.96,7.29,7.22,7.34,7.67,7.6,7.62,7.42,7.49,7.77,8.05,8.21,8.59,8.39,8.28,8.76,8.83,8.9,8.88,8.93,9.65,9.28,9.2,9.49,9.66,9.86,10.02,10.28,10.81,11.59,12.42,12.19,12.46,13.69,13.75,12.43,12.16,12.05,11.41,9.72,9.89,10.26,11.23,11.04,10.52,10.74,11.36,12.13,11.76,12.2,12.14,12.29,10.7,10.74,11.05,10.82,11.14,11.62,11.57,12.08,12.51,12.69,12.92,13.44,13.67,13.72,12.46,12.84,12.62,12.21,12.55,12.87,13.15,13.29,13.78,13.74,13.53,12.61,12.65,13.16,13.26,13.28,13.84,13.84,13.35,13.18,13.04,12.87,12.93,13.03,13.31,12.86,13.15,12.26,12.4,12.74,12.9,12.75,12.73,12.69,11.69,11.67,11.8,12.1,12.47,12.59,13.28,13.22,13.21,13.6,13.35,14.18,14.49,14.45,14.36,14.23,13.86,14.01,13.74,14.35,14.76,15.24,15.82,15.57,16.44,16.48,16.98,17.01,18.06,19.48,19.57,17.53,17.57,16.74,17.49,17.45,16.68,16.19,16.58,16.6,17.03,16.85,16.65,16.31,16.73,16.7,17.56,17.62,18.55,17.52,17.12,15.76,12.82,13.01,13.05,12.72,10.66,10.77,12.98,11.2,11.29,9.56,8.88,9.01,9.95,9.33,9.17,10.04,9.41,9.73,10.33,10.29,10.79,10.85,10.51,11.16,11.74,12.37,12.96,13.55,13.21,12.68,12.62,12.61,13.16,12.86,12.17,11.98,12.06,12.15,13.11,13.84,13.79,14.3,15.3,14.84,14.02,13.77,13.41,12.63,12.47,13.4,13.4,14.08,14.28,13.59,14.11,14.74,16.09,16.35,16.2,15.91,16.23,17.31,17.39,16.33,16.35,17.26,17.74,17.98,18.14,17.39,17.18,16.92,16.92,17.17,18.35,17.28,16.29,15.17,15.14,15.57,15.76,16.5,16.91,17.02,16.68,17.15,17.92,18.16,17.5,17.96,17.63,18.42,17.72,17.63,17.76,17.36,18.42,18.38,17.98,17.65,18.0,17.55,17.6,18.11,17.92,18.14,17.88,18.87,19.65,19.93,20.76,21.16,22.03,23.03,23.05,23.48,24.73,26.72,25.2,26.62,26.74,28.41,28.78,29.07,30.44,28.39,28.52,27.14,26.68,27.75,29.21,30.16,32.54,33.49,34.1,33.88,35.95,36.62,38.08,40.22,42.79,45.3,34.2,32.5,34.28,34.7,35.19,36.22,34.68,34.73,33.85,34.1,34.91,38.59,39.63,39.24,38.29,39.18,39.0,40.9,40.98,39.97,32.9,28.16,28.69,31.37,30.79,31.7,32.97,33.71,32.25,30.9,31.35,31.85,28.8,28.78,26.16,28.78,28.85,29.9,31.67,33.18,33.28,33.18,33.56,34.56,33.17,32.27,31.54,31.79,31.27,31.47,31.32,30.7,29.9,28.58,27.25,27.76,27.38,28.17,28.54,26.81,26.72,27.32,26.67,27.03,26.93,27.25,27.72,27.64,28.1,30.52,31.74,33.0,34.06,33.73,34.35,33.79,32.33,31.67,31.82,30.91,32.27,32.67,33.76,32.83,32.52,29.89,29.75,29.32,30.14,30.76,31.56,30.87,31.51,30.18,28.72,28.01,28.69,28.64,28.8,28.33,26.8,27.25,23.31,22.91,23.69,23.37,22.26,21.66,22.36,22.37,21.58,19.87,18.61,19.32,19.1,19.42,19.92,19.46,19.27,20.84,22.87,23.64,23.05,21.72,21.47,21.44,21.14,21.52,20.49,22.06,21.75,21.6,20.64,19.93,19.71,19.05,19.5,19.33,19.37,19.5,19.52,20.0,19.87,19.31,19.27,20.17,21.37,21.27,21.11,20.97,20.17,19.68,19.8,19.81,19.6,19.06,19.06,19.25,19.33,19.31,18.85,18.76,19.0,19.55,20.75,20.87,20.95,20.7,20.46,20.34,19.78,19.85,19.4,19.32,19.1,18.64,18.45,17.52,16.97,17.02,17.01,17.07,16.2,15.28,15.35,16.2,15.97,15.73,16.26,15.86,15.71,15.71,15.88,16.52,17.65,16.92,17.0,16.8,16.34,16.2,15.99,15.5,15.47,16.73,16.56,16.3,16.08,15.83,15.84,16.31,16.39,17.07,16.66,16.15,15.87,15.93,15.77,15.61,14.99,14.93,14.49,14.54,14.52,14.88,14.84,14.27,14.56,14.54,14.35,14.79,14.43,15.25,15.61,15.75,15.63,15.02,14.39,14.17,13.98,13.93,13.92,13.71,14.2,13.82,14.0,13.8,13.88,13.58,14.26,14.94,15.25,15.0,14.75,15.27,15.29,15.28,15.06,14.96,15.56,16.2,16.86,17.18,17.04,16.56,16.2,15.95,16.31,17.25,17.2,17.57,19.72,20.14,19.34,19.41,20.16,19.66,19.41,18.5,18.65,19.41,18.72,19.12,19.01,17.33,17.44,17.4,17.61,17.76,18.22,16.51,16.31,16.3,16.62,16.05,15.74,15.85,15.95,16.52,16.82,16.7,17.1,17.6,17.88,17.89,17.66,16.89,16.91,17.23,17.94,18.16,17.94,17.98,17.41,16.27,16.22,16.59,16.95,17.13,17.35,16.76,16.51,16.47,15.84,15.22,16.07,16.31,16.47,16.13,16.68,16.93,17.34,17.77,17.7,16.95,16.82,16.58,16.92,16.95,16.72,16.73,16.91,16.93,16.96,16.42,15.82,15.71,16.09,16.5,17.06,17.01,17.04,16.98,17.14,16.34,16.43,16.43,16.32,16.48,16.45,16.25,16.28,16.27,16.34,16.6,16.53,16.25,16.44,16.25,16.34,16.37,16.39,16.76,16.25,16.03,15.93,15.81,15.26,15.36,15.36,15.35,14.61,14.62,14.65,14.17,14.12,14.17,14.29,14.51,14.32,14.52,14.63,14.34,14.34,13.97,14.26,14.15,14.38,14.53,14.6,14.68,15.44,15.62,15.47,15.26,15.69,15.71,15.58,15.77,15.56,15.07,15.23,15.32,15.1,15.03,15.06,14.94,14.8,14.65,14.79,14.48,14.41,14.38,14.71,14.7,14.78,15.22,15.17,15.03,15.32,16.39,16.0,16.39,16.95,16.93,17.73,18.14,17.99,17.75,17.52,17.11,17.43,17.25,17.53,17.66,16.81,16.73,16.8,16.87,16.87,16.62,16.94,17.38,17.82,17.91,17.77,17.6,17.47,17.62,17.56,17.8,17.18,16.81,15.77,12.01,12.51,13.93,14.55,15.16,14.91,14.85,14.75,15.45,17.0,17.19,17.58,17.62,17.09,17.53,17.84,18.02,18.89,19.44,23.16,24.23,25.81,26.85,26.39,26.82,26.54,26.75,22.22,22.89,23.53,23.93,24.63,23.02,23.98,24.2,23.98,23.14,22.15,23.75,23.86,25.32,26.15,26.64,25.02,24.86,25.18,26.4,27.07,26.95,26.68,25.36,25.16,25.85,24.67,24.0,24.98,24.95,25.88,25.87,26.3,26.82,27.61,27.55,27.36,27.58,26.39,25.95,25.77,26.01,25.93,25.07,24.8,24.98,23.39,23.2,23.43,23.92,24.02,23.01,22.39,21.52,22.3,22.52,23.22,23.95,23.58,24.18,24.79,23.5,22.35,21.89,21.8,22.3,22.77,22.24,22.45,22.91,22.5,22.36,22.86,23.29,23.73,24.35,25.66,24.64,25.02,24.64,24.27,25.0,24.34,23.16,22.48,20.84,21.17,21.83,21.61,21.59,21.23,20.86,19.73,19.2,18.46,18.27,18.54,19.92,20.2,19.23,18.89,17.77,18.17,19.0,19.0,18.25,19.41,18.77,18.39,18.88,18.92,20.67,21.07,20.64,21.36,22.39,22.83,23.24,23.86,23.41,23.52,23.45,23.43,23.0,22.11,21.21,21.09,20.52,20.09,21.09,22.34,22.89,23.93,25.05,24.75,24.77,24.77,23.86,23.52,23.0,23.25,23.48,23.41,22.34,22.47,22.71,23.04,24.73,24.23,23.45,22.69,22.41,22.88,24.22,23.01,22.64,23.2,22.55,21.05,21.65,22.59,22.74,22.64,22.44,22.07,23.39,24.65,23.79,22.73,23.91,23.79,22.96,22.84,22.61,22.2,22.67,22.29,22.09,22.71,22.34,23.1,24.3,24.59,24.52,25.65,27.82,28.24,26.91,26.23,27.23,28.12,30.54,31.27,29.61,29.21,29.13,28.84,29.25,30.72,29.11,27.75,27.88,26.93,27.7,28.83,29.43,28.08,28.13,30.59,30.63,31.07,30.67,31.16,33.15,32.8,31.11,29.99,30.74,30.07,30.45,30.73,28.8,29.48,28.91,30.14,29.73,30.25,30.15,31.29,31.73,32.46,31.14,31.52,32.51,33.18,33.09,31.34,30.18,32.27,32.61,32.12,32.43,32.02,32.5,32.9,33.24,36.08,36.13,35.77,35.98,36.24,37.76,38.47,36.22,37.15,37.69,37.08,38.22,40.52,41.08,41.27,43.73,46.17,48.45,51.24,47.76,46.44,47.61,50.04,48.91,50.04,57.44,58.38,62.98,69.22,71.99,75.07,84.07,93.0,103.19,74.94,76.56,73.48,86.7,86.21],"c":[2.16,2.13,2.08,2.07,2.02,1.94,2.0,2.02,2.2,2.23,2.49,2.22,2.28,2.1,2.16,2.28,2.33,2.31,2.36,2.5,2.5,2.48,2.48,2.46,2.45,2.5,2.47,2.35,2.33,2.28,2.25,2.15,2.2,2.27,2.24,2.26,2.23,2.24,2.2,2.08,2.05,1.87,1.91,1.9,1.97,2.09,2.08,1.97,2.04,1.99,1.97,1.94,1.97,2.04,1.99,1.99,2.0,1.89,1.77,1.83,1.82,1.93,1.84,1.83,1.83,1.83,1.8,1.8,1.78,1.78,1.82,1.78,1.76,1.77,1.75,1.69,1.63,1.56,1.59,1.63,1.65,1.65,1.61,1.62,1.7,1.68,1.67,1.7,1.8,1.8,1.83,1.87,1.84,1.81,1.85,1.95,1.96,1.92,1.9,1.89,1.85,1.75,1.74,1.8,1.8,1.84,1.86,1.88,1.91,1.9,1.9,1.88,1.9,1.9,1.87,1.87,1.88,1.88,1.84,1.86,1.85,1.73,1.73,1.68,1.62,1.63,1.64,1.63,1.65,1.63,1.62,1.62,1.66,1.72,1.77,1.74,1.76,1.81,1.84,1.85,1.84,1.78,1.73,1.73,1.75,1.75,1.73,1.78,1.79,1.78,1.74,1.66,1.65,1.6,1.65,1.64,1.63,1.69,1.68,1.56,1.59,1.6,1.59,1.6,1.59,1.64,1.66,1.67,1.69,1.71,1.75,1.71,1.72,1.69,1.69,1.7,1.66,1.6,1.59,1.61,1.63,1.6,1.6,1.59,1.55,1.56,1.59,1.6,1.59,1.56,1.49,1.39,1.42,1.41,1.38,1.34,1.32,1.31,1.31,1.28,1.33,1.32,1.31,1.35,1.42,1.43,1.39,1.37,1.44,1.45,1.49,1.52,1.52,1.53,1.5,1.49,1.5,1.54,1.51,1.53,1.56,1.58,1.55,1.55,1.57,1.59,1.58,1.58,1.57,1.56,1.57,1.59,1.56,1.56,1.68,1.76,1.74,1.84,1.81,1.82,1.84,1.88,1.9,1.86,1.78,1.72,1.74,1.76,1.78,1.83,1.81,1.83,1.8,1.8,1.82,1.87,1.92,1.98,2.0,2.03,2.03,2.01,2.0,1.98,2.03,2.14,2.19,2.46,2.49,2.15,2.21,2.2,2.21,2.21,2.12,2.13,2.19,2.36,2.38,2.39,2.61,2.5,2.53,2.6,2.67,2.8,2.8,2.84,2.91,2.86,2.67,2.65,2.59,2.6,2.59,2.54,2.73,2.7,2.7,2.87,2.92,2.87,2.87,2.86,2.78,2.8,2.92,3.07,2.97,3.17,3.22,3.27,3.34,3.63,3.91,4.04,4.75,5.59,5.82,5.73,5.42,5.28,5.43,5.35,5.02,4.34,4.78,5.43,5.5,5.46,5.77,5.21,4.92,5.01,5.02,4.83,4.61,4.1,3.79,4.37,4.7,4.66,4.47,4.41,4.4,4.12,4.14,3.94,3.87,4.18,4.83,4.75,4.62,5.09,4.89,4.89,4.75,4.21,4.46,4.27,4.21,4.48,4.78,4.35,4.19,4.15,4.27,4.15,4.25,4.55,4.68,4.42,4.33,4.5,4.32,4.28,4.14,4.18,4.33,4.31,4.37,4.5,4.45,4.72,4.53,4.41,4.48,4.45,4.52,4.56,4.57,4.6,4.82,5.0,5.21,4.81,4.85,4.63,4.48,4.51,4.48,4.47,4.46,4.33,4.35,4.27,4.19,4.39,4.36,4.28,4.23,4.03,4.02,4.05,4.23,4.16,4.23,3.98,3.98,4.01,3.99,4.1,4.23,4.16,4.23,4.26,4.22,4.13,4.15,4.28,4.4,4.41,4.43,4.47,4.47,4.46,4.62,4.66,4.92,4.85,4.77,4.96,5.03,4.82,4.5,4.54,4.23,4.32,4.35,4.21,4.29,4.29,4.26,4.38,4.36,4.24,4.16,4.21,4.27,4.36,4.45,4.34,4.32,4.31,4.37,4.33,4.32,4.36,4.4,4.33,4.4,4.46,4.48,4.47,4.53,4.59,4.77,4.81,4.92,4.97,4.84,4.75,4.79,4.86,4.71,4.74,4.79,4.72,4.61,4.55,4.39,4.39,4.46,4.52,4.45,4.56,4.57,4.52,4.55,4.51,4.43,4.4,4.47,4.45,4.49,4.59,4.64,4.64,4.75,4.81,4.81,4.89,4.97,4.84,4.71,4.7,4.76,4.67,4.7,4.76,4.86,4.92,4.92,4.99,4.9,4.9,5.02,5.03,5.0,5.24,5.45,5.28,5.34,5.25,5.22,5.04,5.0,5.09,5.09,5.2,5.21,5.45,5.26,5.33,5.33,5.28,5.24,5.29,5.41,5.6,5.52,5.63,5.54,5.4,5.52,5.5,5.57,5.62,5.67,5.84,5.93,5.92,6.12,5.81,5.73,5.78,6.04,5.95,5.86,5.88,5.95,6.02,5.98,5.93,6.24,6.55,6.62,7.0,7.35,7.72,7.69,7.25,7.34,7.55,7.45,7.39,7.39,7.37,7.57,8.01,8.35,8.33,8.74,8.63,8.49,8.48,8.76,8.54,8.93,8.92,9.3,9.5,9.0,9.13,9.25,9.76,10.32,11.72,13.0,14.04,16.25,15.3,16.98,17.31,16.49,16.02,16.41,16.2,16.08,19.0,19.11,20.9,23.44,27.85,32.75,36.61,49.45,38.3,35.31,36.8,36.11,33.2,35.52,32.45,23.01,21.03,13.99,14.75,15.62,14.58,15.52,13.1,13.01,12.79,11.37,13.7,17.02,16.15,15.71,16.26,16.9,16.2,15.36,16.65,15.61,16.16,15.86,16.19,16.06,17.03,21.65,20.95,22.24,19.91,21.47,20.6,18.93,18.88,17.5,18.54,19.26,18.42,18.05,14.3,15.3,16.5,15.5,15.63,14.9,14.21,13.15,13.35,12.69,13.25,12.53,11.55,12.14,12.9,13.15,12.18,11.4,11.11,11.39,11.13,11.11,10.9,10.65,10.59,9.99,10.47,9.91,9.2,8.44,8.92,8.88,8.46,8.51,8.51,9.31,9.48,9.15,9.95,10.78,10.06,9.54,9.33,9.49,9.5,9.08,9.12,9.05,8.67,8.19,8.23,8.75,8.5,8.77,8.29,8.15,8.22,7.92,7.92,8.28,8.52,8.52,8.29,7.84,7.53,7.04,7.0,7.06,7.11,7.41,7.51,7.21,7.06,6.86,6.65,6.7,6.36,5.92,5.95,5.14,5.12,5.88,6.24,6.38,7.14,6.63,6.82,6.38,7.45,8.25,8.8,8.75,8.98,8.91,8.23,8.9,9.73,10.26,9.87,10.58,9.37,9.83,9.22,10.43,10.44,10.3,10.75,10.87,11.23,12.3,12.83,13.35,7.54,14.26,14.45,13.26,10.6,10.87,10.62,10.39,10.5,11.02,11.75,12.02,11.96,12.4,12.9,13.29,13.22,12.2,11.73,11.72,12.3,11.56,12.03,11.97,12.28,12.14,11.59,11.72,12.22,12.21,12.19,12.24,11.68,11.94,11.24,10.32,10.43,9.53,9.0,8.9,8.91,8.61,8.55,9.73,9.25,8.85,8.84,8.91,8.41,8.09,8.29,8.12,8.87,8.73,9.04,9.62,9.67,9.87,9.43,9.39,9.65,9.11,9.13,9.32,9.09,9.05,8.75,8.89,9.16,9.36,9.12,8.65,8.65,8.39,7.6,7.38,7.39,6.99,7.54,7.88,7.85,7.59,7.45,7.16,7.18,7.14,7.43,7.57,7.13,7.21,7.26,7.42,7.62,7.61,7.52,7.05,6.99,6.67,6.41,6.38,6.09,6.11,6.26,5.95,6.29,6.13,6.32,6.0,5.61,5.67,5.63,6.39,6.66,6.39,6.67,6.4,6.24,6.16,6.29,6.45,6.15,6.08,6.1,6.24,6.11,6.11,5.91,6.04,6.12,6.08,6.13,6.12,6.35,6.21,6.25,6.0,6.05,6.0,6.06,6.36,6.22,6.16,6.16,6.07,6.04,6.12,6.15,6.15,6.06,5.87,5.83,5.78,5.75,6.11,6.19,6.2,6.1,5.88,5.79,5.88,5.67,5.61,5.71,5.74,5.62,5.11,5.41,5.21,5.07,5.12,5.21,5.06,5.0,5.21,5.14,5.3,5.1,5.04,5.05,5.06,5.03,5.01,5.05,5.2,5.34,5.26,5.17,5.46,5.78,5.89,5.76,5.76,5.6,5.5,5.62,5.61,5.71,5.84,5.45,5.38,5.35,5.37,5.38,5.3,5.36,5.39,5.56,5.51,5.55,5.56,5.43,5.44,5.47,5.53,5.66,5.55,5.96,6.35,6.9,7.19,9.14,7.93,8.19,8.86,8.99,7.68,7.88,7.91,7.5,6.81,7.24,7.66,7.71,7.68,8.32,7.99,7.63,7.62,7.55,7.68,7.82,7.63,7.57,7.53,7.82,7.82,7.53,6.88,6.37,6.71,6.6,7.0,6.84,7.01,6.79,6.73,6.7,6.85,6.82,6.71,6.55,6.39,6.28,6.35,6.21,6.27,6.33,6.32,6.62,6.75,6.42,6.46,6.41,6.46,6.37,6.55,6.62,6.58,7.22,7.13,7.11,6.91,6.69,6.95,7.32,7.71,6.8,6.83,6.72,6.67,6.71,6.57,6.63,6.43,6.24,6.17,6.31,6.28,6.34,6.21,6.4,6.44,6.21,6.14,6.11,6.12,6.08,6.12,6.05,5.97,5.91,5.99,6.08,5.81,5.9,5.83,5.94,5.81,6.04,6.05,6.09,5.77,5.81,5.86,5.78,5.64,5.62,5.66,5.37,5.33,5.22,5.39,5.31,5.31,5.17,5.34,5.18,5.23,5.21,5.29,5.13,5.24,5.12,5.05,5.12,5.06,5.21,5.28,5.15,5.08,5.09,5.17,5.24,5.28,5.66,5.88,5.71,5.61,5.6,5.6,5.22,5.28,5.33,5.21,5.28,5.32,5.32,5.33,5.25,5.14,5.11,5.11,5.09,4.97,5.18,5.13,5.08,4.96,5.06,5.05,5.04,5.22,5.07,5.01,4.84,4.82,4.84,4.88,4.9,4.87,4.84,4.83,4.94,5.21,5.13,4.83,4.78,4.81,4.81,4.79,4.71,4.25,4.24,4.22,4.23,4.24,4.14,4.14,4.09,4.15,3.96,4.15,4.09,4.21,4.15,4.04,3.83,3.88,3.83,3.82,3.62,3.75,4.0,4.03,4.01,3.84,4.04,4.02,3.95,3.9,4.02,4.03,4.02,4.05,4.13,4.49,4.51,4.44,4.45,4.53,4.38,4.39,4.1,3.97,3.97,3.96,3.88,3.81,3.87,3.96,4.07,4.09,4.17,4.05,4.12,4.12,4.1,4.03,4.01,4.13,4.07,4.07,3.85,3.82,3.9,3.98,4.14,4.33,4.2,4.13,4.2,4.19,4.1,4.12,4.15,4.11,4.1,4.09,4.09,4.13,4.03,3.99,4.01,4.04,4.12,4.07,4.06,4.08,4.11,4.11,4.02,4.04,3.96,3.92,3.98,3.95,3.93,3.81,3.73,3.72,3.74,3.69,3.81,3.82,3.73,3.75,3.71,3.8,3.76,3.91,3.8,3.77,3.75,3.76,3.72,3.77,3.69,3.67,3.66,3.67,3.71,3.71,3.67,3.74,3.64,3.57,3.59,3.64,3.68,3.72,3.97,3.88,3.87,3.93,4.3,4.36,4.43,4.52,4.71,4.5,4.31,4.34,4.4,4.83,4.99,5.04,5.03,5.3,4.82,4.59,4.66,4.69,4.55,4.28,4.1,4.14,4.06,4.37,4.33,4.44,4.4,4.48,4.58,4.69,4.67,4.61,4.99,5.02,5.03,5.12,5.11,5.21,5.18,4.97,5.46,5.21,5.23,5.18,5.19,5.45,5.43,5.73,5.74,5.46,5.29,5.2,5.28,5.07,5.42,5.53,5.45,5.34,5.39,5.47,5.41,5.36,5.24,5.22,5.25,5.29,5.17,5.19,5.17,5.25,5.44,5.45,5.38,5.71,5.62,5.66,5.37,5.4,5.37,5.26,5.18,5.23,5.17,4.93,4.67,4.82,4.75,4.85,4.7,4.84,4.84,4.76,4.74,4.76,4.73,4.81,4.43,4.61,4.67,4.7,5.16,5.41,5.25,5.64,5.83,6.04,5.39,5.45,5.49,5.35,5.34,5.46,5.35,5.33,5.12,5.19,5.16,5.08,5.2,5.31,5.66,5.58,5.34,5.5,5.49,5.46,5.53,5.32,5.38,5.33,5.4,5.36,5.43,5.36,5.24,5.22,5.25,5.14,5.12,5.14,5.5,5.46,5.41,5.62,5.83,5.72,5.68,5.51,5.53,5.43,5.57,5.6,5.52,5.53,5.54,5.25,5.37,5.41,5.42,5.36,5.31,5.33,5.2,4.98,5.11,5.03,5.07,5.13,5.01,4.99,5.12,5.12,5.08,5.21,5.2,5.14,5.05,4.95,4.85,4.9,5.03,4.89,4.9,4.8,4.83,4.84,4.86,4.74,4.89,4.83,4.88,4.88,4.7,4.75,4.75,4.97,4.96,4.8,5.14,5.24,5.25,5.17,5.27,5.19,5.13,4.74,4.79,4.72,4.74,4.74,4.83,4.84,4.66,4.86,4.9,4.71,4.75,4.75,4.55,4.36,4.26,4.31,4.47,4.38,4.41,4.5,4.72,4.71,4.78,4.72,4.76,5.15,5.14,4.92,4.9,4.82,4.95,5.06,5.25,5.3,5.31,5.79,6.08,6.27,5.94,5.74,5.89,5.83,6.05,7.81,7.08,6.76,6.37,6.31,6.24,5.93,6.38,6.73,6.41,6.28,6.32,6.17,6.01,5.66,5.31,4.96,5.23,5.17,5.29,5.39,5.34,5.29,5.29,5.83,5.53,5.41,5.14,5.16,4.79,4.98,5.05,5.0,5.18,5.3,5.01,4.96,4.87,5.05,5.04,5.13,4.96,4.93,4.78,4.83,4.93,4.91,5.0,5.21,5.11,5.13,5.24,5.69,5.64,5.6,5.58,5.29,5.31,5.04,5.06,5.01,4.92,5.02,5.18,5.44,5.27,5.47,5.3,4.93,4.9,5.09,5.07,5.12,5.24,5.21,5.11,5.13,5.45,5.38,5.34,5.19,5.12,5.19,5.2,5.1,5.25,5.67,5.55,5.38,5.21,5.29,5.21,5.08,5.13,5.2,5.08,5.11,5.2,5.19,5.33,5.13,5.09,5.18,5.37,5.23,5.36,5.23,5.15,5.02,5.11,5.06,5.08,4.93,5.08,5.13,5.09,4.94,5.08,4.97,4.98,4.92,4.91,5.04,5.05,4.96,5.02,4.99,4.96,4.99,4.95,4.95,4.9,4.85,4.86,4.94,4.89,4.87,4.88,4.89,4.86,4.88,4.82,4.72,4.71,4.72,4.65,4.62,4.68,4.71,4.61,4.6,4.58,4.52,4.56,4.82,4.79,4.75,4.57,4.5,4.45,4.42,4.5,4.35,4.34,4.33,4.35,4.37,4.43,4.4,4.36,4.34,4.45,4.57,4.39,4.34,4.45,4.33,4.33,4.22,4.25,4.22,4.25,4.24,4.22,4.21,4.22,4.2,4.18,4.27,4.6,4.58,4.64,4.42,4.24,4.21,4.22,4.11,4.12,4.09,4.14,4.27,4.36,4.52,4.5,4.68,4.76,4.41,4.33,4.25,4.38,4.58,4.45,4.5,4.49,4.49,4.5,4.67,4.62,4.57,4.5,4.62,4.57,4.62,4.64,4.86,5.04,5.01,4.89,4.88,4.87,4.91,5.06,5.01,4.83,4.62,4.63,4.5,4.44,4.57,4.53,4.59,4.62,4.51,4.47,4.29,4.34,4.38,4.54,4.59,4.55,4.46,4.43,4.65,4.74,4.67,4.67,4.79,4.84,4.81,4.78,4.87,4.71,4.53,4.64,4.59,4.67,4.54,4.4,4.38,4.39,4.46,4.48,4.62,4.75,4.78,4.79,4.67,4.56,4.53,4.51,4.55,4.53,4.66,4.75,4.66,5.01,5.12,5.05,5.01,4.93,5.11,5.0,5.32,5.2,5.19,5.08,4.86,4.92,5.15,5.13,4.96,5.3,5.24,5.35,5.42,5.62,5.67,5.72,5.99,6.25,6.21,6.34,6.22,6.09,6.56,6.61,6.58,6.79,7.21,7.42,7.49,8.29,8.09,7.12,6.19,5.95,5.8,5.56,5.86,6.17,5.76,5.69,5.95,6.15,5.88,6.5,6.62,6.31,6.42,6.68,6.48,6.8,6.67,6.71,6.14,6.26,6.42,6.84,7.15,7.06,7.21,7.16,7.36,7.49,7.58,7.67,7.83,6.71,6.68,6.88,6.82,6.46,6.63,6.58,6.77,6.66,6.98,7.32,7.24,7.17,7.42,7.33,6.93,7.11,7.03,7.01,7.24,6.98,7.04,6.88,7.1,7.17,7.53,7.24,7.39,7.29,7.02,6.94,6.96,7.12,7.14,7.2,7.17,7.0,6.84,7.02,6.99,7.08,7.29,7.53,7.62,7.67,7.6,7.79,7.55,7.7,8.11,8.2,8.54,8.97,8.61,8.5,8.83,8.83,9.01,9.08,9.69,9.81,9.55,9.46,9.54,10.26,9.86,10.37,10.68,11.76,12.16,12.61,12.19,12.55,14.07,14.94,12.43,12.7,12.15,11.41,10.28,10.09,10.7,11.51,11.63,11.01,11.34,12.2,12.28,12.01,12.4,12.75,12.29,10.7,11.28,11.55,11.01,11.4,11.98,12.05,12.62,13.03,12.75,13.37,13.85,13.84,13.73,12.5,12.9,12.7,12.43,12.72,13.22,13.66,13.84,13.9,14.28,13.53,13.07,13.07,13.37,13.35,13.58,13.88,13.87,13.35,13.4,13.04,12.87,12.93,13.53,13.31,13.06,13.15,12.54,12.4,13.12,13.29,12.75,12.96,12.69,11.69,11.7,11.95,12.57,12.5,13.47,13.65,13.44,13.79,13.83,14.07,14.32,15.15,14.45,14.55,14.23,14.44,14.01,14.28,14.75,15.28,16.06,15.82,16.53,17.19,16.95,17.38,17.94,19.62,20.22,20.41,17.53,18.36,17.45,17.95,18.18,16.68,16.19,16.97,16.83,18.1,16.85,17.19,16.31,17.44,17.4,18.01,18.38,18.55,17.55,17.59,15.76,12.82,13.62,13.76,12.72,10.8,12.15,13.18,11.2,11.74,9.56,8.88,9.28,10.13,9.33,9.17,10.12,9.46,10.07,10.61,10.29,11.08,11.22,10.78,11.46,12.51,12.89,13.37,14.28,13.21,13.46,13.11,13.65,13.22,12.86,12.3,11.98,12.78,12.15,13.9,13.92,14.66,15.52,15.65,15.07,14.23,14.26,13.44,12.63,13.16,13.78,13.63,14.65,14.98,14.01,14.54,15.95,16.89,17.11,16.2,16.21,17.63,17.31,17.65,16.57,17.52,17.32,18.18,17.98,18.83,17.51,17.31,17.32,16.99,18.12,18.52,17.28,16.29,15.17,15.33,15.95,16.12,17.25,17.31,17.31,16.85,17.69,18.34,18.35,17.89,18.62,17.7,19.64,17.72,18.53,17.76,18.31,18.77,18.65,17.98,17.87,18.25,18.17,17.66,18.3,18.06,18.14,19.03,19.66,19.9,20.85,21.35,21.95,22.37,24.42,23.05,23.96,26.14,26.79,27.07,26.62,28.74,28.79,28.78,29.07,30.63,28.39,28.52,27.14,26.68,28.91,30.0,31.94,32.54,34.43,34.1,35.15,37.68,37.63,40.22,42.61,46.26,48.7,34.2,36.2,34.8,37.69,35.19,37.38,35.39,34.73,33.85,36.28,38.17,39.67,39.63,39.24,38.29,41.98,41.06,42.5,41.4,39.97,32.9,30.45,31.98,31.82,30.8,35.42,33.95,33.77,32.25,31.24,33.15,32.0,29.78,29.22,28.18,29.4,29.64,30.36,33.48,33.93,33.55,33.48,35.57,35.21,33.87,32.27,31.54,32.43,31.27,32.37,31.79,31.14,29.9,28.58,28.48,28.24,27.38,28.17,28.66,26.81,27.08,27.32,27.48,27.07,27.73,27.25,27.88,28.2,30.37,30.52,32.22,34.71,34.69,34.65,34.85,33.79,32.33,31.67,31.92,32.16,32.27,33.41,34.28,32.85,32.52,29.89,30.15,29.32,30.67,31.82,31.56,31.43,31.52,30.18,28.79,28.01,28.78,28.91,29.06,28.64,26.97,27.4,23.66,24.02,24.25,23.37,22.52,22.38,22.57,22.6,21.69,19.87,18.86,19.32,19.66,19.42,20.02,19.46,20.31,22.83,23.06,23.64,23.05,21.72,22.74,21.61,21.65,21.52,21.87,22.35,21.75,21.7,20.64,19.93,19.93,19.49,19.55,19.33,19.92,20.18,19.8,20.01,20.19,19.31,19.87,21.09,21.74,21.27,21.38,21.36,20.55,19.71,19.93,20.09,19.62,19.66,19.17,19.25,19.33,19.42,19.0,19.03,19.58,20.62,21.04,21.12,21.41,20.94,20.46,20.34,20.13,19.86,19.49,19.47,19.13,18.64,18.45,17.54,16.97,17.26,17.36,17.19,16.2,15.42,15.35,16.3,15.97,16.33,17.07,15.86,15.77,15.71,16.24,16.92,18.23,16.92,17.22,16.86,16.34,16.53,15.99,15.5,16.17,17.14,16.84,16.55,16.36,15.83,16.17,16.31,17.25,17.25,16.67,16.15,15.93,16.12,15.83,15.64,15.45,15.01,14.49,14.56,14.75,15.55,15.46,14.44,14.69,14.58,15.26,14.99,14.43,15.99,16.04,15.98,15.63,15.08,14.39,14.29,14.11,14.13,13.92,13.82,14.2,13.82,14.04,13.8,14.17,14.08,14.91,15.64,15.37,15.17,15.43,15.5,15.94,15.28,15.38,15.16,16.17,17.19,17.86,17.31,17.09,16.56,16.3,16.1,17.32,17.37,18.04,19.24,19.72,20.14,19.7,20.04,20.22,19.87,19.41,18.67,18.75,19.41,18.91,19.82,19.35,17.33,17.47,17.51,17.61,18.3,18.59,16.51,16.46,16.35,16.95,16.05,15.74,16.24,16.45,16.76,16.89,16.7,17.28,17.62,18.0,18.27,17.66,16.89,17.4,17.63,18.06,18.4,18.56,17.98,17.41,16.27,16.3,16.77,17.29,17.19,17.35,16.76,16.71,16.47,15.84,15.71,16.43,16.56,16.7,17.09,17.15,17.02,17.5,18.21,17.7,16.97,16.86,16.62,17.2,17.07,16.72,17.09,17.0,17.09,17.05,16.42,15.82,15.98,16.18,16.86,17.16,17.12,17.04,17.4,17.14,16.36,16.84,16.61,16.45,16.48,16.48,16.53,16.28,16.27,16.5,17.11,16.53,16.41,16.76,16.39,16.67,16.42,16.72,17.23,16.43,16.03,15.99,15.81,15.37,15.36,15.36,15.38,14.66,14.62,14.65,14.19,14.21,14.33,14.3,14.63,14.6,14.61,14.69,14.82,14.34,14.29,14.26,14.23,14.48,14.58,14.69,15.29,15.71,15.68,15.47,15.38,16.01,15.78,15.68,15.87,15.56,15.12,15.36,15.46,15.1,15.2,15.06,14.96,15.0,14.65,14.79,14.48,14.55,14.48,14.91,15.03,15.29,15.22,15.21,15.14,16.32,16.44,16.2,17.0,17.16,17.05,18.39,18.14,18.14,17.88,17.52,17.61,17.6,17.43,18.12,18.12,16.81,16.87,17.18,16.96,16.94,16.93,17.04,17.82,18.21,17.91,18.06,17.83,17.89,17.77,17.7,18.56,17.18,17.48,15.77,12.63,14.31,14.39,15.18,15.16,15.31,14.85,14.98,16.25,17.0,17.59,17.58,17.62,17.52,17.83,18.02,18.77,19.16,22.48,24.07,28.33,26.7,26.85,27.35,26.82,26.88,27.06,22.63,23.86,24.32,24.36,24.76,23.62,25.78,24.25,24.16,23.14,24.23,23.82,25.82,25.78,26.48,26.64,25.25,25.32,27.41,26.53,27.07,26.95,26.68,25.36,25.48,26.18,25.05,24.32,25.23,26.14,26.12,25.88,27.38,27.23,27.8,27.63,27.36,28.14,26.39,26.13,26.17,26.01,26.11,25.16,25.49,24.98,23.39,23.2,23.61,24.05,24.02,23.01,22.66,22.09,22.55,23.24,24.31,24.01,23.82,24.95,24.79,23.63,22.35,21.89,22.64,22.66,23.09,22.24,23.1,24.32,22.5,22.5,22.89,23.77,24.21,25.15,25.66,25.23,25.62,24.69,24.62,25.66,24.34,23.45,22.48,20.84,22.03,22.27,21.61,21.59,21.84,20.86,19.73,19.2,18.46,18.81,20.07,20.06,20.27,19.23,19.21,17.91,18.77,19.0,19.0,19.02,20.62,18.77,18.39,19.23,19.96,21.48,21.09,21.34,22.61,23.11,22.83,23.73,23.95,23.45,23.68,23.87,23.73,23.49,22.11,21.21,21.09,21.09,20.09,21.89,23.17,23.89,24.93,26.02,25.16,24.77,25.84,23.86,23.66,23.14,23.89,24.32,23.99,22.34,22.47,22.71,24.77,24.73,24.23,23.45,22.69,22.79,24.18,24.64,23.01,23.06,23.65,23.07,21.11,22.08,23.21,22.75,22.64,22.5,24.0,23.7,25.16,23.79,24.19,24.46,23.79,22.98,23.05,22.8,22.91,23.23,22.66,23.01,22.71,22.72,24.5,25.22,24.59,24.54,26.78,29.02,28.24,27.62,26.5,28.64,29.68,30.59,31.27,30.27,29.21,30.43,29.37,30.58,30.72,29.11,27.75,28.95,27.57,28.14,29.43,29.47,28.84,29.96,31.32,31.91,32.06,31.2,32.12,33.15,32.8,31.55,30.66,31.25,30.7,31.11,30.73,28.8,29.64,29.82,30.36,30.63,30.84,31.61,32.27,33.1,32.93,31.14,32.49,33.9,33.18,34.4,31.34,31.27,32.31,33.34,32.37,32.52,32.13,33.09,33.08,36.19,36.08,36.13,35.98,36.88,37.5,38.27,38.73,36.49,38.29,37.73,38.01,38.8,40.74,42.26,42.23,45.0,47.6,50.76,54.1,48.01,48.96,48.7,52.01,48.91,53.91,58.1,64.51,65.78,72.18,74.22,78.14,90.8,99.0,103.19,74.94,77.4,84.75,86.7,86.21],"m":[2.18,2.11,2.08,2.06,2.01,1.97,1.94,2.01,2.11,2.19,2.32,2.26,2.26,2.17,2.17,2.27,2.33,2.35,2.32,2.42,2.5,2.48,2.44,2.5,2.46,2.49,2.48,2.38,2.32,2.29,2.26,2.18,2.16,2.25,2.24,2.25,2.22,2.23,2.21,2.12,2.06,1.93,1.92,1.93,1.97,2.05,2.09,1.99,1.98,2.0,1.98,1.96,1.96,2.0,2.02,2.0,1.99,1.95,1.85,1.83,1.82,1.86,1.86,1.82,1.83,1.81,1.81,1.8,1.78,1.79,1.8,1.77,1.76,1.77,1.76,1.69,1.62,1.58,1.58,1.62,1.66,1.66,1.63,1.61,1.69,1.68,1.67,1.7,1.76,1.79,1.85,1.87,1.84,1.82,1.86,1.92,1.98,1.94,1.9,1.88,1.89,1.79,1.74,1.78,1.8,1.84,1.84,1.88,1.9,1.9,1.9,1.89,1.88,1.9,1.88,1.87,1.86,1.88,1.86,1.85,1.86,1.77,1.71,1.72,1.67,1.61,1.63,1.66,1.64,1.64,1.62,1.62,1.65,1.72,1.77,1.76,1.75,1.81,1.85,1.84,1.85,1.81,1.77,1.73,1.74,1.74,1.73,1.79,1.79,1.8,1.77,1.69,1.64,1.61,1.62,1.65,1.64,1.67,1.69,1.59,1.59,1.61,1.59,1.59,1.59,1.62,1.66,1.67,1.67,1.7,1.74,1.73,1.73,1.69,1.68,1.68,1.67,1.61,1.59,1.6,1.63,1.6,1.59,1.59,1.57,1.55,1.57,1.61,1.59,1.57,1.49,1.42,1.4,1.41,1.39,1.35,1.31,1.32,1.31,1.28,1.31,1.33,1.32,1.34,1.39,1.4,1.39,1.37,1.41,1.46,1.5,1.48,1.52,1.53,1.49,1.49,1.48,1.53,1.53,1.53,1.54,1.58,1.58,1.55,1.56,1.59,1.59,1.59,1.57,1.55,1.57,1.58,1.57,1.56,1.59,1.72,1.76,1.78,1.81,1.81,1.82,1.87,1.9,1.89,1.8,1.7,1.71,1.76,1.79,1.81,1.83,1.82,1.83,1.81,1.81,1.84,1.9,1.96,1.97,2.01,2.03,2.0,2.01,1.98,2.0,2.1,2.22,2.31,2.41,2.23,2.19,2.23,2.21,2.23,2.15,2.12,2.15,2.28,2.39,2.43,2.54,2.59,2.5,2.59,2.64,2.72,2.76,2.86,2.92,2.84,2.73,2.61,2.62,2.6,2.6,2.55,2.65,2.74,2.73,2.84,2.94,2.9,2.84,2.86,2.79,2.81,2.86,3.01,3.04,3.14,3.23,3.29,3.32,3.51,3.85,3.96,4.45,5.35,5.48,6.12,5.31,5.24,5.47,5.3,5.16,4.55,4.61,5.37,5.46,5.36,5.76,5.33,4.87,4.88,5.03,4.81,4.58,4.28,4.12,4.14,4.49,4.88,4.55,4.41,4.39,4.24,4.13,4.04,3.89,4.09,4.52,4.77,4.6,4.93,5.02,4.89,4.91,4.43,4.45,4.34,4.2,4.49,4.66,4.5,4.23,4.32,4.07,4.24,4.15,4.37,4.54,4.52,4.4,4.43,4.4,4.28,4.25,4.13,4.19,4.29,4.36,4.42,4.55,4.65,4.61,4.44,4.52,4.47,4.5,4.55,4.58,4.64,4.71,5.03,5.14,4.95,4.84,4.72,4.5,4.5,4.53,4.45,4.48,4.39,4.31,4.33,4.2,4.32,4.4,4.31,4.25,4.1,4.0,4.02,4.22,4.19,4.24,4.14,3.92,3.95,3.98,4.04,4.13,4.2,4.18,4.27,4.24,4.19,4.1,4.19,4.38,4.46,4.47,4.4,4.52,4.44,4.54,4.66,4.79,4.87,4.82,4.8,5.03,4.89,4.54,4.56,4.34,4.25,4.29,4.2,4.2,4.34,4.21,4.33,4.38,4.3,4.18,4.2,4.2,4.32,4.41,4.39,4.36,4.28,4.37,4.34,4.33,4.36,4.4,4.34,4.38,4.48,4.47,4.51,4.51,4.58,4.76,4.84,4.87,4.96,4.83,4.79,4.79,4.83,4.75,4.76,4.76,4.74,4.61,4.57,4.45,4.39,4.46,4.51,4.45,4.51,4.57,4.59,4.54,4.55,4.4,4.39,4.45,4.49,4.47,4.59,4.62,4.65,4.73,4.81,4.84,4.86,4.93,4.84,4.73,4.75,4.75,4.69,4.69,4.77,4.88,4.93,4.95,5.0,4.95,4.89,4.97,5.04,4.98,5.19,5.42,5.25,5.35,5.32,5.26,5.07,4.97,5.05,5.07,5.13,5.19,5.42,5.31,5.29,5.35,5.33,5.28,5.29,5.29,5.51,5.59,5.57,5.63,5.41,5.5,5.55,5.53,5.62,5.69,5.79,5.94,5.94,5.98,6.06,5.82,5.76,5.96,5.95,5.87,5.87,5.98,6.01,6.01,5.99,6.13,6.42,6.63,7.19,7.21,7.75,7.65,7.32,7.21,7.44,7.6,7.4,7.5,7.41,7.47,7.9,8.28,8.38,8.58,8.76,8.5,8.45,8.6,8.63,8.76,9.03,9.34,9.5,9.13,8.91,9.07,9.42,10.19,11.52,12.33,15.54,15.61,16.48,16.43,17.1,17.06,16.15,16.46,16.2,16.27,17.72,19.44,20.08,23.12,26.65,35.48,35.25,44.91,41.77,36.05,36.5,38.43,33.56,33.97,34.74,27.69,19.98,18.79,15.05,16.34,14.89,14.31,13.31,13.09,12.82,11.73,13.26,15.4,16.07,15.7,15.87,16.96,16.79,15.74,15.96,16.08,15.99,15.76,15.93,16.1,16.34,19.53,20.63,22.67,20.93,20.98,20.91,19.53,19.0,19.01,18.23,18.8,18.48,18.53,15.98,15.29,16.19,15.77,15.79,14.97,14.87,13.32,13.04,13.36,13.09,12.83,11.59,11.91,12.73,13.02,12.25,11.85,11.14,11.36,11.13,10.97,11.06,10.86,10.43,10.33,10.23,10.13,9.9,8.42,8.53,8.85,8.64,8.45,8.34,8.82,9.42,9.01,9.52,10.35,10.86,10.02,9.08,9.3,9.46,9.17,9.02,9.09,8.77,8.18,8.15,8.33,8.61,8.7,8.39,8.08,8.16,7.93,7.86,7.97,8.25,8.52,8.41,7.95,7.75,7.16,7.06,7.14,7.07,7.38,7.5,7.25,7.17,6.84,6.67,6.72,6.48,6.01,5.95,5.45,5.06,5.56,5.87,6.41,6.82,6.93,6.91,6.39,6.8,8.04,7.99,9.11,8.95,8.86,8.32,8.34,9.49,10.09,9.91,10.43,9.93,9.6,9.28,9.95,10.62,10.45,10.59,11.01,11.17,12.22,12.88,12.9,12.98,13.96,14.51,13.79,10.98,10.71,10.86,10.41,10.46,11.08,11.41,12.18,12.11,12.33,12.89,13.2,13.16,12.68,11.38,11.62,11.97,11.73,11.64,12.15,12.23,12.28,11.81,11.6,12.32,12.48,12.15,12.26,11.83,11.89,11.76,10.25,10.37,9.89,9.25,8.69,8.94,8.85,8.51,9.37,9.56,9.26,8.73,8.83,8.57,8.02,8.12,8.11,8.62,8.83,8.91,9.44,9.67,9.92,9.63,9.49,9.55,9.39,9.2,9.21,9.22,8.99,8.65,8.91,9.09,9.21,9.27,8.75,8.54,8.4,8.01,7.32,7.49,7.16,7.18,7.59,7.82,7.6,7.56,7.2,7.16,7.09,7.53,7.54,7.18,7.23,7.26,7.24,7.65,7.67,7.52,7.23,7.05,6.79,6.38,6.33,6.16,6.0,6.09,6.09,6.2,6.15,6.23,6.18,5.62,5.65,5.6,6.14,6.48,6.46,6.65,6.53,6.27,6.2,6.26,6.47,6.26,6.08,6.12,6.15,6.27,6.12,5.95,6.01,6.15,6.11,6.24,6.14,6.3,6.28,6.31,6.12,6.03,5.97,6.14,6.11,6.25,6.2,6.17,6.13,6.07,6.11,6.13,6.2,6.08,5.85,5.83,5.81,5.81,5.91,6.13,6.15,6.16,5.91,5.87,5.9,5.84,5.62,5.67,5.71,5.66,5.14,5.33,5.37,5.12,5.09,5.18,5.12,4.95,5.13,5.14,5.3,5.12,5.08,5.07,5.08,5.04,5.01,5.02,5.17,5.39,5.17,5.13,5.32,5.68,5.82,5.92,5.61,5.69,5.59,5.71,5.62,5.68,5.78,5.54,5.29,5.39,5.35,5.4,5.36,5.31,5.39,5.55,5.55,5.61,5.52,5.51,5.43,5.47,5.48,5.57,5.57,5.8,6.29,6.7,7.05,8.28,8.74,8.36,8.64,9.17,7.62,7.62,7.84,7.53,6.87,7.2,7.46,7.68,7.67,7.96,8.41,7.76,7.64,7.67,7.6,7.65,7.6,7.55,7.58,7.66,7.77,7.73,7.28,6.67,6.58,6.64,6.88,6.99,6.77,6.84,6.76,6.74,6.75,6.84,6.7,6.63,6.46,6.3,6.37,6.28,6.21,6.35,6.3,6.51,6.68,6.55,6.41,6.45,6.42,6.35,6.49,6.63,6.65,6.82,7.16,7.05,7.08,6.77,6.82,7.1,7.54,7.02,6.82,6.7,6.68,6.72,6.52,6.55,6.46,6.25,6.16,6.24,6.31,6.35,6.23,6.37,6.45,6.35,6.12,6.13,6.15,6.14,6.1,6.07,6.01,5.93,5.92,6.15,5.83,5.89,5.83,5.94,5.84,5.89,6.07,6.09,5.85,5.81,5.83,5.79,5.75,5.63,5.63,5.46,5.18,5.21,5.35,5.23,5.31,5.27,5.28,5.22,5.22,5.21,5.23,5.16,5.2,5.19,5.09,5.09,5.08,5.11,5.28,5.22,5.08,5.12,5.12,5.21,5.27,5.43,5.79,5.67,5.58,5.64,5.59,5.35,5.21,5.29,5.25,5.25,5.24,5.32,5.32,5.31,5.16,5.13,5.09,5.09,4.97,5.06,5.12,5.08,5.02,4.99,5.03,5.03,5.16,5.13,5.04,4.95,4.83,4.82,4.92,4.84,4.87,4.87,4.85,4.9,5.14,5.17,4.86,4.8,4.79,4.8,4.83,4.72,4.52,4.23,4.23,4.17,4.22,4.19,4.13,4.13,4.14,4.04,4.03,4.08,4.17,4.16,4.15,3.95,3.84,3.82,3.76,3.7,3.64,3.86,4.05,4.0,3.9,4.03,4.0,4.03,3.91,3.95,4.04,4.06,4.04,4.11,4.24,4.51,4.44,4.39,4.47,4.45,4.4,4.24,4.05,3.96,3.96,3.96,3.91,3.87,3.99,4.08,4.18,4.17,4.09,4.09,4.14,4.09,4.07,4.04,4.08,4.1,4.07,3.98,3.85,3.9,3.89,3.99,4.15,4.25,4.18,4.19,4.19,4.11,4.1,4.12,4.15,4.07,4.1,4.12,4.1,4.08,4.0,3.98,4.04,4.1,4.09,4.08,4.07,4.07,4.11,4.04,4.04,3.95,3.94,3.98,3.95,3.91,3.89,3.77,3.71,3.73,3.73,3.8,3.82,3.76,3.75,3.72,3.77,3.76,3.82,3.75,3.76,3.76,3.75,3.73,3.74,3.72,3.67,3.67,3.68,3.7,3.69,3.67,3.71,3.68,3.58,3.58,3.59,3.65,3.68,3.84,3.85,3.89,3.93,4.16,4.29,4.34,4.53,4.62,4.47,4.35,4.29,4.34,4.58,5.05,5.02,5.03,5.12,5.22,4.71,4.72,4.74,4.74,4.36,4.04,4.09,4.06,4.2,4.38,4.45,4.41,4.31,4.55,4.59,4.67,4.56,4.92,5.09,5.06,5.11,5.16,5.07,5.3,5.07,5.24,5.26,5.27,5.18,5.25,5.27,5.41,5.59,5.67,5.53,5.34,5.24,5.17,5.17,5.37,5.49,5.59,5.43,5.33,5.42,5.48,5.31,5.32,5.23,5.26,5.3,5.23,5.14,5.11,5.23,5.39,5.46,5.44,5.58,5.65,5.6,5.51,5.39,5.34,5.28,5.19,5.21,5.16,5.05,4.68,4.78,4.79,4.85,4.72,4.72,4.85,4.82,4.69,4.71,4.74,4.79,4.49,4.57,4.69,4.67,4.79,5.33,5.28,5.72,5.68,5.89,5.55,5.38,5.41,5.34,5.32,5.4,5.44,5.32,5.08,5.18,5.25,5.16,5.12,5.25,5.43,5.66,5.42,5.34,5.48,5.47,5.47,5.35,5.42,5.35,5.38,5.34,5.35,5.35,5.3,5.24,5.23,5.18,5.14,5.14,5.34,5.52,5.44,5.55,5.61,5.75,5.69,5.61,5.5,5.4,5.55,5.55,5.62,5.52,5.52,5.37,5.33,5.34,5.45,5.38,5.3,5.34,5.26,5.12,5.16,5.12,5.08,5.11,5.06,4.99,5.11,5.08,5.07,5.18,5.21,5.17,5.08,5.03,4.89,4.89,4.93,4.99,4.94,4.85,4.8,4.87,4.89,4.76,4.78,4.82,4.84,4.85,4.79,4.68,4.71,4.78,4.95,4.87,4.99,5.21,5.23,5.23,5.22,5.21,5.13,4.91,4.78,4.74,4.74,4.69,4.76,4.85,4.68,4.77,4.77,4.76,4.74,4.76,4.64,4.34,4.28,4.3,4.38,4.4,4.43,4.51,4.67,4.67,4.73,4.68,4.72,5.1,5.22,5.06,4.97,4.82,4.85,4.97,5.17,5.32,5.3,5.7,5.99,6.12,6.09,5.96,5.7,5.81,6.04,7.01,7.1,6.89,6.32,6.43,6.18,5.95,6.37,6.47,6.47,6.25,6.29,6.17,6.05,5.65,5.31,5.12,5.17,5.31,5.22,5.34,5.4,5.32,5.31,5.59,5.6,5.42,5.2,5.12,4.99,4.84,4.99,4.96,5.0,5.31,5.12,4.86,4.88,5.0,4.98,5.02,4.98,4.92,4.83,4.8,4.91,4.91,4.98,5.11,5.21,5.13,5.13,5.48,5.56,5.57,5.52,5.39,5.28,5.08,5.08,5.06,4.95,4.94,5.13,5.23,5.33,5.4,5.33,5.03,4.93,5.0,5.06,5.06,5.2,5.23,5.12,5.08,5.24,5.43,5.34,5.23,5.14,5.15,5.17,5.13,5.2,5.54,5.58,5.53,5.24,5.24,5.21,5.09,5.11,5.19,5.17,5.11,5.15,5.19,5.26,5.21,5.12,5.13,5.27,5.23,5.36,5.25,5.22,5.07,5.07,5.09,5.09,5.02,5.06,5.1,5.1,4.96,5.02,5.0,4.99,4.97,4.91,5.03,5.04,4.99,4.97,4.99,4.96,4.99,4.94,4.96,4.9,4.87,4.82,4.91,4.93,4.87,4.85,4.9,4.88,4.87,4.84,4.77,4.74,4.72,4.66,4.63,4.66,4.71,4.64,4.59,4.6,4.54,4.55,4.68,4.78,4.79,4.63,4.54,4.46,4.45,4.44,4.43,4.33,4.37,4.33,4.34,4.39,4.41,4.37,4.34,4.38,4.56,4.46,4.36,4.38,4.38,4.32,4.27,4.26,4.25,4.25,4.23,4.18,4.19,4.21,4.21,4.18,4.21,4.47,4.54,4.6,4.52,4.35,4.22,4.25,4.12,4.13,4.08,4.1,4.2,4.28,4.44,4.53,4.61,4.77,4.57,4.32,4.27,4.36,4.46,4.48,4.43,4.53,4.51,4.5,4.6,4.65,4.57,4.49,4.57,4.57,4.61,4.64,4.78,4.89,5.0,4.89,4.86,4.87,4.88,5.0,5.03,4.92,4.63,4.64,4.59,4.45,4.5,4.49,4.55,4.59,4.59,4.5,4.38,4.33,4.39,4.47,4.5,4.55,4.53,4.45,4.54,4.64,4.69,4.64,4.73,4.84,4.79,4.8,4.84,4.82,4.57,4.57,4.65,4.65,4.62,4.47,4.39,4.41,4.44,4.49,4.58,4.64,4.76,4.82,4.76,4.61,4.51,4.5,4.57,4.53,4.58,4.73,4.72,4.88,5.08,4.99,4.98,4.95,5.04,5.05,5.19,5.2,5.26,5.1,4.85,4.91,5.06,5.13,4.98,5.16,5.28,5.29,5.43,5.56,5.64,5.71,5.93,6.18,6.47,6.32,6.36,6.14,6.43,6.65,6.55,6.76,7.06,7.22,7.58,7.87,8.14,7.25,6.61,6.05,6.0,5.58,5.79,6.04,5.96,5.77,5.73,5.93,5.95,6.16,6.5,6.48,6.29,6.62,6.61,6.74,6.65,6.74,6.3,6.21,6.32,6.6,7.0,7.02,7.16,7.26,7.22,7.46,7.59,7.62,7.8,7.39,6.77,6.85,6.85,6.43,6.58,6.59,6.78,6.7,6.64,7.24,7.42,7.24,7.45,7.4,7.05,7.04,7.02,7.14,7.17,7.15,6.96,7.0,7.03,7.05,7.38,7.4,7.29,7.27,7.13,6.93,7.03,7.02,7.08,7.23,7.09,7.0,6.96,6.84,7.03,7.01,7.33,7.34,7.44,7.76,7.71,7.75,7.57,7.62,7.92,8.13,8.32,8.75,8.67,8.47,8.83,9.0,9.01,9.02,9.31,9.79,9.56,9.29,9.53,9.84,9.98,10.2,10.47,11.16,11.83,12.61,13.6,12.61,14.03,14.27,13.17,12.62,12.56,11.73,10.33,10.19,10.42,11.36,11.47,11.02,11.04,11.76,12.31,12.04,12.37,12.43,12.89,11.23,10.98,11.39,11.14,11.28,11.79,11.81,12.32,12.67,12.82,13.08,13.62,13.86,13.77,12.65,12.87,12.81,12.37,12.77,13.15,13.4,13.59,13.88,14.04,14.24,12.92,12.9,13.3,13.33,13.41,13.87,13.94,13.74,13.37,13.31,13.03,12.99,13.23,13.61,13.05,13.23,12.61,12.54,12.9,13.08,13.15,12.87,12.96,12.44,11.78,11.86,12.24,12.55,13.04,13.5,13.41,13.52,13.74,13.63,14.32,15.16,14.81,14.5,14.48,14.19,14.45,13.99,14.59,15.09,15.68,16.06,16.03,16.78,16.67,17.29,17.52,18.87,20.2,20.14,19.68,18.05,17.24,17.94,18.02,17.35,16.6,16.73,16.79,17.58,17.36,16.84,16.78,17.12,17.0,17.89,17.97,18.81,17.92,17.42,16.63,14.43,13.3,13.59,13.06,11.43,11.51,13.23,12.35,11.59,10.39,9.54,9.36,10.16,9.72,9.37,10.21,9.56,10.0,10.74,10.65,10.91,11.09,10.75,11.32,12.05,12.58,13.21,14.01,13.85,13.06,12.93,13.06,13.45,12.96,12.29,12.55,12.31,12.56,13.62,13.98,14.17,14.8,15.68,15.06,14.21,13.92,13.7,12.98,13.0,13.64,13.74,14.47,14.63,13.97,14.32,15.33,16.44,16.93,16.8,16.24,17.2,17.73,17.57,16.78,17.06,17.48,18.19,18.49,18.8,17.76,17.34,17.11,17.11,17.77,18.54,18.12,16.72,16.22,15.33,15.88,16.07,16.97,17.21,17.32,16.78,17.44,18.05,18.33,17.84,18.25,17.93,19.11,18.42,18.11,18.19,18.05,18.53,18.79,18.61,17.84,18.2,17.84,17.81,18.34,18.13,18.34,18.52,19.36,19.88,20.46,21.04,21.72,22.59,23.76,23.79,23.73,25.23,27.47,26.07,27.24,27.97,29.26,29.24,29.21,30.59,29.34,29.13,28.37,27.09,28.31,29.73,30.84,33.09,34.31,35.69,34.88,36.83,37.25,39.18,41.06,44.27,46.49,38.98,36.86,34.75,36.47,37.25,36.98,35.28,35.69,34.25,35.28,37.12,39.74,40.35,40.19,38.8,40.17,41.7,41.55,41.82,40.47,38.13,30.67,30.82,32.06,31.37,33.19,33.94,34.24,33.68,31.49,32.35,32.28,30.21,29.27,27.66,29.07,29.71,30.32,32.58,33.64,33.7,33.54,34.28,35.54,33.71,32.96,31.99,32.38,32.16,31.77,31.57,30.95,30.55,29.05,27.96,28.11,27.99,28.94,28.72,28.05,26.98,27.81,27.21,27.2,27.31,27.68,27.89,27.91,29.41,30.68,32.2,33.75,34.44,34.04,34.75,33.91,32.87,31.92,32.13,31.66,32.51,33.11,34.0,33.09,32.96,31.39,30.03,30.26,30.42,31.3,31.9,31.35,31.7,30.82,29.32,28.79,28.83,28.96,28.9,28.62,27.23,27.45,23.5,23.37,24.12,23.76,22.95,22.31,22.49,22.51,21.74,21.08,19.11,19.5,19.43,19.7,20.09,19.78,19.77,21.73,23.03,24.2,23.69,22.85,22.21,21.68,21.55,21.92,21.38,22.34,22.31,21.77,20.92,20.24,19.9,19.38,19.86,19.63,19.56,19.82,19.78,20.09,20.1,19.59,19.65,20.39,21.62,21.65,21.28,21.16,20.73,19.92,19.87,20.04,19.68,19.42,19.29,19.45,19.55,19.44,19.05,18.86,19.24,19.9,20.9,21.02,21.21,20.9,20.79,20.57,20.11,19.91,19.51,19.51,19.23,18.91,18.59,17.7,17.16,17.33,17.35,17.27,16.91,15.66,15.59,16.25,16.4,16.19,16.75,16.21,15.86,15.87,16.22,16.84,18.0,17.61,17.28,16.89,16.72,16.48,16.31,15.7,15.73,16.98,16.66,16.64,16.27,15.98,16.27,16.37,16.83,17.32,16.7,16.51,16.02,16.06,15.93,15.68,15.4,15.2,14.75,14.61,14.63,15.29,15.25,14.59,14.66,14.65,14.66,14.94,14.58,15.67,15.93,15.84,15.88,15.23,14.51,14.26,14.12,14.1,14.22,13.82,14.24,13.86,14.02,13.9,14.03,14.12,14.53,15.34,15.3,15.17,14.99,15.47,15.58,15.64,15.3,15.12,15.96,16.86,17.27,17.34,17.24,16.92,16.31,16.02,16.77,17.41,17.45,18.22,20.04,20.3,19.69,19.82,20.44,19.96,19.74,18.78,18.73,19.66,18.96,19.48,19.27,18.16,17.55,17.57,17.66,18.18,18.53,16.94,16.55,16.51,16.85,16.63,15.87,16.05,16.35,16.73,16.96,16.95,17.4,17.65,17.97,18.03,18.19,17.39,17.16,17.46,18.03,18.28,18.19,18.2,17.62,16.64,16.31,16.76,17.11,17.23,17.53,16.91,16.61,16.65,16.09,15.64,16.22,16.51,16.67,16.66,16.94,17.01,17.47,17.89,17.79,17.2,16.91,16.66,17.12,17.11,16.92,16.93,17.0,17.02,17.05,16.81,16.09,15.86,16.15,16.7,17.12,17.1,17.15,17.23,17.24,16.61,16.66,16.56,16.5,16.55,16.51,16.37,16.5,16.39,16.51,16.9,16.64,16.37,16.56,16.42,16.53,16.45,16.57,16.98,16.39,16.19,15.98,15.94,15.53,15.49,15.44,15.4,14.86,14.72,14.72,14.28,14.18,14.23,14.36,14.61,14.43,14.66,14.7,14.54,14.59,14.11,14.4,14.26,14.45,14.62,14.67,15.01,15.54,15.68,15.56,15.32,15.91,15.77,15.7,15.87,15.8,15.11,15.37,15.42,15.33,15.11,15.17,14.96,14.91,14.83,14.84,14.7,14.46,14.44,14.83,14.81,15.05,15.3,15.25,15.12,15.73,16.47,16.3,16.74,17.19,17.01,18.24,18.7,18.13,17.83,18.2,17.37,17.62,17.48,17.71,17.97,17.62,16.89,17.06,16.95,16.97,16.75,17.01,17.6,18.0,18.16,17.93,17.85,17.87,17.73,17.68,18.2,18.08,17.13,16.65,12.49,13.76,14.11,14.96,15.44,15.13,15.14,14.93,15.65,17.23,17.36,17.92,17.69,17.42,17.78,17.98,18.47,19.14,21.52,23.9,26.35,27.06,27.29,26.88,27.58,26.81,27.13,23.82,23.59,24.0,24.49,24.83,23.86,24.5,24.4,24.27,23.4,23.61,24.01,24.95,25.76,26.31,27.21,25.28,25.33,25.77,27.33,27.25,27.27,27.55,26.21,25.66,26.07,25.26,24.37,25.14,25.43,26.06,26.09,26.81,27.33,27.86,27.72,27.77,27.73,27.21,26.0,26.05,26.33,26.1,25.15,25.24,25.39,23.49,23.53,23.65,24.05,24.29,23.5,22.61,22.14,22.47,22.93,23.89,24.15,23.77,24.55,25.06,23.87,22.74,22.27,22.2,22.64,22.9,22.61,22.83,23.65,23.45,22.6,23.04,23.57,24.28,24.9,25.93,25.11,25.22,24.76,24.52,25.34,25.02,23.51,22.65,21.47,21.64,22.0,21.81,21.96,21.5,21.36,20.76,19.51,18.85,18.73,19.09,20.2,20.41,19.88,19.08,18.08,18.44,19.4,19.36,18.65,20.39,19.27,18.58,19.26,19.56,21.06,21.5,21.22,21.83,22.74,23.28,23.67,23.89,23.86,23.72,23.95,23.65,23.61,22.32,21.59,21.59,20.83,20.46,21.74,22.67,23.36,24.41,25.46,25.16,24.94,25.37,24.96,23.71,23.31,23.47,23.74,23.92,23.15,22.71,22.89,23.67,24.93,24.61,24.06,22.92,22.67,23.68,24.5,23.42,22.92,23.34,23.0,21.2,21.93,22.92,22.89,22.94,22.65,23.1,23.62,24.91,24.24,23.36,24.09,24.03,23.29,23.0,22.89,22.6,23.01,22.42,22.7,23.0,22.52,23.9,24.65,25.0,24.64,26.42,28.18,28.37,27.35,26.65,27.69,28.94,31.28,31.59,30.05,29.35,29.7,29.24,29.92,30.94,30.42,28.63,28.48,27.17,27.96,29.43,29.57,28.52,28.82,30.93,31.55,31.48,31.14,31.63,34.04,33.59,31.99,30.66,31.04,30.52,30.93,31.57,29.92,29.58,29.4,30.26,30.19,30.57,30.76,31.89,32.23,32.77,31.85,32.12,33.03,33.65,33.76,33.14,30.6,32.46,33.08,32.59,32.71,32.42,32.8,33.16,34.77,36.29,36.61,36.11,36.51,36.78,38.23,38.88,37.37,37.79,38.02,37.76,38.59,40.73,41.39,42.05,44.38,47.08,49.3,52.49,49.32,47.82,48.31,51.74,50.66,52.21,57.79,60.93,64.97,70.38,73.92,77.17,88.61,95.19,111.12,82.74,80.36,79.46,87.92,86.21],"n":[4,5,5,5,5,5,5,5,5,5,4,5,5,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,2,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,4,4,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,3,5,4,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,3,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,4,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,4,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,6,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,3,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,4,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,5,3,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,4,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,4,4,5,5,5,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,5,4,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,3,4,5,5,5,5,5,7,7,4,1]}});
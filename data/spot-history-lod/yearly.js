@@ -0,0 +1,3 @@
+// Auto-generated by devops/build-seed-bundle.py — do not edit
+// Level-of-detail tier yearly (ohlc, up to 59 points per metal)
+window._loadSpotSeedLod("yearly",{"Gold":{"t":["1968-01-01","1969-01-01","1970-01-01","1971-01-01","1972-01-01","1973-01-01","1974-01-01","1975-01-01","1976-01-01","1977-01-01","1978-01-01","1979-01-01","1980-01-01","1981-01-01","1982-01-01","1983-01-01","1984-01-01","1985-01-01","1986-01-01","1987-01-01","1988-01-01","1989-01-01","1990-01-01","1991-01-01","1992-01-01","1993-01-01","1994-01-01","1995-01-01","1996-01-01","1997-01-01","1998-01-01","1999-01-01","2000-01-01","2001-01-01","2002-01-01","2003-01-01","2004-01-01","2005-01-01","2006-01-01","2007-01-01","2008-01-01","2009-01-01","2010-01-01","2011-01-01","2012-01-01","2013-01-01","2014-01-01","2015-01-01","2016-01-01","2017-01-01","2018-01-01","2019-01-01","2020-01-01","2021-01-01","2022-01-01","2023-01-01","2024-01-01","2025-01-01","2026-01-01"],"o":[35.18,41.8,35.13,37.33,43.73,64.99,114.75,185.0,140.35,136.1,168.6,227.15,559.0,592.0,399.0,452.75,384.0,306.25,327.1,402.4,484.1,413.6,401.65,392.5,351.2,329.4,395.0,381.4,387.1,367.8,287.7,288.25,282.05,272.8,278.1,342.2,415.2,426.8,520.75,640.75,840.75,869.75,1113.0,1405.5,1590.0,1681.5,1219.75,1184.25,1072.7,1148.65,1312.8,1287.2,1520.55,1930.8,1809.05,1835.05,2074.9,2644.6,4386.85],"h":[42.6,43.75,39.19,43.9,70.0,127.0,197.5,186.25,140.35,168.15,243.65,524.0,843.0,599.25,488.5,511.5,406.85,339.3,442.75,502.75,485.3,417.15,421.4,403.7,359.3,406.7,397.5,396.95,416.25,367.8,314.6,326.25,316.6,292.85,348.5,417.25,455.75,537.5,725.75,841.75,1023.5,1218.25,1426.0,1896.5,1790.0,1692.5,1379.0,1298.0,1370.0,1350.9,1360.25,1542.6,2061.5,1957.2,2017.15,2077.8,2783.95,4481.85,5501.7],"l":[35.14,35.0,34.78,37.33,43.73,64.1,114.75,128.75,103.05,129.4,166.3,216.55,474.0,391.75,297.0,374.75,303.25,285.0,326.0,392.6,389.05,358.1,346.75,343.5,330.2,326.5,370.25,372.45,368.3,283.05,273.4,252.9,263.8,256.7,277.8,319.75,373.5,411.5,520.75,608.3,692.5,813.0,1052.25,1316.0,1537.5,1192.75,1144.5,1050.6,1072.7,1148.65,1176.7,1270.05,1472.35,1685.35,1618.2,1809.05,1990.8,2631.8,4386.85],"c":[41.95,35.21,37.38,43.62,64.7,112.25,187.5,140.25,134.55,165.6,224.5,524.0,589.5,400.0,448.0,381.5,309.0,327.0,390.9,486.5,410.15,401.0,391.0,353.4,332.9,390.65,382.5,386.7,369.55,289.2,287.45,290.85,272.65,276.5,342.75,417.25,438.0,513.0,635.7,836.5,865.0,1104.0,1410.25,1574.5,1664.0,1201.5,1199.25,1062.25,1159.1,1296.5,1281.65,1523.0,1891.1,1820.1,1812.35,2062.4,2610.85,4307.95,5137.1],"m":[38.83,41.1,35.96,40.81,58.17,97.12,158.76,160.87,124.8,147.84,193.57,307.01,614.75,459.16,375.97,423.71,360.65,317.42,368.2,446.84,436.78,381.27,383.73,362.34,343.87,360.05,384.16,384.07,387.73,331.0,294.12,278.86,279.29,271.19,310.08,363.83,409.53,444.99,604.34,696.43,872.37,973.66,1226.66,1573.16,1668.86,1409.51,1266.06,1159.82,1249.84,1257.86,1268.93,1393.71,1771.04,1799.18,1800.8,1941.67,2388.52,3439.54,4895.24],"n":[244,254,255,253,254,253,254,254,255,252,252,253,254,251,253,252,252,253,253,253,253,252,253,253,254,253,252,252,254,253,253,252,252,253,252,253,254,252,252,253,254,253,253,251,252,253,253,253,253,252,253,253,254,253,250,251,254,253,45]},"Palladium":{"t":["1990-01-01","1991-01-01","1992-01-01","1993-01-01","1994-01-01","1995-01-01","1996-01-01","1997-01-01","1998-01-01","1999-01-01","2000-01-01","2001-01-01","2002-01-01","2003-01-01","2004-01-01","2005-01-01","2006-01-01","2007-01-01","2008-01-01","2009-01-01","2010-01-01","2011-01-01","2012-01-01","2013-01-01","2014-01-01","2015-01-01","2016-01-01","2017-01-01","2018-01-01","2019-01-01","2020-01-01","2021-01-01","2022-01-01","2023-01-01","2024-01-01","2025-01-01","2026-01-01"],"o":[128.0,81.75,80.0,106.25,124.25,156.6,128.75,120.75,204.0,334.0,444.0,965.0,440.0,234.0,194.0,180.0,261.0,332.0,370.0,185.0,420.0,792.0,655.0,707.0,723.0,796.0,547.0,684.0,1071.0,1263.0,1950.0,2419.0,1869.0,1804.0,1112.0,910.0,1649.0],"h":[128.75,102.65,113.5,145.0,161.0,176.25,142.25,245.5,407.0,454.0,972.0,1094.0,440.0,271.0,333.0,297.0,402.0,381.0,588.0,402.0,797.0,859.0,721.0,774.0,909.0,830.0,774.0,1060.0,1274.0,1990.0,2795.0,2997.0,3339.0,1830.0,1232.0,1825.0,2090.0],"l":[81.75,78.75,79.1,99.6,123.25,127.5,114.25,117.75,201.0,284.0,433.0,315.0,222.0,144.0,179.0,172.0,261.0,320.0,168.0,177.0,387.0,561.0,564.0,644.0,703.0,528.0,465.0,684.0,864.0,1261.0,1583.0,1608.0,1658.0,941.0,858.0,910.0,1649.0],"c":[81.75,79.75,106.25,123.25,156.75,127.5,116.5,204.0,329.0,454.0,954.0,440.0,233.0,193.0,184.0,253.0,324.0,365.0,183.5,402.0,791.0,636.0,699.0,711.0,798.0,547.0,676.0,1056.0,1263.0,1920.0,2370.0,1928.0,1788.0,1119.0,909.0,1567.0,1691.97],"m":[108.79,88.35,88.31,122.49,142.88,151.31,128.12,178.63,284.3,358.59,682.34,602.82,336.89,200.7,229.84,201.52,319.91,354.95,351.51,264.22,527.08,732.78,643.25,724.45,802.31,690.42,612.88,869.28,1029.08,1539.36,2200.47,2397.7,2112.54,1336.49,984.04,1150.73,1783.94],"n":[189,253,254,253,252,252,254,253,253,252,252,253,252,253,254,252,252,253,254,253,253,251,252,253,253,253,253,252,253,253,254,252,250,251,254,253,45]},"Platinum":{"t":["1990-01-01","1991-01-01","1992-01-01","1993-01-01","1994-01-01","1995-01-01","1996-01-01","1997-01-01","1998-01-01","1999-01-01","2000-01-01","2001-01-01","2002-01-01","2003-01-01","2004-01-01","2005-01-01","2006-01-01","2007-01-01","2008-01-01","2009-01-01","2010-01-01","2011-01-01","2012-01-01","2013-01-01","2014-01-01","2015-01-01","2016-01-01","2017-01-01","2018-01-01","2019-01-01","2020-01-01","2021-01-01","2022-01-01","2023-01-01","2024-01-01","2025-01-01","2026-01-01"],"o":[471.0,416.25,336.5,352.7,399.5,416.0,400.75,369.5,366.0,362.5,442.0,610.0,481.0,600.0,815.0,848.0,982.0,1136.0,1530.0,934.0,1496.0,1768.0,1408.0,1559.0,1387.0,1208.0,878.0,906.0,937.0,796.0,981.0,1101.0,963.0,1086.0,995.0,911.0,2133.0],"h":[504.5,424.3,392.1,418.65,425.25,461.25,433.0,495.0,428.0,456.0,625.0,645.0,607.0,842.0,937.0,1011.0,1390.0,1534.0,2276.0,1500.0,1780.0,1899.0,1728.0,1730.0,1511.0,1281.0,1177.0,1027.0,1020.0,982.0,1075.0,1306.0,1149.0,1106.0,1082.0,2303.0,2860.0],"l":[389.75,330.0,332.75,339.75,379.25,398.25,367.25,345.5,335.0,344.0,416.0,406.0,449.0,600.0,774.0,843.0,982.0,1112.0,756.0,915.0,1477.0,1364.0,1391.0,1323.0,1188.0,829.0,817.0,877.0,774.0,784.0,607.0,911.0,836.0,852.0,875.0,911.0,2012.0],"c":[415.0,334.2,355.25,393.5,416.5,398.25,370.25,362.0,361.5,448.0,611.0,477.0,598.0,814.0,861.0,964.0,1117.0,1529.0,899.0,1466.0,1731.0,1381.0,1523.0,1358.0,1210.0,872.0,907.0,927.0,794.0,971.0,1075.0,962.0,1065.0,1006.0,914.0,2027.0,2185.18],"m":[460.7,376.07,359.86,374.18,405.29,424.2,397.21,395.87,371.83,377.63,545.32,529.03,540.13,692.51,845.99,897.46,1142.75,1304.57,1574.85,1207.32,1611.31,1720.57,1551.98,1486.26,1384.39,1053.47,988.68,948.73,879.53,863.95,885.71,1090.5,961.4,965.38,955.74,1281.66,2263.59],"n":[189,253,254,253,252,252,254,253,253,252,252,253,252,253,254,252,252,253,254,253,253,251,252,253,253,253,253,252,253,253,254,252,250,251,254,253,45]},"Silver":{"t":["1968-01-01","1969-01-01","1970-01-01","1971-01-01","1972-01-01","1973-01-01","1974-01-01","1975-01-01","1976-01-01","1977-01-01","1978-01-01","1979-01-01","1980-01-01","1981-01-01","1982-01-01","1983-01-01","1984-01-01","1985-01-01","1986-01-01","1987-01-01","1988-01-01","1989-01-01","1990-01-01","1991-01-01","1992-01-01","1993-01-01","1994-01-01","1995-01-01","1996-01-01","1997-01-01","1998-01-01","1999-01-01","2000-01-01","2001-01-01","2002-01-01","2003-01-01","2004-01-01","2005-01-01","2006-01-01","2007-01-01","2008-01-01","2009-01-01","2010-01-01","2011-01-01","2012-01-01","2013-01-01","2014-01-01","2015-01-01","2016-01-01","2017-01-01","2018-01-01","2019-01-01","2020-01-01","2021-01-01","2022-01-01","2023-01-01","2024-01-01","2025-01-01","2026-01-01"],"o":[2.17,1.96,1.8,1.65,1.37,2.04,3.28,4.44,4.16,4.43,4.87,6.08,39.95,15.8,8.06,11.06,8.96,6.25,5.81,5.36,6.63,6.07,5.21,4.16,3.87,3.66,5.28,4.84,5.17,4.77,5.94,5.0,5.3,4.59,4.59,4.74,5.99,6.39,9.04,13.01,14.93,11.08,17.17,30.67,28.78,30.87,19.94,15.71,14.0,15.95,17.06,15.44,17.93,27.27,22.89,24.3,23.95,29.41,74.22],"h":[2.58,2.04,1.93,1.75,2.03,3.26,6.76,5.21,5.08,4.97,6.26,32.2,49.45,16.3,11.11,14.67,10.11,6.75,6.31,10.93,7.82,6.21,5.36,4.57,4.33,5.42,5.75,6.04,5.83,6.27,7.81,5.75,5.45,4.82,5.1,5.96,8.29,9.22,14.94,15.82,20.92,19.18,30.7,48.7,37.23,32.23,22.05,18.23,20.71,18.56,17.52,19.3,28.89,29.59,26.18,26.02,34.51,74.83,118.45],"l":[1.84,1.56,1.57,1.27,1.37,1.96,3.27,3.93,3.83,4.31,4.82,5.93,10.89,8.03,4.9,7.54,6.22,5.45,4.85,5.36,6.05,5.04,3.95,3.55,3.65,3.56,4.64,4.42,4.71,4.22,4.69,4.88,4.57,4.07,4.24,4.37,5.5,6.39,8.83,11.67,8.88,10.51,15.14,26.16,26.67,18.61,15.28,13.71,13.58,15.22,13.97,14.38,12.01,21.52,17.77,20.09,22.09,29.41,73.48],"c":[1.95,1.79,1.63,1.37,2.03,3.26,4.47,4.18,4.36,4.76,6.02,32.2,15.5,8.15,10.87,8.91,6.29,5.8,5.28,6.7,6.05,5.22,4.19,3.86,3.67,5.12,4.85,5.14,4.8,6.0,5.0,5.33,4.58,4.52,4.67,5.96,6.82,8.83,12.9,14.76,10.79,16.99,30.63,28.18,29.95,19.5,15.97,13.82,16.24,16.86,15.46,18.05,26.48,23.09,23.95,23.79,28.91,71.99,86.21],"m":[2.19,1.8,1.77,1.54,1.68,2.55,4.67,4.43,4.35,4.64,5.42,11.07,20.98,10.49,7.92,11.41,8.14,6.13,5.46,7.02,6.53,5.5,4.83,4.06,3.95,4.31,5.29,5.2,5.2,4.9,5.54,5.22,4.95,4.37,4.6,4.88,6.66,7.31,11.55,13.38,14.99,14.67,20.19,35.12,31.15,23.79,19.08,15.68,17.14,17.05,15.71,16.21,20.55,25.14,21.73,23.35,28.27,40.03,86.78],"n":[251,254,255,249,252,245,254,254,255,252,252,253,254,251,252,253,252,253,253,252,253,252,253,253,254,253,252,252,254,253,253,252,252,253,252,253,254,252,252,253,254,253,253,251,252,253,253,253,253,252,253,253,254,253,250,251,254,253,45]}});
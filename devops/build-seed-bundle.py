@@ -2,7 +2,7 @@
 """
 Build a compact JS seed bundle from spot-history year files.
 
-Reads data/spot-history-{year}.json (1968–current) and generates
+Reads every data/spot-history-{year}.json and generates
 data/spot-history-bundle.js — a single <script>-loadable file that
 pre-populates historicalDataCache so charts work on file:// protocol
 where fetch() and XHR are blocked by Chrome security.
@@ -10,69 +10,825 @@ where fetch() and XHR are blocked by Chrome security.
 Compact format groups entries by year → metal → [[MM-DD, price], ...].
 The JS loader in spot.js expands these back into full cache entries.
 
+Alongside the single-file bundle (kept for file:// users who want all of
+history up front), the builder writes one bundle per decade to
+data/spot-history-bundles/ plus data/spot-history-bundle-index.js, a tiny
+script listing those ranges so spot.js can inject only the ones a chart
+asks for.
+
+data/spot-history-lod/ holds level-of-detail tiers for long-range charts:
+weekly, monthly and yearly OHLC/mean bars per metal, and LTTB
+(largest-triangle-three-buckets) downsamples of the whole history at
+fixed point budgets. Each tier is its own script calling
+_loadSpotSeedLod(); the bundle index lists them with their point counts
+so a chart can load the coarsest tier that fills its width. The tiers are
+built with the spot poller's NumPy series helpers (spot_series.py, shared
+with scan-history.py), so the builder needs NumPy: pip install numpy
+
+data/spot-history-fx/<CODE>.js holds the seed history converted into each
+currency the poller records in fx-history-{year}.json (same layout as the
+main bundle, one script per currency, only the days with an FX rate), so
+non-USD charts need no per-point conversion.
+
+Every output gets precompressed .gz (and, with the brotli module, .br)
+sidecars, regenerated only when the output's bytes change, and a record
+(content hash, size, updated-at) in data/etag-manifest.json.
+
+data/spot-history-columnar.js carries the same points as delta-encoded
+little-endian integer columns (base64 inside a _loadSpotSeedColumnar()
+call), several times smaller than the JSON pairs; --verify round-trips it
+against the year files.
+
+Pending year-file journals (spot-history-{year}.journal.ndjson, written
+by the poller with SPOT_HISTORY_JOURNAL=1) are compacted into their year
+files before anything is read, so the bundle and the published year
+files always include them.
+
+Builds are incremental: each year's encoded fragment is cached in
+data/.spot-history-bundle-cache.json keyed by the year file's hash, so
+only years whose file changed are re-read. Each output is recorded with
+a hash of its inputs: when one year changes, only its range bundle and
+the outputs spanning every year (the main bundle, LOD tiers, currency
+bundles and the columnar script) are rebuilt and republished. A file
+whose content would not change is left untouched, sidecars included.
+
 Usage:
-    python3 devops/build-seed-bundle.py
+    python3 devops/build-seed-bundle.py            # Incremental build
+    python3 devops/build-seed-bundle.py --full     # Ignore the cache
+    python3 devops/build-seed-bundle.py --verify   # Round-trip check the columnar output
 
 Run from project root. Output: data/spot-history-bundle.js
 """
 
+import argparse
+import base64
+import contextlib
+import hashlib
 import json
 import os
+import re
+import struct
 import sys
 from collections import defaultdict
+from datetime import date
+from itertools import accumulate
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
-OUTPUT_FILE = os.path.join(DATA_DIR, "spot-history-bundle.js")
+OUTPUT_NAME = "spot-history-bundle.js"
+INDEX_NAME = "spot-history-bundle-index.js"
+COLUMNAR_NAME = "spot-history-columnar.js"
+COLUMNAR_VERSION = 1
+RANGE_DIR_NAME = "spot-history-bundles"
+RANGE_YEARS = 10  # One lazy-loadable bundle per decade
+CACHE_NAME = ".spot-history-bundle-cache.json"
+CACHE_VERSION = 5  # 5: outputs keyed on their inputs' hashes
+LOD_DIR_NAME = "spot-history-lod"
+LOD_VERSION = 1
+LOD_LTTB_BUDGETS = (500, 2000)  # points per metal for the shape-preserving tiers
+LOD_PERIODS = ("weekly", "monthly", "yearly")  # keys of spot_series.PERIOD_STARTS
+CURRENCY_DIR_NAME = "spot-history-fx"
+FX_CARRY_DAYS = 7  # a metal day without its own FX rate reuses one at most this old
 
-START_YEAR = 1968
-END_YEAR = 2026  # Update when adding new year files
+YEAR_FILE_RE = re.compile(r"^spot-history-(\d{4})\.json$")
+FX_FILE_RE = re.compile(r"^fx-history-(\d{4})\.json$")
+JOURNAL_FILE_RE = re.compile(r"^spot-history-(\d{4})\.journal\.ndjson(\.compacting)?$")
+SPOT_POLLER_DIR = os.path.join(PROJECT_ROOT, "devops", "pollers", "shared", "spot-poller")
+SEED_UPDATER_PATH = os.path.join(SPOT_POLLER_DIR, "update-seed-data.py")
+SPOT_SERIES_PATH = os.path.join(SPOT_POLLER_DIR, "spot_series.py")
 
 
-def build_bundle():
-    """Read all year files and produce compact JS bundle."""
-    # Structure: { year: { metal: [[MM-DD, price], ...] } }
-    bundle = {}
-    total_entries = 0
+def find_year_files(data_dir):
+    """Return [(year, path), ...] for every spot-history-{year}.json, oldest first."""
+    found = []
+    for name in os.listdir(data_dir):
+        match = YEAR_FILE_RE.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(data_dir, name)))
+    return sorted(found)
+
+
+def find_fx_files(data_dir):
+    """Return [(year, path), ...] for every fx-history-{year}.json, oldest first."""
+    found = []
+    for name in os.listdir(data_dir):
+        match = FX_FILE_RE.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(data_dir, name)))
+    return sorted(found)
+
 
-    for year in range(START_YEAR, END_YEAR + 1):
-        filepath = os.path.join(DATA_DIR, f"spot-history-{year}.json")
-        if not os.path.exists(filepath):
+def compact_journals(data_dir):
+    """
+    Fold pending year-file journals into their year files using the spot
+    poller's own compaction. Returns {year: entries folded} (empty, without
+    loading the updater, when there are none).
+    """
+    years = {m.group(1) for m in map(JOURNAL_FILE_RE.match, os.listdir(data_dir)) if m}
+    if not years:
+        return {}
+    seed = load_seed_updater()
+    return {year: seed.compact_journal(data_dir, year) for year in sorted(years)}
+
+
+def usable_entries(entries):
+    """Yield (metal, "MM-DD", price) for entries the bundles keep, price rounded to cents."""
+    for e in entries:
+        if not (e.get("spot") and e.get("metal") and e.get("timestamp")):
             continue
+        # Extract MM-DD from timestamp "YYYY-MM-DD HH:MM:SS"
+        ts = e["timestamp"]
+        yield e["metal"], ts[5:10], round(e["spot"], 2)
+
+
+def year_columns(entries):
+    """
+    Collect a year's usable points into a small column store,
+    {metal: (["MM-DD", ...], [price, ...])} in file order, with metal
+    names interned. Both encoders read it, so the entry dicts are walked
+    once and can be dropped as soon as it is built.
+    """
+    columns = {}
+    for metal, mm_dd, price in usable_entries(entries):
+        column = columns.get(metal)
+        if column is None:
+            column = columns[sys.intern(metal)] = ([], [])
+        column[0].append(mm_dd)
+        column[1].append(price)
+    return columns
+
+
+def encode_year(columns):
+    """Encode one year's columns as the compact {metal: [[MM-DD, price], ...]} JSON fragment.
+
+    Returns (fragment, entry_count); fragment is None when the year has no usable entries.
+    """
+    if not columns:
+        return None, 0
+    year_data = {metal: [list(point) for point in zip(days, prices)] for metal, (days, prices) in columns.items()}
+    count = sum(len(days) for days, _ in columns.values())
+    return json.dumps(year_data, separators=(",", ":")), count
+
+
+# ---------------------------------------------------------------------------
+# Columnar format
+# ---------------------------------------------------------------------------
+# Per year and metal: day-of-year deltas and fixed-point cent price deltas,
+# each packed little-endian at the narrowest width (1, 2 or 4 bytes) that
+# fits the column, then base64'd so the payload still loads via <script>.
+#
+#   {"n": points, "d0": first day-of-year (0-based), "p0": first price in cents,
+#    "dw": day delta width, "d": base64 day deltas (n-1, unsigned),
+#    "pw": price delta width, "p": base64 price deltas (n-1, signed)}
+
+_INT_CODES = {1: "b", 2: "h", 4: "i"}
+
+
+def _pack_ints(values, signed):
+    """Pack ints at the narrowest width that fits. Returns (width, base64)."""
+    for width, code in _INT_CODES.items():
+        bits = width * 8
+        lo, hi = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+        if all(lo <= v <= hi for v in values):
+            break
+    else:
+        raise ValueError("delta does not fit in 32 bits")
+    fmt = f"<{len(values)}{code if signed else code.upper()}"
+    return width, base64.b64encode(struct.pack(fmt, *values)).decode("ascii")
+
+
+def _unpack_ints(b64, width, signed, count):
+    code = _INT_CODES[width]
+    return list(struct.unpack(f"<{count}{code if signed else code.upper()}", base64.b64decode(b64)))
+
+
+def encode_columns(year, points):
+    """Encode one metal's [(MM-DD, price), ...] for a year as a column record."""
+    jan1 = date(year, 1, 1).toordinal()
+    day_of_year = {}
+    rows = []
+    for mm_dd, price in points:
+        day = day_of_year.get(mm_dd)
+        if day is None:
+            day = day_of_year[mm_dd] = date(year, int(mm_dd[:2]), int(mm_dd[3:])).toordinal() - jan1
+        rows.append((day, round(price * 100)))
+    rows.sort()
+    days = [d for d, _ in rows]
+    cents = [c for _, c in rows]
+    dw, d = _pack_ints([b - a for a, b in zip(days, days[1:])], signed=False)
+    pw, p = _pack_ints([b - a for a, b in zip(cents, cents[1:])], signed=True)
+    return {"n": len(rows), "d0": days[0], "p0": cents[0], "dw": dw, "d": d, "pw": pw, "p": p}
 
-        with open(filepath, "r") as f:
-            entries = json.load(f)
 
-        if not isinstance(entries, list):
+def decode_column_ordinals(year, column):
+    """Decode a column record into ([day ordinal, ...], [price, ...]) in day order."""
+    count = column["n"]
+    jan1 = date(year, 1, 1).toordinal()
+    days = accumulate(_unpack_ints(column["d"], column["dw"], False, count - 1), initial=jan1 + column["d0"])
+    cents = accumulate(_unpack_ints(column["p"], column["pw"], True, count - 1), initial=column["p0"])
+    return list(days), [c / 100 for c in cents]
+
+
+def decode_columns(year, column):
+    """Inverse of encode_columns(): returns [(MM-DD, price), ...] in day order."""
+    days, prices = decode_column_ordinals(year, column)
+    return [(date.fromordinal(d).strftime("%m-%d"), p) for d, p in zip(days, prices)]
+
+
+def encode_year_columnar(year, columns):
+    """Encode one year's columns as the {metal: column} JSON fragment (None if empty)."""
+    if not columns:
+        return None
+    encoded = {metal: encode_columns(year, zip(days, prices)) for metal, (days, prices) in columns.items()}
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+# ---------------------------------------------------------------------------
+# Level-of-detail tiers
+# ---------------------------------------------------------------------------
+# Built from the cached columnar fragments (cent precision), so an
+# incremental build never re-reads unchanged year files. Tier payloads are
+# column-oriented per metal: {"t": [period start "YYYY-MM-DD", ...], ...}.
+
+def history_series(records):
+    """{metal: ([day ordinal, ...], [price, ...])} across every year, oldest first."""
+    series = {}
+    for year in sorted(records, key=int):
+        columnar = records[year]["columnar"]
+        if columnar is None:
             continue
+        for metal, column in json.loads(columnar).items():
+            days, prices = decode_column_ordinals(int(year), column)
+            target = series.setdefault(metal, ([], []))
+            target[0].extend(days)
+            target[1].extend(prices)
+    return series
+
+
+def build_lod_tiers(series, budgets=LOD_LTTB_BUDGETS):
+    """
+    Compute every LOD tier from history_series(). Returns
+    [(relpath, encoded_bytes, info), ...] where info is the tier's index
+    record (name, kind, file, points).
+
+    The bucketing and downsampling are the spot poller's NumPy series
+    helpers (spot_series.py), shared with scan-history.py.
+    """
+    if not series:
+        return []
+    spot_series = load_spot_series()
+    np = spot_series.np
+    arrays = {metal: (np.array(days, dtype="int64"), np.array(prices)) for metal, (days, prices) in sorted(series.items())}
+    tiers = []
+    for name in LOD_PERIODS:
+        payload = {}
+        for metal, (days, prices) in arrays.items():
+            bars = spot_series.aggregate_ohlc(days, prices, name)
+            bars["t"] = [date.fromordinal(day).isoformat() for day in bars["t"]]
+            payload[metal] = bars
+        tiers.append((name, "ohlc", payload))
+    for budget in budgets:
+        payload = {}
+        for metal, (days, prices) in arrays.items():
+            keep = spot_series.lttb_indices(days, prices, budget)
+            payload[metal] = {
+                "t": [date.fromordinal(day).isoformat() for day in days[keep].tolist()],
+                "p": prices[keep].tolist(),
+            }
+        tiers.append((f"lttb-{budget}", "line", payload))
+
+    built = []
+    for name, kind, payload in tiers:
+        points = max(len(columns["t"]) for columns in payload.values())
+        rel = f"{LOD_DIR_NAME}/{name}.js"
+        js = "// Auto-generated by devops/build-seed-bundle.py — do not edit\n"
+        js += f"// Level-of-detail tier {name} ({kind}, up to {points} points per metal)\n"
+        js += f"window._loadSpotSeedLod({json.dumps(name)},{json.dumps(payload, separators=(',', ':'))});\n"
+        built.append((rel, js.encode("utf-8"), {"name": name, "kind": kind, "file": rel, "points": points}))
+    return built
+
+
+# ---------------------------------------------------------------------------
+# Per-currency bundles
+# ---------------------------------------------------------------------------
+# fx-history-{year}.json holds {"base": "USD", "rates": {"YYYY-MM-DD":
+# {code: units per 1 USD}}}, written by the spot poller from the same API
+# calls as the metals.
+
+def load_fx_history(fx_files):
+    """{code: ([day ordinal, ...], [rate, ...])} from the fx-history files, oldest first."""
+    history = {}
+    for _, path in fx_files:
+        with open(path, "r", encoding="utf-8") as f:
+            rates = json.load(f).get("rates", {})
+        for day in sorted(rates):
+            ordinal = date.fromisoformat(day).toordinal()
+            for code, rate in rates[day].items():
+                if isinstance(rate, (int, float)) and rate > 0:
+                    target = history.setdefault(code, ([], []))
+                    target[0].append(ordinal)
+                    target[1].append(rate)
+    return history
+
+
+def convert_series(days, prices, fx_days, fx_rates, carry=FX_CARRY_DAYS):
+    """
+    Convert a USD daily series with the FX rate of the same day, or the
+    latest earlier one up to `carry` days old. Days without a usable rate
+    are dropped. Returns [(day ordinal, price), ...].
+    """
+    converted = []
+    j = -1
+    for day, price in zip(days, prices):
+        while j + 1 < len(fx_days) and fx_days[j + 1] <= day:
+            j += 1
+        if j >= 0 and day - fx_days[j] <= carry:
+            converted.append((day, round(price * fx_rates[j], 2)))
+    return converted
+
+
+def build_currency_bundles(series, fx_history):
+    """
+    One bundle per currency in the _loadSpotSeedBundle() layout
+    ({year: {metal: [[MM-DD, price], ...]}}). Returns [(relpath, encoded_bytes, info), ...].
+    """
+    built = []
+    for code, (fx_days, fx_rates) in sorted(fx_history.items()):
+        years = {}
+        first = last = None
+        count = 0
+        for metal, (days, prices) in sorted(series.items()):
+            for day, price in convert_series(days, prices, fx_days, fx_rates):
+                d = date.fromordinal(day)
+                years.setdefault(str(d.year), {}).setdefault(metal, []).append([d.strftime("%m-%d"), price])
+                first = day if first is None else min(first, day)
+                last = day if last is None else max(last, day)
+                count += 1
+        if not count:
+            continue
+        payload = {year: years[year] for year in sorted(years, key=int)}
+        rel = f"{CURRENCY_DIR_NAME}/{code}.js"
+        js = "// Auto-generated by devops/build-seed-bundle.py — do not edit\n"
+        js += f"// {count} entries in {code} across {len(payload)} years\n"
+        js += f"window._loadSpotSeedCurrency({json.dumps(code)},{json.dumps(payload, separators=(',', ':'))});\n"
+        info = {
+            "code": code,
+            "file": rel,
+            "first": date.fromordinal(first).isoformat(),
+            "last": date.fromordinal(last).isoformat(),
+            "entries": count,
+        }
+        built.append((rel, js.encode("utf-8"), info))
+    return built
+
+
+def parse_columnar_script(path):
+    """Read spot-history-columnar.js back into its payload dict."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    start = text.index("window._loadSpotSeedColumnar(") + len("window._loadSpotSeedColumnar(")
+    end = text.rindex(");")
+    return json.loads(text[start:end])
+
+
+def verify_columnar(data_dir=DATA_DIR, columnar_file=None):
+    """
+    Round-trip check: decode the columnar payload and compare it, point by
+    point, with the year files (cents precision, as in the JS bundle).
+    Returns a list of mismatch descriptions (empty when everything matches).
+    """
+    columnar_file = columnar_file or os.path.join(data_dir, COLUMNAR_NAME)
+    payload = parse_columnar_script(columnar_file)
+    decoded_years = payload.get("years", {})
+    problems = []
+
+    for year, path in find_year_files(data_dir):
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        expected = defaultdict(list)
+        for metal, mm_dd, price in usable_entries(entries if isinstance(entries, list) else []):
+            expected[metal].append((mm_dd, price))
+        decoded = decoded_years.get(str(year), {})
+        for metal in sorted(set(expected) | set(decoded)):
+            want = sorted(expected.get(metal, []))
+            got = decode_columns(year, decoded[metal]) if metal in decoded else []
+            if want != got:
+                diff = next((i for i, (a, b) in enumerate(zip(want, got)) if a != b), min(len(want), len(got)))
+                problems.append(
+                    f"{year} {metal}: {len(want)} expected, {len(got)} decoded, first difference at point {diff}"
+                )
+    on_disk = {str(year) for year, _ in find_year_files(data_dir)}
+    for year in sorted(set(decoded_years) - on_disk):
+        problems.append(f"{year}: decoded data but no year file")
+    return problems
+
+
+def load_cache(data_dir):
+    """Load the per-year fragment cache (empty if missing, unreadable or outdated)."""
+    path = os.path.join(data_dir, CACHE_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "years": {}, "outputs": {}}
+    return cache
 
-        year_data = defaultdict(list)
-        for e in entries:
-            if not (e.get("spot") and e.get("metal") and e.get("timestamp")):
-                continue
-            # Extract MM-DD from timestamp "YYYY-MM-DD HH:MM:SS"
-            ts = e["timestamp"]
-            mm_dd = ts[5:10]  # "MM-DD"
-            year_data[e["metal"]].append([mm_dd, round(e["spot"], 2)])
-            total_entries += 1
-
-        if year_data:
-            bundle[year] = dict(year_data)
-
-    # Generate JS
-    js_data = json.dumps(bundle, separators=(",", ":"))
+
+def save_cache(data_dir, cache):
+    path = os.path.join(data_dir, CACHE_NAME)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+
+
+def _year_record(path, cached):
+    """
+    Return (record, reencoded) for a year file.
+
+    A cached record is reused when its mtime/size still match, or when the
+    file's hash matches after an mtime-only change (e.g. git checkout).
+    """
+    st = os.stat(path)
+    if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+        return cached, False
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached.get("sha256") == digest:
+        return dict(cached, mtime_ns=st.st_mtime_ns), False
+
+    entries = json.loads(raw)
+    if not isinstance(entries, list):
+        entries = []
+    columns = year_columns(entries)
+    del entries  # only the columns are needed from here on
+    year = int(YEAR_FILE_RE.match(os.path.basename(path)).group(1))
+    fragment, count = encode_year(columns)
+    record = {
+        "sha256": digest,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "entries": count,
+        "fragment": fragment,
+        "columnar": encode_year_columnar(year, columns),
+    }
+    return record, True
+
+
+def _outputs_match(data_dir, records):
+    """True if every output recorded in the cache is still on disk untouched."""
+    if not records:
+        return False
+    return all(_output_untouched(data_dir, rel, record) for rel, record in records.items())
+
+
+def _columnar_script(records, total_entries):
+    """Splice every year's columnar fragment into the _loadSpotSeedColumnar() script."""
+    columnar_parts = [
+        f'"{year}":{records[year]["columnar"]}'
+        for year in sorted(records, key=int)
+        if records[year]["columnar"] is not None
+    ]
+    columnar_js = "// Auto-generated by devops/build-seed-bundle.py — do not edit\n"
+    columnar_js += f"// {total_entries} entries across {len(columnar_parts)} years, delta-encoded columns\n"
+    columnar_js += (
+        f'window._loadSpotSeedColumnar({{"v":{COLUMNAR_VERSION},"years":{{{",".join(columnar_parts)}}}}});\n'
+    )
+    return columnar_js.encode("utf-8")
+
+
+def _bundle_script(parts, total_entries, label=""):
+    """Wrap spliced "year":fragment parts in a _loadSpotSeedBundle() call."""
+    js_data = "{" + ",".join(parts) + "}"
     js_content = f"// Auto-generated by devops/build-seed-bundle.py — do not edit\n"
-    js_content += f"// {total_entries} entries across {len(bundle)} years\n"
+    js_content += f"// {total_entries} entries across {len(parts)} years{label}\n"
     js_content += f"window._loadSpotSeedBundle({js_data});\n"
+    return js_content.encode("utf-8")
+
+
+def _range_start(year, range_years):
+    return year - year % range_years
+
+
+def range_groups(records, range_years=RANGE_YEARS):
+    """{range start: [year, ...]} for the years that have a fragment, oldest first."""
+    groups = defaultdict(list)
+    for year in sorted(records, key=int):
+        if records[year]["fragment"] is not None:
+            groups[_range_start(int(year), range_years)].append(year)
+    return dict(sorted(groups.items()))
+
+
+def build_range_bundle(records, start, years, range_years=RANGE_YEARS):
+    """
+    Splice one year range's fragments (a decade by default) into a bundle.
+
+    Returns (relpath, encoded_bytes, info) where info is the range's index
+    record (file, start, end, years, entries); "bytes" is filled in later.
+    """
+    parts = [f'"{y}":{records[y]["fragment"]}' for y in years]
+    entries = sum(records[y]["entries"] for y in years)
+    first, last = int(years[0]), int(years[-1])
+    name = f"spot-history-{start}s.js" if range_years == 10 else f"spot-history-{start}-{start + range_years - 1}.js"
+    rel = f"{RANGE_DIR_NAME}/{name}"
+    encoded = _bundle_script(parts, entries, f" ({first}–{last})")
+    return rel, encoded, {
+        "file": rel,
+        "start": first,
+        "end": last,
+        "years": len(years),
+        "entries": entries,
+    }
+
+
+def _input_key(*inputs):
+    """Hash of an output group's inputs (year hashes, settings), recorded in the cache."""
+    return hashlib.sha256(json.dumps(inputs, separators=(",", ":")).encode("utf-8")).hexdigest()[:16]
+
+
+def _output_untouched(data_dir, rel, record):
+    try:
+        st = os.stat(os.path.join(data_dir, rel))
+    except FileNotFoundError:
+        return False
+    return record.get("mtime_ns") == st.st_mtime_ns and record.get("size") == st.st_size
+
+
+def _reusable_outputs(data_dir, cached_outputs, group, key):
+    """
+    The cached output records of `group` if they were built from inputs
+    hashing to `key` and are untouched on disk, else None.
+    """
+    cached = {rel: record for rel, record in cached_outputs.items() if record.get("group") == group}
+    if cached and all(
+        record.get("key") == key and _output_untouched(data_dir, rel, record) for rel, record in cached.items()
+    ):
+        return cached
+    return None
+
+
+def build_bundle(data_dir=DATA_DIR, output_file=None, incremental=True, range_years=RANGE_YEARS):
+    """
+    Read the year files and produce the compact JS bundle.
+
+    Also emits one bundle per year range under data/spot-history-bundles/
+    and data/spot-history-bundle-index.js, which lists those ranges so the
+    app can load only the years a chart needs.
 
-    with open(OUTPUT_FILE, "w") as f:
-        f.write(js_content)
+    With incremental=True, unchanged years are spliced in from the cache.
+    Returns a dict summarizing the build (years, entries, reencoded, written).
+    """
+    output_file = output_file or os.path.join(data_dir, OUTPUT_NAME)
+    for year, count in compact_journals(data_dir).items():
+        print(f"  Compacted {count} journal entries into spot-history-{year}.json")
+    cache = load_cache(data_dir) if incremental else {"version": CACHE_VERSION, "years": {}, "outputs": {}}
+    cached_years = cache["years"]
 
-    file_size = os.path.getsize(OUTPUT_FILE)
-    print(f"Generated {OUTPUT_FILE}")
-    print(f"  {total_entries} entries, {len(bundle)} years")
+    records = {}
+    reencoded = []
+    for year, path in find_year_files(data_dir):
+        record, changed = _year_record(path, cached_years.get(str(year)))
+        records[str(year)] = record
+        if changed:
+            reencoded.append(year)
+
+    # Splice cached fragments — identical to json.dumps() of the whole
+    # {year: {metal: [...]}} dict with compact separators.
+    parts = []
+    total_entries = 0
+    for year in sorted(records, key=int):
+        record = records[year]
+        if record["fragment"] is None:
+            continue
+        parts.append(f'"{year}":{record["fragment"]}')
+        total_entries += record["entries"]
+
+    fx_files = find_fx_files(data_dir)
+    fx_signature = {}
+    for year, path in fx_files:
+        st = os.stat(path)
+        fx_signature[str(year)] = [st.st_mtime_ns, st.st_size]
+
+    years_changed = (
+        bool(reencoded)
+        or set(records) != set(cached_years)
+        or cache.get("range_years") != range_years
+        or cache.get("fx", {}) != fx_signature
+    )
+    if incremental and not years_changed and _outputs_match(data_dir, cache.get("outputs")):
+        print(f"{output_file} is up to date ({len(records)} year files unchanged)")
+        return {"years": len(parts), "entries": total_entries, "reencoded": [], "written": False}
+
+    # Every output group is keyed on the hashes of its inputs. A group whose
+    # key matches the cache and whose files are untouched is neither rebuilt
+    # nor republished: one changed year rebuilds its own range bundle and the
+    # outputs spanning every year (main bundle, LOD tiers, currencies,
+    # columnar), not the other ranges.
+    cached_outputs = cache.get("outputs", {}) if incremental else {}
+    all_years = [records[year]["sha256"] for year in sorted(records, key=int)]
+    groups = [("bundle", _input_key(all_years))]
+    ranges = range_groups(records, range_years)
+    for start, years in ranges.items():
+        groups.append((f"range-{start}", _input_key(range_years, [records[y]["sha256"] for y in years])))
+    groups.append(("lod", _input_key(LOD_VERSION, all_years)))
+    if fx_files:
+        groups.append(("currencies", _input_key(all_years, fx_signature)))
+    groups.append(("columnar", _input_key(COLUMNAR_VERSION, all_years)))
+
+    outputs = []  # (group, key, rel, encoded bytes or None when reused, index info)
+    series = None
+    for group, key in groups:
+        reused = _reusable_outputs(data_dir, cached_outputs, group, key)
+        if reused is not None:
+            outputs.extend((group, key, rel, None, record.get("info")) for rel, record in reused.items())
+            continue
+        if group == "bundle":
+            built = [(os.path.relpath(output_file, data_dir), _bundle_script(parts, total_entries), None)]
+        elif group == "columnar":
+            built = [(COLUMNAR_NAME, _columnar_script(records, total_entries), None)]
+        elif group.startswith("range-"):
+            start = int(group[len("range-"):])
+            built = [build_range_bundle(records, start, ranges[start], range_years)]
+        else:
+            if series is None:
+                series = history_series(records)
+            if group == "lod":
+                built = build_lod_tiers(series)
+            else:
+                built = build_currency_bundles(series, load_fx_history(fx_files))
+        for rel, encoded, info in built:
+            outputs.append((group, key, rel, encoded, info and dict(info, bytes=len(encoded))))
+
+    index = {"ranges": [info for group, _, _, _, info in outputs if group.startswith("range-")]}
+    lod = [info for group, _, _, _, info in outputs if group == "lod"]
+    currencies = [info for group, _, _, _, info in outputs if group == "currencies"]
+    if lod:
+        index["lod"] = {"v": LOD_VERSION, "tiers": lod}
+    if currencies:
+        index["currencies"] = currencies
+    index_js = "// Auto-generated by devops/build-seed-bundle.py — do not edit\n"
+    index_js += f"// {len(ranges)} seed ranges; each file calls window._loadSpotSeedBundle()\n"
+    index_js += f"window._registerSpotSeedIndex({json.dumps(index, separators=(',', ':'))});\n"
+    outputs.append(("index", None, INDEX_NAME, index_js.encode("utf-8"), None))
+
+    # Hash-checked writes, .gz/.br sidecars and the ETag manifest share the
+    # spot poller's implementation (SPOT_SIDECARS)
+    publisher = load_seed_updater()
+    manifest_files = publisher.etag_manifest(data_dir)["files"]
+    written = []
+    output_records = {}
+    for group, key, rel, encoded, info in outputs:
+        path = os.path.join(data_dir, rel)
+        if encoded is None:
+            if rel not in manifest_files:
+                with open(path, "rb") as f:
+                    publisher.note_published(data_dir, path, publisher.content_etag(f.read()))
+            output_records[rel] = cached_outputs[rel]
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if publisher.publish_bytes(data_dir, path, encoded, "bundle"):
+            written.append(rel)
+        st = os.stat(path)
+        output_records[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "group": group, "key": key, "info": info}
+    publisher.save_etag_manifest(data_dir)
+
+    cache = {
+        "version": CACHE_VERSION,
+        "years": records,
+        "range_years": range_years,
+        "fx": fx_signature,
+        "outputs": output_records,
+    }
+    save_cache(data_dir, cache)
+
+    file_size = os.path.getsize(output_file)
+    print(f"{'Generated' if written else 'Unchanged'} {output_file}")
+    print(f"  {total_entries} entries, {len(parts)} years ({len(reencoded)} re-encoded,"
+          f" {sum(encoded is not None for _, _, _, encoded, _ in outputs)} of {len(outputs)} outputs rebuilt)")
     print(f"  {file_size:,} bytes ({file_size // 1024}KB)")
+    print(f"  {len(ranges)} range bundles in {RANGE_DIR_NAME}/ + {INDEX_NAME}"
+          f" ({len(written)} file{'s' if len(written) != 1 else ''} written)")
+    columnar_size = os.path.getsize(os.path.join(data_dir, COLUMNAR_NAME))
+    print(f"  {COLUMNAR_NAME}: {columnar_size:,} bytes ({columnar_size // 1024}KB)")
+    if lod:
+        print(f"  {len(lod)} LOD tiers in {LOD_DIR_NAME}/: "
+              + ", ".join(f"{info['name']} {info['bytes'] // 1024}KB" for info in lod))
+    if currencies:
+        print(f"  {len(currencies)} currency bundles in {CURRENCY_DIR_NAME}/: "
+              + ", ".join(f"{info['code']} {info['entries']} entries" for info in currencies))
+    return {
+        "years": len(parts),
+        "entries": total_entries,
+        "reencoded": reencoded,
+        "written": bool(written),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Build data/spot-history-bundle.js from the spot-history year files."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-encode every year file instead of reusing the fragment cache.",
+    )
+    parser.add_argument(
+        "--range-years",
+        type=int,
+        default=RANGE_YEARS,
+        help=f"Years per lazy-loadable range bundle (default: {RANGE_YEARS}).",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help=f"After building, decode {COLUMNAR_NAME} and check it against the year files.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="build-seed-bundle-profile.json",
+        default=None,
+        metavar="REPORT",
+        help="Profile the build (cProfile + tracemalloc) and write a JSON report "
+             "in the spot poller's --profile format (default: build-seed-bundle-profile.json).",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=DATA_DIR,
+        help="Directory holding spot-history-{year}.json (default: project data/).",
+    )
+    return parser.parse_args()
+
+
+def load_seed_updater():
+    """Import the spot poller's update-seed-data.py (stdlib-only at import time)."""
+    if "seed_updater" in sys.modules:
+        return sys.modules["seed_updater"]
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    spec = spec_from_file_location("seed_updater", SEED_UPDATER_PATH)
+    mod = module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    sys.modules["seed_updater"] = mod
+    return mod
+
+
+def load_spot_series():
+    """Import the spot poller's NumPy series helpers (spot_series.py)."""
+    if "spot_series" in sys.modules:
+        return sys.modules["spot_series"]
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    spec = spec_from_file_location("spot_series", SPOT_SERIES_PATH)
+    mod = module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    sys.modules["spot_series"] = mod
+    return mod
+
+
+def load_profiler():
+    """Borrow the spot poller's Profiler so --profile reports share one format."""
+    mod = load_seed_updater()
+    return mod.Profiler(), mod.format_profile_summary
+
+
+def _unprofiled(name):
+    return contextlib.nullcontext()
 
 
 if __name__ == "__main__":
-    build_bundle()
+    args = parse_args()
+    if load_spot_series().np is None:
+        print("build-seed-bundle.py needs NumPy for the LOD tiers: pip install numpy", file=sys.stderr)
+        sys.exit(2)
+    if args.profile:
+        profiler, format_summary = load_profiler()
+        profiler.enable()
+        phase = profiler.phase
+    else:
+        phase = _unprofiled
+
+    problems = []
+    try:
+        with phase("bundle_build"):
+            build_bundle(data_dir=args.data_dir, incremental=not args.full, range_years=args.range_years)
+        if args.verify:
+            with phase("verify"):
+                problems = verify_columnar(args.data_dir)
+    finally:
+        if args.profile:
+            report = profiler.report()
+            profiler.write(args.profile)
+            print(f"Profile ({report['total_wall_ms']:.0f}ms total) → {args.profile}")
+            print(format_summary(report))
+
+    if args.verify:
+        for problem in problems:
+            print(f"  MISMATCH {problem}")
+        if problems:
+            print(f"Columnar verify FAILED ({len(problems)} mismatches)")
+            sys.exit(1)
+        print("Columnar verify OK — decoded payload matches the year files")
@@ -10,6 +10,7 @@
  *   - supervisorctl (service health inside container)
  *   - Turso poller_runs (last run stats per poller)
  *   - Turso provider_failures (failure queue stats)
+ *   - Python spot poller textfile (SPOT_METRICS_FILE), plus per-tier age
  */
 
 import { createServer } from "node:http";
@@ -19,6 +20,7 @@ import { createClient } from "@libsql/client";
 
 const PORT = parseInt(process.env.METRICS_PORT || "9100", 10);
 const IFACE = process.env.NET_IFACE || "ens18";
+const SPOT_METRICS_FILE = process.env.SPOT_METRICS_FILE || "";
 
 // Load .env
 (function loadEnv() {
@@ -171,6 +173,26 @@ async function collectTurso() {
   return metrics;
 }
 
+// ── Spot poller textfile ─────────────────────────────────────────────────────
+
+function collectSpotPoller() {
+  const metrics = [];
+  if (!SPOT_METRICS_FILE || !existsSync(SPOT_METRICS_FILE)) return metrics;
+  try {
+    const text = readFileSync(SPOT_METRICS_FILE, "utf8").trimEnd();
+    metrics.push(text);
+    // Age per tier, so alerts fire before api-health.js's 20-minute staleness
+    const nowSecs = Date.now() / 1000;
+    for (const line of text.split("\n")) {
+      const m = line.match(/^spot_last_success_timestamp_seconds\{tier="([^"]+)"\} ([0-9.]+)$/);
+      if (m) metrics.push(`spot_tier_age_seconds{tier="${m[1]}"} ${(nowSecs - parseFloat(m[2])).toFixed(0)}`);
+    }
+  } catch (err) {
+    console.error("[metrics] spot textfile error:", err.message);
+  }
+  return metrics;
+}
+
 // ── HTTP server ──────────────────────────────────────────────────────────────
 
 const server = createServer(async (req, res) => {
@@ -180,13 +202,14 @@ const server = createServer(async (req, res) => {
     return;
   }
 
-  const [system, services, turso] = await Promise.all([
+  const [system, services, turso, spot] = await Promise.all([
     Promise.resolve(collectSystem()),
     Promise.resolve(collectServices()),
     collectTurso(),
+    Promise.resolve(collectSpotPoller()),
   ]);
 
-  const body = [...system, ...services, ...turso].join("\n") + "\n";
+  const body = [...system, ...services, ...turso, ...spot].join("\n") + "\n";
   res.writeHead(200, { "Content-Type": "text/plain; version=0.0.4; charset=utf-8" });
   res.end(body);
 });
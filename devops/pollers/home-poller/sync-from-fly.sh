@@ -36,8 +36,13 @@ SHARED_FILES=(
   monitor-oos.sh
   spot-extract.js
   backfill-spot.js
+  spot-poller/bench-baseline.json
+  spot-poller/bench.py
   spot-poller/poller.py
   spot-poller/requirements.txt
+  spot-poller/scan-history.py
+  spot-poller/spot_series.py
+  spot-poller/stub_api.py
   spot-poller/update-seed-data.py
 )
 
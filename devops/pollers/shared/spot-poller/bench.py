@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Spot Pipeline Benchmarks
+========================
+Generates synthetic seed history (year files plus hourly/15-min shards)
+into a temp data dir, then times each pipeline stage against a local
+stub_api.py server. Results are compared with stored baselines and the
+run fails when a stage regresses past the threshold.
+
+Each stage is normalized by the calibration probes for what it mostly
+spends its time on: pure-Python CPU, fsync'd file writes or HTTP round
+trips to the stub. The probes run fixed workloads on this host before
+the stages. A stage's baseline is stored in probe units (its time over
+the probe time), so the gate compares code, not machines.
+
+Usage:
+    python3 bench.py                          # small scale, compare to baseline
+    python3 bench.py --scale large            # 500 years, 20 metals, 1 year of shards
+    python3 bench.py --years 200 --metals 8 --shard-days 60
+    python3 bench.py --stages merge_append,build_bundle_full --repeat 5
+    python3 bench.py --save-baseline          # record this machine's numbers
+
+Baselines live in bench-baseline.json, keyed by scale, with the probe
+times of the host that recorded them. Raw milliseconds are kept for
+reference only.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+from stub_api import StubApiServer
+
+HERE = Path(__file__).resolve().parent
+BUNDLE_SCRIPT = HERE.parents[2] / "build-seed-bundle.py"
+BASELINE_FILE = HERE / "bench-baseline.json"
+
+SCALES = {
+    "small": {"years": 60, "metals": 4, "shard_days": 7},
+    "medium": {"years": 150, "metals": 8, "shard_days": 30},
+    "large": {"years": 500, "metals": 20, "shard_days": 365},
+}
+DEFAULT_SCALE = "small"
+DEFAULT_REPEAT = 3
+REGRESSION_THRESHOLD = 1.5  # fail when normalized min time exceeds baseline × this
+NOISE_FLOOR_MS = 2.0  # ...and is also at least this much slower than expected here
+CALIBRATION_REPEAT = 7
+
+REAL_METALS = [("XAU", "Gold", 1900.0), ("XAG", "Silver", 24.0),
+               ("XPT", "Platinum", 950.0), ("XPD", "Palladium", 1100.0)]
+HOLIDAY_RATE = 0.04  # weekdays left out of the synthetic history
+CATCHUP_MAX_YEARS = 10
+
+
+def _load(name, path):
+    spec = spec_from_file_location(name, path)
+    mod = module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# ---------------------------------------------------------------------------
+# Synthetic history
+# ---------------------------------------------------------------------------
+
+def synthetic_metals(count):
+    """[(symbol, metal name, base price)] — the four real metals, then made-up ones."""
+    metals = list(REAL_METALS[:count])
+    for i in range(len(metals), count):
+        metals.append((f"X{i + 1:02d}", f"Synthetic{i + 1:02d}", 10.0 * (i + 1)))
+    return metals
+
+
+def generate_history(data_dir, years, metals, end_year, seed=42):
+    """
+    Write spot-history-YYYY.json for `years` years ending at end_year.
+
+    Weekdays only, with HOLIDAY_RATE of them left out; each metal follows
+    a seeded random walk. Returns (rates_by_date, holidays): MetalPriceAPI
+    style rates for every written day, and the skipped weekdays.
+    """
+    rng = random.Random(seed)
+    prices = {metal: base for _, metal, base in metals}
+    rates_by_date = {}
+    holidays = []
+    ordered = sorted(metals, key=lambda m: m[1])  # year files sort by (timestamp, metal)
+    for year in range(end_year - years + 1, end_year + 1):
+        entries = []
+        day = date(year, 1, 1)
+        while day.year == year:
+            if day.weekday() < 5:
+                if rng.random() < HOLIDAY_RATE:
+                    holidays.append(day)
+                else:
+                    ts = f"{day.isoformat()} 12:00:00"
+                    rates = {}
+                    for symbol, metal, _ in ordered:
+                        prices[metal] = max(0.5, prices[metal] * (1 + rng.gauss(0, 0.01)))
+                        spot = round(prices[metal], 2)
+                        rates[symbol] = 1.0 / spot
+                        entries.append({
+                            "spot": spot, "metal": metal, "source": "seed",
+                            "provider": "StakTrakr", "timestamp": ts,
+                        })
+                    rates_by_date[day.isoformat()] = rates
+            day += timedelta(days=1)
+        raw = json.dumps(entries, separators=(", ", ": "))
+        (Path(data_dir) / f"spot-history-{year}.json").write_text(raw, encoding="utf-8")
+    return rates_by_date, holidays
+
+
+def snapshot_entries(metals, when, source="hourly"):
+    ts = when.strftime("%Y-%m-%d %H:%M:00")
+    return [
+        {"spot": base, "metal": metal, "source": source, "provider": "MetalPriceAPI", "timestamp": ts}
+        for _, metal, base in sorted(metals, key=lambda m: m[1])
+    ]
+
+
+def generate_shards(seed_mod, data_dir, metals, days, end):
+    """Write `days` days of hourly and 15-min shards ending at `end` (UTC)."""
+    t = end - timedelta(days=days)
+    while t <= end:
+        entries = snapshot_entries(metals, t)
+        seed_mod.save_15min_file(data_dir, entries, t.date(), f"{t.hour:02d}", f"{t.minute:02d}")
+        if t.minute == 0:
+            seed_mod.save_hourly_file(data_dir, entries, t.date(), f"{t.hour:02d}", overwrite=True)
+        t += timedelta(minutes=15)
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+# Each stage gets the shared context, does its (untimed) setup and returns
+# the callable to time. Stages are called once per repeat.
+
+STAGES = {}
+STAGE_PROBES = {}
+
+
+def stage(name, probes=("cpu",)):
+    """Register a stage; `probes` are the calibration probes its time is normalized by."""
+    def register(fn):
+        STAGES[name] = fn
+        STAGE_PROBES[name] = probes
+        return fn
+    return register
+
+
+def _fresh_dir(ctx, name):
+    path = Path(ctx["work"]) / name
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+    return path
+
+
+def _copy_years(ctx, name, years=None):
+    path = _fresh_dir(ctx, name)
+    for src in Path(ctx["history"]).glob("spot-history-*.json"):
+        if years is None or int(src.stem[-4:]) in years:
+            shutil.copy2(src, path / src.name)
+    return path
+
+
+@stage("invert_rates")
+def _invert_rates(ctx):
+    seed, rates = ctx["seed"], list(ctx["rates_by_date"].values())
+    return lambda: [seed.invert_rates(r) for r in rates]
+
+
+@stage("transform_to_seed_format")
+def _transform(ctx):
+    seed, rates = ctx["seed"], ctx["rates_by_date"]
+    return lambda: seed.transform_to_seed_format(rates)
+
+
+@stage("find_latest_date_cold")
+def _latest_cold(ctx):
+    seed, history = ctx["seed"], ctx["history"]
+    return lambda: seed.find_latest_date(history, persist=False)
+
+
+@stage("find_latest_date_warm")
+def _latest_warm(ctx):
+    seed = ctx["seed"]
+    if "warm_dir" not in ctx:
+        ctx["warm_dir"] = _copy_years(ctx, "warm")
+        seed.find_latest_date(ctx["warm_dir"])
+    warm = ctx["warm_dir"]
+    return lambda: seed.find_latest_date(warm)
+
+
+@stage("merge_append", probes=("cpu", "fs"))
+def _merge_append(ctx):
+    """A month of new days after the end of history — the poller's common case."""
+    seed = ctx["seed"]
+    work = _copy_years(ctx, "merge-append", {ctx["end_year"]})
+    start = date(ctx["end_year"], 12, 31) + timedelta(days=1)
+    rates = {
+        (start + timedelta(days=i)).isoformat(): {sym: 1.0 / base for sym, _, base in ctx["metals"]}
+        for i in range(30)
+    }
+    new_entries = seed.transform_to_seed_format(rates)
+    return lambda: seed.merge_into_year_files(work, new_entries, analytics=False)
+
+
+@stage("merge_backfill", probes=("cpu", "fs"))
+def _merge_backfill(ctx):
+    """Fill the holiday holes of the last year — inserts into the middle."""
+    seed = ctx["seed"]
+    work = _copy_years(ctx, "merge-backfill", {ctx["end_year"]})
+    holes = [d for d in ctx["holidays"] if d.year == ctx["end_year"]]
+    rates = {d.isoformat(): {sym: 1.0 / base for sym, _, base in ctx["metals"]} for d in holes}
+    new_entries = seed.transform_to_seed_format(rates)
+    return lambda: seed.merge_into_year_files(work, new_entries, analytics=False)
+
+
+@stage("analytics_full")
+def _analytics_full(ctx):
+    """Moving averages, volatility, pair ratios and returns over the whole history."""
+    seed = ctx["seed"]
+    work = _copy_years(ctx, "analytics-full")
+    return lambda: seed.update_analytics(work)
+
+
+@stage("analytics_noon")
+def _analytics_noon(ctx):
+    """Incremental refresh after the noon seed added the last day."""
+    seed = ctx["seed"]
+    work = _copy_years(ctx, "analytics-noon")
+    seed.update_analytics(work)
+    last_day = f"{ctx['end_year']}-12-31"
+    return lambda: seed.update_analytics(work, last_day)
+
+
+def _bundle_dir(ctx):
+    if "bundle_dir" not in ctx:
+        ctx["bundle_dir"] = _copy_years(ctx, "bundle")
+    return str(ctx["bundle_dir"])
+
+
+@stage("build_bundle_full")
+def _bundle_full(ctx):
+    bundle, data_dir = ctx["bundle"], _bundle_dir(ctx)
+    return lambda: bundle.build_bundle(data_dir=data_dir, incremental=False)
+
+
+@stage("build_bundle_noop")
+def _bundle_noop(ctx):
+    bundle, data_dir = ctx["bundle"], _bundle_dir(ctx)
+    bundle.build_bundle(data_dir=data_dir, incremental=True)
+    return lambda: bundle.build_bundle(data_dir=data_dir, incremental=True)
+
+
+@stage("build_bundle_one_year")
+def _bundle_one_year(ctx):
+    """Incremental rebuild after the latest year file gained a day."""
+    bundle, data_dir = ctx["bundle"], _bundle_dir(ctx)
+    bundle.build_bundle(data_dir=data_dir, incremental=True)
+    path = Path(data_dir) / f"spot-history-{ctx['end_year']}.json"
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    extra = dict(entries[-1], timestamp=f"{ctx['end_year']}-12-31 13:00:00")
+    path.write_text(json.dumps(entries + [extra], separators=(", ", ": ")), encoding="utf-8")
+    return lambda: bundle.build_bundle(data_dir=data_dir, incremental=True)
+
+
+@stage("hourly_writer", probes=("fs",))
+def _hourly_writer(ctx):
+    seed, metals = ctx["seed"], ctx["metals"]
+    work = _fresh_dir(ctx, "hourly-writer")
+    hours = [ctx["now"] - timedelta(hours=h) for h in range(ctx["shard_days"] * 24)]
+    batches = [(h, snapshot_entries(metals, h)) for h in hours]
+
+    def run():
+        for h, entries in batches:
+            seed.save_hourly_file(work, entries, h.date(), f"{h.hour:02d}", overwrite=True)
+    return run
+
+
+@stage("15min_writer", probes=("fs",))
+def _min15_writer(ctx):
+    seed, metals = ctx["seed"], ctx["metals"]
+    work = _fresh_dir(ctx, "15min-writer")
+    slots = [ctx["now"] - timedelta(minutes=15 * i) for i in range(ctx["shard_days"] * 96)]
+    batches = [(s, snapshot_entries(metals, s)) for s in slots]
+
+    def run():
+        for s, entries in batches:
+            seed.save_15min_file(work, entries, s.date(), f"{s.hour:02d}", f"{s.minute:02d}")
+    return run
+
+
+@stage("rolling_windows")
+def _rolling(ctx):
+    """Cold rebuild of latest-24h/7d from the slot files."""
+    seed, shards = ctx["seed"], ctx["shards"]
+    for name in seed.ROLLING_WINDOWS:
+        (Path(shards) / "15min" / name).unlink(missing_ok=True)
+    return lambda: seed.update_rolling_windows(shards, ctx["now"])
+
+
+@stage("pack_closed_days", probes=("cpu", "fs"))
+def _pack(ctx):
+    seed, shards = ctx["seed"], ctx["shards"]
+    return lambda: seed.pack_closed_days(shards, ctx["now"].date(), force=True)
+
+
+@stage("pack_closed_days_noop", probes=("cpu", "fs"))
+def _pack_noop(ctx):
+    """Re-run the packer over days that are already packed and unchanged."""
+    seed, shards = ctx["seed"], ctx["shards"]
+    seed.pack_closed_days(shards, ctx["now"].date())
+    return lambda: seed.pack_closed_days(shards, ctx["now"].date())
+
+
+@stage("catchup_stub", probes=("net",))
+def _catchup(ctx):
+    """Parallel /timeframe catch-up (dry run) over up to CATCHUP_MAX_YEARS against the stub."""
+    seed = ctx["seed"]
+    if "catchup_dir" not in ctx:
+        ctx["catchup_dir"] = _copy_years(ctx, "catchup")
+    data_dir = ctx["catchup_dir"]
+    span = min(ctx["years"], CATCHUP_MAX_YEARS)
+    end = date(ctx["end_year"], 12, 31)
+    start = date(ctx["end_year"] - span + 1, 1, 1)
+    return lambda: seed.run_chunked_catchup(
+        "bench", data_dir, start, end, workers=4, rate=0, dry_run=True, log=lambda msg: None
+    )
+
+
+@stage("poll_once_stub", probes=("net", "fs"))
+def _poll_once(ctx):
+    """One full --once poll (fetch, hourly, 15-min, seed, rolling, packing) against the stub."""
+    poller = ctx["poller"]
+    work = _copy_years(ctx, "poll", {ctx["now"].year})
+    return lambda: poller.poll_once("bench", work)
+
+
+@stage("history_scan")
+def _history_scan(ctx):
+    """scan-history.py over the whole synthetic history (gaps, duplicates, spikes, ranges)."""
+    scanner = ctx["scanner"]
+    return lambda: scanner.scan(ctx["history"])
+
+# ---------------------------------------------------------------------------
+# Calibration probes
+# ---------------------------------------------------------------------------
+# Fixed workloads that measure the host, not the pipeline: stage times are
+# divided by the probes they depend on, so a slower disk or CPU moves the
+# probe and the stage together.
+
+PROBES = {}
+PROBE_NET_PARAMS = {"api_key": "bench", "base": "USD", "currencies": "XAU"}
+
+
+def probe(name):
+    def register(fn):
+        PROBES[name] = fn
+        return fn
+    return register
+
+
+@probe("cpu")
+def _probe_cpu(ctx):
+    """JSON round trip and sort of a fixed batch of entries: interpreter speed."""
+    rows = [
+        {"spot": 1000 + i * 0.01, "metal": "Gold", "source": "seed", "provider": "StakTrakr",
+         "timestamp": f"2000-01-{1 + i % 28:02d} {i % 24:02d}:00:00"}
+        for i in range(20000)
+    ]
+    return lambda: sorted(json.loads(json.dumps(rows)), key=lambda e: (e["timestamp"], -e["spot"]))
+
+
+@probe("fs")
+def _probe_fs(ctx):
+    """Atomic fsync'd writes of small files: the storage's sync latency."""
+    seed, work = ctx["seed"], _fresh_dir(ctx, "probe-fs")
+    raw = b"x" * 2048
+    return lambda: [seed.atomic_write_bytes(work / f"{i}.json", raw) for i in range(40)]
+
+
+@probe("net")
+def _probe_net(ctx):
+    """Keep-alive /latest round trips to the stub: loopback HTTP and the client stack."""
+    seed = ctx["seed"]
+    client = seed.ApiClient(base_url=ctx["stub"].base_url, usage_file=None, per_minute=0, per_month=0)
+    return lambda: [client.get("/latest", PROBE_NET_PARAMS) for _ in range(30)]
+
+
+def calibrate(ctx, names, repeat=CALIBRATION_REPEAT):
+    """{probe: min ms} for the probes `names` need."""
+    return {name: _time(PROBES[name], ctx, repeat)["min_ms"] for name in names}
+
+
+def probe_factor(calibration, probes):
+    """Geometric mean of the stage's probe times (ms)."""
+    return math.exp(statistics.fmean(math.log(calibration[p]) for p in probes))
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def scale_key(scale):
+    return f"years={scale['years']},metals={scale['metals']},shard_days={scale['shard_days']}"
+
+
+def build_context(scale, work, stub):
+    seed = _load("seed_updater", HERE / "update-seed-data.py")
+    poller = _load("spot_poller", HERE / "poller.py")
+    bundle = _load("build_seed_bundle", BUNDLE_SCRIPT)
+    scanner = _load("scan_history", HERE / "scan-history.py")
+    for mod in (seed, poller.seed):
+        mod._client = mod.ApiClient(base_url=stub.base_url, usage_file=None, per_minute=0, per_month=0)
+        mod._cache = mod.ResponseCache(directory=Path(work) / "api-cache", enabled=False)
+
+    now = datetime.utcnow().replace(second=0, microsecond=0)
+    now -= timedelta(minutes=now.minute % 15)
+    end_year = now.year - 1  # history ends last year so the poll stage merges a fresh year
+    history = Path(work) / "history"
+    history.mkdir()
+    metals = synthetic_metals(scale["metals"])
+
+    started = time.perf_counter()
+    rates_by_date, holidays = generate_history(history, scale["years"], metals, end_year)
+    shards = Path(work) / "shards"
+    generate_shards(seed, shards, metals, scale["shard_days"], now)
+    print(f"Generated {scale['years']} years × {scale['metals']} metals "
+          f"({len(rates_by_date) * scale['metals']:,} entries) and {scale['shard_days']} days of shards "
+          f"in {time.perf_counter() - started:.1f}s")
+
+    return {
+        "seed": seed, "poller": poller, "bundle": bundle, "scanner": scanner,
+        "work": work, "history": history, "shards": shards,
+        "metals": metals, "rates_by_date": rates_by_date, "holidays": holidays,
+        "years": scale["years"], "end_year": end_year,
+        "shard_days": scale["shard_days"], "now": now, "stub": stub,
+    }
+
+
+def _time(setup, ctx, repeat):
+    samples = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn = setup(ctx)
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": round(min(samples), 2), "median_ms": round(statistics.median(samples), 2)}
+
+
+def run_stage(name, ctx, repeat, calibration):
+    """Time a stage; "units" is its min time over its probes' (host-independent)."""
+    result = _time(STAGES[name], ctx, repeat)
+    result["units"] = float(f"{result['min_ms'] / probe_factor(calibration, STAGE_PROBES[name]):.4g}")
+    return result
+
+
+def compare(results, baseline, calibration, threshold):
+    """
+    Return [(stage, current_ms, expected_ms, ratio)] for regressed stages.
+    expected_ms is the baseline's units on this host's probes; ratio compares units.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("units"):
+            continue
+        ratio = result["units"] / base["units"]
+        expected = base["units"] * probe_factor(calibration, STAGE_PROBES[name])
+        if ratio > threshold and result["min_ms"] - expected > NOISE_FLOOR_MS:
+            regressions.append((name, result["min_ms"], expected, ratio))
+    return regressions
+
+
+def load_baselines(path):
+    """{scale key: {"calibration": {probe: ms}, "stages": {stage: result}}}"""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the spot data pipeline on synthetic history.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default=DEFAULT_SCALE,
+                        help=f"Preset size (default: {DEFAULT_SCALE}); --years/--metals/--shard-days override it.")
+    parser.add_argument("--years", type=int, help="Years of daily history (60–500).")
+    parser.add_argument("--metals", type=int, help="Metals per day (4–20).")
+    parser.add_argument("--shard-days", type=int, help="Days of hourly + 15-min shards.")
+    parser.add_argument("--stages", help=f"Comma-separated subset of: {', '.join(STAGES)}.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per stage; the minimum is compared (default: {DEFAULT_REPEAT}).")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline file (default: bench-baseline.json).")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline for this scale.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help=f"Fail when a stage's min time exceeds baseline × this (default: {REGRESSION_THRESHOLD}).")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON.")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated temp data dir.")
+    args = parser.parse_args()
+
+    scale = dict(SCALES[args.scale])
+    for key in ("years", "metals", "shard_days"):
+        if getattr(args, key) is not None:
+            scale[key] = getattr(args, key)
+    if not 1 <= scale["years"] <= 500:
+        parser.error("--years must be between 1 and 500")
+    if not 1 <= scale["metals"] <= 20:
+        parser.error("--metals must be between 1 and 20")
+    args.scale_params = scale
+
+    args.stage_names = list(STAGES)
+    if args.stages:
+        args.stage_names = [s.strip() for s in args.stages.split(",") if s.strip()]
+        unknown = [s for s in args.stage_names if s not in STAGES]
+        if unknown:
+            parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    scale = args.scale_params
+    key = scale_key(scale)
+    work = tempfile.mkdtemp(prefix="spot-bench-")
+    stub = StubApiServer().start()
+    try:
+        ctx = build_context(scale, work, stub)
+        if ctx["scanner"].np is None and "history_scan" in args.stage_names:
+            print("Skipping history_scan: NumPy is not installed.")
+            args.stage_names.remove("history_scan")
+        needed = sorted({p for name in args.stage_names for p in STAGE_PROBES[name]})
+        calibration = calibrate(ctx, needed)
+        print("Calibration: " + ", ".join(f"{name} {ms:.2f}ms" for name, ms in calibration.items()))
+        print(f"Scale {key}, {args.repeat} run(s) per stage\n")
+        results = {}
+        for name in args.stage_names:
+            results[name] = run_stage(name, ctx, args.repeat, calibration)
+            print(f"  {name:<24} min {results[name]['min_ms']:>10.2f}ms   "
+                  f"median {results[name]['median_ms']:>10.2f}ms   "
+                  f"{results[name]['units']:>8.3f}u ({'+'.join(STAGE_PROBES[name])})")
+    finally:
+        stub.stop()
+        if args.keep:
+            print(f"\nData kept in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps({"scale": key, "calibration": calibration, "results": results}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    baselines = load_baselines(args.baseline)
+    if args.save_baseline:
+        saved = baselines.get(key, {})
+        stages = dict(saved.get("stages", {}), **results)
+        baselines[key] = {
+            "calibration": dict(sorted(dict(saved.get("calibration", {}), **calibration).items())),
+            "stages": dict(sorted(stages.items())),
+        }
+        Path(args.baseline).write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline for {key} saved to {args.baseline}")
+        return
+
+    baseline = baselines.get(key, {}).get("stages")
+    if not baseline:
+        print(f"\nNo baseline for {key} — run with --save-baseline to record one.")
+        return
+    regressions = compare(results, baseline, calibration, args.threshold)
+    if regressions:
+        print(f"\nREGRESSED (> {args.threshold:g}× baseline, normalized by the calibration probes):")
+        for name, current, expected, ratio in regressions:
+            print(f"  {name}: {current:.2f}ms vs {expected:.2f}ms expected on this host ({ratio:.2f}×)")
+        sys.exit(1)
+    print(f"\nNo regressions (threshold {args.threshold:g}× baseline, normalized by the calibration probes).")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,61 @@ StakTrakr Seed Data Poller
 =============================
 Long-running script (designed for Docker) that:
   1. On startup: backfills any gap since the last seed data entry
-  2. Every hour: polls /latest and writes to data/hourly/YYYY/MM/DD/HH.json
+  2. On every aligned slot (hourly by default, --cadence 15m for quarter-hours):
+     polls /latest and writes to data/hourly/YYYY/MM/DD/HH.json
   3. At noon EST (hour >= 12): also writes the daily seed entry to spot-history-YYYY.json
 
 Writes directly to the mounted data/ folder. User commits manually.
 """
 
-import sys
 import time
+
+_STARTED = time.perf_counter()  # before anything else, for the --once startup report
+
+import argparse
+import os
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Import shared utilities from the backfill script
-from importlib.util import spec_from_file_location, module_from_spec
+from importlib.util import LazyLoader, find_spec, spec_from_file_location, module_from_spec
+
+
+def _lazy_import(name):
+    """Module object whose real import runs on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = find_spec(name)
+    spec.loader = LazyLoader(spec.loader)
+    mod = module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# Only the long-running loop needs asyncio; --once never pays for importing it
+asyncio = _lazy_import("asyncio")
+
 
 def _import_seed_updater():
-    """Import update-seed-data.py as a module (handles the hyphenated filename)."""
+    """
+    Import update-seed-data.py as the module `seed_updater` (handles the
+    hyphenated filename). Registered in sys.modules so later imports reuse
+    it; SourceFileLoader keeps its bytecode in __pycache__, so only the
+    first run after a change pays for compiling it.
+    """
+    if "seed_updater" in sys.modules:
+        return sys.modules["seed_updater"]
     script_path = Path(__file__).parent / "update-seed-data.py"
     spec = spec_from_file_location("seed_updater", script_path)
     mod = module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    sys.modules["seed_updater"] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules["seed_updater"]
+        raise
     return mod
 
 seed = _import_seed_updater()
@@ -32,7 +67,8 @@ seed = _import_seed_updater()
 # Configuration
 # ---------------------------------------------------------------------------
 
-POLL_INTERVAL_SECONDS = 3600  # 1 hour
+# Wall-clock-aligned cadence for the polling loop: 15m, 1h, ... (must divide a day)
+POLL_CADENCE = os.getenv("POLL_CADENCE", "1h")
 
 # ---------------------------------------------------------------------------
 # Catchup
@@ -48,35 +84,25 @@ def run_catchup(api_key, data_dir):
     yesterday = datetime.now().date() - timedelta(days=1)
     start = latest + timedelta(days=1)
 
-    if start > yesterday:
+    checkpoint = seed.load_checkpoint(data_dir)
+    if start > yesterday and not checkpoint:
         log(f"Catchup: already current (latest: {latest}).")
         return
 
-    days = (yesterday - start).days + 1
-    log(f"Catchup: backfilling {start} → {yesterday} ({days} days)...")
-
-    chunk_start = start
-    all_entries = []
-    while chunk_start <= yesterday:
-        chunk_end = min(chunk_start + timedelta(days=seed.MAX_DAYS_PER_REQUEST - 1), yesterday)
-        log(f"  Fetching {chunk_start} to {chunk_end}...")
-        try:
-            data = seed.fetch_timeframe(api_key, chunk_start, chunk_end)
-            rates = data.get("rates", {})
-            entries = seed.transform_to_seed_format(rates)
-            all_entries.extend(entries)
-            log(f"  OK — {len(rates)} days returned.")
-        except Exception as e:
-            log(f"  Error during catchup: {e}")
-            return
-        chunk_start = chunk_end + timedelta(days=1)
-
-    if all_entries:
-        results = seed.merge_into_year_files(data_dir, all_entries)
-        for year, count in sorted(results.items()):
-            if count > 0:
-                log(f"  Catchup wrote +{count} entries to spot-history-{year}.json")
+    if checkpoint:
+        log(f"Catchup: resuming interrupted run {checkpoint['start']} → {checkpoint['end']}...")
     else:
+        days = (yesterday - start).days + 1
+        log(f"Catchup: backfilling {start} → {yesterday} ({days} days)...")
+
+    with seed.PROFILER.phase("catchup"):
+        outcome = seed.run_chunked_catchup(api_key, data_dir, start, yesterday, log=log)
+    for year, count in sorted(outcome["results"].items()):
+        if count > 0:
+            log(f"  Catchup wrote +{count} entries to spot-history-{year}.json")
+    if outcome["failed"]:
+        log(f"  Catchup: {len(outcome['failed'])} chunk(s) failed — will resume on next start.")
+    elif not outcome["days"]:
         log("  Catchup: no data returned (weekends/holidays?).")
 
 # ---------------------------------------------------------------------------
@@ -84,74 +110,153 @@ def run_catchup(api_key, data_dir):
 # ---------------------------------------------------------------------------
 
 NOON_HOUR = 17  # noon EST = 17:00 UTC — market reference price for daily seed
+# Closed days re-checked for packing on each poll (covers backfilled stragglers)
+INTRADAY_PACK_LOOKBACK_DAYS = 2
 
 # ---------------------------------------------------------------------------
 # 24-hour backfill (fills gaps from missed polls)
 # ---------------------------------------------------------------------------
 
-def backfill_recent_hours(api_key, data_dir, hours_back=24):
+BACKFILL_LOOKBACK = "24h"
+# Missing days this close together share one /timeframe request — a request
+# costs one unit of quota however many days it spans, so bridging a weekend
+# is cheaper than splitting around it.
+BACKFILL_MERGE_GAP_DAYS = 2
+
+
+def parse_lookback(value):
+    """Parse a lookback like "24h", "7d", "2w" (or bare hours, "48") into hours."""
+    text = str(value).strip().lower()
+    units = {"h": 1, "d": 24, "w": 24 * 7}
+    if text and text[-1] in units:
+        amount, factor = text[:-1], units[text[-1]]
+    else:
+        amount, factor = text, 1
+    hours = int(amount) * factor
+    if hours <= 0:
+        raise ValueError(f"lookback must be positive: {value!r}")
+    return hours
+
+
+def find_missing_hours(data_dir, now, hours_back):
+    """
+    Return [(date, "HH"), ...] for hourly files missing in the last hours_back
+    hours (excluding the current hour), oldest first.
+
+    Lists each day directory once instead of probing every path.
+    """
+    slots_by_day = {}
+    for h in range(hours_back, 0, -1):
+        target = now - timedelta(hours=h)
+        slots_by_day.setdefault(target.date(), []).append(f"{target.hour:02d}")
+
+    missing = []
+    for day, hours in slots_by_day.items():
+        day_dir = (
+            Path(data_dir) / "hourly"
+            / str(day.year)
+            / f"{day.month:02d}"
+            / f"{day.day:02d}"
+        )
+        try:
+            present = {name[:-5] for name in os.listdir(day_dir) if name.endswith(".json")}
+        except FileNotFoundError:
+            present = set()
+        missing.extend((day, hour) for hour in hours if hour not in present)
+    return missing
+
+
+def plan_backfill_requests(missing, merge_gap_days=BACKFILL_MERGE_GAP_DAYS):
+    """
+    Group missing slots into the fewest /timeframe date ranges.
+
+    Days with missing hours are joined into one range when they are at most
+    merge_gap_days apart; ranges never exceed MAX_DAYS_PER_REQUEST.
+    Returns [(start_date, end_date, [(date, "HH"), ...]), ...].
+    """
+    by_day = {}
+    for day, hour in missing:
+        by_day.setdefault(day, []).append((day, hour))
+
+    plan = []
+    for day in sorted(by_day):
+        if plan:
+            start, end, slots = plan[-1]
+            if (day - end).days <= merge_gap_days + 1 and (day - start).days < seed.MAX_DAYS_PER_REQUEST:
+                plan[-1] = (start, day, slots + by_day[day])
+                continue
+        plan.append((day, day, list(by_day[day])))
+    return plan
+
+
+def format_backfill_plan(plan, hours_back):
+    """Human-readable dry-run report of planned backfill requests."""
+    slots = sum(len(p[2]) for p in plan)
+    lines = [f"Backfill plan: {slots} missing hourly files in the last {hours_back}h → "
+             f"{len(plan)} /timeframe request{'s' if len(plan) != 1 else ''} "
+             f"({len(plan)} unit{'s' if len(plan) != 1 else ''} of API quota)"]
+    for start, end, range_slots in plan:
+        days = (end - start).days + 1
+        lines.append(f"  {start} → {end} ({days} day{'s' if days != 1 else ''}, "
+                     f"{len(range_slots)} slot{'s' if len(range_slots) != 1 else ''})")
+    return "\n".join(lines)
+
+
+def backfill_recent_hours(api_key, data_dir, hours_back=24, dry_run=False, deadline=None):
     """
     Backfill missing hourly files from the last N hours.
     Uses /timeframe endpoint for accurate historical prices.
     Called in --once mode (GitHub Actions) to ensure no 404s.
+
+    /timeframe only has daily granularity, so every backfilled hour of a
+    day carries that day's rate. With dry_run=True the plan is logged and
+    nothing is fetched or written. Past `deadline` (a time.perf_counter()
+    value) no further requests are issued; the rest waits for the next run.
     """
     now = datetime.utcnow()
-    missing = []
-
-    # Scan for missing hourly files
-    for h in range(1, hours_back + 1):
-        target = now - timedelta(hours=h)
-        hour_str = f"{target.hour:02d}"
-        target_date = target.date()
-        hourly_dir = (
-            Path(data_dir) / "hourly"
-            / str(target_date.year)
-            / f"{target_date.month:02d}"
-            / f"{target_date.day:02d}"
-        )
-        path = hourly_dir / f"{hour_str}.json"
-        if not path.exists():
-            missing.append((target_date, hour_str))
+    with seed.PROFILER.phase("hour_scan"):
+        missing = find_missing_hours(data_dir, now, hours_back)
 
     if not missing:
-        log("Backfill: no gaps in last 24 hours.")
+        log(f"Backfill: no gaps in last {hours_back} hours.")
         return
 
-    log(f"Backfill: {len(missing)} missing hourly files found.")
-
-    # Group missing by date for efficient /timeframe calls
-    dates_needed = sorted(set(d for d, _ in missing))
-    start_date = dates_needed[0]
-    end_date = dates_needed[-1]
-
-    try:
-        data = seed.fetch_timeframe(api_key, start_date, end_date)
-        rates_by_date = data.get("rates", {})
-    except Exception as e:
-        log(f"Backfill: /timeframe fetch failed: {e}")
+    plan = plan_backfill_requests(missing)
+    log(format_backfill_plan(plan, hours_back))
+    if dry_run:
         return
 
     filled = 0
-    for target_date, hour_str in missing:
-        date_str = target_date.strftime("%Y-%m-%d")
-        if date_str not in rates_by_date:
+    for i, (start_date, end_date, slots) in enumerate(plan):
+        if deadline is not None and time.perf_counter() > deadline:
+            log(f"Backfill: run budget spent — deferring {len(plan) - i} request(s) to the next run.")
+            break
+        try:
+            data = seed.fetch_timeframe(api_key, start_date, end_date)
+            rates_by_date = data.get("rates", {})
+        except Exception as e:
+            log(f"Backfill: /timeframe {start_date} → {end_date} failed: {e}")
             continue
-        inverted = seed.invert_rates(rates_by_date[date_str])
-        entries = []
-        for symbol in ["XAU", "XAG", "XPT", "XPD"]:
-            if symbol not in inverted:
+
+        for target_date, hour_str in slots:
+            date_str = target_date.strftime("%Y-%m-%d")
+            if date_str not in rates_by_date:
                 continue
-            entries.append({
-                "spot": inverted[symbol],
-                "metal": seed.SYMBOL_TO_METAL[symbol],
-                "source": "hourly",
-                "provider": "StakTrakr",
-                "timestamp": f"{date_str} {hour_str}:00:00",
-            })
-        if entries:
-            written = seed.save_hourly_file(data_dir, entries, target_date, hour_str)
-            if written:
-                filled += 1
+            inverted = seed.invert_rates(rates_by_date[date_str])
+            entries = []
+            for symbol in ["XAU", "XAG", "XPT", "XPD"]:
+                if symbol not in inverted:
+                    continue
+                # /timeframe is only asked of the primary provider; stamp it
+                # like a live shard it answered
+                entries.append(seed.SpotEntry(
+                    inverted[symbol], seed.SYMBOL_TO_METAL[symbol], "hourly", seed.PRIMARY_PROVIDER_NAME,
+                    f"{date_str} {hour_str}:00:00",
+                ))
+            if entries:
+                written = seed.save_hourly_file(data_dir, entries, target_date, hour_str)
+                if written:
+                    filled += 1
 
     log(f"Backfill: filled {filled} of {len(missing)} missing hourly files.")
 
@@ -162,11 +267,7 @@ def write_hourly(entries, data_dir, hour_str, date_obj):
     Always overwrites — poller runs every 15 min for freshness.
     """
     # Re-tag entries with "hourly" source for the sharded files
-    hourly_entries = []
-    for e in entries:
-        hourly_entry = dict(e)
-        hourly_entry["source"] = "hourly"
-        hourly_entries.append(hourly_entry)
+    hourly_entries = [e.replace(source="hourly") for e in entries]
 
     seed.save_hourly_file(data_dir, hourly_entries, date_obj, hour_str, overwrite=True)
     log(f"Hourly: wrote {len(hourly_entries)} entries → "
@@ -176,42 +277,52 @@ def write_hourly(entries, data_dir, hour_str, date_obj):
 # Hourly poll
 # ---------------------------------------------------------------------------
 
-def poll_once(api_key, data_dir):
+def fetch_snapshot(api_key, now):
     """
-    Poll /latest prices every hour.
-    - Always writes to the hourly sharded tree (data/hourly/YYYY/MM/DD/HH.json)
-    - At noon EST (hour >= 12), also writes/overwrites the daily seed file
+    Fetch /latest and build the entries for one poll at `now` (UTC).
+    Returns a snapshot dict, or None if the API gave nothing usable.
     """
-    now = datetime.utcnow()  # UTC for timezone-neutral hourly file paths
-    today = now.date()
-    hour = now.hour
-    today_str = today.strftime("%Y-%m-%d")
-    hour_str = f"{hour:02d}"
+    today_str = now.strftime("%Y-%m-%d")
+    hour_str = f"{now.hour:02d}"
+    minute_str = f"{now.minute:02d}"
 
     log(f"Poll: fetching latest prices for {today_str} (hour {hour_str})...")
     try:
-        data = seed.fetch_latest(api_key)
+        provider, rates = seed.fetch_latest_hedged(api_key)
     except Exception as e:
         log(f"Poll error: {e}")
-        return
-
-    rates = data.get("rates", {})
-    if not rates:
-        log("Poll: no rates in response.")
-        return
+        return None
 
     entries = seed.transform_latest_to_seed(rates, today_str)
     if not entries:
         log("Poll: no valid entries after transformation.")
-        return
+        return None
 
     # Fix timestamps for hourly files — use actual poll time (not floored to hour)
+    # and record which provider actually answered
+    timestamp = f"{today_str} {hour_str}:{minute_str}:00"
+    hourly_entries = [e.replace(timestamp=timestamp, provider=provider) for e in entries]
+
+    if provider != seed.PRIMARY_PROVIDER_NAME:
+        log(f"Poll: answered by backup provider {provider}")
+    return {
+        "now": now,
+        "provider": provider,
+        "entries": entries,
+        "hourly_entries": hourly_entries,
+        "fx": seed.extract_fx_rates(rates),
+    }
+
+
+def write_snapshot(data_dir, snapshot):
+    """Write one snapshot: hourly file, 15-min slot and (from noon EST) the daily seed."""
+    now = snapshot["now"]
+    today = now.date()
+    today_str = today.strftime("%Y-%m-%d")
+    hour_str = f"{now.hour:02d}"
     minute_str = f"{now.minute:02d}"
-    hourly_entries = []
-    for e in entries:
-        he = dict(e)
-        he["timestamp"] = f"{today_str} {hour_str}:{minute_str}:00"
-        hourly_entries.append(he)
+    entries = snapshot["entries"]
+    hourly_entries = snapshot["hourly_entries"]
 
     # Always write hourly data (with actual-hour timestamps)
     write_hourly(hourly_entries, data_dir, hour_str, today)
@@ -225,19 +336,285 @@ def poll_once(api_key, data_dir):
         log(f"15min: {hour_str}{minute_str}.json already exists — skipped.")
 
     # At noon EST (or later if missed), write daily seed
-    if hour >= NOON_HOUR:
-        year_data = seed.load_year_file(data_dir, str(today.year))
-        existing_dates = {e["timestamp"][:10] for e in year_data}
-
-        if today_str not in existing_dates:
+    if now.hour >= NOON_HOUR:
+        if not seed.seed_date_present(data_dir, today_str):
             results = seed.merge_into_year_files(data_dir, entries)
             for year, count in sorted(results.items()):
                 if count > 0:
                     log(f"Seed: wrote daily prices for {today_str} "
                         f"(noon+ window, +{count} entries to spot-history-{year}.json)")
+            if snapshot.get("fx") and seed.merge_fx_history(data_dir, {today_str: snapshot["fx"]}).get(today_str[:4]):
+                log(f"Seed: wrote {len(snapshot['fx'])} FX rates for {today_str} → {seed.FX_FILE_PREFIX}{today.year}.json")
         else:
             log(f"Seed: daily data for {today_str} already present — skipping.")
 
+
+def run_post_write_jobs(data_dir, now, pack=True):
+    """
+    Derived outputs that only read what write_snapshot produced. pack=False
+    skips the closed-day packing, which any later run picks up again.
+    """
+    # Rolling consolidated windows (one client request instead of 96)
+    counts = seed.update_rolling_windows(data_dir, now)
+    log("15min: rolling windows " + ", ".join(f"{name} ({n} slots)" for name, n in counts.items()))
+
+    # Pack yesterday's shards once the UTC day closes (cheap no-op otherwise)
+    if not pack:
+        log("Pack: run budget spent — deferred to the next run.")
+    else:
+        for tier, packed in seed.pack_closed_days(data_dir, now.date(), lookback_days=INTRADAY_PACK_LOOKBACK_DAYS).items():
+            if packed["days"]:
+                log(f"Pack: {tier} — packed {packed['days']} closed day(s), "
+                    f"refreshed {packed['months']} monthly OHLC rollup(s)")
+
+    # Bound how far the published year files trail their journals
+    for year, count in seed.compact_stale_journals(data_dir, now).items():
+        log(f"Journal: folded {count} entries older than {seed.JOURNAL_MAX_LAG_HOURS:g}h "
+            f"into spot-history-{year}.json")
+
+    # One fetch tells clients which shards changed since they last looked
+    listed = seed.save_etag_manifest(data_dir, polled=now)
+    log(f"ETags: {seed.ETAG_MANIFEST_FILENAME} lists {listed} published files")
+
+
+def poll_once(api_key, data_dir, deadline=None):
+    """
+    Poll /latest prices once.
+    - Always writes to the hourly sharded tree (data/hourly/YYYY/MM/DD/HH.json)
+    - At noon EST (hour >= 12), also writes/overwrites the daily seed file
+    - Past `deadline` (time.perf_counter()), optional post-write work is skipped
+    """
+    now = datetime.utcnow()  # UTC for timezone-neutral hourly file paths
+    with seed.METRICS.timer("spot_phase_duration_seconds", phase="fetch"), seed.PROFILER.phase("fetch"):
+        snapshot = fetch_snapshot(api_key, now)
+    if snapshot is None:
+        return
+    with seed.METRICS.timer("spot_phase_duration_seconds", phase="write"), seed.PROFILER.phase("write"):
+        write_snapshot(data_dir, snapshot)
+    with seed.METRICS.timer("spot_phase_duration_seconds", phase="post_write"), seed.PROFILER.phase("post_write"):
+        run_post_write_jobs(data_dir, now, pack=deadline is None or time.perf_counter() <= deadline)
+
+# ---------------------------------------------------------------------------
+# Aligned scheduler
+# ---------------------------------------------------------------------------
+
+def parse_cadence(value):
+    """Parse a poll cadence like '15m', '1h' or '900' (seconds) into seconds."""
+    text = str(value).strip().lower()
+    units = {"s": 1, "m": 60, "h": 3600}
+    if text[-1:] in units:
+        number, unit = text[:-1], units[text[-1]]
+    else:
+        number, unit = text, 1
+    try:
+        seconds = int(number) * unit
+    except ValueError:
+        raise ValueError(f"invalid cadence {value!r} (use e.g. 15m, 1h)")
+    if seconds <= 0 or 86400 % seconds:
+        raise ValueError(f"cadence {value!r} must divide a day evenly (e.g. 5m, 15m, 1h)")
+    return seconds
+
+
+class AlignedScheduler:
+    """
+    Fire a coroutine on wall-clock-aligned boundaries (:00/:15/:30/:45 for 15m).
+
+    Each wake-up is computed from the wall clock rather than by sleeping a
+    fixed interval, so a slow poll never shifts later slots. The job is
+    started as its own task and not awaited, so a slow disk or API can't
+    push the next slot back. If the loop itself wakes a full cadence late
+    (host suspended, event loop blocked), the skipped slots are logged
+    and counted rather than fired in a burst.
+    """
+
+    def __init__(self, cadence, clock=time.time):
+        self.cadence = cadence
+        self.clock = clock
+        self.stats = {"fired": 0, "missed": 0, "max_lag_seconds": 0.0}
+        self._tasks = set()
+
+    def next_boundary(self, t):
+        return (int(t // self.cadence) + 1) * self.cadence
+
+    async def run(self, job):
+        slot = self.next_boundary(self.clock())
+        while True:
+            delay = slot - self.clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue  # re-check: sleep may return early against the wall clock
+            lag = -delay
+            if lag >= self.cadence:
+                skipped = int(lag // self.cadence)
+                self.stats["missed"] += skipped
+                seed.METRICS.inc("spot_scheduler_missed_slots_total", skipped)
+                log(f"Scheduler: missed {skipped} slot(s) — woke {lag:.0f}s after "
+                    f"{datetime.utcfromtimestamp(slot):%H:%M} UTC")
+                slot += skipped * self.cadence
+                lag -= skipped * self.cadence
+            self.stats["fired"] += 1
+            self.stats["max_lag_seconds"] = max(self.stats["max_lag_seconds"], round(lag, 3))
+            seed.METRICS.inc("spot_scheduler_slots_total")
+            seed.METRICS.observe("spot_scheduler_wakeup_lag_seconds", lag)
+            task = asyncio.create_task(job(datetime.utcfromtimestamp(slot)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            slot += self.cadence
+
+
+class PollPipeline:
+    """
+    Fetch → write → post-write.
+
+    Fetches run in a thread per slot. Writes go through a single queue so
+    snapshots land in slot order. Post-write jobs (rolling windows, packing,
+    journal compaction, the ETag manifest) run on the writer's task once
+    the queue is drained, so they never touch the year files or manifests
+    while a write is in flight. They coalesce: snapshots queued while they
+    run are all written before the next run covers them.
+    """
+
+    def __init__(self, api_key, data_dir, scheduler=None):
+        self.api_key = api_key
+        self.data_dir = data_dir
+        self.scheduler = scheduler
+        self._writes = asyncio.Queue()
+
+    async def on_slot(self, slot):
+        # The slot time, not the (slightly later) wake-up time, names the files
+        with seed.METRICS.timer("spot_phase_duration_seconds", phase="fetch"):
+            snapshot = await asyncio.to_thread(fetch_snapshot, self.api_key, slot)
+        if snapshot is not None:
+            await self._writes.put(snapshot)
+
+    async def writer(self):
+        while True:
+            snapshot = await self._writes.get()
+            written = None
+            while True:
+                try:
+                    with seed.METRICS.timer("spot_phase_duration_seconds", phase="write"):
+                        await asyncio.to_thread(write_snapshot, self.data_dir, snapshot)
+                except Exception as e:
+                    log(f"Write error: {e}")
+                else:
+                    written = snapshot["now"]
+                if self._writes.empty():
+                    break
+                snapshot = self._writes.get_nowait()
+            if written is not None:
+                await self.post_write(written)
+
+    async def post_write(self, now):
+        try:
+            with seed.METRICS.timer("spot_phase_duration_seconds", phase="post_write"):
+                await asyncio.to_thread(run_post_write_jobs, self.data_dir, now)
+            # The monthly API count, once per cycle: a stopped container loses at most this cycle's
+            await asyncio.to_thread(seed.get_client().flush_usage)
+        except Exception as e:
+            log(f"Post-write error: {e}")
+        publish_metrics()
+        log_fetch_stats()
+        if self.scheduler:
+            stats = self.scheduler.stats
+            log(f"Scheduler: {stats['fired']} slot(s) fired, {stats['missed']} missed, "
+                f"max wake-up lag {stats['max_lag_seconds']:.2f}s")
+
+
+async def run_scheduled(api_key, data_dir, cadence):
+    scheduler = AlignedScheduler(cadence)
+    pipeline = PollPipeline(api_key, data_dir, scheduler)
+    first = datetime.utcfromtimestamp(scheduler.next_boundary(time.time()))
+    log(f"Entering polling loop (every {cadence // 60} min, aligned; first slot {first:%H:%M} UTC)...")
+    await asyncio.gather(
+        scheduler.run(pipeline.on_slot),
+        pipeline.writer(),
+    )
+
+# ---------------------------------------------------------------------------
+# Single-shot run (GitHub Actions)
+# ---------------------------------------------------------------------------
+
+# Wall-clock budget for --once; past it the run stops issuing backfill
+# requests and defers closed-day packing so the job finishes on time.
+ONCE_BUDGET_SECONDS = float(os.getenv("ONCE_BUDGET_SECONDS", "120"))
+
+
+def slot_already_polled(data_dir, now, slot_minutes=15):
+    """
+    True if a 15-min file already exists for the slot containing `now`
+    (one listdir of today's 15min directory). Lets a re-triggered --once
+    run exit before importing the HTTP stack or spending quota.
+    """
+    slot_start = now.replace(minute=now.minute - now.minute % slot_minutes, second=0, microsecond=0)
+    return bool(seed._list_15min_slots(data_dir, slot_start - timedelta(seconds=1), now))
+
+
+def process_age_seconds():
+    """
+    Seconds since the interpreter process started (Linux /proc), or None.
+    Covers what perf_counter can't see: exec, site and the first imports.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # starttime (field 22) is in clock ticks after boot; comm may contain spaces
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+
+
+def format_once_timing(timings, budget):
+    """One-line timing report for a --once run."""
+    parts = [f"{name} {seconds:.2f}s" for name, seconds in timings.items() if name != "total"]
+    total = timings["total"]
+    over = " — OVER BUDGET" if total > budget else ""
+    return f"Timing: {', '.join(parts)}; total {total:.2f}s of {budget:.0f}s budget{over}"
+
+
+def run_once(api_key, data_dir, args):
+    """Backfill recent hours and poll once, within args.budget seconds."""
+    # Interpreter boot before this module's first line ran (exec, site, stdlib)
+    age = process_age_seconds()
+    boot = max(0.0, age - (time.perf_counter() - _STARTED)) if age is not None else 0.0
+    deadline = _STARTED - boot + args.budget
+    timings = {"startup": boot + time.perf_counter() - _STARTED}
+    seed.METRICS.set("spot_once_startup_seconds", timings["startup"])
+
+    now = datetime.utcnow()
+    if not args.force and slot_already_polled(data_dir, now) \
+            and not find_missing_hours(data_dir, now, args.backfill_hours):
+        timings["total"] = boot + time.perf_counter() - _STARTED
+        log(f"Up to date: slot {now:%H}:{now.minute - now.minute % 15:02d} UTC already polled "
+            f"and no hourly gaps — nothing to do (--force to poll anyway).")
+        log(format_once_timing(timings, args.budget))
+        return False
+
+    if args.profile:
+        seed.PROFILER.enable()
+    try:
+        # First backfill any missing hours in the lookback window (prevents 404s)
+        start = time.perf_counter()
+        with seed.PROFILER.phase("backfill"):
+            backfill_recent_hours(api_key, data_dir, hours_back=args.backfill_hours, deadline=deadline)
+        timings["backfill"] = time.perf_counter() - start
+        start = time.perf_counter()
+        with seed.PROFILER.phase("poll"):
+            poll_once(api_key, data_dir, deadline=deadline)
+        timings["poll"] = time.perf_counter() - start
+    finally:
+        if args.profile:
+            report = seed.PROFILER.report()
+            seed.PROFILER.write(args.profile)
+            log(f"Profile ({report['total_wall_ms']:.0f}ms total) → {args.profile}\n"
+                + seed.format_profile_summary(report))
+    timings["total"] = boot + time.perf_counter() - _STARTED
+    seed.METRICS.set("spot_once_duration_seconds", timings["total"])
+    log(format_once_timing(timings, args.budget))
+    return True
+
 # ---------------------------------------------------------------------------
 # Main loop
 # ---------------------------------------------------------------------------
@@ -248,16 +625,122 @@ def log(msg):
     print(f"[{ts}] {msg}", flush=True)
 
 
+def publish_metrics():
+    """Swap in the Prometheus textfile (if SPOT_METRICS_FILE is set)."""
+    if seed.METRICS_FILE:
+        try:
+            seed.METRICS.write_textfile(seed.METRICS_FILE)
+        except OSError as e:
+            log(f"Metrics: could not write {seed.METRICS_FILE}: {e}")
+
+
+def log_fetch_stats():
+    """API client stats, plus cache and provider lines when they have something to say."""
+    log(seed.format_client_stats(seed.get_client().stats()))
+    cache = seed.get_response_cache().stats()
+    if cache["hits"] or cache["misses"]:
+        log(seed.format_cache_stats(cache))
+    hedge = seed._hedged.stats() if seed._hedged else None
+    if hedge and len(hedge["providers"]) > 1:
+        log(seed.format_hedge_stats(hedge))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="StakTrakr spot price poller.")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Backfill recent hours, poll once and exit (GitHub Actions mode).",
+    )
+    parser.add_argument(
+        "--backfill",
+        default=BACKFILL_LOOKBACK,
+        metavar="LOOKBACK",
+        help=f"Hourly backfill lookback for --once, e.g. 24h, 7d, 2w (default: {BACKFILL_LOOKBACK}).",
+    )
+    parser.add_argument(
+        "--cadence",
+        default=POLL_CADENCE,
+        help=f"Polling loop cadence, aligned to the wall clock, e.g. 15m or 1h (default: {POLL_CADENCE}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk /timeframe response cache for the backfill.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="poller-profile.json",
+        default=None,
+        metavar="REPORT",
+        help="With --once: profile each phase (cProfile + tracemalloc) and write a JSON "
+             "report (default: poller-profile.json).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --once: poll even if the current 15-min slot is already on disk.",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="With --once: wall-clock budget; past it backfill requests and closed-day "
+             f"packing are deferred to the next run (default: {ONCE_BUDGET_SECONDS:.0f}).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --once: report the planned backfill requests and quota use, then exit.",
+    )
+    args = parser.parse_args()
+    try:
+        args.backfill_hours = parse_lookback(args.backfill)
+    except ValueError as e:
+        parser.error(f"--backfill: {e}")
+    try:
+        args.cadence_seconds = parse_cadence(args.cadence)
+    except ValueError as e:
+        parser.error(f"--cadence: {e}")
+    if args.profile and not args.once:
+        parser.error("--profile needs --once (the polling loop never finishes a report)")
+    for flag, given in (("--dry-run", args.dry_run), ("--force", args.force), ("--budget", args.budget is not None)):
+        if given and not args.once:
+            parser.error(f"{flag} needs --once")
+    if args.budget is None:
+        args.budget = ONCE_BUDGET_SECONDS
+    return args
+
+
 def main():
-    once = "--once" in sys.argv
+    args = parse_args()
+    once = args.once
+    if args.no_cache:
+        seed.get_response_cache().enabled = False
 
     log("StakTrakr Seed Data Poller starting...")
     if once:
         log("Running in single-shot mode (--once).")
 
+    if once and args.dry_run:
+        data_dir = seed.resolve_data_dir()
+        log(f"Data directory: {data_dir}")
+        backfill_recent_hours(None, data_dir, hours_back=args.backfill_hours, dry_run=True)
+        log("Done (dry run — nothing fetched or written).")
+        return
+
     api_key = seed.load_config()
     data_dir = seed.resolve_data_dir()
 
+    if seed.METRICS_FILE:
+        # Keep last-success times for tiers this process hasn't written yet
+        seed.METRICS.restore_gauges(seed.METRICS_FILE, "spot_last_success_timestamp_seconds")
+    if seed.METRICS_PORT:
+        seed.METRICS.serve(seed.METRICS_PORT)
+        log(f"Metrics: serving http://127.0.0.1:{seed.METRICS_PORT}/metrics")
+
     log(f"Data directory: {data_dir}")
     if not data_dir.exists():
         log(f"Error: Data directory {data_dir} does not exist. Is the volume mounted?")
@@ -265,21 +748,22 @@ def main():
 
     if once:
         # Single poll — used by GitHub Actions
-        # First backfill any missing hours from the last 24h (prevents 404s)
-        backfill_recent_hours(api_key, data_dir)
-        poll_once(api_key, data_dir)
+        if not run_once(api_key, data_dir, args):
+            publish_metrics()
+            return
+        log_fetch_stats()
+        publish_metrics()
         log("Done (single-shot).")
         return
 
     # Phase 1: catchup
     run_catchup(api_key, data_dir)
 
-    # Phase 2: hourly polling loop
-    log(f"Entering polling loop (every {POLL_INTERVAL_SECONDS}s)...")
-    while True:
-        poll_once(api_key, data_dir)
-        log(f"Next poll in {POLL_INTERVAL_SECONDS // 60} minutes.")
-        time.sleep(POLL_INTERVAL_SECONDS)
+    # Phase 2: polling loop on wall-clock-aligned slots
+    try:
+        asyncio.run(run_scheduled(api_key, data_dir, args.cadence_seconds))
+    except KeyboardInterrupt:
+        log("Stopped.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+StakTrakr Spot History Scanner
+==============================
+Checks the whole price history in one pass per metal:
+
+  - missing trading days in data/spot-history-*.json (business-day calendar)
+  - duplicate (timestamp, metal) keys, in the year files and the hourly/15-min trees
+  - implausible prices: non-positive/non-finite values and robust z-score
+    spikes or jumps in the log returns (e.g. a bad inversion of a near-zero rate)
+
+Each metal's series is loaded into NumPy arrays once (spot_series.py, the
+helpers build-seed-bundle.py's LOD tiers use too); every check is a
+vectorized pass over them. The missing days are folded into the fewest
+/timeframe ranges and printed as update-seed-data.py commands.
+
+Requires NumPy (not needed by the poller itself): pip install numpy
+
+Usage:
+    python3 scan-history.py --data-dir ../../../../data   # Report on the repo's data/
+    python3 scan-history.py --since 2000-01-01    # Only scan from a date on
+    python3 scan-history.py --json scan.json      # Also write the full report
+    python3 scan-history.py --check               # Exit 1 if anything was found (CI)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+from spot_series import group_by_metal, np  # np is None without NumPy; main() explains
+
+
+def _import_seed_updater():
+    """Import update-seed-data.py as `seed_updater` (shared with the poller)."""
+    if "seed_updater" in sys.modules:
+        return sys.modules["seed_updater"]
+    spec = spec_from_file_location("seed_updater", Path(__file__).parent / "update-seed-data.py")
+    mod = module_from_spec(spec)
+    sys.modules["seed_updater"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+seed = _import_seed_updater()
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Weekday holes this long (in business days) are reported even when every
+# metal misses them; shorter all-metal holes are market holidays.
+MIN_MISSING_RUN = 3
+# Robust z-score (local median/MAD of log returns) above which a move is flagged
+SPIKE_Z_THRESHOLD = 12.0
+# Log returns per block used for the local median/MAD (about a quarter)
+SPIKE_WINDOW = 63
+# Missing days this close together (calendar days) share one /timeframe
+# request — bridges weekends, like the poller's backfill planner
+RANGE_MERGE_GAP_DAYS = 4
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _columns(entries, since, columns):
+    """Append well-formed entries' timestamp/metal/spot to the flat column lists."""
+    entries = [e for e in entries if e.get("timestamp") and e.get("metal") and e["timestamp"] >= since]
+    columns[0].extend([e["timestamp"] for e in entries])
+    columns[1].extend([e["metal"] for e in entries])
+    columns[2].extend([e.get("spot") for e in entries])
+
+
+def load_daily_series(data_dir, since=""):
+    """{metal: (timestamps, prices)} from every year file (journals overlaid)."""
+    years = {p.stem[len("spot-history-"):] for p in Path(data_dir).glob("spot-history-*.json")}
+    years = {y for y in years if y.isdigit()} | set(seed.journal_years(data_dir))
+    columns = ([], [], [])
+    count = 0
+    for year in sorted(years):
+        if since and year < since[:4]:
+            continue
+        entries = seed.load_year_file(data_dir, year)
+        count += len(entries)
+        _columns(entries, since, columns)
+    return group_by_metal(*columns), count
+
+
+def _shard_files(tier_dir):
+    """Per-slot shard files (YYYY/MM/DD/HH.json or HHMM.json) under one tier."""
+    for root, _dirs, files in os.walk(tier_dir):
+        rel = Path(root).relative_to(tier_dir).parts
+        if len(rel) != 3:  # packed DD.json / ohlc.json live one level up
+            continue
+        for name in files:
+            if name.endswith(".json") and name[:-5].isdigit():
+                yield Path(root) / name
+
+
+def load_intraday_series(data_dir, tier, since=""):
+    """{metal: (timestamps, prices)} from a tier's shard files, plus the slot count."""
+    columns = ([], [], [])
+    slots = []
+    for path in _shard_files(Path(data_dir) / tier):
+        yyyy, mm, dd = path.parts[-4:-1]
+        stem = path.stem
+        slot = f"{yyyy}-{mm}-{dd} {stem[:2]}:{stem[2:] or '00'}:00"
+        if slot < since:
+            continue
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        slots.append(slot)
+        _columns(entries if isinstance(entries, list) else [], since, columns)
+    return group_by_metal(*columns), slots
+
+# ---------------------------------------------------------------------------
+# Checks (vectorized per metal)
+# ---------------------------------------------------------------------------
+
+def find_duplicates(ts):
+    """Timestamps occurring more than once in a sorted series → {timestamp: count}."""
+    repeated = ts[1:] == ts[:-1]
+    if not repeated.any():
+        return {}
+    values, counts = np.unique(ts[1:][repeated], return_counts=True)
+    return {str(v).replace("T", " "): int(c) + 1 for v, c in zip(values, counts)}
+
+
+def _block_median(values, window):
+    """
+    Median of each consecutive block of `window` values, repeated across
+    the block (a short final block uses the last full window). O(n), unlike
+    a sliding median, and local enough to follow volatility regimes.
+    """
+    n = len(values)
+    full = n // window
+    medians = np.repeat(np.median(values[:full * window].reshape(full, window), axis=1), window)
+    if n > full * window:
+        medians = np.concatenate([medians, np.full(n - full * window, np.median(values[-window:]))])
+    return medians
+
+
+def find_price_anomalies(ts, spot, threshold=SPIKE_Z_THRESHOLD, window=SPIKE_WINDOW):
+    """
+    Flag implausible prices in one sorted series.
+
+    Returns a list of {"timestamp", "kind", "price", "previous", "z"} where
+    kind is "invalid" (non-positive or non-finite), "spike" (a move out and
+    straight back, i.e. one bad point) or "jump" (a single outsized move).
+    Scores are robust z-scores of the log returns against the median/MAD
+    of their block of `window` returns, so volatile eras don't drown out
+    quiet ones.
+    """
+    found = []
+    valid = np.isfinite(spot) & (spot > 0)
+    for i in np.flatnonzero(~valid):
+        found.append({"timestamp": str(ts[i]).replace("T", " "), "kind": "invalid",
+                      "price": None if not np.isfinite(spot[i]) else float(spot[i]),
+                      "previous": None, "z": None})
+    ts, spot = ts[valid], spot[valid]
+    if len(spot) < 3:
+        return found
+
+    returns = np.diff(np.log(spot))
+    win = min(window, len(returns))
+    center = _block_median(returns, win)
+    deviation = np.abs(returns - center)
+    mad = _block_median(deviation, win)
+    # Floor the scale: flat stretches (stale repeated prices) have MAD 0
+    floor = max(float(np.median(deviation)) * 0.25, 1e-6)
+    z = (returns - center) / (1.4826 * np.maximum(mad, floor))
+
+    big = np.abs(z) > threshold
+    # Point i+1 is a spike when the moves into and out of it are both big
+    # and opposite; otherwise a big move into it is a jump.
+    spike = np.zeros(len(spot), dtype=bool)
+    spike[1:-1] = big[:-1] & big[1:] & (np.sign(returns[:-1]) != np.sign(returns[1:]))
+    jump = np.zeros(len(spot), dtype=bool)
+    jump[1:] = big & ~spike[1:]
+    jump[2:] &= ~spike[1:-1]  # the move back out of a spike isn't a jump
+    for i in np.flatnonzero(spike | jump):
+        found.append({
+            "timestamp": str(ts[i]).replace("T", " "),
+            "kind": "spike" if spike[i] else "jump",
+            "price": float(spot[i]),
+            "previous": float(spot[i - 1]),
+            "z": round(float(z[i - 1]), 1),
+        })
+    found.sort(key=lambda a: a["timestamp"])
+    return found
+
+
+def find_missing_days(series, until=None, min_run=MIN_MISSING_RUN):
+    """
+    Business days missing per metal between its first point and `until`
+    (default: the latest day any metal has). A day counts when another
+    metal has a price that day, or when it sits in a run of at least
+    min_run missing business days; shorter all-metal holes are holidays.
+
+    Returns {metal: datetime64[D] array}.
+    """
+    days = {metal: np.unique(ts.astype("datetime64[D]")) for metal, (ts, _) in series.items()}
+    if not days:
+        return {}
+    traded = np.unique(np.concatenate(list(days.values())))
+    end = np.datetime64(until, "D") if until else traded[-1]
+
+    missing = {}
+    for metal, have in days.items():
+        calendar = np.arange(have[0], end + 1, dtype="datetime64[D]")
+        calendar = calendar[np.is_busday(calendar)]
+        absent = ~np.isin(calendar, have)
+        if not absent.any():
+            missing[metal] = calendar[:0]
+            continue
+        idx = np.flatnonzero(absent)
+        # Runs of consecutive missing business days
+        breaks = np.flatnonzero(np.diff(idx) != 1) + 1
+        run_id = np.zeros(len(idx), dtype=np.int64)
+        run_id[breaks] = 1
+        run_id = np.cumsum(run_id)
+        run_len = np.bincount(run_id)[run_id]
+        gap_days = calendar[idx]
+        keep = np.isin(gap_days, traded) | (run_len >= min_run)
+        missing[metal] = gap_days[keep]
+    return missing
+
+
+def missing_hours(slots):
+    """
+    Hourly slots absent between the first and last hourly shard.
+    Returns (count, [(first_missing, last_missing), ...] runs as "YYYY-MM-DD HH:00").
+    """
+    if not slots:
+        return 0, []
+    have = np.unique(np.array(slots, dtype="datetime64[h]"))
+    expected = np.arange(have[0], have[-1] + 1, dtype="datetime64[h]")
+    gaps = expected[~np.isin(expected, have)]
+    if not len(gaps):
+        return 0, []
+    breaks = np.flatnonzero(np.diff(gaps) != np.timedelta64(1, "h")) + 1
+    runs = [(str(run[0]).replace("T", " ") + ":00", str(run[-1]).replace("T", " ") + ":00")
+            for run in np.split(gaps, breaks)]
+    return len(gaps), runs
+
+
+def plan_timeframe_ranges(days, merge_gap_days=RANGE_MERGE_GAP_DAYS, max_days=seed.MAX_DAYS_PER_REQUEST):
+    """
+    Fold missing days (datetime64[D]) into the fewest /timeframe date ranges:
+    days at most merge_gap_days apart share a range, and no range exceeds
+    max_days (the API's limit). Returns [(start, end), ...] as date objects.
+    """
+    days = np.unique(days)
+    if not len(days):
+        return []
+    breaks = np.flatnonzero(np.diff(days).astype(np.int64) > merge_gap_days) + 1
+    ranges = []
+    for run in np.split(days, breaks):
+        start, end = run[0], run[-1]
+        while start <= end:
+            chunk_end = min(start + np.timedelta64(max_days - 1, "D"), end)
+            ranges.append((start.astype(date), chunk_end.astype(date)))
+            start = chunk_end + np.timedelta64(1, "D")
+    return ranges
+
+# ---------------------------------------------------------------------------
+# Scan and report
+# ---------------------------------------------------------------------------
+
+def _day_runs(days):
+    """Collapse sorted datetime64[D] days into "A" / "A..B" strings of consecutive days."""
+    if not len(days):
+        return []
+    breaks = np.flatnonzero(np.diff(days).astype(np.int64) > 1) + 1
+    return [str(r[0]) if len(r) == 1 else f"{r[0]}..{r[-1]}" for r in np.split(days, breaks)]
+
+
+def scan(data_dir, since="", until=None, threshold=SPIKE_Z_THRESHOLD, min_run=MIN_MISSING_RUN):
+    """Run every check over data_dir. Returns the report dict (JSON-serializable)."""
+    started = time.perf_counter()
+    series, entry_count = load_daily_series(data_dir, since)
+    missing = find_missing_days(series, until=until, min_run=min_run)
+
+    daily = {}
+    for metal, (ts, spot) in sorted(series.items()):
+        daily[metal] = {
+            "points": int(len(ts)),
+            "first": str(ts[0].astype("datetime64[D]")),
+            "last": str(ts[-1].astype("datetime64[D]")),
+            "missing_days": int(len(missing[metal])),
+            "missing": _day_runs(missing[metal]),
+            "duplicates": find_duplicates(ts),
+            "anomalies": find_price_anomalies(ts, spot, threshold=threshold),
+        }
+
+    all_missing = np.concatenate([m for m in missing.values()]) if missing else np.array([], "datetime64[D]")
+    ranges = plan_timeframe_ranges(all_missing)
+
+    intraday = {}
+    for tier in seed.INTRADAY_TIERS:
+        tier_series, slots = load_intraday_series(data_dir, tier, since)
+        record = {
+            "files": len(slots),
+            "metals": {
+                metal: {
+                    "points": int(len(ts)),
+                    "duplicates": find_duplicates(ts),
+                    "anomalies": find_price_anomalies(ts, spot, threshold=threshold),
+                }
+                for metal, (ts, spot) in sorted(tier_series.items())
+            },
+        }
+        if tier == "hourly":
+            record["missing_hours"], record["missing_hour_runs"] = missing_hours(slots)
+        intraday[tier] = record
+
+    return {
+        "generated": datetime.now().strftime(seed.TIMESTAMP_FORMAT),
+        "data_dir": str(data_dir),
+        "since": since or None,
+        "entries": entry_count,
+        "daily": daily,
+        "intraday": intraday,
+        "timeframe_ranges": [[s.isoformat(), e.isoformat()] for s, e in ranges],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def issue_count(report):
+    """Number of findings (missing days, duplicate keys, anomalies) in a report."""
+    total = 0
+    for record in report["daily"].values():
+        total += record["missing_days"] + len(record["duplicates"]) + len(record["anomalies"])
+    for tier in report["intraday"].values():
+        total += tier.get("missing_hours", 0)
+        for record in tier["metals"].values():
+            total += len(record["duplicates"]) + len(record["anomalies"])
+    return total
+
+
+def _format_anomaly(metal, a):
+    if a["kind"] == "invalid":
+        return f"    {metal:<10} {a['timestamp']}  invalid price {a['price']}"
+    return (f"    {metal:<10} {a['timestamp']}  {a['kind']:<5} {a['previous']:,.2f} → {a['price']:,.2f}"
+            f"  (z {a['z']:+.1f})")
+
+
+def format_report(report, limit=10):
+    """Human-readable summary; long lists are cut to `limit` lines each."""
+    lines = [f"Spot history scan — {report['data_dir']} "
+             f"({report['entries']:,} entries) in {report['elapsed_ms']:.0f}ms"]
+
+    lines.append("Daily seed:")
+    for metal, r in report["daily"].items():
+        lines.append(f"  {metal:<10} {r['points']:>7,} points {r['first']} → {r['last']}  "
+                     f"missing {r['missing_days']} day(s), {len(r['duplicates'])} duplicate key(s), "
+                     f"{len(r['anomalies'])} anomal{'y' if len(r['anomalies']) == 1 else 'ies'}")
+    for metal, r in report["daily"].items():
+        if r["missing"]:
+            shown = ", ".join(r["missing"][:limit])
+            more = f" (+{len(r['missing']) - limit} more)" if len(r["missing"]) > limit else ""
+            lines.append(f"    {metal:<10} missing: {shown}{more}")
+        for ts, count in list(r["duplicates"].items())[:limit]:
+            lines.append(f"    {metal:<10} {ts}  duplicate ×{count}")
+        lines.extend(_format_anomaly(metal, a) for a in r["anomalies"][:limit])
+
+    for tier, t in report["intraday"].items():
+        if not t["files"]:
+            continue
+        dupes = sum(len(r["duplicates"]) for r in t["metals"].values())
+        anomalies = sum(len(r["anomalies"]) for r in t["metals"].values())
+        line = f"{tier}: {t['files']:,} files, {dupes} duplicate key(s), {anomalies} anomal{'y' if anomalies == 1 else 'ies'}"
+        if "missing_hours" in t:
+            line += f", {t['missing_hours']} missing hour(s)"
+        lines.append(line)
+        for start, end in t.get("missing_hour_runs", [])[:limit]:
+            lines.append(f"    missing {start}" + (f" → {end}" if end != start else ""))
+        for metal, r in t["metals"].items():
+            for ts, count in list(r["duplicates"].items())[:limit]:
+                lines.append(f"    {metal:<10} {ts}  duplicate ×{count}")
+            lines.extend(_format_anomaly(metal, a) for a in r["anomalies"][:limit])
+
+    ranges = report["timeframe_ranges"]
+    if ranges:
+        lines.append(f"Backfill: {len(ranges)} /timeframe request(s) cover the missing days:")
+        for start, end in ranges[:limit]:
+            lines.append(f"  python3 update-seed-data.py --start-date {start} --end-date {end}")
+        if len(ranges) > limit:
+            lines.append(f"  ... {len(ranges) - limit} more in the --json report")
+    else:
+        lines.append("Backfill: nothing to request.")
+    return "\n".join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Scan the spot history for missing days, duplicate keys and implausible prices."
+    )
+    parser.add_argument("--since", default="", metavar="YYYY-MM-DD", help="Only scan entries from this date on.")
+    parser.add_argument("--until", default=None, metavar="YYYY-MM-DD",
+                        help="Count missing days up to this date (default: the latest day on disk).")
+    parser.add_argument("--threshold", type=float, default=SPIKE_Z_THRESHOLD,
+                        help=f"Robust z-score that flags a price move (default: {SPIKE_Z_THRESHOLD:g}).")
+    parser.add_argument("--min-run", type=int, default=MIN_MISSING_RUN,
+                        help="Business days an all-metal hole must span to be reported rather than "
+                             f"treated as a holiday (default: {MIN_MISSING_RUN}).")
+    parser.add_argument("--data-dir", default=None,
+                        help="Directory holding spot-history-{year}.json (default: DATA_DIR or the poller's data/).")
+    parser.add_argument("--json", metavar="PATH", help="Also write the full report as JSON.")
+    parser.add_argument("--limit", type=int, default=10, help="Lines per list in the text report (default: 10).")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if anything was found.")
+    args = parser.parse_args()
+    for name in ("since", "until"):
+        value = getattr(args, name)
+        if value:
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                parser.error(f"--{name}: expected YYYY-MM-DD, got {value!r}")
+    return args
+
+
+def main():
+    args = parse_args()
+    if np is None:
+        print("scan-history.py needs NumPy: pip install numpy", file=sys.stderr)
+        sys.exit(2)
+
+    report = scan(Path(args.data_dir) if args.data_dir else seed.resolve_data_dir(), since=args.since, until=args.until,
+                  threshold=args.threshold, min_run=args.min_run)
+    print(format_report(report, limit=args.limit))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report → {args.json}")
+    if args.check and issue_count(report):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+NumPy helpers for whole-history price series, shared by scan-history.py
+(checks) and devops/build-seed-bundle.py (level-of-detail tiers).
+
+A series is a pair of sorted arrays per metal. Days are date ordinals
+(int64) for the daily tiers, datetime64[s] for the scanner's intraday
+loads; prices are float64.
+
+Requires NumPy (not needed by the poller itself): pip install numpy
+"""
+
+try:
+    import numpy as np
+except ImportError:  # callers check and explain
+    np = None
+
+# date.toordinal() of 1970-01-01, the datetime64 epoch
+_EPOCH_ORDINAL = 719163
+
+
+def price_array(values):
+    """float64 array; anything non-numeric becomes NaN (reported as invalid)."""
+    try:
+        return np.array(values, dtype="float64")
+    except (TypeError, ValueError):
+        return np.array([v if isinstance(v, (int, float)) else np.nan for v in values], dtype="float64")
+
+
+def group_by_metal(timestamps, metals, prices):
+    """Flat columns → {metal: (datetime64[s] array, float64 array)}, each sorted by time."""
+    if not timestamps:
+        return {}
+    ts = np.array(timestamps, dtype="datetime64[s]")
+    spot = price_array(prices)
+    names, codes = np.unique(np.array(metals), return_inverse=True)
+    # One stable sort by (metal, time) instead of a sort per metal
+    order = np.lexsort((ts, codes))
+    ts, spot, codes = ts[order], spot[order], codes[order]
+    bounds = np.searchsorted(codes, np.arange(len(names) + 1))
+    return {str(name): (ts[bounds[i]:bounds[i + 1]], spot[bounds[i]:bounds[i + 1]]) for i, name in enumerate(names)}
+
+# ---------------------------------------------------------------------------
+# Period bars
+# ---------------------------------------------------------------------------
+
+def _calendar_start(days, unit):
+    as_dates = (days - _EPOCH_ORDINAL).astype("datetime64[D]")
+    return as_dates.astype(f"datetime64[{unit}]").astype("datetime64[D]").astype("int64") + _EPOCH_ORDINAL
+
+
+PERIOD_STARTS = {
+    "weekly": lambda days: days - (days - 1) % 7,  # ordinal 1 (0001-01-01) is a Monday
+    "monthly": lambda days: _calendar_start(days, "M"),
+    "yearly": lambda days: _calendar_start(days, "Y"),
+}
+
+
+def aggregate_ohlc(days, prices, period):
+    """
+    Bucket a sorted daily series (ordinals, prices) into PERIOD_STARTS[period]
+    periods. Returns {"t", "o", "h", "l", "c", "m", "n"} columns as lists:
+    period start ordinals, open/high/low/close, the mean rounded to cents
+    and the number of days.
+    """
+    days = np.asarray(days, dtype="int64")
+    prices = np.asarray(prices, dtype="float64")
+    if not len(days):
+        return {name: [] for name in "tohlcmn"}
+    starts = PERIOD_STARTS[period](days)
+    first = np.flatnonzero(np.concatenate(([True], starts[1:] != starts[:-1])))
+    counts = np.diff(np.append(first, len(days)))
+    # Integer cents sum exactly, whatever the order
+    cents = np.add.reduceat(np.rint(prices * 100).astype("int64"), first)
+    return {
+        "t": starts[first].tolist(),
+        "o": prices[first].tolist(),
+        "h": np.maximum.reduceat(prices, first).tolist(),
+        "l": np.minimum.reduceat(prices, first).tolist(),
+        "c": prices[first + counts - 1].tolist(),
+        "m": [round(total / n / 100, 2) for total, n in zip(cents.tolist(), counts.tolist())],
+        "n": counts.tolist(),
+    }
+
+# ---------------------------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------------------------
+
+def lttb_indices(xs, ys, budget):
+    """
+    Largest-triangle-three-buckets: indices of `budget` points that keep the
+    visual shape of the series (always the first and last point).
+
+    Bucket edges and the averages of every bucket are computed up front in
+    NumPy. The anchor chain (each pick depends on the previous one) then
+    runs over plain floats: with a few points per bucket, per-bucket array
+    calls would cost more than they save.
+    """
+    n = len(xs)
+    if budget >= n or budget < 3:
+        return list(range(n))
+    every = (n - 2) / (budget - 2)
+    edges = (np.arange(budget - 1) * every).astype("int64") + 1
+    # Bucket i spans edges[i]:edges[i + 1]; the last one runs to the end
+    bounds = np.append(edges, n)
+    spans = np.diff(bounds)
+    avg_x = (np.add.reduceat(np.asarray(xs, dtype="float64"), bounds[:-1]) / spans).tolist()
+    avg_y = (np.add.reduceat(np.asarray(ys, dtype="float64"), bounds[:-1]) / spans).tolist()
+    xs = xs.tolist() if hasattr(xs, "tolist") else xs
+    ys = ys.tolist() if hasattr(ys, "tolist") else ys
+    edges = edges.tolist()
+
+    picked = [0]
+    anchor = 0
+    for i in range(budget - 2):
+        ax, ay = xs[anchor], ys[anchor]
+        # Twice the triangle area is |dx*y + dy*x - c| for this anchor/average
+        dx, dy = ax - avg_x[i + 1], avg_y[i + 1] - ay
+        c = dx * ay + dy * ax
+        best = -1.0
+        for j in range(edges[i], edges[i + 1]):
+            area = abs(dx * ys[j] + dy * xs[j] - c)
+            if area > best:
+                best, anchor = area, j
+        picked.append(anchor)
+    picked.append(n - 1)
+    return picked
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for MetalPriceAPI
+=================================
+Serves /v1/latest and /v1/timeframe with deterministic synthetic rates so
+the poller, the updater and the HTTP client can be exercised offline.
+Failures and latency can be injected to drive the retry/backoff paths.
+
+Usage:
+    python3 stub_api.py --port 8765 --fail-rate 0.2 --latency 0.05
+
+    METAL_PRICE_API_BASE_URL=http://127.0.0.1:8765/v1 METAL_PRICE_API_KEY=test \\
+        python3 update-seed-data.py --dry-run --start-date 2025-01-01
+
+In-process (benchmarks, ad-hoc checks):
+    with StubApiServer(latency=0.01) as stub:
+        stub.fail_next(2, status=503)
+        client = ApiClient(base_url=stub.base_url)
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Rough 2026 price levels ($/oz) the synthetic series oscillate around;
+# FX symbols are USD per unit of the currency
+BASE_PRICES = {
+    "XAU": 2900.0,
+    "XAG": 32.0,
+    "XPT": 980.0,
+    "XPD": 960.0,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "CAD": 0.73,
+    "AUD": 0.65,
+    "CHF": 1.12,
+    "JPY": 0.0067,
+}
+
+
+def synthetic_price(symbol, day):
+    """Deterministic $/oz for a symbol on a date — smooth, never near zero."""
+    base = BASE_PRICES.get(symbol, 100.0)
+    t = day.toordinal()
+    wobble = 0.04 * math.sin(t / 9.0) + 0.02 * math.sin(t / 2.3 + len(symbol))
+    return round(base * (1.0 + wobble), 2 if base >= 10 else 6)
+
+
+def synthetic_rates(symbols, day):
+    """Rates in MetalPriceAPI form: units of metal per 1 USD."""
+    return {s: 1.0 / synthetic_price(s, day) for s in symbols}
+
+
+class StubApiServer:
+    """
+    Threaded HTTP server imitating the MetalPriceAPI endpoints we use.
+
+    latency:   seconds to sleep before each response
+    fail_rate: probability of answering 503 to any request
+    fail_next(n, status, retry_after): answer the next n requests with
+               `status`, optionally with a Retry-After header
+    requests:  list of (path, params) for every request received
+    clients:   (host, port) of the connection behind each request, so
+               keep-alive reuse shows up as repeated ports
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_rate=0.0, seed=None):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.requests = []
+        self.clients = []
+        self._forced = []
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def fail_next(self, count=1, status=503, retry_after=None):
+        with self._lock:
+            self._forced.extend([(status, retry_after)] * count)
+
+    def start(self):
+        # Short poll interval: stop() returns promptly (per-test servers)
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -- request handling ---------------------------------------------------
+
+    def _next_failure(self):
+        with self._lock:
+            if self._forced:
+                return self._forced.pop(0)
+            if self.fail_rate and self._random.random() < self.fail_rate:
+                return 503, None
+        return None, None
+
+    def respond(self, path, params, headers=None):
+        """Return (status, body_dict) for a request; extra response headers go into `headers`."""
+        with self._lock:
+            self.requests.append((path, params))
+        if self.latency:
+            time.sleep(self.latency)
+        failure, retry_after = self._next_failure()
+        if failure:
+            if retry_after is not None and headers is not None:
+                headers["Retry-After"] = str(retry_after)
+            return failure, {"success": False, "error": {"info": f"stub failure {failure}"}}
+        if not params.get("api_key"):
+            return 200, {"success": False, "error": {"info": "Missing API key"}}
+
+        symbols = [s for s in params.get("currencies", "XAU,XAG,XPT,XPD").split(",") if s]
+        if path.endswith("/latest"):
+            now = datetime.utcnow()
+            return 200, {
+                "success": True,
+                "base": "USD",
+                "timestamp": int(now.timestamp()),
+                "rates": synthetic_rates(symbols, now.date()),
+            }
+        if path.endswith("/timeframe"):
+            try:
+                start = date.fromisoformat(params["start_date"])
+                end = date.fromisoformat(params["end_date"])
+            except (KeyError, ValueError):
+                return 200, {"success": False, "error": {"info": "Invalid date range"}}
+            rates = {}
+            day = start
+            while day <= end:
+                if day.weekday() < 5:  # markets closed on weekends
+                    rates[day.isoformat()] = synthetic_rates(symbols, day)
+                day += timedelta(days=1)
+            return 200, {
+                "success": True,
+                "base": "USD",
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "rates": rates,
+            }
+        return 404, {"success": False, "error": {"info": f"Unknown endpoint {path}"}}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                with stub._lock:
+                    stub.clients.append(self.client_address[:2])
+                headers = {}
+                status, body = stub.respond(parsed.path, params, headers)
+                raw = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local MetalPriceAPI stand-in.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per response.")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of a 503 per request.")
+    args = parser.parse_args()
+
+    stub = StubApiServer(port=args.port, latency=args.latency, fail_rate=args.fail_rate).start()
+    print(f"Stub MetalPriceAPI listening on {stub.base_url} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
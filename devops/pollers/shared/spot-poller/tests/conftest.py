@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the spot poller tests.
+
+    cd devops/pollers/shared/spot-poller && python3 -m pytest -q tests
+"""
+
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+POLLER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(POLLER_DIR))
+
+
+def _load_seed_updater():
+    """update-seed-data.py as `seed_updater`, the name poller.py registers it under."""
+    if "seed_updater" in sys.modules:
+        return sys.modules["seed_updater"]
+    spec = spec_from_file_location("seed_updater", POLLER_DIR / "update-seed-data.py")
+    mod = module_from_spec(spec)
+    sys.modules["seed_updater"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="session")
+def seed():
+    return _load_seed_updater()
+
+
+@pytest.fixture
+def stub():
+    from stub_api import StubApiServer
+
+    with StubApiServer() as server:
+        yield server
@@ -0,0 +1,99 @@
+import math
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+
+def series_of(seed, n, rng):
+    prices = [2000.0]
+    for _ in range(n - 1):
+        prices.append(round(prices[-1] * math.exp(rng.gauss(0, 0.015)), 2))
+    series = seed._empty_series()
+    series["days"] = list(range(730000, 730000 + n))
+    series["p"] = prices
+    return series
+
+
+def naive_vol(prices, i, window, trading_days):
+    returns = [math.log(prices[k] / prices[k - 1]) for k in range(i - window + 1, i + 1)]
+    mean = sum(returns) / window
+    variance = sum((r - mean) ** 2 for r in returns) / (window - 1)
+    return math.sqrt(variance) * math.sqrt(trading_days) * 100
+
+
+def test_rolling_columns_match_two_pass_definitions(seed):
+    series = series_of(seed, 400, random.Random(1))
+    seed.rolling_tail(series, 0)
+    prices, window = series["p"], seed.ANALYTICS_VOL_WINDOW
+    vol = series[f"vol{window}"]
+    assert vol[:window] == [None] * window
+    for i in range(window, len(prices)):
+        assert vol[i] == pytest.approx(naive_vol(prices, i, window, seed.ANALYTICS_TRADING_DAYS), abs=0.006)
+    for w in seed.ANALYTICS_MA_WINDOWS:
+        ma = series[f"ma{w}"]
+        assert ma[w - 2] is None
+        assert ma[-1] == pytest.approx(sum(prices[-w:]) / w, abs=0.006)
+
+
+@pytest.mark.parametrize("start", [0, 1, 29, 30, 31, 199, 200, 350, 399, 400])
+def test_incremental_tail_matches_full_pass(seed, start):
+    full = series_of(seed, 400, random.Random(2))
+    seed.rolling_tail(full, 0)
+    tail = {name: list(column) for name, column in full.items()}
+    seed.rolling_tail(tail, start)
+    assert tail == full
+
+
+def seed_years(seed, data_dir, years, rng):
+    price = {"Gold": 2000.0, "Silver": 25.0}
+    for year in years:
+        entries = []
+        for day in range(1, 366, 2):
+            stamp = datetime(year, 1, 1) + timedelta(days=day - 1)
+            if stamp.year != year:
+                break
+            for metal in price:
+                price[metal] = round(price[metal] * math.exp(rng.gauss(0, 0.015)), 2)
+                entries.append({"spot": price[metal], "metal": metal, "source": "seed", "provider": "StakTrakr",
+                                "timestamp": stamp.strftime("%Y-%m-%d 12:00:00")})
+        entries.sort(key=lambda e: (e["timestamp"], e["metal"]))
+        seed.save_year_file(data_dir, str(year), entries)
+
+
+def analytics_files(seed, data_dir):
+    root = data_dir / seed.ANALYTICS_DIRNAME
+    files = {p.name: p.read_bytes() for p in root.glob("*.json")}
+    files["summary"] = (data_dir / seed.ANALYTICS_SUMMARY_FILENAME).read_bytes()
+    return files
+
+
+def test_incremental_refresh_rewrites_only_the_merged_years(seed, tmp_path):
+    seed_years(seed, tmp_path, [2024, 2025, 2026], random.Random(3))
+    seed.update_analytics(tmp_path)
+    assert sorted(analytics_files(seed, tmp_path)) == ["2024.json", "2025.json", "2026.json", "summary"]
+    older = {p.name: p.stat().st_mtime_ns for p in (tmp_path / seed.ANALYTICS_DIRNAME).glob("202[45].json")}
+
+    entry = {"spot": 2500.0, "metal": "Gold", "source": "seed", "provider": "StakTrakr",
+             "timestamp": "2026-12-31 12:00:00"}
+    seed.merge_into_year_files(tmp_path, [entry], analytics=True)
+    assert {p.name: p.stat().st_mtime_ns for p in (tmp_path / seed.ANALYTICS_DIRNAME).glob("202[45].json")} == older
+
+    full = tmp_path / "full"
+    full.mkdir()
+    for path in tmp_path.glob("spot-history-20*.json"):
+        (full / path.name).write_bytes(path.read_bytes())
+    seed.update_analytics(full)
+    assert analytics_files(seed, tmp_path) == analytics_files(seed, full)
+
+
+def test_catchup_refreshes_analytics_once(seed, stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(seed, "_client", seed.ApiClient(base_url=stub.base_url, usage_file=None,
+                                                        per_minute=0, per_month=0))
+    monkeypatch.setattr(seed, "_cache", seed.ResponseCache(directory=tmp_path / "cache", enabled=False))
+    calls = []
+    monkeypatch.setattr(seed, "update_analytics", lambda data_dir, since=None: calls.append(since))
+    outcome = seed.run_chunked_catchup("test", tmp_path, date(2023, 6, 1), date(2025, 3, 1), workers=2,
+                                       rate=100, log=lambda *a: None)
+    assert not outcome["failed"] and outcome["days"] > 365
+    assert calls == ["2023-06-01"]
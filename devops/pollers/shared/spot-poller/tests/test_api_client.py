@@ -0,0 +1,137 @@
+import json
+from datetime import datetime
+
+import pytest
+import requests
+
+PARAMS = {"api_key": "test", "base": "USD", "currencies": "XAU,XAG"}
+
+
+@pytest.fixture
+def client_for(seed, tmp_path, monkeypatch):
+    """ApiClient factory against the stub; backoff sleeps are recorded, not slept."""
+    sleeps = []
+    monkeypatch.setattr(seed.time, "sleep", sleeps.append)
+
+    def make(stub, **kwargs):
+        kwargs.setdefault("backoff_base", 0.5)
+        kwargs.setdefault("per_minute", 0)
+        kwargs.setdefault("per_month", 0)
+        kwargs.setdefault("usage_file", tmp_path / ".api-usage.json")
+        client = seed.ApiClient(base_url=stub.base_url, **kwargs)
+        client.sleeps = sleeps
+        return client
+
+    return make
+
+
+def test_retries_5xx_then_succeeds(client_for, stub):
+    stub.fail_next(2, status=503)
+    client = client_for(stub)
+    data = client.get("/latest", PARAMS)
+    assert data["success"] is True
+    assert set(data["rates"]) == {"XAU", "XAG"}
+    assert len(stub.requests) == 3
+    assert client.retries == 2
+    assert client.failures == 0
+    assert client.stats()["status"] == {"503": 2, "200": 1}
+    # Full-jitter backoff stays under base * 2^attempt
+    assert len(client.sleeps) == 2
+    assert 0 <= client.sleeps[0] <= 0.5 and 0 <= client.sleeps[1] <= 1.0
+
+
+def test_429_honours_retry_after(client_for, stub):
+    stub.fail_next(1, status=429, retry_after=7)
+    client = client_for(stub)
+    assert client.get("/latest", PARAMS)["success"] is True
+    assert client.sleeps == [7.0]
+
+
+def test_retry_after_is_capped(client_for, stub):
+    stub.fail_next(1, status=429, retry_after=600)
+    client = client_for(stub, backoff_cap=30.0)
+    client.get("/latest", PARAMS)
+    assert client.sleeps == [30.0]
+
+
+def test_gives_up_after_max_retries(client_for, stub):
+    stub.fail_next(5, status=502)
+    client = client_for(stub, max_retries=2)
+    with pytest.raises(requests.HTTPError):
+        client.get("/latest", PARAMS)
+    assert len(stub.requests) == 3
+    assert client.failures == 1
+
+
+def test_client_errors_are_not_retried(client_for, stub):
+    stub.fail_next(1, status=400)
+    client = client_for(stub)
+    with pytest.raises(requests.HTTPError):
+        client.get("/latest", PARAMS)
+    assert len(stub.requests) == 1
+    assert client.retries == 0
+
+
+def test_api_error_body_raises(client_for, stub):
+    client = client_for(stub)
+    with pytest.raises(RuntimeError, match="Missing API key"):
+        client.get("/latest", {"currencies": "XAU"})
+
+
+def test_monthly_budget_counts_every_attempt(client_for, stub, tmp_path):
+    stub.fail_next(1, status=503)
+    client = client_for(stub, per_month=5)
+    client.get("/latest", PARAMS)
+    client.close()
+    usage = json.loads((tmp_path / ".api-usage.json").read_text())
+    assert usage == {"month": datetime.utcnow().strftime("%Y-%m"), "requests": 2}
+
+
+def test_usage_file_is_written_in_batches(seed, client_for, stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(seed, "USAGE_FLUSH_CALLS", 3)
+    usage_file = tmp_path / ".api-usage.json"
+    client = client_for(stub, per_month=100)
+    for _ in range(2):
+        client.get("/latest", PARAMS)
+    assert not usage_file.exists()
+    client.get("/latest", PARAMS)
+    assert json.loads(usage_file.read_text())["requests"] == 3
+    # Another process counted meanwhile: the next flush adds to its count
+    usage_file.write_text(json.dumps({"month": datetime.utcnow().strftime("%Y-%m"), "requests": 10}))
+    client.get("/latest", PARAMS)
+    client.flush_usage()
+    assert json.loads(usage_file.read_text())["requests"] == 11
+    assert client.usage()["requests"] == 11
+
+
+def test_unlimited_budget_never_touches_the_usage_file(client_for, stub, tmp_path):
+    client = client_for(stub)
+    client.get("/latest", PARAMS)
+    client.close()
+    assert not (tmp_path / ".api-usage.json").exists()
+    assert client.usage()["requests"] == 1
+
+
+def test_monthly_budget_refuses_when_used_up(seed, client_for, stub, tmp_path):
+    month = datetime.utcnow().strftime("%Y-%m")
+    (tmp_path / ".api-usage.json").write_text(json.dumps({"month": month, "requests": 3}))
+    client = client_for(stub, per_month=3)
+    with pytest.raises(seed.QuotaExceeded):
+        client.get("/latest", PARAMS)
+    assert stub.requests == []
+
+
+def test_budget_from_an_earlier_month_is_reset(client_for, stub, tmp_path):
+    (tmp_path / ".api-usage.json").write_text(json.dumps({"month": "2000-01", "requests": 99}))
+    client = client_for(stub, per_month=3)
+    assert client.get("/latest", PARAMS)["success"] is True
+    assert client.usage()["requests"] == 1
+
+
+def test_connection_is_reused(client_for, stub):
+    client = client_for(stub)
+    for _ in range(4):
+        client.get("/latest", PARAMS)
+    client.get("/timeframe", dict(PARAMS, start_date="2026-01-05", end_date="2026-01-09"))
+    assert len(stub.clients) == 5
+    assert len(set(stub.clients)) == 1
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+RATES = {"XAU": 0.0005, "XAG": 0.04}
+
+
+@pytest.fixture
+def provider(seed):
+    """Stand-in SpotProvider factory with injected latency and failures."""
+
+    class FakeProvider(seed.SpotProvider):
+        def __init__(self, name, delay=0.0, error=None, rates=RATES):
+            self.name = name
+            self.delay = delay
+            self.error = error
+            self.rates = rates
+            self.started = None
+            self.cancelled = threading.Event()
+
+        def latest_rates(self, cancel=None):
+            self.started = time.perf_counter()
+            # Sleep like a slow request, but give up if the fetch is decided
+            if cancel is not None and cancel.wait(self.delay):
+                self.cancelled.set()
+                raise seed.RequestCancelled(f"{self.name}: cancelled")
+            if cancel is None:
+                time.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return self.rates
+
+    return FakeProvider
+
+
+def hedged(seed, providers, delay=0.05):
+    return seed.HedgedFetcher(providers, default_delay=delay, min_delay=0.01, max_delay=1.0)
+
+
+def test_spot_provider_is_abstract(seed):
+    with pytest.raises(TypeError):
+        seed.SpotProvider()
+
+
+def test_primary_wins_without_hedging(seed, provider):
+    primary, backup = provider("Primary"), provider("Backup")
+    fetcher = hedged(seed, [primary, backup], delay=0.5)
+    assert fetcher.fetch() == ("Primary", RATES)
+    assert backup.started is None
+    assert fetcher.stats() == {
+        "providers": ["Primary", "Backup"], "wins": {"Primary": 1}, "errors": {}, "hedges": 0,
+    }
+
+
+def test_hedge_fires_after_delay(seed, provider):
+    primary, backup = provider("Primary", delay=5.0), provider("Backup")
+    fetcher = hedged(seed, [primary, backup], delay=0.05)
+    started = time.perf_counter()
+    assert fetcher.fetch() == ("Backup", RATES)
+    elapsed = time.perf_counter() - started
+    assert backup.started - primary.started >= 0.05
+    assert elapsed < 1.0
+    assert fetcher.stats()["hedges"] == 1
+    # The loser is told to stop rather than left running
+    assert primary.cancelled.wait(1.0)
+
+
+def test_primary_error_hands_over_immediately(seed, provider):
+    primary = provider("Primary", error=RuntimeError("HTTP 500"))
+    backup = provider("Backup")
+    fetcher = hedged(seed, [primary, backup], delay=5.0)
+    started = time.perf_counter()
+    assert fetcher.fetch() == ("Backup", RATES)
+    assert time.perf_counter() - started < 1.0
+    stats = fetcher.stats()
+    assert stats["errors"] == {"Primary": 1}
+    assert stats["hedges"] == 0
+
+
+def test_invalid_rates_count_as_failure(seed, provider):
+    primary = provider("Primary", rates={"XAU": 0})
+    backup = provider("Backup")
+    fetcher = hedged(seed, [primary, backup])
+    assert fetcher.fetch() == ("Backup", RATES)
+    assert fetcher.stats()["errors"] == {"Primary": 1}
+
+
+def test_all_providers_fail(seed, provider):
+    fetcher = hedged(seed, [
+        provider("Primary", error=RuntimeError("HTTP 500")),
+        provider("Backup", delay=0.1, error=ConnectionError("refused")),
+    ])
+    with pytest.raises(RuntimeError) as excinfo:
+        fetcher.fetch()
+    assert "Primary: HTTP 500" in str(excinfo.value)
+    assert "Backup: refused" in str(excinfo.value)
+    assert fetcher.stats()["errors"] == {"Primary": 1, "Backup": 1}
+
+
+def test_fetch_leaves_no_executor_threads(seed, provider):
+    fetcher = hedged(seed, [provider("Primary", delay=5.0), provider("Backup")])
+    for _ in range(3):
+        fetcher.fetch()
+    deadline = time.monotonic() + 2.0
+    while any(t.name.startswith("hedge") for t in threading.enumerate()):
+        assert time.monotonic() < deadline, "hedge workers still alive"
+        time.sleep(0.01)
+
+
+def test_cancel_stops_client_retries(seed, stub, tmp_path):
+    stub.fail_next(5, status=503, retry_after=30)
+    client = seed.ApiClient(base_url=stub.base_url, per_minute=0, per_month=0,
+                            usage_file=tmp_path / ".api-usage.json")
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    started = time.perf_counter()
+    with pytest.raises(seed.RequestCancelled):
+        client.get("/latest", {"api_key": "test"}, cancel=cancel)
+    assert time.perf_counter() - started < 5.0
+    assert len(stub.requests) == 1
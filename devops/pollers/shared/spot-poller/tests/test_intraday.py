@@ -0,0 +1,53 @@
+import json
+import os
+from datetime import date
+
+DAY = date(2026, 2, 16)
+
+
+def _write_shards(seed, data_dir, prices):
+    for hour, spot in prices.items():
+        entries = [{"spot": spot, "metal": "Gold", "source": "hourly", "provider": "StakTrakr",
+                    "timestamp": f"{DAY} {hour}:00:00"}]
+        seed.save_hourly_file(data_dir, entries, DAY, hour, overwrite=True)
+
+
+def test_packed_day_has_no_local_mtimes(seed, tmp_path):
+    _write_shards(seed, tmp_path, {"09": 2900.0, "10": 2910.5})
+    assert seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    packed = json.loads((tmp_path / "hourly/2026/02/16.json").read_text())
+    assert "source_mtime_ns" not in packed
+    assert packed["shards"] == 2
+    assert packed["ohlc"]["Gold"]["close"] == 2910.5
+
+
+def test_new_mtimes_do_not_repack(seed, tmp_path):
+    _write_shards(seed, tmp_path, {"09": 2900.0, "10": 2910.5})
+    seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    for shard in (tmp_path / "hourly/2026/02/16").iterdir():
+        os.utime(shard, ns=(1, 1))  # what a clone or rsync without -t does
+    assert not seed.pack_intraday_day(tmp_path, "hourly", DAY)
+
+
+def test_changed_or_added_shard_repacks(seed, tmp_path):
+    _write_shards(seed, tmp_path, {"09": 2900.0, "10": 2910.5})
+    seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    _write_shards(seed, tmp_path, {"10": 2911.0})
+    assert seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    _write_shards(seed, tmp_path, {"11": 2915.0})
+    assert seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    packed = json.loads((tmp_path / "hourly/2026/02/16.json").read_text())
+    assert [e["spot"] for e in packed["entries"]] == [2900.0, 2911.0, 2915.0]
+
+
+def test_unchanged_day_is_skipped_without_reading_shards(seed, tmp_path, monkeypatch):
+    _write_shards(seed, tmp_path, {"09": 2900.0, "10": 2910.5})
+    seed.pack_intraday_day(tmp_path, "hourly", DAY)
+    for shard in (tmp_path / "hourly/2026/02/16").iterdir():
+        os.utime(shard, ns=(1, 1))
+
+    def no_shard_reads(path, *args, **kwargs):
+        raise AssertionError(f"read {path}")
+
+    monkeypatch.setattr(seed, "open", no_shard_reads, raising=False)
+    assert not seed.pack_intraday_day(tmp_path, "hourly", DAY)
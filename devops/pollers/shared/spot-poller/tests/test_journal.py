@@ -0,0 +1,61 @@
+import json
+from datetime import datetime, timedelta
+
+
+def entry(day, spot=2900.0):
+    return {"spot": spot, "metal": "Gold", "source": "seed", "provider": "StakTrakr",
+            "timestamp": f"{day} 12:00:00"}
+
+
+def published(tmp_path, year="2026"):
+    return [e["timestamp"][:10] for e in json.loads((tmp_path / f"spot-history-{year}.json").read_text())]
+
+
+def journaled(seed, tmp_path, *days):
+    seed.save_year_file(tmp_path, "2026", [entry("2026-03-01")])
+    for day in days:
+        seed.merge_into_year_files(tmp_path, [entry(day)], journal=True, analytics=False)
+    assert seed.journal_path(tmp_path, "2026").exists()
+
+
+def test_journal_entries_overlay_the_year_until_compacted(seed, tmp_path):
+    journaled(seed, tmp_path, "2026-03-02")
+    assert published(tmp_path) == ["2026-03-01"]
+    assert [e["timestamp"][:10] for e in seed.load_year_file(tmp_path, "2026")] == ["2026-03-01", "2026-03-02"]
+
+
+def test_stale_journal_kept_within_max_lag(seed, tmp_path):
+    journaled(seed, tmp_path, "2026-03-02", "2026-03-03")
+    now = datetime(2026, 3, 4, 12, 0)  # oldest entry is 48h old
+    assert seed.compact_stale_journals(tmp_path, now, max_lag_hours=72) == {}
+    assert published(tmp_path) == ["2026-03-01"]
+
+
+def test_stale_journal_compacted_past_max_lag(seed, tmp_path):
+    journaled(seed, tmp_path, "2026-03-02", "2026-03-03")
+    now = datetime(2026, 3, 5, 12, 0)  # oldest entry is exactly 72h old
+    assert seed.compact_stale_journals(tmp_path, now, max_lag_hours=72) == {"2026": 2}
+    assert published(tmp_path) == ["2026-03-01", "2026-03-02", "2026-03-03"]
+    assert not seed.journal_path(tmp_path, "2026").exists()
+
+
+def test_published_year_lag_is_bounded_by_max_lag(seed, tmp_path):
+    """Daily noon seeds, a poll every 15 min: each entry is published within the max lag plus one poll."""
+    seed.save_year_file(tmp_path, "2026", [entry("2026-03-01")])
+    poll = timedelta(minutes=15)
+    now = datetime(2026, 3, 2, 0, 0)
+    journaled_at, lags = {}, []
+    while now < datetime(2026, 3, 20):
+        if now.hour == 12 and now.minute == 0:
+            day = now.strftime("%Y-%m-%d")
+            seed.merge_into_year_files(tmp_path, [entry(day)], journal=True, analytics=False)
+            journaled_at[day] = now
+        seed.compact_stale_journals(tmp_path, now)
+        for day in published(tmp_path):
+            if day in journaled_at:
+                lags.append(now - journaled_at.pop(day))
+        now += poll
+    assert len(lags) >= 15
+    assert max(lags) <= timedelta(hours=seed.JOURNAL_MAX_LAG_HOURS) + poll
+    # The journal still batches: several days go out per compaction
+    assert len(set(lags)) > 1
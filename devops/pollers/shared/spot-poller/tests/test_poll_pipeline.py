@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def poller(seed, monkeypatch):
+    import poller
+
+    monkeypatch.setattr(poller, "publish_metrics", lambda: None)
+    monkeypatch.setattr(poller, "log_fetch_stats", lambda: None)
+    monkeypatch.setattr(poller, "log", lambda *a: None)
+    return poller
+
+
+def test_post_write_jobs_wait_for_queued_writes(poller, monkeypatch, tmp_path):
+    busy = threading.Lock()
+    events = []
+
+    def job(name, duration):
+        def run(data_dir, arg):
+            assert busy.acquire(blocking=False), f"{name} overlapped another write or post-write job"
+            try:
+                events.append((name, arg if name == "post" else arg["now"]))
+                time.sleep(duration)
+            finally:
+                busy.release()
+        return run
+
+    monkeypatch.setattr(poller, "write_snapshot", job("write", 0.01))
+    monkeypatch.setattr(poller, "run_post_write_jobs", job("post", 0.05))
+
+    async def scenario():
+        pipeline = poller.PollPipeline("test", tmp_path)
+        writer = asyncio.create_task(pipeline.writer())
+        await pipeline._writes.put({"now": 1})
+        await asyncio.sleep(0.03)  # post-write for 1 is running
+        for now in (2, 3):
+            await pipeline._writes.put({"now": now})
+        await asyncio.sleep(0.2)
+        writer.cancel()
+
+    asyncio.run(scenario())
+    # Snapshots queued during a post-write run are written, then covered by one run
+    assert events == [("write", 1), ("post", 1), ("write", 2), ("write", 3), ("post", 3)]
+
+
+def test_backfilled_hours_carry_the_timeframe_provider(poller, seed, monkeypatch, tmp_path):
+    import json
+
+    def timeframe(api_key, start_date, end_date):
+        days = {str(start_date), str(end_date)}
+        return {"rates": {day: {"XAU": 1 / 2900.0, "XAG": 1 / 33.0} for day in days}}
+
+    monkeypatch.setattr(seed, "fetch_timeframe", timeframe)
+    poller.backfill_recent_hours("key", tmp_path, hours_back=2)
+    shards = sorted((tmp_path / "hourly").rglob("*.json"))
+    assert shards
+    for shard in shards:
+        assert {e["provider"] for e in json.loads(shard.read_text())} == {seed.PRIMARY_PROVIDER_NAME}
@@ -0,0 +1,63 @@
+import random
+from datetime import date
+from itertools import groupby
+
+import pytest
+
+spot_series = pytest.importorskip("spot_series")
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def daily():
+    rng = random.Random(3)
+    days, prices, day, price = [], [], date(2019, 12, 30).toordinal(), 1500.0
+    while len(days) < 900:
+        day += rng.choice((1, 1, 1, 1, 3))
+        price = round(price * (1 + rng.gauss(0, 0.01)), 2)
+        days.append(day)
+        prices.append(price)
+    return np.array(days), np.array(prices)
+
+
+PERIOD_KEYS = {
+    "weekly": lambda d: d - (d - 1) % 7,
+    "monthly": lambda d: date.fromordinal(d).replace(day=1).toordinal(),
+    "yearly": lambda d: date(date.fromordinal(d).year, 1, 1).toordinal(),
+}
+
+
+@pytest.mark.parametrize("period", sorted(PERIOD_KEYS))
+def test_aggregate_ohlc_matches_grouping(daily, period):
+    days, prices = daily
+    bars = spot_series.aggregate_ohlc(days, prices, period)
+    groups = [(start, [p for _, p in g]) for start, g in
+              groupby(zip(days.tolist(), prices.tolist()), key=lambda point: PERIOD_KEYS[period](point[0]))]
+    assert bars["t"] == [start for start, _ in groups]
+    assert bars["o"] == [g[0] for _, g in groups]
+    assert bars["h"] == [max(g) for _, g in groups]
+    assert bars["l"] == [min(g) for _, g in groups]
+    assert bars["c"] == [g[-1] for _, g in groups]
+    assert bars["n"] == [len(g) for _, g in groups]
+    assert bars["m"] == pytest.approx([sum(g) / len(g) for _, g in groups], abs=0.006)
+
+
+def test_aggregate_ohlc_mean_is_exact_in_cents():
+    # 37.475 exactly: a float sum would round it either way depending on order
+    bars = spot_series.aggregate_ohlc([737425, 737426, 737427, 737428], [37.41, 37.52, 37.45, 37.52], "weekly")
+    assert bars["m"] == [round(14990 / 4 / 100, 2)]
+
+
+def test_lttb_keeps_budget_and_endpoints(daily):
+    days, prices = daily
+    keep = spot_series.lttb_indices(days, prices, 100)
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == len(days) - 1
+    assert keep == sorted(set(keep))
+    # The extremes survive downsampling
+    assert int(np.argmax(prices)) in keep and int(np.argmin(prices)) in keep
+
+
+def test_lttb_short_series_is_untouched(daily):
+    days, prices = daily
+    assert spot_series.lttb_indices(days[:50], prices[:50], 100) == list(range(50))
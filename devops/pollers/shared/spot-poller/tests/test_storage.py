@@ -0,0 +1,83 @@
+import os
+from stat import S_IMODE
+
+
+def test_atomic_write_new_file_gets_default_mode(seed, tmp_path):
+    path = tmp_path / "spot-history-2026.json"
+    seed.atomic_write_bytes(path, b"[]")
+    assert path.read_bytes() == b"[]"
+    assert S_IMODE(path.stat().st_mode) == 0o666 & ~seed._UMASK
+
+
+def test_atomic_write_keeps_existing_mode(seed, tmp_path):
+    path = tmp_path / "spot-history-2026.json"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    seed.atomic_write_bytes(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert S_IMODE(path.stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["spot-history-2026.json"]
+
+
+def test_sidecars_only_for_large_tiers(seed, tmp_path):
+    year = tmp_path / "spot-history-2026.json"
+    shard = tmp_path / "hourly" / "2026" / "03" / "05" / "12.json"
+    shard.parent.mkdir(parents=True)
+    seed.publish_bytes(tmp_path, year, b'[{"spot": 1}]' * 50, "seed")
+    seed.publish_bytes(tmp_path, shard, b'[{"spot": 1}]', "hourly")
+    assert year.with_name(year.name + ".gz").exists()
+    assert not any(p.name.endswith(seed.SIDECAR_SUFFIXES) for p in shard.parent.iterdir())
+
+
+def test_unchanged_publish_does_not_recompress(seed, tmp_path, monkeypatch):
+    year = tmp_path / "spot-history-2026.json"
+    raw = b'[{"spot": 1}]' * 50
+    seed.publish_bytes(tmp_path, year, raw, "seed")
+    calls = []
+    monkeypatch.setattr(seed, "compress_sidecars", lambda data: calls.append(data) or {})
+    assert not seed.publish_bytes(tmp_path, year, raw, "seed")
+    assert calls == []
+    year.with_name(year.name + ".gz").unlink()
+    seed.publish_bytes(tmp_path, year, raw, "seed")
+    assert calls == [raw]
+
+
+def test_sidecars_removed_when_tier_excluded(seed, tmp_path):
+    shard = tmp_path / "hourly" / "2026" / "03" / "05" / "12.json"
+    shard.parent.mkdir(parents=True)
+    stale = shard.with_name(shard.name + ".gz")
+    stale.write_bytes(b"stale")
+    seed.publish_bytes(tmp_path, shard, b'[{"spot": 1}]', "hourly")
+    assert not stale.exists()
+
+
+def test_hourly_repoll_with_same_prices_advances_timestamp(seed, tmp_path):
+    import json
+    from datetime import date
+
+    day = date(2026, 3, 7)
+
+    def poll(ts):
+        entries = [seed.SpotEntry(2900.5, "Gold", "hourly", "StakTrakr", ts)]
+        return seed.save_hourly_file(tmp_path, entries, day, "12", overwrite=True)
+
+    assert poll("2026-03-07 12:00:00")
+    assert poll("2026-03-07 12:15:00")
+    path = tmp_path / "hourly" / "2026" / "03" / "07" / "12.json"
+    assert json.loads(path.read_text())[-1]["timestamp"] == "2026-03-07 12:15:00"
+
+
+def test_year_file_rows_load_as_spot_entries(seed, tmp_path):
+    import json
+
+    rows = [
+        {"spot": 2900.5, "metal": "Gold", "source": "seed", "provider": "StakTrakr", "timestamp": "2026-03-05 12:00:00"},
+        {"spot": 33.1, "metal": "Silver", "source": "seed", "provider": "StakTrakr", "timestamp": "2026-03-05 12:00:00",
+         "note": "hand-edited"},
+    ]
+    (tmp_path / "spot-history-2026.json").write_text(json.dumps(rows))
+    entries = seed.load_year_file(tmp_path, "2026")
+    assert isinstance(entries[0], seed.SpotEntry) and entries[0] == rows[0]
+    assert entries[1] == rows[1]  # extra keys: kept as a dict
+    seed.save_year_file(tmp_path, "2026", entries)
+    assert json.loads((tmp_path / "spot-history-2026.json").read_text()) == rows
@@ -11,21 +11,37 @@ Usage:
     python3 update-seed-data.py --start-date 2026-01-15 --end-date 2026-02-01
 """
 
+import abc
 import argparse
+import atexit
+import hashlib
 import json
+import math
 import os
+import random
 import sys
-from datetime import datetime, timedelta
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from itertools import accumulate, combinations
 from pathlib import Path
+from stat import S_IMODE
 
-import requests
-from dotenv import load_dotenv
+# requests, python-dotenv, concurrent.futures, http.server and the profiling
+# modules are imported where they are used: a --once run that finds nothing
+# to do never loads them.
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-API_BASE_URL = "https://api.metalpriceapi.com/v1"
+# Overridable so the poller can be pointed at stub_api.py for offline runs
+API_BASE_URL = os.getenv("METAL_PRICE_API_BASE_URL", "https://api.metalpriceapi.com/v1")
 TIMEFRAME_ENDPOINT = "/timeframe"
 LATEST_ENDPOINT = "/latest"
 CURRENCIES = "XAU,XAG,XPT,XPD"
@@ -38,8 +54,154 @@ SYMBOL_TO_METAL = {
     "XPD": "Palladium",
 }
 
+# FX symbols requested in the same /latest and /timeframe calls as the metals
+# (the API bills per request, not per symbol). Rates are "units per 1 USD",
+# kept per day in fx-history-{year}.json; build-seed-bundle.py turns them
+# into per-currency spot bundles.
+FX_CURRENCIES = [c.strip().upper() for c in os.getenv("SPOT_FX_CURRENCIES", "EUR,GBP,CAD,AUD,CHF,JPY").split(",") if c.strip()]
+REQUEST_CURRENCIES = ",".join([CURRENCIES] + FX_CURRENCIES)
+FX_FILE_PREFIX = "fx-history-"
+
 MAX_DAYS_PER_REQUEST = 365
 
+# HTTP client: keep-alive pool, jittered exponential backoff, request budget
+REQUEST_TIMEOUT_SECONDS = 30
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 30.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# 0 = unlimited. With a monthly quota, the count persists in API_USAGE_FILE
+# across runs; unlimited runs count in memory only.
+REQUESTS_PER_MINUTE = int(os.getenv("METAL_PRICE_API_PER_MINUTE", "0"))
+REQUESTS_PER_MONTH = int(os.getenv("METAL_PRICE_API_MONTHLY_QUOTA", "0"))
+API_USAGE_FILE = Path(os.getenv("METAL_PRICE_API_USAGE_FILE", Path(__file__).parent / ".api-usage.json"))
+USAGE_FLUSH_CALLS = 10  # metered requests between API_USAGE_FILE writes (also flushed on close)
+
+# On-disk /timeframe response cache. Ranges that ended more than
+# TIMEFRAME_CACHE_SETTLE_DAYS ago never change and never expire; anything
+# touching the last day gets a short TTL. Least-recently-used entries are
+# evicted past the size cap. METAL_PRICE_API_CACHE=0 disables it.
+TIMEFRAME_CACHE_DIR = Path(os.getenv("METAL_PRICE_API_CACHE_DIR", Path(__file__).parent / ".api-cache"))
+TIMEFRAME_CACHE_ENABLED = os.getenv("METAL_PRICE_API_CACHE", "1") != "0"
+TIMEFRAME_CACHE_TTL_SECONDS = 15 * 60
+TIMEFRAME_CACHE_SETTLE_DAYS = 1
+TIMEFRAME_CACHE_MAX_BYTES = int(os.getenv("METAL_PRICE_API_CACHE_MAX_MB", "64")) * 1024 * 1024
+
+# Hedged /latest polls: backups are "Name=base_url" pairs (comma separated,
+# read at call time so .env applies) speaking the MetalPriceAPI /latest shape.
+# A backup fires when the provider before it hasn't answered within its
+# observed p95 latency (clamped to the bounds below; default until sampled).
+PRIMARY_PROVIDER_NAME = "MetalPriceAPI"
+BACKUP_PROVIDERS_ENV = "SPOT_BACKUP_PROVIDERS"
+HEDGE_DELAY_DEFAULT_SECONDS = 2.0
+HEDGE_DELAY_MIN_SECONDS = 0.25
+HEDGE_DELAY_MAX_SECONDS = 10.0
+HEDGE_MIN_SAMPLES = 5
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Chunked catch-up: parallel /timeframe chunks under a token bucket.
+# Progress is checkpointed so a restart only re-fetches missing chunks.
+CATCHUP_WORKERS = int(os.getenv("CATCHUP_WORKERS", "1"))
+CATCHUP_RATE_PER_SECOND = float(os.getenv("CATCHUP_RATE_PER_SECOND", "2"))
+CATCHUP_CHUNK_RETRIES = 2
+CATCHUP_CHECKPOINT_FILENAME = ".catchup-checkpoint.json"
+
+# Rolling consolidated windows over the 15-min slot files, rewritten each
+# poll so a client warm-up is one request instead of one per slot.
+ROLLING_WINDOWS = {
+    "latest-24h.json": 24,
+    "latest-7d.json": 24 * 7,
+}
+
+# Closed UTC days of intraday shards are packed into one file per day per
+# tier (data/<tier>/YYYY/MM/DD.json) plus a monthly OHLC rollup (ohlc.json).
+INTRADAY_TIERS = ("hourly", "15min")
+INTRADAY_PACK_VERSION = 3  # 2: content-hash "source" replaces the local source_mtime_ns; 3: adds "listing"
+INTRADAY_ROLLUP_NAME = "ohlc.json"
+
+# Prometheus metrics: written as a text file after each poll (SPOT_METRICS_FILE,
+# picked up by home-poller/metrics-exporter.js) and/or served on a local port.
+METRICS_FILE = os.getenv("SPOT_METRICS_FILE", "")
+METRICS_PORT = int(os.getenv("SPOT_METRICS_PORT", "0"))
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+METRIC_HELP = {
+    "spot_api_requests_total": ("counter", "HTTP attempts to the spot API by endpoint and status."),
+    "spot_api_request_duration_seconds": ("histogram", "Spot API HTTP attempt latency."),
+    "spot_api_cache_requests_total": ("counter", "/timeframe response cache lookups by result."),
+    "spot_phase_duration_seconds": ("histogram", "Poll/updater phase durations."),
+    "spot_files_written_total": ("counter", "Files written by tier."),
+    "spot_bytes_written_total": ("counter", "Bytes written by tier."),
+    "spot_last_success_timestamp_seconds": ("gauge", "Unix time of the last successful write per tier."),
+    "spot_scheduler_slots_total": ("counter", "Scheduler slots fired."),
+    "spot_scheduler_missed_slots_total": ("counter", "Scheduler slots skipped because the loop woke late."),
+    "spot_scheduler_wakeup_lag_seconds": ("histogram", "Delay between a slot boundary and its wake-up."),
+    "spot_once_startup_seconds": ("gauge", "poller --once: interpreter start to ready (imports, config)."),
+    "spot_once_duration_seconds": ("gauge", "poller --once: wall time of the whole run."),
+    "spot_analytics_points_recomputed": ("gauge", "Analytics points recomputed by the last update."),
+    "spot_sidecar_bytes_written_total": ("counter", "Bytes of precompressed sidecars written by tier and encoding."),
+    "spot_files_unchanged_total": ("counter", "Writes skipped because the content hash matched the file on disk, by tier."),
+}
+
+# --profile reports: hot functions kept per phase
+PROFILE_TOP_FUNCTIONS = 15
+PROFILE_REPORT_VERSION = 1
+
+# Per-year summary cache so gap detection doesn't have to parse every year file.
+# Lives next to the year files; it is a local cache, not a published artifact.
+MANIFEST_FILENAME = ".spot-history-manifest.json"
+MANIFEST_VERSION = 1
+
+# Optional append-only journal for the year files: new entries past a year's
+# last timestamp are appended as NDJSON lines to spot-history-{year}.journal.ndjson
+# instead of rewriting the whole year. Readers overlay it; compaction folds it
+# back once it reaches JOURNAL_COMPACT_LINES, once its oldest entry is older
+# than JOURNAL_MAX_LAG_HOURS (checked after every poll), at the end of every
+# updater run and at bundle-build time. The browser only sees the year file,
+# so JOURNAL_MAX_LAG_HOURS plus one poll interval bounds how far it lags.
+JOURNAL_ENABLED = os.getenv("SPOT_HISTORY_JOURNAL", "0") == "1"
+JOURNAL_COMPACT_LINES = int(os.getenv("SPOT_HISTORY_JOURNAL_COMPACT_LINES", "256"))
+JOURNAL_MAX_LAG_HOURS = float(os.getenv("SPOT_HISTORY_JOURNAL_MAX_LAG_HOURS", "72"))
+JOURNAL_SUFFIX = ".journal.ndjson"
+
+# The large published files (year files, FX history, bundles, analytics) get
+# precompressed sidecars next to them (.gz always, .br when the brotli module
+# is installed), at maximum compression, so a static host can serve them with
+# Content-Encoding instead of compressing on every request. Written only when
+# the file's content changes, and for the ETag manifest. Intraday shards are
+# small and numerous, so they don't get sidecars by default. Sidecars are
+# build output and gitignored.
+SIDECARS_ENABLED = os.getenv("SPOT_SIDECARS", "1") == "1"
+SIDECAR_TIERS = frozenset(filter(None, (
+    t.strip() for t in os.getenv("SPOT_SIDECAR_TIERS", "seed,fx,bundle,analytics,etags").split(",")
+)))
+SIDECAR_SUFFIXES = (".gz", ".br")
+
+# Published path → {etag, size, updated} manifest for every data file, so a
+# client fetches one file to learn which shards changed. Writers compare the
+# content hash first and skip identical payloads. Intraday shards older than
+# ETAG_MANIFEST_SHARD_DAYS drop out; their packed day file stands in for them.
+ETAG_MANIFEST_FILENAME = "etag-manifest.json"
+ETAG_MANIFEST_VERSION = 1
+ETAG_MANIFEST_SHARD_DAYS = 7
+ETAG_LENGTH = 16  # hex chars of the SHA-256
+
+# Derived analytics published next to the seed bundle: per-metal moving
+# averages and volatility plus metal-pair ratios (one series file per year),
+# and latest values with period returns (summary file). Refreshed after every
+# year-file merge from the earliest merged day onward; earlier points are
+# reused and only the series files from that day's year on are rewritten.
+ANALYTICS_ENABLED = os.getenv("SPOT_ANALYTICS", "1") == "1"
+ANALYTICS_DIRNAME = "spot-history-analytics"  # {year}.json
+ANALYTICS_SUMMARY_FILENAME = "spot-history-analytics-summary.json"
+ANALYTICS_VERSION = 2  # 2: series split into per-year files
+ANALYTICS_LEGACY_FILENAME = "spot-history-analytics.json"  # version 1's single series file
+ANALYTICS_MA_WINDOWS = (50, 200)  # trading days
+ANALYTICS_VOL_WINDOW = 30  # daily log returns, annualized over ANALYTICS_TRADING_DAYS
+ANALYTICS_TRADING_DAYS = 252
+# Trailing returns as of the latest day (calendar days back)
+ANALYTICS_RETURN_PERIODS = {"1w": 7, "1m": 30, "3m": 91, "6m": 182, "1y": 365, "5y": 1826, "10y": 3652}
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -55,6 +217,8 @@ def load_config():
             print(f"Error: METAL_PRICE_API_KEY not in environment and {env_path} not found.")
             print("Copy .env.example to .env and add your API key.")
             sys.exit(1)
+        from dotenv import load_dotenv
+
         load_dotenv(env_path)
         api_key = os.getenv("METAL_PRICE_API_KEY")
     if not api_key or api_key == "your_api_key_here":
@@ -70,32 +234,826 @@ def resolve_data_dir():
         return Path(env_dir)
     return Path(__file__).parent.parent.parent / "data"
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def _label_str(labels):
+    if not labels:
+        return ""
+    inner = ",".join(
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in labels
+    )
+    return "{" + inner + "}"
+
+
+class Metrics:
+    """
+    Minimal thread-safe Prometheus registry: counters, gauges, histograms.
+
+    Series are keyed by (name, sorted labels). render() produces the text
+    exposition format; write_textfile() swaps it in atomically so a scraper
+    never reads half a file.
+    """
+
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[0][i] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def get(self, name, **labels):
+        """Current value of a counter or gauge (None if never set)."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key))
+
+    def render(self):
+        with self._lock:
+            series = {}  # name -> [(labels, lines)]
+            for (name, labels), value in self._counters.items():
+                series.setdefault(name, []).append((labels, [f"{name}{_label_str(labels)} {value:g}"]))
+            for (name, labels), value in self._gauges.items():
+                series.setdefault(name, []).append((labels, [f"{name}{_label_str(labels)} {value:.3f}"]))
+            for (name, labels), (counts, total, count) in self._histograms.items():
+                lines = [
+                    f"{name}_bucket{_label_str(labels + (('le', f'{bound:g}'),))} {n}"
+                    for bound, n in zip(self.buckets, counts)
+                ]
+                lines.append(f"{name}_bucket{_label_str(labels + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_label_str(labels)} {total:.6f}")
+                lines.append(f"{name}_count{_label_str(labels)} {count}")
+                series.setdefault(name, []).append((labels, lines))
+        out = []
+        for name in sorted(series):
+            kind, text = METRIC_HELP.get(name, ("untyped", name))
+            out.append(f"# HELP {name} {text}")
+            out.append(f"# TYPE {name} {kind}")
+            for _, lines in sorted(series[name]):
+                out.extend(lines)
+        return "\n".join(out) + "\n"
+
+    def write_textfile(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(path, self.render().encode("utf-8"))
+
+    def restore_gauges(self, path, name):
+        """
+        Reload one gauge family from a previous textfile, so one-shot runs
+        keep reporting when tiers they didn't touch last succeeded.
+        """
+        try:
+            lines = Path(path).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            if not line.startswith(name + "{"):
+                continue
+            try:
+                label_part, value = line[len(name) + 1:].rsplit("} ", 1)
+                labels = dict(
+                    pair.split("=", 1) for pair in label_part.split(",") if "=" in pair
+                )
+                labels = {k: v.strip('"') for k, v in labels.items()}
+                if self.get(name, **labels) is None:
+                    self.set(name, float(value), **labels)
+            except ValueError:
+                continue
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serve /metrics from a daemon thread; returns the server."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+METRICS = Metrics()
+
+
+def record_write(tier, nbytes):
+    """Count one written file for a tier and stamp its last-success time."""
+    METRICS.inc("spot_files_written_total", tier=tier)
+    METRICS.inc("spot_bytes_written_total", nbytes, tier=tier)
+    METRICS.set("spot_last_success_timestamp_seconds", time.time(), tier=tier)
+
+
+def record_unchanged(tier):
+    """Count a write skipped as identical; the tier is still current, so stamp it."""
+    METRICS.inc("spot_files_unchanged_total", tier=tier)
+    METRICS.set("spot_last_success_timestamp_seconds", time.time(), tier=tier)
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+
+class Profiler:
+    """
+    Per-phase cProfile + tracemalloc sections for --profile runs.
+
+    `with PROFILER.phase("merge"):` records wall time, CPU time, peak traced
+    memory and the hottest functions of the block. Phases may nest: the
+    outer phase's wall/CPU/peak include the inner one, but its function
+    table excludes it (one cProfile is active at a time). Repeated phases
+    are aggregated. Only the calling thread is profiled. When disabled,
+    phase() costs one attribute check.
+    """
+
+    def __init__(self, top=PROFILE_TOP_FUNCTIONS):
+        self.enabled = False
+        self.top = top
+        self._stack = []
+        self._phases = {}  # name -> aggregate, in first-seen order
+        self._started = None
+
+    def enable(self):
+        import tracemalloc
+
+        self.enabled = True
+        self._started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        import cProfile
+        import tracemalloc
+
+        parent = self._stack[-1] if self._stack else None
+        if parent:
+            parent["profile"].disable()
+            parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame = {
+            "name": name,
+            "profile": cProfile.Profile(),
+            "peak": 0,
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+        }
+        self._stack.append(frame)
+        frame["profile"].enable()
+        try:
+            yield
+        finally:
+            frame["profile"].disable()
+            wall = time.perf_counter() - frame["wall"]
+            cpu = time.process_time() - frame["cpu"]
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            self._add(name, wall, cpu, peak, frame["profile"])
+            if parent:
+                parent["peak"] = max(parent["peak"], peak)
+                tracemalloc.reset_peak()
+                parent["profile"].enable()
+
+    def _add(self, name, wall, cpu, peak, profile):
+        import pstats
+
+        agg = self._phases.get(name)
+        if agg is None:
+            agg = self._phases[name] = {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak": 0, "stats": None}
+        agg["calls"] += 1
+        agg["wall"] += wall
+        agg["cpu"] += cpu
+        agg["peak"] = max(agg["peak"], peak)
+        stats = pstats.Stats(profile)
+        if agg["stats"] is None:
+            agg["stats"] = stats
+        else:
+            agg["stats"].add(stats)
+
+    @staticmethod
+    def _function_label(func):
+        filename, line, name = func
+        if filename == "~":
+            return name  # builtins, e.g. <built-in method posix.stat>
+        parts = Path(filename).parts
+        for anchor in ("site-packages", "dist-packages", "devops"):
+            if anchor in parts:
+                parts = parts[parts.index(anchor) + 1:]
+                break
+        else:
+            parts = parts[-2:]
+        return f"{'/'.join(parts)}:{line}({name})"
+
+    def report(self, command=None):
+        """
+        Machine-readable report. Keys are sorted and values rounded so two
+        reports diff cleanly; times are milliseconds, memory KiB.
+        """
+        phases = {}
+        for name, agg in self._phases.items():
+            entries = sorted(
+                agg["stats"].stats.items(), key=lambda item: (-item[1][2], str(item[0]))
+            )[: self.top]
+            phases[name] = {
+                "calls": agg["calls"],
+                "wall_ms": round(agg["wall"] * 1000, 1),
+                "cpu_ms": round(agg["cpu"] * 1000, 1),
+                "peak_kib": round(agg["peak"] / 1024),
+                "hot": [
+                    {
+                        "function": self._function_label(func),
+                        "calls": nc,
+                        "tottime_ms": round(tt * 1000, 2),
+                        "cumtime_ms": round(ct * 1000, 2),
+                    }
+                    for func, (cc, nc, tt, ct, callers) in entries
+                ],
+            }
+        return {
+            "version": PROFILE_REPORT_VERSION,
+            "command": command or " ".join(Path(sys.argv[0]).name.split() + sys.argv[1:]),
+            "python": sys.version.split()[0],
+            "total_wall_ms": round((time.perf_counter() - self._started) * 1000, 1) if self._started else 0.0,
+            "phases": phases,
+        }
+
+    def write(self, path, command=None):
+        raw = json.dumps(self.report(command), indent=2, sort_keys=True) + "\n"
+        atomic_write_bytes(path, raw.encode("utf-8"))
+        return path
+
+
+def format_profile_summary(report):
+    """One line per phase for the console."""
+    lines = []
+    for name, phase in report["phases"].items():
+        hottest = phase["hot"][0]["function"] if phase["hot"] else "—"
+        lines.append(
+            f"  {name:<12} {phase['calls']:>3}x  wall {phase['wall_ms']:>9.1f}ms  "
+            f"cpu {phase['cpu_ms']:>9.1f}ms  peak {phase['peak_kib']:>7} KiB  hottest {hottest}"
+        )
+    return "\n".join(lines)
+
+
+PROFILER = Profiler()
+
 # ---------------------------------------------------------------------------
 # Year-file I/O
 # ---------------------------------------------------------------------------
 
-def load_year_file(data_dir, year):
-    """Load a spot-history-{year}.json file, returning a list (empty if missing)."""
+def _read_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import, before any writer threads exist (os.umask is process-wide)
+_UMASK = _read_umask()
+
+
+def atomic_write_bytes(path, raw):
+    """
+    Write bytes via a temp file in the same directory + os.replace().
+
+    Readers (the browser, rsync, git) see either the old file or the new
+    one — never a truncated write from a crashed or concurrent run. The
+    file keeps the mode of the one it replaces; a new file gets the
+    default 0666 & ~umask rather than mkstemp's owner-only 0600.
+    """
+    path = Path(path)
+    try:
+        mode = S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Published files and compressed sidecars
+# ---------------------------------------------------------------------------
+
+_brotli = None
+
+
+def _load_brotli():
+    """The brotli module, or None when it isn't installed (no .br sidecars)."""
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli
+        except ImportError:
+            brotli = False
+        _brotli = brotli
+    return _brotli or None
+
+
+def compress_sidecars(raw):
+    """{suffix: bytes} for every sidecar available here, at maximum compression."""
+    import gzip
+
+    sidecars = {".gz": gzip.compress(raw, compresslevel=9, mtime=0)}
+    brotli = _load_brotli()
+    if brotli is not None:
+        sidecars[".br"] = brotli.compress(raw, quality=11)
+    return sidecars
+
+
+def write_sidecars(path, raw, tier, force=True):
+    """
+    (Re)write the .gz/.br sidecars of `path`, whose content is `raw`.
+    Without force, sidecars that exist and are no older than the file are
+    kept. Sidecars this host can't produce (or all of them, with
+    SPOT_SIDECARS=0 or a tier outside SIDECAR_TIERS) are removed rather
+    than left stale.
+    """
+    path = Path(path)
+    wanted = SIDECARS_ENABLED and tier in SIDECAR_TIERS
+    if not force and wanted:
+        # Checked before compressing: recompressing an unchanged file at
+        # level 9/11 costs far more than the write it replaces
+        suffixes = (".gz", ".br") if _load_brotli() is not None else (".gz",)
+        mtime_ns = path.stat().st_mtime_ns
+        current = True
+        for suffix in suffixes:
+            try:
+                current = current and path.with_name(path.name + suffix).stat().st_mtime_ns >= mtime_ns
+            except FileNotFoundError:
+                current = False
+        if current:
+            return
+    sidecars = compress_sidecars(raw) if wanted else {}
+    for suffix in SIDECAR_SUFFIXES:
+        sidecar = path.with_name(path.name + suffix)
+        if suffix not in sidecars:
+            sidecar.unlink(missing_ok=True)
+            continue
+        atomic_write_bytes(sidecar, sidecars[suffix])
+        METRICS.inc("spot_sidecar_bytes_written_total", len(sidecars[suffix]), tier=tier, encoding=suffix[1:])
+
+
+def publish_bytes(data_dir, path, raw, tier):
+    """
+    Atomically write a published data file under `data_dir` and its
+    compressed sidecars, and record it in the ETag manifest.
+
+    Content whose hash matches the file on disk is not rewritten (and not
+    recompressed, unless a sidecar is missing or stale). The manifest's
+    record is trusted while the file's size and mtime still match it;
+    otherwise the file on disk is hashed.
+    Returns True if the file was written.
+    """
+    path = Path(path)
+    etag = content_etag(raw)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is None or st.st_size != len(raw):
+        unchanged = False
+    else:
+        record = etag_manifest(data_dir)["files"].get(_published_rel(data_dir, path))
+        unchanged = record == _etag_record(etag, st) or content_etag(path.read_bytes()) == etag
+    if unchanged:
+        record_unchanged(tier)
+    else:
+        atomic_write_bytes(path, raw)
+        record_write(tier, len(raw))
+    write_sidecars(path, raw, tier, force=not unchanged)
+    note_published(data_dir, path, etag)
+    return not unchanged
+
+
+def artifact_class(rel):
+    """Size-report class for a path relative to the data dir, or None if it isn't published."""
+    parts = Path(rel).parts
+    name = parts[-1]
+    if len(parts) == 1:
+        if name.startswith("spot-history-analytics") and name.endswith(".json"):
+            return "analytics"
+        if name.startswith(FX_FILE_PREFIX) and name.endswith(".json"):
+            return "fx"
+        if name.startswith("spot-history-") and name.endswith(".json") and name[13:17].isdigit():
+            return "seed"
+        if name.startswith("spot-history-") and name.endswith(".js"):
+            return "bundle"
+        return None
+    if parts[0].startswith("spot-history-") and name.endswith(".js"):
+        return "bundle"
+    if parts[0] == ANALYTICS_DIRNAME and name.endswith(".json"):
+        return "analytics"
+    if parts[0] in INTRADAY_TIERS and name.endswith(".json"):
+        if name.startswith("latest-"):
+            return "rolling"
+        if name == INTRADAY_ROLLUP_NAME:
+            return "rollup"
+        if len(parts) == 4:
+            return "packed"
+        if len(parts) == 5:
+            return parts[0]
+    return None
+
+
+def published_files(data_dir, classes=False):
+    """Every published data file under data_dir (as a Path, or (Path, class) with classes=True)."""
+    root = Path(data_dir)
+    for dirpath, _dirs, files in os.walk(root):
+        for name in sorted(files):
+            if name.endswith(SIDECAR_SUFFIXES) or name.startswith("."):
+                continue
+            path = Path(dirpath) / name
+            cls = artifact_class(path.relative_to(root).as_posix())
+            if cls is not None:
+                yield (path, cls) if classes else path
+
+
+def size_report(data_dir):
+    """
+    {class: {"files", "raw", <enc>, <enc>_files, <enc>_raw}} over the published
+    files, for enc in gz/br; <enc>_raw is the raw size of the files that have
+    that sidecar.
+    """
+    report = {}
+    for path, cls in published_files(data_dir, classes=True):
+        row = report.setdefault(cls, dict.fromkeys(
+            ["files", "raw", "gz", "gz_files", "gz_raw", "br", "br_files", "br_raw"], 0))
+        size = path.stat().st_size
+        row["files"] += 1
+        row["raw"] += size
+        for suffix in SIDECAR_SUFFIXES:
+            sidecar = path.with_name(path.name + suffix)
+            if sidecar.exists():
+                enc = suffix[1:]
+                row[enc] += sidecar.stat().st_size
+                row[enc + "_files"] += 1
+                row[enc + "_raw"] += size
+    return dict(sorted(report.items()))
+
+
+def _human_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:,.0f}{unit}" if unit == "B" else f"{n:,.1f}{unit}"
+        n /= 1024
+
+
+def format_size_report(report):
+    """One line per artifact class: raw size and what each sidecar encoding saves."""
+    lines = [f"{'class':<10} {'files':>7} {'raw':>10} {'gzip':>22} {'brotli':>22}"]
+    totals = dict.fromkeys(["files", "raw", "gz", "gz_raw", "br", "br_raw"], 0)
+    for cls, row in list(report.items()) + [("total", totals)]:
+        cells = []
+        for enc in ("gz", "br"):
+            if not row[enc + "_raw"]:
+                cells.append("—")
+                continue
+            cell = f"{_human_bytes(row[enc])} (-{100 * (1 - row[enc] / row[enc + '_raw']):.0f}%)"
+            if cls != "total" and row[enc + "_files"] < row["files"]:
+                cell += f" {row[enc + '_files']}/{row['files']}"
+            cells.append(cell)
+        lines.append(f"{cls:<10} {row['files']:>7,} {_human_bytes(row['raw']):>10} {cells[0]:>22} {cells[1]:>22}")
+        if cls != "total":
+            for key in totals:
+                totals[key] += row[key]
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Published ETag manifest
+# ---------------------------------------------------------------------------
+
+_etag_manifests = {}  # abspath of a data dir -> {"manifest": dict, "dirty": bool}
+_etag_lock = threading.RLock()  # the loop poller publishes from asyncio.to_thread workers
+
+
+def content_etag(raw):
+    """Short content hash published as a file's ETag."""
+    return hashlib.sha256(raw).hexdigest()[:ETAG_LENGTH]
+
+
+def _published_rel(data_dir, path):
+    return os.path.relpath(path, data_dir).replace(os.sep, "/")
+
+
+def _etag_record(etag, st):
+    updated = datetime.utcfromtimestamp(st.st_mtime).strftime(TIMESTAMP_FORMAT)
+    return {"etag": etag, "size": st.st_size, "updated": updated}
+
+
+def _empty_etag_manifest():
+    return {"v": ETAG_MANIFEST_VERSION, "generated": None, "polled": None, "files": {}}
+
+
+def _etag_state(data_dir):
+    key = os.path.abspath(data_dir)
+    with _etag_lock:
+        return _etag_manifests.get(key) or _load_etag_state(data_dir, key)
+
+
+def _load_etag_state(data_dir, key):
+    try:
+        manifest = json.loads((Path(data_dir) / ETAG_MANIFEST_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        manifest = None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("v") != ETAG_MANIFEST_VERSION
+        or not isinstance(manifest.get("files"), dict)
+    ):
+        manifest = _empty_etag_manifest()
+    state = _etag_manifests[key] = {"manifest": manifest, "dirty": False}
+    return state
+
+
+def etag_manifest(data_dir):
+    """The data dir's ETag manifest, loaded once per process and kept current in memory."""
+    return _etag_state(data_dir)["manifest"]
+
+
+def note_published(data_dir, path, etag):
+    """Record a published file (just written or confirmed current) in the manifest."""
+    state = _etag_state(data_dir)
+    rel = _published_rel(data_dir, path)
+    record = _etag_record(etag, os.stat(path))
+    with _etag_lock:
+        if state["manifest"]["files"].get(rel) != record:
+            state["manifest"]["files"][rel] = record
+            state["dirty"] = True
+
+
+def unpublish(data_dir, path):
+    """Remove a published file and its sidecars, and drop it from the manifest."""
+    path = Path(path)
+    for stale in [path] + [path.with_name(path.name + suffix) for suffix in SIDECAR_SUFFIXES]:
+        stale.unlink(missing_ok=True)
+    state = _etag_state(data_dir)
+    with _etag_lock:
+        if state["manifest"]["files"].pop(_published_rel(data_dir, path), None) is not None:
+            state["dirty"] = True
+
+
+def _etag_expired(rel, oldest):
+    """True for an intraday shard (<tier>/YYYY/MM/DD/<slot>.json) from before `oldest`."""
+    parts = rel.split("/")
+    if len(parts) != 5 or parts[0] not in INTRADAY_TIERS:
+        return False
+    try:
+        return date(int(parts[1]), int(parts[2]), int(parts[3])) < oldest
+    except ValueError:
+        return False
+
+
+def save_etag_manifest(data_dir, polled=None):
+    """
+    Write data/etag-manifest.json if any record changed or a poll is stamped.
+
+    Records of files that are gone, and of intraday shards older than
+    ETAG_MANIFEST_SHARD_DAYS, are dropped. Returns the number of files listed,
+    or None if nothing needed writing.
+    """
+    state = _etag_state(data_dir)
+    with _etag_lock:
+        manifest = state["manifest"]
+        if polled is not None:
+            manifest["polled"] = polled.strftime(TIMESTAMP_FORMAT)
+        elif not state["dirty"]:
+            return None
+        now = datetime.utcnow()
+        oldest = now.date() - timedelta(days=ETAG_MANIFEST_SHARD_DAYS)
+        root = Path(data_dir)
+        manifest["files"] = {
+            rel: record
+            for rel, record in sorted(manifest["files"].items())
+            if not _etag_expired(rel, oldest) and (root / rel).is_file()
+        }
+        manifest["generated"] = now.strftime(TIMESTAMP_FORMAT)
+        raw = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        path = root / ETAG_MANIFEST_FILENAME
+        atomic_write_bytes(path, raw)
+        record_write("etags", len(raw))
+        write_sidecars(path, raw, "etags")
+        state["dirty"] = False
+        return len(manifest["files"])
+
+
+def save_etag_manifests():
+    """Flush every ETag manifest this process touched."""
+    for data_dir in list(_etag_manifests):
+        save_etag_manifest(data_dir)
+
+
+def rebuild_etag_manifest(data_dir):
+    """Re-hash every published file (e.g. after a checkout) and rewrite the manifest."""
+    state = _etag_state(data_dir)
+    with _etag_lock:
+        state["manifest"]["files"] = {}
+        for path in published_files(data_dir):
+            note_published(data_dir, path, content_etag(path.read_bytes()))
+        state["dirty"] = True
+        return save_etag_manifest(data_dir)
+
+
+def load_year_file(data_dir, year, journal=True):
+    """
+    Load a spot-history-{year}.json file as a list of SpotEntry rows (empty if missing).
+
+    Entries still in the year's journal are overlaid (journal wins on a
+    duplicate key) unless journal=False.
+    """
     path = Path(data_dir) / f"spot-history-{year}.json"
-    if not path.exists():
-        return []
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    entries = []
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f, object_hook=entry_from_json)
+    if journal:
+        pending = read_journal(data_dir, year)
+        if pending:
+            entries, _ = merge_sorted_entries(entries, pending, overwrite=True)
+    return entries
 
 
 def save_year_file(data_dir, year, entries):
-    """Write entries to spot-history-{year}.json with compact formatting."""
+    """Write entries to spot-history-{year}.json with compact formatting.
+
+    Also refreshes the year's manifest record so the next gap check
+    doesn't need to re-parse the file.
+    """
     path = Path(data_dir) / f"spot-history-{year}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(entries, f, separators=(", ", ": "))
+    raw = json.dumps(entries, separators=(", ", ": "), default=entry_to_json).encode("utf-8")
+    publish_bytes(data_dir, path, raw, "seed")
+    manifest = load_manifest(data_dir)
+    stat = path.stat()
+    record = manifest["years"].get(str(year), {})
+    if (record.get("mtime_ns"), record.get("size")) != (stat.st_mtime_ns, stat.st_size):
+        manifest["years"][str(year)] = summarize_year(entries, raw, stat)
+        save_manifest(data_dir, manifest)
+
+# ---------------------------------------------------------------------------
+# Year-file journal
+# ---------------------------------------------------------------------------
+
+def journal_path(data_dir, year):
+    return Path(data_dir) / f"spot-history-{year}{JOURNAL_SUFFIX}"
+
+
+def journal_years(data_dir):
+    """Years that currently have a journal file, oldest first."""
+    years = []
+    for path in Path(data_dir).glob(f"spot-history-*{JOURNAL_SUFFIX}"):
+        year = path.name[len("spot-history-"):-len(JOURNAL_SUFFIX)]
+        if year.isdigit():
+            years.append(year)
+    return sorted(years)
+
+
+def read_journal(data_dir, year, path=None):
+    """
+    Entries in a year's journal, in append order (empty if there is none).
+
+    A torn last line from a crash mid-append is skipped, not fatal.
+    """
+    try:
+        with open(path or journal_path(data_dir, year), "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entry = json.loads(line, object_hook=entry_from_json)
+        except ValueError:
+            continue
+        if isinstance(entry, Mapping) and "timestamp" in entry and "metal" in entry:
+            entries.append(entry)
+    return entries
+
+
+def append_journal(data_dir, year, entries):
+    """Append entries to a year's journal (one fsync'd write). Returns the journal's line count."""
+    path = journal_path(data_dir, year)
+    raw = "".join(json.dumps(e, separators=(", ", ": "), default=entry_to_json) + "\n" for e in entries).encode("utf-8")
+    with open(path, "ab") as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    record_write("journal", len(raw))
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def compact_journal(data_dir, year):
+    """
+    Fold a year's journal into spot-history-{year}.json (atomic rewrite),
+    then remove it. Returns the number of journal entries folded in.
+
+    The journal is renamed aside first, so an append racing the compaction
+    starts a fresh journal instead of being deleted with the old one.
+    """
+    path = journal_path(data_dir, year)
+    folding = path.with_name(path.name + ".compacting")
+    if not folding.exists():  # else: resume a compaction that crashed midway
+        try:
+            os.replace(path, folding)
+        except FileNotFoundError:
+            return 0
+    pending = read_journal(data_dir, year, path=folding)
+    if pending:
+        existing = load_year_file(data_dir, year, journal=False)
+        merged, _ = merge_sorted_entries(existing, pending, overwrite=True)
+        save_year_file(data_dir, year, merged)
+    folding.unlink()
+    return len(pending)
+
+
+def compact_journals(data_dir):
+    """Compact every year's journal. Returns {year: entries folded}."""
+    return {year: compact_journal(data_dir, year) for year in journal_years(data_dir)}
+
+
+def compact_stale_journals(data_dir, now, max_lag_hours=None):
+    """
+    Compact the journals whose oldest entry is more than max_lag_hours
+    (default JOURNAL_MAX_LAG_HOURS) before `now` (naive UTC), so the
+    published year file never trails its journal by more than that.
+    Returns {year: entries folded} for the journals compacted.
+    """
+    if max_lag_hours is None:
+        max_lag_hours = JOURNAL_MAX_LAG_HOURS
+    cutoff = (now - timedelta(hours=max_lag_hours)).strftime("%Y-%m-%d %H:%M:%S")
+    folded = {}
+    for year in journal_years(data_dir):
+        pending = read_journal(data_dir, year)
+        if pending and min(e["timestamp"] for e in pending) <= cutoff:
+            folded[year] = compact_journal(data_dir, year)
+    return folded
 
 
 def save_hourly_file(data_dir, entries, date_obj, hour_str, overwrite=False):
     """
     Write hourly price snapshot to data/hourly/YYYY/MM/DD/HH.json.
 
-    Returns True if written, False if file already exists and overwrite=False.
-    Pass overwrite=True to always update (used by live pollers for 15-min freshness).
+    Returns True if written, False if the file already exists and
+    overwrite=False, or already holds these exact bytes. Pass
+    overwrite=True to update it (used by live pollers for 15-min freshness).
     """
     hourly_dir = (
         Path(data_dir) / "hourly"
@@ -107,9 +1065,8 @@ def save_hourly_file(data_dir, entries, date_obj, hour_str, overwrite=False):
     path = hourly_dir / f"{hour_str}.json"
     if path.exists() and not overwrite:
         return False
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
-    return True
+    raw = json.dumps(entries, separators=(",", ":"), default=entry_to_json).encode("utf-8")
+    return publish_bytes(data_dir, path, raw, "hourly")
 
 
 def save_15min_file(data_dir, entries, date_obj, hour_str, minute_str):
@@ -134,55 +1091,874 @@ def save_15min_file(data_dir, entries, date_obj, hour_str, minute_str):
     path = min_dir / filename
     if path.exists():
         return False
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
+    raw = json.dumps(entries, separators=(",", ":"), default=entry_to_json).encode("utf-8")
+    publish_bytes(data_dir, path, raw, "15min")
     return True
 
+
+def _list_15min_slots(data_dir, start, end):
+    """Map slot datetime → path for 15-min files with start < slot <= end (one listdir per day)."""
+    slots = {}
+    day = start.date()
+    while day <= end.date():
+        day_dir = (
+            Path(data_dir) / "15min"
+            / str(day.year)
+            / f"{day.month:02d}"
+            / f"{day.day:02d}"
+        )
+        try:
+            names = os.listdir(day_dir)
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            stem = name[:-5]
+            if not (name.endswith(".json") and len(stem) == 4 and stem.isdigit()):
+                continue
+            slot = datetime(day.year, day.month, day.day, int(stem[:2]), int(stem[2:]))
+            if start < slot <= end:
+                slots[slot] = day_dir / name
+        day += timedelta(days=1)
+    return slots
+
+
+def update_rolling_windows(data_dir, now, windows=None):
+    """
+    Rewrite data/15min/latest-24h.json and latest-7d.json from the slot files.
+
+    The per-slot HHMM.json files stay the source of truth. Slots already
+    consolidated in the widest existing window file are reused, so a poll
+    only reads slot files that are new since the last rewrite. Each window
+    is written atomically as:
+        {"generated": ts, "window_hours": N,
+         "slots": [{"slot": "YYYY-MM-DD HH:MM", "entries": [...]}, ...]}
+    Returns {filename: slot_count}.
+    """
+    windows = windows or ROLLING_WINDOWS
+    base = Path(data_dir) / "15min"
+    widest_name = max(windows, key=windows.get)
+    on_disk = _list_15min_slots(data_dir, now - timedelta(hours=windows[widest_name]), now)
+
+    known = {}
+    try:
+        previous = json.loads((base / widest_name).read_text(encoding="utf-8"))
+        for slot in previous.get("slots", []):
+            key = datetime.strptime(slot["slot"], "%Y-%m-%d %H:%M")
+            if key in on_disk:
+                known[key] = slot["entries"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    for key, path in on_disk.items():
+        if key in known:
+            continue
+        try:
+            known[key] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+
+    counts = {}
+    base.mkdir(parents=True, exist_ok=True)
+    for name, hours in windows.items():
+        cutoff = now - timedelta(hours=hours)
+        slots = [
+            {"slot": key.strftime("%Y-%m-%d %H:%M"), "entries": known[key]}
+            for key in sorted(known)
+            if key > cutoff
+        ]
+        payload = {
+            "generated": now.strftime(TIMESTAMP_FORMAT),
+            "window_hours": hours,
+            "slots": slots,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        publish_bytes(data_dir, base / name, raw, "rolling")
+        counts[name] = len(slots)
+    return counts
+
+# ---------------------------------------------------------------------------
+# Intraday packing and OHLC rollups
+# ---------------------------------------------------------------------------
+
+def ohlc_summary(entries):
+    """Per-metal open/high/low/close/mean/count for entries sorted by timestamp."""
+    by_metal = {}
+    for entry in entries:
+        spot = entry.get("spot")
+        if not isinstance(spot, (int, float)) or spot <= 0:
+            continue
+        by_metal.setdefault(entry["metal"], []).append(spot)
+    return {
+        metal: {
+            "open": spots[0],
+            "high": max(spots),
+            "low": min(spots),
+            "close": spots[-1],
+            "mean": round(sum(spots) / len(spots), 4),
+            "count": len(spots),
+        }
+        for metal, spots in sorted(by_metal.items())
+    }
+
+
+def combine_ohlc(summaries):
+    """Fold per-period OHLC dicts (in chronological order) into one per metal."""
+    combined = {}
+    for summary in summaries:
+        for metal, bar in summary.items():
+            acc = combined.get(metal)
+            if acc is None:
+                combined[metal] = dict(bar)
+                continue
+            total = acc["count"] + bar["count"]
+            acc["mean"] = round((acc["mean"] * acc["count"] + bar["mean"] * bar["count"]) / total, 4)
+            acc["high"] = max(acc["high"], bar["high"])
+            acc["low"] = min(acc["low"], bar["low"])
+            acc["close"] = bar["close"]
+            acc["count"] = total
+    return dict(sorted(combined.items()))
+
+
+def _packed_day_header(path):
+    """A packed day file's fields before "ohlc" (version, shards, hashes), without parsing its entries."""
+    raw = path.read_bytes()
+    cut = raw.find(b',"ohlc":')
+    return json.loads(raw[:cut] + b"}" if cut > 0 else raw)
+
+
+def pack_intraday_day(data_dir, tier, day, force=False):
+    """
+    Pack every shard of one day into data/<tier>/YYYY/MM/DD.json.
+
+    Shards are left in place (clients and health checks still read the
+    current hour). The packed file records the shard count, a hash of the
+    shard names and sizes ("listing") and a hash of their names and
+    contents ("source"); none of them use mtimes, which differ on every
+    clone or rsync. An unchanged day is skipped without opening its
+    shards when the listing matches and every shard is older than the
+    packed file. Otherwise the shards are hashed, and only a changed source
+    (a late backfill, a rewritten shard) repacks the day.
+    Returns True if the packed file was (re)written.
+    """
+    month_dir = Path(data_dir) / tier / str(day.year) / f"{day.month:02d}"
+    day_dir = month_dir / f"{day.day:02d}"
+    packed_path = month_dir / f"{day.day:02d}.json"
+    try:
+        shards = sorted(
+            (e for e in os.scandir(day_dir) if e.is_file() and e.name.endswith(".json")),
+            key=lambda e: e.name,
+        )
+    except FileNotFoundError:
+        return False
+    if not shards:
+        return False
+    stats = [shard.stat() for shard in shards]
+    listing = hashlib.sha256(
+        "".join(f"{shard.name}:{st.st_size}\n" for shard, st in zip(shards, stats)).encode("utf-8")
+    ).hexdigest()[:ETAG_LENGTH]
+
+    previous = None
+    if not force:
+        try:
+            packed_mtime_ns = packed_path.stat().st_mtime_ns
+            previous = _packed_day_header(packed_path)
+            if not (previous.get("version") == INTRADAY_PACK_VERSION and previous.get("shards") == len(shards)):
+                previous = None
+        except (OSError, ValueError, AttributeError):
+            previous = None
+        # A same-size rewrite keeps the listing, but not the shard's mtime
+        # below the packed file's
+        if (previous is not None and previous.get("listing") == listing
+                and all(st.st_mtime_ns < packed_mtime_ns for st in stats)):
+            return False
+
+    digest = hashlib.sha256()
+    contents = []
+    for shard in shards:
+        try:
+            with open(shard.path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"  Warning: skipping unreadable shard {shard.path}: {e}")
+            continue
+        digest.update(f"{shard.name}:{len(raw)}\n".encode("utf-8"))
+        digest.update(raw)
+        contents.append((shard, raw))
+    source = digest.hexdigest()[:ETAG_LENGTH]
+    if previous is not None and previous.get("source") == source and previous.get("listing") == listing:
+        return False
+
+    entries = []
+    for shard, raw in contents:
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            print(f"  Warning: skipping unreadable shard {shard.path}: {e}")
+            continue
+        if isinstance(data, list):
+            entries.extend(data)
+    entries.sort(key=_entry_key)
+
+    payload = {
+        "version": INTRADAY_PACK_VERSION,
+        "date": day.isoformat(),
+        "tier": tier,
+        "shards": len(shards),
+        "listing": listing,
+        "source": source,
+        "ohlc": ohlc_summary(entries),
+        "entries": entries,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    publish_bytes(data_dir, packed_path, raw, "packed")
+    return True
+
+
+def rollup_intraday_month(data_dir, tier, year, month):
+    """Write data/<tier>/YYYY/MM/ohlc.json from the month's packed day files."""
+    month_dir = Path(data_dir) / tier / str(year) / f"{month:02d}"
+    days = {}
+    for name in sorted(os.listdir(month_dir)):
+        if not (name.endswith(".json") and len(name) == 7 and name[:2].isdigit()):
+            continue
+        try:
+            packed = json.loads((month_dir / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        days[packed["date"]] = packed.get("ohlc", {})
+    payload = {
+        "version": INTRADAY_PACK_VERSION,
+        "month": f"{year}-{month:02d}",
+        "tier": tier,
+        "ohlc": combine_ohlc(days.values()),
+        "days": days,
+    }
+    publish_bytes(data_dir, month_dir / INTRADAY_ROLLUP_NAME, json.dumps(payload, separators=(",", ":")).encode("utf-8"), "rollup")
+    return len(days)
+
+
+def _intraday_days(data_dir, tier):
+    """Yield every date that has a shard directory under data/<tier>/."""
+    root = Path(data_dir) / tier
+    for year_dir in sorted(p for p in root.glob("[0-9][0-9][0-9][0-9]") if p.is_dir()):
+        for month_dir in sorted(p for p in year_dir.glob("[0-9][0-9]") if p.is_dir()):
+            for day_dir in sorted(p for p in month_dir.glob("[0-9][0-9]") if p.is_dir()):
+                try:
+                    yield datetime(int(year_dir.name), int(month_dir.name), int(day_dir.name)).date()
+                except ValueError:
+                    continue
+
+
+def pack_closed_days(data_dir, today, tiers=INTRADAY_TIERS, lookback_days=None, force=False):
+    """
+    Pack every closed UTC day (before `today`) and refresh touched monthly rollups.
+
+    lookback_days limits the scan to the most recent N closed days, which
+    is what the hourly poller uses; None packs the whole tree.
+    Returns {tier: {"days": packed_count, "months": rollup_count}}.
+    """
+    oldest = today - timedelta(days=lookback_days) if lookback_days else None
+    summary = {}
+    for tier in tiers:
+        months = set()
+        packed = 0
+        for day in _intraday_days(data_dir, tier):
+            if day >= today or (oldest and day < oldest):
+                continue
+            if pack_intraday_day(data_dir, tier, day, force=force):
+                packed += 1
+                months.add((day.year, day.month))
+        for year, month in sorted(months):
+            rollup_intraday_month(data_dir, tier, year, month)
+        summary[tier] = {"days": packed, "months": len(months)}
+    return summary
+
+# ---------------------------------------------------------------------------
+# Seed-history manifest
+# ---------------------------------------------------------------------------
+
+def _empty_manifest():
+    return {"version": MANIFEST_VERSION, "years": {}}
+
+
+def load_manifest(data_dir):
+    """Load the year-file manifest, returning an empty one if missing or unreadable."""
+    path = Path(data_dir) / MANIFEST_FILENAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return _empty_manifest()
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_VERSION
+        or not isinstance(manifest.get("years"), dict)
+    ):
+        return _empty_manifest()
+    return manifest
+
+
+def save_manifest(data_dir, manifest):
+    """Write the year-file manifest."""
+    path = Path(data_dir) / MANIFEST_FILENAME
+    atomic_write_bytes(path, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def summarize_year(entries, raw, stat):
+    """
+    Build the manifest record for one year file.
+
+    entries: parsed list, raw: the file's bytes, stat: os.stat_result of the file.
+    min/max only consider well-formed "YYYY-MM-DD HH:MM:SS" timestamps.
+    """
+    first = None
+    last = None
+    metals = set()
+    for entry in entries:
+        metal = entry.get("metal")
+        if metal:
+            metals.add(metal)
+        ts = entry.get("timestamp", "")
+        try:
+            datetime.strptime(ts, TIMESTAMP_FORMAT)
+        except (TypeError, ValueError):
+            continue
+        if first is None or ts < first:
+            first = ts
+        if last is None or ts > last:
+            last = ts
+    return {
+        "count": len(entries),
+        "min": first,
+        "max": last,
+        "metals": sorted(metals),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def _scan_year_file(path):
+    """Fully read and parse one year file into a manifest record."""
+    with open(path, "rb") as f:
+        raw = f.read()
+        stat = os.fstat(f.fileno())
+    entries = json.loads(raw)
+    if not isinstance(entries, list):
+        entries = []
+    return summarize_year(entries, raw, stat)
+
+
+def _refresh_record(record, filepath):
+    """
+    Return (record, changed) for one year file.
+
+    Records whose mtime and size still match are trusted as-is. When the
+    mtime moved (git checkout, rsync) the file is hashed, and only a hash
+    mismatch triggers a full parse.
+    """
+    stat = filepath.stat()
+    if record and record.get("mtime_ns") == stat.st_mtime_ns and record.get("size") == stat.st_size:
+        return record, False
+    if record and record.get("size") == stat.st_size:
+        digest = hashlib.sha256(filepath.read_bytes()).hexdigest()
+        if digest == record.get("sha256"):
+            return dict(record, mtime_ns=stat.st_mtime_ns), True
+    return _scan_year_file(filepath), True
+
+
+def refresh_manifest(data_dir):
+    """Bring the manifest in line with the year files on disk. Returns (manifest, changed)."""
+    manifest = load_manifest(data_dir)
+    records = manifest["years"]
+    changed = False
+    seen = set()
+
+    for filepath in sorted(Path(data_dir).glob("spot-history-*.json")):
+        year = filepath.stem[len("spot-history-"):]
+        if not year.isdigit():
+            continue
+        seen.add(year)
+        record, updated = _refresh_record(records.get(year), filepath)
+        if updated:
+            records[year] = record
+            changed = True
+
+    for year in list(records):
+        if year not in seen:
+            del records[year]
+            changed = True
+
+    return manifest, changed
+
+
+def current_year_record(data_dir, year):
+    """Up-to-date manifest record for one year file (None if the file is missing)."""
+    filepath = Path(data_dir) / f"spot-history-{year}.json"
+    if not filepath.exists():
+        return None
+    manifest = load_manifest(data_dir)
+    record, updated = _refresh_record(manifest["years"].get(str(year)), filepath)
+    if updated:
+        manifest["years"][str(year)] = record
+        save_manifest(data_dir, manifest)
+    return record
+
+
+def seed_date_present(data_dir, date_str):
+    """
+    True if spot-history-{year}.json already has an entry dated date_str.
+
+    Answers from the journal and the manifest when date_str is at or past
+    the year's last entry (the daily noon-seed case); only dates inside the
+    year's range fall back to loading the file.
+    """
+    year = date_str[:4]
+    if any(e["timestamp"][:10] == date_str for e in read_journal(data_dir, year)):
+        return True
+    record = current_year_record(data_dir, year)
+    if record is None:
+        return False
+    latest = (record.get("max") or "")[:10]
+    if date_str == latest:
+        return True
+    if date_str > latest:
+        return False
+    return any(e.get("timestamp", "")[:10] == date_str for e in load_year_file(data_dir, year))
+
 # ---------------------------------------------------------------------------
 # Gap detection
 # ---------------------------------------------------------------------------
 
-def find_latest_date(data_dir):
-    """Scan all spot-history-*.json files and return the most recent date as a date object."""
-    data_path = Path(data_dir)
-    latest = None
-    for filepath in sorted(data_path.glob("spot-history-*.json")):
-        entries = json.load(open(filepath, "r", encoding="utf-8"))
-        for entry in entries:
-            ts = entry.get("timestamp", "")
+def find_latest_date(data_dir, persist=True):
+    """
+    Return the most recent seed date across all spot-history-*.json files.
+
+    Reads the manifest instead of parsing every year file; only years whose
+    content changed since the manifest was written are re-scanned. Pending
+    journal entries count too.
+    Pass persist=False to leave the manifest file untouched (dry runs).
+    """
+    manifest, changed = refresh_manifest(data_dir)
+    if changed and persist:
+        save_manifest(data_dir, manifest)
+    latest = max((r["max"] for r in manifest["years"].values() if r.get("max")), default=None)
+    for year in journal_years(data_dir):
+        for entry in read_journal(data_dir, year):
+            if latest is None or entry["timestamp"] > latest:
+                latest = entry["timestamp"]
+    if latest is None:
+        return None
+    return datetime.strptime(latest, TIMESTAMP_FORMAT).date()
+
+# ---------------------------------------------------------------------------
+# API interaction
+# ---------------------------------------------------------------------------
+
+class QuotaExceeded(RuntimeError):
+    """Raised when the configured monthly request budget is used up."""
+
+
+class RequestCancelled(RuntimeError):
+    """Raised by ApiClient.get when its cancel event is set between attempts."""
+
+
+class ApiClient:
+    """
+    Shared MetalPriceAPI client for the poller and the updater.
+
+    - One keep-alive requests.Session with a connection pool, so repeated
+      polls and catch-up chunks skip the TCP+TLS handshake.
+    - Connection errors, timeouts and 429/5xx responses are retried with
+      full-jitter exponential backoff (Retry-After is honoured on 429).
+    - Every HTTP attempt counts against a per-minute budget (callers wait)
+      and a per-month budget (QuotaExceeded). The monthly count is read
+      from usage_file once, kept in memory and written back every
+      USAGE_FLUSH_CALLS requests and on close(), so one-shot runs share a
+      single count. Without a monthly budget the file isn't touched.
+    - stats() reports call counts, status codes and latency.
+    """
+
+    def __init__(
+        self,
+        base_url=None,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        max_retries=MAX_RETRIES,
+        backoff_base=BACKOFF_BASE_SECONDS,
+        backoff_cap=BACKOFF_CAP_SECONDS,
+        per_minute=REQUESTS_PER_MINUTE,
+        per_month=REQUESTS_PER_MONTH,
+        usage_file=API_USAGE_FILE,
+        pool_size=8,
+    ):
+        self.base_url = (base_url or API_BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.per_minute = per_minute
+        self.per_month = per_month
+        self.usage_file = Path(usage_file) if usage_file else None
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._recent = deque()  # monotonic send times within the last minute
+        self._usage = None  # {"month", "requests"}, loaded on first use
+        self._unsaved = 0  # requests counted since usage_file was last written
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.status_counts = Counter()
+        self.latencies = deque(maxlen=500)
+
+    # -- budget -------------------------------------------------------------
+
+    def _load_usage(self, month=None):
+        month = month or datetime.utcnow().strftime("%Y-%m")
+        if self.usage_file and self.usage_file.exists():
             try:
-                dt = datetime.strptime(ts, "%Y-%m-%d %H:%M:%S").date()
-                if latest is None or dt > latest:
-                    latest = dt
-            except ValueError:
+                usage = json.loads(self.usage_file.read_text(encoding="utf-8"))
+                if usage.get("month") == month:
+                    return usage
+            except (OSError, ValueError):
+                pass
+        return {"month": month, "requests": 0}
+
+    def _month_usage(self):
+        """This month's count (caller holds _lock); a new month starts from the file's record."""
+        month = datetime.utcnow().strftime("%Y-%m")
+        if self._usage is None or self._usage["month"] != month:
+            self._flush_usage()
+            self._usage = self._load_usage(month) if self.per_month else {"month": month, "requests": 0}
+        return self._usage
+
+    def _flush_usage(self):
+        """
+        Add the unsaved requests to usage_file's count (caller holds _lock).
+        Re-reading it first keeps the requests of other processes sharing
+        the file.
+        """
+        if not self._unsaved or not self.usage_file:
+            return
+        usage = self._load_usage(self._usage["month"])
+        usage["requests"] += self._unsaved
+        atomic_write_bytes(self.usage_file, json.dumps(usage).encode("utf-8"))
+        self._usage = usage
+        self._unsaved = 0
+
+    def _acquire(self):
+        """Block until the per-minute budget allows a request; count it toward the month."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 60:
+                    self._recent.popleft()
+                if not self.per_minute or len(self._recent) < self.per_minute:
+                    usage = self._month_usage()
+                    if self.per_month and usage["requests"] >= self.per_month:
+                        raise QuotaExceeded(
+                            f"Monthly API budget used: {usage['requests']}/{self.per_month} "
+                            f"requests in {usage['month']}"
+                        )
+                    usage["requests"] += 1
+                    if self.per_month:
+                        self._unsaved += 1
+                        if self._unsaved >= USAGE_FLUSH_CALLS:
+                            self._flush_usage()
+                    self._recent.append(now)
+                    return
+                wait = 60 - (now - self._recent[0])
+            time.sleep(wait)
+
+    def usage(self):
+        """Return {"month": "YYYY-MM", "requests": N} for the current month."""
+        with self._lock:
+            return dict(self._month_usage())
+
+    def flush_usage(self):
+        """Write the monthly count to usage_file now, if any request is unsaved."""
+        with self._lock:
+            self._flush_usage()
+
+    def close(self):
+        """Persist the monthly count and close the connection pool."""
+        self.flush_usage()
+        self.session.close()
+
+    # -- requests -----------------------------------------------------------
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(self.backoff_cap, retry_after)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get(self, endpoint, params, cancel=None):
+        """
+        GET {base_url}{endpoint} and return the decoded JSON body.
+        Raises requests exceptions once retries are exhausted, and
+        RuntimeError when the API answers success=false. Setting the
+        optional `cancel` event stops further attempts (RequestCancelled).
+        """
+        import requests
+
+        url = f"{self.base_url}{endpoint}"
+        attempt = 0
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise RequestCancelled(f"{endpoint}: cancelled")
+            self._acquire()
+            started = time.perf_counter()
+            try:
+                resp = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(endpoint, None, time.perf_counter() - started)
+                if attempt >= self.max_retries:
+                    self.failures += 1
+                    raise
+                error = e
+                retry_after = None
+            else:
+                self._record(endpoint, resp.status_code, time.perf_counter() - started)
+                if resp.status_code not in RETRYABLE_STATUS or attempt >= self.max_retries:
+                    if not resp.ok:
+                        self.failures += 1
+                    resp.raise_for_status()
+                    break
+                error = f"HTTP {resp.status_code}"
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+            delay = self._backoff(attempt, retry_after)
+            attempt += 1
+            self.retries += 1
+            print(f"  {endpoint}: {error} — retry {attempt}/{self.max_retries} in {delay:.1f}s", flush=True)
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise RequestCancelled(f"{endpoint}: cancelled after {attempt} attempt(s)")
+
+        data = resp.json()
+        if not data.get("success", False):
+            self.failures += 1
+            error_info = data.get("error", {})
+            msg = error_info.get("info", error_info.get("message", "Unknown API error"))
+            raise RuntimeError(f"API error: {msg}")
+        return data
+
+    def _record(self, endpoint, status, elapsed):
+        status = str(status) if status is not None else "error"
+        with self._lock:
+            self.calls += 1
+            self.status_counts[status] += 1
+            self.latencies.append(elapsed)
+        METRICS.inc("spot_api_requests_total", endpoint=endpoint, status=status)
+        METRICS.observe("spot_api_request_duration_seconds", elapsed, endpoint=endpoint)
+
+    def stats(self):
+        """Snapshot of call counts, status codes, latency and monthly usage."""
+        with self._lock:
+            samples = sorted(self.latencies)
+            stats = {
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures,
+                "status": dict(self.status_counts),
+                "latency_ms": None,
+            }
+            if samples:
+                stats["latency_ms"] = {
+                    "min": round(samples[0] * 1000, 1),
+                    "p50": round(samples[len(samples) // 2] * 1000, 1),
+                    "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 1),
+                    "max": round(samples[-1] * 1000, 1),
+                }
+            stats["month"] = dict(self._month_usage())
+        return stats
+
+
+def _parse_retry_after(value):
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+_client = None
+
+
+def get_client():
+    """Return the process-wide ApiClient, creating it on first use (closed at exit)."""
+    global _client
+    if _client is None:
+        _client = ApiClient()
+        atexit.register(_client.close)
+    return _client
+
+
+class ResponseCache:
+    """
+    Persistent cache of successful API responses, one JSON file per key.
+
+    Keys are the request parameters minus the API key. A file's mtime is
+    bumped on every hit, so eviction past max_bytes drops the least
+    recently used entries first. Entries with an expiry are dropped once
+    they pass it; entries without one are kept until evicted.
+    """
+
+    def __init__(self, directory=TIMEFRAME_CACHE_DIR, max_bytes=TIMEFRAME_CACHE_MAX_BYTES,
+                 enabled=TIMEFRAME_CACHE_ENABLED):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(endpoint, params):
+        parts = {k: v for k, v in params.items() if k != "api_key"}
+        return endpoint + "?" + "&".join(f"{k}={parts[k]}" for k in sorted(parts))
+
+    def _path(self, key):
+        return self.directory / (hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + ".json")
+
+    def get(self, key):
+        """Return the cached body for key, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            record = None
+        if record and record.get("key") == key:
+            expires = record.get("expires")
+            if expires is None or expires > time.time():
+                os.utime(path)  # LRU: last access = mtime
+                with self._lock:
+                    self.hits += 1
+                METRICS.inc("spot_api_cache_requests_total", result="hit")
+                return record["body"]
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self.misses += 1
+        METRICS.inc("spot_api_cache_requests_total", result="miss")
+        return None
+
+    def put(self, key, body, ttl=None):
+        """Store body under key; ttl=None means it never expires."""
+        if not self.enabled:
+            return
+        record = {
+            "key": key,
+            "stored": int(time.time()),
+            "expires": time.time() + ttl if ttl is not None else None,
+            "body": body,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self._path(key), json.dumps(record, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self.stores += 1
+        self._evict()
+
+    def _entries(self):
+        try:
+            scan = [e for e in os.scandir(self.directory) if e.name.endswith(".json")]
+        except FileNotFoundError:
+            return []
+        entries = []
+        for entry in scan:
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
                 continue
-    return latest
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self):
+        """This run's hit/miss counters plus what is on disk."""
+        entries = self._entries()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "directory": str(self.directory),
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+
+def format_cache_stats(stats):
+    """One-line summary of ResponseCache.stats() for logs."""
+    if not stats["enabled"]:
+        return "Cache: disabled"
+    return (f"Cache: {stats['hits']} hits, {stats['misses']} misses, {stats['stores']} stored, "
+            f"{stats['evictions']} evicted | {stats['entries']} entries, "
+            f"{stats['bytes'] / 1024 / 1024:.1f} of {stats['max_bytes'] / 1024 / 1024:.0f} MB "
+            f"in {stats['directory']}")
+
+
+_cache = None
+
+
+def get_response_cache():
+    """Return the process-wide ResponseCache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
+
+
+def timeframe_cache_ttl(end_date, today=None):
+    """None (never expires) for settled ranges, else TIMEFRAME_CACHE_TTL_SECONDS."""
+    today = today or datetime.utcnow().date()
+    end = end_date if not isinstance(end_date, str) else datetime.strptime(end_date, "%Y-%m-%d").date()
+    if end < today - timedelta(days=TIMEFRAME_CACHE_SETTLE_DAYS):
+        return None
+    return TIMEFRAME_CACHE_TTL_SECONDS
 
-# ---------------------------------------------------------------------------
-# API interaction
-# ---------------------------------------------------------------------------
 
 def fetch_timeframe(api_key, start_date, end_date):
     """
-    Call MetalPriceAPI /timeframe endpoint.
+    Call MetalPriceAPI /timeframe endpoint, through the response cache.
     Returns the raw JSON response dict or raises on error.
     Dates are date objects or 'YYYY-MM-DD' strings.
     """
-    url = f"{API_BASE_URL}{TIMEFRAME_ENDPOINT}"
     params = {
         "api_key": api_key,
         "start_date": str(start_date),
         "end_date": str(end_date),
         "base": "USD",
-        "currencies": CURRENCIES,
+        "currencies": REQUEST_CURRENCIES,
     }
-    resp = requests.get(url, params=params, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
-    if not data.get("success", False):
-        error_info = data.get("error", {})
-        msg = error_info.get("info", error_info.get("message", "Unknown API error"))
-        raise RuntimeError(f"API error: {msg}")
+    cache = get_response_cache()
+    key = cache.key(TIMEFRAME_ENDPOINT, params)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    data = get_client().get(TIMEFRAME_ENDPOINT, params)
+    cache.put(key, data, ttl=timeframe_cache_ttl(end_date))
     return data
 
 
@@ -191,25 +1967,307 @@ def fetch_latest(api_key):
     Call MetalPriceAPI /latest endpoint.
     Returns the raw JSON response dict or raises on error.
     """
-    url = f"{API_BASE_URL}{LATEST_ENDPOINT}"
     params = {
         "api_key": api_key,
         "base": "USD",
-        "currencies": CURRENCIES,
+        "currencies": REQUEST_CURRENCIES,
     }
-    resp = requests.get(url, params=params, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
-    if not data.get("success", False):
-        error_info = data.get("error", {})
-        msg = error_info.get("info", error_info.get("message", "Unknown API error"))
-        raise RuntimeError(f"API error: {msg}")
-    return data
+    return get_client().get(LATEST_ENDPOINT, params)
+
+
+# ---------------------------------------------------------------------------
+# Spot providers and hedged /latest
+# ---------------------------------------------------------------------------
+
+class SpotProvider(abc.ABC):
+    """
+    A source of /latest rates. Subclasses set `name` (recorded as the
+    `provider` of the entries they produce) and implement latest_rates().
+    """
+
+    name = "unknown"
+
+    @abc.abstractmethod
+    def latest_rates(self, cancel=None):
+        """
+        Return MetalPriceAPI-style rates: {"XAU": units of metal per 1 USD, ...}.
+        `cancel` is a threading.Event set once another provider has won;
+        implementations should stop retrying when it is set.
+        """
+
+
+class MetalPriceApiProvider(SpotProvider):
+    """Any endpoint speaking MetalPriceAPI's /latest — the real API, a mirror or stub_api.py."""
+
+    def __init__(self, name, api_key, client):
+        self.name = name
+        self.api_key = api_key
+        self.client = client
+
+    def latest_rates(self, cancel=None):
+        params = {"api_key": self.api_key, "base": "USD", "currencies": REQUEST_CURRENCIES}
+        return self.client.get(LATEST_ENDPOINT, params, cancel=cancel).get("rates") or {}
+
+
+def _env_key_name(name):
+    return "".join(c if c.isalnum() else "_" for c in name.upper()) + "_API_KEY"
+
+
+def build_providers(api_key, backups=None):
+    """
+    Primary MetalPriceAPI provider on the shared client, then the backups
+    from SPOT_BACKUP_PROVIDERS ("Name=base_url,..."). A backup's key comes
+    from <NAME>_API_KEY and falls back to api_key. Backups get their own
+    client without the monthly budget, which is MetalPriceAPI's.
+    """
+    providers = [MetalPriceApiProvider(PRIMARY_PROVIDER_NAME, api_key, get_client())]
+    spec = os.getenv(BACKUP_PROVIDERS_ENV, "") if backups is None else backups
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, base_url = item.partition("=")
+        if not sep or not name.strip() or not base_url.strip():
+            raise ValueError(f"{BACKUP_PROVIDERS_ENV}: expected Name=base_url, got {item!r}")
+        name = name.strip()
+        client = ApiClient(base_url=base_url.strip(), per_month=0, usage_file=None)
+        providers.append(MetalPriceApiProvider(name, os.getenv(_env_key_name(name), api_key), client))
+    return providers
+
+
+def _valid_rates(rates):
+    """True if rates has a positive rate for at least one metal we track."""
+    return isinstance(rates, dict) and any(
+        isinstance(rates.get(symbol), (int, float)) and rates[symbol] > 0
+        for symbol in SYMBOL_TO_METAL
+    )
+
+
+class HedgedFetcher:
+    """
+    First-valid-answer-wins /latest across an ordered provider list.
+
+    The primary is asked first. If it hasn't answered within its hedge
+    delay (p95 of its recent successful latencies), the next provider is
+    asked as well; a provider that fails outright hands over immediately.
+    The first valid rates payload wins. Each fetch runs on its own
+    executor, shut down without waiting once a winner is in: requests
+    already on the wire finish (bounded by the client timeout), but the
+    losers' retries are cancelled so they stop spending quota. Raises
+    RuntimeError if every provider fails.
+    """
+
+    def __init__(self, providers, default_delay=HEDGE_DELAY_DEFAULT_SECONDS,
+                 min_delay=HEDGE_DELAY_MIN_SECONDS, max_delay=HEDGE_DELAY_MAX_SECONDS):
+        if not providers:
+            raise ValueError("HedgedFetcher needs at least one provider")
+        self.providers = list(providers)
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._latency = {p.name: deque(maxlen=100) for p in self.providers}
+        self.wins = Counter()
+        self.errors = Counter()
+        self.hedges = 0
+
+    def hedge_delay(self, provider):
+        with self._lock:
+            samples = sorted(self._latency[provider.name])
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return self.default_delay
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return min(self.max_delay, max(self.min_delay, p95))
+
+    def _call(self, provider, cancel):
+        started = time.perf_counter()
+        rates = provider.latest_rates(cancel=cancel)
+        if not _valid_rates(rates):
+            raise RuntimeError("no usable rates in response")
+        with self._lock:
+            self._latency[provider.name].append(time.perf_counter() - started)
+        return rates
+
+    def fetch(self):
+        """Return (provider_name, rates) from the first provider with a valid answer."""
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        queue = list(self.providers)
+        pending = {}
+        errors = []
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(queue), thread_name_prefix="hedge")
+
+        def launch():
+            provider = queue.pop(0)
+            pending[executor.submit(self._call, provider, cancel)] = provider
+            return provider
+
+        try:
+            newest = launch()
+            while pending:
+                timeout = self.hedge_delay(newest) if queue else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        rates = future.result()
+                    except Exception as e:
+                        with self._lock:
+                            self.errors[provider.name] += 1
+                        errors.append(f"{provider.name}: {e}")
+                        continue
+                    with self._lock:
+                        self.wins[provider.name] += 1
+                    return provider.name, rates
+                if queue:
+                    # Nothing back within the newest provider's p95: hedge. A
+                    # provider that failed outright hands over straight away.
+                    if not done:
+                        with self._lock:
+                            self.hedges += 1
+                    newest = launch()
+        finally:
+            # Losers stop at their next retry; nothing joins their threads.
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise RuntimeError("All spot providers failed — " + "; ".join(errors))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "providers": [p.name for p in self.providers],
+                "wins": dict(self.wins),
+                "errors": dict(self.errors),
+                "hedges": self.hedges,
+            }
+
+
+_hedged = None
+
+
+def get_hedged_fetcher(api_key):
+    """Return the process-wide HedgedFetcher, building the provider list on first use."""
+    global _hedged
+    if _hedged is None:
+        _hedged = HedgedFetcher(build_providers(api_key))
+    return _hedged
+
+
+def fetch_latest_hedged(api_key):
+    """/latest across the primary and any backups. Returns (provider_name, rates)."""
+    return get_hedged_fetcher(api_key).fetch()
+
+
+def format_hedge_stats(stats):
+    """One-line summary of HedgedFetcher.stats() for logs."""
+    wins = ", ".join(f"{name} {stats['wins'].get(name, 0)}" for name in stats["providers"])
+    line = f"Providers: wins {wins} | {stats['hedges']} hedged"
+    if stats["errors"]:
+        line += " | errors " + ", ".join(f"{k} {v}" for k, v in sorted(stats["errors"].items()))
+    return line
+
+
+def format_client_stats(stats):
+    """One-line summary of ApiClient.stats() for logs."""
+    line = f"API: {stats['calls']} calls, {stats['retries']} retries, {stats['failures']} failed"
+    if stats["latency_ms"]:
+        lat = stats["latency_ms"]
+        line += f" | latency p50 {lat['p50']}ms p95 {lat['p95']}ms max {lat['max']}ms"
+    month = stats["month"]
+    line += f" | {month['month']}: {month['requests']} requests"
+    if REQUESTS_PER_MONTH:
+        line += f" of {REQUESTS_PER_MONTH}"
+    return line
 
 # ---------------------------------------------------------------------------
 # Data transformation
 # ---------------------------------------------------------------------------
 
+class SpotEntry(Mapping):
+    """
+    One price point: a slotted, read-only stand-in for the entry dict.
+
+    Every entry the poller handles is one: new ones from the API, and the
+    year-file and journal rows that load_year_file()/read_journal() parse
+    with object_hook=entry_from_json. (build-seed-bundle.py reduces each
+    year straight to its own column store instead.) Reads like the dict
+    it replaces (entry["spot"], .get(), dict(entry)), but without a
+    per-entry hash table, and the repeated metal/source/provider strings
+    are shared (constants here, interned by entry_from_json), so a year
+    of rows takes about 40% of the memory. replace() makes a re-tagged
+    copy without going through a dict. json.dumps needs
+    default=entry_to_json; it emits the same key order as the dicts it
+    replaces.
+    """
+
+    __slots__ = ("spot", "metal", "source", "provider", "timestamp")
+    FIELDS = __slots__
+
+    def __init__(self, spot, metal, source, provider, timestamp):
+        self.spot = spot
+        self.metal = metal
+        self.source = source
+        self.provider = provider
+        self.timestamp = timestamp
+
+    def replace(self, **changes):
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values.update(changes)
+        return SpotEntry(**values)
+
+    def to_dict(self):
+        return {
+            "spot": self.spot,
+            "metal": self.metal,
+            "source": self.source,
+            "provider": self.provider,
+            "timestamp": self.timestamp,
+        }
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    # Direct versions of the Mapping mixins, for the per-row reads of whole-history scans
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __repr__(self):
+        return f"SpotEntry({self.to_dict()!r})"
+
+
+def entry_to_json(obj):
+    """json.dumps default= hook: SpotEntry → dict at the serialization boundary."""
+    if isinstance(obj, SpotEntry):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def entry_from_json(obj):
+    """
+    json.loads object_hook= counterpart: an object with exactly the entry
+    fields becomes a SpotEntry. Anything else (a hand-edited row with extra
+    or missing keys) stays a dict, so saving it back loses nothing.
+    """
+    if obj.keys() == _ENTRY_FIELD_SET:
+        return SpotEntry(
+            obj["spot"], sys.intern(obj["metal"]), sys.intern(obj["source"]),
+            sys.intern(obj["provider"]), obj["timestamp"],
+        )
+    return obj
+
+
+_ENTRY_FIELD_SET = frozenset(SpotEntry.FIELDS)
+
+
 def invert_rates(rates_dict):
     """
     Convert API rates (units of metal per 1 USD) to $/oz.
@@ -226,59 +2284,137 @@ def transform_to_seed_format(rates_by_date):
     Input format (from /timeframe):
         {"2026-02-12": {"XAU": 0.000345, ...}, "2026-02-13": {...}}
 
-    Output: list of seed entries sorted by timestamp then metal.
+    Output: list of SpotEntry seed entries sorted by timestamp then metal.
     """
     entries = []
     for date_str, symbols in sorted(rates_by_date.items()):
         inverted = invert_rates(symbols)
+        timestamp = f"{date_str} 12:00:00"
         for symbol in ["XAU", "XAG", "XPT", "XPD"]:
             if symbol not in inverted:
                 continue
-            metal = SYMBOL_TO_METAL[symbol]
-            entries.append({
-                "spot": inverted[symbol],
-                "metal": metal,
-                "source": "seed",
-                "provider": "StakTrakr",
-                "timestamp": f"{date_str} 12:00:00",
-            })
+            entries.append(SpotEntry(inverted[symbol], SYMBOL_TO_METAL[symbol], "seed", "StakTrakr", timestamp))
     return entries
 
 
-def transform_latest_to_seed(rates, date_str):
+def transform_latest_to_seed(rates, date_str, provider="StakTrakr"):
     """
     Convert a /latest response's rates into seed entries for a single date.
 
     Input: {"XAU": 0.000345, "XAG": 0.012, ...}, "2026-02-13"
-    Output: list of 4 seed entries
+    Output: list of 4 SpotEntry seed entries. `provider` is recorded on each entry;
+    the curated year files keep the default "StakTrakr".
     """
     inverted = invert_rates(rates)
     entries = []
     for symbol in ["XAU", "XAG", "XPT", "XPD"]:
         if symbol not in inverted:
             continue
-        metal = SYMBOL_TO_METAL[symbol]
-        entries.append({
-            "spot": inverted[symbol],
-            "metal": metal,
-            "source": "seed",
-            "provider": "StakTrakr",
-            "timestamp": f"{date_str} 12:00:00",
-        })
+        entries.append(SpotEntry(inverted[symbol], SYMBOL_TO_METAL[symbol], "seed", provider, f"{date_str} 12:00:00"))
     return entries
 
 # ---------------------------------------------------------------------------
 # Merge logic
 # ---------------------------------------------------------------------------
 
-def merge_into_year_files(data_dir, new_entries, dry_run=False, overwrite=False):
+def _entry_key(entry):
+    return (entry["timestamp"], entry["metal"])
+
+
+def merge_sorted_entries(existing, new_entries, overwrite=False):
+    """
+    Merge new entries into an already-sorted year list without re-sorting it.
+
+    existing must be sorted by (timestamp, metal), which is how every year
+    file is written. Entries newer than the tail are appended directly;
+    otherwise only the suffix from the first insertion point (found by
+    binary search) is merged. Duplicate keys keep the existing entry, or
+    take the new one when overwrite=True.
+
+    Returns (merged, count) — count is len(new_entries) when overwriting,
+    else the number of entries actually added.
+    """
+    incoming = {}
+    for entry in new_entries:
+        incoming[_entry_key(entry)] = entry
+    incoming_keys = sorted(incoming)
+    if not incoming_keys:
+        return existing, 0
+
+    keys = [_entry_key(e) for e in existing]
+    if any(a > b for a, b in zip(keys, keys[1:])):
+        # Hand-edited or legacy file — restore the invariant once
+        existing = sorted(existing, key=_entry_key)
+        keys.sort()
+
+    # Fast path: everything is newer than the current tail
+    if not keys or incoming_keys[0] > keys[-1]:
+        added = [incoming[k] for k in incoming_keys]
+        return existing + added, (len(new_entries) if overwrite else len(added))
+
+    start = bisect_left(keys, incoming_keys[0])
+    merged = existing[:start]
+    added = 0
+    i, j = start, 0
+    while i < len(keys) or j < len(incoming_keys):
+        if j == len(incoming_keys) or (i < len(keys) and keys[i] < incoming_keys[j]):
+            merged.append(existing[i])
+            i += 1
+        elif i == len(keys) or incoming_keys[j] < keys[i]:
+            merged.append(incoming[incoming_keys[j]])
+            added += 1
+            j += 1
+        else:
+            merged.append(incoming[incoming_keys[j]] if overwrite else existing[i])
+            i += 1
+            j += 1
+
+    return merged, (len(new_entries) if overwrite else added)
+
+
+def _journal_append(data_dir, year, entries, overwrite):
+    """
+    Journal entries newer than the year file's tail. Returns the count
+    added, or None when some entry is older and needs the full merge.
+    """
+    record = current_year_record(data_dir, year)
+    if record is None or min(e["timestamp"] for e in entries) <= (record.get("max") or ""):
+        return None
+    if not overwrite:
+        pending = {_entry_key(e) for e in read_journal(data_dir, year)}
+        fresh = {}
+        for entry in entries:
+            if _entry_key(entry) not in pending:
+                fresh[_entry_key(entry)] = entry
+        entries = list(fresh.values())
+        if not entries:
+            return 0
+    if append_journal(data_dir, year, entries) >= JOURNAL_COMPACT_LINES:
+        compact_journal(data_dir, year)
+    return len(entries)
+
+
+def merge_into_year_files(data_dir, new_entries, dry_run=False, overwrite=False, journal=None, analytics=None):
     """
     Merge new entries into the appropriate year files.
     Deduplicates by (timestamp, metal). Returns a dict of {year: count_added}.
 
     If overwrite=True, existing entries with the same (timestamp, metal) key
     are replaced with the new values (used for noon seed updates).
+    Year files are written atomically (temp file + rename).
+
+    With journal=True (default: SPOT_HISTORY_JOURNAL), entries that all lie
+    past the year file's last timestamp are appended to the year's journal
+    instead; anything older goes through the full rewrite, which also folds
+    in the journal.
+
+    With analytics=True (default: SPOT_ANALYTICS), the analytics files are
+    refreshed from the earliest merged day once anything was written.
     """
+    if journal is None:
+        journal = JOURNAL_ENABLED
+    if analytics is None:
+        analytics = ANALYTICS_ENABLED
     # Group new entries by year
     by_year = {}
     for entry in new_entries:
@@ -286,39 +2422,592 @@ def merge_into_year_files(data_dir, new_entries, dry_run=False, overwrite=False)
         by_year.setdefault(year, []).append(entry)
 
     results = {}
-    for year, entries in sorted(by_year.items()):
-        existing = load_year_file(data_dir, year)
-
-        if overwrite:
-            # Build lookup of new entries by key
-            new_keys = {(e["timestamp"], e["metal"]): e for e in entries}
-            # Replace matching entries, keep non-matching ones
-            merged = [new_keys.pop((e["timestamp"], e["metal"]), e) for e in existing]
-            # Append any new entries that weren't replacements
-            remaining = list(new_keys.values())
-            merged.extend(remaining)
-            count = len(entries)
-        else:
-            # Build a set of existing (timestamp, metal) keys for dedup
-            existing_keys = {(e["timestamp"], e["metal"]) for e in existing}
-            # Filter to only truly new entries
-            to_add = [e for e in entries if (e["timestamp"], e["metal"]) not in existing_keys]
-            if not to_add:
+    with METRICS.timer("spot_phase_duration_seconds", phase="merge"), PROFILER.phase("seed_merge"):
+        for year, entries in sorted(by_year.items()):
+            if journal and not dry_run:
+                count = _journal_append(data_dir, year, entries, overwrite)
+                if count is not None:
+                    results[year] = count
+                    continue
+
+            existing = load_year_file(data_dir, year)
+            merged, count = merge_sorted_entries(existing, entries, overwrite=overwrite)
+
+            if not overwrite and count == 0:
                 results[year] = 0
                 continue
-            merged = existing + to_add
-            count = len(to_add)
 
-        # Sort by timestamp, then by metal name for consistent ordering
-        merged.sort(key=lambda e: (e["timestamp"], e["metal"]))
+            if not dry_run:
+                save_year_file(data_dir, year, merged)
+                # The rewrite already includes anything the journal held
+                journal_path(data_dir, year).unlink(missing_ok=True)
 
-        if not dry_run:
-            save_year_file(data_dir, year, merged)
+            results[year] = count
+
+    if analytics and not dry_run and any(results.values()):
+        since = min(entry["timestamp"] for entry in new_entries)[:10]
+        with METRICS.timer("spot_phase_duration_seconds", phase="analytics"):
+            update_analytics(data_dir, since)
+    return results
+
+# ---------------------------------------------------------------------------
+# FX history
+# ---------------------------------------------------------------------------
+
+def extract_fx_rates(rates):
+    """FX_CURRENCIES rates (units per 1 USD) from an API rates dict, to 6 significant digits."""
+    fx = {}
+    for code in FX_CURRENCIES:
+        rate = rates.get(code) if isinstance(rates, dict) else None
+        if isinstance(rate, (int, float)) and rate > 0:
+            fx[code] = float(f"{rate:.6g}")
+    return fx
+
+
+def fx_path(data_dir, year):
+    return Path(data_dir) / f"{FX_FILE_PREFIX}{year}.json"
 
-        results[year] = count
 
+def load_fx_file(data_dir, year):
+    """{"YYYY-MM-DD": {code: rate}} for one year (empty if missing or unreadable)."""
+    try:
+        with open(fx_path(data_dir, year), "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    rates = raw.get("rates") if isinstance(raw, dict) else None
+    return rates if isinstance(rates, dict) else {}
+
+
+def merge_fx_history(data_dir, fx_by_date, dry_run=False):
+    """
+    Merge {"YYYY-MM-DD": {code: rate}} into fx-history-{year}.json (new values
+    win). Returns {year: days added or changed}; unchanged years aren't rewritten.
+    """
+    by_year = {}
+    for day, fx in fx_by_date.items():
+        if fx:
+            by_year.setdefault(day[:4], {})[day] = fx
+
+    results = {}
+    for year, days in sorted(by_year.items()):
+        rates = load_fx_file(data_dir, year)
+        changed = 0
+        for day, fx in days.items():
+            merged = dict(rates.get(day, {}), **fx)
+            if merged != rates.get(day):
+                rates[day] = merged
+                changed += 1
+        results[year] = changed
+        if changed and not dry_run:
+            body = {"base": "USD", "rates": {day: dict(sorted(rates[day].items())) for day in sorted(rates)}}
+            raw = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            publish_bytes(data_dir, fx_path(data_dir, year), raw, "fx")
     return results
 
+# ---------------------------------------------------------------------------
+# Derived analytics
+# ---------------------------------------------------------------------------
+# One daily series per metal (the last entry of each day), and one per pair
+# of the four API metals over the days both have a price, published as one
+# file per calendar year. Dates are stored as a first day plus day deltas
+# ("d0", "dd"); warm-up points of a rolling column are null. In memory the
+# series are whole and the day axis is a list of date ordinals.
+
+def year_file_years(data_dir):
+    """Years with a spot-history-{year}.json or a journal, oldest first."""
+    years = {p.stem[len("spot-history-"):] for p in Path(data_dir).glob("spot-history-*.json")}
+    return sorted({y for y in years if y.isdigit()} | set(journal_years(data_dir)))
+
+
+def _analytics_columns():
+    columns = [f"ma{w}" for w in ANALYTICS_MA_WINDOWS]
+    return columns + [f"vol{ANALYTICS_VOL_WINDOW}"]
+
+
+def _empty_series():
+    return dict({"days": [], "p": []}, **{name: [] for name in _analytics_columns()})
+
+
+def _encode_days(days):
+    if not days:
+        return {"d0": None, "dd": []}
+    return {"d0": date.fromordinal(days[0]).isoformat(), "dd": [b - a for a, b in zip(days, days[1:])]}
+
+
+def _decode_days(record):
+    if not record.get("d0"):
+        return []
+    return list(accumulate(record["dd"], initial=date.fromisoformat(record["d0"]).toordinal()))
+
+
+def analytics_path(data_dir, year):
+    return Path(data_dir) / ANALYTICS_DIRNAME / f"{year}.json"
+
+
+def _analytics_order(metals):
+    """The four API metals in SYMBOL_TO_METAL order, then any others by name."""
+    known = [m for m in SYMBOL_TO_METAL.values() if m in metals]
+    return known + sorted(set(metals) - set(known))
+
+
+def load_analytics(data_dir):
+    """
+    Decoded analytics state ({"metals": {...}, "ratios": {...}}) joined from
+    the per-year series files, or None when there are none or one is
+    unreadable or built with different windows.
+    """
+    paths = sorted(p for p in Path(data_dir, ANALYTICS_DIRNAME).glob("*.json") if p.stem.isdigit())
+    if not paths:
+        return None
+    state = {"metals": {}, "ratios": {}}
+    for path in paths:
+        try:
+            raw = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(raw, dict)
+            or raw.get("v") != ANALYTICS_VERSION
+            or raw.get("ma") != list(ANALYTICS_MA_WINDOWS)
+            or raw.get("vol") != ANALYTICS_VOL_WINDOW
+        ):
+            return None
+        for metal, record in raw.get("metals", {}).items():
+            series = state["metals"].setdefault(metal, _empty_series())
+            series["days"].extend(_decode_days(record))
+            for name in ["p"] + _analytics_columns():
+                series[name].extend(record[name])
+        for pair, record in raw.get("ratios", {}).items():
+            ratio = state["ratios"].setdefault(pair, {"days": [], "r": []})
+            ratio["days"].extend(_decode_days(record))
+            ratio["r"].extend(record["r"])
+    return state
+
+
+def analytics_daily_prices(entries, since=None):
+    """{metal: {date ordinal: price}} from year-file entries on or after `since` (ordinal)."""
+    daily = {}
+    for entry in entries:
+        spot = entry.get("spot")
+        if not isinstance(spot, (int, float)) or spot <= 0:
+            continue
+        try:
+            day = date.fromisoformat(entry["timestamp"][:10]).toordinal()
+        except (KeyError, TypeError, ValueError):
+            continue
+        if since is not None and day < since:
+            continue
+        # Year files are sorted by timestamp: the day's last entry wins
+        daily.setdefault(entry["metal"], {})[day] = spot
+    return daily
+
+
+# Log returns are summed as integers in units of 1e-12, exact at any length
+_VOL_FIXED_POINT = 10 ** 12
+
+
+def rolling_tail(series, start):
+    """
+    Recompute the rolling columns of `series` from index `start` onward,
+    reading the preceding prices as lookback. Every column is a running sum
+    over exact integers, O(1) per point: moving averages over cents, and
+    volatility over log returns in fixed point (sum and sum of squares), so
+    any start gives the same result as a full pass.
+    """
+    prices = series["p"]
+    n = len(prices)
+    cents = [round(p * 100) for p in prices[max(0, start - max(ANALYTICS_MA_WINDOWS)):]]
+    offset = n - len(cents)
+    for window in ANALYTICS_MA_WINDOWS:
+        column = series[f"ma{window}"]
+        del column[start:]
+        total = sum(cents[max(0, start - window) - offset:start - offset])
+        for i in range(start, n):
+            total += cents[i - offset]
+            if i >= window:
+                total -= cents[i - window - offset]
+            column.append(round(total / window / 100, 2) if i >= window - 1 else None)
+
+    window = ANALYTICS_VOL_WINDOW
+    column = series[f"vol{window}"]
+    del column[start:]
+    first = max(1, start - window + 1)
+    fixed = [round(math.log(prices[i] / prices[i - 1]) * _VOL_FIXED_POINT) for i in range(first, n)]
+    scale = math.sqrt(ANALYTICS_TRADING_DAYS) * 100 / _VOL_FIXED_POINT
+    column.extend([None] * min(first - start, n - start))  # index 0 has no return
+    total = squares = 0
+    for i in range(first, n):
+        r = fixed[i - first]
+        total += r
+        squares += r * r
+        if i - window >= first:
+            r = fixed[i - window - first]
+            total -= r
+            squares -= r * r
+        if i < start:
+            continue
+        if i < window:
+            column.append(None)
+            continue
+        # window·Σr² − (Σr)² = window·(window−1)·sample variance
+        column.append(round(math.sqrt((window * squares - total * total) / (window * (window - 1))) * scale, 2))
+
+
+def _ratio_tail(ratio, numerator, denominator, since):
+    """Truncate a pair's ratio series at `since` and rebuild it from the metals' tails."""
+    cut = bisect_left(ratio["days"], since)
+    del ratio["days"][cut:]
+    del ratio["r"][cut:]
+    prices = dict(zip(denominator["days"][bisect_left(denominator["days"], since):],
+                      denominator["p"][bisect_left(denominator["days"], since):]))
+    start = bisect_left(numerator["days"], since)
+    for day, price in zip(numerator["days"][start:], numerator["p"][start:]):
+        other = prices.get(day)
+        if other:
+            ratio["days"].append(day)
+            ratio["r"].append(float(f"{price / other:.5g}"))  # Silver/Platinum is ~0.04
+
+
+def _price_on_or_before(series, day):
+    i = bisect_left(series["days"], day + 1)
+    return series["p"][i - 1] if i else None
+
+
+def summarize_analytics(state):
+    """Latest values, trailing and calendar-year returns (percent) per metal and pair."""
+    summary = {"v": ANALYTICS_VERSION, "metals": {}, "ratios": {}}
+    last_days = []
+    for metal, series in state["metals"].items():
+        if not series["days"]:
+            continue
+        last, spot = series["days"][-1], series["p"][-1]
+        last_days.append(last)
+        record = {"date": date.fromordinal(last).isoformat(), "spot": spot}
+        for name in _analytics_columns():
+            record[name] = series[name][-1]
+        record["returns"] = {}
+        for period, days_back in ANALYTICS_RETURN_PERIODS.items():
+            if series["days"][0] > last - days_back:
+                continue
+            base = _price_on_or_before(series, last - days_back)
+            record["returns"][period] = round((spot / base - 1) * 100, 2)
+        # Calendar-year close vs the previous close (the first price for year one)
+        yearly = {}
+        base = series["p"][0]
+        for year in range(date.fromordinal(series["days"][0]).year, date.fromordinal(last).year + 1):
+            i = bisect_left(series["days"], date(year + 1, 1, 1).toordinal()) - 1
+            if series["days"][i] < date(year, 1, 1).toordinal():
+                continue
+            yearly[str(year)] = round((series["p"][i] / base - 1) * 100, 2)
+            base = series["p"][i]
+        record["yearly"] = yearly
+        summary["metals"][metal] = record
+    for pair, ratio in state["ratios"].items():
+        if not ratio["days"]:
+            continue
+        summary["ratios"][pair] = {
+            "date": date.fromordinal(ratio["days"][-1]).isoformat(),
+            "ratio": ratio["r"][-1],
+            "min": min(ratio["r"]),
+            "max": max(ratio["r"]),
+            "mean": float(f"{sum(ratio['r']) / len(ratio['r']):.5g}"),
+        }
+    summary["last"] = date.fromordinal(max(last_days)).isoformat() if last_days else None
+    return summary
+
+
+def _year_bounds(days, year):
+    return bisect_left(days, date(year, 1, 1).toordinal()), bisect_left(days, date(year + 1, 1, 1).toordinal())
+
+
+def save_analytics(data_dir, state, since_day=None):
+    """
+    Write the series files of the years from `since_day` (a date ordinal) on,
+    or of every year without it (removing files of years no longer covered,
+    and version 1's single file), then the summary. Returns bytes written.
+    """
+    spans = [s["days"] for s in state["metals"].values() if s["days"]]
+    first = date.fromordinal(min(d[0] for d in spans)).year if spans else 0
+    last = date.fromordinal(max(d[-1] for d in spans)).year if spans else -1
+    if since_day is not None:
+        first = max(first, date.fromordinal(since_day).year)
+    Path(data_dir, ANALYTICS_DIRNAME).mkdir(exist_ok=True)
+    written = 0
+    for year in range(first, last + 1):
+        metals = {}
+        for metal, series in state["metals"].items():
+            lo, hi = _year_bounds(series["days"], year)
+            if lo < hi:
+                metals[metal] = _encode_days(series["days"][lo:hi])
+                for name in ["p"] + _analytics_columns():
+                    metals[metal][name] = series[name][lo:hi]
+        ratios = {}
+        for pair, ratio in state["ratios"].items():
+            lo, hi = _year_bounds(ratio["days"], year)
+            if lo < hi:
+                ratios[pair] = dict(_encode_days(ratio["days"][lo:hi]), r=ratio["r"][lo:hi])
+        payload = {
+            "v": ANALYTICS_VERSION,
+            "ma": list(ANALYTICS_MA_WINDOWS),
+            "vol": ANALYTICS_VOL_WINDOW,
+            "year": year,
+            "metals": metals,
+            "ratios": ratios,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        publish_bytes(data_dir, analytics_path(data_dir, year), raw, "analytics")
+        written += len(raw)
+    if since_day is None:
+        for path in Path(data_dir, ANALYTICS_DIRNAME).glob("*.json"):
+            if not (path.stem.isdigit() and first <= int(path.stem) <= last):
+                unpublish(data_dir, path)
+        unpublish(data_dir, Path(data_dir) / ANALYTICS_LEGACY_FILENAME)
+    raw = json.dumps(summarize_analytics(state), separators=(",", ":")).encode("utf-8")
+    publish_bytes(data_dir, Path(data_dir) / ANALYTICS_SUMMARY_FILENAME, raw, "analytics")
+    return written + len(raw)
+
+
+def update_analytics(data_dir, since=None):
+    """
+    Refresh the analytics files after a merge. `since` is the earliest
+    merged date ("YYYY-MM-DD"): only year files from that year on are read,
+    only points on or after that day are recomputed, and only the series
+    files from that year on are rewritten. Without `since`, or when the
+    existing files can't be extended, everything is rebuilt.
+
+    Returns {"full": bool, "points": recomputed points, "bytes": written}.
+    """
+    state = load_analytics(data_dir)
+    since_day = date.fromisoformat(since[:10]).toordinal() if since else None
+    full = (
+        state is None
+        or since_day is None
+        or any(s["days"] and s["days"][0] >= since_day for s in state["metals"].values())
+    )
+    if full:
+        state, since_day = {"metals": {}, "ratios": {}}, None
+
+    with PROFILER.phase("analytics"):
+        daily = {}
+        for year in year_file_years(data_dir):
+            if since_day is not None and int(year) < date.fromordinal(since_day).year:
+                continue
+            for metal, prices in analytics_daily_prices(load_year_file(data_dir, year), since_day).items():
+                daily.setdefault(metal, {}).update(prices)
+
+        points = 0
+        start_day = since_day if since_day is not None else 0
+        # Rebuilt in a fixed order: a reload lists metals by first appearance
+        metals = state["metals"]
+        state["metals"] = {m: metals.get(m) or _empty_series() for m in _analytics_order(set(daily) | set(metals))}
+        for metal, series in state["metals"].items():
+            cut = bisect_left(series["days"], start_day)
+            del series["days"][cut:]
+            del series["p"][cut:]
+            tail = sorted(daily.get(metal, {}).items())
+            series["days"].extend(day for day, _ in tail)
+            series["p"].extend(price for _, price in tail)
+            rolling_tail(series, cut)
+            points += len(tail)
+
+        paired = [m for m in SYMBOL_TO_METAL.values() if m in state["metals"]]
+        ratios = state["ratios"]
+        state["ratios"] = {}
+        for numerator, denominator in combinations(paired, 2):
+            pair = f"{numerator}/{denominator}"
+            ratio = state["ratios"][pair] = ratios.get(pair) or {"days": [], "r": []}
+            _ratio_tail(ratio, state["metals"][numerator], state["metals"][denominator], start_day)
+
+        written = save_analytics(data_dir, state, since_day)
+    METRICS.set("spot_analytics_points_recomputed", points)
+    return {"full": full, "points": points, "bytes": written}
+
+# ---------------------------------------------------------------------------
+# Chunked catch-up
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def plan_chunks(start, end, max_days=MAX_DAYS_PER_REQUEST):
+    """Split [start, end] into consecutive (chunk_start, chunk_end) ranges of at most max_days."""
+    chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=max_days - 1), end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _uncovered(start, end, done):
+    """Return the sub-ranges of [start, end] not covered by the sorted (s, e) ranges in done."""
+    gaps = []
+    cursor = start
+    for s, e in sorted(done):
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, min(end, s - timedelta(days=1))))
+        cursor = max(cursor, e + timedelta(days=1))
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def load_checkpoint(data_dir):
+    """Return the pending catch-up checkpoint as {"start", "end", "done"} with dates, or None."""
+    path = Path(data_dir) / CATCHUP_CHECKPOINT_FILENAME
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        parse = lambda v: datetime.strptime(v, "%Y-%m-%d").date()
+        return {
+            "start": parse(raw["start"]),
+            "end": parse(raw["end"]),
+            "done": [(parse(s), parse(e)) for s, e in raw.get("done", [])],
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_checkpoint(data_dir, checkpoint):
+    path = Path(data_dir) / CATCHUP_CHECKPOINT_FILENAME
+    raw = {
+        "start": str(checkpoint["start"]),
+        "end": str(checkpoint["end"]),
+        "done": [[str(s), str(e)] for s, e in sorted(checkpoint["done"])],
+    }
+    atomic_write_bytes(path, json.dumps(raw, indent=2).encode("utf-8"))
+
+
+def clear_checkpoint(data_dir):
+    try:
+        (Path(data_dir) / CATCHUP_CHECKPOINT_FILENAME).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _fetch_chunk(api_key, chunk, bucket):
+    bucket.acquire()
+    data = fetch_timeframe(api_key, chunk[0], chunk[1])
+    return data.get("rates", {})
+
+
+def run_chunked_catchup(
+    api_key,
+    data_dir,
+    start,
+    end,
+    workers=CATCHUP_WORKERS,
+    rate=CATCHUP_RATE_PER_SECOND,
+    chunk_retries=CATCHUP_CHUNK_RETRIES,
+    dry_run=False,
+    log=print,
+):
+    """
+    Fetch [start, end] in MAX_DAYS_PER_REQUEST chunks on a bounded thread pool.
+
+    Requests go through a token bucket (`rate` per second). A chunk that
+    still fails after the client's own retries is re-queued up to
+    chunk_retries times without holding up the others. Each finished chunk
+    is merged into the year files as it arrives and recorded in a
+    checkpoint; a later run widens its range to any chunks an interrupted
+    run left missing. The checkpoint is removed once everything is in.
+    Analytics (SPOT_ANALYTICS) are refreshed once at the end, from the
+    earliest day any chunk added, rather than after every chunk.
+
+    Returns {"results": {year: count}, "days": n, "failed": [(start, end, error)]}.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    checkpoint = None if dry_run else load_checkpoint(data_dir)
+    if checkpoint:
+        start = min(start, checkpoint["start"])
+        end = max(end, checkpoint["end"])
+        done = list(checkpoint["done"])
+    else:
+        done = []
+    checkpoint = {"start": start, "end": end, "done": done}
+
+    chunks = [c for gap in _uncovered(start, end, done) for c in plan_chunks(gap[0], gap[1])]
+    results = {}
+    failed = []
+    days_returned = 0
+    if not chunks:
+        if not dry_run:
+            clear_checkpoint(data_dir)
+        return {"results": results, "days": 0, "failed": failed}
+
+    bucket = TokenBucket(rate, capacity=max(1, workers))
+    attempts = {chunk: 0 for chunk in chunks}
+    since = None
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {pool.submit(_fetch_chunk, api_key, chunk, bucket): chunk for chunk in chunks}
+        try:
+            while pending:
+                future = next(as_completed(pending))
+                chunk = pending.pop(future)
+                try:
+                    rates = future.result()
+                except Exception as e:
+                    attempts[chunk] += 1
+                    if attempts[chunk] <= chunk_retries:
+                        log(f"  {chunk[0]} to {chunk[1]}: FAILED ({e}) — retrying chunk "
+                            f"({attempts[chunk]}/{chunk_retries})")
+                        pending[pool.submit(_fetch_chunk, api_key, chunk, bucket)] = chunk
+                    else:
+                        log(f"  {chunk[0]} to {chunk[1]}: FAILED ({e}) — giving up")
+                        failed.append((chunk[0], chunk[1], str(e)))
+                    continue
+
+                entries = transform_to_seed_format(rates)
+                days_returned += len(rates)
+                merged = merge_into_year_files(data_dir, entries, dry_run=dry_run, analytics=False) if entries else {}
+                merge_fx_history(data_dir, {day: extract_fx_rates(r) for day, r in rates.items()}, dry_run=dry_run)
+                if any(merged.values()):
+                    first = min(entry["timestamp"] for entry in entries)[:10]
+                    since = first if since is None else min(since, first)
+                for year, count in merged.items():
+                    results[year] = results.get(year, 0) + count
+                log(f"  {chunk[0]} to {chunk[1]}: OK ({len(rates)} day{'s' if len(rates) != 1 else ''} returned)")
+                if not dry_run:
+                    checkpoint["done"].append(chunk)
+                    save_checkpoint(data_dir, checkpoint)
+        finally:
+            # Also after an interrupted run: later merges only refresh from their own day
+            if since is not None and ANALYTICS_ENABLED and not dry_run:
+                with METRICS.timer("spot_phase_duration_seconds", phase="analytics"):
+                    update_analytics(data_dir, since)
+
+    if not dry_run and not failed:
+        clear_checkpoint(data_dir)
+    return {"results": results, "days": days_returned, "failed": failed}
+
 # ---------------------------------------------------------------------------
 # CLI and main
 # ---------------------------------------------------------------------------
@@ -344,11 +3033,112 @@ def parse_args():
         default=None,
         help="Override end date (YYYY-MM-DD). Default: today.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=CATCHUP_WORKERS,
+        help=f"Concurrent /timeframe chunk requests (default: {CATCHUP_WORKERS}).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=CATCHUP_RATE_PER_SECOND,
+        help=f"Max chunk requests per second, 0 = unlimited (default: {CATCHUP_RATE_PER_SECOND:g}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk /timeframe response cache (no reads, no writes).",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print the /timeframe response cache size and location, then exit.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="update-seed-data-profile.json",
+        default=None,
+        metavar="REPORT",
+        help="Profile each phase (cProfile + tracemalloc) and write a JSON report "
+             "(default: update-seed-data-profile.json).",
+    )
+    parser.add_argument(
+        "--pack-intraday",
+        action="store_true",
+        help="Pack every closed day of hourly/15min shards and rebuild monthly OHLC rollups, then exit.",
+    )
+    parser.add_argument(
+        "--compact-journal",
+        action="store_true",
+        help="Fold every spot-history-{year}.journal.ndjson into its year file, then exit.",
+    )
+    parser.add_argument(
+        "--size-report",
+        action="store_true",
+        help="Print raw vs .gz/.br sidecar sizes per published artifact class, then exit.",
+    )
+    parser.add_argument(
+        "--rebuild-analytics",
+        action="store_true",
+        help=f"Recompute {ANALYTICS_DIRNAME}/ and {ANALYTICS_SUMMARY_FILENAME} from every year file, then exit.",
+    )
+    parser.add_argument(
+        "--rebuild-etags",
+        action="store_true",
+        help=f"Re-hash every published data file into {ETAG_MANIFEST_FILENAME}, then exit.",
+    )
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
+    if args.profile:
+        PROFILER.enable()
+    try:
+        run_updater(args)
+    finally:
+        save_etag_manifests()
+        if args.profile:
+            report = PROFILER.report()
+            PROFILER.write(args.profile)
+            print(f"\nProfile ({report['total_wall_ms']:.0f}ms total) → {args.profile}")
+            print(format_profile_summary(report))
+
+
+def run_updater(args):
+    if args.no_cache:
+        get_response_cache().enabled = False
+    if args.cache_stats:
+        print(format_cache_stats(get_response_cache().stats()))
+        return
+    if args.pack_intraday:
+        data_dir = resolve_data_dir()
+        today = datetime.utcnow().date()
+        for tier, counts in pack_closed_days(data_dir, today, force=True).items():
+            print(f"{tier}: packed {counts['days']} day(s), rebuilt {counts['months']} monthly rollup(s)")
+        return
+    if args.compact_journal:
+        folded = compact_journals(resolve_data_dir())
+        for year, count in folded.items():
+            print(f"spot-history-{year}.json: folded in {count} journal entries")
+        if not folded:
+            print("No journals to compact.")
+        return
+    if args.size_report:
+        print(format_size_report(size_report(resolve_data_dir())))
+        return
+    if args.rebuild_etags:
+        count = rebuild_etag_manifest(resolve_data_dir())
+        print(f"{ETAG_MANIFEST_FILENAME}: {count:,} published files")
+        return
+    if args.rebuild_analytics:
+        outcome = update_analytics(resolve_data_dir())
+        print(f"{ANALYTICS_DIRNAME}/: {outcome['points']:,} daily points, "
+              f"{outcome['bytes'] // 1024}KB written with the summary")
+        return
+
     api_key = load_config()
     data_dir = resolve_data_dir()
 
@@ -359,7 +3149,8 @@ def main():
     if args.start_date:
         start = datetime.strptime(args.start_date, "%Y-%m-%d").date()
     else:
-        latest = find_latest_date(data_dir)
+        with PROFILER.phase("gap_scan"):
+            latest = find_latest_date(data_dir, persist=not args.dry_run)
         if latest is None:
             print("Error: No existing seed data found. Use --start-date to specify.")
             sys.exit(1)
@@ -372,7 +3163,11 @@ def main():
         else datetime.now().date()
     )
 
-    if start > end:
+    checkpoint = None if args.dry_run else load_checkpoint(data_dir)
+    if checkpoint:
+        print(f"Resuming interrupted catch-up {checkpoint['start']} → {checkpoint['end']} "
+              f"({len(checkpoint['done'])} chunk{'s' if len(checkpoint['done']) != 1 else ''} already done)")
+    elif start > end:
         print("Already up to date.")
         sys.exit(0)
 
@@ -382,35 +3177,25 @@ def main():
         print("(dry run — no files will be modified)")
     print()
 
-    # Fetch in chunks of MAX_DAYS_PER_REQUEST
-    all_entries = []
-    chunk_start = start
-    while chunk_start <= end:
-        chunk_end = min(chunk_start + timedelta(days=MAX_DAYS_PER_REQUEST - 1), end)
-        print(f"API request: {chunk_start} to {chunk_end} ... ", end="", flush=True)
-        try:
-            data = fetch_timeframe(api_key, chunk_start, chunk_end)
-        except Exception as e:
-            print(f"FAILED")
-            print(f"  Error: {e}")
-            sys.exit(1)
+    # Fetch in chunks of MAX_DAYS_PER_REQUEST, merging each as it arrives
+    with PROFILER.phase("catchup"):
+        outcome = run_chunked_catchup(
+            api_key, data_dir, start, end,
+            workers=args.workers, rate=args.rate, dry_run=args.dry_run,
+        )
+    results = outcome["results"]
 
-        rates = data.get("rates", {})
-        days_returned = len(rates)
-        print(f"OK ({days_returned} day{'s' if days_returned != 1 else ''} returned)")
+    if outcome["failed"]:
+        print(f"\n{len(outcome['failed'])} chunk(s) failed — completed chunks were kept; "
+              f"re-run to resume the missing ranges:")
+        for chunk_start, chunk_end, error in outcome["failed"]:
+            print(f"  {chunk_start} to {chunk_end}: {error}")
 
-        entries = transform_to_seed_format(rates)
-        all_entries.extend(entries)
-        chunk_start = chunk_end + timedelta(days=1)
-
-    if not all_entries:
+    if not outcome["days"] and not outcome["failed"]:
         print("\nNo data returned from API (weekend/holiday gap?).")
         sys.exit(0)
 
-    # Merge into year files
     print()
-    results = merge_into_year_files(data_dir, all_entries, dry_run=args.dry_run)
-
     print("Updated files:" if not args.dry_run else "Would update files:")
     for year, count in sorted(results.items()):
         if count > 0:
@@ -420,6 +3205,17 @@ def main():
 
     total = sum(results.values())
     print(f"\nDone. {total} entries {'added' if not args.dry_run else 'would be added'}.")
+    if not args.dry_run:
+        # Don't leave the published year files trailing their journals
+        for year, count in compact_journals(data_dir).items():
+            print(f"spot-history-{year}.json: folded in {count} journal entries")
+    print(format_client_stats(get_client().stats()))
+    print(format_cache_stats(get_response_cache().stats()))
+    if METRICS_FILE and not args.dry_run:
+        METRICS.restore_gauges(METRICS_FILE, "spot_last_success_timestamp_seconds")
+        METRICS.write_textfile(METRICS_FILE)
+    if outcome["failed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
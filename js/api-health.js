@@ -4,10 +4,20 @@
 //   Market prices  — manifest.json       — stale after 30 min
 //   Spot prices    — hourly/YYYY/MM/DD/HH.json — stale after 20 min
 //   Goldback       — goldback-spot.json  — stale after 25 hr (daily scrape)
+//
+// The spot check reads etag-manifest.json (path → etag/size/updated, written
+// by the spot poller) to find the newest hourly shard and only re-downloads
+// it when its etag changed. Every poll rewrites the hour's file with its
+// timestamp; the manifest's "polled" time (the poller's last poll) also
+// counts as fresh, in case the shard was fetched from a lagging cache.
 
 const API_HEALTH_MARKET_STALE_MIN   = 30;  // poller runs every ~15-20 min; 30 min gives comfortable margin
 const API_HEALTH_SPOT_STALE_MIN     = 20;  // metalpriceapi.com updated every 10 min; poller runs every 15 min
 const API_HEALTH_GOLDBACK_STALE_MIN = 25 * 60; // 25 hours in minutes
+const API_HEALTH_ETAG_MANIFEST      = "etag-manifest.json";
+
+/** Last hourly shard fetched per data endpoint: { url, etag, data } */
+const _apiHealthHourlyCache = new Map();
 
 /**
  * Normalizes naive "YYYY-MM-DD HH:MM:SS" timestamps (no timezone suffix) to
@@ -50,9 +60,10 @@ const _timeAgo = (timestamp) => {
  * @param {PromiseSettledResult} marketResult
  * @param {PromiseSettledResult} spotResult
  * @param {PromiseSettledResult} goldbackResult
+ * @param {string|null} [polled] - Last poll time from the ETag manifest
  * @returns {{market: object, spot: object, goldback: object}}
  */
-const _parseEndpointHealth = (marketResult, spotResult, goldbackResult) => {
+const _parseEndpointHealth = (marketResult, spotResult, goldbackResult, polled = null) => {
   // --- Market prices (manifest.json) ---
   let market = { ok: false, ageMin: null, ago: null, coins: [], error: null };
   if (marketResult.status === "fulfilled") {
@@ -75,7 +86,9 @@ const _parseEndpointHealth = (marketResult, spotResult, goldbackResult) => {
   if (spotResult.status === "fulfilled") {
     const entries = spotResult.value;
     const last    = Array.isArray(entries) && entries[entries.length - 1];
-    const ts      = last && last.timestamp;
+    let ts        = last && last.timestamp;
+    // The poller's last poll time counts too, when it is newer than the shard's
+    if (ts && polled && new Date(_normalizeTs(polled)) > new Date(_normalizeTs(ts))) ts = polled;
     if (ts) {
       const spotDate = new Date(_normalizeTs(ts));
       if (!isNaN(spotDate.getTime())) {
@@ -141,21 +154,44 @@ const fetchApiHealth = async () => {
     return `${dataBase}/hourly/${y}/${mo}/${dy}/${hr}.json`;
   };
 
+  // Newest hourly shard listed in the ETag manifest, re-downloaded only when its etag changed
+  const _fetchLatestHourly = async (dataEp, etags) => {
+    const files = etags.files || {};
+    const rel = Object.keys(files).filter((p) => /^hourly\/\d{4}\/\d{2}\/\d{2}\/\d{2}\.json$/.test(p)).sort().pop();
+    if (!rel) throw new Error("No hourly files in ETag manifest");
+    const url = `${dataEp}/${rel}`;
+    const cached = _apiHealthHourlyCache.get(dataEp);
+    if (cached && cached.url === url && cached.etag === files[rel].etag) return cached.data;
+    const data = await _fetchWithTimeout(url);
+    _apiHealthHourlyCache.set(dataEp, { url, etag: files[rel].etag, data });
+    return data;
+  };
+
   // Fetch all 3 feeds from a single endpoint independently
   const _fetchFromEndpoint = async (ep) => {
     const dataEp = ep.replace(/\/api$/, "");
-    const spotFetch = _fetchWithTimeout(_hourlyUrl(dataEp, 0))
+    const probeHourly = () => _fetchWithTimeout(_hourlyUrl(dataEp, 0))
       .catch((e) => { console.debug(`[api-health] ${ep} hour-0 miss:`, e.message); return _fetchWithTimeout(_hourlyUrl(dataEp, 1)); });
-    return Promise.allSettled([
+    let polled = null;
+    const spotFetch = _fetchWithTimeout(`${dataEp}/${API_HEALTH_ETAG_MANIFEST}`)
+      .catch((e) => { console.debug(`[api-health] ${ep} no ETag manifest:`, e.message); return null; })
+      .then((etags) => {
+        if (!etags) return probeHourly();
+        polled = etags.polled || null;
+        return _fetchLatestHourly(dataEp, etags)
+          .catch((e) => { console.debug(`[api-health] ${ep} manifest shard miss:`, e.message); return probeHourly(); });
+      });
+    const results = await Promise.allSettled([
       _fetchWithTimeout(`${ep}/manifest.json`),
       spotFetch,
       _fetchWithTimeout(`${ep}/goldback-spot.json`),
     ]);
+    return { results, polled };
   };
 
   // Probe all endpoints in parallel — each endpoint is fully independent
   const endpointRaws = await Promise.all(apiEndpoints.map(_fetchFromEndpoint));
-  const parsed = endpointRaws.map(([m, s, g]) => _parseEndpointHealth(m, s, g));
+  const parsed = endpointRaws.map(({ results: [m, s, g], polled }) => _parseEndpointHealth(m, s, g, polled));
 
   return { primary: parsed[0], backup: parsed[1] ?? null };
 };
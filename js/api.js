@@ -171,30 +171,12 @@ const fetchStaktrakr15minRange = async (slotsBack = 96) => {
     spotHistory.map(e => `${e.timestamp}|${e.metal}`)
   );
 
-  // Fetch slots in batches of 6 (96 slots = 24 h of 15-min coverage)
   let newCount = 0;
   let fetchCount = 0;
   const batchSize = 6;
   const providerName = API_PROVIDERS.STAKTRAKR.name;
 
-  for (let i = 0; i < slots.length; i += batchSize) {
-    const batch = slots.slice(i, i + batchSize);
-    const results = await Promise.all(batch.map(async (s) => {
-      const yyyy = s.getUTCFullYear();
-      const mm = String(s.getUTCMonth() + 1).padStart(2, '0');
-      const dd = String(s.getUTCDate()).padStart(2, '0');
-      const hh = String(s.getUTCHours()).padStart(2, '0');
-      const min15 = String(s.getUTCMinutes()).padStart(2, '0');
-      const path = `/${yyyy}/${mm}/${dd}/${hh}${min15}.json`;
-      try {
-        // Try primary endpoint first; fall back to backup after 5-second timeout or error
-        const data = await _staktrakrFetch(baseUrls, path);
-        const { current } = API_PROVIDERS.STAKTRAKR.parseBatchResponse(data);
-        // Use ISO-format UTC timestamp so normalisation is consistent with hourly
-        return { current, timestamp: `${yyyy}-${mm}-${dd}T${hh}:${min15}:00Z` };
-      } catch { return null; }
-    }));
-
+  const addResults = (results) => {
     results.forEach(result => {
       if (!result) return;
       fetchCount++;
@@ -214,11 +196,59 @@ const fetchStaktrakr15minRange = async (slotsBack = 96) => {
         }
       });
     });
+  };
+
+  // Prefer the poller's rolling window file: one request instead of one per slot.
+  // Slots are snapped to 15 min so timestamps match the per-slot path below.
+  let rolling = null;
+  try {
+    const windowFile = slotsBack > 96 ? '/latest-7d.json' : '/latest-24h.json';
+    rolling = await _staktrakrFetch(baseUrls, windowFile);
+  } catch { rolling = null; }
+  // A window without a slots array (stale or partial upload) falls back to per-slot fetches
+  if (!Array.isArray(rolling?.slots)) rolling = null;
+
+  if (rolling) {
+    const oldest = slots[slots.length - 1].getTime();
+    addResults(rolling.slots.map((slot) => {
+      const [datePart, timePart] = String(slot.slot || '').split(' ');
+      const [hh, mi] = (timePart || '').split(':');
+      const min15 = String(Math.floor(Number(mi) / 15) * 15).padStart(2, '0');
+      const timestamp = `${datePart}T${hh}:${min15}:00Z`;
+      const slotMs = Date.parse(timestamp);
+      if (!Number.isFinite(slotMs) || slotMs < oldest) return null;
+      try {
+        const { current } = API_PROVIDERS.STAKTRAKR.parseBatchResponse(slot.entries);
+        return { current, timestamp };
+      } catch { return null; }
+    }));
+  }
+
+  // Fallback: fetch slots in batches of 6 (96 slots = 24 h of 15-min coverage)
+  for (let i = 0; !rolling && i < slots.length; i += batchSize) {
+    const batch = slots.slice(i, i + batchSize);
+    const results = await Promise.all(batch.map(async (s) => {
+      const yyyy = s.getUTCFullYear();
+      const mm = String(s.getUTCMonth() + 1).padStart(2, '0');
+      const dd = String(s.getUTCDate()).padStart(2, '0');
+      const hh = String(s.getUTCHours()).padStart(2, '0');
+      const min15 = String(s.getUTCMinutes()).padStart(2, '0');
+      const path = `/${yyyy}/${mm}/${dd}/${hh}${min15}.json`;
+      try {
+        // Try primary endpoint first; fall back to backup after 5-second timeout or error
+        const data = await _staktrakrFetch(baseUrls, path);
+        const { current } = API_PROVIDERS.STAKTRAKR.parseBatchResponse(data);
+        // Use ISO-format UTC timestamp so normalisation is consistent with hourly
+        return { current, timestamp: `${yyyy}-${mm}-${dd}T${hh}:${min15}:00Z` };
+      } catch { return null; }
+    }));
+
+    addResults(results);
   }
 
   if (newCount > 0) {
     saveSpotHistory();
-    debugLog(`[StakTrakr] Added ${newCount} 15-min entries (${fetchCount} files fetched)`);
+    debugLog(`[StakTrakr] Added ${newCount} 15-min entries (${fetchCount} ${rolling ? 'slots from rolling window' : 'files fetched'})`);
   }
 
   return { newCount, fetchCount };
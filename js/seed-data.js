@@ -1161,7 +1161,8 @@ function getEmbeddedSeedData() {
  * Runs once per app version via migration_seedHistoryMerge flag.
  *
  * Data sources (priority order):
- *   1. historicalDataCache — pre-populated by spot-history-bundle.js
+ *   1. historicalDataCache — pre-populated by spot-history-bundle.js, or
+ *      by the lazy range bundles listed in spot-history-bundle-index.js
  *   2. Fetch individual year JSON files (HTTP only)
  *   3. Embedded fallback data (file:// protocol)
  *
@@ -1185,6 +1186,12 @@ async function loadSeedSpotHistory() {
   // Priority 3: Embedded fallback data (file:// protocol)
   let seedEntries = [];
 
+  // Lazy seed ranges (spot-history-bundle-index.js): pull in every range once
+  // for the seeding pass. No-op when the single-file bundle is loaded.
+  if (typeof loadSpotSeedYears === "function") {
+    await loadSpotSeedYears();
+  }
+
   // Try the in-memory bundle cache first — already loaded, no network needed
   if (typeof historicalDataCache !== "undefined" && historicalDataCache.size > 0) {
     for (const entries of historicalDataCache.values()) {
@@ -531,9 +531,154 @@ const xhrLoadJSON = (url) =>
     xhr.send();
   });
 
+// ---------------------------------------------------------------------------
+// Lazy seed ranges (data/spot-history-bundle-index.js)
+// ---------------------------------------------------------------------------
+// The index script registers per-decade bundles built by
+// devops/build-seed-bundle.py. Each range file calls _loadSpotSeedBundle(),
+// so only the ranges a chart actually needs are downloaded and parsed.
+
+/** @type {Array<{file: string, start: number, end: number, years: number, entries: number, bytes: number}>} */
+let spotSeedRanges = [];
+
+/** @type {Map<string, Promise<void>>} In-flight/completed range script loads keyed by file */
+const spotSeedRangeLoads = new Map();
+
+/** @type {Array<{name: string, kind: string, file: string, points: number, bytes: number}>} */
+let spotSeedLodTiers = [];
+
+/** @type {Map<string, Object>} Loaded level-of-detail tiers keyed by tier name */
+const spotSeedLod = new Map();
+
+/** @type {Array<{code: string, file: string, first: string, last: string, entries: number, bytes: number}>} */
+let spotSeedCurrencies = [];
+
+/** @type {Map<string, Map<number, Array<Object>>>} Seed history priced in a display currency, keyed by code then year */
+const historicalCurrencyCache = new Map();
+
+/**
+ * Registers the seed range index. Called by data/spot-history-bundle-index.js.
+ * @param {{ranges: Array<Object>, lod?: {tiers: Array<Object>}}} index - Range index from the bundle builder
+ */
+window._registerSpotSeedIndex = function(index) {
+  spotSeedRanges = (index && Array.isArray(index.ranges)) ? index.ranges : [];
+  spotSeedLodTiers = (index && index.lod && Array.isArray(index.lod.tiers)) ? index.lod.tiers : [];
+  spotSeedCurrencies = (index && Array.isArray(index.currencies)) ? index.currencies : [];
+};
+
+/**
+ * Receives a level-of-detail tier. Called by data/spot-history-lod/<tier>.js.
+ * @param {string} name - Tier name ('weekly', 'monthly', 'yearly', 'lttb-500', ...)
+ * @param {Object} payload - Per-metal columns: {t: [...], p: [...]} or {t, o, h, l, c, m, n}
+ */
+window._loadSpotSeedLod = function(name, payload) {
+  spotSeedLod.set(name, payload || {});
+};
+
+/**
+ * Injects a range bundle <script>. Works on file:// where fetch() is blocked.
+ * Resolves (never rejects) once the script has run or failed to load.
+ * @param {Object} range - Range record from the index
+ * @returns {Promise<void>}
+ */
+const loadSpotSeedRange = (range) => {
+  if (spotSeedRangeLoads.has(range.file)) return spotSeedRangeLoads.get(range.file);
+  const promise = new Promise((resolve) => {
+    const script = document.createElement('script');
+    script.src = `data/${range.file}`;
+    script.async = true;
+    script.onload = () => resolve();
+    script.onerror = () => {
+      // Allow a later retry; fetchYearFile() falls back to the JSON year file
+      spotSeedRangeLoads.delete(range.file);
+      resolve();
+    };
+    document.head.appendChild(script);
+  });
+  spotSeedRangeLoads.set(range.file, promise);
+  return promise;
+};
+
+/**
+ * Loads the seed ranges covering the given years (all ranges when omitted).
+ * Ranges whose years are already in historicalDataCache are skipped, so this
+ * is a no-op when the single-file bundle was loaded instead of the index.
+ * @param {number[]} [years] - Years a chart needs
+ * @returns {Promise<void>}
+ */
+const loadSpotSeedYears = (years) => {
+  const needed = spotSeedRanges.filter((range) => {
+    for (let y = range.start; y <= range.end; y++) {
+      if (years && !years.includes(y)) continue;
+      if (!historicalDataCache.has(y)) return true;
+    }
+    return false;
+  });
+  return Promise.all(needed.map(loadSpotSeedRange)).then(() => undefined);
+};
+
+/**
+ * Receives a per-currency seed bundle. Called by data/spot-history-fx/<CODE>.js.
+ * Prices are already converted with each day's FX rate (no client-side conversion).
+ * @param {string} code - ISO 4217 currency code
+ * @param {Object} bundle - {year: {metal: [[MM-DD, price], ...]}}, like _loadSpotSeedBundle()
+ */
+window._loadSpotSeedCurrency = function(code, bundle) {
+  const years = new Map();
+  for (const yearStr of Object.keys(bundle || {})) {
+    years.set(parseInt(yearStr, 10), _seedBundleYearEntries(yearStr, bundle[yearStr], code));
+  }
+  historicalCurrencyCache.set(code, years);
+};
+
+/**
+ * Loads the seed history priced in `code`, as {year → entries} in the
+ * historicalDataCache shape (each entry also carries `currency`).
+ * Only days the poller recorded an FX rate for are present.
+ * @param {string} code - ISO 4217 currency code ('EUR', 'GBP', ...)
+ * @returns {Promise<Map<number, Array<Object>>|null>} null for USD or when no bundle exists
+ */
+const loadSpotSeedCurrency = async (code) => {
+  if (historicalCurrencyCache.has(code)) return historicalCurrencyCache.get(code);
+  const record = spotSeedCurrencies.find((c) => c.code === code);
+  if (!record) return null;
+  await loadSpotSeedRange(record);
+  return historicalCurrencyCache.get(code) || null;
+};
+
+/**
+ * Loads a downsampled whole-history series for long-range charts: the
+ * coarsest tier with at least `points` points (the finest one otherwise).
+ * 'line' tiers are LTTB downsamples; 'ohlc' tiers are weekly/monthly/yearly
+ * bars whose spot is the period close.
+ * @param {string} metalName - Metal name ('Silver', 'Gold', etc.)
+ * @param {number} points - Points the chart can usefully draw
+ * @param {string} [kind='line'] - 'line' or 'ohlc'
+ * @returns {Promise<Array<{ts: number, spot: number}>|null>} Sorted entries, or null when no tier is available
+ */
+const loadSpotSeedLod = async (metalName, points, kind = 'line') => {
+  const tiers = spotSeedLodTiers
+    .filter((tier) => tier.kind === kind)
+    .sort((a, b) => a.points - b.points);
+  if (!tiers.length) return null;
+  const tier = tiers.find((t) => t.points >= points) || tiers[tiers.length - 1];
+  if (!spotSeedLod.has(tier.name)) await loadSpotSeedRange(tier);
+  const columns = spotSeedLod.get(tier.name)?.[metalName];
+  if (!columns || !Array.isArray(columns.t)) return null;
+  return columns.t.map((day, i) => {
+    const ts = new Date(day + ' 12:00:00').getTime();
+    if (kind !== 'ohlc') return { ts, spot: columns.p[i] };
+    return {
+      ts, spot: columns.c[i], open: columns.o[i], high: columns.h[i],
+      low: columns.l[i], close: columns.c[i], mean: columns.m[i], days: columns.n[i],
+    };
+  });
+};
+
 /**
  * Fetches a single year file from data/spot-history-{year}.json.
- * Three-tier loading: local fetch → local XHR → remote staktrakr.com.
+ * Lazy seed range bundle first (when the index is registered), then
+ * three-tier loading: local fetch → local XHR → remote staktrakr.com.
  * Caches the result (or empty array on failure) to avoid retries.
  * Deduplicates concurrent fetches for the same year.
  * @param {number} year - Year to fetch
@@ -554,7 +699,7 @@ const fetchYearFile = (year) => {
   const localUrl = `data/${filename}`;
   const remoteUrl = `${HISTORICAL_DATA_REMOTE}${filename}`;
 
-  const promise = fetch(localUrl)
+  const fetchFromNetwork = () => fetch(localUrl)
     .then((res) => {
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
       return res.json();
@@ -582,7 +727,10 @@ const fetchYearFile = (year) => {
       // All three methods failed — cache empty to avoid retries
       historicalDataCache.set(year, []);
       return [];
-    })
+    });
+
+  const promise = loadSpotSeedYears([year])
+    .then(() => (historicalDataCache.has(year) ? historicalDataCache.get(year) : fetchFromNetwork()))
     .finally(() => {
       historicalFetchPromises.delete(year);
     });
@@ -1329,21 +1477,123 @@ const clearSpotHistory = async () => {
  * Loads the spot history seed bundle into the cache.
  * @param {Object} bundle - The spot history seed bundle.
  */
+/**
+ * Expands one year of a seed bundle ({metal: [[MM-DD, price], ...]}) into entries.
+ * @param {string} yearStr - Four-digit year
+ * @param {Object} metals - Per-metal [MM-DD, price] pairs
+ * @param {string} [currency] - Set on each entry for per-currency bundles
+ * @returns {Array<Object>} Seed entries
+ */
+const _seedBundleYearEntries = (yearStr, metals, currency) => {
+  const entries = [];
+  for (const metal of Object.keys(metals)) {
+    for (const pair of metals[metal]) {
+      const entry = {
+        spot: pair[1],
+        metal: metal,
+        source: 'seed',
+        provider: 'LBMA',
+        timestamp: yearStr + '-' + pair[0] + ' 12:00:00'
+      };
+      if (currency) entry.currency = currency;
+      entries.push(entry);
+    }
+  }
+  return entries;
+};
+
 window._loadSpotSeedBundle = function(bundle) {
   let loaded = 0;
   for (const yearStr of Object.keys(bundle)) {
     const year = parseInt(yearStr, 10);
     if (historicalDataCache.has(year) && historicalDataCache.get(year).length > 0) continue;
-    const metals = bundle[yearStr];
+    const entries = _seedBundleYearEntries(yearStr, bundle[yearStr]);
+    historicalDataCache.set(year, entries);
+    loaded += entries.length;
+  }
+  if (loaded > 0) {
+    console.log('[SpotSeed] Loaded ' + loaded + ' entries from bundle (' + Object.keys(bundle).length + ' years)');
+  }
+};
+
+// ---------------------------------------------------------------------------
+// Columnar seed loader (data/spot-history-columnar.js)
+// ---------------------------------------------------------------------------
+// Same points as the bundle, as delta-encoded little-endian integer columns:
+// { v, years: { year: { metal: { n, d0, p0, dw, d, pw, p } } } }
+//   d0/p0 — first day-of-year (0-based) and first price in cents
+//   d/p   — base64 day deltas (unsigned) / cent deltas (signed), n-1 each,
+//           packed at dw/pw bytes per value
+
+/**
+ * Decodes a base64 packed integer column into an Int32Array.
+ * @param {string} b64 - Base64 payload
+ * @param {number} width - Bytes per value (1, 2 or 4)
+ * @param {boolean} signed - Whether values are signed
+ * @param {number} count - Number of values
+ * @returns {Int32Array}
+ */
+const decodeSeedColumn = (b64, width, signed, count) => {
+  const bin = atob(b64);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const view = new DataView(bytes.buffer);
+  const out = new Int32Array(count);
+  for (let i = 0; i < count; i++) {
+    if (width === 1) out[i] = signed ? view.getInt8(i) : view.getUint8(i);
+    else if (width === 2) out[i] = signed ? view.getInt16(i * 2, true) : view.getUint16(i * 2, true);
+    else out[i] = signed ? view.getInt32(i * 4, true) : view.getUint32(i * 4, true);
+  }
+  return out;
+};
+
+/**
+ * Expands one metal/year column into day-of-year and cent typed arrays.
+ * @param {Object} column - Column record from the columnar payload
+ * @returns {{ days: Uint16Array, cents: Int32Array }}
+ */
+const decodeSeedColumns = (column) => {
+  const n = column.n;
+  const days = new Uint16Array(n);
+  const cents = new Int32Array(n);
+  const dayDeltas = decodeSeedColumn(column.d, column.dw, false, n - 1);
+  const centDeltas = decodeSeedColumn(column.p, column.pw, true, n - 1);
+  days[0] = column.d0;
+  cents[0] = column.p0;
+  for (let i = 1; i < n; i++) {
+    days[i] = days[i - 1] + dayDeltas[i - 1];
+    cents[i] = cents[i - 1] + centDeltas[i - 1];
+  }
+  return { days, cents };
+};
+
+/**
+ * Loads the columnar seed payload into historicalDataCache.
+ * @param {Object} payload - The columnar spot history payload.
+ */
+window._loadSpotSeedColumnar = function(payload) {
+  if (!payload || payload.v !== 1 || !payload.years) return;
+  let loaded = 0;
+  for (const yearStr of Object.keys(payload.years)) {
+    const year = parseInt(yearStr, 10);
+    if (historicalDataCache.has(year) && historicalDataCache.get(year).length > 0) continue;
+    // Day-of-year → "YYYY-MM-DD" lookup, built once per year
+    const jan1 = Date.UTC(year, 0, 1);
+    const dayLabels = [];
+    for (let d = 0; d < 366; d++) {
+      dayLabels.push(new Date(jan1 + d * 86400000).toISOString().slice(0, 10));
+    }
+    const metals = payload.years[yearStr];
     const entries = [];
     for (const metal of Object.keys(metals)) {
-      for (const pair of metals[metal]) {
+      const { days, cents } = decodeSeedColumns(metals[metal]);
+      for (let i = 0; i < days.length; i++) {
         entries.push({
-          spot: pair[1],
+          spot: cents[i] / 100,
           metal: metal,
           source: 'seed',
           provider: 'LBMA',
-          timestamp: yearStr + '-' + pair[0] + ' 12:00:00'
+          timestamp: dayLabels[days[i]] + ' 12:00:00'
         });
       }
     }
@@ -1351,7 +1601,7 @@ window._loadSpotSeedBundle = function(bundle) {
     loaded += entries.length;
   }
   if (loaded > 0) {
-    console.log('[SpotSeed] Loaded ' + loaded + ' entries from bundle (' + Object.keys(bundle).length + ' years)');
+    console.log('[SpotSeed] Loaded ' + loaded + ' entries from columnar bundle (' + Object.keys(payload.years).length + ' years)');
   }
 };
 
@@ -1373,6 +1623,9 @@ window.saveSpotHistory = saveSpotHistory;
 window.getHistoricalSparklineData = getHistoricalSparklineData;
 window.getRequiredYears = getRequiredYears;
 window.fetchYearFile = fetchYearFile;
+window.loadSpotSeedYears = loadSpotSeedYears;
+window.loadSpotSeedLod = loadSpotSeedLod;
+window.loadSpotSeedCurrency = loadSpotSeedCurrency;
 window.historicalDataCache = historicalDataCache;
 // STAK-222: Expose spotHistory via getter so window.spotHistory always reflects current array
 Object.defineProperty(window, 'spotHistory', { get: () => spotHistory, configurable: true });
@@ -1226,7 +1226,9 @@ function _fetchYearFile(year) {
  * (live data wins over seed). Returns sorted {ts, spot} entries.
  *
  * For ranges <= 180 days, just returns the in-memory spotHistory slice (no fetch).
- * For longer ranges (including "All"), async-fetches year files back to 1968.
+ * "All" uses the downsampled level-of-detail series sized to the window
+ * width when the seed index provides one; other long ranges (and "All"
+ * without LOD tiers) async-fetch year files back to 1968.
  *
  * @param {string} metalName - Metal name ('Silver', 'Gold', etc.)
  * @param {number} days - Number of days (0 = all available data)
@@ -1252,6 +1254,10 @@ async function _fetchHistoricalSpotData(metalName, days, fromTs, toTs) {
     for (const e of liveEntries) byDay.set(new Date(e.ts).toISOString().slice(0, 10), e);
     return [...byDay.values()].sort((a, b) => a.ts - b.ts);
   } else {
+    if (days === 0 && !toTs && typeof loadSpotSeedLod === 'function') {
+      const lodEntries = await _fetchLodSpotData(metalName);
+      if (lodEntries) return lodEntries;
+    }
     // "All" — go back to 1968 (earliest seed data)
     startYear = 1968;
   }
@@ -1282,6 +1288,38 @@ async function _fetchHistoricalSpotData(metalName, days, fromTs, toTs) {
   return [...byDay.values()].sort((a, b) => a.ts - b.ts);
 }
 
+/**
+ * "All"-range spot series from the level-of-detail tiers: one point per
+ * device pixel of window width at most, with live spotHistory appended
+ * after the tier's last day (one entry per day, latest wins).
+ *
+ * @param {string} metalName - Metal name ('Silver', 'Gold', etc.)
+ * @returns {Promise<Array<{ts:number, spot:number}>|null>} Sorted entries, or null to fall back to year files
+ */
+async function _fetchLodSpotData(metalName) {
+  const width = (window.innerWidth || 1000) * (window.devicePixelRatio || 1);
+  let lod;
+  try {
+    lod = await loadSpotSeedLod(metalName, Math.round(width));
+  } catch (err) {
+    console.warn('LOD spot series unavailable:', err);
+    return null;
+  }
+  if (!lod || !lod.length) return null;
+
+  const lastDay = new Date(lod[lod.length - 1].ts).toISOString().slice(0, 10);
+  const live = (typeof spotHistory !== 'undefined' ? spotHistory : [])
+    .filter(e => e.metal === metalName)
+    .map(e => ({ ts: new Date(e.timestamp).getTime(), spot: e.spot }))
+    .sort((a, b) => a.ts - b.ts);
+  const byDay = new Map();
+  for (const e of live) {
+    const day = new Date(e.ts).toISOString().slice(0, 10);
+    if (day > lastDay) byDay.set(day, e);
+  }
+  return [...lod, ...[...byDay.values()].sort((a, b) => a.ts - b.ts)];
+}
+
 // ---------------------------------------------------------------------------
 // Price history chart (private)
 // ---------------------------------------------------------------------------
@@ -8,7 +8,7 @@ const DEV_MODE = false; // Set to true during development — bypasses all cachi
 
 
 
-const CACHE_NAME = 'staktrakr-v3.33.60-b1773086790';
+const CACHE_NAME = 'staktrakr-v3.33.60-b1792194630';
 
 
 
@@ -88,7 +88,8 @@ const CORE_ASSETS = [
   './js/clone-picker.js',
   './js/events.js',
   './js/init.js',
-  './data/spot-history-bundle.js',
+  './data/spot-history-bundle-index.js',
+  './data/spot-history-bundles/spot-history-2020s.js',
   './data/spot-history-2025.json',
   './data/spot-history-2026.json',
   './images/safe-favicon.svg',